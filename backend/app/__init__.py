@@ -2,7 +2,7 @@ from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_cors import CORS
-from .config import Config
+from .config import Config, engine_options
 
 db = SQLAlchemy()
 migrate = Migrate()
@@ -10,12 +10,34 @@ migrate = Migrate()
 def create_app(config_class=Config):
     app = Flask(__name__)
     app.config.from_object(config_class)
+    # Derived from the final database URI, so config subclasses that only
+    # change the URI (e.g. to in-memory SQLite) get matching pool options
+    if 'SQLALCHEMY_ENGINE_OPTIONS' not in app.config:
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(app.config['SQLALCHEMY_DATABASE_URI'])
 
     db.init_app(app)
     migrate.init_app(app, db)
     CORS(app)
 
-    from app.routes import auth, cars, bookings, reports, users, settings, notifications
+    from app.utils.user_cache import user_cache
+    user_cache.init_app(app)
+
+    from app.utils.settings_cache import settings_cache
+    settings_cache.init_app(app)
+
+    from app.utils.response_cache import response_cache
+    response_cache.init_app(app)
+
+    from app.services.notification_broker import notification_broker
+    notification_broker.init_app(app)
+
+    from app.services.mail_queue import mail_queue
+    mail_queue.init_app(app)
+
+    from app.services.outbox import outbox
+    outbox.init_app(app)
+
+    from app.routes import auth, cars, bookings, reports, users, settings, notifications, metrics
     app.register_blueprint(auth.bp, url_prefix='/api/auth')
     app.register_blueprint(cars.bp, url_prefix='/api/cars')
     app.register_blueprint(bookings.bp, url_prefix='/api/bookings')
@@ -23,6 +45,10 @@ def create_app(config_class=Config):
     app.register_blueprint(reports.bp, url_prefix='/api/reports')
     app.register_blueprint(settings.bp, url_prefix='/api/settings')
     app.register_blueprint(notifications.bp, url_prefix='/api/notifications')
+    app.register_blueprint(metrics.bp, url_prefix='/api/metrics')
+
+    from app.commands import register_commands
+    register_commands(app)
 
     from app.services.scheduler import init_scheduler
     init_scheduler(app)
@@ -0,0 +1,83 @@
+import click
+
+
+def register_commands(app):
+    @app.cli.command('rebuild-rollups')
+    def rebuild_rollups():
+        """Recompute booking_daily_stats from the bookings table."""
+        from app.services.rollup_service import RollupService
+        from app.utils.response_cache import response_cache
+        count = RollupService.rebuild()
+        response_cache.bump('bookings')
+        click.echo(f"Rebuilt booking rollups: {count} car-days")
+
+    @app.cli.command('import-cars')
+    @click.argument('path', type=click.Path(exists=True, dir_okay=False))
+    @click.option('--format', 'fmt', type=click.Choice(['csv', 'jsonl']), default=None,
+                  help='File format; defaults to the file extension.')
+    @click.option('--no-update', is_flag=True, help='Report existing plates instead of updating them.')
+    def import_cars(path, fmt, no_update):
+        """Add or update cars from a CSV or JSON-lines file."""
+        from app.services.car_import_service import CarImportService
+        from app.utils.response_cache import response_cache
+        fmt = fmt or ('jsonl' if path.endswith(('.jsonl', '.ndjson')) else 'csv')
+        with open(path, 'rb') as stream:
+            try:
+                report = CarImportService.import_rows(
+                    CarImportService.read_rows(stream, fmt),
+                    update_existing=not no_update,
+                    chunk_size=app.config['CAR_IMPORT_CHUNK_SIZE']
+                )
+            finally:
+                response_cache.bump('cars')
+        for error in report.errors:
+            click.echo(f"row {error['row']}: {error['license_plate'] or '-'}: {error['message']}", err=True)
+        if report.error_count > len(report.errors):
+            click.echo(f"... {report.error_count - len(report.errors)} more errors", err=True)
+        click.echo(f"Imported cars: {report.inserted} added, {report.updated} updated, {report.unchanged} unchanged, {report.error_count} rejected")
+
+    @app.cli.command('dispatch-outbox')
+    @click.option('--retry-failed', is_flag=True, help='Requeue events that exhausted OUTBOX_MAX_ATTEMPTS first.')
+    def dispatch_outbox(retry_failed):
+        """Deliver pending outbox events now."""
+        from app import db
+        from app.models import OutboxEvent
+        from app.services.outbox import outbox
+        from datetime import datetime
+        if retry_failed:
+            count = OutboxEvent.query.filter(OutboxEvent.available_at.is_(None)).update(
+                {'available_at': datetime.utcnow(), 'attempts': 0}, synchronize_session=False
+            )
+            db.session.commit()
+            click.echo(f"Requeued {count} failed events")
+        click.echo(f"Processed {outbox.drain()} outbox events")
+
+    @app.cli.command('reconcile-unread-counters')
+    def reconcile_unread_counters():
+        """Repair drifted unread-notification counters."""
+        from app.services.notification_service import NotificationService
+        count = NotificationService.reconcile_unread_counters()
+        click.echo(f"Repaired {count} unread counters")
+
+    @app.cli.command('purge-notifications')
+    @click.option('--days', type=int, default=None, help='Override NOTIFICATION_RETENTION_DAYS.')
+    @click.option('--mode', type=click.Choice(['delete', 'archive']), default=None,
+                  help='Override NOTIFICATION_RETENTION_MODE.')
+    def purge_notifications(days, mode):
+        """Delete or archive read notifications past the retention period."""
+        from app.services.notification_retention import NotificationRetentionService
+        count = NotificationRetentionService.purge(
+            days if days is not None else app.config['NOTIFICATION_RETENTION_DAYS'],
+            mode=mode or app.config['NOTIFICATION_RETENTION_MODE'],
+            batch_size=app.config['NOTIFICATION_RETENTION_BATCH']
+        )
+        click.echo(f"Purged {count} notifications")
+
+    @app.cli.command('partition-notifications')
+    def partition_notifications():
+        """Convert notifications to monthly partitions (PostgreSQL, needs downtime)."""
+        from app.services.notification_retention import NotificationRetentionService
+        if NotificationRetentionService.partition_table(app.config['NOTIFICATION_PARTITION_MONTHS_AHEAD']):
+            click.echo("notifications is now partitioned by month")
+        else:
+            click.echo("notifications is already partitioned")
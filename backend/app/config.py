@@ -1,7 +1,85 @@
 import os
 
+
+def engine_options(database_uri):
+    """Connection pool settings from DB_* environment variables."""
+    if database_uri in ('sqlite://', 'sqlite:///:memory:'):
+        # In-memory SQLite lives in a single connection; keep SQLAlchemy's pool
+        return {}
+
+    from app.utils.pool_metrics import TimedQueuePool
+    options = {
+        'poolclass': TimedQueuePool,
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 10)),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 10)),
+        'pool_timeout': int(os.environ.get('DB_POOL_TIMEOUT', 10)),
+        'pool_pre_ping': os.environ.get('DB_POOL_PRE_PING', 'true').lower() == 'true',
+        'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE', 1800)),
+    }
+    # Off by default: this engine also runs migrations, CLI jobs and the
+    # scheduler. Set it for web serving only; routes can raise it per transaction
+    statement_timeout = int(os.environ.get('DB_STATEMENT_TIMEOUT_MS', 0))
+    if database_uri.startswith('postgresql') and statement_timeout:
+        options['connect_args'] = {'options': f'-c statement_timeout={statement_timeout}'}
+    return options
+
+
 class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'you-will-never-guess'
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or \
         'sqlite:///app.db'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # SQLALCHEMY_ENGINE_OPTIONS defaults to engine_options(SQLALCHEMY_DATABASE_URI), applied in create_app
+    # Report routes: statement timeout and concurrent queries per process, so
+    # long reports can't hold every pooled connection (see app/utils/query_budget.py)
+    REPORT_STATEMENT_TIMEOUT_MS = int(os.environ.get('REPORT_STATEMENT_TIMEOUT_MS', 60000))
+    REPORT_MAX_CONCURRENT_QUERIES = int(os.environ.get('REPORT_MAX_CONCURRENT_QUERIES', 2))
+    REPORT_QUEUE_TIMEOUT = float(os.environ.get('REPORT_QUEUE_TIMEOUT', 10))
+    # Authenticated-user cache used by token_required
+    USER_CACHE_SIZE = int(os.environ.get('USER_CACHE_SIZE', 1024))
+    USER_CACHE_TTL = int(os.environ.get('USER_CACHE_TTL', 60))
+    # Rows per transaction for car imports (POST /api/cars/import, `flask import-cars`)
+    CAR_IMPORT_CHUNK_SIZE = int(os.environ.get('CAR_IMPORT_CHUNK_SIZE', 500))
+    # Transactional outbox (app/services/outbox.py), dispatched by the scheduler leader
+    OUTBOX_POLL_SECONDS = int(os.environ.get('OUTBOX_POLL_SECONDS', 2))
+    OUTBOX_BATCH_SIZE = int(os.environ.get('OUTBOX_BATCH_SIZE', 100))
+    OUTBOX_MAX_ATTEMPTS = int(os.environ.get('OUTBOX_MAX_ATTEMPTS', 8))
+    OUTBOX_RETRY_BACKOFF = int(os.environ.get('OUTBOX_RETRY_BACKOFF', 30))
+    OUTBOX_LEASE_SECONDS = int(os.environ.get('OUTBOX_LEASE_SECONDS', 300))
+    # Outbound mail worker pool
+    MAIL_QUEUE_SIZE = int(os.environ.get('MAIL_QUEUE_SIZE', 1000))
+    MAIL_WORKERS = int(os.environ.get('MAIL_WORKERS', 2))
+    MAIL_MAX_RETRIES = int(os.environ.get('MAIL_MAX_RETRIES', 3))
+    MAIL_RETRY_BACKOFF = float(os.environ.get('MAIL_RETRY_BACKOFF', 1.0))
+    MAIL_ENQUEUE_TIMEOUT = float(os.environ.get('MAIL_ENQUEUE_TIMEOUT', 5.0))
+    MAIL_IDLE_TIMEOUT = float(os.environ.get('MAIL_IDLE_TIMEOUT', 60.0))
+    # Seconds between settings-cache watermark checks (picks up other workers' changes)
+    SETTINGS_CACHE_TTL = int(os.environ.get('SETTINGS_CACHE_TTL', 30))
+    # Rendered PDF reports kept in memory, keyed by filters and data watermark
+    REPORT_PDF_CACHE_SIZE = int(os.environ.get('REPORT_PDF_CACHE_SIZE', 16))
+    # ETag/304 cache for GET endpoints (app/utils/response_cache.py)
+    RESPONSE_CACHE_SIZE = int(os.environ.get('RESPONSE_CACHE_SIZE', 256))
+    RESPONSE_CACHE_TTL = float(os.environ.get('RESPONSE_CACHE_TTL', 5))
+    # Notification event stream: 'local' (single process) or 'postgres' (LISTEN/NOTIFY across workers);
+    # unset means 'postgres' on a PostgreSQL database, so every gunicorn worker gets every push
+    NOTIFICATION_BROKER_BACKEND = os.environ.get('NOTIFICATION_BROKER_BACKEND')
+    NOTIFICATION_STREAM_HEARTBEAT = int(os.environ.get('NOTIFICATION_STREAM_HEARTBEAT', 25))
+    NOTIFICATION_STREAM_QUEUE_SIZE = int(os.environ.get('NOTIFICATION_STREAM_QUEUE_SIZE', 100))
+    # Open streams per process; past it clients get 503 and poll instead. Each
+    # stream holds a thread, and gunicorn.conf.py adds this many threads on top
+    # of GUNICORN_THREADS so streams never take threads from regular requests.
+    NOTIFICATION_STREAM_MAX = int(os.environ.get('NOTIFICATION_STREAM_MAX', 100))
+    # How often the unread-notification counters are checked against the table
+    UNREAD_RECONCILE_MINUTES = int(os.environ.get('UNREAD_RECONCILE_MINUTES', 60))
+    # Retention for read notifications: 0 days disables it; mode is 'delete' or 'archive'
+    NOTIFICATION_RETENTION_DAYS = int(os.environ.get('NOTIFICATION_RETENTION_DAYS', 90))
+    NOTIFICATION_RETENTION_MODE = os.environ.get('NOTIFICATION_RETENTION_MODE', 'delete')
+    NOTIFICATION_RETENTION_BATCH = int(os.environ.get('NOTIFICATION_RETENTION_BATCH', 1000))
+    # Only used once notifications is partitioned (`flask partition-notifications`, PostgreSQL)
+    NOTIFICATION_PARTITION_MONTHS_AHEAD = int(os.environ.get('NOTIFICATION_PARTITION_MONTHS_AHEAD', 3))
+    # Background jobs run in one process only, elected through a Postgres
+    # advisory lock or, on other databases, an flock() on SCHEDULER_LOCK_FILE
+    SCHEDULER_AUTOSTART = os.environ.get('SCHEDULER_AUTOSTART', 'true').lower() == 'true'
+    SCHEDULER_LOCK_FILE = os.environ.get('SCHEDULER_LOCK_FILE', '/tmp/carbooking-scheduler.lock')
+    # Seconds between a follower's attempts to take over as leader
+    SCHEDULER_LEADER_CHECK = int(os.environ.get('SCHEDULER_LEADER_CHECK', 10))
@@ -38,10 +38,30 @@ class Car(db.Model):
     current_mileage = db.Column(db.Integer, default=0)
     status = db.Column(db.String(50), default='available') # available, maintenance, reserved
     last_maintenance_mileage = db.Column(db.Integer, default=0)
+    maintenance_checked_mileage = db.Column(db.Integer) # current_mileage as of the last maintenance check
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+# Bookings in these statuses block the car for their period
+ACTIVE_BOOKING_STATUSES = ['pending', 'approved', 'picked_up']
+ACTIVE_BOOKING_STATUS_SQL = "status IN ('pending', 'approved', 'picked_up')"
+
 class Booking(db.Model):
     __tablename__ = 'bookings'
+    # On PostgreSQL the ex_bookings_car_no_overlap exclusion constraint (migration
+    # 3e9b1f6c4a25) also rejects overlapping active bookings of the same car.
+    __table_args__ = (
+        # Overlap check in create_booking: one car, active, time range
+        db.Index('ix_bookings_car_active_period', 'car_id', 'start_time', 'end_time',
+                 postgresql_where=db.text(ACTIVE_BOOKING_STATUS_SQL),
+                 sqlite_where=db.text(ACTIVE_BOOKING_STATUS_SQL)),
+        # booked_car_ids in get_available_cars: any car, active, time range
+        db.Index('ix_bookings_active_period', 'start_time', 'end_time', 'car_id',
+                 postgresql_where=db.text(ACTIVE_BOOKING_STATUS_SQL),
+                 sqlite_where=db.text(ACTIVE_BOOKING_STATUS_SQL)),
+        db.Index('ix_bookings_user_created', 'user_id', 'created_at'),
+        # Keyset pagination order of the bookings listing
+        db.Index('ix_bookings_created_id', 'created_at', 'id'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'))
     car_id = db.Column(db.Integer, db.ForeignKey('cars.id'))
@@ -53,7 +73,101 @@ class Booking(db.Model):
     start_mileage = db.Column(db.Integer)
     end_mileage = db.Column(db.Integer)
     mileage_image_url = db.Column(db.String(500))
+    overdue_notified_at = db.Column(db.DateTime) # set once the daily check has raised the overdue alert
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    user = db.relationship('User')
+    car = db.relationship('Car')
+
+    @classmethod
+    def is_active(cls):
+        # Rendered as literals rather than bound parameters so the planner
+        # can match the partial indexes above.
+        return cls.status.in_(db.bindparam('active_statuses', ACTIVE_BOOKING_STATUSES,
+                                           expanding=True, literal_execute=True))
+
+    def to_dict(self, fields=None):
+        data = {
+            'id': self.id,
+            'user_id': self.user_id,
+            'car_id': self.car_id,
+            'start_time': self.start_time.isoformat() + 'Z',
+            'end_time': self.end_time.isoformat() + 'Z',
+            'objective': self.objective,
+            'destination': self.destination,
+            'status': self.status,
+            'start_mileage': self.start_mileage,
+            'end_mileage': self.end_mileage,
+            'created_at': self.created_at.isoformat() + 'Z'
+        }
+        # Only touch the relationships when asked for, so a projection
+        # without user/car fields doesn't trigger lazy loads.
+        if fields is None or fields & {'user_name', 'user_phone'}:
+            user = self.user
+            data['user_name'] = user.full_name if user else 'Unknown'
+            data['user_phone'] = user.phone_number if user else 'Unknown'
+        if fields is None or fields & {'car_license', 'car_model'}:
+            car = self.car
+            data['car_license'] = car.license_plate if car else 'Unknown'
+            data['car_model'] = f"{car.brand} {car.model}" if car else 'Unknown'
+        if fields is not None:
+            data = {k: v for k, v in data.items() if k in fields}
+        return data
+
+class BookingDailyStat(db.Model):
+    """Per car, per day (of start_time) booking rollup maintained by RollupService."""
+    __tablename__ = 'booking_daily_stats'
+    car_id = db.Column(db.Integer, primary_key=True)
+    day = db.Column(db.Date, primary_key=True)
+    month = db.Column(db.String(7), nullable=False, index=True) # 'YYYY-MM', for portable monthly GROUP BY
+    booking_count = db.Column(db.Integer, nullable=False, default=0)
+    completed_count = db.Column(db.Integer, nullable=False, default=0)
+    mileage = db.Column(db.Integer, nullable=False, default=0)
+
+# Owner id of the shared counter for system notifications (user_id IS NULL)
+SYSTEM_NOTIFICATIONS_OWNER = 0
+
+class NotificationUnreadCounter(db.Model):
+    """
+    Unread notification count per owner, kept in step by NotificationService.
+
+    owner_id is the user id, or SYSTEM_NOTIFICATIONS_OWNER for system
+    notifications, which every admin sees (and reads) in common.
+    """
+    __tablename__ = 'notification_unread_counters'
+    owner_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    count = db.Column(db.Integer, nullable=False, default=0)
+
+class CacheVersion(db.Model):
+    """Per-table change counter behind the GET response cache (app/utils/response_cache.py)."""
+    __tablename__ = 'cache_versions'
+    table_name = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+class OutboxEvent(db.Model):
+    """
+    Side effect (email, maintenance check) recorded in the same transaction
+    as the change that caused it, delivered by app/services/outbox.py.
+
+    available_at is when the dispatcher may (re)try the event; it is NULL
+    once the event has failed OUTBOX_MAX_ATTEMPTS times.
+    """
+    __tablename__ = 'outbox_events'
+    id = db.Column(db.Integer, primary_key=True)
+    kind = db.Column(db.String(50), nullable=False)
+    payload = db.Column(db.JSON, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    available_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    last_error = db.Column(db.Text)
+
+class JobRun(db.Model):
+    """Last successful run of a scheduled job, so a new scheduler leader can catch up."""
+    __tablename__ = 'job_runs'
+    job_id = db.Column(db.String(100), primary_key=True)
+    last_run_at = db.Column(db.DateTime, nullable=False)
+
 class Setting(db.Model):
     __tablename__ = 'settings'
     id = db.Column(db.Integer, primary_key=True)
@@ -72,6 +186,10 @@ class Setting(db.Model):
         }
 class Notification(db.Model):
     __tablename__ = 'notifications'
+    __table_args__ = (
+        db.Index('ix_notifications_user_read_created', 'user_id', 'is_read', 'created_at'),
+        db.Index('ix_notifications_created_at', 'created_at'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True) # Null means it's for all admins or system-wide
     title = db.Column(db.String(255), nullable=False)
@@ -90,3 +208,15 @@ class Notification(db.Model):
             'is_read': self.is_read,
             'created_at': self.created_at.isoformat()
         }
+
+class NotificationArchive(db.Model):
+    """Read notifications moved out of `notifications` by the retention job."""
+    __tablename__ = 'notifications_archive'
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False) # Original notifications.id
+    user_id = db.Column(db.Integer, nullable=True, index=True)
+    title = db.Column(db.String(255), nullable=False)
+    message = db.Column(db.Text, nullable=False)
+    type = db.Column(db.String(50))
+    is_read = db.Column(db.Boolean)
+    created_at = db.Column(db.DateTime)
+    archived_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -1,6 +1,8 @@
 from flask import Blueprint, request, jsonify, current_app
 from app import db
 from app.models import User
+from app.utils.user_cache import user_cache
+from app.utils.response_cache import response_cache
 import jwt
 import datetime
 import random
@@ -28,6 +30,7 @@ def register():
     
     db.session.add(new_user)
     db.session.commit()
+    response_cache.bump('users')
     
     return jsonify({'message': 'User registered successfully'}), 201
 
@@ -84,6 +87,7 @@ def forgot_password():
     temp_password = ''.join(random.choices(string.ascii_letters + string.digits, k=8))
     user.set_password(temp_password)
     db.session.commit()
+    user_cache.invalidate(user.id)
 
     # Send email
     from app.services.email_service import EmailService
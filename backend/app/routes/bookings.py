@@ -1,11 +1,35 @@
 from flask import Blueprint, request, jsonify
 from app import db
-from app.models import Booking, Car, User
+from app.models import Booking, Car, ACTIVE_BOOKING_STATUSES
 from app.utils.decorators import token_required, admin_required
-from datetime import datetime
+from app.utils.pagination import encode_cursor, decode_cursor, InvalidCursor
+from app.utils.response_cache import response_cache
+from app.services.booking_index import booking_index
+from app.services.availability_service import AvailabilityService, MAX_MATRIX_SLOTS
+from app.services.rollup_service import RollupService
+from app.services.booking_guard import BookingGuard
+from app.services.bulk_booking_service import BulkBookingService, MAX_BULK_BOOKINGS
+from app.services.outbox import outbox
+from sqlalchemy import and_, or_, func, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm.attributes import set_committed_value
+from datetime import datetime, date, timezone
 
 bp = Blueprint('bookings', __name__)
 
+BOOKING_PAGE_SIZE = 50
+BOOKING_PAGE_SIZE_MAX = 500
+# Statuses an admin can set through the status endpoints
+BOOKING_STATUSES = ['pending', 'approved', 'rejected', 'completed', 'cancelled']
+
+def _parse_iso(value):
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    # DB stores naive UTC datetimes
+    if parsed.tzinfo:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
 @bp.route('/', methods=['POST'])
 @token_required
 def create_booking(current_user):
@@ -18,13 +42,29 @@ def create_booking(current_user):
             return jsonify({'message': f'Missing field: {field}'}), 400
             
     try:
-        start_time = datetime.fromisoformat(data['start_time'].replace('Z', '+00:00'))
-        end_time = datetime.fromisoformat(data['end_time'].replace('Z', '+00:00'))
+        start_time = _parse_iso(data['start_time'])
+        end_time = _parse_iso(data['end_time'])
     except ValueError:
         return jsonify({'message': 'Invalid date format'}), 400
         
-    car = Car.query.get(data['car_id'])
+    if end_time <= start_time:
+        return jsonify({'message': 'End time must be after start time'}), 400
+
+    # The index is keyed by int; a "3" would silently skip the fast path
+    try:
+        car_id = int(data['car_id'])
+    except (ValueError, TypeError):
+        return jsonify({'message': 'Invalid car_id'}), 400
+
+    # Cheap in-memory rejection first; the locked re-check below is authoritative
+    overlapping = booking_index.find_overlap(car_id, start_time, end_time)
+    if overlapping:
+        overlap_start, overlap_end, _ = overlapping
+        return jsonify({'message': BookingGuard.conflict_message(overlap_start, overlap_end)}), 400
+
+    car = BookingGuard.lock_car(car_id)
     if not car:
+        db.session.rollback()
         return jsonify({'message': 'Car not found'}), 404
         
     if car.status != 'available':
@@ -34,20 +74,15 @@ def create_booking(current_user):
         # Let's keep it simple: If car.status is 'maintenance', block.
         # If 'reserved', check dates.
         if car.status == 'maintenance':
+             db.session.rollback()
              return jsonify({'message': 'Car is under maintenance'}), 400
     
     # Check for overlapping active bookings (pending, approved, picked_up)
-    overlapping_booking = Booking.query.filter(
-        Booking.car_id == car.id,
-        Booking.status.in_(['pending', 'approved', 'picked_up']),
-        Booking.start_time < end_time,
-        Booking.end_time > start_time
-    ).first()
-    
-    if overlapping_booking:
-        return jsonify({
-            'message': f'Car is already booked from {overlapping_booking.start_time.strftime("%Y-%m-%d %H:%M")} to {overlapping_booking.end_time.strftime("%Y-%m-%d %H:%M")}'
-        }), 400
+    # while holding the car lock, so concurrent requests can't both pass
+    conflict = BookingGuard.find_conflict(car.id, start_time, end_time)
+    if conflict:
+        db.session.rollback()
+        return jsonify({'message': BookingGuard.conflict_message(conflict.start_time, conflict.end_time)}), 400
 
     new_booking = Booking(
         user_id=current_user.id,
@@ -60,48 +95,234 @@ def create_booking(current_user):
     )
     
     db.session.add(new_booking)
-    db.session.commit()
-    
-    # Notify admin
-    from app.services.email_service import EmailService
-    EmailService.notify_new_booking(new_booking, current_user, car)
+    RollupService.add(new_booking)
+    try:
+        db.session.flush()
+        # Notify admin, delivered by the outbox dispatcher once committed
+        outbox.add('booking_created', booking_id=new_booking.id)
+        db.session.commit()
+    except IntegrityError as e:
+        db.session.rollback()
+        if not BookingGuard.is_conflict(e):
+            raise
+        return jsonify({'message': 'Car is already booked for this period'}), 400
+    booking_index.sync(new_booking)
+    response_cache.bump('bookings')
     
     return jsonify({'message': 'Booking created successfully', 'id': new_booking.id}), 201
 
+@bp.route('/bulk', methods=['POST'])
+@token_required
+def create_bulk_bookings(current_user):
+    """
+    Create many bookings in one transaction: several cars and/or a recurrence.
+
+    Body: car_ids (or car_id), objective, destination, and either
+    slots: [{start_time, end_time}, ...] or recurrence: {start_time,
+    end_time, freq: daily|weekly, interval, byweekday: [MO..SU], count or
+    until (YYYY-MM-DD)}. Every slot is booked for every car. By default any
+    conflict rejects the whole batch; with skip_conflicts=true the free
+    slots are booked and the rest reported back.
+    """
+    data = request.get_json() or {}
+
+    car_ids = data.get('car_ids') or ([data['car_id']] if data.get('car_id') else [])
+    if not car_ids:
+        return jsonify({'message': 'Missing field: car_ids'}), 400
+    if not isinstance(car_ids, list):
+        return jsonify({'message': 'car_ids must be a list'}), 400
+    try:
+        car_ids = sorted({int(car_id) for car_id in car_ids})
+    except (ValueError, TypeError):
+        return jsonify({'message': 'car_ids must be whole numbers'}), 400
+
+    try:
+        if data.get('recurrence'):
+            rule = data['recurrence']
+            until = rule.get('until')
+            slots = BulkBookingService.expand_recurrence(
+                _parse_iso(rule['start_time']),
+                _parse_iso(rule['end_time']),
+                rule.get('freq', 'weekly'),
+                interval=int(rule.get('interval', 1)),
+                byweekday=rule.get('byweekday'),
+                count=int(rule['count']) if rule.get('count') else None,
+                until=date.fromisoformat(until) if until else None
+            )
+        elif data.get('slots'):
+            slots = [(_parse_iso(slot['start_time']), _parse_iso(slot['end_time'])) for slot in data['slots']]
+        else:
+            return jsonify({'message': 'Either slots or recurrence is required'}), 400
+    except KeyError as e:
+        return jsonify({'message': f'Missing field: {e.args[0]}'}), 400
+    except (ValueError, TypeError) as e:
+        return jsonify({'message': f'Invalid request: {e}'}), 400
+
+    wanted = [(car_id, start, end) for car_id in car_ids for start, end in slots]
+    if not wanted:
+        return jsonify({'message': 'The request does not produce any bookings'}), 400
+    if len(wanted) > MAX_BULK_BOOKINGS:
+        return jsonify({'message': f'At most {MAX_BULK_BOOKINGS} bookings per request'}), 400
+    if any(end <= start for _, start, end in wanted):
+        return jsonify({'message': 'End time must be after start time'}), 400
+
+    # Lock in id order so concurrent batches can't deadlock each other
+    for car_id in car_ids:
+        car = BookingGuard.lock_car(car_id)
+        if not car:
+            db.session.rollback()
+            return jsonify({'message': f'Car not found: {car_id}'}), 404
+        if car.status == 'maintenance':
+            db.session.rollback()
+            return jsonify({'message': f'Car is under maintenance: {car.license_plate}'}), 400
+
+    conflicts = BulkBookingService.find_conflicts(wanted)
+    skipped = [
+        {
+            'car_id': wanted[i][0],
+            'start_time': wanted[i][1].isoformat() + 'Z',
+            'end_time': wanted[i][2].isoformat() + 'Z',
+            'message': BookingGuard.conflict_message(*conflicts[i])
+        }
+        for i in sorted(conflicts)
+    ]
+    if skipped and not data.get('skip_conflicts'):
+        db.session.rollback()
+        return jsonify({'message': f'{len(skipped)} of the requested bookings conflict with existing ones', 'conflicts': skipped}), 400
+
+    new_bookings = [
+        Booking(
+            user_id=current_user.id,
+            car_id=car_id,
+            start_time=start,
+            end_time=end,
+            objective=data.get('objective'),
+            destination=data.get('destination'),
+            status='pending'
+        )
+        for i, (car_id, start, end) in enumerate(wanted) if i not in conflicts
+    ]
+    if not new_bookings:
+        db.session.rollback()
+        return jsonify({'message': 'All requested bookings conflict with existing ones', 'conflicts': skipped}), 400
+
+    db.session.add_all(new_bookings)
+    RollupService.add_many(new_bookings)
+    try:
+        db.session.flush()
+        ids = [b.id for b in new_bookings]
+        # One digest for the admins instead of an email per booking
+        outbox.add('bookings_created', booking_ids=ids)
+        db.session.commit()
+    except IntegrityError as e:
+        db.session.rollback()
+        if not BookingGuard.is_conflict(e):
+            raise
+        return jsonify({'message': 'Car is already booked for this period'}), 400
+    for booking in new_bookings:
+        booking_index.sync(booking)
+    response_cache.bump('bookings')
+
+    return jsonify({
+        'message': f'{len(new_bookings)} bookings created successfully',
+        'ids': ids,
+        'skipped': skipped
+    }), 201
+
 @bp.route('/', methods=['GET'])
 @token_required
 def get_bookings(current_user):
+    """
+    Keyset-paginated bookings listing, newest first.
+
+    Query params: status (comma separated), car_id, user_id (admin only),
+    start_date/end_date (bookings overlapping the range), fields (comma
+    separated projection), limit and cursor (from the previous page's
+    next_cursor). counts=true adds per-status totals for the filtered set.
+    """
     show_all = request.args.get('all') == 'true'
 
+    try:
+        limit = min(int(request.args.get('limit', BOOKING_PAGE_SIZE)), BOOKING_PAGE_SIZE_MAX)
+    except ValueError:
+        return jsonify({'message': 'Invalid limit'}), 400
+    if limit < 1:
+        return jsonify({'message': 'Invalid limit'}), 400
+
+    fields = None
+    if request.args.get('fields'):
+        fields = {f.strip() for f in request.args['fields'].split(',') if f.strip()}
+        fields.add('id')
+
+    # type=int would turn a bad value into None, i.e. an IS NULL filter
+    for name in ('user_id', 'car_id'):
+        if request.args.get(name) and request.args.get(name, type=int) is None:
+            return jsonify({'message': f'Invalid {name}'}), 400
+
+    filters = []
     if current_user.role == 'admin' or show_all:
-        bookings = Booking.query.order_by(Booking.created_at.desc()).all()
+        if request.args.get('user_id'):
+            filters.append(Booking.user_id == request.args.get('user_id', type=int))
     else:
-        bookings = Booking.query.filter_by(user_id=current_user.id).order_by(Booking.created_at.desc()).all()
-        
-    output = []
-    for b in bookings:
-        car = Car.query.get(b.car_id)
-        user = User.query.get(b.user_id)
-        
-        output.append({
-            'id': b.id,
-            'user_id': b.user_id,
-            'user_name': user.full_name if user else 'Unknown',
-            'user_phone': user.phone_number if user else 'Unknown',
-            'car_id': b.car_id,
-            'car_license': car.license_plate if car else 'Unknown',
-            'car_model': f"{car.brand} {car.model}" if car else 'Unknown',
-            'start_time': b.start_time.isoformat() + 'Z',
-            'end_time': b.end_time.isoformat() + 'Z',
-            'objective': b.objective,
-            'destination': b.destination,
-            'status': b.status,
-            'start_mileage': b.start_mileage,
-            'end_mileage': b.end_mileage,
-            'created_at': b.created_at.isoformat() + 'Z'
-        })
-        
-    return jsonify({'bookings': output}), 200
+        filters.append(Booking.user_id == current_user.id)
+
+    if request.args.get('status'):
+        filters.append(Booking.status.in_(request.args['status'].split(',')))
+
+    if request.args.get('car_id'):
+        filters.append(Booking.car_id == request.args.get('car_id', type=int))
+
+    try:
+        if request.args.get('start_date'):
+            filters.append(Booking.end_time >= _parse_iso(request.args['start_date']))
+        if request.args.get('end_date'):
+            filters.append(Booking.start_time < _parse_iso(request.args['end_date']))
+    except ValueError:
+        return jsonify({'message': 'Invalid date format'}), 400
+
+    counts = None
+    if request.args.get('counts') == 'true':
+        # Per-status totals over the whole filtered set (not just this page)
+        counts = dict(
+            db.session.query(Booking.status, func.count(Booking.id))
+            .filter(*filters)
+            .group_by(Booking.status)
+            .all()
+        )
+
+    cursor = request.args.get('cursor')
+    if cursor:
+        try:
+            cursor_created_at, cursor_id = decode_cursor(cursor)
+        except InvalidCursor:
+            return jsonify({'message': 'Invalid cursor'}), 400
+        filters.append(or_(
+            Booking.created_at < cursor_created_at,
+            and_(Booking.created_at == cursor_created_at, Booking.id < cursor_id)
+        ))
+
+    query = Booking.query.filter(*filters)
+
+    # Only join users/cars when the projection actually needs them.
+    # Eager-loading avoids two extra lookups per booking row.
+    if fields is None or fields & {'user_name', 'user_phone'}:
+        query = query.options(joinedload(Booking.user))
+    if fields is None or fields & {'car_license', 'car_model'}:
+        query = query.options(joinedload(Booking.car))
+
+    bookings = query.order_by(Booking.created_at.desc(), Booking.id.desc()).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(bookings) > limit:
+        bookings = bookings[:limit]
+        next_cursor = encode_cursor(bookings[-1].created_at, bookings[-1].id)
+
+    output = [b.to_dict(fields) for b in bookings]
+
+    response = {'bookings': output, 'next_cursor': next_cursor}
+    if counts is not None:
+        response['counts'] = counts
+    return jsonify(response), 200
 
 @bp.route('/<int:id>/status', methods=['PUT'])
 @token_required
@@ -114,27 +335,134 @@ def update_booking_status(current_user, id):
         return jsonify({'message': 'Status is required'}), 400
         
     new_status = data['status']
-    allowed_statuses = ['pending', 'approved', 'rejected', 'completed', 'cancelled']
-    
-    if new_status not in allowed_statuses:
+    if new_status not in BOOKING_STATUSES:
          return jsonify({'message': 'Invalid status'}), 400
          
+    if new_status in ACTIVE_BOOKING_STATUSES and booking.status not in ACTIVE_BOOKING_STATUSES:
+        # Re-activating a booking: its period may have been taken meanwhile
+        BookingGuard.lock_car(booking.car_id)
+        conflict = BookingGuard.find_conflict(booking.car_id, booking.start_time, booking.end_time, exclude_id=booking.id)
+        if conflict:
+            db.session.rollback()
+            return jsonify({'message': BookingGuard.conflict_message(conflict.start_time, conflict.end_time)}), 400
+
+    RollupService.remove(booking)
     booking.status = new_status
+    RollupService.add(booking)
+    # Notify user of status update
+    outbox.add('booking_status', booking_ids=[booking.id], status=new_status)
     
     # If approved, maybe update car status to 'reserved'? 
     # Or just rely on the overlap check?
     # Let's keep car status as 'available' but rely on bookings table for availability.
     
-    db.session.commit()
-    
-    # Notify user of status update
-    from app.services.email_service import EmailService
-    user = User.query.get(booking.user_id)
-    car = Car.query.get(booking.car_id)
-    EmailService.notify_booking_status(booking, user, car)
+    try:
+        db.session.commit()
+    except IntegrityError as e:
+        db.session.rollback()
+        if not BookingGuard.is_conflict(e):
+            raise
+        return jsonify({'message': 'Car is already booked for this period'}), 400
+    booking_index.sync(booking)
+    response_cache.bump('bookings')
     
     return jsonify({'message': f'Booking {new_status}'}), 200
 
+@bp.route('/status', methods=['PUT'])
+@token_required
+@admin_required
+def update_bookings_status(current_user):
+    """
+    Set one status on many bookings in a single transaction.
+
+    Body: {ids: [...], status}. Returns a result per id: updated,
+    unchanged, not_found or conflict (re-activations whose period has been
+    taken meanwhile). Each affected user gets one email for the batch,
+    sent by the outbox dispatcher.
+    """
+    data = request.get_json() or {}
+    new_status = data.get('status')
+    if not new_status:
+        return jsonify({'message': 'Status is required'}), 400
+    if new_status not in BOOKING_STATUSES:
+        return jsonify({'message': 'Invalid status'}), 400
+
+    if not data.get('ids'):
+        return jsonify({'message': 'Missing field: ids'}), 400
+    try:
+        if not isinstance(data['ids'], list):
+            raise TypeError
+        ids = sorted({int(booking_id) for booking_id in data['ids']})
+    except (TypeError, ValueError):
+        return jsonify({'message': 'ids must be a list of booking ids'}), 400
+    if len(ids) > MAX_BULK_BOOKINGS:
+        return jsonify({'message': f'At most {MAX_BULK_BOOKINGS} bookings per request'}), 400
+
+    bookings = {b.id: b for b in Booking.query.filter(Booking.id.in_(ids)).all()}
+    results = {booking_id: {'id': booking_id, 'result': 'not_found'} for booking_id in ids}
+    changed = []
+    for booking_id, booking in bookings.items():
+        if booking.status == new_status:
+            results[booking_id]['result'] = 'unchanged'
+        else:
+            changed.append(booking)
+
+    reactivated = [
+        b for b in changed
+        if new_status in ACTIVE_BOOKING_STATUSES and b.status not in ACTIVE_BOOKING_STATUSES
+    ]
+    if reactivated:
+        # Re-activated periods may have been taken meanwhile; lock in car id
+        # order so concurrent batches can't deadlock each other
+        for car_id in sorted({b.car_id for b in reactivated}):
+            BookingGuard.lock_car(car_id)
+        conflicts = BulkBookingService.find_conflicts([(b.car_id, b.start_time, b.end_time) for b in reactivated])
+        for i, (start, end) in conflicts.items():
+            booking = reactivated[i]
+            results[booking.id].update(result='conflict', message=BookingGuard.conflict_message(start, end))
+            changed.remove(booking)
+
+    if changed:
+        now = datetime.utcnow()
+        RollupService.remove_many(changed)
+        db.session.execute(
+            update(Booking)
+            .where(Booking.id.in_([b.id for b in changed]))
+            .values(status=new_status, updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        # Mirror the UPDATE on the loaded objects without marking them dirty,
+        # otherwise the flush would write every row a second time
+        for booking in changed:
+            set_committed_value(booking, 'status', new_status)
+            set_committed_value(booking, 'updated_at', now)
+            results[booking.id]['result'] = 'updated'
+        RollupService.add_many(changed)
+        outbox.add('booking_status', booking_ids=[b.id for b in changed], status=new_status)
+
+        # Detach the bookings so the commit doesn't expire them and turn
+        # each index sync below into its own SELECT
+        for booking in changed:
+            db.session.expunge(booking)
+
+    try:
+        db.session.commit()
+    except IntegrityError as e:
+        db.session.rollback()
+        if not BookingGuard.is_conflict(e):
+            raise
+        return jsonify({'message': 'Car is already booked for this period'}), 400
+
+    if changed:
+        for booking in changed:
+            booking_index.sync(booking)
+        response_cache.bump('bookings')
+
+    return jsonify({
+        'message': f'{len(changed)} of {len(ids)} bookings {new_status}',
+        'results': [results[booking_id] for booking_id in ids]
+    }), 200
+
 @bp.route('/available-cars', methods=['GET'])
 @token_required
 def get_available_cars(current_user):
@@ -145,23 +473,18 @@ def get_available_cars(current_user):
         return jsonify({'message': 'Start and End time required'}), 400
         
     try:
-        start_time = datetime.fromisoformat(start_str.replace('Z', '+00:00'))
-        end_time = datetime.fromisoformat(end_str.replace('Z', '+00:00'))
+        start_time = _parse_iso(start_str)
+        end_time = _parse_iso(end_str)
     except ValueError:
         return jsonify({'message': 'Invalid date format'}), 400
         
     # Find cars that have NO active bookings (pending, approved, picked_up) overlapping with the requested time
-    # Subquery for booked car IDs in that time range
-    booked_car_ids = db.session.query(Booking.car_id).filter(
-        Booking.status.in_(['pending', 'approved', 'picked_up']),
-        Booking.start_time < end_time,
-        Booking.end_time > start_time
-    ).subquery()
-    
-    available_cars = Car.query.filter(
-        Car.status == 'available',
-        ~Car.id.in_(booked_car_ids)
-    ).all()
+    booked_car_ids = booking_index.busy_car_ids(start_time, end_time)
+    
+    query = Car.query.filter(Car.status == 'available')
+    if booked_car_ids:
+        query = query.filter(~Car.id.in_(booked_car_ids))
+    available_cars = query.all()
     
     output = []
     for car in available_cars:
@@ -175,6 +498,65 @@ def get_available_cars(current_user):
         
     return jsonify({'cars': output}), 200
 
+@bp.route('/availability-matrix', methods=['GET'])
+@token_required
+def get_availability_matrix(current_user):
+    """
+    Free/busy matrix for every car over one window, in slot_minutes slots.
+
+    encoding=runs (default) returns busy runs as [start_slot, length] pairs;
+    encoding=bitmap returns base64 of the busy bits packed MSB-first.
+    """
+    start_str = request.args.get('start_time')
+    end_str = request.args.get('end_time')
+    encoding = request.args.get('encoding', 'runs')
+
+    if not start_str or not end_str:
+        return jsonify({'message': 'Start and End time required'}), 400
+
+    try:
+        start_time = _parse_iso(start_str)
+        end_time = _parse_iso(end_str)
+    except ValueError:
+        return jsonify({'message': 'Invalid date format'}), 400
+
+    try:
+        slot_minutes = int(request.args.get('slot_minutes', 60))
+    except ValueError:
+        return jsonify({'message': 'Invalid slot size'}), 400
+
+    if end_time <= start_time or slot_minutes < 1:
+        return jsonify({'message': 'Invalid time window'}), 400
+
+    if (end_time - start_time).total_seconds() / 60 / slot_minutes > MAX_MATRIX_SLOTS:
+        return jsonify({'message': f'Window too large: at most {MAX_MATRIX_SLOTS} slots'}), 400
+
+    if encoding not in ('runs', 'bitmap'):
+        return jsonify({'message': 'Invalid encoding'}), 400
+
+    cars, busy = AvailabilityService.busy_matrix(start_time, end_time, slot_minutes)
+    encode = AvailabilityService.encode_runs if encoding == 'runs' else AvailabilityService.encode_bitmap
+
+    output = []
+    for car, row in zip(cars, busy):
+        output.append({
+            'id': car.id,
+            'license_plate': car.license_plate,
+            'brand': car.brand,
+            'model': car.model,
+            'status': car.status,
+            'busy': encode(row)
+        })
+
+    return jsonify({
+        'start_time': start_time.isoformat() + 'Z',
+        'end_time': end_time.isoformat() + 'Z',
+        'slot_minutes': slot_minutes,
+        'slots': busy.shape[1],
+        'encoding': encoding,
+        'cars': output
+    }), 200
+
 @bp.route('/<int:id>/return', methods=['PUT'])
 @token_required
 def return_car(current_user, id):
@@ -228,20 +610,21 @@ def return_car(current_user, id):
     if end_mileage < start_mileage:
         return jsonify({'message': f'End mileage cannot be less than start mileage ({start_mileage})'}), 400
         
+    RollupService.remove(booking)
     booking.start_mileage = start_mileage
     booking.end_mileage = end_mileage
     booking.status = 'completed'
+    RollupService.add(booking)
     car.current_mileage = end_mileage
+
+    # Notify user of completion and check for maintenance, both after commit
+    # through the outbox dispatcher
+    outbox.add('booking_status', booking_ids=[booking.id], status='completed')
+    outbox.add('maintenance_check', car_id=car.id)
     
     db.session.commit()
-
-    # Notify user of completion
-    from app.services.email_service import EmailService
-    user = User.query.get(booking.user_id)
-    EmailService.notify_booking_status(booking, user, car)
-
-    # Check for maintenance
-    from app.services.notification_service import NotificationService
-    NotificationService.check_maintenance(car)
+    booking_index.sync(booking)
+    # The car's mileage changed too
+    response_cache.bump('bookings', 'cars')
     
     return jsonify({'message': 'Car returned successfully'}), 200
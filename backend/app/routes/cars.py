@@ -1,12 +1,16 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
 from app import db
 from app.models import Car
+from app.services.car_import_service import CarImportService, IMPORT_FORMATS
 from app.utils.decorators import token_required, admin_required
+from app.utils.response_cache import response_cache
+import csv
 
 bp = Blueprint('cars', __name__)
 
 @bp.route('/', methods=['GET'])
 @token_required
+@response_cache.cached('cars')
 def get_cars(current_user):
     # Admins see all cars, Users see available cars? 
     # Requirement: "User can see available cars, if not available cannot select"
@@ -55,9 +59,50 @@ def add_car(current_user):
     
     db.session.add(new_car)
     db.session.commit()
+    response_cache.bump('cars')
     
     return jsonify({'message': 'Car added successfully'}), 201
 
+@bp.route('/import', methods=['POST'])
+@token_required
+@admin_required
+def import_cars(current_user):
+    """
+    Add or update cars from a CSV (header row) or JSON-lines upload.
+
+    The body is either the raw file (?format=csv|jsonl, or a text/csv /
+    application/x-ndjson content type) or a multipart upload in `file`.
+    Columns: license_plate, brand, model, color, current_mileage, status,
+    last_maintenance_mileage; empty ones keep the car's current value.
+    With ?update=false existing plates are reported instead of updated.
+    """
+    upload = request.files.get('file')
+    fmt = request.args.get('format')
+    if not fmt:
+        name = upload.filename if upload else ''
+        content_type = upload.mimetype if upload else request.mimetype
+        fmt = 'jsonl' if name.endswith(('.jsonl', '.ndjson')) or 'json' in content_type else 'csv'
+    if fmt not in IMPORT_FORMATS:
+        return jsonify({'message': f"format must be one of: {', '.join(IMPORT_FORMATS)}"}), 400
+
+    rows = CarImportService.read_rows(upload.stream if upload else request.stream, fmt)
+    try:
+        report = CarImportService.import_rows(
+            rows,
+            update_existing=request.args.get('update', 'true').lower() != 'false',
+            chunk_size=current_app.config['CAR_IMPORT_CHUNK_SIZE']
+        )
+    except (UnicodeDecodeError, csv.Error) as e:
+        db.session.rollback()
+        return jsonify({'message': f'Could not read the file: {e}'}), 400
+    finally:
+        # Earlier chunks are committed even if a later one fails
+        response_cache.bump('cars')
+
+    result = report.to_dict()
+    result['message'] = f"{report.inserted} cars added, {report.updated} updated, {report.unchanged} unchanged, {report.error_count} rows rejected"
+    return jsonify(result), 200
+
 @bp.route('/<int:id>', methods=['PUT'])
 @token_required
 @admin_required
@@ -78,6 +123,7 @@ def update_car(current_user, id):
     if 'last_maintenance_mileage' in data: car.last_maintenance_mileage = data['last_maintenance_mileage']
     
     db.session.commit()
+    response_cache.bump('cars')
     
     return jsonify({'message': 'Car updated successfully'}), 200
 
@@ -90,6 +136,7 @@ def service_car(current_user, id):
     car.status = 'available' # Reset status to available after service
     
     db.session.commit()
+    response_cache.bump('cars')
     return jsonify({'message': 'Car marked as serviced', 'new_maintenance_mileage': car.last_maintenance_mileage}), 200
 
 @bp.route('/<int:id>', methods=['DELETE'])
@@ -99,5 +146,6 @@ def delete_car(current_user, id):
     car = Car.query.get_or_404(id)
     db.session.delete(car)
     db.session.commit()
+    response_cache.bump('cars')
     
     return jsonify({'message': 'Car deleted successfully'}), 200
@@ -0,0 +1,24 @@
+from flask import Blueprint, jsonify
+from app import db
+from app.utils.decorators import token_required, admin_required
+from app.utils.user_cache import user_cache
+from app.utils.response_cache import response_cache
+from app.utils.pool_metrics import pool_metrics
+from app.services.mail_queue import mail_queue
+from app.services.notification_broker import notification_broker
+from app.services.outbox import outbox
+
+bp = Blueprint('metrics', __name__)
+
+@bp.route('/', methods=['GET'])
+@token_required
+@admin_required
+def get_metrics(current_user):
+    return jsonify({
+        'db_pool': pool_metrics.stats(db.engine.pool),
+        'user_cache': user_cache.stats(),
+        'response_cache': response_cache.stats(),
+        'mail_queue': mail_queue.stats(),
+        'notification_broker': notification_broker.stats(),
+        'outbox': outbox.stats()
+    }), 200
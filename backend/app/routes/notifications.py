@@ -1,7 +1,11 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, Response, current_app
 from app import db
 from app.models import Notification
 from app.utils.decorators import token_required, admin_required
+from app.services.notification_broker import notification_broker
+from app.services.notification_service import NotificationService
+import json
+import queue
 
 bp = Blueprint('notifications', __name__)
 
@@ -21,15 +25,52 @@ def get_notifications(current_user):
 @bp.route('/unread-count', methods=['GET'])
 @token_required
 def get_unread_count(current_user):
-    if current_user.role == 'admin':
-        count = Notification.query.filter(
-            ((Notification.user_id == current_user.id) | (Notification.user_id == None)),
-            Notification.is_read == False
-        ).count()
-    else:
-        count = Notification.query.filter_by(user_id=current_user.id, is_read=False).count()
-    
-    return jsonify({'count': count}), 200
+    return jsonify({'count': NotificationService.unread_count(current_user)}), 200
+
+@bp.route('/stream', methods=['GET'])
+@token_required
+def stream_notifications(current_user):
+    """
+    Server-Sent Events stream of the caller's notifications.
+
+    Events: 'notification' (data is the new notification) and 'refresh'
+    (several changed at once; re-fetch the list). No database connection is
+    held while the stream is open; idle streams only send a comment line
+    every NOTIFICATION_STREAM_HEARTBEAT seconds.
+
+    Each open stream holds a server thread, so a process serves at most
+    NOTIFICATION_STREAM_MAX of them; beyond that the client gets 503 and
+    falls back to polling until a slot frees up. Marking notifications read
+    sends 'refresh' to the owner's other streams so their badges follow.
+    """
+    subscription = notification_broker.subscribe(current_user.id, current_user.role == 'admin')
+    if subscription is None:
+        db.session.remove()
+        response = jsonify({'message': 'Too many open notification streams, poll instead'})
+        response.headers['Retry-After'] = '60'
+        return response, 503
+    heartbeat = current_app.config.get('NOTIFICATION_STREAM_HEARTBEAT', 25)
+    db.session.remove()
+
+    def generate():
+        yield "retry: 5000\n\n"
+        while True:
+            try:
+                event, data = subscription.get(timeout=heartbeat)
+            except queue.Empty:
+                yield ": keepalive\n\n"
+                continue
+            yield f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+    response = Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        # Stop nginx-style proxies from buffering the stream
+        'X-Accel-Buffering': 'no'
+    })
+    # Runs even if the client goes away before the first chunk, when a
+    # generator's own finally would not, so the slot is always released
+    response.call_on_close(lambda: notification_broker.unsubscribe(subscription))
+    return response
 
 @bp.route('/<int:id>/read', methods=['PUT'])
 @token_required
@@ -40,20 +81,35 @@ def mark_as_read(current_user, id):
     if notification.user_id and notification.user_id != current_user.id:
         return jsonify({'message': 'Unauthorized'}), 403
         
-    notification.is_read = True
+    # Conditional so a concurrent read of the same notification is counted once
+    flipped = Notification.query.filter_by(id=id, is_read=False).update(
+        {Notification.is_read: True}, synchronize_session=False
+    )
+    NotificationService.adjust_unread(notification.user_id, -flipped)
     db.session.commit()
+    if flipped:
+        # Other tabs (and, for system notifications, other admins) re-fetch
+        notification_broker.publish(notification.user_id, 'refresh')
     return jsonify({'message': 'Notification marked as read'}), 200
 
 @bp.route('/read-all', methods=['PUT'])
 @token_required
 def mark_all_as_read(current_user):
+    owners = [current_user.id]
     if current_user.role == 'admin':
-        Notification.query.filter(
-            ((Notification.user_id == current_user.id) | (Notification.user_id == None)),
+        owners.append(None)
+    changed = []
+    for owner in owners:
+        # owner None renders as IS NULL (system notifications)
+        flipped = Notification.query.filter(
+            Notification.user_id == owner,
             Notification.is_read == False
         ).update({Notification.is_read: True}, synchronize_session=False)
-    else:
-        Notification.query.filter_by(user_id=current_user.id, is_read=False).update({Notification.is_read: True}, synchronize_session=False)
+        NotificationService.adjust_unread(owner, -flipped)
+        if flipped:
+            changed.append(owner)
     
     db.session.commit()
+    for owner in changed:
+        notification_broker.publish(owner, 'refresh')
     return jsonify({'message': 'All notifications marked as read'}), 200
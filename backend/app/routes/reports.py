@@ -1,28 +1,44 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, request, jsonify, Response, stream_with_context
 from app import db
-from app.models import Car, Booking
-from sqlalchemy import func
+from app.models import Car, Booking, BookingDailyStat, User
+from app.utils.decorators import token_required, admin_required
+from app.utils.response_cache import response_cache
+from app.utils.query_budget import report_budget
+from app.utils.pagination import encode_cursor, decode_cursor, InvalidCursor
+from app.services.report_pdf_service import ReportPdfService
+from sqlalchemy import func, case, and_, or_
+from sqlalchemy.orm import joinedload
+from werkzeug.utils import secure_filename
+from datetime import datetime
+import csv
+import io
+import itertools
+import logging
 
 bp = Blueprint('reports', __name__)
 
 @bp.route('/stats', methods=['GET'])
+@response_cache.cached('cars', 'bookings')
+@report_budget
 def get_stats():
     # 1. Total Cars
     total_cars = Car.query.count()
     active_cars = Car.query.filter(Car.status.in_(['available', 'reserved'])).count()
 
     # 2. Total Bookings
-    total_bookings = Booking.query.count()
+    # Booking figures come from the booking_daily_stats rollup (maintained by
+    # RollupService), not from scanning the bookings table.
+    total_bookings = db.session.query(
+        func.coalesce(func.sum(BookingDailyStat.booking_count), 0)
+    ).scalar()
 
     # 3. Bookings per Car (for Bar Chart)
-    # Query: SELECT car.license_plate, car.brand, car.model, COUNT(booking.id) 
-    #        FROM cars JOIN bookings ON ... GROUP BY car.id
     cars_stats = db.session.query(
         Car.license_plate, 
         Car.brand, 
         Car.model, 
-        func.count(Booking.id).label('booking_count')
-    ).outerjoin(Booking, Car.id == Booking.car_id).group_by(Car.id).all()
+        func.coalesce(func.sum(BookingDailyStat.booking_count), 0).label('booking_count')
+    ).outerjoin(BookingDailyStat, Car.id == BookingDailyStat.car_id).group_by(Car.id).all()
 
     car_data = []
     for cs in cars_stats:
@@ -32,18 +48,11 @@ def get_stats():
         })
 
     # 4. Monthly Usage (for Line Chart)
-    # Query: Extract month from start_time and count
-    # This might be database specific. For simplicity in SQLite/Postgres:
-    # We will fetch all bookings and aggregate in Python for DB compatibility safety 
-    # or use EXTRACT(MONTH FROM start_time) if we are sure about Postgres.
-    # Given the environment is Docker/Postgres (from previous context), we can use extract.
-    
-    from sqlalchemy import extract
-    
+    # Grouped on the rollup's 'YYYY-MM' column, which works on SQLite and Postgres alike
     monthly_stats = db.session.query(
-        func.to_char(Booking.start_time, 'YYYY-MM').label('month'),
-        func.count(Booking.id)
-    ).group_by('month').order_by('month').all()
+        BookingDailyStat.month,
+        func.sum(BookingDailyStat.booking_count)
+    ).group_by(BookingDailyStat.month).order_by(BookingDailyStat.month).all()
 
     monthly_data = []
     for ms in monthly_stats:
@@ -60,20 +69,18 @@ def get_stats():
         'monthly_stats': monthly_data
     }), 200
 
-@bp.route('/advanced-stats', methods=['GET'])
-def get_advanced_stats():
-    from flask import request
-    from app.models import User, Car
-    from datetime import datetime
-    import logging
+REPORT_PAGE_SIZE = 100
+REPORT_PAGE_SIZE_MAX = 1000
+EXPORT_BATCH_SIZE = 500
 
+def _report_filters():
+    """Booking.start_time range filters from the start_date/end_date query params."""
     start_date_str = request.args.get('start_date')
     end_date_str = request.args.get('end_date')
     
     logging.info(f"Advanced Stats Request: start={start_date_str}, end={end_date_str}")
 
-    query = Booking.query
-
+    filters = []
     try:
         if start_date_str:
             # Handle ISO format from frontend (Z or +00:00)
@@ -83,7 +90,7 @@ def get_advanced_stats():
             # Remove timezone if DB stores naive
             if start_date.tzinfo:
                 start_date = start_date.replace(tzinfo=None)
-            query = query.filter(Booking.start_time >= start_date)
+            filters.append(Booking.start_time >= start_date)
             
         if end_date_str:
             if 'Z' in end_date_str:
@@ -91,68 +98,157 @@ def get_advanced_stats():
             end_date = datetime.fromisoformat(end_date_str)
             if end_date.tzinfo:
                 end_date = end_date.replace(tzinfo=None)
-            query = query.filter(Booking.start_time <= end_date)
+            filters.append(Booking.start_time <= end_date)
             
     except Exception as e:
         logging.error(f"Error parsing dates: {e}")
         # Continue with unfiltered query or return error? 
         # For now, let's continue to avoid breaking the UI but log it.
+        filters = []
+
+    return filters
+
+def _trip_mileage():
+    # Mileage only counts for completed bookings with both readings
+    return case(
+        (and_(Booking.status == 'completed', Booking.start_mileage.isnot(None), Booking.end_mileage.isnot(None)),
+         Booking.end_mileage - Booking.start_mileage),
+        else_=0
+    )
+
+def _car_label(car):
+    return f"{car.brand} {car.model} ({car.license_plate})" if car else 'N/A'
+
+def _advanced_summary(filters):
+    """Summary and daily series for the filtered bookings, aggregated in SQL."""
+    trip_mileage = _trip_mileage()
+
+    total_bookings, total_mileage_sum = db.session.query(
+        func.count(Booking.id),
+        func.coalesce(func.sum(trip_mileage), 0)
+    ).filter(*filters).one()
+    logging.info(f"Bookings found for range: {total_bookings}")
+
+    # Top users (grouped by name, as before, so namesakes are merged)
+    user_name = func.coalesce(User.full_name, 'N/A')
+    user_rows = db.session.query(
+        user_name.label('name'),
+        func.count(Booking.id).label('count')
+    ).outerjoin(User, Booking.user_id == User.id).filter(*filters).group_by(user_name).order_by(
+        func.count(Booking.id).desc()
+    ).limit(10).all()
+
+    car_rows = db.session.query(
+        Booking.car_id,
+        func.count(Booking.id).label('count'),
+        func.coalesce(func.sum(trip_mileage), 0).label('mileage')
+    ).filter(*filters).group_by(Booking.car_id).all()
+    cars = {c.id: c for c in Car.query.filter(Car.id.in_([r.car_id for r in car_rows if r.car_id is not None])).all()}
 
-    bookings = query.order_by(Booking.start_time).all()
-    logging.info(f"Bookings found for range: {len(bookings)}")
-
-    if not bookings:
-        return jsonify({
-            'summary': {
-                'top_users': [],
-                'car_stats': [],
-                'total_mileage': 0,
-                'total_bookings': 0
-            },
-            'daily_stats': [],
-            'bookings': []
-        }), 200
-
-    # Dictionaries for aggregation
-    user_counts = {}
     car_stats_dict = {}
-    daily_stats_dict = {}
-    total_mileage_sum = 0
-    detailed_bookings = []
+    for r in car_rows:
+        c_name = _car_label(cars.get(r.car_id))
+        stats = car_stats_dict.setdefault(c_name, {'name': c_name, 'count': 0, 'mileage': 0})
+        stats['count'] += r.count
+        stats['mileage'] += int(r.mileage)
+
+    # Daily stats; func.date() yields a string on SQLite and a date on Postgres
+    day = func.date(Booking.start_time)
+    daily_rows = db.session.query(
+        day.label('day'),
+        func.count(Booking.id).label('bookings')
+    ).filter(*filters).group_by(day).order_by(day).all()
+
+    # Format summaries
+    sorted_users = [{'name': r.name, 'count': r.count} for r in user_rows]
+    sorted_cars = sorted(car_stats_dict.values(), key=lambda x: x['count'], reverse=True)
+    sorted_daily = [{'date': str(r.day), 'bookings': r.bookings} for r in daily_rows]
+
+    return {
+        'summary': {
+            'top_users': sorted_users,
+            'car_stats': sorted_cars,
+            'total_mileage': int(total_mileage_sum),
+            'total_bookings': total_bookings
+        },
+        'daily_stats': sorted_daily
+    }
+
+def _export_rows(filters):
+    """Detailed report rows as a streamed joined query (server-side cursor)."""
+    return db.session.query(
+        Booking.start_time,
+        Booking.status,
+        Booking.destination,
+        Booking.objective,
+        _trip_mileage().label('mileage'),
+        User.full_name,
+        Car.brand,
+        Car.model,
+        Car.license_plate
+    ).outerjoin(User, Booking.user_id == User.id).outerjoin(Car, Booking.car_id == Car.id).filter(
+        *filters
+    ).order_by(Booking.start_time, Booking.id).execution_options(yield_per=EXPORT_BATCH_SIZE)
+
+@bp.route('/advanced-stats', methods=['GET'])
+@token_required
+@admin_required
+@report_budget
+def get_advanced_stats(current_user):
+    """
+    Summary and daily series for a start_time range.
+    Detailed rows are served by /advanced-stats/bookings.
+    """
+    return jsonify(_advanced_summary(_report_filters())), 200
+
+@bp.route('/advanced-stats/bookings', methods=['GET'])
+@token_required
+@admin_required
+@report_budget
+def get_advanced_stats_bookings(current_user):
+    """
+    Detailed booking rows for the advanced report, in start_time order,
+    keyset-paginated with limit and cursor (the previous page's next_cursor).
+    """
+    filters = _report_filters()
+
+    try:
+        limit = min(int(request.args.get('limit', REPORT_PAGE_SIZE)), REPORT_PAGE_SIZE_MAX)
+    except ValueError:
+        return jsonify({'message': 'Invalid limit'}), 400
+    if limit < 1:
+        return jsonify({'message': 'Invalid limit'}), 400
 
-    # Map users and cars for quick lookup (if list is small)
-    # For large datasets, this should be optimized, but for reports it's usually okay.
-    from app.models import User, Car
-    users_dict = {u.id: u.full_name for u in User.query.all()}
-    cars_obj_dict = {c.id: f"{c.brand} {c.model} ({c.license_plate})" for c in Car.query.all()}
+    cursor = request.args.get('cursor')
+    if cursor:
+        try:
+            cursor_start, cursor_id = decode_cursor(cursor)
+        except InvalidCursor:
+            return jsonify({'message': 'Invalid cursor'}), 400
+        filters.append(or_(
+            Booking.start_time > cursor_start,
+            and_(Booking.start_time == cursor_start, Booking.id > cursor_id)
+        ))
 
+    bookings = Booking.query.options(joinedload(Booking.user), joinedload(Booking.car)).filter(*filters).order_by(
+        Booking.start_time, Booking.id
+    ).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(bookings) > limit:
+        bookings = bookings[:limit]
+        next_cursor = encode_cursor(bookings[-1].start_time, bookings[-1].id)
+
+    detailed_bookings = []
     for b in bookings:
-        # User count
-        u_name = users_dict.get(b.user_id, 'N/A')
-        user_counts[u_name] = user_counts.get(u_name, 0) + 1
-
-        # Car stats
-        c_name = cars_obj_dict.get(b.car_id, 'N/A')
-        if c_name not in car_stats_dict:
-            car_stats_dict[c_name] = {'name': c_name, 'count': 0, 'mileage': 0}
-        
-        car_stats_dict[c_name]['count'] += 1
-        
         mileage = 0
         if b.status == 'completed' and b.end_mileage is not None and b.start_mileage is not None:
             mileage = b.end_mileage - b.start_mileage
-            car_stats_dict[c_name]['mileage'] += mileage
-            total_mileage_sum += mileage
-
-        # Daily stats
-        d_str = b.start_time.strftime('%Y-%m-%d')
-        daily_stats_dict[d_str] = daily_stats_dict.get(d_str, 0) + 1
 
-        # Detailed record
         detailed_bookings.append({
             'id': b.id,
-            'user': u_name,
-            'car': c_name,
+            'user': b.user.full_name if b.user else 'N/A',
+            'car': _car_label(b.car),
             'start_time': b.start_time.strftime('%Y-%m-%d %H:%M'),
             'end_time': b.end_time.strftime('%Y-%m-%d %H:%M'),
             'status': b.status,
@@ -161,18 +257,116 @@ def get_advanced_stats():
             'purpose': b.objective or '-'
         })
 
-    # Format summaries
-    sorted_users = sorted([{'name': k, 'count': v} for k, v in user_counts.items()], key=lambda x: x['count'], reverse=True)[:10]
-    sorted_cars = sorted(list(car_stats_dict.values()), key=lambda x: x['count'], reverse=True)
-    sorted_daily = sorted([{'date': k, 'bookings': v} for k, v in daily_stats_dict.items()], key=lambda x: x['date'])
+    return jsonify({'bookings': detailed_bookings, 'next_cursor': next_cursor}), 200
 
-    return jsonify({
-        'summary': {
-            'top_users': sorted_users,
-            'car_stats': sorted_cars,
-            'total_mileage': int(total_mileage_sum),
-            'total_bookings': len(bookings)
-        },
-        'daily_stats': sorted_daily,
-        'bookings': detailed_bookings
-    }), 200
+EXPORT_COLUMNS = [
+    'วันที่ (Date)',
+    'ผู้ใช้งาน (User)',
+    'พาหนะ (Vehicle)',
+    'จุดหมาย (Destination)',
+    'วัตถุประสงค์ (Purpose)',
+    'สถานะ (Status)',
+    'ระยะทาง (Mileage)'
+]
+
+@bp.route('/advanced-stats/export', methods=['GET'])
+@token_required
+@admin_required
+@report_budget
+def export_advanced_stats_bookings(current_user):
+    """
+    Detailed booking rows for the advanced report as a streamed CSV.
+
+    Rows are read through a server-side cursor (yield_per) and written out
+    one by one, so memory stays flat whatever the date range. The first row
+    is fetched here, so a query that times out still gets a 503.
+    """
+    rows = iter(_export_rows(_report_filters()))
+    first = next(rows, None)
+    if first is not None:
+        rows = itertools.chain([first], rows)
+
+    def generate():
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        def flush():
+            data = buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+            return data
+
+        # BOM so Excel recognises the file as UTF-8
+        writer.writerow(EXPORT_COLUMNS)
+        yield '\ufeff' + flush()
+
+        for i, r in enumerate(rows, 1):
+            car = f"{r.brand} {r.model} ({r.license_plate})" if r.license_plate else 'N/A'
+            writer.writerow([
+                r.start_time.strftime('%Y-%m-%d %H:%M'),
+                r.full_name or 'N/A',
+                car,
+                r.destination or '-',
+                r.objective or '-',
+                r.status.upper(),
+                f"{r.mileage} km" if r.mileage and r.mileage > 0 else '-'
+            ])
+            if i % EXPORT_BATCH_SIZE == 0:
+                yield flush()
+        yield flush()
+
+    filename = request.args.get('filename') or 'detailed_bookings.csv'
+    return Response(
+        stream_with_context(report_budget.stream(generate())),
+        mimetype='text/csv',
+        headers={'Content-Disposition': f'attachment; filename="{secure_filename(filename)}"'}
+    )
+
+@bp.route('/advanced-stats/pdf', methods=['GET'])
+@token_required
+@admin_required
+@report_budget
+def export_advanced_stats_pdf(current_user):
+    """
+    The advanced report rendered as PDF on the server.
+
+    Rendered files are cached per (filters, data watermark); the watermark is
+    the filtered bookings' count and latest updated_at, the car counts and
+    the shared users/cars versions, so any booking change in the range or
+    an edited name, plate or model produces a fresh render.
+    """
+    filters = _report_filters()
+    start_date_str = request.args.get('start_date')
+    end_date_str = request.args.get('end_date')
+
+    booking_count, last_update = db.session.query(
+        func.count(Booking.id), func.max(Booking.updated_at)
+    ).filter(*filters).one()
+    car_counts = (
+        Car.query.filter(Car.status.in_(['available', 'reserved'])).count(),
+        Car.query.count()
+    )
+    cache_key = (
+        start_date_str, end_date_str, booking_count, last_update, car_counts,
+        response_cache.current_version('users'), response_cache.current_version('cars')
+    )
+
+    pdf = ReportPdfService.get_cached(cache_key)
+    if pdf is None:
+        date_range_string = 'ทั้งหมด'
+        if filters and start_date_str and end_date_str:
+            date_range_string = (
+                f"{datetime.fromisoformat(start_date_str.replace('Z', '+00:00')):%d/%m/%Y} - "
+                f"{datetime.fromisoformat(end_date_str.replace('Z', '+00:00')):%d/%m/%Y}"
+            )
+        pdf = ReportPdfService.render(
+            date_range_string, _advanced_summary(filters), car_counts, _export_rows(filters)
+        )
+        ReportPdfService.put_cached(cache_key, pdf)
+
+    filename = request.args.get('filename') or 'vehicle_report.pdf'
+    return Response(
+        pdf,
+        mimetype='application/pdf',
+        headers={'Content-Disposition': f'attachment; filename="{secure_filename(filename)}"'}
+    )
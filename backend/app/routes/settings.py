@@ -2,15 +2,17 @@ from flask import Blueprint, request, jsonify
 from app import db
 from app.models import Setting
 from app.utils.decorators import token_required, admin_required
+from app.utils.settings_cache import settings_cache
+from app.utils.response_cache import response_cache
 
 bp = Blueprint('settings', __name__)
 
 @bp.route('/', methods=['GET'])
 @token_required
 @admin_required
+@response_cache.cached('settings')
 def get_settings(current_user):
-    settings = Setting.query.all()
-    return jsonify({s.key: s.value for s in settings}), 200
+    return jsonify(settings_cache.all()), 200
 
 @bp.route('/', methods=['POST'])
 @token_required
@@ -29,6 +31,8 @@ def update_settings(current_user):
             db.session.add(setting)
     
     db.session.commit()
+    settings_cache.invalidate()
+    response_cache.bump('settings')
     return jsonify({'message': 'Settings updated successfully'}), 200
 @bp.route('/test-email', methods=['POST'])
 @token_required
@@ -49,7 +53,7 @@ def test_email(current_user):
     from app.services.email_service import EmailService
     
     # Simple check: if smtp_pass is '********' or empty, use existing from DB
-    current_settings = {s.key: s.value for s in Setting.query.all()}
+    current_settings = settings_cache.all()
     
     test_settings = {
         'smtp_host': data.get('smtp_host') or current_settings.get('smtp_host'),
@@ -2,12 +2,15 @@ from flask import Blueprint, request, jsonify
 from app import db
 from app.models import User
 from app.utils.decorators import token_required, admin_required
+from app.utils.user_cache import user_cache
+from app.utils.response_cache import response_cache
 
 bp = Blueprint('users', __name__)
 
 @bp.route('/', methods=['GET'])
 @token_required
 @admin_required
+@response_cache.cached('users')
 def get_users(current_user):
     users = User.query.order_by(User.id).all()
     output = []
@@ -36,6 +39,8 @@ def update_profile(current_user):
         current_user.set_password(data['password'])
         
     db.session.commit()
+    user_cache.invalidate(current_user.id)
+    response_cache.bump('users')
     return jsonify({'message': 'Profile updated successfully', 'user': current_user.to_dict()}), 200
 
 @bp.route('/<int:id>', methods=['PUT'])
@@ -60,6 +65,8 @@ def update_user(current_user, id):
         user.set_password(data['password'])
         
     db.session.commit()
+    user_cache.invalidate(user.id)
+    response_cache.bump('users')
     return jsonify({'message': 'User updated successfully'}), 200
 
 @bp.route('/<int:id>', methods=['DELETE'])
@@ -74,4 +81,6 @@ def delete_user(current_user, id):
         
     db.session.delete(user)
     db.session.commit()
+    user_cache.invalidate(id)
+    response_cache.bump('users')
     return jsonify({'message': 'User deleted successfully'}), 200
@@ -0,0 +1,62 @@
+from app import db
+from app.models import Booking, Car
+import numpy as np
+import base64
+
+MAX_MATRIX_SLOTS = 10000
+
+class AvailabilityService:
+    @staticmethod
+    def busy_matrix(window_start, window_end, slot_minutes):
+        """
+        Free/busy matrix for every car over [window_start, window_end).
+
+        Returns (cars, busy) where busy is a (len(cars), n_slots) boolean
+        array; a slot is busy if any active booking overlaps any part of it.
+        Bookings are fetched in one query and painted onto the matrix with
+        a vectorised difference-array + cumsum.
+        """
+        slot = np.timedelta64(slot_minutes, 'm')
+        origin = np.datetime64(window_start, 's')
+        n_slots = int(-(-(np.datetime64(window_end, 's') - origin) // slot))
+
+        cars = Car.query.order_by(Car.id).all()
+        row_of = {car.id: i for i, car in enumerate(cars)}
+
+        rows = db.session.query(Booking.car_id, Booking.start_time, Booking.end_time).filter(
+            Booking.is_active(),
+            Booking.start_time < window_end,
+            Booking.end_time > window_start
+        ).all()
+        rows = [r for r in rows if r.car_id in row_of]
+
+        busy = np.zeros((len(cars), n_slots), dtype=bool)
+        if not rows:
+            return cars, busy
+
+        car_rows = np.fromiter((row_of[r.car_id] for r in rows), dtype=np.intp, count=len(rows))
+        starts = np.array([r.start_time for r in rows], dtype='datetime64[s]')
+        ends = np.array([r.end_time for r in rows], dtype='datetime64[s]')
+
+        first = np.clip((starts - origin) // slot, 0, n_slots).astype(np.intp)
+        # Ceil so a booking ending mid-slot still marks that slot busy
+        last = np.clip(-((origin - ends) // slot), 0, n_slots).astype(np.intp)
+
+        diff = np.zeros((len(cars), n_slots + 1), dtype=np.int32)
+        np.add.at(diff, (car_rows, first), 1)
+        np.add.at(diff, (car_rows, last), -1)
+        busy = np.cumsum(diff[:, :n_slots], axis=1) > 0
+        return cars, busy
+
+    @staticmethod
+    def encode_runs(row):
+        """Busy runs of one matrix row as [start_slot, length] pairs."""
+        edges = np.diff(np.concatenate(([0], row.view(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        return [[int(s), int(e - s)] for s, e in zip(starts, ends)]
+
+    @staticmethod
+    def encode_bitmap(row):
+        """One matrix row packed MSB-first into bytes, base64 encoded."""
+        return base64.b64encode(np.packbits(row).tobytes()).decode()
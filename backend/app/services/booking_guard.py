@@ -0,0 +1,53 @@
+from app import db
+from app.models import Booking, Car
+from sqlalchemy.exc import IntegrityError
+
+# SQLSTATE raised by the bookings exclusion constraint on PostgreSQL
+EXCLUSION_VIOLATION = '23P01'
+
+
+class BookingGuard:
+    """
+    Atomic double-booking prevention.
+
+    The in-memory booking_index is a per-process fast path only; under
+    concurrency (or with several workers) the database decides. Writers
+    call lock_car() as the first statement of their transaction, re-check
+    with find_conflict() and then insert/update, so competing requests for
+    the same car run one after another:
+
+    - PostgreSQL: SELECT ... FOR UPDATE on the car row, backed by the
+      ex_bookings_car_no_overlap exclusion constraint (see is_conflict()).
+    - SQLite: no row locks, so a no-op UPDATE of the car row takes the
+      database write lock up front instead.
+    """
+
+    @staticmethod
+    def lock_car(car_id):
+        """Lock the car for the rest of the transaction and return it (or None)."""
+        if db.engine.dialect.name == 'postgresql':
+            return Car.query.filter(Car.id == car_id).with_for_update().first()
+        db.session.execute(db.update(Car).where(Car.id == car_id).values(id=Car.id))
+        return db.session.get(Car, car_id)
+
+    @staticmethod
+    def find_conflict(car_id, start, end, exclude_id=None):
+        """First active booking of the car overlapping [start, end), from the database."""
+        query = Booking.query.filter(
+            Booking.car_id == car_id,
+            Booking.is_active(),
+            Booking.start_time < end,
+            Booking.end_time > start
+        )
+        if exclude_id is not None:
+            query = query.filter(Booking.id != exclude_id)
+        return query.order_by(Booking.start_time).first()
+
+    @staticmethod
+    def is_conflict(error):
+        """True if an IntegrityError came from the bookings exclusion constraint."""
+        return isinstance(error, IntegrityError) and getattr(error.orig, 'pgcode', None) == EXCLUSION_VIOLATION
+
+    @staticmethod
+    def conflict_message(start, end):
+        return f'Car is already booked from {start.strftime("%Y-%m-%d %H:%M")} to {end.strftime("%Y-%m-%d %H:%M")}'
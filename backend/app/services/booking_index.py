@@ -0,0 +1,166 @@
+from app.utils.response_cache import response_cache
+from bisect import bisect_left, insort
+from datetime import timezone
+import threading
+import logging
+
+
+def _naive_utc(value):
+    # Request payloads carry tz-aware datetimes, the DB returns naive UTC
+    if value.tzinfo:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+class _CarIntervals:
+    """Active booking intervals of one car, kept sorted by start time."""
+
+    def __init__(self):
+        self.entries = []  # (start, end, booking_id), sorted
+        self.max_duration = None
+
+    def add(self, start, end, booking_id):
+        insort(self.entries, (start, end, booking_id))
+        duration = end - start
+        if self.max_duration is None or duration > self.max_duration:
+            self.max_duration = duration
+
+    def remove(self, start, end, booking_id):
+        i = bisect_left(self.entries, (start, end, booking_id))
+        if i < len(self.entries) and self.entries[i][2] == booking_id:
+            del self.entries[i]
+
+    def find_overlap(self, start, end):
+        # Only entries starting before `end` can overlap, and none of them
+        # can if it started more than max_duration before `start`.
+        i = bisect_left(self.entries, (end,))
+        while i > 0:
+            i -= 1
+            entry = self.entries[i]
+            if entry[1] > start:
+                return entry
+            if entry[0] < start - self.max_duration:
+                break
+        return None
+
+
+class BookingIntervalIndex:
+    """
+    Per-process, per-car index of active booking intervals.
+
+    The bookings table stays the source of truth: the index is rebuilt from it
+    on first use and by the daily job, and kept in sync by the booking routes
+    after each commit via sync().
+
+    Other workers' writes only reach this process through the shared
+    `bookings` version in cache_versions, which every booking write bumps.
+    Reads compare the version the response cache last saw (re-read at most
+    every RESPONSE_CACHE_TTL seconds, so most lookups cost no query) with
+    the version the index reflects and rebuild when it has moved past it;
+    another worker's write therefore shows up here within the ttl. A local
+    bump that moves the version exactly one step past ours was our own
+    write, already applied by sync(), so the index stays current without a
+    rebuild. The locked re-check in BookingGuard still decides every write.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._cars = {}
+        self._bookings = {}  # booking_id -> (car_id, start, end)
+        self._loaded = False
+        self._version = None
+        self.rebuilds = 0
+
+    def rebuild(self):
+        from app import db
+        from app.models import Booking
+
+        # Read before the rows: a write landing in between only causes
+        # one more rebuild on the next read
+        version = response_cache.current_version('bookings')
+        rows = db.session.query(Booking.id, Booking.car_id, Booking.start_time, Booking.end_time).filter(
+            Booking.is_active()
+        ).all()
+
+        cars = {}
+        bookings = {}
+        for booking_id, car_id, start, end in rows:
+            start, end = _naive_utc(start), _naive_utc(end)
+            cars.setdefault(car_id, _CarIntervals()).add(start, end, booking_id)
+            bookings[booking_id] = (car_id, start, end)
+
+        with self._lock:
+            self._cars = cars
+            self._bookings = bookings
+            self._version = version
+            self._loaded = True
+            self.rebuilds += 1
+        logging.info(f"Booking interval index rebuilt with {len(bookings)} active bookings")
+
+    def _ensure_loaded(self):
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self.rebuild()
+
+    def _stale(self, version):
+        # The cached version may lag behind the one a rebuild just read
+        return self._version is None or version > self._version
+
+    def _ensure_current(self):
+        self._ensure_loaded()
+        version = response_cache.version('bookings')
+        if self._stale(version):
+            with self._lock:
+                if self._stale(version):
+                    self.rebuild()
+
+    def bumped(self, version):
+        """response_cache listener: this process bumped `bookings` to version."""
+        with self._lock:
+            if self._version is not None and version == self._version + 1:
+                self._version = version
+            else:
+                # Another worker wrote in between; rebuild on the next read
+                self._version = None
+
+    def sync(self, booking):
+        """Reflect a committed booking's current status and period."""
+        from app.models import ACTIVE_BOOKING_STATUSES
+
+        self._ensure_loaded()
+        with self._lock:
+            self._remove(booking.id)
+            if booking.status in ACTIVE_BOOKING_STATUSES:
+                start, end = _naive_utc(booking.start_time), _naive_utc(booking.end_time)
+                self._cars.setdefault(booking.car_id, _CarIntervals()).add(start, end, booking.id)
+                self._bookings[booking.id] = (booking.car_id, start, end)
+
+    def _remove(self, booking_id):
+        existing = self._bookings.pop(booking_id, None)
+        if existing:
+            car_id, start, end = existing
+            self._cars[car_id].remove(start, end, booking_id)
+
+    def find_overlap(self, car_id, start, end):
+        """Return (start, end, booking_id) of an active booking overlapping the period, or None."""
+        self._ensure_current()
+        start, end = _naive_utc(start), _naive_utc(end)
+        with self._lock:
+            intervals = self._cars.get(car_id)
+            return intervals.find_overlap(start, end) if intervals else None
+
+    def busy_car_ids(self, start, end):
+        """Ids of cars with an active booking overlapping the period."""
+        self._ensure_current()
+        start, end = _naive_utc(start), _naive_utc(end)
+        with self._lock:
+            return {
+                car_id for car_id, intervals in self._cars.items()
+                if intervals.find_overlap(start, end)
+            }
+
+
+booking_index = BookingIntervalIndex()
+
+response_cache.listen('bookings', booking_index.bumped)
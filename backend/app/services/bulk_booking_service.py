@@ -0,0 +1,96 @@
+from app import db
+from app.models import Booking
+from app.services.booking_index import _CarIntervals
+from datetime import timedelta
+
+MAX_BULK_BOOKINGS = 500
+# Longest span a recurrence may cover, counted from its first start
+MAX_RECURRENCE_DAYS = 731
+WEEKDAYS = ['MO', 'TU', 'WE', 'TH', 'FR', 'SA', 'SU']
+
+
+class BulkBookingService:
+    @staticmethod
+    def expand_recurrence(start, end, freq, interval=1, byweekday=None, count=None, until=None):
+        """
+        Occurrences of [start, end) for a small RRULE subset.
+
+        freq is 'daily' or 'weekly'; byweekday is a list of MO..SU codes
+        (for weekly rules it defaults to start's weekday); the rule ends
+        after `count` occurrences or on the last one starting on or before
+        the `until` date, and must end within MAX_RECURRENCE_DAYS. Returns
+        a list of (start, end) pairs.
+        """
+        if freq not in ('daily', 'weekly'):
+            raise ValueError("freq must be 'daily' or 'weekly'")
+        if interval < 1:
+            raise ValueError('interval must be at least 1')
+        if count is None and until is None:
+            raise ValueError('count or until is required')
+        too_long = f'Recurrence must end within {MAX_RECURRENCE_DAYS} days'
+        if until is not None and (until - start.date()).days > MAX_RECURRENCE_DAYS:
+            raise ValueError(too_long)
+        if byweekday:
+            unknown = set(byweekday) - set(WEEKDAYS)
+            if unknown:
+                raise ValueError(f"Unknown weekday(s): {', '.join(sorted(unknown))}")
+            days = {WEEKDAYS.index(day) for day in byweekday}
+        else:
+            days = {start.weekday()} if freq == 'weekly' else None
+
+        duration = end - start
+        week_start = start.date() - timedelta(days=start.weekday())
+        occurrences = []
+        current = start
+        while True:
+            if until is not None and current.date() > until:
+                break
+            if count is not None and len(occurrences) >= count:
+                break
+            if (current - start).days > MAX_RECURRENCE_DAYS:
+                raise ValueError(too_long)
+            if freq == 'daily':
+                matches = (current - start).days % interval == 0
+            else:
+                matches = ((current.date() - week_start).days // 7) % interval == 0
+            if matches and (days is None or current.weekday() in days):
+                occurrences.append((current, current + duration))
+                if len(occurrences) > MAX_BULK_BOOKINGS:
+                    raise ValueError(f'Recurrence expands to more than {MAX_BULK_BOOKINGS} bookings')
+            current += timedelta(days=1)
+        return occurrences
+
+    @staticmethod
+    def find_conflicts(requests):
+        """
+        Check (car_id, start, end) requests against active bookings and each other.
+
+        Existing bookings of the involved cars within the overall span are
+        fetched in one query; returns {request index: (start, end)} of the
+        first booking each conflicting request overlaps.
+        """
+        car_ids = {car_id for car_id, _, _ in requests}
+        span_start = min(start for _, start, _ in requests)
+        span_end = max(end for _, _, end in requests)
+        existing = db.session.query(Booking.car_id, Booking.start_time, Booking.end_time, Booking.id).filter(
+            Booking.car_id.in_(car_ids),
+            Booking.is_active(),
+            Booking.start_time < span_end,
+            Booking.end_time > span_start
+        ).all()
+
+        intervals = {car_id: _CarIntervals() for car_id in car_ids}
+        for row in existing:
+            intervals[row.car_id].add(row.start_time, row.end_time, row.id)
+
+        conflicts = {}
+        # Requests are checked in time order and accepted ones join the
+        # index, so two requests of the same batch can't overlap either.
+        for i in sorted(range(len(requests)), key=lambda i: requests[i][1]):
+            car_id, start, end = requests[i]
+            overlap = intervals[car_id].find_overlap(start, end)
+            if overlap:
+                conflicts[i] = (overlap[0], overlap[1])
+            else:
+                intervals[car_id].add(start, end, None)
+        return conflicts
@@ -0,0 +1,201 @@
+from app import db
+from app.models import Car
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from datetime import datetime
+import codecs
+import csv
+import json
+
+CAR_STATUSES = ['available', 'maintenance', 'reserved']
+IMPORT_FORMATS = ['csv', 'jsonl']
+TEXT_FIELDS = ['brand', 'model', 'color']
+INT_FIELDS = ['current_mileage', 'last_maintenance_mileage']
+# Values for columns a new car's row leaves out (same as add_car)
+DEFAULTS = {'brand': None, 'model': None, 'color': None, 'current_mileage': 0,
+            'status': 'available', 'last_maintenance_mileage': 0}
+# Errors listed in a report; the rest are only counted
+MAX_REPORTED_ERRORS = 1000
+
+
+class ImportReport:
+    def __init__(self):
+        self.inserted = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.error_count = 0
+        self.errors = []
+
+    def error(self, row, message, plate=None):
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'row': row, 'license_plate': plate, 'message': message})
+
+    def to_dict(self):
+        return {
+            'inserted': self.inserted,
+            'updated': self.updated,
+            'unchanged': self.unchanged,
+            'error_count': self.error_count,
+            'errors': self.errors,
+            'errors_truncated': self.error_count > len(self.errors)
+        }
+
+
+class CarImportService:
+    @staticmethod
+    def read_rows(stream, fmt):
+        """
+        Yield (row number, dict) from a binary CSV or JSON-lines stream.
+
+        The stream is decoded and parsed line by line, so the upload is never
+        held in memory as a whole. Rows that can't be parsed come back as
+        (row number, error message).
+        """
+        if fmt not in IMPORT_FORMATS:
+            raise ValueError(f"Unknown format: {fmt}")
+        text = codecs.getreader('utf-8-sig')(stream)
+        if fmt == 'csv':
+            reader = csv.DictReader(text)
+            for row in reader:
+                # Row 1 is the header
+                yield reader.line_num, row
+            return
+        for number, line in enumerate(text, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                yield number, f"Invalid JSON: {e}"
+                continue
+            yield number, row if isinstance(row, dict) else 'Each line must be a JSON object'
+
+    @staticmethod
+    def validate(row):
+        """Return the car columns given in a row, or raise ValueError."""
+        plate = str(row.get('license_plate') or '').strip()
+        if not plate:
+            raise ValueError('License plate is required')
+        values = {'license_plate': plate}
+        for field in TEXT_FIELDS:
+            value = row.get(field)
+            if value is not None and str(value).strip():
+                values[field] = str(value).strip()
+        for field in INT_FIELDS:
+            value = row.get(field)
+            if value is None or str(value).strip() == '':
+                continue
+            try:
+                number = int(str(value).strip())
+            except ValueError:
+                raise ValueError(f'{field} must be a whole number')
+            if number < 0:
+                raise ValueError(f'{field} cannot be negative')
+            values[field] = number
+        status = str(row.get('status') or '').strip()
+        if status:
+            if status not in CAR_STATUSES:
+                raise ValueError(f"status must be one of: {', '.join(CAR_STATUSES)}")
+            values['status'] = status
+        return values
+
+    @staticmethod
+    def import_rows(rows, update_existing=True, chunk_size=500):
+        """
+        Validate and upsert (row number, row) pairs chunk by chunk.
+
+        Each chunk is checked against existing plates with one query and
+        written with one upsert per column set, then committed on its own;
+        a failing chunk is rolled back and its rows reported. Columns a row
+        leaves empty keep their current value on update. With
+        update_existing=False plates that already exist are reported as
+        errors instead. Returns an ImportReport.
+        """
+        report = ImportReport()
+        seen = set()
+        chunk = []
+        for number, row in rows:
+            if isinstance(row, str):
+                report.error(number, row)
+                continue
+            try:
+                values = CarImportService.validate(row)
+            except ValueError as e:
+                report.error(number, str(e), str(row.get('license_plate') or '') or None)
+                continue
+            if values['license_plate'] in seen:
+                report.error(number, 'Duplicate license plate in this file', values['license_plate'])
+                continue
+            seen.add(values['license_plate'])
+            chunk.append((number, values))
+            if len(chunk) >= chunk_size:
+                CarImportService._write_chunk(chunk, update_existing, report)
+                chunk = []
+        if chunk:
+            CarImportService._write_chunk(chunk, update_existing, report)
+        return report
+
+    @staticmethod
+    def _write_chunk(chunk, update_existing, report):
+        plates = [values['license_plate'] for _, values in chunk]
+        existing = {
+            plate for (plate,) in
+            db.session.query(Car.license_plate).filter(Car.license_plate.in_(plates))
+        }
+        if not update_existing:
+            for number, values in chunk:
+                if values['license_plate'] in existing:
+                    report.error(number, 'Car with this license plate already exists', values['license_plate'])
+            chunk = [(number, values) for number, values in chunk if values['license_plate'] not in existing]
+            if not chunk:
+                db.session.rollback()
+                return
+
+        # A multi-row upsert needs the same update columns for every row
+        groups = {}
+        for _, values in chunk:
+            groups.setdefault(tuple(sorted(values)), []).append(values)
+        now = datetime.utcnow()
+        try:
+            for columns, group in groups.items():
+                CarImportService._upsert(
+                    [{**DEFAULTS, 'created_at': now, **values} for values in group],
+                    [col for col in columns if col != 'license_plate'] if update_existing else None
+                )
+            db.session.commit()
+        except IntegrityError:
+            # e.g. a plate added concurrently while update_existing=False
+            db.session.rollback()
+            for number, values in chunk:
+                report.error(number, 'Chunk could not be saved; a plate was taken concurrently', values['license_plate'])
+            return
+
+        found = [values for _, values in chunk if values['license_plate'] in existing]
+        # A plate-only row has nothing to write to an existing car
+        unchanged = sum(1 for values in found if len(values) == 1)
+        report.unchanged += unchanged
+        report.updated += len(found) - unchanged
+        report.inserted += len(chunk) - len(found)
+
+    @staticmethod
+    def _upsert(rows, update_columns):
+        # update_columns=None is a plain insert, so a duplicate plate fails the chunk
+        dialect = db.session.get_bind().dialect.name
+        if dialect == 'postgresql':
+            stmt = postgresql.insert(Car)
+        elif dialect == 'sqlite':
+            stmt = sqlite.insert(Car)
+        else:
+            raise NotImplementedError(f"Car import is not supported on {dialect}")
+
+        stmt = stmt.values(rows)
+        if update_columns:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['license_plate'],
+                set_={col: getattr(stmt.excluded, col) for col in update_columns}
+            )
+        elif update_columns is not None:
+            # Only the plate given: nothing to update on existing cars
+            stmt = stmt.on_conflict_do_nothing(index_elements=['license_plate'])
+        db.session.execute(stmt)
@@ -1,58 +1,91 @@
-import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from app.models import Setting
-from flask import current_app
+from app.utils.settings_cache import settings_cache
+from app.services.mail_queue import mail_queue, open_smtp_connection, SmtpSession
+from contextlib import contextmanager
 import threading
 
+STATUS_TITLES = {
+    'approved': 'Approved',
+    'rejected': 'Rejected',
+    'cancelled': 'Cancelled',
+    'completed': 'Completed'
+}
+
+STATUS_MESSAGES = {
+    'approved': "Your vehicle reservation has been <strong>approved</strong>.",
+    'rejected': "Your vehicle reservation has been <strong>rejected</strong>.",
+    'cancelled': "Your vehicle reservation has been <strong>cancelled</strong>.",
+    'completed': "Your vehicle reservation has been marked as <strong>completed</strong>. Thank you!"
+}
+
+# Set by EmailService.direct_delivery() for the current thread
+_delivery = threading.local()
+
 class EmailService:
+    @staticmethod
+    @contextmanager
+    def direct_delivery():
+        """
+        Send synchronously within the block instead of queueing.
+
+        Used by the outbox dispatcher so an event is only acknowledged once
+        its email is with the SMTP server; transient failures raise.
+        """
+        session = SmtpSession()
+        _delivery.session = session
+        try:
+            yield
+        finally:
+            _delivery.session = None
+            session.close()
+
     @staticmethod
     def get_setting(key, default=None):
-        setting = Setting.query.filter_by(key=key).first()
-        return setting.value if setting else default
+        return settings_cache.get(key, default)
+
+    @staticmethod
+    def build_message(sender, recipient, subject, body, cc=None):
+        msg = MIMEMultipart()
+        msg['From'] = sender
+        msg['To'] = recipient
+        if cc:
+            msg['Cc'] = cc
+        msg['Subject'] = subject
+        msg.attach(MIMEText(body, 'html'))
+        return msg
 
     @staticmethod
-    def send_email_sync(app, recipient, subject, body, cc=None):
-        with app.app_context():
-            smtp_host = EmailService.get_setting('smtp_host')
-            smtp_port = EmailService.get_setting('smtp_port')
-            smtp_user = EmailService.get_setting('smtp_user')
-            smtp_pass = EmailService.get_setting('smtp_pass')
-            smtp_enable = EmailService.get_setting('email_notifications_enabled') == 'true'
+    def send_email(recipient, subject, body, cc=None):
+        # Queued for the mail worker pool so the API response isn't blocked
+        # on SMTP; workers reuse authenticated connections across messages.
+        smtp_host = EmailService.get_setting('smtp_host')
+        smtp_port = EmailService.get_setting('smtp_port')
+        smtp_user = EmailService.get_setting('smtp_user')
+        smtp_pass = EmailService.get_setting('smtp_pass')
+        smtp_use_tls = EmailService.get_setting('smtp_use_tls', 'true') == 'true'
+        smtp_enable = EmailService.get_setting('email_notifications_enabled') == 'true'
 
         if not smtp_enable or not all([smtp_host, smtp_port, smtp_user, smtp_pass]):
             print("Email notifications disabled or SMTP not configured.")
-            return
+            return False
 
-        try:
-            msg = MIMEMultipart()
-            msg['From'] = smtp_user
-            msg['To'] = recipient
-            if cc:
-                msg['Cc'] = cc
-            msg['Subject'] = subject
-            msg.attach(MIMEText(body, 'html'))
-
-            destinations = [recipient]
-            if cc:
-                destinations.append(cc)
-
-            server = smtplib.SMTP(smtp_host, int(smtp_port))
-            server.starttls()
-            server.login(smtp_user, smtp_pass)
-            server.send_message(msg)
-            server.quit()
-            print(f"Email sent to {recipient} (CC: {cc})")
-        except Exception as e:
-            print(f"Error sending email: {e}")
+        smtp = {
+            'host': smtp_host,
+            'port': smtp_port,
+            'user': smtp_user,
+            'password': smtp_pass,
+            'use_tls': smtp_use_tls
+        }
+        msg = EmailService.build_message(smtp_user, recipient, subject, body, cc)
+        destinations = [recipient]
+        if cc:
+            destinations.append(cc)
 
-    @staticmethod
-    def send_email(recipient, subject, body, cc=None):
-        # Sending email in a separate thread to avoid blocking the API response
-        # Need to pass the current_app object to the thread to access app context
-        app = current_app._get_current_object()
-        thread = threading.Thread(target=EmailService.send_email_sync, args=(app, recipient, subject, body, cc))
-        thread.start()
+        session = getattr(_delivery, 'session', None)
+        if session is not None:
+            return session.send(smtp, msg, destinations)
+        return mail_queue.enqueue(smtp, msg, destinations)
 
     @staticmethod
     def notify_new_booking(booking, user, car):
@@ -76,6 +109,37 @@ class EmailService:
         """
         EmailService.send_email(recipient, subject, body)
 
+    @staticmethod
+    def notify_new_bookings(bookings, user, cars):
+        """One digest email for a batch of bookings; cars maps car_id to Car."""
+        recipient = EmailService.get_setting('admin_email')
+        if not recipient or not bookings:
+            return
+
+        subject = f"New Vehicle Reservations: {len(bookings)} bookings by {user.full_name}"
+        rows = ''.join(
+            f"<tr><td>{cars[b.car_id].brand} {cars[b.car_id].model} ({cars[b.car_id].license_plate})</td>"
+            f"<td>{b.start_time.strftime('%Y-%m-%d %H:%M')}</td>"
+            f"<td>{b.end_time.strftime('%Y-%m-%d %H:%M')}</td></tr>"
+            for b in bookings
+        )
+        first = bookings[0]
+        body = f"""
+        <h3>New Booking Alert</h3>
+        <p>{len(bookings)} vehicle reservations have been created in one request.</p>
+        <ul>
+            <li><strong>User:</strong> {user.full_name}</li>
+            <li><strong>Objective:</strong> {first.objective}</li>
+            <li><strong>Destination:</strong> {first.destination}</li>
+        </ul>
+        <table border="1" cellpadding="4" cellspacing="0">
+            <tr><th>Car</th><th>Start</th><th>End</th></tr>
+            {rows}
+        </table>
+        <p>Please check the admin panel for details.</p>
+        """
+        EmailService.send_email(recipient, subject, body)
+
     @staticmethod
     def notify_overdue_bookings(bookings):
         recipient = EmailService.get_setting('admin_email')
@@ -84,16 +148,15 @@ class EmailService:
 
         subject = f"Daily Check: {len(bookings)} Overdue Vehicle Returns"
         
+        # Rows carry license_plate, brand, model, full_name and end_time
+        # from the scheduler's joined query
         bookings_html = ""
         for b in bookings:
-            from app.models import User, Car
-            u = User.query.get(b.user_id)
-            c = Car.query.get(b.car_id)
             bookings_html += f"""
             <tr>
-                <td style='padding:8px; border:1px solid #ddd;'>{c.license_plate}</td>
-                <td style='padding:8px; border:1px solid #ddd;'>{c.brand} {c.model}</td>
-                <td style='padding:8px; border:1px solid #ddd;'>{u.full_name}</td>
+                <td style='padding:8px; border:1px solid #ddd;'>{b.license_plate}</td>
+                <td style='padding:8px; border:1px solid #ddd;'>{b.brand} {b.model}</td>
+                <td style='padding:8px; border:1px solid #ddd;'>{b.full_name}</td>
                 <td style='padding:8px; border:1px solid #ddd;'>{b.end_time.strftime('%Y-%m-%d %H:%M')}</td>
             </tr>
             """
@@ -135,25 +198,11 @@ class EmailService:
     def notify_booking_status(booking, user, car):
         cc_email = EmailService.get_setting('admin_email')
         
-        status_titles = {
-            'approved': 'Approved',
-            'rejected': 'Rejected',
-            'cancelled': 'Cancelled',
-            'completed': 'Completed'
-        }
-        
-        status_title = status_titles.get(booking.status, booking.status.capitalize())
+        status_title = STATUS_TITLES.get(booking.status, booking.status.capitalize())
         
         subject = f"Booking {status_title}: {car.brand} {car.model}"
         
-        status_messages = {
-            'approved': "Your vehicle reservation has been <strong>approved</strong>.",
-            'rejected': "Your vehicle reservation has been <strong>rejected</strong>.",
-            'cancelled': "Your vehicle reservation has been <strong>cancelled</strong>.",
-            'completed': "Your vehicle reservation has been marked as <strong>completed</strong>. Thank you!"
-        }
-        
-        status_message = status_messages.get(booking.status, f"Your booking status has been updated to: {booking.status}")
+        status_message = STATUS_MESSAGES.get(booking.status, f"Your booking status has been updated to: {booking.status}")
 
         body = f"""
         <h3>Booking Status Update</h3>
@@ -169,6 +218,37 @@ class EmailService:
         """
         EmailService.send_email(user.email, subject, body, cc=cc_email)
 
+    @staticmethod
+    def notify_booking_statuses(bookings, user):
+        """One status email for several of a user's bookings (car relationship loaded)."""
+        if not bookings:
+            return
+        if len(bookings) == 1:
+            return EmailService.notify_booking_status(bookings[0], user, bookings[0].car)
+        cc_email = EmailService.get_setting('admin_email')
+
+        status = bookings[0].status
+        status_title = STATUS_TITLES.get(status, status.capitalize())
+        subject = f"{len(bookings)} Bookings {status_title}"
+        status_message = f"The following vehicle reservations have been <strong>{status_title.lower()}</strong>."
+        rows = ''.join(
+            f"<tr><td>{b.id}</td>"
+            f"<td>{b.car.brand} {b.car.model} ({b.car.license_plate})</td>"
+            f"<td>{b.start_time.strftime('%Y-%m-%d %H:%M')} - {b.end_time.strftime('%Y-%m-%d %H:%M')}</td></tr>"
+            for b in bookings
+        )
+        body = f"""
+        <h3>Booking Status Update</h3>
+        <p>Hello {user.full_name},</p>
+        <p>{status_message}</p>
+        <table border="1" cellpadding="4" cellspacing="0">
+            <tr><th>Booking ID</th><th>Vehicle</th><th>Period</th></tr>
+            {rows}
+        </table>
+        <p>Please log in to the system for more details.</p>
+        """
+        EmailService.send_email(user.email, subject, body, cc=cc_email)
+
     @staticmethod
     def send_test_email(recipient, custom_settings=None):
         """
@@ -177,8 +257,7 @@ class EmailService:
         def get_val(key):
             if custom_settings and key in custom_settings:
                 return custom_settings[key]
-            setting = Setting.query.filter_by(key=key).first()
-            return setting.value if setting else None
+            return settings_cache.get(key)
 
         smtp_host = get_val('smtp_host')
         smtp_port = get_val('smtp_port')
@@ -189,12 +268,7 @@ class EmailService:
             return False, "SMTP settings are incomplete"
 
         try:
-            msg = MIMEMultipart()
             # If smtp_user looks like an email, use it. Otherwise use it as just name.
-            msg['From'] = smtp_user
-            msg['To'] = recipient
-            msg['Subject'] = "SMTP Connection Test - Car Booking System"
-            
             body = f"""
             <h3>SMTP Test Successful!</h3>
             <p>Your Car Booking System is now correctly configured to send emails.</p>
@@ -204,11 +278,16 @@ class EmailService:
                 <li>User: {smtp_user}</li>
             </ul>
             """
-            msg.attach(MIMEText(body, 'html'))
+            msg = EmailService.build_message(smtp_user, recipient, "SMTP Connection Test - Car Booking System", body)
 
-            server = smtplib.SMTP(smtp_host, int(smtp_port))
-            server.starttls()
-            server.login(smtp_user, smtp_pass)
+            # Sent synchronously on its own connection so the admin gets the real error back
+            server = open_smtp_connection({
+                'host': smtp_host,
+                'port': smtp_port,
+                'user': smtp_user,
+                'password': smtp_pass,
+                'use_tls': (get_val('smtp_use_tls') or 'true') == 'true'
+            })
             server.send_message(msg)
             server.quit()
             return True, None
@@ -0,0 +1,83 @@
+import logging
+import os
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool
+
+# Arbitrary application-wide key for pg_try_advisory_lock
+ADVISORY_LOCK_KEY = 0x43415253
+
+
+class LeaderLock:
+    """
+    Process-level lock that at most one process holds at a time.
+
+    On PostgreSQL this is a session advisory lock held on a dedicated
+    connection, released by the server when the holder's connection dies.
+    Elsewhere it is an flock() on `lock_file`, released by the kernel when
+    the holder exits. Either way, a crashed leader frees the lock for the
+    next process that tries.
+    """
+
+    def __init__(self, database_uri, lock_file):
+        self.database_uri = database_uri
+        self.lock_file = lock_file
+        self._conn = None
+        self._fd = None
+
+    @property
+    def uses_database(self):
+        return self.database_uri.startswith('postgresql')
+
+    def acquire(self):
+        if self.uses_database:
+            return self._acquire_advisory()
+        return self._acquire_file()
+
+    def _acquire_advisory(self):
+        try:
+            conn = create_engine(self.database_uri, poolclass=NullPool).connect()
+            if conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {'key': ADVISORY_LOCK_KEY}).scalar():
+                conn.commit()
+                self._conn = conn
+                return True
+            conn.close()
+        except Exception as e:
+            logging.error(f"Leader election failed: {e}")
+        return False
+
+    def _acquire_file(self):
+        import fcntl
+        fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        self._fd = fd
+        return True
+
+    def held(self):
+        """False if the lock was lost (e.g. the lock connection dropped)."""
+        if self._fd is not None:
+            return True
+        if self._conn is None:
+            return False
+        try:
+            self._conn.execute(text("SELECT 1"))
+            self._conn.commit()
+            return True
+        except Exception as e:
+            logging.error(f"Lost leader lock connection: {e}")
+            self.release()
+            return False
+
+    def release(self):
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
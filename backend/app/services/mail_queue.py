@@ -0,0 +1,204 @@
+import atexit
+import logging
+import queue
+import smtplib
+import threading
+import time
+
+_STOP = object()
+
+
+def open_smtp_connection(smtp):
+    """Connect and authenticate with an smtp settings dict."""
+    server = smtplib.SMTP(smtp['host'], int(smtp['port']), timeout=smtp.get('timeout', 30))
+    if smtp.get('use_tls', True):
+        server.starttls()
+    server.ehlo_or_helo_if_needed()
+    # Local debugging stand-ins (aiosmtpd, smtpd) don't offer AUTH
+    if smtp.get('user') and smtp.get('password') and server.has_extn('auth'):
+        server.login(smtp['user'], smtp['password'])
+    return server
+
+
+class SmtpSession:
+    """
+    Synchronous delivery over one reused connection, for callers that must
+    know a message went out (the outbox dispatcher) rather than queue it.
+
+    send() raises on transient failures so the caller can retry later, and
+    returns False for permanent ones (5xx, refused recipients).
+    """
+
+    def __init__(self):
+        self.server = None
+        self.server_key = None
+
+    def send(self, smtp, msg, destinations):
+        key = (smtp['host'], smtp['port'], smtp.get('user'), smtp.get('password'), smtp.get('use_tls', True))
+        if key != self.server_key:
+            self.close()
+            self.server_key = key
+        for attempt in range(2):
+            reused = self.server is not None
+            try:
+                if self.server is None:
+                    self.server = open_smtp_connection(smtp)
+                self.server.send_message(msg, to_addrs=destinations)
+                logging.info(f"Email sent to {msg['To']} (CC: {msg['Cc']})")
+                return True
+            except smtplib.SMTPRecipientsRefused as e:
+                logging.error(f"Error sending email: {e}")
+                return False
+            except (smtplib.SMTPException, OSError) as e:
+                self.close()
+                if isinstance(e, smtplib.SMTPResponseException) and e.smtp_code >= 500:
+                    logging.error(f"Error sending email: {e}")
+                    return False
+                # Only a pooled connection dropped while idle gets a second go
+                if attempt or not (reused and isinstance(e, smtplib.SMTPServerDisconnected)):
+                    raise
+
+    def close(self):
+        self.server = MailQueue._close(self.server)
+
+
+class MailQueue:
+    """
+    Bounded outbound mail queue drained by a small pool of worker threads.
+
+    Each worker keeps one authenticated SMTP connection open and reuses it
+    across messages until it goes idle, fails, or the SMTP settings change.
+    enqueue() blocks for at most `enqueue_timeout` seconds when the queue is
+    full (backpressure) and returns False if the message was not accepted.
+    Failed deliveries are retried with exponential backoff; 5xx replies are
+    treated as permanent. Workers start lazily on the first enqueue, and
+    shutdown() (also registered with atexit) drains the queue before exit.
+    """
+
+    def __init__(self, max_size=1000, workers=2, max_retries=3, backoff=1.0,
+                 enqueue_timeout=5.0, idle_timeout=60.0):
+        self.max_size = max_size
+        self.workers = workers
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.enqueue_timeout = enqueue_timeout
+        self.idle_timeout = idle_timeout
+        self._queue = None
+        self._threads = []
+        self._lock = threading.Lock()
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+
+    def init_app(self, app):
+        self.max_size = app.config.get('MAIL_QUEUE_SIZE', self.max_size)
+        self.workers = app.config.get('MAIL_WORKERS', self.workers)
+        self.max_retries = app.config.get('MAIL_MAX_RETRIES', self.max_retries)
+        self.backoff = app.config.get('MAIL_RETRY_BACKOFF', self.backoff)
+        self.enqueue_timeout = app.config.get('MAIL_ENQUEUE_TIMEOUT', self.enqueue_timeout)
+        self.idle_timeout = app.config.get('MAIL_IDLE_TIMEOUT', self.idle_timeout)
+
+    def _start(self):
+        with self._lock:
+            if self._threads:
+                return
+            self._queue = queue.Queue(maxsize=self.max_size)
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._run, name=f'mail-worker-{i}', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+            atexit.register(self.shutdown)
+
+    def enqueue(self, smtp, msg, destinations):
+        """Queue a prepared message for delivery with the given smtp settings."""
+        self._start()
+        try:
+            self._queue.put((smtp, msg, destinations), timeout=self.enqueue_timeout)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            logging.error(f"Mail queue full, dropping email to {msg['To']}")
+            return False
+
+    def shutdown(self, timeout=30.0):
+        """Stop accepting work, deliver what is queued, then stop the workers."""
+        with self._lock:
+            threads, self._threads = self._threads, []
+        if not threads:
+            return
+        for _ in threads:
+            self._queue.put(_STOP)
+        deadline = time.monotonic() + timeout
+        for thread in threads:
+            thread.join(max(0, deadline - time.monotonic()))
+
+    def stats(self):
+        return {
+            'queued': self._queue.qsize() if self._queue else 0,
+            'max_size': self.max_size,
+            'workers': len(self._threads),
+            'sent': self.sent,
+            'failed': self.failed,
+            'dropped': self.dropped
+        }
+
+    def _run(self):
+        server = None
+        server_key = None
+        while True:
+            try:
+                job = self._queue.get(timeout=self.idle_timeout)
+            except queue.Empty:
+                server = self._close(server)
+                continue
+
+            if job is _STOP:
+                self._close(server)
+                self._queue.task_done()
+                return
+
+            smtp, msg, destinations = job
+            key = (smtp['host'], smtp['port'], smtp.get('user'), smtp.get('password'), smtp.get('use_tls', True))
+            if key != server_key:
+                server = self._close(server)
+                server_key = key
+
+            for attempt in range(self.max_retries + 1):
+                reused = server is not None
+                try:
+                    if server is None:
+                        server = open_smtp_connection(smtp)
+                    server.send_message(msg, to_addrs=destinations)
+                    self.sent += 1
+                    logging.info(f"Email sent to {msg['To']} (CC: {msg['Cc']})")
+                    break
+                except smtplib.SMTPRecipientsRefused as e:
+                    # Permanent, and the connection itself is still fine
+                    self.failed += 1
+                    logging.error(f"Error sending email: {e}")
+                    break
+                except (smtplib.SMTPException, OSError) as e:
+                    server = self._close(server)
+                    permanent = isinstance(e, smtplib.SMTPResponseException) and e.smtp_code >= 500
+                    if permanent or attempt == self.max_retries:
+                        self.failed += 1
+                        logging.error(f"Error sending email: {e}")
+                        break
+                    # A pooled connection the server dropped while idle is
+                    # retried straight away on a fresh one.
+                    if not (reused and isinstance(e, smtplib.SMTPServerDisconnected)):
+                        time.sleep(self.backoff * (2 ** attempt))
+
+            self._queue.task_done()
+
+    @staticmethod
+    def _close(server):
+        if server is not None:
+            try:
+                server.quit()
+            except (smtplib.SMTPException, OSError):
+                server.close()
+        return None
+
+
+mail_queue = MailQueue()
@@ -0,0 +1,178 @@
+from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool
+import json
+import logging
+import queue
+import select
+import threading
+
+CHANNEL = 'notification_events'
+# Postgres NOTIFY payloads are capped at 8000 bytes
+MAX_NOTIFY_PAYLOAD = 7900
+
+
+class LocalBackend:
+    """Delivers events to subscribers in this process only (single worker)."""
+
+    def __init__(self, broker):
+        self.broker = broker
+
+    def publish(self, message):
+        self.broker.dispatch(message)
+
+    def start(self):
+        pass
+
+
+class PostgresBackend:
+    """
+    Fans events out to every worker process through LISTEN/NOTIFY.
+
+    publish() issues pg_notify on a pooled connection; each process runs one
+    listener thread that hands received events to its local subscribers.
+    The listener sits on a connection of its own outside the pool, so it
+    never takes a slot from request handlers.
+    """
+
+    def __init__(self, broker, engine):
+        self.broker = broker
+        self.engine = engine
+        self.listen_engine = create_engine(engine.url, poolclass=NullPool)
+
+    def publish(self, message):
+        payload = json.dumps(message)
+        if len(payload.encode()) > MAX_NOTIFY_PAYLOAD:
+            # Too big to carry; tell the audience to re-fetch instead
+            payload = json.dumps({'user_id': message['user_id'], 'event': 'refresh', 'data': {}})
+        with self.engine.connect() as conn:
+            conn.exec_driver_sql("SELECT pg_notify(%s, %s)", (CHANNEL, payload))
+            conn.commit()
+
+    def start(self):
+        thread = threading.Thread(target=self._listen, name='notification-listener', daemon=True)
+        thread.start()
+
+    def _listen(self):
+        while True:
+            conn = None
+            try:
+                conn = self.listen_engine.raw_connection()
+                conn.driver_connection.autocommit = True
+                cursor = conn.cursor()
+                cursor.execute(f"LISTEN {CHANNEL}")
+                pg_conn = conn.driver_connection
+                while True:
+                    if select.select([pg_conn], [], [], 60) == ([], [], []):
+                        continue
+                    pg_conn.poll()
+                    while pg_conn.notifies:
+                        notify = pg_conn.notifies.pop(0)
+                        self.broker.dispatch(json.loads(notify.payload))
+            except Exception as e:
+                logging.error(f"Notification listener failed, reconnecting: {e}")
+                threading.Event().wait(5)
+            finally:
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+
+
+class NotificationBroker:
+    """
+    Pub/sub for the notification event stream (/api/notifications/stream).
+
+    Each open stream subscribes with its user id and role and gets a small
+    queue. publish(user_id, event, data) routes an event to that user's
+    streams, or to every admin stream when user_id is None (the convention
+    for system notifications). The transport between processes is the
+    NOTIFICATION_BROKER_BACKEND: 'local' or 'postgres', by default
+    'postgres' whenever the database is PostgreSQL.
+    """
+
+    def __init__(self, queue_size=100, max_subscribers=100):
+        self.queue_size = queue_size
+        self.max_subscribers = max_subscribers
+        self.backend_name = 'local'
+        self._backend = None
+        self._subscribers = {}
+        self._lock = threading.Lock()
+        self.published = 0
+        self.dropped = 0
+        self.rejected = 0
+
+    def init_app(self, app):
+        backend = app.config.get('NOTIFICATION_BROKER_BACKEND')
+        if not backend:
+            # Workers of a multi-process server only share events through the database
+            backend = 'postgres' if app.config['SQLALCHEMY_DATABASE_URI'].startswith('postgresql') else 'local'
+        self.backend_name = backend
+        self.queue_size = app.config.get('NOTIFICATION_STREAM_QUEUE_SIZE', self.queue_size)
+        self.max_subscribers = app.config.get('NOTIFICATION_STREAM_MAX', self.max_subscribers)
+
+    def _get_backend(self):
+        # Started lazily, so a pre-forking server starts one listener per worker
+        with self._lock:
+            if self._backend is None:
+                if self.backend_name == 'postgres':
+                    from app import db
+                    self._backend = PostgresBackend(self, db.engine)
+                elif self.backend_name == 'local':
+                    self._backend = LocalBackend(self)
+                else:
+                    raise ValueError(f"Unknown notification broker backend: {self.backend_name}")
+                self._backend.start()
+            return self._backend
+
+    def subscribe(self, user_id, is_admin):
+        """Return a queue of (event, data), or None when max_subscribers are open."""
+        self._get_backend()
+        subscription = queue.Queue(maxsize=self.queue_size)
+        with self._lock:
+            if len(self._subscribers) >= self.max_subscribers:
+                self.rejected += 1
+                return None
+            self._subscribers[subscription] = (user_id, is_admin)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscribers.pop(subscription, None)
+
+    def publish(self, user_id, event, data=None):
+        """Publish an event; failures are logged, never raised to the caller."""
+        self.published += 1
+        try:
+            self._get_backend().publish({'user_id': user_id, 'event': event, 'data': data or {}})
+        except Exception as e:
+            logging.error(f"Failed to publish notification event: {e}")
+
+    def dispatch(self, message):
+        user_id = message['user_id']
+        with self._lock:
+            targets = [
+                subscription for subscription, (sub_user_id, is_admin) in self._subscribers.items()
+                if (is_admin if user_id is None else sub_user_id == user_id)
+            ]
+        for subscription in targets:
+            try:
+                subscription.put_nowait((message['event'], message['data']))
+            except queue.Full:
+                # A stalled client; it resyncs when it reconnects
+                self.dropped += 1
+
+    def stats(self):
+        with self._lock:
+            subscribers = len(self._subscribers)
+        return {
+            'backend': self.backend_name,
+            'subscribers': subscribers,
+            'max_subscribers': self.max_subscribers,
+            'rejected': self.rejected,
+            'published': self.published,
+            'dropped': self.dropped
+        }
+
+
+notification_broker = NotificationBroker()
@@ -0,0 +1,195 @@
+from app import db
+from app.models import Notification, NotificationArchive
+from sqlalchemy import select, insert, delete, literal, and_, or_
+from datetime import datetime, timedelta
+import logging
+import re
+
+PARTITION_NAME = re.compile(r'^notifications_p(\d{4})(\d{2})$')
+
+
+def _month_start(value):
+    return datetime(value.year, value.month, 1)
+
+
+def _next_month(value):
+    return datetime(value.year + value.month // 12, value.month % 12 + 1, 1)
+
+
+class NotificationRetentionService:
+    """
+    Retention for the notifications table.
+
+    purge() removes read notifications older than the retention period in
+    small committed chunks (optionally copying them to notifications_archive
+    first), so no long-running transaction holds locks on the table. Unread
+    notifications are never touched, which keeps the unread counters valid.
+
+    On PostgreSQL the table can additionally be converted to monthly range
+    partitions on created_at (partition_table(), a one-off maintenance
+    operation). The daily job then keeps partitions created ahead of time
+    and drops old partitions the purge has emptied.
+    """
+
+    @staticmethod
+    def purge(days, mode='delete', batch_size=1000):
+        if mode not in ('delete', 'archive'):
+            raise ValueError(f"Unknown notification retention mode: {mode}")
+        cutoff = datetime.utcnow() - timedelta(days=days)
+        columns = ['id', 'user_id', 'title', 'message', 'type', 'is_read', 'created_at']
+        total = 0
+        last = None
+        while True:
+            query = db.session.query(Notification.id, Notification.created_at).filter(
+                Notification.created_at < cutoff,
+                Notification.is_read == True
+            )
+            if last is not None:
+                # Keyset on (created_at, id) so old unread rows aren't rescanned each chunk
+                query = query.filter(or_(
+                    Notification.created_at > last[0],
+                    and_(Notification.created_at == last[0], Notification.id > last[1])
+                ))
+            chunk = query.order_by(Notification.created_at, Notification.id).limit(batch_size).all()
+            if not chunk:
+                break
+            ids = [row.id for row in chunk]
+
+            if mode == 'archive':
+                db.session.execute(insert(NotificationArchive).from_select(
+                    columns + ['archived_at'],
+                    select(*[getattr(Notification, col) for col in columns], literal(datetime.utcnow()))
+                    .where(Notification.id.in_(ids))
+                ))
+            db.session.execute(delete(Notification).where(Notification.id.in_(ids)))
+            db.session.commit()
+
+            total += len(ids)
+            last = (chunk[-1].created_at, chunk[-1].id)
+            if len(chunk) < batch_size:
+                break
+
+        logging.info(f"Notification retention: {mode}d {total} notifications older than {cutoff:%Y-%m-%d}")
+        return total
+
+    @staticmethod
+    def is_partitioned():
+        if db.engine.dialect.name != 'postgresql':
+            return False
+        return db.session.execute(db.text(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass('notifications'))"
+        )).scalar()
+
+    @staticmethod
+    def _partitions():
+        names = db.session.execute(db.text(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = 'notifications'::regclass"
+        )).scalars()
+        partitions = {}
+        for name in names:
+            match = PARTITION_NAME.match(name)
+            if match:
+                partitions[datetime(int(match.group(1)), int(match.group(2)), 1)] = name
+        return partitions
+
+    @staticmethod
+    def _create_partition(month):
+        db.session.execute(db.text(
+            f"CREATE TABLE IF NOT EXISTS notifications_p{month:%Y%m} PARTITION OF notifications "
+            f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{_next_month(month):%Y-%m-%d}')"
+        ))
+
+    @staticmethod
+    def ensure_partitions(months_ahead=3):
+        """Create the monthly partitions from this month to months_ahead."""
+        existing = NotificationRetentionService._partitions()
+        month = _month_start(datetime.utcnow())
+        for _ in range(months_ahead + 1):
+            if month not in existing:
+                NotificationRetentionService._create_partition(month)
+            month = _next_month(month)
+        db.session.commit()
+
+    @staticmethod
+    def drop_empty_partitions(days):
+        """Drop monthly partitions entirely older than the cutoff that hold no rows."""
+        cutoff = datetime.utcnow() - timedelta(days=days)
+        dropped = 0
+        for month, name in sorted(NotificationRetentionService._partitions().items()):
+            if _next_month(month) > cutoff:
+                break
+            if db.session.execute(db.text(f"SELECT NOT EXISTS (SELECT 1 FROM {name})")).scalar():
+                db.session.execute(db.text(f"DROP TABLE {name}"))
+                dropped += 1
+        db.session.commit()
+        return dropped
+
+    @staticmethod
+    def partition_table(months_ahead=3):
+        """
+        Convert notifications into a table range-partitioned by month on
+        created_at, in one transaction. Rewrites the whole table, so run it
+        during a maintenance window (`flask partition-notifications`).
+        """
+        if db.engine.dialect.name != 'postgresql':
+            raise NotImplementedError("Notification partitioning requires PostgreSQL")
+        if NotificationRetentionService.is_partitioned():
+            return False
+
+        statements = [
+            "ALTER TABLE notifications RENAME TO notifications_unpartitioned",
+            # Keep the id sequence alive when the old table is dropped
+            "ALTER SEQUENCE notifications_id_seq OWNED BY NONE",
+            "CREATE TABLE notifications (LIKE notifications_unpartitioned INCLUDING DEFAULTS) "
+            "PARTITION BY RANGE (created_at)",
+            "CREATE TABLE notifications_default PARTITION OF notifications DEFAULT",
+        ]
+        for statement in statements:
+            db.session.execute(db.text(statement))
+
+        oldest = db.session.execute(db.text("SELECT MIN(created_at) FROM notifications_unpartitioned")).scalar()
+        month = _month_start(oldest or datetime.utcnow())
+        last = _month_start(datetime.utcnow())
+        for _ in range(months_ahead):
+            last = _next_month(last)
+        while month <= last:
+            NotificationRetentionService._create_partition(month)
+            month = _next_month(month)
+
+        statements = [
+            "INSERT INTO notifications (id, user_id, title, message, type, is_read, created_at) "
+            "SELECT id, user_id, title, message, type, is_read, COALESCE(created_at, now() at time zone 'utc') "
+            "FROM notifications_unpartitioned",
+            "DROP TABLE notifications_unpartitioned",
+            "ALTER SEQUENCE notifications_id_seq OWNED BY notifications.id",
+            # The partition key has to be part of the primary key
+            "ALTER TABLE notifications ADD PRIMARY KEY (id, created_at)",
+            "ALTER TABLE notifications ADD CONSTRAINT notifications_user_id_fkey "
+            "FOREIGN KEY (user_id) REFERENCES users (id)",
+            "CREATE INDEX ix_notifications_user_read_created ON notifications (user_id, is_read, created_at)",
+            "CREATE INDEX ix_notifications_created_at ON notifications (created_at)",
+        ]
+        for statement in statements:
+            db.session.execute(db.text(statement))
+        db.session.commit()
+        logging.info("Converted notifications to a monthly partitioned table")
+        return True
+
+    @staticmethod
+    def run(config):
+        """Daily retention pass, driven by the NOTIFICATION_* config values."""
+        days = config.get('NOTIFICATION_RETENTION_DAYS', 90)
+        partitioned = NotificationRetentionService.is_partitioned()
+        if partitioned:
+            NotificationRetentionService.ensure_partitions(config.get('NOTIFICATION_PARTITION_MONTHS_AHEAD', 3))
+        if not days:
+            return 0
+        total = NotificationRetentionService.purge(
+            days,
+            mode=config.get('NOTIFICATION_RETENTION_MODE', 'delete'),
+            batch_size=config.get('NOTIFICATION_RETENTION_BATCH', 1000)
+        )
+        if partitioned:
+            NotificationRetentionService.drop_empty_partitions(days)
+        return total
@@ -1,6 +1,13 @@
 from app import db
-from app.models import Notification, Setting, Car
-from app.services.email_service import EmailService
+from app.models import Notification, Car, NotificationUnreadCounter, SYSTEM_NOTIFICATIONS_OWNER
+from app.services.notification_broker import notification_broker
+from app.services.outbox import outbox
+from sqlalchemy import insert, update, delete, and_, or_
+from sqlalchemy.dialects import postgresql, sqlite
+from datetime import datetime
+import logging
+
+MAINTENANCE_INTERVAL = 10000
 
 class NotificationService:
     @staticmethod
@@ -12,43 +19,182 @@ class NotificationService:
             user_id=user_id
         )
         db.session.add(new_notif)
+        NotificationService.adjust_unread(user_id, 1)
         db.session.commit()
+        notification_broker.publish(user_id, 'notification', new_notif.to_dict())
         return new_notif
 
     @staticmethod
-    def notify_admin(title, message, type='info', send_email=True):
-        # Create in-app notification for admins (user_id=None)
-        notif = NotificationService.create_notification(title, message, type)
-        
-        if send_email:
-            admin_email = Setting.query.filter_by(key='admin_email').first()
-            if admin_email and admin_email.value:
-                EmailService.send_email(admin_email.value, title, message)
-        
-        return notif
+    def adjust_unread(user_id, delta):
+        """
+        Add delta to the unread counter of user_id (None = system
+        notifications) in the current transaction; call it alongside every
+        insert of an unread notification or is_read flip.
+        """
+        if not delta:
+            return
+        owner_id = SYSTEM_NOTIFICATIONS_OWNER if user_id is None else user_id
+
+        dialect = db.engine.dialect.name
+        if dialect == 'postgresql':
+            stmt = postgresql.insert(NotificationUnreadCounter)
+        elif dialect == 'sqlite':
+            stmt = sqlite.insert(NotificationUnreadCounter)
+        else:
+            raise NotImplementedError(f"Unread counters are not supported on {dialect}")
+
+        stmt = stmt.values(owner_id=owner_id, count=delta)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['owner_id'],
+            set_={'count': NotificationUnreadCounter.count + delta}
+        )
+        db.session.execute(stmt)
 
     @staticmethod
-    def check_maintenance(car):
+    def unread_count(user):
+        """Badge count: the user's own counter, plus the system one for admins."""
+        owners = [user.id]
+        if user.role == 'admin':
+            owners.append(SYSTEM_NOTIFICATIONS_OWNER)
+        count = db.session.query(db.func.sum(NotificationUnreadCounter.count)).filter(
+            NotificationUnreadCounter.owner_id.in_(owners)
+        ).scalar()
+        return max(count or 0, 0)
+
+    @staticmethod
+    def reconcile_unread_counters():
         """
-        Check if car needs maintenance based on 10,000 km interval.
-        Triggers if it crosses a 10,000 km mark since last maintenance.
+        Recompute the unread counters from the notifications table and fix
+        any that drifted. Returns the number of counters corrected.
         """
-        interval = 10000
-        current = car.current_mileage
-        last = car.last_maintenance_mileage
-        
+        if db.engine.dialect.name == 'postgresql':
+            # Writers update the counters after inserting/flipping rows, so
+            # holding this lock means every change is either already visible
+            # to the count below or applied on top of the repaired value.
+            db.session.execute(db.text("LOCK TABLE notification_unread_counters IN EXCLUSIVE MODE"))
+
+        owner = db.func.coalesce(Notification.user_id, SYSTEM_NOTIFICATIONS_OWNER)
+        actual = dict(db.session.query(owner, db.func.count(Notification.id)).filter(
+            Notification.is_read == False
+        ).group_by(owner).all())
+        stored = dict(db.session.query(NotificationUnreadCounter.owner_id, NotificationUnreadCounter.count).all())
+
+        drifted = {
+            owner_id: actual.get(owner_id, 0)
+            for owner_id in set(actual) | set(stored)
+            if actual.get(owner_id, 0) != stored.get(owner_id, 0)
+        }
+        if drifted:
+            db.session.execute(delete(NotificationUnreadCounter).where(
+                NotificationUnreadCounter.owner_id.in_(list(drifted))
+            ))
+            db.session.execute(insert(NotificationUnreadCounter), [
+                {'owner_id': owner_id, 'count': count} for owner_id, count in drifted.items()
+            ])
+            logging.warning(f"Repaired {len(drifted)} drifted unread notification counters")
+        db.session.commit()
+        return len(drifted)
+
+    @staticmethod
+    def notify_admin(title, message, type='info', send_email=True):
+        # The email goes through the outbox, committed with the notification
+        if send_email:
+            outbox.add('admin_email', subject=title, body=message)
+
+        # Create in-app notification for admins (user_id=None)
+        return NotificationService.create_notification(title, message, type)
+
+    @staticmethod
+    def maintenance_due(current, last, interval=MAINTENANCE_INTERVAL):
         # Check if the car has crossed a 10,000 km threshold
         # e.g., if it was 9,500 and now 10,050 -> alert
         # or if it's been more than 10,000 km since last recorded maintenance
-        if (current // interval) > (last // interval) or (current - last >= interval):
-            title = f"Maintenance Due: {car.brand} {car.model} ({car.license_plate})"
-            message = f"""
+        return (current // interval) > (last // interval) or (current - last >= interval)
+
+    @staticmethod
+    def maintenance_due_clause(current, last, interval=MAINTENANCE_INTERVAL):
+        """SQL form of maintenance_due over column expressions."""
+        return or_((current // interval) > (last // interval), (current - last) >= interval)
+
+    @staticmethod
+    def maintenance_alert_message(car, interval=MAINTENANCE_INTERVAL):
+        title = f"Maintenance Due: {car.brand} {car.model} ({car.license_plate})"
+        message = f"""
             <h3>Vehicle Maintenance Alert</h3>
             <p>The vehicle <strong>{car.brand} {car.model}</strong> with license plate <strong>{car.license_plate}</strong> 
-            has reached <strong>{current:,} km</strong>.</p>
-            <p>Last maintenance was recorded at {last:,} km. It is now due for its {interval:,} km service.</p>
+            has reached <strong>{car.current_mileage:,} km</strong>.</p>
+            <p>Last maintenance was recorded at {car.last_maintenance_mileage:,} km. It is now due for its {interval:,} km service.</p>
             <p>Please update the car's maintenance status once the service is complete.</p>
             """
+        return title, message
+
+    @staticmethod
+    def check_maintenance(car):
+        """
+        Check if car needs maintenance based on 10,000 km interval.
+        Triggers if it crosses a 10,000 km mark since last maintenance,
+        once per crossing: the car's maintenance_checked_mileage watermark
+        suppresses repeat alerts while it stays due.
+        """
+        interval = MAINTENANCE_INTERVAL
+        current = car.current_mileage or 0
+        last = car.last_maintenance_mileage or 0
+        checked = car.maintenance_checked_mileage
+
+        due = NotificationService.maintenance_due(current, last, interval)
+        already_alerted = checked is not None and NotificationService.maintenance_due(checked, last, interval) \
+            and (current // interval) == (checked // interval)
+
+        # The watermark commits together with the alert (notify_admin commits)
+        car.maintenance_checked_mileage = current
+
+        if due and not already_alerted:
+            title, message = NotificationService.maintenance_alert_message(car, interval)
             NotificationService.notify_admin(title, message, type='maintenance')
             return True
+        db.session.commit()
         return False
+
+    @staticmethod
+    def check_maintenance_changed():
+        """
+        Set-based version of check_maintenance for the daily job.
+
+        Only cars whose current_mileage moved since the last check are read,
+        alerts for the newly due ones are bulk-inserted, and the watermark of
+        every changed car is advanced in one UPDATE. Returns the alerted cars.
+        """
+        interval = MAINTENANCE_INTERVAL
+        current = db.func.coalesce(Car.current_mileage, 0)
+        last = db.func.coalesce(Car.last_maintenance_mileage, 0)
+        checked = Car.maintenance_checked_mileage
+        changed = Car.current_mileage.is_distinct_from(checked)
+
+        already_alerted = and_(
+            checked.isnot(None),
+            NotificationService.maintenance_due_clause(checked, last, interval),
+            (current // interval) == (checked // interval)
+        )
+        due_cars = Car.query.filter(
+            changed,
+            NotificationService.maintenance_due_clause(current, last, interval),
+            ~already_alerted
+        ).all()
+
+        now = datetime.utcnow()
+        if due_cars:
+            alerts = [NotificationService.maintenance_alert_message(car, interval) for car in due_cars]
+            db.session.execute(insert(Notification), [
+                {'title': title, 'message': message, 'type': 'maintenance', 'is_read': False, 'created_at': now}
+                for title, message in alerts
+            ])
+            NotificationService.adjust_unread(None, len(alerts))
+            outbox.add('admin_email', subject=f"Maintenance Due: {len(due_cars)} Vehicles",
+                       body=''.join(message for _, message in alerts))
+
+        db.session.execute(
+            update(Car).where(changed).values(maintenance_checked_mileage=Car.current_mileage),
+            execution_options={'synchronize_session': False}
+        )
+        db.session.commit()
+        return due_cars
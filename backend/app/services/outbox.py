@@ -0,0 +1,173 @@
+from app import db
+from app.models import OutboxEvent
+from sqlalchemy import update, delete
+from datetime import datetime, timedelta
+import logging
+
+
+class Outbox:
+    """
+    Transactional outbox for side effects of request handlers.
+
+    add(kind, **payload) stages an event in the caller's transaction, so it
+    is stored if and only if the change that caused it commits. dispatch()
+    runs in the scheduler leader every OUTBOX_POLL_SECONDS: it claims a
+    batch of due events for OUTBOX_LEASE_SECONDS, runs their handlers with
+    emails sent synchronously, deletes the ones that succeeded and
+    reschedules the rest with exponential backoff. A process dying mid-batch
+    only delays its events until the lease runs out, so delivery is at least
+    once; handlers must tolerate the occasional repeat.
+    """
+
+    def __init__(self, batch_size=100, max_attempts=8, backoff=30, lease=300):
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.lease = lease
+        self.handlers = {}
+        self.dispatched = 0
+        self.retried = 0
+        self.failed = 0
+
+    def init_app(self, app):
+        self.batch_size = app.config.get('OUTBOX_BATCH_SIZE', self.batch_size)
+        self.max_attempts = app.config.get('OUTBOX_MAX_ATTEMPTS', self.max_attempts)
+        self.backoff = app.config.get('OUTBOX_RETRY_BACKOFF', self.backoff)
+        self.lease = app.config.get('OUTBOX_LEASE_SECONDS', self.lease)
+
+    def handler(self, kind):
+        def register(func):
+            self.handlers[kind] = func
+            return func
+        return register
+
+    def add(self, kind, **payload):
+        """Stage an event in the current transaction; the caller commits."""
+        if kind not in self.handlers:
+            raise ValueError(f"No outbox handler for {kind}")
+        db.session.add(OutboxEvent(kind=kind, payload=payload))
+
+    def dispatch(self):
+        """Deliver one batch of due events. Returns the number handled."""
+        from app.services.email_service import EmailService
+
+        now = datetime.utcnow()
+        events = OutboxEvent.query.filter(
+            OutboxEvent.available_at <= now
+        ).order_by(OutboxEvent.id).limit(self.batch_size).with_for_update(skip_locked=True).all()
+        if not events:
+            db.session.rollback()
+            return 0
+        # Claim the batch; handlers commit on their own
+        batch = [(event.id, event.kind, event.payload, event.attempts) for event in events]
+        db.session.execute(
+            update(OutboxEvent)
+            .where(OutboxEvent.id.in_([event_id for event_id, _, _, _ in batch]))
+            .values(available_at=now + timedelta(seconds=self.lease))
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+
+        done, failures = [], []
+        with EmailService.direct_delivery():
+            for event_id, kind, payload, attempts in batch:
+                try:
+                    self.handlers[kind](**payload)
+                    done.append(event_id)
+                except Exception as e:
+                    db.session.rollback()
+                    logging.exception(f"Outbox event {event_id} ({kind}) failed")
+                    failures.append((event_id, attempts + 1, f"{type(e).__name__}: {e}"))
+
+        if done:
+            db.session.execute(delete(OutboxEvent).where(OutboxEvent.id.in_(done)))
+        for event_id, attempts, error in failures:
+            gave_up = attempts >= self.max_attempts
+            db.session.execute(
+                update(OutboxEvent).where(OutboxEvent.id == event_id).values(
+                    attempts=attempts,
+                    last_error=error,
+                    available_at=None if gave_up else now + timedelta(seconds=self.backoff * 2 ** (attempts - 1))
+                )
+            )
+            if gave_up:
+                self.failed += 1
+            else:
+                self.retried += 1
+        db.session.commit()
+        self.dispatched += len(done)
+        return len(batch)
+
+    def drain(self):
+        """Dispatch until nothing is due. Returns the number handled."""
+        total = 0
+        while True:
+            handled = self.dispatch()
+            if not handled:
+                return total
+            total += handled
+
+    def stats(self):
+        pending = OutboxEvent.query.filter(OutboxEvent.available_at.isnot(None)).count()
+        dead = OutboxEvent.query.filter(OutboxEvent.available_at.is_(None)).count()
+        return {
+            'pending': pending,
+            'failed_events': dead,
+            'dispatched': self.dispatched,
+            'retried': self.retried,
+            'failed': self.failed
+        }
+
+
+outbox = Outbox()
+
+
+def _bookings(ids):
+    from app.models import Booking
+    from sqlalchemy.orm import joinedload
+    return Booking.query.options(joinedload(Booking.user), joinedload(Booking.car)) \
+        .filter(Booking.id.in_(ids)).order_by(Booking.id).all()
+
+
+@outbox.handler('booking_created')
+def _booking_created(booking_id):
+    from app.services.email_service import EmailService
+    for booking in _bookings([booking_id]):
+        EmailService.notify_new_booking(booking, booking.user, booking.car)
+
+
+@outbox.handler('bookings_created')
+def _bookings_created(booking_ids):
+    from app.services.email_service import EmailService
+    bookings = _bookings(booking_ids)
+    if bookings:
+        EmailService.notify_new_bookings(bookings, bookings[0].user, {b.car_id: b.car for b in bookings})
+
+
+@outbox.handler('booking_status')
+def _booking_status(booking_ids, status):
+    from app.services.email_service import EmailService
+    by_user = {}
+    # Bookings changed again since are covered by that change's own event
+    for booking in _bookings(booking_ids):
+        if booking.status == status:
+            by_user.setdefault(booking.user_id, []).append(booking)
+    for user_bookings in by_user.values():
+        EmailService.notify_booking_statuses(user_bookings, user_bookings[0].user)
+
+
+@outbox.handler('maintenance_check')
+def _maintenance_check(car_id):
+    from app.models import Car
+    from app.services.notification_service import NotificationService
+    car = db.session.get(Car, car_id)
+    if car:
+        NotificationService.check_maintenance(car)
+
+
+@outbox.handler('admin_email')
+def _admin_email(subject, body):
+    from app.services.email_service import EmailService
+    admin_email = EmailService.get_setting('admin_email')
+    if admin_email:
+        EmailService.send_email(admin_email, subject, body)
@@ -0,0 +1,214 @@
+from collections import OrderedDict
+from flask import current_app
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import mm
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfgen import canvas
+import io
+import os
+import threading
+
+FONT_NAME = 'THSarabunNew'
+FONT_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'assets', 'fonts', 'THSarabunNew.ttf')
+
+PAGE_WIDTH, PAGE_HEIGHT = A4
+MARGIN = 14 * mm
+ROW_HEIGHT = 6 * mm
+
+_font_lock = threading.Lock()
+_font_registered = False
+
+
+def _ensure_font():
+    # Parsing the TTF is the expensive part; do it once per process
+    global _font_registered
+    if not _font_registered:
+        with _font_lock:
+            if not _font_registered:
+                pdfmetrics.registerFont(TTFont(FONT_NAME, FONT_PATH))
+                _font_registered = True
+
+
+def _clip(text, width, size):
+    # Longest prefix that fits the column, found by binary search so long
+    # values cost O(log n) width measurements instead of one per character
+    if pdfmetrics.stringWidth(text, FONT_NAME, size) <= width:
+        return text
+    low, high = 0, len(text) - 1
+    while low < high:
+        middle = (low + high + 1) // 2
+        if pdfmetrics.stringWidth(text[:middle], FONT_NAME, size) <= width:
+            low = middle
+        else:
+            high = middle - 1
+    return text[:low]
+
+
+class _PdfWriter:
+    """Top-down text/table writer over a reportlab canvas with page breaks."""
+
+    def __init__(self, buffer):
+        self.c = canvas.Canvas(buffer, pagesize=A4)
+        self.y = PAGE_HEIGHT - MARGIN
+
+    def new_page(self):
+        self.c.showPage()
+        self.y = PAGE_HEIGHT - MARGIN
+
+    def ensure_space(self, height):
+        if self.y - height < MARGIN:
+            self.new_page()
+
+    def text(self, value, size=12, x=MARGIN, center=False, gap=None):
+        gap = gap or size * 0.6
+        self.ensure_space(size + gap)
+        self.c.setFont(FONT_NAME, size)
+        self.y -= size
+        if center:
+            self.c.drawCentredString(PAGE_WIDTH / 2, self.y, value)
+        else:
+            self.c.drawString(x, self.y, value)
+        self.y -= gap
+
+    def _row(self, values, widths, size, fill=None):
+        self.c.setFont(FONT_NAME, size)
+        if fill:
+            self.c.setFillColorRGB(*fill)
+            self.c.rect(MARGIN, self.y - ROW_HEIGHT, sum(widths), ROW_HEIGHT, stroke=0, fill=1)
+            self.c.setFillColorRGB(0, 0, 0)
+        x = MARGIN
+        for value, width in zip(values, widths):
+            text = _clip(str(value), width - 4, size)
+            self.c.drawString(x + 2, self.y - ROW_HEIGHT + 4, text)
+            x += width
+        self.y -= ROW_HEIGHT
+
+    def table(self, head, rows, widths, size=10):
+        """Draw rows as they are produced, repeating the header on each page."""
+        self.ensure_space(ROW_HEIGHT * 2)
+        self._row(head, widths, size + 1, fill=(0.85, 0.87, 0.95))
+        for i, row in enumerate(rows):
+            if self.y - ROW_HEIGHT < MARGIN:
+                self.new_page()
+                self._row(head, widths, size + 1, fill=(0.85, 0.87, 0.95))
+            self._row(row, widths, size, fill=(0.96, 0.96, 0.96) if i % 2 else None)
+        self.y -= ROW_HEIGHT
+
+    def line_chart(self, points, height=60 * mm):
+        """Simple daily trend line of (label, value) points."""
+        if not points:
+            return
+        self.ensure_space(height + ROW_HEIGHT)
+        width = PAGE_WIDTH - 2 * MARGIN
+        bottom = self.y - height
+        self.c.setStrokeColorRGB(0.7, 0.7, 0.7)
+        self.c.rect(MARGIN, bottom, width, height, stroke=1, fill=0)
+
+        top_value = max(v for _, v in points) or 1
+        step = width / max(len(points) - 1, 1)
+        coords = [
+            (MARGIN + i * step, bottom + (v / top_value) * (height - 4 * mm))
+            for i, (_, v) in enumerate(points)
+        ]
+        self.c.setStrokeColorRGB(0.39, 0.4, 0.95)
+        path = self.c.beginPath()
+        path.moveTo(*coords[0])
+        for point in coords[1:]:
+            path.lineTo(*point)
+        self.c.drawPath(path, stroke=1, fill=0)
+        self.c.setStrokeColorRGB(0, 0, 0)
+
+        self.c.setFont(FONT_NAME, 9)
+        self.c.drawString(MARGIN, bottom - 4 * mm, points[0][0])
+        self.c.drawRightString(MARGIN + width, bottom - 4 * mm, points[-1][0])
+        self.c.drawString(MARGIN + 2, self.y - 10, f"max {top_value}")
+        self.y = bottom - ROW_HEIGHT
+
+    def finish(self):
+        self.c.save()
+
+
+class ReportPdfService:
+    _cache = OrderedDict()
+    _cache_lock = threading.Lock()
+
+    @staticmethod
+    def get_cached(key):
+        with ReportPdfService._cache_lock:
+            pdf = ReportPdfService._cache.get(key)
+            if pdf is not None:
+                ReportPdfService._cache.move_to_end(key)
+            return pdf
+
+    @staticmethod
+    def put_cached(key, pdf):
+        with ReportPdfService._cache_lock:
+            ReportPdfService._cache[key] = pdf
+            ReportPdfService._cache.move_to_end(key)
+            while len(ReportPdfService._cache) > current_app.config.get('REPORT_PDF_CACHE_SIZE', 16):
+                ReportPdfService._cache.popitem(last=False)
+
+    @staticmethod
+    def render(date_range_string, report, car_counts, rows):
+        """
+        Render the advanced report (same layout as the old browser export).
+
+        `report` is the advanced-stats summary dict, `car_counts` a
+        (active_cars, total_cars) pair and `rows` an iterable of detailed
+        rows, consumed lazily while the history table is drawn.
+        """
+        _ensure_font()
+        buffer = io.BytesIO()
+        pdf = _PdfWriter(buffer)
+        summary = report['summary']
+        active_cars, total_cars = car_counts
+
+        # 1. Header
+        pdf.text("รายงานการใช้รถยนต์ (Vehicle Usage Report)", size=22, center=True)
+        pdf.text(f"ช่วงวันที่: {date_range_string}", size=14, center=True, gap=14)
+
+        # 2. Summary Section
+        pdf.text("สรุปภาพรวม (System Summary)", size=16)
+        pdf.text(f"- ระยะทางรวมทั้งหมด: {summary['total_mileage']} กม.", x=MARGIN + 6 * mm)
+        pdf.text(f"- จำนวนการจองทั้งหมด: {summary['total_bookings']} รายการ", x=MARGIN + 6 * mm)
+        pdf.text(f"- สถานะรถ: พร้อมใช้ {active_cars} คัน / ทั้งหมด {total_cars} คัน", x=MARGIN + 6 * mm, gap=12)
+
+        # 3. Usage trend
+        pdf.text("กราฟแนวโน้มการใช้งาน (Usage Trend Graph)", size=16)
+        pdf.line_chart([(d['date'], d['bookings']) for d in report['daily_stats']])
+
+        # 4. Top 5 Users
+        pdf.text("ลำดับผู้ใช้งาน (Top 5 Users)", size=16)
+        pdf.table(['ชื่อ-นามสกุล', 'จํานวนครั้งที่จอง'],
+                  [[u['name'], u['count']] for u in summary['top_users'][:5]],
+                  [120 * mm, 62 * mm])
+
+        # 5. Car Usage
+        pdf.text("การใช้รถแยกประเภท (Car Usage & Mileage)", size=16)
+        pdf.table(['รุ่นรถ/ทะเบียน', 'การจอง', 'ระยะทางรวม'],
+                  [[c['name'], c['count'], f"{c['mileage']} กม."] for c in summary['car_stats']],
+                  [110 * mm, 32 * mm, 40 * mm])
+
+        # 6. Daily Trend Data
+        pdf.text("แนวโน้มการจองรายวัน (Daily Booking Trend Data)", size=16)
+        pdf.table(['วันที่', 'จํานวนการจอง'],
+                  [[d['date'], d['bookings']] for d in report['daily_stats']],
+                  [91 * mm, 91 * mm], size=9)
+
+        # 7. Detailed Bookings (Separate Page)
+        pdf.new_page()
+        pdf.text("ประวัติการจองฉบับเต็ม (Detailed Booking History)", size=18, center=True)
+        pdf.table(['วันที่', 'ผู้ใช้งาน', 'พาหนะ', 'จุดหมาย', 'สถานะ', 'ระยะทาง'],
+                  ([
+                      r.start_time.strftime('%Y-%m-%d %H:%M'),
+                      r.full_name or 'N/A',
+                      f"{r.brand} {r.model} ({r.license_plate})" if r.license_plate else 'N/A',
+                      r.destination or '-',
+                      r.status.upper(),
+                      f"{r.mileage} กม." if r.mileage and r.mileage > 0 else '-'
+                  ] for r in rows),
+                  [28 * mm, 34 * mm, 46 * mm, 36 * mm, 20 * mm, 18 * mm], size=9)
+
+        pdf.finish()
+        return buffer.getvalue()
@@ -0,0 +1,110 @@
+from app import db
+from app.models import Booking, BookingDailyStat
+from sqlalchemy import insert, delete
+from sqlalchemy.dialects import postgresql, sqlite
+import logging
+
+COUNTERS = ['booking_count', 'completed_count', 'mileage']
+
+class RollupService:
+    """
+    Keeps booking_daily_stats in step with the bookings table.
+
+    Routes call remove(booking) before changing a booking's status or
+    mileage and add(booking) afterwards, inside the same transaction, so each
+    row reflects the booking's current contribution.
+    """
+
+    @staticmethod
+    def contribution(booking):
+        completed = booking.status == 'completed'
+        mileage = 0
+        if completed and booking.end_mileage is not None and booking.start_mileage is not None:
+            mileage = booking.end_mileage - booking.start_mileage
+        return {
+            'booking_count': 1,
+            'completed_count': 1 if completed else 0,
+            'mileage': mileage
+        }
+
+    @staticmethod
+    def _apply(booking, sign):
+        RollupService._apply_many([booking], sign)
+
+    @staticmethod
+    def _apply_many(bookings, sign):
+        # One multi-row upsert; rows are merged per (car, day) first because
+        # Postgres rejects a statement that updates the same row twice.
+        rows = {}
+        for booking in bookings:
+            if booking.car_id is None:
+                continue
+            day = booking.start_time.date()
+            row = rows.setdefault((booking.car_id, day), dict(
+                car_id=booking.car_id, day=day, month=day.strftime('%Y-%m'), **{col: 0 for col in COUNTERS}
+            ))
+            for col, value in RollupService.contribution(booking).items():
+                row[col] += value * sign
+        if not rows:
+            return
+
+        dialect = db.engine.dialect.name
+        if dialect == 'postgresql':
+            stmt = postgresql.insert(BookingDailyStat)
+        elif dialect == 'sqlite':
+            stmt = sqlite.insert(BookingDailyStat)
+        else:
+            raise NotImplementedError(f"Booking rollups are not supported on {dialect}")
+
+        stmt = stmt.values(list(rows.values()))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['car_id', 'day'],
+            set_={
+                col: getattr(BookingDailyStat, col) + getattr(stmt.excluded, col)
+                for col in COUNTERS
+            }
+        )
+        db.session.execute(stmt)
+
+    @staticmethod
+    def add(booking):
+        RollupService._apply(booking, 1)
+
+    @staticmethod
+    def remove(booking):
+        RollupService._apply(booking, -1)
+
+    @staticmethod
+    def add_many(bookings):
+        RollupService._apply_many(bookings, 1)
+
+    @staticmethod
+    def remove_many(bookings):
+        RollupService._apply_many(bookings, -1)
+
+    @staticmethod
+    def rebuild(batch_size=1000):
+        """Recompute every rollup row from the bookings table."""
+        totals = {}
+        rows = db.session.query(
+            Booking.car_id, Booking.start_time, Booking.status, Booking.start_mileage, Booking.end_mileage
+        ).filter(Booking.car_id.isnot(None)).execution_options(yield_per=batch_size)
+        for booking in rows:
+            day = booking.start_time.date()
+            row = totals.setdefault((booking.car_id, day), {
+                'car_id': booking.car_id,
+                'day': day,
+                'month': day.strftime('%Y-%m'),
+                'booking_count': 0,
+                'completed_count': 0,
+                'mileage': 0
+            })
+            for col, value in RollupService.contribution(booking).items():
+                row[col] += value
+
+        db.session.execute(delete(BookingDailyStat))
+        if totals:
+            db.session.execute(insert(BookingDailyStat), list(totals.values()))
+        db.session.commit()
+        logging.info(f"Rebuilt booking rollups: {len(totals)} car-days")
+        return len(totals)
@@ -1,11 +1,22 @@
 from flask_apscheduler import APScheduler
 from app import db
-from app.models import Booking, Notification, Car, User
+from app.models import Booking, Notification, Car, User, JobRun
 from app.services.email_service import EmailService
-from datetime import datetime
+from app.services.notification_broker import notification_broker
+from sqlalchemy import insert, update
+from app.services.leader_lock import LeaderLock
+from datetime import datetime, timedelta, timezone
 import logging
+import os
+import threading
+import time
 
 scheduler = APScheduler()
+_leader_thread = None
+
+DAILY_CHECK_JOB = 'daily_system_check'
+# Local time, like the cron trigger
+DAILY_CHECK_HOUR = 7
 
 def check_daily_tasks():
     """
@@ -20,50 +31,160 @@ def check_daily_tasks():
         # 2. Check Maintenance for all cars
         check_maintenance_internal()
 
+        # 3. Resync the in-memory booking index with the database
+        from app.services.booking_index import booking_index
+        booking_index.rebuild()
+
+        # 4. Notification retention
+        from app.services.notification_retention import NotificationRetentionService
+        NotificationRetentionService.run(scheduler.app.config)
+
+        db.session.merge(JobRun(job_id=DAILY_CHECK_JOB, last_run_at=datetime.utcnow()))
+        db.session.commit()
+
+def daily_check_missed(now=None):
+    """True if the daily check hasn't run since its latest 7:00 AM (local time)."""
+    now = now or datetime.now()
+    due = now.replace(hour=DAILY_CHECK_HOUR, minute=0, second=0, microsecond=0)
+    if due > now:
+        due -= timedelta(days=1)
+    last_run = db.session.get(JobRun, DAILY_CHECK_JOB)
+    return last_run is None or last_run.last_run_at < due.astimezone(timezone.utc).replace(tzinfo=None)
+
 def check_overdue_bookings_internal():
     now = datetime.utcnow()
     logging.info(f"Checking for overdue bookings at {now.strftime('%Y-%m-%d %H:%M:%S')} UTC")
-    overdue_bookings = Booking.query.filter(
+    overdue_bookings = db.session.query(
+        Booking.id,
+        Booking.end_time,
+        Booking.overdue_notified_at,
+        Car.license_plate,
+        Car.brand,
+        Car.model,
+        User.full_name
+    ).join(Car, Booking.car_id == Car.id).join(User, Booking.user_id == User.id).filter(
         Booking.end_time < now,
         Booking.status.in_(['approved', 'picked_up'])
-    ).all()
+    ).order_by(Booking.end_time).all()
 
-    if overdue_bookings:
-        for booking in overdue_bookings:
-            user = User.query.get(booking.user_id)
-            car = Car.query.get(booking.car_id)
-            
-            notification = Notification(
-                title=f"Overdue Return: {car.license_plate}",
-                message=f"Vehicle {car.brand} {car.model} ({car.license_plate}) overdue since {booking.end_time.strftime('%Y-%m-%d %H:%M')}.",
-                type='warning'
-            )
-            db.session.add(notification)
-        
+    # Only raise the in-app alert once per booking; the daily email still
+    # lists everything that is overdue.
+    newly_overdue = [b for b in overdue_bookings if b.overdue_notified_at is None]
+    if newly_overdue:
+        db.session.execute(insert(Notification), [
+            {
+                'title': f"Overdue Return: {b.license_plate}",
+                'message': f"Vehicle {b.brand} {b.model} ({b.license_plate}) overdue since {b.end_time.strftime('%Y-%m-%d %H:%M')}.",
+                'type': 'warning',
+                'is_read': False,
+                'created_at': now
+            }
+            for b in newly_overdue
+        ])
+        from app.services.notification_service import NotificationService
+        NotificationService.adjust_unread(None, len(newly_overdue))
+        db.session.execute(
+            update(Booking)
+            .where(Booking.id.in_([b.id for b in newly_overdue]))
+            .values(overdue_notified_at=now)
+        )
         db.session.commit()
+        # Bulk-inserted, so admins' streams re-fetch rather than get each row
+        notification_broker.publish(None, 'refresh')
+
+    if overdue_bookings:
         EmailService.notify_overdue_bookings(overdue_bookings)
-    logging.info(f"Checked overdue bookings: found {len(overdue_bookings)}")
+    logging.info(f"Checked overdue bookings: found {len(overdue_bookings)}, {len(newly_overdue)} new")
 
 def check_maintenance_internal():
     from app.services.notification_service import NotificationService
-    cars = Car.query.all()
-    count = 0
-    for car in cars:
-        if NotificationService.check_maintenance(car):
-            count += 1
-    logging.info(f"Checked maintenance: {count} cars due")
+    due_cars = NotificationService.check_maintenance_changed()
+    if due_cars:
+        notification_broker.publish(None, 'refresh')
+    logging.info(f"Checked maintenance: {len(due_cars)} cars newly due")
+
+def dispatch_outbox():
+    with scheduler.app.app_context():
+        from app.services.outbox import outbox
+        outbox.drain()
+
+def reconcile_unread_counters():
+    with scheduler.app.app_context():
+        from app.services.notification_service import NotificationService
+        NotificationService.reconcile_unread_counters()
 
 def init_scheduler(app):
-    if not scheduler.running:
-        scheduler.init_app(app)
-        scheduler.add_job(
-            id='daily_system_check',
-            func=check_daily_tasks,
-            trigger='cron',
-            hour=7,
-            minute=0
-        )
-        scheduler.start()
-        logging.info("Scheduler initialized.")
-        for job in scheduler.get_jobs():
-            logging.info(f"Scheduled job: {job.id}, Next run: {job.next_run_time}")
+    """
+    Register the jobs and run them in whichever process wins leadership.
+
+    Under gunicorn with preload_app the master must not start threads, so
+    SCHEDULER_AUTOSTART is off there and gunicorn.conf.py calls
+    start_scheduler() from each worker's post_fork hook instead.
+    """
+    if app.config.get('SCHEDULER_AUTOSTART', True):
+        start_scheduler(app)
+
+def start_scheduler(app):
+    global _leader_thread
+    if _leader_thread is not None:
+        return
+    scheduler.init_app(app)
+    # A run delayed within this process (busy pool, clock jump) still happens
+    # once; runs missed while no process led are caught up by _catch_up()
+    scheduler.add_job(
+        id=DAILY_CHECK_JOB,
+        func=check_daily_tasks,
+        trigger='cron',
+        hour=DAILY_CHECK_HOUR,
+        minute=0,
+        misfire_grace_time=3600,
+        coalesce=True
+    )
+    scheduler.add_job(
+        id='reconcile_unread_counters',
+        func=reconcile_unread_counters,
+        trigger='interval',
+        minutes=app.config.get('UNREAD_RECONCILE_MINUTES', 60),
+        coalesce=True
+    )
+    scheduler.add_job(
+        id='dispatch_outbox',
+        func=dispatch_outbox,
+        trigger='interval',
+        seconds=app.config.get('OUTBOX_POLL_SECONDS', 2),
+        coalesce=True
+    )
+    lock = LeaderLock(app.config['SQLALCHEMY_DATABASE_URI'], app.config['SCHEDULER_LOCK_FILE'])
+    _leader_thread = threading.Thread(
+        target=_lead, args=(lock, app.config.get('SCHEDULER_LEADER_CHECK', 10)),
+        name='scheduler-leader', daemon=True
+    )
+    _leader_thread.start()
+
+def _catch_up():
+    # The cron trigger only looks forward, so a 7:00 AM that passed while
+    # leadership was changing hands would otherwise be skipped for the day
+    try:
+        with scheduler.app.app_context():
+            missed = daily_check_missed()
+        if missed:
+            logging.info("Daily system check missed while no leader was running; running it now.")
+            scheduler.modify_job(DAILY_CHECK_JOB, next_run_time=datetime.now(scheduler.scheduler.timezone))
+    except Exception as e:
+        logging.error(f"Could not check for a missed daily system check: {e}")
+
+def _lead(lock, interval):
+    # Followers retry so a new leader takes over when the current one dies;
+    # the leader steps down if it loses its lock.
+    while True:
+        if not scheduler.running:
+            if lock.acquire():
+                scheduler.start()
+                logging.info(f"Scheduler started in process {os.getpid()} (leader).")
+                _catch_up()
+                for job in scheduler.get_jobs():
+                    logging.info(f"Scheduled job: {job.id}, Next run: {job.next_run_time}")
+        elif not lock.held():
+            scheduler.shutdown(wait=False)
+            logging.warning(f"Scheduler stopped in process {os.getpid()}: leader lock lost.")
+        time.sleep(interval)
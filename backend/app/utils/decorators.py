@@ -1,7 +1,9 @@
 from functools import wraps
 from flask import request, jsonify, current_app
 import jwt
+from app import db
 from app.models import User
+from app.utils.user_cache import user_cache
 
 def token_required(f):
     @wraps(f)
@@ -19,9 +21,16 @@ def token_required(f):
 
         try:
             data = jwt.decode(token, current_app.config['SECRET_KEY'], algorithms=["HS256"])
-            current_user = User.query.get(data['user_id'])
-            if not current_user:
-                 return jsonify({'message': 'User not found!'}), 401
+            cached_user = user_cache.get(data['user_id'])
+            if cached_user is None:
+                cached_user = User.query.get(data['user_id'])
+                if not cached_user:
+                     return jsonify({'message': 'User not found!'}), 401
+                # Keep a detached copy in the cache; the request works on a
+                # session-bound copy so route changes still get flushed.
+                db.session.expunge(cached_user)
+                user_cache.set(cached_user)
+            current_user = db.session.merge(cached_user, load=False)
         except jwt.ExpiredSignatureError:
             return jsonify({'message': 'Token has expired!'}), 401
         except jwt.InvalidTokenError:
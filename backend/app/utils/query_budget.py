@@ -0,0 +1,100 @@
+from functools import wraps
+from flask import current_app, jsonify, Response
+from sqlalchemy.exc import OperationalError
+import logging
+import threading
+
+# SQLSTATE for query_canceled (statement_timeout)
+QUERY_CANCELED = '57014'
+
+
+class QueryBudget:
+    """
+    Per-route database budget: a statement timeout for the route's
+    transaction plus a cap on how many such requests query at once in this
+    process, so e.g. long report queries can't starve booking writes of
+    pooled connections.
+
+    Timeouts are applied with SET LOCAL on PostgreSQL and are a no-op
+    elsewhere. A request that can't get a slot within `queue_timeout_key`
+    seconds, or whose statement times out, gets a 503.
+
+    A streamed response keeps its slot until the body has been sent; wrap
+    its generator in stream() so the timeout also covers the queries the
+    generator runs.
+    """
+
+    def __init__(self, timeout_key, concurrency_key, queue_timeout_key):
+        self.timeout_key = timeout_key
+        self.concurrency_key = concurrency_key
+        self.queue_timeout_key = queue_timeout_key
+        self._slots = None
+        self._lock = threading.Lock()
+
+    def _semaphore(self):
+        with self._lock:
+            if self._slots is None:
+                self._slots = threading.BoundedSemaphore(current_app.config[self.concurrency_key])
+            return self._slots
+
+    def _apply_timeout(self):
+        from app import db
+        if db.engine.dialect.name == 'postgresql':
+            timeout = int(current_app.config[self.timeout_key])
+            db.session.execute(db.text(f"SET LOCAL statement_timeout = {timeout}"))
+
+    @staticmethod
+    def _is_cancel(error):
+        return getattr(error.orig, 'pgcode', None) == QUERY_CANCELED
+
+    def __call__(self, f):
+        @wraps(f)
+        def decorated(*args, **kwargs):
+            from app import db
+            slots = self._semaphore()
+            if not slots.acquire(timeout=current_app.config[self.queue_timeout_key]):
+                return jsonify({'message': 'Server is busy with other reports, please retry shortly'}), 503
+            release = True
+            try:
+                self._apply_timeout()
+                response = f(*args, **kwargs)
+                if isinstance(response, Response) and response.is_streamed:
+                    # The body still queries after the view returns
+                    response.call_on_close(slots.release)
+                    release = False
+                return response
+            except OperationalError as e:
+                if not self._is_cancel(e):
+                    raise
+                db.session.rollback()
+                logging.warning(f"{f.__name__} exceeded its statement timeout")
+                return jsonify({'message': 'Report query timed out, try a narrower date range'}), 503
+            finally:
+                if release:
+                    slots.release()
+        return decorated
+
+    def stream(self, chunks):
+        """
+        Run a response body generator under the statement timeout.
+
+        The timeout is set again in the transaction the generator queries
+        in. The status line has gone out by the time a statement is
+        cancelled mid-stream, so the body just ends early and the
+        cancellation is logged.
+        """
+        from app import db
+
+        def generate():
+            self._apply_timeout()
+            try:
+                yield from chunks
+            except OperationalError as e:
+                if not self._is_cancel(e):
+                    raise
+                db.session.rollback()
+                logging.warning("Streamed report exceeded its statement timeout; response truncated")
+        return generate()
+
+
+report_budget = QueryBudget('REPORT_STATEMENT_TIMEOUT_MS', 'REPORT_MAX_CONCURRENT_QUERIES', 'REPORT_QUEUE_TIMEOUT')
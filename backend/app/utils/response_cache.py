@@ -0,0 +1,170 @@
+from collections import OrderedDict
+from functools import wraps
+from flask import current_app, make_response, request
+from sqlalchemy.dialects import postgresql, sqlite
+import hashlib
+import logging
+import threading
+import time
+
+
+class ResponseCache:
+    """
+    ETag/304 cache for read-heavy GET endpoints, keyed on per-table versions.
+
+    Each cached view declares the tables its response is built from. Write
+    routes call bump(table, ...) after committing; that increments the
+    table's row in cache_versions (shared by every worker process) and
+    drops this process' copy of the versions. Versions are otherwise
+    re-read at most every `ttl` seconds, so within a process a hit costs no
+    query at all.
+
+    The ETag is derived from the request path and the table versions, so
+    it is known before the view runs: a matching If-None-Match returns 304
+    straight away, and an unchanged response is served from the stored
+    body without querying or serializing.
+    """
+
+    def __init__(self, max_size=256, ttl=5):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._versions = {}
+        self._checked_at = 0.0
+        self._generation = 0
+        self._listeners = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.not_modified = 0
+        self.misses = 0
+
+    def init_app(self, app):
+        self.max_size = app.config.get('RESPONSE_CACHE_SIZE', self.max_size)
+        self.ttl = app.config.get('RESPONSE_CACHE_TTL', self.ttl)
+
+    def _current_versions(self):
+        now = time.monotonic()
+        if now - self._checked_at < self.ttl:
+            return self._versions
+        from app import db
+        from app.models import CacheVersion
+        generation = self._generation
+        versions = dict(db.session.query(CacheVersion.table_name, CacheVersion.version).all())
+        with self._lock:
+            # Don't let a read that raced a local bump() hide that bump for a whole ttl
+            if generation == self._generation:
+                self._versions = versions
+                self._checked_at = now
+        return versions
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._versions = {}
+            self._checked_at = 0.0
+
+    def listen(self, table, callback):
+        """Call callback(version) with the new version after each local bump of table."""
+        self._listeners.setdefault(table, []).append(callback)
+
+    def version(self, table):
+        """The shared version of one table as of the last check (at most ttl old)."""
+        return self._current_versions().get(table, 0)
+
+    def current_version(self, table):
+        """The shared version of one table, read now rather than through the ttl."""
+        from app import db
+        from app.models import CacheVersion
+        version = db.session.query(CacheVersion.version).filter(CacheVersion.table_name == table).scalar()
+        return version or 0
+
+    def bump(self, *tables):
+        """Mark tables as changed. Call after the write has been committed."""
+        from app import db
+        from app.models import CacheVersion
+
+        dialect = db.engine.dialect.name
+        if dialect == 'postgresql':
+            stmt = postgresql.insert(CacheVersion)
+        elif dialect == 'sqlite':
+            stmt = sqlite.insert(CacheVersion)
+        else:
+            raise NotImplementedError(f"Response cache versions are not supported on {dialect}")
+
+        stmt = stmt.values([{'table_name': table, 'version': 1} for table in tables])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['table_name'],
+            set_={'version': CacheVersion.version + 1}
+        ).returning(CacheVersion.table_name, CacheVersion.version)
+        versions = {}
+        try:
+            versions = dict(db.session.execute(stmt).all())
+            db.session.commit()
+        except Exception as e:
+            # The data change itself is already committed; at worst other
+            # workers serve the old response until the next bump.
+            db.session.rollback()
+            logging.error(f"Failed to bump cache versions for {tables}: {e}")
+        with self._lock:
+            self._generation += 1
+            self._checked_at = 0.0
+        for table, version in versions.items():
+            for callback in self._listeners.get(table, []):
+                callback(version)
+
+    def cached(self, *tables):
+        """Decorator for a GET view whose response depends only on `tables` and the URL."""
+        def decorator(f):
+            @wraps(f)
+            def decorated(*args, **kwargs):
+                versions = self._current_versions()
+                key = request.full_path
+                stamp = tuple(versions.get(table, 0) for table in tables)
+                etag = hashlib.sha1(f"{key}|{tables}|{stamp}".encode()).hexdigest()
+
+                if request.if_none_match.contains_weak(etag):
+                    self.not_modified += 1
+                    response = current_app.response_class(status=304)
+                    return self._finish(response, etag)
+
+                with self._lock:
+                    entry = self._entries.get(key)
+                    if entry and entry[0] == etag:
+                        self._entries.move_to_end(key)
+                        self.hits += 1
+                        response = current_app.response_class(entry[1], mimetype=entry[2])
+                        return self._finish(response, etag)
+
+                self.misses += 1
+                response = make_response(f(*args, **kwargs))
+                if response.status_code == 200 and self.max_size > 0:
+                    with self._lock:
+                        self._entries[key] = (etag, response.get_data(), response.mimetype)
+                        self._entries.move_to_end(key)
+                        while len(self._entries) > self.max_size:
+                            self._entries.popitem(last=False)
+                    self._finish(response, etag)
+                return response
+            return decorated
+        return decorator
+
+    @staticmethod
+    def _finish(response, etag):
+        response.set_etag(etag)
+        # Authenticated data: browsers may keep it but must revalidate each time
+        response.headers['Cache-Control'] = 'private, no-cache'
+        return response
+
+    def stats(self):
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'not_modified': self.not_modified,
+                'misses': self.misses
+            }
+
+
+response_cache = ResponseCache()
@@ -0,0 +1,62 @@
+import threading
+import time
+
+
+class SettingsCache:
+    """
+    Process-wide snapshot of the settings table.
+
+    The snapshot is loaded once and replaced when update_settings commits
+    (invalidate()). To pick up changes made by other worker processes it is
+    revalidated at most every `ttl` seconds against the max(updated_at)
+    watermark; in between, reads cost no queries.
+    """
+
+    def __init__(self, ttl=30):
+        self.ttl = ttl
+        self._values = None
+        self._watermark = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.ttl = app.config.get('SETTINGS_CACHE_TTL', self.ttl)
+
+    def _current_watermark(self):
+        from app import db
+        from app.models import Setting
+        return db.session.query(db.func.max(Setting.updated_at), db.func.count(Setting.id)).one()
+
+    def _load(self):
+        from app.models import Setting
+        watermark = self._current_watermark()
+        self._values = {s.key: s.value for s in Setting.query.all()}
+        self._watermark = watermark
+        self._checked_at = time.monotonic()
+
+    def _snapshot(self):
+        values = self._values
+        if values is not None and time.monotonic() - self._checked_at < self.ttl:
+            return values
+        with self._lock:
+            if self._values is None:
+                self._load()
+            elif time.monotonic() - self._checked_at >= self.ttl:
+                if self._current_watermark() != self._watermark:
+                    self._load()
+                else:
+                    self._checked_at = time.monotonic()
+            return self._values
+
+    def get(self, key, default=None):
+        return self._snapshot().get(key, default)
+
+    def all(self):
+        return dict(self._snapshot())
+
+    def invalidate(self):
+        with self._lock:
+            self._values = None
+
+
+settings_cache = SettingsCache()
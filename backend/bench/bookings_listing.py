@@ -0,0 +1,130 @@
+"""
+Benchmark of GET /api/bookings as the number of bookings grows.
+
+Seeds a throwaway SQLite database with N bookings (spread over N/10 users
+and N/20 cars) and reports, per N, the queries and wall time for the first
+page and for walking every page via next_cursor. --lazy replays the same
+requests with per-row relationship loading, i.e. the listing before it
+eager-loaded users and cars.
+
+    python bench/bookings_listing.py 1000 5000 20000
+    python bench/bookings_listing.py --lazy 1000 5000 20000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SCHEDULER_AUTOSTART', 'false')
+
+import jwt
+from flask_migrate import upgrade
+from sqlalchemy import event, insert
+from sqlalchemy.orm import lazyload
+
+from app import create_app, db
+from app.config import Config
+from app.models import Booking, Car, User
+from app.routes import bookings as bookings_routes
+
+MIGRATIONS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'migrations')
+PAGE = 500
+REPEAT = 5
+
+
+def make_app(path):
+    class BenchConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{path}'
+        SCHEDULER_AUTOSTART = False
+        RESPONSE_CACHE_TTL = 0
+    app = create_app(BenchConfig)
+    with app.app_context():
+        upgrade(directory=MIGRATIONS)
+    return app
+
+
+def seed(app, n):
+    with app.app_context():
+        db.session.execute(insert(User), [
+            {'email': f'driver{i}@example.com', 'password_hash': '-', 'full_name': f'Driver {i}', 'role': 'user'}
+            for i in range(max(n // 10, 1))
+        ] + [{'email': 'admin@example.com', 'password_hash': '-', 'full_name': 'Admin', 'role': 'admin'}])
+        db.session.execute(insert(Car), [
+            {'license_plate': f'BENCH-{i:05d}', 'brand': 'Toyota', 'model': 'Vios', 'status': 'available'}
+            for i in range(max(n // 20, 1))
+        ])
+        users = db.session.scalars(db.select(User.id).filter(User.role == 'user')).all()
+        cars = db.session.scalars(db.select(Car.id)).all()
+        start = datetime(2030, 1, 1)
+        db.session.execute(insert(Booking), [
+            {
+                'user_id': users[i % len(users)],
+                'car_id': cars[i % len(cars)],
+                'start_time': start + timedelta(hours=3 * i),
+                'end_time': start + timedelta(hours=3 * i + 2),
+                'status': 'completed',
+                'created_at': start + timedelta(seconds=i)
+            }
+            for i in range(n)
+        ])
+        db.session.commit()
+        admin = User.query.filter_by(role='admin').one()
+        token = jwt.encode({'user_id': admin.id, 'role': admin.role, 'exp': datetime.utcnow() + timedelta(hours=1)},
+                           app.config['SECRET_KEY'], algorithm='HS256')
+        return {'Authorization': f'Bearer {token}'}
+
+
+def measure(app, headers, walk):
+    """(queries, seconds) for the first page, or for every page if walk."""
+    client = app.test_client()
+    queries = 0
+
+    def count(*args):
+        nonlocal queries
+        queries += 1
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', count)
+    began = time.perf_counter()
+    try:
+        cursor = None
+        while True:
+            url = f'/api/bookings/?limit={PAGE}' + (f'&cursor={cursor}' if cursor else '')
+            response = client.get(url, headers=headers)
+            assert response.status_code == 200, response.json
+            cursor = response.json['next_cursor']
+            if not walk or not cursor:
+                break
+    finally:
+        event.remove(engine, 'before_cursor_execute', count)
+    return queries, time.perf_counter() - began
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('sizes', nargs='*', type=int, default=[1000, 5000, 20000])
+    parser.add_argument('--lazy', action='store_true', help='load users/cars per row (the old behaviour)')
+    args = parser.parse_args()
+    if args.lazy:
+        bookings_routes.joinedload = lazyload
+
+    print(f"{'bookings':>9} {'page queries':>13} {'page ms':>9} {'all queries':>12} {'all ms':>9}")
+    for n in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            app = make_app(os.path.join(tmp, 'bench.db'))
+            headers = seed(app, n)
+            measure(app, headers, walk=False)  # warm up
+            page = [measure(app, headers, walk=False) for _ in range(REPEAT)]
+            page_queries, page_seconds = page[0][0], min(seconds for _, seconds in page)
+            all_queries, all_seconds = measure(app, headers, walk=True)
+            with app.app_context():
+                db.engine.dispose()
+        print(f"{n:>9} {page_queries:>13} {page_seconds * 1000:>9.1f} {all_queries:>12} {all_seconds * 1000:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
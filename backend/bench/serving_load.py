@@ -0,0 +1,141 @@
+"""
+Load test of the production gunicorn profile against the Flask dev server.
+
+Seeds a throwaway SQLite database, starts each server on it in turn and
+has --clients threads request a mix of read endpoints (bookings listing,
+cars, available cars) for --duration seconds, then reports throughput and
+latency percentiles per server.
+
+    python bench/serving_load.py --clients 32 --duration 20
+    python bench/serving_load.py --workers 4 --threads 8 --servers gunicorn
+"""
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND)
+os.environ.setdefault('SCHEDULER_AUTOSTART', 'false')
+
+from bookings_listing import make_app, seed
+
+PATHS = [
+    '/api/bookings/?limit=50',
+    '/api/cars/',
+    '/api/bookings/available-cars?start_time=2030-06-01T09:00:00Z&end_time=2030-06-01T17:00:00Z',
+]
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def server_command(name, port, args):
+    if name == 'gunicorn':
+        return [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'wsgi:app',
+                '--bind', f'127.0.0.1:{port}', '--workers', str(args.workers),
+                '--threads', str(args.threads), '--access-logfile', '/dev/null']
+    # What the Dockerfile used to run
+    return [sys.executable, '-m', 'flask', '--app', 'app.py', 'run', '--port', str(port)]
+
+
+def wait_until_up(base, process, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f'Server exited with {process.returncode}')
+        try:
+            urllib.request.urlopen(base + '/api/cars/', timeout=1)
+        except urllib.error.HTTPError:
+            return  # 401 without a token: it's serving
+        except OSError:
+            time.sleep(0.2)
+            continue
+        return
+    raise RuntimeError('Server did not come up')
+
+
+def run_load(base, headers, clients, duration):
+    latencies, errors = [], []
+    lock = threading.Lock()
+    stop = time.monotonic() + duration
+
+    def client(offset):
+        own, failed = [], 0
+        i = offset
+        while time.monotonic() < stop:
+            request = urllib.request.Request(base + PATHS[i % len(PATHS)], headers=headers)
+            began = time.perf_counter()
+            try:
+                with urllib.request.urlopen(request, timeout=30) as response:
+                    response.read()
+                own.append(time.perf_counter() - began)
+            except OSError:
+                failed += 1
+            i += 1
+        with lock:
+            latencies.extend(own)
+            errors.append(failed)
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sorted(latencies), sum(errors)
+
+
+def percentile(values, p):
+    return values[min(len(values) - 1, int(len(values) * p))] * 1000 if values else float('nan')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--servers', nargs='+', default=['flask', 'gunicorn'], choices=['flask', 'gunicorn'])
+    parser.add_argument('--clients', type=int, default=32)
+    parser.add_argument('--duration', type=float, default=20)
+    parser.add_argument('--bookings', type=int, default=5000)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() * 2 + 1)
+    parser.add_argument('--threads', type=int, default=8)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database = os.path.join(tmp, 'load.db')
+        app = make_app(database)
+        headers = seed(app, args.bookings)
+        env = dict(
+            os.environ,
+            DATABASE_URL=f'sqlite:///{database}',
+            SECRET_KEY=app.config['SECRET_KEY'],
+            SCHEDULER_LOCK_FILE=os.path.join(tmp, 'scheduler.lock'),
+        )
+
+        print(f"{'server':>9} {'requests':>9} {'errors':>7} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+        for name in args.servers:
+            port = free_port()
+            base = f'http://127.0.0.1:{port}'
+            process = subprocess.Popen(server_command(name, port, args), cwd=BACKEND, env=env,
+                                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            try:
+                wait_until_up(base, process)
+                run_load(base, headers, args.clients, min(args.duration, 3))  # warm up
+                latencies, errors = run_load(base, headers, args.clients, args.duration)
+            finally:
+                process.terminate()
+                process.wait(timeout=30)
+            print(f"{name:>9} {len(latencies):>9} {errors:>7} {len(latencies) / args.duration:>8.1f} "
+                  f"{percentile(latencies, 0.5):>8.1f} {percentile(latencies, 0.95):>8.1f} "
+                  f"{percentile(latencies, 0.99):>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,36 @@
+# Production serving profile: gunicorn -c gunicorn.conf.py wsgi:app
+import multiprocessing
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:5000')
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+# Threaded workers: requests are mostly DB-bound. Each open notification
+# stream (SSE) holds an otherwise idle thread for as long as it is connected,
+# so every worker gets NOTIFICATION_STREAM_MAX threads for streams on top of
+# GUNICORN_THREADS for regular requests; streams past the cap get 503 and poll.
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 8)) + int(os.environ.get('NOTIFICATION_STREAM_MAX', 100))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 60))
+keepalive = 5
+# Recycle workers now and then so slow leaks can't accumulate
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 5000))
+max_requests_jitter = 500
+
+# Import the app once in the master and fork it into the workers
+preload_app = True
+accesslog = '-'
+
+# The master must not start the scheduler's threads before forking;
+# post_fork starts it per worker and leader election keeps one running.
+os.environ.setdefault('SCHEDULER_AUTOSTART', 'false')
+
+
+def post_fork(server, worker):
+    from app import db
+    from app.services.scheduler import start_scheduler
+
+    flask_app = server.app.wsgi()
+    with flask_app.app_context():
+        # Never share pooled connections inherited from the master
+        db.engine.dispose(close=False)
+    start_scheduler(flask_app)
@@ -0,0 +1,54 @@
+"""Add exclusion constraint against overlapping active bookings (PostgreSQL)
+
+Revision ID: 3e9b1f6c4a25
+Revises: 2d5a7c3e8f14
+Create Date: 2026-10-17 21:03:27.185402
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3e9b1f6c4a25'
+down_revision = '2d5a7c3e8f14'
+branch_labels = None
+depends_on = None
+
+# Kept in sync with app.models.ACTIVE_BOOKING_STATUSES
+ACTIVE_BOOKING_STATUS_SQL = "status IN ('pending', 'approved', 'picked_up')"
+
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        # SQLite relies on BookingGuard's write lock; there is no exclusion constraint
+        return
+
+    conflicts = bind.execute(sa.text(
+        "SELECT a.id, b.id FROM bookings a JOIN bookings b "
+        "ON a.car_id = b.car_id AND a.id < b.id "
+        "AND a.start_time < b.end_time AND a.end_time > b.start_time "
+        f"WHERE a.{ACTIVE_BOOKING_STATUS_SQL} AND b.{ACTIVE_BOOKING_STATUS_SQL}"
+    )).fetchall()
+    if conflicts:
+        pairs = ', '.join(f"{a}/{b}" for a, b in conflicts[:20])
+        raise RuntimeError(
+            f"Cannot add booking exclusion constraint: {len(conflicts)} overlapping active booking "
+            f"pairs exist (e.g. {pairs}). Cancel or reschedule them and re-run the migration."
+        )
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    # Columns hold naive UTC timestamps, hence tsrange; '[)' bounds let one
+    # booking start exactly when the previous one ends.
+    op.execute(
+        "ALTER TABLE bookings ADD CONSTRAINT ex_bookings_car_no_overlap "
+        "EXCLUDE USING gist (car_id WITH =, tsrange(start_time, end_time, '[)') WITH &&) "
+        f"WHERE ({ACTIVE_BOOKING_STATUS_SQL})"
+    )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("ALTER TABLE bookings DROP CONSTRAINT IF EXISTS ex_bookings_car_no_overlap")
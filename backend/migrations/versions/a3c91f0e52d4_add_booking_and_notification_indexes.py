@@ -0,0 +1,44 @@
+"""Add booking and notification indexes
+
+Revision ID: a3c91f0e52d4
+Revises: 377604aaa128
+Create Date: 2026-10-17 09:12:31.104522
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3c91f0e52d4'
+down_revision = '377604aaa128'
+branch_labels = None
+depends_on = None
+
+ACTIVE_BOOKING_STATUS_SQL = "status IN ('pending', 'approved', 'picked_up')"
+
+
+def upgrade():
+    with op.batch_alter_table('bookings', schema=None) as batch_op:
+        batch_op.create_index('ix_bookings_car_active_period', ['car_id', 'start_time', 'end_time'], unique=False,
+                              postgresql_where=sa.text(ACTIVE_BOOKING_STATUS_SQL),
+                              sqlite_where=sa.text(ACTIVE_BOOKING_STATUS_SQL))
+        batch_op.create_index('ix_bookings_active_period', ['start_time', 'end_time', 'car_id'], unique=False,
+                              postgresql_where=sa.text(ACTIVE_BOOKING_STATUS_SQL),
+                              sqlite_where=sa.text(ACTIVE_BOOKING_STATUS_SQL))
+        batch_op.create_index('ix_bookings_user_created', ['user_id', 'created_at'], unique=False)
+        batch_op.create_index('ix_bookings_created_id', ['created_at', 'id'], unique=False)
+
+    with op.batch_alter_table('notifications', schema=None) as batch_op:
+        batch_op.create_index('ix_notifications_user_read_created', ['user_id', 'is_read', 'created_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('notifications', schema=None) as batch_op:
+        batch_op.drop_index('ix_notifications_user_read_created')
+
+    with op.batch_alter_table('bookings', schema=None) as batch_op:
+        batch_op.drop_index('ix_bookings_created_id')
+        batch_op.drop_index('ix_bookings_user_created')
+        batch_op.drop_index('ix_bookings_active_period')
+        batch_op.drop_index('ix_bookings_car_active_period')
@@ -31,6 +31,7 @@ def seed_data():
             {'key': 'smtp_port', 'value': '587', 'description': 'SMTP Server Port'},
             {'key': 'smtp_user', 'value': '', 'description': 'SMTP Username'},
             {'key': 'smtp_pass', 'value': '', 'description': 'SMTP Password'},
+            {'key': 'smtp_use_tls', 'value': 'true', 'description': 'Use STARTTLS for SMTP'},
         ]
         
         for s in default_settings:
@@ -0,0 +1,109 @@
+import os
+import sys
+from datetime import datetime, timedelta
+
+import jwt
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app, db
+from app.config import Config
+
+MIGRATIONS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'migrations')
+
+# PostgreSQL-only tests (exclusion constraint, planner checks) run when
+# TEST_DATABASE_URL points at a scratch database; its schema is dropped.
+TEST_DATABASE_URL = os.environ.get('TEST_DATABASE_URL')
+requires_postgres = pytest.mark.skipif(
+    not (TEST_DATABASE_URL or '').startswith('postgresql'),
+    reason='TEST_DATABASE_URL is not a PostgreSQL database'
+)
+
+
+def _make_config(uri):
+    class TestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = uri
+        TESTING = True
+        SCHEDULER_AUTOSTART = False
+        RESPONSE_CACHE_TTL = 0
+    return TestConfig
+
+
+def _reset_postgres(uri):
+    import sqlalchemy as sa
+    engine = sa.create_engine(uri)
+    with engine.begin() as conn:
+        conn.execute(sa.text('DROP SCHEMA public CASCADE'))
+        conn.execute(sa.text('CREATE SCHEMA public'))
+    engine.dispose()
+
+
+@pytest.fixture
+def app(tmp_path):
+    """App on a migrated database: a temp SQLite file, or TEST_DATABASE_URL."""
+    from flask_migrate import upgrade
+    from app.services.booking_index import booking_index
+    from app.utils.response_cache import response_cache
+    from app.utils.settings_cache import settings_cache
+    from app.utils.user_cache import user_cache
+
+    uri = TEST_DATABASE_URL or f"sqlite:///{tmp_path / 'test.db'}"
+    if uri.startswith('postgresql'):
+        _reset_postgres(uri)
+    app = create_app(_make_config(uri))
+    with app.app_context():
+        upgrade(directory=MIGRATIONS)
+        # Process-wide caches outlive the app; start each test empty
+        booking_index.__init__()
+        response_cache.clear()
+        settings_cache.invalidate()
+        user_cache.clear()
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+def make_user(email, role='user'):
+    from app.models import User
+    user = User(email=email, full_name=email.split('@')[0].title(), role=role, phone_number='0800000000')
+    user.set_password('secret')
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def make_car(plate, **values):
+    from app.models import Car
+    car = Car(license_plate=plate, brand='Toyota', model='Vios', current_mileage=0,
+              last_maintenance_mileage=0, **values)
+    db.session.add(car)
+    db.session.commit()
+    return car
+
+
+def auth_headers(app, user):
+    token = jwt.encode(
+        {'user_id': user.id, 'role': user.role, 'exp': datetime.utcnow() + timedelta(hours=1)},
+        app.config['SECRET_KEY'], algorithm='HS256'
+    )
+    return {'Authorization': f'Bearer {token}'}
+
+
+def iso(value):
+    return value.isoformat() + 'Z'
+
+
+@pytest.fixture
+def admin(app):
+    return make_user('admin@example.com', role='admin')
+
+
+@pytest.fixture
+def user(app):
+    return make_user('user@example.com')
@@ -0,0 +1,74 @@
+import base64
+from datetime import datetime, timedelta
+
+import pytest
+
+from app import db
+from app.models import Booking
+from app.services.booking_guard import BookingGuard
+from conftest import auth_headers, iso, make_car
+
+WINDOW_START = datetime(2030, 1, 7, 8)
+WINDOW_END = datetime(2030, 1, 7, 14)
+SLOT = 30
+
+
+def _at(hour, minute=0):
+    return datetime(2030, 1, 7, hour, minute)
+
+
+def _book(user, car, start, end, status='approved'):
+    db.session.add(Booking(user_id=user.id, car_id=car.id, start_time=start, end_time=end, status=status))
+
+
+def _decode(busy, encoding, slots):
+    if encoding == 'runs':
+        row = [False] * slots
+        for start, length in busy:
+            row[start:start + length] = [True] * length
+        return row
+    bits = ''.join(f'{byte:08b}' for byte in base64.b64decode(busy))
+    return [bit == '1' for bit in bits[:slots]]
+
+
+@pytest.mark.parametrize('encoding', ['runs', 'bitmap'])
+def test_matrix_matches_per_car_overlap_checks(app, client, user, encoding):
+    booked = make_car('4AB-001')
+    in_maintenance = make_car('4AB-002', status='maintenance')
+    free = make_car('4AB-003')
+    # Touching intervals: each only fills its own slots
+    _book(user, booked, _at(9), _at(10))
+    _book(user, booked, _at(10), _at(10, 30))
+    # Inactive bookings never make a slot busy
+    _book(user, booked, _at(11), _at(12), status='cancelled')
+    _book(user, booked, _at(12), _at(12, 30), status='rejected')
+    _book(user, booked, _at(12, 30), _at(13), status='completed')
+    # Clipped at both ends of the window
+    _book(user, booked, _at(7), _at(8, 15))
+    _book(user, booked, _at(13, 45), _at(16))
+    # Mid-slot booking on a car that is also in maintenance
+    _book(user, in_maintenance, _at(8, 40), _at(8, 50), status='pending')
+    db.session.commit()
+
+    response = client.get(
+        f'/api/bookings/availability-matrix?start_time={iso(WINDOW_START)}&end_time={iso(WINDOW_END)}'
+        f'&slot_minutes={SLOT}&encoding={encoding}',
+        headers=auth_headers(app, user)
+    )
+    assert response.status_code == 200
+    slots = response.json['slots']
+    assert slots == 12
+    rows = {car['id']: car for car in response.json['cars']}
+    assert rows[in_maintenance.id]['status'] == 'maintenance'
+
+    for car in (booked, in_maintenance, free):
+        expected = []
+        for i in range(slots):
+            slot_start = WINDOW_START + timedelta(minutes=SLOT * i)
+            expected.append(BookingGuard.find_conflict(car.id, slot_start, slot_start + timedelta(minutes=SLOT)) is not None)
+        assert _decode(rows[car.id]['busy'], encoding, slots) == expected, car.license_plate
+
+    busy_slots = [i for i, busy in enumerate(_decode(rows[booked.id]['busy'], encoding, slots)) if busy]
+    # 08:00 (clipped start), 09:00-10:30 (touching), 13:30 (clipped end)
+    assert busy_slots == [0, 2, 3, 4, 11]
+    assert not any(_decode(rows[free.id]['busy'], encoding, slots))
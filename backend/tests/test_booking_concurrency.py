@@ -0,0 +1,57 @@
+import threading
+from datetime import datetime, timedelta
+
+from app.models import Booking
+from app.services.booking_guard import BookingGuard
+from app.services.booking_index import booking_index
+from conftest import auth_headers, iso, make_car, make_user, requires_postgres
+
+START = datetime(2030, 1, 7, 9)
+THREADS = 12
+
+
+def test_concurrent_overlapping_requests_book_the_car_once(app, client, monkeypatch):
+    # Every request starts within the others' windows. The in-memory index
+    # is bypassed, as it would be on other workers, so the database decides.
+    monkeypatch.setattr(booking_index, 'find_overlap', lambda *args: None)
+    car_id = make_car('1AB-301').id
+    requests = [
+        (auth_headers(app, make_user(f'racer{i}@example.com')), START + timedelta(minutes=10 * i))
+        for i in range(THREADS)
+    ]
+    barrier = threading.Barrier(THREADS)
+    statuses = []
+
+    def book(headers, start):
+        with app.test_client() as own_client:
+            barrier.wait()
+            response = own_client.post('/api/bookings/', headers=headers, json={
+                'car_id': car_id, 'start_time': iso(start), 'end_time': iso(start + timedelta(hours=2))
+            })
+            statuses.append(response.status_code)
+
+    threads = [threading.Thread(target=book, args=request) for request in requests]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(statuses) == [201] + [400] * (THREADS - 1)
+    assert Booking.query.filter(Booking.car_id == car_id, Booking.is_active()).count() == 1
+
+
+@requires_postgres
+def test_exclusion_constraint_conflict_is_a_400(app, client, user, monkeypatch):
+    car = make_car('1AB-302')
+    headers = auth_headers(app, user)
+    body = {'car_id': car.id, 'start_time': iso(START), 'end_time': iso(START + timedelta(hours=2))}
+    assert client.post('/api/bookings/', headers=headers, json=body).status_code == 201
+
+    # Skip both application-level checks so only the constraint is left
+    monkeypatch.setattr(booking_index, 'find_overlap', lambda *args: None)
+    monkeypatch.setattr(BookingGuard, 'find_conflict', staticmethod(lambda *args, **kwargs: None))
+    body['start_time'] = iso(START + timedelta(hours=1))
+    response = client.post('/api/bookings/', headers=headers, json=body)
+    assert response.status_code == 400
+    assert response.json['message'] == 'Car is already booked for this period'
+    assert Booking.query.filter(Booking.car_id == car.id).count() == 1
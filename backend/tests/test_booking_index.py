@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app import db
+from app.services.booking_index import BookingIntervalIndex, booking_index
+from app.utils.response_cache import response_cache
+from conftest import auth_headers, iso, make_car
+
+START = datetime(2030, 1, 7, 9)
+
+
+def _available(client, headers, start, end):
+    response = client.get(f'/api/bookings/available-cars?start_time={iso(start)}&end_time={iso(end)}', headers=headers)
+    assert response.status_code == 200
+    return {car['id'] for car in response.json['cars']}
+
+
+def test_other_worker_sees_bookings_and_cancellations(app, client, admin, user):
+    # A second index stands in for another gunicorn worker's copy: it gets
+    # no sync() calls and no bump callbacks, only the shared version.
+    other_worker = BookingIntervalIndex()
+    car = make_car('1AB-001')
+    end = START + timedelta(hours=2)
+    assert other_worker.busy_car_ids(START, end) == set()
+
+    response = client.post('/api/bookings/', headers=auth_headers(app, user), json={
+        'car_id': car.id, 'start_time': iso(START), 'end_time': iso(end)
+    })
+    assert response.status_code == 201
+    assert other_worker.busy_car_ids(START, end) == {car.id}
+
+    response = client.put(f"/api/bookings/{response.json['id']}/status",
+                          headers=auth_headers(app, admin), json={'status': 'cancelled'})
+    assert response.status_code == 200
+    assert other_worker.busy_car_ids(START, end) == set()
+    assert other_worker.find_overlap(car.id, START, end) is None
+
+
+def test_own_writes_do_not_force_rebuilds(app, client, user):
+    car = make_car('1AB-002')
+    headers = auth_headers(app, user)
+    assert _available(client, headers, START, START + timedelta(hours=1)) == {car.id}
+    rebuilds = booking_index.rebuilds
+
+    for day in range(3):
+        start = START + timedelta(days=day)
+        response = client.post('/api/bookings/', headers=headers, json={
+            'car_id': car.id, 'start_time': iso(start), 'end_time': iso(start + timedelta(hours=1))
+        })
+        assert response.status_code == 201
+        assert _available(client, headers, start, start + timedelta(hours=1)) == set()
+
+    assert booking_index.rebuilds == rebuilds
+
+
+
+def test_lookups_within_the_ttl_cost_no_query(app, monkeypatch):
+    monkeypatch.setattr(response_cache, 'ttl', 60)
+    car = make_car('1AB-003')
+    end = START + timedelta(hours=1)
+    booking_index.find_overlap(car.id, START, end)
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', record)
+    try:
+        for _ in range(10):
+            booking_index.find_overlap(car.id, START, end)
+            booking_index.busy_car_ids(START, end)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', record)
+    assert statements == []
+
+
+def test_string_car_id_takes_the_index_fast_path(app, client, user, monkeypatch):
+    car = make_car('1AB-004')
+    headers = auth_headers(app, user)
+    body = {'car_id': str(car.id), 'start_time': iso(START), 'end_time': iso(START + timedelta(hours=1))}
+    assert client.post('/api/bookings/', headers=headers, json=body).status_code == 201
+
+    # A conflict must be caught by the index, before the car is locked
+    monkeypatch.setattr('app.routes.bookings.BookingGuard.lock_car', lambda car_id: pytest.fail('reached the DB check'))
+    response = client.post('/api/bookings/', headers=headers, json=body)
+    assert response.status_code == 400
+    assert 'already booked' in response.json['message']
+
+    body['car_id'] = 'three'
+    assert client.post('/api/bookings/', headers=headers, json=body).status_code == 400
@@ -0,0 +1,134 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event, insert
+
+from app import db
+from app.models import Booking, Car, User
+from conftest import auth_headers
+
+
+STATUSES = ['pending', 'approved', 'completed', 'cancelled']
+
+
+def _seed(n_users, n_cars, n_bookings, ties=1):
+    """Bookings round-robin over users, cars and STATUSES; `ties` share each created_at."""
+    # Bulk inserts: nobody logs in as these users, so skip password hashing
+    db.session.execute(insert(User), [
+        {'email': f'driver{i}@example.com', 'password_hash': '-', 'full_name': f'Driver {i}', 'role': 'user'}
+        for i in range(n_users)
+    ])
+    db.session.execute(insert(Car), [
+        {'license_plate': f'2AB-{i:03d}', 'brand': 'Toyota', 'model': 'Vios', 'status': 'available'}
+        for i in range(n_cars)
+    ])
+    users = db.session.scalars(db.select(User.id).filter(User.email.like('driver%'))).all()
+    cars = db.session.scalars(db.select(Car.id)).all()
+    start = datetime(2030, 1, 1)
+    db.session.execute(insert(Booking), [
+        {
+            'user_id': users[i % n_users],
+            'car_id': cars[i % n_cars],
+            'start_time': start + timedelta(days=i),
+            'end_time': start + timedelta(days=i, hours=2),
+            'status': STATUSES[i % len(STATUSES)],
+            'created_at': start + timedelta(minutes=i // ties)
+        }
+        for i in range(n_bookings)
+    ])
+    db.session.commit()
+
+
+def _count_queries(request):
+    statements = []
+
+    def count(*args):
+        statements.append(args[2])
+
+    event.listen(db.engine, 'before_cursor_execute', count)
+    try:
+        response = request()
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', count)
+    assert response.status_code == 200
+    return response, len(statements)
+
+
+@pytest.mark.parametrize('fields', [None, 'user_name,car_license'])
+def test_listing_costs_the_same_number_of_queries_for_any_page_size(app, client, admin, fields):
+    _seed(n_users=40, n_cars=25, n_bookings=200)
+    headers = auth_headers(app, admin)
+    url = '/api/bookings/?limit={}' + (f'&fields={fields}' if fields else '')
+
+    small, small_queries = _count_queries(lambda: client.get(url.format(5), headers=headers))
+    large, large_queries = _count_queries(lambda: client.get(url.format(200), headers=headers))
+
+    assert len(small.json['bookings']) == 5
+    assert len(large.json['bookings']) == 200
+    assert large_queries == small_queries
+    assert all(b['user_name'] and b['car_license'] for b in large.json['bookings'])
+
+
+@pytest.mark.parametrize('query', ['user_id=abc', 'car_id=1.5', 'car_id=x'])
+def test_non_integer_id_filters_get_400(app, client, admin, query):
+    response = client.get(f'/api/bookings/?{query}', headers=auth_headers(app, admin))
+    assert response.status_code == 400
+
+
+def _walk(client, headers, query=''):
+    ids, cursor, pages = [], None, 0
+    while True:
+        url = f'/api/bookings/?limit=7{query}' + (f'&cursor={cursor}' if cursor else '')
+        response = client.get(url, headers=headers)
+        assert response.status_code == 200
+        ids += [b['id'] for b in response.json['bookings']]
+        cursor = response.json['next_cursor']
+        pages += 1
+        if not cursor:
+            return ids, pages
+
+
+def test_cursor_walk_visits_every_booking_once_despite_tied_created_at(app, client, admin):
+    _seed(n_users=4, n_cars=3, n_bookings=50, ties=5)
+    ids, pages = _walk(client, auth_headers(app, admin))
+
+    expected = [b.id for b in Booking.query.order_by(Booking.created_at.desc(), Booking.id.desc())]
+    assert ids == expected
+    assert len(set(ids)) == 50
+    assert pages == 8
+
+
+def test_filters_apply_across_pages(app, client, admin):
+    _seed(n_users=4, n_cars=3, n_bookings=50, ties=5)
+    headers = auth_headers(app, admin)
+    user_id, car_id = User.query.filter_by(email='driver1@example.com').one().id, Car.query.first().id
+
+    def matching(*criteria):
+        return sorted(b.id for b in Booking.query.filter(*criteria))
+
+    assert sorted(_walk(client, headers, '&status=pending,cancelled')[0]) == \
+        matching(Booking.status.in_(['pending', 'cancelled']))
+    assert sorted(_walk(client, headers, f'&car_id={car_id}')[0]) == matching(Booking.car_id == car_id)
+    assert sorted(_walk(client, headers, f'&user_id={user_id}')[0]) == matching(Booking.user_id == user_id)
+    # Bookings overlapping [Jan 10, Jan 20)
+    assert sorted(_walk(client, headers, '&start_date=2030-01-10T00:00:00Z&end_date=2030-01-20T00:00:00Z')[0]) == \
+        matching(Booking.end_time >= datetime(2030, 1, 10), Booking.start_time < datetime(2030, 1, 20))
+
+    # A regular user only ever sees their own, whatever user_id says
+    driver = User.query.get(user_id)
+    own = _walk(client, auth_headers(app, driver), f'&user_id={user_id + 1}')[0]
+    assert sorted(own) == matching(Booking.user_id == user_id)
+
+
+def test_projection_returns_only_the_requested_fields(app, client, admin):
+    _seed(n_users=2, n_cars=2, n_bookings=3)
+    response = client.get('/api/bookings/?fields=status,car_license', headers=auth_headers(app, admin))
+    assert response.status_code == 200
+    assert all(set(b) == {'id', 'status', 'car_license'} for b in response.json['bookings'])
+
+
+@pytest.mark.parametrize('cursor', ['not-a-cursor', 'Zm9vfGJhcg=='])
+def test_invalid_cursor_gets_400(app, client, admin, cursor):
+    response = client.get(f'/api/bookings/?cursor={cursor}', headers=auth_headers(app, admin))
+    assert response.status_code == 400
+    assert response.json['message'] == 'Invalid cursor'
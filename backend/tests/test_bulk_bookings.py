@@ -0,0 +1,46 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.services.bulk_booking_service import BulkBookingService, MAX_RECURRENCE_DAYS
+from conftest import auth_headers, iso, make_car
+
+START = datetime(2030, 1, 7, 9)
+END = START + timedelta(hours=2)
+
+
+def _bulk(app, client, user, **body):
+    return client.post('/api/bookings/bulk', headers=auth_headers(app, user), json={
+        'slots': [{'start_time': iso(START), 'end_time': iso(END)}], **body
+    })
+
+
+def test_car_ids_given_as_strings_are_accepted(app, client, user):
+    first, second = make_car('1AB-101'), make_car('1AB-102')
+    response = _bulk(app, client, user, car_ids=[str(first.id), second.id, first.id])
+    assert response.status_code == 201
+    assert len(response.json['ids']) == 2
+
+
+@pytest.mark.parametrize('car_ids', [['abc'], [None], [[1]], 'abc', {'id': 1}])
+def test_invalid_car_ids_get_400(app, client, user, car_ids):
+    make_car('1AB-103')
+    assert _bulk(app, client, user, car_ids=car_ids).status_code == 400
+
+
+def test_recurrence_span_is_bounded(app, client, user):
+    car = make_car('1AB-104')
+    too_far = (START + timedelta(days=MAX_RECURRENCE_DAYS + 1)).date()
+    response = client.post('/api/bookings/bulk', headers=auth_headers(app, user), json={
+        'car_ids': [car.id],
+        'recurrence': {'start_time': iso(START), 'end_time': iso(END), 'freq': 'weekly',
+                       'until': too_far.isoformat()}
+    })
+    assert response.status_code == 400
+    assert str(MAX_RECURRENCE_DAYS) in response.json['message']
+
+
+def test_count_rule_that_never_matches_stops_at_the_span_limit():
+    # Only one Sunday falls in week 0; the next matching week is 10000 weeks away
+    with pytest.raises(ValueError, match=str(MAX_RECURRENCE_DAYS)):
+        BulkBookingService.expand_recurrence(START, END, 'weekly', interval=10000, byweekday=['SU'], count=2)
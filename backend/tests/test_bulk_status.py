@@ -0,0 +1,75 @@
+from datetime import datetime, timedelta
+
+from app import db
+from app.models import Booking, BookingDailyStat
+from app.services.booking_index import booking_index
+from app.services.rollup_service import COUNTERS, RollupService
+from conftest import auth_headers, iso, make_car
+
+START = datetime(2030, 1, 7, 9)
+
+
+def _book(client, headers, car, start, hours=2):
+    response = client.post('/api/bookings/', headers=headers, json={
+        'car_id': car.id, 'start_time': iso(start), 'end_time': iso(start + timedelta(hours=hours))
+    })
+    assert response.status_code == 201
+    return response.json['id']
+
+
+def _set_status(client, headers, ids, status):
+    response = client.put('/api/bookings/status', headers=headers, json={'ids': ids, 'status': status})
+    assert response.status_code == 200
+    return {r['id']: r['result'] for r in response.json['results']}
+
+
+def _rollups():
+    return sorted(
+        (row.car_id, row.day, *(getattr(row, col) for col in COUNTERS))
+        for row in BookingDailyStat.query.all() if any(getattr(row, col) for col in COUNTERS)
+    )
+
+
+def test_reactivation_conflicts_with_the_batch_and_existing_bookings(app, client, admin, user):
+    headers, admin_headers = auth_headers(app, user), auth_headers(app, admin)
+    first, second = make_car('BST-1'), make_car('BST-2')
+
+    # Two cancelled bookings of one car that overlap each other
+    a = _book(client, headers, first, START)
+    assert _set_status(client, admin_headers, [a], 'cancelled') == {a: 'updated'}
+    b = _book(client, headers, first, START + timedelta(hours=1))
+    # A cancelled booking whose period has since been taken
+    c = _book(client, headers, second, START)
+    assert _set_status(client, admin_headers, [b, c], 'cancelled') == {b: 'updated', c: 'updated'}
+    d = _book(client, headers, second, START + timedelta(hours=1))
+
+    results = _set_status(client, admin_headers, [a, b, c, d, 999], 'pending')
+    assert results == {a: 'updated', b: 'conflict', c: 'conflict', d: 'unchanged', 999: 'not_found'}
+    statuses = dict(db.session.query(Booking.id, Booking.status))
+    assert statuses == {a: 'pending', b: 'cancelled', c: 'cancelled', d: 'pending'}
+
+
+def test_rollups_and_index_follow_the_batch(app, client, admin, user):
+    headers, admin_headers = auth_headers(app, user), auth_headers(app, admin)
+    first, second = make_car('BST-3'), make_car('BST-4')
+    ids = [_book(client, headers, car, START + timedelta(days=day)) for car in (first, second) for day in range(3)]
+    rebuilds = booking_index.rebuilds
+
+    assert set(_set_status(client, admin_headers, ids[:4], 'rejected').values()) == {'updated'}
+    for booking_id in ids[:4]:
+        booking = db.session.get(Booking, booking_id)
+        assert booking_index.find_overlap(booking.car_id, booking.start_time, booking.end_time) is None
+    # The freed periods can be booked again straight away
+    _book(client, headers, first, START)
+
+    assert set(_set_status(client, admin_headers, ids[1:3], 'approved').values()) == {'updated'}
+    for booking_id in ids[1:3]:
+        booking = db.session.get(Booking, booking_id)
+        assert booking_index.find_overlap(booking.car_id, booking.start_time, booking.end_time)[2] == booking_id
+    # Kept in step by sync(), not by rebuilding
+    assert booking_index.rebuilds == rebuilds
+
+    db.session.expire_all()
+    incremental = _rollups()
+    RollupService.rebuild()
+    assert incremental == _rollups()
@@ -0,0 +1,84 @@
+import io
+import json
+
+from app.models import Car
+from app.services.car_import_service import CarImportService
+from conftest import auth_headers, make_car
+
+
+def _import(app, client, admin, body, fmt='csv', **params):
+    return client.post('/api/cars/import', headers=auth_headers(app, admin), query_string={'format': fmt, **params},
+                       data=body.encode())
+
+
+def test_duplicate_and_invalid_rows_are_reported_by_line(app, client, admin):
+    body = (
+        "license_plate,brand,model,current_mileage,status\n"
+        "IMP-1,Toyota,Vios,100,available\n"
+        "IMP-2,Honda,City,abc,available\n"
+        ",Honda,City,10,available\n"
+        "IMP-1,Toyota,Yaris,200,available\n"
+        "IMP-3,Mazda,2,-5,available\n"
+        "IMP-4,Mazda,3,50,parked\n"
+        "IMP-5,Mazda,CX-3,,\n"
+    )
+    response = _import(app, client, admin, body)
+    assert response.status_code == 200
+    report = response.json
+    assert (report['inserted'], report['updated'], report['unchanged']) == (2, 0, 0)
+    assert [(e['row'], e['license_plate'], e['message']) for e in report['errors']] == [
+        (3, 'IMP-2', 'current_mileage must be a whole number'),
+        (4, None, 'License plate is required'),
+        (5, 'IMP-1', 'Duplicate license plate in this file'),
+        (6, 'IMP-3', 'current_mileage cannot be negative'),
+        (7, 'IMP-4', 'status must be one of: available, maintenance, reserved'),
+    ]
+    assert report['error_count'] == 5
+
+    # The first occurrence of a duplicated plate wins
+    assert Car.query.filter_by(license_plate='IMP-1').one().model == 'Vios'
+    # Empty columns fall back to the defaults for new cars
+    car = Car.query.filter_by(license_plate='IMP-5').one()
+    assert (car.current_mileage, car.status) == (0, 'available')
+
+
+def test_plate_only_rows_leave_existing_cars_unchanged(app, client, admin):
+    make_car('IMP-6', color='Red')
+    body = "license_plate,color\nIMP-6,\nIMP-7,\n"
+    report = _import(app, client, admin, body).json
+    assert (report['inserted'], report['updated'], report['unchanged']) == (1, 0, 1)
+    assert report['message'] == '1 cars added, 0 updated, 1 unchanged, 0 rows rejected'
+    assert Car.query.filter_by(license_plate='IMP-6').one().color == 'Red'
+
+    # A column that is given updates the car and leaves the rest alone
+    report = _import(app, client, admin, "license_plate,color\nIMP-6,Blue\n").json
+    assert (report['inserted'], report['updated'], report['unchanged']) == (0, 1, 0)
+    car = Car.query.filter_by(license_plate='IMP-6').one()
+    assert (car.color, car.model) == ('Blue', 'Vios')
+
+
+def test_existing_plates_are_rejected_without_update(app, client, admin):
+    make_car('IMP-8')
+    report = _import(app, client, admin, "license_plate\nIMP-8\nIMP-9\n", update='false').json
+    assert (report['inserted'], report['updated'], report['unchanged']) == (1, 0, 0)
+    assert [(e['row'], e['message']) for e in report['errors']] == [(2, 'Car with this license plate already exists')]
+
+
+def test_jsonl_rows_are_numbered_by_line_across_chunks(app):
+    lines = [
+        json.dumps({'license_plate': 'IMP-10', 'brand': 'Kia'}),
+        '',
+        '{not json',
+        '["IMP-11"]',
+        json.dumps({'license_plate': 'IMP-12', 'current_mileage': '7'}),
+        json.dumps({'license_plate': 'IMP-10'}),
+    ]
+    rows = CarImportService.read_rows(io.BytesIO('\n'.join(lines).encode()), 'jsonl')
+    report = CarImportService.import_rows(rows, chunk_size=1)
+    assert (report.inserted, report.updated, report.unchanged) == (2, 0, 0)
+    assert [(e['row'], e['message'].split(':')[0]) for e in report.errors] == [
+        (3, 'Invalid JSON'),
+        (4, 'Each line must be a JSON object'),
+        (6, 'Duplicate license plate in this file'),
+    ]
+    assert Car.query.filter_by(license_plate='IMP-12').one().current_mileage == 7
@@ -0,0 +1,91 @@
+import socket
+from email.message import EmailMessage
+
+import pytest
+from aiosmtpd.controller import Controller
+
+from app.services import mail_queue as mail_queue_module
+from app.services.mail_queue import MailQueue
+
+
+class RecordingHandler:
+    """Accepts every message, remembering which connection delivered it."""
+
+    def __init__(self, transient_failures=0):
+        self.transient_failures = transient_failures
+        self.received = []
+
+    async def handle_DATA(self, server, session, envelope):
+        if self.transient_failures:
+            self.transient_failures -= 1
+            return '451 Try again later'
+        self.received.append((session.peer, envelope.rcpt_tos))
+        return '250 OK'
+
+
+@pytest.fixture
+def smtp_server():
+    servers = []
+
+    def start(handler):
+        with socket.socket() as s:
+            s.bind(('127.0.0.1', 0))
+            port = s.getsockname()[1]
+        controller = Controller(handler, hostname='127.0.0.1', port=port)
+        controller.start()
+        servers.append(controller)
+        return {'host': '127.0.0.1', 'port': port, 'use_tls': False, 'timeout': 5}
+
+    yield start
+    for controller in servers:
+        controller.stop()
+
+
+def _message(i):
+    msg = EmailMessage()
+    msg['From'] = 'noreply@example.com'
+    msg['To'] = f'driver{i}@example.com'
+    msg['Subject'] = f'Booking {i}'
+    msg.set_content('Hello')
+    return msg
+
+
+def test_messages_share_one_smtp_session(smtp_server):
+    handler = RecordingHandler()
+    smtp = smtp_server(handler)
+    queue = MailQueue(workers=1)
+    for i in range(3):
+        assert queue.enqueue(smtp, _message(i), [f'driver{i}@example.com'])
+    queue.shutdown()
+
+    assert [rcpt for _, rcpt in handler.received] == [[f'driver{i}@example.com'] for i in range(3)]
+    assert len({peer for peer, _ in handler.received}) == 1
+    assert queue.stats()['sent'] == 3
+
+
+def test_transient_failure_is_retried_with_backoff(smtp_server, monkeypatch):
+    handler = RecordingHandler(transient_failures=2)
+    smtp = smtp_server(handler)
+    sleeps = []
+    monkeypatch.setattr(mail_queue_module.time, 'sleep', sleeps.append)
+    queue = MailQueue(workers=1, max_retries=3, backoff=0.5)
+    queue.enqueue(smtp, _message(0), ['driver0@example.com'])
+    queue.shutdown()
+
+    assert len(handler.received) == 1
+    assert sleeps == [0.5, 1.0]
+    assert queue.stats()['sent'] == 1
+    assert queue.stats()['failed'] == 0
+
+
+def test_shutdown_delivers_everything_queued(smtp_server):
+    handler = RecordingHandler()
+    smtp = smtp_server(handler)
+    queue = MailQueue(workers=2)
+    for i in range(10):
+        queue.enqueue(smtp, _message(i), [f'driver{i}@example.com'])
+    queue.shutdown()
+
+    assert len(handler.received) == 10
+    assert queue.stats()['queued'] == 0
+    assert queue.stats()['workers'] == 0
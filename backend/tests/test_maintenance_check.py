@@ -0,0 +1,79 @@
+from flask_migrate import downgrade, upgrade
+from sqlalchemy import event
+
+from app import db
+from app.models import Car, Notification
+from app.services.notification_service import NotificationService
+from conftest import MIGRATIONS, make_car
+
+
+def _alerts():
+    return [n.title for n in Notification.query.filter_by(type='maintenance').order_by(Notification.id)]
+
+
+def _car(plate, mileage):
+    car = make_car(plate)
+    _drive(car, mileage)
+    return car
+
+
+def _drive(car, mileage):
+    car.current_mileage = mileage
+    db.session.commit()
+
+
+def test_crossing_a_threshold_alerts_exactly_once(app):
+    car = _car('MNT-1', 9500)
+    assert NotificationService.check_maintenance_changed() == []
+
+    _drive(car, 10050)
+    assert [c.id for c in NotificationService.check_maintenance_changed()] == [car.id]
+    # Still due, but neither an unchanged nor a further-driven car alerts again
+    assert NotificationService.check_maintenance_changed() == []
+    _drive(car, 12000)
+    assert NotificationService.check_maintenance_changed() == []
+    assert _alerts() == ['Maintenance Due: Toyota Vios (MNT-1)']
+
+    # The next threshold is a new alert
+    _drive(car, 20100)
+    assert [c.id for c in NotificationService.check_maintenance_changed()] == [car.id]
+    assert len(_alerts()) == 2
+
+
+def test_unchanged_cars_are_not_read(app):
+    due = _car('MNT-2', 15000)
+    _car('MNT-3', 100)
+    NotificationService.check_maintenance_changed()
+    assert db.session.get(Car, due.id).maintenance_checked_mileage == 15000
+
+    loaded = []
+
+    def record(car, context):
+        loaded.append(car.license_plate)
+
+    db.session.expunge_all()
+    event.listen(Car, 'load', record)
+    try:
+        assert NotificationService.check_maintenance_changed() == []
+        _car('MNT-5', 11000)
+        db.session.expunge_all()
+        assert [c.license_plate for c in NotificationService.check_maintenance_changed()] == ['MNT-5']
+    finally:
+        event.remove(Car, 'load', record)
+    assert loaded == ['MNT-5']
+
+
+def test_migration_starts_existing_cars_as_checked(app):
+    downgrade(directory=MIGRATIONS, revision='c5e2d8b1f7a6')
+    db.session.execute(db.text(
+        "INSERT INTO cars (license_plate, brand, model, current_mileage, last_maintenance_mileage) "
+        "VALUES ('MNT-4', 'Toyota', 'Vios', 25000, 0)"
+    ))
+    db.session.commit()
+    upgrade(directory=MIGRATIONS)
+
+    car = Car.query.filter_by(license_plate='MNT-4').one()
+    assert car.maintenance_checked_mileage == 25000
+    # Already alerted by the old daily check while it was due
+    assert NotificationService.check_maintenance_changed() == []
+    assert _alerts() == []
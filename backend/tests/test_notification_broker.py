@@ -0,0 +1,42 @@
+from types import SimpleNamespace
+
+from app.services.notification_broker import NotificationBroker
+
+
+def _broker(**config):
+    broker = NotificationBroker()
+    broker.init_app(SimpleNamespace(config=config))
+    return broker
+
+
+def test_backend_follows_the_database_by_default():
+    assert _broker(SQLALCHEMY_DATABASE_URI='postgresql://db/app').backend_name == 'postgres'
+    assert _broker(SQLALCHEMY_DATABASE_URI='sqlite:///app.db').backend_name == 'local'
+
+
+def test_explicit_backend_wins():
+    broker = _broker(SQLALCHEMY_DATABASE_URI='postgresql://db/app', NOTIFICATION_BROKER_BACKEND='local')
+    assert broker.backend_name == 'local'
+
+
+def test_postgres_listener_connects_outside_the_pool():
+    from sqlalchemy import create_engine
+    from sqlalchemy.pool import NullPool, QueuePool
+    from app.services.notification_broker import PostgresBackend
+
+    engine = create_engine('sqlite:///unused.db', poolclass=QueuePool)
+    backend = PostgresBackend(NotificationBroker(), engine)
+    assert isinstance(backend.listen_engine.pool, NullPool)
+    assert backend.listen_engine.url == engine.url
+
+
+def test_gunicorn_reserves_threads_for_streams(monkeypatch):
+    import runpy
+    from pathlib import Path
+
+    # The config file setdefault()s this one; keep that out of other tests
+    monkeypatch.setenv('SCHEDULER_AUTOSTART', 'false')
+    monkeypatch.setenv('GUNICORN_THREADS', '8')
+    monkeypatch.setenv('NOTIFICATION_STREAM_MAX', '50')
+    conf = runpy.run_path(str(Path(__file__).resolve().parents[1] / 'gunicorn.conf.py'))
+    assert conf['threads'] == 58
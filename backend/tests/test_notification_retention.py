@@ -0,0 +1,51 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app import db
+from app.models import Notification, NotificationArchive
+from app.services.notification_retention import NotificationRetentionService
+
+
+def _seed():
+    now = datetime.utcnow()
+    old = now - timedelta(days=100)
+    rows = {}
+    # Old rows interleave read and unread, with ties on created_at, so the
+    # purge has to page past unread rows across several chunks
+    for i in range(7):
+        created_at = old + timedelta(minutes=i // 2)
+        rows[f'old-read-{i}'] = Notification(title=f'old-read-{i}', message='m', is_read=True, created_at=created_at)
+        rows[f'old-unread-{i}'] = Notification(title=f'old-unread-{i}', message='m', is_read=False, created_at=created_at)
+    rows['recent-read'] = Notification(title='recent-read', message='m', is_read=True, created_at=now - timedelta(days=89))
+    rows['recent-unread'] = Notification(title='recent-unread', message='m', is_read=False, created_at=now)
+    db.session.add_all(rows.values())
+    db.session.commit()
+    return {title: n.id for title, n in rows.items()}
+
+
+@pytest.mark.parametrize('mode', ['delete', 'archive'])
+def test_purge_removes_only_old_read_notifications(app, mode):
+    ids = _seed()
+    config = {'NOTIFICATION_RETENTION_DAYS': 90, 'NOTIFICATION_RETENTION_MODE': mode, 'NOTIFICATION_RETENTION_BATCH': 3}
+
+    assert NotificationRetentionService.run(config) == 7
+
+    purged = {title for title in ids if title.startswith('old-read-')}
+    remaining = {n.title for n in Notification.query.all()}
+    assert remaining == set(ids) - purged
+    archived = {n.id: n for n in NotificationArchive.query.all()}
+    if mode == 'archive':
+        assert set(archived) == {ids[title] for title in purged}
+        assert all(n.is_read and n.archived_at for n in archived.values())
+    else:
+        assert archived == {}
+
+    # Nothing left to do on the next run
+    assert NotificationRetentionService.run(config) == 0
+
+
+def test_zero_days_disables_retention(app):
+    ids = _seed()
+    assert NotificationRetentionService.run({'NOTIFICATION_RETENTION_DAYS': 0}) == 0
+    assert Notification.query.count() == len(ids)
@@ -0,0 +1,46 @@
+from app.services.notification_broker import notification_broker
+from conftest import auth_headers
+
+
+def test_streams_beyond_the_limit_get_503_and_slots_are_released(app, client, user, monkeypatch):
+    monkeypatch.setattr(notification_broker, 'max_subscribers', 1)
+    headers = auth_headers(app, user)
+
+    first = client.get('/api/notifications/stream', headers=headers, buffered=False)
+    assert first.status_code == 200
+    assert notification_broker.stats()['subscribers'] == 1
+
+    second = client.get('/api/notifications/stream', headers=headers)
+    assert second.status_code == 503
+    assert second.headers['Retry-After'] == '60'
+
+    # Closed before a single chunk was read
+    first.close()
+    assert notification_broker.stats()['subscribers'] == 0
+    third = client.get('/api/notifications/stream', headers=headers, buffered=False)
+    assert third.status_code == 200
+    third.close()
+
+
+def test_marking_read_refreshes_the_owners_other_streams(app, client, user, admin):
+    from app.services.notification_service import NotificationService
+
+    own = NotificationService.create_notification('Approved', 'Your booking was approved', user_id=user.id)
+    NotificationService.create_notification('Overdue', 'A car is overdue')
+    other_tab = notification_broker.subscribe(user.id, False)
+    admin_tab = notification_broker.subscribe(admin.id, True)
+    try:
+        assert client.put(f'/api/notifications/{own.id}/read', headers=auth_headers(app, user)).status_code == 200
+        assert other_tab.get_nowait() == ('refresh', {})
+        assert admin_tab.empty()
+
+        # Already read: nothing changed, nothing to push
+        client.put(f'/api/notifications/{own.id}/read', headers=auth_headers(app, user))
+        assert other_tab.empty()
+
+        assert client.put('/api/notifications/read-all', headers=auth_headers(app, admin)).status_code == 200
+        assert admin_tab.get_nowait() == ('refresh', {})
+        assert other_tab.empty()
+    finally:
+        notification_broker.unsubscribe(other_tab)
+        notification_broker.unsubscribe(admin_tab)
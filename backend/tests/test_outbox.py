@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app import db
+from app.models import Car, OutboxEvent
+from app.services.outbox import outbox
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    seen = []
+    monkeypatch.setitem(outbox.handlers, 'test_event', lambda **payload: seen.append(payload))
+    return seen
+
+
+def _make_due():
+    db.session.execute(db.update(OutboxEvent).values(available_at=datetime.utcnow() - timedelta(seconds=1)))
+    db.session.commit()
+
+
+def test_event_commits_with_its_change_and_is_deleted_once_handled(app, calls):
+    db.session.add(Car(license_plate='3AB-001', brand='Toyota', model='Vios'))
+    outbox.add('test_event', plate='3AB-001')
+    db.session.commit()
+
+    # A rolled back change leaves no event behind
+    db.session.add(Car(license_plate='3AB-002', brand='Toyota', model='Vios'))
+    outbox.add('test_event', plate='3AB-002')
+    db.session.rollback()
+    assert OutboxEvent.query.count() == 1
+
+    assert outbox.dispatch() == 1
+    assert calls == [{'plate': '3AB-001'}]
+    assert OutboxEvent.query.count() == 0
+    assert outbox.dispatch() == 0
+
+
+def test_failing_event_backs_off_and_is_parked_after_max_attempts(app, monkeypatch):
+    def fail(**payload):
+        raise RuntimeError('SMTP down')
+
+    monkeypatch.setitem(outbox.handlers, 'test_event', fail)
+    monkeypatch.setattr(outbox, 'max_attempts', 3)
+    monkeypatch.setattr(outbox, 'backoff', 30)
+    outbox.add('test_event', plate='3AB-003')
+    db.session.commit()
+
+    for attempts in (1, 2):
+        before = datetime.utcnow()
+        assert outbox.dispatch() == 1
+        event = OutboxEvent.query.one()
+        assert event.attempts == attempts
+        assert event.last_error == 'RuntimeError: SMTP down'
+        delay = 30 * 2 ** (attempts - 1)
+        assert before + timedelta(seconds=delay - 1) <= event.available_at <= datetime.utcnow() + timedelta(seconds=delay)
+        # Not due again until the backoff has passed
+        assert outbox.dispatch() == 0
+        _make_due()
+
+    assert outbox.dispatch() == 1
+    event = OutboxEvent.query.one()
+    assert event.attempts == 3
+    assert event.available_at is None
+    assert outbox.stats()['failed_events'] == 1
+    assert outbox.dispatch() == 0
@@ -0,0 +1,67 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+
+from app import db
+from app.models import Booking, ACTIVE_BOOKING_STATUSES
+from app.services.availability_service import AvailabilityService
+from app.services.booking_guard import BookingGuard
+
+START = datetime(2030, 1, 7)
+END = datetime(2030, 1, 8)
+
+
+def _booking_queries(run):
+    """Statements and parameters sent to the database while `run` reads bookings."""
+    seen = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if 'FROM bookings' in statement:
+            seen.append((statement, parameters))
+
+    event.listen(db.engine, 'before_cursor_execute', capture)
+    try:
+        run()
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', capture)
+    assert seen
+    return seen
+
+
+def _plan(statement, parameters):
+    connection = db.session.connection()
+    if db.engine.dialect.name == 'postgresql':
+        # The test tables are tiny; make any usable index win over a scan
+        connection.exec_driver_sql('SET LOCAL enable_seqscan = off')
+        rows = connection.exec_driver_sql('EXPLAIN ' + statement, parameters).fetchall()
+        return '\n'.join(row[0] for row in rows)
+    rows = connection.exec_driver_sql('EXPLAIN QUERY PLAN ' + statement, parameters).fetchall()
+    return '\n'.join(row[-1] for row in rows)
+
+
+@pytest.mark.parametrize('run, index', [
+    (lambda: BookingGuard.find_conflict(1, START, END), 'ix_bookings_car_active_period'),
+    (lambda: AvailabilityService.busy_matrix(START, END, 60), 'ix_bookings_active_period'),
+])
+def test_active_booking_queries_use_the_partial_indexes(app, run, index):
+    [(statement, parameters)] = _booking_queries(run)
+    # literal_execute puts the statuses in the SQL text, where the planner
+    # can match them against the indexes' WHERE clause
+    assert "IN ('pending', 'approved', 'picked_up')" in statement
+    assert index in _plan(statement, parameters)
+
+
+def test_bound_statuses_cannot_use_the_partial_index(app):
+    # The reason Booking.is_active() renders literals. psycopg2 interpolates
+    # parameters client-side, so this only shows on SQLite.
+    if db.engine.dialect.name != 'sqlite':
+        pytest.skip('parameters are bound server-side only on SQLite')
+    query = db.session.query(Booking.id).filter(
+        Booking.car_id == 1,
+        Booking.status.in_(ACTIVE_BOOKING_STATUSES),
+        Booking.start_time < END,
+        Booking.end_time > START
+    )
+    [(statement, parameters)] = _booking_queries(query.all)
+    assert 'ix_bookings_car_active_period' not in _plan(statement, parameters)
@@ -0,0 +1,12 @@
+import pytest
+
+from conftest import auth_headers
+
+REPORTS = ['/api/reports/advanced-stats', '/api/reports/advanced-stats/bookings']
+
+
+@pytest.mark.parametrize('url', REPORTS)
+def test_advanced_reports_are_admin_only(app, client, admin, user, url):
+    assert client.get(url).status_code == 401
+    assert client.get(url, headers=auth_headers(app, user)).status_code == 403
+    assert client.get(url, headers=auth_headers(app, admin)).status_code == 200
@@ -0,0 +1,18 @@
+import threading
+from app.utils.query_budget import report_budget
+from conftest import auth_headers
+
+
+def test_streamed_export_holds_its_slot_until_the_body_is_closed(app, client, admin, monkeypatch):
+    monkeypatch.setattr(report_budget, '_slots', threading.BoundedSemaphore(1))
+    app.config['REPORT_QUEUE_TIMEOUT'] = 0
+    headers = auth_headers(app, admin)
+
+    export = client.get('/api/reports/advanced-stats/export', headers=headers, buffered=False)
+    assert export.status_code == 200
+
+    busy = client.get('/api/reports/stats', headers=headers)
+    assert busy.status_code == 503
+
+    export.close()
+    assert client.get('/api/reports/stats', headers=headers).status_code == 200
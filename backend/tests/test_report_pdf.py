@@ -0,0 +1,28 @@
+from datetime import datetime, timedelta
+
+from app.services.report_pdf_service import ReportPdfService
+from conftest import auth_headers, iso, make_car
+
+START = datetime(2030, 1, 7, 9)
+
+
+def test_pdf_is_rendered_again_after_a_car_is_edited(app, client, admin, user, monkeypatch):
+    monkeypatch.setattr(ReportPdfService, '_cache', type(ReportPdfService._cache)())
+    renders = []
+    render = ReportPdfService.render
+    monkeypatch.setattr(ReportPdfService, 'render', staticmethod(lambda *args: renders.append(1) or render(*args)))
+    car = make_car('1AB-201')
+    assert client.post('/api/bookings/', headers=auth_headers(app, user), json={
+        'car_id': car.id, 'start_time': iso(START), 'end_time': iso(START + timedelta(hours=2))
+    }).status_code == 201
+    headers = auth_headers(app, admin)
+
+    assert client.get('/api/reports/advanced-stats/pdf', headers=headers).status_code == 200
+    assert client.get('/api/reports/advanced-stats/pdf', headers=headers).status_code == 200
+    assert len(renders) == 1
+
+    assert client.put(f'/api/cars/{car.id}', headers=headers, json={'license_plate': '1AB-202'}).status_code == 200
+    response = client.get('/api/reports/advanced-stats/pdf', headers=headers)
+    assert response.status_code == 200
+    assert response.mimetype == 'application/pdf'
+    assert len(renders) == 2
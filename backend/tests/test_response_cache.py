@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import event
+
+from app import db
+from app.models import CacheVersion
+from app.utils.response_cache import response_cache
+from conftest import auth_headers, iso, make_car
+
+START = datetime(2030, 1, 7, 9)
+
+
+def _statements(request):
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', record)
+    try:
+        response = request()
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', record)
+    return response, statements
+
+
+def test_repeated_get_revalidates_to_304(app, client, user):
+    make_car('ETG-1')
+    headers = auth_headers(app, user)
+    first = client.get('/api/cars/', headers=headers)
+    assert first.status_code == 200
+    assert first.headers['Cache-Control'] == 'private, no-cache'
+    etag = first.headers['ETag']
+
+    again = client.get('/api/cars/', headers={**headers, 'If-None-Match': etag})
+    assert again.status_code == 304
+    assert again.data == b''
+    assert again.headers['ETag'] == etag
+
+
+def test_write_to_a_dependent_table_changes_the_etag(app, client, admin, user):
+    car = make_car('ETG-2')
+    first = client.get('/api/reports/stats')
+    etag = first.headers['ETag']
+    assert first.json['total_bookings'] == 0
+
+    response = client.post('/api/bookings/', headers=auth_headers(app, user), json={
+        'car_id': car.id, 'start_time': iso(START), 'end_time': iso(START + timedelta(hours=2))
+    })
+    assert response.status_code == 201
+
+    after = client.get('/api/reports/stats', headers={'If-None-Match': etag})
+    assert after.status_code == 200
+    assert after.headers['ETag'] != etag
+    assert after.json['total_bookings'] == 1
+
+    # A table the view doesn't depend on leaves it alone
+    etag = after.headers['ETag']
+    assert client.post('/api/settings/', headers=auth_headers(app, admin), json={'smtp_host': 'x'}).status_code == 200
+    assert client.get('/api/reports/stats', headers={'If-None-Match': etag}).status_code == 304
+
+
+def test_hits_within_the_ttl_cost_no_query(app, client, monkeypatch):
+    monkeypatch.setattr(response_cache, 'ttl', 60)
+    make_car('ETG-3')
+    first = client.get('/api/reports/stats')
+
+    response, statements = _statements(lambda: client.get('/api/reports/stats'))
+    assert response.status_code == 200
+    assert response.data == first.data
+    assert statements == []
+
+    response, statements = _statements(
+        lambda: client.get('/api/reports/stats', headers={'If-None-Match': first.headers['ETag']})
+    )
+    assert response.status_code == 304
+    assert statements == []
+
+
+def test_another_workers_bump_is_seen_after_the_ttl(app, client, monkeypatch):
+    monkeypatch.setattr(response_cache, 'ttl', 60)
+    etag = client.get('/api/reports/stats').headers['ETag']
+
+    # Bumped behind this process's back, as another worker would
+    db.session.merge(CacheVersion(table_name='cars', version=response_cache.current_version('cars') + 1))
+    db.session.commit()
+    assert client.get('/api/reports/stats', headers={'If-None-Match': etag}).status_code == 304
+
+    monkeypatch.setattr(response_cache, 'ttl', 0)
+    assert client.get('/api/reports/stats', headers={'If-None-Match': etag}).status_code == 200
@@ -0,0 +1,110 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import func
+
+from app import db
+from app.models import Booking, BookingDailyStat, Car
+from app.services.rollup_service import COUNTERS, RollupService
+from conftest import auth_headers, iso, make_car
+
+START = datetime(2030, 1, 7, 9)
+
+
+def _rollups():
+    # Incremental updates leave all-zero rows behind where a rebuild has none
+    rows = BookingDailyStat.query.all()
+    return sorted(
+        (row.car_id, row.day, row.month, *(getattr(row, col) for col in COUNTERS))
+        for row in rows if any(getattr(row, col) for col in COUNTERS)
+    )
+
+
+def _assert_matches_rebuild():
+    db.session.expire_all()
+    incremental = _rollups()
+    RollupService.rebuild()
+    assert incremental == _rollups()
+
+
+def _book(client, headers, car, day, hours=2):
+    start = START + timedelta(days=day)
+    response = client.post('/api/bookings/', headers=headers, json={
+        'car_id': car.id, 'start_time': iso(start), 'end_time': iso(start + timedelta(hours=hours))
+    })
+    assert response.status_code == 201
+    return response.json['id']
+
+
+def _seed(app, client, admin, user):
+    headers = auth_headers(app, user)
+    first, second = make_car('RLP-1'), make_car('RLP-2')
+    ids = [_book(client, headers, first, day) for day in range(3)]
+    ids.append(_book(client, headers, second, 0))
+    # Two slots on one car-day and one on the next month
+    response = client.post('/api/bookings/bulk', headers=headers, json={
+        'car_ids': [second.id],
+        'slots': [
+            {'start_time': iso(START + timedelta(days=1)), 'end_time': iso(START + timedelta(days=1, hours=1))},
+            {'start_time': iso(START + timedelta(days=1, hours=3)), 'end_time': iso(START + timedelta(days=1, hours=4))},
+            {'start_time': iso(START + timedelta(days=31)), 'end_time': iso(START + timedelta(days=31, hours=1))}
+        ]
+    })
+    assert response.status_code == 201
+    return first, second, ids + response.json['ids']
+
+
+def test_route_updates_match_a_full_rebuild(app, client, admin, user):
+    first, second, ids = _seed(app, client, admin, user)
+    admin_headers = auth_headers(app, admin)
+    _assert_matches_rebuild()
+
+    assert client.put(f'/api/bookings/{ids[0]}/status', headers=admin_headers,
+                      json={'status': 'approved'}).status_code == 200
+    assert client.put(f'/api/bookings/{ids[0]}/return', headers=admin_headers,
+                      json={'end_mileage': 150}).status_code == 200
+    assert client.put(f'/api/bookings/{ids[1]}/status', headers=admin_headers,
+                      json={'status': 'cancelled'}).status_code == 200
+    assert client.put('/api/bookings/status', headers=admin_headers,
+                      json={'ids': ids[3:], 'status': 'rejected'}).status_code == 200
+    _assert_matches_rebuild()
+
+    completed = db.session.get(BookingDailyStat, (first.id, START.date()))
+    assert (completed.booking_count, completed.completed_count, completed.mileage) == (1, 1, 150)
+
+    # Re-activating some of them, one already at the target status
+    assert client.put('/api/bookings/status', headers=admin_headers,
+                      json={'ids': [ids[1], ids[3], ids[4]], 'status': 'pending'}).status_code == 200
+    _assert_matches_rebuild()
+
+    # Removing a booking's contribution, as the routes do before a change
+    booking = db.session.get(Booking, ids[2])
+    RollupService.remove(booking)
+    db.session.delete(booking)
+    db.session.commit()
+    _assert_matches_rebuild()
+
+
+def test_stats_match_the_baseline_aggregates(app, client, admin, user):
+    first, second, ids = _seed(app, client, admin, user)
+    admin_headers = auth_headers(app, admin)
+    make_car('RLP-3')
+    client.put('/api/bookings/status', headers=admin_headers, json={'ids': ids[:2], 'status': 'cancelled'})
+
+    # What /api/reports/stats computed from the bookings table before the rollup
+    total_bookings = Booking.query.count()
+    cars_stats = db.session.query(
+        Car.license_plate, Car.brand, Car.model, func.count(Booking.id)
+    ).outerjoin(Booking, Car.id == Booking.car_id).group_by(Car.id).all()
+    if db.engine.dialect.name == 'postgresql':
+        month = func.to_char(Booking.start_time, 'YYYY-MM')
+    else:
+        month = func.strftime('%Y-%m', Booking.start_time)
+    monthly_stats = db.session.query(month, func.count(Booking.id)).group_by(month).order_by(month).all()
+
+    stats = client.get('/api/reports/stats').json
+    assert stats['total_bookings'] == total_bookings == 7
+    assert sorted(stats['cars_stats'], key=lambda c: c['name']) == sorted((
+        {'name': f"{brand} {model} ({plate})", 'bookings': count} for plate, brand, model, count in cars_stats
+    ), key=lambda c: c['name'])
+    assert stats['monthly_stats'] == [{'month': m, 'bookings': count} for m, count in monthly_stats]
+    assert [m['month'] for m in stats['monthly_stats']] == ['2030-01', '2030-02']
@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta, timezone
+
+from app import db
+from app.models import Booking, JobRun, Notification
+from app.services.email_service import EmailService
+from app.services.notification_service import NotificationService
+from app.services.scheduler import DAILY_CHECK_JOB, check_overdue_bookings_internal, daily_check_missed
+from conftest import make_car
+
+
+def _local_to_utc(value):
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _ran_at(local_time):
+    db.session.merge(JobRun(job_id=DAILY_CHECK_JOB, last_run_at=_local_to_utc(local_time)))
+    db.session.commit()
+
+
+def test_daily_check_counts_as_missed_until_it_has_run_since_7am(app):
+    with app.app_context():
+        morning = datetime(2030, 1, 8, 9, 30)
+        assert daily_check_missed(morning)
+
+        _ran_at(datetime(2030, 1, 7, 7, 0, 5))
+        assert daily_check_missed(morning)
+        # Before 7:00 AM yesterday's run is still the latest one due
+        assert not daily_check_missed(datetime(2030, 1, 8, 6, 59))
+
+        _ran_at(datetime(2030, 1, 8, 7, 0, 5))
+        assert not daily_check_missed(morning)
+        assert daily_check_missed(morning + timedelta(days=1))
+
+
+def test_overdue_booking_is_notified_once_but_emailed_daily(app, admin, user, monkeypatch):
+    emailed = []
+    monkeypatch.setattr(EmailService, 'notify_overdue_bookings',
+                        staticmethod(lambda bookings: emailed.append(sorted(b.id for b in bookings))))
+
+    now = datetime.utcnow()
+    first = make_car('OVR-1')
+    second = make_car('OVR-2')
+    late = Booking(user_id=user.id, car_id=first.id, status='picked_up',
+                   start_time=now - timedelta(days=2), end_time=now - timedelta(hours=3))
+    returned = Booking(user_id=user.id, car_id=second.id, status='returned',
+                       start_time=now - timedelta(days=2), end_time=now - timedelta(hours=3))
+    db.session.add_all([late, returned])
+    db.session.commit()
+
+    check_overdue_bookings_internal()
+    check_overdue_bookings_internal()
+    assert Notification.query.filter(Notification.title.like('Overdue Return:%')).count() == 1
+    assert db.session.get(Booking, late.id).overdue_notified_at is not None
+
+    # A booking that becomes overdue later gets its own single alert
+    later = Booking(user_id=user.id, car_id=second.id, status='approved',
+                    start_time=now - timedelta(hours=2), end_time=now - timedelta(minutes=5))
+    db.session.add(later)
+    db.session.commit()
+    check_overdue_bookings_internal()
+
+    titles = [n.title for n in Notification.query.filter(Notification.title.like('Overdue Return:%'))]
+    assert sorted(titles) == ['Overdue Return: OVR-1', 'Overdue Return: OVR-2']
+    assert NotificationService.unread_count(admin) == 2
+    assert emailed == [[late.id], [late.id], sorted([late.id, later.id])]
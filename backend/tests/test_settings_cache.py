@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import event
+
+from app import db
+from app.models import Setting
+from app.services.email_service import EmailService
+from app.utils.settings_cache import settings_cache
+from conftest import auth_headers
+
+
+def test_update_is_visible_on_the_next_read(app, client, admin):
+    headers = auth_headers(app, admin)
+    assert client.post('/api/settings/', headers=headers, json={'smtp_host': 'old.example.com'}).status_code == 200
+    assert client.get('/api/settings/', headers=headers).json['smtp_host'] == 'old.example.com'
+    assert EmailService.get_setting('smtp_host') == 'old.example.com'
+
+    assert client.post('/api/settings/', headers=headers, json={'smtp_host': 'new.example.com'}).status_code == 200
+    assert client.get('/api/settings/', headers=headers).json['smtp_host'] == 'new.example.com'
+    assert EmailService.get_setting('smtp_host') == 'new.example.com'
+
+
+def test_reads_within_the_ttl_cost_no_query(app, monkeypatch):
+    monkeypatch.setattr(settings_cache, 'ttl', 60)
+    db.session.add(Setting(key='smtp_host', value='mail.example.com'))
+    db.session.commit()
+    assert settings_cache.get('smtp_host') == 'mail.example.com'
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', record)
+    try:
+        for _ in range(10):
+            assert settings_cache.get('smtp_host') == 'mail.example.com'
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', record)
+    assert statements == []
+
+
+def test_another_workers_update_is_picked_up_after_the_ttl(app, monkeypatch):
+    db.session.add(Setting(key='smtp_host', value='old.example.com'))
+    db.session.commit()
+    monkeypatch.setattr(settings_cache, 'ttl', 60)
+    assert settings_cache.get('smtp_host') == 'old.example.com'
+
+    # Written behind this process's back, as another worker would
+    db.session.query(Setting).filter_by(key='smtp_host').update({
+        Setting.value: 'new.example.com',
+        Setting.updated_at: datetime.utcnow() + timedelta(seconds=1)
+    })
+    db.session.commit()
+    assert settings_cache.get('smtp_host') == 'old.example.com'
+
+    monkeypatch.setattr(settings_cache, 'ttl', 0)
+    assert settings_cache.get('smtp_host') == 'new.example.com'
@@ -0,0 +1,78 @@
+from app import db
+from app.models import Notification, NotificationUnreadCounter, SYSTEM_NOTIFICATIONS_OWNER
+from app.services.notification_service import NotificationService
+from conftest import auth_headers, make_user
+
+
+def _counters():
+    return {
+        owner_id: count
+        for owner_id, count in db.session.query(NotificationUnreadCounter.owner_id, NotificationUnreadCounter.count)
+        if count
+    }
+
+
+def _actual():
+    owner = db.func.coalesce(Notification.user_id, SYSTEM_NOTIFICATIONS_OWNER)
+    return dict(db.session.query(owner, db.func.count(Notification.id)).filter(
+        Notification.is_read == False
+    ).group_by(owner).all())
+
+
+def _assert_in_step():
+    db.session.expire_all()
+    assert _counters() == _actual()
+
+
+def _badge(client, app, user):
+    return client.get('/api/notifications/unread-count', headers=auth_headers(app, user)).json['count']
+
+
+def test_counters_follow_create_and_read(app, client, admin, user):
+    other = make_user('other@example.com')
+    mine = [NotificationService.create_notification(f'Mine {i}', 'message', user_id=user.id) for i in range(3)]
+    NotificationService.create_notification('Theirs', 'message', user_id=other.id)
+    system = [NotificationService.notify_admin(f'System {i}', 'message', send_email=False) for i in range(2)]
+    _assert_in_step()
+    assert _badge(client, app, user) == 3
+    assert _badge(client, app, admin) == 2
+
+    headers = auth_headers(app, user)
+    # Reading the same notification twice only counts once
+    assert client.put(f'/api/notifications/{mine[0].id}/read', headers=headers).status_code == 200
+    assert client.put(f'/api/notifications/{mine[0].id}/read', headers=headers).status_code == 200
+    _assert_in_step()
+    assert _badge(client, app, user) == 2
+
+    assert client.put(f'/api/notifications/{system[0].id}/read', headers=auth_headers(app, admin)).status_code == 200
+    _assert_in_step()
+    assert _badge(client, app, admin) == 1
+
+    assert client.put('/api/notifications/read-all', headers=headers).status_code == 200
+    _assert_in_step()
+    assert _badge(client, app, user) == 0
+    assert _badge(client, app, other) == 1
+
+    assert client.put('/api/notifications/read-all', headers=auth_headers(app, admin)).status_code == 200
+    _assert_in_step()
+    assert _badge(client, app, admin) == 0
+    assert _counters() == {other.id: 1}
+
+
+def test_reconcile_repairs_drift(app, client, admin, user):
+    for i in range(3):
+        NotificationService.create_notification(f'Mine {i}', 'message', user_id=user.id)
+    NotificationService.notify_admin('System', 'message', send_email=False)
+
+    # Drift the counters: one too high, one lost, one for an owner with nothing unread
+    db.session.query(NotificationUnreadCounter).filter_by(owner_id=user.id).update({'count': 7})
+    db.session.query(NotificationUnreadCounter).filter_by(owner_id=SYSTEM_NOTIFICATIONS_OWNER).delete()
+    db.session.add(NotificationUnreadCounter(owner_id=admin.id, count=-2))
+    db.session.commit()
+    assert _badge(client, app, user) == 7
+
+    assert NotificationService.reconcile_unread_counters() == 3
+    _assert_in_step()
+    assert _badge(client, app, user) == 3
+    assert _badge(client, app, admin) == 1
+    assert NotificationService.reconcile_unread_counters() == 0
@@ -0,0 +1,55 @@
+from sqlalchemy import event
+
+from app import db
+from conftest import auth_headers, make_user
+
+
+def _user_queries(request):
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        if 'FROM users' in statement:
+            statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', record)
+    try:
+        response = request()
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', record)
+    return response, len(statements)
+
+
+def test_cache_hit_skips_the_user_query(app, client, user):
+    headers = auth_headers(app, user)
+    # Requests share the test's session; don't let its identity map answer
+    db.session.expunge_all()
+    response, queries = _user_queries(lambda: client.get('/api/auth/me', headers=headers))
+    assert response.status_code == 200
+    assert queries == 1
+
+    response, queries = _user_queries(lambda: client.get('/api/auth/me', headers=headers))
+    assert response.status_code == 200
+    assert response.json['email'] == user.email
+    assert queries == 0
+
+
+def test_profile_update_is_seen_on_the_next_request(app, client, user):
+    headers = auth_headers(app, user)
+    client.get('/api/auth/me', headers=headers)
+    assert client.put('/api/users/profile', headers=headers, json={'full_name': 'Renamed Driver'}).status_code == 200
+    assert client.get('/api/auth/me', headers=headers).json['full_name'] == 'Renamed Driver'
+
+
+def test_role_change_and_delete_take_effect_at_once(app, client, admin):
+    member = make_user('member@example.com')
+    member_headers = auth_headers(app, member)
+    admin_headers = auth_headers(app, admin)
+    assert client.get('/api/users/', headers=member_headers).status_code == 403
+
+    assert client.put(f'/api/users/{member.id}', headers=admin_headers, json={'role': 'admin'}).status_code == 200
+    assert client.get('/api/users/', headers=member_headers).status_code == 200
+
+    assert client.delete(f'/api/users/{member.id}', headers=admin_headers).status_code == 200
+    response = client.get('/api/auth/me', headers=member_headers)
+    assert response.status_code == 401
+    assert response.json['message'] == 'User not found!'
@@ -0,0 +1,4 @@
+# WSGI entry point for gunicorn (app.py is shadowed by the app package)
+from app import create_app
+
+app = create_app()
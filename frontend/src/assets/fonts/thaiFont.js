@@ -1 +0,0 @@
-export const THSarabunNew_base64 = 'AAEAAAAYAQAABACARFNJR0hhcMQABx5sAAAM3EdERUYMCQckAAbexAAAAFJHUE9TjNa5XAAG3xgAABdGR1NVQm/CCy8ABvZgAAAoCkxUU0haxxM0AAAmfAAAAgNPUy8ypP1UgQAAAggAAABgVkRNWFrgYlMAACiAAAAF4GNtYXCsw0I3AAAYFAAABmZjdnQgBKsAyQAAMMgAAAAoZmVhdAAGBFcABytIAAAALGZwZ20GWZw3AAAvVAAAAXNnYXNwADQAIAAAAmgAAAAQZ2x5Zr0yY4cAAGdQAAZkYGhkbXinJdsVAAA47AAALmRoZWFk9YbuggAAAYwAAAA2aGhlYQV1A04AAAHEAAAAJGhtdHictQLfAAAw8AAAB/xrZXJuY6llRAAG2KwAAAYYbG9jYQcclvAAAB58AAAIAG1heHAEPCGtAAAB6AAAACBtb3J4A9e4DQAHK3QAACYYbmFtZR1VdhEAAAJ4AAAVm3Bvc3SOIeG+AAbLsAAADPtwcmVw1yZqSgAALmAAAAD0AAEAAAABAMX0xfZOXw889QAZA+gAAAAAyieP9AAAAADKKhtD/lX+WwOzA0QAAAAJAAIAAQAAAAAAAQAAA0z+NwAeA7r+Vf9dA7MAAQAAAAAAAAAAAAAAAAAAAf8AAQAAAf8B0gApAFYABgABAAAAAAAKAAACAB+DAAMAAQADAXYBkAAFAAACvAKKAAAAjAK8AooAAAHdAB4A+ggFAgsFAAQCAAIAA6EAAG9QACBaAAAAAAAAAABwc2sgAEAAIPsCA1L/BgA8A0wByWABAYOAAAAAAVQB3AAAACAADQAAAAMACAAKAC0ACf//AAoAAAAbAUoAAQAAAAAAAACUAAAAAQAAAAAAAQAOAJQAAQAAAAAAAgAHAKIAAQAAAAAAAwA2AKkAAQAAAAAABAAOAN8AAQAAAAAABQAQAO0AAQAAAAAABgAMAP0AAQAAAAAABwBLAQkAAQAAAAAACAApAVQAAQAAAAAACQAXAX0AAQAAAAAACwAsAZQAAQAAAAAADAAZAcAAAQAAAAAADQToAdkAAQAAAAAAEgAOBsEAAwABBAkAAAEoBs8AAwABBAkAAQAcB/cAAwABBAkAAgAOCBMAAwABBAkAAwBsCCEAAwABBAkABAAcCI0AAwABBAkABQAgCKkAAwABBAkABgAYCMkAAwABBAkABwCWCOEAAwABBAkACABSCXcAAwABBAkACQAuCckAAwABBAkACwBYCfcAAwABBAkADAAyCk8AAwABBAkADQnQCoFDb3B5cmlnaHQgKGMpIDIwMTAtMjAxMSBieSBTb2Z0d2FyZSBJbmR1c3RyeSBQcm9tb3Rpb24gQWdlbmN5IChQdWJsaWMgT3JnYW5pemF0aW9uKSAoU0lQQSkuIEFsbCByaWdodHMgcmVzZXJ2ZWQuDQpDcmVhdGVkIGJ5IDogU3VwcGFraXQgQ0hBTEVSTUxBUlAuVEggU2FyYWJ1biBOZXdSZWd1bGFyU3VwcGFraXRDaGFsZXJtbGFycC5QU0suRGVzaWduTFRELjogVEhTYXJhYnVuTmV3OiAyMDExVEggU2FyYWJ1biBOZXdWZXJzaW9uIDEuMyAyMDExVEhTYXJhYnVuTmV3VEggU2FyYWJ1biBOZXcgaXMgYSB0cmFkZW1hcmsgb2YgTXIuU3VwcGFraXQgQ2hhbGVybWxhcnAsIFBTSy4gRGVzaWduIExURC4uTXIuU3VwcGFraXQgQ2hhbGVybWxhcnAsIFJTQUQuRGVzaWduIExURC5Nci5TdXBwYWtpdCBDSEFMRVJNTEFSUGh0dHA6Ly93d3cuZmFjZWJvb2suY29tL3N1cHBha2l0LmNoYWxlcm1sYXJwbWFpbHRvOnR5cGV0aGFpQGdtYWlsLmNvbVRoaXMgZm9udCBpcyBmcmVlIHNvZnR3YXJlOyB5b3UgY2FuIHJlZGlzdHJpYnV0ZSBpdCBhbmQvb3IgbW9kaWZ5IGl0IHVuZGVyIHRoZSB0ZXJtcyBvZiB0aGUgR05VIEdlbmVyYWwgUHVibGljIExpY2Vuc2UgYXMgcHVibGlzaGVkIGJ5IHRoZSBGcmVlIFNvZnR3YXJlIEZvdW5kYXRpb247IGVpdGhlciB2ZXJzaW9uIDIgb2YgdGhlIExpY2Vuc2UsIG9yIChhdCB5b3VyIG9wdGlvbikgYW55IGxhdGVyIHZlcnNpb24uDQoNClRoaXMgZm9udCBpcyBkaXN0cmlidXRlZCBpbiB0aGUgaG9wZSB0aGF0IGl0IHdpbGwgYmUgdXNlZnVsLCBidXQgV0lUSE9VVCBBTlkgV0FSUkFOVFk7IHdpdGhvdXQgZXZlbiB0aGUgaW1wbGllZCB3YXJyYW50eSBvZiBNRVJDSEFOVEFCSUxJVFkgb3IgRklUTkVTUyBGT1IgQSBQQVJUSUNVTEFSIFBVUlBPU0UuICBTZWUgdGhlIEdOVSBHZW5lcmFsIFB1YmxpYyBMaWNlbnNlIGZvciBtb3JlIGRldGFpbHMuDQoNCllvdSBzaG91bGQgaGF2ZSByZWNlaXZlZCBhIGNvcHkgb2YgdGhlIEdOVSBHZW5lcmFsIFB1YmxpYyBMaWNlbnNlIGFsb25nIHdpdGggdGhpcyBmb250OyBpZiBub3QsIHdyaXRlIHRvIHRoZSBGcmVlIFNvZnR3YXJlIEZvdW5kYXRpb24sIEluYy4sIDUxIEZyYW5rbGluIFN0LCBGaWZ0aCBGbG9vciwgQm9zdG9uLCBNQSAgMDIxMTAtMTMwMSAgVVNBDQoNCkFzIGEgc3BlY2lhbCBleGNlcHRpb24sIGlmIHlvdSBjcmVhdGUgYSBkb2N1bWVudCB3aGljaCB1c2VzIHRoaXMgZm9udCwgYW5kIGVtYmVkIHRoaXMgZm9udCBvciB1bmFsdGVyZWQgcG9ydGlvbnMgb2YgdGhpcyBmb250IGludG8gdGhlIGRvY3VtZW50LCB0aGlzIGZvbnQgZG9lcyBub3QgYnkgaXRzZWxmIGNhdXNlIHRoZSByZXN1bHRpbmcgZG9jdW1lbnQgdG8gYmUgY292ZXJlZCBieSB0aGUgR05VIEdlbmVyYWwgUHVibGljIExpY2Vuc2UuIFRoaXMgZXhjZXB0aW9uIGRvZXMgbm90IGhvd2V2ZXIgaW52YWxpZGF0ZSBhbnkgb3RoZXIgcmVhc29ucyB3aHkgdGhlIGRvY3VtZW50IG1pZ2h0IGJlIGNvdmVyZWQgYnkgdGhlIEdOVSBHZW5lcmFsIFB1YmxpYyBMaWNlbnNlLiBJZiB5b3UgbW9kaWZ5IHRoaXMgZm9udCwgeW91IG1heSBleHRlbmQgdGhpcyBleGNlcHRpb24gdG8geW91ciB2ZXJzaW9uIG9mIHRoZSBmb250LCBidXQgeW91IGFyZSBub3Qgb2JsaWdhdGVkIHRvIGRvIHNvLiBJZiB5b3UgZG8gbm90IHdpc2ggdG8gZG8gc28sIGRlbGV0ZSB0aGlzIGV4Y2VwdGlvbiBzdGF0ZW1lbnQgZnJvbSB5b3VyIHZlcnNpb24uVEggU2FyYWJ1biBOZXcAQwBvAHAAeQByAGkAZwBoAHQAIAAoAGMAKQAgADIAMAAxADAALQAyADAAMQAxACAAYgB5ACAAUwBvAGYAdAB3AGEAcgBlACAASQBuAGQAdQBzAHQAcgB5ACAAUAByAG8AbQBvAHQAaQBvAG4AIABBAGcAZQBuAGMAeQAgACgAUAB1AGIAbABpAGMAIABPAHIAZwBhAG4AaQB6AGEAdABpAG8AbgApACAAKABTAEkAUABBACkALgAgAEEAbABsACAAcgBpAGcAaAB0AHMAIAByAGUAcwBlAHIAdgBlAGQALgANAAoAQwByAGUAYQB0AGUAZAAgAGIAeQAgADoAIABTAHUAcABwAGEAawBpAHQAIABDAEgAQQBMAEUAUgBNAEwAQQBSAFAALgBUAEgAIABTAGEAcgBhAGIAdQBuACAATgBlAHcAUgBlAGcAdQBsAGEAcgBTAHUAcABwAGEAawBpAHQAQwBoAGEAbABlAHIAbQBsAGEAcgBwAC4AUABTAEsALgBEAGUAcwBpAGcAbgBMAFQARAAuADoAIABUAEgAUwBhAHIAYQBiAHUAbgBOAGUAdwA6ACAAMgAwADEAMQBUAEgAIABTAGEAcgBhAGIAdQBuACAATgBlAHcAVgBlAHIAcwBpAG8AbgAgADEALgAzACAAMgAwADEAMQBUAEgAUwBhAHIAYQBiAHUAbgBOAGUAdwBUAEgAIABTAGEAcgBhAGIAdQBuACAATgBlAHcAIABpAHMAIABhACAAdAByAGEAZABlAG0AYQByAGsAIABvAGYAIABNAHIALgBTAHUAcABwAGEAawBpAHQAIABDAGgAYQBsAGUAcgBtAGwAYQByAHAALAAgAFAAUwBLAC4AIABEAGUAcwBpAGcAbgAgAEwAVABEAC4ALgBNAHIALgBTAHUAcABwAGEAawBpAHQAIABDAGgAYQBsAGUAcgBtAGwAYQByAHAALAAgAFIAUwBBAEQALgBEAGUAcwBpAGcAbgAgAEwAVABEAC4ATQByAC4AUwB1AHAAcABhAGsAaQB0ACAAQwBIAEEATABFAFIATQBMAEEAUgBQAGgAdAB0AHAAOgAvAC8AdwB3AHcALgBmAGEAYwBlAGIAbwBvAGsALgBjAG8AbQAvAHMAdQBwAHAAYQBrAGkAdAAuAGMAaABhAGwAZQByAG0AbABhAHIAcABtAGEAaQBsAHQAbwA6AHQAeQBwAGUAdABoAGEAaQBAAGcAbQBhAGkAbAAuAGMAbwBtAFQAaABpAHMAIABmAG8AbgB0ACAAaQBzACAAZgByAGUAZQAgAHMAbwBmAHQAdwBhAHIAZQA7ACAAeQBvAHUAIABjAGEAbgAgAHIAZQBkAGkAcwB0AHIAaQBiAHUAdABlACAAaQB0ACAAYQBuAGQALwBvAHIAIABtAG8AZABpAGYAeQAgAGkAdAAgAHUAbgBkAGUAcgAgAHQAaABlACAAdABlAHIAbQBzACAAbwBmACAAdABoAGUAIABHAE4AVQAgAEcAZQBuAGUAcgBhAGwAIABQAHUAYgBsAGkAYwAgAEwAaQBjAGUAbgBzAGUAIABhAHMAIABwAHUAYgBsAGkAcwBoAGUAZAAgAGIAeQAgAHQAaABlACAARgByAGUAZQAgAFMAbwBmAHQAdwBhAHIAZQAgAEYAbwB1AG4AZABhAHQAaQBvAG4AOwAgAGUAaQB0AGgAZQByACAAdgBlAHIAcwBpAG8AbgAgADIAIABvAGYAIAB0AGgAZQAgAEwAaQBjAGUAbgBzAGUALAAgAG8AcgAgACgAYQB0ACAAeQBvAHUAcgAgAG8AcAB0AGkAbwBuACkAIABhAG4AeQAgAGwAYQB0AGUAcgAgAHYAZQByAHMAaQBvAG4ALgANAAoADQAKAFQAaABpAHMAIABmAG8AbgB0ACAAaQBzACAAZABpAHMAdAByAGkAYgB1AHQAZQBkACAAaQBuACAAdABoAGUAIABoAG8AcABlACAAdABoAGEAdAAgAGkAdAAgAHcAaQBsAGwAIABiAGUAIAB1AHMAZQBmAHUAbAAsACAAYgB1AHQAIABXAEkAVABIAE8AVQBUACAAQQBOAFkAIABXAEEAUgBSAEEATgBUAFkAOwAgAHcAaQB0AGgAbwB1AHQAIABlAHYAZQBuACAAdABoAGUAIABpAG0AcABsAGkAZQBkACAAdwBhAHIAcgBhAG4AdAB5ACAAbwBmACAATQBFAFIAQwBIAEEATgBUAEEAQgBJAEwASQBUAFkAIABvAHIAIABGAEkAVABOAEUAUwBTACAARgBPAFIAIABBACAAUABBAFIAVABJAEMAVQBMAEEAUgAgAFAAVQBSAFAATwBTAEUALgAgACAAUwBlAGUAIAB0AGgAZQAgAEcATgBVACAARwBlAG4AZQByAGEAbAAgAFAAdQBiAGwAaQBjACAATABpAGMAZQBuAHMAZQAgAGYAbwByACAAbQBvAHIAZQAgAGQAZQB0AGEAaQBsAHMALgANAAoADQAKAFkAbwB1ACAAcwBoAG8AdQBsAGQAIABoAGEAdgBlACAAcgBlAGMAZQBpAHYAZQBkACAAYQAgAGMAbwBwAHkAIABvAGYAIAB0AGgAZQAgAEcATgBVACAARwBlAG4AZQByAGEAbAAgAFAAdQBiAGwAaQBjACAATABpAGMAZQBuAHMAZQAgAGEAbABvAG4AZwAgAHcAaQB0AGgAIAB0AGgAaQBzACAAZgBvAG4AdAA7ACAAaQBmACAAbgBvAHQALAAgAHcAcgBpAHQAZQAgAHQAbwAgAHQAaABlACAARgByAGUAZQAgAFMAbwBmAHQAdwBhAHIAZQAgAEYAbwB1AG4AZABhAHQAaQBvAG4ALAAgAEkAbgBjAC4ALAAgADUAMQAgAEYAcgBhAG4AawBsAGkAbgAgAFMAdAAsACAARgBpAGYAdABoACAARgBsAG8AbwByACwAIABCAG8AcwB0AG8AbgAsACAATQBBACAAIAAwADIAMQAxADAALQAxADMAMAAxACAAIABVAFMAQQANAAoADQAKAEEAcwAgAGEAIABzAHAAZQBjAGkAYQBsACAAZQB4AGMAZQBwAHQAaQBvAG4ALAAgAGkAZgAgAHkAbwB1ACAAYwByAGUAYQB0AGUAIABhACAAZABvAGMAdQBtAGUAbgB0ACAAdwBoAGkAYwBoACAAdQBzAGUAcwAgAHQAaABpAHMAIABmAG8AbgB0ACwAIABhAG4AZAAgAGUAbQBiAGUAZAAgAHQAaABpAHMAIABmAG8AbgB0ACAAbwByACAAdQBuAGEAbAB0AGUAcgBlAGQAIABwAG8AcgB0AGkAbwBuAHMAIABvAGYAIAB0AGgAaQBzACAAZgBvAG4AdAAgAGkAbgB0AG8AIAB0AGgAZQAgAGQAbwBjAHUAbQBlAG4AdAAsACAAdABoAGkAcwAgAGYAbwBuAHQAIABkAG8AZQBzACAAbgBvAHQAIABiAHkAIABpAHQAcwBlAGwAZgAgAGMAYQB1AHMAZQAgAHQAaABlACAAcgBlAHMAdQBsAHQAaQBuAGcAIABkAG8AYwB1AG0AZQBuAHQAIAB0AG8AIABiAGUAIABjAG8AdgBlAHIAZQBkACAAYgB5ACAAdABoAGUAIABHAE4AVQAgAEcAZQBuAGUAcgBhAGwAIABQAHUAYgBsAGkAYwAgAEwAaQBjAGUAbgBzAGUALgAgAFQAaABpAHMAIABlAHgAYwBlAHAAdABpAG8AbgAgAGQAbwBlAHMAIABuAG8AdAAgAGgAbwB3AGUAdgBlAHIAIABpAG4AdgBhAGwAaQBkAGEAdABlACAAYQBuAHkAIABvAHQAaABlAHIAIAByAGUAYQBzAG8AbgBzACAAdwBoAHkAIAB0AGgAZQAgAGQAbwBjAHUAbQBlAG4AdAAgAG0AaQBnAGgAdAAgAGIAZQAgAGMAbwB2AGUAcgBlAGQAIABiAHkAIAB0AGgAZQAgAEcATgBVACAARwBlAG4AZQByAGEAbAAgAFAAdQBiAGwAaQBjACAATABpAGMAZQBuAHMAZQAuACAASQBmACAAeQBvAHUAIABtAG8AZABpAGYAeQAgAHQAaABpAHMAIABmAG8AbgB0ACwAIAB5AG8AdQAgAG0AYQB5ACAAZQB4AHQAZQBuAGQAIAB0AGgAaQBzACAAZQB4AGMAZQBwAHQAaQBvAG4AIAB0AG8AIAB5AG8AdQByACAAdgBlAHIAcwBpAG8AbgAgAG8AZgAgAHQAaABlACAAZgBvAG4AdAAsACAAYgB1AHQAIAB5AG8AdQAgAGEAcgBlACAAbgBvAHQAIABvAGIAbABpAGcAYQB0AGUAZAAgAHQAbwAgAGQAbwAgAHMAbwAuACAASQBmACAAeQBvAHUAIABkAG8AIABuAG8AdAAgAHcAaQBzAGgAIAB0AG8AIABkAG8AIABzAG8ALAAgAGQAZQBsAGUAdABlACAAdABoAGkAcwAgAGUAeABjAGUAcAB0AGkAbwBuACAAcwB0AGEAdABlAG0AZQBuAHQAIABmAHIAbwBtACAAeQBvAHUAcgAgAHYAZQByAHMAaQBvAG4ALgAAAAADAAAAAwAABCYAAQAAAAAAHAADAAEAAAHmAAYBygAAACAA4AHwAAIAAwAEAAUABgAHAAgACQAKAAsADAANAA4ADwAQABEAEgATABQAFQAWABcAGAAZABoAGwAcAB0AHgAfACAAIQAiACMAJAAlACYAJwAoACkAKgArACwALQAuAC8AMAAxADIAMwA0ADUANgA3ADgAOQA6ADsAPAA9AD4APwBAAEEAQgBDAEQARQBGAEcASABJAEoASwBMAE0ATgBPAFAAUQBSAFMAVABVAFYAVwBYAFkAWgBbAFwAXQBeAF8AAACGAIcAiQCLAJMAmACeAKMAogCkAKYApQCnAKkAqwCqAKwArQCvAK4AsACxALMAtQC0ALYAuAC3ALwAuwC9AL4BOQByAGUAZgBqATsAeAChAHAAbAFFAHYAawFRAIgAmgFOAHMBUgFTAGgAdwFIAUsBSgAAAU8AbQB8AUYAqAC6AIEAZABvAU0AzAFQAUkAbgB9ATwAAQCCAIUAlwDFAMYBMQEyATYBNwEzATQAuQFUAMEAyQFCAUMBQAFBAXMBdAE6AHkBNQE4AT0AhACMAIMAjQCKAI8AkACRAI4AlQCWAAAAlACcAJ0AmwDCAM0A0wBxAM8A0ADRAHoA1ADSAM4ABAJAAAAAhgCAAAYABgAgAH4AoACsAK0A/wEDAQcBDQERAR8BKQExAUIBUwFfAWEBaQF4AX4BkgGhAbACxwLdAwEDAwMJAyMOOg5bHvkgDyAUIBogHiAiICYgMCAzIDogRCCjIKwhEyEiISYhLiFaIV4iAiIGIg8iEiIaIh4iKyJIImAiZSXKJcz3Gvcd+IL7Av//AAAAIAAhAKAAoQCtAK4BAgEGAQwBEAEeASgBMAFBAVIBXgFgAWgBeAF9AZIBoAGvAsYC2AMAAwMDCQMjDgAOPx6gIAwgEyAYIBwgICAmIDAgMiA5IEQgoyCrIRMhIiEmIS4hUyFbIgIiBiIPIhEiGiIeIisiSCJgImQlyiXM9wD3G/iA+wH//wAA/+EAAP/DAAD/wgDQAM4AygDIALwAtAAA/4L/cwCB/2cAef9R/03/OgBDADb+B/33AAD+5f7e/sfy1fLR4tbhIeEe4RvhGuEZ4RbhDeEM4Qfg/uEtAADgMeAj4CDgGeCi4JHfRt9D3zvfOt8z3zDfJN8I3vHe7tuK24kKVgAACXEGcgABAIYAAACEAAAAggAAAAAAAAAAAAAAAAAAAHQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAXgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAPgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABoAAAAAAAAB8AABAf0B3gDCAesB6QHRAUMB9AFxAXIABAJAAAAAhgCAAAYABgAgAH4AoACsAK0A/wEDAQcBDQERAR8BKQExAUIBUwFfAWEBaQF4AX4BkgGhAbACxwLdAwEDAwMJAyMOOg5bHvkgDyAUIBogHiAiICYgMCAzIDogRCCjIKwhEyEiISYhLiFaIV4iAiIGIg8iEiIaIh4iKyJIImAiZSXKJcz3Gvcd+IL7Av//AAAAIAAhAKAAoQCtAK4BAgEGAQwBEAEeASgBMAFBAVIBXgFgAWgBeAF9AZIBoAGvAsYC2AMAAwMDCQMjDgAOPx6gIAwgEyAYIBwgICAmIDAgMiA5IEQgoyCrIRMhIiEmIS4hUyFbIgIiBiIPIhEiGiIeIisiSCJgImQlyiXM9wD3G/iA+wH//wAA/+EAAP/DAAD/wgDQAM4AygDIALwAtAAA/4L/cwCB/2cAef9R/03/OgBDADb+B/33AAD+5f7e/sfy1fLR4tbhIeEe4RvhGuEZ4RbhDeEM4Qfg/uEtAADgMeAj4CDgGeCi4JHfRt9D3zvfOt8z3zDfJN8I3vHe7tuK24kKVgAACXEGcgABAIYAAACEAAAAggAAAAAAAAAAAAAAAAAAAHQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAXgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAPgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABoAAAAAAAAB8AABAf0B3gDCAesB6QHRAUMB9AFxAXIAAAAAAAAAAACAAAAAgAAAAigAAATAAAAFkAAAD1QAABMsAAAcoAAAHQQAAB3oAAAezAAAJTgAACWsAAAnCAAAJywAACiYAAAp8AAAMKAAADJMAAA3hAAARGgAAEeEAABMZAAAVEAAAFZkAABjsAAAajQAAGrgAABruAAAbAAAAGxAAABsiAAAcSgAAHTAAAB8GAAAg1QAAIgQAACMqAAAjVQAAI48AACS8AAAk7gAAJRIAACVxAAAnLAAAJ1gAACluAAAp+AAAKzUAACvEAAAtLgAALhIAAC98AAAvzwAAMHgAADEQAAAzoQAANQsAADYSAAA2lAAANqgAADbRAAA25gAANz0AADdHAAA3XQAAOKMAADnyAAA7XAAAPJ8AAD4pAAA+lAAAQMkAAEGgAABCHgAAQucAAEQ8AABEZwAARV4AAEYRAABHEAAASE8AAEmDAABKHgAATPEAAE1bAABN/gAATzcAAE//AABSnAAAVK8AAFVKAABVywAAVdcAAFYNAABWMgAAVjgAAFY4AABWOAAAVr4AAFcRAABXdgAAV9EAAFg/AABYcAAAWIIAAFlAAABZuAAAWscAAFstAABbPgAAW00AAFzHAABc0QAAXeAAAF4DAABeewAAXzoAAF9KAABfsAAAX8kAAF/4AABgPQAAYFMAAGD5AABhCgAAYVAAAGHAAABiSAAAYwUAAGMLAABjEQAAYxcAAGMdAABjIwAAYykAAGNRAABjVwAAY10AAGNjAABjaQAAY28AAGN1AABjewAAY4EAAGOHAABkFQAAZBsAAGQhAABkJwAAZC0AAGQzAABkOQAAZEsAAGU1AABlOwAAZUEAAGVHAABlTQAAZVMAAGXeAABmlAAAZpoAAGagAABmpgAAZqwAAGayAABmuAAAZ5gAAGeeAABnpAAAZ6oAAGewAABntgAAZ7wAAGfCAABnyAAAZ84AAGiTAABomQAAaJ8AAGilAABoqwAAaLEAAGi3AABpBwAAae4AAGn0AABp+gAAagAAAGoGAABqDAAAas0AAGrTAABq5QAAawcAAGstAABryQAAbKEAAGynAABsrQAAbLMAAGy5AABsvwAAbOIAAGz1AABtAQAAbRkAAG1UAABt+gAAbjkAAG5kAABudAAAbnQAAHDeAABzngAAdM4AAHf8AAB4ugAAfeYAAH80AACCVwAAhiwAAImMAACNUwAAkmsAAJg/AACefwAAppoAAKxcAACwYQAAtVMAALo5AAC9VQAAwJEAAMQwAADF+wAAyWoAAMxwAADNkQAAzrAAANCFAADSOQAA1OEAANduAADaigAA3LIAAN7tAADi+gAA5bYAAOh5AADrWAAA7McAAPIpAAD0vQAA+hEAAPzZAAD/1QABAiQAAQWcAAEHKgABCXcAAQr3AAEL2gABDdIAAQ+FAAEQ1QABEx0AARSGAAEVVgABFtUAARcQAAEYMgABGP4AARqMAAEc4QABHscAASCrAAEhMgABItIAASTdAAEk+AABJ38AASxKAAEsogABLrcAAS+JAAEwDwABMR8AATHWAAEz7AABNskAAThCAAE6ogABPi0AAUDCAAFEkAABR20AAUpmAAFLJgABTL4AAUzKAAFM5AABTPoAAU0SAAFNHAABTSYAAU1iAAFNtAABTg0AAU6RAAFPRAABT+sAAVAIAAFQXAABUH4AAVFDAAFSwwABUswAAVLcAAFT0AABVFYAAVRiAAFVJAABVbAAAVXRAAFWWAABVqkAAVdbAAFXbQABV4UAAVeYAAFXogABV7QAAVhEAAFYjwABWNYAAVj5AAFZDQABWSEAAVk7AAFbNgABXAkAAV1QAAFeVgABYJAAAWGGAAFhnwABY2wAAWYzAAFmlgABaLQAAWjiAAFrGAABbswAAW89AAFxVwABcr4AAXQRAAF03AABd14AAXd5AAF6QwABflIAAX6kAAGAcQABgMIAAYEfAAGBWgABgV4AAYFiAAGBmwABgdoAAYXwAAGF9gABhfwAAYYCAAGGCQABhhIAAYYaAAGGIwABhisAAYY0AAGGPAABhkQAAYZMAAGGVAABhlwAAYZlAAGGbQABhnYAAYZ+AAGGhwABho8AAYaXAAGGnwABhqcAAYavAAGGtQABhrsAAYbBAAGGyAABhs4AAYbUAAGG3QABhuUAAYbuAAGG9gABhv8AAYcHAAGHDwABhxcAAYcfAAGHJwABhy0AAYczAAGHOQABhz8AAYdFAAGHSwABh1EAAYdXAAGHYAABh2gAAYdxAAGHeQABh4IAAYeKAAGHkgABh5oAAYeiAAGHqgABh7AAAYe2AAGHvAABh8IAAYfIAAGHzwABh9UAAYfbAAGH4QABh+cAAYftAAGH8wABh/kAAYgAAAGIBgABiAwAAYgSAAGIGAABiB4AAYglAAGIKwABiDEAAYg3AAGIPQABiEMAAYhJAAGITwABiFUAAYhbAAGIYgABiGgAAYhuAAGIlQABiW4AAYl0AAGJegABiYYAAYmMAAGJkgABiZgAAYonAAGK9wABiv0AAYsDAAGLCQABiw8AAYsVAAGLGwABiyEAAYsnAAGLLQABjAwAAYzpAAGNOwABjaMAAY3jAAGOCAABjhsAAY5WAAGOaQABj0EAAZBZAAGRbgABkkEAAZJBAAGSRwABkk0AAZJTAAGSVwABkyQAAZQtAAGUzwABlagAAZaLAAGXPgABmAcAAZkPAAGZGAABmRgAAAB/0sBS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0sBAUtLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLSwFLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0sBS0tLS0tLS0tLS0tLSwEAAAAAAQABAQEBAQAMAPgI/wAIAAf//AAJAAj/+wAKAAn/+wALAAr/+gAMAAv/+gANAAv/+gAOAAz/+QAPAA3/+QAQAA7/+AARAA//+AASABD/9wATABH/9wAUABH/9gAVABL/9gAWABP/9QAXABT/9QAYABX/9QAZABb/9AAaABb/9AAbABf/8wAcABj/8wAdABn/8gAeABr/8gAfABv/8QAgABz/8QAhABz/8AAiAB3/8AAjAB7/8AAkAB//7wAlACD/7wAmACH/7gAnACH/7gAoACL/7QApACP/7QAqACT/7AArACX/7AAsACb/6wAtACb/6wAuACf/6gAvACj/6gAwACn/6gAxACr/6QAyACv/6QAzACz/6AA0ACz/6AA1AC3/5wA2AC7/5wA3AC//5gA4ADD/5gA5ADH/5QA6ADH/5QA7ADL/5QA8ADP/5AA9ADT/5AA+ADX/4wA/ADb/4wBAADf/4gBBADf/4gBCADj/4QBDADn/4QBEADr/4ABFADv/4ABGADz/4ABHADz/3wBIAD3/3wBJAD7/3gBKAD//3gBLAED/3QBMAEH/3QBNAEH/3ABOAEL/3ABPAEP/2wBQAET/2wBRAEX/2gBSAEb/2gBTAEf/2gBUAEf/2QBVAEj/2QBWAEn/2ABXAEr/2ABYAEv/1wBZAEz/1wBaAEz/1gBbAE3/1gBcAE7/1QBdAE//1QBeAFD/1QBfAFH/1ABgAFL/1ABhAFL/0wBiAFP/0wBjAFT/0gBkAFX/0gBlAFb/0QBmAFf/0QBnAFf/0ABoAFj/0ABpAFn/0ABqAFr/zwBrAFv/zwBsAFz/zgBtAFz/zgBuAF3/zQBvAF7/zQBwAF//zABxAGD/zAByAGH/ywBzAGL/ywB0AGL/ygB1AGP/ygB2AGT/ygB3AGX/yQB4AGb/yQB5AGf/yAB6AGf/yAB7AGj/xwB8AGn/xwB9AGr/xgB+AGv/xgB/AGz/xQCAAG3/xQCBAG3/xQCCAG7/xACDAG//xACEAHD/wwCFAHH/wwCGAHL/wgCHAHL/wgCIAHP/wQCJAHT/wQCKAHX/wACLAHb/wACMAHf/wACNAHj/vwCOAHj/vwCPAHn/vgCQAHr/vgCRAHv/vQCSAHz/vQCTAH3/vACUAH3/vACVAH7/uwCWAH//uwCXAID/ugCYAIH/ugCZAIL/ugCaAIL/uQCbAIP/uQCcAIT/uACdAIX/uACeAIb/twCfAIf/twCgAIj/tgChAIj/tgCiAIn/tQCjAIr/tQCkAIv/tQClAIz/tACmAI3/tACnAI3/swCoAI7/swCpAI//sgCqAJD/sgCrAJH/sQCsAJL/sQCtAJP/sACuAJP/sACvAJT/sACwAJX/rwCxAJb/rwCyAJf/rgCzAJj/rgC0AJj/rQC1AJn/rQC2AJr/rAC3AJv/rAC4AJz/qwC5AJ3/qwC6AJ3/qgC7AJ7/qgC8AJ//qgC9AKD/qQC+AKH/qQC/AKL/qADAAKP/qADBAKP/pwDCAKT/pwDDAKX/pgDEAKb/pgDFAKf/pQDGAKj/pQDHAKj/pQDIAKn/pADJAKr/pADKAKv/owDLAKz/owDMAK3/ogDNAK7/ogDOAK7/oQDPAK//oQDQALD/oADRALH/oADSALL/oADTALP/nwDUALP/nwDVALT/ngDWALX/ngDXALb/nQDYALf/nQDZALj/nADaALj/nADbALn/mwDcALr/mwDdALv/mwDeALz/mgDfAL3/mgDgAL7/mQDhAL7/mQDiAL//mADjAMD/mADkAMH/lwDlAML/lwDmAMP/lgDnAMP/lgDoAMT/lQDpAMX/lQDqAMb/lQDrAMf/lADsAMj/lADtAMn/kwDuAMn/kwDvAMr/kgDwAMv/kgDxAMz/kQDyAM3/kQDzAM7/kAD0AM7/kAD1AM//kAD2AND/jwD3ANH/jwD4ANL/jgD5ANP/jgD6ANP/jQD7ANT/jQD8ANX/jAD9ANb/jAD+ANf/iwD/ANj/i7gAACsAugABAAQAAisBugAFAAUAAisBvwAFAJkAgQBlAEgALgAAAAgrvwAGAKcAgQBlAEgALgAAAAgrvwAHAI4AgQBlAEgALgAAAAgrvwAIAI4AgQBqAEwALgAAAAgrvwAJAKcAgQBqAEwALgAAAAgrAL8AAQCnAIEAZQBIAC4AAAAIK78AAgDFAKEAfQBaAC4AAAAIK78AAwCnAIEAagBMAC4AAAAIK78ABADFAKEAagBMAC4AAAAIKwC6AAoABQAHK7gAACBFfWkYRLoArwAQAAFzugDPABAAAXO6AP8AEAABc7oAHwAQAAF0ugBPABAAAXS4AAAsS7gACVBYsQEBjlm4Af+FuABEHbkACQADX14tuAABLCAgRWlEsAFgLbgAAiy4AAEqIS24AAMsIEawAyVGUlgjWSCKIIpJZIogRiBoYWSwBCVGIGhhZFJYI2WKWS8gsABTWGkgsABUWCGwQFkbaSCwAFRYIbBAZVlZOi24AAQsIEawBCVGUlgjilkgRiBqYWSwBCVGIGphZFJYI4pZL/0tuAAFLEsgsAMmUFhRWLCARBuwQERZGyEhIEWwwFBYsMBEGyFZWS24AAYsICBFaUSwAWAgIEV9aRhEsAFgLbgAByy4AAYqLbgACCxLILADJlNYsEAbsABZioogsAMmU1gjIbCAioobiiNZILADJlNYIyG4AMCKihuKI1kgsAMmU1gjIbgBAIqKG4ojWSCwAyZTWCMhuAFAioobiiNZILgAAyZTWLADJUW4AYBQWCMhuAGAIyEbsAMlRSMhIyFZGyFZRC24AAksS1NYRUQbISFZLQAAFAAhABwAIQAcACQAIQAnACcAIQAAAAr/WQAAAVQABwGIAAgB4gACArQAMgDYAAAAkwAmANAAJQGTACIBaQA0AkkAIgGnABMAeAAlAL4AFAC+ABQBHQASAZsAJgCiAB4A2AAUAKIALgEO/+4BagAfAWoASwFqABoBagAiAWoAIAFqABgBagAmAWoAIQFqACEBagAmAKIALgCiAB4BmwAsAZsANwGbACwBGwAfAhgAFwGQAAABegA2AZYAFwGvADYBXwA2AV8ANgGpABcBuQA2AJMANgEI//8BeAA2AWEANgIkACgBuQA2AeYAFgF6ADYB5wAWAXsANgFgABsBe//7AdIANgGGAAACTAAAAaIAEQFuAAABqAAWAMQANAEG//cAxAALAZwAKwFgAAAAzAA7AVgAGgGRADEBSwAbAZEAHAF2ABsAzgAFATcAJAGGADQAjwAnAJv/1gE8ADQAyAA0AlkALQGGAC0BjgAcAZEAMQGRADEA2QAqARoAHQDuAAYBhgA0AVUAAwH7AAMBPgAAAVEAAwFBAA8A0AANAJkAPADQABwBoAAaATz+0QAAAAAA2AAAAAD+3wCXACYBmwAgAZsAOQGbABYBmwAiAJkAPAF2ADcA1AAOAhgAGQD2ABgBKgALAaQAFwIYABkBYAAAANQAFAGbACYA/gAZAP4AIwDUADYBlgA5AXYALQCiAC4A1AAjAP4AOwEdABQBJgATAhgAHgIYAB4CGAAjASEAIgGQAAABkAAAAZAAAAGQAAABkAAAAZAAAAJG//kBlgAXAV8ANgFfADYBXwA2AV8ANgCTAB0AkwAdAJMABQCT//sBrwAFAbkANgHmABYB5gAWAeYAFgHmABYB5gAWAZsALwHmABYB0gA2AdIANgHSADYB0gA2AW4AAAF8ADwBiAApAVgAGgFYABoBWAAaAVgAGgFYABoBWAAaAmAAGgFLABsBdgAbAXYAGwF2ABsBdgAbAI8AGwCPABsAjwADAI//+QFqACYBhgAtAY4AHAGOABwBjgAcAY4AHAGOABwBmwAmAY4AHAGGADQBhgA0AYYANAGGADQBUQADAbAAPQFRAAMAjwA0AWkAEgDRABICxwAWAqcAHAFgABsBGgAdAX4ABwGoABYBQQAPAY7/7wDUABcA1AAXAS4APAEuAHUBLgBNAS4AUADUABcBFwAqAAAAAAGCACQBegAPAX4ADwGJACEBiQAhAZgADwEmABABbwAYAXkAGgF8AA8BgAAPAgcAHgIHAB4BqQAYAakAGAFX//IBzQAPAhQAIAIfAB4BhwAgAYcAIAF6ABoBrgARAU8AFAGkABEBrAARAawAEQF9ACgBfQAoAb8AEQG/ABEBqQAYAZAAEQF3ACoBQgAZAXoAGgF9ABUBqQAYAU8ACgGJACEBtgARAX0AFQGrABEBxgARAYMAGgF0ACUBhwA2AWUAHwAA/xUBPAAYATz/XgAA/qcAAP6nAAD+pwAA/qcAAP9eAAD+9QAA/5sBmwBLAMsANQF5ADUA7f/ZAPL/1gD0/90Azf+pAY8AOgAA/twAAP+nAAD/RgAA/yAAAP9zAAD/TgAA/14AAP86AcIAOAHBACYBwQAkAcEAEAHBACIBwQAdAcEAHQHBABIBwQAYAcEAIAHBABoCCgA2ArkATQAA//IAAP/NAAD/8gAA/14BaAAVAtAAFgD3AEkA9wBJAPcASQFyAE4BcgBOAXIATgF2ACcBdgAnANgAGAHfAC4DPQAiAH0ADwDWAA8AtwALALcAEwCi/9wBlgAAANEAFgH5AA4BxQAjATkAHwE9ABwB2gAAAb4ANgGbABkBmwA3AV4AFwJqADUA8v/ZAZsALQGbADcBmwA5AZsAOQGCACEBkAARAVAAGgAA/lUAAP5VAAD+VQAA/lUAAP85AAD+1wAA/q8AAP7lAAD/AAAA/6MAAP8WAAD+4QAA/2sAAP9FAgAAHgAA/qoAAP7RAAD+jQAA/1UAAP7dAAD+ogAA/yEAAP8XAAD/XgAA/vUAAP+bAakAGAHGABEBWwAKAZQACgO6ADoBkAAAAVgAGgGQAAABWAAaAZAAAAFYABoBkAAAAVgAGgGQAAABWAAaAZAAAAFYABoBkAAAAVgAGgGQAAABWAAaAZAAAAFYABoBkAAAAVgAGgGQAAABWAAaAZAAAAFYABoBXwA2AXYAGwFfADYBdgAbAV8ANgF2ABsBXwA2AXYAGwFfADYBdgAbAV8ANgF2ABsBXwA2AXYAGwFfADYBdgAbAJMAEACPAA4AkwAtAI8AJwHmABYBjgAcAeYAFgGOABwB5gAWAY4AHAHmABYBjgAcAeYAFgGOABwB5gAWAY4AHAHmABYBjgAcAeYAFgGOABwB5gAWAY4AHAHmABYBjgAcAeYAFgGOABwB5gAWAY4AHAHSADYBhgA0AdIANgGGADQB0gA2AXUANAHSADYBdQA0AdIANgF1ADQB0gA2AXUANAHSADYBdQA0AW4AAAFRAAMBbgAAAVEAAwFuAAABUQADAW4AAAFRAAMBaP/zAZEAFwGQAAABWAAaAZYAFwFLABsBlgAXAUsAGwGvAAYBkQAcAakAFwE3ACQAk//vAI//7QCTADUBZQAdASAAIAHcADsBlQA0AeYAFgGOABwB0gA2AXUANAAA/xsAAP89AAD/ZQAA/5UAAP9vAhgAHgIYACMCGAAbAhgALADYAAABuwA4Aj8AGgJtABgBqQAYAhgAHgIYABACGAAeAhgAEAIYACMCGAAgAhgAHgIYABsA2AAUAAAAAAAAABcAAAIECQkGAgECBAMFBAECAgMEAQIBAgMDAwMDAwMDAwMBAQQEBAMFBAMEBAMDBAQBAgMDBQQEAwQDAwMEBAUEAwQCAgIEAwIDBAMEAwIDBAEBAwIFBAQEBAIDAgQDBQMDAwIBAgQDAAIAAQQEBAQBAwIFAgMEBQMCBAICAgQDAQICAwMFBQUDBAQEBAQEBQQDAwMDAQEBAQQEBAQEBAQEBAQEBAQDAwQDAwMDAwMFAwMDAwMBAQEBAwQEBAQEBAQEBAQEBAMEAwEDAgYGAwMDBAMEAgIDAwMDAgMAAwMDBAQEAwMDAwMFBQQEAwQFBQQEAwQDBAQEAwMEBAQEAwMDAwQDBAQDBAQDAwQDAAMDAAAAAAAAAAQCAwICAgIEAAAAAAAAAAAEBAQEBAQEBAQEBAUGAAAAAAMGAgICAwMDAwMCBAcBAgICAQQCBQQDAwQEBAQDBgIEBAQEAwQDAAAAAAAAAAAAAAAAAAAFAAAAAAAAAAAAAAAEBAMECQQDBAMEAwQDBAMEAwQDBAMEAwQDBAMEAwMDAwMDAwMDAwMDAwMDAwMBAQEBBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQDBAMEAwQDBAMDAwMDAwMDAwMEBAMEAwQDBAQEAwEBAQMDBAQEBAQDAAAAAAAFBQUFAgQFBgQFBQUFBQUFBQIAAAAACgoHAgECBAQGBAECAgMEAgICAwQEBAQEBAQEBAQCAgQEBAMFBAQEBAQEBAQBAwQEBQQFBAUEBAQFBAYEBAQCAwIEBAIDBAMEBAIDBAECAwIGBAQEBAIDAgQDBQMDAwICAgQDAAIAAgQEBAQCBAIFAgMEBQQCBAMDAgQEAgIDAwMFBQUDBAQEBAQEBgQEBAQEAQEBAQQEBQUFBQUEBQUFBQUEBAQDAwMDAwMGAwQEBAQBAQEBBAQEBAQEBAQEBAQEBAMEAwEEAgcHBAMEBAMEAgIDAwMDAgMABAQEBAQEAwQEBAQFBQQEAwUFBQQEBAQDBAQEBAQEBAQEBAMEBAQDBAQEBAUEBAQEAAMDAAAAAAAAAAQCBAICAgIEAAAAAAAAAAAFBAQEBAQEBAQEBAUHAAAAAAQHAgICBAQEBAQCBQgBAgICAgQCBQUDAwUEBAQEBgIEBAQEBAQDAAAAAAAAAAAAAAAAAAAFAAAAAAAAAAAAAAAEBQMECgQDBAMEAwQDBAMEAwQDBAMEAwQDBAMEAwQEBAQEBAQEBAQEBAQEBAQBAQEBBQQFBAUEBQQFBAUEBQQFBAUEBQQFBAUEBQQFBAUEBQQFBAUEBQQEAwQDBAMEAwQEBAMEAwQDBAQEAwEBAQQDBQQFBAUEAAAAAAAFBQUFAgQGBgQFBQUFBQUFBQIAAAAACwsIAgICBAQGBQECAgMFAgICAwQEBAQEBAQEBAQCAgUFBQMGBAQEBQQEBQUCAwQEBgUFBAUEBAQFBAYFBAUCAwIFBAIEBAQEBAIDBAICAwIHBAQEBAIDAwQEBgQEBAICAgUDAAIAAgUFBQUCBAIGAwMFBgQCBQMDAgQEAgIDAwMGBgYDBAQEBAQEBgQEBAQEAgICAgUFBQUFBQUFBQUFBQUEBAQEBAQEBAQHBAQEBAQCAgICBAQEBAQEBAUEBAQEBAQFBAIEAggHBAMEBQQEAgIDAwMDAgMABAQEBAQEAwQEBAQGBgUFBAUGBgQEBAUEBQUFBAQFBQUEBAQEBAUEBAUEBQUEBAQEAAMDAAAAAAAAAAUCBAMDAwIEAAAAAAAAAAAFBQUFBQUFBQUFBQYIAAAAAAQIAwMDBAQEBAQCBQkBAgICAgQCBgUDAwUFBQUEBwMFBQUFBAQEAAAAAAAAAAAAAAAAAAAGAAAAAAAAAAAAAAAFBQQECwQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQCAgICBQQFBAUEBQQFBAUEBQQFBAUEBQQFBAUEBQQFBAUEBQQFBAUEBQQEBAQEBAQEBAQEBAQEBAQEBQQFAwICAgQDBQQFBAUEAAAAAAAGBgYGAgUGBwUGBgYGBgYGBgIAAAAADAsIAwIDBQQHBQECAgMFAgMCAwQEBAQEBAQEBAQCAgUFBQMGBQUFBQQEBQUCAwUEBwUGBQYFBAUGBQcFBAUCAwIFBAIEBQQFBAIEBQICBAIHBQUFBQMDAwUEBgQEBAMCAwUEAAMAAgUFBQUCBAMGAwQFBgQDBQMDAwUEAgMDAwQGBgYDBQUFBQUFBwUEBAQEAgICAgUFBgYGBgYFBgYGBgYEBQUEBAQEBAQHBAQEBAQCAgICBAUFBQUFBQUFBQUFBQQFBAIEAwkIBAMFBQQFAwMEBAQEAwMABQUFBQUFBAQFBQUGBgUFBAYGBwUFBQUEBQUFBQUFBQUFBQQFBQUEBQUFBQUFBAUEAAQEAAAAAAAAAAUCBQMDAwIFAAAAAAAAAAAFBQUFBQUFBQUFBQYIAAAAAAQJAwMDBAQEBAQDBgoCAwICAgUDBgUEBAYFBQUEBwMFBQUFBQUEAAAAAAAAAAAAAAAAAAAGAAAAAAAAAAAAAAAFBQQFCwUEBQQFBAUEBQQFBAUEBQQFBAUEBQQFBAQEBAQEBAQEBAQEBAQEBAQCAgICBgUGBQYFBgUGBQYFBgUGBQYFBgUGBQYFBgUGBQYEBgQGBAYEBgQEBAQEBAQEBAQFBQQFBAUEBQUFBAICAgQDBgUGBQYEAAAAAAAGBgYGAwUHBwUGBgYGBgYGBgMAAAAADQwJAwIDBQUIBgICAgQFAgMCBAUFBQUFBQUFBQUCAgUFBQQHBQUFBgUFBgYCAwUFBwYGBQYFBQUGBQgFBQYDAwMFBQMEBQQFBQMEBQICBAMIBQUFBQMEAwUEBwQEBAMCAwUEAAMAAgUFBQUCBQMHAwQFBwUDBQMDAwUFAgMDBAQHBwcEBQUFBQUFCAUFBQUFAgICAgYGBgYGBgYFBgYGBgYFBQUEBAQEBAQIBAUFBQUCAgICBQUFBQUFBQUFBQUFBQQGBAIFAwkJBQQFBgQFAwMEBAQEAwQABQUFBQUFBAUFBQUHBwYGBAYHBwUFBQYEBQYGBQUGBgYFBQQFBQYEBQYFBgYFBQUFAAQEAAAAAAAAAAUDBQMDAwMFAAAAAAAAAAAGBgYGBgYGBgYGBgcJAAAAAAUJAwMDBQUFBQUDBgsCAwICAgUDBwYEBAYGBQUFCAMFBQUFBQUEAAAAAAAAAAAAAAAAAAAHAAAAAAAAAAAAAAAGBgUFDAUEBQQFBAUEBQQFBAUEBQQFBAUEBQQFBAUFBQUFBQUFBQUFBQUFBQUCAgICBgUGBQYFBgUGBQYFBgUGBQYFBgUGBQYFBgUGBQYFBgUGBQYFBgUFBAUEBQQFBAUFBQQFBAUEBgUGBAICAgUEBgUGBQYFAAAAAAAHBwcHAwYHCAYHBwcHBwcHBwMAAAAADw4KAwIDBgUJBgIDAwQGAgMCBAUFBQUFBQUFBQUCAgYGBgQIBgYGBgUFBgcCBAYFCAcHBgcGBQYHBgkGBQYDBAMGBQMFBgUGBgMFBgICBQMJBgYGBgMEBAYFCAUFBQMCAwYFAAMAAgYGBgYCBgMIBAQGCAUDBgQEAwYGAgMEBAQICAgEBgYGBgYGCQYFBQUFAgICAgYHBwcHBwcGBwcHBwcFBgYFBQUFBQUJBQYGBgYCAgICBQYGBgYGBgYGBgYGBgUGBQIFAwsKBQQGBgUGAwMFBQUFAwQABgYGBgYGBAYGBgYICAYGBQcICAYGBgYFBgYGBgYHBwYGBgUGBgYFBgcGBgcGBgYFAAUFAAAAAAAAAAYDBgQEBAMGAAAAAAAAAAAHBwcHBwcHBwcHBwgKAAAAAAULBAQEBgYGBgYDBwwCAwMDAgYDCAcFBQcHBgYFCQQGBgYGBgYFAAAAAAAAAAAAAAAAAAAIAAAAAAAAAAAAAAAGBwUGDgYFBgUGBQYFBgUGBQYFBgUGBQYFBgUGBQUGBQYFBgUGBQYFBgUGBQYCAgICBwYHBgcGBwYHBgcGBwYHBgcGBwYHBgcGBwYHBgcGBwYHBgcGBwYFBQUFBQUFBQUGBgUGBQYFBgYGBQICAgUEBwYHBgcGAAAAAAAICAgIAwcJCQYICAgICAgICAMAAAAAEA8LAwIDBgYJBwIDAwUHAwMDBAYGBgYGBgYGBgYDAwcHBwUJBgYHBwYGBwcCBAYGCQcIBggGBgYHBgkHBgcDBAMHBgMGBgUGBgMFBgICBQMKBgYGBgMFBAYFCAUFBQMCAwcFAAMAAgcHBwcCBgMJBAUHCQYDBwQEAwcGAwMEBQUJCQkFBgYGBgYGCQcGBgYGAgICAgcHCAgICAgHCAcHBwcGBgYGBgYGBgYKBQYGBgYCAgICBgYGBgYGBgcGBgYGBgUHBQIGAwsLBgUGBwUGAwMFBQUFAwQABgYGBgYHBQYGBgYICAcHBQcJCQYGBgcFBwcHBgYHBwcGBgUGBgcFBgcGBwcGBgYGAAUFAAAAAAAAAAcDBgQEBAMGAAAAAAAAAAAHBwcHBwcHBwcHBwgLAAAAAAYMBAQEBgYGBgYDCA0CAwMDAwcDCAcFBQgHBwcGCgQHBwcHBgYFAAAAAAAAAAAAAAAAAAAIAAAAAAAAAAAAAAAHBwYGDwYGBgYGBgYGBgYGBgYGBgYGBgYGBgYGBgYGBgYGBgYGBgYGBgYGBgYCAgICCAYIBggGCAYIBggGCAYIBggGCAYIBggGBwYHBgcGBwYHBgcGBwYGBQYFBgUGBQYGBgYHBQcFBwYHBQICAgYFCAYIBgcGAAAAAAAJCQkJAwcJCgcJCQkJCQkJCQMAAAAAERAMBAMEBwYKBwIDAwUHAwQDBQYGBgYGBgYGBgYDAwcHBwUJBwYHBwYGBwgDBAYGCQgIBggGBgYIBwoHBgcDBAMHBgMGBwYHBgQFBwIDBQMKBwcHBwQFBAcGCQUGBQQDBAcFAAQAAwcHBwcDBgQJBAUHCQYEBwQEBAcGAwQEBQUJCQkFBwcHBwcHCgcGBgYGAwMDAwcICAgICAgHCAgICAgGBgcGBgYGBgYKBgYGBgYCAgICBgcHBwcHBwcHBwcHBwYHBgIGBAwMBgUHBwUHBAQFBQUFBAUABwYHBwcHBQYGBgcJCQcHBggJCQcHBgcGBwcHBgYICAcHBgUGBgcGBwcGBwgHBgcGAAUFAAAAAAAAAAcDBgQEBAMHAAAAAAAAAAAICAgICAgICAgICAkMAAAAAAYMBAQEBgYGBgYECA4CBAMDAwcECQgFBQgIBwcGCwQHBwcHBwcGAAAAAAAAAAAAAAAAAAAJAAAAAAAAAAAAAAAHCAYHEAcGBwYHBgcGBwYHBgcGBwYHBgcGBwYHBgYGBgYGBgYGBgYGBgYGBgYDAgMCCAcIBwgHCAcIBwgHCAcIBwgHCAcIBwgHCAcIBwgGCAYIBggGCAYGBgYGBgYGBgYHBwYHBgcGBwcHBQMCAwYFCAcIBwgGAAAAAAAJCQkJBAgKCwcJCQkJCQkJCQQAAAAAExINBAMECAcLCAIEBAUIAwQDBQcHBwcHBwcHBwcDAwgICAUKCAcICAcHCAgDBQcHCggJBwkHBwcJBwsIBwgEBQQIBwQHCAYIBwQGBwMDBgQLBwgICAQFBQcGCgYGBgQDBAgGAAQAAwgICAgDBwQKBQYICgcECAUFBAgHAwQFBQYKCgoFCAgICAgICwgHBwcHAwMDAwgICQkJCQkICQkJCQkHBwcHBwcHBwcMBgcHBwcDAwMDBwcICAgICAgIBwcHBwYIBgMHBA4NBwUHCAYIBAQGBgYGBAUABwcHBwcIBgcHBwcKCggIBwkKCgcHBwgGCAgIBwcJCQgIBwYHBwgGBwgHCAkHBwcHAAYGAAAAAAAAAAgEBwUFBQQIAAAAAAAAAAAJCQkJCQkJCQkJCQoNAAAAAAcOBQUFBwcHBwcECRACBAMDAwgECgkGBgkICAgHDAUICAgIBwgGAAAAAAAAAAAAAAAAAAAKAAAAAAAAAAAAAAAICQcIEggHCAcIBwgHCAcIBwgHCAcIBwgHCAcIBwcHBwcHBwcHBwcHBwcHBwcDAwMDCQgJCAkICQgJCAkICQgJCAkICQgJCAkICQcJBwkHCQcJBwkHCQcHBgcGBwYHBgcICAcIBggGCAgIBgMDAwcFCQgJCAkHAAAAAAAKCgoKBAgLDAgKCgoKCgoKCgQAAAAAFRQPBQMECAgMCQMEBAYJAwUDBggICAgICAgICAgDAwkJCQYLCAgJCQcHCQkDBggHDAkKCAoIBwgKCAwJCAkEBgQJBwQHCAcICAQHCAMDBwQNCAgICAUGBQgHCwcHBwQDBAkHAAUAAwkJCQkDCAQLBQYJCwcECQUFBAkIAwQFBgYLCwsGCAgICAgIDAkHBwcHAwMDAwkJCgoKCgoJCgoKCgoICAgHBwcHBwcNBwgICAgDAwMDCAgICAgICAkICAgICAcJBwMIBA8OBwYICQcIBAQGBgYGBAYACAgICAgJBggICAgLCwkJBwoLCwgICAkHCQkJCAgJCQkICAcICAkHCAkICQoICAgIAAcHAAAAAAAAAAkECAUFBQQIAAAAAAAAAAAJCQkJCQkJCQkJCQsPAAAAAAgPBQUFCAgICAgFChEDBQQEAwkECwoHBwoJCQkHDQUJCQkJCAgHAAAAAAAAAAAAAAAAAAALAAAAAAAAAAAAAAAJCgcIFAgHCAcIBwgHCAcIBwgHCAcIBwgHCAcIBwcIBwgHCAcIBwgHCAcIBwgDAwMDCggKCAoICggKCAoICggKCAoICggKCAoICggKCAoICggKCAoICggIBwgHCAcIBwgICAcJBwkHCQgJBwMDAwgGCgkKCAoIAAAAAAALCwsLBQkMDQkLCwsLCwsLCwUAAAAAGBcRBQQFCgkOCgMFBQcKBAUEBgkJCQkJCQkJCQkEBAoKCgcNCgkKCggICgsEBgkIDQsMCQwJCAkLCQ4KCQoFBgUKCAUICggKCQUHCQMECAUOCQoKCgUHBgkIDAgICAUEBQoIAAUABAoKCgoECQUNBgcKDQgFCgYGBQoJBAUGBwcNDQ0HCgoKCgoKDgoICAgIBAQEBAoLDAwMDAwKDAsLCwsJCQkICAgICAgPCAkJCQkDAwMDCQkKCgoKCgoKCQkJCQgKCAMJBREQCAcJCggKBQUHBwcHBQcACQkJCQkKBwkJCQkMDAoKCAsNDQkJCQoICgoKCQkLCwoKCQgJCQoICQsJCgsJCQkJAAgIAAAAAAAAAAoFCQYGBgUKAAAAAAAAAAALCwsLCwsLCwsLCw0RAAAAAAkRBgYGCQkJCQkFDBQDBQQEBAoFDAsICAsLCgoIDwYKCgoKCQoIAAAAAAAAAAAAAAAAAAAMAAAAAAAAAAAAAAAKCwgKFwoICggKCAoICggKCAoICggKCAoICggKCAgJCAkICQgJCAkICQgJCAkEAwQDDAoMCgwKDAoMCgwKDAoMCgwKDAoMCgwKCwkLCQsJCwkLCQsJCwkJCAkICQgJCAkKCggKCAoICgoKBwQDBAkHCwoMCgsJAAAAAAANDQ0NBQsODwoNDQ0NDQ0NDQUAAAAAGxoTBgQGCwoQCwMFBQgLBAYEBwoKCgoKCgoKCgoEBAsLCwgOCwoLDAkJCwwEBwoKDwwNCg0KCgoNCxALCgsFBwULCgYJCwkLCgYICwQECQUQCwsLCwYIBgsJDgkJCQYEBgsJAAYABAsLCwsECgYOBwgLDgoGCwcHBgsKBAYHCAgODg4ICwsLCwsLEAsJCQkJBAQEBAwMDQ0NDQ0LDQ0NDQ0KCgsJCQkJCQkQCQoKCgoEBAQECgsLCwsLCwsLCwsLCwkMCQQKBhMSCggKCwkLBgYICAgIBggACgoKCwsLCAoKCgoODgsLCQwODwsLCgwJCwwMCgoMDAsLCgkKCgsJCwwKDAwKCgsKAAkJAAAAAAAAAAsFCgYHBwYLAAAAAAAAAAAMDAwMDAwMDAwMDA4TAAAAAAoTBwcHCgoKCgoGDRYDBgUFBAsGDgwICQ0MCwsJEQcLCwsLCgsJAAAAAAAAAAAAAAAAAAAOAAAAAAAAAAAAAAALDAkLGgsJCwkLCQsJCwkLCQsJCwkLCQsJCwkLCQkKCQoJCgkKCQoJCgkKCQoEBAQEDQsNCw0LDQsNCw0LDQsNCw0LDQsNCw0LDQsNCw0KDQoNCg0KDQoKCQoJCgkKCQoLCwkLCQsJDAsLCAQEBAoIDQsNCw0KAAAAAAAODg4OBgwQEQsODg4ODg4ODgYAAAAAHRwUBgQGDAoRDAMGBggMBQYFCAsLCwsLCwsLCwsFBQwMDAgQDAsMDQoKDA0ECAsKEA0OCw4LCgsOCxEMCwwGCAYMCgYKDAoMCwYJCwQFCQYRCwwMDAYIBwsKDwkKCQYEBgwJAAYABAwMDAwECwYQBwkMEAoGDAcHBgwLBQYHCAkQEBAIDAwMDAwMEQwKCgoKBAQEBA0NDg4ODg4MDg4ODg4LCwsKCgoKCgoSCgsLCwsEBAQECwsMDAwMDAwMCwsLCwoNCgQKBhUUCggLDAkMBgYJCQkJBggACwsLCwsMCQsLCwsPDwwMCg0PEAsLCwwKDAwMCwsNDQwMCwkLCwwKCw0LDA0LCwsKAAkJAAAAAAAAAAwGCwcHBwYMAAAAAAAAAAANDQ0NDQ0NDQ0NDQ8UAAAAAAoVBwcHCwsLCwsGDhgEBgUFBQwGDw0JCQ4NDAwKEgcMDAwMCwwKAAAAAAAAAAAAAAAAAAAPAAAAAAAAAAAAAAAMDQoMHAwKDAoMCgwKDAoMCgwKDAoMCgwKDAoMCgoLCgsKCwoLCgsKCwoLCgsEBAQEDgwODA4MDgwODA4MDgwODA4MDgwODA4MDgsOCw4LDgsOCw4LDgsLCgsKCwoLCgoMDAoMCgwKDQwMCQQEBAoIDgwODA4LAAAAAAAQEBAQBg0REgwQEBAQEBAQEAYAAAAAIB8WBwUHDQwTDgQGBgkNBQcFCQwMDAwMDAwMDAwFBQ0NDQkRDQwNDgsLDg4FCAwLEg4QDBAMCwwPDBMNDA4GCAYNCwcLDQsNDAcKDAUFCgYTDA0NDQcJCAwLEAoLCgcFBw0KAAcABQ0NDQ0FDAcRCAoNEQsHDQgIBw0MBQcICQkREREJDQ0NDQ0NEw0LCwsLBQUFBQ4OEBAQEBANEA8PDw8MDA0LCwsLCwsTCwwMDAwFBQUFDAwNDQ0NDQ0NDAwMDAsOCwUMBxcWCwkMDgoNBwcKCgoKBwkADAwMDQ0NCQwMDAwREQ4OCw8REQ0NDA4LDQ4ODAwODg4NDAoMDA4LDQ4MDg8MDA0LAAoKAAAAAAAAAA0HDAgICAcNAAAAAAAAAAAODg4ODg4ODg4ODhEWAAAAAAwXCAgIDAwMDAwHDxsEBwYGBQ0HEA8KCg8ODQ0LFAgNDQ0NDA0LAAAAAAAAAAAAAAAAAAAQAAAAAAAAAAAAAAAODwsNHw0LDQsNCw0LDQsNCw0LDQsNCw0LDQsNCwsMCwwLDAsMCwwLDAsMCwwFBQUFEA0QDRANEA0QDRANEA0QDRANEA0QDRANDwwPDA8MDwwPDA8MDwwMCwwLDAsMCwwNDQsNCw0LDg0OCgUFBQsJDw0QDQ8MAAAAAAARERERBw4SFA4REREREREREQcAAAAAIR8XBwUHDQwTDgQGBgkOBQcFCQwMDAwMDAwMDAwFBQ4ODgkSDQwNDgwMDg8FCQwMEg8QDBANDA0PDRMODA4GCQYODAcLDQsNDAcKDQUFCgcUDQ0NDQcJCA0LEQsLCwcFBw4KAAcABQ4ODg4FDAcSCAoOEgwHDggIBw0MBQcICQoSEhIKDQ0NDQ0NEw0MDAwMBQUFBQ4PEBAQEBAOEA8PDw8MDQ0LCwsLCwsUCwwMDAwFBQUFDA0NDQ0NDQ4NDQ0NDQsOCwUMBxcWDAkNDgsNBwcKCgoKBwkADQwNDQ0NCgwMDQ0REQ4OCw8SEg0NDA4LDg4ODQ0PDw4NDAsMDQ4LDQ4NDg8NDA0MAAoKAAAAAAAAAA4HDAgICAcNAAAAAAAAAAAPDw8PDw8PDw8PDxEXAAAAAAwYCAgIDAwMDAwHEBsEBwYGBQ0HEQ8KChAPDg4MFAgODg4ODQ0LAAAAAAAAAAAAAAAAAAARAAAAAAAAAAAAAAAODwsNHw0LDQsNCw0LDQsNCw0LDQsNCw0LDQsNCwwMDAwMDAwMDAwMDAwMDAwFBQUFEA0QDRANEA0QDRANEA0QDRANEA0QDRANDw0PDQ8MDwwPDA8MDwwMCwwLDAsMCwwNDQsNCw0LDg0OCgUFBQwKEA0QDQ8MAAAAAAASEhISBw8TFQ4SEhISEhISEgcAAAAAJSMaCAUIDw0WEAQHBwsPBggGCg0NDQ0NDQ0NDQ0GBg8PDwoUDw4PEA0NEBAFCg4NFBASDhIODQ4RDhYPDhAHCgcPDQgNDwwPDggMDgUGDAcWDg8PDwgKCQ4NEwwMDAgGCA8MAAgABg8PDw8GDggUCQsQFA0IDwkJCA8OBggJCwsUFBQLDw8PDw8PFg8NDQ0NBQUFBRAQEhISEhIPEhEREREODg8NDQ0NDQ0XDA4ODg4FBQUFDQ4PDw8PDw8PDg4ODgwQDAUNCBoZDQoOEAwPCAgLCwsLCAoADg4ODw8PCw4ODg4TExAQDREUFA4ODhAMEBAQDg4RERAPDgwODhAMDxAOEBEODg4NAAwMAAAAAAAAAA8IDgkJCQgPAAAAAAAAAAARERERERERERERERMaAAAAAA0bCQkJDg4ODg4IEh8FCAcHBg8IExEMDBIRDw8NFwkPDw8PDg8MAAAAAAAAAAAAAAAAAAATAAAAAAAAAAAAAAAQEQ0PIw8NDw0PDQ8NDw0PDQ8NDw0PDQ8NDw0PDQ0ODQ4NDg0ODQ4NDg0ODQ4FBQUFEg8SDxIPEg8SDxIPEg8SDxIPEg8SDxIPEQ4RDhEOEQ4RDhEOEQ4ODA4MDgwODA0PDw0PDA8MEA8QDAUFBQ0LEg8SDxEOAAAAAAAUFBQUCBAVFxAUFBQUFBQUFAgAAAAAKigdCQYJEQ8ZEgUICAwRBwkHCw8PDw8PDw8PDw8HBxEREQwXERAREg8PEhMGCxAPFxMUEBQQDxAUEBkSDxIICwgRDwkOEQ4REAkNEAYHDQgZEBEREQkMChAOFQ0ODQkGCRENAAkABhEREREGEAkXCg0SFw8JEQsLCREQBwkLDAwXFxcMERERERERGBEPDw8PBgYGBhITFBQUFBQRFBQUFBQPEBAODg4ODg4aDhAQEBAGBgYGDxAREREREREREBAQEA4SDgYPCR4dDwwQEg0RCQkNDQ0NCQwAEBAQERERDA8QEBAWFhISDhMWFxAQEBIOEhISEBATExIREA4QEBIOERIQEhMQEBAPAA0NAAAAAAAAABEJEAoKCgkRAAAAAAAAAAATExMTExMTExMTExYdAAAAAA8eCgoKEBAQEBAJFCMFCQgIBxEJFRMNDRQTEREPGgoREREREBEOAAAAAAAAAAAAAAAAAAAWAAAAAAAAAAAAAAASEw8RKBEOEQ4RDhEOEQ4RDhEOEQ4RDhEOEQ4RDg8QDxAPEA8QDxAPEA8QDxAGBgYGFBEUERQRFBEUERQRFBEUERQRFBEUERQRFBAUEBQQFBAUEBQQFBAPDg8ODw4PDg8REQ4RDhEOEhESDQYGBg8MFBEUERQQAAAAAAAXFxcXCRMYGhIXFxcXFxcXFwkAAAAALiwgCgcKExEbEwYJCQ0TBwoHDBEREREREREREREHBxMTEw0ZEhETFBAQFBQHDBEQGRQWERYREBEVEhsTERQJDAkTEAkQEg8SEQkOEgcHDwkcEhISEgoNCxIQFw8QDwoHChMPAAoABxMTExMHEQoZCw4TGRAKEwwMChMRBwoMDQ4ZGRkNEhISEhISGxMQEBAQBwcHBxQUFhYWFhYTFhUVFRURERIQEBAQEBAcDxEREREHBwcHERISEhISEhMSEhISEhAUEAcRCiEfEA0SFA8SCgoODg4OCg0AEhESEhITDhERERIYGBQUEBUYGRISERQPExQUEhIVFRQSEQ8REhQPEhQSFBUSERIQAA8PAAAAAAAAABMJEQsLCwkSAAAAAAAAAAAVFRUVFRUVFRUVFRggAAAAABEhCwsLEREREREKFiYGCggIBxMKFxUODxYVExMQHAsTExMTEhIPAAAAAAAAAAAAAAAAAAAYAAAAAAAAAAAAAAAUFRATLBIQEhASEBIQEhASEBIQEhASEBIQEhASEBAREBEQERAREBEQERAREBEHBwcHFhIWEhYSFhIWEhYSFhIWEhYSFhIWEhYSFRIVEhURFREVERURFREREBEQERAREBESEhATDxMPFBIUDgcHBxANFhMWEhURAAAAAAAZGRkZChQaHRQZGRkZGRkZGQoAAAAAMjAjCwcKFBIdFQYKCg4VCAsIDhISEhISEhISEhIICBUVFQ4bFBMUFhISFRYHDRMSGxYYExgTEhMXFB0VEhUKDQoVEgoRFBEUEwoQFAcIEAoeFBQUFAsODBQRGRAREAoIChUQAAsACBUVFRUIEwsbDA8VGxILFQ0NCxQTCAsNDg8bGxsOFBQUFBQUHRQSEhISBwcHBxYWGBgYGBgVGBcXFxcSExQREREREREeERMTExMHBwcHEhQUFBQUFBUUFBQUFBEWEQcSCiQiEg4TFRAUCwsPDw8PCw4AExMTFBQUDxITExMaGhUVERcbGxQUExYRFRUVExMWFhUUExATExURFBYTFRcTExQSABAQAAAAAAAAABUKEwwMDAoUAAAAAAAAAAAXFhYWFhYWFhYWFhojAAAAABIkDAwMExMTExMLGCkGCwkJCBQKGRcQEBgWFRUSHwwVFRUVExQRAAAAAAAAAAAAAAAAAAAaAAAAAAAAAAAAAAAVFxEUMBQRFBEUERQRFBEUERQRFBEUERQRFBEUERITEhMSExITEhMSExITEhMHBwcHGBQYFBgUGBQYFBgUGBQYFBgUGBQYFBgUFxQXFBcTFxMXExcTFxMSERIREhESERIUFBEUERQRFhQVEAcHBxIOGBQYFBcTAAAAAAAbGxsbCxYdHxUbGxsbGxsbGwsAAAAANjQlDAgLFhQgFwYKCg8WCQwJDxQUFBQUFBQUFBQJCRYWFg8dFhQWFxMTFxgIDhQTHhgaFBoUExQZFSAXFBcLDgsWEwsTFhIWFAsRFQgIEQsgFRUWFgwPDRUSGxESEQsICxYRAAwACBYWFhYIFAsdDRAXHRMLFg4OCxYUCQsODxAdHR0QFhYWFhYWHxYTExMTCAgICBcYGhoaGhoWGhkZGRkUFRUTExMTExMhEhQUFBQICAgIFBUVFRUVFRYVFRUVFRIXEggUCyYlEw8VFxEVCwsQEBAQCw8AFRQVFRUWEBQUFRUcHBcXExkdHRUVFBcSFxcXFRUYGBcWFBEUFRcSFRgVFxkVFBUTABERAAAAAAAAABYLFA0NDQsWAAAAAAAAAAAYGBgYGBgYGBgYGBwmAAAAABMnDQ0NFBQUFBQMGi0HDAoKCRYLGxgRERoYFhYTIQ0WFhYWFRYSAAAAAAAAAAAAAAAAAAAcAAAAAAAAAAAAAAAXGRMWNBYTFhMWExYTFhMWExYTFhMWExYTFhMWExMUExQTFBMUExQTFBMUExQICAgIGhUaFRoVGhUaFRoVGhUaFRoVGhUaFRoVGRUZFRkUGRQZFBkUGRQUEhQSFBIUEhMWFhMWEhYSFxYXEQgICBMQGhYaFRkUAAAAAAAdHR0dDBgfIhcdHR0dHR0dHQwAAAAAOjcoDQkMFxUiGQcLCxEYCQ0JEBUVFRUVFRUVFRUJCRgYGBAfFxYYGRQUGRoJDxYUIBocFhwWFBYbFyIYFRkLDwsYFAwUFxMXFgwSFwgJEgwjFxcXFw0QDhcUHRIUEwwJDBgSAA0ACRgYGBgJFgwfDhEYHxQMGA8PDBgWCQwPEREfHx8RFxcXFxcXIhgUFBQUCQkJCRkaHBwcHBwYHBsbGxsVFhcUFBQUFBQjExYWFhYICAgIFRcXFxcXFxgXFxcXFxQZFAgVDCknFBAWGRMXDAwSEhISDBAAFhYWFxcYERUWFhYeHhkZFBsfIBcXFhkTGBkZFhYaGhkXFhMWFhkTFxkWGRoWFhcVABISAAAAAAAAABgMFg4ODgwXAAAAAAAAAAAaGhoaGhoaGhoaGh4oAAAAABUqDg4OFRUVFhYNHDAHDAsLCRgMHRoSEhsaGBgUJA4YGBgYFhcTAAAAAAAAAAAAAAAAAAAeAAAAAAAAAAAAAAAZGhQXNxcUFxQXFBcUFxQXFBcUFxQXFBcUFxQXFBQWFBYUFhQWFBYUFhQWFBYJCAkIHBccFxwXHBccFxwXHBccFxwXHBccFxwXGxcbFxsWGxYbFhsWGxYVFBUUFRQVFBUXFxQYExgTGRcZEgkICRURHBccFxsWAAAAAAAfHx8fDRohJBkfHx8fHx8fHw0AAAAAQ0AuDgoOGxgnHAgNDRMcCw4LEhgYGBgYGBgYGBgLCxwcHBMkGxkbHRgYHB4KEhkYJR4hGSEZGBkfGiccGRwNEg0cGA4XGxYbGQ4VGgoKFQ0oGhsbGw8TEBoXIhUXFg4KDhwVAA4AChwcHBwKGQ4kEBQcJBgOHBERDhsZCw4RExQkJCQTGxsbGxsbJxsYGBgYCgoKCh0eISEhISEcIR8fHx8ZGRoXFxcXFxcpFhkZGRkKCgoKGBobGxsbGxwbGhoaGhcdFwoYDjAuGBMaHBYbDg4UFBQUDhMAGhkaGhobFBkZGRojIxwcFx8kJBoaGR0WHB0dGhoeHhwbGRYZGhwWGh0aHR4aGRoYABUVAAAAAAAAABwOGRAQEA4bAAAAAAAAAAAeHh4eHh4eHh4eHiMvAAAAABgwERERGRkZGRkOIDgIDgwMCxsOIh4VFSAeHBwXKRAcHBwcGhsXAAAAAAAAAAAAAAAAAAAiAAAAAAAAAAAAAAAcHhcbQBsXGxcbFxsXGxcbFxsXGxcbFxsXGxcbFxgZGBkYGRgZGBkYGRgZGBkKCgoKIRshGyEbIRshGyEbIRshGyEbIRshGyEbHxofGh8ZHxkfGR8ZHxkZFxkXGRcZFxgbGxcbFhsWHRscFQoKChgTIBshGx8ZAAAAAAAkJCQkDh4nKhwkJCQkJCQkJA4AAAAAS0g0EAsQHhssIAkODhUfDBAMFBsbGxsbGxsbGxsMDB8fHxUoHhweIBoaICELFBwaKSEkHCUcGhwjHSwfGyAPFA8fGg8aHhkeHA8XHQsMGA8tHR4eHhAVEh0aJhgZGBALEB8YABAACx8fHx8LHBAoEhYgKBoQHxMTEB4cDBATFRYoKCgWHh4eHh4eLB4aGhoaCwsLCyAhJCQkJCQfJCMjIyMbHR0aGhoaGhouGRwcHBwLCwsLGx0eHh4eHh8eHR0dHRkgGQsbEDUzGhUdIBgeEBAXFxcXEBUAHRwdHR0fFhwcHR0nJyAgGiMoKR0dHCAZICAgHR0iIiAeHBgcHSAZHSEdICIdHB0bABgYAAAAAAAAAB8PHBISEg8eAAAAAAAAAAAiIiIiIiIiIiIiIic0AAAAABs2ExMTHBwcHBwQJD4JEA4ODB4QJiIXGCQhHx8aLhIfHx8fHR4ZAAAAAAAAAAAAAAAAAAAmAAAAAAAAAAAAAAAgIhoeSB4aHhoeGh4aHhoeGh4aHhoeGh4aHhoeGhocGhwaHBocGhwaHBocGhwLCwsLJB4kHiQeJB4kHiQeJB4kHiQeJB4kHiQeIx0jHSMcIxwjHCMcIxwbGRsZGxkbGRseHhoeGR4ZIB4gFwsLCxsWJB4kHiMcAAAAAAAoKCgoECErLyAoKCgoKCgoKBAAAAAAAAIAMgAAAoIDKQADAAcAVLgACC+4AAkvuAAA3LgACBC4AAHQuAABL7gAABC5AAQABvS4AAEQuQAHAAb0ALgAAEVYuAAALxu5AAAACj5ZuwADAAIABQAEK7gAABC5AAQAAvQwMSkBESEDESERAoL9sAJQHv3sAyn88wLx/Q8AAAAAAgAm//oAawHbAAMADwFtuwAEAAcACgAEK0EFAIIABACSAAQAAnFBAwACAAQAAXJBAwBzAAQAAXFBAwDzAAQAAXFBAwBDAAQAAXJBAwCFAAQAAXJBAwB2AAQAAXJBAwCWAAQAAXJBAwBUAAQAAXJBBQATAAQAIwAEAAJyQQUAowAEALMABAACcUEDADIABAABckEHAMIABADSAAQA4gAEAANxQQMAYgAEAAFyQQMAYAAEAAFxuAAEELgAANC4AAAvQQMAbwAAAAFyQQMA/AAKAAFxQQcATAAKAFwACgBsAAoAA3JBAwDNAAoAAXFBAwA+AAoAAXJBAwDtAAoAAXFBAwANAAoAAXJBBQAcAAoALAAKAAJyQQMA3AAKAAFxQQcAeQAKAIkACgCZAAoAA3K4AAoQuAAB0LgAAS8AfLgAAC8YuAAARVi4AAIvG7kAAgASPlm4AABFWLgABy8buQAHAAo+WbgADdwwMQFBAwBwAAQAAXJBAwB+AAoAAXI3IwMzExQGIyImNTQ2MzIWWCAHLwsVDg4UFA4OFXgBY/5BDhQUDg4VFQAAAAIAJQFSAKsB8wADAAcCc0EDAKoAAAABckEDAB4AAAABXUEFAEkAAABZAAAAAnJBAwA2AAAAAXJBAwAqAAEAAXJBAwAeAAEAAV1BAwAZAAEAAXJBAwCWAAEAAXJBBQCpAAIAuQACAAJyQQMAGgACAAFyQQMAmwACAAFxQQMAOwACAAFyQQUAHQACAC0AAgACXUEFAD8AAgBPAAIAAl1BAwBPAAIAAXJBBQCcAAIArAACAAJdQQMACwACAAFyQQUAugACAMoAAgACXUEFAFkAAgBpAAIAAl1BAwApAAIAAXJBBQCpAAIAuQACAAJxQQMA9QADAAFxQQMABgADAAFyQQMAhgADAAFxQQMA1wADAAFxQQMA9wADAAFyQQMAHwADAAFdQQMAlwADAAFyQQMAJwADAAFxQQMAJgADAAFyQQMA5gADAAFxQQMANQADAAFxQQMAMwADAAFyQQUASQAEAFkABAACckEDADUABAABckEDACMABAABckEHAAkABQAZAAUAKQAFAANyQQUA6AAGAPgABgACcUELAJkABgCpAAYAuQAGAMkABgDZAAYABXFBAwALAAYAAXJBAwBOAAYAAXJBAwAaAAYAAXJBBQApAAYAOQAGAAJyQQUAdwAGAIcABgACXUEFAFYABgBmAAYAAl1BBQAFAAcAFQAHAAJyQQMAhQAHAAFxQQMA9gAHAAFyQQUAVwAHAGcABwACcUEDAHYABwABcUEDANYABwABckEDAOUABwABckEDADQABwABckEDACIABwABcgBBAwAmAAEAAV1BAwCGAAEAAV1BAwDlAAEAAV1BAwAmAAUAAV1BAwCGAAUAAV1BAwDlAAUAAV0wMRMjJzMHIyczoRsKL2EbCi8BUqGhoQACACIABAFtAcoAGwAfAG8AuAACL7gABi+7ABsAAgAAAAQrugAQAB0AAyu4AAAQuAAE0LgAABC4AAjQuAAbELgACtC4AB0QuAAM0LkADwAC9LgAEtC4ABAQuAAU0LgADxC4ABbQuAAdELgAGNC4AAwQuAAZ0LgAGxC4AB7QMDElIwcjNyMHIzcjNTM3IzUzNzMHMzczBzMVIwczJyMHMwFtXBwdHX4dHR04PRpXXRweHHwdHxw0OhpUWX0bfomFhYWFHn8ehoaGhh5/f38AAAAAAQA0/8YBNAIYACgJTLgABi+4ABcvuwAiAAUAEwAEK7sAGQAGABYABCu7AAAABwAPAAQruAAZELgABNC4AAQvuAAGELkABQAH9EEFADoADwBKAA8AAnJBIQAJAA8AGQAPACkADwA5AA8ASQAPAFkADwBpAA8AeQAPAIkADwCZAA8AqQAPALkADwDJAA8A2QAPAOkADwD5AA8AEF1BIQAJAA8AGQAPACkADwA5AA8ASQAPAFkADwBpAA8AeQAPAIkADwCZAA8AqQAPALkADwDJAA8A2QAPAOkADwD5AA8AEHFBBwAJAA8AGQAPACkADwADcrgAFxC5ABgAB/RBIQAGACIAFgAiACYAIgA2ACIARgAiAFYAIgBmACIAdgAiAIYAIgCWACIApgAiALYAIgDGACIA1gAiAOYAIgD2ACIAEF1BIQAGACIAFgAiACYAIgA2ACIARgAiAFYAIgBmACIAdgAiAIYAIgCWACIApgAiALYAIgDGACIA1gAiAOYAIgD2ACIAEHFBBwAGACIAFgAiACYAIgADckEFADUAIgBFACIAAnJBAwCIACUAAXIAuAAFL7gAFy+4ABkvuAAWL7gABC+4AAcvuQAMAAH0uAAEELkADAAB9EEDAKMAEQABcrgAFhC5AB4AAfS4ABkQuQAeAAH0QQMArwAlAAFyQQMAiwAlAAFyMDEBQQMAjAAAAAFdQQMAiwABAAFdQQMAIAACAAFdQQMAMwACAAFdQQMABAACAAFdQQMARAACAAFdQQMAFQACAAFdQQMAzwACAAFdQQMAIgADAAFxQQMAIAAEAAFxQQMA0AAEAAFxQQcAMAAEAEAABABQAAQAA3JBAwAUAAQAAV1BAwB4AAQAAV1BAwD4AAQAAXFBAwAQAAUAAV1BAwBxAAUAAV1BBQCPAAUAnwAFAAJxQQUA7wAFAP8ABQACcUEDAHAABgABXUEDABEABgABXUEDANgABgABXUEDAJwABgABcUEDAPwABgABcUEDAO4ABgABcUEDAI8ABgABcUEDAHAABwABXUEDABMABwABXUEDAJwABwABcUEDAPwABwABcUEDAI4ABwABcUEDAO4ABwABcUEDALoACAABXUEDAO0ACAABcUEDAG8ACAABXUEDABAACQABXUEDADMACQABXUEDACUACQABXUEFAIgACQCYAAkAAnFBAwCpAAkAAV1BAwDpAAkAAXFBAwBaAAkAAV1BAwBtAAkAAV1BAwDNAAkAAV1BAwCmAAoAAXFBAwDXAAoAAXFBAwDoAAoAAXFBBQBbAAoAawAKAAJdQQMAIwALAAFyQQMANAALAAFyQQMAEgANAAFdQQMAKgANAAFxQQMA+gANAAFxQQMAzwANAAFdQQMAjQAOAAFdQQMAjwAPAAFdQQMAywAQAAFdQQMAjwAQAAFdQQMAmAARAAFxQQMAVAASAAFyQQMAOQASAAFyQQMACgATAAFdQQMA+gAUAAFdQQMACwAUAAFdQQUAHQAUAC0AFAACXUEDAEQAFQABckEDAAkAFQABXUEDANkAFQABXUEJADsAFQBLABUAWwAVAGsAFQAEXUEDAHwAFQABXUEDAPwAFQABXUEDAB8AFQABXUEDAAAAFwABXUEDAGAAFwABXUEDAMAAFwABXUEDABEAFwABXUEDAHEAFwABXUEDAN8AFwABcUEDAD8AFwABckEFAAAAGAAQABgAAl1BAwBgABgAAV1BAwBxABgAAV1BAwDBABgAAV1BAwA+ABgAAXJBAwDfABgAAXFBAwDMABoAAV1BAwAkABsAAXFBAwDlABsAAV1BAwD2ABsAAV1BAwDXABsAAXFBAwAaABsAAXFBAwALABsAAXFBAwDMABsAAV1BAwCqABwAAV1BAwDKABwAAV1BAwCbABwAAV1BAwAbABwAAXFBAwBsABwAAV1BAwAMABwAAXFBAwDjACAAAV1BAwAmACAAAXFBAwBaACAAAV1BAwDHACYAAV1BAwDFACcAAV1BAwCPACgAAV0AQQMAhQABAAFdQQMACgABAAFxQQMAyAACAAFdQQMAGQACAAFdQQMACgACAAFdQQUAGgACACoAAgACcUEDAEsAAgABXUEDAPcABAABcUEDADcABAABckEDANAABQABXUEDAPAABQABXUEDAAAABQABcUEDAMEABQABXUEDAJIABQABXUEDALIABQABXUEDAOIABQABXUEDANAABgABXUEDAPAABgABXUEDAAAABgABcUEDAMEABgABXUEDAJIABgABXUEDALIABgABXUEDAOIABgABXUEDAFgABgABXUEDACYACAABckEDADcACQABXUEDAGkACQABXUEDAOkACQABcUEDABoACQABckEFAIsACQCbAAkAAnFBAwAvAAkAAXJBAwDUAAoAAXFBAwCmAAoAAXFBAwBXAAoAAV1BAwDpAAoAAXFBAwBqAAoAAV1BAwA1AAsAAXJBAwAnAAsAAXJBAwAaAA0AAV1BAwCCAA4AAV1BAwDMABAAAV1BAwCNABAAAV1BAwCVABEAAXJBAwBXABEAAXJBAwAZABEAAXJBAwDKABEAAV1BAwCKABEAAXFBAwDqABEAAXFBAwAKABEAAXJBBQA6ABEASgARAAJyQQMAmwARAAFxQQMA+wARAAFxQQMAPAARAAFdQQMAUwAVAAFdQQMARAAVAAFdQQMABwAVAAFdQQMAUQAXAAFdQQMAcwAXAAFdQQMAHQAXAAFdQQMAPQAXAAFdQQMAzgAXAAFdQQMA7gAXAAFdQQMADgAXAAFxQQMAcAAYAAFdQQMAUQAYAAFdQQMAHAAYAAFdQQMAPAAYAAFdQQMAzgAYAAFdQQMA7gAYAAFdQQMADgAYAAFxQQMAyAAaAAFdQQMA9AAbAAFdQQMAxQAbAAFdQQMAJQAbAAFxQQMA1QAbAAFxQQMAFgAbAAFxQQMABwAbAAFxQQMAZgAcAAFdQQMAFgAcAAFxQQUAlwAcAKcAHAACXUEDAMkAHAABXUEDAIsAHAABXUEDADsAHAABcUEDAFMAIAABXUEDAAUAJQABckEDAPYAJQABcUEDAFgAJQABckEDAGoAJQABXUEDAJoAJQABckEFAD0AJQBNACUAAl1BAwCdACUAAV1BAwDNACUAAV1BAwCPACUAAV1BAwB5ACYAAV1BAwDFACcAAV1BAwCKACgAAV0lFAcGBxUjNSInNxYzMjY1NCcmNTQ2NzUzFRYXByYjIgcGFRQWFxYXFgE0Gx82I0AtEig8LTdYeDoxIjErEiI4LBgUKjQ7GR+FKCAjCkpKIx8iLyQ6JTJKKzwHTEwDGiAdGRQcHicXGhkgAAUAIv/3AiYB3AADAAsAEwAbACMDbLsAEAAFAAgABCu7AAQABQAMAAQruwAgAAUAGAAEK7sAFAAFABwABCtBAwBuABQAAV26AAAACAAUERI5QQMAWwAAAAFdQQMALwAAAAFdQQMASgAAAAFdQQMAOQAAAAFdQQMACgABAAFdugACAAgAFBESOUEDAGUAAgABXUEDACAAAgABXUEDAC0AAwABXUEDAAQABAABXUEFAJEABAChAAQAAl1BAwAjAAUAAV1BAwA1AAUAAV1BAwBWAAUAAV1BAwAUAAUAAV1BAwBDAAUAAV1BAwCQAAUAAV1BAwCYAAYAAV1BAwArAAcAAV1BAwAcAAcAAV1BAwBLAAcAAV1BAwA6AAcAAV1BAwBZAAcAAV1BBQAaAAkAKgAJAAJdQQUAOQAJAEkACQACXUEDADUACwABXUEFABQACwAkAAsAAl1BAwBDAAsAAV1BAwCTAAwAAV1BAwChAAwAAV1BAwAVABUAAV1BAwA1ABUAAV1BAwBDABUAAV1BAwAhABUAAV1BAwBrABcAAV1BAwArABcAAV1BBQA6ABcASgAXAAJdQQMAGQAXAAFdQQMAzwAYAAFdQQMArwAYAAFdQQMADAAYAAFxQQMASwAZAAFdQQMALAAZAAFdQQMAawAZAAFdQQMAOgAZAAFdQQMAGgAZAAFdQQMANAAbAAFdQQMAFwAbAAFdQQMAVQAbAAFxQQMAQwAbAAFdQQMAIgAbAAFdQQMAbQAcAAFdQQMACgAdAAFxQQMAVQAfAAFxQQMArwAgAAFdQQMAzQAgAAFdQQMACwAgAAFxQQMACQAjAAFxuAAUELgAJdwAuAAARVi4AAEvG7kAAQAKPlm4AABFWLgAFi8buQAWAAo+WbsACgABAA4ABCu7ABIAAQAGAAQruwAaAAEAHgAEK0EDAAAACgABXbgAChC4AADQQQMACQADAAFdQQMADQAGAAFdQQMAXQAGAAFdQQMA3gAGAAFdQQMALQAGAAFdQQMAnQAGAAFdQQMA/AAGAAFdQQMAlwAMAAFdQQMAAAAOAAFdQQMAXQASAAFdQQMA3gASAAFdQQMALwASAAFdQQMAnQASAAFdQQMADQASAAFdQQMA+wASAAFdQQMAAAAaAAFdQQMAAgAeAAFduAAWELkAIgAB9DAxAUEDACoAAAABXUEDACkAAwABXQkBIwEHFCMiNTQzMgc0IyIVFDMyBRQjIjU0MzIHNCMiFRQzMgHF/t4iASKra2trayRHR0dHAVJra2trJEdHR0cB3P4bAeWOjo6Ojm5ublWOjo6Obm5uAAMAE//3Aa4B7QAcACcAMAjfuAAQL7gADC+4ABYvuAAAL7gABC+4ABovuAAmL7gADi+4AAcvuAACL0EDADgAAAABcUEDAKcAAAABXUEDACMAAAABXUEDADUAAQABcUEDACAAAQABXUEDAAQAAgABckEDACIAAgABXbgABBC5AAUAB/RBAwDTAAUAAV1BAwAgAAUAAV1BAwBXAAcAAV1BAwBHAAcAAXFBAwBFAAcAAV1BAwAjAAcAAV1BAwAgAAgAAV1BAwB4AAwAAV1BBQB5AA0AiQANAAJdQQMAeQAOAAFdQQMA1gAOAAFdQQMARAAOAAFdQQMA0wAQAAFdQQMAaQASAAFdQQMAWAASAAFdQQMAdQAUAAFdQQMAVgAUAAFxQQMAlAAUAAFdQQUAVAAUAGQAFAACXUEDAFYAFQABXUEDAGIAFQABXUEDAEMAFgABcUEDAEMAFwABcbgAJhC4ABjQQQMAqAAZAAFduAAHELgAGtBBAwAkABoAAV1BAwB5ABsAAV1BAwA4ABsAAXFBAwAgABsAAV24AAAQuQAcAAf0QQMAOQAcAAFxQQMA6gAcAAFxQQMASAAcAAFxQQMAIQAcAAFduAAWELkAHQAH9EEDAEQAHQABcUEDAEoAIAABcbgAEBC5ACQAB/RBAwDVACQAAV1BAwBAACUAAXJBAwBGACcAAXG4ABoQuQAoAAf0uAACELkAKAAH9EEDAJgAKAABXUEDAOsAKAABcUEDAAwAKAABckEDAHkAKAABXUEDAEgAKAABcUEDANMAKAABXUEDANgAKQABXbgAGBC5ACoAB/S4AA4QuQAqAAf0QQMAqQAqAAFdQQMAOgAqAAFdQQMAWAAqAAFdQQMA0gAqAAFdQQMAmAArAAFdQQMA1QArAAFduAAMELkALAAH9EEDAJcALQABXUEDAFYALQABcUEDAKYALQABXUEDAOwAMAABcUEDACAAMAABXQC4ABMvuAAmL7gAAEVYuAAJLxu5AAkACj5ZuAAARVi4AAUvG7kABQAKPlm4AABFWLgABC8buQAEAAo+WUEDACsAAgABXUEHADsABwBLAAcAWwAHAANxQQMALAAHAAFdQQMAWQAHAAFdQQMASAAHAAFdQQMASAAOAAFdQQMAVQAVAAFxQQMAeQAaAAFdQQMAmQAaAAFdQQMABAAaAAFyQQMARwAgAAFxuAATELkAIQAC9EEDAAgAKAABckEDAEgAKAABXUEDANcAKAABXbgAJhC5ACoAAvRBAwCsACoAAV1BAwCeACoAAV1BAwBaACoAAV1BAwBJACoAAXFBAwDaACsAAV1BAwCZACsAAV24AAkQuQAvAAL0QQMA5wAwAAFxMDEBQQMAMwABAAFyQQMAZAABAAFxQQMAdQABAAFxQQMAwwACAAFxQQMAOAACAAFdQQMAOQAFAAFdQQMASQAFAAFxQQUAKQAFADkABQACckEDAE8ABQABckEDAE8ABgABckEDADQABwABXUEDAJcABwABcUEDAHgABwABcUEDAEsABwABckEDADYACAABXUEDAKgACgABcUEDAKkACwABcUEDALoADQABcUEFAFUADgBlAA4AAnJBAwB2AA4AAXJBAwB5AA4AAXFBAwAZAA4AAXJBAwC6AA4AAXFBAwAqAA4AAXJBAwA8AA4AAXJBAwBSAA8AAXJBAwDKAA8AAXFBAwA7AA8AAXJBAwAMAA8AAXJBAwAKABEAAXJBAwAFABIAAXJBAwAZABIAAXFBAwBJABIAAXFBAwA6ABIAAV1BAwBGABMAAXFBAwBAABQAAXFBAwAUABQAAXFBAwB1ABQAAXFBAwClABQAAXFBAwA2ABQAAV1BAwCGABQAAV1BAwBmABQAAXFBAwCGABQAAXFBAwA0ABUAAV1BAwAyABcAAXJBBQC1ABcAxQAXAAJxQQMAxQAYAAFxQQMAtgAYAAFxQQMApgAaAAFxQQUAmQAcAKkAHAACcUEDAGkAHQABcUEDAAUAHgABckEDAEUAHwABcUEDAAYAHwABckEFAGgAHwB4AB8AAnFBAwBBACAAAXFBAwB6ACAAAXFBAwA6ACAAAXJBAwA1ACUAAXJBBQC2ACYAxgAmAAJxQQMAWAAnAAFxQQMACgAnAAFyQQMAoQAoAAFxQQMAcgAoAAFyQQMANQAoAAFdQQMAJgAoAAFyQQMAWAAoAAFyQQMAOQAoAAFyQQUAugAoAMoAKAACXUEDAAoAKAABcUEDAHoAKAABcUEDAJoAKAABcUEDALoAKAABcUEDAI4AKAABcUEDAN8AKAABXUEDAHAAKQABckEDAKMAKQABcUEDANkAKQABXUEDAHAAKgABckEDADUAKgABXUEDAN8AKgABXUEFAHYALACGACwAAnFBAwCUAC0AAXFBAwCFAC0AAXFBAwBmAC0AAXFBAwCnAC0AAXFBAwCDAC4AAXFBAwBkAC4AAXFBAwB1AC4AAXFBAwAKADAAAXFBAwCKADAAAXFBAwCcADAAAXEAQQUAiQAHAJkABwACcUEDACoABwABckEFAGsABwB7AAcAAnFBAwDMAAcAAXFBAwBMAAcAAXJBAwA9AAcAAV1BAwA+AAcAAXJBAwB2AA4AAXFBAwC3AA4AAXFBAwDHAA8AAXFBAwCFABUAAXFBAwAWABUAAXFBAwBmABUAAXFBAwB1ABoAAXFBAwAlABoAAXJBAwBGABoAAXFBAwCmABoAAXFBAwDHABoAAXFBAwA5ABoAAV1BAwAIAB4AAXJBAwBAACAAAXFBAwDDACYAAXFBAwBDACYAAXJBAwAkACYAAXFBAwCUACYAAXFBAwBVACYAAXFBAwClACYAAXFBAwA1ACYAAXJBAwADACcAAXJBAwBWACcAAXFBBQBVACgAZQAoAAJyQQMABgAoAAFxQQMAdwAoAAFyQQMAOQAoAAFyQQMAOgAoAAFdQQMAcwAqAAFyQQMACAAqAAFxQQMAuQAqAAFxQQMAKgAqAAFyQQMA2wAqAAFdQQMAjQAqAAFxQQMAPgAqAAFdQQMAigArAAFxQQMAlwAtAAFxAQYHFhcjJicGIyImNTQ3JjU0NjMyFhUUBxYXNjcnNCcmIyIGFRQXNhMmJwYVFBYzMgGdGCsmLjITJUpXPFRlK0A2LDh6OlwiE3QQEyIjKipoKVtGU0IxSwEAfzEmKhIjPk86XzI5LTBGNytQN0BfLm2HHRQXMiInNzL+/ltQLEcxPQAAAQAlAVIAUwHzAAMAS7gAAi+4AAMvuAACELkAAwAH9DAxAEEDAIUAAAABXUEDAOUAAAABXUEDACYAAAABXUEDAIUAAQABXUEDAOUAAQABXUEDACYAAQABXRMjJzNKGwouAVKhAAEAFP/GAKoCFAAJAL27AAgABwADAAQrQSEABgAIABYACAAmAAgANgAIAEYACABWAAgAZgAIAHYACACGAAgAlgAIAKYACAC2AAgAxgAIANYACADmAAgA9gAIABBdQSEABgAIABYACAAmAAgANgAIAEYACABWAAgAZgAIAHYACACGAAgAlgAIAKYACAC2AAgAxgAIANYACADmAAgA9gAIABBxQQcABgAIABYACAAmAAgAA3JBBQA1AAgARQAIAAJyALgABS+4AAAvMDEXIyY1NDczBhUUqSZvbihwOnmrooiAqp8AAAEAFP/GAKkCFAAJAL27AAAABwAFAAQrQQUAOgAFAEoABQACckEhAAkABQAZAAUAKQAFADkABQBJAAUAWQAFAGkABQB5AAUAiQAFAJkABQCpAAUAuQAFAMkABQDZAAUA6QAFAPkABQAQXUEhAAkABQAZAAUAKQAFADkABQBJAAUAWQAFAGkABQB5AAUAiQAFAJkABQCpAAUAuQAFAMkABQDZAAUA6QAFAPkABQAQcUEHAAkABQAZAAUAKQAFAANyALgAAi+4AAcvMDE3FAcjNjU0JzMWqW8mb28mb+2mgYucnol9AAEAEgECAQsB7gARBiS4AAkvuAAIL7gAES+4AAAvALgADC+4AA4vuAAFL7gAAy+4AABFWLgACS8buQAJABA+WbgAAEVYuAARLxu5ABEAED5ZuwAEAAIADQAEK7gAERC5AAAAAvS4AAkQuQAIAAL0MDEBQQMApAABAAFdQQMABwABAAFyQQUAdQACAIUAAgACcUEDAKUAAgABcUEDAKYAAgABXUEDAOYAAgABcUEDAJcAAgABXUEHALcAAgDHAAIA1wACAANxQQcACgACABoAAgAqAAIAA3FBAwBaAAIAAXFBAwBLAAIAAXFBAwCZAAMAAV1BAwBJAAMAAXFBAwBJAAMAAXJBAwAaAAMAAXFBAwCbAAMAAXFBAwAsAAMAAXFBBQBcAAMAbAADAAJxQQMADQADAAFxQQMAPQADAAFyQQMArQAEAAFdQQMAAQAFAAFxQQMAYgAFAAFxQQMAIwAFAAFxQQMAUwAFAAFxQQMAQwAFAAFyQQMAFQAFAAFxQQMARgAFAAFxQQMAlgAFAAFxQQMAmQAFAAFdQQMAegAFAAFxQQMABQAGAAFxQQMAJQAGAAFxQQUARQAGAFUABgACcUEDABYABgABcUEFAMgABgDYAAYAAnFBAwCZAAYAAV1BAwCZAAYAAXFBAwC5AAYAAXFBAwDpAAYAAXFBAwCKAAYAAXFBAwCrAAYAAV1BAwB7AAYAAXFBAwCrAAYAAXFBAwAIAAcAAXJBAwC6AAcAAV1BAwCrAAcAAV1BAwA2AAoAAXJBAwC8AAoAAV1BAwAUAAsAAXFBAwAFAAsAAXFBBQBFAAsAVQALAAJxQQMAlwALAAFxQQMAmAALAAFdQQkAuAALAMgACwDYAAsA6AALAARxQQMAuQALAAFdQQMAKQALAAFxQQMAigALAAFxQQMAqgALAAFxQQMAewALAAFxQQMAQAAMAAFxQQMAMAAMAAFyQQMAUQAMAAFxQQMAEwAMAAFxQQMAQwAMAAFyQQMABAAMAAFxQQMAZAAMAAFxQQMAJQAMAAFxQQMAlQAMAAFxQQMAuwAMAAFdQQMACwAOAAFxQQMAawAOAAFxQQMAmwAOAAFxQQMAHAAOAAFxQQMAXgAOAAFxQQMATgAOAAFyQQMALwAOAAFxQQMATwAOAAFxQQMAPwAOAAFyQQUAdQAPAIUADwACcUEDAKUADwABcUEDANYADwABcUEFALcADwDHAA8AAnFBAwDnAA8AAXFBBQAKAA8AGgAPAAJxQQMAWgAPAAFxQQMASwAPAAFxAEEDAKEAAgABXUEDAJMAAgABXUEDABMAAgABcUEDAJMAAgABcUEDAGoAAgABcUEDAKIAAwABXUEDABMAAwABcUEDAJQAAwABXUEDAJUAAwABcUEDAPkAAwABcUEFABkAAwApAAMAAnJBAwB9AAMAAXFBAwCgAAQAAV1BBQCBAAQAkQAEAAJdQQMA8QAEAAFdQQMAswAEAAFdQQMACQAEAAFyQQMAHAAEAAFyQQMATwAEAAFyQQMAogAFAAFdQQMAkwAFAAFdQQMAkwAFAAFxQQMAFAAFAAFxQQUA6QAFAPkABQACcUEFABkABQApAAUAAnJBAwB8AAUAAXFBAwCgAAYAAV1BAwCTAAYAAXFBAwCVAAYAAV1BAwAIAAYAAXFBAwB5AAYAAXFBAwBqAAYAAXFBAwC2AAoAAV1BAwBlAAsAAXFBAwD3AAsAAV1BAwC5AAsAAV1BAwAZAAsAAXFBAwALAAsAAXFBAwCbAAsAAXFBAwCOAAsAAV1BAwAuAAsAAXFBAwA+AAsAAXJBAwBPAAsAAXJBAwDyAAwAAV1BAwBlAAwAAXFBAwAWAAwAAXFBAwArAAwAAXFBAwCMAAwAAV1BAwAMAAwAAXFBAwBMAAwAAXJBAwDyAA0AAV1BAwBCAA0AAXFBAwBlAA0AAXFBAwBMAA0AAXJBAwCdAA0AAV1BAwC9AA0AAV1BAwCPAA0AAV1BAwDzAA4AAV1BAwAXAA4AAXFBAwCMAA4AAV1BAwBMAA4AAXJBAwANAA4AAXFBAwAtAA4AAXFBAwBkAA8AAXFBAwCZAA8AAXFBAwCOAA8AAV1BAwAOAA8AAXFBAwBOAA8AAXIBJxcHJwcnNwc1Fyc3FzcXBzcBC2dAITU0IUBnZ0AmMC8mQGcBZAlWFWNjFVYJJgdVFlxcFlUHAAAAAAEAJgAAAXUBZQALAEy7AAIABQADAAQruAADELgAB9C4AAIQuAAJ0AC4AAgvuAAARVi4AAIvG7kAAgAKPlm7AAsAAQAAAAQruAAAELgABNC4AAsQuAAG0DAxJSMVIzUjNTM1MxUzAXWWI5aWI5alpaUhn58AAQAe/5MAewBEAA8BILsAAAAHAAoABCtBBQAvAAAAPwAAAAJxQQMACQAAAAFxQQMABwAFAAFxQQMABgAHAAFxQSEACQAKABkACgApAAoAOQAKAEkACgBZAAoAaQAKAHkACgCJAAoAmQAKAKkACgC5AAoAyQAKANkACgDpAAoA+QAKABBdQR0AKQAKADkACgBJAAoAWQAKAGkACgB5AAoAiQAKAJkACgCpAAoAuQAKAMkACgDZAAoA6QAKAPkACgAOcUEDAAkACgABckEDABMACgABcUEDAAAACgABcQC4AAQvuAANL7gAAEVYuAAHLxu5AAcACj5ZQQcAxQAAANUAAADlAAAAA3FBAwD0AAAAAXFBAwC9AA0AAXFBAwCsAA0AAXFBAwCbAA0AAXEwMTcGBwYHJzY3IiY1NDYzMhZ7Ah8VGQ40BhAXFg8QFRs2KR0MDyM0Fg8PFxgAAAAAAQAUAKUAwwDGAAMADQC7AAMAAQAAAAQrMDE3IzUzw6+vpSEAAQAu//oAcwA/AAsBP7sAAAAHAAYABCtBBQDmAAAA9gAAAAJxQQsABgAAABYAAAAmAAAANgAAAEYAAAAFckEhAAkABgAZAAYAKQAGADkABgBJAAYAWQAGAGkABgB5AAYAiQAGAJkABgCpAAYAuQAGAMkABgDZAAYA6QAGAPkABgAQXUELAAkABgAZAAYAKQAGADkABgBJAAYABXFBAwA6AAYAAXJBAwBJAAYAAXJBBQDpAAYA+QAGAAJxQQcACQAGABkABgApAAYAA3IAuAAARVi4AAMvG7kAAwAKPllBBQDJAAMA2QADAAJxuAAJ3EEDAOYACQABcUEbAAcACQAXAAkAJwAJADcACQBHAAkAVwAJAGcACQB3AAkAhwAJAJcACQCnAAkAtwAJAMcACQANXUEFANYACQDmAAkAAl1BBQDEAAkA1AAJAAJxMDE3FAYjIiY1NDYzMhZzFQ4OFBQODhUcDhQUDg4VFQAAAAH/7v/jARYB7QADATlBAwAnAAAAAXFBAwApAAIAAXFBAwC5AAMAAV1BAwCIAAMAAV0AuAADL7gAAC+4AAIvuAABLzAxAUEDAPYAAAABXUEDAGYAAAABcUEDAKYAAAABcUEDAAcAAAABXUEDAEcAAAABXUEDAFcAAAABcUEFAMcAAADXAAAAAnFBAwAYAAAAAV1BAwAYAAAAAXJBAwDXAAEAAXFBAwD3AAEAAXFBAwAHAAIAAXJBDwA4AAIASAACAFgAAgBoAAIAeAACAIgAAgCYAAIAB3FBAwCpAAIAAXFBBQDJAAIA2QACAAJxQQMAugACAAFxQQMAOAADAAFxQQMAWAADAAFxQQMA+QADAAFdQQMAGQADAAFxQQMAeQADAAFxQQMAmQADAAFxQQcAuQADAMkAAwDZAAMAA3EAQQMA2AACAAFxCQEjEwEW/v4m/wHt/fYCCgAAAgAf//UBSgHfAA8AHwZLuAAgL7gAEC+5AAAAB/S4ABAQuAAC0LgAAi9BBQBaAAIAagACAAJdQQUAewACAIsAAgACXUEFADkAAgBJAAIAAl1BAwC5AAIAAV1BAwABAAMAAXJBAwD0AAMAAXFBAwA5AAMAAXFBAwDiAAMAAXFBAwBBAAMAAXJBBQAQAAMAIAADAAJyQQMA+gAFAAFxQQMACgAFAAFyQQMA7AAFAAFxQQMAGwAFAAFyQQMAKQAFAAFyQQMANgAFAAFxuAAgELgACNC4AAgvuQAYAAf0uAAG0LgABi9BBQBVAAYAZQAGAAJdQQMAdAAGAAFdQQMAgwAGAAFduAAYELgACtC4AAovQQMAgwAKAAFdQQMAZQAKAAFdQQMAUwAKAAFdQQMAcgAKAAFdQQUA6wALAPsACwACcUEDAEsACwABckEFAAoACwAaAAsAAnJBAwAoAAsAAXJBAwDyAA0AAXFBAwDkAA0AAXFBAwBBAA0AAXJBBwAAAA0AEAANACAADQADcrgAEBC4AA7QuAAOL0EFADkADgBJAA4AAl1BBQBaAA4AagAOAAJdQQUAewAOAIsADgACXUEDAEoADgABcUEDADkADgABcUEDALgADgABXUEDAOcADgABcUEDAPwAEQABcUEDADwAEQABckEDAEgAEQABckEFABkAEgApABIAAnJBAwAPABIAAXJBAwBKABIAAXFBAwA5ABIAAXFBAwA4ABIAAXJBAwBKABMAAXFBAwDNABMAAXFBAwDZABMAAXFBAwDlABMAAXFBAwBDABUAAXFBAwDRABUAAXFBAwDAABUAAXFBAwA2ABYAAXFBCQAAABYAEAAWACAAFgAwABYABHJBAwAWABcAAXJBBwAgABcAMAAXAEAAFwADckEDAPAAFwABcUEDAPEAGQABcUEFAMUAGgDVABoAAnFBBQAwABoAQAAaAAJyQQMAEAAaAAFyQQMARgAbAAFxQQMASAAdAAFxQQMAGgAeAAFyQQMAPAAeAAFyQQMASgAeAAFyQQUAyAAeANgAHgACcUEDAPwAHwABcbgAABC4ACHcALgAAEVYuAAMLxu5AAwAEj5ZuAAARVi4AAQvG7kABAAKPlm7AAwAAQAUAAQrQQMARQABAAFxQQMANgABAAFxQQMARQABAAFyQQMAJQABAAFyQQMAKwACAAFyQQMA7wADAAFxQQMAJwAGAAFyQQMAKAAMAAFyQQMAQgAMAAFyQQMAAAAMAAFdQQMA5QANAAFxQQMAJwANAAFyQQMARAANAAFyQQMAEwANAAFyQQMAKwAPAAFyQQUAPgASAE4AEgACckEDAAkAEgABckEFAFgAFABoABQAAl1BBQAZABQAKQAUAAJxQQMAKgAUAAFyQQMAOgAUAAFxQQMA2QAUAAFxQQUAeQAUAIkAFAACXUEDAEUAFAABckEDAAAAFAABXUEDADwAFgABckEDAC8AFgABckEDAE0AFgABckEDAAoAFgABckEDABkAFgABckEDAE8AFwABckEFAB8AFwAvABcAAnJBAwA+ABcAAXJBAwAjABkAAXJBAwDyABkAAXFBAwABABkAAXJBAwDRABoAAXFBBQA1ABoARQAaAAJxQQMAwwAaAAFxQQMAEQAaAAFyQQUAMAAaAEAAGgACckEDAMYAGwABcbgABBC5ABwAAfRBBQAWABwAJgAcAAJxQQMARgAcAAFyQQMAZwAcAAFdQQMA1gAcAAFxQQUAdgAcAIYAHAACXUEDAFYAHAABXUEDAMMAHgABcUEDANUAHgABcUEDAEYAHgABckEFADYAHgBGAB4AAnFBAwAjAB4AAXJBAwAQAB4AAXJBAwAwAB4AAXJBAwDyAB8AAXFBAwABAB8AAXIwMQFBAwDIAAIAAV1BAwDaAAIAAV1BAwDIAA4AAV1BAwDZAA4AAV1BAwC4ABEAAXFBAwCpABEAAXFBAwCmABYAAXFBAwATABcAAXJBAwAkABcAAXJBAwC2ABcAAXFBAwAGABcAAXJBBQA2ABcARgAXAAJyQQUANQAaAEUAGgACckEDAKYAGgABcUEDALcAGgABcUEDALkAHgABcUEDAKkAHwABcQBBAwAJABcAAXJBAwAaABcAAXJBBQA6ABcASgAXAAJyQQMALAAXAAFyQQMARgAaAAFyJRQHBiMiJyY1NDc2MzIXFgc0JyYjIgcGFRQXFjMyNzYBSiApTE0pICMpSkopIigZHjY3HhkYHjg3HhjjU0RXV0NUZUZRUUZkVzxGRjtYSDpLSzoAAAABAEsAAAEfAd4ACwF9uwAKAAcAAwAEK0EFANcABQDnAAUAAnFBAwA3AAUAAXJBAwBAAAUAAXJBAwBKAAYAAXJBBQDZAAYA6QAGAAJxQQMAOQAGAAFyALgAAEVYuAAHLxu5AAcAEj5ZuAAARVi4AAAvG7kAAAAKPlm5AAIAAfS6AAQAAAAHERI5QQMA+gAEAAFxQQMAqwAEAAFxQQUADAAEABwABAACckEDAE4ABAABckEDAC4ABAABckEDADwABAABckEDAOsABAABcUEDAMsABAABcUEDALoABAABcUEDANkABAABcUEFAKkABQC5AAUAAnFBBQALAAUAGwAFAAJyQQMALAAFAAFyQQMAOwAFAAFyQQMAygAFAAFxQQUA6QAFAPkABQACcUEDANgABQABcUEJAMUABgDVAAYA5QAGAPUABgAEcUEFAAUABgAVAAYAAnJBAwBGAAYAAXJBAwC2AAYAAXFBAwClAAYAAXFBAwA1AAYAAXJBAwAkAAYAAXK4AArQuAAL0DAxISM1MxEHJzcyFREzAR++S0sWcxZLJAF9QRllJv5sAAAAAAEAGgAAAU8B3gAaBN27ABYABwAJAAQruAAWELgAAdC4AAEvQQMASAACAAFyQQMA9gACAAFxQQMAHgAEAAFyQQMA/gAEAAFxQQMAIwAEAAFdQQMAHwAGAAFyQQMATwAGAAFyQQMA2QAHAAFxQQMAugAHAAFxQQMAXQAHAAFxQQMA/gAHAAFxQQMAPwAHAAFyQQMATQAHAAFyQQUADAAHABwABwACckEDAIoABwABcUEDABkABwABcUEDACIABwABXUEDAOwACAABcUEDAN4ACAABcUEDAAoACAABckEDACQACAABXUEDABkACQABcUEDAOoACQABcUEDAKkACQABcUEDAGgACQABcUEDACUACQABXUEDANkACwABXUEDAPwACwABXUEDAA0ACwABckEDAP8ACwABcUEDAC0ACwABcUEDAMoACwABcUEFAAkACwAZAAsAAnFBAwDoAAsAAV1BAwBAAAwAAXJBAwAiAA0AAXJBAwAkAA0AAXFBAwA1AA0AAXFBAwD2AA0AAV1BAwAGAA0AAXFBAwBnAA0AAXFBAwB2AA0AAXFBAwAVAA0AAXFBAwBEAA0AAXFBAwBTAA0AAXFBAwARAA0AAXJBBQAwAA0AQAANAAJyQQUA5AAOAPQADgACcUEDALQADgABcUEDAMUADgABcUEDACYADgABckEDAEcADgABckEDANYADgABcUEDAKUADgABcUEFAIQADgCUAA4AAnFBAwAzAA4AAXJBAwADAA4AAXJBAwDZAA8AAXFBBQCKAA8AmgAPAAJxQQMA+gAPAAFxQQMADAAPAAFyQQMAOwAPAAFyQQMAygAPAAFxQQUAGgAPACoADwACckEDALgADwABcUEDAEgADwABckEDAOoAEAABcUEDAKkAEAABcUEDAN4AEQABcUEDAPsAEQABcUEDAAsAEQABckEFAGkAEQB5ABEAAnFBAwCqABIAAXFBAwAuABIAAXJBAwDKABIAAXFBAwDJABIAAV1BAwAlABQAAXJBAwAMABQAAXJBAwD1ABQAAXFBAwAkABQAAV1BAwATABQAAV1BAwALABUAAXJBAwDEABcAAXFBAwBzABcAAXFBAwCSABcAAXFBAwDSABgAAXFBAwBlABgAAXFBAwAkABgAAXJBAwBAABgAAXJBBQAAABgAEAAYAAJyQQMAJAAZAAFyQQMAQAAZAAFyQQUAAAAZABAAGQACckEDAHEAGgABcUEDAMMAGgABcUEDAGQAGgABcUEDAPYAGgABXUEDALcAGgABXUEDAA0AGgABXUEDADYAGgABcUEDADUAGgABckEDACQAGgABcUEDAJIAGgABcUEFAKAAGgCwABoAAnFBBwDQABoA4AAaAPAAGgADcUEHAAAAGgAQABoAIAAaAANyuAAWELgAHNwAuAAARVi4ABMvG7kAEwASPlm4AABFWLgAAS8buQABAAo+WbkAAAAB9EEDAPgABAABcUEDADQABAABckEDADUABwABckEDAPMABwABcUEDABgACQABcbgAExC5AAwAAfRBAwCIAA4AAXFBAwALAA8AAV1BAwC4AA8AAXFBAwCHAA8AAXFBAwAmABUAAV1BAwB4ABcAAXFBAwArABgAAXJBAwDXABgAAXFBAwAqABkAAXJBAwBHABkAAXJBBQC3ABoAxwAaAAJxMDElByE2Nz4BNzY1NCYjIgcnNjc2MzIWFRQHBgcBTwj+0wQKK2hAIDIoWgwkBigkOThJeFckJycZICxkTSsnJypaCjofHEU0THNWKQAAAAABACL/8wFIAd4AJQxxuAAmL7gACy9BAwAvAAsAAXJBBQAFAAsAFQALAAJdQQMAQgALAAFduQAAAAf0QQMAKAAAAAFyQQMAFQAAAAFdQQMAAwAAAAFdQQMAhgABAAFdQQMAFgACAAFdQQMA3AACAAFxQQMAWAACAAFyQQUAIwACADMAAgACcUEDAEIAAgABcUEDALsABAABXUEDANsABAABXUEDAI8ABAABcUEDAMsABAABcUEDAEsABAABcUEFACoABAA6AAQAAnFBAwDKAAQAAV1BAwD6AAUAAV1BAwDaAAUAAXFBAwDZAAYAAV1BAwAYAAYAAXFBAwDfAAkAAXFBAwAsAAkAAXJBAwAKAAkAAXFBAwDaAAoAAXFBAwAsAA0AAXJBAwDbAA0AAXFBAwCbAA0AAXFBAwDUABAAAV1BAwAJABAAAV1BBQC6ABAAygAQAAJdQQMAKwAQAAFxQQMAOQAQAAFxQQMAhwAQAAFxQQMARAAQAAFdQQMAFAAQAAFdQQMAlQARAAFdQQMA1gARAAFdQQMAiAARAAFdQQMASQARAAFyQQMAyQARAAFxQQMASgARAAFxQQMAewARAAFdQQMArAARAAFxQQUAKwARADsAEQACcUEDAJoAEQABcUEDAPoAEQABXUEDALkAEQABXUEDAIgAEQABcUEDAAgAEQABXUEDACYAEQABXUEDABQAEQABXUEDAEQAEQABXUEDACoAEgABckEDAMsAEgABcUEDAA0AEgABckEDAEoAEgABcUEDAOkAEgABXUEDABgAEgABXUEDAAkAEwABckEDAIsAEwABcUEDAO4AEwABXUEDAL0AEwABcUEDAMoAEwABXUEFAJkAEwCpABMAAl1BAwAYABMAAV1BAwALABQAAXJBAwAYABQAAV24ACYQuAAV0LgAFS9BAwAVABUAAV1BAwDPABUAAXFBAwDUABUAAV1BAwCkABUAAV1BAwCJABYAAXFBAwC5ABYAAXFBAwAWABYAAXFBAwCgABYAAV1BAwDUABgAAXFBAwDGABgAAXFBAwAmABgAAXJBAwBVABgAAXJBAwBEABgAAXJBAwByABgAAXFBAwAVABkAAXJBAwC2ABkAAXFBAwAnABkAAXJBAwCWABkAAXFBBQA1ABkARQAZAAJyQQMAJAAZAAFdQQUAMgAZAEIAGQACXUEDAFgAGgABXUEDAKkAGgABXUEDAMkAGgABcUEFADoAGgBKABoAAnJBBQAKABoAGgAaAAJyQQMAmgAaAAFxQQMAugAaAAFxQQMAiQAaAAFxQQMAiAAaAAFdQQUAJgAaADYAGgACXUEDAEUAGgABXUEDAFkAGwABckEDACoAGwABckEDAA4AGwABckEDAOsAGwABcUEDANoAGwABcUEDABkAGwABcUEDABYAGwABXUEDAFYAHAABXUEDAHkAHAABXUEDAAkAHAABcUEDAIkAHAABcUEDABcAHAABXUEFAGUAHAB1ABwAAnFBAwDFABwAAXFBAwB1AB4AAV1BBQAmAB4ANgAeAAJdQQMAFgAeAAFxQQMAEwAeAAFdQQMAQwAeAAFduQAgAAX0QQMAxwAgAAFxQQMApwAgAAFdQQMAFQAgAAFdQQMA1AAgAAFdQQMAXwAhAAFdQQMAMAAiAAFyQQMAlQAiAAFdQQMAWAAiAAFdQQMAawAiAAFdQQUAJwAiADcAIgACXUEDAPUAIgABXUEDANAAIgABXUEDAAAAIgABckEDAAgAIwABckEDABYAIwABXUEDANEAIwABcUEDACMAJAABcUEDADUAJAABcUEDAMcAJAABcUEDAGgAJAABXUEDANoAJAABcUEDAOgAJAABXUEDABYAJAABcUEDAPQAJAABXUEDAEAAJAABcUEDAAAAJAABcbgAABC4ACfcQQUA7wAnAP8AJwACcUEHAA8AJwAfACcALwAnAANyALgAES+4AABFWLgAHS8buQAdABI+WbgAAEVYuAADLxu5AAMACj5ZuwAiAAEADgAEK0EDAFsAAQABcUEDAH4AAQABXUEDABoAAQABXUEDANcAAQABcUEDAC4ABAABckEFAAoABQAaAAUAAnJBAwCbAAUAAXFBAwDZAAUAAXFBAwAHAAUAAV1BBQBfAAYAbwAGAAJdQQMABwAGAAFduAADELkACAAB9EEDAJQACgABcUEDAMYACgABcUEDABYACgABcUEDAPQACgABXUEDACAACgABckEDABYADQABckEDAIsADgABXUEFAMwADgDcAA4AAl1BAwDNAA4AAXFBAwD9AA4AAV1BAwBcAA4AAXJBAwALAA4AAXFBAwAaAA4AAXFBAwBiAA4AAV1BBQB2ABEAhgARAAJxQQMARwARAAFxQQMAuQARAAFdQQMAiQARAAFdQQMA+QARAAFdQQMAOwARAAFxQQMATAARAAFdQQMAPQARAAFdQQMAfAARAAFdQQMAWwARAAFyQQMAqgARAAFxQQMAKQARAAFxQQMACQARAAFdQQMAmQARAAFxQQMAFgARAAFxQQMABQARAAFyQQMANQARAAFyuAARELkAEAAB9EEDACoAEAABcUEDAFoAEAABckEDAAsAEAABXUEDAIsAEAABXUEDAMwAEAABXUEDAA0AEAABcUEDAPwAEAABXUEDALsAEAABXUEFABsAEAArABAAAnJBAwBKABAAAV1BAwA5ABAAAXFBAwCHABAAAXFBAwAkABIAAXJBAwDmABIAAV1BAwAWABIAAV1BAwAUABIAAXFBAwBDABIAAXJBAwAlACIAAV1BAwBGACIAAXFBAwDXACIAAV1BAwDLACIAAXFBAwAJACIAAXJBAwBXACIAAV1BAwCWACIAAV1BBQA0ACIARAAiAAJdQQMAYAAiAAFduAAiELkAEwAB9EEDADQAEwABXUEDABUAEwABXUEDAJYAEwABcUEDACYAEwABXUEDAJYAEwABXUEDAEUAEwABXUEDAFIAEwABXUEDAGAAEwABXUEDAEQAFAABckEDAEYAFAABXUEDABcAFAABXUEDAKcAFAABcUEDACYAFAABckEDADQAFAABXUEDAFIAFAABXbgAHRC5ABcAAfRBAwCoABcAAXFBAwBKABkAAV1BAwDPABkAAXFBAwA4ABkAAV1BAwAnABkAAV1BAwCYABoAAXFBAwDKABoAAXFBAwBqABoAAV1BAwArABoAAV1BAwBeABoAAV1BAwA/ABoAAV1BAwBNABoAAV1BAwDbABoAAV1BAwBaABoAAXJBAwC5ABoAAV1BAwAIABoAAV1BAwDIABoAAV1BAwAZABsAAV1BAwBXABsAAXJBAwCFAB4AAV1BAwCkAB4AAV1BAwBEAB8AAV1BAwClAB8AAXFBAwAVAB8AAV1BAwDGAB8AAXFBAwAWAB8AAXFBAwA1AB8AAV1BAwDUAB8AAXFBAwAkAB8AAV1BAwCSAB8AAXFBAwCsACEAAXFBAwDbACEAAXFBBQBTACEAYwAhAAJdQQMAFQAjAAFdQQMAZAAkAAFdQQMA5AAkAAFdQQMAMwAlAAFyQQUABQAlABUAJQACcUEDABYAJQABckEDAPQAJQABXUEDAOMAJQABXUEDAGIAJQABXTAxAUEDAOUAAgABcUEDAP8ABAABcUEDAEIABwABckEDAKMABwABcUEDAKkACQABcUEDALoACQABcUEDADcACgABckEDAAsADQABckEDAGcAEAABcUEDAPkAEQABcUEDADsAEQABckEDAPAAGAABcUEDAMUAGAABcUEDAPMAGQABcUEDABUAGQABcUEDABYAGgABcUEDABoAGwABckEDAPQAHAABcUEDAKQAIgABcUEDAAkAIgABckEDAGgAIwABXUEDAAoAIwABckEDAMYAJAABcUEDABcAJAABcgBBAwCbAAEAAV1BAwDLAAEAAXFBAwA7AAEAAXJBAwDsAAEAAXFBAwAcAAEAAXJBAwANAAEAAXJBAwD6AAQAAXFBAwDrAAQAAXFBAwA0AAcAAXJBAwAwAAoAAXJBAwBBAAoAAXJBAwCzAAoAAXFBAwDzAAoAAXFBAwCkAAoAAXFBAwAVAAoAAXJBAwBsABAAAXFBAwD1ABEAAXFBAwA1ABQAAXJBAwAWABYAAXFBAwC5ABkAAXFBAwC5ABoAAXFBAwAGACEAAXJBAwBlACIAAV1BAwCnACIAAXFBAwBkACMAAV1BAwAVACQAAXJBAwBmACQAAXFBAwASACUAAXJBAwDzACUAAXFBAwBUACUAAXElFAYHBic3FjMyNjU0JiMiByc2NzY1NCMiByc+ATMyFhUUBzMyFgFIaFJCKhElPDpSMCUrGBMmJjlESyUcEE4xKjxSBjVAoUxeAgInHxxONCc0FyAdHjAbMUsPLDQtJy4+RwAAAAACACAAAAFZAegABQAQAt24ABEvuAAAL0EDANkAAgABcUEDAHcAAgABXUEDAIUAAwABcUEDAMEAAwABcUEDADAAAwABckEDAIIABAABcbgAERC4AA3QuAANL7kABQAH9LgAABC5AAYAB/S4AAnQuAAAELgAC9BBAwCFAA4AAXFBAwCJAA8AAXFBAwDqAA8AAXFBAwALAA8AAXJBBQAcAA8ALAAPAAJyQQMATgAPAAFyQQMA2wAPAAFxQQMAOwAPAAFyQQMA+QAPAAFxQQMASQAPAAFxQQMAdgAPAAFduAAGELgAEtxBAwA/ABIAAV1BAwBfABIAAV0AuAAARVi4ABAvG7kAEAASPlm4AABFWLgACi8buQAKAAo+WbsABwABAAgABCu4AAcQuAAA0EEDACgAEAABcUEDAGgAEAABcUEDABkAEAABXUENAJkAEACpABAAuQAQAMkAEADZABAA6QAQAAZdQQMA+QAQAAFxQQMAGQAQAAFxQQMAOgAQAAFyQQMAGQAQAAFyQQMASQAQAAFyQQMAWQAQAAFdQQMA2AAQAAFxQQMASAAQAAFxQQcAaAAQAHgAEACIABAAA11BAwCYABAAAXG6AAEACgAQERI5QQMAmQABAAFdQQcA2gABAOoAAQD6AAEAA11BAwAKAAEAAXFBBwBLAAEAWwABAGsAAQADcUEDADwAAQABcUEFAJ0AAQCtAAEAAnFBCQDPAAEA3wABAO8AAQD/AAEABHFBCwAPAAEAHwABAC8AAQA/AAEATwABAAVyQQMAvgABAAFxQQMAfAABAAFxQQMAiwABAAFxQQMAGwABAAFxQQMAKgABAAFxQQMAWQABAAFdQQMAFwABAAFduAAIELgADNBBAwB9AA4AAV1BAwB2AA4AAXFBAwBmAA8AAXFBAwCRAA8AAXEwMQFBAwBXAAMAAXFBAwBHAA8AAXJBAwD6AA8AAXEAQQMASQABAAFyQQMA8wACAAFxQQMASAAQAAFyNxEGBwYHOwEHIxUjNSM+ATfqRS0rAsdHBUIoygKDbZQBISJVUVklb2+VzhYAAAAAAQAY//gBPgHbAB4EfrgAGS+4ABgvuwAAAAcADQAEK0EDACYAAAABXUEDAIMAAAABXUEDACYAAgABcUEDAEcAAgABckEDABcAAgABXUEDAKQAAgABcUEDAAQAAgABckEDAEoABAABckEDAMsABAABXUEDAK0ABAABcUEDAA0ABAABckEDAAsABAABcUEDALkABAABXUEDACkABAABcUEDABoABQABckEDAN4ABQABcUEDAEsABQABckEFAOkABQD5AAUAAnFBAwAZAAUAAV1BAwB3AAYAAV1BAwBKAAYAAXJBAwC3AAYAAV1BAwCmAAYAAXFBAwBBAAgAAXJBAwADAAkAAXJBAwC6AAsAAV1BAwCrAAsAAXFBAwALAAsAAXJBAwAaAAsAAXFBAwB5AAsAAV1BAwD4AAwAAXFBAwBNAAwAAXJBAwAsAAwAAXFBAwBoAAwAAV1BAwBXAAwAAXFBAwCYAA0AAXFBAwCGAA0AAV1BAwDKAA8AAV1BAwAMAA8AAXJBAwAbAA8AAXJBAwCZAA8AAV1BAwC4AA8AAV1BAwAHABMAAXJBAwAWABMAAXJBAwBHABkAAXK4ABkQuQAUAAf0QQMAOgAUAAFyuAAYELkAFQAH9EEDALcAFgABXbgADRC4ABfQuAAXL0EDAAsAFwABXUEDAFwAFwABXUEDAG0AFwABXUEDAL4AFwABXUEDAHwAFwABXUEDABwAFwABXUEDAMsAFwABXUEFADsAFwBLABcAAl1BAwAmABwAAV1BAwCFABwAAV1BAwDFABwAAV1BAwCfAB8AAXFBAwBfACAAAV1BBQAvACAAPwAgAAJdQQMADwAgAAFdALgAAEVYuAAWLxu5ABYAEj5ZuAAARVi4AAMvG7kAAwAKPlm7ABYAAQAXAAQruwAbAAEAEQAEK0EDAFMAAQABcUEDAEoABQABckEDAH8ABQABXUEDABoABQABckEFAOoABQD6AAUAAnFBBQBuAAYAfgAGAAJduAADELkACgAB9EEDAOMADAABcUEDAFUADAABXUEDANUADAABcUEDAPQADAABcUEDAFIADAABcUEDACAADAABckEDACQAEQABXUEFAGkAFAB5ABQAAl1BAwApABQAAXJBAwCIABQAAV1BAwAmABQAAV1BAwAiABsAAV26ABkAEQAbERI5QQMAIQAZAAFyQQUAMAAZAEAAGQACcjAxAUEDADEAAgABckEDAGQAAgABcUEDALQAAgABcUEDAMYAAgABcUEDAEoABAABcUEDAD8ABAABckEFAIkABQCZAAUAAnFBAwBbAAUAAXFBAwA2AAYAAXJBAwBaAAYAAXFBAwAzAAgAAXJBAwC1AAgAAXFBAwDXAAgAAXFBAwAzAAkAAXJBAwDqAA8AAV1BAwDGABIAAXFBAwDHABMAAXFBAwBKABkAAXEAQQUASwABAFsAAQACcUEDACkABAABckEDAFkABQABcUEFAIkABQCZAAUAAnFBAwA0AAYAAXJBAwA0AAgAAXJBAwDWAAgAAXFBAwDFAAwAAXFBAwD2AB4AAV0lFAYjIic3FhcWMzI2NTQnJiMiDwE3MwcjBzYzMhcWAT5oUkUnEQ4QHCk2UyQeMCoZFQ/VB6gJGh46KSykTV8lHwkIDUY/NhsYIQLyJo0KJCgAAAAAAgAm//gBQgHkABUAIQdzuAAiL7gAFi9BAwCYABYAAV25AAAAB/RBAwDZAAEAAV1BAwCAAAEAAXFBAwAFAAIAAV1BAwAWAAIAAV1BAwC9AAIAAV1BAwD2AAIAAV1BAwAkAAIAAV1BAwCAAAIAAXFBAwCKAAQAAXFBAwB7AAQAAXFBAwC5AAQAAV1BBQDEAAQA1AAEAAJduAAiELgAB9C4AAcvQQMA2QAHAAFxuQAcAAf0QQMApwAcAAFdQQUA1gAcAOYAHAACXbgABdC4AAUvQQMApgAFAAFdQQMA2QAFAAFxQQMAiwAFAAFxQQMAlwAFAAFdQQcAxQAFANUABQDlAAUAA11BAwC0AAUAAV1BAwAYAAgAAV1BAwDZAAgAAXFBAwB2AAgAAXFBAwDDAAgAAXFBAwDKAAkAAXFBAwCOAAkAAXFBAwA9AAkAAXFBAwAqAAkAAXJBAwCFAAkAAV24ABYQuAAK0LgACi9BAwAUAAsAAXJBAwBFAAsAAXJBAwA3AAsAAXJBBQDXAAsA5wALAAJxQQMAtwALAAFxQQMANQALAAFxQQMAwwALAAFxQQMAIQALAAFyQQMAhQAMAAFdQQMANgAMAAFxQQMAJQAMAAFxQQMAIAAMAAFyQQMAQAAMAAFyQQMAYQANAAFxQQMAQAANAAFyQQMAcAANAAFxQQUAdgAOAIYADgACXUEDABkADgABXUEDAHMADgABcUEDAMAADgABcbgAHBC4AA/QuAAPL0EDAAYADwABcUEDAIYADwABcUEDAKgADwABcUEDAA0ADwABXUEDAMoADwABcUEDAOcADwABcUEDAGYADwABcUEDAPUADwABXUEDANUADwABcUEDAA4AEQABXUEDAA0AEwABXUEFAAYAFAAWABQAAl1BAwA2ABQAAXJBAwAkABQAAV1BAwC8ABUAAV1BAwB4ABUAAXFBAwCAABUAAXFBAwC8ABcAAV1BAwCJABcAAXFBAwB3ABcAAXFBBQDaABgA6gAYAAJdQQMAawAYAAFxQQMAfAAYAAFxQQMATwAYAAFyQQMALwAYAAFyQQMAPQAYAAFyQQMAzAAYAAFdQQMACwAYAAFyQQMAugAYAAFdQQMAigAYAAFxQQMAQAAaAAFyQQMAAgAaAAFxQQMAxAAaAAFdQQMA5QAaAAFdQQMANwAaAAFxQQMAtQAaAAFdQQMAkwAaAAFxQQMAMgAaAAFyQQMAAAAaAAFyQQMAIAAaAAFyQQMA4wAbAAFxQQMA0AAbAAFxQQMA9QAdAAFxQQMAmgAdAAFdQQUA1gAdAOYAHQACXUEDAIQAHQABcUEDABQAHQABckEFABEAHgAhAB4AAnJBAwADAB4AAXJBBQBzAB4AgwAeAAJxQQUAtAAeAMQAHgACXUEDADQAHgABckEDAOQAHgABXUEDAFMAHgABcUEDAGIAHgABcUEDANAAHgABcUEDAEAAHgABckEDAAoAIAABckEDAOoAIAABXUEDANsAIAABXUEFAB8AIAAvACAAAnJBAwBPACAAAXJBAwC9ACAAAV1BBQBrACAAewAgAAJxQQMAWgAgAAFxQQMAygAgAAFdQQMAgQAgAAFxQQMA2AAhAAFdQQMAhAAhAAFxuAAAELgAI9wAuAAARVi4AAovG7kACgASPlm4AABFWLgAAy8buQADAAo+WbsAEwABABkABCtBAwCNAAgAAXFBAwA/AAgAAXFBBQDHAAgA1wAIAAJxQQMAAwAIAAFdQQMAfQAJAAFdQQMAKQAJAAFdQQMAyAAJAAFdQQMA+gALAAFxQQsAqwALALsACwDLAAsA2wALAOsACwAFcUEDAEsACwABckEDAD0ACwABckEDAAsACwABckEDADsACwABcUEDACoACwABckEDABgACwABckEDAHkADAABXUEDAMkADQABcboADwADAAoREjlBAwA1AA8AAXFBAwDGAA8AAXFBAwCIAA8AAXFBAwCnAA8AAXFBAwB1AA8AAXFBAwDUAA8AAXFBAwDyAA8AAV1BAwAgABMAAV1BAwB7ABUAAXFBAwB/ABcAAXFBAwAgABkAAV1BAwAMABsAAXJBAwD9ABsAAXFBAwA/ABsAAXFBBQDfABsA7wAbAAJxQQMArwAbAAFxQQMAngAbAAFxQQMATAAbAAFyQQMAGwAbAAFyQQUASwAbAFsAGwACcUEDAEMAHQABcUEDAFQAHQABcUEDADIAHQABcUEDAOAAHQABcbgAAxC5AB8AAfRBAwDVAB8AAV1BAwBIACAAAXIwMQFBAwD5AAQAAXFBAwCKAA0AAXFBAwCKAA4AAXFBAwDkAA8AAXFBAwCFAA8AAXFBAwCDABQAAXFBAwAaABgAAXJBAwCAABoAAXFBAwDwABoAAXFBAwAwABoAAXJBAwASABoAAXJBAwBkABoAAXFBAwDkABsAAXFBAwAkABsAAXJBAwBnABsAAXFBAwAGAB0AAXJBAwBfACIAAV0AQQMAhQAPAAFxQQMAOAAaAAFyQQMAawAbAAFxQQMAjQAbAAFxQQUA7wAbAP8AGwACcUEFAA8AGwAfABsAAnIlFAYjIicmNTQ2NxcGBwYHNjc2MzIWBzQmIyIGFRQWMzI2AUJJP0cpJI5uA0M3PhcEGSAqO0ooNi8rPDwrMDWRQVg2MElztRUdEzQ6UA8RFFo/MkZGMjFGRgABACEAAAFJAdsADAHzuwAAAAcAAQAEK0EDAHgABQABXUEHAKoABQC6AAUAygAFAANxQQMAmwAFAAFxQQMAawAFAAFxQQMAfAAFAAFxQQUAHAAFACwABQACckEDAI0ABQABcUEFAD8ABQBPAAUAAnJBAwANAAUAAXJBAwDcAAUAAXFBBwAsAAUAPAAFAEwABQADcUEDAPsABQABcUEDAOoABQABcUEDABoABQABcUEDADUABQABXUEDAAMABQABXUEDADsABwABckEDAEkABwABckEDAAYABwABXUEDAAcACAABXUEDAAsACQABXUEFABQACgAkAAoAAnJBAwD1AAoAAXFBAwAFAAoAAXJBBQAWAAoAJgAKAAJxQQUANwAKAEcACgACcUEDAFwACgABXUEDADkACgABXUEJAGYACgB2AAoAhgAKAJYACgAEcUEFAKUACgC1AAoAAnFBBwDEAAoA1AAKAOQACgADcUEDAEMACgABckEDADEACgABckEDAF8ADQABXUEDAF8ADgABXUEDAA8ADgABXUEDAI8ADgABXUEFAC8ADgA/AA4AAl1BAwBtAA4AAV0AuAAARVi4AAkvG7kACQASPlm4AABFWLgAAC8buQAAAAo+WbsACQABAAYABCtBAwBHAAUAAXJBAwBIAAoAAXJBAwA1AAoAAV0wMTMjNDc+ATcjNyEHDgGtKjwORAHxDwEZCENRl4ogcwEmKFjNAAMAIf/4AUgB3wALABUALQzDuwAGAAcAHAAEK7sAKAAHAAwABCtBAwBjAAwAAXFBAwByAAwAAXG4AAwQuAAA0LgAAC9BAwDpAAAAAXFBAwBJAAAAAXJBAwBPAAIAAXJBAwC/AAIAAXFBAwCXAAIAAXFBAwCUAAQAAXFBAwAWAAQAAXFBAwBDAAQAAXJBAwCwAAQAAXFBAwBDAAUAAXJBAwDmAAYAAXFBAwCUAAcAAV1BAwCLAAcAAXFBAwCTAAcAAXFBAwCxAAcAAXFBAwDGAAgAAV1BAwDtAAgAAXFBAwBmAAgAAXFBAwCDAAgAAXFBAwCSAAgAAXFBBQCMAAoAnAAKAAJxQQMAawAKAAFxQQMAyQAKAAFdQQMAmgALAAFdQQMAvgALAAFxQQMAmgALAAFxQQMAgwALAAFxQQMAmgAOAAFdQQMAlAAQAAFduAAGELgAEtC4ABIvQQMA7gASAAFxQQUAbAASAHwAEgACcUEDAEIAEwABcUEDAEYAEwABckEDAOoAEwABcUEDADQAEwABcUEDAFEAEwABcUEDAJEAEwABXUEDAGcAFAABckEFADsAFQBLABUAAnFBAwCZABUAAV1BAwBYABUAAXFBAwBZACgAAV1BAwByACgAAXFBAwBhACgAAXG4ACgQuAAW0LgAFi9BAwAGABcAAXFBAwAmABcAAV1BAwCEABcAAXFBAwDUABgAAV1BAwC0ABgAAXFBBQA1ABgARQAYAAJdQQMABQAYAAFxQQMAJgAYAAFdQQMA9gAYAAFdQQMApQAYAAFxQQMAhAAYAAFxQQMAFAAYAAFdQQMA4wAYAAFdQQUAEgAYACIAGAACcUEDABYAGQABXUEFADkAGgBJABoAAl1BAwAqABoAAXFBAwDrABoAAV1BAwC7ABoAAXFBAwAbABoAAXFBAwDvABoAAXFBAwDdABoAAV1BAwCLABoAAXFBAwD7ABoAAXFBAwCqABoAAXFBAwD6ABoAAV1BAwAJABoAAXFBBQAYABoAKAAaAAJdQQMAjAAbAAFxQQMAKQAbAAFdQQMACQAbAAFxQQMAGQAeAAFxQQMAOwAeAAFyQQMALAAeAAFyQQUADQAeAB0AHgACckEDAJ0AHgABcUEDAKwAHgABcUEDAPsAHgABcUEDAIkAHgABcUEDAOgAHgABcboAHwAcABYREjlBAwBIAB8AAXFBAwD4AB8AAV1BAwAIAB8AAXFBAwA4AB8AAV1BBQDJAB8A2QAfAAJxQQUAeQAfAIkAHwACcUEDAEkAHwABXUEDAHoAHwABXUEDAJsAHwABcUEDAPsAHwABcUEDAAsAHwABckEDANwAHwABXUEDAMsAHwABXUEDAGsAHwABcUEDAOkAHwABXUEDACkAHwABXUEDAKkAHwABcUEDAFgAHwABXUEDABgAHwABXUEDACgAHwABcUEDAOYAHwABcUEDAJEAHwABXUEDAM0AIAABXUEDAMwAIAABcUEDADwAIAABckEDAE0AIQABckEDAMkAIQABXbgAHBC4ACLQuAAiL0EFAG8AIgB/ACIAAnFBAwAvACMAAXJBAwAZACMAAXFBAwApACQAAV1BAwALACQAAXJBAwBrACQAAXFBAwDrACQAAV1BAwA+ACQAAXJBBQAfACQALwAkAAJyQQMA3QAkAAFdQQMAGwAkAAFdQQMAGwAkAAFxQQMA+QAkAAFdQQMACQAkAAFxQQMAKQAkAAFxQQMAOAAkAAFdQQMAMgAmAAFyQQUAEwAmACMAJgACcUEDAAMAJgABckEDABQAJgABckEHADYAJgBGACYAVgAmAANdQQMAJwAmAAFdQQMA9wAmAAFdQQMABgAmAAFxQQMA1AAmAAFdQQMAZAAmAAFxQQMA4wAmAAFdQQMAEgAmAAFdQQMAcQAmAAFxQQMAIQAmAAFyQQMAFQAnAAFxQQMAYQAnAAFxQQMAmgApAAFdQQMAxgApAAFdQQMA9QAqAAFxQQMABgAqAAFxQQMAwgAqAAFdQQMAwAAqAAFxugArABwAFhESOUEDANUAKwABXUEFAJYAKwCmACsAAnFBAwDGACsAAV1BAwAmACsAAXFBAwAXACsAAXFBAwA3ACsAAV1BAwCcACsAAV1BAwBJACsAAXJBAwBHACsAAXFBAwD2ACsAAXFBAwBGACsAAV1BAwAmACsAAV1BBQDFACsA1QArAAJxQQMAhQArAAFxQQUAZAArAHQAKwACcUEDABIALAABckEDAKQALAABcUEDAIYALAABcUEDALgALAABcUEDAEsALAABckEDAAoALAABckEFAHgALACIACwAAl1BAwD1ACwAAXFBBQAjACwAMwAsAAJyQQMA4gAsAAFdQQMAkAAsAAFxQQMAqAAtAAFdQQMAlAAtAAFxuAAoELgAL9wAuAAUL7gAAy+4AABFWLgAJS8buQAlABI+WbgAAEVYuAAZLxu5ABkACj5ZuwAlAAEADwAEK0EDAA0AAQABckEDAP4AAQABcUEDABsAAQABckEDACoAAQABckEDAE0AAgABckEDAC8AJQABcrgAJRC4AAPcQQMAUwADAAFdQQMAFAADAAFdQQMAJgADAAFyQQMAFwADAAFyQQMAuQADAAFdQQMAfQADAAFxQQMAPgADAAFyQQMAvgADAAFxQQMA/QADAAFxQQMASAADAAFyQQMABwADAAFxQQMAxgADAAFxQQMAkwADAAFdQQMA0gADAAFdQQMAEAADAAFxQQMA/AAFAAFxQQMADQAFAAFyQQMAGwAFAAFyQQMAKQAFAAFyQQMAJgAHAAFyQQMABQAHAAFyQQMAFAAHAAFyuAAZELkACQAB9EEFADYACQBGAAkAAnJBAwCHAAsAAXFBAwAlAAsAAXJBBQADAAsAEwALAAJyQQMAygAPAAFxQQMALwAPAAFyQQMA6gAPAAFxQQMA+QAPAAFxQQMA2QAPAAFxQQMAlwATAAFdQQMAEwATAAFyQQMAIQATAAFyQQMABQAUAAFyQQkAhQAUAJUAFAClABQAtQAUAARxQQMANwAUAAFxQQMA+AAUAAFxQQMAbAAUAAFyQQMAfAAUAAFdQQMAOgAUAAFdQQMAtwAUAAFdQQMA5QAUAAFxQQMARQAUAAFyQQMAIgAUAAFyQQMAEAAUAAFyQQMA5QAVAAFxQQMAlAAVAAFdQQUAEwAVACMAFQACckEDABoAFwABXUEDANwAFwABcUEDAM4AFwABcUEDAO4AFwABcUEFANwAFwDsABcAAl1BAwD7ABcAAXFBAwD6ABcAAV1BAwBJABcAAV1BAwDqABsAAXFBAwAbABsAAV1BBQDNABsA3QAbAAJxQQMA6wAbAAFdQQMA+wAbAAFxQQMA2gAbAAFdQQMA+gAbAAFdQQMA1gAdAAFdQQMA+wAdAAFxQQMA1QAdAAFxQQMAwgAdAAFxQQMAFgAeAAFxQQUA5QAeAPUAHgACcUEDADMAHgABcrgAAxC4AB/QuAAfL0EDANQAHwABXUEDADQAHwABckEDALUAHwABcUEDABUAHwABckEDAAYAHwABckEDAJYAHwABXUEDAFcAHwABXUEFACkAHwA5AB8AAl1BAwDJAB8AAV1BAwDqAB8AAV1BAwDKAB8AAXFBAwD5AB8AAV1BAwAJAB8AAXFBAwB4AB8AAXFBBQAWAB8AJgAfAAJxQQMARgAfAAFxQQMAlgAfAAFxQQMAFQAfAAFdQQUA5QAfAPUAHwACcUEDAIQAHwABcUEDAGMAHwABcUEDACAAHwABckEDACUAIQABckEDANUAIwABXUEDABUAIwABckEDAAUAJAABckEDACsAJwABckEDAOoAJwABcUEFANUAJwDlACcAAl1BAwAXACgAAV1BAwDlACkAAXFBAwCJACkAAXFBAwCVACkAAXFBAwCkACkAAXFBAwAgACkAAXK4AAMQuAAr0LgAKy9BAwAUACsAAV1BAwA1ACsAAXJBAwCFACsAAXFBAwDVACsAAV1BAwDmACsAAXFBAwCWACsAAV1BAwBHACsAAXFBAwBHACsAAXJBAwB5ACsAAXFBAwDJACsAAV1BAwD6ACsAAV1BAwDsACsAAV1BAwDKACsAAXFBAwAJACsAAXFBBQApACsAOQArAAJdQQMAFwArAAFxQQMAFgArAAFyQQUAJgArADYAKwACcUEDAFUAKwABcUEDALUAKwABXUEDAPUAKwABcUEDAAUAKwABckEDALUAKwABcUEDAGMAKwABcUEDACAAKwABckEDAHcALAABXUEDADQALAABckEDANUALQABXUEDAOgALQABcUEDAOYALQABXUEDANUALQABcUEDAMIALQABcTAxQQMASAADAAFyQQMAIwAUAAFyQQMANQAUAAFyJTQmJw4BFRQWMzI2AzQmIyIGFRQXNhcUBiMiJjU0NjcuATU0NjMyFhUUBgceAQEgNjY1Nj0vLj0PMiorMlxdN1BEQ1A5LCUxSjs6SjElLDl9J0cDA0cnLTU1ARkjLi4jPhcXq0BISEAxRwkLOSE1REQ1ITkLCUcAAgAm//QBQgHgABUAIQYZuAAiL7gAFi+5AAAAB/RBAwAsAAEAAXFBAwC8AAEAAV1BAwCkAAIAAXFBAwAlAAIAAXFBAwADAAIAAXJBBwDQAAIA4AACAPAAAgADcUEDAF4AIgABXbgAIhC4AA/QuAAPL7kAHAAH9LgAA9C4AAMvQQMAGAAEAAFyQQMASwAEAAFyQQMAKQAEAAFyQQMAOAAEAAFyQQMA1gAEAAFxQQMACwAFAAFyQQMAKwAFAAFyQQMAeQAFAAFxQQUAPQAGAE0ABgACckEDAGwABgABcUEDAHkABgABcbgAFhC4AAjQuAAIL0EDADcACAABckEDALgACAABXUEDAMkACAABcUEDAIsACAABcUEDAOoACAABcUEDAIkACAABXUEDAPgACAABXUEDANcACAABcUEDAKcACAABcUEDAL0ADQABXUEFAMsADQDbAA0AAl1BAwALAA0AAV1BAwArAA4AAV1BAwALABEAAV1BAwC+ABEAAV1BAwDcABEAAV1BAwApABEAAV1BAwCFABEAAXFBAwDqABMAAV1BAwCFABMAAXFBAwC1ABMAAV24ABYQuAAU0LgAFC9BAwDLABQAAV1BAwDqABQAAV1BBwCJABQAmQAUAKkAFAADXUEDAPgAFQABcUEDAIsAGAABcUEDAOwAGAABXUEDAC4AGAABckEDAD8AGAABckEFAA8AGAAfABgAAnJBAwBOABgAAXJBBQBsABgAfAAYAAJxQQMAywAYAAFdQQMAWwAYAAFxQQUAOgAYAEoAGAACcUELAAAAGgAQABoAIAAaADAAGgBAABoABXJBAwDjABoAAXFBAwDkABoAAV1BAwDFABoAAV1BBQA1ABoARQAaAAJxQQMAVAAaAAFxQQMAYgAaAAFxQQUAcAAaAIAAGgACcUEDAMAAGgABcUEDAEEAHgABckEFAEMAHgBTAB4AAnFBAwBkAB4AAXFBAwDFAB4AAV1BAwC6AB4AAV1BAwA1AB4AAXFBAwDkAB4AAV1BAwByAB4AAXFBBQDgAB4A8AAeAAJxQQcAEAAeACAAHgAwAB4AA3JBAwA7ACAAAXFBAwDMACAAAV1BAwA+ACAAAXJBAwD/ACAAAXFBAwBPACAAAXJBBQAfACAALwAgAAJyQQMA7gAgAAFxQQUAfAAgAIwAIAACcUEDAFsAIAABcUEDAEoAIAABcUEDAMcAIAABcbgAABC4ACPcALgAAy+4AABFWLgAEi8buQASABI+WbsAHwABAAwABCtBAwDyAAEAAXFBAwAOAAEAAV1BAwD2AAEAAV1BAwCBAAEAAV1BAwAwAAEAAXJBAwAhAAQAAXJBAwBDAAQAAXJBAwAGAAQAAXJBAwCXAAQAAXFBAwDoAAQAAXFBAwDZAAQAAXFBAwCoAAQAAXFBAwC3AAQAAXFBAwCGAAQAAXFBAwDGAAQAAXFBAwDyAAQAAXFBAwAQAAQAAXJBAwAwAAQAAXJBAwBEAAYAAXK6AAgAAwASERI5QQMA3AAIAAFxQQUAjwAIAJ8ACAACcUEDAO8ACAABcUEDAM8ACAABcUEFAD8ACABPAAgAAnJBAwD5AAgAAXFBAwC1AAgAAV1BAwAfAAwAAV1BAwCsAAwAAV1BAwCpAA4AAXFBAwCMAA4AAXFBAwAbAA4AAV1BAwAEAA4AAXJBAwBkAA4AAXFBAwClABAAAXFBAwBqABAAAXFBAwAXABAAAV1BAwD0ABAAAXFBAwCDABAAAXFBAwBrABUAAXFBAwA7ABUAAXJBAwCmABUAAXFBAwAFABUAAV1BAwDuABcAAXFBAwAMABcAAXJBAwBqABcAAXG4ABIQuQAZAAH0QQMA7QAbAAFxQQMAagAbAAFxQQMA5QAdAAFxQQMAAgAdAAFyQQMAYgAdAAFxQQMAHwAfAAFdQQMArAAfAAFdQQMA+wAgAAFxQQMAiAAgAAFxQQMABAAhAAFyMDEBQQMAawAgAAFxQQMAzgAgAAFxQQMADwAgAAFyQQMALwAgAAFyQQMATwAgAAFyAEEDAKUAAQABcUEDAHYAAQABcUEDAMkAIAABcUEDAAoAIAABckEDAEoAIAABckEDACsAIAABcgEUBgcnNjc2NwYHBiMiJjU0NjMyFxYHNCYjIgYVFBYzMjYBQo5uA0M3PhcEGSAqO0pJP0cpJCg8KzA1Ni8rPAExc7UVHRM0OlAPERRaP0FYNjAzMUZGMTJGRgAAAgAu//oAcwE+AAsAFwBiuwAAAAcABgAEK7gAABC4AAzQuAAGELgAEtAAuAAARVi4AAMvG7kAAwAKPlm6ABUADwADK0EDAMkAAwABcbgAAxC4AAncQQMAxAAJAAFxQQMAyQAPAAFxQQMAxgAVAAFxMDE3FAYjIiY1NDYzMhY1FAYjIiY1NDYzMhZzFQ4OFBQODhUVDg4UFA4OFRwOFBQODhUV8Q4UFA4OFRUAAAIAHv+TAHsBPgAPABsAgLsAEAAHABYABCu4ABAQuAAA0LgAAC+4ABYQuAAK0LgACi8AuAAEL7gAAEVYuAAHLxu5AAcACj5ZugAZABMAAytBAwDZABMAAXG4ABMQuAAN3EEDANkADQABcUEDAB8ADQABckEDAKAADQABcUEDAFAADQABcUEDANUAGQABcTAxNwYHBgcnNjciJjU0NjMyFicUBiMiJjU0NjMyFnsCHxUZDjQGEBcWDxAVCBUODhQUDg4VGzYpHQwPIzQWDw8XGO8OFBQODhUVAAEALP/+AW4BeQAGACIAuAAEL7gAAEVYuAABLxu5AAEACj5ZugAGAAEABBESOTAxJRUlNSUVBQFu/r4BQv7mJCawG7AlmQAAAAIANwBmAWQBCQADAAcAFwC7AAQAAQAFAAQruwAAAAEAAQAEKzAxARUhNQUVITUBZP7TAS3+0wEJISGCISEAAAABACz//gFuAXkABgAiALgABi+4AABFWLgAAi8buQACAAo+WboABAACAAYREjkwMSUVBTUtATUBbv6+ARr+5skbsCaYmCUAAAACAB//+gD3AeMAFgAiBDq7ABcABwAdAAQruwARAAcABgAEK0EDALoAAAABcUEDACoAAAABcUEDADgAAAABcUEFANwAHQDsAB0AAnFBAwDNAB0AAXFBAwD+AB0AAXFBAwBOAB0AAXJBAwAeAB0AAXJBAwA9AB0AAXJBAwAMAB0AAXJBAwC8AB0AAXFBAwAsAB0AAXK4AB0QuAAD0LgAAy9BAwBKAAMAAXFBAwBZAAMAAV1BAwC5AAQAAXFBAwDMAAUAAXFBAwBZAAcAAXFBAwCrAAcAAXFBAwBPAAcAAXJBAwAbAAcAAXJBAwAaAAcAAXFBAwDpAAcAAXFBAwBIAAcAAXFBAwA2AAkAAXJBAwAlAAkAAXJBAwDUAAkAAXFBBQCXAAoApwAKAAJdQQMAOgALAAFyQQMAhwALAAFdQQMAFQALAAFxQQUA6QAMAPkADAACXUEFAFkADABpAAwAAnFBAwA6AAwAAXFBBQAaAAwAKgAMAAJyQQMAywAMAAFxQQMA6gAMAAFxQQMACgAMAAFxQQMAKQAMAAFxQQMAiQAMAAFxQQMAEAAMAAFxQQMARAAOAAFdQQMAxAAOAAFxQQMAhQAOAAFdQQMAJgAOAAFxQQUApgAOALYADgACcUEFAGYADgB2AA4AAnFBAwD1AA4AAXFBBQAFAA4AFQAOAAJyQQUAhQAOAJUADgACcUEDADQADgABcUEDAOQADgABcUEDAEIADgABckEDABoADwABcUEDAEIADwABXUEDANQAEwABcUEDAPYAEwABXUEDAFwAEwABXUEDAGkAEwABXUEDAAUAEwABcUEDAAMAEwABckEDAOMAEwABcUEHANMAFwDjABcA8wAXAANxQQcAAwAXABMAFwAjABcAA3JBDQBTABcAYwAXAHMAFwCDABcAkwAXAKMAFwAGcUEDAMIAFwABcUEDAEEAFwABcrgAFxC4ABXQuAAVL0EDAE8AFQABcUEDAC8AFQABcUEDAD0AFQABcUEDALwAFQABcbgAERC4ACTcALgAAEVYuAANLxu5AA0AEj5ZuAAARVi4ABovG7kAGgAKPllBBQA4AAAASAAAAAJdQQMAWQAAAAFdQQMAiAAAAAFdQQMAaAAAAAFdQQMAVQAEAAFdQQMAZAAEAAFdQQMAFAAEAAFxuAANELkACAAB9EEDAJcACgABXUEDAIMACgABXUEDABcACwABcUEDAIAACwABXUEDABgADAABcUEDAEQADwABXUEDADUAEAABcUEFABYAEAAmABAAAnFBBQCGABAAlgAQAAJxQQMARQAQAAFdQQMAcwAQAAFxQQMAfAASAAFxQQcAGgASACoAEgA6ABIAA3FBAwCJABIAAXFBAwAuABMAAXJBAwCaABMAAXFBAwDIABMAAV24ABoQuAAg3DAxAUEDADkABwABckEDADEAFwABckEDADIAGAABckEDADMAIgABcjcjJjU0NjU0IyIHJzYzMhcWFRQHBhUUFxQGIyImNTQ2MzIWiiIFbVIvIQ8wNjkeGz8xExUODhQUDg4Vew8UNXorSBoeHyEdKzVDNDMSbQ4UFA4OFRUAAAIAF/+fAf4BigA2AD8C57sAJQAHADAABCu7ADoABQAMAAQruwAYAAUADgAEK7sAAAAGAB4ABCu4AA4QuAAE0LgABC+6AAUADgAYERI5QQMACwAUAAFxQQMAtAAXAAFdQQMAuwAgAAFdQQMAywAgAAFxQQMA2gAgAAFxQQMAegAgAAFxQQMAdAAiAAFxQQMAtQAiAAFdQQMA9QAiAAFdQQMA0wAiAAFdQQUAwwAiANMAIgACcUEDANUAIwABcUEDALUAJgABXUEDANMAJgABcUEDANQAJwABcUEDAJYAJwABXUEDAEQAJwABckEDALIAJwABXUEDAOgAKgABcUEDABgAKwABckEDAAcAKwABckEDAEoAMwABckEDAEQANQABcrgADhC4ADfQALgAAEVYuAA0Lxu5ADQAED5ZuAAARVi4AAMvG7kAAwAKPlm4AABFWLgABy8buQAHAAo+WbgAAEVYuAAJLxu5AAkACj5ZuwAoAAEALQAEK7sAFgACABEABCu7AA4AAgA4AAQrugAFAAcANBESOUEDAAkABQABckEDAJkACwABXUEDAKgACwABXUEDAJQADQABXUEDAJQADgABXUEDAIMADgABXUEDAKEADgABXUEDAPUAEQABXUEDAIcAEQABXUEDAMMAEQABXUEDAKAAEQABXUEDAPUAEwABXUEDAPIAFgABXUEDAKIAFgABXUEDALMAFgABXUEDAIIAFgABXUEDAMEAFgABXUEDAJAAFgABXbgAAxC5ABsAAvS4ADQQuQAhAAL0QQMAxAAmAAFxQQMAowAmAAFdQQMA5gAqAAFxQQMA9wAqAAFdQQUAlwAqAKcAKgACXUEDABcAKgABckEDAMcAKgABXUEDANYAKgABXUEDALYAKgABXUEDAAUAKgABckEFAAkAKwAZACsAAnJBAwDpACsAAXFBAwCGACsAAV1BAwClACsAAV1BAwCDADgAAV1BAwChADgAAV1BAwCVADkAAV24ABsQuAA80DAxJRQGDwEnBiMiJy4BNTQzNTQjIgcnNjMyHQEUFz4BNTQmIyIHBhUUFjMyNxcGIyImNTQ3NjMyFgc1BhUUMzI3NgH+VDEfCihCDAcgLchRLB8LJzFyBCdAaFlePkJuUUUwDjxKXoRGSnlkerCjPUgcArBEYAMCLTMBBS4ecAVVGBkdf2sWEwJONVNtPkJoVnEeHSCAY21LUHylPQJLPD8EAAAAAgAAAAABkAHjAAcACgcouAAFL7gAAC9BAwAVAAEAAV1BAwAUAAIAAV1BAwAHAAYAAXJBAwAGAAcAAXJBAwAaAAgAAV1BAwAMAAoAAV1BBQA+AAwATgAMAAJdQQMAHQAMAAFdQQMAXAAMAAFdALgAAy+4AABFWLgABi8buQAGABI+WbgAAEVYuAAHLxu5AAcAEj5ZuAAARVi4AAUvG7kABQAKPlm4AABFWLgABC8buQAEAAo+WbgAAEVYuAABLxu5AAEACj5ZuAAARVi4AAAvG7kAAAAKPlm7AAkAAQAGAAQrQQMAAAAJAAFyuAADELkACgAB9DAxAUEDAEMAAAABcUEDAAMAAAABckEDAEQAAAABckEDACUAAAABckEDAJYAAAABcUEDAOYAAAABcUEDABYAAAABckEDADcAAAABckEDAMkAAAABXUEDAOkAAAABXUEDACoAAAABXUEJAIoAAACaAAAAqgAAALoAAAAEXUEDAEYAAQABcUEDABkAAQABcUEDAIkAAQABcUEDAKkAAQABcUEDAPkAAQABcUEDACkAAQABckEDAEkAAQABckEDABoAAQABckEDADsAAQABckEDAEcAAgABcUEDACgAAgABcUEDAIgAAgABcUEDABkAAgABXUEDADkAAgABXUEDADkAAgABcUEDAHkAAgABcUEDALkAAgABcUEDANkAAgABcUEDACkAAgABckEDAMoAAgABcUEDAIsAAgABXUEDAKsAAgABcUEDABsAAgABckEFADsAAgBLAAIAAnJBAwAUAAMAAXJBBQA0AAMARAADAAJyQQMApQADAAFxQQUAdgADAIYAAwACcUEDALYAAwABcUEDACYAAwABckEDABkAAwABXUEDABQABAABckEDADQABAABckEDAKUABAABcUEDABYABAABcUEDAIYABAABcUEDAPYABAABcUEDACYABAABckEDAEYABAABckEDABkABAABXUEDAEkABAABcUEDAOYABQABXUEDAJkABQABcUEDAOkABQABcUEDABkABQABckEDACoABQABckEFADsABQBLAAUAAnJBAwAMAAUAAXJBAwBNAAUAAXFBAwDEAAYAAV1BAwAlAAYAAV1BAwBlAAYAAXFBBQAGAAYAFgAGAAJdQQMAFgAGAAFxQQcAVwAGAGcABgB3AAYAA11BAwDnAAYAAXFBAwD5AAYAAXFBAwAJAAYAAXJBAwA5AAYAAXJBAwCaAAYAAV1BAwDqAAYAAV1BAwCaAAYAAXFBBQAaAAYAKgAGAAJyQQMASgAGAAFyQQUABQAHABUABwACckEDADUABwABckEDAPYABwABcUEDACYABwABckEDAEYABwABckEDAOcABwABXUEDAJcABwABcUEDAAgABwABcUEFAEgABwBYAAcAAnFBAwDoAAcAAXFBAwAZAAcAAV1BAwBJAAcAAV1BAwDJAAcAAV1BAwD5AAcAAV1BAwAZAAcAAXFBAwBpAAcAAXFBAwAKAAcAAV1BBQAqAAcAOgAHAAJdQQkAWgAHAGoABwB6AAcAigAHAARdQQUAqgAHALoABwACXUEDAFoABwABckEDABIACAABXUEDAFgACAABcUEDAPgACAABcUEDAPkACAABXUEDACkACAABcUEFAIkACACZAAgAAnFBAwApAAgAAXJBAwBaAAgAAV1BAwCqAAgAAV1BAwBKAAgAAXFBAwB6AAgAAXFBAwDqAAgAAXFBAwBKAAgAAXJBAwDLAAgAAXFBAwAbAAgAAXJBAwCtAAgAAXFBAwA9AAgAAXJBAwAVAAkAAXFBAwAWAAkAAV1BAwDGAAkAAV1BAwBmAAkAAXFBAwC3AAkAAXFBAwCYAAkAAV1BAwBIAAkAAXFBAwCYAAkAAXFBAwDoAAkAAXFBAwAIAAkAAXJBAwBZAAkAAV1BAwCpAAkAAV1BBQDpAAkA+QAJAAJdQQMAOQAJAAFyQQMAKgAJAAFdQQMAhAAKAAFxQQMApAAKAAFxQQMANAAKAAFyQQMAZQAKAAFxQQMAJQAKAAFyQQMARQAKAAFyQQMAFgAKAAFxQQUAxgAKANYACgACcUEFAAYACgAWAAoAAnJBAwA3AAoAAXFBAwD3AAoAAXFBAwAZAAoAAV1BAwDpAAoAAV1BAwBcAAwAAV1BAwAuAAwAAV1BAwBvAAwAAV0AQQMAEAACAAFdQQMAEAADAAFdQQMANwAFAAFyQQMAEAAIAAFdQQMAtwAJAAFdQQMAyQAJAAFdQQMASQAJAAFxQQMAmQAJAAFxQQMAuQAJAAFxQQMAGgAJAAFxQQUAagAJAHoACQACcUEDAOoACQABcUEDAHsACQABXUEDADsACQABckEDAP0ACQABXUEDAK0ACQABcUEFAM0ACQDdAAkAAnFBAwAPAAkAAXJBAwAQAAoAAV1BAwDIAAoAAXFBAwAIAAoAAXJBAwBXAAwAAV0hIycjByMTMxMnBwGQKzfNNiu0KEZaW5mZAeP+1/7+AAADADb/+gFaAeIADgAYACMGz7sAHgAHAAQABCu7AAkABwAPAAQrQQcAWQAPAGkADwB5AA8AA11BDwCZAA8AqQAPALkADwDJAA8A2QAPAOkADwD5AA8AB11BIQAJAA8AGQAPACkADwA5AA8ASQAPAFkADwBpAA8AeQAPAIkADwCZAA8AqQAPALkADwDJAA8A2QAPAOkADwD5AA8AEHFBBwAJAA8AGQAPACkADwADckEFADoADwBKAA8AAnJBCQAJAA8AGQAPACkADwA5AA8ABF1BAwCDAA8AAV1BAwBAAA8AAV1BAwCDAAkAAV1BAwBCAAkAAV26ABkADwAJERI5uAAZL0EFAKEAGQCxABkAAl1BBQAiABkAMgAZAAJdQQMAYwAZAAFdQQMAgwAZAAFdQQUA6QAZAPkAGQACXUEFAAkAGQAZABkAAnFBAwDJABkAAV1BBQA6ABkASgAZAAJyQQMAmQAZAAFdQRsAOQAZAEkAGQBZABkAaQAZAHkAGQCJABkAmQAZAKkAGQC5ABkAyQAZANkAGQDpABkA+QAZAA1xQQcACQAZABkAGQApABkAA3JBAwAlABkAAXFBAwBUABkAAV1BAwBDABkAAV1BAwDSABkAAV1BAwARABkAAV1BAwBwABkAAV1BAwAAABkAAV25AAAAB/RBAwBjAAAAAV1BAwDkAAAAAV1BAwAVAAAAAV1BAwCHAAAAAV1BAwAlAAAAAXFBAwBUAAAAAV1BAwCRAAAAAV1BAwBDAAEAAV1BAwDEAAEAAXFBAwAkAAEAAXFBAwC1AAEAAXFBAwD1AAEAAV1BAwDXAAEAAV1BAwAWAAEAAXFBAwA1AAEAAV1BAwDkAAEAAXFBAwAEAAEAAXFBAwAjAAEAAV1BAwCTAAEAAXFBAwDBAAEAAV1BBQATAAgAIwAIAAJdQQMARAAIAAFxQQMA5AAIAAFdQQMA5QAIAAFxQQMANgAIAAFxQQMA9gAIAAFdQQMANQAIAAFdQQMAFAAIAAFxQQMAAwAIAAFxQQMAQgAIAAFdQQMAgQAIAAFdQQMANQALAAFyQQMABQALAAFyQQMARAALAAFyugAMAAQAABESOUEDAOgADAABXUEDAGoADAABcUEDAAUADAABckEDABMADAABckEDAOYADQABcUEDANkADQABXUEDALoADQABcUEDALgADQABXUEDAMUADQABXUEDAMUADQABcUEDAJYADgABcUEDAOQADgABcUEDANMADgABcbgAHhC4ABPQQQMA2QAXAAFdQQMACgAXAAFxQQMAnAAXAAFxQQMALQAXAAFyQQMAPgAXAAFyQQUAzQAXAN0AFwACcUEDAPwAFwABXUEDAIoAFwABcUEDAKkAFwABcUEDALgAFwABcUEDAN4AGwABXUEDAG8AGwABcUEDAM8AGwABcUEDAL8AGwABXUEDAN4AGwABcUEDAM0AGwABXUEDALsAIgABXUEDAF0AIgABcUEDAM0AIgABcUEDAN8AIgABcUEDAJ0AIgABcUEDACwAIgABcUEDAGsAIgABcUEDAHoAIgABcUEDAF0AJAABXUEDAB0AJQABXUEDAFwAJQABXQC4AABFWLgABy8buQAHABI+WbgAAEVYuAACLxu5AAIACj5ZuwAVAAEAHAAEK0EDABgACAABcUEDAEcACQABXboADAAcABUREjlBAwDoAAwAAV1BAwDYAA4AAXG4AAcQuQARAAH0QQUAOQARAEkAEQACckEhAAgAEQAYABEAKAARADgAEQBIABEAWAARAGgAEQB4ABEAiAARAJgAEQCoABEAuAARAMgAEQDYABEA6AARAPgAEQAQXUEhAAgAEQAYABEAKAARADgAEQBIABEAWAARAGgAEQB4ABEAiAARAJgAEQCoABEAuAARAMgAEQDYABEA6AARAPgAEQAQcUEHAAgAEQAYABEAKAARAANyQQMA9wAXAAFdQQUAhwAXAJcAFwACcUEFALYAFwDGABcAAnFBAwCkABcAAXFBAwDJABsAAXFBAwBpABsAAXG4AAIQuQAgAAH0QSEABwAgABcAIAAnACAANwAgAEcAIABXACAAZwAgAHcAIACHACAAlwAgAKcAIAC3ACAAxwAgANcAIADnACAA9wAgABBdQSEABwAgABcAIAAnACAANwAgAEcAIABXACAAZwAgAHcAIACHACAAlwAgAKcAIAC3ACAAxwAgANcAIADnACAA9wAgABBxQQcABwAgABcAIAAnACAAA3JBBQA2ACAARgAgAAJyQQMAZwAiAAFxQQMAVgAiAAFxMDEBQQMAbQAkAAFdQQMADAAlAAFdQQMALQAlAAFdAEEDAOgAGwABcSUUIyInETYzMhUUBgceASc0IyIHFTMyNzYXNCYrARUWMzI3NgFaySwvMjKtKyQkPjqGHx5RNSAdFFM/RRshQCkyhYsKAdENeCQ7DQk/s1gHrhwavjUzzAYXHAAAAQAX//kBewHjABcEcbgACy+4AAEvuAAGL7sAEgAHAAYABCtBAwA7AAAAAXJBAwDoAAEAAXFBAwAyAAEAAV1BAwAxAAEAAXJBAwAwAAIAAXJBAwBZAAQAAV1BAwDCAAQAAXFBAwDSAAYAAV1BAwDuAAcAAV1BAwBZAAgAAV1BAwDCAAgAAXFBBQA3AAsARwALAAJxQQMAyAALAAFxQQMA5wALAAFxQQMANQALAAFyQQMAMAALAAFdQQMAKAAMAAFxQQMAMwAMAAFdQQMA1gAPAAFdQQMA5QAPAAFdQQMAwQAPAAFxQQMA7AAQAAFdQQMA7QARAAFdQQUA5gASAPYAEgACXUEhAAYAEgAWABIAJgASADYAEgBGABIAVgASAGYAEgB2ABIAhgASAJYAEgCmABIAtgASAMYAEgDWABIA5gASAPYAEgAQcUEHAAYAEgAWABIAJgASAANyQRsABgASABYAEgAmABIANgASAEYAEgBWABIAZgASAHYAEgCGABIAlgASAKYAEgC2ABIAxgASAA1dQQUANQASAEUAEgACckEDANMAEgABXUEDANYAFAABXUEDAMIAFQABcUEDAFkAGAABXUEDAE0AGQABXUEDADcAGQABXQC4AABFWLgACS8buQAJABI+WbgAAEVYuAADLxu5AAMACj5ZQQMANwAAAAFyQQMAJAAAAAFyQQkAOQABAEkAAQBZAAEAaQABAARxQQcA2QABAOkAAQD5AAEAA3FBBwB6AAEAigABAJoAAQADcUEDAEkAAQABckEFAKkAAQC5AAEAAnFBAwDIAAEAAXFBAwA4AAEAAXJBAwBFAAsAAXJBAwCGAAsAAXFBAwDWAAsAAXFBAwDHAAsAAXFBBQA3AAsARwALAAJxQQMANwALAAFyQQMA9gALAAFxQQUApgALALYACwACcUEFAGUACwB1AAsAAnFBAwCVAAsAAXFBAwBUAAsAAXFBAwAaAAwAAXJBAwAvAAwAAXJBAwDsAAwAAXFBAwA5AAwAAV1BAwApAAwAAXG4AAkQuQAOAAH0QQUAOQAOAEkADgACckEhAAgADgAYAA4AKAAOADgADgBIAA4AWAAOAGgADgB4AA4AiAAOAJgADgCoAA4AuAAOAMgADgDYAA4A6AAOAPgADgAQXUEhAAgADgAYAA4AKAAOADgADgBIAA4AWAAOAGgADgB4AA4AiAAOAJgADgCoAA4AuAAOAMgADgDYAA4A6AAOAPgADgAQcUEHAAgADgAYAA4AKAAOAANyuAADELkAFgAB9EEhAAcAFgAXABYAJwAWADcAFgBHABYAVwAWAGcAFgB3ABYAhwAWAJcAFgCnABYAtwAWAMcAFgDXABYA5wAWAPcAFgAQXUEhAAcAFgAXABYAJwAWADcAFgBHABYAVwAWAGcAFgB3ABYAhwAWAJcAFgCnABYAtwAWAMcAFgDXABYA5wAWAPcAFgAQcUEHAAcAFgAXABYAJwAWAANyQQUANgAWAEYAFgACcjAxAUEDACsAGQABXUEDAG4AGQABXSUXBiMiJjU0NjMyFwcmIyIHBhUUFxYzMgFvDDVNYYGBYU01DDY+TTY5OTZNPjIgGYtra4kZIBc5PF5ePDkAAgA2//wBkgHhAAoAFgRLuAAXL7gACy9BBQA6AAsASgALAAJyQQUA6QALAPkACwACcUEHAAkACwAZAAsAKQALAANyQSEACQALABkACwApAAsAOQALAEkACwBZAAsAaQALAHkACwCJAAsAmQALAKkACwC5AAsAyQALANkACwDpAAsA+QALABBdQRsACQALABkACwApAAsAOQALAEkACwBZAAsAaQALAHkACwCJAAsAmQALAKkACwC5AAsAyQALAA1xuQAAAAf0QQMARgAAAAFxQQMA1gAAAAFxQQMAVQABAAFxQQMAhgABAAFdQQMAJQABAAFxQQMAFAABAAFxuAAXELgABNC4AAQvQQMAFQAIAAFxQQMA1QAIAAFxuAALELgACdC4AAkvQQUAMwAJAEMACQACckEDACYACQABckEFANMACQDjAAkAAnFBAwDCAAkAAXFBBwDbAA0A6wANAPsADQADcUEDAAsADQABckEDAPsADQABXUEDACwADQABckEDAHwADQABcUEFADsADQBLAA0AAnJBAwDKAA0AAXFBAwAZAA0AAXK4AAQQuQASAAf0QQMAiQAVAAFdQQMA+wAVAAFxQQMACwAVAAFyQQMAmwAVAAFxQQMASgAVAAFyQQMAGQAVAAFyQQUA2QAVAOkAFQACXbgAABC4ABjcALgAAEVYuAAFLxu5AAUAEj5ZuAAARVi4AAcvG7kABwASPlm4AABFWLgAAi8buQACAAo+WbgAAEVYuAAELxu5AAQACj5ZQQMA1wAAAAFxQQMAnAABAAFxQQMAbAABAAFxQQMArwABAAFxQQUAfwABAI8AAQACcUEDAA0AAQABcUEDALwAAQABcUEDAEoAAQABcUEDAPoAAQABXUEDALUACAABcUEDAHIACQABcUEDAIUACQABcUEDAPYACQABXUEDAEUACQABcUEDAJMACQABcUEDAAIACQABcUEFAKAACQCwAAkAAnFBBQCgAAoAsAAKAAJxQQMAUgAKAAFxQQMAZAAKAAFxQQMA3AAKAAFxQQMAFAAKAAFxQQMAIwAKAAFxQQMAggAKAAFxQQMAcAAKAAFxQQMAAAAKAAFxQQMArQAMAAFxQQMA2wAMAAFxQQMAugANAAFxQQMAmwANAAFxQQMAigANAAFxQQMA2gANAAFduAAHELkADwAB9EEFADkADwBJAA8AAnJBIQAIAA8AGAAPACgADwA4AA8ASAAPAFgADwBoAA8AeAAPAIgADwCYAA8AqAAPALgADwDIAA8A2AAPAOgADwD4AA8AEF1BIQAIAA8AGAAPACgADwA4AA8ASAAPAFgADwBoAA8AeAAPAIgADwCYAA8AqAAPALgADwDIAA8A2AAPAOgADwD4AA8AEHFBBwAIAA8AGAAPACgADwADcrgAEdC4ABEvuAAEELkAEgAB9LgAFNBBAwC0ABYAAXFBAwDWABYAAV1BAwCjABYAAXFBAwDTABYAAXEwMSUUIyInETYzMhcWBzQnJiMiBxEWMzI2AZLiHlxcMls5OicyLkofRTItUV74/AkB0Aw9QGxfNjII/m0GcwAAAQA2AAABOQHcAAsAgrsACgAHAAEABCu4AAoQuAAF0EEHAH8ADQCPAA0AnwANAANdALgAAEVYuAADLxu5AAMAEj5ZuAAARVi4AAAvG7kAAAAKPlm7AAMAAQAEAAQruwAHAAEACAAEK7gAABC5AAoAAfQwMQFBAwAPAA0AAV1BAwA/AA0AAV1BAwBfAA0AAV0pAREhFSMVMxUjFTMBOf79AQPcxMTcAdwhryHKAAEANgAAAUMB3AAJAMC7AAIABwADAAQruAACELgAB9BBAwCGAAkAAV1BAwBeAAoAAV1BAwBeAAsAAV1BAwA8AAsAAV0AuAAARVi4AAUvG7kABQASPlm4AABFWLgABC8buQAEABI+WbgAAEVYuAACLxu5AAIACj5ZuwAFAAEABgAEK7sACQABAAAABCtBAwAAAAAAAV1BAwAAAAEAAV1BAwAAAAkAAV0wMQFBAwAkAAUAAV1BAwAkAAYAAV1BAwANAAsAAV1BAwBtAAsAAV0lIxUjESEVIxUzATTXJwEN5tfl5QHcIbUAAAABABf/+wF/AeEAHQRcuAAeL7gAGi9BAwCgABoAAV25AAEAB/RBAwD6AAcAAXFBAwBaAAcAAXFBAwDrAAcAAXFBAwDsAAcAAV1BAwANAAcAAXJBAwA/AAcAAXFBAwDdAAcAAV1BAwAbAAcAAXJBAwB6AAcAAXFBAwD6AAcAAV1BAwCJAAcAAXFBAwC5AAcAAV24AB4QuAAJ0LgACS9BAwDIAAwAAV1BAwCKAAwAAXFBBQBaAAwAagAMAAJxQQMAewAMAAFxQQMAuwAMAAFdQQMADAAMAAFyQQMAPAAMAAFxQQMATQAMAAFxQQMALwAMAAFyQQMA3QAMAAFxQQMAnAAMAAFxQQUAvAAMAMwADAACcUEDANsADAABXUEDAKsADAABcUEFADoADABKAAwAAnJBAwD6AAwAAV1BBQDqAAwA+gAMAAJxQQMAFgAMAAFyQQMANAAMAAFdQQMA9QAPAAFdQQMAtgAPAAFxQQMAJwAPAAFyQQMAOQAPAAFyQQMAOQAPAAFdQQMA6QAPAAFdQQMAWwAPAAFdQQMACQAPAAFxQQMAmQAPAAFdQQMABwAPAAFyQQMAVgAPAAFxQQMAJQAPAAFxQQMAhQAPAAFxQQMA5AAPAAFxQQMAGQAQAAFxQQMASQAQAAFxQQMAigAQAAFxQQMAKgAQAAFxQQMA+wAQAAFdQQMA3gAQAAFdQQMADAAQAAFxQQMAywAQAAFdQQUAWgAQAGoAEAACcUEDAHkAEAABcUEDAAkAEAABckEFAKkAEAC5ABAAAnFBAwDoABAAAXFBAwAuABEAAXJBAwA8ABEAAXJBAwAaABEAAXJBAwAyABMAAXJBAwDUABMAAXFBAwCkABMAAV1BAwB1ABMAAXFBAwA1ABMAAV1BAwAlABMAAXFBAwBmABMAAXFBAwAWABMAAXFBAwCWABMAAV1BAwBFABMAAXFBAwD1ABMAAV1BAwAFABMAAXFBAwAVABMAAXJBAwBUABMAAXFBBQCEABMAlAATAAJxQQUAswATAMMAEwACcUEDAKIAEwABcUEFAOIAEwDyABMAAnFBAwACABMAAXK5ABUAB/RBAwAXABYAAXFBAwAmABcAAXFBAwA2ABcAAV1BBQBlABcAdQAXAAJxQQMAxQAXAAFduAABELgAH9wAuAAARVi4AA0vG7kADQASPlm4AABFWLgABi8buQAGAAo+WbsAAAABABsABCtBAwCfAAAAAV24AAYQuQAYAAH0ugABAAYAGBESOUEDAMcABwABXUEFADwACABMAAgAAnJBAwDEAAoAAV1BAwBEAAoAAXJBAwAkAAoAAXFBAwA4AAwAAXFBAwDYAA8AAV1BAwAHAA8AAXJBAwAsABAAAXJBAwA6ABAAAXJBAwDmABAAAV24AA0QuQASAAH0QQMAyAATAAFxQQMAHgAUAAFyQQMArQAUAAFxQQMAeAAXAAFxQQMAyAAXAAFdQQMAnwAbAAFdMDEBQQMAagAHAAFdQQMAWwAHAAFdJRUmIzAGIyImNTQ3NjMyFwcmIyIGFRQWMzI3NSM1AX8IDXYUW245O2ZJNww8OktlV1A/NHnu5AYVhW9qQkYYIBd2XGJxGZogAAAAAQA2AAABgwHcAAsAnbgADC+4AA0vuAAA3EEDAB8AAAABXbkAAQAH9LgADBC4AAXQuAAFL7kABAAH9LgAB9C4AAEQuAAJ0AC4AABFWLgABi8buQAGABI+WbgAAEVYuAAKLxu5AAoAEj5ZuAAARVi4AAAvG7kAAAAKPlm4AABFWLgABC8buQAEAAo+WbsACQABAAIABCswMQFBAwAvAAwAAV1BAwAfAA0AAV0hIzUjFSMRMxUzNTMBgyf/Jyf/J+3tAdzOzgAAAAABADYAAABdAdwAAwB3uwAAAAcAAQAEK0EDADQABAABXQC4AABFWLgAAi8buQACABI+WbgAAEVYuAAALxu5AAAACj5ZMDEBQQUAXQAEAG0ABAACXUEDAD4ABAABXUEDAHoABQABXUEDAFsABQABXUEFAAwABQAcAAUAAl1BAwBsAAUAAV0zIxEzXScnAdwAAAAB////9wDSAdwADAFLuwAAAAcACgAEK0EDAPUAAQABXUEDAAUAAQABcUEDABEADQABXUEDAGAADQABXUEDAEsADgABXQC4AABFWLgACy8buQALABI+WbgAAEVYuAACLxu5AAIACj5ZuQAHAAH0QSEABwAHABcABwAnAAcANwAHAEcABwBXAAcAZwAHAHcABwCHAAcAlwAHAKcABwC3AAcAxwAHANcABwDnAAcA9wAHABBdQSEABwAHABcABwAnAAcANwAHAEcABwBXAAcAZwAHAHcABwCHAAcAlwAHAKcABwC3AAcAxwAHANcABwDnAAcA9wAHABBxQQcABwAHABcABwAnAAcAA3JBBQA2AAcARgAHAAJyMDEBQQMAAAANAAFdQQMAewAOAAFdQQMAPgAOAAFdQQMADwAOAAFdQQMALwAOAAFdAEEDACoAAAABXUEDAA8AAAABXTcUIyInNxYzMjY1ETPSjCcgChcmNDEnnKUPHww9UAE2AAAAAAEANv/7AYYB4gALBr24AAYvuAAFL7gACi+4AAAvuAACL0EDAAoAAAABckEDAA8AAQABckEDAFsAAQABcUEDABoAAQABckEDAG0AAgABcUEDAHgAAgABXUEDAEQAAgABcrgABRC5AAQAB/S4AAYQuQAHAAf0QQMAEwAKAAFyQQMAUwAKAAFxQQMAQgAKAAFyuAAKELkACQAH9EEDABwACQABcrgAAhC5AAsAB/RBAwBVAAsAAXFBAwAGAAsAAXJBAwBkAAsAAXFBAwAQAAsAAXJBAwBfAAwAAV1BAwBOAAwAAV1BAwAvAA0AAXFBAwDfAA0AAV1BAwBNAA0AAV0AuAAARVi4AAYvG7kABgASPlm4AABFWLgACS8buQAJABI+WbgAAEVYuAAFLxu5AAUACj5ZuAAARVi4AAEvG7kAAQAKPllBAwB4AAIAAV1BAwBGAAIAAXJBAwAVAAIAAXJBAwAdAAMAAXJBAwAqAAgAAXJBAwAQAAgAAXJBAwBIAAkAAXJBAwAZAAoAAXJBAwBWAAoAAXFBAwBGAAoAAXJBAwBnAAsAAXFBAwAHAAsAAXJBAwBWAAsAAXFBAwASAAsAAXIwMQFBAwBAAAAAAXJBAwABAAAAAXJBAwCiAAAAAXFBAwADAAAAAV1BAwDTAAAAAXFBAwAAAAEAAV1BAwBIAAEAAXFBAwBoAAEAAXFBAwCYAAEAAXFBAwA5AAEAAXFBAwCJAAEAAXFBAwDJAAEAAXFBAwC6AAEAAXFBAwDqAAEAAXFBAwD7AAEAAXFBAwA8AAEAAXJBAwAuAAEAAXJBAwCUAAIAAXFBAwDUAAIAAXFBAwAmAAIAAXFBAwBGAAIAAXFBAwDGAAIAAXFBAwAGAAIAAXJBAwA5AAIAAXFBAwAfAAIAAV1BAwBHAAMAAXJBAwBAAAkAAXJBAwDSAAkAAXFBAwDyAAkAAXFBAwDDAAkAAXFBAwB1AAkAAXFBAwAFAAkAAXJBAwAlAAkAAXJBAwD5AAkAAV1BAwAJAAkAAXFBAwBJAAkAAXFBAwAqAAkAAXFBAwCKAAkAAXFBAwCqAAkAAXFBAwDrAAkAAXFBAwC8AAkAAXFBAwA/AAkAAV1BAwA/AAkAAXJBAwDQAAoAAXFBAwBAAAoAAXJBAwBxAAoAAXFBAwCRAAoAAXFBAwDxAAoAAXFBAwABAAoAAXJBAwDDAAoAAV1BAwATAAoAAXFBAwDDAAoAAXFBAwAjAAoAAXJBAwD4AAoAAV1BAwA+AAoAAV1BBQAAAAsAEAALAAJxQQMA0AALAAFxQQMA8AALAAFxQQMAAAALAAFyQQMAMAALAAFyQQMAsQALAAFdQQMAgQALAAFxQQMAwQALAAFxQQMA4QALAAFxQQMAIQALAAFyQQMA8gALAAFdQQMAcgALAAFxQQMAUgALAAFyQQMAMwALAAFxQQMAkwALAAFxQQMAxAALAAFdQQMApAALAAFxQQMARAALAAFyQQMAJQALAAFxQQMARQALAAFxQQMAZQALAAFxQQMAtQALAAFxQQMA1gALAAFdQQMANwALAAFdQQMAHwALAAFdQQMALAAMAAFdQQMAPwAMAAFdQQMAbwAMAAFdQQMALgANAAFdQQUADwANAB8ADQACXUEDAD8ADQABXUEFAF8ADQBvAA0AAl1BAwCPAA0AAV0AQQMAQwAAAAFyQQMApQAAAAFxQQMA1gAAAAFxQQMAKQABAAFyQQMA1AACAAFxQQMAlQACAAFxQQMAxwACAAFxQQMAKAACAAFxQQMACAACAAFyQQMAGwACAAFxQQMA7AACAAFxQQMALQACAAFyQQMATQACAAFyQQMA+wADAAFdQQMAGwADAAFxQQMA6wADAAFxQQMAKwADAAFyQQMADAADAAFyQQMATAADAAFyQQMAIAAIAAFxQQMAoAAIAAFxQQcA0AAIAOAACADwAAgAA3FBCQAAAAgAEAAIACAACAAwAAgABHJBAwCxAAgAAXFBAwBBAAgAAXJBAwDCAAgAAXFBBQB0AAgAhAAIAAJxQQMAtQAIAAFdQQMA9QAIAAFdQQMARQAIAAFxQQMAlQAIAAFxQQMABgAIAAFxQQMA9gAJAAFdQQMA9gAKAAFdQQMACAAKAAFyQQMAKgAKAAFyQQMATQAKAAFyQQMAgAALAAFxQQMAkgALAAFxQQMAQwALAAFxQQMA0wALAAFxQQMA9AALAAFdQQMAxAALAAFxQQMANAALAAFyQQMANQALAAFxQQUApQALALUACwACcUEDACYACwABcUEDAGYACwABcUEFAOcACwD3AAsAAnFBAwAIAAsAAXIlBycHFSMRMxU3FwcBhiPTMycn7SfGCQ79M8UB3OXrC8YAAQA2AAABRwHcAAUAkLsABAAHAAEABCtBAwBfAAYAAV1BAwA9AAcAAV0AuAAARVi4AAIvG7kAAgASPlm4AABFWLgAAC8buQAAAAo+WbkABAAB9DAxAUEDAGEAAAABXUEDACMAAAABXUEDAGEABQABXUEDACMABQABXUEDAG4ABgABXUEDAGwABwABXUEDAA0ABwABXUEDAF8ABwABXSkBETMRMwFH/u8n6gHc/kUAAAABACgAAAH8AdwADAghuAAIL7gABy+4AAwvuAAAL0EDAN8AAAABXUEDABYAAAABcUEDAAUAAAABcrkAAQAH9EEDANkAAQABXUEDAAMAAQABckEDAE8ADAABXUEDAN8ADAABXbgADBC5AAIAB/RBAwBMAAIAAV1BAwDYAAIAAV1BAwAGAAIAAXJBAwDeAAMAAV1BAwAaAAMAAXFBAwBIAAMAAV1BAwAYAAQAAV1BAwDYAAQAAV1BAwAXAAQAAXFBAwBGAAQAAV1BAwATAAgAAV1BAwBAAAgAAV24AAgQuQAFAAf0QQMA1wAFAAFdQQMAFwAFAAFdQQMAGQAHAAFxQQMAQAAHAAFduAAHELkABgAH9EEDABcABgABXUEDAEcABgABXUEDANYABgABXUEDANkACQABXUEDABcACQABXUEDANsACgABXUEDAN8ACwABXUEDAE0ACwABXUEDAFwADQABXUEFAA8ADgAfAA4AAl1BAwBOAA4AAV1BAwBZAA4AAV0AuAAARVi4AAkvG7kACQASPlm4AABFWLgACC8buQAIABI+WbgAAEVYuAAMLxu5AAwAEj5ZuAAARVi4AAsvG7kACwASPlm4AABFWLgAAC8buQAAAAo+WbgAAEVYuAABLxu5AAEACj5ZuAAARVi4AAYvG7kABgAKPlm4AABFWLgABy8buQAHAAo+WbgAAEVYuAAELxu5AAQACj5ZuAAARVi4AAMvG7kAAwAKPlm7AAoAAQADAAQrQQMACQACAAFyQQMA1QACAAFdQQMA1gAFAAFdQQMAFQAFAAFdQQMAFAAKAAFxMDEBQQMAIAAAAAFdQQMAgAAAAAFdQQMAIgAAAAFyQQMAQwAAAAFyQQMABgAAAAFyQQMAXAAAAAFdQQMAPwAAAAFdQQcArwAAAL8AAADPAAAAA3FBAwAgAAEAAV1BAwCAAAEAAV1BAwAiAAEAAXJBAwBEAAEAAXJBAwD4AAEAAV1BAwDpAAEAAXFBAwAJAAEAAXJBAwBcAAEAAV1BAwDOAAEAAXFBAwA/AAEAAV1BBQCvAAEAvwABAAJxQQUAeAACAIgAAgACXUEDAMgAAgABcUEDAF4AAgABXUEDAA8AAgABXUEDAD8AAgABXUEDAG8AAgABXUEDAK8AAgABXUEDAM8AAgABXUEDADYAAwABckEDACcAAwABXUEDAIgAAwABXUEDAFkAAwABXUEDALkAAwABXUEDAMkAAwABcUEDAAkAAwABckEDADoAAwABXUEDAMoAAwABXUEDAPoAAwABXUEDAKoAAwABcUEDAHwAAwABXUEDAG0AAwABXUEDAK4AAwABXUEDACIABAABXUEDADYABAABXUEDAIYABAABXUEDAMYABAABcUEDAMcABAABXUEDAKcABAABcUEDADgABAABckEDAKkABAABXUEDAPkABAABXUEDAFoABAABXUEDAG0ABAABXUEFACAABQAwAAUAAl1BAwDAAAUAAV1BAwACAAUAAV1BAwBVAAUAAV1BAwDHAAUAAXFBAwAIAAUAAXJBAwC5AAUAAXFBAwBVAAYAAV1BAwD3AAYAAV1BAwC3AAYAAXFBAwAHAAYAAXJBAwDIAAYAAXFBAwBVAAcAAV1BAwAgAAgAAV1BAwDAAAgAAV1BAwAxAAgAAV1BAwADAAgAAV1BAwBVAAgAAV1BAwCoAAgAAXFBAwC7AAgAAXFBAwDCAAkAAV1BAwADAAkAAV1BAwAjAAkAAV1BAwBDAAkAAXJBAwA0AAkAAV1BAwAVAAkAAV1BAwD1AAkAAXFBBQAlAAkANQAJAAJyQQMApgAJAAFxQQMAVwAJAAFdQQMA+AAJAAFdQQMAiQAJAAFdQQMAWgAJAAFyQQMAawAJAAFdQQMAJAAKAAFdQQMAOAAKAAFdQQMAeQAKAAFdQQMA+QAKAAFdQQMAbAAKAAFdQQMAjAAKAAFdQQMArAAKAAFdQQMAhAALAAFdQQMAJQALAAFdQQMAVQALAAFyQQMAdwALAAFdQQMA9wALAAFdQQMAOQALAAFyQQMA+gALAAFxQQMAKgALAAFyQQMACwALAAFdQQMAWwALAAFdQQMAPAALAAFdQQMAbAALAAFdQQMATAALAAFyQQMArwALAAFdQQMAzwALAAFdQQMAtAAMAAFxQQMABQAMAAFyQQMARQAMAAFyQQMAJgAMAAFyQQMAJwAMAAFdQQMAhwAMAAFdQQMApwAMAAFxQQMAyQAMAAFxQQMAXAAMAAFdQQMADQAMAAFdQQMAPwAMAAFdQQMAbwAMAAFdQQMArwAMAAFdQQMAzwAMAAFdQQMAbwANAAFdQQMAPwAOAAFdQQUAXwAOAG8ADgACXUEDAN8ADgABXQBBAwAgAAIAAV1BBQBQAAIAYAACAAJdQQMAoAACAAFdQQMAAwACAAFdQQMAMwACAAFdQQMAxgACAAFdQQMA9wACAAFdQQMAqQACAAFxQQMAGgACAAFyQQMA7AACAAFxQQMATAACAAFyQQMAPQACAAFyQQMAzwACAAFxQQMALwACAAFyQQMAAAAFAAFdQQMAIAAFAAFdQQMAYAAFAAFdQQMAFAAFAAFdQQMAhQAFAAFdQQMAqQAFAAFxQQUACgAFABoABQACckEFAD0ABQBNAAUAAnJBAwDuAAUAAXFBAwDPAAUAAXFBAwAvAAUAAXJBAwCiAAoAAXFBAwAyAAoAAXJBAwB0AAoAAV1BAwD1AAoAAV1BAwAFAAoAAXJBAwAoAAoAAV1BAwBaAAoAAV1BAwC6AAoAAV1BAwBcAAoAAXIhIwsBIwsBIxMzGwEzAfwlHpoamh4lIS6bmy4BpP5cAaT+XAHc/lUBqwABADYAAAGDAdwACQH8uAAFL7gABC+4AAkvuAAAL0EDAD8AAAABXUEFAEwAAABcAAAAAl25AAEAB/RBAwBZAAEAAV1BAwAQAAQAAV24AAQQuQADAAf0QQMAEAAFAAFduAAFELkABgAH9EEDAC8ABwABXUEDAD8ACQABXUEFAEwACQBcAAkAAl24AAkQuQAIAAf0QQMAXgAKAAFdQQUATwALAF8ACwACXUEDAC8ACwABXUEDAD0ACwABXUEDABwACwABXQC4AABFWLgACS8buQAJABI+WbgAAEVYuAAILxu5AAgAEj5ZuAAARVi4AAYvG7kABgASPlm4AABFWLgABS8buQAFABI+WbgAAEVYuAAELxu5AAQACj5ZQQMAXgAHAAFdMDEBQQMALgAAAAFdQQMALwABAAFdQQMALwAIAAFdQQMALgAJAAFdQQUALwAKAD8ACgACXUEDAG8ACgABXUEDAD0ACwABXQBBAwABAAIAAV1BBQDqAAIA+gACAAJxQQMAGgACAAFyQQMAOwACAAFxQQMACwACAAFyQQUAOwACAEsAAgACckEDAC8AAgABckEDACAABwABckEDADEABwABckEDAAIABwABckEDAOMABwABcUEDAEMABwABckEDADQABwABcUEDAPUABwABcUEDABUABwABckEDACcABwABcUEDAA8ABwABXSEjAxEjETMTETMBgyn8KC36JgGl/lsB3P5hAZ8AAAACABb/9gHQAeQACwAXBKm4AAYvuAAAL0EDAGUAAgABcUEDALMAAgABXUEDAGoABAABcUEDALkABAABXUEDADoACAABcUEDAEsACAABckEDAGoACAABcUEDALkACAABXUEDAGUACgABcUEDAEQACgABckEDALMACgABXbkADAAH9EEDAEsADgABcUEDAKsADgABcUEDACsADgABckEDAEwADgABckEDAD4ADgABckEDAL8ADgABcUEDAF0ADgABcUEDADwADgABcUEDANsADgABcUEDAHsADgABcUEFADoADgBKAA4AAl1BAwCKAA4AAXFBAwBEABAAAXJBBQB0ABAAhAAQAAJxQQMAJAAQAAFyQQUANQAQAEUAEAACXUEFAKQAEAC0ABAAAnFBBwA0ABAARAAQAFQAEAADcUEDANMAEAABcUEDADEAEAABcrgABhC5ABIAB/RBAwCzABQAAXFBBQBEABQAVAAUAAJxQQMAhQAUAAFxQQMA5gAUAAFdQQUANQAUAEUAFAACXUEDAHQAFAABcUEDAKQAFAABcUEDADMAFAABcUEDADEAFAABckEFADoAFgBKABYAAl1BAwB7ABYAAXFBAwA8ABYAAXFBAwC+ABYAAXFBAwA+ABYAAXJBAwBdABYAAXFBAwCrABYAAXFBAwBLABYAAXJBAwBKABYAAXFBAwCKABYAAXFBAwDPABkAAV1BAwBfABkAAV1BAwAvABkAAV1BAwBMABkAAV1BAwAMABkAAV0AuAAARVi4AAkvG7kACQASPlm4AABFWLgAAy8buQADAAo+WUEDAHsAAQABcUEDAEwAAQABckEDANsAAQABcUEDALkAAQABcUEDAEwABQABckEDAHsABQABcUEDANsABQABcUEDANQABwABcUEDAHQABwABcUEDAEQACwABXUEDANQACwABcUEDAHMACwABcUEDAGsADQABcUEHAA8ADQAfAA0ALwANAANyQQMATQANAAFyQQMAuwANAAFxQQMACQANAAFxuAAJELkADwAB9EEDAE0AEQABckEHAA8AEQAfABEALwARAANyQQMAawARAAFxQQMACQARAAFxQQMAQwATAAFyQQMABgATAAFxQQMAZAATAAFxQQUAAQATABEAEwACckEDACAAEwABcrgAAxC5ABUAAfRBAwBkABcAAXFBAwC1ABcAAXFBAwAGABcAAXFBAwBFABcAAXJBBQABABcAEQAXAAJyQQMAIAAXAAFyMDEBQQMAqAANAAFdQQMAywANAAFxQQUAmQAOAKkADgACXUEDABkADgABcUEDAMsADgABcUEDAMQAEAABcUEFAJYAEACmABAAAl1BAwD2ABAAAV1BAwAWABAAAXFBAwAnABAAAXFBAwCnABEAAV1BAwCmABMAAV1BAwDEABQAAXFBAwCWABQAAV1BAwD2ABQAAV1BBQAWABQAJgAUAAJxQQMApwAUAAFdQQMAqAAWAAFdQQMAmQAWAAFdQQUAGQAWACkAFgACcUEDAMsAFgABcUEDAKkAFwABXUEDAMsAFwABcUEDAGwAGQABXUEDAK0AGQABXUEDAC0AGQABcUEDAD8AGQABXUEDAO8AGQABXSUUBiMiJjU0NjMyFgc0JiMiBhUUFjMyNgHQe2Jie3tiYnsnZlBQZmZQUGbta4yMa2uMjGtYfX1YWH19AAIANgAAAVkB4QAOABcB6rgACS+4AAgvuAAAL0EDAB4AAAABXUEDAE4AAAABXUEDADMAAwABXbgACBC5AAcAB/S4AAAQuQAPAAf0QQMAuAAQAAFdQQMAxwAQAAFduAAJELkAEwAH9EEDAEwAFwABcUEDAKoAFwABXUEDABoAFwABcUEDAC8AGAABXUEFAE4AGABeABgAAl1BAwCvABkAAV1BAwAfABkAAV1BAwDfABkAAV1BBQBPABkAXwAZAAJdQQMAjwAZAAFdQQMADAAZAAFdALgABC+4AABFWLgACy8buQALABI+WbgAAEVYuAAILxu5AAgACj5ZQQMAaQABAAFxQQMAewABAAFxQQMAuwABAAFdQQMAmgABAAFxQQMAyQABAAFdQQMAAQABAAFdQQMAAwAEAAFdQQMAQQAEAAFdQQMARQAGAAFdQQMAagAOAAFxQQMAlAAOAAFxQQMAGwAQAAFyQQMAPgAQAAFxQQMALgAQAAFyQQMAPQAQAAFyQQMAagAQAAFxQQMAeQAQAAFxuAALELkAEQAB9LgABBC5ABYAAfRBAwBHABYAAV1BAwAGABYAAV1BAwCWABcAAV1BAwA2ABcAAXJBAwATABcAAXJBAwAyABcAAXEwMQFBAwA9ABgAAV1BAwB7ABkAAV1BAwAuABkAAV0BFAcGJyInFSMRNjMyFxYHNCMiBxUWMzYBWTw0TiAeJzw3SDE3JYwyGRsrkQFYSykjAQbIAdcKISZFagXQBwgAAAAAAgAW/70B0AHkABEAHQVIuAAML7gAAC9BAwC0AAMAAV1BAwBVAAMAAXFBAwC1AAMAAXFBAwBDAAMAAXJBAwAiAAMAAXJBAwA2AAQAAV1BAwA7AAYAAV1BAwC5AAYAAV1BAwAbAAkAAXJBAwAlAAkAAXFBAwAuAAoAAXJBAwBKAAoAAXJBAwC3AAoAAV1BAwBZAA4AAXFBAwDbAA4AAXFBAwAuAA4AAXJBAwBMAA4AAXJBAwBqAA4AAXFBAwC4AA4AAV1BAwAkAA4AAXFBAwDVABAAAXFBAwBlABAAAXFBAwAtABAAAXFBAwBFABAAAXJBAwCzABAAAV1BAwAiABAAAXK5ABIAB/RBAwA6ABQAAV1BAwCKABQAAXFBAwB7ABQAAXFBAwAuABQAAXFBAwA+ABQAAXJBAwDfABQAAXFBBQC+ABQAzgAUAAJxQQMAXQAUAAFxQQUAOwAUAEsAFAACcUEDAKoAFAABXUEDABkAFAABcUEDAEkAFAABXUEDANMAFgABcUEDAHQAFgABcUEDAFQAFgABcUEDAEUAFgABcUEDACUAFgABcUEDABYAFgABcUEDAIUAFgABcUEFADUAFgBFABYAAl1BAwC0ABYAAXFBAwA0ABYAAXFBAwCkABYAAV1BAwAxABYAAXJBAwDBABYAAXG4AAwQuQAYAAf0QQUAsgAaAMIAGgACcUEDAFQAGgABcUEDADQAGgABcUEFADUAGgBFABoAAl1BAwBFABoAAXFBBQAVABoAJQAaAAJxQQMAhQAaAAFxQQMApAAaAAFdQQMAdAAaAAFxQQMA0AAaAAFxQQMAMAAaAAFyQQMASgAcAAFxQQMAewAcAAFxQQMAqwAcAAFdQQMAzAAcAAFxQQMAvQAcAAFxQQMALwAcAAFxQQMAPgAcAAFyQQMA3QAcAAFxQQMAXAAcAAFxQQMAOwAcAAFxQQMAGgAcAAFxQQMAigAcAAFxQQUAOQAcAEkAHAACXUEDAL0AHQABcUEDAA4AHwABXUEDAD8AHwABXUEDAO8AHwABXUEDAF8AHwABXUEDAA8AHwABcUEDACwAHwABXUEDAEwAHwABXQC4AAcvuAAARVi4AA8vG7kADwASPlm4AABFWLgACS8buQAJAAo+WUEDANsAAQABcUEFAGsAAQB7AAEAAnFBAwAbAAEAAXJBAwApAAEAAXFBAwBFAAEAAXJBAwAlAAMAAXG4AATQQQMAOAAEAAFdQQMAJwAEAAFxuAAHELkABgAB9EEDABsACwABckEDAGwACwABcUEDAHsACwABcUEDACoACwABcUEDACQADQABcUEDAHQADQABcUEDAGMADQABcUEDABIADQABckEDANMAEQABcUEDAHQAEQABcUEDAGMAEQABcUEDABIAEQABckEDACsAEwABcUEDAEwAEwABckEDAA8AEwABckEFAKsAEwC7ABMAAnFBAwAKABMAAXFBAwCaABMAAV24AA8QuQAVAAH0QQMA+wAXAAFdQQMADwAXAAFyQQMATwAXAAFyQQMAqwAXAAFxQQMAmgAXAAFdQQMACgAXAAFxQQMAowAZAAFxQQMABQAZAAFxQQMAlQAZAAFdQQMA9AAZAAFdQQMAQwAZAAFyQQMAAQAZAAFyuAAJELkAGwAB9EEDACcAGwABcUEDAKMAHQABcUEDAAUAHQABcUEDAJUAHQABXUEDABUAHQABckEDAEEAHQABckEDAAEAHQABcjAxAUEDANkABwABcUEDAOoABwABcUEDAPwABwABcUEDAP0ACAABcUEDAG0AHwABXUEDAC0AHwABcQBBAwD3AAYAAXElFAcGBxYXByYnIiY1NDYzMhYHNCYjIgYVFBYzMjYB0CosTDtNDmNSYnt7YmJ7J2ZQUGZmUFBm7VZBRBMZBCUXIoxra4yMa1h9fVhYfX0AAAACADYAAAFmAeEAEgAbAze4AAcvuAAGL7gADS+4AAAvuAAPL0EDACIAAAABcbgAABC5AAEAB/RBAwAmAAEAAXFBAwB8AAIAAXFBAwBrAAIAAXFBAwBHAA8AAXJBAwBHAA8AAV1BAwAWAA8AAXFBAwAjAA8AAXG4AA8QuQADAAf0QQMADAADAAFyQQMAIwADAAFxuAAGELkABQAH9EEDAB0ADQABXUEDAEwADQABXbgADRC5ABMAB/RBAwAZABMAAV1BAwBtABQAAXFBAwB5ABQAAXFBAwC5ABQAAXG4AAcQuQAXAAf0QQMArwAaAAFxQQMAPQAaAAFyQQMAvAAaAAFxQQMAqwAbAAFxQQMAugAbAAFxQQUALwAcAD8AHAACXUEDAF8AHAABXUEDAC4AHQABXUEDAE8AHQABXUEDAB8AHQABXUEDAI8AHQABXUEDAF0AHQABXUEDAA0AHQABXQC4ABkvuAAARVi4AAkvG7kACQASPlm4AABFWLgABi8buQAGAAo+WbgAAEVYuAAFLxu5AAUACj5ZuAAARVi4AAEvG7kAAQAKPlm4AABFWLgAAC8buQAAAAo+WUEFAMoAAgDaAAIAAnFBAwAdABkAAV24ABkQuQADAAH0QQMARgAMAAFyQQMATgAOAAFyQQMASAAPAAFyQQMARgAPAAFdQQMAFAAPAAFxQQUAagAQAHoAEAACcUEDAE8AFAABckEDAK0AFAABcbgACRC5ABUAAfRBAwAZABgAAV0wMQFBAwDKAAIAAV1BBQDLAAIA2wACAAJxQQMAlAAMAAFxQQcA1gAMAOYADAD2AAwAA11BAwBHAAwAAXJBAwDmAA4AAV1BAwCGAA4AAXFBBQDiAA8A8gAPAAJxQQMAEgAPAAFyQQUAIwAPADMADwACckEDAHUADwABXUEDAIYADwABXUEDABIAEAABckEDACMAEAABckEDAFUAEAABXUEDAKsAEAABXUEDAEUAFAABckEDAPYAFAABXUEDAIkAFAABcUEDAMoAFAABXUEDALsAFAABXUEDAMgAGwABXUEDAG4AHAABXUEDAHsAHQABXUEDAK8AHQABXQBBAwBIAAwAAXJBBQDoAA8A+AAPAAJxISMmKwEVIxE2MxYXFhUUBxYXFgM0IyIHFTMyNgFmJhtsXCc4PU0tNFw1Gw0miTcXWTtD2dkB1gsBHSJAWSIdTykBC2MHwDUAAAABABv/9wFAAeUAIwU6uAARL7gABi+4AAAvuAAWL0EDAF8AAAABXUEDACIAAAABXUEDADUAAgABXUEFABAAAgAgAAIAAl1BAwAQAAMAAV1BAwCcAAUAAXFBAwCrAAUAAXFBAwBeAAYAAV1BAwA+AAYAAXJBAwAsAAYAAXJBAwBYAAcAAV1BAwAlAAcAAXJBAwBDAAcAAXJBAwA0AAgAAXJBAwAUAAgAAXJBAwBAAAgAAXJBAwATAAsAAV24AAAQuQAMAAf0QQMACgAMAAFdQQMAJQAMAAFdQQMACgAPAAFdQQUAdAARAIQAEQACXUEFADQAEQBEABEAAl1BAwBjABEAAV1BAwBNABMAAV1BAwBNABMAAXJBBQAaABMAKgATAAJdQQMAdAATAAFdQQMASgAVAAFyQQMAXQAWAAFdQQMA5wAWAAFdQQMAhgAWAAFdQQMAOgAYAAFyQQMAKwAYAAFyQQMATgAYAAFyQQMAWwAYAAFdQQMAaQAYAAFdQQMAhgAYAAFdQQMATQAbAAFdQQMA1gAbAAFdQQMANAAbAAFyQQMAdAAcAAFduAARELkAHgAH9EEFAGUAHgB1AB4AAl1BAwAGAB4AAXJBAwBGAB4AAV1BAwA1AB4AAV1BAwCEAB4AAV1BAwC4ACAAAV1BAwBeACQAAV1BAwA9ACUAAV1BAwANACUAAV0AuAAgL7gAAEVYuAAULxu5ABQAEj5ZuAAARVi4AAQvG7kABAAKPllBAwCcAAEAAXFBAwCrAAIAAXFBAwDbAAUAAXFBAwAqAAYAAXJBAwA5AAYAAXJBAwBHAAYAAXJBAwBHAAcAAXJBAwBWAAcAAV25AAkAAfRBAwDXAAsAAV1BAwDGAAsAAV1BAwA1AAsAAXJBAwB8ACAAAV1BAwA+ACAAAV1BAwC6ACAAAV1BAwBKACAAAV24ACAQuQAPAAH0QQMASwAPAAFdQQMAeQAPAAFdQQMAywAQAAFdQQMARwAVAAFyQQMA5AAWAAFdQQMAFwAWAAFxQQMARwAWAAFyQQMAdQAWAAFdQQMAgwAWAAFdQQMAYAAWAAFdQQMAdAAYAAFdQQMAOwAYAAFyQQMALAAYAAFyQQMAVwAYAAFdQQMAgAAYAAFdQQMAYAAYAAFduAAUELkAGgAB9EEDABUAHgABckEDAMkAHwABXUEDADQAHwABckEDAKUAIgABcUEDACQAIgABckEDAAUAIwABckEDANcAIwABXUEDAMUAIwABXUEDAJMAIwABcTAxAUEDALMACAABcUEDAOkACwABXUEDAIkADgABXUEHAJoADgCqAA4AugAOAANdQQMA/AAPAAFdQQMA8QAVAAFdQQMA0wAVAAFdQQMAOwAVAAFxQQMABgAWAAFxQQMAJgAWAAFxQQMAqAAWAAFdQQMAmwAWAAFdQQMAOwAWAAFxQQMA/AAWAAFdQQUAqAAYALgAGAACXUEDAPgAGAABXUEDADkAGAABcUEDALUAGwABXUEDAOYAHAABXUEDALcAHAABXUEDAJcAHgABXUEDAJUAHwABXUEDAKYAHwABXUEDAOUAIQABXUEDAOUAIgABXUEDAIAAJAABXUEDAFwAJQABXUEDAG0AJQABXQBBAwD9AAEAAV1BAwC1AAcAAXFBAwC2AAgAAXFBAwDnAAsAAV1BAwCoAA4AAV1BAwC5AA8AAV1BAwCzABYAAV1BAwCkABYAAV1BAwA0ABYAAXFBAwCVABYAAV1BBQCkABgAtAAYAAJdQQMA+AAYAAFdQQMAOQAYAAFxQQMA6AAcAAFdQQMApQAfAAFdJRQHBiMiJzcWMzI2NTQmJyY1NDYzMhcGByYjIgcGFRQXFhcWAUAnLE9ONRAxRjhAMTmFUkJDKgkIKzI4HhhqRR4jfDYkKyQiJTUsKDESK1s1RhkRDhcdGCBCJBgcIQAAAAH/+wAAAYAB3AAHASW4AAcvuAAGL7gABC+4AAMvQQUAEAAEACAABAACXbgABBC5AAEAB/RBBQAQAAMAIAADAAJduAADELkAAgAH9EEDABEABwABXUEDACAABwABXUEDAA8ACQABXUEFAD8ACQBPAAkAAl1BAwARAAkAAV0AuAAARVi4AAYvG7kABgASPlm4AABFWLgABy8buQAHABI+WbgAAEVYuAACLxu5AAIACj5ZuAAARVi4AAMvG7kAAwAKPlm4AAcQuQAAAAH0uAAGELkABQAB9DAxAUEDAGAAAAABXUEDAAAAAQABXUEDAGEAAQABXUEDAAAAAgABXUEDAGEAAgABXUEDAAAAAwABXUEDAGAAAwABXUEDAAAABAABXUEDAGAABAABXUEDAGAABwABXQEjESMRIzUhAYCvJrABhQG7/kUBuyEAAAAAAQA2//cBnAHcAA8CbLgABS+4AA8vuAAFELkABgAH9EEDAPQACAABXUEDAAMACAABcUEDAAQACQABcUEDAAIACQABckEDABAACQABckEDAAwACwABckEDABsACwABckEDABsADAABcUEDAPkADAABXUEDAAgADAABcbgADxC5AA4AB/RBAwAAAA4AAV1BBwAvABAAPwAQAE8AEAADXQC4AABFWLgABi8buQAGABI+WbgAAEVYuAAFLxu5AAUAEj5ZuAAARVi4AA8vG7kADwASPlm4AABFWLgADi8buQAOABI+WbgAAEVYuAACLxu5AAIACj5ZQQUAawABAHsAAQACcUEDAEsAAQABcUEDAKkAAQABXUEDAEwAAwABcUEFAGsAAwB7AAMAAnFBAwCpAAMAAV1BAwCXAAgAAV25AAoAAfRBAwCXAAwAAV0wMQFBAwAAAAAAAV1BAwAAAAEAAV1BAwASAAkAAXFBAwAjAAkAAXFBAwCFAAkAAV1BAwCGAAkAAXFBAwCJAAsAAXFBAwCKAAsAAV1BBQAcAAsALAALAAJxQQMAAAAPAAFdQQMAbwAQAAFdQQMALgARAAFdQQMAfwARAAFdAEEDACQAAAABcUEDAPIACAABcUEDAHMACAABXUEDAKMACAABcUEDAOMACAABcUEFAMQACADUAAgAAnFBAwAlAAgAAXFBAwCVAAgAAXFBAwBFAAgAAXJBAwCHAAkAAV1BAwCHAAsAAV1BAwDyAAwAAXFBAwDjAAwAAXFBAwB0AAwAAV1BAwCkAAwAAXFBBQDEAAwA1AAMAAJxQQMARAAMAAFyQQMAJQAMAAFxQQMAlQAMAAFxJRQjIjURMxEUFjMyNicRMwGcs7MnTT9ATQEnydLSARP+7l5UVF4BEgAAAAEAAAAAAYYB3AAGAji4AAMvuAAAL0EDADoAAAABXUEDADYAAwABXbgAAxC5AAQAB/S4AAAQuQAGAAf0QQMAOgAGAAFdQQMAfwAIAAFdQQUAnwAIAK8ACAACXUEDAD8ACAABXUEDAE4ACAABXUEDAF0ACAABXQC4AABFWLgAAC8buQAAABI+WbgAAEVYuAAGLxu5AAYAEj5ZuAAARVi4AAQvG7kABAASPlm4AABFWLgAAy8buQADABI+WbgAAEVYuAACLxu5AAIACj5ZuAAARVi4AAEvG7kAAQAKPlm7AAUAAQABAAQrMDEBQQUAEAAAACAAAAACXUEDAAMAAAABXUEDAKgAAAABXUEDAJkAAAABXUEDAHoAAAABXUEDABUAAQABXUEDAAYAAQABXUEDAGoAAQABXUEDAHsAAQABXUEDACEAAgABXUEFAAQAAgAUAAIAAl1BAwB0AAIAAV1BAwBnAAIAAV1BAwCpAAIAAV1BAwCKAAIAAV1BAwCVAAMAAV1BAwB2AAMAAV1BAwCmAAMAAV1BAwB1AAQAAV1BBQCXAAQApwAEAAJdQQMAJAAFAAFdQQUABQAFABUABQACXUEDAMgABQABXUEHAIkABQCZAAUAqQAFAANdQQUAEAAGACAABgACXUEDAAQABgABXUEDAHoABgABXUEFAJoABgCqAAYAAl1BAwBtAAgAAV0AQQMAZQAFAAFdQQMAxQAFAAFdQQMAdwAFAAFdQQMApwAFAAFdQQMAKwAFAAFdQQMAHwAFAAFdAQMjAzMbAQGGriquLJeXAdz+JAHc/lEBrwAAAQAAAAACTAHcAAwKCLgABi+4AAAvQQMANwAAAAFdQQMAVwAAAAFxQQUAQgAAAFIAAAACXUEDADoAAQABXUEDAEsAAQABXUEDAGoAAQABXUEDAFgAAQABXUEDACkAAgABckEDAGkAAgABXUEDAEQAAgABXUEDAFAAAgABXUEDAEYAAwABXUEDAFMAAwABXUEDAEcABAABXUEDACYABAABckEDAFUABAABXUEFAEAABQBQAAUAAl1BAwBYAAYAAXFBAwBGAAYAAV1BAwBbAAcAAV1BAwBXAAcAAXFBAwAiAAcAAXJBAwBRAAgAAV1BAwApAAkAAXJBAwBBAAkAAV1BAwBQAAkAAV1BAwBpAAoAAV1BAwBJAAoAAV1BAwBWAAoAAV1BAwAjAAoAAXJBAwBqAAsAAV1BAwBIAAsAAV1BAwBWAAsAAV1BAwBaAAwAAXFBAwAuAAwAAXJBAwA2AAwAAV1BBQBAAAwAUAAMAAJdQQMAPgAOAAFdQQMARwAOAAFdALgAAEVYuAAMLxu5AAwAEj5ZuAAARVi4AAovG7kACgASPlm4AABFWLgACS8buQAJABI+WbgAAEVYuAAHLxu5AAcAEj5ZuAAARVi4AAAvG7kAAAASPlm4AABFWLgABi8buQAGABI+WbgAAEVYuAABLxu5AAEACj5ZuAAARVi4AAUvG7kABQAKPlm7AAkAAQADAAQruwAKAAEAAwAEK7oACAAGAAMrugALAAAAAytBAwBpAAMAAV1BAwBYAAMAAV1BAwAgAAMAAXJBAwBWAAsAAV0wMQFBAwAgAAAAAV1BAwCCAAAAAV1BAwATAAAAAV1BBQDGAAAA1gAAAAJxQQMA6AAAAAFdQQMAGAAAAAFxQQMAeQAAAAFdQQMAOgAAAAFdQQMAmgAAAAFdQQMAugAAAAFdQQMAhAABAAFdQQMA9AABAAFxQQMAFQABAAFdQQUA1QABAOUAAQACcUEDAAUAAQABckEFADUAAQBFAAEAAnJBCQCWAAEApgABALYAAQDGAAEABHFBAwAWAAEAAXJBAwAnAAEAAV1BAwAHAAEAAXFBAwB4AAEAAV1BAwBpAAEAAXFBAwCaAAEAAV1BAwDqAAEAAV1BAwALAAEAAV1BAwA7AAEAAV1BBQAQAAIAIAACAAJdQQMAgQACAAFdQQMACQACAAFxQQMAaQACAAFxQQUAyQACANkAAgACcUEDABkAAgABckEFAOoAAgD6AAIAAl1BAwD6AAIAAXFBBQA6AAIASgACAAJyQQMAnQACAAFdQQMAEAADAAFdQQMAhQADAAFdQQMAJwADAAFdQQMAlwADAAFdQQUAuAADAMgAAwACXUEDAAgAAwABcUEDAEgAAwABcUEDAHoAAwABXUEDADQABAABXUEDAJQABAABXUEDAPQABAABXUEDAPQABAABcUEDAOUABAABXUEFADUABABFAAQAAnJBBQDGAAQA1gAEAAJxQQMAFgAEAAFyQQMABwAEAAFdQQMAJwAEAAFdQQUAuAAEAMgABAACXUEDAHkABAABXUEFACEABQAxAAUAAl1BAwASAAUAAV1BAwAEAAUAAV1BAwCUAAUAAV1BAwDlAAUAAV1BAwB3AAUAAV1BAwBoAAUAAXFBAwBpAAUAAV1BAwA5AAUAAXFBCQCZAAUAqQAFALkABQDJAAUABHFBAwAZAAUAAXJBAwAaAAUAAXFBBQDaAAUA6gAFAAJxQQMACgAFAAFyQQUAOgAFAEoABQACckEDAPsABQABcUEDALUABgABXUEDAJYABgABXUEDABcABgABXUEFAMkABgDZAAYAAnFBAwDhAAcAAXFBAwARAAcAAXJBAwACAAcAAXJBAwBCAAcAAXJBBwCTAAcAowAHALMABwADcUEDADMABwABckEFAHQABwCEAAcAAnFBBQDEAAcA1AAHAAJxQQMA9AAHAAFxQQMAZQAHAAFxQQMAJQAHAAFyQQMAtgAHAAFdQQcABgAHABYABwAmAAcAA3FBAwBGAAcAAXFBAwA3AAcAAXFBAwAYAAcAAV1BAwAKAAcAAV1BAwArAAcAAV1BAwAUAAgAAV1BAwAlAAgAAV1BAwA2AAgAAV1BAwCWAAgAAV1BAwB3AAgAAV1BAwDnAAgAAV1BAwBnAAgAAXFBAwAYAAgAAXFBAwA4AAgAAXFBAwACAAkAAV1BAwAiAAkAAV1BAwATAAkAAV1BAwCDAAkAAV1BAwDEAAkAAV1BAwDkAAkAAV1BAwA0AAkAAXFBAwCXAAkAAV1BAwD3AAkAAV1BAwBoAAkAAV1BAwAJAAkAAXFBAwD5AAkAAXFBAwA6AAkAAV1BAwDqAAkAAXFBAwBKAAkAAXJBAwB7AAkAAV1BAwBLAAkAAXFBAwAbAAkAAXJBAwAlAAoAAV1BAwCFAAoAAV1BAwDlAAoAAXFBAwAVAAoAAXJBAwAWAAoAAV1BAwD2AAoAAXFBAwBGAAoAAXJBAwAHAAoAAXFBAwA4AAoAAV1BAwB4AAoAAV1BAwBIAAoAAXFBAwBoAAoAAXFBAwD5AAoAAV1BAwApAAoAAXFBBQC6AAoAygAKAAJdQQMAOwAKAAFxQQMA7AAKAAFdQQMADQAKAAFdQQMAEgALAAFdQQMAIwALAAFdQQMAhQALAAFdQQMAGAALAAFxQQMAaAALAAFxQQMA6QALAAFdQQMAOgALAAFdQQMAmgALAAFdQQUAEAAMACAADAACXUEDAIAADAABXUEDAAUADAABXUEDAJgADAABXUEDADgADAABcUEDADkADAABXUEDAHkADAABXUEDAAkADAABcUEDACkADAABcUEDAEkADAABcUEDALoADAABXUEDABoADAABcUEDACoADAABckEHAGsADAB7AAwAiwAMAANxQQUAywAMANsADAACcUEDAPsADAABcUEHAJwADACsAAwAvAAMAANxQQMA7QAMAAFxQQMADQAMAAFyQQUAPQAMAE0ADAACckEDAB4ADAABckEDAA0ADgABXUEDAG8ADgABXQBBAwAAAAMAAV1BAwAgAAMAAV1BAwBgAAMAAV1BAwDkAAMAAXFBAwAUAAMAAXJBAwCFAAMAAV1BAwA2AAMAAV1BAwAHAAMAAXFBAwDIAAMAAV1BAwD4AAMAAV1BAwDpAAMAAV1BAwC6AAMAAV1BAwBKAAMAAXFBAwBrAAMAAXFBAwA8AAMAAXJBAwA+AAMAAXFBBQATAAgAIwAIAAJyQQMABQAIAAFyQQMANQAIAAFyQQMAVgAIAAFxQQMApgAIAAFxQQMARgAIAAFyQQMACAAIAAFdQQMAKAAIAAFdQQMAmQAIAAFdQQMAewAIAAFdQQMAbAAIAAFdQQUAEwALACMACwACckEDAAUACwABckEDADUACwABckEDAFYACwABcUEDAKYACwABcUEDAEYACwABckEDAHsACwABXQEDIwsBIwMzGwEzGwECTJAqbGwqkCx5ayxreQHc/iQBsP5QAdz+UQGv/lEBrwAAAQARAAABkQHcAAsFergABi+4AAQvuAAKL7gAAC9BAwAhAAAAAV25AAEAB/RBAwBDAAEAAV1BAwAgAAEAAV1BAwAkAAIAAV24AAQQuQADAAf0QQMAKgADAAFdQQMASQADAAFdQQMAWAAFAAFdQQMARQAFAAFdQQMAIQAFAAFduAAGELkABwAH9EEDACoABwABXUEDAEgABwABXUEDACQACAABXUEDACIACgABXbgAChC5AAkAB/RBAwBEAAkAAV1BAwAgAAkAAV1BAwBHAAsAAV1BAwAiAAsAAV1BAwBLAA0AAV1BAwAhAA0AAV0AuAAIL7gAAEVYuAAKLxu5AAoAEj5ZuAAARVi4AAYvG7kABgASPlm4AABFWLgABC8buQAEAAo+WbgAAEVYuAAALxu5AAAACj5ZQQMASwAIAAFdQQMACQAIAAFduAAIELkAAgAB9EEDAAoAAgABXUEDAEMAAgABXTAxAUEDAKMAAAABXUEDAEMAAAABcUEDAAcAAAABXUEDABkAAAABckEDAKEAAQABXUEDAEIAAQABcUEDAHkAAQABcUEDABkAAQABckEFAOoAAQD6AAEAAnFBAwBKAAEAAXJBAwBLAAEAAV1BAwAvAAEAAV1BAwCkAAIAAV1BAwBFAAIAAXFBAwA1AAIAAXJBAwCXAAIAAXFBAwDnAAIAAXFBAwBIAAIAAV1BAwBoAAIAAV1BAwBYAAIAAXFBAwCJAAIAAV1BAwAJAAIAAXJBAwBKAAIAAXJBAwDkAAMAAXFBAwD1AAMAAXFBAwBGAAMAAV1BAwAWAAMAAXJBAwBKAAMAAXJBAwA2AAQAAV1BAwB2AAUAAV1BAwBoAAUAAV1BAwBYAAUAAXFBAwCYAAUAAXFBAwB5AAUAAXFBBwC5AAUAyQAFANkABQADcUEFACkABQA5AAUAAnJBAwCKAAUAAV1BAwAaAAUAAXJBAwD8AAUAAXFBAwAMAAUAAXJBAwBJAAYAAXJBAwDkAAcAAXFBAwD1AAcAAXFBAwAmAAcAAV1BAwAmAAcAAXJBAwBGAAcAAXJBAwA3AAcAAXJBAwA4AAcAAV1BAwBoAAgAAV1BAwCoAAgAAV1BAwAIAAgAAXJBAwBIAAgAAXJBAwB5AAgAAV1BAwBJAAgAAXFBAwA6AAgAAV1BAwD6AAgAAXFBAwA6AAgAAXJBAwApAAkAAXJBAwBKAAkAAV1BBQDqAAkA+gAJAAJxQQMASwAJAAFyQQMAPgAJAAFyQQMALwAJAAFdQQMAJQAKAAFdQQMABwAKAAFdQQMA9AALAAFxQQUABQALABUACwACckEDADUACwABckEDAIYACwABXUEDAKYACwABXUEDAHYACwABcUEFAMYACwDWAAsAAnFBAwAmAAsAAXJBAwBGAAsAAXJBAwBXAAsAAXFBAwC3AAsAAXFBAwBoAAsAAV1BAwCZAAsAAXFBAwB6AAsAAV1BAwA/AA0AAV1BAwBfAA0AAV0AQQMANgACAAFdQQMAhgACAAFdQQMApwACAAFdQQMASQACAAFdQQMAOQACAAFyQQUA6gACAPoAAgACcUEDALsAAgABXUEDAHwAAgABXUEDABwAAgABckEDAC0AAgABckEDAA8AAgABckEDAE8AAgABckEDADYABQABckEDANkABQABcUEDAPkABQABcUEDAPIACAABcUEDAHMACAABcUEDAEQACAABcUEDAAQACAABckEHACQACAA0AAgARAAIAANyQQUAhQAIAJUACAACcUEDAOUACAABcUEDABUACAABckEDAMYACAABcUEDADcACAABXUEFAGcACAB3AAgAAl1BAwCnAAgAAV1BAwAYAAsAAXJBAwBJAAsAAXFBAwDZAAsAAXFBAwD5AAsAAXEhIycHIzcnMxc3MwcBkS6Ski6poi+Kii+i19f06NDQ6AABAAAAAAFuAdwACAPzuAAFL7gAAC+7AAIABwADAAQrQQMAPwAAAAFxQQMAjwAAAAFxQQMAPwAAAAFdQQMAxgAAAAFxQQMASwAEAAFyQQMAyQAFAAFxQQMASQAFAAFyQQMAIwAFAAFxQQMAEQAFAAFxuAAFELkABgAH9EEDABcABgABcUEDAEgABgABckEDAMcABgABcUEDAGYABgABcUEDACQABgABcboABwADAAIREjm6AAcABAABERI5QQMAiQAHAAFxQQMAOgAHAAFxQQUA6AAHAPgABwACcUEDADcABwABcrgAABC5AAgAB/RBAwA4AAgAAXFBAwDIAAgAAXFBAwBoAAgAAXFBAwCPAAoAAXFBAwByAAoAAXEAuAAARVi4AAAvG7kAAAASPlm4AABFWLgABS8buQAFABI+WbgAAEVYuAACLxu5AAIACj5ZQQMAOAABAAFxQQMAGgABAAFxQQMAKQABAAFxQQMAiAABAAFxQQMAxwABAAFxQQMAGwAEAAFxQQMAjAAEAAFxQQMAKgAEAAFxQQMAWQAEAAFxQQMA6wAGAAFxugAHAAIAABESOUEDAGQABwABcUEDAAQABwABckEDADUABwABcUEDADcABwABckEDAPcABwABXUEDAAcABwABcUEDAPYABwABcUEDABUABwABcUEDAIQABwABcUEDACQABwABckEDABIABwABcjAxAUEDACAAAAABckEDAHIAAAABcUEDANIAAAABcUEDAMMAAAABcUEDAEcAAAABckEDAJgAAAABcUEDADoAAAABckEDAO8AAAABcUEDANYABQABcUEDAD0ABQABckEDAE8ABQABckEDANUABgABcUEDAOYABgABcUEDADwABgABckEDAE0ABgABckEDAHYABwABcUEDANYABwABcUEDAMgABwABcUEDAOgABwABcUEDADsABwABckEDAMAACAABcUEDACAACAABckEDANIACAABcUEDAHYACAABcUEDALkACAABcUEDADkACAABckEDAJoACAABcUEDAO8ACAABcUEDACQACQABcUEDAD4ACgABcUEDAD8ACgABXQBBBQDJAAEA2QABAAJxQQMAegABAAFxQQUAqgABALoAAQACcUEFAOsAAQD7AAEAAnFBBQArAAEAOwABAAJyQQMAegAEAAFxQQUAqgAEALoABAACcUEDABoABAABckEDAEoABAABckEHANsABADrAAQA+wAEAANxQQMAPAAEAAFyQQMALwAEAAFyQQMAwQAHAAFxQQMAQwAHAAFyQQMAlAAHAAFxQQMA1AAHAAFxQQMA5QAHAAFxQQMAdwAHAAFxQQMA9wAHAAFxQQMAKwAHAAFyAQMVIzUDMxc3AW6kJqQtiooB3P720tEBC+npAAEAFgAAAZgB3AAJAdi4AAUvuAAIL7gAAC+4AAIvQQMAXAACAAFduAAIELkABAAH9EELAA8ABAAfAAQALwAEAD8ABABPAAQABXJBAwBAAAUAAV1BAwBEAAYAAV24AAIQuQAJAAf0QQUAEQAJACEACQACckEDAEEACQABckEDADAACQABckEDAAAACQABckEDAF0ACgABXQC4AABFWLgABy8buQAHABI+WbgAAEVYuAAGLxu5AAYAEj5ZuAAARVi4AAIvG7kAAgAKPlm4AABFWLgAAS8buQABAAo+WboAAwAIAAMruAABELkAAAAB9LgABhC5AAUAAfRBAwArAAgAAXIwMQFBAwACAAAAAV1BAwABAAEAAV1BAwA+AAIAAV1BAwAfAAIAAV1BAwAfAAMAAV1BAwA/AAMAAV1BAwAAAAQAAV1BAwArAAQAAXJBAwBMAAQAAXJBAwAfAAUAAV1BAwAfAAYAAV1BAwAAAAcAAV1BAwAAAAgAAV1BAwBGAAgAAXJBAwAmAAkAAXJBAwBGAAkAAXJBAwBaAAkAAXJBAwAfAAkAAV1BAwA/AAkAAV1BAwAfAAoAAV1BAwA/AAoAAV1BAwAaAAsAAV1BAwA+AAsAAV0AQQMAHAADAAFdQQMAKQAIAAFyJQchNQEhNyEVAQGYCP6GAUP+0QYBW/6+ISEaAaEhG/5gAAABADT/sgC5AfoABwAtuwAHAAUAAgAEK7gAAhC4AAHcuAAE0AC7AAAAAgABAAQruwAEAAIABQAEKzAxFxUjETMVIxG5hYViMB4CSB799AAAAAH/9//kARcB4wADAIm7AAMABwACAAQruwAAAAcAAQAEKwC4AAAvuAAARVi4AAIvG7kAAgASPlkwMQFBAwAnAAAAAXFBBQBHAAAAVwAAAAJxQQMARwAAAAFyQQUAVgADAGYAAwACXUEHAKYAAwC2AAMAxgADAANdQQUAxgADANYAAwACcUEDABcAAwABcUEDADcAAwABcQUjAzMBFyj4JxwB/wAAAQAL/7IAkQH6AAcAMboAAAABAAMruAAAELkAAwAF9LgAARC4AAXQALsAAwACAAAABCu7AAcAAgAEAAQrMDEXIzUzESM1M5GGYmKGTh4CDB4AAAAAAQArAJ8BbwHgAAYBM7gABS+4AAEvQQMA1wAAAAFxQQMARQAAAAFyQQMA+AABAAFdQQMA1gABAAFxQQMANQABAAFyQQMAOQACAAFyQQMAKwACAAFyQQMAiQACAAFxQQMA2AACAAFxQQMAKAADAAFyQQUANgAEAEYABAACckEDANYABAABcUEDACUABAABckEDAIIABAABcUEDADoABQABckEDAEgABQABckEDAPcABQABXUEDANsABgABcUEDAEoABgABcgC4AAUvuAACL7gAAEVYuAAGLxu5AAYAEj5ZugADAAAAARESOboAAwAGAAUREjlBAwBqAAMAAXFBAwBLAAMAAXJBBQAsAAMAPAADAAJyQQMAzgADAAFxQQMArAADAAFxQQMAigADAAFxQQMA+QADAAFdQQMA1wADAAFxMDEbASMLASMT35AlfX0lkAHg/r8BG/7lAUEAAAAAAQAA/0kBYP9oAAMADQC7AAAAAQABAAQrMDEFFSE1AWD+oJgfHwAAAAEAOwGGAJQB4QADAD1BAwA4AAEAAXJBAwBGAAIAAXJBAwA1AAIAAXIAuAAAL7gAAEVYuAADLxu5AAMAEj5ZugACAAAAAxESOTAxEyMnN5QfOicBhlEKAAACABr/9wEwAVsAGAAiBLS4ACMvuAAkL7gAFty5AAoAB/S4AALQuAACL7gAIxC4AAfQuAAHL0EDALsACAABcUEDABsADQABckEDAPcAEQABcUEHAAYAEQAWABEAJgARAANyQQUANQARAEUAEQACckELAAgAEgAYABIAKAASADgAEgBIABIABV1BAwAcABIAAXJBAwD9ABIAAXFBAwANABIAAXJBAwBNABIAAXJBAwAtABIAAXJBAwA7ABIAAXJBAwAHABIAAXFBAwDHABIAAXG4AAoQuAAZ0LgABxC5ABwAB/RBBQBWABwAZgAcAAJdQRkARgAcAFYAHABmABwAdgAcAIYAHACWABwApgAcALYAHADGABwA1gAcAOYAHAD2ABwADHFBBwAGABwAFgAcACYAHAADckEJAAYAHAAWABwAJgAcADYAHAAEXUERAIYAHACWABwApgAcALYAHADGABwA1gAcAOYAHAD2ABwACF1BBwAGABwAFgAcACYAHAADcUEFADUAHABFABwAAnK4AAoQuAAh0LgAIS8AuAAARVi4ABQvG7kAFAAOPlm4AABFWLgAAS8buQABAAo+WbgAAEVYuAAELxu5AAQACj5ZuwAKAAEAGgAEK7oAAgAEABQREjlBAwC7AAIAAXFBAwB6AAYAAV1BAwAJAAgAAXFBAwBGAAgAAV1BBQAlAAgANQAIAAJdQQMA0wAKAAFdQQMAcAAKAAFdQQUAGQANACkADQACcUEDAMsADQABcUEDAAwADQABcUEDAP0ADQABcUEDAAsADQABckEDAKoADQABcUEDAPkADQABXUEFANkADQDpAA0AAnG4ABQQuQAPAAH0QQUAOQAPAEkADwACckEhAAgADwAYAA8AKAAPADgADwBIAA8AWAAPAGgADwB4AA8AiAAPAJgADwCoAA8AuAAPAMgADwDYAA8A6AAPAPgADwAQXUEhAAgADwAYAA8AKAAPADgADwBIAA8AWAAPAGgADwB4AA8AiAAPAJgADwCoAA8AuAAPAMgADwDYAA8A6AAPAPgADwAQcUEHAAgADwAYAA8AKAAPAANyQQMABwARAAFxQQMAiAARAAFdQQMA5gARAAFdQQMA9AARAAFdQQMA8wASAAFdQQMA5AASAAFxQQMARAASAAFxQQMA5QASAAFdQQMAlwASAAFxQQMABwASAAFxQQMAxwASAAFxQQMA1gASAAFxQQMApQASAAFxQQMAJAASAAFxQQMAdAASAAFxQQMAgwASAAFxQQMAUQASAAFxQQMA0wAaAAFdQQMAcAAaAAFdQQMACAAbAAFxuAAEELkAHwAB9EEhAAcAHwAXAB8AJwAfADcAHwBHAB8AVwAfAGcAHwB3AB8AhwAfAJcAHwCnAB8AtwAfAMcAHwDXAB8A5wAfAPcAHwAQXUEhAAcAHwAXAB8AJwAfADcAHwBHAB8AVwAfAGcAHwB3AB8AhwAfAJcAHwCnAB8AtwAfAMcAHwDXAB8A5wAfAPcAHwAQcUEHAAcAHwAXAB8AJwAfAANyQQUANgAfAEYAHwACcjAxAUEDAEYAEQABXUEDACcAEQABXUEDAEUAEgABXUEFACYAEgA2ABIAAl1BBQAHABIAFwASAAJdIQcnBiMiJjU0OwE1NCcmIyIHJzYzMh0BFCc1IhUUFjMyNzYBMCMOLkssQN0GDxc3I0kFODyBJ7ooHk8gBQc3OTIsfwYhGSgXJBKOeipFRFYhI0MLAAIAMf/3AXUB+QARAB4E3rgAHy+4ACAvQQMAGwAgAAFdQQMAOwAgAAFduAAA3EEDAE0AAAABXUEHABwAAAAsAAAAPAAAAANdQQMANgABAAFdQQMA0wACAAFduAAfELgACtC4AAovuQAaAAf0uAAF0LgABS9BAwAHAAUAAXK4ABoQuAAH0LgABy+4AAoQuAAI0LgACC+4ABoQuAAM0LoADQAIAAAREjlBBQADAA0AEwANAAJyQQMA1wANAAFdQQMATAANAAFdQQMAHAANAAFdQQMA4wANAAFxQQMAIgANAAFyQQUAMQANAEEADQACckEDADMAEAABXUEDAEIAEAABXUEDANEAEAABXbgAABC5ABIAB/RBBQA6ABIASgASAAJyQQMATAASAAFdQQMAOgASAAFdQQcACQASABkAEgApABIAA11BFwBZABIAaQASAHkAEgCJABIAmQASAKkAEgC5ABIAyQASANkAEgDpABIA+QASAAtdQSEACQASABkAEgApABIAOQASAEkAEgBZABIAaQASAHkAEgCJABIAmQASAKkAEgC5ABIAyQASANkAEgDpABIA+QASABBxQQcACQASABkAEgApABIAA3JBAwBEABQAAV1BAwA2AB4AAV0AuAALL7gAAEVYuAAPLxu5AA8ADj5ZuAAARVi4AAcvG7kABwAKPlm4AABFWLgAAy8buQADAAo+WboABQADAAsREjlBAwAMAAUAAXK6AA0AAwALERI5QQMA0gANAAFdQQMAxAANAAFdQQMAhQANAAFxQQMAVgANAAFxQQMARAANAAFxQQMA5AANAAFxQQMAoQANAAFdQQsAAAANABAADQAgAA0AMAANAEAADQAFcrgADxC5ABUAAfRBBQA5ABUASQAVAAJyQSEACAAVABgAFQAoABUAOAAVAEgAFQBYABUAaAAVAHgAFQCIABUAmAAVAKgAFQC4ABUAyAAVANgAFQDoABUA+AAVABBdQSEACAAVABgAFQAoABUAOAAVAEgAFQBYABUAaAAVAHgAFQCIABUAmAAVAKgAFQC4ABUAyAAVANgAFQDoABUA+AAVABBxQQcACAAVABgAFQAoABUAA3JBAwCrABoAAV1BAwBlABoAAXG4AAMQuQAdAAH0QQ0ApwAdALcAHQDHAB0A1wAdAOcAHQD3AB0ABl1BIQAHAB0AFwAdACcAHQA3AB0ARwAdAFcAHQBnAB0AdwAdAIcAHQCXAB0ApwAdALcAHQDHAB0A1wAdAOcAHQD3AB0AEHFBBwAHAB0AFwAdACcAHQADckEDAJkAHQABXUETAAcAHQAXAB0AJwAdADcAHQBHAB0AVwAdAGcAHQB3AB0AhwAdAAldQQUANgAdAEYAHQACcjAxAUEDACsABAABckEDAAgABQABckEDAPMADQABcUEDAJoADQABXUEDAAgAGgABckEDAJkAHAABXUEDAB8AHwABXUEDACwAIAABXUEDAE0AIAABXQBBAwAnAAQAAXJBAwAKAAUAAXJBAwCfAAUAAV1BAwD/AAUAAXFBAwA/AAUAAXJBAwCQAA0AAV1BAwD1AA0AAXFBAwCaABkAAV1BAwAgABoAAXJBAwBAABoAAXJBAwDyABoAAXFBAwACABoAAXJBAwAUABoAAXJBAwCbABoAAV1BAwAgABsAAXJBAwBDABsAAXIlFAYjIicUByM2NREzFTYzMhYHNCYjIgcGHQEUFjMyAXVWSVAvAiQDJyxVR1ImQDowIydEMn6uUmVFIhoaOQGm5khiTD9QISM3OTBAAAAAAQAb//cBOAFbABUFYLsAEQAHAAYABCtBAwBqAAAAAXFBAwBHAAEAAXJBAwBkAAEAAXFBAwBmAAsAAXFBAwBqAAwAAXFBAwB6AA0AAXFBIQAGABEAFgARACYAEQA2ABEARgARAFYAEQBmABEAdgARAIYAEQCWABEApgARALYAEQDGABEA1gARAOYAEQD2ABEAEF1BIQAGABEAFgARACYAEQA2ABEARgARAFYAEQBmABEAdgARAIYAEQCWABEApgARALYAEQDGABEA1gARAOYAEQD2ABEAEHFBBwAGABEAFgARACYAEQADckEFADUAEQBFABEAAnJBAwBvABcAAXFBAwB/ABcAAV1BBQA/ABcATwAXAAJdALgAAEVYuAAJLxu5AAkADj5ZuAAARVi4AAMvG7kAAwAKPllBAwA+AAAAAXFBAwArAAAAAXFBAwBbAAEAAXFBBQAvAAEAPwABAAJxQQMAHAABAAFxQQMASgABAAFyQQMASgABAAFxQQMAFQALAAFxQQMA+AALAAFdQQMARQALAAFxQQMAUwALAAFxQQMAIAALAAFxQQMAeAAMAAFxQQMASAAMAAFyQQMAIgAMAAFxQQMAOgANAAFxuAAJELkADgAB9EEFADkADgBJAA4AAnJBIQAIAA4AGAAOACgADgA4AA4ASAAOAFgADgBoAA4AeAAOAIgADgCYAA4AqAAOALgADgDIAA4A2AAOAOgADgD4AA4AEF1BIQAIAA4AGAAOACgADgA4AA4ASAAOAFgADgBoAA4AeAAOAIgADgCYAA4AqAAOALgADgDIAA4A2AAOAOgADgD4AA4AEHFBBwAIAA4AGAAOACgADgADckEDAFoAEAABcUEDAFQAEgABcbgAAxC5ABQAAfRBIQAHABQAFwAUACcAFAA3ABQARwAUAFcAFABnABQAdwAUAIcAFACXABQApwAUALcAFADHABQA1wAUAOcAFAD3ABQAEF1BIQAHABQAFwAUACcAFAA3ABQARwAUAFcAFABnABQAdwAUAIcAFACXABQApwAUALcAFADHABQA1wAUAOcAFAD3ABQAEHFBBwAHABQAFwAUACcAFAADckEFADYAFABGABQAAnIwMQFBAwDzAAAAAXFBAwDHAAAAAXFBAwB5AAAAAXFBAwCgAAEAAXFBAwDgAAEAAXFBAwAwAAEAAXJBAwAhAAEAAXJBAwDSAAEAAXFBAwAVAAEAAXJBAwC2AAEAAXFBAwD6AAEAAXFBAwCZAAQAAXFBAwBqAAQAAXFBAwCKAAQAAXFBAwBpAAgAAXFBBQCKAAgAmgAIAAJxQQMA/QAIAAFxQQMAIgAKAAFyQQMA4wAKAAFxQQMApgAKAAFxQQMAoAALAAFxQQMA4AALAAFxQQMAIAALAAFyQQMA0gALAAFxQQMAFAALAAFyQQMA9wAMAAFxQQMAyAAMAAFxQQMA6AAMAAFxQQMAugAMAAFxQQMAyAANAAFxQQMA+QANAAFxQQMAvQANAAFxQQMAIwAPAAFyQQMAIwATAAFyQQMAygAVAAFxQQMAHwAXAAFdAEEDAPUAAAABcUEDAHgAAAABcUEDAMoAAAABcUEFAIkAAQCZAAEAAnFBAwA5AAEAAXJBAwB6AAEAAXFBAwC7AAEAAXFBAwANAAEAAXJBAwD/AAEAAXFBAwB7AAUAAXFBAwCmAAoAAXFBAwB0AAsAAXFBBQCGAAsAlgALAAJxQQMAKAALAAFyQQMAyAAMAAFxQQMAugAMAAFxQQMAKgAMAAFyQQMASgAMAAFyQQMA+wAMAAFxQQMACwAMAAFyQQMAPAAMAAFyQQMAuAANAAFxQQMAyQANAAFxQQMA+QANAAFxJRcGIyImNTQ2MzIXByYjIgYVFBYzMgEqDis+VGBgVD4rDiU4PU9PPTgvIBhhUVFhGCAYTkRETgAAAAACABz/9wFgAfkAEQAeBLC4AB8vuAAgL7gAENy4AADQuAAAL7gAEBC5ABIAB/S4AAHQuAABL7gAEhC4AAPQuAADL0EDAHsABgABXUEDACkABgABXUEDAF8AHwABXbgAHxC4AAjQuAAIL0EDAG4ACAABXUEFAH0ACACNAAgAAl1BAwBaAAoAAV1BAwArAAoAAV1BBQBrAAoAewAKAAJdQQMAOgAKAAFdQQMASAAKAAFduAASELgADdC4AAgQuQAaAAf0QQsABgAaABYAGgAmABoANgAaAEYAGgAFXUEDAIgAGgABXUEDAHcAGgABXUEPAJYAGgCmABoAtgAaAMYAGgDWABoA5gAaAPYAGgAHXUEhAAYAGgAWABoAJgAaADYAGgBGABoAVgAaAGYAGgB2ABoAhgAaAJYAGgCmABoAtgAaAMYAGgDWABoA5gAaAPYAGgAQcUEHAAYAGgAWABoAJgAaAANyQQUANQAaAEUAGgACckEDACoAGwABXQC4AA4vuAAARVi4AAsvG7kACwAOPlm4AABFWLgAAC8buQAAAAo+WbgAAEVYuAAFLxu5AAUACj5ZugADAAUADhESOboADQAFAA4REjm4AAsQuQAXAAH0QQUAOQAXAEkAFwACckEhAAgAFwAYABcAKAAXADgAFwBIABcAWAAXAGgAFwB4ABcAiAAXAJgAFwCoABcAuAAXAMgAFwDYABcA6AAXAPgAFwAQXUEhAAgAFwAYABcAKAAXADgAFwBIABcAWAAXAGgAFwB4ABcAiAAXAJgAFwCoABcAuAAXAMgAFwDYABcA6AAXAPgAFwAQcUEHAAgAFwAYABcAKAAXAANyuAAFELkAHAAB9EEhAAcAHAAXABwAJwAcADcAHABHABwAVwAcAGcAHAB3ABwAhwAcAJcAHACnABwAtwAcAMcAHADXABwA5wAcAPcAHAAQXUEhAAcAHAAXABwAJwAcADcAHABHABwAVwAcAGcAHAB3ABwAhwAcAJcAHACnABwAtwAcAMcAHADXABwA5wAcAPcAHAAQcUEHAAcAHAAXABwAJwAcAANyQQUANgAcAEYAHAACcjAxAUEDABcAAwABckEDACgAAwABckEDANsABgABXUEDANsACgABXUEDAMcADQABcUEDAEgADQABckEFAFkAFQBpABUAAnFBAwBKABUAAXFBAwDbABUAAXFBAwDZABoAAV1BAwCmAB4AAV1BAwB9AB8AAV1BAwBuAB8AAV0AQQMAngADAAFdQQUALgADAD4AAwACckEDAK8AAwABXUEDAP8AAwABcUEDAB8AAwABckEDAE8AAwABckEDAN0ABwABXUEDAGUADAABcUEDAPAADQABcUEFAAAADQAQAA0AAnJBAwBAAA0AAXJBAwCBAA0AAXFBAwDhAA0AAXFBAwAhAA0AAXJBAwCjAA0AAV1BBQCjAA0AswANAAJxQQMAMwANAAFyQQMAlAANAAFdQQMAxAANAAFdQQMAxAANAAFxQQMAQQASAAFyQQMAAwASAAFyQQUAnwASAK8AEgACXUEFAMoAFADaABQAAnFBAwBPABQAAXJBAwBYABUAAXFBAwBKABUAAXJBAwBlAB4AAXFBAwCbAB4AAV0hIyY1BiMiJjU0NjMyFzUzERQnNTQnJiMiBhUUMzI2AWAkAi9QSVZSR1UsJycnIzA6QH4yRBoiRWVSS2JI5v5aOW45NyMhUD+VQAAAAAIAG//3AVcBWwAQABkF07sADAAHAAYABCtBAwAWAAAAAXJBAwCHAAEAAXFBAwDlAAEAAXFBAwBEAAIAAXJBAwDqAAQAAXFBAwBKAAQAAXJBAwAoAAUAAXJBAwC4AAcAAXFBAwCGAAgAAXFBAwAJAAgAAXJBAwAqAAgAAXJBBQA4AAgASAAIAAJxQQMAlQAIAAFdQQMAowAIAAFdQQUAtQAKAMUACgACXUEDAIYACgABXUEDABgACgABckEDAAYACgABckEDACQACgABckEDAHMACgABXUEDACcACwABcUEDANgACwABcUEDAIkACwABXUEDALkACwABXUEDAEcACwABckEDABYACwABckEDAEQACwABXUEDADcADAABcUEDAIUADQABcUEDAJYADQABcUEFADYADQBGAA0AAnJBAwDkAA0AAXFBAwAUAA0AAXJBAwA1AA4AAXFBAwDmAA4AAXFBAwBFAA4AAXJBAwAQAA4AAXJBAwBLABAAAXJBAwDYABEAAXFBAwCJABEAAV1BAwBpABEAAXFBAwApABEAAXJBAwD6ABEAAXFBAwA8ABEAAXJBAwAaABEAAXJBAwDpABEAAXFBAwC5ABEAAV1BAwA4ABEAAXFBAwCoABEAAXFBAwBAABEAAV1BAwANABIAAXJBAwA6ABIAAXJBAwB4ABIAAXFBAwBKABMAAXJBAwALABMAAXJBAwA+ABMAAXJBBQC6ABMAygATAAJxQQUAiQATAJkAEwACcUEDABgAEwABcUEDADoAFAABcUEDAHUAFAABXUEDAAQAFwABckEDANUAFwABcUEDABcAFwABcUEDADcAFwABcUEDAJYAFwABXUEDAMQAFwABcUEDAPIAFwABcUEDACAAFwABcrgADBC4ABnQuAAZL0EDAF8AGwABXUEDAL8AGwABXUEDAI8AGwABXUEDAC4AGwABXUEDAD0AGwABXQC4AABFWLgACS8buQAJAA4+WbgAAEVYuAADLxu5AAMACj5ZuwARAAEACwAEK7oAAAADAAkREjlBAwDHAAAAAXFBAwDsAAEAAXFBAwC6AAEAAXFBAwCJAAEAAXFBAwAnAAgAAXJBAwDUAAsAAV1BAwATAA0AAXK4AAMQuQAPAAH0QSEABwAPABcADwAnAA8ANwAPAEcADwBXAA8AZwAPAHcADwCHAA8AlwAPAKcADwC3AA8AxwAPANcADwDnAA8A9wAPABBdQSEABwAPABcADwAnAA8ANwAPAEcADwBXAA8AZwAPAHcADwCHAA8AlwAPAKcADwC3AA8AxwAPANcADwDnAA8A9wAPABBxQQcABwAPABcADwAnAA8AA3JBBQA2AA8ARgAPAAJyQQMA0wARAAFduAAJELkAFQAB9EEFADkAFQBJABUAAnJBIQAIABUAGAAVACgAFQA4ABUASAAVAFgAFQBoABUAeAAVAIgAFQCYABUAqAAVALgAFQDIABUA2AAVAOgAFQD4ABUAEF1BIQAIABUAGAAVACgAFQA4ABUASAAVAFgAFQBoABUAeAAVAIgAFQCYABUAqAAVALgAFQDIABUA2AAVAOgAFQD4ABUAEHFBBwAIABUAGAAVACgAFQADckEDACgAFwABcUEDANgAFwABcTAxAUEDAIkAAQABXUEDANoABAABcUEDADoABAABckEDAPsABAABcUEDAAsABAABckEDANMACAABcUEDAMkACAABcUEDADoACAABckEDABYACgABckEDADwACgABcUEDADUADgABckEDANoAEQABcUEDADkAEgABcUEDANoAEgABcUEDADkAEwABcUEDANoAEwABcUEDACoAEwABckEFANUAFgDlABYAAnFBAwAfABsAAV1BAwDfABsAAV0AQQUAJgAAADYAAAACckEDAHgAAQABcUEDANkABQABcUEDAMoABQABcUEDAPoABQABcUEDAAoABQABckEDALsABQABcUEDAGYABwABcUEDAOQADQABcUEDAIYADQABXSUXBiMiJjU0NjMyFyEeATMyNyYnJiMiBwYHAUQDOkROYGBKjwP+6gJNPTwpARYePTcjHAcwIRhgSlRms0RLrikgLCggLQABAAUAAADxAgEAEwFvuwAKAAcACwAEK0EDANMABAABXUEDAOQABAABXUEFABYABAAmAAQAAnFBAwA3AAQAAXFBAwDmAAQAAXFBAwAFAAQAAXJBAwAEAAQAAXFBAwDxAAQAAV1BAwAxAAQAAXK4AAoQuAAF0LgACxC4AA/QuAAPL0EDAC0AEQABckEDAFkAEQABXUEDACMAEgABXUEFAC8AFQA/ABUAAl1BAwBfABUAAV1BAwAfABUAAXFBAwB/ABUAAV0AuAAARVi4AAYvG7kABgAOPlm4AABFWLgADi8buQAOAA4+WbgAAEVYuAAKLxu5AAoACj5ZuwASAAEAAwAEK0EDAPkABAABcbgABhC5AAgAAfS4AAzQuAAN0EEDADYAEQABXUEDACUAEQABXTAxAUEDABQABAABckEDAMUABAABcUEDAMYABAABXUEFAKYABAC2AAQAAnFBAwDXAAQAAXFBBwAQABQAIAAUADAAFAADXUEDAB8AFQABXRMHJiMiHQEzFSMRIxEjNTM1NDMy8QsWG1BiYic5OnkmAfEcC38NH/7LATUfDaAAAAIAJP9jARsBVQAnADUIOrsALwAFACAABCu7AAsABgAoAAQrQQMAagALAAFxuAALELgAANC4AAAvQQMAowABAAFdQQMAhAAFAAFdQQUAjAAgAJwAIAACXUEDAHoAIAABXUEPAAYALwAWAC8AJgAvADYALwBGAC8AVgAvAGYALwAHXUEFAH0ALwCNAC8AAl1BAwCbAC8AAV1BDQCmAC8AtgAvAMYALwDWAC8A5gAvAPYALwAGXUEhAAYALwAWAC8AJgAvADYALwBGAC8AVgAvAGYALwB2AC8AhgAvAJYALwCmAC8AtgAvAMYALwDWAC8A5gAvAPYALwAQcUEHAAYALwAWAC8AJgAvAANyQQUANQAvAEUALwACcroAHAAgAC8REjm4ABwvQQMAhgAcAAFdQQMAYwAcAAFyuQAHAAb0QQMAZgAHAAFyQQMAhQAHAAFdQQMAMAAJAAFyQQMAZgAKAAFxQQMAJAAKAAFyQQMAVAAKAAFxQQMAJwAMAAFyQQMAlAAMAAFxQQMANQANAAFyQQMAdgANAAFxQQMAJAANAAFyQQMAZAANAAFxQQMAOgAPAAFyQQUAmgAQAKoAEAACcUEDAPwAEAABcUEDADsAEAABcUEDAGkAEAABcUEDALgAEAABcUEDAKkAEQABXUEDAFYAEQABcUEDAGUAEQABcUEDADUAEgABckEFADsAFABLABQAAnJBBQAsABUAPAAVAAJyQQMAOQAVAAFxQQUAOgAoAEoAKAACckEhAAkAKAAZACgAKQAoADkAKABJACgAWQAoAGkAKAB5ACgAiQAoAJkAKACpACgAuQAoAMkAKADZACgA6QAoAPkAKAAQXUEhAAkAKAAZACgAKQAoADkAKABJACgAWQAoAGkAKAB5ACgAiQAoAJkAKACpACgAuQAoAMkAKADZACgA6QAoAPkAKAAQcUEHAAkAKAAZACgAKQAoAANyuAAoELgAFtC4ABYvQQMAagAWAAFxQQMAagAXAAFxQQMAmQAXAAFxQQMAZgAdAAFyQQMAhgAeAAFdQQMAjAAiAAFdQQMAmgAiAAFdQQMAaQAkAAFxQQMAqgAkAAFdQQMA+gAkAAFxQQMAKwAkAAFyQQMA3QAkAAFdQQMAjgAkAAFdQQMAzwAkAAFdQQMAvgAkAAFdQQMAewAkAAFxQQMAmwAkAAFdQQUAOgAkAEoAJAACckEDACkAJAABcUEDAJkAJAABcUEDAAkAJAABckEDAIwAJQABXUEDAO4AJQABcUEDAL4AJQABXUEDAHsAJQABcUEDAKoAJQABXboAJgAgAAAREjlBAwA5ACYAAXFBBQAzACYAQwAmAAJyQQMALwAqAAFyQQMAPAAqAAFyQQMACgAqAAFyQQMALgArAAFyQQMA/AArAAFxQQMARQAtAAFyQQMAFgAxAAFyQQMAJwAxAAFyQQMANAAxAAFyQQMAQwAxAAFyQQMAQgAyAAFyQQMAMAAyAAFyQQMAGgA0AAFyQQMApwA0AAFduAALELgAN9wAuAAARVi4ACMvG7kAIwAOPlm7ABMAAQAOAAQruwAzAAIAAwAEK0EDACsAAwABXUEDABAAAwABXUEFAOkABQD5AAUAAnFBAwAJAAUAAXJBAwAoAAUAAV1BAwCmAAkAAXFBAwC3AAkAAXFBAwDnAAkAAXFBAwCXAAkAAXFBAwD2AAkAAXFBBwAGAAkAFgAJACYACQADckEFAMYACQDWAAkAAnFBAwClAAoAAXFBBwDSAAoA4gAKAPIACgADXUEDAEIACgABcUEDAGgACwABcUEDAG0ADAABcUEDAEsADAABcUEDAKsADAABcUEDACcADQABckEDAKkAEAABcUEDABsAEAABckEDAAoAEAABckEDAPgAEAABcUEDALgAEAABcUEFAAUAEQAVABEAAnJBAwAgABEAAXJBAwDEABIAAXFBBwAGABUAFgAVACYAFQADcUEDAGwAFQABcUEDAJUAFQABcUEDAFMAFQABcUEDAKkAGAABcUEDADkAGAABckEDAJsAGAABcUEDAEsAGAABckEDAPoAGAABcUEHAAoAGAAaABgAKgAYAANyQQcAyQAYANkAGADpABgAA3FBBQAZABgAKQAYAAJxQQMAuAAYAAFxQQMAGgAbAAFxQQMAWQAbAAFxQQMADQAcAAFxQQMAEAAeAAFdQQMAJgAhAAFduAAjELkAJQAC9EEDADcAJgABckEDADwAKgABcbgALNBBAwBKAC0AAXJBAwDGADEAAXFBAwAmADEAAXJBAwAQADMAAV0wMQFBAwBUAAEAAV1BBQA1AAEARQABAAJdQQMAZgABAAFdQQMAMwACAAFdQQMARAACAAFdQQMAZQACAAFdQQMATQAFAAFyQQMAPgAFAAFyQQMARAAJAAFyQQMA2wAQAAFdQQMA7QAQAAFdQQMAQQASAAFyQQMAiAAVAAFxQQMAOQAVAAFxQQMAawAeAAFyQQMAPAAeAAFyQQMATgAeAAFyQQMAewAgAAFdQQUASgAiAFoAIgACXUEDAHsAIgABXUEDAD4AIgABXUEDAFoAJAABcUEDAIoAJAABcUEDABsAJAABcUEFADsAJABLACQAAnFBAwDsACQAAV1BAwAMACQAAXFBAwD/ACQAAV1BAwBaACUAAXFBAwCKACUAAXFBAwAbACUAAXFBBQA7ACUASwAlAAJxQQMA7AAlAAFdQQMADAAlAAFxQQMA/wAlAAFdQQMASgAnAAFyQQMASgAqAAFyQQMASgArAAFyQQMAfAAtAAFdAEEDAIUAFQABcUEDADYAFQABcUEDAGkAHgABckEDAHUAIgABXSUUBiMiJwYVFBcWFRQGIyInNxYzMjY1NCcmJyY1NDcmNTQ2OwEVJxYHNCcmIyIGFRQXFjMyNgETRTMfFgZRYD48NSwOKyslME8wEh8KJUQuhTEpIhUYKSgsGxkgJDLkOEILDw4aFxtHKzcbIBkiGzAaDwwTHhIeKC02QiAFKDMhGR41JCgYFi4AAAABADQAAAFSAfkAEAMmuAARL7gAEi9BAwAvABIAAV24AAHcQQMAHwABAAFduQACAAf0QQMADQAEAAFyQQMAygAEAAFxuAARELgACtC4AAovuQAJAAf0uAAM0EEDAEQAEAABXUEDAEAAEAABcQC4AAsvuAAARVi4AA8vG7kADwAOPlm4AABFWLgAAS8buQABAAo+WbgAAEVYuAAJLxu5AAkACj5ZQQMADQADAAFyQQMAKwADAAFyuAAPELkABQAB9EEFADkABQBJAAUAAnJBFwBYAAUAaAAFAHgABQCIAAUAmAAFAKgABQC4AAUAyAAFANgABQDoAAUA+AAFAAtdQSEACAAFABgABQAoAAUAOAAFAEgABQBYAAUAaAAFAHgABQCIAAUAmAAFAKgABQC4AAUAyAAFANgABQDoAAUA+AAFABBxQQcACAAFABgABQAoAAUAA3JBCQAIAAUAGAAFACgABQA4AAUABF1BAwAEAAgAAXJBAwBDAAgAAXJBAwAQAAgAAXK6AA0AAQALERI5QQMARQANAAFyQQMAEQANAAFyQQMABAAQAAFyQQMAQAAQAAFdMDEBQQMA8AAEAAFdQQMAUwAEAAFdQQMA4wAEAAFdQQMA1AAEAAFdQQMANQAEAAFdQQMApgAEAAFxQQMAtwAEAAFxQQMASQAEAAFyQQMAQgAGAAFyQQMA+gAGAAFxQQMAewAGAAFxQQMAbAAGAAFxQQMAewAOAAFxQQMAUAAQAAFdQQMA4AAQAAFdQQUAoAAQALAAEAACcUEDAPEAEAABXUEDANIAEAABXUEDADMAEAABXUEDAPUAEAABcUEDAB8AEgABXQBBAwCcAAMAAXFBBQCQAAgAoAAIAAJdQQMAwAAIAAFdQQUAYAAIAHAACAACcUEDAPAACAABcUEHAAAACAAQAAgAIAAIAANyQQMAggAIAAFxQQMAgwAIAAFdQQcAgAANAJAADQCgAA0AA11BAwDAAA0AAV1BBwBgAA0AcAANAIAADQADcUEDAAAADQABckEDADEADQABckEFABIADQAiAA0AAnJBAwDzAA0AAXFBAwBDAA0AAXJBAwDkAA0AAXElFSM1NCMiBh0BIxEzFTYzMgFSJ2YpQScnKUmFwcHBekUozgH54kQAAAIAJwAAAGYB2wADAA8BwrsAAwAHAAoABCu4AAMQuQABAAf0QQMAQQAEAAFxQQUAggAEAJIABAACckEDABMABAABcUEDANMABAABcUEDAIQABAABcUEDAHQABAABckEDAGUABAABckEDAPUABAABcUEFAAUABAAVAAQAAnJBAwDWAAQAAV1BBQBnAAQAdwAEAAJxQQMA5wAEAAFxQQMAxwAEAAFdQQMANgAEAAFyQQUAtQAEAMUABAACcUEFAEQABABUAAQAAnJBAwCkAAQAAXFBAwD0AAQAAV1BAwAEAAQAAXFBAwCTAAQAAXFBAwAjAAQAAXJBBQAiAAQAMgAEAAJxQQUAoAAEALAABAACckEDAFAABAABcUEDAP0ACgABcUEDAB4ACgABckEDAAwACgABckEHACwACgA8AAoATAAKAANyQQMAHwARAAFdALgAAEVYuAACLxu5AAIADj5ZuAAARVi4AAAvG7kAAAAKPlm7AA0AAQAHAAQrQQMALwAHAAFdQQMAKwANAAFxQQUAXAANAGwADQACcUEDAC8ADQABXUEDADwADQABcUEDAHsADQABcUEDAEsADQABcTAxAUEDAIsAEQABXUEDAH8AEQABXTMjETM3FAYjIiY1NDYzMhZbJycLEg4OEREODhIBVGcOEREODhISAAL/1v9sAHIB2wAJABUC2rsACQAHABAABCtBAwAEAAEAAXJBAwAVAAEAAXJBAwDzAAEAAXFBBQDQAAEA4AABAAJxQQMANwACAAFyQQMA0wACAAFxQQMA4gACAAFxQQMACAADAAFyQQMANwADAAFyQQMA/QAEAAFxQQMADQAEAAFyQQMA5QAEAAFxQQMAeQAFAAFxQQMAywAFAAFxQQMAiAAFAAFxQQMA2AAFAAFxuAAJELkABwAH9EEDAOAACgABcUEFAMEACgDRAAoAAnFBAwAxAAoAAXJBAwBCAAoAAXJBDwBTAAoAYwAKAHMACgCDAAoAkwAKAKMACgCzAAoAB3FBBQA0AAoARAAKAAJxQQUAhAAKAJQACgACckEFAFYACgBmAAoAAnJBAwAmAAoAAXFBAwB1AAoAAXJBAwAEAAoAAXJBAwAjAAoAAXJBAwDzAAoAAXFBAwDyAAoAAV1BAwARAAoAAXJBAwABAAoAAXFBAwAQAAoAAXFBAwCgAAoAAXJBBQAdABAALQAQAAJyQQMADwAQAAFyQQMAPgAQAAFyQQMA/QAQAAFxQQMATQAQAAFyQQMAVwATAAFxQQMATwAXAAFdALgAAi+4AABFWLgACC8buQAIAA4+WbsAEwABAA0ABCtBAwBNAAEAAXJBAwD5AAEAAV1BAwA7AAIAAXJBAwDYAAIAAXFBAwAHAAMAAXJBAwAxAAMAAXJBAwAWAAQAAXJBAwBEAAQAAXJBAwAyAAQAAXJBAwC0AAUAAXFBAwCUAAUAAXFBAwClAAUAAXFBAwBlAAUAAXFBAwDVAAUAAXFBAwCFAAUAAXFBBQAkAAUANAAFAAJyQQMA4gAFAAFxQQMA8QAFAAFxQQMA4gAHAAFdQQMACAAKAAFyQQUAZwAKAHcACgACckEDACwADQABXUEFAG0AEwB9ABMAAnFBAwBeABMAAXFBBQA9ABMATQATAAJxQQMALAATAAFdQQMALAATAAFxMDE3BgcnNjc2NREzNxQGIyImNTQ2MzIWZwKLBEUWDycLEg4OEREODhIHmAMfBiodOgFCZw4REQ4OEhIAAAEANP/2AUcB+QALBSK7AAQABwAFAAQrQQUAJwAAADcAAAACXUEDALcAAAABXUEDAEoAAQABckEDACUAAQABXbgABBC4AAfQQQMAWAAJAAFxQQMAOAAJAAFdQQMAOwAKAAFdQQMA9wAKAAFdQQMAtwALAAFdQQMAMQAMAAFdQQMAQAAMAAFdQQsAHwANAC8ADQA/AA0ATwANAF8ADQAFXQC4AAYvuAAARVi4AAEvG7kAAQAKPlm4AABFWLgAAC8buQAAAAo+WbgAAEVYuAAELxu5AAQACj5ZQQMAygADAAFdugAIAAEABhESOUEDAPQACAABXboACgABAAYREjlBAwD2AAsAAV0wMQFBAwATAAAAAXJBAwBDAAAAAXJBAwB0AAAAAXFBAwA1AAAAAXFBAwDGAAAAAXFBAwAGAAAAAXJBAwA5AAAAAV1BAwAJAAAAAXFBAwB6AAAAAV1BAwD6AAAAAV1BAwCKAAAAAXFBAwBLAAAAAXFBAwB8AAAAAXJBAwBtAAAAAV1BAwA0AAEAAXFBAwBlAAEAAXJBAwA4AAEAAV1BAwB5AAEAAV1BAwBZAAEAAXFBAwAJAAEAAXJBAwBqAAEAAV1BAwCqAAEAAXFBAwD6AAEAAXFBAwD7AAEAAV1BAwALAAEAAXFBAwCbAAEAAXFBAwA7AAEAAXJBAwBMAAEAAXFBAwDsAAEAAXFBAwAsAAEAAXJBAwCNAAEAAXFBAwDeAAEAAXFBAwDPAAEAAXFBAwA5AAIAAXFBAwCJAAIAAXFBBwC3AAgAxwAIANcACAADcUEDAEcACAABckEDABMACQABckEDALUACQABckEDAAgACQABckEDACgACQABckEDADkACQABcUEDAJoACQABcUEDAHoACQABckEDAPsACQABXUEDAIsACQABcUEFAOsACQD7AAkAAnFBAwC8AAkAAXFBAwAtAAkAAXFBAwBNAAkAAXJBAwAQAAoAAXJBAwChAAoAAXFBAwAyAAoAAXJBAwDTAAoAAXFBAwAjAAoAAXJBAwDEAAoAAXFBAwAEAAoAAXJBAwBEAAoAAXJBAwB2AAoAAXFBAwC2AAoAAXFBBQBHAAoAVwAKAAJxQQMA+QAKAAFdQQMAEAALAAFyQQMAwQALAAFxQQMAQQALAAFyQQMAAgALAAFyQQMAowALAAFxQQUA4wALAPMACwACcUEDADMACwABckEDAHUACwABcUEDALUACwABcUEDACUACwABckEDAOYACwABXUEDADYACwABcUEDAGYACwABcUEDAKcACwABXUEDACcACwABcQBBAwAXAAAAAXJBAwCzAAIAAXJBAwA4AAIAAXFBAwCIAAIAAXFBAwAJAAIAAXJBAwDKAAIAAXFBAwAKAAMAAXJBAwAbAAMAAXJBAwCsAAMAAXFBAwCwAAgAAXFBBQDgAAgA8AAIAAJxQQMAAAAIAAFyQQMAQQAIAAFyQQMAogAIAAFxQQMAwgAIAAFxQQMAEgAIAAFyQQUAIwAIADMACAACcUEDANMACAABcUEDADMACAABckEHAHQACACEAAgAlAAIAANxQQMAJAAIAAFyQQMA1gAIAAFdQQMAZgAIAAFxQQMAZwAJAAFyQQMAtwAKAAFxQQMANwAKAAFyQQMA2AAKAAFdQQMAtAALAAFxQQMARQALAAFyQQMANgALAAFxQQMAdgALAAFxQQUA5gALAPYACwACcUEFAAYACwAWAAsAAnJBAwBnAAsAAXFBAwDHAAsAAXFBAwAnAAsAAXIlBycHFSMRMxE3FwcBRyeiIycnqSiSAQu7Io8B+f7CngiKAAAAAQA0//kAtgH5AAkAgbsABgAHAAMABCtBAwDcAAIAAXFBAwDNAAIAAXFBAwD5AAIAAV1BAwDoAAIAAV0AuAAEL7gAAEVYuAABLxu5AAEACj5ZuQAAAAH0QQMAsgAGAAFxQQkAoAAGALAABgDAAAYA0AAGAARdMDEBQQUACgACABoAAgACckEDAOsAAgABcTcHJjURMxEUFxa2BH4nDRQbIgasAU7+wUkhNAAAAAEALQAAAiUBWwAhA364ACIvuAAS0LgAEi+4AArcQQMAcAAKAAFdQQUAIAAKADAACgACXbgAAdxBBQAgAAEAMAABAAJdQQMAcAABAAFduQAAAAf0uAAKELkACQAH9EEDAEkADAABckEDAEAADwABcrgAEhC5ABEAB/S4ABIQuAAV0LgAFS+4ABEQuAAY0LgAGC+6ABwACgABERI5uAAAELgAI9wAuAAARVi4ABUvG7kAFQAOPlm4AABFWLgAGi8buQAaAA4+WbgAAEVYuAAeLxu5AB4ADj5ZuAAARVi4AAAvG7kAAAAKPlm4AABFWLgACS8buQAJAAo+WbgAAEVYuAARLxu5ABEACj5ZQQMALQADAAFyuAAeELkABQAB9EEFADkABQBJAAUAAnJBIQAIAAUAGAAFACgABQA4AAUASAAFAFgABQBoAAUAeAAFAIgABQCYAAUAqAAFALgABQDIAAUA2AAFAOgABQD4AAUAEF1BIQAIAAUAGAAFACgABQA4AAUASAAFAFgABQBoAAUAeAAFAIgABQCYAAUAqAAFALgABQDIAAUA2AAFAOgABQD4AAUAEHFBBwAIAAUAGAAFACgABQADckEDAD4ADAABcrgADdBBAwBPAA8AAXK6ABgAAAAaERI5ugAcAAAAGhESOTAxAUEDANsABAABcUEDAAsABAABckEDAPwABAABcUEDABoADAABckEDADkAGQABckEDACsAGQABckEDAOMAGwABXUEDACMAGwABckEDAPUAGwABXUEDAAUAGwABcUEDACUAGwABcUEDABYAGwABcUEDADYAGwABcUEDAAQAHAABckEDAOYAHAABcUEDACcAHAABckEDAOQAHwABXUEDAPYAHwABXUEHAAYAHwAWAB8AJgAfAANxQQMACgAfAAFyAEEDAMgAAwABXUEDALkAAwABXUEDAIkAAwABcUEDANoAAwABXUEDALoAAwABcUEDAJsAAwABcUEDAO4AAwABcUEDANsACwABcUEDACwACwABckEDAPsADAABcUEDADMADwABckEDABQADwABckEDACYADwABckEDABIAEAABckEDABAAGAABckEDADQAGAABckEFAGUAGAB1ABgAAnFBAwAlABgAAXJBAwD1ABwAAV1BAwDlABwAAXFBAwAmABwAAXJBAwAHABwAAXJBAwDmACAAAV1BAwDmACEAAV0hIzU0JiMiBh0BIzU0IyIGHQEjETQnMxYXNjMyFzYzMhYVAiUnLy0nOydWKEAnByUHASdLRSIoUjhAvDpFPSbYzm1FKM4BABs5FShETExVSQABAC0AAAFSAVsAEwKOuAAUL7gAFS9BAwBfABUAAV24AADcQQUAHwAAAC8AAAACXbkAAQAH9EEDADMABQABckEDACAABQABcrgAFBC4AAnQuAAJL7kACAAH9LgACRC4AAzQuAAML7gACBC4AA/QuAAPL0EDADYADwABckEDABwAEwABXQC4AABFWLgADC8buQAMAA4+WbgAAEVYuAARLxu5ABEADj5ZuAAARVi4AAAvG7kAAAAKPlm4AABFWLgACC8buQAIAAo+WUEDAKoAAwABcbgAERC5AAQAAfRBFQAIAAQAGAAEACgABAA4AAQASAAEAFgABABoAAQAeAAEAIgABACYAAQACnFBBQA5AAQASQAEAAJyQR8ACAAEABgABAAoAAQAOAAEAEgABABYAAQAaAAEAHgABACIAAQAmAAEAKgABAC4AAQAyAAEANgABADoAAQAD11BCwC4AAQAyAAEANgABADoAAQA+AAEAAVxQQcACAAEABgABAAoAAQAA3K6AA8AAAARERI5QQMAVAATAAFdQQMAYwATAAFdQQMAcAATAAFdMDEBQQMAugADAAFxQQMAKwADAAFyQQMAeQAFAAFxQQMAagAFAAFxQQMAOgAFAAFyQQMAZwAPAAFxQQMAeQAQAAFxQQMAPQAQAAFyQQMALQAVAAFdQQMAHgAVAAFdAEEDAJoAAwABcUEDAMoAAwABcUEDAPsABgABcUEFAAsABgAbAAYAAnJBAwAuAAYAAXJBBQBgAAcAcAAHAAJxQQMAMAAHAAFyQQMAJAAHAAFyQQMAYAAPAAFxQQMAMQAPAAFyQQMAgwAPAAFxQQMANAAPAAFxQQMARQAPAAFyQQMAdgAPAAFxQQMAYwAQAAFxQQMAdwAQAAFxISM1NCMiBh0BIxE0JzMWFzYzMhUBUidmKUEnByUHASdMhcF6RSjOAQAbORUoRJoAAAIAHP/2AXIBWwALABcDsLgAGC+4ABkvQQMAgAAZAAFduAAA3LgAGBC4AAbQuAAGL7gAABC5AAwAB/RBBQA6AAwASgAMAAJyQSEACQAMABkADAApAAwAOQAMAEkADABZAAwAaQAMAHkADACJAAwAmQAMAKkADAC5AAwAyQAMANkADADpAAwA+QAMABBdQSEACQAMABkADAApAAwAOQAMAEkADABZAAwAaQAMAHkADACJAAwAmQAMAKkADAC5AAwAyQAMANkADADpAAwA+QAMABBxQQcACQAMABkADAApAAwAA3JBBQC5AA4AyQAOAAJdQQMAtgAQAAFdQQMAxQAQAAFduAAGELkAEgAH9EEhAAYAEgAWABIAJgASADYAEgBGABIAVgASAGYAEgB2ABIAhgASAJYAEgCmABIAtgASAMYAEgDWABIA5gASAPYAEgAQXUEhAAYAEgAWABIAJgASADYAEgBGABIAVgASAGYAEgB2ABIAhgASAJYAEgCmABIAtgASAMYAEgDWABIA5gASAPYAEgAQcUEHAAYAEgAWABIAJgASAANyQQUANQASAEUAEgACckEDAMYAFAABXUEDALUAFAABXUEDALoAFgABXUEDAMkAFgABXQC4AABFWLgACS8buQAJAA4+WbgAAEVYuAADLxu5AAMACj5ZQQUAtgABAMYAAQACXUEDALQABQABXUEDAMkACwABXUEDALgACwABXbgACRC5AA8AAfRBBQA5AA8ASQAPAAJyQSEACAAPABgADwAoAA8AOAAPAEgADwBYAA8AaAAPAHgADwCIAA8AmAAPAKgADwC4AA8AyAAPANgADwDoAA8A+AAPABBdQSEACAAPABgADwAoAA8AOAAPAEgADwBYAA8AaAAPAHgADwCIAA8AmAAPAKgADwC4AA8AyAAPANgADwDoAA8A+AAPABBxQQcACAAPABgADwAoAA8AA3K4AAMQuQAVAAH0QSEABwAVABcAFQAnABUANwAVAEcAFQBXABUAZwAVAHcAFQCHABUAlwAVAKcAFQC3ABUAxwAVANcAFQDnABUA9wAVABBdQSEABwAVABcAFQAnABUANwAVAEcAFQBXABUAZwAVAHcAFQCHABUAlwAVAKcAFQC3ABUAxwAVANcAFQDnABUA9wAVABBxQQcABwAVABcAFQAnABUAA3JBBQA2ABUARgAVAAJyMDEBQQMA+AAIAAFxQQMACAAIAAFyQQMA9wAKAAFxQQMABwAKAAFyQQMA5QAUAAFxQQMA6gAWAAFxJRQGIyImNTQ2MzIWBzQmIyIGFRQWMzI2AXJeTU1eXk1NXiZLOjpLSzo6S6lLaGhLS2dnSz5TUz4+VFQAAAIAMf9ZAXUBWwASACEElbgAIi+4ACMvuAAA3EEDAB8AAAABXUEDAC0AAAABXbkAEwAF9EEFADoAEwBKABMAAnJBIQAJABMAGQATACkAEwA5ABMASQATAFkAEwBpABMAeQATAIkAEwCZABMAqQATALkAEwDJABMA2QATAOkAEwD5ABMAEF1BIQAJABMAGQATACkAEwA5ABMASQATAFkAEwBpABMAeQATAIkAEwCZABMAqQATALkAEwDJABMA2QATAOkAEwD5ABMAEHFBBwAJABMAGQATACkAEwADcrgAAtC4AAIvQQMA5wACAAFxQQMAJwACAAFyQQMAMwAGAAFxuAAiELgACNC4AAgvuQAHAAf0uAAIELgAC9C4AAsvuAAHELgADNC4AAwvuAAHELgADtC4AA4vQQMAVQAPAAFxQQMARgAPAAFxQQMAZAAPAAFxQQMAMgAPAAFxQQMAWgARAAFxQQMAaQARAAFxQQMASQARAAFxQQMASQASAAFxQQMAXAAVAAFxuAAHELgAGdBBAwBWABwAAXFBAwA1ABwAAXFBAwB8ACAAAXFBAwAuACAAAXJBAwALACAAAXJBAwCJACAAAXEAuAAARVi4ABAvG7kAEAAOPlm4AABFWLgABy8buQAHAAw+WbgAAEVYuAAELxu5AAQACj5ZQQMAPAABAAFyQQMAPwACAAFyugAGAAcAEBESOUEDAO0ABgABcUEDAB4ABgABckEDAP8ABgABcUEDAA8ABgABckEFAD8ABgBPAAYAAnJBAwAtAAYAAXJBAwCNAAYAAXFBAwA9AAYAAXG6AA4ABwAQERI5QQUAPQASAE0AEgACcrgAEBC5ABYAAfRBBQA5ABYASQAWAAJyQSEACAAWABgAFgAoABYAOAAWAEgAFgBYABYAaAAWAHgAFgCIABYAmAAWAKgAFgC4ABYAyAAWANgAFgDoABYA+AAWABBdQSEACAAWABgAFgAoABYAOAAWAEgAFgBYABYAaAAWAHgAFgCIABYAmAAWAKgAFgC4ABYAyAAWANgAFgDoABYA+AAWABBxQQcACAAWABgAFgAoABYAA3JBAwBFABwAAXG4AAQQuQAeAAH0QSEABwAeABcAHgAnAB4ANwAeAEcAHgBXAB4AZwAeAHcAHgCHAB4AlwAeAKcAHgC3AB4AxwAeANcAHgDnAB4A9wAeABBdQSEABwAeABcAHgAnAB4ANwAeAEcAHgBXAB4AZwAeAHcAHgCHAB4AlwAeAKcAHgC3AB4AxwAeANcAHgDnAB4A9wAeABBxQQcABwAeABcAHgAnAB4AA3JBBQA2AB4ARgAeAAJyMDEBQQMAFgACAAFyQQMAyQACAAFdQQMA9QADAAFxQQMAZwAOAAFxQQMAagAPAAFxQQMA2QASAAFdQQMAOQASAAFxQQMAagASAAFxQQMA2QAUAAFdQQMAZQAYAAFxQQMAyAAgAAFdQQMALAAjAAFdQQMAHQAjAAFdAEEDAPwAAQABcUEDAPkAAgABcUEDAGkABgABcUEDAMsABgABXUEDAAIADgABckEDADQADgABckEDACUADgABckEDAE4AGAABciUUBwYjIicVIxE0JzMWFTYzMhYHNCYjIgYdARQXFjMyNzYBdSgqR1UsJwMkAi9QSVYlQT4yRCcjMDoiH6RLLzNI5gGmOhkaIkVlUUZPQDA5NyMhKScAAAACADH/WQF1AVsAEgAhBGu4ACIvuAAjL7gAANy5AAEAB/RBAwAGAAMAAXJBAwD5AAUAAXFBBQAJAAUAGQAFAAJyuAAiELgACNC4AAgvQQMAIwAIAAFduQAaAAX0QQUA5gAaAPYAGgACXUEhAAYAGgAWABoAJgAaADYAGgBGABoAVgAaAGYAGgB2ABoAhgAaAJYAGgCmABoAtgAaAMYAGgDWABoA5gAaAPYAGgAQcUEHAAYAGgAWABoAJgAaAANyQQUABgAaABYAGgACXUEVADYAGgBGABoAVgAaAGYAGgB2ABoAhgAaAJYAGgCmABoAtgAaAMYAGgAKXUEFADUAGgBFABoAAnJBAwAhABoAAV24AAbQuAAGL0EDAEwABgABckEDABoABwABckEDAEkABwABckEDACgABwABcrgAARC4AA3QuAANL7gAARC4AA/QuAAPL0EDAGcADwABcbgAABC4ABDQuAAQL7gAARC4ABPQALgAAEVYuAALLxu5AAsADj5ZuAAARVi4AAAvG7kAAAAMPlm4AABFWLgABC8buQAEAAo+WboAAgAAAAsREjlBBQBLAAIAWwACAAJxQQMAPQACAAFxQQUAPwACAE8AAgACckEFAA8AAgAfAAIAAnJBAwCPAAIAAXFBAwAtAAIAAXJBAwBsAAIAAXFBAwDKAAIAAV1BBQDqAAIA+gACAAJxQQMA/QAHAAFxQQMALgAHAAFyQQMAPQAHAAFyQQMACwAHAAFyQQMAGAAHAAFyugANAAAACxESOUEDABQADQABckEDADQADQABckEDACUADQABckEDAFsADQABckEDAG8ADQABckEDAHkADQABckEDAEUADQABckEDAPQADQABcUEDAGMADQABcUEDAAMADQABckEDAPkADwABcUEDAGoADwABcUEDACoADwABckEFADkADwBJAA8AAnJBBQAIAA8AGAAPAAJyQQMAZwAPAAFyQQMA4gATAAFxQQMA6wAUAAFxQQMAEgAUAAFyQQMA8gAUAAFxuAALELkAFwAB9EEFADkAFwBJABcAAnJBIQAIABcAGAAXACgAFwA4ABcASAAXAFgAFwBoABcAeAAXAIgAFwCYABcAqAAXALgAFwDIABcA2AAXAOgAFwD4ABcAEF1BIQAIABcAGAAXACgAFwA4ABcASAAXAFgAFwBoABcAeAAXAIgAFwCYABcAqAAXALgAFwDIABcA2AAXAOgAFwD4ABcAEHFBBwAIABcAGAAXACgAFwADckEDAAYAHAABcrgABBC5AB4AAfRBIQAHAB4AFwAeACcAHgA3AB4ARwAeAFcAHgBnAB4AdwAeAIcAHgCXAB4ApwAeALcAHgDHAB4A1wAeAOcAHgD3AB4AEF1BIQAHAB4AFwAeACcAHgA3AB4ARwAeAFcAHgBnAB4AdwAeAIcAHgCXAB4ApwAeALcAHgDHAB4A1wAeAOcAHgD3AB4AEHFBBwAHAB4AFwAeACcAHgADckEFADYAHgBGAB4AAnIwMQFBAwB/ACMAAXIFIzUGIyInJjU0NjMyFzQ3MwYVBzU0JiMiBhUUFxYzMjc2AXInLFVHKihWSVAvAiQDJ0QyPkEfIjowIyen5kgzL0tSZUUiGhk6bjkwQE9GPycpISMAAAEAKgAAANABWwASAi+7AAcABwAIAAQrQQMAFgADAAFyQQMAJQADAAFyQQMA8AADAAFxuAAHELgADtC4AA4vQQMAJwAOAAFyQQMAHwAUAAFdALgAAEVYuAALLxu5AAsADj5ZuAAARVi4ABAvG7kAEAAOPlm4AABFWLgAEi8buQASAA4+WbgAAEVYuAAHLxu5AAcACj5ZuAAQELkAAgAB9EEFADkAAgBJAAIAAnJBIQAIAAIAGAACACgAAgA4AAIASAACAFgAAgBoAAIAeAACAIgAAgCYAAIAqAACALgAAgDIAAIA2AACAOgAAgD4AAIAEF1BIQAIAAIAGAACACgAAgA4AAIASAACAFgAAgBoAAIAeAACAIgAAgCYAAIAqAACALgAAgDIAAIA2AACAOgAAgD4AAIAEHFBBwAIAAIAGAACACgAAgADckEFAC8ABAA/AAQAAnJBAwBOAAQAAXJBAwAMAAQAAXJBAwAvAAUAAXK6AA4ABwAQERI5QQMACQAOAAFyMDEBQQMAhQADAAFxQQMAhgAOAAFxQQMAaAAQAAFdQQcAXwAUAG8AFAB/ABQAA10AQQUAVgAEAGYABAACXUEDAEoABAABcUEDAF0ABAABcUEFAH0ABACNAAQAAnFBAwBuAAQAAXFBAwBgAAUAAV1BAwBUAAUAAV1BAwBgAAYAAV1BAwBSAAYAAV1BAwBQAA4AAV1BAwBzAA4AAV1BAwBkAA4AAV1BBQCEAA4AlAAOAAJdQQMAhAAOAAFxEyYjIgcGHQEjNTQnMxYVNjMyF9ADCU0ZAycKIQsgRwkKATgBYAsXt+VLJBYuSwIAAQAd//cA+AFbABwK9LgAHS+4AB4vQQMAXwAeAAFduAAA3EEDAGwAAAABckEDAK4AAAABXUEDAO8AAAABXUEDAD0AAAABckEDAAMAAAABckEDABIAAAABckEDAGwAAQABckEDADgAAQABckEDAFYAAgABXUEDAE8ABAABckEFAJoABQCqAAUAAnFBBQB7AAUAiwAFAAJxQQMASwAFAAFxQQMADQAFAAFyQQMADgAFAAFxQQMA7gAFAAFxQQMAvwAFAAFxQQMAHwAFAAFyQQMA3wAFAAFxQQUAPwAFAE8ABQACckEDAM4ABQABcUEDAC4ABQABckEDAD0ABQABcUEFABsABQArAAUAAnFBAwD6AAUAAXFBAwBqAAUAAXFBAwBZAAUAAXG4AB0QuAAO0LgADi+4AAbQuAAGL0EDAPcABgABcUEDAAgABgABckEDAEUABgABckEDAMQABgABcbgAABC5AAoABfRBCQBpAAoAeQAKAIkACgCZAAoABF1BCwAJAAoAGQAKACkACgA5AAoASQAKAAVdQQMAGgAKAAFyQQMAPAAKAAFyQQMArAAKAAFdQQMASgAKAAFyQQMAKQAKAAFyQQMAaQAKAAFyQQsAuQAKAMkACgDZAAoA6QAKAPkACgAFXUEhAAkACgAZAAoAKQAKADkACgBJAAoAWQAKAGkACgB5AAoAiQAKAJkACgCpAAoAuQAKAMkACgDZAAoA6QAKAPkACgAQcUEDAAkACgABckEFAHkADACJAAwAAnFBAwDYAAwAAXFBAwCYAA0AAXFBAwB3AA8AAXFBAwA6ABAAAXJBAwDcABAAAXFBAwBqABAAAXFBAwB5ABAAAXFBAwAhABIAAXJBAwChABIAAXFBAwDTABIAAXFBAwAUABIAAXJBAwDFABIAAXFBAwDmABIAAXFBAwA0ABIAAXJBAwCUABIAAXFBAwDyABIAAXFBAwABABIAAXJBAwCwABIAAXFBAwAgABIAAXFBAwDzABMAAV1BAwAUABMAAXJBAwD0ABMAAXFBAwB1ABMAAXFBAwA3ABMAAXFBAwAoABMAAXFBAwDXABMAAXFBAwBGABMAAXFBBwCEABMAlAATAKQAEwADcUEDAMQAEwABcUEDAEMAEwABckEDABMAEwABcUEDAOAAEwABcUEDAEgAFAABcUEDAAkAFAABckEDACkAFAABcUEDAMoAFAABcUEDABoAFAABcUEDADsAFAABcUEDAE0AFAABckEDAHwAFAABcUEDALsAFAABcUEDABoAFAABckEDACkAFAABckEFAIkAFACZABQAAnFBAwCoABQAAXFBBQDoABQA+AAUAAJxQQMAaAAUAAFxQQMA2wAVAAFxQQMAygAVAAFxuAAOELkAGQAF9EERAIYAGQCWABkApgAZALYAGQDGABkA1gAZAOYAGQD2ABkACHFBBwAGABkAFgAZACYAGQADckEDAHcAGQABcUEFAEYAGQBWABkAAnFBIQAGABkAFgAZACYAGQA2ABkARgAZAFYAGQBmABkAdgAZAIYAGQCWABkApgAZALYAGQDGABkA1gAZAOYAGQD2ABkAEF1BBwAGABkAFgAZACYAGQADcUEFADUAGQBFABkAAnJBAwDGABoAAXFBAwDRABoAAXFBAwBqABwAAXJBAwCGABwAAXFBAwAlABwAAXEAuAAbL7gAAEVYuAARLxu5ABEADj5ZuAAARVi4AAMvG7kAAwAKPllBAwBrAAEAAXFBAwB6AAEAAXFBAwBKAAQAAXJBAwAXAAUAAXJBAwCIAAUAAXFBAwD6AAUAAXFBAwAJAAUAAXFBBQDYAAUA6AAFAAJxQQMA9gAFAAFdQQMARgAFAAFyQQMA9QAGAAFduQAIAAH0QSEABwAIABcACAAnAAgANwAIAEcACABXAAgAZwAIAHcACACHAAgAlwAIAKcACAC3AAgAxwAIANcACADnAAgA9wAIABBdQSEABwAIABcACAAnAAgANwAIAEcACABXAAgAZwAIAHcACACHAAgAlwAIAKcACAC3AAgAxwAIANcACADnAAgA9wAIABBxQQcABwAIABcACAAnAAgAA3JBBQA2AAgARgAIAAJyQQMAigALAAFxQQMA/wALAAFxQQMAGgALAAFxQQMACQALAAFxQQUAWwAbAGsAGwACckEDAOsAGwABXUEFAHwAGwCMABsAAnFBAwCvABsAAXJBAwA8ABsAAXFBBQCLABsAmwAbAAJyQQMAegAbAAFyQQMA9QAbAAFduAAbELkADAAB9EEDAOoADAABXUEDALoADAABcUEDAOsADAABcUEDACwADAABXUEDANwADAABcUEFAC0ADAA9AAwAAnJBAwD+AAwAAXFBBQA9AAwATQAMAAJdQQMATAAMAAFyQQUAfAAMAIwADAACcUEFAAwADAAcAAwAAnJBAwDLAAwAAXFBAwA6AAwAAXFBAwCaAAwAAXFBAwCpAAwAAXFBAwD7AA0AAV1BBQAcAA0ALAANAAJxQQMADgANAAFxQQMAPwANAAFxQQMAbwANAAFxQQMATgANAAFxQQMAXQANAAFxQQMA6wANAAFxQQMAmgANAAFxQQMA6QANAAFdQQMAlgAPAAFxQQMAZgAPAAFxQQMA9AAPAAFxQQMAdAAPAAFxQQMAJAASAAFxQQMANgATAAFxQQMA+AATAAFdQQMAagATAAFxQQMA6QATAAFxQQMAmAATAAFxQQMABQATAAFxQQMAIwATAAFxQQMANgAUAAFxQQMAmAAUAAFxQQMA+AAUAAFxQQMAKwAUAAFyQQMAbAAUAAFxQQMAOQAUAAFyQQMA+AAUAAFdQQMAVwAUAAFxQQMAFgAUAAFxQQMAJQAUAAFxuAARELkAFgAB9EEFADkAFgBJABYAAnJBEwB4ABYAiAAWAJgAFgCoABYAuAAWAMgAFgDYABYA6AAWAPgAFgAJcUEHAAgAFgAYABYAKAAWAANyQSEACAAWABgAFgAoABYAOAAWAEgAFgBYABYAaAAWAHgAFgCIABYAmAAWAKgAFgC4ABYAyAAWANgAFgDoABYA+AAWABBdQQ0ACAAWABgAFgAoABYAOAAWAEgAFgBYABYABnFBAwB3ABgAAXFBAwA5ABkAAXFBAwB3ABkAAXFBAwA5ABoAAXFBAwAFABoAAXFBBwBGABwAVgAcAGYAHAADcUEDAK8AHAABckEDAPkAHAABcUEFAOYAHAD2ABwAAl1BAwA1ABwAAXEwMQFBAwA+AAAAAV1BAwBvAAAAAV1BAwBzAAEAAV1BAwCFAAEAAV1BAwBmAAEAAV1BAwA6AAEAAV1BAwCUAAIAAV1BAwBvAAIAAV1BAwBtAAgAAV1BBwB0AAkAhAAJAJQACQADXUEDADsACQABXUEDAG0ACQABXUEDAD8ACgABXUEDAG8ACgABXUEDADoACwABXUEDAG8ACwABXUEDAIoAEAABXUEDAHsAEAABXUEDAGwAEAABXUEDAF0AEAABXUEDAEUAEwABXUEDADYAEwABXUEDACcAEwABXUEDAJcAEwABXUEDAEUAFAABXUEDAFkAGwABXUEDADoAGwABXUEDAGsAHAABXUEDAD8AHAABXUEDAD8AHgABXQBBAwAxAAEAAV1BAwAzAAkAAV1BAwBnAAkAAV1BAwAoABMAAV1BAwBIABMAAV1BAwCYABMAAV1BAwAoABQAAV1BAwBJABQAAV1BAwBaABsAAV1BBQCKABsAmgAbAAJdQQMAbAAbAAFdNxQGIyInNxYzMjU0JyY1NDYzMhcHJiMiBhUUFxb4QToyLg8wJFRPWzs1NR8QHi0gJE5bWis4GyAaPzEYHEAnOBcgGCIZKBsfAAAAAQAG//cA3gHLABUBaLsAEgAHAAcABCtBAwDKAAQAAXFBBQAKAAQAGgAEAAJyQQMAPQAEAAFyQQMA6gAEAAFxQQMA2QAEAAFxQQMA+QAEAAFxuAAHELgAC9C4ABIQuAAN0EEDABAAFgABXQC4AA0vuAAARVi4AAovG7kACgAOPlm4AABFWLgADi8buQAOAA4+WbgAAEVYuAADLxu5AAMACj5ZuAAOELkACAAB9LgACdBBAwBbAA0AAV24ABDQuAAR0LgAAxC5ABQAAfRBIQAHABQAFwAUACcAFAA3ABQARwAUAFcAFABnABQAdwAUAIcAFACXABQApwAUALcAFADHABQA1wAUAOcAFAD3ABQAEF1BIQAHABQAFwAUACcAFAA3ABQARwAUAFcAFABnABQAdwAUAIcAFACXABQApwAUALcAFADHABQA1wAUAOcAFAD3ABQAEHFBBwAHABQAFwAUACcAFAADckEFADYAFABGABQAAnIwMTcXBiMiJyY9ASM1MzU3FTMVIxUUMzLSBBQhLBcUREQnbW0zHx8fCSIeLdEfZRJ3H9BMAAEANP/3AWMBVAAUAkq4ABUvuAAQL0EDAFoAAAABcUEDAHoAAAABcUEDAGgAAAABcUEDAAkAAQABckEDAEkAAQABckEDABoAAQABckEDALoAAQABcUEDAOsAAQABcUEDAHwAAQABcUEDAFsAAQABcUEDADoAAQABckEDAPoAAQABcUEDACkAAQABckEFAMkAAQDZAAEAAnFBAwBpAAEAAXG4AAPQuAADL0EDANwABgABXUEDAM4ABgABXUEDAL0ABgABXUEDABsABgABckEFAOoABgD6AAYAAl1BBwAKAAYAGgAGACoABgADcbgAFRC4AAfQuAAHL7kACgAH9EEDAOoADQABcbgAEBC5ABMAB/S4ABbcALgAAEVYuAAILxu5AAgADj5ZuAAARVi4ABEvG7kAEQAOPlm4AABFWLgAAS8buQABAAo+WbgAAEVYuAAFLxu5AAUACj5ZugADAAUACBESOUEDAHwAAwABXUEDAE0AAwABcUEDADsAAwABcUEDABkAAwABckEDAPQABgABcUEDAAMABgABckEDAPEACgABcUEDAAEACgABckEDANQACwABcUEDAMUACwABcUEFAJYACwCmAAsAAnFBAwC0AAsAAXFBAwDjAAsAAXFBAwDwAAsAAXFBAwAAAAsAAXK5AAwAAfRBAwB9ABAAAV0wMUEDAFsAAwABcUEDAHsAAwABcUEDAGwAAwABcUEDAEwAAwABckEDAI0AAwABcUEDAB4AAwABckEDAD4AAwABckEDAC8AAwABckEHACAACgAwAAoAQAAKAANyJQcmJwYjIj0BMxUUMzI3Nj0BMxEUAWMlDAQsVHonXCsjJicBCCIgRJ6/uIMcIDHO/v8lAAABAAMAAAFSAVQABgS8ALgAAEVYuAAALxu5AAAADj5ZuAAARVi4AAMvG7kAAwAOPlm4AABFWLgAAS8buQABAAo+WboABQABAAAREjkwMQFBAwBjAAAAAXFBAwDDAAAAAXFBAwC1AAAAAXFBAwAVAAAAAXJBAwBFAAAAAXJBAwAmAAAAAXFBAwD2AAAAAXFBAwD3AAAAAV1BBQCHAAAAlwAAAAJxQQMA5wAAAAFxQQMAWAAAAAFxQQMAaQAAAAFdQQMAmQAAAAFdQQMASQAAAAFxQQMAeQAAAAFxQQMAKQAAAAFyQQMACgAAAAFdQQMAWgAAAAFdQQMAuwAAAAFdQQMA6wAAAAFdQQMAjAAAAAFdQQMAIwABAAFyQQMA5AABAAFxQQMANQABAAFxQQMA9QABAAFxQQMARQABAAFyQQMAlgABAAFxQQcAtgABAMYAAQDWAAEAA3FBAwA2AAEAAXJBAwBIAAEAAXFBAwB4AAEAAXFBAwBJAAEAAV1BBQC5AAEAyQABAAJdQQcACQABABkAAQApAAEAA3FBAwCKAAEAAV1BAwBbAAEAAV1BAwBEAAIAAV1BAwCmAAIAAV1BAwBWAAIAAXFBAwCXAAIAAXFBAwAJAAIAAV1BBQAZAAIAKQACAAJxQQMA6gACAAFxQQMASgACAAFyQQMAOwACAAFyQQMA3AACAAFxQQMALgACAAFyQQMADwACAAFxQQMAVAADAAFxQQMA1QADAAFdQQMAlQADAAFxQQMA9QADAAFxQQMA5gADAAFdQQMANgADAAFxQQMAJwADAAFyQQMACQADAAFdQQMAugADAAFxQQMADAADAAFxQQMA8AAEAAFxQQMAUgAEAAFxQQMAkgAEAAFxQQMAAgAEAAFyQQMAIgAEAAFyQQMAEwAEAAFyQQUAMwAEAEMABAACckEDAKQABAABcUEDAOQABAABcUEDADUABAABcUEFAHUABACFAAQAAnFBBwC1AAQAxQAEANUABAADcUEFANYABADmAAQAAl1BAwBmAAQAAXFBAwAnAAQAAXFBAwAMAAQAAXFBAwANAAQAAV1BAwBmAAUAAXFBAwCWAAUAAXFBAwDGAAUAAXFBAwD2AAUAAXFBAwA3AAUAAXFBAwAXAAUAAXJBAwBHAAUAAXJBAwAIAAUAAV1BAwAoAAUAAV1BAwAYAAUAAXFBBQAoAAUAOAAFAAJyQQMAigAFAAFdQQMADAAFAAFxQQMA9gAGAAFdQQMAZgAGAAFxQQMAxgAGAAFxQQMAiAAGAAFdQQUAGAAGACgABgACcUEDALkABgABXUEFAIkABgCZAAYAAnFBAwDpAAYAAXFBAwDqAAYAAV1BAwBaAAYAAXFBBQCqAAYAugAGAAJxQQMAGgAGAAFyQQMASgAGAAFyQQMASwAGAAFxQQMA+wAGAAFxQQMAfAAGAAFxQQMA3QAGAAFxQQMADQAGAAFyQQMAPQAGAAFyQQMALwAGAAFyAEEDABAABQABckEDAAEABQABckEDAMIABQABcUEFADIABQBCAAUAAnJBAwD0AAUAAXFBCQCFAAUAlQAFAKUABQC1AAUABHFBAwBGAAUAAXFBBQBmAAUAdgAFAAJxQQMAJgAFAAFyQQMA6AAFAAFxAQMjAzMbAQFSmSOTKH6BAVT+rAFU/tYBKgAAAQADAAAB+wFUAAwC47gABi+4AAkvuAAAL7gABS+4AAIvQQMAYwAAAAFdQQMAGQAAAAFdQQUAIwAAADMAAAACXUEDAKAAAAABcUEDAHkAAgABXUEDAKgAAgABcUEHABEAAgAhAAIAMQACAANduQABAAf0QQUAGAABACgAAQACXUEDAEkAAQABXUEDAHgAAQABXUEDAKYAAQABcUEDADMACQABXUEDALgACQABcUEDABUACQABXUEDACIACQABXUEDAGEACQABXbgACRC5AAoAB/RBAwAnAAoAAV1BAwAcAAoAAV1BAwC3AAoAAXFBAwA2AAoAAV1BAwCmAAoAAXG6AAMACQAKERI5QQMAFgAFAAFdQQUAqAAFALgABQACcUEDACgABQABXUEDAHcABQABXUEDAGIABQABXUEDAFEABQABXbgABRC5AAQAB/RBAwAnAAQAAV1BAwB5AAQAAV1BAwCYAAQAAXFBAwCnAAQAAXFBAwC2AAQAAXFBAwB8AAYAAV24AAYQuQAHAAf0QQMAGgAHAAFdQQMAewAHAAFdQQMAtwAHAAFxQQMAlgAHAAFxugAIAAUABBESOboACwACAAEREjlBAwC4AAsAAXFBAwAVAAsAAV24AAAQuQAMAAf0QQMAJAAMAAFdQQMAZQAMAAFdQQMAEwAMAAFdQQMAMwAMAAFdALgAAEVYuAAALxu5AAAADj5ZuAAARVi4AAYvG7kABgAOPlm4AABFWLgACS8buQAJAA4+WbgAAEVYuAABLxu5AAEACj5ZuAAARVi4AAQvG7kABAAKPlm6AAMAAQAAERI5QQMAIAADAAFdugAIAAEAABESOUEDAAwACAABXUEDACYACAABXUEDAJIACAABcboACwABAAAREjlBAwAlAAsAAV1BAwALAAsAAV1BAwC1AAsAAXFBAwCVAAsAAXEwMQFBAwDoAAkAAXFBAwDmAAoAAXFBAwCXAAoAAXFBAwCoAA0AAXFBAwCgAA4AAXEBAyMLASMDMxsBMxsBAft6ImJnJG8pWmYlYGMBVP6sASz+1AFU/toBJv7aASYAAAABAAAAAAE+AVQACwpDQQMAFQAAAAFyQQMAtgAAAAFxQQMAJwAAAAFdQQcAigAAAJoAAACqAAAAA3FBAwDPAAAAAXFBAwAfAAAAAXFBBQBvAAAAfwAAAAJxQQMA9wAAAAFxQQMABwAAAAFyQQMAVgAAAAFxQQMAZQAAAAFdQQMAMwAAAAFyQQMAQQAAAAFyQQMAOgABAAFxQQMAOgABAAFyQQUAnQABAK0AAQACcUEJAM8AAQDfAAEA7wABAP8AAQAEcUEDAA8AAQABckEDAB8AAQABcUEHAG8AAQB/AAEAjwABAANxQQMAHQABAAFyQQMAugABAAFxQQUASQABAFkAAQACcUEDAEcAAQABckEDAOoAAgABcUEDAGsAAgABcUEDAPsAAgABcUEDAHoAAgABcUEDABgAAgABcUEDAPEAAwABcUEFAAEAAwARAAMAAnJBBQCyAAMAwgADAAJxQQUAlAADAKQAAwACcUEDAGUAAwABcUEDAAYAAwABcUEDABcAAwABcUEDAPcAAwABXUEDADUAAwABcUEFAEQAAwBUAAMAAnFBAwB0AAMAAXFBAwCCAAMAAXFBAwAxAAMAAXJBAwDQAAMAAXFBAwDWAAQAAXFBAwBHAAQAAXJBAwAoAAQAAV1BBQCYAAQAqAAEAAJxQQMA6AAEAAFxQQMAGQAEAAFyQQMA+gAEAAFxQQMACAAEAAFyQQMAyAAEAAFxQQUASAAEAFgABAACcUEDAHcABAABcUEDADYABAABcUEDAIUABAABcUEDALUABAABcUEDALgABQABcUEDABgABQABckEFAFkABQBpAAUAAnFBAwD5AAUAAV1BAwB6AAUAAXFBAwAKAAUAAXJBAwD8AAUAAXFBAwDOAAUAAXFBAwCMAAUAAXFBAwAbAAUAAXFBBQCaAAUAqgAFAAJxQQUAOgAFAEoABQACcUEDAEkABQABckEDADgABQABckEDANgABQABcUEDAAgABQABcUEDAIgABQABXUEDAEQABgABcUEDABQABgABckEFADYABgBGAAYAAnJBBQCZAAYAqQAGAAJxQQMA9gAGAAFxQQMABgAGAAFyQQMAJQAGAAFxQQUAtAAGAMQABgACcUEFANMABgDjAAYAAnFBAwCCAAYAAXFBBwCBAAcAkQAHAKEABwADcUEHAEMABwBTAAcAYwAHAANxQQUABQAHABUABwACcUEDAKcABwABXUEFANcABwDnAAcAAl1BAwD2AAcAAV1BBQAkAAcANAAHAAJxQQMAcgAHAAFxQQUAMAAHAEAABwACckELALAABwDAAAcA0AAHAOAABwDwAAcABXFBBQAAAAcAEAAHAAJyQQMANQAIAAFyQQMAeQAIAAFxQQMA2QAIAAFxQQMAzQAIAAFxQQMAagAIAAFxQQUAmQAIAKkACAACcUEDAIgACAABcUEDABMACAABckEDAEMACAABckEDAEgACQABckEDADkACQABXUEDADkACQABckEDAEoACQABcUEDAB0ACQABckEFAJ4ACQCuAAkAAnFBCQDPAAkA3wAJAO8ACQD/AAkABHFBAwAPAAkAAXJBAwAfAAkAAXFBBwBvAAkAfwAJAI8ACQADcUEDAC4ACQABcUEDADwACQABcUEDALoACQABcUEDAAkACQABcUEDAKgACQABXUEDAFgACQABcUEDANgACQABXUEDAJYACgABXUEDADYACgABckEFAAkACgAZAAoAAnJBAwB9AAoAAXFBBQAeAAoALgAKAAJxQQMAjwAKAAFxQQUAzwAKAN8ACgACcUEDAG8ACgABcUEDAO4ACgABcUEDADoACgABcUEDAFcACgABcUEDALYACgABcUEDAGYACgABXUEDAEAACgABckEDABIACwABckEDALMACwABcUEDAPQACwABXUEDAPUACwABcUEDANcACwABcUEFAGoACwB6AAsAAnFBAwAaAAsAAXFBAwDKAAsAAXFBAwCHAAsAAV1BBwCGAAsAlgALAKYACwADcUEFADUACwBFAAsAAnFBAwBUAAsAAXFBAwADAAsAAXJBAwAxAAsAAXJBAwBAAAsAAXIAuAAARVi4AAYvG7kABgAOPlm4AABFWLgACS8buQAJAA4+WbgAAEVYuAAALxu5AAAACj5ZuAAARVi4AAMvG7kAAwAKPlm6AAIAAAAGERI5QQMA+QACAAFxQQMAGgACAAFxQQMAeQACAAFxQQMAaAACAAFxQQMANwAFAAFyQQMAFgAFAAFyQQMA1gAFAAFxQQMAQwAIAAFyQQUAFAAIACQACAACcUEDAMQACAABcUEDABQACAABckEDAAYACAABckEFAJcACACnAAgAAnFBAwBnAAgAAXFBAwB2AAgAAXFBAwD0AAgAAXFBAwCEAAgAAXFBAwA0AAgAAXJBAwDjAAgAAXFBAwDSAAgAAXFBAwAHAAsAAXJBAwBHAAsAAXJBAwDXAAsAAXFBAwAVAAsAAXIwMQFBBwAlAAAANQAAAEUAAAADckEDAKcAAAABcUEDAAgAAAABckEDANkAAAABcUEDAIoAAAABcUEDAPoAAAABcUEDAMsAAAABXUEDAGsAAAABcUEDAMsAAAABcUEDAPgAAQABcUEDAAgAAQABckEDAIkAAQABcUEDAHoAAQABcUEDAOoAAQABcUEDACoAAQABckEDAMwAAQABXUEDAGwAAQABcUEDAN0AAQABcUEDAM8AAQABcUEDAEQAAgABckEDACUAAgABckEDADcAAgABckEFAMsAAgDbAAIAAnFBAwDgAAMAAXFBAwAgAAMAAXJBAwBBAAMAAXJBAwA0AAMAAXJBAwCmAAMAAXFBAwA8AAQAAXJBAwBHAAUAAXJBAwBqAAUAAXFBAwDcAAUAAXFBAwDvAAUAAXFBAwAjAAYAAXJBAwAgAAcAAXJBAwDlAAcAAXFBAwAFAAcAAXJBAwBFAAcAAXJBAwAWAAcAAXJBAwA2AAcAAXJBAwD3AAcAAXFBAwAkAAgAAXJBAwBGAAgAAXJBAwA3AAgAAXJBAwB4AAgAAXFBAwDJAAgAAXFBAwDqAAgAAXFBAwCmAAkAAXFBAwCJAAkAAXFBAwD5AAkAAXFBAwDLAAkAAV1BAwA7AAkAAXJBAwDsAAkAAXFBBQBtAAkAfQAJAAJxQQMA3gAJAAFxQQMALgAJAAFyQQMAzwAJAAFxQQMApQAKAAFxQQMAJwAKAAFyQQMAagAKAAFxQQMAywAKAAFdQQMA3AAKAAFxQQMAfQAKAAFxQQMAzQAKAAFxQQMAIQALAAFyQQMA4gALAAFxQQMARQALAAFyQQMApwALAAFxQQMANwALAAFyQQcAbwANAH8ADQCPAA0AA3FBBQDPAA0A3wANAAJxAEEDAMgAAgABcUEDAOkAAgABcUEFADkAAgBJAAIAAnJBAwAqAAIAAXJBAwBIAAUAAXJBAwAmAAcAAXJBAwAhAAgAAXJBAwA2AAgAAXJBAwB4AAgAAXFBAwCnAAsAAXFBAwAnAAsAAXIhIycHIzcnMxc3MwcBPi5ycS2KgSxsayuCk5Otp4qKpgAAAAABAAP/ZAFOAVQADAgXQQMAlwAAAAFdQQUAOQAAAEkAAAACcUEDAKwAAAABXUEDACkAAAABXUEDAGgAAAABXUEDADcAAAABckEDAPQAAAABcUEDACUAAQABckEDADcAAQABckEDAEUAAQABckEFAAQAAQAUAAEAAnJBAwDnAAIAAV1BAwAmAAIAAXJBAwAtAAMAAXJBAwAbAAMAAXJBAwAbAAQAAXJBAwAMAAQAAXJBAwA8AAQAAXJBAwBKAAQAAXJBAwApAAQAAXJBAwD6AAUAAXFBAwAbAAUAAXJBAwA7AAUAAXJBAwAqAAUAAXJBAwDpAAUAAV1BAwA5AAcAAXJBAwDqAAcAAV1BAwD5AAcAAXFBAwAJAAcAAXJBAwA2AAcAAXFBAwBmAAgAAV1BBQCXAAgApwAIAAJdQQMAOAAIAAFyQQMACQAIAAFyQQMA+gAIAAFxQQMAKgAIAAFyQQMASQAIAAFyQQMASAAIAAFxQQMAFwAIAAFyQQMANgAIAAFxQQMA5gAIAAFdQQMAQQAJAAFyQQMAAgAJAAFyQQMAMwAJAAFxQQMARgAJAAFxQQMA5gAJAAFdQQMAIwAJAAFyQQMAMgAJAAFyQQMA8QAJAAFxQQMAEAAJAAFyQQMARwAKAAFyQQMAGAAKAAFyQQMAJwAKAAFdQQMAtwAKAAFdQQUAlgAKAKYACgACXUEFAKkACwC5AAsAAl1BAwApAAsAAXJBAwBKAAsAAXFBAwAbAAsAAXJBAwAOAAsAAXJBAwA/AAsAAXJBAwBNAAsAAXJBAwDrAAsAAV1BAwApAAsAAV1BAwD5AAsAAXFBAwBpAAsAAV1BAwCYAAsAAV1BAwAWAAwAAXJBBQA4AAwASAAMAAJxQQMAOAAMAAFyQQMACQAMAAFdQQUAmQAMAKkADAACXUEDAGoADAABXUEDACwADAABXUEDAOsADAABXUEDALoADAABXUEDADkADAABXUEDAFgADAABXUEDAAgADAABckEDAEYADAABckEDAPQADAABcUEDACQADAABcgC4AAIvuAAARVi4AAgvG7kACAAOPlm4AABFWLgACy8buQALAA4+WUEDADcAAAABckEDADwAAgABckEDAEkAAgABckEDADoAAwABckEDAEUAAwABckEDABUAAwABckEDADcABAABckEDADYABQABcUEDAEQABQABcUEDACIABQABcroACgACAAgREjlBAwAAAAoAAXJBAwATAAoAAXJBAwD0AAoAAXFBBQCWAAoApgAKAAJdQQMAJAAKAAFyQQMARAAKAAFxQQMAQQAKAAFyQQMAMAAKAAFxQQMAMAAKAAFyMDEBQQUAhQAAAJUAAAACcUEDAOUAAAABcUEDAHYAAAABcUEDAKYAAAABcUEDAMYAAAABcUEDAFkAAAABXUEFABkAAAApAAAAAnJBAwAwAAEAAXJBBwCEAAEAlAABAKQAAQADcUEDAMQAAQABcUEDAHUAAQABcUEDAFYAAQABXUEDADcAAQABXUEDAEcAAQABcUEDALwAAQABcUEDAB8AAQABckEDAKgAAgABcUEDANgAAgABcUEDABkAAwABckEDADcABAABckEDAMoABAABcUEDAPsABAABcUEDABwABAABckEDAO4ABAABcUEDAL8ABAABcUEDAN8ABAABcUEDAEYABQABcUEDABgABQABcUEDADgABQABckEDAKkABQABcUEDAMkABQABcUEDAFoABQABcUEFANoABQDqAAUAAnFBAwAKAAUAAXJBAwD7AAUAAV1BAwArAAUAAXJBAwC8AAUAAXFBAwBIAAcAAXJBAwD5AAcAAV1BAwAZAAcAAXFBAwCJAAcAAXFBBQDZAAcA6QAHAAJxQQMAWgAHAAFxQQMAegAHAAFxQQMAawAHAAFxQQUAuwAHAMsABwACcUEDACsABwABckEDAK0ABwABcUEDAGUACAABcUEDAJUACAABcUEDAL8ACAABcUEDAJAACQABcUEDAOEACQABcUEDAGIACQABcUEDAHQACQABcUEFAMQACQDUAAkAAnFBAwCFAAkAAXFBAwClAAkAAXFBAwBWAAkAAXFBAwAmAAkAAXJBAwC8AAkAAXFBAwC5AAoAAXFBAwBpAAsAAXFBAwCKAAsAAXFBAwC6AAsAAXFBAwAqAAsAAXJBAwAbAAsAAXFBAwCbAAsAAXFBAwDrAAsAAXFBAwB9AAsAAXFBAwCtAAsAAXFBAwDdAAsAAXFBAwDPAAsAAXFBAwA2AAwAAXFBAwC2AAwAAXFBAwDmAAwAAXFBAwCnAAwAAV1BAwCIAAwAAV1BAwCYAAwAAXFBAwDYAAwAAXFBAwAZAAwAAXFBAwB5AAwAAXFBAwAJAAwAAXJBAwCqAAwAAXFBAwBbAAwAAV1BAwDLAAwAAXEAQQMAsgAAAAFxQQMAAwAAAAFyQQMAqgACAAFxQQsAvAACAMwAAgDcAAIA7AACAPwAAgAFcUEDABYAAwABckEFANoAAwDqAAMAAnFBAwD7AAMAAXFBAwA7AAMAAXJBBQC8AAMAzAADAAJxQQMABAAEAAFyQQMAtwAEAAFxQQMAFgAFAAFxQQMARwAFAAFxQQUAJwAFADcABQACckEDAKoABQABcUEDACcABwABckEDAKsABwABcUEDAEIACgABcUEDALIACgABcUEDANIACgABcUEDAAIACgABckEDAJMACgABcUEDADMACgABckEDAAYACgABXUEDAFYACgABcUEDAIYACgABcUEDACYACgABcjMGByc2NzQnAzMbATO4O2IJVSwDjSp/dyuFFx8TdQMJAT3+4AEgAAABAA8AAAE1AVQACQI/QQMA4QAAAAFxQQ0AigACAJoAAgCqAAIAugACAMoAAgDaAAIABnFBBQA7AAIASwACAAJyQQMADQACAAFyQQUAHAACACwAAgACckEFAOsAAgD7AAIAAnFBAwBpAAIAAXFBAwBYAAIAAXFBAwBpAAMAAXFBBQCKAAMAmgADAAJxQQUA2wADAOsAAwACcUEDAHsAAwABcUEDAKwAAwABcUEDAB0AAwABckEFAC8AAwA/AAMAAnJBAwBNAAMAAXJBAwD9AAMAAXFBAwDMAAMAAXFBAwALAAMAAXJBAwC6AAMAAXFBAwBaAAMAAXFBAwDIAAMAAV1BBwAoAAMAOAADAEgAAwADcUEDADkABgABcUEDAAQABwABckEDALUABwABcUEJAGYABwB2AAcAhgAHAJYABwAEcUEFABYABwAmAAcAAnJBAwA3AAcAAXJBBQA3AAcARwAHAAJxQQMA9wAHAAFxQQUAxgAHANYABwACcUEDAFUABwABcUEDAEQABwABckEDAOQABwABcUEDAKQABwABcUEDAPMACAABcUEHAAMACAATAAgAIwAIAANyQQMAhAAIAAFxQQUAlgAIAKYACAACcUEHAFYACABmAAgAdgAIAANxQQcAxQAIANUACADlAAgAA3FBAwBEAAgAAXJBAwCzAAgAAXFBAwAyAAgAAXIAuAAARVi4AAUvG7kABQAOPlm4AABFWLgAAC8buQAAAAo+WbgABRC5AAMAAfRBAwDHAAcAAV24AAAQuQAIAAH0MDEpATUTIzchBwMzAS3+4vDkBgEPAe/1GAEcIBv+5wAAAAEADf+zALQB4wAgAaq7AB4ABQAEAAQruAAEELgAANy6AAcABAAeERI5uAAHL7gADNC4AAQQuAAP0LgAABC4ABLQQQUAVgAVAGYAFQACcbgAHhC4ABbQuAAHELkAHAAF9LgAGNC6ABoABAAeERI5QQMA9AAaAAFdQQMABwAaAAFxQQMANAAaAAFxQQMAQwAaAAFxQQMAVgAfAAFxALgAAEVYuAARLxu5ABEAEj5ZuwAAAAIAAQAEK0EDAPkACQABXUEDAAkACQABcUEDADkACQABcUEDAEcACQABcUEDAFsACgABcUEDAEkACgABcbgAERC5ABMAAvRBAwBoABUAAXFBAwD7ABoAAV1BAwA9ABoAAXFBAwBaABoAAXFBAwAKABoAAXFBAwBoAB8AAXEwMQFBAwDLAAMAAXFBAwC8AAMAAXFBAwDLABAAAXFBAwC8ABAAAXFBAwAUABkAAXJBAwDFABkAAXFBBQAgABoAMAAaAAJyQQMAsQAaAAFxQQMAEQAaAAFyQQUA4gAaAPIAGgACcUEDAMMAGgABcUEDAMUAGwABcUEDABUAGwABcgBBAwC4ABAAAXEXFSMiNTQ2NTQnNTY1NCY1NDsBFSMiFRYVFAcWFRQHFDO0C2wOPj4ObAsPRQ4oKA5FLx5fE08UMgIeAjIUTxNfHkVlCjMTEzMKZUUAAAEAPP9SAF0CEAADABW7AAEABgACAAQrALgAAS+4AAAvMDETESMRXSECEP1CAr4AAAEAHP+zAMMB4wAgAHy6AB4AAQADK7gAHhC5AAQABfS6AAYAAQAeERI5uAAGL7oACAABAB4REjm4AArQuAAEELgADNC4AAEQuAAP0LgAHhC4ABPQuAAGELkAGwAF9LgAFtAAuAAARVi4ABAvG7kAEAASPlm7AAEAAgAAAAQruAAQELkADgAC9DAxFzUzMjUmNTQ3JjU0NzQrATUzMhUUBhUUFxUGFRQWFRQjHA9FDigoDkUPC2wOPj4ObE0eRWUKMxMTMwplRR5fE08UMgIeAjIUTxNfAAAAAAEAGgCXAYUA+QAUAFNBAwDWAAQAAV1BBwAmAAoANgAKAEYACgADckEDANYACwABXUEDADoADgABcgC7ABIAAQAFAAQruwAPAAEACAAEK7gADxC4AADQuAAFELgACtAwMSUVFAcGIyImIyIHIzU0NjMyFjMyNwGFGRUgJ4MjLwIfLyEmhSQrAvkGLhkVQUEIKjA/P////tEAAAEEAmcCIgEHAAAAAgFnAAAAAAAB/t8Bz/+GAp8AHwG7uAAgL7gAIS+4AAXcuAAgELgAF9C4ABcvuQANAAb0QSEABgANABYADQAmAA0ANgANAEYADQBWAA0AZgANAHYADQCGAA0AlgANAKYADQC2AA0AxgANANYADQDmAA0A9gANABBdQSEABgANABYADQAmAA0ANgANAEYADQBWAA0AZgANAHYADQCGAA0AlgANAKYADQC2AA0AxgANANYADQDmAA0A9gANABBxQQcABgANABYADQAmAA0AA3JBBQA1AA0ARQANAAJyuAAFELgAD9C4AA8vuAAFELkAHAAG9EEFADoAHABKABwAAnJBIQAJABwAGQAcACkAHAA5ABwASQAcAFkAHABpABwAeQAcAIkAHACZABwAqQAcALkAHADJABwA2QAcAOkAHAD5ABwAEF1BIQAJABwAGQAcACkAHAA5ABwASQAcAFkAHABpABwAeQAcAIkAHACZABwAqQAcALkAHADJABwA2QAcAOkAHAD5ABwAEHFBBwAJABwAGQAcACkAHAADcroAGgAFABwREjkAuAAUL7sAHgACAAMABCu4AB4QuAAK3LoABwAeAAoREjm6ABoAHgAKERI5MDEDByYjIhUUFwcmIyIGFRQzMjcXBiMiJjU0NjMmNTQzMnoJERQuMgkMDBwjLQ0TARMbGSQoGRRNGwKYGQUfIQYXBBkPGwgZCB0YGSINGToAAAIAJv90AHABVQADAA8BFLsABAAHAAoABCtBIQAGAAQAFgAEACYABAA2AAQARgAEAFYABABmAAQAdgAEAIYABACWAAQApgAEALYABADGAAQA1gAEAOYABAD2AAQAEF1BIQAGAAQAFgAEACYABAA2AAQARgAEAFYABABmAAQAdgAEAIYABACWAAQApgAEALYABADGAAQA1gAEAOYABAD2AAQAEHFBBwAGAAQAFgAEACYABAADckEFADUABABFAAQAAnIAuAAAL7gAAEVYuAANLxu5AA0ADj5ZuAAH3EEFANkABwDpAAcAAl1BGwAIAAcAGAAHACgABwA4AAcASAAHAFgABwBoAAcAeAAHAIgABwCYAAcAqAAHALgABwDIAAcADV0wMRcjEzM3FAYjIiY1NDYzMhZmNwojFBYPDxYWDw8WjAFcYA8WFg8PFhYAAQAg/8UBegIeACEBMbgAIi+4ACMvuAAE3LgAAtC4AAIvuAAEELkABQAG9LgAIhC4AArQuAAKL7kAGwAH9EEhAAYAGwAWABsAJgAbADYAGwBGABsAVgAbAGYAGwB2ABsAhgAbAJYAGwCmABsAtgAbAMYAGwDWABsA5gAbAPYAGwAQXUEhAAYAGwAWABsAJgAbADYAGwBGABsAVgAbAGYAGwB2ABsAhgAbAJYAGwCmABsAtgAbAMYAGwDWABsA5gAbAPYAGwAQcUEHAAYAGwAWABsAJgAbAANyQQUANQAbAEUAGwACcrgADNC4AAwvuAAFELgADtC4AAQQuAAQ0AC4AA8vuAAEL7sAHwABAAIABCu7ABMAAQAYAAQruAACELgABtC4AAYvuAATELgADtC4AA4vugAWAAQADxESOTAxJQYrARUjNSYnJjU0NzY3NTMVNjMyFwcmIyIGFRQXFjMyNwF6MFMFIUwwNSwwVSEHDjw0CC05XGYvMls/LDAaUVMLMjdiUzc8D1tXARMkF2FbVi0wFAABADkAAAFhAc0AHgEUuwAbAAUABAAEK7gABBC4AAbQuAAGL0EhAAYAGwAWABsAJgAbADYAGwBGABsAVgAbAGYAGwB2ABsAhgAbAJYAGwCmABsAtgAbAMYAGwDWABsA5gAbAPYAGwAQXUEhAAYAGwAWABsAJgAbADYAGwBGABsAVgAbAGYAGwB2ABsAhgAbAJYAGwCmABsAtgAbAMYAGwDWABsA5gAbAPYAGwAQcUEHAAYAGwAWABsAJgAbAANyQQUANQAbAEUAGwACcroAFAAEABsREjm4ABQvuQALAAX0ALgAAEVYuAAALxu5AAAACj5ZuwANAAEAEgAEK7sACQABAAYABCu4AAkQuAAW0LgABhC4ABjQuAAAELkAHQAB9DAxKQE1NjU0JyM1MyY1NDMyFwcmIyIVFBczFSMWFRQHMwFh/thVBU9MCIApKgwoIVsJcW0ENuUZNFEXIx8wIYUUHRBlJSsfFxxUMAAAAgAWACsBhQGaABsAJwE7uAAoL7gAKS+4AADcuQAcAAf0QQUAOgAcAEoAHAACckEhAAkAHAAZABwAKQAcADkAHABJABwAWQAcAGkAHAB5ABwAiQAcAJkAHACpABwAuQAcAMkAHADZABwA6QAcAPkAHAAQXUEhAAkAHAAZABwAKQAcADkAHABJABwAWQAcAGkAHAB5ABwAiQAcAJkAHACpABwAuQAcAMkAHADZABwA6QAcAPkAHAAQcUEHAAkAHAAZABwAKQAcAANyuAAC0LgAAi+4AAAQuAAD0LgAAy+4ACgQuAAL0LgACy+5AAwAB/S4AAsQuAAO0LgADBC4ABDQuAALELgAEdC4AAAQuAAZ0LgAGS+4ABwQuAAa0LgAGi+4AAwQuAAi0AC4ABIvuAAVL7gAGC+7ACUAAQAHAAQruAAVELkAHwAB9DAxJRQHFwcnBiMiJwcnNyY1NDcnNxc2MzIXNxcHFgc0JiMiBhUUFjMyNgGDJigdKi5EQTAoHScnJycdKDQ9QDIrHCgmKFM8OlVVOjxT4UItKR4qKioqHikwP0AyKB8qKSkqHygsRjxZWD09VVcAAAABACIAEwF5AcsAFgB/uwACAAUAAwAEK7gAAxC4AAfQugAOAAMAAhESObgAAhC4ABTQALgAAi+4AAwvuAAPL7sAFgACAAAABCu7ABEAAgAUAAQruAAAELgABNC4ABYQuAAG0LgAFBC4AAjQuAARELgACtC4AAovugALABQAERESOboADgACAAwREjkwMSUjFSM1IzUzNSM1MyczFzczBzMVIxUzAVl5JXh4eHiZLn19L5l5eXlfTEwdOR3509P4HjkAAAAAAgA8/4UAXQHbAAMABwAluwAAAAYAAQAEK7gAABC4AATQuAABELgABdAAuAACL7gABC8wMTcjNTMRIzUzXSEhISHj+P2q+QAAAgA3/9kBPwHfACkAOAJPuwAxAAYAEQAEK7sAAAAGAAsABCtBBQA6AAsASgALAAJyQSEACQALABkACwApAAsAOQALAEkACwBZAAsAaQALAHkACwCJAAsAmQALAKkACwC5AAsAyQALANkACwDpAAsA+QALABBdQSEACQALABkACwApAAsAOQALAEkACwBZAAsAaQALAHkACwCJAAsAmQALAKkACwC5AAsAyQALANkACwDpAAsA+QALABBxQQcACQALABkACwApAAsAA3JBIQAGADEAFgAxACYAMQA2ADEARgAxAFYAMQBmADEAdgAxAIYAMQCWADEApgAxALYAMQDGADEA1gAxAOYAMQD2ADEAEF1BIQAGADEAFgAxACYAMQA2ADEARgAxAFYAMQBmADEAdgAxAIYAMQCWADEApgAxALYAMQDGADEA1gAxAOYAMQD2ADEAEHFBBwAGADEAFgAxACYAMQADckEFADUAMQBFADEAAnK6ABUAEQAxERI5uAAVL7kAIAAF9LoAKgALAAAREjm4ACovQQUAOgAqAEoAKgACckEhAAkAKgAZACoAKQAqADkAKgBJACoAWQAqAGkAKgB5ACoAiQAqAJkAKgCpACoAuQAqAMkAKgDZACoA6QAqAPkAKgAQXUEhAAkAKgAZACoAKQAqADkAKgBJACoAWQAqAGkAKgB5ACoAiQAqAJkAKgCpACoAuQAqAMkAKgDZACoA6QAqAPkAKgAQcUEHAAkAKgAZACoAKQAqAANyuQAmAAX0uAA63AC7AAgAAgADAAQruwAYAAIAHQAEKzAxJRQGIyInNxYzMjY1NCcmJyY1NDcmNTQ2MzIXByYjIgYVFBcWFxYVFAcWJzQmJyYnBhUUFxYXFhc2AS1INj8oECE4KTE3MzM3LRdDNTUsESMyIi0dEzRqKhgTKiI8FyIjFTMvDRpBMDghHB8mHysZFBUcNCwkFx8rNRodGiMaGxIMEiRDLigYaRQpDBQOHSEcFQ0SEQofAAAAAAIADgGIAMcBxQALABcBlbgAGC+4ABkvuAAYELgABtC4AAYvuQAAAAf0QSEABgAAABYAAAAmAAAANgAAAEYAAABWAAAAZgAAAHYAAACGAAAAlgAAAKYAAAC2AAAAxgAAANYAAADmAAAA9gAAABBdQSEABgAAABYAAAAmAAAANgAAAEYAAABWAAAAZgAAAHYAAACGAAAAlgAAAKYAAAC2AAAAxgAAANYAAADmAAAA9gAAABBxQQcABgAAABYAAAAmAAAAA3JBBQA1AAAARQAAAAJyuAAZELgADNy5ABIAB/RBBQA6ABIASgASAAJyQSEACQASABkAEgApABIAOQASAEkAEgBZABIAaQASAHkAEgCJABIAmQASAKkAEgC5ABIAyQASANkAEgDpABIA+QASABBdQSEACQASABkAEgApABIAOQASAEkAEgBZABIAaQASAHkAEgCJABIAmQASAKkAEgC5ABIAyQASANkAEgDpABIA+QASABBxQQcACQASABkAEgApABIAA3IAuwAJAAEAAwAEK7gAAxC4AA/QuAAJELgAFdAwMRMUBiMiJjU0NjMyFhcUBiMiJjU0NjMyFksSDQ0REQ0NEnwSDQ0REQ0NEgGmDRERDQ0SEg0NERENDRISAAMAGf/9Af8B4wATAB8AKwO7uwAmAAUAGgAEK7sADwAHAAUABCu7ABQABQAgAAQrQSEABgAPABYADwAmAA8ANgAPAEYADwBWAA8AZgAPAHYADwCGAA8AlgAPAKYADwC2AA8AxgAPANYADwDmAA8A9gAPABBdQSEABgAPABYADwAmAA8ANgAPAEYADwBWAA8AZgAPAHYADwCGAA8AlgAPAKYADwC2AA8AxgAPANYADwDmAA8A9gAPABBxQQcABgAPABYADwAmAA8AA3JBBQA1AA8ARQAPAAJyQQUAOgAgAEoAIAACckEhAAkAIAAZACAAKQAgADkAIABJACAAWQAgAGkAIAB5ACAAiQAgAJkAIACpACAAuQAgAMkAIADZACAA6QAgAPkAIAAQXUEhAAkAIAAZACAAKQAgADkAIABJACAAWQAgAGkAIAB5ACAAiQAgAJkAIACpACAAuQAgAMkAIADZACAA6QAgAPkAIAAQcUEHAAkAIAAZACAAKQAgAANyQSEABgAmABYAJgAmACYANgAmAEYAJgBWACYAZgAmAHYAJgCGACYAlgAmAKYAJgC2ACYAxgAmANYAJgDmACYA9gAmABBdQSEABgAmABYAJgAmACYANgAmAEYAJgBWACYAZgAmAHYAJgCGACYAlgAmAKYAJgC2ACYAxgAmANYAJgDmACYA9gAmABBxQQcABgAmABYAJgAmACYAA3JBBQA1ACYARQAmAAJyuAAUELgALdwAuAAARVi4AB0vG7kAHQASPlm4AABFWLgAFy8buQAXAAo+WbsAEQABAAIABCu7AAgAAQANAAQruAAdELkAIwAB9EEFADkAIwBJACMAAnJBIQAIACMAGAAjACgAIwA4ACMASAAjAFgAIwBoACMAeAAjAIgAIwCYACMAqAAjALgAIwDIACMA2AAjAOgAIwD4ACMAEF1BIQAIACMAGAAjACgAIwA4ACMASAAjAFgAIwBoACMAeAAjAIgAIwCYACMAqAAjALgAIwDIACMA2AAjAOgAIwD4ACMAEHFBBwAIACMAGAAjACgAIwADcrgAFxC5ACkAAfRBIQAHACkAFwApACcAKQA3ACkARwApAFcAKQBnACkAdwApAIcAKQCXACkApwApALcAKQDHACkA1wApAOcAKQD3ACkAEF1BIQAHACkAFwApACcAKQA3ACkARwApAFcAKQBnACkAdwApAIcAKQCXACkApwApALcAKQDHACkA1wApAOcAKQD3ACkAEHFBBwAHACkAFwApACcAKQADckEFADYAKQBGACkAAnIwMSUGIyImNTQ2MzIXByYjBhUUFzI/ARQGIyImNTQ2MzIWBzQmIyIGFRQWMzI2AXImQ0FOUkI/IAwmLWxtMyOaj2Rkj49kZI8keVZWeXlWVnl1HVQ9RlEYHhYGbG0GGVxkj49kZI+PZFZ5eVZWeXkAAAACABgA9ADUAd8AFgAeATy4AB8vuAAgL7gAFNy4AADQuAAAL7gAFBC5ABgABfS4AAHQuAABL7oAAgAUABgREjm4AB8QuAAG0LgABi+4ABgQuAAI0LgABhC5ABoABfRBIQAGABoAFgAaACYAGgA2ABoARgAaAFYAGgBmABoAdgAaAIYAGgCWABoApgAaALYAGgDGABoA1gAaAOYAGgD2ABoAEF1BIQAGABoAFgAaACYAGgA2ABoARgAaAFYAGgBmABoAdgAaAIYAGgCWABoApgAaALYAGgDGABoA1gAaAOYAGgD2ABoAEHFBBwAGABoAFgAaACYAGgADckEFADUAGgBFABoAAnK4AA/QuAAPLwC4AABFWLgACC8buQAIABA+WbsAHAACAAQABCu7ABIAAgANAAQruAAEELgAANC4AAAvuAAIELkAGAAC9DAxNyMnBiMiNTQ3NTQnJiMiByc2MzIdARQnNSIVFDMyNtQfBRwvTZYIECMiHAslK1cjczATMPchJEROAgcODRcVGRprQx0uKjQmHQAAAAACAAsAMAETATUABQALABMAuAACL7gACC+4AAAvuAAGLzAxNyc3MwcXIyc3MwcX6W9uKm5vmW9uKm5vMIGEhIGBhISBAAEAFwBbAYMBEAAFABu7AAAABwABAAQrALgAAC+7AAUAAQACAAQrMDElIzUhNSEBgyf+uwFsW5QhAAAAAAQAGf/9Af8B4wALABcAJwAwBVy7ABIABQAGAAQruwAdAAcAHgAEK7sAJAAHACgABCu7AAAABQAMAAQrQQUAOgAMAEoADAACckEhAAkADAAZAAwAKQAMADkADABJAAwAWQAMAGkADAB5AAwAiQAMAJkADACpAAwAuQAMAMkADADZAAwA6QAMAPkADAAQXUEhAAkADAAZAAwAKQAMADkADABJAAwAWQAMAGkADAB5AAwAiQAMAJkADACpAAwAuQAMAMkADADZAAwA6QAMAPkADAAQcUEHAAkADAAZAAwAKQAMAANyQSEABgASABYAEgAmABIANgASAEYAEgBWABIAZgASAHYAEgCGABIAlgASAKYAEgC2ABIAxgASANYAEgDmABIA9gASABBdQSEABgASABYAEgAmABIANgASAEYAEgBWABIAZgASAHYAEgCGABIAlgASAKYAEgC2ABIAxgASANYAEgDmABIA9gASABBxQQcABgASABYAEgAmABIAA3JBBQA1ABIARQASAAJyQQMABAAYAAFyQQMANQAYAAFxQQMA9gAYAAFxQQcAxQAYANUAGADlABgAA3FBBwATABgAIwAYADMAGAADckEDAEEAGAABckEDALoAGQABcUEDANsAGQABcUEDAMkAGQABcUEFACkAGQA5ABkAAnJBAwA9ABsAAXJBAwBPABsAAXJBBQDvABsA/wAbAAJxQQcADwAbAB8AGwAvABsAA3JBAwDMABsAAXFBAwA7ABsAAXG6ACYABgAAERI5QQMAtAAnAAFxQQUAOgAoAEoAKAACckEhAAkAKAAZACgAKQAoADkAKABJACgAWQAoAGkAKAB5ACgAiQAoAJkAKACpACgAuQAoAMkAKADZACgA6QAoAPkAKAAQXUEhAAkAKAAZACgAKQAoADkAKABJACgAWQAoAGkAKAB5ACgAiQAoAJkAKACpACgAuQAoAMkAKADZACgA6QAoAPkAKAAQcUEHAAkAKAAZACgAKQAoAANyuAAdELgALNAAuAAARVi4AAkvG7kACQASPlm4AABFWLgAIS8buQAhABA+WbgAAEVYuAADLxu5AAMACj5ZuwAuAAEAGwAEK7gACRC5AA8AAfRBBQA5AA8ASQAPAAJyQSEACAAPABgADwAoAA8AOAAPAEgADwBYAA8AaAAPAHgADwCIAA8AmAAPAKgADwC4AA8AyAAPANgADwDoAA8A+AAPABBdQSEACAAPABgADwAoAA8AOAAPAEgADwBYAA8AaAAPAHgADwCIAA8AmAAPAKgADwC4AA8AyAAPANgADwDoAA8A+AAPABBxQQcACAAPABgADwAoAA8AA3K4AAMQuQAVAAH0QSEABwAVABcAFQAnABUANwAVAEcAFQBXABUAZwAVAHcAFQCHABUAlwAVAKcAFQC3ABUAxwAVANcAFQDnABUA9wAVABBdQSEABwAVABcAFQAnABUANwAVAEcAFQBXABUAZwAVAHcAFQCHABUAlwAVAKcAFQC3ABUAxwAVANcAFQDnABUA9wAVABBxQQcABwAVABcAFQAnABUAA3JBBQA2ABUARgAVAAJyQQMANwAZAAFyugAmABsALhESObgAIRC5ACoAAfRBBQA5ACoASQAqAAJyQSEACAAqABgAKgAoACoAOAAqAEgAKgBYACoAaAAqAHgAKgCIACoAmAAqAKgAKgC4ACoAyAAqANgAKgDoACoA+AAqABBdQSEACAAqABgAKgAoACoAOAAqAEgAKgBYACoAaAAqAHgAKgCIACoAmAAqAKgAKgC4ACoAyAAqANgAKgDoACoA+AAqABBxQQcACAAqABgAKgAoACoAA3K4ACzQuAAsLzAxJRQGIyImNTQ2MzIWBzQmIyIGFRQWMzI2ByMmKwEVIxE2NzIWFRQHFic0IyIHFTMyNgH/j2Rkj49kZI8keVZWeXlWVnlfJxIvPSgkLzU7KSclRRsUNhwi8GSPj2Rkj49kVnl5VlZ5eT1/fwEjBwEtJzQWI2g2A2EYAAEAAAIQAWACLwADAA0AuwAAAAEAAQAEKzAxARUhNQFg/qACLx8fAAACABQBOAC/AeMACwAXA/C4ABgvuAAZL7gAANxBCQCfAAAArwAAAL8AAADPAAAABF1BCwA/AAAATwAAAF8AAABvAAAAfwAAAAVdQQUAZQACAHUAAgACXUEFAEYAAgBWAAIAAl1BAwA1AAIAAV1BAwCDAAIAAV1BAwBKAAQAAV1BAwA7AAQAAV1BBwBZAAQAaQAEAHkABAADXUEDAIgABAABXbgAGBC4AAbQuAAGL0EDAAAABgABcUEDADoACAABckEDADsACAABXUELAEkACABZAAgAaQAIAHkACACJAAgABV1BAwDpAAgAAXFBAwDlAAoAAXFBBQBWAAoAZgAKAAJdQQMARwAKAAFdQQMANQAKAAFdQQMAdAAKAAFdQQMAggAKAAFduAAAELkADAAG9EEHAAkADAAZAAwAKQAMAANdQQUAOgAMAEoADAACckEJALkADADJAAwA2QAMAOkADAAEcUEDAPkADAABXUEVAAkADAAZAAwAKQAMADkADABJAAwAWQAMAGkADAB5AAwAiQAMAJkADAAKcUEHAAkADAAZAAwAKQAMAANyQQMA+QAOAAFxQQMA9AAQAAFxuAAGELkAEgAG9EETABYAEgAmABIANgASAEYAEgBWABIAZgASAHYAEgCGABIAlgASAAlxQQkAtgASAMYAEgDWABIA5gASAARxQQcABgASABYAEgAmABIAA11BAwD2ABIAAV1BBQAGABIAFgASAAJyQQMARQASAAFyQQMA9AAUAAFxQQMA+QAWAAFxALgAAEVYuAAVLxu5ABUADj5ZuAAARVi4AAkvG7kACQASPllBAwDfABUAAV1BAwB/ABUAAV1BAwC2ABUAAXG4ABUQuQADAAL0QQMAeAADAAFdQQUAuAADAMgAAwACXUEDAOgAAwABcUEDANoAAwABcUEFADkAAwBJAAMAAnJBBQDoAAMA+AADAAJdQRsACAADABgAAwAoAAMAOAADAEgAAwBYAAMAaAADAHgAAwCIAAMAmAADAKgAAwC4AAMAyAADAA1xQQMAmAADAAFdQQcACAADABgAAwAoAAMAA11BBwAIAAMAGAADACgAAwADckEDADUABwABckEDANwACQABcUEDAM4ACQABcUEDAKAACQABcUEDAPAACQABXbgACRC5AA8AAvRBBwAIAA8AGAAPACgADwADXUEHAMgADwDYAA8A6AAPAANxQQUAOQAPAEkADwACckEDALkADwABcUEVAAgADwAYAA8AKAAPADgADwBIAA8AWAAPAGgADwB4AA8AiAAPAJgADwAKcUEDAHgADwABXUEHAAgADwAYAA8AKAAPAANyQQkAuAAPAMgADwDYAA8A6AAPAARdMDETFAYjIiY1NDYzMhYHNCYjIgYVFBYzMja/MyMjMjIjIzMeIRcXICAXFyEBjSMyMiMjMzMjFyIiFxchIQAAAgAmAAABdQFlAAsADwBWuwACAAUAAwAEK7gAAxC4AAfQuAACELgACdAAuAAIL7gAAEVYuAAMLxu5AAwACj5ZuwALAAEAAAAEK7gAABC4AATQuAALELgABtC4AAwQuQAOAAH0MDElIxUjNSM1MzUzFTMVITUhAXWWI5aWI5b+sQFPyYWFIHx86SAAAAABABkAxADSAeEAFgGWuwASAAYABwAEK7gAEhC4AADQuAAAL0EFADoABwBKAAcAAnJBIQAJAAcAGQAHACkABwA5AAcASQAHAFkABwBpAAcAeQAHAIkABwCZAAcAqQAHALkABwDJAAcA2QAHAOkABwD5AAcAEF1BIQAJAAcAGQAHACkABwA5AAcASQAHAFkABwBpAAcAeQAHAIkABwCZAAcAqQAHALkABwDJAAcA2QAHAOkABwD5AAcAEHFBBwAJAAcAGQAHACkABwADcrgAEhC4ABjcALgAAEVYuAAPLxu5AA8AEj5ZuwAAAAEAAQAEK7gADxC5AAkAAfRBBQA5AAkASQAJAAJyQSEACAAJABgACQAoAAkAOAAJAEgACQBYAAkAaAAJAHgACQCIAAkAmAAJAKgACQC4AAkAyAAJANgACQDoAAkA+AAJABBdQSEACAAJABgACQAoAAkAOAAJAEgACQBYAAkAaAAJAHgACQCIAAkAmAAJAKgACQC4AAkAyAAJANgACQDoAAkA+AAJABBxQQcACAAJABgACQAoAAkAA3IwMTcHIzY3PgE1NCMiByc+ATMyFhUUBwYH0gS1AkMbMyswBSIELiIjLTYoKeMfKUAZNhsrNwYmKigiKTgqKQABACMAwwDXAeIAIQKUuwAdAAYAFAAEK0EFADoAFABKABQAAnJBIQAJABQAGQAUACkAFAA5ABQASQAUAFkAFABpABQAeQAUAIkAFACZABQAqQAUALkAFADJABQA2QAUAOkAFAD5ABQAEF1BIQAJABQAGQAUACkAFAA5ABQASQAUAFkAFABpABQAeQAUAIkAFACZABQAqQAUALkAFADJABQA2QAUAOkAFAD5ABQAEHFBBwAJABQAGQAUACkAFAADcroACwAUAB0REjm4AAsvQQUAOgALAEoACwACckEhAAkACwAZAAsAKQALADkACwBJAAsAWQALAGkACwB5AAsAiQALAJkACwCpAAsAuQALAMkACwDZAAsA6QALAPkACwAQXUEhAAkACwAZAAsAKQALADkACwBJAAsAWQALAGkACwB5AAsAiQALAJkACwCpAAsAuQALAMkACwDZAAsA6QALAPkACwAQcUEHAAkACwAZAAsAKQALAANyuQAAAAb0ALgAAEVYuAAbLxu5ABsAEj5ZugAgAAMAAyu4AAMQuQAIAAH0uAAbELgADdxBBQDZAA0A6QANAAJdQRsACAANABgADQAoAA0AOAANAEgADQBYAA0AaAANAHgADQCIAA0AmAANAKgADQC4AA0AyAANAA1duAAbELkAFgAB9EEFADkAFgBJABYAAnJBIQAIABYAGAAWACgAFgA4ABYASAAWAFgAFgBoABYAeAAWAIgAFgCYABYAqAAWALgAFgDIABYA2AAWAOgAFgD4ABYAEF1BIQAIABYAGAAWACgAFgA4ABYASAAWAFgAFgBoABYAeAAWAIgAFgCYABYAqAAWALgAFgDIABYA2AAWAOgAFgD4ABYAEHFBBwAIABYAGAAWACgAFgADcjAxExQGBwYnNxYzMjY1NCMiByc2NzY1NCMiByc2MzIVFAYHFtc8MSwbDxceJSoqHBAOMgYXISkRHRs/PxwRQgEqLjcBARUgEyYeLA4ZIwUTEhQsDz40EiYHBAAAAAEANgIQAJoCawADACW4AAIvuAADL7gAAS+4AAAvuAADELkAAgAH9AC4AAIvuAAALzAxEyM3M1UfMjICEFsAAAABADn/dAFmAVQAFgFTuAAXL7gAGC+4ABXcuAAA0LgAAC+4ABUQuQASAAf0uAAD0LgAAy+6AAQAFQASERI5uAAXELgACtC4AAovuQAJAAf0uAAM0AC4AAkvuAAARVi4AAsvG7kACwAOPlm4AABFWLgAEy8buQATAA4+WbgAAEVYuAAALxu5AAAACj5ZuAAARVi4AAYvG7kABgAKPlm6AAQACQALERI5ugAIAAkACxESObkADwAB9EEhAAcADwAXAA8AJwAPADcADwBHAA8AVwAPAGcADwB3AA8AhwAPAJcADwCnAA8AtwAPAMcADwDXAA8A5wAPAPcADwAQXUEhAAcADwAXAA8AJwAPADcADwBHAA8AVwAPAGcADwB3AA8AhwAPAJcADwCnAA8AtwAPAMcADwDXAA8A5wAPAPcADwAQcUEHAAcADwAXAA8AJwAPAANyQQUANgAPAEYADwACcjAxISMmPQEGIyInFSMRMxUUMzI2PQEzERQBZiUFOUc6IyYmZixIJhwYC0gztgHgwnlDKc/+/z4AAAABAC3/wQFBAdsADwAvugADAAsAAyu7AAAABgABAAQruAADELkABQAF9AC4AAAvuAAEL7gADS+4AA8vMDEFIxEjESM1IyInJjU0MzIXAUEiMCMEPCwzxjUZPwH6/gbzIyhCmgUAAQAuAJMAcwDYAAsAj7sAAAAHAAYABCtBIQAJAAYAGQAGACkABgA5AAYASQAGAFkABgBpAAYAeQAGAIkABgCZAAYAqQAGALkABgDJAAYA2QAGAOkABgD5AAYAEF1BGQAJAAYAGQAGACkABgA5AAYASQAGAFkABgBpAAYAeQAGAIkABgCZAAYAqQAGALkABgAMcQC6AAkAAwADKzAxNxQGIyImNTQ2MzIWcxUODhQUDg4VtQ4UFA4OFRUAAAABACP/dQCZAAQADwDbuwAAAAYACQAEK0EFADoACQBKAAkAAnJBIQAJAAkAGQAJACkACQA5AAkASQAJAFkACQBpAAkAeQAJAIkACQCZAAkAqQAJALkACQDJAAkA2QAJAOkACQD5AAkAEF1BIQAJAAkAGQAJACkACQA5AAkASQAJAFkACQBpAAkAeQAJAIkACQCZAAkAqQAJALkACQDJAAkA2QAJAOkACQD5AAkAEHFBBwAJAAkAGQAJACkACQADcroADQAJAAAREjkAuAACL7gADC+7AAsAAQAHAAQrugAOAAIADBESOTAxFxQjIic3FjMyNTQnNzMHFplGGBgKFRImPycgGzJROg0WChwZBTwmDAAAAAABADsAyQDCAeQACwAsuwAKAAUAAwAEKwC4AAAvuAAARVi4AAcvG7kABwASPlm6AAQAAAAHERI5MDE3IzUzNQcnNxYdATPCeiwmE0cVK8kYzSEYPwIa5wAAAgAUAO4BCQHjAAsAFwJMuAAYL7gAGS+4AADcuAAYELgABtC4AAYvuAAAELkADAAF9EEFADoADABKAAwAAnJBIQAJAAwAGQAMACkADAA5AAwASQAMAFkADABpAAwAeQAMAIkADACZAAwAqQAMALkADADJAAwA2QAMAOkADAD5AAwAEF1BIQAJAAwAGQAMACkADAA5AAwASQAMAFkADABpAAwAeQAMAIkADACZAAwAqQAMALkADADJAAwA2QAMAOkADAD5AAwAEHFBBwAJAAwAGQAMACkADAADcrgABhC5ABIABfRBIQAGABIAFgASACYAEgA2ABIARgASAFYAEgBmABIAdgASAIYAEgCWABIApgASALYAEgDGABIA1gASAOYAEgD2ABIAEF1BIQAGABIAFgASACYAEgA2ABIARgASAFYAEgBmABIAdgASAIYAEgCWABIApgASALYAEgDGABIA1gASAOYAEgD2ABIAEHFBBwAGABIAFgASACYAEgADckEFADUAEgBFABIAAnIAuAAARVi4AAkvG7kACQASPlm7ABUAAQADAAQruAAJELkADwAB9EEFADkADwBJAA8AAnJBIQAIAA8AGAAPACgADwA4AA8ASAAPAFgADwBoAA8AeAAPAIgADwCYAA8AqAAPALgADwDIAA8A2AAPAOgADwD4AA8AEF1BIQAIAA8AGAAPACgADwA4AA8ASAAPAFgADwBoAA8AeAAPAIgADwCYAA8AqAAPALgADwDIAA8A2AAPAOgADwD4AA8AEHFBBwAIAA8AGAAPACgADwADcjAxARQGIyImNTQ2MzIWBzQmIyIGFRQWMzI2AQlKMTJISDIxSiM0JCQzMyQkNAFoMkhIMjFKSjEkNDQkJDMzAAIAEwAwARsBNQAFAAsAEwC4AAMvuAAJL7gAAC+4AAYvMDE3IzcnMxcVIzcnMxc9Km9uKm4qb24qbjCBhISBgYSEAAAABAAe//cB9gHTAAUAEQAVACEAqbsAIAAFABkABCu6AAcACwADK7gABxC5AAAABfS6AAEACwAHERI5uAAJ0LgABxC4AA/QugATABkAIBESOboAFQALAAcREjm4AAcQuAAj3AC4ABQvuAAdL7gAAEVYuAASLxu5ABIACj5ZuAAARVi4AAgvG7kACAAKPlm7ABEAAQAGAAQruAARELgAANC6AAEAEgAUERI5uAAGELgACtC6ABoAEgAUERI5MDElNQYHBgcXIxUjNSM2NzY3FTMFIwEzASM1MzUHJzcWHQEzAaccFxYCmCojcAElLEEs/pwhARwh/vd6LCYTRxUrX5QYMCwgIT4+Q0ZVAr9oAdz+5xjJIRg/AhrjAAMAHv/3Af4B0wADAA8AJgFFuAAnL7gAKC+4ACcQuAAH0LgABy+5AA4ABfS6AAEABwAOERI5uAAoELgAIdy6AAMABwAhERI5uAAQ0LgAEC+4ACEQuQAWAAX0QQUAOgAWAEoAFgACckEhAAkAFgAZABYAKQAWADkAFgBJABYAWQAWAGkAFgB5ABYAiQAWAJkAFgCpABYAuQAWAMkAFgDZABYA6QAWAPkAFgAQXUEhAAkAFgAZABYAKQAWADkAFgBJABYAWQAWAGkAFgB5ABYAiQAWAJkAFgCpABYAuQAWAMkAFgDZABYA6QAWAPkAFgAQcUEHAAkAFgAZABYAKQAWAANyugAlAAcAIRESOQC4AAIvuAALL7gAAEVYuAAALxu5AAAACj5ZuAAARVi4ABAvG7kAEAAKPlm7AB4AAQAYAAQrugAIAAAAAhESObgAEBC5ACUAAfQwMRcjATMBIzUzNQcnNxYdATMFIzY3PgE1NCMiByc+ATMyFhUUBwYHM5IhARwh/vd6LCYTRxUrAVW1AkMbMyswBSIELiIkLTYpJYcJAdz+5xjJIRg/Ahrj0ilAGTYbKzcGJionIyk4KikAAAAEACP/9wH2AdYAAwAlACsANwF7uwAhAAYAGAAEK7oALQAxAAMrugADADEALRESOUEhAAYAIQAWACEAJgAhADYAIQBGACEAVgAhAGYAIQB2ACEAhgAhAJYAIQCmACEAtgAhAMYAIQDWACEA5gAhAPYAIQAQXUEhAAYAIQAWACEAJgAhADYAIQBGACEAVgAhAGYAIQB2ACEAhgAhAJYAIQCmACEAtgAhAMYAIQDWACEA5gAhAPYAIQAQcUEHAAYAIQAWACEAJgAhAANyQQUANQAhAEUAIQACcroADwAYACEREjm4AA8vuQAEAAb0uAAtELkAJgAF9LoAJwAxAC0REjm4AC/QuAAtELgANdC4AC0QuAA53AC4AABFWLgAAC8buQAAAAo+WbgAAEVYuAAuLxu5AC4ACj5ZuwAfAAEAGgAEK7sANwABACwABCu7AAwAAQAHAAQruAAfELgAAtC4AAIvugADABoAHxESObgAHxC4ABHcugAkAB8AERESObgANxC4ACbQuAAsELgAMNAwMRcjATMHFAYHBic3FjMyNjU0IyIHJzY3NjU0IyIHJzYzMhUUBgcWFzUGBwYHFyMVIzUjNjc2NxUzkiEBHCHXPDEsGw8XHiUqKhwQDjIGFyEtDR0bPz8cEULQHBcWApgqI3ABJSxBLAkB3LUuNwEBFSATJh4sDhkjBRMSFCwPPjQSJgcK+pQYMCwgIT4+Q0ZVAr8AAgAi/2cA+gFVABYAIgKMuwASAAcABgAEK7sAFwAHAB0ABCtBBQA6AB0ASgAdAAJyQSEACQAdABkAHQApAB0AOQAdAEkAHQBZAB0AaQAdAHkAHQCJAB0AmQAdAKkAHQC5AB0AyQAdANkAHQDpAB0A+QAdABBdQSEACQAdABkAHQApAB0AOQAdAEkAHQBZAB0AaQAdAHkAHQCJAB0AmQAdAKkAHQC5AB0AyQAdANkAHQDpAB0A+QAdABBxQQcACQAdABkAHQApAB0AA3K6AAoAHQAXERI5uAAKL0EFADoACgBKAAoAAnJBIQAJAAoAGQAKACkACgA5AAoASQAKAFkACgBpAAoAeQAKAIkACgCZAAoAqQAKALkACgDJAAoA2QAKAOkACgD5AAoAEF1BIQAJAAoAGQAKACkACgA5AAoASQAKAFkACgBpAAoAeQAKAIkACgCZAAoAqQAKALkACgDJAAoA2QAKAOkACgD5AAoAEHFBBwAJAAoAGQAKACkACgADcrkADwAF9EEhAAYAEgAWABIAJgASADYAEgBGABIAVgASAGYAEgB2ABIAhgASAJYAEgCmABIAtgASAMYAEgDWABIA5gASAPYAEgAQXUEhAAYAEgAWABIAJgASADYAEgBGABIAVgASAGYAEgB2ABIAhgASAJYAEgCmABIAtgASAMYAEgDWABIA5gASAPYAEgAQcUEHAAYAEgAWABIAJgASAANyQQUANQASAEUAEgACcgC4AABFWLgAIC8buQAgAA4+WbsAFAABAAIABCu4ACAQuAAa3EEFANkAGgDpABoAAl1BGwAIABoAGAAaACgAGgA4ABoASAAaAFgAGgBoABoAeAAaAIgAGgCYABoAqAAaALgAGgDIABoADV0wMRcGIyInJjU0NzY1NCczFhUUBhUUMzI3AxQGIyImNTQ2MzIW+jA2OR4bPzEDIgVtUi8hJRYPDxYWDw8Weh8hHSs1QzQzEg4PFDV6K0gaAYwPFhYPDxYWAAD//wAAAAABkAJpAiYAIgAAAAcB6wEsAIj//wAAAAABkAJpAiYAIgAAAAcB6QE2AIj//wAAAAABkAJeAiYAIgAAAAcAzQBeAIj//wAAAAABkAJMAiYAIgAAAAcB6AEwAIj//wAAAAABkAJNAiYAIgAAAAcAawBdAIj//wAAAAABkAKLAiYAIgAAAAcA0QAyAIgAAv/5AAACIAHcAA8AEgBfALgAAEVYuAAALxu5AAAACj5ZuAAARVi4AAQvG7kABAAKPlm7AAcAAQAIAAQruwAQAAEAAgAEK7gAEBC4AAzQuAAML7kACwAB9LgAABC5AA4AAfS6ABEACAAHERI5MDEhIycjByMTIRUjFzMVIxczLwEHAiDWHKRoKf8BHOQYwbwetfcbdMTEAdwhsCHJw9zc//8AF/91AXsB4wImACQAAAAGAHptAAAA//8ANgAAATkCaQImACYAAAAHAesBFACI//8ANgAAATkCaQImACYAAAAHAekBHgCI//8ANgAAATkCXgImACYAAAAHAM0ARQCI//8ANgAAATkCTQImACYAAAAHAGsARQCI//8AHQAAAHYCaQImACoAAAAHAesArgCI//8AHQAAAHYCaQImACoAAAAHAekAuACI//8ABQAAAKsCXgImACoAAAAHAM3/7gCI////+wAAALQCTQImACoAAAAHAGv/7QCIAAIABf/8AZIB4QAOAB4B27gAHy+4ACAvuAAA3LgAHxC4AATQuAAEL7gACNC4AAAQuQAPAAf0QQUAOgAPAEoADwACckEhAAkADwAZAA8AKQAPADkADwBJAA8AWQAPAGkADwB5AA8AiQAPAJkADwCpAA8AuQAPAMkADwDZAA8A6QAPAPkADwAQXUEhAAkADwAZAA8AKQAPADkADwBJAA8AWQAPAGkADwB5AA8AiQAPAJkADwCpAA8AuQAPAMkADwDZAA8A6QAPAPkADwAQcUEHAAkADwAZAA8AKQAPAANyuAAEELkAGgAH9LgAFdAAuAAARVi4AAsvG7kACwASPlm4AABFWLgAAi8buQACAAo+WbsACAABAAUABCu4AAsQuQATAAH0QQUAOQATAEkAEwACckEhAAgAEwAYABMAKAATADgAEwBIABMAWAATAGgAEwB4ABMAiAATAJgAEwCoABMAuAATAMgAEwDYABMA6AATAPgAEwAQXUEhAAgAEwAYABMAKAATADgAEwBIABMAWAATAGgAEwB4ABMAiAATAJgAEwCoABMAuAATAMgAEwDYABMA6AATAPgAEwAQcUEHAAgAEwAYABMAKAATAANyuAAIELgAFtC4AAUQuAAY0LgAAhC5ABoAAfS4ABzQMDElFCMiJzUjNTM1NjMyFxYHNCcmIyIHFTMVIxUWMzI2AZLiHlwxMVwyWzk6JzIuSh9FqKgyLVFe+PwJ0CHfDD1AbF82MgjBIbEGcwAAAP//ADYAAAGDAkwCJgAvAAAABwHoAUUAiP//ABb/9gHQAmkCJgAwAAAABwHrAVcAiP//ABb/9gHQAmkCJgAwAAAABwHpAWEAiP//ABb/9gHQAl4CJgAwAAAABwDNAIkAiP//ABb/9gHQAkwCJgAwAAAABwHoAVsAiP//ABb/9gHQAk0CJgAwAAAABwBrAIgAiAABAC8ACwFrAVEACwATALgAAC+4AAIvuAAGL7gACC8wMSUnByc3JzcXNxcHFwFRhIQahIQahIQahIQLiooYi4sYiooYi4sAAAADABb/4wHQAe0AFwAhACsDHbgALC+4AC0vuAAA3LgALBC4AAzQuAAML7oABwAMAAAREjm6ABMADAAAERI5uQAdAAf0QSEABgAdABYAHQAmAB0ANgAdAEYAHQBWAB0AZgAdAHYAHQCGAB0AlgAdAKYAHQC2AB0AxgAdANYAHQDmAB0A9gAdABBdQSEABgAdABYAHQAmAB0ANgAdAEYAHQBWAB0AZgAdAHYAHQCGAB0AlgAdAKYAHQC2AB0AxgAdANYAHQDmAB0A9gAdABBxQQcABgAdABYAHQAmAB0AA3JBBQA1AB0ARQAdAAJyuAAAELkAIgAH9EEFADoAIgBKACIAAnJBIQAJACIAGQAiACkAIgA5ACIASQAiAFkAIgBpACIAeQAiAIkAIgCZACIAqQAiALkAIgDJACIA2QAiAOkAIgD5ACIAEF1BIQAJACIAGQAiACkAIgA5ACIASQAiAFkAIgBpACIAeQAiAIkAIgCZACIAqQAiALkAIgDJACIA2QAiAOkAIgD5ACIAEHFBBwAJACIAGQAiACkAIgADcgC4AAYvuAASL7gAAEVYuAAPLxu5AA8AEj5ZuAAARVi4AAMvG7kAAwAKPlm4AA8QuQAaAAH0QQUAOQAaAEkAGgACckEhAAgAGgAYABoAKAAaADgAGgBIABoAWAAaAGgAGgB4ABoAiAAaAJgAGgCoABoAuAAaAMgAGgDYABoA6AAaAPgAGgAQXUEhAAgAGgAYABoAKAAaADgAGgBIABoAWAAaAGgAGgB4ABoAiAAaAJgAGgCoABoAuAAaAMgAGgDYABoA6AAaAPgAGgAQcUEHAAgAGgAYABoAKAAaAANyuAADELkAKQAB9EEhAAcAKQAXACkAJwApADcAKQBHACkAVwApAGcAKQB3ACkAhwApAJcAKQCnACkAtwApAMcAKQDXACkA5wApAPcAKQAQXUEhAAcAKQAXACkAJwApADcAKQBHACkAVwApAGcAKQB3ACkAhwApAJcAKQCnACkAtwApAMcAKQDXACkA5wApAPcAKQAQcUEHAAcAKQAXACkAJwApAANyQQUANgApAEYAKQACcjAxJRQGIyInByM3JicmNTQ2MzIXNzMHFhcWJyYjIgYVFBcWFyU0JyYnAxYzMjYB0HtiMykSJhoUEj17YjMqDikYExA+kCMqUGYzDA4BHzMLDbciKlBm7WuMEiU2DxRGa2uMFB0vDhJGWBJ9WFg/DwuxWD4OCv6OEX0AAP//ADb/9wGcAmkCJgA2AAAABwHrATwAiP//ADb/9wGcAmkCJgA2AAAABwHpAWEAiP//ADb/9wGcAl4CJgA2AAAABwDNAH8AiP//ADb/9wGcAk0CJgA2AAAABwBrAH4AiP//AAAAAAFuAmkCJgA6AAAABwHpATQAiAACADwAAAFfAdwADwAbAdW4ABwvuAAdL7gAANy4ABwQuAAH0LgABy+5AAYAB/S4AAnQugAKAAcAABESObgAABC5ABAABfRBBQA6ABAASgAQAAJyQSEACQAQABkAEAApABAAOQAQAEkAEABZABAAaQAQAHkAEACJABAAmQAQAKkAEAC5ABAAyQAQANkAEADpABAA+QAQABBdQSEACQAQABkAEAApABAAOQAQAEkAEABZABAAaQAQAHkAEACJABAAmQAQAKkAEAC5ABAAyQAQANkAEADpABAA+QAQABBxQQcACQAQABkAEAApABAAA3K4AAYQuAAW0AC4AAgvuAAARVi4AAwvG7kADAAQPlm4AABFWLgABi8buQAGAAo+WbsAGQABAAMABCu4AAwQuQAUAAH0QQUAOQAUAEkAFAACckEhAAgAFAAYABQAKAAUADgAFABIABQAWAAUAGgAFAB4ABQAiAAUAJgAFACoABQAuAAUAMgAFADYABQA6AAUAPgAFAAQXUEhAAgAFAAYABQAKAAUADgAFABIABQAWAAUAGgAFAB4ABQAiAAUAJgAFACoABQAuAAUAMgAFADYABQA6AAUAPgAFAAQcUEHAAgAFAAYABQAKAAUAANyugAKAAwAFBESOTAxARQGIyInFSMRMxU2MzIXFgc0JyYjIgcVFjMyNgFfZVcZKCYmKihDMTclKSM6JS0kH0hNAQZLTQh2AdxeCyAlQzUcFw7CCz0AAQAp/2wBZAHnACkCYLsAFwAHABwABCu7ACUABwAPAAQruwAiAAUAEgAEK7gAIhC5AAAABfS4ACIQuAAM0LgADC9BBQA6AA8ASgAPAAJyQSEACQAPABkADwApAA8AOQAPAEkADwBZAA8AaQAPAHkADwCJAA8AmQAPAKkADwC5AA8AyQAPANkADwDpAA8A+QAPABBdQSEACQAPABkADwApAA8AOQAPAEkADwBZAA8AaQAPAHkADwCJAA8AmQAPAKkADwC5AA8AyQAPANkADwDpAA8A+QAPABBxQQcACQAPABkADwApAA8AA3JBBQA6ABIASgASAAJyQSEACQASABkAEgApABIAOQASAEkAEgBZABIAaQASAHkAEgCJABIAmQASAKkAEgC5ABIAyQASANkAEgDpABIA+QASABBdQSEACQASABkAEgApABIAOQASAEkAEgBZABIAaQASAHkAEgCJABIAmQASAKkAEgC5ABIAyQASANkAEgDpABIA+QASABBxQQcACQASABkAEgApABIAA3K4ACIQuAAr3AC4ABkvuAAARVi4AAQvG7kABAAKPlm7AB8AAQAUAAQruAAEELkACQAB9EEhAAcACQAXAAkAJwAJADcACQBHAAkAVwAJAGcACQB3AAkAhwAJAJcACQCnAAkAtwAJAMcACQDXAAkA5wAJAPcACQAQXUEhAAcACQAXAAkAJwAJADcACQBHAAkAVwAJAGcACQB3AAkAhwAJAJcACQCnAAkAtwAJAMcACQDXAAkA5wAJAPcACQAQcUEHAAcACQAXAAkAJwAJAANyQQUANgAJAEYACQACcjAxJRQHBiMiJzcWMzI2NTQmNTQ2NTQjIhURFAcnNjURNDMyFhUUBhUUFhcWAWQeIToxJAwmJCgsZkRXZBYkE5IyQ0JCBxpmMR4gFCEUKR8iWSYbQRRSpP6rNigKJy0BZrc/NSg2FxE6CiMAAP//ABr/9wEwAeECJgBCAAAABwHrARAAAP//ABr/9wEwAeECJgBCAAAABwHpARoAAP//ABr/9wEwAdYCJgBCAAAABgDNQgAAAP//ABr/9wEwAcQCJgBCAAAABwHoARQAAP//ABr/9wEwAcUCJgBCAAAABgBrQQAAAP//ABr/9wEwAgMCJgBCAAAABgDRFgAAAAADABr/9wI5AVsAIgAsADUC47gANi+4ADcvuAAe3LkAJAAH9LoABQAeACQREjm4ADYQuAAK0LgACi+4ACQQuAAM0LgADC+4ACQQuAAO0LoAGQAeACQREjm4AAoQuQAmAAf0QSEABgAmABYAJgAmACYANgAmAEYAJgBWACYAZgAmAHYAJgCGACYAlgAmAKYAJgC2ACYAxgAmANYAJgDmACYA9gAmABBdQSEABgAmABYAJgAmACYANgAmAEYAJgBWACYAZgAmAHYAJgCGACYAlgAmAKYAJgC2ACYAxgAmANYAJgDmACYA9gAmABBxQQcABgAmABYAJgAmACYAA3JBBQA1ACYARQAmAAJyuAAeELgALdC4AC0vALgAAEVYuAAXLxu5ABcADj5ZuAAARVi4ABsvG7kAGwAOPlm4AABFWLgAAy8buQADAAo+WbgAAEVYuAAHLxu5AAcACj5ZuwANAAEAJAAEK7oAAAADABcREjm6AAUAAwAXERI5uAAXELkAEgAB9EEFADkAEgBJABIAAnJBIQAIABIAGAASACgAEgA4ABIASAASAFgAEgBoABIAeAASAIgAEgCYABIAqAASALgAEgDIABIA2AASAOgAEgD4ABIAEF1BIQAIABIAGAASACgAEgA4ABIASAASAFgAEgBoABIAeAASAIgAEgCYABIAqAASALgAEgDIABIA2AASAOgAEgD4ABIAEHFBBwAIABIAGAASACgAEgADcroAGQADABcREjm4AAMQuQAhAAH0QSEABwAhABcAIQAnACEANwAhAEcAIQBXACEAZwAhAHcAIQCHACEAlwAhAKcAIQC3ACEAxwAhANcAIQDnACEA9wAhABBdQSEABwAhABcAIQAnACEANwAhAEcAIQBXACEAZwAhAHcAIQCHACEAlwAhAKcAIQC3ACEAxwAhANcAIQDnACEA9wAhABBxQQcABwAhABcAIQAnACEAA3JBBQA2ACEARgAhAAJyuAAp0LgAEhC4ADLQMDElFwYjIicGIyImNTQ7ATU0JyYjIgcnNjMyFzYzMhchHgEzMic1IhUUFjMyNzY3MyYnJiMiBwYCJgM6RGcxHHEsQN0GDxc3I0kFODxcGzBdjwP+6gJNPTzuuigeLB8pKO8BFh49NyMcMCEYV1cyLH8GIRkoFyQSTEyzREt2I1YhIxcfeSkgLCggAAAA//8AG/+CATgBWwImAEQAAAAOAHpRADma//8AG//3AVcB4QImAEYAAAAHAesBHwAA//8AG//3AVcB4QImAEYAAAAHAekBKQAA//8AG//3AVcB1gImAEYAAAAGAM1RAAAA//8AG//3AVcBxQImAEYAAAAGAGtQAAAA//8AGwAAAHQB4QImAMIAAAAHAesArAAA//8AGwAAAHQB4QImAMIAAAAHAekAtgAA//8AAwAAAKkB1gImAMIAAAAGAM3sAAAA////+QAAALIBxQImAMIAAAAGAGvrAAAAAAIAJv/0AUIB4AAeACoCj7gAKy+4ACwvuAAA3LkAHwAH9EEFADoAHwBKAB8AAnJBIQAJAB8AGQAfACkAHwA5AB8ASQAfAFkAHwBpAB8AeQAfAIkAHwCZAB8AqQAfALkAHwDJAB8A2QAfAOkAHwD5AB8AEF1BIQAJAB8AGQAfACkAHwA5AB8ASQAfAFkAHwBpAB8AeQAfAIkAHwCZAB8AqQAfALkAHwDJAB8A2QAfAOkAHwD5AB8AEHFBBwAJAB8AGQAfACkAHwADcrgAAtC4AAIvuAArELgAB9C4AAcvugAOAAcAABESObkAJQAH9EEhAAYAJQAWACUAJgAlADYAJQBGACUAVgAlAGYAJQB2ACUAhgAlAJYAJQCmACUAtgAlAMYAJQDWACUA5gAlAPYAJQAQXUEhAAYAJQAWACUAJgAlADYAJQBGACUAVgAlAGYAJQB2ACUAhgAlAJYAJQCmACUAtgAlAMYAJQDWACUA5gAlAPYAJQAQcUEHAAYAJQAWACUAJgAlAANyQQUANQAlAEUAJQACcrgAEtC4ABIvuAAfELgAGtC4ABovALgAAEVYuAAWLxu5ABYAEj5ZuAAARVi4AAQvG7kABAAKPlm7AAoAAQAiAAQrugAOAAQAFhESOboAEwAEABYREjm4AAQQuQAoAAH0QSEABwAoABcAKAAnACgANwAoAEcAKABXACgAZwAoAHcAKACHACgAlwAoAKcAKAC3ACgAxwAoANcAKADnACgA9wAoABBdQSEABwAoABcAKAAnACgANwAoAEcAKABXACgAZwAoAHcAKACHACgAlwAoAKcAKAC3ACgAxwAoANcAKADnACgA9wAoABBxQQcABwAoABcAKAAnACgAA3JBBQA2ACgARgAoAAJyMDElFAcGIyImNTQ2MzIXFhcmJwcnNyYnNxYXNxcHFhcWBzQmIyIGFRQWMzI2AUIkKUc/SUo7KiAXBRc9VxFOLTMDRzdLEUMQDkcoPCsvNjUwKzyjSTA2WEE/WhQQDk46NxsyIg8dDisxGywPElqJMkZGMjFGRgD//wAtAAABUgHEAiYATwAAAAcB6AErAAD//wAc//YBcgHhAiYAUAAAAAcB6wErAAD//wAc//YBcgHhAiYAUAAAAAcB6QE1AAD//wAc//YBcgHWAiYAUAAAAAYAzV0AAAD//wAc//YBcgHEAiYAUAAAAAcB6AEvAAD//wAc//YBcgHFAiYAUAAAAAYAa1wAAAAAAwAmABkBdQFQAAsAFwAbAOO7AAwABwASAAQruAAMELgAANC4AAAvQQUAOgASAEoAEgACckEhAAkAEgAZABIAKQASADkAEgBJABIAWQASAGkAEgB5ABIAiQASAJkAEgCpABIAuQASAMkAEgDZABIA6QASAPkAEgAQXUEhAAkAEgAZABIAKQASADkAEgBJABIAWQASAGkAEgB5ABIAiQASAJkAEgCpABIAuQASAMkAEgDZABIA6QASAPkAEgAQcUEHAAkAEgAZABIAKQASAANyuAASELgABtAAugAVAA8AAyu6AAkAAwADK7sAGwABABgABCswMRMUBiMiJjU+ATMyFgMUBiMiJjU0NjMyFjchNSHvEg4PEgESDg4SARIODxESDw4Rh/6xAU8BLg4VFQ4OFBT+/w4UFA4OFRVcIQAAAAADABz/4wFyAX8AEwAbACMDLbgAJC+4ACUvuAAA3LgAJBC4AArQuAAKL7kAIgAH9EEhAAYAIgAWACIAJgAiADYAIgBGACIAVgAiAGYAIgB2ACIAhgAiAJYAIgCmACIAtgAiAMYAIgDWACIA5gAiAPYAIgAQXUEhAAYAIgAWACIAJgAiADYAIgBGACIAVgAiAGYAIgB2ACIAhgAiAJYAIgCmACIAtgAiAMYAIgDWACIA5gAiAPYAIgAQcUEHAAYAIgAWACIAJgAiAANyQQUANQAiAEUAIgACcroABwAKACIREjm4AAAQuQAUAAf0QQUAOgAUAEoAFAACckEhAAkAFAAZABQAKQAUADkAFABJABQAWQAUAGkAFAB5ABQAiQAUAJkAFACpABQAuQAUAMkAFADZABQA6QAUAPkAFAAQXUEhAAkAFAAZABQAKQAUADkAFABJABQAWQAUAGkAFAB5ABQAiQAUAJkAFACpABQAuQAUAMkAFADZABQA6QAUAPkAFAAQcUEHAAkAFAAZABQAKQAUAANyugARAAAAFBESOboAHAAKAAAREjkAuAAGL7gAEC+4AABFWLgADS8buQANAA4+WbgAAEVYuAADLxu5AAMACj5ZuQAZAAH0QSEABwAZABcAGQAnABkANwAZAEcAGQBXABkAZwAZAHcAGQCHABkAlwAZAKcAGQC3ABkAxwAZANcAGQDnABkA9wAZABBdQSEABwAZABcAGQAnABkANwAZAEcAGQBXABkAZwAZAHcAGQCHABkAlwAZAKcAGQC3ABkAxwAZANcAGQDnABkA9wAZABBxQQcABwAZABcAGQAnABkAA3JBBQA2ABkARgAZAAJyugAcAAYAEBESObgADRC5AB8AAfRBBQA5AB8ASQAfAAJyQSEACAAfABgAHwAoAB8AOAAfAEgAHwBYAB8AaAAfAHgAHwCIAB8AmAAfAKgAHwC4AB8AyAAfANgAHwDoAB8A+AAfABBdQSEACAAfABgAHwAoAB8AOAAfAEgAHwBYAB8AaAAfAHgAHwCIAB8AmAAfAKgAHwC4AB8AyAAfANgAHwDoAB8A+AAfABBxQQcACAAfABgAHwAoAB8AA3IwMSUUBiMiJwcjNyY1NDYzMhc3MwcWBzQnBxYzMjYHNyYjIgYVFAFyXk0sKBgoJDteTSQlHysrQyYwlh0kOkvilBkeOkupS2gUJzszWEtnDzNFM15HK/MRVC7xDFM+Qf//ADT/9wFjAeECJgBWAAAABwHrAScAAP//ADT/9wFjAeECJgBWAAAABwHpATEAAP//ADT/9wFjAdYCJgBWAAAABgDNWQAAAP//ADT/9wFjAcUCJgBWAAAABgBrWAAAAP//AAP/ZAFOAeECJgBaAAAABwHpARcAAAACAD3/dAGRAdYAEAAgAp+4ACEvuAAiL7gAANy4ACEQuAAI0LgACC+5AAcAB/S4AArQugALAAgAABESObgAABC5ABEABfRBBQA6ABEASgARAAJyQSEACQARABkAEQApABEAOQARAEkAEQBZABEAaQARAHkAEQCJABEAmQARAKkAEQC5ABEAyQARANkAEQDpABEA+QARABBdQSEACQARABkAEQApABEAOQARAEkAEQBZABEAaQARAHkAEQCJABEAmQARAKkAEQC5ABEAyQARANkAEQDpABEA+QARABBxQQcACQARABkAEQApABEAA3K4AA/QuAAPL7gABxC4ABjQuAAHELgAG9C4ABsvALgABy+4AAkvuAAARVi4AA0vG7kADQAOPlm4AABFWLgABC8buQAEAAo+WboABgAHAAkREjm6AAsABwAJERI5uAANELkAFAAB9EEFADkAFABJABQAAnJBIQAIABQAGAAUACgAFAA4ABQASAAUAFgAFABoABQAeAAUAIgAFACYABQAqAAUALgAFADIABQA2AAUAOgAFAD4ABQAEF1BIQAIABQAGAAUACgAFAA4ABQASAAUAFgAFABoABQAeAAUAIgAFACYABQAqAAUALgAFADIABQA2AAUAOgAFAD4ABQAEHFBBwAIABQAGAAUACgAFAADcrgABBC5AB4AAfRBIQAHAB4AFwAeACcAHgA3AB4ARwAeAFcAHgBnAB4AdwAeAIcAHgCXAB4ApwAeALcAHgDHAB4A1wAeAOcAHgD3AB4AEF1BIQAHAB4AFwAeACcAHgA3AB4ARwAeAFcAHgBnAB4AdwAeAIcAHgCXAB4ApwAeALcAHgDHAB4A1wAeAOcAHgD3AB4AEHFBBwAHAB4AFwAeACcAHgADckEFADYAHgBGAB4AAnIwMSUUBwYjIicVIxEzFTYzMhcWBzQmIyIHBh0BFBceATMyNgGRNDBKUi4mJjNYSC8sJUk8WyEIBQ9DLDtLsFczLz7BAmLARTMwST1QUxQUOwoUIi5QAAD//wAD/2QBTgHFAiYAWgAAAAYAaz4AAAAAAQA0AAAAWgFUAAMAL7sAAAAHAAEABCsAuAAARVi4AAIvG7kAAgAOPlm4AABFWLgAAC8buQAAAAo+WTAxMyMRM1omJgFUAAAAAQASAAABTQHcAA0AVrsADAAHAAEABCu4AAEQuAAF0LgADBC4AAfQALgABi+4AABFWLgAAC8buQAAAAo+WboAAgAAAAYREjm6AAgAAAAGERI5ugAJAAAABhESObkADAAB9DAxKQE1Byc3NTMVNxUHFTMBTf7vIQkqJ9nZ6sIKHw3460UlQq4AAAEAEv/5AL4B+QARAFa7AAMABwALAAQruAALELgADtC4AAMQuAAQ0AC4AA8vuAAARVi4AAgvG7kACAAKPlm6AAAACAAPERI5uQAHAAH0ugALAAgADxESOboAEQAIAA8REjkwMRMVBxUUFxYXByY9AQcnNxEzEbVSDRM7BH4hCSonAQwjGxRKIDMCIgasFwofDQEV/vgAAAAAAgAW//YCoQHkABYAJAIEuAAlL7gAJi+4ABbcuQACAAf0uAAlELgACNC4AAgvuAACELgADdC4ABYQuAAR0LgAAhC4ABfQuAAIELkAHwAH9EEhAAYAHwAWAB8AJgAfADYAHwBGAB8AVgAfAGYAHwB2AB8AhgAfAJYAHwCmAB8AtgAfAMYAHwDWAB8A5gAfAPYAHwAQXUEhAAYAHwAWAB8AJgAfADYAHwBGAB8AVgAfAGYAHwB2AB8AhgAfAJYAHwCmAB8AtgAfAMYAHwDWAB8A5gAfAPYAHwAQcUEHAAYAHwAWAB8AJgAfAANyQQUANQAfAEUAHwACcgC4AABFWLgACy8buQALABI+WbgAAEVYuAABLxu5AAEACj5ZuAAARVi4AAUvG7kABQAKPlm7AA8AAQAQAAQruwATAAEAFAAEK7oAAwAFAAsREjm6AA0ABQALERI5uAAQELgAHNC4ABwvuAAFELkAIgAB9EEhAAcAIgAXACIAJwAiADcAIgBHACIAVwAiAGcAIgB3ACIAhwAiAJcAIgCnACIAtwAiAMcAIgDXACIA5wAiAPcAIgAQXUEhAAcAIgAXACIAJwAiADcAIgBHACIAVwAiAGcAIgB3ACIAhwAiAJcAIgCnACIAtwAiAMcAIgDXACIA5wAiAPcAIgAQcUEHAAcAIgAXACIAJwAiAANyQQUANgAiAEYAIgACcjAxJRUhNQYjIiY1NDYzMhc1IRUjFTMVIxUnNSYnJiMiBhUUFjMyNgKh/v0/bGJ7e2JsPwED3MTEJwcyNT1QZmZQOVshIUpUjGtrjFRMIa8hynCvMSgpfVhYfUIAAAAAAwAc//YCiAFbABgAJAArAtu7AB8ABwAKAAQruwAUAAcAGQAEK7sAEwAFACUABCu6AAAAJQATERI5ugAFABkAFBESOboADwAZABQREjlBIQAGAB8AFgAfACYAHwA2AB8ARgAfAFYAHwBmAB8AdgAfAIYAHwCWAB8ApgAfALYAHwDGAB8A1gAfAOYAHwD2AB8AEF1BIQAGAB8AFgAfACYAHwA2AB8ARgAfAFYAHwBmAB8AdgAfAIYAHwCWAB8ApgAfALYAHwDGAB8A1gAfAOYAHwD2AB8AEHFBBwAGAB8AFgAfACYAHwADckEFADUAHwBFAB8AAnK4ABQQuAAr0LgAKy+4ABMQuAAt3AC4AABFWLgADS8buQANAA4+WbgAAEVYuAARLxu5ABEADj5ZuAAARVi4AAMvG7kAAwAKPlm4AABFWLgABy8buQAHAAo+WbsAJQABABMABCu6AAAABwANERI5ugAFAAcADRESOboADwAHAA0REjm4AAMQuQAXAAH0QSEABwAXABcAFwAnABcANwAXAEcAFwBXABcAZwAXAHcAFwCHABcAlwAXAKcAFwC3ABcAxwAXANcAFwDnABcA9wAXABBdQSEABwAXABcAFwAnABcANwAXAEcAFwBXABcAZwAXAHcAFwCHABcAlwAXAKcAFwC3ABcAxwAXANcAFwDnABcA9wAXABBxQQcABwAXABcAFwAnABcAA3JBBQA2ABcARgAXAAJyuAANELkAHAAB9EEFADkAHABJABwAAnJBIQAIABwAGAAcACgAHAA4ABwASAAcAFgAHABoABwAeAAcAIgAHACYABwAqAAcALgAHADIABwA2AAcAOgAHAD4ABwAEF1BIQAIABwAGAAcACgAHAA4ABwASAAcAFgAHABoABwAeAAcAIgAHACYABwAqAAcALgAHADIABwA2AAcAOgAHAD4ABwAEHFBBwAIABwAGAAcACgAHAADcrgAFxC4ACLQuAAcELgAKNAwMSUXBiMiJwYjIiY1NDYzMhc2MzIXIRQWMzInNiYjIgYVFBYzMjYlLgEjIgYHAnUDOkRuLy1pTV5eTWwsK2yPA/7qTj477QFLOzpLSzo5SwEYAj0zMUQIMCEYWltoS0tnXV2zR0iQPVRTPj5UU10zQkE0AAD//wAb//cBQAJWAiYANAAAAAcAzgBGAIj//wAd//cA+AHOAiYAVAAAAAYAziMAAAD//wAHAAABdQJKACYAOgcAAAcAawBVAIX//wAWAAABmAJWAiYAOwAAAAcAzgBqAIj//wAPAAABNQHOAiYAWwAAAAYAzjYAAAAAAf/v/7gBmQHOABsAMQC7ABEAAQAMAAQruwAaAAEAAwAEK7sABwABAAgABCu4AAgQuAAU0LgABxC4ABbQMDEBByYjIg8BMwcjBwYjIic3FjMyPwEjNzM3NjMyAZkRExxOHQZiBmIiI3gmEBETHE4cIjkGOgYldiYBvhwLfxofnaAQHAt/nR8aoAAAAAABABcBiAC9AdYABgApALgAAC+4AABFWLgAAS8buQABABA+WbgAAEVYuAAELxu5AAQAED5ZMDETFyMnByM3eEUlLi4lRQHWTjQ0TgAAAQAXAYAAvQHOAAYADwC4AAAvuAACL7gABS8wMRMjJzMXNzN4HEUlLi4lAYBONDQAAQA8AYEA7wHFABEAHQC6AAkABAADK7gACRC4AADQuAAEELkADQAB9DAxEwYHBiMiJyYnMxYXFjMyNzY37wUTGicnGxIGIwQHEBwcDwgEAcUbERgYERsLCBISCAsAAAAAAQB1AfsAuQI/AAsAvbsAAAAHAAYABCtBIQAGAAAAFgAAACYAAAA2AAAARgAAAFYAAABmAAAAdgAAAIYAAACWAAAApgAAALYAAADGAAAA1gAAAOYAAAD2AAAAEF1BIQAGAAAAFgAAACYAAAA2AAAARgAAAFYAAABmAAAAdgAAAIYAAACWAAAApgAAALYAAADGAAAA1gAAAOYAAAD2AAAAEHFBBwAGAAAAFgAAACYAAAADckEFADUAAABFAAAAAnIAugAJAAMAAyswMRMUBiMiJjU0NjMyFrkUDw4TEw4PFAIcDhMTDg4VFQAAAAACAE0BcADfAgMACwAXAky4ABgvuAAZL7gAANy4ABgQuAAG0LgABi+4AAAQuQAMAAb0QQUAOgAMAEoADAACckEhAAkADAAZAAwAKQAMADkADABJAAwAWQAMAGkADAB5AAwAiQAMAJkADACpAAwAuQAMAMkADADZAAwA6QAMAPkADAAQXUEhAAkADAAZAAwAKQAMADkADABJAAwAWQAMAGkADAB5AAwAiQAMAJkADACpAAwAuQAMAMkADADZAAwA6QAMAPkADAAQcUEHAAkADAAZAAwAKQAMAANyuAAGELkAEgAG9EEhAAYAEgAWABIAJgASADYAEgBGABIAVgASAGYAEgB2ABIAhgASAJYAEgCmABIAtgASAMYAEgDWABIA5gASAPYAEgAQXUEhAAYAEgAWABIAJgASADYAEgBGABIAVgASAGYAEgB2ABIAhgASAJYAEgCmABIAtgASAMYAEgDWABIA5gASAPYAEgAQcUEHAAYAEgAWABIAJgASAANyQQUANQASAEUAEgACcgC4AABFWLgAFS8buQAVABA+WbsACQABAA8ABCu4ABUQuQADAAL0QQUAOQADAEkAAwACckEhAAgAAwAYAAMAKAADADgAAwBIAAMAWAADAGgAAwB4AAMAiAADAJgAAwCoAAMAuAADAMgAAwDYAAMA6AADAPgAAwAQXUEhAAgAAwAYAAMAKAADADgAAwBIAAMAWAADAGgAAwB4AAMAiAADAJgAAwCoAAMAuAADAMgAAwDYAAMA6AADAPgAAwAQcUEHAAgAAwAYAAMAKAADAANyMDETFAYjIiY1NDYzMhYHNCYjIgYVFBYzMjbfKx8dKysdHysdGRMSGBgSExkBuB0rKx0fLCwgExkZExEYGAAAAQBQ/2IA2gAEABAAw7sADAAHAAYABCtBIQAGAAwAFgAMACYADAA2AAwARgAMAFYADABmAAwAdgAMAIYADACWAAwApgAMALYADADGAAwA1gAMAOYADAD2AAwAEF1BIQAGAAwAFgAMACYADAA2AAwARgAMAFYADABmAAwAdgAMAIYADACWAAwApgAMALYADADGAAwA1gAMAOYADAD2AAwAEHFBBwAGAAwAFgAMACYADAADckEFADUADABFAAwAAnIAuAAJL7sADgABAAMABCswMRcOASMiJjU0NjczBhUUFzI32hMgESQiCggoEyceHY8IBysdEi4aMR8rAw8AAQAXAYcAwQHJABcAX7oAAAAMAAMrALgAAC+4AA8vuAAARVi4AAMvG7kAAwAQPlm4AABFWLgACy8buQALABA+WbgAAxC5ABQAAvS4AAjQuAAIL7gAAxC4AAzQuAAML7gADxC4ABfQuAAXLzAxEw4BIyIuAiMiBgcjPgEzMh4CMzI2N8EBGRcJFRUTBwgKARkBExcKFBQUCwcMAQHJGiQJCgkSDhgoCQwJDxEAAAIAKgFKAOsB6wADAAcAGwC6AAcAAAADK7gABxC4AALQuAAAELgABdAwMRMjNzMHIzcznBs7L6YbOy8BSqGhoQABACQAAAFKAZAAGglTuAAbL7gAHC9BCwAPABwAHwAcAC8AHAA/ABwATwAcAAVduAAA3EEDAF8AAAABXUEDAC4AAAABcbkAAQAF9EEDAEkABAABckEFAIkABACZAAQAAnFBAwCqAAQAAXJBAwAOAAQAAXJBBQAvAAQAPwAEAAJyQQMAHAAEAAFyQQMAegAEAAFyQQUAiQAEAJkABAACckEDANgABAABXUEDAKgABAABXUEDADMABgABckEDABUABgABckEDAAcABgABckEDAPUABgABXUEFANQABgDkAAYAAnFBAwCjAAYAAXJBAwBBAAYAAXJBAwAqAAcAAXJBAwACAAcAAXJBAwAAABsAAV24ABsQuAAP0LgADy+5AA4ABfS6AAgADwAOERI5QQMARQAIAAFxQQMAFQAIAAFyQQMA5gAIAAFxQQMAiAAIAAFyQQMA+QAIAAFdQQMACQAIAAFxQQUAOwAIAEsACAACXUEDAHsACAABXUEDAF0ACAABXUEDACsACAABckEDAMoACAABXUEDANkACAABckEFACYACAA2AAgAAnFBAwDGAAgAAXFBAwA1AAgAAXJBAwBEAAgAAXJBAwDUAAgAAXFBAwBEAAkAAXJBAwBVAAkAAXFBAwDVAAkAAXFBAwBEAAkAAXFBAwAEAAkAAXJBAwDjAAkAAXG6AAoADwAAERI5QQMAJgAKAAFyQQMARwAKAAFxQQMASAAKAAFyQQUAawAKAHsACgACXUEHAD0ACgBNAAoAXQAKAANdQQUACgAKABoACgACcUEDAMgACgABcUEFAKYACgC2AAoAAnFBAwD2AAoAAV1BAwDlAAoAAV26ABIADwAAERI5QQMARwASAAFyQQMAyAASAAFdQQMAeQASAAFdQQMAKQASAAFyQQMAagASAAFxQQMAXAASAAFdQQMAagASAAFdQQUAOQASAEkAEgACXUEDAMkAEgABcUEDABgAEgABcUEDAOcAEgABcUEFAOUAEgD1ABIAAl1BAwB1ABIAAXJBAwCmABQAAXFBAwBnABQAAXFBAwC3ABQAAXFBAwArABQAAXJBAwA7ABQAAV1BAwB5ABQAAXJBBQAHABQAFwAUAAJxQQMA1gAUAAFdQQMA1gAUAAFxQQMA8gAUAAFdQQMAGgAVAAFxQQMARAAWAAFyQQMAJQAWAAFxQQMAFQAWAAFyQQMA1gAWAAFyQQMAegAWAAFxQQUAXAAWAGwAFgACcUEDAC8AFgABckEDABwAFgABcUEDAJoAFgABcUEFAGkAFgB5ABYAAl1BBQB2ABYAhgAWAAJyQQMAlQAWAAFyQQUA1AAWAOQAFgACcUEDADMAFgABckEDAKMAFgABckEDAMYAGAABXUEDALcAGAABXUEDAAkAGAABckEDAC8AGAABckEDAD4AGAABckEDAKkAGAABckEDALYAGAABcUEDAKUAGAABcUEDAMUAGAABcQC4AABFWLgAFy8buQAXABA+WbgAAEVYuAAALxu5AAAACj5ZuAAARVi4AA4vG7kADgAKPllBAwDVAAIAAXFBAwCyAAIAAXFBAwCpAAMAAXJBAwAtAAMAAXJBAwCJAAMAAXFBAwA4AAMAAXK4ABcQuQAFAAH0QQcAeAAFAIgABQCYAAUAA11BCwAIAAUAGAAFACgABQA4AAUASAAFAAVdQQMA5wAGAAFxugAIAAAAFxESOUEDAOcACAABcUEDABsACAABcUEDAMwACAABXUEDAEgACAABcUEDACcACAABcUEDAFYACAABXUEDAAQACQABckEDAEQACQABckEDAFUACQABcUEDAMYACQABcUEDANUACQABcUEDACQACQABcUEDAOIACQABcUEDADEACQABcboACgAAABcREjlBAwA0AAoAAXFBAwBVAAoAAXFBAwBlAAoAAV1BBQDGAAoA1gAKAAJxQQMARgAKAAFyQQMARwAKAAFxQQUAKQAKADkACgACckEDAHoACgABckEDAMsACgABXUEDAIkACgABckEFAKgACgC4AAoAAnFBBQDnAAoA9wAKAAJdQQMAdgAKAAFdQQMA5QAKAAFxQQMAJQAKAAFxQQMAZAAKAAFxQQMAUQAKAAFdQQUAMAAKAEAACgACXUEDAB0ACwABcUEDABsADAABcUEFACsADQA7AA0AAnJBAwBZAA0AAXFBAwDTABAAAXFBBQB0ABAAhAAQAAJxQQMAJQAQAAFxQQMAcwAQAAFdQQMAkwAQAAFxQQMAUQAQAAFdugASAAAAFxESOUEDAGQAEgABcUEFANUAEgDlABIAAnFBAwAlABIAAXFBAwBmABIAAV1BAwDHABIAAXFBAwAoABIAAXJBAwDIABIAAV1BAwA5ABIAAXJBAwAYABIAAXFBAwBHABIAAXJBAwBWABIAAXFBAwDmABIAAV1BAwB1ABIAAV1BAwBFABIAAXFBAwA0ABIAAXFBBwAxABIAQQASAFEAEgADXUEDAJYAEwABcroAFAAAABcREjlBAwCXABQAAXJBAwAoABQAAXJBAwC5ABQAAV1BAwDNABQAAV1BAwAfABQAAXFBAwCqABQAAV1BAwD5ABQAAV1BAwBXABQAAXFBAwCnABQAAXFBAwC2ABQAAXFBAwAlABUAAXJBAwBkABUAAXFBAwAmABYAAXJBAwC1ABkAAV1BAwDiABkAAXFBAwCxABkAAXFBAwDxABoAAV1BAwCzABoAAXFBAwCzABoAAV1BBQDEABoA1AAaAAJxQQMAFQAaAAFxQQMANAAaAAFdQQMA5AAaAAFdQQMAQwAaAAFdQQMAogAaAAFxQQMAUAAaAAFdQQMAwAAaAAFdMDEBQQMA2gAEAAFxQQMABAAGAAFxQQUApwAGALcABgACcUEDAKgABgABXUEDAGsABwABXUEDAKsABwABXUEDALwABwABXUEDAMkACAABXUEDAAkACAABckEDAGwACAABXUEFAKwACAC8AAgAAl1BAwCoAAoAAV1BAwBVABIAAV1BAwC2ABIAAV1BAwDHABIAAV1BAwBVABQAAV1BBQCqABQAugAUAAJdQQMAVgAVAAFdQQUAqQAVALkAFQACXUEDAFYAFgABXUEDAFwAHAABXUEDAC8AHAABcQBBAwA7AAgAAXJBAwCpAAoAAV1BAwCpABIAAV1BAwDKABIAAV1BAwA5ABMAAXJBAwA7ABQAAXIhIxE0JiMiBgcWFw4BHQEjNTQ3Jgc+ATMyFhUBSiQ9MCJADDsWGCQkNCErCFU6QU4BBTE6Jh4FJwUrGra1OxUQBThISD8AAAACAA//+AFCAZAAKAA0CnS7AC8ABgAYAAQruwASAAYAKQAEK7sAHgAGAAgABCu7AAAABQAmAAQrQQMA1gABAAFdQQMAEQABAAFyQQMAHAADAAFyQQUAyQADANkAAwACXUEFAJAAEgCgABIAAl1BBQAiABIAMgASAAJdQQMAQwASAAFdQQMAhgASAAFxQQMA/wASAAFxQQcAVgASAGYAEgB2ABIAA11BAwATABIAAV1BAwCCABIAAV1BAwAAABIAAV1BAwAAABIAAXG4ABIQuAAE0LgABC9BAwAAAAQAAV1BBwAJAAgAGQAIACkACAADXUEDAF8ACAABXUEFAGkACAB5AAgAAl1BAwCIAAgAAXFBAwD3AAgAAXJBAwB5AAoAAXFBAwBLAAoAAXFBBQDLAAoA2wAKAAJxQQMAGgAKAAFxQQMAWQAKAAFxQQcA2QAKAOkACgD5AAoAA3JBBwBfABgAbwAYAH8AGAADckEDAAAAGAABXboADQAYAAAREjlBAwAbAA0AAXFBAwBLAA0AAXFBAwCcAA0AAXFBAwANAA0AAXFBAwBvAA0AAXJBAwBvAA0AAXFBAwA/AA0AAXFBAwBdAA0AAXJBAwDNAA0AAXJBAwAsAA0AAXFBAwDrAA0AAV1BAwCGAA0AAXFBAwBCAA0AAXJBAwA0ABAAAXFBAwCVABAAAXFBAwBGABAAAXFBAwCqABAAAXJBAwD6ABAAAXJBAwBmABAAAXFBAwAlABAAAXFBAwC1ABAAAV1BBQDEABAA1AAQAAJdQQMA4gAQAAFdQQMABAAUAAFxQQMAdgAUAAFyQQMAtQAUAAFdQQMAxAAUAAFdQQUA0wAUAOMAFAACXUEDAOUAFQABXUEDANkAFgABXUEFALgAFgDIABYAAl1BAwDoABYAAV1BAwCZABoAAXFBAwBrABoAAXFBCQAKABoAGgAaACoAGgA6ABoABHFBAwBJABoAAXFBAwDGABoAAXJBAwDZABwAAXFBAwBWABwAAV1BAwBfAB4AAV24ABIQuQAiAAX0QQMAiQAiAAFxQQMAAAAiAAFdQQMAywAlAAFxQQMACgAlAAFyQQMA2QAlAAFxQQMARgApAAFdQQMA+AApAAFyQQMA/wApAAFxQQMABwApAAFdQQcAgAApAJAAKQCgACkAA11BAwAAACkAAXFBAwBmAC8AAV1BBwBfAC8AbwAvAH8ALwADckEDAMYALwABcUEFADYALwBGAC8AAl1BAwAQADUAAXFBAwDwADUAAV1BAwAAADUAAV1BAwAQADYAAXFBAwCPADYAAXFBBQAfADYALwA2AAJdQQMAjwA2AAFdQQMAXwA2AAFxQQMAXwA2AAFdQQMALwA2AAFxQQMADgA2AAFdQQMA4AA2AAFxQQMAAAA2AAFyALgAAEVYuAANLxu5AA0ADj5ZuAAARVi4ACcvG7kAJwAQPlm4AABFWLgAGy8buQAbABA+WbgAAEVYuAAPLxu5AA8ADj5ZuAAARVi4AAIvG7kAAgAKPlm7ADIAAgAVAAQrQQMAjAAAAAFdQQMAzAAAAAFdQQMA/QAAAAFxQQMAHAAAAAFyQQMArAAAAAFdQQMAmwAAAAFdQQMAugAAAAFdQQUA7AABAPwAAQACcUEDAAwAAQABckEDAO0AAwABcUEDAPwAAwABcUEDAAwAAwABckEDAOkAAwABXUEDALoABAABXUEDADwABAABckEDAP8ABAABcUEHAIwABACcAAQArAAEAANdQQMASwAEAAFyQQMAKQAEAAFyQQMAFwAEAAFyQQMARAAFAAFyQQMANgAFAAFyQQMAbQAFAAFyQQMA1QAFAAFxQQMApAAFAAFdQQMAIwAFAAFyQQMA8wAHAAFdQQMAJAAHAAFxQQMAlgAHAAFxQQMAOQAHAAFyQQMAZgAHAAFxQQUAtQAHAMUABwACcUEDAOQABwABcUEDABMABwABcUEDADEABwABcUEDAHoACAABckEDAGkACQABcUEFAEoACQBaAAkAAnFBAwCrAAkAAXFBAwDMAAkAAXFBAwCaAAkAAXFBAwAqAAkAAXFBAwDZAAkAAXFBAwC5AAkAAXG4ABsQuQALAAL0QRsAOAALAEgACwBYAAsAaAALAHgACwCIAAsAmAALAKgACwC4AAsAyAALANgACwDoAAsA+AALAA1dQQMACAALAAFxQQMASAALAAFxQQMAqAALAAFxQQMASQALAAFyQQMAiAALAAFxQQMAKAALAAFxQQUACAALABgACwACXUEDABgACwABckEDAFAADQABXUEDACAADQABXUEDAFAADwABXUEDACAADwABXUEDAKAADwABckEDANEAEQABXUEDAAwAEwABcUEFABAAFQAgABUAAnFBAwAQABUAAXJBAwA9ABUAAV1BAwBvABUAAXJBAwCvABUAAXJBAwDPABUAAXFBAwDwABUAAXJBAwBQABUAAXFBBQDAABUA0AAVAAJdQQMAwAAVAAFyQQMADAAXAAFxQQMA8AAXAAFyQQMABAAZAAFxQQMAVgAZAAFxQQMANQAZAAFxQQMAQgAZAAFxQQMAEgAZAAFxQQMAcgAdAAFdQQMAlAAdAAFdQQMA9wAdAAFxQQMApwAdAAFdQQMAhwAdAAFdQQMABQAdAAFyQQMAZAAdAAFdQQMAEgAdAAFyQQMA4AAdAAFxQQMAUAAeAAFdQQMA4AAfAAFxQQMA8gAfAAFdQQMAEwAfAAFxQQMA5AAfAAFdQQMA1QAfAAFdQQMAxgAfAAFdQQMA9QAfAAFyQQMAswAfAAFyQQMAIgAfAAFxQQMAoAAfAAFyQQMAMAAfAAFxQQMAwAAfAAFyQQMAqwAgAAFxQQMAUgAhAAFdQQMAtAAhAAFyQQMAOAAhAAFyQQMAkgAhAAFyQQMAoAAhAAFyQQMAgAAhAAFyQQUAOQAiAEkAIgACckEDAAwAIgABckEDAP8AIgABcUEDAO4AIgABcUEDABsAIgABckEDAMUAIgABcUEDANQAIgABcbgAAhC5ACQAAfRBAwDnACQAAXFBBwBnACQAdwAkAIcAJAADXUEDABcAJAABckELAAcAJAAXACQAJwAkADcAJABHACQABV1BCQCHACQAlwAkAKcAJAC3ACQABHFBAwBGACQAAXJBAwAKACYAAXJBAwDWACYAAXFBAwDFACYAAXG4AA8QuQAsAAL0QQMAmAAsAAFxQQMACAAsAAFdQQUAKAAsADgALAACcUEDAK8ALAABckEFAB8ALAAvACwAAl1BBQBPACwAXwAsAAJdQQUAbwAsAH8ALAACckEJAMgALADYACwA6AAsAPgALAAEcUEDAGgALAABXUEDABgALAABckEFAFgALABoACwAAnFBAwBXACwAAXJBAwAQADIAAXJBAwDwADIAAXJBAwB3ADIAAXJBAwBvADIAAXJBAwDPADIAAXFBAwCvADIAAXJBAwBQADIAAXFBBQDAADIA0AAyAAJdQQMAwAAyAAFyQQUAEAAyACAAMgACcTAxAUEDAPYAEAABXUEDAPYAFAABXUEDAOAANQABXUEDAOAANgABXQBBAwD1ABEAAV1BAwD5ABMAAV0lFCMiPQE0NjU0JiMiBzYzMhYVFAYjIiY1NDYzMhYVFAYdARQzMjURMwc0JiMiBhUUFjMyNgFCXFoyJxwsFwkOGiEhGh8hOTMsOTA3NyTTEg4OEhIODhJTW1tfGVYYFyMdBCEZGiMuISU5LCYdXhZdODgBOGkOEhIODhISAAIAD//4AUYBkQAuADoEHbsANQAFABoABCu7ABMABgAvAAQruwAkAAYACAAEK7sAAAAFACwABCtBIQAGABMAFgATACYAEwA2ABMARgATAFYAEwBmABMAdgATAIYAEwCWABMApgATALYAEwDGABMA1gATAOYAEwD2ABMAEHFBBwAGABMAFgATACYAEwADckEfAAYAEwAWABMAJgATADYAEwBGABMAVgATAGYAEwB2ABMAhgATAJYAEwCmABMAtgATAMYAEwDWABMA5gATAA9dQQUANQATAEUAEwACckEDAPAAEwABXbgAExC4AATQuAAEL0EDABAABAABXUEFADoACABKAAgAAnJBIQAJAAgAGQAIACkACAA5AAgASQAIAFkACABpAAgAeQAIAIkACACZAAgAqQAIALkACADJAAgA2QAIAOkACAD5AAgAEF1BIQAJAAgAGQAIACkACAA5AAgASQAIAFkACABpAAgAeQAIAIkACACZAAgAqQAIALkACADJAAgA2QAIAOkACAD5AAgAEHFBBwAJAAgAGQAIACkACAADcroADgAaAAAREjlBAwDwAC8AAV26AB8ALwATERI5uAATELkAKAAF9EEDABEAKAABXUERACYANQA2ADUARgA1AFYANQBmADUAdgA1AIYANQCWADUACHFBCwC2ADUAxgA1ANYANQDmADUA9gA1AAVxQQcABgA1ABYANQAmADUAA3JBAwAGADUAAXFBHwAGADUAFgA1ACYANQA2ADUARgA1AFYANQBmADUAdgA1AIYANQCWADUApgA1ALYANQDGADUA1gA1AOYANQAPXUEFADUANQBFADUAAnJBAwAQADsAAXFBAwBYADwAAXFBBwAPADwAHwA8AC8APAADXUEDAC8APAABcUEFAE8APABfADwAAl1BAwDQADwAAXFBAwAAADwAAXIAuAAKL324AAwvGLgAAEVYuAAeLxu5AB4AED5ZuAAARVi4ACAvG7kAIAAQPlm4AABFWLgALS8buQAtABA+WbgAAEVYuAACLxu5AAIACj5ZuwAQAAEAMgAEK7sAOAABABYABCtBAwCpAAoAAXFBAwCsAAwAAXFBAwDyADIAAV1BAwDwABAAAV26AA4AMgAQERI5QQMArwAWAAFxQQMAqgAZAAFdugAfAAIAHhESObgAAhC5ACoAAfRBIQAHACoAFwAqACcAKgA3ACoARwAqAFcAKgBnACoAdwAqAIcAKgCXACoApwAqALcAKgDHACoA1wAqAOcAKgD3ACoAEF1BIQAHACoAFwAqACcAKgA3ACoARwAqAFcAKgBnACoAdwAqAIcAKgCXACoApwAqALcAKgDHACoA1wAqAOcAKgD3ACoAEHFBBwAHACoAFwAqACcAKgADckEFADYAKgBGACoAAnJBAwCvADgAAXEwMSUUIyI9ATQ2NTQnBycGBzYzMhYVFAYjIicmNTQ3NjcXNxYXFhUUBh0BFDMyNREzBzQmIyIGFRQWMzI2AUZcWjwmIyQgCw4SHSIlGyISEBgaKRkbJBcUOTc3JNMSDg4SEg4OElNbWz8gYR80CCopFiQGJRwdJBwZJCslKQgjIwQeHCQfZB0/ODgBOI8OEhIODhISAAACACEAAAFRAZAAKAA0DCW4ABkvuwAIAAUAIgAEK7sAEwAGACkABCu7AAAABQABAAQrQQMAzwAAAAFdQQMAoAAAAAFdQQMAzwABAAFdQQMAoAABAAFdQQMA2QAEAAFxQQMAiQAEAAFdQQMA2gAEAAFdQQMA+gAEAAFxQQMAygAEAAFyQQMA/wAEAAFdQQMA7QAEAAFdQQMAGgAEAAFyQQUAigAEAJoABAACcUEDALoABAABXUEDACkABAABckEFAEkABABZAAQAAnFBAwBoAAQAAXFBAwDzAAYAAV1BAwDkAAYAAV1BAwDVAAYAAV1BAwB1AAYAAXFBAwCFAAYAAXJBBQBWAAYAZgAGAAJxQQMAFgAGAAFyQQMAtwAGAAFdQQMARgAGAAFyQQMAtgAGAAFxQQMAhQAGAAFdQQMA9QAGAAFxQQMARQAGAAFxQQMA1AAGAAFxQQMApAAGAAFdQQMAgwAGAAFxQQMAkgAGAAFxQQUABgAIABYACAACXUEJADYACABGAAgAVgAIAGYACAAEXUEDAKgACwABXbgACBC5AB0ABfRBAwADAB0AAV1BCQA5AB0ASQAdAFkAHQBpAB0ABF1BAwASAB0AAV1BAwAgAB0AAV26AAwACAAdERI5QQMA2QAMAAFxQQMAxwAMAAFxQQMAxgAMAAFyQQMAIwAZAAFxQQMANQAZAAFxQQMAtgAZAAFxQQMAFAAZAAFyQQMAogAZAAFxQQUAMQAZAEEAGQACcrgAGRC5AA0ABvRBAwATAA0AAXJBAwA2AA0AAXFBAwB8AA0AAV1BAwD9AA0AAV1BBwAPAA0AHwANAC8ADQADXUEDAB8ADQABcUEDAJwADQABXUEDAIsADQABXUEDANYADQABcUEDAEMADQABckEDAKIADQABcbgAIhC4AC/cQQMASwAvAAFdQQsAXwAvAG8ALwB/AC8AjwAvAJ8ALwAFckELAG8ALwB/AC8AjwAvAJ8ALwCvAC8ABV1BAwAvAC8AAV1BBQDgAC8A8AAvAAJxQQsAAAAvABAALwAgAC8AMAAvAEAALwAFckEDADAALwABcboAGAAiAC8REjlBAwAYABgAAXJBBQBqABgAegAYAAJdQQMAqQAYAAFxQQMAQwAYAAFyQQMAMgAYAAFyuAAYELkADgAG9EEDAOgADgABcUEDAEkADgABcUEFANkADgDpAA4AAl1BAwAZAA4AAXJBAwA6AA4AAV1BAwBaAA4AAXFBAwAaAA4AAXFBAwA7AA4AAXJBBwAPAA4AHwAOAC8ADgADXUEDAF8ADgABXUEFAJsADgCrAA4AAl1BAwC6AA4AAXFBAwA6AA4AAXFBAwD6AA4AAV1BAwCJAA4AAV1BAwApAA4AAXFBAwBJAA4AAV1BAwCXAA4AAXJBAwAFAA4AAXFBAwB1AA8AAXJBAwA6AA8AAXJBAwBLAA8AAXFBAwAsAA8AAXJBAwBLAA8AAXJBBQDrAA8A+wAPAAJdQQMA9gAPAAFxQQMAlAAPAAFyQQMAYgAPAAFyQQMAowAQAAFxQQMA5AARAAFdQQMA9QARAAFdQQMAFwARAAFxQQMANgARAAFxQQMAJQARAAFxQQMAAwARAAFxQQMAogARAAFxQQcAgAATAJAAEwCgABMAA11BAwBTABMAAV1BAwDPABMAAV1BAwBPABMAAXFBAwBCABMAAV1BAwAAABMAAV1BBQCQABMAoAATAAJxQQMA5QAVAAFdQQMA9gAVAAFdQQMAAwAVAAFxQQMAowAVAAFxQQMAtQAaAAFxQQMAJgAaAAFxQQMApwAaAAFdQQMA5gAaAAFxQQMApAAaAAFxQQMAQwAaAAFyuAAIELgAHtC4AB4vQQMAAwAeAAFdQQUAEAAeACAAHgACXUEDAIUAJAABckEDAIUAJAABcUEDAHYAJAABcUEFAOYAJAD2ACQAAl1BAwDVACQAAV1BAwCUACQAAXFBAwDCACQAAXJBAwDnACYAAXFBAwCaACYAAXFBAwDsACYAAV1BAwDdACYAAV1BAwDNACYAAXJBAwD7ACYAAV1BAwCJACYAAXFBAwB2ACYAAXFBAwDEACYAAXFBBQCQACkAoAApAAJxQQMARAApAAFdQQMAzwApAAFdQQMATwApAAFxQQcAgAApAJAAKQCgACkAA11BAwBQACkAAV1BBQAAACkAEAApAAJdQQUAkAA1AKAANQACXUEDAAAANgABcUEDAE8ANgABXUEFAB8ANgAvADYAAl1BAwDPADYAAV1BAwDwADYAAXFBAwDAADYAAXEAuAAARVi4ACUvG7kAJQAQPlm4AABFWLgAAC8buQAAAAo+WbgAAEVYuAAdLxu5AB0ACj5ZuwAQAAIALAAEK7sAMgACABYABCtBAwC6AAIAAXFBAwCrAAIAAXFBAwDZAAIAAV1BAwDFAAIAAXFBAwDaAAMAAV1BAwBLAAMAAXJBAwDpAAMAAV1BAwDJAAMAAXK4ACUQuQAFAAH0QQMAaAAFAAFdQQMA+AAFAAFdQQMACAAFAAFxQQMACAAFAAFyQQUAKAAFADgABQACcUEFAJgABQCoAAUAAl1BAwAYAAUAAV1BCQB4AAUAiAAFAJgABQCoAAUABHFBBQBZAAcAaQAHAAJxQQMAegAHAAFxQQUAiQAHAJkABwACcUEDAKkABwABXUEDADkABwABckEDADQACwABckEDAKwACwABckEDABMACwABckEDABIACwABXboADAAAACUREjlBAwC4AAwAAXFBAwAaAAwAAXFBAwDXAAwAAXFBAwCkAAwAAXFBAwCuAA0AAXJBAwArAA0AAXJBAwDzAA0AAXFBAwAjAA4AAXJBAwAnAA4AAXFBAwDyAA4AAXFBAwABAA4AAXJBAwAFAA8AAXFBAwBQABAAAV1BAwDQABAAAXFBAwChABAAAV1BBQACABAAEgAQAAJdQQMAMwAQAAFdQQMAkwAQAAFdQQMAYQAQAAFdQQcAkAAQAKAAEACwABAAA3JBAwDAABAAAV1BAwAgABAAAV1BAwBgABAAAXJBAwDmABIAAV1BAwAGABIAAXFBAwD0ABIAAV1BAwCqABQAAXFBAwD6ABQAAV1BAwAKABQAAXFBAwDpABQAAV1BAwAgABYAAV1BBQAQABYAIAAWAAJxQQMAAQAWAAFyQQMACAAWAAFxQQMAUAAWAAFxQQMAwAAWAAFdQQMA8AAWAAFxQQMAwAAWAAFyQQMAwAAyAAFyQQMAwAAyAAFdQQMA8AAyAAFxQQMAAAAyAAFyQQMAEAAyAAFdQQUAEAAyACAAMgACcUEDAFAAMgABcboAGAAWADIREjlBAwBhABgAAV1BAwCDABgAAV1BAwCUABgAAV1BAwC1ABgAAV1BAwAbABgAAXJBAwBPABgAAXJBAwA9ABgAAXJBAwAqABgAAXJBAwBVABgAAXJBAwCjABgAAV1BAwCiABgAAXFBAwAQABgAAV1BAwBwABgAAV1BAwBKABoAAXJBAwBLABoAAXFBAwDMABoAAXFBAwDOABoAAXJBAwArABoAAXJBAwDbABoAAXFBAwD6ABoAAXFBAwCpABoAAV1BAwDMABwAAXFBAwDKAB8AAV1BAwB5ACEAAXFBAwALACEAAXFBAwDaACEAAXFBAwC4ACEAAXFBAwDDACEAAXJBAwDGACMAAV1BAwB1ACMAAXFBAwAEACMAAXFBAwAZACcAAXFBAwD2ACcAAXFBAwDiACcAAXFBBQADACgAEwAoAAJxQQMANAAoAAFdQQUAwwAoANMAKAACXUEDAOIAKAABXUEDAMIAKAABcUEDAMAALAABXUEDAFAALAABXUEHAJAALACgACwAsAAsAANyQQUAkAAsAKAALAACXUEDABAALAABXUEDAGAALAABckEDANAALAABcTAxAUEDACgADwABXUEDANkADwABXUEDAMUAEQABXUEDANYAEQABXUEDANUAFQABXUEDAMYAFQABXUEDAH8ANgABXUEDAE8ANgABcQBBAwDCAA4AAV1BAwAlAA4AAV1BAwAiAA8AAV1BAwDFAA8AAV1BAwAgABAAAV1BAwAgABEAAV1BAwAlABIAAV1BBQDGABIA1gASAAJdQQMA2QAUAAFdQQMAygAUAAFdQQMAIQAYAAFdQQMAIQAZAAFdQQMAIQAaAAFdISMRNCYjIgYVFBcWFzY3NjMyFhUUBiMiJwYHBh0BIzU0JjU0NjMyFhUHNCYjIgYVFBYzMjYBUSRHLS5FCAsBCRYdLBkgIhkaFA4OESQgWEI9WXISDQ0SEg0NEgENMDM/LhYfLAY5KDQgGxkjGBUnMCVBXB1qHEFQQT8aDRISDQ0SEgAAAgAhAAABUQGSACYAMgJkuwAKAAcAIAAEK7sAEQAGACcABCu7AAAABQABAAQrQSEABgAKABYACgAmAAoANgAKAEYACgBWAAoAZgAKAHYACgCGAAoAlgAKAKYACgC2AAoAxgAKANYACgDmAAoA9gAKABBdQSEABgAKABYACgAmAAoANgAKAEYACgBWAAoAZgAKAHYACgCGAAoAlgAKAKYACgC2AAoAxgAKANYACgDmAAoA9gAKABBxQQcABgAKABYACgAmAAoAA3JBBQA1AAoARQAKAAJyuAAKELkAGwAF9LoADAAKABsREjlBAwCQABEAAV24AAoQuAAc0LgAHC9BEwAJACcAGQAnACkAJwA5ACcASQAnAFkAJwBpACcAeQAnAIkAJwAJXUEFADoAJwBKACcAAnJBDQCpACcAuQAnAMkAJwDZACcA6QAnAPkAJwAGXUEhAAkAJwAZACcAKQAnADkAJwBJACcAWQAnAGkAJwB5ACcAiQAnAJkAJwCpACcAuQAnAMkAJwDZACcA6QAnAPkAJwAQcUEHAAkAJwAZACcAKQAnAANyQQMAkAAnAAFduAAgELgALdxBAwCfAC0AAV1BAwCQADMAAV1BBQAfADQALwA0AAJdQQMATwA0AAFdQQMArwA0AAFdQQMAfwA0AAFdQQMA8AA0AAFxQQMAwAA0AAFxALgAAEVYuAAiLxu5ACIAED5ZuAAARVi4ACQvG7kAJAAQPlm4AABFWLgAAC8buQAAAAo+WbgAAEVYuAAbLxu5ABsACj5ZuwAOAAIAKgAEK7sAMAACABQABCu6AAwAAAAiERI5MDEBQQMATwA0AAFxISMRJicHJwYHBhUUFzYzMhYVFAYjIicGBwYdASM1NCY1NDcXNxYXBzQmIyIGFRQWMzI2AVEkAUIwNSARDRMbSxogIRggFA0MDSQibSwobgFyEg0NEhINDRIBGEUQNjcRIxoXIlWIIBoZIhcOJysmNlAfdB5zHjMzFmI6DRISDQ0SEgAAAAMAD//4AWABkQALAEIAThPXuAAML7gAQi+4AAYvuAA9L7gAQy98uAAxLxi4ABEvuAA6L3y4ABcvGLgAJS9BBQDQABEA4AARAAJdQQMAVAARAAFdQQMAQwARAAFdQQMAMAARAAFdQQcAgAARAJAAEQCgABEAA124ABEQuQAAAAb0QQUARQAAAFUAAAACXUEFAA8ABgAfAAYAAnJBAwBfAAYAAXJBBQB/AAYAjwAGAAJxQQMArwAGAAFyQQMAHwAMAAFxQQUAvwAMAM8ADAACXUEDAG8ADAABXUEDAIUADQABXUEDAKgADQABcUEFAMkADQDZAA0AAnFBBQCKAA0AmgANAAJxQQMA+wANAAFxQQMAXAANAAFxQQMAHQANAAFxQQMATQANAAFyQQMAvQANAAFxQQMA7AANAAFxQQMAHAANAAFyQQMAagANAAFdQQUAKQANADkADQACckEDAGkADQABcUEDAEcADQABXUEDAJMADQABXUEDADEADQABXUEDAEoADgABckEDAIkADwABcUEDAOkAEwABXUEDAKQAEwABXUEDAOQAFAABXUEDABoAFQABcbgABhC5ABcABvRBAwBXABcAAXJBAwAcABgAAXFBAwAMABkAAXJBAwA/ABkAAXJBAwDJABkAAV1BAwBSABkAAV1BAwBSAD0AAV24AD0QuQAcAAX0QQMAUAAdAAFdQQMArgA6AAFxQQMA7wA6AAFdQQMA/wA6AAFxQQMA3gA6AAFdQQMAIgA6AAFduAA6ELkAHwAG9EEDAFgAIQABcUEDACkAIQABckEDAOsAIQABcUEDAM4AIQABcUEDAN8AIQABcUEDAL8AIQABcUEDAL4AIQABXUEDAHsAIQABcUEDAOkAIQABXUEDAMgAIQABXUEDAEcAIQABckEDABcAIQABckEDAAgAIgABckEDAHkAIgABcUEDAHkAIgABckEDAMoAIgABXUEDANsAIgABXUEDALwAIgABcUEDAK0AIgABcUEDALwAIgABXUEFAMsAIgDbACIAAnFBAwB5ACIAAV1BAwDpACIAAXFBBQCIACIAmAAiAAJdQQMARwAiAAFyQQMARwAiAAFdQQMA5gAjAAFxQQMA1wAjAAFxQQMANwAjAAFxQQMAqAAjAAFxQQMAbQAjAAFdQQMA2QAjAAFdQQMA9wAjAAFxQQMAVwAjAAFxQQMAVgAjAAFdQQMAxgAjAAFxQQMABQAjAAFyQQMAqAAlAAFxQQMAWwAlAAFdQQMAnAAlAAFdQQMAHQAlAAFxQQUArgAlAL4AJQACXUEDAD8AJQABcUEDAI8AJQABXUEJAM8AJQDfACUA7wAlAP8AJQAEXUEDAA8AJQABcUEDAH4AJQABXUEDAF0AJQABckEDAGsAJQABckEDACoAJQABcUEDALcAJQABcUEDAOUAJQABcUEDAKgAJwABcUEDAAYAKAABcUEDACYAKAABcUEDAEQAKAABckEDAOMAKAABcUEDAEEAQwABXUEFAE8AQwBfAEMAAnFBAwBQAEMAAV1BAwBwAEMAAXK4AEMQuQAqAAb0QQMAgQAqAAFdQQMAZgAqAAFdQQMARwAqAAFxQQMAlAAqAAFdQQMAcAAqAAFdQQUAQAAqAFAAKgACXUEDABYALAABcUEDAAUALAABcUEDAB0ALgABcUEDAAsALgABcUEDAPgALgABXUENAAAAMQAQADEAIAAxADAAMQBAADEAUAAxAAZdQQMAMAAxAAFxQQMAVwA0AAFxQQMA2gA0AAFxQQMANQA0AAFdQQMAFQA0AAFdQQMA5AA1AAFxQQUAxQA1ANUANQACcUEDADYANQABXUEDAFYANQABcUEDAIcANQABXUEDAGkANQABcUEDAKcANQABcUEDALYANQABcUEDAKUANQABXUEDAPUANQABcUEDAAUANQABckEDAEIANQABckEDADEANQABckEDAPkANgABcUEFAGoANgB6ADYAAl1BAwDLADYAAXFBAwDNADYAAV1BAwCuADYAAXFBAwC8ADYAAXFBBQDaADYA6gA2AAJxQQMASQA2AAFxQQMAiQA2AAFdQQMAJgA2AAFyQQMASAA3AAFyQQMAOQA3AAFyQQMAWgA3AAFxQQMADAA3AAFyQQMA/QA3AAFxQQMAvwA3AAFdQQsArwA3AL8ANwDPADcA3wA3AO8ANwAFcUEDAG0ANwABXUEDAOwANwABXUEDAHsANwABXUEDACoANwABckEDADkANwABXUEDAJcANwABcUEDAKcANwABXUEDAMwAOAABXUEDAOoAOAABcUEFAL8AQgDPAEIAAl1BAwAfAEIAAXFBAwBvAEIAAV24AEIQuQBBAAX0uAAxELkASQAF9LgADBC4AFDcALgACS+4AEYvuABML7gAAy+4AC0vuAAnL7gAAEVYuABBLxu5AEEAED5ZuAAARVi4ADUvG7kANQAQPlm4AABFWLgANy8buQA3ABA+WbgAAEVYuAAULxu5ABQACj5ZuAAARVi4AAwvG7kADAAKPlm7AA4AAQA/AAQrQQkAcAADAIAAAwCQAAMAoAADAARdQQMA5QADAAFyQQMANwADAAFdQQMAOAADAAFyQQMAVQADAAFdQQMAYwADAAFdQQUAYAADAHAAAwACckEDABAAAwABcUEDAF4ACQABckELAB8ACQAvAAkAPwAJAE8ACQBfAAkABV1BBwB/AAkAjwAJAJ8ACQADXUEDAOwACQABckEDAGsACQABXUEDADYADwABckEDAFkADwABcUEDAOoADwABcUEDAPkADwABcUEFAHYADwCGAA8AAnFBAwAGAA8AAXJBAwDVAA8AAXFBAwAbABMAAXFBAwC6ABMAAV24AAkQuQAUAAH0QQMADgAUAAFdQQMAagAUAAFdQQMAugAVAAFdQQMAigAWAAFdQQMAFwAZAAFxQQMA5wAZAAFdQQMAeAAaAAFdQQMAyQAaAAFxQQMAuwAaAAFdQQMASQAaAAFdQQMA9gAaAAFdQQMAswAaAAFxQQMAlQAbAAFxQQMANgAbAAFyQQMAhgAbAAFxQQMAdwAbAAFxQQcA2AAbAOgAGwD4ABsAA3FBBQBZABsAaQAbAAJxQQMAOQAbAAFxQQMAOgAbAAFdQQMAKwAbAAFxQQMA6gAbAAFdQQUAyQAbANkAGwACXUEDAHgAGwABckEDAFgAGwABXUEFAAYAGwAWABsAAnJBAwCmABsAAV1BAwAlABsAAXJBAwBEABsAAXJBAwCkABsAAXFBAwBJABwAAXFBBQCGABwAlgAcAAJxQQMAVgAcAAFxQQMAxAAdAAFxQQMA5AAdAAFxQQMAGQAdAAFyQQMANQAdAAFxQQMAxAAdAAFdQQMA0gAdAAFxQQMAUgAdAAFxQQMA1AAeAAFxQQMAJQAeAAFxQQMA1AAeAAFdQQMAUwAeAAFxQQMA4AAeAAFdQQMA5QAhAAFxQQMAhwAhAAFxQQMAqAAhAAFdQQMAygAhAAFxQQMATAAhAAFyQQMAWAAhAAFxQQMACAAhAAFyQQMAdQAhAAFyQQMAxAAhAAFdQQMAYgAhAAFyQQMA4gAiAAFxQQMARQAiAAFdQQMAtgAiAAFdQQMA1gAiAAFxQQMANwAiAAFdQQMAxwAiAAFxQQUAeQAiAIkAIgACcUEFAIcAIgCXACIAAl1BAwAGACIAAXJBAwCmACIAAXFBAwA2ACIAAXJBAwC0ACIAAXFBAwBSACIAAV1BAwBwACIAAV1BAwA2ACMAAXFBAwAIACMAAXJBBQDYACMA6AAjAAJxQQMAKQAjAAFxQQMAKQAjAAFyQQMAGgAjAAFxQQMAygAjAAFxQQMAygAjAAFdQQMAqQAjAAFxQQMA+QAjAAFxQQMAWAAjAAFxQQMAhwAjAAFxQQMAogAjAAFdQQMAYgAjAAFyQQMA5QAlAAFxQQMA+AAlAAFdQQMAJQAlAAFyQQMAMgAlAAFyQQMAkAAnAAFxQQMAMAAnAAFyQQMAAQAnAAFyQQMApwAnAAFxQQMAGAAnAAFxQQMASAAnAAFyQQMASAAnAAFxQQUA2AAnAOgAJwACcUEDAMQAJwABXUEDABAAJwABckEDAMAAJwABcUEDAGAAJwABcUEDAPAAJwABcUEDAFYAKAABcUEDABUAKAABcUEDAFQAKQABcUEFANYAKQDmACkAAnFBAwAWACkAAXFBAwC2ACkAAV1BAwA1ACkAAXFBAwAEACkAAXFBAwAiACkAAXFBAwA6ACsAAXFBAwAcACsAAXFBAwDdACsAAXFBAwDsACsAAXFBAwArACsAAXFBAwAJACsAAXFBAwB4ACsAAXFBAwCbACwAAV1BAwB3AC0AAXFBAwDHAC0AAXFBAwAYAC0AAXFBAwBZAC0AAV1BAwBMAC0AAV1BAwD/AC0AAV1BAwDfAC0AAXFBAwBPAC0AAXJBAwCvAC0AAXFBBwCPAC0AnwAtAK8ALQADXUEDAO4ALQABcUEDADsALQABXUEDADgALQABcUEDAIgALQABcUEDAJcALQABcUEDAGAALQABcUEFAAAALQAQAC0AAnJBAwANAC8AAXFBAwAJADAAAXFBAwCmADIAAXFBAwAEADIAAXJBAwAbADMAAXFBAwAXADUAAXFBAwAyADYAAXJBAwBSADYAAV1BAwCjADYAAXFBAwBFADYAAXJBAwBmADYAAV1BAwD2ADYAAXFBAwCHADYAAV1BAwCmADYAAV1BAwA2ADYAAV1BAwDFADYAAXFBAwB0ADYAAV1BAwDTADYAAXFBAwACADYAAXJBAwDhADYAAXFBAwCwADYAAXFBAwAGADkAAXJBAwAzADkAAXJBAwDDADsAAV1BAwC1ADsAAV1BAwBpADsAAV1BAwDUADsAAV1BAwDgADsAAV1BAwBQADsAAXFBAwALADwAAXJBAwB3AD4AAXFBAwA5AD4AAXFBAwD5AD4AAXFBAwDqAD4AAXFBAwBZAD4AAXFBAwDIAD4AAXFBAwAGAD4AAXJBBQCGAD4AlgA+AAJxQQMAIgBAAAFyQQMAFABAAAFxQQMAdwBAAAFxQQMAigBAAAFdQQMAmQBAAAFdQQMAZgBAAAFxQQUAAwBAABMAQAACckEDAEIAQAABckEDADEAQAABckEFALAARgDAAEYAAl1BAwBgAEYAAXFBAwBQAEYAAXJBAwAzAEYAAV1BAwBFAEYAAV1BAwCVAEYAAV1BAwCBAEYAAXJBAwCQAEYAAXFBBQAAAEYAEABGAAJyQQMAcABGAAFdQQMAIABGAAFxQQMAMABMAAFyQQMAWABMAAFyQQMASgBMAAFdQQUAbwBMAH8ATAACckEJAF8ATABvAEwAfwBMAI8ATAAEXUEDAP8ATAABXUEDAA8ATAABcUEFAN8ATADvAEwAAnFBBQCvAEwAvwBMAAJdQQMALwBMAAFdQQMAngBMAAFdQQMAOQBMAAFdQQMAgwBMAAFyQQMA8ABMAAFxQQUAAABMABAATAACckEFAFAATABgAEwAAnEwMQFBAwCjAA0AAV1BAwBVAA0AAV1BAwDgABMAAV1BBQDGABMA1gATAAJdQQMA9gATAAFdQQUAyQAVANkAFQACXUEDAPkAFQABXUEDALkAGQABXUEDANkAGQABXUEDAPkAGQABXUEDAGgAGwABckEDAEoAHQABcUEDACgAIQABckEDAGkAIQABcUEDALoAIQABcUEDABwAIQABckEDAK8AIQABcUEDABgAIgABckEDAGkAIgABcUEDAEUAIwABcUEDABUAIwABckEDACYAIwABckEDAGoAIwABcUEDAOUAKAABXUEDANYAKAABXUEDAEYAKAABcUEDAPUAKQABXUEDAPUALAABXUEDANYALAABXUEDANkALgABXUEDAOsALgABXUEDAPwALgABXUEDAPkALwABXUEDAEIANQABcUEDACIANQABckEDABMANQABckEDADQANQABcUEDAGoANQABcUEDADYANgABcUEDABYANgABckEDAKgANgABcUEDAGkANgABcUEDAGgANwABcUEDAMkANwABcUEDALoANwABcUEDABoANwABckEDAEsANwABcUEDAKwANwABcUEDAKoAOAABcUEDAKoAOQABcQBBAwBIAA8AAXFBBQDJABIA2QASAAJdQQMA+QASAAFdQQMA6wASAAFdQQMACgATAAFxQQMACgAVAAFxQQMAyQAWAAFdQQUA6QAWAPkAFgACXUEDAAQAGAABcUEDAPYAGAABXUEDALcAGAABXUEDANcAGAABXUEDAAMAGQABcUEDAAQAGgABcUEDAGwAGgABckEDAGwAGwABckEDAEUAHAABcUEDALYAHAABcUEDALYAHQABXUEDALYAHQABcUEDADYAHQABckEDAEgAHQABcUEFAEIAHgBSAB4AAnFBAwC1AB4AAV1BAwCZACAAAXFBAwBoACEAAXFBAwCYACEAAXFBAwCpACEAAXFBBQApACEAOQAhAAJyQQMAGgAhAAFyQQMASwAhAAFxQQMARgAiAAFdQQMAagAiAAFxQQMASwAiAAFxQQMAmAAjAAFxQQMAKAAjAAFyQQMAaQAjAAFxQQMAOQAjAAFyQQMATAAjAAFxQQMAHAAjAAFyQQMA5QApAAFdQQMA1gApAAFdQQMA2QArAAFdQQMA6gArAAFdQQMAqAAtAAFdQQMA6gAwAAFdQQMA/AAwAAFdQQMASAAyAAFxQQMATQAzAAFxQQMAEwA2AAFyQQMAJQA2AAFyQQMApwA2AAFxQQMAVAA7AAFxQQMASQA+AAFxNzQmIyIGFRQWMzI2FyMmJxYVFAYjIiY1NDY7ATU0NjU0JwcnBgc2MzIWFRQGIyInJjU0NzY3FzceARUUBh0BFhcRMwc0JiMiBhUUFjMyNq8VDg4VFQ4OFbEkK08OJx0eJygdBDwmIyQgCw4SHSIlGyISEBgaKRkbJCs5WS8k7RIODhISDg4SPQ4VFQ4OFRUvUhEQFh0oKB0dJxEgYR80CCopFiQGJRwdJBwZJCslKQgjIwQ3Jx9kHQ8KQAFSjw4SEg4OEhIAAAACABAAAADuAZAAEQAdBNy4AB4vuAABL7kAAAAF9EEDAEcAAgABcUEDAJcAAgABXUEDAEcAAgABXUEDAKUAAgABcUEFALQAAgDEAAIAAnFBAwCkAAMAAXFBAwD3AAMAAV1BAwBaAAMAAXJBBQCGAAMAlgADAAJxQQUAswADAMMAAwACcUEDAHIAAwABcbgAARC4AATQQQMAyAAHAAFxQQMA/wAIAAFdQQMAiwAIAAFxQQMADgAJAAFxQQMAPwAeAAFxuAAeELgACtC4AAovQQMAIgAKAAFxQQMAjAAKAAFxQQMA3wAKAAFxQQMAvwAKAAFyQQMA7wAKAAFdQQUAnwAKAK8ACgACXUEHAG8ACgB/AAoAjwAKAANyQQMAXgAKAAFdQQMATAAKAAFdQQMAMAAKAAFxQQMAEAAKAAFxQQMA/QAMAAFdQQMADgAMAAFxQQMAiwAMAAFxQQMAugAMAAFdQQMA9wAOAAFdQQMAtQAOAAFdQQMAAgAOAAFxuAABELgAEtC4ABIvuAAKELkAGAAG9EEDAFgAGAABXUEDAEoAGAABXUEDAGcAGAABckEDACYAGAABcUEDAEgAGwABckEDAMcAGwABcbgAABC4AB/cALgAAEVYuAANLxu5AA0AED5ZuAAARVi4AAAvG7kAAAAKPlm7ABsAAQAHAAQrQQMAVwACAAFyQQMAJgACAAFdQQMAAgADAAFyQQMA0wADAAFxQQMApwADAAFxQQMAWgADAAFyQQMAqQADAAFdQQMAxAADAAFxQQMA4gADAAFxQQMA8QADAAFxQQkAEAADACAAAwAwAAMAQAADAARyugAEAAAADRESOUEDAEQABAABckEDAPMABAABcUEJAAMABAATAAQAIwAEADMABAAEckEDAOMABwABcUEDAE0ABwABckEDAA8ABwABXUEDAK8ABwABXUEDAK8ABwABcUEFAM8ABwDfAAcAAnFBAwDPAAcAAV1BAwCPAAcAAV1BAwD/AAcAAV1BAwAXAAcAAXJBAwAhAAcAAV1BAwCgAAcAAXJBAwAXABsAAXJBAwBNABsAAXJBAwDPABsAAV1BAwCvABsAAV1BAwD/ABsAAV1BBQDPABsA3wAbAAJxQQMAjwAbAAFdQQMArgAbAAFxQQMAZwAbAAFyQQMA4QAbAAFxQQMAoAAbAAFyugAFAAcAGxESOUEDAHcABQABXUEDAFYABQABXUEDAPoACQABXUEDALkACQABXUEDAPcACwABXUEDALYACwABXUEDALYAEAABXbgADRC5ABUAAfQwMQFBAwAwAAEAAV1BAwAFAAIAAV1BAwC1AAIAAV1BBQAXAAIAJwACAAJdQQMAtwADAAFdQQMAGAADAAFdQQMAOwADAAFdQQcAyQAIANkACADpAAgAA11BBwDJAAwA2QAMAOkADAADXUEHAMYADgDWAA4A5gAOAANdQQMA5gAPAAFdAEEFABMAAgAjAAIAAl1BAwAEAAIAAV1BAwC5AAIAAV1BAwAWAAMAAV1BAwAHAAMAAV1BAwAnAAMAAV1BAwA5AAMAAV1BAwC6AAMAAV1BBQAKAAQAGgAEAAJdQQMAKwAEAAFdQQcAyQAJANkACQDpAAkAA11BBwDGAAsA1gALAOYACwADXUEFAMYADwDWAA8AAl1BBwDGABAA1gAQAOYAEAADXTMjJzcXNQYjIiY1NDYzMhcWFSc0JiMiBhUUFjMyNu4kuhSmDhEbJyYcIBMQIRQODhQUDg4U0Be04AcnGh0mFRMbAg4UFA4OFBQAAAAAAgAY//cBNwGQACMALwwGuAAEL7gAAC+4ACMvuwAqAAYACgAEK7oAIwAkAAMrQQMAXwAAAAFxQQMA1QABAAFdQQMAxwABAAFdQQMApgABAAFdQQMA8gABAAFdQQMAEgABAAFxQQMALQACAAFyQQMAPAACAAFyQQMAqAADAAFxQQMA+gADAAFdQQUAygADANoAAwACcUEDABwAAwABckEDAA0AAwABckEDAB8AAwABcUEFAC8AAwA/AAMAAnJBAwBfAAMAAXFBAwBOAAMAAXJBAwDcAAMAAV1BAwDrAAMAAV1BBwB6AAMAigADAJoAAwADcUEDAKgAAwABXUEDAGgAAwABcUEDAMgAAwABXUEDALMABAABXUEFAGUABAB1AAQAAl1BAwDoAAQAAV1BAwA7AAQAAXJBAwAMAAQAAXJBAwBdAAQAAXFBAwAbAAQAAXJBAwDIAAQAAXFBAwCnAAQAAXFBAwCEAAQAAV1BAwDCAAQAAV1BAwAiAAQAAXFBBQDgACQA8AAkAAJdQQMAkgAkAAFyQQMAPwAkAAFxQQMADwAkAAFyQQMAcgAkAAFyQQMAwAAkAAFxQQcAkAAkAKAAJACwACQAA11BBQBgACQAcAAkAAJduAAkELgABdC4AAUvQQMAFwAFAAFyQQMAeQAFAAFxQQMAygAFAAFxQQMACgAFAAFyQQMA+wAFAAFdQQMAvAAFAAFxQQMAnQAFAAFyQQMAnAAFAAFdQQUA6wAFAPsABQACcUEFACsABQA7AAUAAnJBAwBKAAUAAXJBAwC6AAUAAV1BAwCoAAUAAV1BAwBVAAUAAV1BAwBDAAUAAV1BAwBBAAcAAV1BAwBQAAcAAV1BAwDqAAgAAV1BAwD5AAgAAV1BAwDYAAgAAV1BAwDwAAoAAXFBAwBRAAoAAV1BAwBAAAoAAV1BAwAgAAoAAXFBAwDJAAwAAV1BAwAdAAwAAXFBAwAPAAwAAXFBAwD5AAwAAV1BBQDYAAwA6AAMAAJdQQMAJAAMAAFxQQMA1AAOAAFdQQMABgAOAAFxQQMAFwAOAAFxQQMAJwAOAAFyQQMAJgAOAAFxQQMAxgAOAAFdQQMA8gAOAAFdQQMAwgAOAAFxQQMA5gAPAAFdQQMAswAQAAFdQQMA9AAQAAFxQQMApQAQAAFdQQMAdgAQAAFxQQMAZwAQAAFdQQMAyAAQAAFdQQMACAAQAAFyQQMACQAQAAFxQQMASgAQAAFxQQUAWgAQAGoAEAACckEDADsAEAABcUEDABoAEAABckEFAHkAEACJABAAAnJBAwBpABAAAXFBAwBYABAAAXFBAwA3ABAAAXJBAwAmABAAAXJBBQDVABAA5QAQAAJxQQMARQAQAAFyQQMAtAAQAAFxQQMAwgAQAAFxQQMAogAQAAFxuAAEELkAEQAH9EEFAHYAEQCGABEAAl1BAwBnABEAAXFBAwBYABEAAXFBBQAHABEAFwARAAJxQQMAFwARAAFyQQMAhgARAAFxQQMA1QARAAFdQQMAKgATAAFyQQMANwATAAFyQQMAXwAjAAFxuAAjELkAFQAF9EEDACsAGAABckEDAAsAGAABckEDABoAGAABcUEDACUAGAABcUEDAMQAGgABcUEDAEUAGgABckEDABYAGgABcUEDAOUAGgABcUEDANMAGgABcUEDAAAAGgABckEDADYAGwABckEDAAEAGwABcrgAChC4ABzQuAAcL0EDAOIAHAABcUEDACQAHAABckEDAAUAHAABcUEDADcAHAABcUEDAPYAHAABcUEFADUAHABFABwAAnJBAwATABwAAXJBAwABABwAAXJBAwDQABwAAXFBAwAHAB0AAXJBAwD4AB0AAXFBAwDpAB0AAXFBAwAaAB0AAXJBAwBLAB0AAXJBAwA9AB0AAXJBAwArAB0AAXJBAwA6AB0AAXFBAwBJAB0AAXFBAwBoAB0AAXFBAwAIAB0AAXFBAwDXAB0AAXFBAwBlAB0AAXJBAwDrAB4AAXFBAwBWAB4AAXJBAwBWAB4AAV1BAwBkAB8AAXJBAwAXAB8AAXFBAwC4AB8AAXFBAwBZAB8AAXFBAwDqAB8AAXFBAwD7AB8AAXFBAwBPAB8AAXJBAwDcAB8AAXFBAwA6AB8AAXJBAwB5AB8AAXFBAwDJAB8AAXFBBQCIAB8AmAAfAAJxQQMAVQAfAAFyQQMAVAAfAAFdQQMAlAAfAAFyQQMAFQAgAAFxQQMAKAAgAAFxQQUAOgAgAEoAIAACcUEDAO0AIAABcUEDAC8AIAABckEDAEsAIAABckEDANkAIAABcUEDAFcAIAABcUEDAFQAIAABckEDAGAAIAABckEDAFIAIgABXUEDAFYAIgABcUEDAEUAIgABcUEDACIAIgABcUEDAAIAIgABckEDANYAKgABcUEDAIYAKgABcUEDAAcAKgABckEDAI8AKgABXUEDACgAKgABckEPAAYAKgAWACoAJgAqADYAKgBGACoAVgAqAGYAKgAHXUEDABYAKgABckEDAPAAKgABcUEDACAAKgABcUEDACAAMAABcUEDAOAAMAABXUEDAKAAMAABXbgAIxC4ADHcALgAAEVYuAAhLxu5ACEAED5ZuAAARVi4AAIvG7kAAgAKPlm7AA0AAgAnAAQruwAtAAIABwAEK0EDAE0AAAABcUEDAP4AAAABXUEDAA4AAAABcUEDAO8AAAABXUEDAB8AAAABcUEDAC4AAAABcUEDAKwAAAABXUEDADwAAAABcUEDAKwABAABXUEDAA0ABAABcUEDAPwABAABXUEDANsABAABXUEFADoABABKAAQAAnFBAwBgAAcAAXFBAwCZAAcAAXJBAwC/AAcAAXFBAwAgAAcAAXJBAwAgAAcAAXFBBQBAAAcAUAAHAAJdQQMAYAAtAAFxQQMAvgAtAAFxQQMAIAAtAAFyQQMAIAAtAAFxugAFAAcALRESOUEDAEcABQABXUEDAOkABQABXUEDALUABQABXUEDAFQABQABXUEDAAwACAABcUEDABoACAABcUEDAMgACAABXUEHAHAADQCAAA0AkAANAANdQQMAgQANAAFyQQMAsQANAAFdQQ0AAAANABAADQAgAA0AMAANAEAADQBQAA0ABl1BAwDwAA0AAV1BAwDWABAAAV1BAwAXABAAAXJBAwDHABAAAV1BAwAlABAAAXFBAwDxABAAAV1BAwAXABEAAXJBAwAJABEAAXFBAwCWABEAAXFBAwClABEAAXG4AAIQuQATAAH0QQsAtwATAMcAEwDXABMA5wATAPcAEwAFcUEFAAcAEwAXABMAAnJBAwDYABMAAV1BGwAHABMAFwATACcAEwA3ABMARwATAFcAEwBnABMAdwATAIcAEwCXABMApwATALcAEwDHABMADV1BBQDnABMA9wATAAJdQRUABwATABcAEwAnABMANwATAEcAEwBXABMAZwATAHcAEwCHABMAlwATAApxQQMAjgAVAAFdQQMAMQAWAAFxQQMAQAAWAAFxuAAhELkAGQAB9EEFADkAGQBJABkAAnJBGwA4ABkASAAZAFgAGQBoABkAeAAZAIgAGQCYABkAqAAZALgAGQDIABkA2AAZAOgAGQD4ABkADXFBBwAIABkAGAAZACgAGQADckEhAAgAGQAYABkAKAAZADgAGQBIABkAWAAZAGgAGQB4ABkAiAAZAJgAGQCoABkAuAAZAMgAGQDYABkA6AAZAPgAGQAQXUEFAAgAGQAYABkAAnFBAwAIABwAAV1BAwAoABwAAV1BBQA4AB0ASAAdAAJdQQMA6QAdAAFdQQMAGAAdAAFdQQMAVwAdAAFdQQMAhAAdAAFyQQUAiwAeAJsAHgACckEDAGAAIwABcUEDAGEAIwABXUEDACMAIwABcUEFAHUAIwCFACMAAnFBAwCEACMAAV1BAwByACMAAV1BAwCRACMAAXFBAwBQACMAAV1BBQAwACMAQAAjAAJxQQMAMAAnAAFdQQMA8AAnAAFdQQcAcAAnAIAAJwCQACcAA11BAwCwACcAAV1BAwCAACcAAXIwMQFBAwCBAAUAAV1BAwBZAAUAAXFBAwDlAA4AAV1BAwCIACoAAV0AQQMA6wAAAAFdQQMA5gAPAAFdJRQjIi8BBiMiJjU0NjMyFh8BFjMyPQE0JiMiBgcjNjc2MzIVBzQmIyIGFRQWMzI2ATdHOAgRDxMZIiIZFiIEHQQYIT4pLTsHJQUiKUOMmhINDRERDQ0SQUo4cAkiGRojHRaqGSTrJyEmISocImlWDRISDQ0REQADABr/+QFTAZAANgBCAE4OfLgAKi+4ABIvuAAyL7gAMy+4AAAvuAALL7gADC+4ABgvuAAGL7gAQy+4AEkvQQMA3wAAAAFdQQMAzAAAAAFdQQMAwwAAAAFxQQMAxwACAAFxQQMABQACAAFxQQMANAACAAFxQQMAywADAAFdQQMABQADAAFxQQMAywAEAAFdQQMAmwAEAAFxQQMACQAEAAFxQQMAqQAEAAFxQQMAzwAFAAFdQQMAjQAGAAFyQQUALgAGAD4ABgACckEDAN0ABgABcUEFAJwABgCsAAYAAnFBBwAQAAYAIAAGADAABgADcUEDANkABwABcUEDADAABwABcUEDADgACAABckEDADAACAABcUEDABoACQABckEDAIUACgABXUEDANYACgABXUEDAAkACgABcUEDACgACgABcUEDADYACgABcUEDABIACgABckEDAEEACgABckEDABQACwABXUEDAAMACwABXUEFAJAACwCgAAsAAl1BAwADAAwAAV1BBQCQAAwAoAAMAAJdQQMARwAPAAFxQQMAowAPAAFdQQMARwAQAAFdQQMAmwARAAFxQQMAAwASAAFxQQMALQASAAFdQQsAEAASACAAEgAwABIAQAASAFAAEgAFcUENAKAAEgCwABIAwAASANAAEgDgABIA8AASAAZdQQMA2wATAAFxQQMAKgAVAAFdQQMAxQAWAAFdQQMA0AAWAAFxQQMA0gAYAAFxQQMAAwAYAAFxQQMA6AAYAAFxQQMAKgAYAAFdQQMAQwAYAAFyQQMAggAYAAFdQQUAkAAYAKAAGAACXUEDAPAAGAABXUEDAJMAGQABcUEDAKIAGQABcUEDAPkAGgABcbgADBC5ABsABfRBAwDtAB0AAXFBAwAeAB0AAXJBAwAJAB0AAXJBAwB5AB0AAXFBAwAXAB4AAXFBAwDbAB4AAV1BAwDNAB4AAV1BAwCdAB4AAXFBAwC8AB4AAXFBAwD6AB4AAV1BAwClAB4AAXFBAwBCAB4AAXFBAwCQADMAAV24ADMQuQAgAAX0QQMAOAAgAAFyQQMAkAAyAAFduAAyELkAIQAF9EEFAAwAIwAcACMAAnJBAwCcACMAAXFBAwCOACMAAXFBAwC/ACMAAXFBAwAtACMAAXJBAwBMACMAAXJBAwCrACMAAXFBAwDJACMAAV1BAwAbACQAAXJBBQChACcAsQAnAAJxQQMAAgAnAAFyQQUAZgAnAHYAJwACcUEDAIQAJwABcUEDAJIAJwABcUEDABEAJwABckEFACAAJwAwACcAAnJBAwDgACoAAV1BAwDHACoAAV1BAwATACoAAXFBAwAgACoAAXFBBQCgACoAsAAqAAJduAAqELkAKQAI9EEDABcAKQABcUEFALcAKQDHACkAAl1BAwCmACkAAV1BAwD2ACkAAV1BAwApACsAAXJBAwDKACsAAXFBAwDcACsAAXFBAwDqACsAAXFBAwD5ACsAAXFBAwBlACsAAXJBAwA6ACwAAXJBAwBLACwAAXJBAwAcACwAAXJBAwDtACwAAXFBAwDOACwAAXFBAwDcACwAAXFBAwD8ACwAAXFBAwALACwAAXJBAwCjACwAAV1BAwChACwAAXJBAwAkAC0AAXFBAwDbAC0AAXFBAwALAC0AAXFBAwC2AC0AAXFBAwCgAC0AAXJBAwBAAC0AAXJBAwAGAC8AAXJBAwBLAC8AAXJBAwApAC8AAXJBAwDTAC8AAXFBAwACAC8AAXFBAwBBADAAAV1BAwAzADAAAXFBAwDkADAAAXFBAwDEADAAAXFBAwA1ADAAAV1BAwD2ADAAAXFBAwA1ADAAAXJBAwAkADAAAXJBAwAkADAAAV1BAwBCADAAAXFBAwBBADAAAXJBAwDQADAAAXFBAwBDADEAAXFBAwD1ADEAAXFBAwAFADEAAXJBAwAFADEAAXFBAwDTADEAAXFBAwDCADEAAXFBAwDiADEAAXFBAwD1ADUAAV1BAwDGADUAAXFBAwBHADUAAXFBAwAYADUAAXFBAwAnADUAAXFBAwCWADUAAXFBAwCFADUAAXFBAwCkADUAAV1BAwAEADUAAXFBAwC0ADYAAXFBAwCGADYAAXJBAwCFADYAAXFBAwDTADYAAXFBAwDAADYAAXG4AAAQuQA3AAn0QQMAygA3AAFdQQMAOgA4AAFyQQMAKAA6AAFyQQMApwA6AAFyuAAGELkAPQAJ9EEDAKsAPQABcUEDAJoAPQABcUEDAIgAPQABckEDABcAQAABcrgAGBC5AEMACfRBAwCJAEMAAXJBAwAFAEMAAXFBAwCFAEMAAV24ABIQuQBJAAn0QQMAKgBJAAFdQQMABQBJAAFxQQMAQwBMAAFxQQcAkABPAKAATwCwAE8AA11BBQAQAE8AIABPAAJxQQUA4ABPAPAATwACXUEDAF8AUAABXUEDAA8AUAABXUEDAI8AUAABcUEDAC8AUAABXUEDAC8AUAABcUEDAOAAUAABXQC4ABUvuABGL7gATC+4AA8vuAAaL7gAUC+4ADovuABAL7gAAEVYuAAuLxu5AC4AED5ZuAAARVi4AAsvG7kACwAKPlm4AABFWLgACi8buQAKAAo+WbgAAEVYuAADLxu5AAMACj5ZuABQELgAANxBAwAvAAAAAXFBAwAcAAAAAXFBAwDbAAAAAV1BAwDNAAIAAXFBAwCbAAQAAXFBAwCqAAQAAXFBAwDLAAUAAV1BAwDaAAUAAV1BAwDaAAcAAXFBAwBJAAgAAXFBAwBKAAgAAXJBAwBbAAgAAV1BAwCqAAgAAXFBAwA4AAgAAXJBAwDVAAgAAV1BAwBrAAkAAV1BAwDqAAkAAV1BAwDLAAwAAV1BAwCaAA4AAXFBAwBCAA4AAXFBAwC8ABoAAXFBAwBHABoAAXG4ABoQuQBMAAP0QQcAmgBMAKoATAC6AEwAA3FBBQA8AEwATABMAAJyQQMArwBMAAFdQQMAzwBMAAFxQQMADwBMAAFyQQMAHABMAAFyQQMAKwBMAAFyQQMAQQBMAAFxQQMAwABMAAFduQAPAAT0QQMAmQAPAAFxQQUArAAPALwADwACcUEDAEgADwABcUEDAAgADwABckEDAEQAEAABXUEDAIAAFQABckEDAMEAFQABcUEDABIAFQABXUEDANMAFQABcUEDACEAFQABXUEDAFAAFQABXUEDAIAAFQABcUEDAJAAFQABXUEDANEAFgABcUEDAMIAFwABXUEDAAAAFwABcUEDAOQAGAABcUEDAEEAGAABcbgAChC5ABwAA/RBAwDkABwAAXFBAwAlABwAAXFBAwDVABwAAXFBAwBFABwAAXFBBQBWABwAZgAcAAJxQQMABgAcAAFxQQMApwAcAAFdQQMAugAcAAFdQQMAJgAcAAFyQQUAlgAcAKYAHAACcUEDADYAHAABcUEFAHUAHACFABwAAnFBAwC1ABwAAXFBAwAFABwAAXJBAwDEABwAAXFBAwAzABwAAXJBBQBtAB0AfQAdAAJdQQMAFQAdAAFxQQUAlwAeAKcAHgACcUEDAIgAHgABcUEDABgAHgABcUEDAFkAHgABcUEDAOsAHgABcUEDAF0AHgABXUEDACwAHgABcUEDADsAHgABcUEFAAgAHgAYAB4AAnJBAwA4AB4AAXJBAwDXAB4AAXFBAwC2AB4AAXFBAwD2AB4AAV1BBQAbACAAKwAgAAJxQQMA+gAiAAFdQQMA6QAiAAFdQQMAOgAjAAFyQQMAiAAjAAFxuAAuELkAJQAD9EEDAPkAJQABXUEDAE0AJwABckEDANwAKQABXUEDAIkAKQABckEDAOkAKQABXUEDAEsAKgABXUEDADwAKgABXUEDANwAKgABXUEDAAsAKgABXUEDAEoAKgABckEFABoAKgAqACoAAl1BAwDnADAAAXFBAwDnADEAAXFBBQAWADEAJgAxAAJxQQMAUwAyAAFxQQMAUAAyAAFdQQMAiwAzAAFxQQMA6QA1AAFdQQMASgA1AAFxQQMAuwA1AAFdQQMAHAA1AAFyQQMAHQA1AAFxQQMA/AA1AAFxQQMALAA1AAFxQQMACwA1AAFyQQMAqgA1AAFdQQMABgA1AAFxQQMAxgA1AAFxQQMAhwA2AAFxQQMAtwA2AAFxQQMAlgA6AAFyQQMAKQA6AAFyQQMA7wA6AAFxQQcAHwA6AC8AOgA/ADoAA3FBAwCLADoAAXFBBQBXADoAZwA6AAJyQQUAdQA6AIUAOgACckEHAIAAOgCQADoAoAA6AANdQQMA9wBAAAFxQQMAiwBAAAFyQQMAnQBAAAFyQQMAXwBAAAFdQQ0AjwBAAJ8AQACvAEAAvwBAAM8AQADfAEAABl1BAwCuAEAAAXJBBQBbAEAAawBAAAJyQQMAegBAAAFyQQMAJwBAAAFyQQMARgBAAAFxuAAVELkARgAD9EEDABcARgABcUEDAIgARgABcUEDABUARgABXUEDANUARgABcTAxAUEDALUAAgABXUEDAAUAAgABcUEHANYAAgDmAAIA9gACAANdQQMAuQAEAAFdQQcA2QAEAOkABAD5AAQAA11BAwAZAAQAAXFBAwA5AAQAAXFBAwAqAAQAAXFBCwC5ABQAyQAUANkAFADpABQA+QAUAAVdQQMA9QAWAAFdQQMABQAWAAFxQQMAtgAWAAFdQQUA1gAWAOYAFgACXUEDAF8AUAABcQBBAwDpAAAAAV1BAwAKAAAAAXFBAwDYAAEAAV1BAwC6AAEAAV1BBQDqAAEA+gABAAJdQQMACgABAAFxQQMA+QAFAAFdQQMAGQAFAAFxQQMAuwAFAAFdQQMAxQATAAFdQQMA1gATAAFdQQMA9gATAAFdQQMAtwATAAFdQQMA5wATAAFdQQMA9AAXAAFdQQMAtgAXAAFdQQUA1gAXAOYAFwACXUEDAAYAFwABcUEDAE8AGgABckEDAPYAHAABcUEDAGUAMgABcSUUBiMiJjU0NwYHIzU0NyMiJjU0NjMyFhUUBh0BNjc2PQE0JyYjIgcGByM2NzYzMhcWHQEUBxYHNCYjIgYVFBYzMjYnNCYjIgYVFBYzMjYBUyIdGiQBOR4tBwQZIyMZGiMcIUw5JB8pJiAkCCUDJSpDQScqGy0dEw4NFBQNDhPBEQ0NERENDRE3GiQkGgkEGCxdHQ8jGRojIxoTORZAMBcaPGQjFhISFSIqHiIaHTZlMBsOLg4TEw4NFBSbDRERDQ0REQAAAAACAA//+AFXAaAAMwA/DNa7ADoABgAYAAQruwASAAYANAAEK7sAHgAGAAgABCu7AAAABQAmAAQrQQMADwAAAAFdQQMATAAAAAFdQQMA8wABAAFxQQMAAwABAAFyQQUAxgABANYAAQACXUEDAEwAAQABXUEDALMAAQABcUEDABAAAQABckEDAOAAAQABcUEDABsAAwABckEFAOwAAwD8AAMAAnFBAwC9AAMAAXFBAwANAAMAAXJBAwC7AAMAAV1BAwDKAAMAAV1BAwDZAAMAAV1BAwChABIAAV1BAwCDABIAAV1BAwA2ABIAAXFBAwC2ABIAAV1BBwAGABIAFgASACYAEgADXUEFADkAEgBJABIAAnJBCQBGABIAVgASAGYAEgB2ABIABF1BFwBWABIAZgASAHYAEgCGABIAlgASAKYAEgC2ABIAxgASANYAEgDmABIA9gASAAtxQQcABgASABYAEgAmABIAA3JBBwDWABIA5gASAPYAEgADXUEDADMAEgABXUEDAJIAEgABXUEDAAAAEgABcUEHAFAAEgBgABIAcAASAANyuAASELgABNC4AAQvQQMAAQAEAAFdQQMAEAAEAAFdQQMAVgAHAAFyQQMAMwAIAAFdQQMA+QAIAAFxQQcACQAIABkACAApAAgAA3JBAwBJAAgAAV1BBQCpAAgAuQAIAAJdQQcAGQAIACkACAA5AAgAA3FBBQA6AAgASgAIAAJyQQMAXQAIAAFdQRMAWQAIAGkACAB5AAgAiQAIAJkACACpAAgAuQAIAMkACADZAAgACXFBBwDZAAgA6QAIAPkACAADXUEHAGkACAB5AAgAiQAIAANdQQcACQAIABkACAApAAgAA11BAwBEAAgAAXFBAwDhAAgAAXFBAwAAAAgAAXFBAwAWAAwAAXJBAwBFAAwAAXJBAwAPACYAAV1BAwBNACYAAV26AC0AJgAAERI5uAAtL0EDAHkALQABXbkALgAH9LoADQAYAC4REjlBAwCmAA0AAXFBAwDeAA0AAV1BAwBfAA0AAXFBAwA/AA0AAXFBAwAaAA0AAXFBAwBFAA0AAXJBAwAVAA0AAXJBAwBcAA8AAXFBAwBYABAAAXFBAwDWABQAAV1BAwDkABQAAV1BAwDzABQAAV1BBQDJABYA2QAWAAJdQQMAuAAWAAFdQQUA6AAWAPgAFgACXUEDAHsAGQABcUEDAJ4AGQABcUEDAGoAGQABcUEDAFkAGQABcUEHAIoAGgCaABoAqgAaAANdQQMAGgAaAAFxQQMATAAaAAFxQQMAjAAaAAFxQQMAnQAaAAFxQQMAPQAaAAFxQQMArAAaAAFxQQMAWgAaAAFdQQUAWgAaAGoAGgACcUEFAGkAGgB5ABoAAl1BAwDDABoAAXJBAwCTABwAAV1BAwBFABwAAXFBAwCFABwAAV1BAwCiABwAAV1BAwABABwAAXFBAwB2AB0AAV1BBQCTAB4AowAeAAJxQQMAZAAeAAFdQQMAWQAeAAFdQQMANAAeAAFdQQMAQwAeAAFxQQMA4QAeAAFxQQMAAAAeAAFxQQMASQAgAAFxuAASELkAIgAF9EEDAIUAIgABXUEDAKcAIgABXUEDAOoAIgABcUEJALkAIgDJACIA2QAiAOkAIgAEXUEDAJYAIgABXUEDAAMAIgABXUEDABAAIgABXUEDAOoAIwABcUEDABsAIwABckEDALsAIwABcUEDAAoAIwABckEDAPgAIwABcUEDAAYAIwABXUEDABUAJQABckEDANkAJQABcUEDALQAJQABcUEDAOMAJQABcUEDAHoAKwABcUEDAEkAKwABcUEDABgALAABckEDAMgALwABXUEDAFwAMAABcUEDABkAMAABckEDAEcAMAABcroAMQAYAC4REjlBAwA1ADEAAV1BAwAZADEAAXFBAwBNADEAAXFBAwB9ADEAAXFBAwD2ADEAAXFBBQAGADEAFgAxAAJyQQMAdQAxAAFdQQMA5QAxAAFxQQcAUAA0AGAANABwADQAA3JBAwAAADQAAXFBBwCAADQAkAA0AKAANAADXUEPAFYAOgBmADoAdgA6AIYAOgCWADoApgA6ALYAOgAHcUEDAAcAOgABcUEHANYAOgDmADoA9gA6AANxQQcABgA6ABYAOgAmADoAA3JBEQAGADoAFgA6ACYAOgA2ADoARgA6AFYAOgBmADoAdgA6AAhdQQUANQA6AEUAOgACckEDAKAAQAABXUEDAMAAQAABXUEDABAAQAABcUEFAOAAQADwAEAAAl24AC4QuABB3EEJAM8AQQDfAEEA7wBBAP8AQQAEcUEDAC8AQQABcUENAF8AQQBvAEEAfwBBAI8AQQCfAEEArwBBAAZxALgALS+4AABFWLgAGy8buQAbABA+WbgAAEVYuAANLxu5AA0ADj5ZuAAARVi4AA8vG7kADwAOPlm4AABFWLgAAi8buQACAAo+WbsAPQACABUABCtBAwDvAAAAAXFBAwCsAAAAAV1BAwC7AAAAAV1BAwDnAAMAAXFBAwCrAAQAAV1BAwD6AAQAAXFBAwBtAAUAAXJBAwD/AAUAAXJBAwDeAAUAAXJBAwCtAAUAAXJBAwBDAAUAAXFBAwCKAAYAAXJBAwCsAAcAAXJBAwDlAAcAAXFBAwDpAAkAAXG4ABsQuQALAAL0QQUAOQALAEkACwACckEdACgACwA4AAsASAALAFgACwBoAAsAeAALAIgACwCYAAsAqAALALgACwDIAAsA2AALAOgACwD4AAsADnFBBwAIAAsAGAALACgACwADckEhAAgACwAYAAsAKAALADgACwBIAAsAWAALAGgACwB4AAsAiAALAJgACwCoAAsAuAALAMgACwDYAAsA6AALAPgACwAQXUEDAAgACwABcUEDAC0ADQABcUEDAN8ADQABXUEDAFoADQABcUEDAKcADQABcUEDAC8ADwABcUEDAN0ADwABXUEDAFkADwABcUEDAFsAEAABcUEDAHAAFQABckEDABEAFQABckEDADwAFQABXUEDAM8AFQABcUEDAK4AFQABckEDABMAFQABcUEDAMAAFQABckEDAMAAFQABXUEDAPAAFQABckEDAMkAGQABckEDABQAGQABcUEDAMsAHQABckEFAIMAHwCTAB8AAnJBAwBKAB8AAXJBAwByAB8AAXJBAwDAAB8AAXJBAwBPACAAAXJBAwCpACAAAXJBAwA+ACEAAXJBAwBUACEAAXK4AAIQuQAkAAH0QSEABwAkABcAJAAnACQANwAkAEcAJABXACQAZwAkAHcAJACHACQAlwAkAKcAJAC3ACQAxwAkANcAJADnACQA9wAkABBdQSEABwAkABcAJAAnACQANwAkAEcAJABXACQAZwAkAHcAJACHACQAlwAkAKcAJAC3ACQAxwAkANcAJADnACQA9wAkABBxQQcABwAkABcAJAAnACQAA3JBBQA2ACQARgAkAAJyQQMASQApAAFyQQMANAApAAFxQQMAQwApAAFxQQMAOwArAAFxQQMAFgAsAAFyQQMAcgAtAAFdQQMAdQAuAAFdQQMATwAvAAFyQQMAMgAvAAFyQQMASQAwAAFyQQMAFwAwAAFyugAxAAIALRESOUEDADUAMQABcUEDADYAMQABXUEDAPcAMQABcUEDAHYAMQABXUEDAHUAMQABcUEFAAUAMQAVADEAAnJBAwBEADEAAXFBAwD0ADIAAXFBAwCkADIAAXFBAwCEADIAAXFBAwDiADIAAXFBAwCRADIAAXG4AA8QuQA3AAL0QREACAA3ABgANwAoADcAOAA3AEgANwBYADcAaAA3AHgANwAIXUEFADkANwBJADcAAnJBAwBfADcAAXFBAwDbADcAAV1BBQAIADcAGAA3AAJxQRUAaAA3AHgANwCIADcAmAA3AKgANwC4ADcAyAA3ANgANwDoADcA+AA3AApxQQcACAA3ABgANwAoADcAA3JBAwA4ADcAAXFBAwDwAD0AAXJBAwDAAD0AAV1BAwCuAD0AAXJBAwDPAD0AAXFBAwBxAD0AAXJBAwAQAD0AAXFBAwAQAD0AAXJBAwDAAD0AAXJBAwDnAEEAAXEwMQFBBQDBAAEA0QABAAJxQQMAlgABAAFdQQMAmQADAAFdQQMA3gADAAFxQQMAzwADAAFxQQMAxgAQAAFdQQMABgAQAAFxQQMAxQAUAAFdQQMABgAUAAFxQQMACQAWAAFxQQUAzgAjAN4AIwACcUEDANAAJQABcUEDAMYAJQABcUEDANUAMQABcUEDANAAQAABXUEFAD8AQQBPAEEAAnEAQQMAmQAAAAFdQQMAmQAEAAFdQQMAxgARAAFdQQMABgARAAFxQQMAyQATAAFdQQMACQATAAFxQQMA0QAxAAFxQQMA0QAyAAFxJRQjIj0BNDY1NCYjIgc2MzIWFRQGIyImNTQ2MzIWFRQGHQEUMzI9ATQnNjU2NzMOAQcWFSc0JiMiBhUUFjMyNgFEXVsyJxwsFwkOGiEhGh8hOTMsOTA4OCsCNwMmAyQTJ9USDg4SEg4OElNbW18ZVhgXIx0EIRkaIy4hJTksJh1eFl04OKEsDwYRF0YmOAoPNCoOEhIODhISAAACAA//+AFbAaAACwBFDly7AAYABQAmAAQruwAfAAYAAAAEK7sAMAAGABQABCu7AAwABQA4AAQrQQUA4AAAAPAAAAACXUEDAAAAAAABcUEDAJEAAAABXUEFAKAAAACwAAAAAl1BBQBwAAAAgAAAAAJdQQMA0wANAAFdQQMA9AANAAFxQQMAxQANAAFdQQMA5gANAAFxQQMAtQANAAFxQQMAxAANAAFxQQMAAQANAAFyQQMA0AANAAFxQQcAuwAPAMsADwDbAA8AA3FBAwC8AA8AAV1BAwDvAA8AAV1BAwDvAA8AAXFBAwANAA8AAXJBAwD8AA8AAXFBBQDJAA8A2QAPAAJdQQMAdAAPAAFdQQUAgwAfAJMAHwACXUEFAKEAHwCxAB8AAl1BBQDgAB8A8AAfAAJdQQMAAAAfAAFxuAAfELgAENC4ABAvQQMAAQAQAAFdQQMADwAQAAFxQQMAvwAQAAFdQQMA7wAQAAFdQQMAMgAQAAFdQQMAcAAQAAFdQQMAEAAQAAFdQQMATAAUAAFdQQMAyQAUAAFxQQMApgAUAAFdQQMA+wAWAAFxQQMAzwAWAAFxQQMASgAWAAFxQQMACAAWAAFyQQMAaAAXAAFxQQMAGAAXAAFxQQMAmQAXAAFdQQMA6gAXAAFxQQMAWgAXAAFyQQMA3wAXAAFxQQMAzAAXAAFxQQMACgAXAAFyQQMA+QAXAAFdQQMA+QAXAAFxQQMAiAAXAAFdQQMApwAXAAFyQQMAcwAXAAFdQQMAxAAYAAFdQQMAJgAYAAFxQQMApwAYAAFdQQMABwAYAAFxQQMA9gAYAAFxQQMABgAYAAFyQQMAFQAYAAFyQQMAJAAYAAFyQQMAQwAYAAFyQQMABAAZAAFxQQMAFAAZAAFyQQMAxgAZAAFxQQMAJQAZAAFxQQMA1AAZAAFxQQMAEwAZAAFxQQMA8gAZAAFxugA/ADgADBESObgAPy9BAwAKAD8AAXFBAwDYAD8AAXG5AEAAB/S6ABoAJgBAERI5QQMAFgAaAAFxQQMAxgAaAAFxQQMAJgAaAAFyQQMARwAaAAFxQQMAJwAaAAFxQQMARgAaAAFyQQMABgAaAAFyQQMANgAaAAFxQQMAFQAaAAFyQQMA5QAaAAFxQQMABAAdAAFxQQMA0wAdAAFdQQMA4QAdAAFdQQMAAAAgAAFxQQMA0wAhAAFdQQMA4gAhAAFdQQMAAAAhAAFxQQMADgAjAAFxQQMA6gAjAAFdQQMA2QAjAAFdQQMA9gAoAAFxQQMAdgAoAAFdQQMApQAoAAFyQQUAMwApAEMAKQACcUEDAFQAKQABckEDABcAKQABckEDAPoAKQABXUEDAEsAKQABckEDANsAKQABcUEDAJgAKQABXUEDAGcAKQABcUEDAKQAKQABckEDAHIAKQABXUEDACIAKQABcUEDAPQAKgABcUEDAMUAKgABXUEDAAUAKgABckEDAFgAKgABckEDAMcAKgABcUEDANUAKgABcUEDAGQAKgABXUEFABMAKgAjACoAAnJBAwBBACoAAXK6ACsAAAAfERI5QQMA6AArAAFxQQMASwArAAFxQQUAjAArAJwAKwACXUEDAM4AKwABcUEDAP4AKwABXUEDAN8AKwABcUEDAL8AKwABXUEDAK4AKwABXUEDAO0AKwABXUEDAAsAKwABcUEDAHkAKwABcUEDACcAKwABcUEDAHEAKwABXUEDAEsALAABcUEDAPsALAABXUEFAM8ALADfACwAAnFBAwD+ACwAAXFBBQALACwAGwAsAAJyQQMASQAsAAFyQQMAKQAsAAFyQQMAdgAtAAFxQQMA2gAtAAFxQQMAWwAtAAFyQQMAdwAtAAFdQQMA5QAtAAFxQQMANAAtAAFxQQMAygAuAAFxQQMA+AAuAAFxQQMAdwAuAAFdQQUAVwAwAGcAMAACXUEDAEkAMAABXUEDADYAMAABcUEDAKUAMAABXUEDALoAMwABXUEDAHcAMwABXUEDADUAMwABXbgAHxC5ADQABfRBAwBwADQAAV1BAwCnADQAAV1BAwDvADQAAV1BAwAPADQAAXFBAwC+ADQAAV1BBQCFADQAlQA0AAJdQQMAMAA0AAFdQQMAEAA0AAFdQQMApQA1AAFxQQMAqAA3AAFxQQMAOQA7AAFxQQMApAA7AAFxQQMAOQA9AAFxQQMAewA9AAFxQQMASAA9AAFxQQMAtwA9AAFxQQMACgA+AAFxQQMApwA+AAFxQQMAxgBBAAFdugBDACYAQBESOUEDADcAQwABXUEDAOgAQwABXUEDAEoAQwABcUEDAHsAQwABcUEDADkAQwABcUEDALcAQwABcUEDAAcAQwABckEDAKYAQwABcUEDAKAARgABXUEDABAARgABcUEJAMAARgDQAEYA4ABGAPAARgAEXbgAQBC4AEfcQQkAzwBHAN8ARwDvAEcA/wBHAARxQQ0AXwBHAG8ARwB/AEcAjwBHAJ8ARwCvAEcABnFBAwAvAEcAAXEAuAA/L7gAAEVYuAAqLxu5ACoAED5ZuAAARVi4ACwvG7kALAAQPlm4AABFWLgADi8buQAOAAo+WbsAHAABAAMABCu7AAkAAQAiAAQruwAXAAEAKwAEK0EDAPAAAwABXUEDAFAAAwABckEDANEAAwABcUEDAIAAAwABckEDAJAAAwABcUEDAMAAAwABXUEFAIAAAwCQAAMAAl1BAwA6AAkAAV1BAwCrAAkAAXFBBQA8AAkATAAJAAJyQQMArwAJAAFdQQMACwAJAAFdQQMAWwAJAAFdQQMAwAAJAAFdQQMAEAAJAAFxQQMAzwAMAAFxQQMAvwAMAAFdQQMA3QAMAAFxQQMArAAMAAFdQQMAuAANAAFdQQMArAAQAAFdQQUAOgAQAEoAEAACckEDABkAEAABckEDAMQAEQABcUEDABUAEQABcUEDALUAEQABcUEDACcAEQABckEDAEYAEQABXUEFAHUAEQCFABEAAnFBAwCkABEAAXFBBQAzABEAQwARAAJyQQMAkgARAAFxQQMA4wATAAFxQQMANQATAAFyQQMARgATAAFxQQMAFQATAAFyQQMAJAATAAFyQQMAAQATAAFyQQMAEAATAAFxQQMARQAUAAFdQQMApwAWAAFxQQMAqQAWAAFdQQMASQAWAAFxQQMA+gAWAAFxQQMA2QAWAAFxQQMACQAWAAFxQQMAyAAWAAFxQQMABwAWAAFyQQMAVQAWAAFyQQMABAAXAAFyQQMApAAXAAFyQQUAZgAXAHYAFwACXUEDAAcAFwABcUEDAOcAFwABcUEDABwAFwABcUEDAEwAFwABcUEDAMcAFwABcUEDAIcAFwABXUEDAJQAFwABXUEDAIQAFwABckEDAHMAFwABckEDANEAFwABcUEDANcAGAABcUEDAKgAGAABXUEDACkAGAABcUEDAMkAGAABXUEDAMsAGAABcUEDAB0AGAABcUEDABsAGAABckEDAEoAGAABcUEDAPkAGAABcUEDAAkAGAABcUEDAIgAGAABXUEDAAYAGAABckEDAFUAGAABckEDABwAGQABcUEDAPAAHAABXUEDANAAHAABcUEDAIAAHAABckEDABcAHAABcUEDAJIAHAABXUEDAFAAHAABckEDAJAAHAABcUEDAMAAHAABXUEDAIAAHAABXboAGgADABwREjlBAwDGABoAAV1BAwADAB0AAXFBAwAVAB4AAXFBAwDVAB4AAV1BAwDZACAAAV1BAwA8ACIAAV1BBQA9ACIATQAiAAJyQQMADwAiAAFdQQMArwAiAAFdQQMArwAiAAFxQQMAXQAiAAFdQQMAEwAiAAFxQQMAwAAiAAFdQQMAHAAnAAFyQQUA3AAnAOwAJwACcUEDABgAKgABcUEDAHEAPwABXboAKwAOAD8REjlBAwDjACsAAV1BAwAEACsAAXFBBQBkACsAdAArAAJdQQMANgArAAFxQQMAlgArAAFdQQMAyAArAAFdQQMAhwArAAFdQQMA5gArAAFxQQMARQArAAFyQQMAJAArAAFyQQMAwwArAAFxQQMA8QArAAFxQQMAAQArAAFyQQMA0AArAAFxQQMApgAtAAFxQQMAkAAtAAFxQQMAkAAuAAFxQQMA2gAxAAFxQQMAEQAxAAFxQQMAPAAyAAFyQQMARQAzAAFduAAOELkANgAB9EEDAHMAOQABXUEDABoAOQABckEDAGUAOQABXUEDANIAOQABcUEDAKEAOQABcUEDADoAOgABckEDAOgAOwABcUEDAKYAOwABcUEDAEQAPQABcUEDAKgAPgABXUEDAEUAPgABcUEDANQAQQABXUEDAKUAQQABcUEDAEIAQQABcUEDAAEAQQABcroAQwADABwREjlBAwBFAEMAAXFBCwA1AEMARQBDAFUAQwBlAEMAdQBDAAVdQQMABgBDAAFxQQMAGQBDAAFxQQMAqgBDAAFdQQMAugBDAAFxQQMA2wBDAAFxQQMA/ABDAAFdQQMAzQBDAAFdQQMAiwBDAAFxQQMA6gBDAAFdQQMAmgBDAAFxQQMAyQBDAAFxQQMA6ABDAAFxQQMAdgBDAAFxQQMABQBDAAFyQQMApQBDAAFxQQMAIwBDAAFxQQMApABEAAFxQQUAggBFAJIARQACcUEDAGMARQABXUEDANQARQABXUEDAKwARQABXUEDAAQARQABckEDAHIARQABXUEDANAARQABcUEDAKAARQABcTAxAUEDAJYADQABXUEDAOcADQABXUEDAJkADwABXUEDAMYAHQABXUEDAPYAHQABXUEDAMYAIQABXUEDAPYAIQABXUEFAD8ARwBPAEcAAnEAQQMAmQAMAAFdQQMA6AANAAFdQQMAmQAQAAFdQQMAxQAeAAFdQQMA9QAeAAFdQQMAyQAgAAFdQQMA+QAgAAFdNzQmIyIGFRQWMzI2FxQjIj0BNDY1NCcHJwYHNjMyFhUUBiMiJyY1NDc2Nxc3FhcWFRQGHQEUMzI9ATQnNic2NzMOAQcWFXMSDg4SEg4OEtVdWzwmIyQgCw4SHSIlGyISEBgaKRkbJBcUOTg4KAECNwMmAyQTJ/kOEhIODhISmFtbPyBhHzQIKikWJAYlHB0kHBkkKyUpCCMjBB4cJB9kHT45OKEsDgkPF0YmOAoPNAAAAwAe//cBzwGQADcAQwBPE4R8uAA3Lxi4ACwvuAAoL7gAMi+4AB8vuAA+L7gAOC+4ACUvQQMApwABAAFyQQMAqAABAAFdQQMAKwABAAFxQQMACwABAAFyQQMAnQABAAFyQQMAvgABAAFxQQMA/gABAAFxQQMA7wABAAFxQQMArwABAAFxQQMAHwABAAFyQQUAPgABAE4AAQACckEDAN4AAQABcUEDAC0AAQABckEDAMwAAQABcUEDAJsAAQABcUEDAFoAAQABcUEDAMcAAQABXUEDAIcAAQABckEDAFUAAQABckEDAO8AAgABcUEDAC8AAgABckEDACUAAwABcUEDAAYAAwABXUEDAPUAAwABXUEDABMAAwABXUEDAPAAOAABXUEDAB8AOAABcUEDAL8AOAABXUEDADAAOAABXUEDAJAAOAABckEDAJAAOAABXbgAOBC5AAUABvRBAwAHAAUAAV1BAwC3AAUAAV1BAwARAAUAAV1BAwCgAAUAAV1BAwAGAAYAAV1BAwBmAAYAAV1BAwAEAAYAAXFBAwDzAAYAAV1BAwDlAAcAAV1BAwD0AAcAAV1BBQALAAkAGwAJAAJxQQMAzQAJAAFdQQMAuwAJAAFdQQMA6gAJAAFdQQMA+QAJAAFdQQMAbQA+AAFyQQMAXwA+AAFyQQMAHwA+AAFxQQcAvwA+AM8APgDfAD4AA11BBwB/AD4AjwA+AJ8APgADXUEPAH8APgCPAD4AnwA+AK8APgC/AD4AzwA+AN8APgAHckEFAM8APgDfAD4AAnFBAwALAD4AAXFBAwCaAD4AAXG4AD4QuQALAAb0QQMAaQALAAFdQQMAmwALAAFxQQMACwALAAFxQQMAXwALAAFdQQMAOwALAAFdQQMASgALAAFdQQMAyQALAAFxQQMA2AALAAFxQQMASQAMAAFdQQMACwANAAFxQQMA6gANAAFdQQMAvwAyAAFdQQMAXwAyAAFdQQMAHwAyAAFxQQMAjwAyAAFdQQMALQAyAAFduAAyELkADwAH9EEFAMkAEADZABAAAl1BAwCqABAAAXFBAwBNABAAAXJBAwA/ABAAAXJBAwC7ABAAAXFBAwB6ABAAAXFBAwBYABAAAXJBAwBAABAAAV1BAwDEABIAAXFBAwD2ABIAAV1BAwBoABIAAXFBAwBEABIAAXJBAwCzABIAAXFBAwBxABIAAXFBAwBpABMAAXFBAwBZABMAAXJBAwBBABMAAXJBAwC2ABQAAV1BAwCoABQAAXFBBQDoABQA+AAUAAJdQQMAGgAUAAFxQQMAawAUAAFxQQMAvAAUAAFxQQMAjQAUAAFdQQMALAAUAAFxQQMAmwAUAAFdQQMAewAUAAFdQQMACQAUAAFxQQMAOAAUAAFxQQMAeAAUAAFxQQMAxAAUAAFxQQMAQwAUAAFyQQMAQwAVAAFxQQMAxgAVAAFxQQMAGAAVAAFxQQMA1AAVAAFxQQMAMwAVAAFyQQMAIQAVAAFxQQMANwAWAAFyQQMAeAAWAAFxQQMA+QAWAAFdQQMA2gAWAAFxQQMA2wAWAAFdQQMAzAAWAAFdQQMA7gAWAAFdQQMAHwAWAAFxQQMAXwAWAAFdQQMAvwAWAAFdQQMADgAWAAFxQQUALQAWAD0AFgACcUEDAGsAFgABXUEDALoAFgABcUEDAMkAFgABcUEDAGkAFgABcUEDAEgAFgABXUEDAEYAFgABcUEFABUAFgAlABYAAl1BAwC1ABcAAXFBAwBmABcAAXFBAwB0ABcAAXFBAwAyABcAAXFBAwBEACgAAV1BAwALACgAAXFBAwAcACgAAXFBAwAlACgAAV1BBQAEACgAFAAoAAJdQQMAMwAoAAFduAAoELkAGQAH9EEDABYAGQABXUEDABoAGQABcUEDAEgAGQABXUEDACUAGQABXUEDAAQAGQABXUEDABsAGgABcUEDAEUAHAABXUEDAOMAHQABXUEDAAUAHQABcUEDALUAHQABcUEDAMIAHQABcUEDANAAHQABcUEDAEYAHgABXUEFAMAAHgDQAB4AAnFBAwAgAB8AAXJBAwDRAB8AAXFBAwATAB8AAXJBBQCzAB8AwwAfAAJxQQMAMgAfAAFyQQMAAAAfAAFxQQMAQAAfAAFyQQcAYAAfAHAAHwCAAB8AA3JBAwC1ACEAAXFBAwDkACEAAV1BAwDBACEAAXFBAwALACQAAXFBAwAVACQAAV1BAwBDACUAAV1BAwBSACUAAXFBAwBFACcAAV1BAwATACcAAV1BAwDPACkAAXFBAwCWACoAAXJBAwBnACoAAXJBAwBIACoAAXFBBwDJACoA2QAqAOkAKgADcUEDAFkAKgABcUEDALoAKgABcUEDAPoAKgABXUEDADwAKgABckEDAA0AKgABcUEFAFwAKgBsACoAAl1BAwB7ACoAAV1BBQB6ACoAigAqAAJxQQMAKgAqAAFyQQMASQAqAAFdQQMAOQAqAAFxQQMAuAAqAAFdQQMAJwAqAAFxQQMAZAAqAAFxQQMAggAqAAFyQQMAOQAsAAFyQQMAfAAsAAFdQQMAXwAsAAFdQQMAbQAsAAFdQQMASgAsAAFyQQMApgAsAAFyQQMAkwAsAAFyQQMACQAtAAFdQQMAigAtAAFxQQMAmQAtAAFxQQMApgAtAAFyQQMAlQAtAAFyQQMACAAuAAFdQQMAGQAuAAFdQQMAmQAuAAFxQQUAawAuAHsALgACXUEDAIsALgABcUEDAAsALgABcUEDALkALgABcUEDAKgALgABcUEDAHYALgABcUEDAKIALgABckEDAEMAMAABXUEFAGUAMAB1ADAAAl1BAwDGADAAAXFBAwAGADAAAXFBAwDTADAAAXFBAwAiADAAAXFBAwDhADAAAXFBAwAoADEAAV1BAwDlADEAAXFBAwC9ADMAAV1BAwBcADMAAV1BAwDmADMAAV1BAwABADQAAXFBAwA/ADUAAXK4ADcQuQA2AAf0uAAfELkARAAG9EEDAEkARAABckEDAHgARAABckEDADcARAABckEDADgARwABcbgAJRC5AEoABvRBAwAoAEoAAXJBAwD/AFEAAV1BAwCPAFEAAXFBAwCvAFEAAXFBBQBPAFEAXwBRAAJdQQMAvwBRAAFdQQMA3wBRAAFdQQMAnwBRAAFdQQcADwBRAB8AUQAvAFEAA11BAwDvAFEAAXFBAwBvAFEAAXFBAwAvAFEAAXFBAwDPAFEAAXEAuAAcL7gADi+4ADMvuAAARVi4AC8vG7kALwAQPlm4AABFWLgANi8buQA2ABA+WbgAAEVYuAA3Lxu5ADcAED5ZuAAARVi4AAEvG7kAAQAKPlm4AABFWLgAAC8buQAAAAo+WbgAAEVYuAAILxu5AAgACj5ZuAAARVi4ACIvG7kAIgAKPllBAwBqAAEAAV1BAwA/AAIAAV1BAwAfAAIAAV1BAwAvAAIAAXFBAwAsAAIAAV1BAwCoAAIAAV1BAwCVADMAAXFBAwDVADMAAXFBAwArADMAAV1BAwAMADMAAV1BAwBdADMAAXJBAwAeADMAAXFBAwAvADMAAXFBAwDeADMAAXJBAwAdADMAAV1BBQC8ADMAzAAzAAJyQQMABgAzAAFxQQcAxQAzANUAMwDlADMAA11BAwC0ADMAAXFBAwD0ADMAAV24ADMQuQADAAH0QQMAcwADAAFyQQMAFAADAAFxQQMAhQADAAFyQQMAyQADAAFxQQMAGwADAAFdQQUAOwADAEsAAwACckEDAAkAAwABXUEFAJQAAwCkAAMAAnJBAwAjAAMAAXFBCQDAAAMA0AADAOAAAwDwAAMABHJBAwBgAAMAAXJBAwA/AAUAAV1BAwAcAAUAAV1BAwC7AAUAAV1BAwALAAYAAXFBAwAMAAkAAXFBAwC6AAoAAV1BAwBEAAwAAV1BAwADAA0AAXFBAwBDAA4AAXJBAwDGAA4AAV1BAwA8AA4AAXFBAwAfAA4AAXFBAwArAA4AAXFBAwD1AA4AAV1BAwDTAA4AAXFBAwDBAA4AAXFBAwD+AA8AAV1BAwC6AA8AAV1BAwDpAA8AAV1BAwAjABAAAV24AC8QuQARAAH0QQMAVwATAAFyQQUAtwAUAMcAFAACcUEDALgAFAABXUEFAIgAFACYABQAAl1BAwD6ABQAAV1BAwANABQAAXFBAwB9ABQAAXFBAwDPABQAAV1BAwAfABQAAXFBAwA+ABQAAXFBAwCtABQAAV1BAwDcABQAAV1BAwBpABQAAV1BAwAoABQAAXFBAwBHABQAAXJBAwA0ABQAAV1BAwBQABQAAV1BBQDHABUA1wAVAAJxQQMAWgAVAAFyQQMAewAVAAFyQQMAmwAVAAFyQQMAqgAVAAFyQQMA6QAVAAFdQQMAJwAVAAFyQQMAhwAVAAFyQQMAZgAWAAFdQQMAWQAWAAFyQQMAGgAWAAFyQQMAugAWAAFdQQMAbAAWAAFxQQMALAAWAAFxQQMAXgAWAAFxQQUAzwAWAN8AFgACXUEDAH8AFgABcUEDAA8AFgABcUEDAD8AFgABcUEDAB0AFgABcUEDAOwAFgABXUEDACsAFgABckEDABoAFgABXUEDADoAFgABckEDAPgAFgABXUEDAEEAFgABXUEDAFAAFgABXUEDAD0AFwABcUEDABoAFwABckEDAMsAGAABcUEDABsAGQABckEDAEMAHAABckEDAEQAHAABXUEDAB4AHAABcUEDAC8AHAABcUEDAL8AHAABXUEDADwAHAABcUEFAMMAHADTABwAAnFBAwBQABwAAV1BAwDwABwAAXJBAwAFAB0AAXFBAwBDAB0AAV1BAwBFAB4AAV1BAwANACEAAXFBAwBWACQAAXJBAwAnACUAAXFBAwAvACcAAXFBAwBfACcAAXJBAwB+ACcAAXJBAwA/ACgAAXFBAwA/ACkAAXFBAwB/ACkAAXFBAwCGACkAAXFBAwCVACkAAXFBAwAzACoAAV1BAwBlACoAAXJBAwBmACoAAV1BAwC4ACoAAXFBAwCJACoAAXFBAwBqACoAAXFBAwDqACoAAV1BAwD7ACoAAV1BAwBcACoAAXFBAwDOACoAAV1BAwA/ACoAAXFBAwB/ACoAAXFBAwAOACoAAXFBAwDdACoAAV1BAwAbACoAAXJBAwAqACoAAXFBAwA6ACoAAXJBAwC5ACoAAV1BAwApACoAAXJBAwBHACoAAXFBAwDmACoAAXFBAwB0ACoAAV1BAwBCACoAAV1BAwBQACoAAV1BAwC2ACwAAXJBAwBpACwAAV1BAwCsACwAAV1BBQAPACwAHwAsAAJxQQMAzwAsAAFdQQMAPwAsAAFxQQMAfwAsAAFxQQMALQAsAAFxQQMA+wAsAAFdQQMASAAsAAFxQQUAxQAsANUALAACckEDAFAALAABXUEFAM8ALQDfAC0AAnJBAwC+AC0AAXJBAwAmADAAAV1BAwAoADEAAV1BAwAXADEAAXFBAwDUADEAAXFBAwA0ADIAAV1BAwBSADIAAV1BAwAaADQAAV1BAwA7ADQAAXFBAwAtADQAAV1BAwD/ADQAAXJBAwAsADQAAXFBAwDbADQAAXJBAwC4ADQAAXFBAwCXADQAAXG4AAEQuQA1AAH0QQMAswA1AAFxQQMApgA1AAFxQQMAqQA1AAFdQQMAvAA1AAFdQQUAbAA1AHwANQACXUEDAEwANQABXUEDAM0ANQABXUEDAA0ANQABXUEFABwANQAsADUAAl1BAwAsADUAAXFBAwAaADUAAXFBAwDpADUAAV1BAwCFADUAAXFBAwDCADUAAXFBAwBAADUAAXK4AA4QuQA7AAH0QQMAKwA7AAFxQQMAvgA7AAFdQQMA+gA7AAFdQQMAyQA7AAFduAAIELkAQQAB9LgAHBC5AEcAAfRBAwBfAEcAAV1BAwA7AEcAAXFBAwBCAEcAAV24ACIQuQBNAAH0QQMAWABNAAFyQQMAQgBNAAFdQQMA2ABRAAFdQQMAiABRAAFxMDEBQQMAewABAAFxQQMAbAABAAFxQQMA7wABAAFxQQMA1wADAAFdQQcAtgAHAMYABwDWAAcAA11BAwDZAAkAAV1BAwC6AAkAAV1BAwDaAA0AAV1BAwBiABIAAXFBAwBUABIAAXFBAwBmABQAAXFBAwBZABQAAXFBAwDQABUAAXFBAwB0ABcAAXFBBQDZABgA6QAYAAJxQQcAtgAdAMYAHQDWAB0AA11BAwD2AB0AAV1BBwC2ACEAxgAhANYAIQADXUEDAPYAIQABXUELALkAIwDJACMA2QAjAOkAIwD5ACMABV1BAwApACMAAXFBAwALACcAAXFBAwAMACgAAXFBAwDZACkAAXFBAwDqACkAAXFBAwByACoAAXFBAwDWACoAAXFBAwA/AFEAAV1BAwB/AFEAAV1BAwBPAFEAAXEAQQcAyQAGANkABgDpAAYAA11BBQC5AAoAyQAKAAJdQQUAxgAMANYADAACXUEDANYADgABXUEDAFgAFAABcUEDAHwAFwABcUEHALYAHgDGAB4A1gAeAANdQQMA9gAeAAFdQQcAuQAgAMkAIADZACAAA11BAwD5ACAAAV1BBQC5ACQAyQAkAAJdQQMA6QAkAAFdQQMAdAApAAFxQQMA1gAqAAFxQQMAeQAqAAFxQQMAPAAzAAFdQQMAOwA0AAFdQQMAPgA1AAFdISMmJxYVFAYjIiY1NDY3NTQjIgYHFhcOAR0BNjMyFhUUBiMiJjU0NzU0NyYHPgEzMhYdARYXETMDNCYjIgYVFBYzMjYnNCYjIgYVFBYzMjYBzyUYOAIjHxsnIxlnIDkLOBgYJAkOGyclHR0lBzQmKQlRNz9KUiEklBQODhMTDg4UpRQODhMTDg4UJSEIBRsnJxsaJgKOZyceBCgFKho/BCcbGycnGxANXzYZDwQ4SUU+lhwsAVn+sQ4UFA4OExMODhQUDg4TEwAAAAAEAB7/VQHeAZAAEgAeACoAWBZhuwA7AAUARgAEK7sAQAAGAB8ABCu7ABkABgAGAAQruwArAAUAVgAEK7gAKxC5ABIABvRBAwC4ABIAAXFBAwAIABIAAXJBAwDJABIAAXFBAwD7ABIAAXFBAwA6ABIAAXJBAwDpABIAAXFBAwBoABIAAXFBAwCYABIAAXFBAwAoABIAAXK5AAAABfRBAwD3AAAAAXFBAwAnAAAAAXJBAwCyAAIAAV1BAwBDAAIAAXJBAwBjAAIAAV1BAwDDAAIAAXFBAwB2AAIAAV1BAwCXAAIAAV1BAwCJAAIAAXJBAwDHAAIAAV1BAwCmAAIAAV1BAwCEAAIAAV1BAwBDAAIAAXFBAwDzAAIAAXFBAwByAAIAAXFBAwCBAAIAAXFBAwBgAAIAAXFBAwBKAAQAAXJBAwA9AAQAAXJBBQAfAAQALwAEAAJyQQMA6wAEAAFxQQMAhQAEAAFyQQMAxQAEAAFxQQMAKQAGAAFyQQkAaQAGAHkABgCJAAYAmQAGAARdQQcAOQAGAEkABgBZAAYAA3FBAwBcAAYAAV1BAwAfAAYAAXJBBQA6AAYASgAGAAJyQQUA6QAGAPkABgACXUEFAAkABgAZAAYAAnFBCwAJAAYAGQAGACkABgA5AAYASQAGAAVdQRMAeQAGAIkABgCZAAYAqQAGALkABgDJAAYA2QAGAOkABgD5AAYACXFBAwAJAAYAAXJBAwBhAAYAAXFBAwD6AAgAAV1BAwAJAAgAAXFBAwDoAAgAAV1BBQAXAAkAJwAJAAJdQQMAZwAJAAFdQQMAlAAKAAFxQQMA9QAKAAFdQQMAhgAKAAFxQQMA1gAKAAFxQQMAxQAKAAFxQQMAFAAKAAFxQQMAYAAKAAFxQQMAAwALAAFxQQMAYAALAAFxuAAGELgADNxBAwCGAAwAAXFBAwB7AAwAAXFBBQDPAAwA3wAMAAJdQQsAXwAMAG8ADAB/AAwAjwAMAJ8ADAAFckEDABYADAABcUEDAKYADAABcUEDABEADAABcroADgAGAAwREjlBAwDEAA4AAXFBAwC2AA4AAXFBAwAXAA4AAXJBAwDXAA4AAXFBAwBFAA4AAXJBAwAjAA4AAXJBAwAyAA4AAXJBAwC4ABEAAXFBAwANABEAAXJBAwDpABEAAXFBAwBzABEAAXFBAwCAABEAAXG5ABMABvRBAwCWABMAAXFBAwCHABMAAXFBAwCXABMAAV1BAwCnABMAAXFBAwBmABMAAXFBAwDGABMAAXFBAwAVABMAAXJBAwCKABkAAV1BAwAbABkAAXJBAwCZABkAAV1BAwBhABkAAXFBAwBQAB8AAXJBAwCQAB8AAV1BAwA9AB8AAXFBAwAvAB8AAXFBAwACAB8AAXFBBQCQAB8AoAAfAAJyQQkAoAAfALAAHwDAAB8A0AAfAARxQQMA8AAfAAFdQQMA0gAiAAFxuAA7ELgAJdC4ACUvQQMAEAAsAAFyQQMAwgAsAAFxQQMABAAsAAFyQQMA1QAsAAFdQQMARgAsAAFyQQMAtwAsAAFxQQMAJQAsAAFyQQUApAAsALQALAACXUEDAMMALAABXUEDAOIALAABcUEDAPAALAABcUEDADAALAABckEDAGkALgABcUEDAKoALgABXUEFALwALgDMAC4AAnFBAwDOAC4AAV1BBQDvAC4A/wAuAAJxQQUAHwAuAC8ALgACckEDAD0ALgABckEDANsALgABXUEDAAoALgABckEDAEkALgABckEDAPYALgABXboALwAGABkREjm4AC8vQQUAcAAvAIAALwACXUEDAAIALwABXUEDAEMALwABXUEFABMALwAjAC8AAl1BAwAxAC8AAV1BBQDgAC8A8AAvAAJdQQUAoAAvALAALwACXUEDADUAMAABXUEDAPUAMAABXUEDAGYAMAABcUEDAOYAMAABXUEDALYAMAABXUEDAEYAMAABXUEDAAUAMAABXUEDABQAMAABXUEDACMAMAABXUEDAOkAMQABXUEDAAkAMQABckEFAGYAMwB2ADMAAnG6ADUARgA7ERI5QQMARAA1AAFyQQcAFQA1ACUANQA1ADUAA3JBAwDWADUAAXFBAwD5ADUAAV1BAwBpADUAAV1BAwDJADUAAV1BAwBbADUAAV1BAwDcADUAAV1BAwC7ADUAAV1BAwAZADUAAXFBAwDpADUAAXJBAwAGADUAAXJBAwBFADUAAXFBAwD0ADUAAXFBAwDEADUAAXFBAwDiADUAAXFBAwDEADYAAXFBAwA5ADYAAXJBAwDVADYAAXFBAwBDADYAAXFBAwAgADYAAXK6AEkARgAAERI5QQMAqABJAAFdQQcASQBJAFkASQBpAEkAA11BBQDZAEkA6QBJAAJxQQUAugBJAMoASQACXUEDADsASQABXUEDAHoASQABXUEHABkASQApAEkAOQBJAANyQQMAqQBJAAFxQQMA9wBJAAFdQQMAdABJAAFxugA3AEYAABESObgASRC5ADcABvRBAwBKADcAAV1BAwC6ADcAAV1BAwBLADcAAXJBAwA8ADcAAXJBAwANADcAAXJBAwDNADcAAV1BAwD+ADcAAXFBBQDPADcA3wA3AAJxQQMAHgA3AAFyQQMALQA3AAFyQQMA/AA3AAFdQQMA2wA3AAFdQQMAagA3AAFdQQMAegA3AAFxQQUAWQA3AGkANwACcUEDAHgANwABXUEDAOYAOQABcUEDAKcAPQABXUEDAAQAPgABcUEDALMAPgABcUEDANAAPgABcUEDANAAPwABcUEJAKAAQACwAEAAwABAANAAQAAEcUEDAAIAQAABcUEDAPMAQAABXUEHAAYAQAAWAEAAJgBAAANdQQMA5gBAAAFdQQUA5gBAAPYAQAACcUEHAAYAQAAWAEAAJgBAAANyQQMAOABAAAFyQQMAPQBAAAFxQQMALwBAAAFxQQMASgBAAAFyQQMAVgBAAAFxQQMAdgBAAAFxQQUAZgBAAHYAQAACXUEFADMAQABDAEAAAl1BAwCiAEAAAV1BBQCQAEAAoABAAAJyQQMAkABAAAFdQQMAUABAAAFyQQMA8QBBAAFdQQMAtABCAAFxQQMABQBCAAFxQQMA5ABCAAFdQQMAwgBCAAFxQQMA/ABFAAFdQQMA6wBFAAFdQQMACwBFAAFxQQMA6ABLAAFdQQMAaABLAAFdQQMA2QBLAAFdQQMA+gBLAAFdQQMA+QBLAAFyQQMAuABLAAFyQQUA2ABLAOgASwACckEDALgASwABXUEDAEcASwABckEDAF0ATAABXUEDABkATAABXUEDAHgATQABcUEDALkATQABcUEDAIkATQABXUEDADoATQABXUEDAB8ATQABcUEDAIwATQABcUEFAGoATQB6AE0AAl1BAwBJAE0AAXJBAwBJAE0AAV1BAwAIAE0AAV1BAwA2AE0AAXJBAwDUAE8AAXFBAwAEAE8AAXFBAwA1AE8AAXJBAwBFAE8AAV1BBQAWAE8AJgBPAAJyQQMANwBPAAFdQQMAZgBPAAFdQQMAFgBPAAFxQQMAZQBPAAFxQQMA9ABPAAFxQQMARABPAAFxQQMARABPAAFyQQMA4wBPAAFxQQUA5gBRAPYAUQACXUEDAGYAUQABcbgALxC5AFIABfRBAwBnAFIAAXFBAwCpAFMAAV1BAwBjAFMAAXFBAwAJAFUAAXJBAwAQAFkAAXG4ACsQuABa3AC4AABFWLgATi8buQBOABA+WbgAAEVYuABXLxu5AFcAED5ZuAAARVi4AC0vG7kALQAKPlm4AABFWLgAQy8buQBDAAo+WbsAHAABAAMABCu7AAkAAgAWAAQruwA9AAEAIgAEK0EDACAACQABXUEDAAEACQABXUEFAIIACQCSAAkAAl1BAwDiAAkAAV1BAwCjAAkAAV1BAwCyAAkAAV1BAwASAAkAAV1BBQBhAAkAcQAJAAJdQQUA4AAJAPAACQACckEDANAACQABXbgACRC4AADQuAAAL0EDALoAAAABXUEHADMAAABDAAAAUwAAAANdQQMA5gABAAFxQQMAxgABAAFxQQMAagABAAFxQQMAhgABAAFyQQMAAwABAAFyQQMA8gABAAFxQQMAaQACAAFxQQMAigACAAFxQQMA6gACAAFxQQMAuAACAAFdQQMASAACAAFxQQMAbwAcAAFyQQMAnwAcAAFxQQcAjwAcAJ8AHACvABwAA3JBAwB6ABwAAXK6AA4AAwAcERI5QQMAGgAOAAFyQQMASQAOAAFyQQUAyAAOANgADgACcbgADhC5AAMAAvRBAwCcAAMAAXJBAwBKAAMAAXFBAwB6AAMAAXJBAwC2AAgAAV1BAwD1AAgAAV1BAwC0AAoAAXFBAwBVAAoAAV1BAwAEAAoAAXFBAwDyAAoAAV1BAwAUAAsAAXG5ABAAAvRBAwCVABAAAXFBAwC1ABEAAXFBAwBVABIAAV1BAwC4ABIAAV1BAwA0ABIAAV1BAwBDABIAAV1BAwCnABMAAXFBCQCAABYAkAAWAKAAFgCwABYABF1BAwDiABYAAV1BBQDgABYA8AAWAAJyQQMA0AAWAAFdQQUAHwAiAC8AIgACcUEDAD4AIgABcUEDANAAIgABcUEDAMgAQwABcbgAQxC5ACgAAfRBEQA3ACgARwAoAFcAKABnACgAdwAoAIcAKACXACgApwAoAAhxQQkAxwAoANcAKADnACgA9wAoAARxQQcABwAoABcAKAAnACgAA3JBEQAHACgAFwAoACcAKAA3ACgARwAoAFcAKABnACgAdwAoAAhdQQMA5wAoAAFdQQMApwAoAAFdQQMABwAoAAFxQQUANgAoAEYAKAACckEDAJ0AKwABXUEDAPsAKwABXbgAVNC5AC0AAfRBAwCdAC8AAV1BAwC/AC8AAV1BAwC/AC8AAXFBAwAsAC8AAXJBAwA7AC8AAXJBAwDbADAAAV1BAwAWADEAAXG4AE4QuQAyAAH0QQUAKAAyADgAMgACcUEFADkAMgBJADIAAnJBIQAIADIAGAAyACgAMgA4ADIASAAyAFgAMgBoADIAeAAyAIgAMgCYADIAqAAyALgAMgDIADIA2AAyAOgAMgD4ADIAEF1BAwAIADIAAXFBFwBYADIAaAAyAHgAMgCIADIAmAAyAKgAMgC4ADIAyAAyANgAMgDoADIA+AAyAAtxQQcACAAyABgAMgAoADIAA3K6ADUAQwBOERI5QQMA9wA1AAFxQQMAKQA1AAFyQQMA/AA1AAFdQQMAHwA1AAFxQQUAzAA1ANwANQACXUEDALkANQABXUEDAGgANQABXUEDAEcANQABckEDAOUANQABcUEDAMYANgABcUEDANIANgABcboANwBDAE4REjlBAwBDADcAAV1BAwBmADcAAV1BAwAIADcAAXJBAwD5ADcAAXFBAwAbADcAAXJBAwCsADcAAXFBAwAuADcAAXJBAwDPADcAAV1BAwB/ADcAAXFBAwD/ADcAAV1BAwDeADcAAV1BAwBtADcAAXFBAwBcADcAAXFBAwA7ADcAAXJBAwC5ADcAAV1BAwDGADcAAXFBAwBzADcAAV1BAwAyADcAAV1BAwBSADcAAV1BAwAfADkAAXFBAwDrADkAAV1BAwCEADkAAXFBAwBDAD0AAV1BAwCkAD0AAV1BBQAfAD0ALwA9AAJxQQMAPgA9AAFxQQcAFAA9ACQAPQA0AD0AA11BAwBQAD0AAV1BAwDQAD0AAXG6ADsAIgA9ERI5QQMABAA+AAFxQQMA8wA+AAFdQQMAsgA+AAFxQQMADgBCAAFxQQMAvABCAAFxQQMA+wBCAAFdQQMAHwBHAAFxQQUAZABHAHQARwACXUEDAIUASAABcUEDAOwASAABXUEDAFwASAABcUEDAOUASAABcUEDAMIASAABcboASQBDAE4REjlBAwAzAEkAAV1BAwDWAEkAAXFBAwBHAEkAAXFBAwCoAEkAAXFBAwBqAEkAAXFBAwC6AEkAAV1BAwB/AEkAAXFBBQDNAEkA3QBJAAJdQQMA+gBJAAFdQQMAOQBJAAFyQQUAGABJACgASQACckEDAOcASQABcUEFAGYASQB2AEkAAl1BAwBCAEkAAV1BAwBRAEkAAV26AEsAQwBOERI5QQMAawBLAAFxQQMAHQBLAAFxQQMAXwBLAAFxQQUA3wBLAO8ASwACXUEDAD8ASwABcUEDAH8ASwABcUEDAP0ASwABXUEFALwASwDMAEsAAl1BAwBqAEsAAV1BAwCpAEsAAV1BAwD5AEwAAXJBAwAXAEwAAV1BAwBVAEwAAV1BAwAHAE0AAV1BAwBmAE0AAV1BAwBUAE0AAV1BAwA3AE8AAV1BAwBmAE8AAV1BAwBEAE8AAV1BAwDUAFAAAXFBAwAWAFAAAXFBAwAJAFAAAXJBAwD1AFAAAXFBAwAzAFAAAXJBAwDjAFAAAXFBAwB0AFEAAV1BAwBQAFEAAV1BAwBGAFcAAV1BBQCXAFcApwBXAAJdQQMA9wBXAAFdQQMAxwBXAAFdQQMARwBXAAFxQQMAdgBXAAFdQQUAFgBXACYAVwACXTAxAUEDAFQAAgABcUEFAMkACADZAAgAAl1BAwApAAgAAXFBAwDqAAgAAV1BBQBTAAoAYwAKAAJxQQUAxgAKANYACgACXUEDACYACgABcUEDAEYACgABcUEDAOMACwABXUEDAJQADgABcUEDAKYADgABcUEDANcADgABcUEDAPUALAABcUEDAOsALgABcUEDABsALgABckEDAAoANQABcUEDAD8ANgABcUEDABcANwABcUEDAGgANwABcUEDAHkANwABcUEDADsANwABcUEDAC0ANwABcUEDADQAOAABcUEDABUAOAABcUEDAFYAOAABcUEHALYAPgDGAD4A1gA+AANdQQcAtgBCAMYAQgDWAEIAA11BAwDIAEQAAV1BAwC5AEQAAV1BAwDZAEQAAV1BAwBVAEkAAXFBAwAGAEkAAXFBAwAXAEkAAXFBAwApAEkAAXFBAwAcAEoAAXFBAwBWAEsAAV1BBQAHAEsAFwBLAAJxQQMABgBMAAFxQQMAiQBNAAFxQQMAmwBNAAFxAEEFAMkABQDZAAUAAl1BAwApAAUAAXFBBQDGAAcA1gAHAAJdQQMAJgAHAAFxQQMA4gAIAAFdQQMAMwAKAAFxQQMARQAKAAFxQQMA5AALAAFdQQUAxgALANYACwACXUEDACYACwABcUEDANgADgABcUEDAJkADgABcUEDABkANgABcUEDAAsANgABcUEDAD0ANgABcUEDAHkANwABcUEDACoANwABcUEDAGsANwABcUEFAA4ANwAeADcAAnFBAwA/ADcAAXFBAwB5ADgAAXFBAwAcADgAAXFBAwANADgAAXFBAwA/ADgAAXFBBQAMADkAHAA5AAJxQQcAtgA/AMYAPwDWAD8AA11BBwC5AEEAyQBBANkAQQADXUEDAMgARQABXUEDALkARQABXUEDAJUASAABcUEDAB4ASAABcUEDAA8ASAABcUEDACoASQABcUEDAAsASQABcUEDAB0ASQABcUEDAD8ASQABcUEDABsASgABcUEDAA4ASgABcUEFAA8ASwAfAEsAAnFBAwA/AEsAAXFBAwAMAEwAAXFBAwAeAEwAAXFBAwAcAFIAAXIFDgEjIiY1NDYzMhYVFAcWMzI3BzQmIyIGFRQWMzI2JzQmIyIGFRQWMzI2JRQjIj0BNCMiBgcWFw4BHQE2MzIWFRQGIyImPQE0NyYHPgEzMhYdARQzMjURMwHeAjs/KEAgFhcgIwwRVgJtEAsLEBALCxCvFA4OExMODhQBMmJhYSA3CzgYGCQNERwmHyMdJTQmKQlPNz5FPj0kIjxNMiUWICAWJQ4HbDILEBALCxAQmA4UFA4OExMnWlu2ZyYfBCgFKhpBBiYbGyglH3o2GQ8EOElEP704OAE4AAAAAwAY/yUBcQGQAD8ASQBVGBS7AFAABgAsAAQruwBEAAYACwAEK7sAJgAGAEoABCu7AAUABgBIAAQruwAAAAUAFwAEK0EDAMkAAQABcUEFAAkAAQAZAAEAAnJBAwC6AAEAAXFBAwDrAAEAAV1BAwAtAAEAAXJBAwBLAAEAAXJBAwA6AAEAAXJBAwDpAAEAAXFBAwBZAAEAAXFBAwD2AAEAAV1BAwA+AAMAAXJBAwC+AAQAAV1BAwC9AAUAAV1BAwDCAAcAAV1BAwDPAAkAAV1BAwAOAAoAAXFBAwCeAAsAAV1BBQCtAAsAvQALAAJdQQMAywANAAFdQQMACAANAAFxQQMApwANAAFxQQMAqAAOAAFxuABIELgAENC4ABAvQQMAkwASAAFdQQMAGQASAAFyQQMA6gASAAFdQQMAOgASAAFxQQMAGwASAAFxQQMA3AASAAFdQQMAawASAAFxQQMAugASAAFxQQMACgASAAFxQQMACgASAAFyQQMAyQASAAFxQQMAQQASAAFxQQMAcAASAAFdQQMAzAAsAAFxQQMAbgAsAAFyQQMA3wAsAAFyQQMA3wAsAAFxQQkAfwAsAI8ALACfACwArwAsAARyQQMAbgAsAAFdQQUALAAsADwALAACckEDAPkALAABXUEDAEUALAABcroAEwAsAAAREjlBAwCkABMAAV1BAwAlABMAAXJBAwBFABMAAXJBAwC6ABMAAXFBAwDaABMAAV1BBQDrABMA+wATAAJdQQMAvQATAAFdQQMAKgATAAFxQQMAagATAAFxQQMACQATAAFxQQMAlQATAAFdQQMANAATAAFyQQMAcQATAAFdQQMAQAATAAFxuAAFELgAFdBBAwBYABUAAV1BAwB0ABUAAV1BAwA4ABYAAXJBAwDXABYAAXFBAwB2ABcAAXJBBQCrABoAuwAaAAJxQQMASQAaAAFxQQMA2QAaAAFdQQMARQAcAAFxQQMApQAcAAFxQQMAJAAcAAFxQQcA1gBEAOYARAD2AEQAA11BCQAGAEQAFgBEACYARAA2AEQABHFBFwBWAEQAZgBEAHYARACGAEQAlgBEAKYARAC2AEQAxgBEANYARADmAEQA9gBEAAtxQQcABgBEABYARAAmAEQAA3JBAwCcAEQAAV1BEwAGAEQAFgBEACYARAA2AEQARgBEAFYARABmAEQAdgBEAIYARAAJXUEFAKYARAC2AEQAAl1BBQA1AEQARQBEAAJyuABEELkAIgAF9EEDAFAAIgABckEDABIAIgABckEDAKMAIgABXUEDAAQAIgABckEDACQAIgABXUEDACkAIgABcUEDALkAIgABXUEFANUAIgDlACIAAl1BAwBEACIAAXJBAwD0ACIAAV1BAwCjACIAAXFBAwCCACIAAV1BAwDAACIAAV1BAwCQACIAAV26AB4ARAAiERI5QQMASAAeAAFxQQMAqgAeAAFdQQMAvAAeAAFxQQMAvwAeAAFdQQMALwAeAAFxQQMAPgAeAAFxQQMAGgAeAAFxQQMA2AAeAAFdQQMAlQAeAAFdQQMAQQAeAAFyQQMAOQAfAAFxQQMAzAAfAAFxQQMAbwAfAAFyQQMADwAfAAFxQQUAKgAfADoAHwACckEDAEQAHwABcUEDAEAAHwABcroAIABIAAUREjlBAwDZACAAAV1BAwD5ACAAAXFBBQDqACAA+gAgAAJdQQMA2wAgAAFxQQMAOwAgAAFxQQMAnAAgAAFdQQMAbgAgAAFyQQMAvwAgAAFdQQMADwAgAAFxQQMALAAgAAFxQQMAzAAgAAFdQQMAOwAgAAFyQQMAWgAgAAFdQQMAGQAgAAFxQQMAKQAgAAFyQQMARQAgAAFxQQMApAAgAAFxQQMA8wAhAAFdQQUABQAhABUAIQACckEDADoAIQABcUEDAFUAIQABckEDAOQAIQABXUEDAJAAIQABXUEDAEAAIQABckEDAHIAIwABXUEDACUAIwABXUEDAJAAIwABXUEDAEAAIwABckEDAKEAJAABXUEDADYAJAABckEDACcAJAABckEDANYAJAABcUEDAMUAJAABcUEDAJAAJAABXUEDAEAAJAABckEDAOIAJQABXUEDAHMAJQABXUEDABwAJQABcUEDADoAJQABcUEDAPMAJQABXUEDAEAAJQABckEDAJAAJQABXUEDAEIAJgABckEDAHMAJgABXUELAAYAJgAWACYAJgAmADYAJgBGACYABV1BFwBWACYAZgAmAHYAJgCGACYAlgAmAKYAJgC2ACYAxgAmANYAJgDmACYA9gAmAAtxQQMABgAmAAFyQQMAGQAmAAFyQQMAHQAmAAFxQQMALwAmAAFxQQMALQAmAAFyQQMAPAAmAAFxQQMAOQAmAAFyQQMABgAmAAFxQQMAZgAmAAFdQQMA0wAmAAFdQQUA4gAmAPIAJgACXUEHAIAAJgCQACYAoAAmAANdQQMAKgAnAAFyQQMAQgAnAAFyQQMAxAAoAAFdQQMA8QAoAAFdQQMAQQAoAAFyQQMAygAqAAFxQQMAyQAqAAFdQQMACgAuAAFxQQMAzAAuAAFxQQMAygAuAAFdQQMAVAAuAAFyuABEELgAMdC4ADEvQQMAEwAxAAFyQQMAowAxAAFdQQMAVAAxAAFyQQMAxQAxAAFdQQMAVgAxAAFdQQMA9AAxAAFdQQMA0wAxAAFdQQMAQwAxAAFyQQUAgAAxAJAAMQACXUEDAKAAMQABcUEDAFYAMgABckEDAMMAMgABXUEDAJAAMgABXbgARBC4ADPQuAAzL0EDAPIAMwABXUEDAKMAMwABcUEDAOQAMwABXUEDAEUAMwABckEDACwAMwABckEDAD0AMwABckEDAN4AMwABcUEDAP0AMwABcUEDAM0AMwABcUEDAOwAMwABcUEDAMQAMwABXUEDANMAMwABXUEDAFMAMwABckEDAKEAMwABXUEFAIAAMwCQADMAAl1BAwCjADQAAXFBAwDEADQAAV1BAwBIADQAAXJBAwAqADQAAXJBAwDqADQAAXFBAwA5ADQAAXFBAwBVADQAAXJBAwDkADQAAV1BAwDzADQAAV1BAwCQADQAAV1BAwDxAEoAAV1BAwA4AEoAAXJBAwA+AEoAAXFBBQAfAEoALwBKAAJxQQMALgBKAAFyQQMARABKAAFyQQUAcABKAIAASgACXUEDANAASgABXboANQBKACYREjlBAwDnADUAAV1BAwBZADUAAV1BBQDqADUA+gA1AAJxQQMACgA1AAFyQQMA2wA1AAFxQQUAvQA1AM0ANQACcUEDAD4ANQABckEDAC8ANQABckEDAA0ANQABcUEDABsANQABckEDAGoANQABcUEDALkANQABXUEDAMgANQABXUEDADcANQABcUEDACUANQABcbgACxC4ADnQuAA5L0EDAKMAOQABcUEDANcAOQABXUEDAJAAOQABXUEDAEAAOQABckEDAL8AOgABcUEDAEQAOgABckEFAOUAOwD1ADsAAl1BAwAnADsAAXJBAwDKADsAAXFBAwAKADsAAXFBAwApADsAAXFBAwD2ADsAAXFBAwCgADsAAV1BAwBAADsAAXJBAwDUAD0AAXFBAwBKAD0AAXJBAwCrAD0AAXFBAwAFAD0AAXFBAwDDAD0AAXFBAwDjAD0AAXFBAwA9AEcAAXJBAwAsAEsAAXJBDwAGAFAAFgBQACYAUAA2AFAARgBQAFYAUABmAFAAB11BAwAGAFAAAXFBEwA2AFAARgBQAFYAUABmAFAAdgBQAIYAUACWAFAApgBQALYAUAAJcUEDADoAUAABckEDAM0AUAABcUEDAN8AUAABcUEDAN8AUAABckEFAJ8AUACvAFAAAnJBBQBvAFAAfwBQAAJyQQMAjgBQAAFyQQMAKwBQAAFyQQMA+ABQAAFdQQUA5gBQAPYAUAACcUEFAAYAUAAWAFAAAnJBAwDmAFAAAV1BAwCmAFAAAV1BAwBEAFAAAXJBAwBLAFQAAXJBAwArAFUAAXJBBQAPAFcAHwBXAAJdQQMALwBXAAFxQQMAPwBXAAFdQQMAAABXAAFxQQMA4ABXAAFxALgAAC+4AAgvuAAARVi4ADwvG7kAPAAQPlm4AABFWLgAKS8buQApAAo+WbsADgABAEIABCu7AC8AAQBNAAQrQQMAMwAAAAFyQQMAVAAAAAFxQQMA4AAAAAFxQQMAcAAAAAFyuAAIELgAAdC4AAEvQQMAXgABAAFxQQMAHAABAAFxQQUASgADAFoAAwACXUEDALwAAwABXUEDADkAAwABckEDALgAAwABcboABAAIADwREjlBAwAcAAQAAXFBAwDtAAQAAXFBBQBaAAQAagAEAAJxQQMASQAEAAFyQQMA/QAHAAFdQQMADgAHAAFxQQMAfAAHAAFdQQMA6wAHAAFdQQMAvwAJAAFdQQMA/gAJAAFdQQMA6wAJAAFdQQMAygAKAAFdQQMACAAKAAFxQQMAxgAMAAFdQQMA4wANAAFdQQMA9AANAAFdQQMABAANAAFxQQMAcwANAAFdQQMAoAANAAFxQQMAlAAOAAFdQQMATwAOAAFxQQMA3wAOAAFxQQMAPAAOAAFxQQUAswAOAMMADgACcUEDAKEADgABcbgADhC4ABDQuAAQL0EDAMgAEgABcUEDAPoAEgABXUEFANwAEgDsABIAAl1BCQAMABIAHAASACwAEgA8ABIABHFBAwBKABIAAV1BBQAGABIAFgASAAJyQQMAtAASAAFxugATAAgAPBESOUEDAAoAEwABcUEDADoAEwABckEDAPsAEwABXUEDAB4AEwABcUEDAC8AEwABcUEFANwAEwDsABMAAl1BAwA7ABMAAXFBAwBqABMAAXFBAwApABMAAXJBAwC1ABMAAXFBAwDbABQAAXFBAwBZABUAAXFBAwBZABUAAV1BAwDpABUAAXFBAwAnABUAAXFBAwA4ABYAAXJBAwDZABYAAXFBAwDJABYAAV1BAwB9ABYAAXJBAwC/ABYAAV1BBQA6ABYASgAWAAJdQQUAGQAWACkAFgACcUEDALgAFgABcUEDAKMAFgABcUEDAOAAFgABcboAFwAIADwREjlBAwCSABcAAXFBAwBEABcAAXFBAwA1ABcAAXJBAwBbABcAAV1BAwB9ABcAAXJBAwC6ABcAAV1BBQDlABcA9QAXAAJdQQUAcwAXAIMAFwACcUEDAKAAFwABcUEHANAAFwDgABcA8AAXAANxQQcAAAAXABAAFwAgABcAA3JBAwCqABkAAXFBAwDMABkAAV1BAwB7ABkAAXFBBQCJABkAmQAZAAJxQQMAuQAZAAFduAA8ELkAGwAB9EEFACgAGwA4ABsAAnFBBQA5ABsASQAbAAJyQQMAyQAbAAFdQRcAWAAbAGgAGwB4ABsAiAAbAJgAGwCoABsAuAAbAMgAGwDYABsA6AAbAPgAGwALcUEHAAgAGwAYABsAKAAbAANyQRkACAAbABgAGwAoABsAOAAbAEgAGwBYABsAaAAbAHgAGwCIABsAmAAbAKgAGwC4ABsADF1BBwDYABsA6AAbAPgAGwADXUEDAAgAGwABcUEDAE0AHAABcroAHgAIADwREjlBAwAqAB4AAXFBAwAbAB4AAXFBAwDcAB4AAV1BAwD7AB4AAV1BAwC6AB4AAV1BAwA5AB4AAXFBAwC1AB4AAXFBAwA7AB8AAXJBAwANAB8AAXFBAwA9AB8AAXFBAwAoAB8AAXJBAwBDAB8AAXK6ACAACAA8ERI5QQMAuQAgAAFdQQMAGgAgAAFxQQMAawAgAAFyQQMAKwAgAAFyQQMAPAAgAAFyQQMAzgAgAAFdQQMA/wAgAAFdQQMAPwAgAAFxQQMA3wAgAAFdQQMA7QAgAAFdQQMAqwAgAAFxQQMAKwAgAAFxQQMACwAgAAFxQQMA+gAgAAFxQQMAuQAgAAFxQQMA1wAgAAFxQQMAKgAhAAFxQQMA/wAhAAFdQQMATQAhAAFyQQMACAAhAAFyQQMAxAAhAAFxQQMAGgAiAAFyQQMAQAAjAAFyQQMANwAkAAFyQQMARgAkAAFxQQUAxAAkANQAJAACcUEDAKgAJgABXUEDAMwAJwABXUEDAPsAJwABXUEDAOsAKAABXUEDAM4AKgABcUEDAA0AKgABcUEDAOwAKgABXUEDAAQALgABcUEDAOQALgABXUEDAKIALgABXUEDAMAALgABcUEDACUALwABXUEDAD0ALwABcUEFAB8ALwAvAC8AAnFBAwDvAC8AAXJBAwDXAC8AAXJBAwCiAC8AAV1BAwDQAC8AAXFBAwA+AE0AAXFBBQAfAE0ALwBNAAJxQQMA7wBNAAFyQQMA0gBNAAFxQQMAoABNAAFdugAxAE0ALxESOUEDADkAMQABcUEDAKkAMQABcUEDAPgAMQABXUEFAMgAMQDYADEAAl1BAwAfADMAAXFBAwCoADMAAV1BAwASADMAAXJBAwDoADQAAV1BAwDTADQAAXFBAwDBADQAAXG6ADUACAA8ERI5QQMA1wA1AAFxQQMAuQA1AAFdQQMAKgA1AAFyQQUA6wA1APsANQACXUEDADsANQABckEDAN0ANQABXUEDAA8ANQABcUEDAD8ANQABcUEDABsANQABckEDAMsANQABXUEDABsANQABcUEDACkANQABcUEDALgANQABcUEDAMYANQABcUEDAOUANQABcboAOQAIADwREjlBAwA6ADkAAXJBAwC7ADkAAV1BAwAuADkAAXFBAwD/ADkAAV1BAwAPADkAAXFBAwA/ADkAAXFBAwCvADkAAXFBBQDPADkA3wA5AAJdQQMA7gA5AAFdQQMAHQA5AAFxQQMAmwA5AAFdQQMAuQA5AAFxQQMASAA5AAFyQQMASwA6AAFyQQMAxAA+AAFxQQMARgA+AAFyQQMA5AA+AAFdQQMA5AA+AAFxQQMA8gA+AAFdQQMAEAA/AAFyQQMAdQBCAAFdQQMA3wBCAAFxQQMATwBCAAFxQQMAPABCAAFxQQUAowBCALMAQgACcUEDAMIAQgABcbgACBC5AEYAAfRBAwB7AEYAAV1BAwA1AEcAAXJBAwAqAEsAAXK4ACkQuQBTAAH0QQ8ABwBTABcAUwAnAFMANwBTAEcAUwBXAFMAZwBTAAddQRsANwBTAEcAUwBXAFMAZwBTAHcAUwCHAFMAlwBTAKcAUwC3AFMAxwBTANcAUwDnAFMA9wBTAA1xQQcABwBTABcAUwAnAFMAA3JBAwDHAFMAAV1BBQDnAFMA9wBTAAJdQQUABwBTABcAUwACcUEFAJcAUwCnAFMAAl1BBQA2AFMARgBTAAJyQQMAJQBVAAFyMDEBQQMA1gAHAAFdQQMA2QAJAAFdQQMAhQAKAAFdQQMA2QANAAFdQQMAhAAQAAFdQQMAgQASAAFdQQMAJgASAAFyQQMApwASAAFxQQMATQASAAFyQQMAggATAAFdQQMAIwATAAFyQQMApAATAAFxQQMATAATAAFyQQMAgwAUAAFdQQMAggAVAAFdQQMAqQAgAAFdQQMADwAgAAFxQQMANwAhAAFxQQMAkQAiAAFdQQMAEAAkAAFyQQMAowAkAAFxQQMAQwAkAAFyQQMABgAkAAFyQQMA1QAoAAFdQQMAtgAoAAFdQQMAuQAqAAFdQQMAuQAuAAFdQQMA2QAuAAFdQQMAdAAyAAFdQQMAdAAzAAFdQQMAOAA3AAFxQQMAsQA7AAFdQQMANgA7AAFyQQMABgA9AAFyQQMAvQBAAAFdQQMAuwBBAAFdQQMAuwBEAAFdQQMAugBIAAFdQQMAuwBJAAFdQQMAwABXAAFxQQMATwBXAAFxAEEDAI4ABwABXUEDANkACgABXUEDANYADAABXUEDAIUADQABXUEDAIEADgABXUEDACgAEgABckEDAKkAEgABcUEDAE0AEgABckEDANYAEwABXUEDAKoAEwABcUEDACoAEwABckEDAE4AEwABckEDAKoAFAABcUEDAEMAFwABckEDAKkAIAABXUEDADwAIAABcUEDAA0AIAABcUEDAD8AIQABcUEDAEcAJAABckEDALkAJwABXUEDANoAJwABXUEDALkAKwABXUEDANkAKwABXUEDALYALQABXUEDAD8ANAABcUEDADkANQABcUEDAD4ANwABcUEDAD8AOQABcUEDALwAQAABXUEDAL8AQQABXUEDALsAQgABXUEDAIwARgABXUEDAIoARwABXUEDAEcAVwABcQUjLgEnFRQGIyImNTQ2MzIXNjcXBgcWFxE0JiMiBgcWFwYVFBcWFRQGIyImNTQ2MzIXJjU0NyYjIgc+ATMyFhUDJiMiFRQzMjU0JzQmIyIGFRQWMzI2AXEoCEseJiAeIiwfBRUEIRseAVAlPTAiPww1HDYJBCcbGyYmGwsNBigbGg0GBVc6QFC9CQwtISM7FA4OExMODhTXGDAIByAtIxofJAMlExATHRwnAa0xOyceBScSNycpEhgdJyYbGycFLhguGgwBOElJP/55AyAfLQfADhQUDg4TEwAAAAMAGP8kAXEBkAAHAEcAUx+DuwBOAAYANAAEK7sAKgAFADsABCu7AAgABQAfAAQrQQUAAQAqABEAKgACckEDAJIAKgABXUEDADYAKgABcUEDAFYAKgABcUEDAHYAKgABXUEDACYAKgABckEFAGwAKgB8ACoAAnFBAwBuACoAAV1BCwC2ACoAxgAqANYAKgDmACoA9gAqAAVxQQsABgAqABYAKgAmACoANgAqAEYAKgAFXUEJAMYAKgDWACoA5gAqAPYAKgAEXUEFAAYAKgAWACoAAnFBBQCGACoAlgAqAAJxQQMARQAqAAFyQQMAgQAqAAFdQQMAoAAqAAFdQQMAoAAqAAFxuAAqELgAANC4AAAvQQMA6wAAAAFxQQUADQAAAB0AAAACckEDAP8AAAABcUEDAK0AAAABcUEDAGIAAAABcUEDAHEAAAABcUEDAP8AAQABcUEDAEcAAgABcUEDAM0ANAABckENAF8ANABvADQAfwA0AI8ANACfADQArwA0AAZyQQMALwA0AAFyQQMA3wA0AAFyQQMA3QA0AAFxQQMAbQA0AAFdQQMAzAA0AAFxQQMAlgBOAAFdQQUABgBOABYATgACcUEDAOYATgABXUEDAM0ATgABcUEDAM0ATgABckEDAC4ATgABckEDAG8ATgABckEHAI8ATgCfAE4ArwBOAANyQQMA3wBOAAFyQQMA3wBOAAFxQQMAfgBOAAFyQQMAXQBOAAFyQQMAawBOAAFdQQ8AVgBOAGYATgB2AE4AhgBOAJYATgCmAE4AtgBOAAdxQQ0ABgBOABYATgAmAE4ANgBOAEYATgBWAE4ABl1BBQDmAE4A9gBOAAJxQQUABgBOABYATgACckEFADUATgBFAE4AAnK6ABIANABOERI5uAASL0EDABIAEgABcUEDACMAEgABXUEDAAMAEgABXUEDAGUAEgABcUEDAK8AEgABXUEDAP8AEgABcUEDAJ0AEgABXUEDAHMAEgABcUEDAFMAEgABcUEFADIAEgBCABIAAnFBAwAhABIAAXJBAwAgABIAAXG5AAQABvRBAwB2AAQAAXFBAwBlAAQAAXFBAwDTAAQAAXFBAwAMAAUAAXFBAwCrAAcAAXFBAwAfAAcAAXJBAwD/AAcAAXFBAwDuAAcAAXFBAwAJAAcAAXJBAwD1AAcAAV1BAwBlAAkAAXFBAwDGAAkAAV1BAwBKAAkAAXJBAwC6AAkAAXFBAwA/AAkAAXJBBwAKAAkAGgAJACoACQADckEDAMkACQABcUEDANUACQABXUEDAAMACQABcUEDAFEACQABcUEDAMMACgABcUEDALYACgABcUEDABgACgABckEDABkACgABcUEDAK0ACgABcUEDAAkACgABckEDAGgACgABXUEDAEQACgABcUEDAFIACgABcUEDAGEACgABcUEDAFMACwABcUEDAAMACwABckEDADkACwABcUEDAKsACwABcUEDAEgACwABcUEDAAMACwABXUEDAMIACwABcUEFABAACwAgAAsAAnK4ACoQuQAMAAb0QQMAZgAMAAFxQQMAGwAMAAFyQQMAXAAMAAFxQQMA/wAMAAFxQQMADgAMAAFyQQMAmwAMAAFdQQMA6gAMAAFxQQMAdAAMAAFxQQMAYAAMAAFdQQMABAANAAFxQQMA6gANAAFxQQMA/QANAAFxQQMAqgANAAFxQQMAwwANAAFdQQMA8gANAAFdQQMApwAOAAFxQQUAnwAOAK8ADgACXUEDALcADgABXUEDABYADgABckEDAGUADgABcUEDAMwAEAABXUEDAPsAEAABXUEDAAsAEAABcUEDAA8AEQABcUEDALsAEQABXUEDAOsAEQABXUEDAMsAEwABXUEDAK4AEwABcUEDALwAEwABcUEDAOoAEwABXUEDAEYAEwABcUEDAA0AFAABcUEDAPsAFAABXUEDADoAFAABcrgAKhC4ABfQuAAXL0EDABsAFwABckEDAA0AFwABckEDAGQAFwABcUEDAHIAFwABcUEDAMYAGAABcUEDAK8AGAABXUEDAJoAGAABXUEDAHYAGAABcUEDAGQAGAABcUEDANEAGQABcUEDAMIAGQABcUEDAFYAGQABcUEDAGcAGQABcUEDALkAGQABcUEFABwAGQAsABkAAnJBAwAJABkAAXFBAwBIABkAAXFBAwCnABkAAXFBAwDkABkAAV1BAwAxABkAAXFBAwAgABkAAXFBAwBwABkAAXG6ABoANAAIERI5QQUAwAAaANAAGgACcUEDALEAGgABcUEDAOIAGgABXUEDAKMAGgABcUEDAPcAGgABXUEDAAgAGgABckEFAFQAGgBkABoAAnFBAwAjABoAAXJBAwAxABoAAXFBAwAwABoAAXJBAwAgABoAAXFBAwBwABoAAXFBAwCmABsAAXFBAwABABsAAXK4AAwQuAAc0LgAHC9BAwDsABwAAXFBAwCsABwAAV1BAwC2ABwAAXFBAwAVABwAAXFBAwC1AB0AAXFBAwBWAB0AAXFBAwAFAB0AAXJBAwBjAB0AAXFBAwBGAB4AAXFBAwAJAB4AAXJBAwCtAB4AAXFBAwCeAB4AAV1BAwA6AB4AAXJBAwAmAB4AAXJBBQBSAB4AYgAeAAJxQQMAwAAeAAFxQQMAWAAfAAFxQQMAygAiAAFdQQMAKwAiAAFyQQMAvAAiAAFxQQMArQAiAAFxQQMAvAAiAAFdQQMAewAiAAFxQQMAmgAiAAFdQQMAigAiAAFxQQMAqQAiAAFdQQMAAwAkAAFyQQMAdAAkAAFxQQMApQAkAAFxQQMAlgAkAAFxQQMAJQAkAAFyQQUARAAkAFQAJAACcUEDADMAJAABcUEDAIMAJAABcUEDAKMAOwABXUEDAAQAOwABckEFAG4AOwB+ADsAAnFBAwBtADsAAV1BAwCjADsAAXFBBQCAADsAkAA7AAJdQQMAEAA7AAFyugAmADsAKhESOUEDAJYAJgABcUEDAAcAJgABcUEFAKgAJgC4ACYAAnFBAwAqACYAAXFBBQDNACYA3QAmAAJdQQMAjQAmAAFdQQMAPgAmAAFxQQMAnwAmAAFyQQMAfgAmAAFdQQMAvgAmAAFdQQMA/QAmAAFdQQMAHAAmAAFyQQMAGQAmAAFxQQMAWAAmAAFyQQMAZgAmAAFdQQUAMAAmAEAAJgACckEDAAAAJgABckEDAEYAJwABcUEDAMoAJwABcUEDAAoAJwABcUEDAOkAJwABXUEDADQAJwABckEDAFQAJwABcboAKAA0AAgREjlBAwDVACgAAXFBAwDIACgAAXFBAwApACgAAXJBBQBLACgAWwAoAAJdQQMAPAAoAAFxQQMAvgAoAAFdQQUAzwAoAN8AKAACXUEDAC8AKAABcUEDAA8AKAABcUEDAD4AKAABXUEDAPwAKAABXUEDAOsAKAABXUEDAHoAKAABXUEDAKkAKAABXUEDAEYAKAABcUEDAKMAKAABcUEDAFIAKAABcUEDANkAKQABcUEDABIAKQABckEDAGkAKwABcUEDAAEAKwABckEDANEALAABcUEDAMUALAABcUEDACYALAABckEDAGgALAABcUEDAEYALAABcUEDAKIALAABcUEDAAEALAABckEDABAALAABcroASAA7ACoREjm4AEgvQQMAZwBIAAFxQQMAzQBIAAFxQQcALwBIAD8ASABPAEgAA3FBBwDfAEgA7wBIAP8ASAADcUEDAC8ASAABckEDAB0ASAABcUEDAF0ASAABcUEDAIAASAABXUEDAKAASAABXbkALgAG9EEDACgALgABckEDAEoALgABcUEDAGcALgABXUEDAJAALgABXUEDACoALwABckEDACwALwABcUEDAAIALwABcUEDAOAALwABXUEDAEYAMAABcUEDAMUAMAABXUEDAN4AMgABcUEDAM8AMgABcUEDAMkAMgABXUEDAEkAMgABcUEDAA0AMwABcUEDAOwAMwABXUEDAA0ANQABcUEDAOwANQABXUEDAM8ANgABcUEDAN0ANgABcUEDAMkANgABXbgAOxC4ADnQuAA5L0EDAHwAOQABcUEDAAQAOQABckEDAKIAOQABcUEDAKMAOgABcUEDAFoAOgABXUEDAGwAOgABXUEDAAUAOgABckEDAJIAOgABXUEDABEAOgABckEDAG8APAABXUEDALkAPAABcUEDAAQAPAABcroAPQBIAC4REjlBAwBEAD0AAXFBAwA4AD0AAXFBAwC5AD0AAV1BAwC5AD0AAXFBAwDaAD0AAXJBBQDKAD0A2gA9AAJdQQUASwA9AFsAPQACXUEDAD0APQABXUEHAC8APQA/AD0ATwA9AANyQQcAzwA9AN8APQDvAD0AA3FBAwD9AD0AAV1BAwANAD0AAXFBAwBrAD0AAXFBAwAKAD0AAXJBAwAZAD0AAXJBAwD5AD0AAXFBAwB5AD0AAV1BAwCHAD0AAXJBAwBTAD0AAXJBAwAiAD0AAXFBAwAYAD4AAXG4AAQQuABB0LgAQS9BAwDgAEEAAXJBAwAQAEEAAV1BAwChAEEAAXFBBQDCAEEA0gBBAAJyQQMA8wBBAAFyQQMAtQBBAAFdQQMA2ABBAAFxQQMAOQBBAAFxQQMAbQBBAAFxQQMAHwBBAAFyQQUAPwBBAE8AQQACckEDAH4AQQABcUEDACwAQQABckEDAMkAQQABXUEDALgAQQABcUEDAFUAQQABcUEDAPMAQQABcUEDAAIAQQABcUEDAJIAQQABckEFAFAAQQBgAEEAAnJBBQCgAEEAsABBAAJyQQsAYABBAHAAQQCAAEEAkABBAKAAQQAFXUEDAIAAQQABckEDANUAQgABckEDAKYAQgABckEDAB8AQgABckEDAKcAQgABcUEDAGUAQgABckEDAAQAQgABXUEDACEAQgABXUEDAHIAQwABXUEDAFQAQwABckEDAOQAQwABXUEDAFUAQwABcUEDAFYAQwABXUEDAKcAQwABcUEDACkAQwABcUEDAGkAQwABcUEDAAkAQwABcUEDAHoAQwABcUEDALsAQwABcUEDANoAQwABcUEDACkAQwABckEDAMkAQwABcUEDAPgAQwABcUEDADYAQwABcUEDAAUAQwABckEDAPUAQwABXUEDAIQAQwABXUEDAKMAQwABXUEFAAAAQwAQAEMAAl1BAwCQAEMAAV1BAwD1AEUAAV1BAwAFAEUAAXFBAwDWAEUAAXFBAwCpAEUAAXFBBQA2AEUARgBFAAJdQQMA5QBFAAFxQQMAxABFAAFxuAAIELgAVdwAuAAIL7gACy+4AA8vuAAARVi4AEQvG7kARAAQPlm4AABFWLgAMS8buQAxAAo+WbsAFQABAAIABCu7ADcAAQBLAAQrQQUAPQACAE0AAgACcUEDAL8AAgABXUEDALMAAgABcUEDAKIAAgABcUEDAA0ADwABcbgADxC5AAYAAfRBAwALAAYAAXFBAwD7AAcAAV1BAwAYAAcAAXJBAwBRAAgAAXG4AA8QuAAJ0LgACS9BAwA9AAkAAXJBAwBVAAoAAXFBAwAYAAoAAXFBAwDKAAoAAXFBAwBKAAoAAXFBAwANAAoAAV1BAwA+AAoAAXJBAwAPAAoAAXJBAwC+AAoAAXFBAwBLAAoAAXJBAwBqAAoAAV1BAwAZAAoAAXJBAwBmAAoAAXFBAwCiAAoAAXFBAwDBAAoAAV1BAwAHAAsAAXJBAwAbAAsAAXFBAwA+AAsAAXFBAwBPAAsAAXFBAwC/AAsAAXFBAwDOAAsAAXFBAwBtAAsAAXFBAwCqAAsAAV1BAwBWAAsAAXFBAwCjAAsAAXG6AAwADwBEERI5QQMA5gAMAAFxQQMAbAAMAAFxQQMAXwAMAAFxQQMAPgAMAAFxQQMAOgAMAAFyQQMAEQAMAAFyQQMA8AAMAAFxQQMA+gANAAFdQQMACgANAAFxQQMA9gANAAFxQQMAvAAOAAFdQQMADwAQAAFxQQMACAASAAFdQQMApwASAAFdQQMAJwASAAFyQQMABwAUAAFxQQMAswAVAAFxQQMAvAAVAAFdQQUAPAAVAEwAFQACcUEDAKMAFQABXUEDAJIAFQABXUEDAKIAFQABcboAFwACABUREjlBAwDIABgAAXFBAwDZABkAAXFBAwBaABkAAXFBAwDLABkAAXFBAwC8ABkAAV1BAwAtABkAAXJBAwD7ABkAAV1BAwCqABkAAXFBAwBpABkAAXFBAwC4ABkAAXFBAwAEABkAAXG6ABoADwBEERI5QQMAuwAaAAFxQQMArAAaAAFxQQUALQAaAD0AGgACckEDAP4AGgABXUEDAN0AGgABcUEDAMwAGgABcUEFAFoAGgBqABoAAnFBAwB4ABoAAXFBAwCrABsAAXFBAwAbABsAAXJBAwD4ABwAAV1BAwBaABwAAXFBBQA7ABwASwAcAAJxQQMACQAcAAFyQQMAxQAcAAFxQQMAEAAcAAFyQQMAVgAdAAFxQQMAagAdAAFxQQMArQAdAAFdQQMATAAdAAFxQQMAuAAdAAFxQQMABAAdAAFyQQMAQAAdAAFyQQMAwgAeAAFdQQMAUwAeAAFxQQMA5gAeAAFdQQMANgAeAAFxQQMApwAeAAFdQQMACQAeAAFyQQMADQAeAAFdQQMASQAeAAFxQQMAiAAeAAFdQQUAJgAeADYAHgACckEDAAYAHgABcUEDAPUAHgABXUEDAGIAHgABcUEDABEAHgABckEDAKAAHgABcboAHwAPAEQREjlBAwARAB8AAXJBAwBjAB8AAXFBAwADAB8AAXFBAwDFAB8AAV1BAwDmAB8AAV1BAwBFAB8AAXJBAwAEAB8AAXJBAwBDAB8AAXFBAwDSAB8AAV1BAwBRAB8AAXFBAwAgAB8AAXJBAwDbACAAAV24AEQQuQAjAAH0QRsAOAAjAEgAIwBYACMAaAAjAHgAIwCIACMAmAAjAKgAIwC4ACMAyAAjANgAIwDoACMA+AAjAA1xQQcACAAjABgAIwAoACMAA3JBBQA5ACMASQAjAAJyQQsAuAAjAMgAIwDYACMA6AAjAPgAIwAFXUEDAAgAIwABcUEVAAgAIwAYACMAKAAjADgAIwBIACMAWAAjAGgAIwB4ACMAiAAjAJgAIwAKXboAJgAPAEQREjlBBQCpACYAuQAmAAJxQQcACgAmABoAJgAqACYAA3FBAwDMACYAAV1BAwDdACYAAV1BAwD8ACYAAV1BAwA5ACYAAXFBAwC5ACYAAV1BAwBZACYAAXJBAwDJACcAAXJBAwDqACcAAV1BAwDdACcAAXJBAwAOACcAAXFBAwD9ACcAAV1BAwB6ACcAAXJBAwBHACcAAXFBAwBWACcAAXG6ACgADwBEERI5QQMANAAoAAFdQQMAVQAoAAFdQQMA2AAoAAFxQQMAiQAoAAFyQQMAqgAoAAFxQQMArAAoAAFdQQMAzwAoAAFdQQMA/wAoAAFdQQMADwAoAAFxQQMAPwAoAAFxQQUA2wAoAOsAKAACXUEDACoAKAABckEDALkAKAABXUEDACgAKAABcUEDAHQAKAABXUEDADMAKAABckEDAEIAKAABXUEDAC4AKQABcUEDABwAKQABckEFAMUAKQDVACkAAnFBAwAZACoAAXJBAwAIACoAAXJBAwAnACsAAXFBAwCkACwAAXFBAwDJAC4AAV1BAwD7AC8AAV1BAwDLAC8AAV1BAwDnAC8AAV1BAwD4ADAAAV1BAwD7ADMAAV1BAwD1ADUAAV1BAwA7ADcAAXFBAwDvADcAAXJBBQAfADcALwA3AAJxQQMA0AA3AAFxQQMAoAA3AAFdQQMA7wBLAAFyQQcAHwBLAC8ASwA/AEsAA3FBAwDRAEsAAXFBAwCgAEsAAV26ADkASwA3ERI5QQMAOgA5AAFxQQMA1QA5AAFxQQMAxAA8AAFxQQMA0gA8AAFxQQMA4QA8AAFxugA9AA8ARBESOUEDADMAPQABckEDANUAPQABcUEDAMYAPQABcUEDABcAPQABckEDACgAPQABcUEDACkAPQABckEDAN0APQABXUEDAD8APQABcUEDAA8APQABcUEDAP4APQABXUEFALkAPQDJAD0AAl1BAwDYAD0AAXJBAwBnAD0AAXFBAwBGAD0AAXFBAwBVAD0AAV1BAwB1AD0AAV1BAwAzAD0AAV1BAwBCAD0AAV1BAwDWAD4AAXK6AEEADwBEERI5QQMAGABBAAFdQQMAKQBBAAFxQQMA+QBBAAFxQQMAKgBBAAFyQQMAGwBBAAFxQQUAvABBAMwAQQACXUEDAD8AQQABcUEHAN8AQQDvAEEA/wBBAANdQQMADwBBAAFxQQMAqwBBAAFxQQMAugBBAAFxQQMAiQBBAAFdQQMAOQBBAAFyQQMAWABBAAFyQQMAeABBAAFxQQMA0wBBAAFyQQMAvwBCAAFyQQMACwBCAAFdQQMAKgBCAAFdQQUAxQBGANUARgACcUEDAOEARgABcUEDAOQARwABXUEDABAARwABckEDANcATgABcbgAMRC5AFEAAfRBAwC3AFEAAV1BFwBXAFEAZwBRAHcAUQCHAFEAlwBRAKcAUQC3AFEAxwBRANcAUQDnAFEA9wBRAAtxQQcABwBRABcAUQAnAFEAA3JBBQDnAFEA9wBRAAJdQQUABwBRABcAUQACcUEPAAcAUQAXAFEAJwBRADcAUQBHAFEAVwBRAGcAUQAHXUEDAJcAUQABXUEFADYAUQBGAFEAAnIwMQFBAwDpAAAAAXFBAwD/AAAAAXFBAwBDAAMAAXJBAwD/AAYAAXFBAwD/AAcAAXFBAwApAAkAAXFBAwCpAAkAAXFBAwDuAAkAAXFBAwDfAAkAAXFBAwD/AAkAAXFBAwCSAAoAAXFBAwCFAAoAAXFBAwDYAAoAAXFBAwD8AAoAAXFBAwCVAAsAAXFBAwCmAAsAAXFBAwDpAAsAAXFBAwD7AAsAAXFBAwALAAsAAXJBAwAYAAwAAXFBAwAIAAwAAXJBAwC5AAwAAXFBAwD/AAwAAXFBAwD/AA4AAXFBAwDZABAAAV1BAwAUABIAAV1BAwDZABQAAV1BAwCsABcAAXFBAwDsABcAAXFBAwD9ABcAAXFBAwAWABkAAXFBAwD7ABkAAXFBAwDsABkAAXFBAwAOABkAAXFBAwDvABkAAV1BAwASABoAAXFBBQDkABoA9AAaAAJxQQMARQAaAAFxQQMA1gAaAAFxQQMACAAaAAFxQQMA7AAaAAFdQQMAQAAbAAFyQQMA9QAbAAFxQQMAFgAbAAFyQQMArwAcAAFxQQMAdAAdAAFxQQMANgAdAAFyQQMAhwAdAAFxQQMAGwAdAAFxQQMAqwAdAAFxQQMA/AAdAAFxQQMAkQAeAAFxQQMAhAAeAAFxQQMA5wAeAAFxQQMASQAeAAFyQQMAqgAeAAFxQQMA+gAeAAFxQQMAugAiAAFxQQMApwAmAAFxQQMAewAmAAFyQQMAqwAmAAFyQQMAbQAmAAFyQQMAOQAnAAFxQQMAOQAoAAFxQQMAHAAoAAFxQQMAtgAwAAFdQQMA1gAwAAFdQQMAuQAyAAFdQQMA2QAyAAFdQQMAuQA2AAFdQQMA2QA2AAFdQQMAOAA9AAFxQQMAOgA/AAFxQQMAOgBAAAFxQQsAYABBAHAAQQCAAEEAkABBAKAAQQAFckEDANAAQQABckEDADYAQQABcUEHAHAAQgCAAEIAkABCAANyQQMAEABDAAFdQQkAcABDAIAAQwCQAEMAoABDAARyQQMAuQBFAAFxAEEDAPkAAAABcUEDAOEACAABcUEDAEQACgABckEDAJcACgABcUEDAN0ACgABcUEDAP0ACgABcUEDAKcACwABcUEDAAkACwABckEDABoACwABcUEDACwACwABcUEDAJwACwABcUEDAPwACwABcUEDAI0ACwABcUEDAN8ACwABcUEDAHUADAABcUEDALgADAABcUEDAKkADAABcUEDAAkADAABckEDACwADAABcUEDAJwADAABcUEDAB4ADAABcUEDAN8ADAABcUEDAP8ADAABcUEDANkAEQABXUEDANYAEwABXUEFAOYAFwD2ABcAAnFBAwDtABkAAV1BAwD+ABkAAXFBAwAPABkAAXFBAwDvABkAAXFBAwDYABoAAXFBAwDrABoAAV1BAwD9ABoAAXFBAwAPABoAAXFBAwDvABoAAXFBAwAbABsAAXJBAwD9ABsAAXFBAwBOABsAAXJBAwBzABwAAXFBAwAVABwAAXJBAwBFABwAAXJBAwDZABwAAXFBAwAqABwAAXFBAwAbABwAAXFBAwB0AB0AAXFBAwBFAB0AAXJBAwAWAB0AAXJBAwA2AB0AAXJBAwDnAB0AAXFBAwCoAB0AAXFBAwApAB0AAXFBAwAbAB0AAXFBAwCLAB0AAXFBAwB0AB4AAXFBBQCUAB4ApAAeAAJxQQMA1AAeAAFxQQMAhQAeAAFxQQMA9QAeAAFxQQMA5gAeAAFxQQMARwAeAAFyQQMAcQAfAAFxQQMAggAfAAFxQQMAkwAfAAFxQQMA9AAfAAFxQQMAJAAfAAFyQQMApwAmAAFxQQMAdwAmAAFyQQMAPgAnAAFxQQMAHAAoAAFxQQMAPwAoAAFxQQMANAArAAFxQQMAuQAvAAFdQQMAuQAzAAFdQQMA2QAzAAFdQQMAtgA1AAFdQQMA1gA1AAFdQQMAPwA9AAFxQQMAPAA/AAFxQQMAOwBAAAFxQQMAiABBAAFyQQMADwBBAAFxQQMAPwBBAAFxQQMAiwBDAAFyFyYjIhUUMzIXIycHJw4BIyImNTQ2MzIXNjcXBgcXNxcRNCYjIgYHFhcGFRQXFhUUBiMiJjU0NjMyFyY1NDcmIyIHPgEzMhYVBzQmIyIGFRQWMzI2kwkVJyAl3ig2LDcBJhkfISYcEw4CJxsiAjEvOj0wIj8MNRw2CQQnGxsmJhsLDQYoGxoNBgVXOkBQ9hQODhMTDg4UhgkiHho9PDwfIyQaHSMHIxcQFSM0P0EBrTE7Jx4FJxI3JykSGB0nJhsbJwUuGC4aDAE4SUk/zw4UFA4OExMAAAAABf/y/yQBPQGQAC8AUgBcAGQAcBXauAAaL7sAVwAGADkABCu7AFIABgBdAAQruwBhAAYATAAEK7sAEAAGAGUABCu7AGsABgAKAAQruwAVAAUAAAAEK7gAUhC4AADQuAAAL0EFAIAAAACQAAAAAnFBAwCRAAAAAXJBAwCgAAAAAV1BAwDQAAAAAXJBAwDlAAEAAV1BAwBFAAEAAXJBAwAHAAEAAXFBAwBfAAEAAXJBAwAnAAEAAXJBAwDGAAEAAV1BAwAVAAEAAXJBAwAEAAEAAXJBAwD0AAEAAV1BAwDqAAMAAV1BAwD7AAMAAV1BAwA8AAMAAXFBAwC+AAMAAV1BBQAfAAMALwADAAJyQQMATQADAAFyQQUAzAADANwAAwACXUEDAAsAAwABckEDAAgAAwABcUEDAFIAAwABXUEDAL8AZQABXbgAZRC4AATQuAAEL0EDAFEABAABXUEFAK8AOQC/ADkAAl26AAUAOQBSERI5QQMAUgAFAAFdQQMAyQAFAAFdQQMAKwAFAAFyQQMAOQAFAAFxQQMAlQAFAAFyQQMAIgAFAAFxQQMAoAAFAAFdQQMA+wAIAAFdQQMAGwAIAAFxQQMACQAIAAFxQQMAbgAKAAFdQQMA3wAKAAFyQQMAjgAKAAFdQQMAfQAKAAFdQQMAIAAKAAFxQQMA+wAMAAFdQQMAGgAMAAFxQQMACQAMAAFxQQMAWQANAAFyQQMA9gAOAAFdQQMABgAOAAFxQQMAFQAOAAFxQQMAvwAQAAFdQQMAUAAQAAFdQQMAJwASAAFyQQMAFgASAAFyQQMA9AASAAFxQQMAKwAUAAFyQQMA+QAUAAFxQQMATgAVAAFyQQMAzwAVAAFxQQMALwAVAAFdQQMA3wAVAAFdQQMAXwAVAAFxQQMADwAVAAFyQQMAHwAVAAFxQQMAbwAVAAFdQQMAPwAVAAFyQQUAXwAVAG8AFQACckEDAKAAFQABXUEDAJAAFQABcUEDABsAFgABcUEDAFwAFgABckEDAA4AFgABckEDAFwAFgABcUEDAGoAFgABckEDAJUAFgABcUEDAMsAGAABcUEDAD8AGQABckEDAP8AGQABcUEDAA8AGQABckEDANsAGQABcUEDAOoAGQABcUEFADkAGgBJABoAAnJBAwAbABoAAV1BAwAsABoAAV1BAwAKABoAAV1BAwCjABoAAV1BAwAgABoAAXFBAwCmABsAAV1BAwAgABsAAXFBAwDlABwAAXFBAwBmABwAAXJBAwBKABwAAV1BAwAqABwAAV1BAwAfABwAAV1BAwAcABwAAXJBAwAqABwAAXJBBQA5ABwASQAcAAJyQQMAVgAcAAFxQQMAZQAcAAFxQQMAIgAcAAFxQQMAFgAeAAFyQQMAagAeAAFxQQMARgAeAAFyQQMAJQAeAAFxQQcAtQAeAMUAHgDVAB4AA3FBAwBnAB8AAV1BAwCFAB8AAV1BAwDhAB8AAXFBAwBHACAAAXFBAwCXACAAAV1BAwB2ACAAAV1BAwAaACIAAXFBAwC7ACIAAXFBAwDvACIAAXFBAwAtACIAAXJBAwBLACIAAXJBAwD5ACIAAXFBAwAZACIAAXJBAwAWACMAAV1BAwD4ACMAAXFBAwC5ACMAAXFBAwDKACMAAV1BAwDKACMAAXFBAwBbACMAAXJBAwArACMAAXFBAwC8ACMAAV1BAwAcACMAAXFBAwDrACMAAXFBAwBbACMAAXFBBQBaACMAagAjAAJdQQMAagAjAAFxQQMACQAjAAFyQQMA2QAjAAFxQQMAFwAjAAFyQQMARQAjAAFdQQMARQAjAAFyQQMAxwAkAAFdQQMABgAkAAFxQQMAUgAkAAFxQQMAlwAlAAFdQQUAZQAlAHUAJQACXUEDAIQAJQABXUEDAOoAJgABXUEDAFoAJgABcUEDAMoAJgABXUEDAEgAJgABckEDAOUAJgABcUEDAEsAJwABcUEDABsAJwABcUEDABYAKQABcUEDABUAKQABckEDAEMAKQABcUEDAN8AawABckEDACAAawABcbgAaxC4ACvQuAArL0EDANEAKwABckEDANEAKwABcUEDAEIAKwABckEDAPIAKwABcUEDADQAKwABckEDAPYAKwABXUEDAEwAKwABXUEDALQAKwABcUEDAMIAKwABcUEDABIAKwABckEFAJEAKwChACsAAl1BAwABACsAAXJBAwAgACsAAXJBAwDgACsAAXFBAwAFACwAAXJBAwA1ACwAAXJBAwAlAC4AAV1BAwA0AC4AAXJBAwCFAC8AAXFBAwCTAC8AAXFBAwD9ADIAAV1BBQA2ADIARgAyAAJxQQMAGQAzAAFyQQMADAAzAAFyQQMAtwAzAAFxQQMABQAzAAFxuAA5ELgANNxBAwA0ADQAAXJBAwD2ADQAAXFBAwA2ADQAAXFBAwBFADQAAXJBAwAjADQAAXJBAwCzADQAAXFBAwAFADYAAXFBAwD8ADgAAV1BAwBNADgAAXFBBQAfADgALwA4AAJxQQMAbgA4AAFxQQMAnQA4AAFxQQMAPAA4AAFxQQMAyQA4AAFdQQMAbgA6AAFxQQMAHQA6AAFyQQMALAA6AAFyQQMAbAA7AAFxQQMAHQA7AAFyQQMA/wA7AAFxQQMADgA7AAFyQQMA7AA7AAFxQQMAKwA7AAFyQQMAmgA7AAFxQQMA5wA8AAFxQQMA6gA+AAFxQQMA8QBAAAFdQQMAcgBAAAFdQQMAQwBAAAFxQQMANQBAAAFxQQcA2ABAAOgAQAD4AEAAA3FBBQAIAEAAGABAAAJyQQMAOQBAAAFyQQMALABAAAFyQQMAyQBAAAFxQQMASABAAAFyQQMAtgBAAAFxQQMAFABAAAFdQQMAAgBAAAFdQQMAYQBAAAFdQQMAUABAAAFyQQUAgABAAJAAQAACXboAQQBlABAREjlBAwBgAEEAAV1BAwBRAEEAAXJBAwDyAEEAAV1BAwCSAEEAAV1BAwA0AEEAAXFBAwA2AEEAAXJBAwBDAEEAAXFBAwByAEEAAV1BAwASAEEAAXJBAwABAEEAAV1BAwCAAEEAAV1BAwAQAEEAAV24AEPQuABDL0EDALUAQwABcUEDAEcAQwABcUEDAJsAQwABckEDADYAQwABcUEDAEIAQwABckEDADEAQwABckEFABoARAAqAEQAAnJBAwALAEQAAXJBAwA5AEQAAXJBAwD4AEQAAXG6AEYAOQBSERI5QQMAoQBGAAFdQQMAmwBKAAFxQQMAaABKAAFxQQMASABLAAFxQQMATQBMAAFdQQMADgBMAAFxQQcAHwBMAC8ATAA/AEwAA3FBBwDfAEwA7wBMAP8ATAADXUEDAJ8ATAABcUEDAL8ATAABXUEDAB4ATAABXUEDAG0ATAABXUEDAAwATAABXUEDAJwATgABcUEDAFwATgABcUEDAGsATgABcUEDAEkATgABcUEDAFYAUAABcUEDALcAUAABcUEDAJcAUAABcUEDAGUAUAABcUEDAEMAUAABcUEDAPgAVQABcUEDAK4AVwABXUEDAM4AWgABcUEDAAQAWgABcUEDAHQAWwABXUEDAPYAWwABXUEDANwAWwABcUEDANcAWwABXUEDACYAWwABcUEDAFIAWwABckEDAIAAWwABXUEFAB8AYQAvAGEAAnFBAwCfAGEAAXFBBwDfAGEA7wBhAP8AYQADXUEDAD0AYQABcUEDACAAcQABcbgAUhC4AHLcQQMAHwByAAFxQQUAvwByAM8AcgACXQC4ADAvuAAzL7gANy89uAAvLxi4ACsvuAAaLz24ABYvGLgAAEVYuAAdLxu5AB0AED5ZuAAARVi4ACIvG7kAIgAQPlm4AABFWLgAAi8buQACAAo+WbsAIAABACUABCu6AE8AVQADK7sADQABAGgABCu7AG4AAQAHAAQrugByAAAAAytBBQAvAAAAPwAAAAJyQQMAHgAAAAFyQQMA2QAAAAFdQQMAzAADAAFdQQMAOgADAAFxQQMAPgAEAAFyQQMATAAEAAFyQQMAJgAEAAFyQQMAQgAHAAFxQQMAXAAHAAFdQQMALQAHAAFdQQMApwAHAAFdQQMAUQAHAAFyQQMAIAAHAAFyQQMAUABuAAFyQQMAIABuAAFyQQMAQABuAAFxQQMAEABuAAFdugAFAAcAbhESOUEDAOsACAABXUEDAAkACAABcUEDAPoACQABXUEDAPYACwABXUEDAAUADAABcUEDAOQADAABXUEFAEAADQBQAA0AAl1BAwBdAA0AAXFBAwBRAA0AAXJBAwAQAA0AAV1BCQBwAA0AgAANAJAADQCgAA0ABF1BAwAFAA4AAXFBAwDlAA4AAV1BBQA0ABAARAAQAAJxQQMA9AAQAAFdQQMAIwAQAAFxQQMAEQAQAAFxuAACELkAEwAB9EEDACcAFAABckEDAMkAFgABXUEDAKMAFgABckEDAAkAGAABckEDAFoAGQABckEDAMoAGQABcUEDAEQAGQABXUEDAKUAGgABXUEDALYAGgABXUEDAEkAGgABckEDAJYAGgABckEDAGUAGgABckEDAEQAGgABXUEDAHMAGgABXUEDAOQAHwABXUEDAOUAHwABcUEDAIMAHwABXUEDAGIAHwABXUEDAIEAIAABckEDAJEAIAABXUEDABIAIAABckEDADIAIAABcUEDAFMAIAABXUEDAOMAIAABXUEDAMcAIAABXUEDALMAIAABXUEDAJMAIAABcUEDAOIAIAABcUEDAGEAIAABcUEDAHEAIAABXUEDAFEAIAABckEDAGAAIAABckEDAKkAJAABXUEDAOUAJAABcUEDAHEAJQABXUEDAFIAJQABckEDAGMAJQABcUEDAGMAJQABXUEDADQAJQABcUEDAIQAJQABXUEDAOQAJQABcUEDAOQAJQABXUEDAFQAJQABXUEDALMAJQABXUEDAJMAJQABcUEDABIAJQABckEDAJEAJQABXUEDAIAAJQABckEDAGAAJQABckEDAOcAJgABcbgAHRC5ACgAAfRBAwDFACsAAV1BAwBKACsAAXFBAwAbACsAAXFBAwC6ACsAAV1BAwD3ACsAAV1BBQBkACsAdAArAAJdQQMAkwArAAFdQQMAywAsAAFdQQMAGQAsAAFxQQMA5AAuAAFxQQMAoQAvAAFdQQUAsgAvAMIALwACcUEDAFQALwABcUEDACQALwABckEDAIUALwABcUEDAAQALwABXUEDABMALwABcUEDABIALwABXUEDAJAALwABXUEDACAALwABXUEDAAQAMAABcbgANxC4ADHQuAAxL0EDADgAMgABcUEDAPoAMgABcUEDABoAMgABckEDAEoAMgABcUEDAAkAMgABcUEFAIUAMgCVADIAAl1BAwBzADIAAV1BAwCLADMAAV1BAwD9ADMAAV1BAwAEADMAAXFBAwAyADMAAXK4ADcQuABj3EEDAF0AYwABckEDALoAYwABcUEDAGMAYwABcroANAA3AGMREjlBAwC5ADQAAXFBAwBKADQAAXJBBQAsADQAPAA0AAJyQQMA/QA0AAFxQQMAmwA0AAFdQQMAeQA0AAFdQQMANwA0AAFxQQMAlAA0AAFyQQMA6wA2AAFdQQMACgA2AAFxQQMA2QA2AAFdQQMA2gA4AAFdQQMA6wA4AAFdQQMAnQA4AAFxQQMAawA4AAFxQQMAOQA4AAFxQQMAyAA4AAFdQQMABgA6AAFyQQMAKAA6AAFyQQMAZQA6AAFxQQMA8wA6AAFxQQMAZQA7AAFxQQMAlAA7AAFxQQMAHwA8AAFdQQMADQA8AAFdQQMA5QA8AAFxQQUACABAABgAQAACckEDACkAQAABckEDADcAQAABckEDAEYAQAABcUEDAOUAVQABcUEDAPQAVQABcUEDAFEAVQABckEDAAAATwABcboAQQBVAE8REjlBAwAaAEEAAXJBAwA5AEEAAXJBAwB5AEMAAV1BAwCbAEMAAV1BAwCKAEMAAV1BAwA4AEMAAXJBBQA2AEMARgBDAAJxQQcABQBEABUARAAlAEQAA3JBAwB7AEQAAV1BAwCbAEQAAV1BAwCKAEQAAV1BAwD0AEQAAXFBAwAzAEQAAXJBAwBKAEUAAXFBAwD6AEUAAV1BBQCFAEUAlQBFAAJdQQMAcgBFAAFdugBGADcAYxESOUEDAJoARwABXbgAVRC4AEnQuABJL0EDALwASQABXUEDALsASQABcUEDAJsASQABXUEDAJwASgABcUEDAGkASgABcUEDAEoASwABcUEDALQATgABcUEDAJMATgABcUEDAGIATgABcUEDAJYAUAABcUEDAGMAUAABcUEDALMAUAABcUEDAEYAUQABcbgANxC5AFkAAvS4AE8QuQBfAAL0QQMAbABfAAFyQQMA8ABfAAFdQQMAkQBoAAFdQQMAXwBoAAFxQQMAUQBoAAFyQQMAoABoAAFdMDEBQQMAtgAFAAFdQQUAuQAIAMkACAACXUEDANoACAABXUEFAMkADADZAAwAAl1BAwC6AAwAAV1BAwDVAA4AAV1BBQC2AA4AxgAOAAJdQQMArwAZAAFxQQMA1QAfAAFdQQMA1AAgAAFdQQMA1QAhAAFdQQMA0wAiAAFdQQMAqgAiAAFxQQMA1AAjAAFdQQMAqQAjAAFxQQMA0wAlAAFdQQMA1QAmAAFdQQMAqgAmAAFxQQMAoAAwAAFdQQMAogA0AAFxQQMAtAA0AAFdQQMARgA0AAFyQQMAogA1AAFxQQMAtAA1AAFdQQMAoAA2AAFxQQMA+QA4AAFdQQMADAA4AAFxQQMA1wA/AAFdQQUAwABAANAAQAACXUEDAOEAQAABXUEDALIAQAABXUEFAMAAQQDQAEEAAl1BAwDhAEEAAV1BAwCzAEEAAV1BAwCjAEIAAXFBAwChAEMAAXFBAwBIAEQAAXJBAwCsAEoAAV1BAwCvAEsAAV1BAwCvAEwAAV1BAwCuAE0AAV1BAwCrAE4AAV1BAwCgAFEAAV1BAwCgAFIAAV1BAwDnAFsAAV1BAwD/AHIAAV0AQQcAuQAJAMkACQDZAAkAA11BAwCWAAoAAV1BAwCTAAsAAV1BBQDGAAsA1gALAAJdQQMAtwALAAFdQQMAkAAMAAFdQQMAkAANAAFdQQMAkAAOAAFdQQMAoAAPAAFdQQMAkgAPAAFdQQcAtQAPAMUADwDVAA8AA11BAwCgABAAAV1BAwCRABAAAV1BAwCoABgAAXFBAwDbACQAAV1BAwDEADIAAV1BAwBLADIAAXJBAwDNADMAAV1BAwBJADQAAXJBAwCsADQAAXFBAwDKADYAAV1BAwANADcAAXFBAwALAEAAAXFBAwDoAEEAAV1BAwAKAEEAAXFBAwAEAEMAAXFBAwDYAEMAAV1BAwDpAEMAAV1BAwBGAEQAAXJBAwDKAEQAAV1BAwC8AEQAAV1BAwCvAEcAAV1BAwCvAEgAAV1BAwCvAEkAAV1BAwCvAEoAAV0lFCMiPQEGIyImNTQ2MzIWHQEUMzI9ATQnJic+ATMyFjMyNxcGIyImIyIGBxYXFhUTIycHJw4BIyY1NDYzMhc2NxcGBxc3FzUGIyImNTQ2MzIWFQcmIwYVFDMyNTQ3NCMiFRQzMgM0JiMiBhUUFjMyNgEbUE8LDhkiIhkaIyssYTpCA0A1FUcTGAUfECoWTRQXKwJkKkUDJyssLQEmGkAoGxcMBiYbKQEsKzAFCxUeHhUUHsoKGCEfJq4YGBgYhhALCw8PCwsQT1hYMwQhGRojHxxuNDSRGBgPCS49FhYHNBgbEhQQGSP+SBsaNxwgATgYGgUpFA8UJzMWHi0BGxMTGxkVLwcCGBogBTcWFhcBNAsQEAsLDw8AAAIADwAAAZUBkQAwADwPaLgALC+7ADcABQAeAAQruwAXAAYAMQAEK7sAJQAGAAwABCu7AAAABQABAAQrQQMAbwAAAAFdQQMAPwAAAAFdQQMAPwABAAFdQQMAbwABAAFdQQMATAAEAAFdQQMAVAAFAAFxQQMA6AAsAAFdQQMAuQAsAAFxQQMA+QAsAAFdQQMAagAsAAFxQQMAqgAsAAFdQQMAywAsAAFxQQMASwAsAAFyQQMA/AAsAAFxQQMADAAsAAFyQQMAHQAsAAFxQQMAPwAsAAFyQQMA7gAsAAFxQQMAXQAsAAFyQQMALAAsAAFdQQMASwAsAAFxQQMAigAsAAFxQQMA2gAsAAFdQQMAeQAsAAFxQQUAKQAsADkALAACcUEDACkALAABckEDAFgALAABcUEDAAQALAABXbgALBC5AAYABvRBAwBFAAYAAV1BAwAmAAYAAXFBAwBXAAYAAXFBAwDYAAYAAXFBAwA4AAYAAXFBAwAJAAYAAXJBAwD6AAYAAXFBAwCKAAYAAXFBAwApAAYAAXJBAwDoAAYAAV1BAwC3AAYAAXFBAwBXAAYAAXJBAwBGAAYAAXFBAwAlAAYAAV1BAwAUAAYAAV1BBQDDAAcA0wAHAAJxQQUApAAHALQABwACcUEDAEUABwABcUEDAJYABwABcUEDAPYABwABcUEDAGcABwABcUEDANgABwABXUEDABkABwABXUEDAPkABwABXUEDAFwABwABXUEDAFwABwABckEDAMkABwABXUEDAHkABwABcUEDAIcABwABcUEDADcABwABcUEDAAYABwABcUEDAEUABwABXUEDAAQABwABckEDAFQABwABcUEDABEABwABckEHACAABwAwAAcAQAAHAANyQQMAYwAXAAFdQQsAcAAXAIAAFwCQABcAoAAXALAAFwAFXUEFAOAAFwDwABcAAl1BAwAAABcAAXG4ABcQuAAI0LgACC9BAwABAAgAAV1BAwBvAAgAAV1BAwAQAAgAAV1BAwBAAAgAAV1BAwByAAwAAV1BAwB8AAwAAXFBAwCfAAwAAV1BAwDPAAwAAXFBAwBjAAwAAV1BAwDwAAwAAV1BAwAAAAwAAXFBAwBQAAwAAV1BAwCIAA4AAXFBAwALAA4AAXJBAwDeAA4AAXFBAwDPAA4AAXFBAwD8AA4AAXFBAwCbAA4AAV1BBQCWAA4ApgAOAAJxQQMANAAOAAFyQQMAVgAPAAFxQQMANwAPAAFyQQMAmAAPAAFdQQMAGQAPAAFxQQMA6gAPAAFxQQMAWwAPAAFyQQMAywAPAAFxQQMAewAPAAFxQQMAagAPAAFxQQMA+QAPAAFxQQMA2QAPAAFxQQMACAAPAAFyQQMAtwAPAAFxQQMARQAPAAFyQQMAZQAPAAFdQQMAFgAQAAFxQQMA1wAQAAFxQQMABwAQAAFyQQMANwAQAAFyQQMAJAAQAAFyQQMAQQAQAAFyQQMAxgARAAFxugASAB4AABESOUEDAAUAEgABckEDABUAEgABcUEDACYAEgABckEHAMUAEgDVABIA5QASAANxQQMA9AASAAFxQQMAEwASAAFyQQMA8gAVAAFdQQMAlQAWAAFxQQMAxQAZAAFdQQMABAAgAAFyQQMAZQAgAAFxQQUA5gAgAPYAIAACcUEDABUAIAABckEDABIAIAABcUEDAFIAIAABckEDAMQAIQABcUEDAPUAIQABcUEDAAUAIQABckEDABUAIQABcUEDAJkAIQABXUEDANUAIQABcUEDACQAIQABckEDABIAIQABckEDAEEAIQABckEDAHAAMQABXUEFAJAAMQCgADEAAl1BBQDgADEA8AAxAAJdQQMAAAAxAAFxugAiADEAFxESOUEDALsAIgABXUEDAM4AIgABcUEDAJ8AIgABXUEDAK4AIgABXUEDANwAIgABcUEDAGkAIgABXUEDAIkAIgABXUEDAEoAIwABckEDAAwAIwABckEFAM8AIwDfACMAAnFBAwD9ACMAAXFBAwAbACMAAXJBAwAqACMAAXJBAwCjACMAAXFBAwCTACQAAXFBAwCFACQAAXFBBQAWACQAJgAkAAJyQQMAdwAkAAFxQQMApgAkAAFdQQMApQAkAAFxQQMANAAkAAFxQQMA4wAkAAFxQQMAQAAkAAFyQQMAAQAlAAFxQQMAfAAlAAFxQQMAzwAlAAFxQQMAnQAlAAFdQQMAcQAlAAFdQQUAUAAlAGAAJQACXUEDAPAAJQABXUEDAGsAKAABXUEDAEAAKAABcrgAFxC5ACkABvRBAwBvACkAAV1BAwBAACkAAV1BAwDtACsAAXFBAwB8ACsAAXFBBwC4ACsAyAArANgAKwADcUEDAAoALQABcUEDAPsALQABXUEDACwALQABckEDAB0ALQABcUEDAE8ALQABXUEDAI4ALQABcUEDAM0ALQABXUEDAEwALQABckEDAPsALQABcUEDAFoALQABcUEDADgALQABXUEDAE0ALgABXUEDAKcALgABXUEDAPYALwABXUEDABcALwABcUEDAEcALwABcUEDAFUALwABcUEDADQALwABcUEFABAAPQAgAD0AAnFBBQDQAD0A4AA9AAJdQQUAkAA9AKAAPQACXUEDANAAPgABcUEDAC8APgABcUEJAC8APgA/AD4ATwA+AF8APgAEXUEDAA8APgABXUEDAH8APgABXUEDAOAAPgABXUEDAAAAPgABckEDAAAAPgABcQC4AABFWLgAIS8buQAhABA+WbgAAEVYuAAjLxu5ACMAED5ZuAAARVi4AC4vG7kALgAQPlm4AABFWLgAAC8buQAAAAo+WbgAAEVYuAAHLxu5AAcACj5ZuwAUAAEANAAEK7sAOgABABoABCu4AC4QuQAEAAH0QQMAIAAJAAFyQQMAQgAJAAFyQQMAYgAJAAFxQQMA4wAJAAFxQQUAhAAJAJQACQACcUEDABQACQABcUEDABIACQABckEDAPIACQABXUEDAAIACQABcUEDAPEACQABcUEDAAAACQABckEDAIAACQABXUEDAEQACwABcUEDAIMACwABXbgADtC4AA4vQQMAWgAOAAFyQQMANwAOAAFyQQMAFQAPAAFyQQUAxgAPANYADwACcUEDAFcADwABckEDABgADwABXUEDAHkADwABcUEDADoADwABckEDAEoADwABcUEDABsADwABcUEDAKsADwABcUEDAIoADwABcUEDAMkADwABXUEDALkADwABcUEDAFgADwABcUEDAGcADwABcUEDAAYADwABckEDAGMADwABXUEDAJMADwABXUEDADgAEAABckEDAAkAEAABckEDAEoAEAABckEDAB4AEAABcUEDAMsAEAABcUEDAGkAEAABcUEFANkAEADpABAAAnFBAwCIABAAAV1BAwBVABAAAXJBAwDAADQAAV1BBwCAADQAkAA0AKAANAADXUEDAFAANAABckEDAJAANAABcUEDANAANAABcUEDANAAFAABcUEDAJEAFAABcUEDAMAAFAABXUEHAIAAFACQABQAoAAUAANdQQMAUAAUAAFyugASADQAFBESOUEDAAMAFQABcUEDAMAAFQABXUEDAPYAFgABXUEDAMIAFgABXUEDAPsAFwABXUEDAP8AGAABXUEDAMgAGAABXUEDAA0AGQABcUEDACsAGQABXUEDAAoAGgABXUEDAF8AGgABXUEDAP8AGgABXUEDAD8AGgABckEDAE0AGgABckEDABEAGgABcUEDAMAAGgABXUEDAP0AGwABXUEDAA0AGwABcUEDAMkAHgABXboAIgAuAAQREjlBAwABACIAAXJBAwBCACIAAXJBAwCGACIAAV1BAwAbACIAAV1BAwAMACIAAV1BAwC3ACIAAV1BAwBkACIAAV1BBQASACIAIgAiAAJyQQUAwQAiANEAIgACcUEDAPAAIgABcUEDAEUAJAABcUEDAFoAJgABcUEDAHsAKAABcUEDAD4AKAABckEFAMwAKADcACgAAnFBAwC5ACgAAXFBAwCEACgAAV26ACkAAAAhERI5QQMA5QApAAFdQQMAtgApAAFxQQMAyAApAAFxQQMAxgApAAFdQQMA5gApAAFxQQMA9AApAAFxQQMAIgApAAFyQQMAQwAqAAFyQQMAhQAqAAFxQQMAdAAqAAFxQQMA4AAqAAFdQQMA8AAqAAFxQQMAIAArAAFyQQMAMAArAAFxQQMAgQArAAFxQQMAwwArAAFdQQMAAwArAAFyQQMAlQArAAFxQQMAZQArAAFxQQMA9QArAAFdQQMANAArAAFyQQMAAwArAAFxQQMAEgArAAFyQQMA8QArAAFxQQMA4AArAAFdQQMAQAArAAFyQQMAoAArAAFxQQMASAAsAAFxQQMAMAAsAAFdQQMAYQAvAAFdQQMAAwAvAAFxQQMA5AAvAAFdQQMAhQAvAAFdQQMApwAvAAFdQQMA1QAvAAFdQQMAhAAvAAFxQQMAYgAvAAFxQQMAsQAvAAFdQQMAwAAvAAFdQQMAYAAwAAFdQQUA0QAwAOEAMAACXUEDABMAMAABcUEDAAUAMAABcUEDALIAMAABXUEDADAAMAABcUEHAIAAMACQADAAoAAwAANdQQMAwAAwAAFdQQMATAA6AAFyQQMAPwA6AAFyQQMA/wA6AAFdQQMAwAA6AAFdQQMAEAA6AAFxQQMACAA+AAFyMDEBQQMAdwAFAAFxQQMA6QAFAAFxQQMAlAAGAAFdQQMAhgAGAAFdQQMA6QAGAAFxQQMAygAGAAFxQQMA4wAHAAFxQQMA1QAHAAFxQQUANgAHAEYABwACckEFALcABwDHAAcAAnFBAwD3AAcAAXFBAwBoAAcAAXFBAwDZAA8AAXFBAwBEABIAAXJBAwDVABUAAV1BAwDmABUAAV1BAwAQABYAAV1BAwASABcAAV1BAwARABgAAV1BBQDZABsA6QAbAAJdQQMA2QAiAAFxQQMAyQAjAAFxQQMAtwArAAFxQQMA1wArAAFxQQMAtgAsAAFxQQMAyQAsAAFxQQMAKgAtAAFxQQMAJgAvAAFxQQMAgwAxAAFdQQMAFgAxAAFdQQMAFQAyAAFdQQMAigA3AAFdQQMAFAA8AAFdQQMAbwA+AAFdQQMATwA+AAFxAEEDAKoADwABXUEFANYAFgDmABYAAl1BBQDaABgA6gAYAAJdQQMAfAAZAAFdQQMAPQAZAAFdQQMAXwAZAAFdQQMAewAaAAFdQQMA1wAiAAFxQQMAqgAoAAFxQQMAtAAqAAFxISMRNCMiBwMjNTQ2NTQnBycGBzYzMhYVFAYjIicmNTQ2Nxc3FhUUBhUHNj8BNjMyFQU0JiMiBhUUFjMyNgGVJB0LDX8tNiAjJCALDhIdIiUbIhIQMikZG0kzBAsNUhUoPv7eEg4OEhIODhIBQC0a/q2SIGEfNgYqKRYkBiUcHSQcGSQrTggjIwlZH2YgVSoh2DhQRw4SEg4OEhIAAAMAIP/4AdwBkAA8AEgAVBLauwAWAAUALgAEK7sAQwAGACAABCu7ACYABgA9AAQruwA4AAUADgAEK7sAAAAFAAEABCtBAwAQADgAAV24ADgQuQAFAAb0QQMAIAAFAAFdQQMAcAAFAAFdQQMAcAAFAAFyQQMAgQAFAAFdQQMAYwAFAAFdQQMAtwAFAAFdQQMA5AAFAAFdQQMAUgAFAAFdQQMAMQAFAAFdQQUAkAAFAKAABQACXUEDAEAABQABXUEFAJAABQCgAAUAAnJBBQDQAAUA4AAFAAJyugADADgABRESOUEDAHAAAwABXUEDAFIAAwABXUEDADYAAwABXUEDAHAAAwABckEFAJAAAwCgAAMAAnJBAwDQAAMAAXJBAwBzAAQAAV1BAwBxAAQAAXJBAwCQAAQAAXJBAwBXAAYAAV1BAwAyAAYAAV1BAwBUAD0AAV1BAwBpAD0AAV1BAwB2AD0AAV1BBQCQAD0AoAA9AAJdQQUAsAA9AMAAPQACcUEDALAAJgABcUEDAAEAJgABXUEDAHIAJgABXUEDAGMAJgABXUEHALYAJgDGACYA1gAmAANdQQUA1gAmAOYAJgACcUEDAIYAJgABXUEDADgAJgABXUEDADoAJgABckEDAEgAJgABckERADYAJgBGACYAVgAmAGYAJgB2ACYAhgAmAJYAJgCmACYACHFBAwBGACYAAV1BBQAGACYAFgAmAAJyQQMA9gAmAAFdQQUABgAmABYAJgACcUEDACIAJgABXUEDAFEAJgABXUEDAMEAJgABcUEDABAAJgABXUEFAJAAJgCgACYAAl26AAsAPQAmERI5uAALL0EDAF0ACwABckEDAI4ACwABckEDAI4ACwABXUENAI8ACwCfAAsArwALAL8ACwDPAAsA3wALAAZxQQcAvwALAM8ACwDfAAsAA11BAwD/AAsAAV1BBQAPAAsAHwALAAJxQQMAbwALAAFxQQMArwALAAFyQQMALgALAAFyQQMAXgALAAFxQQMAIAALAAFxQQMAQAALAAFyQQMAEAAOAAFdQQMAzAARAAFxQQMALwARAAFyQQMASgARAAFyQQMAFgARAAFxQQMA+QASAAFdQQMALwASAAFyQQMAeAASAAFdQQMA5QASAAFxQQMAGgATAAFxQQMAKgATAAFyQQMARQATAAFyQQMAwwATAAFxQQMACAAUAAFyQRkANgAWAEYAFgBWABYAZgAWAHYAFgCGABYAlgAWAKYAFgC2ABYAxgAWANYAFgDmABYADHFBBQAGABYAFgAWAAJdQQcAtgAWAMYAFgDWABYAA11BDQA2ABYARgAWAFYAFgBmABYAdgAWAIYAFgAGXUEDAPYAFgABXUEFAAYAFgAWABYAAnFBBwAGABYAFgAWACYAFgADckEFADUAFgBFABYAAnK4ABYQuQApAAX0QQMANAApAAFdQQMAeAApAAFdQQMAWwApAAFdQQUAhwApAJcAKQACXUEDAEEAKQABXUEDACEAKQABXbgAGdBBAwDnABkAAXFBAwALABkAAXJBAwBNABkAAXJBAwAnABkAAV1BAwATABkAAV1BAwBTABkAAV26AB0ALgAAERI5QQMANQAdAAFyQQMACAAdAAFyQQMATAAdAAFyQQMAqAAdAAFdQQMAlQAdAAFdQQMAIwAdAAFdQQMAYgAgAAFxQQMAfQAgAAFyQQMAbwAgAAFyQQMA7wAgAAFyQQUATwAgAF8AIAACXUEDAD0AIAABXUEDAMkAIAABXUEDAFEAIAABcUEDAPAAIAABcUEDANgAIgABXUEDABcAIwABXUEDANMAJAABXbgAFhC4ACrQuAAqL0ENAAAAKgAQACoAIAAqADAAKgBAACoAUAAqAAZdQQMAOQAxAAFxQQMAOQAxAAFyQQMAowAyAAFxQQMAJwAyAAFyQQUAGQAyACkAMgACcUEDAIYAMgABcUEDAEEAMgABckEDAMEAMgABcUEDACsAMwABckEDAPkAMwABXUEDAIkANAABcUEDAE4ANAABckEDAC8ANAABckEDAMwANAABcUEDAKgANAABcUEDACcANAABcUEDABIANQABcbgAARC4ADrQQQMAlgBDAAFdQQsABgBDABYAQwAmAEMANgBDAEYAQwAFXUEDAKYAQwABcUEDABcAQwABcUEDAFsAQwABXUEFAG8AQwB/AEMAAnJBAwDvAEMAAXJBAwBpAEMAAV1BAwDXAEMAAXFBBQAGAEMAFgBDAAJyQQMAdgBDAAFdQQUAUABDAGAAQwACcUEDAPAAQwABcbgAOBC4AEnQuABJL0EDAJAASQABckEDAKEASQABckEDAIUASQABXUEDAHAASQABckEFANAASQDgAEkAAnJBBQCQAEkAoABJAAJdQQMA1wBMAAFxuAALELkATwAG9EEDAFkATwABckEDAI0ATwABXUEDAEsATwABXUEDAKkATwABckEDAMcATwABXUEFAJAAVQCgAFUAAl1BAwDgAFYAAXFBCQAPAFYAHwBWAC8AVgA/AFYABF1BAwBPAFYAAXFBAwBvAFYAAXFBAwAvAFYAAXFBAwBfAFYAAV1BAwDAAFYAAXFBAwAAAFYAAXIAuAAARVi4ADIvG7kAMgAQPlm4AABFWLgANC8buQA0ABA+WbgAAEVYuAA7Lxu5ADsAED5ZuAAARVi4ADMvG7kAMwAOPlm4AABFWLgAAC8buQAAAAo+WbgAAEVYuAApLxu5ACkACj5ZuAAARVi4AAgvG7kACAAKPlm6ACMAKwADK7sAQAACACMABCtBAwA6AAIAAXK4ACkQuABG3EELAAcARgAXAEYAJwBGADcARgBHAEYABV1BAwBZAEYAAV1BAwC3AEYAAV1BBwBnAEYAdwBGAIcARgADXUEDAEAARgABcboAAwApAEYREjlBAwA5AAMAAXJBAwBpAAMAAV1BAwDJAAMAAXFBAwCLAAMAAV1BAwBOAAMAAV1BAwAsAAMAAV1BAwDaAAMAAXFBBQCZAAMAqQADAAJdQQMAOQADAAFdQQMA6QADAAFxQQMAuAADAAFdQQMAugAGAAFdQQMANQAGAAFdQQMAzAAHAAFdQQMA+wAHAAFdQQMA+wAJAAFdQQMAywAJAAFdQQMApgANAAFxQQMA1QAOAAFdQQUAJgAOADYADgACckEDAFoADgABcUEFACwADgA8AA4AAnFBAwDcAA4AAXJBBQC2AA4AxgAOAAJdQQMARQAOAAFyQQMA0wAOAAFxQQMA8gAOAAFdQQMA/gAPAAFdQQMASgAPAAFxQQMAxAAPAAFxuAA0ELkAEQAB9EEDACgAEQABckEDABgAEQABcUEDADoAEQABcUEDAMoAEQABcUEDAAkAEQABcUEFAOgAEQD4ABEAAl1BAwBIABEAAXJBAwCXABEAAXFBAwDDADMAAXFBAwCEADMAAXFBAwCqADMAAV1BAwD7ADMAAV1BAwAsADMAAXFBAwDdADMAAV1BAwAdADMAAXFBAwBMADMAAXFBAwDLADMAAV1BAwD3ADMAAXFBAwBDADMAAXJBAwAgADMAAXJBAwBQADMAAV24ADMQuQASAAH0QQMAVQASAAFyQQMAhgASAAFxQQMAdgASAAFdQQMA2AASAAFdQQUAOQASAEkAEgACckEHADkAEgBJABIAWQASAANxQQMA2QASAAFxQQMA+wASAAFxQQMA/AASAAFdQQUAPQASAE0AEgACXUEDAMsAEgABXUEDAKoAEgABXUEDAJkAEgABcUEDAAkAEgABckEDAOgAEgABcUEDAKgAEgABcUEDAMYAEgABcUEDAHUAEgABckEDAKQAEgABckEDAIQAEgABckEDAKkAMgABXbgAMhC5ABMAAfRBAwAYABMAAXFBAwA5ABMAAXFBAwCqABMAAXFBAwD7ABMAAV1BAwDKABMAAXFBAwDoABMAAV1BAwCXABMAAXFBAwDVABMAAXJBAwDoABQAAV1BAwDWABUAAXFBAwA2ABUAAXJBAwDkABUAAXFBAwD6ABgAAV1BAwAjABgAAXFBAwDxABgAAXG6ABkAKQBGERI5QQMAVAAZAAFdQQMA5QAZAAFdQQMANgAZAAFyQQMAZgAZAAFxQQMA5gAZAAFxQQMApQAZAAFdQQMAVQAZAAFxQQMAQQAZAAFyQQMAAAAZAAFyQQMARAAbAAFyugAdACkARhESOUEDAJQAHQABXUEDAKUAHQABXUEDANMAHQABckEDACMAHQABXUEDAPoAHgABXUEDAPcAIgABXUEDALcAIgABXUEDAAYAIgABcUEDABMAIgABcUEHAIAAIwCQACMAoAAjAANdQQMAtwAjAAFdQQMAnwAjAAFxQQMA/wAjAAFxQQMANAAjAAFdQQUAEAAjACAAIwACXUEDAFAAIwABXUEDAMYAJAABXUEDAPsAJQABcUEDAFcAJgABXUEDAMgAJwABXUEDAPoAJwABcUEDADoAJwABckEFANYAJwDmACcAAnFBAwCkACcAAV1BAwD3ACsAAXFBAwD5ACwAAV1BAwCmACwAAV1BAwAmACwAAXFBAwCgAC0AAV1BAwAmADEAAXFBAwD1ADEAAXFBAwA0ADUAAXFBBQA2ADYARgA2AAJxQQMAFgA2AAFxQQMA8wA2AAFxQQMAMAA2AAFyQQMAxAA3AAFxQQMASQA3AAFxQQMAYwA3AAFdQQMAUQA3AAFdQQcALQA4AD0AOABNADgAA11BAwBbADgAAXJBAwD1ADgAAV1BAwDWADkAAXFBAwD0ADkAAXG6ADoAKQBGERI5QQMAIwA6AAFyQQMABAA6AAFyQQMA1wA6AAFdQQMAPQA6AAFdQQMAXwA6AAFdQQMAbQA6AAFdQQMAmwA6AAFdQQMA9QA6AAFxQQMA0wA6AAFxQQUAMgA6AEIAOgACckEDABAAOgABckEDAMcAPQABcUEDAFAAQAABXUEDAAUAQAABcUEDADcAQAABckEDADcAQAABcUEDACgAQAABckEDAFoAQAABcUEDAAwAQAABckEDAJ8AQAABcUEDAP4AQAABcUEDABoAQAABckEDANoAQAABcUEDAOgAQAABcUEDAPcAQAABXUEDAIUAQAABcUEDABIAQAABXUEFACAAQAAwAEAAAl1BBwCAAEAAkABAAKAAQAADXbgAKxC4AEzQQQMA1ABMAAFxQQMA/wBMAAFxQQMAWQBMAAFxQQUAgABMAJAATAACckEFAJAATACgAEwAAl24AAgQuQBSAAH0QRkANwBSAEcAUgBXAFIAZwBSAHcAUgCHAFIAlwBSAKcAUgC3AFIAxwBSANcAUgDnAFIADHFBBQAHAFIAFwBSAAJdQQMA9wBSAAFdQQUABwBSABcAUgACcUEDAPgAUgABcUEJAFcAUgBnAFIAdwBSAIcAUgAEXUEDADcAUgABXUEHAAcAUgAXAFIAJwBSAANyQQMANgBSAAFyMDEBQQMASQABAAFxQQMAqQABAAFxQQMA6QABAAFxQQUA1gAHAOYABwACXUEFANkACQDpAAkAAl1BAwC6AAkAAV1BAwDpAA0AAV1BAwCoABgAAXFBAwD3ABkAAXFBAwDqABkAAXFBAwC4ABoAAXFBAwDoABsAAXFBAwCZAB0AAXFBAwDpACIAAV1BAwDmACQAAV1BAwCgADkAAXEAQQMAqQADAAFxQQMAigADAAFxQQMAugADAAFxQQUAawADAHsAAwACcUEDANkABgABXUEDAOoABgABXUEDAAkABwABcUEDABoABwABcUEDAAkACQABcUEDABoACQABcUEDALkACgABXUEFANkACgDpAAoAAl1BAwASAA0AAXFBAwCyAA0AAXFBAwADAA0AAXFBAwCTAA0AAXFBAwCkAA0AAXFBAwCzAA4AAXFBAwAUAA4AAXFBAwCUAA4AAXFBAwAFAA4AAXFBAwClAA4AAXFBAwA1ABEAAXFBAwB5ABEAAXFBAwAzABIAAXFBAwB5ABIAAXFBAwA1ABMAAXFBAwDIABMAAXFBAwB5ABMAAXFBAwA1ABQAAXFBAwCgABgAAXFBAwCQABkAAXFBAwDwABkAAXFBBQAQABkAIAAZAAJyQQMAsQAZAAFxQQMAwgAZAAFxQQMAowAZAAFxQQMA0wAZAAFxQQMAdgAZAAFxQQUAEAAaACAAGgACckEDAJEAGgABcUEDAPEAGgABcUEDAOIAGgABcUEDAKMAGgABcUEDANMAGgABcUEDALQAGgABcUEDAMUAGgABcUEDACAAGwABckEDABMAGwABckEDAJQAGwABcUEDAMQAGwABcUEDAPQAGwABcUEDALUAGwABcUEFANUAGwDlABsAAnFBAwCmABsAAXFBAwDmACEAAV1BAwDmACUAAV1BAwAiADEAAXJBAwC4ADMAAXFBAwADADgAAXFBAwAUADgAAXFBAwCjADoAAXFBAwDlADoAAXFBAwCWADoAAXEhIyYnFhUUBiMiJjU0Njc1NCcHJw4BFRQWFzY3NjcuATU0NjMyFgcOAQcjNTQmNTQ3NjcXNx4BHQEWFxEzBTQmIyIGFRQWMzI2FzQmIyIGFRQWMzI2AdwkGjcCJB4eJCMZLkA7Fx0pAQgWGgkZHSIZGSMBAnwDJCoXGi02NiwvUiEk/vcSDg4REQ4OEnUUDg4TEw4OFCscBggaJycbGiYCiEgeOjsPPB4dbSIRFhgNAyEXGSIjGC6BLlseaRwxKCwMOToIUDCRHCcBVKoOEhIODhERlw4UFA4OExMAAAMAHv/3AfwBkAA5AEUAURK1uwBAAAYAIQAEK7sAGwAGADoABCu7AC0ABQAKAAQruwBMAAYABgAEK7sANgAFADMABCu6AEYAMwA2ERI5uABGL0EHANAARgDgAEYA8ABGAANdQQMAKABGAAFyQQMAOQBGAAFdQQMAmQBGAAFxQQMAGQBGAAFdQQMAWQBGAAFdQQMAiQBGAAFdQQMACQBGAAFxQQMAOQBGAAFxQQMA6QBGAAFxQQMAuQBGAAFxQQcAkABGAKAARgCwAEYAA11BAwAgAEYAAV1BAwBgAEYAAV25AAAABvRBBwAwAAAAQAAAAFAAAAADXUEDACcAAAABckEDAAYAAAABcUEFAAAAAAAQAAAAAl1BAwBwAAAAAV1BAwAGAAEAAXFBAwA3AAIAAXFBAwCHAAIAAXFBAwAXAAIAAXFBAwC2AAIAAXFBAwCWAAIAAXFBAwCMAAQAAXFBAwAOAAQAAXFBAwBdAAQAAXFBAwA6AAQAAXFBAwAaAAQAAXFBAwBrAAYAAV1BAwCtAAYAAXFBAwAtAAYAAV1BAwB+AAYAAXFBAwDOAAYAAXFBAwA/AAYAAV1BAwBfAAYAAV1BAwA/AAYAAXFBAwAPAAYAAXFBAwCvAAYAAXJBCwBPAAYAXwAGAG8ABgB/AAYAjwAGAAVyQQMAHgAGAAFdQQMAjQAGAAFxQQMALQAGAAFyQQMAXAAGAAFxQQMApgAGAAFdQQMAdQAGAAFdQQMAGQAHAAFdQQMAKgAHAAFdQQMAWwAHAAFxQQcAbwAHAH8ABwCPAAcAA3JBAwCvAAcAAXJBAwBPAAcAAXJBAwB9AAcAAXFBAwCKAAcAAXFBAwA5AAcAAV1BAwBIAAcAAV1BAwB1AAcAAV1BAwCBAAkAAXJBAwBiAAkAAXJBAwBjAAkAAXFBAwCkAAkAAXJBAwCUAAkAAXFBBQDlAAkA9QAJAAJxQQMAFQAJAAFyQQMAdgAJAAFxQQMApwAJAAFdQQMADgAJAAFxQQMAFwAJAAFxQQMAVgAJAAFxQQUApgAJALYACQACcUEDAIUACQABcUEDAFUACQABckEDAMQACQABcUEDAHMACQABckEFACMACQAzAAkAAnJBAwACAAkAAXJBAwDRAAkAAXFBAwBAAAkAAXJBAwBGAA4AAXJBAwBXAA4AAXFBAwAlAA4AAXJBAwBkAA4AAXG6ABAAIQBAERI5QQUA5AAQAPQAEAACcUEDAAUAEAABckEDAEYAEAABcUEDAEkAEAABXUEDAHkAEAABXUEDADoAEAABcUEDAFoAEAABXUEDAKsAEAABXUEDAOsAEAABXUEDAMoAEAABXUEDAPoAEAABXUEDANkAEAABXUEDALgAEAABXUEFABYAEAAmABAAAnJBBQDFABAA1QAQAAJxQQMANAAQAAFyQQMAQgAQAAFyQQMARQARAAFxQQMA4QARAAFxugASACEAABESOUEDACcAEgABckEDACkAEgABcUEFAGoAEgB6ABIAAl1BAwD7ABIAAV1BAwBbABIAAV1BAwA8ABIAAXFBAwDLABIAAV1BAwA7ABIAAV1BBQCZABIAqQASAAJdQQMASAASAAFdQQMA5gASAAFxQQMARQASAAFxuABAELgAFdC4ABUvQQMAAAAZAAFxQQUAkAAbAKAAGwACXUEDAPAAGwABXUEDAAAAGwABcUEDADEAGwABXUEDAOYAGwABXUEFABYAGwAmABsAAnJBBwAGABsAFgAbACYAGwADXUEDAIYAGwABXUEDAD8AGwABcUEFAFYAGwBmABsAAl1BAwDmABsAAXFBBQC2ABsAxgAbAAJdQQMAhgAbAAFxQQMAQAAbAAFdQQUAUAAbAGAAGwACckEFAJAAGwCgABsAAnJBCQCgABsAsAAbAMAAGwDQABsABHFBAwAAAB0AAXFBAwAIAB8AAXG6ACQAIQAAERI5QQMAVQAkAAFxQQUAaAAkAHgAJAACXUEDAMkAJAABcUEDADwAJAABckEDAFkAJAABXUEDANgAJAABcUEDACYAJAABcUEDAHQAJAABckEDAEQAJAABcUEDAAUAJgABcUEFAKgAJgC4ACYAAl1BBQDYACYA6AAmAAJdQQMAyQAmAAFdQQMA+QAmAAFdQQMAeQAmAAFyQQMAmQAmAAFdQQMAGAAmAAFdQQMA5wAmAAFxQQMAIwAmAAFxQQMAEQAmAAFxQQMARgAnAAFxQQMAqgAoAAFdQQMAGgAoAAFxQQMAWgAoAAFdQQcAewAoAIsAKACbACgAA3FBAwAqACgAAV1BAwB6ACgAAV1BAwA2ACgAAXJBAwBFACgAAXJBAwA0ACoAAXJBAwAWACoAAXJBAwB2ACoAAV1BAwAWACoAAXFBAwAlACoAAXJBAwDjACoAAXFBAwDyACoAAXFBAwBrAC8AAXG6ADgAMwA2ERI5QQMAIwA4AAFyQQUAxAA4ANQAOAACcUEDAIQAOAABcUEDANUAOAABXUEDAHUAOAABcUEDAEUAOAABckEDAPYAOAABXUEDADsAOAABcUEDAGcAOAABXUEDALYAOAABXUEFAJUAOAClADgAAnFBBwCFADgAlQA4AKUAOAADXUEDAHQAOAABXUEDADQAOAABckEFAAQAOAAUADgAAnJBAwDjADgAAV1BBQDjADgA8wA4AAJxQQMA8AA6AAFdQQMAAAA6AAFxQQUAkAA6AKAAOgACckEDAD8AOgABcUEFAJAAOgCgADoAAl1BCQCgADoAsAA6AMAAOgDQADoABHFBBQBQADoAYAA6AAJyQQMArgBMAAFxQQMALgBMAAFyQQMAbwBMAAFdQQMADwBMAAFxQQUAfwBMAI8ATAACcUELAE8ATABfAEwAbwBMAH8ATACPAEwABXJBAwCvAEwAAXJBAwA/AEwAAXFBAwAPAEwAAV1BAwDOAEwAAXFBAwBcAEwAAXFBAwBJAEwAAV1BAwAgAFIAAXFBAwDQAFMAAXFBAwB/AFMAAXFBAwA/AFMAAXFBBwAPAFMAHwBTAC8AUwADXUEDAF8AUwABcUEDAE8AUwABXUEDAPAAUwABcUEDAAAAUwABcQC4AABFWLgANC8buQA0ABA+WbgAAEVYuAApLxu5ACkAED5ZuAAARVi4AAMvG7kAAwAKPlm4AABFWLgAHi8buQAeAAo+WbgAAEVYuAAJLxu5AAkACj5ZuwAYAAEASQAEK0EDAAYAAQABcUEFALsAAgDLAAIAAl1BBQDrAAIA+wACAAJdQQUAuwAEAMsABAACXUEFAOsABAD7AAQAAl1BAwCJAAYAAXFBAwBbAAYAAXFBAwAqAAYAAV1BAwAnAAYAAXJBAwBWAAYAAV26AAcAAwApERI5QQMASAAHAAFdQQMAOQAHAAFdQQMAOQAHAAFxQQMA2QAHAAFxQQMAKgAHAAFdQQMAqgAHAAFxQQMAWwAHAAFxQQUA6wAHAPsABwACcUEDAI0ABwABcUEDAC0ABwABckEDAM0ABwABcUEDAJwABwABcUEDAHsABwABcUEDABsABwABckEDAFoABwABXUEDADoABwABckEDAGkABwABcUEDAKkABwABXUEDAGgABwABXUEDABgABwABXUEDAAgABwABckEDACoACAABXUEDAAoACwABckEDAMwACwABcUEDAP0ACwABXUEDANsACwABXUEDANoACwABcUEDADQACwABcrgAKRC5AA0AAfRBBQDoAA0A+AANAAJdQQUACAANABgADQACcUEFADkADQBJAA0AAnJBGwA4AA0ASAANAFgADQBoAA0AeAANAIgADQCYAA0AqAANALgADQDIAA0A2AANAOgADQD4AA0ADXFBBwAIAA0AGAANACgADQADckEbAAgADQAYAA0AKAANADgADQBIAA0AWAANAGgADQB4AA0AiAANAJgADQCoAA0AuAANAMgADQANXUEDAGcADgABcboAEAADACkREjlBAwA5ABAAAV1BAwDKABAAAV1BBQDcABAA7AAQAAJdQQMA/gAQAAFdQQMAPQAQAAFxQQMAqwAQAAFdQQUAGgAQACoAEAACcUEDALkAEAABXUEDAEgAEAABXUEDAEYAEQABcUEDAMYAEQABcboAEgADACkREjlBAwBmABIAAV1BAwBIABIAAV1BAwApABIAAXJBAwAqABIAAXFBAwAbABIAAXFBAwDcABIAAV1BAwBeABIAAXFBAwDPABIAAV1BAwD/ABIAAV1BAwA/ABIAAXFBAwCsABIAAV1BAwBrABIAAXFBAwDrABIAAV1BAwA6ABIAAV1BAwA4ABIAAXJBAwDmABIAAXFBAwBzABIAAV1BAwBQABIAAV1BAwBuABUAAXFBAwD+ABUAAV1BAwAsABUAAXJBAwA7ABUAAXJBBwAfAEkALwBJAD8ASQADcUEDAKAASQABXUEDAKAAGAABXUEDABMAGAABXUEHAB8AGAAvABgAPwAYAANxQQMAIgAYAAFdQQMAUAAYAAFdQQMA0AAYAAFxugAWAEkAGBESOUEDANQAFgABcUEDAPUAGQABXUEDAMcAGwABcUEDAPsAHQABXUEFALsAHwDLAB8AAl1BBQDrAB8A+wAfAAJdQQMAlAAiAAFxQQMA6gAiAAFdQQMAbwAiAAFxQQMA2wAiAAFdQQUAdQAiAIUAIgACcUEDANQAIgABcUEDAFAAIgABXboAJAADACkREjlBAwB0ACQAAV1BAwDmACQAAXFBAwC5ACQAAV1BAwApACQAAXFBAwA6ACQAAXJBAwBrACQAAXFBAwDMACQAAV1BAwD+ACQAAV1BAwDdACQAAV1BAwCrACQAAV1BAwDqACQAAV1BAwBaACQAAXFBAwApACQAAXJBBQDHACQA1wAkAAJxQQMAZQAkAAFdQQMAQwAkAAFxQQMAUAAkAAFdugAmAAMAKRESOUEDAEoAJgABXUEDADsAJgABXUEDAC0AJgABcUEFAF0AJgBtACYAAnFBAwA/ACYAAXFBBwDfACYA7wAmAP8AJgADXUEDAK4AJgABXUEDAM0AJgABXUEDABwAJgABcUEDAAsAJgABcUEDADkAJgABckEDALkAJgABXUEDAFMAJwABXUEDABMALAABckEDADMALAABckEDAEQALAABckEDAPUALAABcUEDADYALAABcUEDAGUALAABXUEDACQALAABcUEDAFMALAABXUEDAOIALAABcUEFAAAALAAQACwAAnG6AC0AAwApERI5QQMAIwAtAAFyQQMA8wAtAAFdQQMABQAtAAFxQQMApgAtAAFxQQMAOwAtAAFdQQMAGwAtAAFdQQMATQAtAAFdQQMAfwAtAAFdQQMALQAtAAFdQQMAqwAtAAFdQQMAaQAtAAFdQQkAxQAtANUALQDlAC0A9QAtAARxQQMABQAtAAFyQQMAFAAtAAFyQQMAswAtAAFxQQMAMgAtAAFyQQMAQAAtAAFyQQMAtAAuAAFxQQMAQAAuAAFyQQMABQAvAAFyQQMAtAAvAAFxQQMAQgAvAAFyQQMAxQAxAAFdQQMARQAxAAFyQQMAxgAxAAFxQQMAWgAxAAFdQQMARgAxAAFxQQMAVQAxAAFxQQMAtAAxAAFxQQMAAgAxAAFxQQMAsAAzAAFxugA4AEkAGBESOUEDALYAOAABXUEDADcAOAABcUEFAOkAOAD5ADgAAnFBBQDKADgA2gA4AAJxQQMAqgA4AAFxQQMAGwA4AAFyQQMArAA4AAFdQQMAnQA4AAFdQQcAbAA4AHwAOACMADgAA11BAwCLADgAAXFBBwAqADgAOgA4AEoAOAADckEDAAoAOAABckEDAHkAOAABcUEDAJkAOAABcUEDAOcAOAABXUEDANUAOAABXUEDAPQAOAABXUEDAIYAOQABcUEDAAQAOQABcbgASRC4AD3QuAA9L0EDANAAPQABcbgAHhC5AEMAAfRBAwDnAEMAAV1BBQDnAEMA9wBDAAJxQQcABwBDABcAQwAnAEMAA3JBCQBHAEMAVwBDAGcAQwB3AEMABF1BAwAHAEMAAXFBBwB3AEMAhwBDAJcAQwADcUEHAAcAQwAXAEMAJwBDAANdQQMARwBDAAFxQQUANgBDAEYAQwACckEDAIcATAABcbgAT9BBBQBIAE8AWABPAAJdQQMAeABPAAFdMDEBQQMAgAAAAAFdQQMAgAABAAFdQQMAhAACAAFdQQMA1gACAAFdQQMA2QAEAAFdQQMAbwAGAAFdQQMAbwAHAAFdQQMA1gAZAAFdQQMA1gAdAAFdQQMA2QAfAAFdQQMASAAkAAFxQQMAgAA5AAFdQQMAbwBTAAFdAEEDANkAAQABXUEDANkABQABXUEDANYAGgABXUEDANkAHAABXUEDANkAIAABXUEDAEkAJAABcUEDAD8AJAABcUEDAD4AJgABcSUUBiMiJj0BBgcjETQjIgYHFhcOAR0BNjMyFhUUBiMiJj0BNDcmBz4BMzIWHQE2NzY3Nj0BMxUUBxYFNCYjIgYVFBYzMjYlNCYjIgYVFBYzMjYB/CYdHCYkHCthIDcLOBgYJA0RHCYlHR0lNCYpCU83PkUXKTEJGSQTKP6hFA4OExMODhQBPhQODhQUDg4UOBwlJRwGDjABCWcmHwQoBSoaQQYmGx0mJx16NhkPBDhJRD/dHhMYBxYtxcM8ExEsDhQUDg4TEw0OFBQODhQUAAAAAAIAIAAAAU8BkAAnADML37sABwAFACEABCu7AC4ABgATAAQruwAZAAYAKAAEK7sAAAAFAAEABCtBBQDPAAAA3wAAAAJdQQMAoAAAAAFdQQUAzwABAN8AAQACXUEDAKAAAQABXUEDANsAAgABXUEDAKMAAgABXUEDAIoAAwABcUEDAMcAAwABcUEDAJMABQABcUEDAEUABQABckEDALcABQABXUEDANoABQABXUEDAFYABQABcUEFAGQABQB0AAUAAnFBAwChAAUAAV1BAwCBAAUAAXFBDwA2AAcARgAHAFYABwBmAAcAdgAHAIYABwCWAAcAB11BAwB2AAcAAXFBBQDGAAcA1gAHAAJxQQMA9gAHAAFxQQcABgAHABYABwAmAAcAA3JBAwCWAAcAAXFBAwD2AAcAAV1BBQAGAAcAFgAHAAJxQQMABgAHAAFdQQMAFQAHAAFdQQMAFQAJAAFdQQMAZAAJAAFdQQMAQQAJAAFyuAAHELkAHAAF9EEDAMcAHAABcUEDAEcAHAABcUEDABgAHAABcUEDAPsAHAABcUEDAGsAHAABXUEDAGoAHAABckEFAMcAHADXABwAAl1BAwCnABwAAXFBAwC2ABwAAV1BAwADABwAAV24AArQuAAKL0EDALYACgABXUEDACMACgABXboADAAHABwREjlBAwDnAAwAAXFBAwBIAAwAAXJBAwD5AAwAAXFBAwBoAAwAAXJBAwB4AAwAAXFBAwAkAAwAAV1BAwATAAwAAV1BAwD9AA4AAXFBAwAeAA4AAV1BAwBqAA4AAV1BBQAZAA4AKQAOAAJyugAQACEAABESOUEDAOkAEAABcUEDAEoAEAABckEFAKwAEAC8ABAAAnFBAwD+ABAAAXFBAwA/ABAAAXJBAwANABAAAXJBAwDrABAAAV1BBQAKABAAGgAQAAJxQQMA+QAQAAFdQQMAYAAQAAFdQQMA+AARAAFdQQMA2wASAAFxQQMAPgASAAFdQQMAWgASAAFdQQMACQASAAFxQQMAwQATAAFxQQMAYwATAAFdQQMATQATAAFdQQUAHwATAC8AEwACXUEFAL8AEwDPABMAAl1BAwCvABMAAXFBAwA+ABMAAV1BAwBcABMAAXJBAwAjABMAAXJBAwDgABMAAXFBAwDQABMAAXJBAwA9ABQAAV1BAwD5ABUAAV1BAwAIABUAAXFBAwD2ABcAAV1BAwAGABcAAXFBAwBCABkAAV1BBQBTABkAYwAZAAJdQQUATwAZAF8AGQACcUEFAL8AGQDPABkAAl1BBQCSABkAogAZAAJdQQMAwAAZAAFxQQMA4AAZAAFxQQMA+QAaAAFdQQMA0wAaAAFxQQMAQAAbAAFyQQMAwAAbAAFxQQMAEAAbAAFyuAAHELgAHdC4AB0vQQMAJQAdAAFdQQMAFAAdAAFdQQMAAwAdAAFdQQMARQAeAAFdQQMAZAAeAAFdQQMAhQAjAAFxQQcAFgAjACYAIwA2ACMAA3JBAwCoACMAAXFBAwD5ACMAAV1BBQDaACMA6gAjAAJdQQcACQAjABkAIwApACMAA11BAwC5ACMAAXFBAwB2ACMAAXFBAwBFACMAAXJBAwBUACMAAXJBAwCTACMAAXFBAwDkACUAAXFBAwA1ACUAAV1BAwDWACUAAXFBBQAWACUAJgAlAAJdQQMASQAlAAFyQQMAigAlAAFxQQMA2AAlAAFdQQMApgAlAAFxQQUA5QAlAPUAJQACXUEFALUAJQDFACUAAnFBAwADACUAAXFBAwADACUAAXJBAwDoACYAAV1BAwClACcAAV1BAwDAACgAAXFBAwAJACgAAXFBAwCZACgAAXFBBQAJACgAGQAoAAJdQQUAvwAoAM8AKAACXUEFAE8AKABfACgAAnFBAwB5ACgAAXFBAwDZACgAAXFBAwD5ACgAAXFBBwAJACgAGQAoACkAKAADckEJADkAKABJACgAWQAoAGkAKAAEXUEDAOAAKAABcUEFAJAAKACgACgAAl1BAwAgAC4AAXJBBQAGAC4AFgAuAAJdQQkANgAuAEYALgBWAC4AZgAuAARdQQMA9gAuAAFxQQUABgAuABYALgACckEDAF0ALgABckEDAK8ALgABcUEFAL8ALgDPAC4AAl1BAwCWAC4AAXFBAwDWAC4AAXFBAwB2AC4AAXFBAwDCAC4AAXFBAwDgAC4AAXFBAwDQAC4AAXJBBQCQADQAoAA0AAJdQQMATwA1AAFxQQMAzwA1AAFdQQUATwA1AF8ANQACXUEDAH8ANQABXUEFAB8ANQAvADUAAl1BAwDwADUAAXFBAwAAADUAAXIAuAAARVi4ACQvG7kAJAAQPlm4AABFWLgAAC8buQAAAAo+WbgAAEVYuAAcLxu5ABwACj5ZuwAWAAIAKwAEK7sAMQACABAABCtBAwBMAAIAAXJBAwCwAAIAAXFBAwCzAAMAAXG4ACQQuQAEAAH0QQMA+AAEAAFdQQUACAAEABgABAACcUEHAHgABACIAAQAmAAEAANxQQUAOQAEAEkABAACckEHADgABABIAAQAWAAEAANxQRkACAAEABgABAAoAAQAOAAEAEgABABYAAQAaAAEAHgABACIAAQAmAAEAKgABAC4AAQADF1BCQDIAAQA2AAEAOgABAD4AAQABHFBBwAIAAQAGAAEACgABAADckEDAE4ABgABckEDADoABgABckEDABUACQABXUEDAPkACQABcUEDAAkACQABckEDAKQACQABXUEDADMACQABcroADAAAACQREjlBAwDxAAwAAXFBAwDiAAwAAXFBAwBUAAwAAXFBAwBkAAwAAV1BBQCFAAwAlQAMAAJxQQMAtgAMAAFxQQMARwAMAAFyQQMAewAMAAFdQQMAagAMAAFyQQMAdwAMAAFxQQMA5QAMAAFdQQMA9AAMAAFdQQMApAAMAAFxQQMAQgAMAAFdQQMAEgAMAAFxQQMAAAAMAAFyQQMAMAAMAAFyQQMAtQAOAAFxQQMARgAOAAFyQQMAEgAOAAFxQQMAMAAOAAFyQQMAUQAQAAFxQQMAFAAQAAFxQQMA2wAQAAFxQQMATAAQAAFyQQMA9AAQAAFdQQMAYQAQAAFdQQMAYAAQAAFxQQMAAAAQAAFyQQMA+QARAAFdQQMACAASAAFxQQMANwAUAAFdQQMABgAVAAFxQQMA8wAVAAFdQQMAYQAWAAFdQQMAkwAWAAFdQQMAAwAWAAFdQQMAzwAWAAFyQQMALwAWAAFxQQMAUwAWAAFdQQMAYQAWAAFyQQMAoQAWAAFdQQkAEAAWACAAFgAwABYAQAAWAARdQQMABQAXAAFxQQMA8wAXAAFdQQMA5wAZAAFxQQMAwAAaAAFyQQMA0gAaAAFyQQMAkgAaAAFyQQMApAAaAAFyQQMAhAAaAAFdQQMAlQAaAAFdQQMAOQAaAAFdQQMATAAaAAFyQQMArAAaAAFxQQMAKwAaAAFxQQMAxgAaAAFxQQMABQAaAAFyQQMAFAAaAAFxQQMA8wAaAAFxQQMAogAaAAFdQQMAYQAaAAFyQQUA4AAaAPAAGgACXUEDAIAAGgABckEFAM8AGwDfABsAAnFBAwC4ACAAAXFBAwBLACIAAXJBBQDHACIA1wAiAAJdQQMAJQAiAAFdQQMABAAmAAFyQQMAxQAmAAFxQQMApgAmAAFxQQMAJQAmAAFdQQMA9QAmAAFxQQMA8gAmAAFdQQMAsQAmAAFxQQMA1gAnAAFdQQMAwQAnAAFdQQMANQArAAFdQQMALwArAAFxQQMAzwArAAFyQQMAHgArAAFdQQMAYgArAAFyQQUAkAArAKAAKwACXUEFAFAAMQBgADEAAnFBAwDbADEAAXFBAwBPADEAAXJBAwABADEAAXJBAwCwADEAAV1BAwAQADEAAXEwMQFBAwDJABEAAV1BCQC5ABUAyQAVANkAFQDpABUABF1BCQC2ABcAxgAXANYAFwDmABcABF1BAwAAADUAAXEAQQUAyQASANkAEgACXUEDALUAFAABXUEHAMYAFADWABQA5gAUAANdQQUAtQAYAMUAGAACXUEDANYAGAABXSEjETQjIgYVFBYVFAc2NzY3IiY1NDYzMhYVFAYHIzU0JjU0NjMyFhUHNCYjIgYVFBYzMjYBTyRzLkYgAgwdFxgZIiIZGSKNAyQhWkNFTXYSDQ0SEg0NEgEEbD8uHWMbFAcaIBkaIhkZIiIZMJQxWh1rHEROST4UDRISDQ0SEgAAAAACACAAAAFPAZAAKQA1DFS7AAgABQAfAAQruwAwAAYAEQAEK7sAFwAGACoABCu7AAAABQABAAQrQQUAzwAAAN8AAAACXUEDAKAAAAABXUEFAM8AAQDfAAEAAl1BAwCgAAEAAV1BAwAlAAQAAXJBAwAIAAQAAXJBAwAbAAQAAXFBAwD5AAQAAXFBAwAXAAQAAXJBAwDFAAQAAXFBAwA0AAQAAXJBAwDNAAUAAV1BAwBXAAUAAV1BBQDHAAUA1wAFAAJxQQMAFwAGAAFxQQUAGQAGACkABgACckEDADgABgABckEDAPcABgABcUEDAAYABgABckEDAPAACAABcUEDADwACgABXbgACBC5ABoABfRBAwA1ABoAAV1BAwC3ABoAAXFBAwC3ABoAAV1BAwDZABoAAV1BAwBZABoAAXFBAwB6ABoAAXFBBQAqABoAOgAaAAJxQQMAGQAaAAFxQQMAiQAaAAFxQQMA9wAaAAFdQQMApgAaAAFxQQMAEwAaAAFdQQMAAgAaAAFduAAL0LgACy9BAwD1AAsAAV1BAwA0AAsAAV1BAwAiAAsAAV1BAwB0AA0AAXJBAwDwAB8AAXG6AA4AHwAAERI5QQMAiQAOAAFdQQMAygAOAAFxQQMAmgAOAAFxQQMASgAOAAFxQQMASwAOAAFyQQMArAAOAAFxQQMAjAAOAAFxQQMAXQAOAAFxQQMADAAOAAFxQQMAbAAOAAFxQQMA+wAOAAFdQQMA6gAOAAFdQQMAegAOAAFxQQcA2QAOAOkADgD5AA4AA3FBAwAJAA4AAXJBAwDZAA4AAXJBAwC5AA4AAXFBAwAIABAAAXFBAwC8ABEAAXJBAwCvABEAAXFBAwCfABEAAXJBAwDPABEAAV1BAwAfABEAAV1BAwA/ABEAAV1BAwBNABEAAV1BAwBgABEAAV1BAwAgABEAAXJBAwD8ABMAAV1BAwBMABMAAXFBAwD1ABUAAV1BAwAAABcAAV1BAwBfABcAAXFBAwDPABcAAV1BAwBNABcAAXFBBQCQABcAoAAXAAJdQQcAQAAXAFAAFwBgABcAA11BAwB5ABgAAV24AAgQuAAb0LgAGy9BBwAAABsAEAAbACAAGwADXUEDABwAIgABckEDADgAIgABcUEDAHcAIwABcUEDACkAIwABcUEDAPYAIwABcUEDAAYAIwABckEDAMIAIwABcUEDAMcAJAABcUEDABcAJQABckEDAHgAJQABcUEDAPkAJQABcUEDAAkAJQABckEDAMcAJQABcUEDACQAJQABcUEDAAQAJQABcUEDAOkAJgABXUEDACUAJgABckEDADQAJgABcUEDABwAJwABcUEDAPkAJwABcUEFAE8AKgBfACoAAnFBAwDPACoAAV1BAwBHACoAAV1BBQCQACoAoAAqAAJdQQMATgAwAAFdQQMArwAwAAFxQQMAnwAwAAFyQQMAzwAwAAFdQQMAvQAwAAFyQQMAIAAwAAFyQQMAuAAzAAFyQQUAkAA2AKAANgACXUEDAH8ANwABXUEFAB8ANwAvADcAAl1BAwBPADcAAXFBAwDPADcAAV1BBQBPADcAXwA3AAJdQQMA8AA3AAFxQQMAAAA3AAFyQQMAAAA3AAFxALgAMy+4AABFWLgAIy8buQAjABA+WbgAAEVYuAAlLxu5ACUAED5ZuAAARVi4AAAvG7kAAAAKPlm4AABFWLgAGi8buQAaAAo+WbsAFAACAC0ABCu7ACUAAQAEAAQruwAjAAEABgAEK7sABQABACQABCtBAwA1AAIAAXJBAwBHAAIAAXJBAwAqAAIAAXJBAwAFAAIAAXJBAwASAAIAAXJBAwChAAIAAXFBAwDOAAMAAXFBAwDIAAQAAV1BAwAoAAQAAXJBAwAJAAQAAXJBAwD6AAQAAV1BAwCrAAQAAXFBAwDpAAQAAV1BBQAJAAQAGQAEAAJxQQMAuAAEAAFxQQUANgAEAEYABAACckEDACIABAABXUEDAAMABQABckEDAEUABQABXUEDAPUABQABcUEDAMcABQABcUEDADkABQABckEDAOoABQABXUEFABwABQAsAAUAAnFBAwD9AAUAAV1BAwAOAAUAAV1BAwA9AAUAAV1BAwAsAAUAAXJBAwDMAAUAAV1BAwCZAAUAAXFBAwDpAAUAAXFBAwAWAAUAAXJBAwClAAUAAV1BAwBjAAUAAXFBAwBSAAUAAV1BAwBwAAUAAV1BAwAWAAYAAXJBAwDIAAYAAV1BAwBYAAYAAXJBAwB5AAYAAXFBBQDZAAYA6QAGAAJdQQMA+gAGAAFdQQMAGgAGAAFxQQMAqQAGAAFxQQMACQAGAAFxQQMAKAAGAAFyQQMANwAGAAFyQQMARgAGAAFyQQMAIAAGAAFdQQMA5wAHAAFxQQMARQAHAAFyQQMAGgAjAAFxQQMAIAAjAAFdugALAAAAIxESOUEDAPEACwABcUEHACIACwAyAAsAQgALAANxQQMA4gALAAFxQQUAAwALABMACwACckEDANUACwABXUEDAKYACwABXUEDAKsACwABckEDAMYACwABXUEDAAUACwABcUEDABQACwABcUEDANMACwABcUEDAMIACwABcUEDADEACwABckEDACAACwABckEDAEAACwABckEDAI0ADAABckEDAGwADAABckEDAIsADQABckEDAGkADQABcroADgAAACMREjlBAwD0AA4AAXFBBQAkAA4ANAAOAAJxQQMABQAOAAFyQQMA1gAOAAFdQQMAugAOAAFxQQMASwAOAAFyQQMA3QAOAAFxQQMAmwAOAAFxQQMAxwAOAAFxQQMAxQAOAAFdQQMA1AAOAAFyQQMAdAAOAAFdQQUAAwAOABMADgACXUEDABMADgABcUEDABoAEAABcUEDAPoAEAABXUEDAKkAEAABcUEDALcAEwABXUEDAAQAEwABcUEJAHAAFACAABQAkAAUAKAAFAAEXUEDAGEAFAABXUEDAB8AFAABcUEDAAEAFAABXUEHABAAFAAgABQAMAAUAANdQQMAYAAUAAFyQQMAtwAVAAFdQQMABAAVAAFxQQMAowAYAAFdQQMAhQAYAAFdQQMAKAAYAAFxQQMAWQAYAAFxQQMAugAYAAFxQQMA3gAYAAFxQQMAnQAYAAFxQQMAqQAYAAFxQQMAyAAYAAFxQQMAFgAYAAFxQQMAlAAYAAFdQQMA4wAYAAFdQQMAAAAYAAFxQQMA8AAdAAFdQQMAMwAhAAFyQQMAEQAhAAFyQQMAJQAiAAFyQQMAUQAkAAFdQQMAAQAkAAFyQQMAggAkAAFxQQMAFgAkAAFyQQUAxgAkANYAJAACcUEDADcAJAABckEDAPwAJAABXUEDACwAJAABckEDAM4AJAABXUEDAC0AJAABcUEDAAwAJAABXUEDABsAJAABcUEDAPYAJAABcUEDAOYAJAABXUEDAHUAJAABcUEDAGIAJAABcUEDAKEAJAABXUEDAHAAJAABXUEDAEAAJAABXUEDACAAJQABXUEDADEAJgABckEDABAAJgABckEDADYAJwABcUEDABAAJwABckEDADAAJwABckEDAKAAKQABcUEFAEMAKQBTACkAAl1BAwAFACkAAXJBAwAYACkAAXFBAwA0ACkAAXFBBQAyACkAQgApAAJyQQMAwAApAAFxQQUAEAApACAAKQACckEFAJAALQCgAC0AAl1BAwAfAC0AAXFBAwBwAC0AAV1BAwBgAC0AAXJBAwC4ADMAAV1BAwAJADMAAXFBBQCKADMAmgAzAAJyQQMAfAAzAAFyQQMA7wAzAAFdQQMAjwAzAAFdQQMA3wAzAAFxQQMAzAAzAAFyQQMAuwAzAAFyQQMA+gAzAAFdQQMAaQAzAAFyQQMAQAAzAAFxQQMA8AAzAAFxQQMAAAAzAAFyMDEBQQMA6QAPAAFdQQUA2QATAOkAEwACXUEDAMoAEwABXUEHAMYAFQDWABUA5gAVAANdQQMAaQAZAAFxQQUA5gAaAPYAGgACcUEDAFgAGgABcUEDAGkAGgABcUEDAPkAIgABcQBBAwAlAAQAAXJBAwDmAAUAAXFBAwBSAAsAAXFBBQByAAsAggALAAJxQQMAYwALAAFxQQMAcAAMAAFxQQMAUwAMAAFxQQMAgwAMAAFxQQMAZAAMAAFxQQMA6gAQAAFdQQUAxgASANYAEgACXUEFAMYAFgDWABYAAl1BAwBoABgAAXFBAwDmACQAAXEhIxE0JwcnBhUUFhU+ATcuATU0NjMyFhUUBgcjNTQmNTQ3NjcXNxYXFhUHNCYjIgYVFBYzMjYBTyQwQEQyIAo9ChcfIRkZIowDJCIWGi0+OSwZFnQSDQ0SEg0NEgEESh07OyBIH20oFDIPAiAYGSIiGS6AMFodaxwxKC0MNzcIKyUvKg0SEg0NEhIAAAACABr/+AFCAZAAJAAwDfK7ACsABgAZAAQruwATAAYAJQAEK7sAAAAFAAEABCtBBQAgAAAAMAAAAAJxQQUAIAABADAAAQACcUEDAGkABAABckEDAMoABAABXUEDAEwABAABckEDANkABAABXUEFAKkABAC5AAQAAnFBAwDoAAQAAV1BAwA0AAYAAXFBAwDkAAYAAXFBAwA1AAYAAXJBAwAlAAYAAXFBBQBWAAYAZgAGAAJxQQMAZQAGAAFyQQMAJAAGAAFyQQMAdAAGAAFxQQMAQwAGAAFyQQMAEAAGAAFyugAIABkAKxESOUEDABMACAABckEDAOQACAABcUEDAEUACAABcUEDADYACAABckEDANgACAABXUEFAFkACABpAAgAAnJBAwBqAAgAAV1BAwD6AAgAAV1BAwCMAAgAAXJBAwB+AAgAAXJBAwDsAAgAAV1BBQC7AAgAywAIAAJdQQUAmgAIAKoACAACXUEDAHoACAABcUEDADkACAABXUEDAFgACAABXUEDACUACAABckEFAMUACADVAAgAAnFBAwBEAAgAAXJBAwDzAAgAAXFBAwACAAgAAXJBAwA6AAkAAXJBAwDIAAkAAXFBAwDXAAkAAXFBAwBGAAoAAXFBAwBoAAoAAXFBAwCpAAoAAV1BAwBJAAoAAXJBAwA6AAoAAV1BAwBbAAoAAXFBAwB7AAoAAV1BAwD7AAoAAXFBAwDcAAoAAV1BAwAtAAoAAXJBAwC+AAoAAV1BAwBtAAoAAV1BAwB7AAoAAXFBAwDLAAoAAV1BAwBLAAoAAV1BBQDqAAoA+gAKAAJdQQMAGgAKAAFxQQMACQAKAAFxQQUACAAKABgACgACckEDAAYACgABXUEDAMUACgABcUEDANQACgABcUEDAAUACwABcUEDANkACwABcUEDAPYACwABXUEDAHQACwABcUEDAFMACwABcbgAKxC4AA3QuAANL7oADgAZAAAREjlBAwC2AA4AAXFBCQB3AA4AhwAOAJcADgCnAA4ABHFBBQDIAA4A2AAOAAJdQQMAmQAOAAFyQQMAuQAOAAFdQQcAigAOAJoADgCqAA4AA11BBQA7AA4ASwAOAAJdQQUAawAOAHsADgACXUEDAFoADgABXUEDAOkADgABXUEFAFkADgBpAA4AAnJBBQB4AA4AiAAOAAJyQQUA1gAOAOYADgACcUEDAMUADgABcUEDAPQADgABcUELAAQADgAUAA4AJAAOADQADgBEAA4ABXJBAwC0ABEAAXFBAwDDABEAAXFBBwAwABMAQAATAFAAEwADXUEDAPAAEwABXUEDAAAAEwABcUEJAFAAEwBgABMAcAATAIAAEwAEckEFAOYAEwD2ABMAAnFBAwAGABMAAXJBBwAGABMAFgATACYAEwADXUEDAEkAEwABckEDAE8AEwABcUEDADgAEwABckEDACYAEwABckEDAKEAEwABXUEHALAAEwDAABMA0AATAANxQQMAkAATAAFdQQMAEAATAAFyQQMA8AATAAFyQQMAtAAVAAFxQQMAwwAVAAFxQQMA+wAYAAFdQQMAugAYAAFdugAcABkAABESOUEDAFgAHAABXUEDAGkAHAABcUEDAHkAHAABXUEDADoAHAABXUEDADsAHAABckEDAEwAHAABckEDAC0AHAABckEDAE4AHAABXUEDAGwAHAABXUEDALsAHAABXUEDAOoAHAABcUEDAPkAHAABXUEFAMkAHADZABwAAnFBAwDYABwAAV1BBQCEABwAlAAcAAJyQQMAcAAcAAFyQQMANQAeAAFdQQMABgAeAAFxQQMA1wAeAAFyQQMAqAAeAAFdQQUAyQAeANkAHgACXUEDAOsAHgABXUEDACsAHgABckEDAHkAHgABXUEDAPkAHgABXUEDAHgAHgABckEDAEcAHgABXUEFAIYAHgCWAB4AAnJBAwA1AB4AAXFBAwAkAB4AAXFBAwA0ACAAAXFBAwAlACAAAXFBAwBmACAAAXFBAwDGACAAAXFBBQCpACAAuQAgAAJxQQUAagAgAHoAIAACXUEFAIsAIACbACAAAnFBAwAqACAAAV1BAwAZACAAAV1BAwBIACAAAV1BAwDmACAAAXFBBQA2ACAARgAgAAJyQQMAFAAgAAFyQQMAcwAgAAFxQQMAggAgAAFyQQMARQAiAAFdQQMA9QAiAAFdQQMAxgAiAAFxQQMANwAiAAFdQQMAFgAiAAFdQQMA5QAiAAFxQQMAJQAiAAFdQQMA1AAiAAFxQQMAEAAlAAFyQQUAkAAlAKAAJQACXUEDAFEAJQABckEDAE8AJQABcUEDAPAAJQABXUEDAAAAJQABcUEHALAAJQDAACUA0AAlAANxQQcAYAAlAHAAJQCAACUAA3JBAwDwACUAAXJBAwBvADEAAV1BBQAQADEAIAAxAAJxQQMAAAAyAAFyQQMA4AAyAAFdQQcADwAyAB8AMgAvADIAA11BAwBfADIAAV1BAwCPADIAAV1BAwCPADIAAXFBAwAwADIAAXFBAwDgADIAAXFBAwAQADIAAXEAuAAARVi4ACEvG7kAIQAQPlm4AABFWLgAAC8buQAAAAo+WbgAAEVYuAAWLxu5ABYACj5ZuwAQAAEAKAAEK0EFALkAAwDJAAMAAl1BAwDlAAMAAXG4ACEQuQAFAAH0QQMA+AAFAAFdQQUACAAFABgABQACcUEDAAkABQABXUEDADkABQABckEDADgABQABcUEbABgABQAoAAUAOAAFAEgABQBYAAUAaAAFAHgABQCIAAUAmAAFAKgABQC4AAUAyAAFANgABQANXUEXAFgABQBoAAUAeAAFAIgABQCYAAUAqAAFALgABQDIAAUA2AAFAOgABQD4AAUAC3FBBwAIAAUAGAAFACgABQADcroACAAWACEREjlBAwA1AAgAAV1BAwBGAAgAAXJBAwD4AAgAAXFBAwAqAAgAAXFBAwD7AAgAAV1BAwAMAAgAAXFBAwB8AAgAAXFBAwDtAAgAAV1BAwDcAAgAAV1BBQBbAAgAawAIAAJxQQMAygAIAAFdQQMAGQAIAAFxQQMAGAAIAAFyQQMARgAIAAFdQQMAVQAIAAFdQQMA5QAIAAFxQQMAGQAJAAFyQQMA+wAJAAFyQQMAOAAJAAFyQQMAQQAJAAFyQQMANAAKAAFdQQMARgAKAAFxQQMASAAKAAFyQQMA2AAKAAFxQQMAKgAKAAFyQQMA6wAKAAFxQQMAKwAKAAFxQQMAXQAKAAFxQQMADgAKAAFxQQMAfwAKAAFxQQMA/wAKAAFdQQMAzwAKAAFdQQMAHwAKAAFxQQMA3QAKAAFdQQMAbAAKAAFxQQMA6wAKAAFdQQMAOgAKAAFxQQMAugAKAAFdQQMAGAAKAAFyQQMAZgAKAAFdQQMAdAAKAAFdQQMAQgAKAAFdQQMAUAAKAAFdQQMA1wALAAFxQQMAWwALAAFxQQMA/wALAAFdQQMAHQALAAFyQQMAewALAAFxQQMA4wALAAFxQQMA8wALAAFyQQMA/wAMAAFdQQMAOgAMAAFyQQMA/wANAAFdQQMARAANAAFdQQMANwAoAAFdQQUAHwAoAC8AKAACcUEDAJ8AKAABckEDANAAKAABcUEDAKAAKAABXUEDANEAEAABcUEDACUAEAABXUEFAB8AEAAvABAAAnFBAwCfABAAAXJBAwAUABAAAV1BAwCgABAAAV1BBwAwABAAQAAQAFAAEAADXboADgAoABAREjlBAwC3ABEAAV1BAwD2ABEAAV1BAwAFABEAAXFBAwAYABMAAXJBAwCoABMAAV1BAwD8ABUAAV1BAwAMABUAAXFBAwC7ABUAAV1BAwAMABkAAXFBAwCKABkAAXJBAwD9ABoAAV1BAwAPABoAAXFBAwBBABoAAV1BAwBQABoAAV1BAwDUABsAAXFBAwB/ABsAAXFBAwAMABsAAXFBBQCEABsAlAAbAAJxQQMA4wAbAAFxugAcABYAIRESOUEDAEQAHAABXUEDAHYAHAABckEDAOcAHAABcUEDALgAHAABXUEDAMkAHAABXUEDAGsAHAABcUEDABwAHAABcUEDAP0AHAABXUEDAA0AHAABcUEDAF0AHAABcUEDAHwAHAABcUEFANsAHADrABwAAl1BAwAaABwAAXJBBQAoABwAOAAcAAJyQQMAhwAcAAFyQQMAxgAcAAFxQQUAZQAcAHUAHAACXUEDADMAHAABXUEDAFIAHAABXUEDAGgAHgABXUEDAPkAHgABckEDACsAHgABckEDAKwAHgABXUEDAC0AHgABcUEDAG4AHgABcUEDAB8AHgABcUEDAP8AHgABXUEFAM8AHgDfAB4AAl1BAwB/AB4AAXFBAwDuAB4AAV1BAwANAB4AAXFBAwA7AB4AAXFBAwC6AB4AAV1BAwB4AB4AAXJBAwB3AB4AAV1BAwBGAB4AAV1BAwBpAB8AAXJBBQDGACMA1gAjAAJxQQMA9AAjAAFdQQMA4AAjAAFxQQMABQAkAAFxQQMANwAlAAFyuAAWELkALgAB9EEDAFcALgABcUEFAGcALgB3AC4AAl1BCwAHAC4AFwAuACcALgA3AC4ARwAuAAVdQQMAFwAuAAFyQQMARgAuAAFyMDEBQQcAxgARANYAEQDmABEAA11BBwDGABUA1gAVAOYAFQADXUEHAMkAFwDZABcA6QAXAANdQQMAXwAyAAFxAEEHAMYAEgDWABIA5gASAANdQQcAyQAUANkAFADpABQAA11BAwDJABgAAV1BAwAPAB4AAXEhIxE0JiMiBgcWFw4BHQE2MzIWFRQGIyImPQE0NyYjPgEzMhYVBzQmIyIGFRQWMzI2AUIkPDEiPgw9EhckEA4cJyYdHCYzGzMIWDlAT6gUDg4TEw4OFAEFMzgnHgUmBSsZQQcnHB4kJhx8NhkLN0lIP9AOFBQODhMTAAACABEAAAF2AZAAHgAqBrC4AAYvuwAlAAYADgAEK7sAFQAFAAkABCu7AAAABQABAAQrQQMAfwAAAAFdQQMAfwABAAFdQQMA7QAGAAFdQQMAfAAGAAFdQQMAqgAGAAFdQQMAMgAHAAFyQQUAEwAHACMABwACckEDAPUABwABcUEDAAUABwABckEDAOcABwABcUEDADkABwABXUEDAHsABwABXUEDAOsABwABXUEDAPcABwABXUEDAJYABwABcUEDAKMABwABcUEFALIABwDCAAcAAnFBAwBAAAcAAXJBAwDQAAcAAXFBAwD+AAwAAV1BAwD+AA4AAV1BAwAPAA4AAXFBBQCfAA4ArwAOAAJdQQMA7wAOAAFdQQMAjQAOAAFdQQMAfAAOAAFdQQMA/QAQAAFdQQMA1AASAAFdQQMA9AASAAFdQQMA1QATAAFduAAVELgAF9C4ABcvQQMA5wAXAAFduAAGELkAGgAH9EEDAKoAGgABXUEDAGoAGgABXUEDACwAGgABXUEDAOoAGgABXUEDAHkAGgABXUEDADkAGgABXUEDAAkAGwABXUEDADoAGwABXUEDAOwAGwABXUEDAB4AGwABcUEFAIoAGwCaABsAAl1BAwD5ABsAAV1BAwC2ABsAAV1BAwB2ABsAAV1BAwDSAB0AAV1BAwAlAB0AAXFBAwDGAB0AAV1BAwC3AB0AAV1BAwDmAB0AAV1BAwD1AB0AAV1BAwASAB0AAXFBAwAwAB0AAXFBAwAAAB0AAXG4AAkQuAAf0LgAHy9BAwB/ACUAAV1BBQCfACUArwAlAAJdQQUA7wAlAP8AJQACXUEDAA8AJQABcUEDAIYAJQABXUEFAAYAJQAWACUAAl1BAwDoACgAAXFBAwAQACsAAXFBAwAAACwAAXJBBQB/ACwAjwAsAAJdQQUADwAsAB8ALAACXUEDAD8ALAABXUEDAG8ALAABcUEDAE8ALAABcUEDAOAALAABcUEDAAAALAABcQC4AABFWLgAES8buQARABA+WbgAAEVYuAAcLxu5ABwAED5ZuAAARVi4AAAvG7kAAAAKPlm4AABFWLgABy8buQAHAAo+WbsAKAABAAsABCu4ABwQuQAEAAH0QQUAOQAEAEkABAACckERAIgABACYAAQAqAAEALgABADIAAQA2AAEAOgABAD4AAQACF1BIQAIAAQAGAAEACgABAA4AAQASAAEAFgABABoAAQAeAAEAIgABACYAAQAqAAEALgABADIAAQA2AAEAOgABAD4AAQAEHFBBwAIAAQAGAAEACgABAADckEPAAgABAAYAAQAKAAEADgABABIAAQAWAAEAGgABAAHXUEDABsACwABXUEDAI4ACwABXUEDAE8ACwABckEDAM8ACwABXUEDAK8ACwABcUEDAM8ACwABcUEDAP8ACwABXUEDAK8ACwABXUEDAN4ACwABcUEDAAwACwABXUEDAFcACwABXUEDAOAACwABcUEDAN4AKAABcUEDAE8AKAABckEDAI8AKAABXUEDAM8AKAABXUEDAP8AKAABXUEDAK8AKAABXUEDAM8AKAABcUEDAK8AKAABcUEDAAgAKAABXUEDAOAAKAABcboACQALACgREjlBAwCKAAkAAV1BAwAnAAkAAV1BAwBWAAkAAV1BAwANAAwAAXFBAwD9AA0AAV1BAwD4AA4AAV1BAwAGABAAAXFBAwAFABQAAXG6ABcAAAARERI5QQMAJAAXAAFyQQMAfwAXAAFdQQMA+QAXAAFdQQUAMwAXAEMAFwACckEDAOMAFwABXUEDAOsAGQABXUEDACQAGgABXUEDAAQAGwABXbgAItBBAwAWACIAAXJBAwCGACIAAV1BAwDmACIAAV1BCQAmACIANgAiAEYAIgBWACIABHFBAwAHACIAAXJBAwDXACIAAV1BAwDXACIAAXFBCQBnACIAdwAiAIcAIgCXACIABHFBAwD3ACIAAV1BBwCXACIApwAiALcAIgADXUEDACcAIgABckEDAAYAIgABcUEDAMYAIgABXUEHAKYAIgC2ACIAxgAiAANxQQUA5gAiAPYAIgACcUEFADUAIgBFACIAAnIwMQFBAwDYAAwAAV1BBQC5AAwAyQAMAAJdQQMA6QAMAAFdQQMA2AAQAAFdQQUAuQAQAMkAEAACXUEDAOkAEAABXUEFALYAEgDGABIAAl1BAwDnABIAAV1BAwDlAB0AAV1BAwBvACwAAV0AQQkAuQANAMkADQDZAA0A6QANAARdQQMA1gAPAAFdQQUAtgATAMYAEwACXUEDAOcAEwABXSEjETQjIgcDIxEGIyImNTQ2MzIWHQEGBzY/ATYzMhUlNCYjIgYVFBYzMjYBdiQdEg1/Jg0RGycnGxsnAgMGDFEVMD7+/xQODhQUDg4UAUAtGv6tARMHJxsbJycbxC4UFCTYOFAODhQUDg4UFAABABT/+QEzAZEAJQ1QuAAmL7gAJy+4ABAvQQUAXwAnAG8AJwACcbgAJxC4AADcQQUADwAAAB8AAAACXUEFAJAAJgCgACYAAl1BAwDAACYAAV1BAwAgACYAAXG4ACYQuAAE0LgABC9BAwDPAAQAAV1BEQAAAAQAEAAEACAABAAwAAQAQAAEAFAABABgAAQAcAAEAAhdQQMAMAAEAAFxuQAHAAX0uAAAELkACwAF9EEDAFgADgABckEDAHcADgABckEHAA8ADwAfAA8ALwAPAANyQQMAPgAPAAFyQQMASgAPAAFyQQMAlQAQAAFxQQMAFgAQAAFyQQUA1wAQAOcAEAACcUEDAAcAEAABckEFAFgAEABoABAAAnFBAwA4ABAAAV1BAwCKABAAAXJBAwD+ABAAAV1BAwDtABAAAV1BAwAqABAAAXJBAwBIABAAAXJBAwBHABAAAV1BAwA3ABAAAXJBAwAHABAAAXFBAwB2ABAAAV1BAwC1ABAAAV1BAwAgABAAAXFBAwBnABEAAV1BAwDGABEAAV1BAwB5ABIAAV1BAwBKABIAAXJBAwBYABIAAV1BAwBlABIAAXJBAwAEABQAAXJBAwBEABQAAXK4ABbQuAAWL0EDAKYAFgABXbgAABC4ABjQuAAYL0EDAIcAGAABXUEDAGQAGAABckEDAKEAGAABXUEDAJYAGQABXUEDAKEAGQABXUEDADUAGgABckEDAKAAGgABXUEDAKAAGwABXUEDADsAHQABckEDAEoAHQABcUEDAPoAHQABcUEDABYAHwABcUEDAEQAHwABcUEDADIAIQABckEDANMAIQABXUEDAKUAIQABcUEDAFYAIQABXUEDAHYAIQABckEDAPYAIQABXUEHAHcAIQCHACEAlwAhAANdQQMAOAAhAAFdQQMASQAhAAFdQQMAGQAhAAFxQQMAiAAhAAFyQQMAVwAhAAFyQQUA1gAhAOYAIQACcUEDAIYAIQABcUEFALYAIQDGACEAAl1BAwD0ACEAAXFBAwBDACEAAXJBAwACACEAAXJBAwAiACEAAXFBAwACACIAAXJBAwAiACIAAXJBAwBQACIAAV1BAwAQACIAAXIAuAAFL7gABi+4AABFWLgAEy8buQATABA+WbgAAEVYuAAYLxu5ABgAED5ZuAAARVi4AAIvG7kAAgAKPlm7ABYAAQAbAAQruwAjAAIADgAEK7sAIQACABAABCtBAwDaAAAAAV1BBQCcAAAArAAAAAJdQQMAzQAAAAFdQQMAvgAAAAFxQQMArwAAAAFxQQMAzwAAAAFxQQMAHQAAAAFyQQMAjQAAAAFdQQcA2wAAAOsAAAD7AAAAA3FBAwC6AAAAAV1BAwAZAAAAAV1BBwDbAAQA6wAEAPsABAADcUEDAJwABAABXUEDAI0ABAABXUEHAK8ABAC/AAQAzwAEAANxQQkAHQAEAC0ABAA9AAQATQAEAARyQQMADAAEAAFyQQMAqwAEAAFdQQMAugAEAAFdQQMAUAAFAAFdQQMAsAAFAAFdQQcAcAAFAIAABQCQAAUAA11BAwCwAAYAAV1BAwCkAAYAAXJBAwD1AAYAAXFBAwB1AAYAAXJBBQA2AAYARgAGAAJyQQMAtgAGAAFyQQUAxwAGANcABgACcUEFABcABgAnAAYAAnJBAwBmAAYAAXJBAwB1AAYAAXFBAwBVAAYAAXJBAwAkAAYAAV1BAwADAAYAAXJBBwBwAAYAgAAGAJAABgADXUEHADAABgBAAAYAUAAGAANduAACELkACQAB9EEhAAcACQAXAAkAJwAJADcACQBHAAkAVwAJAGcACQB3AAkAhwAJAJcACQCnAAkAtwAJAMcACQDXAAkA5wAJAPcACQAQXUEhAAcACQAXAAkAJwAJADcACQBHAAkAVwAJAGcACQB3AAkAhwAJAJcACQCnAAkAtwAJAMcACQDXAAkA5wAJAPcACQAQcUEHAAcACQAXAAkAJwAJAANyQQUANgAJAEYACQACckEFAEAADABQAAwAAl1BAwAAAAwAAXFBAwDhAAwAAV1BAwAUAAwAAV1BAwDUAAwAAV1BAwBLAAwAAXJBAwCLAAwAAXJBAwDrAAwAAXJBAwCkAAwAAV1BAwBiAAwAAV1BAwCRAAwAAV1BAwCwAAwAAV1BAwAgAAwAAV1BAwBAAAwAAXFBAwByAA4AAV1BAwBjAA4AAXJBAwCUAA4AAV1BAwAIAA4AAV1BAwAZAA4AAV1BAwBpAA4AAXFBAwDpAA4AAXFBBQCJAA4AmQAOAAJyQQMA2gAOAAFyQQMAqwAOAAFyQQMAKwAOAAFxQQMA7QAOAAFyQQMAXwAOAAFyQQMAfgAOAAFyQQMAfAAOAAFxQQMAWwAOAAFxQQMAywAOAAFdQQMAqgAOAAFxQQMASQAOAAFyQQMAyQAOAAFxQQMAOQAOAAFxQQMAyQAOAAFyQQMARgAOAAFdQQMAZAAOAAFdQQMAogAOAAFdQQMAIgAOAAFdQQMAUAAOAAFdQQMACAAPAAFdQQUA2QAPAOkADwACcUEDAPoADwABcUEDAEgADwABckEDAGQADwABXUEDAHAADwABXUEDAIUAEAABXUEDAGYAEAABXUEDAHcAEAABXUEDAJoAEAABckEDAAwAEAABXUEDAGwAEAABckEDAIsAEAABckEDAMkAEAABckEDABcAEAABXUEDAKUAEAABXUEFAEQAEABUABAAAl1BAwDjABAAAV1BAwCJABEAAXJBAwD5ABEAAXFBAwAaABEAAXFBAwB6ABEAAXJBAwA6ABEAAV1BAwCpABEAAXFBAwBIABEAAV1BAwBQABEAAV1BAwBQABQAAV1BAwAAABYAAXFBAwCQABYAAXFBAwDgABYAAXFBBQBQABYAYAAWAAJyQQMAswAWAAFdQQMA4wAWAAFdQQMAYgAWAAFxQQMAEAAWAAFyQQMAsAAWAAFxQQMAMAAWAAFxQQMAgAAWAAFyQQMAUAAWAAFdQQMAUwAZAAFdQQMAVQAaAAFdQQMAMAAbAAFxQQMAsAAbAAFxQQMAEAAbAAFyQQMAUgAbAAFdQQMA4wAbAAFdQQMAYwAbAAFxQQMAswAbAAFdQQUAUAAbAGAAGwACckEDAIAAGwABckEDAJAAGwABcUEDAAAAGwABcUEDAOAAGwABcbgAExC5AB4AAfRBBQA5AB4ASQAeAAJyQSEACAAeABgAHgAoAB4AOAAeAEgAHgBYAB4AaAAeAHgAHgCIAB4AmAAeAKgAHgC4AB4AyAAeANgAHgDoAB4A+AAeABBdQSEACAAeABgAHgAoAB4AOAAeAEgAHgBYAB4AaAAeAHgAHgCIAB4AmAAeAKgAHgC4AB4AyAAeANgAHgDoAB4A+AAeABBxQQcACAAeABgAHgAoAB4AA3JBAwAhACEAAV1BAwBjACEAAV1BAwA0ACEAAV1BBQCEACEAlAAhAAJdQQMAdQAhAAFdQQMAdQAhAAFyQQMA9gAhAAFdQQMAtQAhAAFxQQMA1QAhAAFyQQMAtAAhAAFdQQMApAAhAAFyQQMA5AAhAAFdQQMAogAhAAFdQQUAQAAhAFAAIQACXUEDABAAIQABXUEDAKQAIgABXUEDAMYAIgABcUEDANcAIgABcUEDADYAIgABXUEDALMAIgABXUEDAFAAIgABXUEDACAAIwABXUEFAJAAIwCgACMAAl1BAwAyACMAAV1BBQCDACMAkwAjAAJxQQMAgwAjAAFyQQMAtAAjAAFyQQMA9AAjAAFdQQMAxQAjAAFyQQMAFQAjAAFxQQMA9QAjAAFxQQMAZgAjAAFxQQMA5gAjAAFxQQMAFgAjAAFdQQMAlQAjAAFyQQUAxQAjANUAIwACcUEFANUAIwDlACMAAl1BBQAlACMANQAjAAJyQQMABAAjAAFdQQMAtAAjAAFxQQMAQwAjAAFxQQMA8gAjAAFyQQMAsgAjAAFdQQkAQAAjAFAAIwBgACMAcAAjAARdQQMAYAAjAAFyQQMAAAAjAAFxQQUAEAAlACAAJQACXUEDAJAAJQABXUEFANAAJQDgACUAAl1BAwBAACUAAXFBAwCBACUAAXFBAwDSACUAAXFBAwBjACUAAV1BAwCDACUAAV1BAwDlACUAAXFBAwAFACUAAV1BAwCWACUAAXFBAwDGACUAAV1BAwDFACUAAXFBAwCjACUAAV1BAwDzACUAAXFBAwDzACUAAV1BAwCiACUAAXFBAwBwACUAAXFBBQAAACUAEAAlAAJxQQMAsAAlAAFdQQUAQAAlAFAAJQACXUEDALAAJQABcUEDABAAJQABcjAxAUEDADYAEAABXUEDACoAEAABXUEDADUAEQABXUEDACoAEQABXUEDAK0AIAABXUEDAK4AIQABXUEDANAAJgABXUEFAA8AJwAfACcAAl1BBQC/ACcAzwAnAAJdAEEDAPAABQABXUEFAKAABQCwAAUAAnFBAwDwAAYAAV1BBQCgAAYAsAAGAAJxQQMACQAOAAFdQQMARQAPAAFdQQMAQwAQAAFdQQMAQgAhAAFdQQMAJQAjAAFdQQMA4wAlAAFdJRQjIj0BMxUUMzI9ATQnJic+ATMyFjMyNxcGIyImIyIGBxYXFhUBFW5uJEpKYTtBAzszF0oSGAQfDyoWTRQVKQNsGU5MU1OcnjExlBgYDwktPRYXBzEXHBMWCBooAAADABH/+AGAAZAAIwAvADsLbrsAKgAGABAABCu7ABcABQAKAAQruwAgAAUAHQAEK0EDAI8AHQABXUEDAI8AIAABXboAMAAdACAREjm4ADAvQQMAwAAwAAFdQQMAcgAwAAFdQQMAcwAwAAFxQQMApQAwAAFxQQMAdgAwAAFyQQMAWAAwAAFxQQUAVQAwAGUAMAACXUEFADQAMABEADAAAl1BAwCzADAAAXFBAwDwADAAAV1BBwCAADAAkAAwAKAAMAADXUEDANAAMAABcbkAAAAG9EEDAAIAAAABXUEDAGQAAAABXUEDAFUAAAABcUEDAIYAAAABXUEDAHcAAAABXUEDAEgAAAABcUEDAPcAAAABXUEDANcAAAABcUEDADYAAAABXUEDAEQAAAABXUEFAKMAAACzAAAAAnFBAwBSAAAAAV1BBQAQAAAAIAAAAAJdQQMA9QACAAFdQQMAdwACAAFdQQMAfQACAAFyQQMAnQACAAFyQQMA3AACAAFyQQMABgACAAFxQQMAdQACAAFxQQMAsgACAAFdQQMA2wADAAFyQQMACgADAAFxQQMAmAAEAAFyQQMA2gAEAAFxQQMADQAEAAFxQQMATwAEAAFxQQMAvAAEAAFdQQMAWgAEAAFxQQMAdgAEAAFdQQMA1AAEAAFyQQMATAAFAAFxQQMAZwAGAAFyQQMA9gAGAAFxuAAKELgANtxBAwDNADYAAXFBAwDeADYAAXJBAwCOADYAAV1BBwBvADYAfwA2AI8ANgADckEDAN8ANgABXUEFAA8ANgAfADYAAnFBAwA/ADYAAV1BBQCfADYArwA2AAJdQQUATwA2AF8ANgACcUEDAL4ANgABXUEDAF0ANgABckEDAEoANgABXUEFAOAANgDwADYAAnG6AAcACgA2ERI5QQMA9QAHAAFxQQMAhwAHAAFdQQMAWgAHAAFxQQMAywAHAAFxQQMAdwAHAAFyQQMAdQAHAAFdQQMApQAHAAFdQQMAlAAHAAFyQQMAQgAJAAFyQQMApAAJAAFxQQMAFQAJAAFyQQMAxgAJAAFxQQUAhgAJAJYACQACcUEDADkACQABXUEDAPkACQABXUEDAPYACQABcUEDAHUACQABcUEFAEUACQBVAAkAAnFBAwAjAAkAAXJBAwDRAAkAAXFBAwAxAAkAAXJBAwCoAA0AAXFBAwDIAA0AAXFBAwANAA4AAXFBAwCqAA4AAXFBAwAMAA8AAXFBAwC6AA8AAV1BBQDvABAA/wAQAAJdQQUAfwAQAI8AEAACXUEDAK8AEAABXUEDAA4AEAABcUEDAJ0AEAABXUEDAAsAEQABcUEDAA4AEgABcUEDALsAEgABXUEDALUAFAABXUEDAAMAFAABcUEDAO0AGQABcUEDAB4AGQABckEDANwAGQABcUEDACsAGQABckEDAIsAGgABcUEDAOcAGgABcUEDAIsAGwABcUEDACwAGwABckEDAD4AGwABckEDAE8AGwABckEDAB0AGwABckEDAAwAGwABckEDAJkAGwABcUEDAFkAGwABcUEDAIoAHgABXUEDAI4AHwABXboAIgAdACAREjlBAwCTACIAAXFBAwCkACIAAXFBAwDEACIAAXFBBQDlACIA9QAiAAJxQQUABQAiABUAIgACckEDAPUAIgABXUEDAFcAIgABcUEDAEUAIgABXUEDAMUAIgABXUEFADUAIgBFACIAAnJBAwAkACIAAXJBBQB0ACIAhAAiAAJxQQMAswAiAAFxQQMA0QAiAAFxuAAKELgAJNC4ACQvQQkAfwAqAI8AKgCfACoArwAqAARdQQUA7wAqAP8AKgACXUEDAA4AKgABcUEDAOcANAABcUEDABAAPAABcUEDAD8APQABXUEDAC8APQABcUEDAH8APQABcUEDAL8APQABXUEFAA8APQAfAD0AAl1BAwBPAD0AAXFBAwDAAD0AAXEAuAAARVi4ABMvG7kAEwAQPlm4AABFWLgAHy8buQAfABA+WbgAAEVYuAAJLxu5AAkACj5ZuAAARVi4AAMvG7kAAwAKPlm7AC0AAQANAAQrQQMAWAAAAAFdQQMATAABAAFxQQMAegABAAFxQQMACQABAAFxQQMACwAFAAFxQQUAZQAFAHUABQACckEDAJQABQABckEDAKcABgABXUEDADkABgABXUEDAGcABgABckEDAPcABgABcboABwADABMREjlBAwA5AAcAAXFBAwDJAAcAAXFBAwC3AAcAAXFBAwDWAAcAAXFBAwBIAA0AAXFBBQDOAA0A3gANAAJxQQUADwANAB8ADQACXUEDAK8ADQABXUEDAP8ADQABXUEDAE8ADQABckEDAM8ADQABXUEDAI8ADQABXUEDAN8ADQABckEDAK0ADQABcUEDABcADQABcUEDAOEADQABcUEDAN0ALQABckEDAK8ALQABcUEDAP8ALQABXUEDAK8ALQABXUEDAM8ALQABXUEDAI8ALQABXUEDAE8ALQABckEFAM4ALQDeAC0AAnFBAwBaAC0AAV1BAwDgAC0AAXG6AAsADQAtERI5QQMAtQAWAAFdugAXAAMAExESOUEDAMIAFwABcUEHAJMAFwCjABcAswAXAANxQQUANAAXAEQAFwACcUEDACQAFwABckEDAAUAFwABcUEFAOYAFwD2ABcAAl1BAwB8ABcAAV1BAwAPABcAAV1BAwBOABcAAV1BBQAWABcAJgAXAAJxQQUAVQAXAGUAFwACcUEDAIUAFwABcUEFAOQAFwD0ABcAAnFBAwAEABcAAXJBAwATABcAAXJBAwBCABcAAXJBAwDRABcAAXFBAwAwABcAAXJBAwAPABkAAV1BAwA4ABkAAXFBAwAKABoAAV1BAwAYABoAAXJBAwBFABoAAXJBAwBIABsAAXJBAwCKABsAAXJBAwDoABsAAXFBAwDXABsAAXFBAwD2ABsAAV1BAwAKAB0AAV1BAwC1AB0AAV1BAwDgAB0AAXFBAwDfACAAAXFBAwCqACAAAV1BAwDWACEAAXG6ACIAAwATERI5QQMAeAAiAAFdQQMAugAiAAFdQQMA+gAiAAFxQQMAHAAiAAFxQQMA7gAiAAFxQQMAWwAiAAFxQQUAKgAiADoAIgACcUEDAEkAIgABcUEDAMcAIgABXUEDAPUAIgABXUEDAHUAIwABcUEDAEUAIwABckEDAAYAIwABcUEDAEYAIwABcUEDANUAIwABcUEDAMQAIwABcUEFAKIAIwCyACMAAnG4ABMQuQAnAAH0QQMA1AAzAAFxQQcAVQAzAGUAMwB1ADMAA3JBAwB2ADMAAV1BAwAGADMAAV1BBQA2ADMARgAzAAJdQQMA1wAzAAFyQQMAGAAzAAFyQQMACQAzAAFyQQUA6gAzAPoAMwACcUEDABwAMwABcUEDACsAMwABcUEDALkAMwABXUEDAEkAMwABcUEFALgAMwDIADMAAnJBBwDHADMA1wAzAOcAMwADXUEDAPYAMwABXUEDAAYAMwABcUEDAIYAMwABckEDAKUAMwABckEDAJQAMwABckEFAIMAMwCTADMAAl1BAwCiADMAAV24AAMQuQA5AAH0QQMAtwA5AAFdQQMAeQA5AAFdQQUAhwA5AJcAOQACXUEDAAQAOQABXTAxAUEFAMYAAgDWAAIAAl1BAwDnAAIAAV1BAwDZAAQAAV1BCQDJAA4A2QAOAOkADgD5AA4ABF1BBwDJABIA2QASAOkAEgADXUEDAPoAEgABXUEJAMYAFADWABQA5gAUAPYAFAAEXUEDAE8APQABXUEDAG8APQABXUEDAI8APQABXQBBAwDYAAEAAV1BAwDJAAEAAV1BAwDpAAEAAV1BAwDoAA8AAV1BBQDJAA8A2QAPAAJdQQMA+QAPAAFdQQcAxwAVANcAFQDnABUAA11BAwDkABcAAXElFAYjIiY9AQYHIxEGIyImNTQ2MzIWFRE2NzY3Nj0BMxUUBxYlNCYjIgYVFBYzMjYTNCYjIgYVFBYzMjYBgCcbGyY+IiwNERsnJxsbJxQzOREiJBYq/vUUDg4UFA4OFOsUDg4UFA4OFDkbJiYbBxknARMHJxsbJycb/tkWFxoOGyrHzDAWEekOFBQODhQU/voOFBQODhQUAAACABH/+AF0AZAAFwAjBCC7AB4ABgAKAAQruwARAAUABAAEK7sAAAAFABUABCtBAwBSAAEAAXFBBQCEAAEAlAABAAJxQQMApgABAAFxQQMApwABAAFdQQMAdQABAAFxQQMAswABAAFxQQUAMAABAEAAAQACcUEDAGAAAQABcUEDAIsAAwABcUEDAFwAAwABcUEDAO4AAwABcUEDAE8AAwABcUEDAG8AAwABcUEDAD4AAwABcUEDAH4AAwABcUEDAJwAAwABcUEFAKoAAwC6AAMAAnFBAwCJAAMAAV1BAwCqAAgAAXFBAwALAAgAAXFBBQDJAAgA2QAIAAJxQQMAuAAIAAFdQQMADgAJAAFxQQMAjgAKAAFdQQUAnwAKAK8ACgACXUEFAO8ACgD/AAoAAl1BAwAOAAoAAXFBAwB9AAoAAV1BAwAOAAsAAXFBAwANAAwAAXFBAwC4AAwAAV1BAwAIAA4AAXFBAwC2AA4AAV1BAwDpABIAAXFBAwA6ABIAAXFBAwAmABIAAXFBAwBAABIAAXJBAwApABQAAXFBAwBJABQAAXJBAwAzABQAAXG4AAQQuAAY0LgAGC9BCQB/AB4AjwAeAJ8AHgCvAB4ABF1BBQDvAB4A/wAeAAJdQQMADwAeAAFxQQMAEAAkAAFxQQMAAAAlAAFyQQUADwAlAB8AJQACXUEDAI8AJQABXUEDAD8AJQABXUEDAE8AJQABcUEDAOAAJQABcUEDAAAAJQABcQC4AABFWLgADS8buQANABA+WbgAAEVYuAAXLxu5ABcAED5ZuAAARVi4AAIvG7kAAgAKPlm7ACEAAQAHAAQrQQMAngAAAAFdQQMAPwAAAAFxQQMAbwAAAAFxQQMAjQAAAAFdQQMAjAAAAAFxQQMAbwAEAAFxQQMAjAAEAAFxQQMAPAAEAAFxQQMACwAHAAFdQQMATQAHAAFyQQMAHwAHAAFdQQMArwAHAAFdQQMA/wAHAAFdQQMAzwAHAAFdQQMAjwAHAAFdQQMArQAHAAFxQQUAzQAHAN0ABwACcUEDAEgABwABcUEDAOAABwABcUEDAK4AIQABcUEDAM8AIQABXUEDAK8AIQABXUEDAP8AIQABXUEDAE4AIQABckEFAM0AIQDdACEAAnFBAwDgACEAAXG6AAUABwAhERI5QQMAJQAFAAFdQQMAtgAPAAFdQQMAFwARAAFxuAACELkAEwAB9EEDABcAFQABcbgADRC5ABsAAfRBAwCAABsAAV0wMQFBCQDJAAgA2QAIAOkACAD5AAgABF1BCQDJAAwA2QAMAOkADAD5AAwABF1BCQDGAA4A1gAOAOYADgD2AA4ABF1BAwBvACUAAV0AQQkAyQAJANkACQDpAAkA+QAJAARdQQMA5gALAAFdQQcA1gAPAOYADwD2AA8AA11BAwDHAA8AAV0lFCMiPQEGIyImNTQ2MzIWHQEUMzI1ETMHNCYjIgYVFBYzMjYBdIGCDREbJycbGydeXST/FA4OFBQODhRVXV2+BycbGycnG/Y/PwEwOg4UFA4OFBQAAgAR//gBdAIvABcAIwQWuwAeAAYACgAEK7sAEQAFAAQABCu7AAAABQAVAAQrQQMAgQABAAFxQQMAtAABAAFxQQUAlQABAKUAAQACcUEDAFUAAQABcUEDAEQAAQABcUEDAHQAAQABcUEDADAAAQABcUEDAGAAAQABcUEFAKoAAwC6AAMAAnFBAwBLAAMAAXFBAwA+AAMAAXFBBQBvAAMAfwADAAJxQQMAjgADAAFxQQMAmwADAAFxQQMAWgADAAFxQQMAigADAAFdQQMA/gAIAAFdQQMACwAIAAFxQQMAugAIAAFdQQMADQAJAAFxQQMAjwAKAAFdQQUA7wAKAP8ACgACXUEDAA8ACgABcUEDAK8ACgABXUEDAH4ACgABXUEDAJ0ACgABXUEDAA8ACwABcUEDAAwADAABcUEDALkADAABXUEDALQADgABXUEDAAQADgABcUEDACYAEgABcUEDADMAEgABckEDAEAAEgABckEDAEkAFAABckEDABwAFAABcUEDADsAFAABckEDACgAFAABcUEDADYAFAABcbgABBC4ABjQuAAYL0EFAO8AHgD/AB4AAl1BAwAPAB4AAXFBCQB/AB4AjwAeAJ8AHgCvAB4ABF1BAwAQACQAAXFBAwDgACUAAXFBAwA/ACUAAV1BAwBPACUAAXFBBQAPACUAHwAlAAJdQQMAAAAlAAFxQQMAAAAlAAFyALgAFi+4AABFWLgADS8buQANABA+WbgAAEVYuAACLxu5AAIACj5ZuwAhAAEABwAEK0EDAEwAAAABcUEDAD4AAAABcUEDAF8AAAABcUEDAG4AAAABcUEDAJwAAAABXUEDAIsAAAABXUEDADsAAQABcUEDAG0ABAABcUEDAD4ABAABcUEDAEwABAABcUEDAOoABAABcUEDAE0ABwABckEDAK4ABwABcUEDAI8ABwABXUEDAM8ABwABXUEDAN8ABwABcUEDAP8ABwABXUEDAK8ABwABXUEDAB8ABwABXUEDAM4ABwABcUEDAAwABwABXUEDAOAABwABcUEDAK4AIQABcUEDAE4AIQABckEDAM8AIQABXUEDAI8AIQABXUEDAP8AIQABXUEDAK8AIQABXUEFAM4AIQDeACEAAnFBAwBaACEAAV1BAwDgACEAAXG6AAUABwAhERI5QQMAhwAFAAFdQQMAtQAQAAFdQQMAFgASAAFxuAACELkAEwAB9EEDADsAFAABcbgADRC5ABsAAfQwMQFBBwDJAAgA2QAIAOkACAADXUEJAMkADADZAAwA6QAMAPkADAAEXUEHAMYADgDWAA4A5gAOAANdQQMA9wAOAAFdQQMAbwAlAAFdQQMAjwAlAAFdAEEHAMkACQDZAAkA6QAJAANdQQcAxgAPANYADwDmAA8AA11BAwD3AA8AAV0lFCMiPQEGIyImNTQ2MzIWHQEUMzI1ETMHNCYjIgYVFBYzMjYBdIGCDREbJycbGydeXST/FA4OFBQODhRVXV2+BycbGycnG/Y/PwHX4Q4UFA4OFBQAAAACACgAAAFFAZAAFgAiBu27ABEABQAEAAQruwALAAYAFwAEK7sAAAAFABQABCtBAwBpAAEAAXFBAwBJAAEAAXFBAwCqAAEAAXFBAwBLAAEAAXJBBQAMAAEAHAABAAJyQQMAvgABAAFxQQUALwABAD8AAQACckEDAP0AAQABcUEHAHsAAQCLAAEAmwABAANxQQUAywABANsAAQACcUEDAFoAAQABcUEDAOkAAQABcUEDAKUAAQABXUEDAAQAAQABXboAAgAEAAAREjlBAwCSAAMAAXFBAwBDAAMAAXFBAwDzAAMAAXFBAwAEAAMAAXJBAwC1AAMAAXFBAwDHAAMAAXFBAwAYAAMAAXFBAwCrAAMAAV1BAwAJAAMAAV1BAwCnAAMAAXFBBQDWAAMA5gADAAJxQQMAVQADAAFxQQUAZAADAHQAAwACcUEDAIMAAwABcUEFABIAAwAiAAMAAnJBAwBCAAMAAXJBAwAwAAMAAXJBAwD6AAcAAV1BAwD1AAkAAV1BBwBwAAsAgAALAJAACwADcUEFAHAACwCAAAsAAnJBAwAHAAsAAXFBAwCnAAsAAXFBCQAGAAsAFgALACYACwA2AAsABF1BAwBAAAsAAXJBCwBAAAsAUAALAGAACwBwAAsAgAALAAVdQQUA4AALAPAACwACckEDAPUADQABXUEDAKcAEgABcUEDABkAEgABckEDAOoAEgABXUEDACoAEgABckEDAEgAEgABckEFABcAEgAnABIAAl1BAwBWABIAAXFBAwCHABMAAXFBAwAoABMAAV1BAwBZABMAAXFBAwCqABMAAXFBAwDrABMAAV1BAwAaABMAAV1BAwDYABMAAV1BAwAXABMAAXJBAwBFABMAAXJBAwAlABMAAXJBBQBwABcAgAAXAAJdQQMAQAAXAAFyQQMAQQAXAAFdQQUAcAAXAIAAFwACckEHAHAAFwCAABcAkAAXAANxQQUA4AAXAPAAFwACckEDAFAAFwABXbgAERC4AB3QuAAdL0EDABAAIwABcUEDAIAAIwABXUEFAAAAJAAQACQAAnFBBwAPACQAHwAkAC8AJAADXUEDAC8AJAABcUEDAOAAJAABcUEDAAAAJAABcgC4AABFWLgAFS8buQAVABA+WbgAAEVYuAAILxu5AAgAED5ZuAAARVi4AAAvG7kAAAAKPlm4AABFWLgAAy8buQADAAo+WbsAIAABAA4ABCu6AAIAAAAIERI5QQMAkwACAAFdQQMARAACAAFdQQMAaQACAAFxQQMA2QACAAFxQQMAmwACAAFxQQMA7AACAAFxQQMArQACAAFxQQMAzQACAAFxQQMA/gACAAFxQQMATwACAAFyQQUALgACAD4AAgACckEDAL4AAgABcUEDAA0AAgABckEDABwAAgABckEDAIwAAgABcUEDAFoAAgABcUEDAEkAAgABcUEDAAUAAgABXUEDANMAAgABXUEDAKEAAgABXUEDAMAAAgABXUEDAAUABwABcUEDAAYACQABcUEDAPsACwABXUEDAPwADAABXUEDAAsADQABcUEDAN8ADgABckEDAI8ADgABXUEDAM8ADgABXUEDAK8ADgABcUEDAE8ADgABckEFAM8ADgDfAA4AAnFBAwD/AA4AAV1BAwCvAA4AAV1BAwAPAA4AAV1BAwAdAA4AAV1BAwDgAA4AAXFBAwCvACAAAXFBAwCPACAAAV1BAwDPACAAAV1BAwBPACAAAXJBAwD/ACAAAV1BAwCvACAAAV1BAwDfACAAAXJBBQDPACAA3wAgAAJxQQMA4AAgAAFxugAQAA4AIBESOboAEQAAAAgREjlBAwApABEAAV1BAwBNABEAAXFBAwCmABEAAV1BAwAlABEAAXJBAwCSABIAAXFBAwA0ABIAAXJBAwBGABIAAXFBAwBGABIAAV1BAwDkABIAAXFBAwC0ABIAAV1BAwDRABIAAV1BAwDQABIAAXFBAwDAABMAAV1BAwDQABMAAXG6ABQAAAAIERI5QQMAKQAUAAFdQQMAygAUAAFdQQMATAAUAAFxQQMAWwAUAAFdQQMA2QAUAAFxQQMAuQAUAAFxQQMARQAUAAFyuAAIELkAGgAB9EEDAJgAGgABcUEHAAgAGgAYABoAKAAaAANdQQMAJwAaAAFyMDEBQQkAuQAHAMkABwDZAAcA6QAHAARdQQkAtgAJAMYACQDWAAkA5gAJAARdQQMA1QANAAFdQQUAtgANAMYADQACXUEDAOYADQABXUEDAF8AJAABXUEDAI8AJAABXUEDAF8AJAABcQBBBwDGAAYA1gAGAOYABgADXUEDALcABgABXUEJALYACgDGAAoA1gAKAOYACgAEXUEFALkADADJAAwAAl1BAwDpAAwAAV0hIycHIxE0NjMyFhUUBiMiJxU3MxcRMwc0JiMiBhUUFjMyNgFFKGdmKCYcGycmHA4QXBteJLgUDg4UFA4OFJ6eAU4bJycbGigH3Y6OAVI6DhQUDg4UFAAAAgAoAAABRQIvABYAIgZouwARAAUABAAEK7sACwAGABcABCu7AAAABQAUAAQrQQMASAABAAFxQQMAWgABAAFxQQMA6gABAAFxQQUACwABABsAAQACckEDANwAAQABcUEDAE0AAQABckEDAD4AAQABckEDAC8AAQABckEDAL4AAQABcUEDAP4AAQABcUEDAI0AAQABcUEDAJsAAQABcUEDAMsAAQABcUEDAKoAAQABcUEDAGkAAQABcUEDAHgAAQABcUEDAEMAAQABXboAAgAEAAAREjlBAwBCAAMAAXFBAwCCAAMAAXFBAwB0AAMAAXFBAwBlAAMAAXFBAwDVAAMAAXFBBQCmAAMAtgADAAJxQQMAyAADAAFxQQMAGAADAAFxQQMASAADAAFdQQMA5gADAAFxQQMAVgADAAFxQQMA9QADAAFxQQMABQADAAFyQQMAFAADAAFyQQMAkwADAAFxQQMAIgADAAFyQQMAMQADAAFyQQMAQAADAAFyQQMA+gAHAAFdQQMA9QAJAAFdQQMAQAALAAFyQQUA4AALAPAACwACckEJAAYACwAWAAsAJgALADYACwAEXUEDAAYACwABckEFAEYACwBWAAsAAnFBAwCmAAsAAV1BAwAGAAsAAXFBBQBwAAsAgAALAAJyQQcAcAALAIAACwCQAAsAA3FBCwBAAAsAUAALAGAACwBwAAsAgAALAAVdQQMA9QANAAFdQQMAyAASAAFxQQMAqAASAAFxQQMARQASAAFxQQMAzAATAAFxQQMAqgATAAFxQQMA6gATAAFdQQcAcAAXAIAAFwCQABcAA3FBBQBwABcAgAAXAAJyQQMAQAAXAAFyQQUA4AAXAPAAFwACckELAEAAFwBQABcAYAAXAHAAFwCAABcABV24ABEQuAAd0LgAHS9BAwAQACMAAXFBAwCAACMAAV1BBQAAACQAEAAkAAJxQQcADwAkAB8AJAAvACQAA11BAwAvACQAAXFBAwDgACQAAXFBAwAAACQAAXIAuAAVL7gAAEVYuAAILxu5AAgAED5ZuAAARVi4AAAvG7kAAAAKPlm4AABFWLgAAy8buQADAAo+WbsAIAABAA4ABCu6AAIAAAAVERI5QQMAkwACAAFdQQMA1AACAAFdQQUAWgACAGoAAgACcUEDAMoAAgABcUEDAIsAAgABcUEDAOwAAgABcUEDAA0AAgABckEDAP4AAgABcUEDAL8AAgABcUEFAC0AAgA9AAIAAnJBAwBMAAIAAXJBAwAcAAIAAXJBAwCrAAIAAXFBAwCaAAIAAXFBAwApAAIAAXFBAwB0AAIAAV1BAwChAAIAAV1BAwDAAAIAAV1BAwAGAAcAAXFBAwD6AAsAAV1BAwD7AAwAAV1BAwAdAA4AAV1BAwAPAA4AAV1BAwCvAA4AAV1BAwD/AA4AAV1BAwDfAA4AAXJBAwBPAA4AAXJBAwCvAA4AAXFBAwDPAA4AAV1BAwCPAA4AAV1BBQDPAA4A3wAOAAJxQQMAiAAOAAFyQQMA4AAOAAFxQQMA3wAgAAFyQQMAjwAgAAFdQQMAzwAgAAFdQQMATwAgAAFyQQMA/wAgAAFdQQMArwAgAAFdQQUAzwAgAN8AIAACcUEDAK8AIAABcUEDAOAAIAABcboAEAAOACAREjm6ABEAAAAVERI5QQMAJQARAAFyQQMASwARAAFxQQMA5QARAAFxQQMAxAARAAFxQQMAQwASAAFyQQMAkwASAAFxQQcAFQASACUAEgA1ABIAA3JBAwBGABIAAV1BAwAZABIAAV1BAwAoABIAAV1BAwA2ABIAAXFBAwCFABIAAXFBBQCzABIAwwASAAJdQQMA0AASAAFdQQMA0AASAAFxQQMARQATAAFxugAUAAAAFRESOUEDAOUAFAABcUEDAE0AFAABcUEDACUAFAABckEDAMQAFAABcbgACBC5ABoAAfRBAwAYABoAAXFBAwCIABoAAV1BBwAIABoAGAAaACgAGgADXUEDAKgAGgABXTAxAUEJALkABwDJAAcA2QAHAOkABwAEXUEJALYACQDGAAkA1gAJAOYACQAEXUEJALYADQDGAA0A1gANAOYADQAEXUEDAF8AJAABXUEDAF8AJAABcQBBCQC2AAYAxgAGANYABgDmAAYABF1BCQC2AAoAxgAKANYACgDmAAoABF1BCQC5AAwAyQAMANkADADpAAwABF0hIycHIxE0NjMyFhUUBiMiJxU3MxcRMwc0JiMiBhUUFjMyNgFFKGdmKCYcGycmHA4QXBteJLgUDg4UFA4OFJ6eAU4bJycbGigH3Y6OAfnhDhQUDg4UFAAAAAIAEQAAAYcBkAAeACoKHLsAJQAGAAoABCu7ABEABQAEAAQruwAAAAUAHAAEK0EDAM8AAAABXUEDAP8AAAABXUEDABgAAQABcUEDAJkAAQABcUEFAOkAAQD5AAEAAnFBAwAaAAEAAXJBAwDbAAEAAV1BAwBrAAEAAXFBAwDbAAEAAXFBAwCsAAEAAV1BAwD+AAEAAV1BAwAOAAEAAXJBAwDPAAEAAV1BAwAuAAEAAXJBAwCuAAEAAXFBAwA9AAEAAXJBAwBLAAEAAXJBAwCLAAEAAXFBAwALAAEAAXFBAwBaAAEAAXFBAwBJAAEAAXFBBQC5AAEAyQABAAJxQQMAeQABAAFxQQMAVwABAAFdQQUAhwABAJcAAQACXUEHAI8ACgCfAAoArwAKAANdQQMA/wAKAAFdQQMADwAKAAFxQQMA4AAKAAFxugACAAoAABESOUEDAHUAAgABXUEDAMYAAgABcUEFAMcAAgDXAAIAAl1BAwDXAAIAAXFBAwCIAAIAAV1BAwBIAAIAAXFBAwD5AAIAAV1BAwCYAAIAAXFBAwD4AAIAAXFBBQAIAAIAGAACAAJxQQUApwACALcAAgACcUEFAFcAAgBnAAIAAl1BAwAmAAIAAV1BAwCkAAIAAV1BAwBDAAIAAXJBAwDRAAMAAXFBAwBzAAMAAV1BAwBEAAMAAXFBAwDEAAMAAXFBAwAEAAMAAXJBAwBVAAMAAV1BAwBVAAMAAXFBAwAWAAMAAXJBAwD2AAMAAXFBAwCnAAMAAV1BAwCIAAMAAV1BAwBoAAMAAXFBAwApAAMAAV1BAwAoAAMAAXFBAwD3AAMAAV1BAwAHAAMAAXFBAwA3AAMAAXFBBQB2AAMAhgADAAJxQQMAlQADAAFxQQMAxQADAAFdQQMAtQADAAFxQQMAJAADAAFyQQMApAADAAFxQQMA1AADAAFdQQMAMgADAAFyQQMA4AADAAFxQQMAQAADAAFyQQMA4AAEAAFxQQMAcAAEAAFdQQMA4AAEAAFdQQMA/AAIAAFdQQMA+wAMAAFdQQMA4QAQAAFxQQMA4AARAAFdQQMA4AARAAFxQQMAcAARAAFduAARELgAE9C4ABMvQQMA9wATAAFdQQMA+QAVAAFdQQMAWAAVAAFdQQMAKAAVAAFxQQMAdgAWAAFxQQMA9wAWAAFxQQMAJwAWAAFdQQMAGAAWAAFyQQUAuAAWAMgAFgACXUEDAOkAFgABcUEDAIkAFgABXUEDAGkAFgABcUEDAJoAFgABcUEDAAoAFgABckEDAP0AFgABXUEDAAoAFgABcUEDAIkAFgABcUEDAOkAFgABXUEFACkAFgA5ABYAAnJBAwDYABYAAXFBAwCYABYAAV1BAwAYABYAAXFBBQAnABYANwAWAAJxQQMARgAWAAFxQQMAxQAWAAFxQQMAQwAWAAFyQQMAtQAXAAFdQQMAFgAXAAFxQQMANgAXAAFyQQMApwAXAAFdQQMAxwAXAAFdQQMABwAXAAFxQQMAeAAXAAFxQQUAOAAXAEgAFwACcUEDAIkAFwABXUEDACoAFwABcUEDAPoAFwABXUEDACoAFwABXUEDAGoAFwABcUEDAKkAFwABcUEDAPgAFwABcUEFAIcAFwCXABcAAnFBAwDnABcAAV1BAwAnABcAAXJBAwDHABcAAXFBAwDWABcAAXFBBQAGABcAFgAXAAJyQQMA5AAXAAFxQQMAQAAXAAFyQQMAzwAcAAFdQQMA/wAcAAFduAAcELgAGtC4ABovuAAEELgAH9C4AB8vQQUABgAlABYAJQACXUEDAP8AJQABXUEDAA8AJQABcUEHAI8AJQCfACUArwAlAANdQQUARgAlAFYAJQACXUEDAOAAJQABcUEDAOAAKwABcUEDABAAKwABcUEJAA8ALAAfACwALwAsAD8ALAAEXUEDAM8ALAABXUEDAC8ALAABcQC4AABFWLgAFi8buQAWABA+WbgAAEVYuAAdLxu5AB0AED5ZuAAARVi4AA0vG7kADQAQPlm4AABFWLgAAC8buQAAAAo+WbgAAEVYuAADLxu5AAMACj5ZuwAoAAEABwAEK7oAAgAAAA0REjlBAwBQAAIAAV1BAwBjAAIAAV1BAwDjAAIAAV1BAwAlAAIAAV1BAwAJAAIAAXJBAwDZAAIAAXFBAwBKAAIAAXJBBQC6AAIAygACAAJxQQMA/AACAAFxQQUALwACAD8AAgACckEDAB4AAgABckEDAKsAAgABcUEDAJoAAgABcUEDAEoAAgABcUEFAHkAAgCJAAIAAnFBBQDFAAIA1QACAAJdQQMAtAACAAFdQQMAowACAAFdQQcAcAACAIAAAgCQAAIAA11BAwAwAAIAAV1BAwDwAAIAAV1BBQAAAAIAEAACAAJxQQMAHgAHAAFdQQMArwAHAAFdQQMA/wAHAAFdQQUAzwAHAN8ABwACcUEDAN8ABwABckEDAE8ABwABckEDAK8ABwABcUEDAM8ABwABXUEDAI8ABwABXUEDAA0ABwABXUEDAOAABwABcUEDAK8AKAABcUEDAM8AKAABXUEFAM8AKADfACgAAnFBAwDfACgAAXJBAwBPACgAAXJBAwCvACgAAV1BAwD/ACgAAV1BAwCOACgAAV1BAwDgACgAAXG6AAUABwAoERI5QQMAhwAFAAFdQQMADAAIAAFxQQMAuAAIAAFdQQMA/QAJAAFdQQMA9gALAAFdQQMAtgAMAAFdQQMABgAMAAFxQQMABgAOAAFxQQMAtgAOAAFdQQMA9QAPAAFdQQMAbQARAAFdugATAAAADRESOUEDAHwAEwABXUEDAFoAEwABXUEDAAoAFQABcUEDAI4AFQABXUEDACYAFQABckEDAPIAFQABcUEDAHAAFgABXUEDAAIAFgABXUEDACIAFgABXUEDAGEAFgABXUEFADAAFgBAABYAAl1BAwAQABYAAV1BBQDbABgA6wAYAAJdQQMAnQAYAAFxQQMADgAYAAFxQQUAfwAYAI8AGAACcUEFAH8AGACPABgAAl1BAwDPABgAAV1BAwAfABgAAXFBAwBPABgAAXFBAwBtABgAAXFBAwAMABgAAXJBAwD6ABgAAV1BAwC2ABgAAV26ABoAAAANERI5QQMAzwAaAAFdQQMAWgAaAAFdQQMAzwAcAAFdQQMAWgAcAAFduAANELkAIgAB9EEDACgAIgABXUEDALgAIgABXUEDACgAIgABckEDAOgAIgABcUEFAEgAIgBYACIAAl1BAwAIACIAAXFBAwCHACIAAV0wMQFBBQDJAAgA2QAIAAJdQQMA6gAIAAFdQQcAyQAMANkADADpAAwAA11BBwDGAA4A1gAOAOYADgADXUEDAEUAFwABckEDAMkAFwABXUEDAF8ALAABXUEDAF8ALAABcQBBBwDJAAkA2QAJAOkACQADXUEDAMYACwABXUEHAMYADwDWAA8A5gAPAANdQQMAfAAYAAFxISMLASMRBiMiJjU0NjMyFh0BFAc2NxMzExYXJjURMwU0JiMiBhUUFjMyNgGHLF9fLA0RGycnGxsnBQcLSSJJCwcFJP7uFA4OFBQODhQBW/6lARMHJxsbJycb0RktISgBCP74KCEtGQELOg4UFA4OFBQAAAAAAgARAAABhwIvAB4AKgmyuwAlAAYACgAEK7sAEQAFAAQABCu7AAAABQAcAAQrQQMAzwAAAAFdQQMAlwABAAFdQQUAOAABAEgAAQACcUEFAGkAAQB5AAEAAnFBAwDpAAEAAV1BAwCaAAEAAXFBAwAaAAEAAXJBAwBbAAEAAXFBBQA7AAEASwABAAJyQQMAjAABAAFxQQMALQABAAFyQQMAzgABAAFdQQMArQABAAFxQQMADAABAAFyQQMA2wABAAFdQQUA2wABAOsAAQACcUEDACsAAQABcUEFALoAAQDKAAEAAnFBBQAKAAEAGgABAAJxQQMA+QABAAFxQQMA+AABAAFdQQMAtwABAAFdQQMAVwABAAFdQQMAZgABAAFdQQMADwAKAAFxQQcAjwAKAJ8ACgCvAAoAA11BAwDgAAoAAXG6AAIACgAAERI5QQUAxwACANcAAgACcUEDAKcAAgABcUEDAEgAAgABcUEDAJgAAgABcUEDADkAAgABcUEDAPgAAgABcUEDAHgAAgABcUEDABgAAgABcUEDADcAAgABXUEFAKUAAgC1AAIAAl1BAwBEAAIAAXJBAwDxAAMAAV1BAwAzAAMAAXJBAwAkAAMAAXJBAwBUAAMAAXFBBwCVAAMApQADALUAAwADcUEDAPYAAwABcUEFAAYAAwAWAAMAAnJBAwBnAAMAAV1BAwAXAAMAAXFBAwC4AAMAAV1BAwAoAAMAAXFBAwCJAAMAAV1BAwBpAAMAAXFBAwAIAAMAAXFBAwCYAAMAAV1BAwCnAAMAAV1BAwA3AAMAAXFBBQB2AAMAhgADAAJxQQMAxAADAAFxQQUAxAADANQAAwACXUEDAEMAAwABcUEDANEAAwABcUEDAEAAAwABckEDAOAAAwABcUEFAOAABADwAAQAAl1BAwBwAAQAAV1BAwDgAAQAAXFBAwD7AAgAAV1BAwDIAAgAAV1BAwD6AAwAAV1BAwDIAAwAAV1BAwDGAA4AAV1BAwD0AA4AAV1BAwDhABEAAXFBAwDxABEAAV1BAwDgABEAAV1BAwBwABEAAV24ABEQuAAT0LgAEy9BAwA4ABUAAXFBAwCYABUAAV1BAwBnABUAAV1BAwDHABUAAV1BAwC0ABYAAV1BAwB1ABYAAXFBAwA3ABYAAXFBBQDYABYA6AAWAAJxQQMAiAAWAAFdQQUAKQAWADkAFgACckEFAAkAFgAZABYAAnFBAwDqABYAAV1BAwAKABYAAXJBAwCZABYAAXFBAwDIABYAAV1BAwAYABYAAXJBAwA3ABYAAV1BAwD1ABYAAV1BAwDFABYAAXFBAwBEABYAAXFBAwBDABYAAXJBAwDzABcAAV1BAwA1ABcAAXJBAwAWABcAAXFBAwDmABcAAV1BAwAnABcAAXJBAwCXABcAAV1BAwAHABcAAXFBBQBpABcAeQAXAAJxQQMAigAXAAFdQQUAKQAXADkAFwACcUEDAEcAFwABcUEDAJcAFwABcUEDAMcAFwABXUEFAMYAFwDWABcAAnFBAwCmABcAAV1BBQAGABcAFgAXAAJyQQMA5AAXAAFxQQMAsQAXAAFdQQMAQAAXAAFyQQMAzgAYAAFdQQMAdwAYAAFxQQMAzwAcAAFduAAcELgAGtC4ABovuAAEELgAH9C4AB8vQQcAjwAlAJ8AJQCvACUAA11BAwAPACUAAXFBAwDgACUAAXFBAwDgACsAAXFBAwAQACsAAXFBCQAPACwAHwAsAC8ALAA/ACwABF1BAwDPACwAAV1BAwAvACwAAXEAuAAdL7gAAEVYuAAWLxu5ABYAED5ZuAAARVi4AA0vG7kADQAQPlm4AABFWLgAAC8buQAAAAo+WbgAAEVYuAADLxu5AAMACj5ZuwAoAAEABwAEK7oAAgAAAB0REjlBAwDlAAIAAXFBAwAJAAIAAXJBAwBpAAIAAXFBAwArAAIAAXFBAwC7AAIAAXFBAwCsAAIAAXFBAwB+AAIAAXFBAwD+AAIAAXFBAwDOAAIAAXFBAwAtAAIAAXJBAwA7AAIAAXJBAwBLAAIAAXFBAwDaAAIAAXFBAwA5AAIAAXFBAwDIAAIAAV1BBQDgAAIA8AACAAJdQQUAAAACABAAAgACcUEXABAAAgAgAAIAMAACAEAAAgBQAAIAYAACAHAAAgCAAAIAkAACAKAAAgCwAAIAC11BAwDfAAcAAXJBAwCvAAcAAV1BAwD/AAcAAV1BBQDPAAcA3wAHAAJxQQMATwAHAAFyQQMArwAHAAFxQQMAzwAHAAFdQQMAjwAHAAFdQQUADQAHAB0ABwACXUEDAOAABwABcUEDAM4AKAABcUEDAK8AKAABXUEDAM8AKAABXUEDAK8AKAABcUEDAE8AKAABckEDAP8AKAABXUEDAN8AKAABcUEDAN8AKAABckEDAIoAKAABXUEDAOAAKAABcboABQAHACgREjlBAwAMAAgAAXFBAwC5AAgAAV1BAwC2AAwAAV1BAwAGAAwAAXFBAwAFAA4AAXFBAwD1AA8AAV1BAwDGABAAAV1BAwD1ABAAAV1BAwCxABAAAV26ABMAAAAdERI5QQMAbQATAAFdQQcABgAVABYAFQAmABUAA3FBAwCZABUAAV1BAwBrABUAAXFBAwCMABUAAV1BAwAvABUAAV1BAwDPABUAAV1BAwBLABUAAXFBAwB5ABUAAXFBAwDGABUAAXFBAwAmABUAAXJBAwBAABUAAXJBBQAxABYAQQAWAAJdQQMAAgAWAAFdQQMAcAAWAAFdQQUAEAAWACAAFgACXUEDAEYAGAABckEDAPkAGAABcUEDAHoAGAABcUEDAJwAGAABcUEDADwAGAABcUEFAN0AGADtABgAAl1BAwBNABgAAXFBAwCeABgAAV1BAwAfABgAAXFBAwDPABgAAV1BAwB/ABgAAV1BAwAuABgAAV1BAwCNABgAAXFBAwAtABgAAXFBAwBtABgAAXFBAwCMABgAAV1BAwALABgAAXFBAwD6ABgAAV1BAwCpABgAAXFBAwDlABgAAXFBAwDFABgAAXG6ABoAAAAdERI5QQMAfwAaAAFdQQMAfwAcAAFdQQMAzwAcAAFdQQMAngAcAAFdQQMA3QAcAAFduAANELkAIgAB9EEDAIQAIgABXTAxAUEDAEcAAgABckEDAGUAAwABXUEDALYAAwABXUEFANkACADpAAgAAl1BBQDZAAwA6QAMAAJdQQUA1gAOAOYADgACXUEDAEUAFwABckEDAPAAKwABXUEDAPAALAABXUEDAF8ALAABXUEDAF8ALAABcQBBBQDZAAkA6QAJAAJdQQUA1gAPAOYADwACXSEjCwEjEQYjIiY1NDYzMhYdARQHNjcTMxMWFyY1ETMFNCYjIgYVFBYzMjYBhyxfXywNERsnJxsbJwUHC0kiSQsHBST+7hQODhQUDg4UAVv+pQETBycbGycnG9EZLSEoAQj++CghLRkBsuEOFBQODhQUAAACABj/+AFxAZAAKQA1C9e7ADAABgAWAAQruwAMAAUAHQAEK7sAAAAFAAEABCtBAwDPAAAAAXFBAwBAAAAAAXFBAwBwAAAAAXFBAwDNAAEAAXFBAwBwAAEAAXFBAwBAAAEAAXFBAwArAAQAAXJBBQC7AAQAywAEAAJxQQMAfQAEAAFxQQMAWwAEAAFyQQUAygAEANoABAACXUEDAAoABAABcUEDACMABgABckEDAGUABgABcUEDABYABgABcUEDAEQABgABcUEDAHIABgABcUEDAEAABgABckEDAKYABwABcUEDAGMABwABcUEDAEEABwABckEDANYADAABcUEJAEYADABWAAwAZgAMAHYADAAEXUEHAMYADADWAAwA5gAMAANdQQkAhgAMAJYADACmAAwAtgAMAARxQQMApgAMAAFdQQcABgAMABYADAAmAAwAA11BAwD2AAwAAXFBBwAGAAwAFgAMACYADAADckEDADUADAABcroACAAdAAwREjlBAwABAAgAAXFBAwAkAAgAAXJBAwBVAAgAAXJBAwD2AAgAAV1BAwB2AAgAAXFBAwCnAAgAAV1BAwC5AAgAAV1BAwBLAAgAAV1BAwAcAAgAAXFBAwB7AAgAAXJBAwBaAAgAAV1BAwBHAAgAAXFBAwCWAAgAAXFBAwBWAAgAAXFBBQClAAgAtQAIAAJxQQMA1AAIAAFyQQMAhAAIAAFxQQUAMAAIAEAACAACckEFAAAACAAQAAgAAnJBBwAgABYAMAAWAEAAFgADcUEDAFEAFgABcUEDAO0AFgABckEFAJ8AFgCvABYAAl1BBQDPABYA3wAWAAJyQQkAXwAWAG8AFgB/ABYAjwAWAARyQQMA/wAWAAFyQQMAjgAWAAFdQQMAYgAWAAFxQQMAEQAWAAFxQQMAcAAWAAFxQQMA4AAWAAFxugAKABYAABESOUEDAHgACgABXUEDAEkACgABcUEDALkACgABXUEDAAkACgABcUEDAFoACgABXUEDAMsACgABXUEDAD0ACgABcUEDAB8ACgABcUEDAC4ACgABcUEDAIwACgABXUEDAEsACgABXUEDADoACgABXUEDANkACgABXUEDAGkACgABXUEDAIkACgABcUEDAEcACgABckEDACUACgABcroAKgAdAAwREjm4ACovQQMA/wAqAAFxuQAQAAb0QQMA9wAQAAFxQQMABgASAAFxQQMADAAUAAFxQQMADAAYAAFxuAAdELgAG9C4ABsvugAfACoAEBESOUEDAOgAHwABXUEDADkAHwABXUEDALkAHwABXUEDAPoAHwABXUEFAMoAHwDaAB8AAl1BBQBbAB8AawAfAAJxQQMATAAfAAFxQQMALQAfAAFyQQMAPgAfAAFyQQUAzwAfAN8AHwACcUEDAE8AHwABckEDAD8AHwABcUEDAA8AHwABckEDAB4AHwABckEDAH0AHwABcUEDACwAHwABcUEFAKwAHwC8AB8AAnFBBQCLAB8AmwAfAAJxQQMAagAfAAFdQQMAigAfAAFdQQMAGQAfAAFxQQMAqQAfAAFyQQMAmAAfAAFdQQMAVwAfAAFdugAjABYAABESOUEFAMAAIwDQACMAAnJBAwCRACMAAV1BAwDiACMAAXJBAwCEACMAAV1BAwA3ACMAAXJBAwBIACMAAXFBAwA6ACMAAXFBAwDtACMAAXFBAwAZACMAAXFBAwAoACMAAXFBAwCnACMAAXFBAwCjACMAAXJBAwCiACMAAV1BAwAAACMAAXFBAwDwACMAAXJBCwBQACMAYAAjAHAAIwCAACMAkAAjAAVyQQMAVQAkAAFyQQMAKgAlAAFyQQMAOgAlAAFdQQMASwAlAAFdQQMATAAlAAFyQQMAywAlAAFxQQMAKgAlAAFxQQMAWQAlAAFdQQMAGQAlAAFxQQMAywAnAAFxQQMANgAnAAFdQQUARQAnAFUAJwACXUEFADUAMABFADAAAnJBCQBGADAAVgAwAGYAMAB2ADAABF1BCQBfADAAbwAwAH8AMACPADAABHJBCQDPADAA3wAwAO8AMAD/ADAABHJBBwCPADAAnwAwAK8AMAADXUEHAAYAMAAWADAAJgAwAANdQQUA5gAwAPYAMAACXUEPABAAMAAgADAAMAAwAEAAMABQADAAYAAwAHAAMAAHcUEDAOAAMAABcUEDACAANgABcUEDAOAANwABcUEDAD8ANwABXUEFAA8ANwAfADcAAl1BAwAvADcAAXFBAwBwADcAAXFBAwAAADcAAXEAuAAARVi4ACYvG7kAJgAQPlm4AABFWLgAAC8buQAAAAo+WbgAAEVYuAATLxu5ABMACj5ZuwAZAAEALQAEK0EDAM8AAgABcUEDAK8AAgABcUEDAE8AAgABckEDALoAAgABXUEDAMkAAgABXbgAJhC5AAUAAfRBBQA5AAUASQAFAAJyQR0AKAAFADgABQBIAAUAWAAFAGgABQB4AAUAiAAFAJgABQCoAAUAuAAFAMgABQDYAAUA6AAFAPgABQAOcUEHAAgABQAYAAUAKAAFAANyQSEACAAFABgABQAoAAUAOAAFAEgABQBYAAUAaAAFAHgABQCIAAUAmAAFAKgABQC4AAUAyAAFANgABQDoAAUA+AAFABBdQQMACAAFAAFxQQMASgAGAAFyugAIABMAJhESOUEDAIkACAABXUEDAFcACAABcUEDAEUACAABckEDAEYACQABcUEDAGQACQABcboACgATACYREjlBAwAzAAoAAV1BAwB0AAoAAV1BAwCHAAoAAV1BBQApAAoAOQAKAAJxQQMAGwAKAAFxQQUA2QAKAOkACgACcUEDANcACgABXUEDAEYACgABckEDAGMACgABXUEDAEEACgABXUEDAFAACgABXUEDACUADAABcUEDAMYADAABcUEDAE8ADAABckEDALUADAABXUEDADQADAABcUEDAEIADAABcUEDACoAEAABcUEDAE4AEAABcUEDABsAEAABcUEDADkAEAABcUEDAMkAEAABXUEDAMsAEQABXUEFAOoAEgD6ABIAAl1BAwDrABQAAV1BAwD6ABQAAV1BAwD2ABgAAV1BAwDlABgAAV1BAwDQABkAAXFBBQCfABkArwAZAAJyQQUAHwAZAC8AGQACcUEDAD4AGQABcUEFABAAGQAgABkAAl1BAwCgABkAAV1BBQCfAC0ArwAtAAJyQQcAHwAtAC8ALQA/AC0AA3FBAwDQAC0AAXFBAwCgAC0AAV26ABsALQAZERI5QQMAtAAdAAFdQQMAiQAdAAFdQQUAJQAdADUAHQACcUEDAEEAHQABcUEDAMAAHQABcboAHwATACYREjlBAwAyAB8AAV1BBQBkAB8AdAAfAAJdQQMAxgAfAAFxQQUAhwAfAJcAHwACXUEDACkAHwABckEDABwAHwABcUEDALkAHwABXUEDAFgAHwABcUEFANYAHwDmAB8AAl1BAwBFAB8AAXJBAwBDAB8AAXFBAwBBAB8AAV1BAwBQAB8AAV26ACMAEwAmERI5QQMASAAjAAFxQQMAeAAjAAFdQQMAKQAjAAFyQQMAiQAjAAFdQQMAGwAjAAFxQQMAeQAjAAFxQQMAyQAjAAFdQQUAqAAjALgAIwACXUEFAKcAIwC3ACMAAnFBAwA1ACMAAXFBAwAlACQAAXJBAwDFACgAAXFBBQDiACkA8gApAAJduAATELkAMwAB9EEFAOcAMwD3ADMAAl1BEQAHADMAFwAzACcAMwA3ADMARwAzAFcAMwBnADMAdwAzAAhdQREAhwAzAJcAMwCnADMAtwAzAMcAMwDXADMA5wAzAPcAMwAIcUEHAAcAMwAXADMAJwAzAANyQQMAVwAzAAFxQQUANgAzAEYAMwACcjAxAUEDANUAEgABXUEDALYAEgABXUEFALkAFADJABQAAl1BAwDaABQAAV1BBwC5ABgAyQAYANkAGAADXUEDAPAANgABXUEDAG8ANwABXQBBAwDZABEAAV1BAwC6ABEAAV1BBwC5ABUAyQAVANkAFQADXUEHALYAFwDGABcA1gAXAANdISMRNCYjIgYHFhcGFRQXFhUUBiMiJjU0NjMyFyY1NDcmIyIHPgEzMhYVBzQmIyIGFRQWMzI2AXEkPTAiPww1HDYJBCMfGyYmGwsNBigbGg0GBVc6QFD2FA4OExMODhQBBDE7Jx4FJxI3JykSGB0nJhsbJwUuGC4aDAE4SUk/zw4UFA4OExMAAAAAAwAR//gBWAGQACEALQA5B/y7ADQABgAWAAQruwAdAAUAEAAEK7sAAAAFAB8ABCtBAwAPAAAAAV1BAwD/AAAAAV1BAwApAAEAAXFBAwCJAAEAAXFBAwBqAAEAAXFBBQC6AAEAygABAAJxQQMAGgABAAFyQQMAOwABAAFxQQMA3AABAAFxQQMALwABAAFyQQMA/gABAAFxQQMADgABAAFyQQMATAABAAFyQQMAOwABAAFyQQMA6gABAAFxQQMAmgABAAFxQQMAqQABAAFxQQUASQABAFkAAQACcUEDAHgAAQABcUEDAJMAAQABXboAIgAQAB0REjm4ACIvQQMA8AAiAAFyQQsAkAAiAKAAIgCwACIAwAAiANAAIgAFckEFAFAAIgBgACIAAnK5AAUABvS6AAMAIgAFERI5QQMAdgAJAAFyQQUAjwAWAJ8AFgACXUEFAO8AFgD/ABYAAl1BAwAPABYAAXFBAwCuABYAAV1BAwB+ABYAAV24ABYQuAAL0LgACy9BAwDvAAsAAXJBAwCIAA0AAXJBAwC1AA0AAXJBAwAPAB8AAV1BAwD/AB8AAV1BBQB2ADQAhgA0AAJxQQMA9gA0AAFxQQcABgA0ABYANAAmADQAA3JBBwBGADQAVgA0AGYANAADXUEJAH8ANACPADQAnwA0AK8ANAAEXUEFAO8ANAD/ADQAAl1BAwAPADQAAXFBBwAGADQAFgA0ACYANAADXUEFAMYANADWADQAAnFBAwBWADQAAXFBBQA1ADQARQA0AAJyuAA0ELgAKNC4ACgvQQMA7wAoAAFyuAAQELgALtC4AC4vQQMAsAA6AAFdQQcAEAA6ACAAOgAwADoAA3FBAwA/ADsAAXFBAwB/ADsAAV1BBwAPADsAHwA7AC8AOwADXUEDAOAAOwABcQC4AABFWLgAIC8buQAgABA+WbgAAEVYuAAZLxu5ABkAED5ZuAAARVi4AAAvG7kAAAAKPlm4AABFWLgACC8buQAIAAo+WbsADgABACUABCu7ADcAAQATAAQrugADAAgAGRESOUEHAJoAAwCqAAMAugADAANxQQMA6wADAAFxQQMATQADAAFyQQMAGwADAAFyQQMAKgADAAFyQQMAKgADAAFdQQMAOQADAAFyQQMAyQAFAAFdQQMACgAHAAFxQQMACwAJAAFxQQMABAANAAFxQQUAoAAOALAADgACcUEDAB8ADgABcUEFAJAADgCgAA4AAl1BBQAAAA4AEAAOAAJdQQMABwAlAAFxQQMAHwAlAAFxQQUAOAAlAEgAJQACckEFAJAAJQCgACUAAl1BBQCgACUAsAAlAAJxugAQACUADhESOUEDAAwAEwABXUEDAE8AEwABckEDAK8AEwABXUEDAP8AEwABXUEDAN8AEwABckEDAK8AEwABcUEDAM8AEwABXUEFAM8AEwDfABMAAnFBAwCNABMAAV1BAwAbABMAAV1BAwDgABMAAXFBBQDPADcA3wA3AAJxQQMArwA3AAFdQQMA/wA3AAFdQQMATwA3AAFyQQMArwA3AAFxQQMAzwA3AAFdQQMA3wA3AAFyQQMAjQA3AAFdQQMA4AA3AAFxugARABMANxESOUEDAAwAFAABcUEDAAYAGAABcUEDAAUAHAABcUEDAHkAHQABcUEDAFoAHQABXUEDABsAHQABXUEDAHsAHQABckEDACwAHQABXUEFADsAHQBLAB0AAl1BAwDLAB0AAV1BAwBqAB0AAXJBAwAWAB0AAXJBAwAFAB0AAXK6AB8ACAAZERI5QQMAwwAfAAFxQQMAowAfAAFxQQMAdAAfAAFxQQUABQAfABUAHwACckEDAGUAHwABcUEDAOYAHwABcUEDABcAHwABcUEDACsAHwABXUEDAD8AHwABXUEDAB8AHwABXUEDAA0AHwABXUEDAGoAHwABckEDAFcAHwABcUEFADYAHwBGAB8AAnFBAwCVAB8AAXFBAwBEAB8AAXJBAwDUAB8AAXFBAwDzAB8AAXFBAwAyAB8AAXJBAwAhAB8AAXK4AAgQuQArAAH0QREABwArABcAKwAnACsANwArAEcAKwBXACsAZwArAHcAKwAIXUEXAFcAKwBnACsAdwArAIcAKwCXACsApwArALcAKwDHACsA1wArAOcAKwD3ACsAC3FBBwAHACsAFwArACcAKwADckEDAAcAKwABcUEDADcAKwABcUEFADYAKwBGACsAAnK4ABkQuQAxAAH0QQ8AOAAxAEgAMQBYADEAaAAxAHgAMQCIADEAmAAxAAdxQQUAOQAxAEkAMQACckEPAAgAMQAYADEAKAAxADgAMQBIADEAWAAxAGgAMQAHXUEJAMgAMQDYADEA6AAxAPgAMQAEcUEHAAgAMQAYADEAKAAxAANyQQMAhgAxAAFdMDEBQQkAtgAHAMYABwDWAAcA5gAHAARdQQsAuQAJAMkACQDZAAkA6QAJAPkACQAFXUELALkADQDJAA0A2QANAOkADQD5AA0ABV1BCwC5ABQAyQAUANkAFADpABQA+QAUAAVdQQsAuQAYAMkAGADZABgA6QAYAPkAGAAFXUELALYAGgDGABoA1gAaAOYAGgD2ABoABV1BAwBPADsAAV0AQQMAuQAGAAFdQQMA+QAGAAFdQQsAuQAKAMkACgDZAAoA6QAKAPkACgAFXUELALkAFQDJABUA2QAVAOkAFQD5ABUABV1BAwC2ABsAAV1BBQDWABsA5gAbAAJdQQMAxwAbAAFdISMmJxYVFAYjIiY1NDYzMhc1BiMiJjU0NjMyFh0BFhcRMwM0JiMiBhUUFjMyNgM0JiMiBhUUFjMyNgFYJ05EAykdHSgoHQsKDREbJycbGydjPCTXFg8PFhYPDxYMFA4OFBQODhQ8EwkJHSgoHR0pA5MHJxsbJycb2CMuAWP+tg8WFg8PFhYBHw4UFA4OFBQAAAAAAgAq//gBPwGQACcAMghiuAAVL7gABC+4ABsvuAAuL7oAEAAnAAMruwAoAAYAEAAEK0EDAEsAAwABcUEFAJkAAwCpAAMAAl1BDwAgAAQAMAAEAEAABABQAAQAYAAEAHAABACAAAQAB11BAwAYAAcAAXFBBQCfABUArwAVAAJdQQUAfwAVAI8AFQACcUEDAF8AFQABckEDACgAFQABcbgAFRC5AAoABvRBAwBQABAAAV1BAwDvABAAAXFBAwAfABAAAXFBBQA/ABAATwAQAAJxQQMAvwAQAAFdQQMADwAQAAFyQQMAkAAQAAFdQQMA8AAQAAFdugAIAAoAEBESOUEDAEYACAABcUEDADkACAABXUEDAJoACAABcUEDAMsACAABcUEFAHwACACMAAgAAnFBAwBKAAgAAV1BAwCpAAgAAV1BAwCoAAgAAXFBAwC0AAgAAV1BBQAkAAgANAAIAAJxQQMAGwAMAAFxQQMAvAAMAAFxQQMA3QAMAAFxQQMAWwAMAAFxQQMA6gAMAAFxQQUAaQAMAHkADAACcUEDAAYADgABcUEDAGYADgABcUEDAAYAEgABcUEDAIYAEgABcUEFAJUAEgClABIAAnFBAwB1ABIAAXFBAwD1ABMAAV1BAwALABQAAXFBAwClABQAAXJBAwAPABoAAXJBAwACABsAAV1BAwA2ABsAAV1BAwBEABsAAV1BAwBAABsAAXFBBQAQABsAIAAbAAJdQQMAXAAdAAFxQQMAjwAdAAFxQQMAfAAdAAFxQQMAHAAdAAFxQQMAmAAdAAFxuAAEELkAIQAF9EEFAH8AJwCPACcAAnFBAwBQACcAAV1BBQBQACcAYAAnAAJxuAAnELkAJQAF9EEFAD8AKABPACgAAnFBAwDvACgAAXFBAwAfACgAAXFBAwC/ACgAAV1BAwAPACgAAXJBAwCQACgAAV1BAwDwACgAAV1BBQAPAC4AHwAuAAJxQQMAvwAuAAFxQQcAXwAuAG8ALgB/AC4AA11BBQBfAC4AbwAuAAJyQQMAvwAuAAFdQQMAIAAuAAFxQQMAgAAzAAFduAAnELgANNwAuAAARVi4ACYvG7kAJgAQPlm4AABFWLgADS8buQANABA+WbgAAEVYuAACLxu5AAIACj5ZugAwAB0AAytBEQAvAAAAPwAAAE8AAABfAAAAbwAAAH8AAACPAAAAnwAAAAhxQQMALAABAAFxQQMASwABAAFxQQMAOgABAAFxQQUALAADADwAAwACcUEDAJsAAwABcUEDAIkAAwABXUEFALoABADKAAQAAnFBAwCLAAQAAXFBAwA+AAQAAXFBAwAvAAQAAXFBBQBfAAQAbwAEAAJxQQMAfAAEAAFxQQMAqwAEAAFxQQMASQAEAAFxQQMAmAAEAAFxQQMAYwAFAAFxQQMApQAFAAFxQQMAVgAFAAFxQQUAdQAFAIUABQACcUEDALQABQABcUEDAMEABQABcUEDAJAABQABcUEDAMYABgABcUEDABUABgABcUEDAIQABgABcUEDADAAHQABXUEDAJAAHQABXUEDAFIAHQABXUEFADAAHQBAAB0AAnFBBQBgAB0AcAAdAAJdQQMAsAAdAAFdQQMAkAAdAAFxQQMAUAAwAAFdQQMAYAAwAAFxQQMA8AAwAAFyQQMAzwAwAAFdQQMAjwAwAAFdQQMAzwAwAAFxQQUA4AAwAPAAMAACcUEFAAAAMAAQADAAAnJBAwAwADAAAXFBAwCQADAAAXFBAwAwADAAAXK6AAgAHQAwERI5QQMAKAAIAAFxQQMACQAIAAFdQQMAqQAIAAFdQQUAOAAIAEgACAACXUEHAIcACACXAAgApwAIAANxQQMAagAJAAFxQQMAWwAJAAFxQQMAGwAJAAFxQQMAgQAJAAFxQQMAUAAJAAFyQQUAMAALAEAACwACcUEDADAACwABckEDAFIACwABcUEDAGMACwABXUEDABQACwABcUEDAIQACwABXUEDANMACwABcUEFALEACwDBAAsAAnFBAwBgAAsAAXFBAwDgAAsAAXFBAwBwAAsAAV1BAwA0AAwAAXG4ADAQuQATAAL0QQMAmAATAAFdQQsAHwATAC8AEwA/ABMATwATAF8AEwAFXUEDAK8AEwABXUEDAAgAEwABXUEDAAcAEwABckEDAGYAEwABXUEDAFAAFQABckEDAOEAFQABXUEDADYAFQABcUEHAEgAFQBYABUAaAAVAANxQQMACQAVAAFxQQMAywAVAAFxQQMAGgAVAAFxQQMAuQAVAAFxQQUAuAAVAMgAFQACXUEDAJMAFQABXUEDACAAFQABcUEDANAAFQABXUEFAJAAFQCgABUAAnJBAwDlABcAAV1BAwCgABcAAXJBAwBlABgAAXFBAwBBABgAAXFBAwDhABgAAXG4AB0QuQAbAAH0QQMAhAAgAAFxQQMAdQAgAAFxQQMA6gAgAAFxQQMAVQAgAAFxQQMAEwAgAAFxQQMAkwAgAAFxQQMAPQAhAAFxQQMATwAhAAFxQQMAKwAhAAFxQQMAFwAhAAFxuAACELkAIwAB9EETAAcAIwAXACMAJwAjADcAIwBHACMAVwAjAGcAIwB3ACMAhwAjAAldQQMApwAjAAFdQQMATwAlAAFxQQMALwAlAAFxQQMAFwAlAAFxuAANELkAKwAC9EEDAKAAKwABXTAxAUELALYADgDGAA4A1gAOAOYADgD2AA4ABV1BBwDFABIA1QASAOUAEgADXUEDALYAEgABXUEDAPYAEgABXUEDACYAEgABcUEDANUAEwABXUEDALkAFAABXQBBCQDGAA8A1gAPAOYADwD2AA8ABF1BBQC5ABEAyQARAAJdQQUA6QARAPkAEQACXUEDANoAEQABXSUUIyI9ATQ2NyY1NDYzMhYVFAYjIicGFRQWOwEVIyIGHQEUMzI1ETMHNCYjIgYVFDMyNgE/h4gbFDUtKBkgHhslDwEjHDk6Fh5kYyShEg4OER8OEllhYTMXKggXTCcxIhcXISEDDRwuIiAaLkNDASwxDhISDh8RAAAAAAIAGf/4AR8BkgAhAC0Ps7gALi+4AAsvQQUAAAALABAACwACXUEDAC4ACwABckEDAJwACwABcUEDAIAACwABXUEDABAACwABcUEFANAACwDgAAsAAl25AAAABfRBAwDFAAIAAV1BAwATAAIAAXFBAwDNAAQAAV1BAwAQAC4AAXG4AC4QuAAG0LgABi9BAwBBAAYAAXFBAwCcAAYAAXFBAwAuAAYAAXJBBQCvAAYAvwAGAAJxQQUAnwAGAK8ABgACXUEDAM8ABgABckEDAE8ABgABckEDAD8ABgABXUEDAI8ABgABckEDAD0ABgABckEDABcABgABcUEDABEABgABXUEFANAABgDgAAYAAl1BAwDPAAgAAV1BAwCYAAgAAXFBAwDFAA4AAXJBAwC1AA4AAV1BAwAlAA4AAXJBAwDWAA4AAXJBAwBmAA4AAXJBBQCGAA4AlgAOAAJxQQMA1wAOAAFxQQMAdwAOAAFxQQMAlwAOAAFyQQUAKQAOADkADgACcUEDABsADgABXUEDAC0ADgABXUEDAEoADgABcUEDAAgADgABXUEDAKcADgABcUEDAFcADgABcUEDALYADgABcUEDANYADgABXUEDAGYADgABXUEDAIUADgABckEDAOUADgABXUEDAJUADgABXUEDAEUADgABckEDABMADgABcUEDAAYADwABXUEDAOkADwABcUEDAIsADwABcUEDALwADwABcUEDAP0ADwABXUEDAH8ADwABcUEFAE8ADwBfAA8AAnFBAwCfAA8AAXFBAwCtAA8AAXFBAwBsAA8AAXFBAwALAA8AAXFBBQDKAA8A2gAPAAJxQQMAhwAPAAFyQQMANQAPAAFyQQMAFAAPAAFxQQMASwAQAAFxQQMAGQARAAFxQQMAuwARAAFdQQMA/QARAAFdQQMAKwARAAFxQQMAagARAAFyQQUA2QARAOkAEQACXUEDAOYAEQABcUEDAPYAEgABcUEDAJUAEgABcUEDABAAEgABckEDAJsAEwABXUEDANgAEwABcrgAABC4ABXQuAAVL0EDABgAFQABXUEDACwAFQABXUEDAGUAFQABckEDAEMAFQABXUEDAEgAFgABXUEDALkAFgABXUEDAPkAFgABXUEDAHoAFgABXUEDAJoAFgABcUEDAC4AFgABXUEDAF8AFgABXUEDAJ0AFgABXUEDAGwAFgABXUEDAAoAFgABXUEDAKoAFgABXUEDAIkAFgABXUEDABgAFgABXUEDABUAFgABcUEDAOQAFgABXUEDAEEAFwABckEDAMMAFwABcUEDAPYAFwABXUEDABIAFwABcUEDABAAFwABckEDANAAFwABcUEDAJoAGAABXUEDAIUAGAABXUEDAOMAGAABXUEDAIkAGQABcUEDAEkAGQABcUEDAPoAGQABXUEDAMoAGQABcUEDAMsAGQABXUEDAFsAGQABcUEDAJsAGQABcUEDALsAGQABcUEDAKoAGQABXUEDABkAGQABcUEDANkAGQABcUEDANgAGQABXUEDADMAGQABcUEDABsAGgABckEDAC8AGgABcUEDAK0AGgABcUEDAEoAGgABckEDAHoAGgABcUEDAEMAHAABckEDACIAHAABckEDAB4AHQABXUEDABEAHgABckEDAAMAHgABckEFAMQAHgDUAB4AAnFBBQDlAB4A9QAeAAJxQQMA1QAeAAFdQQMAlgAeAAFyQQMAlgAeAAFxQQMAdgAeAAFxQQMA5wAeAAFyQQMAlwAeAAFdQQMAJwAeAAFxQQMAawAeAAFyQQMAKwAeAAFdQQMATgAeAAFdQQMASwAeAAFxQQMAOQAeAAFxQQMA5wAeAAFdQQMAVwAeAAFdQQMAVwAeAAFxQQMApgAeAAFdQQUAxgAeANYAHgACckEDAFUAHgABckEFAKUAHgC1AB4AAnFBAwCEAB4AAXJBAwATAB4AAXFBAwAiAB4AAXJBAwAxAB4AAXJBAwBAAB4AAXJBAwA3AB8AAXJBAwAcAB8AAV1BAwB+AB8AAXFBAwBLAB8AAXJBAwCEAB8AAXFBAwAQAB8AAXJBAwATACAAAXFBAwBCACAAAXFBAwCRACAAAXG4AAsQuAAi0LgAIi+4AAYQuQAoAAb0QQMAmgAoAAFxQQMAOQAoAAFyQQMAhwAoAAFyuAAAELgAL9xBBwAPAC8AHwAvAC8ALwADXUETAF8ALwBvAC8AfwAvAI8ALwCfAC8ArwAvAL8ALwDPAC8A3wAvAAldALgAEy+4AB8vuAAARVi4ABAvG7kAEAAQPlm4AABFWLgAFS8buQAVABA+WbgAAEVYuAAWLxu5ABYAED5ZuAAARVi4ABgvG7kAGAAOPlm4AABFWLgAAy8buQADAAo+WbsACQABACUABCu7AB4AAgAOAAQruwAgAAEADAAEK0EDANwAAAABXUEDAB8AAAABcUEDALwAAAABXUEDAMsAAAABXUEDAAoAAAABcUEDAL4AAQABXUEDANoAAgABXUEDAAoAAgABcUEDAAsABAABcUEDAJsABAABcUEDALsABQABXUEDALIABwABXUEDAAUACAABcUEDAJMACAABcUEFABAACQAgAAkAAl1BBQAfAAkALwAJAAJxQQMAnwAJAAFyQQMA0AAJAAFxQQMAoAAJAAFdQQMAnwAlAAFyQQUAHwAlAC8AJQACcUEDANAAJQABcUEDAKAAJQABXboACwAlAAkREjlBAwAhAAwAAXJBAwCCAAwAAXFBAwDyAAwAAXJBAwB0AAwAAV1BAwCVAAwAAXJBAwAXAAwAAXJBAwD6AAwAAXFBAwCqAAwAAXFBAwAMAAwAAXJBAwA/AAwAAV1BAwC7AAwAAXFBAwBKAAwAAXJBAwDZAAwAAXFBAwAGAAwAAXFBAwBUAAwAAV1BAwDDAAwAAV1BAwDCAAwAAXJBAwBiAAwAAXFBAwAwAAwAAXJBAwCwAAwAAXJBAwA5AA0AAXFBAwDpAA0AAXFBAwBMAA0AAXJBAwAsAA0AAXJBAwDKAA0AAXFBAwB5AA0AAXFBBQAYAA0AKAANAAJxQQMA1gANAAFdQQMAYQAOAAFxQQMAIgAOAAFdQQMAVAAOAAFxQQMAtAAOAAFxQQMAVAAOAAFyQQMA9AAOAAFyQQMAdQAOAAFdQQMAJwAOAAFyQQMAyQAOAAFxQQMAiQAOAAFyQQMAmgAOAAFyQQMArAAOAAFdQQMA+QAOAAFdQQMA+QAOAAFxQQMA6AAOAAFxQQMA5wAOAAFdQQMAtQAOAAFyQQUAxAAOANQADgACckEDADQADgABckEDAIQADgABcUEDAEQADgABXUEDAFEADgABXUEDABAADgABckEDAGoADwABckEDAIMADwABXUEDAHAADwABXUEDALQAEgABcUEDAJYAEgABcUEDAIQAEgABcUEDAAMAEgABckEDAGEAEwABcUEDALEAEwABcUEDADEAEwABckEDADIAEwABcUEDAGIAEwABXUEDALMAEwABXUEDAIMAEwABcUEDAFUAEwABXUEDAIkAEwABXUEDAMkAEwABXUEDACkAEwABcUEDANsAEwABckEDAAkAEwABXUEDAAkAEwABcUEDAKkAEwABXUEDAPcAEwABXUEDAAMAEwABckEDAOMAEwABXUEDAHMAEwABXUEDABIAEwABckEDAJIAEwABXUEDAOEAEwABcUEDAJEAEwABcUEDAGAAEwABckEDAIAAEwABckEDALkAFgABckEDAFEAGAABXUEDAOIAGAABXUEDAKIAGAABckEDAGMAGAABcUEFAGMAGABzABgAAl1BAwC0ABgAAV1BAwAoABgAAXFBAwBMABgAAXJBAwDLABgAAV1BAwDWABgAAXJBAwCEABgAAV1BAwCTABgAAXFBAwAzABgAAXFBAwBSABgAAXJBAwCSABgAAV1BAwBgABgAAXJBAwCAABgAAXK4ABAQuQAbAAH0uAAYELkAHgAC9EEDAEQAHgABckEDAGUAHgABcUEDAAoAHgABXUEDAMoAHgABXUEDANoAHgABckEDADwAHgABXUEDACwAHgABcUEDABwAHgABXUEDAN0AHgABXUEDAJ0AHgABckEDAG4AHgABXUEDAO8AHgABXUEHAG8AHgB/AB4AjwAeAANyQQcAjwAeAJ8AHgCvAB4AA11BAwC+AB4AAV1BAwD9AB4AAV1BBQBNAB4AXQAeAAJdQQMAXAAeAAFyQQMAfAAeAAFdQQMAqwAeAAFyQQMAGgAeAAFxQQMAKgAeAAFdQQMAOQAeAAFxQQMAJQAeAAFyQQMAMwAeAAFyQQMAEgAeAAFyQQMAMgAfAAFyQQMAlwAfAAFxQQMA2AAfAAFdQQMA6AAfAAFyQQMACQAfAAFyQQMAywAfAAFxQQMAKwAfAAFxQQMACgAfAAFxQQMAmQAfAAFyQQUA2AAfAOgAHwACcUEDAKgAHwABXUEDAFUAHwABckEDAGAAHwABcUEDAGAAHwABckEDAIEAIAABXUEDAJMAIAABXUEDAAMAIAABcUEDAFQAIAABXUEDAFcAIAABcUEDAOoAIAABckEDACsAIAABcUEDAPwAIAABcUEDADoAIAABXUEDAKkAIAABXUEDAIUAIAABcUEDAGQAIAABcUEDANMAIAABXUEDAMIAIAABXUEDAEAAIAABXUEFAGAAIABwACAAAl1BAwAQACEAAXFBAwCAACEAAXFBAwBgACEAAXJBAwBRACEAAXFBAwAyACEAAXJBBQADACEAEwAhAAJyQQMAxAAhAAFxQQMARAAhAAFyQQMAlwAhAAFxQQMAOgAhAAFdQQMA+gAhAAFxQQMARgAhAAFxQQMA5AAhAAFxQQMAJAAhAAFxQQMAAgAhAAFxQQMAIQAhAAFyQQMA0QAhAAFdQQMA0AAhAAFxQQMAYAAhAAFxQQMAwAAhAAFdQQ0AQAAhAFAAIQBgACEAcAAhAIAAIQCQACEABl24AAMQuQArAAH0MDEBQQMA5QACAAFdQQMA9gACAAFdQQMA+QAEAAFdQQcA2QAIAOkACAD5AAgAA11BAwATAA4AAV1BAwD0AA4AAV1BAwBlAA4AAXFBAwATAA8AAV1BAwBzAA8AAXFBAwD7AA8AAV1BAwApAB0AAXFBAwB5AB4AAXFBAwAqAB4AAXEAQQMA+QABAAFdQQUA2QAFAOkABQACXUEHANYABwDmAAcA9gAHAANdQQMA4AAMAAFxQQMAEQAOAAFdQQMAZgAYAAFxQQMAZQAZAAFxQQMAFgAeAAFxQQMARgAeAAFyQQMAjwAeAAFyQQMArwAeAAFyQQMAFgAfAAFyQQMAiwAfAAFyQQMArAAfAAFyQQMA4AAhAAFxQQMAZgAhAAFxQQMALQAhAAFxNxQGIyImNTQ2MzIXNTQnNjMyFjMyNxcGIyImIyIGBx4BFQc0JiMiBhUUFjMyNv4kHhsnJxsRDcEGWxVNEQoJHw8kFU8UEh8BQHwgFA4OFBQODhQ6GycnGxsnB2kpH2oVFwgwFh8QCywppw4UFA4OFBQAAgAa/zgBQgGQACQAMApkuwArAAYAGQAEK7sAEwAGACUABCu7AAAABQABAAQrQQMAugAEAAFxQQMA6gAEAAFxQQUAugAEAMoABAACXUEDANkABAABXUEDAGQABgABcUEDAOUABgABcUEDABQABgABcUEDABIABgABckEDALEABgABcUEDABYABwABcboACAAZACsREjlBAwADAAgAAXJBAwB0AAgAAXFBAwDFAAgAAXFBAwD1AAgAAXFBBQDWAAgA5gAIAAJxQQMANgAIAAFxQQMApwAIAAFdQQMACAAIAAFxQQMAigAIAAFyQQMAbAAIAAFdQQMAywAIAAFdQQUAGQAIACkACAACcUEDAPgACAABckEDAGYACAABcUEFANYACADmAAgAAl1BAwAVAAgAAXJBAwBVAAgAAXFBAwC0AAgAAXFBAwBDAAgAAXJBAwAiAAgAAXJBAwAwAAgAAXJBAwBGAAkAAXFBAwBZAAoAAV1BAwD6AAoAAV1BAwBrAAoAAV1BAwC8AAoAAV1BAwDLAAoAAV1BAwB6AAoAAV1BBwAoAAoAOAAKAEgACgADcUEDABYACgABcbgAKxC4AA3QuAANL7oADgAZAAAREjlBAwDlAA4AAXFBAwB2AA4AAXFBAwDJAA4AAV1BAwBZAA4AAV1BAwCKAA4AAV1BBQBrAA4AewAOAAJdQQcAKwAOADsADgBLAA4AA11BAwCqAA4AAV1BAwAaAA4AAV1BAwCZAA4AAV1BAwC2AA4AAXFBAwDFAA4AAXFBBQA0AA4ARAAOAAJyQQMAFAAOAAFyQQMA8AATAAFyQQUAkAATAKAAEwACXUEHALAAEwDAABMA0AATAANxQQcABgATABYAEwAmABMAA11BAwBPABMAAXFBAwC2ABMAAV1BBwCGABMAlgATAKYAEwADcUEDAPAAEwABXUEDAAAAEwABcUEHADAAEwBAABMAUAATAANdQQMAEAATAAFyQQkAUAATAGAAEwBwABMAgAATAARyQQMAowAXAAFdugAcABkAABESOUEDAIUAHAABckEDAGkAHAABXUEDAMkAHAABcUEDALsAHAABXUEFACwAHAA8ABwAAnJBAwANABwAAV1BAwC7ABwAAXFBAwB6ABwAAV1BAwB5ABwAAXFBAwA4ABwAAV1BAwChABwAAXJBAwDxABwAAXJBAwBGAB4AAV1BAwC3AB4AAXFBAwCXAB4AAXJBAwD4AB4AAXJBAwDYAB4AAV1BAwAsAB4AAXJBAwDJAB4AAV1BAwCoAB4AAV1BAwAHAB4AAV1BAwA3AB4AAXJBAwCGAB4AAXJBAwAlAB4AAXFBAwAUAB4AAXFBAwAoAB8AAXFBAwBXAB8AAXFBAwCnAB8AAXJBAwABACAAAXJBAwA0ACAAAXFBAwBGACAAAXJBAwCnACAAAXJBAwBGACAAAXFBBQBlACAAdQAgAAJxQQMAEwAgAAFyQQMAsQAgAAFxQQMAcQAgAAFyQQMAuwAiAAFxQQMA6wAiAAFxQQMA8AAlAAFdQQMAAAAlAAFxQQUAkAAlAKAAJQACXUEDAE8AJQABcUEDABAAJQABckEDAPAAJQABckEHALAAJQDAACUA0AAlAANxQQkAUAAlAGAAJQBwACUAgAAlAARyQQUAEAAxACAAMQACcUEDABAAMgABcUEDAI8AMgABXUEDAC8AMgABcUEHAA8AMgAfADIALwAyAANdQQMA4AAyAAFdQQMA4AAyAAFxQQMAAAAyAAFyALgAAC+4AABFWLgAIS8buQAhABA+WbgAAEVYuAAWLxu5ABYACj5ZuwAQAAEAKAAEK0EDAOoAAgABXUEDAKwAAwABcUEDALkAAwABcUEDAOkAAwABcbgAIRC5AAUAAfRBBQA5AAUASQAFAAJyQSEACAAFABgABQAoAAUAOAAFAEgABQBYAAUAaAAFAHgABQCIAAUAmAAFAKgABQC4AAUAyAAFANgABQDoAAUA+AAFABBdQSEACAAFABgABQAoAAUAOAAFAEgABQBYAAUAaAAFAHgABQCIAAUAmAAFAKgABQC4AAUAyAAFANgABQDoAAUA+AAFABBxQQcACAAFABgABQAoAAUAA3K6AAgAAAAhERI5QQMAuAAIAAFxQQMAKAAIAAFxQQMAyQAIAAFdQQMAqgAIAAFdQQMASwAIAAFxQQMAOQAIAAFyQQMAaQAIAAFyQQMA+AAIAAFdQQMA1wAIAAFdQQUANAAIAEQACAACXUEDALkACQABcUEDAIkACQABckEDAEYACQABcUEDAGQACgABXUEDAEcACgABcUEDADgACgABcUEDACkACgABXUEDAKoACgABXUEDALsACgABXUEDAM8ACgABXUEDAB0ACgABcUEDAGoACgABcUEDACkACgABcUEDAPkACgABXUEDAFgACgABcUEDADQACgABXUEDAEEACgABXUEDAFAACgABXUEDAHIADQABXUEFAB8AKAAvACgAAnFBAwCfACgAAXJBAwCgACgAAV1BAwDQACgAAXFBAwCgABAAAV1BAwAuABAAAXFBAwAfABAAAXFBAwCfABAAAXJBBQARABAAIQAQAAJdQQcAMAAQAEAAEABQABAAA11BAwDQABAAAXG6AA4AKAAQERI5QQMA9QARAAFdQQMABQARAAFxQQMA+wAVAAFdQQMACwAVAAFxQQMA+wAXAAFdQQMACgAXAAFxQQMAuQAXAAFdQQMA6wAZAAFdQQMALwAZAAFxQQMAvwAZAAFdQQMAqwAZAAFdQQMA+QAZAAFdQQMA4gAaAAFxQQMAJAAaAAFxQQMApgAaAAFdQQMA1AAaAAFxQQMA0wAaAAFdQQMAwgAaAAFxQQMAcgAaAAFxugAcAAAAIRESOUEDAFQAHAABXUEDACUAHAABcUEDAAYAHAABXUEDADgAHAABcUEDAKoAHAABXUEDALgAHAABcUEDAHYAHAABXUEDAGUAHAABXUEDACQAHAABXUEFADIAHABCABwAAl1BAwAVAB4AAV1BAwCnAB4AAXFBAwC4AB4AAXFBAwAJAB4AAXFBAwAqAB4AAXJBAwALAB4AAV1BAwDPAB4AAV1BAwAfAB4AAXFBAwD+AB4AAV1BAwBKAB4AAXFBAwA5AB4AAXJBAwC5AB4AAV1BAwB4AB4AAV1BAwCnAB4AAXJBAwBTAB4AAV1BAwAhAB4AAV1BAwCKAB8AAXJBBQARACQAIQAkAAJdQQMAMgAkAAFdQQMAQAAkAAFdQQMA8AAkAAFduAAWELkALgAB9EEHAAcALgAXAC4AJwAuAANdQQMA1wAuAAFxQQMARwAuAAFxQQkAdwAuAIcALgCXAC4ApwAuAARxMDEBQQMA2AAOAAFdQQMA6QAOAAFdQQcAxgARANYAEQDmABEAA11BBwDGABUA1gAVAOYAFQADXUEHAMkAFwDZABcA6QAXAANdQQMAPgAeAAFyQQMAPAAfAAFyQQMAXwAyAAFdQQMAXwAyAAFxAEEHAMYAEgDWABIA5gASAANdQQcAyQAUANkAFADpABQAA11BAwDIABgAAV1BAwDZABgAAV0FIxE0JiMiBgcWFw4BHQE2MzIWFRQGIyImPQE0NyYjPgEzMhYVBzQmIyIGFRQWMzI2AUIkPDEiPgw9EhckEA4cJyccHCYzGzMIWDlAT6gUDg4TEw4OFMgBzTM4Jx4FJgUrGUEHJxwcJiYcfDYZCzdJSD/QDhQUDg4TEwAAAAIAFf/4AUUBkAAuADoKbLsANQAFABUABCu7AA8ABgAvAAQruwAAAAUAAQAEK0EFAMUABwDVAAcAAnFBAwC0AAcAAXG4ADUQuAAJ0LgACS+6AAoAFQAAERI5QQMARAAKAAFyQQUA5QAKAPUACgACcUEDAAUACgABckEDANYACgABcUEHAIcACgCXAAoApwAKAANxQQMAGAAKAAFxQQMAuQAKAAFdQQMAWgAKAAFdQQUAOwAKAEsACgACXUEDAHsACgABXUEHAIoACgCaAAoAqgAKAANdQQMAaQAKAAFdQQMA2QAKAAFdQQMARwAKAAFxQQMAVgAKAAFxQQMAtgAKAAFxQQMAxQAKAAFxQQMAFAAKAAFyQQUAIwAKADMACgACckEPAAAADwAQAA8AIAAPADAADwBAAA8AUAAPAGAADwAHXUEDAAAADwABcUEDACAADwABckEDAGYADwABcUEDAOYADwABXUEDAOgADwABcUEDABYADwABckEDADEADwABckEFAMAADwDQAA8AAnFBBQCQAA8AoAAPAAJdQQUAsAAPAMAADwACckEFAEAADwBQAA8AAnJBAwDpABQAAV1BAwC6ABkAAV1BAwDrABkAAV1BAwDrABkAAXFBAwAaABkAAXJBAwAJABkAAXG4AAEQuAAc0EEDAL8AHwABcUEDAI0AHwABckEDAMwAIAABcUEDAOwAIAABcUEDAMoAIAABXUEDAAoAIAABckEDAPUAIgABXUEDANMAIgABcUEFAAAAIgAQACIAAnJBBQDDACMA0wAjAAJxQQMAtQAjAAFxQQMAlwAjAAFxQQMAJQAjAAFyQQMAhAAjAAFyQQMA4AAjAAFxQQUAAAAjABAAIwACckEFAOUAJQD1ACUAAnFBBwAFACUAFQAlACUAJQADckEDANYAJQABcUEDAGkAJQABckEDAHoAJQABckEFAHwAJQCMACUAAl1BAwAqACUAAXFBAwCaACUAAXJBAwC3ACUAAXFBAwCGACUAAXFBAwBFACUAAXJBAwAzACUAAXJBAwCmACYAAXJBAwAXACYAAXJBAwAXACYAAV1BAwB4ACYAAXFBBQA5ACYASQAmAAJyQQUA6QAmAPkAJgACcUEDAPkAJgABXUEDACoAJgABckEDAIkAJgABcUEFAMkAJgDZACYAAl1BAwCJACYAAXJBBwC4ACYAyAAmANgAJgADcUEDAAgAJgABckEDAHcAJgABckEDAJcAJgABckEDANYAJgABckEDADUAJgABcUEDAJMAKAABckEDAGgAKAABcUEDADsAKAABckEDAP0AKAABcUEDAEoAKAABckEDAHMAKAABckEDAKEAKAABckEDABAAKAABckEDAMUAKQABcUEDALYAKQABcUEDACkAKQABckEDAOUAKQABcUEDAAQAKQABckEDAIMAKQABckEDACkAKwABckEDALsAKwABcUEDAM0AKwABcUEDAOoAKwABcUEDANUAKwABcUEFAAUAKwAVACsAAnJBBQCwAC8AwAAvAAJyQQUAkAAvAKAALwACXUEDAJgALwABckEDAAAALwABcUEDADAALwABXUEFAMAALwDQAC8AAnFBCQAgAC8AMAAvAEAALwBQAC8ABHJBAwAQADsAAXFBAwCgADsAAV1BAwAAADwAAXJBBwAPADwAHwA8AC8APAADXUEDAI8APAABXUEDAC8APAABcUEDABAAPAABcUEDAOAAPAABcQC4AABFWLgAKi8buQAqABA+WbgAAEVYuAAALxu5AAAACj5ZuAAARVi4ABIvG7kAEgAKPlm7AAwAAQAyAAQruwAaAAEABgAEK0EDACEAAgABXUEDANIAAgABcUEDABAAAgABXUEDAMAAAgABcUEHADAABgBAAAYAUAAGAANdQQMA4AAGAAFdQQMAcAAGAAFdQQMA8gAJAAFdQQMAsgAJAAFdQQMA4AAJAAFdQQUAHwAyAC8AMgACcUEHAI8AMgCfADIArwAyAANyQQMA0AAyAAFxQQMAoAAyAAFdQQUAQAAMAFAADAACXUEHAI8ADACfAAwArwAMAANyQQUAHwAMAC8ADAACcUEDADEADAABXUEDANAADAABcUEDAKAADAABXboACgAyAAwREjlBBQDgABYA8AAWAAJdQQUAEgAWACIAFgACXUEDAAQAFgABcUEDAAMAFgABXUEDAHEAFgABXUEDALAAFgABXUEFAOAAFgDwABYAAnFBBQAAABYAEAAWAAJyQQMAtAAXAAFdQQMA4AAaAAFdQQMABQAaAAFdQQMAcAAaAAFdQQcAMAAaAEAAGgBQABoAA126ABwAEgAqERI5QQUAEAAcACAAHAACXUEFAAAAHAAQABwAAnJBAwCxABwAAXFBBQAkABwANAAcAAJyQQMA5AAcAAFxQQMA1QAcAAFdQQMARQAcAAFxQQMAFAAcAAFxQQMA4wAcAAFdQQMA8QAcAAFxQQMAwAAcAAFdQQMAQAAcAAFyQQUAwAAcANAAHAACcUEDAM0AHQABcUEDANsAHQABXUEDAMkAHQABXbgAKhC5ACEAAfRBAwDoACEAAV1BBQA5ACEASQAhAAJyQRsACAAhABgAIQAoACEAOAAhAEgAIQBYACEAaAAhAHgAIQCIACEAmAAhAKgAIQC4ACEAyAAhAA1dQQUACAAhABgAIQACcUEbADgAIQBIACEAWAAhAGgAIQB4ACEAiAAhAJgAIQCoACEAuAAhAMgAIQDYACEA6AAhAPgAIQANcUEHAAgAIQAYACEAKAAhAANyQQMAhwAlAAFyQQMAFwAmAAFyQQMA+AAmAAFdQQMAyAAmAAFdQQMACQAmAAFdQQMAKgAmAAFdQQUAOwAmAEsAJgACXUEDAOoAJgABXUEDAFkAJgABXUEDAHgAJgABckEDABgAJgABXUEDALYAJgABcUEDAGAAJgABckEDAIkAJwABckEDAGcAJwABckEDAGcAKAABckEDAPMALQABcUEDAAwALQABXUEDABAALQABckEDANAALQABcUEDAOAALgABXUEDANAALgABcUEDABMALgABcUEDAPYALgABXUEDAAIALgABcUEDABAALgABXUEDAEAALgABXUEHAAAALgAQAC4AIAAuAANyuAASELkAOAAB9EEDAMcAOAABcUEHAAcAOAAXADgAJwA4AANdQQMA5wA4AAFdQQMAZwA4AAFxMDEBQQMAyAAKAAFdQQcAtgANAMYADQDWAA0AA11BAwD2AA0AAV1BAwAGAA0AAXFBBwC2ABEAxgARANYAEQADXUEDAPYAEQABXUEDAAYAEQABcUEFAMkAEwDZABMAAl1BAwD5ABMAAV1BAwAJABMAAXFBAwC6ABMAAV1BAwBfADwAAV1BAwBfADwAAXEAQQcAtgAOAMYADgDWAA4AA11BAwD2AA4AAV1BAwAGAA4AAXFBBwC5ABAAyQAQANkAEAADXUEDAPkAEAABXUEDAAkAEAABcUEFAMkAFADZABQAAl1BAwD5ABQAAV1BAwAJABQAAXFBAwC6ABQAAV1BAwC5ABUAAV1BAwDEABwAAXFBAwDWABwAAXEhIzU0JyYjIgYdATYzMhYVFAYjIiY9ATQ3NjMyFzU0JyYjIgcGByM2NzYzMhcWFQc0JiMiBhUUFjMyNgFFJCUfKSg4DhMcJiYcHyYoJTRGKiYhKCoiJQkjBy8sOToqMa8UDg4TEw4OFKsjFRErIjIHJxsbJygbbDIgHigxJBgUEhQiLh4cGyA35Q4UFA4OExMAAgAY/zgBcQGQACkANQrluwAwAAYAFgAEK7sADAAFAB0ABCu7AAAABQABAAQrQQMAqgAEAAFxQQMAvwAEAAFxQQMAKgAEAAFyQQMAygAEAAFdQQMA2AAEAAFdQQMAnwAFAAFyQQMAUQAGAAFxQQMABAAGAAFxQQMAJAAGAAFyQQMAZAAGAAFxQQMAowAGAAFxQQMAcAAGAAFxQQMAsAAGAAFxQRcABgAMABYADAAmAAwANgAMAEYADABWAAwAZgAMAHYADACGAAwAlgAMAKYADAALXUELAFYADABmAAwAdgAMAIYADACWAAwABXFBBQC2AAwAxgAMAAJxQQkAxgAMANYADADmAAwA9gAMAARdQQUABgAMABYADAACcUEFAOYADAD2AAwAAnFBBwAGAAwAFgAMACYADAADckEDADUADAABcroACAAdAAwREjlBAwAEAAgAAXFBBQCFAAgAlQAIAAJxQQMARgAIAAFxQQMAdwAIAAFxQQMAGgAIAAFxQQMAygAIAAFdQQMAawAIAAFyQQMAuwAIAAFdQQMAOgAIAAFdQQMA+AAIAAFdQQMAZgAIAAFxQQMAxQAIAAFxQQMAtAAIAAFxQQMAowAIAAFxQQsAAAAIABAACAAgAAgAMAAIAEAACAAFckEDAGEACQABcUEDABEAFgABcUEFAJ8AFgCvABYAAl1BAwD/ABYAAXJBCwAgABYAMAAWAEAAFgBQABYAYAAWAAVxQQMAkAAWAAFyugAKABYAABESOUEDANgACgABXUEDAMkACgABXUEDAAoACgABcUEFAC8ACgA/AAoAAnFBAwBcAAoAAXFBAwA6AAoAAV1BAwBpAAoAAV1BAwBoAAoAAXFBAwBEAAoAAXG6ACoAHQAMERI5uAAqL0EDANIAKgABckEFAO8AKgD/ACoAAnFBAwB/ACoAAXFBAwDFACoAAXJBAwDhACoAAXJBCwBQACoAYAAqAHAAKgCAACoAkAAqAAVyuQAQAAb0QQMAxAAQAAFyQQMA0wASAAFdQQMAwgASAAFdQQMAyQAUAAFdQQMA2AAUAAFdQQMAyQAYAAFdQQMA2AAYAAFduAAdELgAG9C4ABsvugAfACoAEBESOUEDAGgAHwABXUEHANkAHwDpAB8A+QAfAANdQQMAOQAfAAFdQQMAKgAfAAFxQQMASgAfAAFxQQMAiwAfAAFxQQMALAAfAAFyQQMAnQAfAAFyQQMAXwAfAAFxQQMAzwAfAAFxQQMA/wAfAAFxQQUAPwAfAE8AHwACckEDAL4AHwABcUEDAAwAHwABckEDABsAHwABckEDAKsAHwABcUEDAJoAHwABcUEDAGkAHwABcUEDADkAHwABcUEDABgAHwABcUEDAMgAHwABXUEDAKUAHwABcroAIwAWAAAREjlBAwCSACMAAV1BAwBWACMAAXJBAwA4ACMAAXFBAwBZACMAAXFBAwCqACMAAXFBAwApACMAAXFBAwAYACMAAXFBAwBoACMAAXFBAwB1ACMAAXFBAwAAACMAAXFBAwDwACMAAXJBAwA1ACQAAXJBAwBkACUAAXFBAwA6ACUAAV1BAwC7ACUAAV1BAwCmACUAAXFBAwCzACUAAXFBAwByACUAAXFBAwC7ACcAAXFBAwDlACcAAXFBAwAWADAAAXJBAwB2ADAAAXFBBwAGADAAFgAwACYAMAADXUEDALgAMAABcUEFAJ8AMACvADAAAl1BAwD/ADAAAXJBBQBGADAAVgAwAAJdQQMAhgAwAAFdQQMA5gAwAAFxQQ0AEAAwACAAMAAwADAAQAAwAFAAMABgADAABnFBAwCQADAAAXJBBQAQADYAIAA2AAJxQQMAPwA3AAFdQQMATwA3AAFxQQMALwA3AAFxQQUADwA3AB8ANwACXUEDAOAANwABcQC4AAAvuAAARVi4ACYvG7kAJgAQPlm4AABFWLgAEy8buQATAAo+WbsAGQABAC0ABCtBAwCvAAIAAXFBBQC6AAIAygACAAJdQQMAfAADAAFxQQMAigADAAFxQQMAmQADAAFxuAAmELkABQAB9EEFADkABQBJAAUAAnJBIQAIAAUAGAAFACgABQA4AAUASAAFAFgABQBoAAUAeAAFAIgABQCYAAUAqAAFALgABQDIAAUA2AAFAOgABQD4AAUAEF1BIQAIAAUAGAAFACgABQA4AAUASAAFAFgABQBoAAUAeAAFAIgABQCYAAUAqAAFALgABQDIAAUA2AAFAOgABQD4AAUAEHFBBwAIAAUAGAAFACgABQADcroACAAAACYREjlBAwBnAAgAAXJBAwBJAAgAAXFBAwD5AAgAAV1BAwA2AAgAAV1BAwC0AAgAAXFBAwA7AAkAAXJBAwBJAAkAAXK6AAoAAAAmERI5QQMAZQAKAAFdQQMAxQAKAAFxQQMASAAKAAFxQQMAOQAKAAFyQQMAqgAKAAFxQQMAXQAKAAFxQQUAKwAKADsACgACcUEDACoACgABckEDALkACgABcUEDANYACgABXUEDAMUACgABXUEDAHIACgABXUEDADIACgABXUEDAFQACwABcUEDANwACwABcUEDAEMACwABckEDAMIACwABcUEFACQADAA0AAwAAnFBAwBDAAwAAXFBAwB1AA4AAXFBAwALABAAAXFBAwDaABEAAV1BAwDJABEAAV1BAwDrABIAAV1BAwD6ABIAAV1BBQDrABQA+wAUAAJdQQMACgAUAAFxQQMABgAYAAFxQQMA5gAYAAFdQQMA9QAYAAFdQQMAIAAZAAFdQQcAHwAZAC8AGQA/ABkAA3FBBQCfABkArwAZAAJyQQMAoAAZAAFdQQMA0AAZAAFxQQUAnwAtAK8ALQACckEHAB8ALQAvAC0APwAtAANxQQMAoAAtAAFdQQMA0AAtAAFxugAbAC0AGRESOUEDAHIAHQABcUEDAKAAHQABckEDAMAAHQABcboAHwAAACYREjlBAwB0AB8AAV1BAwBlAB8AAXFBBwAlAB8ANQAfAEUAHwADcUEDAMYAHwABcUEFANYAHwDmAB8AAl1BAwAZAB8AAXFBAwCqAB8AAV1BAwA7AB8AAXJBAwC5AB8AAV1BAwBHAB8AAXJBAwCmAB8AAXFBAwD1AB8AAV1BAwBlAB8AAV1BAwDFAB8AAV1BAwBjAB8AAXJBAwAwAB8AAV26ACMAAAAmERI5QQMAmAAjAAFdQQUArAAjALwAIwACXUEDADkAIwABckEDAKcAIwABcUEDALYAIwABcUEDAFoAJAABckEDAHkAJAABcUEDADYAJAABXUEDAK8AKQABcUEDADIAKQABXUEFAOAAKQDwACkAAl24ABMQuQAzAAH0QRkARwAzAFcAMwBnADMAdwAzAIcAMwCXADMApwAzALcAMwDHADMA1wAzAOcAMwD3ADMADHFBBwAHADMAFwAzACcAMwADckENAAcAMwAXADMAJwAzADcAMwBHADMAVwAzAAZdQQMAhwAzAAFdQQMAJwAzAAFxMDEBQQUAJgAIADYACAACckEDALYAEgABXUEDALgAFAABXUEDAI8AFQABXUEDAI4AFgABXUEDAI8AFwABXUEDALkAGAABXUEDAIoAGAABXUEDABgAHwABckEDADkAHwABckEDAMsAHwABcUEDADQAJAABckEDAI0AMAABXUEDAG8ANwABXQBBAwAmAAgAAXJBAwA4AAgAAXJBAwC5ABEAAV1BAwC5ABUAAV1BAwC3ABcAAV0FIxE0JiMiBgcWFwYVFBcWFRQGIyImNTQ2MzIXJjU0NyYjIgc+ATMyFhUHNCYjIgYVFBYzMjYBcSQ9MCI/DDUcNgkEJxsbJiYbCw0GKBsaDQYFVzpAUPYUDg4TEw4OFMgBzDE7Jx4FJxI3JykSGB0nJhsbJwUuGC4aDAE4SUk/zw4UFA4OExMAAgAK//gBFwGQABYAIgVYuAAjL7gACy+4ABEvuwARAAUAEAAEK7gACxC5AAAABfRBAwC1AAIAAV1BAwDEAAIAAV1BAwADAAIAAXFBAwALAAQAAXFBAwCtAAQAAXFBBQC7AAQAywAEAAJxQQMAuwAEAAFdQQMAygAEAAFdQQMAEAAjAAFxuAAjELgABtC4AAYvQQMAPgAGAAFyQQMA/wAGAAFyQQMArwAGAAFdQQcArwAGAL8ABgDPAAYAA3FBAwDvAAYAAV1BBQBvAAYAfwAGAAJdQQMAfwAGAAFyQQMA4AAGAAFxQQMAoAAGAAFyQQMAuwAIAAFdQQMADAAIAAFxQQMAvAAIAAFxQQMAywAIAAFxQQMA2gAIAAFxQQMAyQAIAAFdQQMABwAMAAFxQQMAygANAAFxQQMACQANAAFxQQMAIwANAAFyuAAO0LgADi9BBQCEAA4AlAAOAAJdQQMAdQAOAAFdQQMAZAAOAAFdQQMAogAOAAFdQQMAkQAPAAFxQQMAsgAPAAFxQQMARQAPAAFyQQMA9gAPAAFyQQMA1gAPAAFdQQMApQAPAAFdQQMAgwAPAAFxQQUAYgAPAHIADwACcUEHAMAADwDQAA8A4AAPAANxQQMAoAAPAAFxQQUAtwAQAMcAEAACXUEDAMcAEAABcUEDAOcAEQABcUEDAEkAEQABckEDAHYAEQABckEDAPUAEQABckEDAKUAEgABckEDAPkAEgABcUEDACkAEgABckEDAOoAEgABXUEDAE8AEgABckEFAAsAEgAbABIAAnJBAwAZABIAAXFBAwD5ABIAAV1BAwA2ABIAAXJBBQClABIAtQASAAJxQQUAwAASANAAEgACcbgABhC4ABPQuAATL0EDAKEAEwABXUEDAAEAFAABckEDAAUAFAABcUEDAEYAFAABckEDAKoAFAABckEDAPcAFAABXUEDAPUAFAABcUEDADQAFAABckEDACEAFAABckEDABAAFAABckEDADgAFQABcbgACxC4ABfQuAAXL7gABhC5AB0ABvS4AAAQuAAk3AC4AABFWLgAEy8buQATABA+WbgAAEVYuAADLxu5AAMACj5ZuwAJAAEAGgAEK0EFABAACQAgAAkAAl1BBQAfAAkALwAJAAJxQQUAjwAJAJ8ACQACckEDANAACQABcUEDAKAACQABXUEFAI8AGgCfABoAAnJBBQAfABoALwAaAAJxQQMA0AAaAAFxQQMAoAAaAAFdugALABoACRESOUEDABAADQABckEDAKgAEwABcbgAExC5AA4AAfRBAwC6AA8AAXFBAwA/AA8AAXJBAwDPAA8AAXFBAwDbAA8AAXFBAwCpAA8AAXFBAwDoAA8AAXFBAwBHABAAAXJBAwAwABAAAXJBBwDHABEA1wARAOcAEQADcUEDADEAEQABckEDAMwAEgABcUEDADgAEgABckEDANgAEgABcUEDAAIAFQABckEDACIAFQABckEDADMAFQABckEDACQAFQABcUEDAEUAFQABckEDAEUAFQABXUEDADcAFQABXUEDAFYAFQABXUEFAGUAFQB1ABUAAl1BAwD0ABUAAXFBAwDjABUAAV1BAwAzABUAAXFBAwACABUAAXFBAwBCABUAAXFBAwAQABUAAXJBAwAVABYAAXFBAwDzABYAAV24AAMQuQAgAAH0MDEBQQcA1gACAOYAAgD2AAIAA11BBwDZAAQA6QAEAPkABAADXUEHANkACADpAAgA+QAIAANdQQMASwAQAAFyQQMASgARAAFyAEEHANkAAQDpAAEA+QABAANdQQUA6QAFAPkABQACXUEHANYABwDmAAcA9gAHAANdJRQGIyImNTQ2MzIXNTQjIgcjNjMyFhUHNCYjIgYVFBYzMjYBFycbGycnGxENY04TJRZyOUwgFA4OFBQODhQ6GycnGxsnB6JZSGg8N+MOFBQODhQUAAMAIQAAAV4BrgAjAC8AOxTbuAAfL7sAKQAFABcABCu7AAgABgAwAAQruwAAAAUAAQAEK0EDAM8AAAABXUEDAKAAAAABXUEDAM8AAQABXUEDAKAAAQABXUEDABkABAABXUEDAAsABAABckEDALoABAABXUEDAGkABAABcUEFANkABADpAAQAAl26AAYAFwAAERI5QQMA+AAGAAFdQQMAWQAGAAFxQQMAKwAGAAFdQQMAXwAGAAFdQQMACwAGAAFyQQMASgAGAAFxQQMA6QAGAAFdQQMAFgAGAAFyQQMAQAAGAAFyQQMAggAIAAFdQQMAzwAIAAFdQQMADwAIAAFyQQMATwAIAAFxQQMAWAAIAAFdQQMAkAAIAAFxQQUAkAAIAKAACAACXUEFANcACgDnAAoAAl1BAwAEAAoAAXG4ABcQuAA23EEFAOAANgDwADYAAnFBAwCsADYAAXFBCQBfADYAbwA2AH8ANgCPADYABHJBBQCfADYArwA2AAJdQQMAfwA2AAFdQQMAXwA2AAFdQQMAbAA2AAFdQQMAEAA2AAFyQQMAMAA2AAFxQQUAMAA2AEAANgACcroADQAXADYREjlBAwAmAA0AAXFBAwDnAA0AAV1BAwAaAA0AAXFBAwC7AA0AAV1BAwCqAA0AAXFBAwD2AA0AAXFBAwA1AA0AAXFBAwAlAA0AAXJBAwAUAA8AAXJBAwBFAA8AAXFBAwBkAA8AAXFBAwBDAA8AAXJBAwDQAA8AAXFBAwA2ACkAAV1BBQB2ACkAhgApAAJxQQMAZgApAAFdQQ0ApgApALYAKQDGACkA1gApAOYAKQD2ACkABnFBBwAGACkAFgApACYAKQADckEFAAYAKQAWACkAAl1BAwAlACkAAV24ACkQuAAS0EEFADUAEgBFABIAAnJBBwDZABIA6QASAPkAEgADXUEDAAkAEgABcUEHANkAEgDpABIA+QASAANyQQMAygASAAFdQQMAewASAAFdQQMAbQASAAFdQQMAWwASAAFdQQ0AWwASAGsAEgB7ABIAiwASAJsAEgCrABIABnJBAwDKABIAAXJBAwC5ABIAAXJBCwAYABIAKAASADgAEgBIABIAWAASAAVxQQMAIwASAAFdQQUAAAASABAAEgACXbgAKRC4ABPQuAATL0EHAAAAEwAQABMAIAATAANdQQMAOAAZAAFdQQUAigAZAJoAGQACcUEDAFYAGQABcUEDAIQAGQABckEDAAcAHAABcUEDAAgAHAABckEDABoAHAABcUEFAOoAHAD6ABwAAl1BAwA7ABwAAXJBAwBMABwAAXFBAwDcABwAAV1BAwBbABwAAXFBAwBKABwAAXJBAwA5ABwAAXFBAwAoABwAAXFBAwCUABwAAXFBAwBiABwAAXG4AAEQuAAe0LgAHi9BAwCeAB4AAXFBAwAPAB4AAXJBAwA9AB4AAXJBAwAbAB4AAXJBBQBQAB8AYAAfAAJxQQMAsQAfAAFxQQMAwwAfAAFxQQMAhwAfAAFxQQMAmQAfAAFxQQMAGgAfAAFdQQMADwAfAAFyQQMAzwAfAAFdQQMAPQAfAAFyQQMAKQAfAAFdQQMAOAAfAAFdQQMAJQAfAAFyQQMAQQAfAAFyQQMAoAAfAAFdQQMAMAAfAAFxQQMAAAAfAAFxQQMAkwAhAAFxQQMAtQAhAAFxQQMANwAhAAFxQQMAFwAhAAFyQQMAdwAhAAFxQQMA+AAhAAFdQQMAOAAhAAFyQQMAWQAhAAFxQQMASgAhAAFxQQMAOgAhAAFdQQMAKwAhAAFdQQMA3AAhAAFdQQMAywAhAAFdQQMAGgAhAAFdQQMAKQAhAAFxQQMAaAAhAAFxQQMACAAhAAFyQQMAGAAhAAFxQQMABwAhAAFxQQMA5wAhAAFxQQMApgAhAAFxQQMAlAAhAAFdQQMAggAhAAFxQQMAwQAhAAFxQQMAggAwAAFdQQ8ACQAwABkAMAApADAAOQAwAEkAMABZADAAaQAwAAddQQMADgAwAAFyQQMATwAwAAFxQQMAzwAwAAFdQQMA+QAwAAFxQQMAeQAwAAFxQQUAkAAwAKAAMAACXUEDAJAAMAABcboAJAAwAAgREjlBAwBHACQAAXFBAwBJACQAAV1BAwD5ACQAAV1BAwAqACQAAXJBAwDKACQAAXFBAwDqACQAAV1BBQAqACQAOgAkAAJdQQMAmwAkAAFdQQMATAAkAAFyQQMADgAkAAFyQQMA3gAkAAFxQQMAPwAkAAFyQQMAHwAkAAFyQQMArgAkAAFdQQMA/QAkAAFxQQMAewAkAAFxQQUAuwAkAMsAJAACXUEDAIoAJAABXUEDAIoAJAABcUEDAOoAJAABcUEFAJkAJACpACQAAnFBAwDZACQAAV1BAwC4ACQAAXFBAwAWACQAAXFBAwBkACQAAXFBAwBkACcAAXFBAwAFACcAAXJBAwC2ACcAAV1BAwBGACcAAXJBAwCFACcAAV1BBQBFACcAVQAnAAJxQQMAhAAnAAFyQQMAogAnAAFdugAtACkAEhESOUEDAJYALQABckEDANcALQABckEDALkALQABcUEDAMoALQABcUEDAOoALQABcUEDAKoALQABcUEDAHcALQABXUEDAKcALQABXUEDADYALQABckEDACYALQABcUEDACUALgABcUEDAKgALgABcUEDAAkALgABckEFALoALgDKAC4AAnFBAwBNAC4AAXJBAwBfAC4AAV1BAwA8AC4AAXJBAwAqAC4AAXJBAwCIAC4AAXFBAwCmAC4AAXJBAwA0AC4AAXFBAwCTAC4AAXJBAwAVAC8AAXJBAwBlAC8AAXJBAwAGAC8AAXFBAwCZAC8AAV1BAwDtAC8AAXFBAwBfAC8AAV1BAwArAC8AAV1BAwCYAC8AAXFBAwAmAC8AAXFBAwClAC8AAV1BAwA0AC8AAXFBAwCjAC8AAXJBAwCgADwAAV1BAwBPAD0AAXFBAwB/AD0AAV1BBQAfAD0ALwA9AAJdQQMAzwA9AAFdQQMAwAA9AAFxQQMAAAA9AAFxALgAHi+4AABFWLgAGi8buQAaABA+WbgAAEVYuAAALxu5AAAACj5ZuAAARVi4ABIvG7kAEgAKPlm7ADkAAgALAAQrQQMAawACAAFxQQMATwACAAFyQQMAPQACAAFyQQMAQwACAAFdQQMAEAACAAFdQQMAswAEAAFdQQMAhAAEAAFdQQMAdQAEAAFdQQUA1wAEAOcABAACcUEDAFgABAABcUEDAMkABAABcUEDAGoABAABcUEDAEwABAABckEDAEsABAABcUEDAPoABAABcUEDAMgABAABXUEFAAcABAAXAAQAAnJBAwD3AAQAAV1BAwDVAAQAAV1BAwDjAAQAAV1BAwAQAAQAAV1BAwBgAAQAAV24ABoQuAAz3EEDAPAAMwABXUEDADIAMwABXUEDAFcAMwABXUEDAGgAMwABXUEDAA8AMwABckEDAIgAMwABXUEFAAgAMwAYADMAAl1BAwBEADMAAV1BAwCwADMAAXJBCQCQADMAoAAzALAAMwDAADMABF1BAwAgADMAAV26AAYAGgAzERI5QQMAggAGAAFdQQMAtAAGAAFdQQMA1AAGAAFxQQMAVwAGAAFxQQMAFwAGAAFyQQMA5wAGAAFdQQMABQAGAAFyQQMA9AAGAAFdQQMAMwAGAAFdQQMAYgAGAAFdQQMAEQAGAAFdQQMACwAJAAFxQQMA2wAJAAFdQQMA6QAJAAFdQQMA+AAJAAFdQQMAwAALAAFdQQMA4AALAAFxQQMAQAALAAFyQQUAEgALACIACwACXUEDAK8ACwABXUEDAPEACwABcUEDABAACwABckEFAFAACwBgAAsAAnFBAwBwAAsAAV1BAwDAAAsAAXJBAwAgADkAAV1BBQBQADkAYAA5AAJxQQMAEAA5AAFyQQMArwA5AAFdQQMAtgA5AAFyQQUA4AA5APAAOQACcUEDAMAAOQABXUEDAMAAOQABckEDAEAAOQABcroADQALADkREjlBAwBwAA0AAV1BAwBSAA0AAV1BAwAjAA0AAV1BAwCUAA0AAV1BAwDVAA0AAV1BAwD3AA0AAXFBAwDIAA0AAV1BAwA4AA0AAXFBAwAqAA0AAXFBAwAsAA0AAXJBAwA+AA0AAXJBAwBKAA0AAXJBAwAZAA0AAXJBAwDoAA0AAV1BAwCoAA0AAXFBAwAGAA0AAXFBAwClAA0AAV1BAwDDAA0AAXJBAwBiAA0AAXJBAwCwAA0AAV1BAwAQAA0AAV1BAwAQAA0AAXFBAwDYAA8AAXFBAwBaAA8AAXFBAwCLAA8AAXFBAwB+AA8AAXFBAwCuAA8AAXFBAwANAA8AAXJBAwBLAA8AAXJBAwCZAA8AAXFBAwAYAA8AAXJBAwBIAA8AAXFBAwBPABAAAXJBAwCLABQAAXFBAwCPABUAAXFBAwDrABUAAV1BAwB2ABUAAV1BAwAUABYAAXFBAwB5ABYAAXFBAwAJABYAAXFBAwCyABYAAXJBAwBxABYAAV1BAwDlABgAAV1BAwDGABgAAV1BAwCJABgAAXJBAwDcABgAAXJBAwDJABgAAXJBAwB1ABgAAXFBAwCEABgAAXFBAwCSABgAAXFBAwBkABwAAXFBAwCFABwAAXFBAwB2ABwAAXFBAwAmABwAAXFBAwBXABwAAXFBAwD3ABwAAV1BAwAXABwAAXFBAwDXABwAAV1BAwBGABwAAXFBAwAGABwAAXFBAwA1ABwAAXFBAwDlABwAAV1BAwADABwAAXJBAwCSABwAAXFBAwBlAB0AAXFBAwBuAB4AAV1BAwBPAB4AAXFBAwCvAB4AAV1BAwD/AB4AAV1BAwBvAB4AAXFBBQDPAB4A3wAeAAJdQQMAPwAeAAFdQQMAHgAeAAFxQQMAjAAeAAFdQQMAHAAeAAFdQQMAPgAfAAFdQQMArgAfAAFdQQMA/QAfAAFdQQMAawAfAAFdQQMAMgAhAAFxQQMA0wAhAAFdQQMAgwAhAAFxQQMAEwAhAAFyQQMABAAhAAFxQQMAdQAhAAFdQQMANQAhAAFyQQMAVQAhAAFyQQMApwAhAAFxQQMA9wAhAAFdQQMARwAhAAFxQQMAaQAhAAFxQQMAdwAhAAFxQQMAJwAhAAFxQQUAtwAhAMcAIQACXUEDABYAIQABcUEDAFUAIQABcUEDACUAIQABXUEDAAQAIQABckEDAJQAIQABXUEDALMAIQABcUEDAGMAIQABckEDAOIAIQABcUEDAOIAIQABXUEDAJEAIQABcUEDAIUAIwABXUEDAEoAIwABckEDAGwAIwABcUEDAPoAIwABXUEDADMAIwABckEDAHMAIwABcboAJAAaADMREjlBBQBjACQAcwAkAAJdQQMA1AAkAAFdQQMAtQAkAAFdQQMA1gAkAAFxQQMABwAkAAFyQQMAKAAkAAFyQQMASwAkAAFyQQMAyAAkAAFdQQMA5gAkAAFdQQMAlgAkAAFdQQMAlQAkAAFxQQMANAAkAAFyQQMAggAkAAFdQQMAMgAkAAFduAAaELkAJgAB9EEDALgAJgABXUEDAFgAJgABcUEDADkAJgABckEPAHgAJgCIACYAmAAmAKgAJgC4ACYAyAAmANgAJgAHcUEJAAgAJgAYACYAKAAmADgAJgAEcUEDAPgAJgABcUEHAAgAJgAYACYAKAAmAANyQRUACAAmABgAJgAoACYAOAAmAEgAJgBYACYAaAAmAHgAJgCIACYAmAAmAApdQQMAqQAoAAFdQQMASgAoAAFyQQMAhgAoAAFxQQMAdQAoAAFxQQMAhwApAAFdugAtAAAAHhESOUEDAMQALQABcUEDAHUALQABXUEDAOUALQABcUEDAJYALQABcUEDALcALQABcUEFAHoALQCKAC0AAnFBAwBaAC0AAV1BAwBLAC0AAXJBBQAtAC0APQAtAAJxQQMA3QAtAAFyQQMA7QAtAAFdQQMACwAtAAFxQQMAOgAtAAFdQQMAmQAtAAFyQQMANgAtAAFyQQMApgAtAAFdQQMAtQAtAAFdQQMAFAAtAAFxQQMA0wAtAAFxQQMAIwAtAAFdQQMAoAAuAAFxQQMAsQAuAAFxQQMAJQAuAAFyQQMAWwAuAAFyQQMAkgAuAAFxQQUAwAAuANAALgACcUEHAGAALgBwAC4AgAAuAANxQQUAAAAuABAALgACckEDANAALwABcUEDABMALwABXUEDAKQALwABcUEDAFUALwABcUEDAMYALwABXUEDADcALwABckEDAEcALwABcUEDALgALwABXUEDAAkALwABcUEDADoALwABcUEDANsALwABckEDAJ8ALwABckEDAB8ALwABcUEDACwALwABcUEDAKoALwABXUEDAAkALwABckEDANkALwABXUEDAHcALwABcUEDAJcALwABXUEFAIYALwCWAC8AAnFBAwAlAC8AAXJBAwD1AC8AAV1BAwDEAC8AAXFBAwBBAC8AAV1BAwBQAC8AAV1BAwAgAC8AAV0wMQFBAwDZAAQAAXFBAwBaAAQAAV1BAwDGAAoAAV1BAwAaABwAAXFBAwD8ABwAAXFBAwAZAB4AAXJBBQDuAB4A/gAeAAJxQQMAhAAfAAFxQQMAJAAfAAFyQQMA1QAfAAFxQQMA6QAfAAFxQQMAGQAfAAFyQQMAhQAgAAFxQQMAIwAhAAFyQQMA1AAhAAFxQQMAlgAhAAFxQQMAGQAhAAFxQQMACQAkAAFyQQUAWgAkAGoAJAACXUEDABoAJAABckEDADoAJAABckEDAN8AJAABcUEDACYAJwABXUEDACYAKAABXUEDACcAKQABXUEDAFoALgABXUEDAAoALgABckEDAF8ALwABXUEDAE8APQABXQBBAwAVAAQAAXFBAwDZAAQAAXFBAwAWAAUAAXFBAwDDAAcAAV1BAwDJAAkAAV1BAwDsAA8AAXFBAwD2ABwAAXFBAwAYABwAAXFBAwDxAB0AAXFBAwDjAB0AAXFBAwAYACEAAXFBAwCJACEAAXFBAwBlACQAAV1BAwC3ACQAAXFBAwDZACQAAXFBAwAaACQAAXJBAwA7ACQAAXJBAwDTAC4AAXFBAwADAC4AAXJBAwA1AC4AAXJBAwBQAC8AAV1BAwAlAC8AAV0hIxE0JwYHFhUUBiMiJwYHBh0BIzU0JjU0NjMyFzY3MwYHFhUnJiMiBhUUFxYXNjcXNCYjIgYVFBYzMjYBUSQjBywjIhgeEQ4OECQgWEIqJSQCLgQyKWQYHC5FCAsBEzFAEg0NEhINDRIBDSwbBiEOKhgiFxUnMCVBXB1qHEFQESAPGCohO1YKPy4WHywGZiYzDRISDQ0SEgAAAAADABH/+AG7AZAALwA7AEcJkbsAQgAGAA0ABCu7ABQABQAHAAQruwA2AAYAHgAEK7sAAwAFABgABCu7ACQABgAwAAQrQQMApwAAAAFxQQMASQAAAAFyQQMAFwAAAAFyQQUAJgAAADYAAAACckEDAAEAAAABckEFADMABABDAAQAAnFBAwA6AAQAAXJBAwBkAAQAAXFBAwBzAAQAAXFBAwBQAAQAAXFBAwB8AAYAAXFBBQBdAAYAbQAGAAJxQQUAOwAGAEsABgACcUEDADYABgABckEDAHAABwABXUEDABgACgABXUEDAMkACwABXUEFAO8ADQD/AA0AAl1BAwAPAA0AAXFBAwCvAA0AAV1BAwCNAA0AAV1BAwCcAA0AAV1BAwDKAA8AAV1BAwDtABAAAV1BAwDGABEAAV1BAwB1ABMAAV1BAwBwABQAAV1BAwAdABwAAXJBAwDKABwAAV1BAwBhABwAAXJBAwBfAB4AAV1BAwAPAB4AAXFBAwBuAB4AAV1BAwDEAB4AAV1BAwBbACAAAXFBAwAqACAAAXFBAwAlACIAAXG4AB4QuAAk3EEDAFQAJAABXUEDAMkAJAABXUEDAHwAJAABcUEDAG0AJAABcUEDAG4AJAABckEDAL8AJAABXUEDAF8AJAABckEDAN8AJAABXUEHAH8AJACPACQAnwAkAANyQQMATgAkAAFxQQMAXAAkAAFxQQMAPAAkAAFxQQMABgAkAAFxQQMAYwAkAAFdQQMAcgAkAAFdugAmAB4AJBESOUEDAIsAJgABXUEDAH0AJgABcUEDADsAJgABcUEDAFsAJgABcUEDAHwAJwABcbgAGBC4ACrQuAADELgALNBBAwAoAC8AAXJBAwA6AC8AAXJBAwANAC8AAXFBAwBLAC8AAXJBAwCZAC8AAXFBAwCIAC8AAXFBAwCoAC8AAXFBAwCUADAAAXJBBQBVADAAZQAwAAJdQQMAhwAwAAFyQQMASQAwAAFyQQMAPQAwAAFxQQMADwAwAAFxQQMAfwAwAAFxQQUAHwAwAC8AMAACckEDAG4AMAABcUEDADwAMAABckEDAEgAMAABcUEDAFUAMAABckEDAHQAMAABckEDAHMAMAABXUEDAKAAMAABXUEDAJcAMwABcUEDAFwANgABXUEDAA8ANgABcUEDAGsANgABXUEDAMAANgABXbgABxC4ADzQuAA8L0EDAF8APAABXUEFAO8AQgD/AEIAAl1BAwAPAEIAAXFBAwBfAEIAAV1BBwCPAEIAnwBCAK8AQgADXUEDABAASAABcbgAAxC4AEncQQMA/wBJAAFdQQUADwBJAB8ASQACcUEHAB8ASQAvAEkAPwBJAANyALgAAEVYuAAQLxu5ABAAED5ZuAAARVi4ACsvG7kAKwAQPlm4AABFWLgABS8buQAFAAo+WbsARQABAAoABCu7ADkAAQAbAAQrQQUAKAAAADgAAAACckEDAAoAAAABcUEDABoAAAABckEDAKgAAAABcUEDAAgAAAABckEDAEUAAAABckEDAKUAAgABcUEDAJwAAwABcUEDAK0AAwABcUEDAD8AAwABcUEDAI4AAwABcUEDAGwAAwABcUEFAEsAAwBbAAMAAnFBAwB7AAMAAXFBBQCcAAcArAAHAAJxQQMAjgAHAAFxQQUAbAAHAHwABwACcUEDAEsABwABcUEDADoABwABcUEDABwACgABXUEDAE4ACgABckEDAK8ACgABXUEDAP8ACgABXUEFAM8ACgDfAAoAAnFBAwCvAAoAAXFBAwDPAAoAAV1BAwCPAAoAAV1BAwANAAoAAV1BAwBcAAoAAV1BAwDgAAoAAXFBAwDeAEUAAXFBAwDPAEUAAV1BAwDPAEUAAXFBAwCPAEUAAV1BAwD/AEUAAV1BAwCvAEUAAXFBAwCvAEUAAV1BAwBPAEUAAXJBAwAMAEUAAV1BAwDgAEUAAXG6AAgACgBFERI5QQMAiQAIAAFdQQMAJAAIAAFdQQMAxgATAAFdQQMAFwAUAAFxQQMAJgAUAAFxQQMANAAUAAFyQQMARAAVAAFyuAAFELkAFgAB9EEDADYAFwABckEDABUAFwABckEDAEMAFwABckEDADUAGAABckEDAB0AGwABXUEDAAwAGwABXUEDACgAHAABckEDAGQAIAABcUEDAHEAIAABcbgARRC4ACHQuAAhL0EFAMAAIQDQACEAAnFBAwCgACEAAV1BAwAhACEAAV1BAwBBACEAAXJBAwBjACEAAV1BAwA9ACEAAXFBAwAfACEAAXJBAwB1ACEAAXJBAwCSACEAAV1BAwBxACEAAV1BAwDwACEAAV1BAwAAACEAAXFBAwCAACEAAV1BBQCQACEAoAAhAAJxQQMAcAAhAAFxQQMAVwAkAAFyQQMAWwA5AAFyQQMArwA5AAFxQQMAzwA5AAFdQQMArwA5AAFdQQMAmAA5AAFdQQUAMAA5AEAAOQACcroAJgAbADkREjlBAwAfACYAAV1BAwB4ACcAAXG4ABsQuQAoAAL0QQMADAAoAAFdQQMAGQAoAAFdugAtABsAORESOUEDAB8ALQABcUEDABUALQABckEDADYALwABckEFAAoALwAaAC8AAl1BAwAaAC8AAXFBAwCGAC8AAXFBAwBCAC8AAXK4AAoQuAAz0EEDAJAAMwABcUEDAPAAMwABXUEDAAAAMwABcUEDAHEAMwABcUEDAKQAMwABcUEDAB8AMwABckEDAD0AMwABcUEDAJMAMwABXUEDAEEAMwABckEDAKAAMwABXUEFAMAAMwDQADMAAnFBAwCAADMAAV24ABAQuQA/AAH0MDEBQQMAuQALAAFdQQcA2QALAOkACwD5AAsAA11BAwAJAAsAAXFBAwC5AA8AAV1BBwDZAA8A6QAPAPkADwADXUEDAAkADwABcUEDALYAEQABXUEHANYAEQDmABEA9gARAANdQQMABgARAAFxQQcA2QAgAOkAIAD5ACAAA11BAwC6ACAAAV1BAwAKACAAAXFBAwAbACAAAXFBAwC2ACIAAV1BBwDWACIA5gAiAPYAIgADXUEDABYAIgABcUEDANwAJgABXQBBAwC5AAwAAV1BBwDZAAwA6QAMAPkADAADXUEDAAkADAABcUEDALYAEgABXUEFANYAEgDmABIAAl1BAwDVAB8AAV1BAwC2AB8AAV1BBQDmAB8A9gAfAAJdQQMABgAfAAFxQQMAtgAjAAFdQQcA1gAjAOYAIwD2ACMAA11BAwDbACYAAV1BAwANAC0AAXFBAwAJAC4AAXElBgcVFCMiPQEGIyImNTQ2MzIWHQEUMzI9AQYjIiY1NDYzMhYVFAcWMzI3NTMVNjcHNCYjIgYVFBYzMjYnNCYjIgYVFBYzMjYBuw4vhocNERsnJxsbJ2JjHhMuRCAWFyAjDBwbFiQYD5wRCwsQEAsLEZQUDg4UFA4OFO8bJVpdXb4HJxsbJycb9j8/SQcyJBcfHxcjEAcKyLQSHBILERELCxAQaQ4UFA4OFBQAAAADABX/+AFWAasAMQA4AEQUkbsAPwAFABUABCu7AA8ABgA5AAQruwAAAAUAAQAEK0EDAK8AAAABXUEDAK8AAQABXUEDALsABAABcUEDACoABAABckEDANIABwABcUEDADQABwABckEDAOUABwABcUEDACgABwABcUEDALoABwABXUEDAMUABwABcUEDALQABwABcUEDABMABwABckEDAEIABwABckEDACAABwABcrgAPxC4AAnQuAAJL7oACgAVAAAREjlBBwAUAAoAJAAKADQACgADckEJALYACgDGAAoA1gAKAOYACgAEcUEDABgACgABcUEDAFoACgABXUEFADsACgBLAAoAAl1BAwCaAAoAAV1BAwCoAAoAAV1BAwAFAAoAAXJBAwD0AAoAAXFBAwBDAAoAAXJBAwDGAA0AAV1BAwDEAA0AAXFBAwAAAA8AAV1BAwBgAA8AAV1BAwAAAA8AAXFBAwARAA8AAV1BBQBSAA8AYgAPAAJyQQMAggAPAAFyQQMAUgAPAAFdQQUAwQAPANEADwACcUEHACAADwAwAA8AQAAPAANyQQUAkAAPAKAADwACXUEHACAADwAwAA8AQAAPAANdQQUAsAAPAMAADwACckEDAHAADwABckEDAMYAEQABXUEDAMsAEwABXUEDABgAEwABcUEDALsAGAABXUEDACkAGQABckEDADoAGQABckEDAGwAGQABcUEDAAwAGQABckEFACsAGQA7ABkAAnFBAwC5ABkAAV1BAwD1ABkAAXFBAwBAABkAAXJBAwBWABoAAV1BAwAjABoAAXJBAwAQABoAAXJBAwBVABsAAV1BAwBnABsAAXFBAwCkABsAAXFBAwBEABsAAXJBAwA1AB0AAXJBAwBXAB0AAV1BAwBoAB0AAV1BAwCoAB0AAXFBAwDJAB0AAXFBBQBZAB0AaQAdAAJxQQMAmgAdAAFxQQMAugAdAAFxQQMAKQAdAAFxQQMAGQAdAAFyQQMAOAAdAAFdQQMA1wAdAAFxQQMA5gAdAAFxQQMAZQAdAAFyQQMAFAAdAAFxQQMAvQAeAAFxQQMAqwAeAAFxQQUAEAAgACAAIAACckEDAEAAIAABckEDAOAAIQABcUEDADEAIQABckEFAKMAIQCzACEAAnFBAwD1ACEAAXFBAwAFACEAAXJBAwAlACEAAXJBAwCVACEAAXFBAwAkACEAAXFBAwDCACEAAXFBAwDRACEAAXFBAwAQACEAAXJBAwBAACEAAXJBAwAUACIAAXJBBQAWACMAJgAjAAJyQQMAlgAjAAFxQQMAZwAjAAFxQQMA+QAjAAFdQQMAigAjAAFyQQMAqQAjAAFyQQMAmAAjAAFyQQMAtwAjAAFxQQMAxgAjAAFxQQMARQAjAAFyQQMABAAjAAFyQQMAWAAkAAFxQQMAqAAkAAFdQQMAOQAkAAFyQQMAyQAkAAFdQQcA2QAkAOkAJAD5ACQAA3FBAwAJACQAAXJBBQCZACQAqQAkAAJxQQMAKAAkAAFyQQMACAAkAAFdQQMARwAkAAFyQQMAhQAkAAFyQQMAZgAmAAFdQQMAaQAmAAFxQQMAKQAmAAFyQQMApwAmAAFdQQMABAAmAAFyQQMAVAAmAAFyQQMAkwAnAAFxQQMAxAAnAAFxQQUANgAnAEYAJwACckEDAHoAJwABcUEFAKUAJwC1ACcAAnFBAwDjACcAAXFBAwDyACcAAXFBAwACACcAAXJBAwDSACcAAXFBAwDaACkAAXFBAwDrACkAAXFBAwCpACkAAXFBAwBAACkAAXJBAwDmACoAAXFBAwC6ACoAAXFBAwBIACoAAXJBAwB0ACoAAV1BAwAQACoAAXJBAwDpACsAAXFBAwBWACwAAV1BAwAZACwAAXJBAwCJACwAAXFBAwAKACwAAXJBAwD8ACwAAXFBAwC9ACwAAXFBAwCbACwAAXFBBQDKACwA2gAsAAJxQQUAOQAsAEkALAACckEDAOcALAABcUEDAMUALAABXUEDAEEALAABcUEDAGUALQABcUEDAOcALQABcUEDAKkALQABcUEDAFkALQABXUEDAJwALQABcUEDAL0ALQABcUEDAKoALQABXUEDAPkALQABcUEDANgALQABcUEDABUALQABckEDAEQALQABckEDAEMALQABcUEDAAkALgABckEDAJsALgABcUEDAOcALgABcUEDADYALgABckEDAHQALwABXUEDANUALwABcUEDADYALwABcUEDAFYALwABXUEDADcALwABckEDAGcALwABXUEDAPcALwABXUEDAKsALwABXUEDACcALwABcUEDALcALwABXUEDACcALwABXUEFALcALwDHAC8AAnFBAwCWAC8AAV1BAwA1AC8AAV1BAwD1AC8AAXFBAwAQAC8AAXJBAwBAAC8AAXK4AAEQuAAy0LoANQAVAAAREjlBAwATADUAAXJBAwA0ADUAAXJBAwC1ADUAAXFBAwAGADUAAXJBAwClADUAAV1BAwBVADUAAV1BAwAUADUAAXFBAwBDADUAAXJBAwAhADUAAXJBAwA0ADYAAXJBAwBDADYAAXJBAwAgADYAAXK6ADcAFQAAERI5QQUAxAA3ANQANwACcUEDADUANwABcUEDAEUANwABckEDALUANwABcUEDAGUANwABcUEDAJcANwABcUEDAAkANwABckEDAKYANwABXUEDAIUANwABXUEDAOUANwABcUEDABUANwABcUEDACQANwABXUEDADQANwABckEFABAANwAgADcAAnJBBwAgADkAMAA5AEAAOQADckEFAJAAOQCgADkAAl1BAwAAADkAAXFBAwCBADkAAXJBAwBkADkAAXJBAwAUADkAAV1BAwBSADkAAXJBAwDRADkAAXFBAwBgADkAAV1BAwDAADkAAXFBBQCwADkAwAA5AAJyQQMAcAA5AAFyQQMAEABFAAFxQQMAAABGAAFyQQMArwBGAAFdQQMAjwBGAAFdQQMALwBGAAFxQQcADwBGAB8ARgAvAEYAA11BBQAAAEYAEABGAAJxQQMA4ABGAAFxALgALC+4AABFWLgAKC8buQAoABA+WbgAAEVYuAAALxu5AAAACj5ZuAAARVi4ABIvG7kAEgAKPlm7AAwAAQA8AAQrQQMAAQACAAFyQQMAUwACAAFdQQMAGgACAAFyQQMA5QACAAFxQQMAIwACAAFxQQMAIAACAAFdQQMAkAACAAFxQQMASwAEAAFyQQMAtwAEAAFxuAAoELgABtxBAwByAAYAAXFBBQCEAAYAlAAGAAJdQQMAVQAGAAFdQQMAZgAGAAFdQQMAPwAGAAFyQQMA/wAGAAFxQQMADwAGAAFyQQMAnwAGAAFxQQMAGwAGAAFdQQMAJgAGAAFxQQMAlAAGAAFyQQMAEgAGAAFxQQMAwAAGAAFdQQMAoAAGAAFdQQMATAAHAAFyQQMA/QAHAAFxQQMAJgAHAAFxQQMAtQAHAAFdQQMA/QAJAAFxQQMAHgAJAAFyQQMATwAJAAFyQQMALQAJAAFyQQMA6QAJAAFdQQMAlQAJAAFdQQUAnwA8AK8APAACckEFAB8APAAvADwAAnFBAwCgADwAAV1BAwDQADwAAXFBAwAxAAwAAV1BBQAfAAwALwAMAAJxQQUAnwAMAK8ADAACckEDAKEADAABXUEFAEAADABQAAwAAl1BAwDQAAwAAXG6AAoAPAAMERI5QQMA/AAVAAFdQQMAOQAVAAFxQQMAIQAWAAFdQQMAAwAWAAFyQQMAVAAWAAFdQQMAhQAWAAFdQQMATQAWAAFyQQMAJQAWAAFxQQMAVQAWAAFxQQMA8wAWAAFdQQMAoQAWAAFxQQMAMQAWAAFxQQUAkAAWAKAAFgACXUEDAEoAGAABckEDAKkAGAABckEDAKgAGQABXUEDALUAGQABcUEDABAAGQABckEDAEYAGgABckEDACcAGgABckEDAEcAGgABcUEDAOYAGgABcUEDACUAGgABXUEDAEsAGwABckEDAPwAGwABXUEDAIQAGwABXUEDAHMAGwABcUEDAOkAHQABcUEDADsAHQABckEDAE0AHQABcUEDAMsAHQABcUEDACoAHQABckEDALkAHQABcUEDAAkAHQABckEDAKcAHgABcbgAKBC5AB8AAfRBAwD5AB8AAV1BAwBKACEAAXJBAwAJACEAAXJBAwAKACMAAV1BAwClACMAAV1BAwBJACQAAV1BAwBaACQAAV1BAwArACQAAV1BAwA9ACQAAV1BAwANACQAAV1BAwAaACQAAV1BAwDJACQAAV1BAwD5ACQAAV1BAwBYACQAAXFBAwDnACoAAXFBAwD4ACoAAV1BAwC3ACoAAXFBAwBGACoAAXJBAwAVACoAAXJBAwA7ACwAAV1BAwCMACwAAV1BAwBNACwAAXFBAwAfACwAAXFBAwDPACwAAV1BAwAdACwAAV1BAwCrACwAAV1BAwBrACwAAV1BAwCpACwAAXFBAwCKAC0AAV1BAwAaAC4AAXJBAwA4AC4AAXJBAwAlAC8AAV1BAwB2AC8AAV1BAwBpAC8AAV1BAwDZAC8AAXFBAwA6AC8AAV1BAwDLAC8AAXFBAwC8AC8AAV1BAwCqAC8AAV1BAwCpAC8AAXFBAwA5AC8AAXJBAwA2AC8AAXFBAwCVAC8AAXFBAwBVAC8AAV1BAwC1AC8AAXFBAwClADEAAXFBAwBBADEAAXK6ADIAEgAsERI5QQcAAAAyABAAMgAgADIAA3JBAwByADIAAXFBAwAiADIAAXFBBQAzADIAQwAyAAJyQQMAEwAyAAFxQQMANAAyAAFxQQMAZQAyAAFxQQMAVQAyAAFdQQMAhAAyAAFdQQMAwwAyAAFdQQMAowAyAAFxQQMAIgAyAAFdQQMAogAyAAFdQQUAwQAyANEAMgACcUEDAOAAMgABcUEDAJAAMgABcboANQAoAAYREjlBAwA5ADUAAXFBAwDLADUAAV1BAwD7ADUAAXFBBwDNADUA3QA1AO0ANQADcUEFAB8ANQAvADUAAnJBAwA+ADUAAXJBAwANADUAAXJBAwBLADUAAXJBAwD5ADUAAV1BAwBpADUAAXFBAwAYADUAAXFBAwAoADYAAXK6ADcAKAAGERI5QQMAKgA3AAFyQQMAOwA3AAFyQQMAagA3AAFxQQMAlwA3AAFxQQMAlgA4AAFxuAASELkAQgAB9DAxAUEDANkACgABXUEDALYADQABXUEHANYADQDmAA0A9gANAANdQQMABgANAAFxQQMAtgARAAFdQQcA1gARAOYAEQD2ABEAA11BAwAGABEAAXFBAwC5ABMAAV1BBQDZABMA6QATAAJdQQMACQATAAFxQQMAggAYAAFyQQMAyQAYAAFdQQMA6wAZAAFdQQMAAAAaAAFyQQMAAAAbAAFyQQMAdAAbAAFxQQMAhwAbAAFyQQMAAAAcAAFyQQMAggAcAAFyQQMAAAAdAAFyQQMAEgAdAAFyQQMAhAAdAAFdQQMAhwAdAAFyQQMASAAdAAFxQQMAKAAdAAFyQQMAigAdAAFxQQMA/AAeAAFxQQMALgAeAAFyQQMA8AAgAAFxQQMAFwAgAAFyQQUAcwAhAIMAIQACcUEDAPMAIQABcUEDADUAIQABcUEDAAUAIQABckEDABcAIQABckEDAPQAIgABcUEDABQAIwABckEDAIUAIwABcUEDAHYAIwABcUEDAPYAIwABcUEDADYAIwABckEFANkAIwDpACMAAl1BBQDZACQA6QAkAAJdQQMAEAAnAAFyQQMAhQAnAAFxQQMAdwAnAAFxQQMAQgAqAAFyQQMAFQAqAAFdQQMAegAqAAFxQQMAFgArAAFdQQUAKQArADkAKwACckEDAHsAKwABcUEDABUALAABXUEDANYALAABXUEDAIsALAABcUEDAHwALAABcUEDACwALAABckEDANYALQABXUEDABcALQABXUEDAFcALQABcUEFAHwALQCMAC0AAnFBAwB6AC4AAXFBAwA6AC4AAXJBAwASAC8AAXJBAwCEAC8AAV1BAwAEAC8AAXFBAwBEAC8AAXJBAwAVAC8AAV1BAwDlAC8AAV1BAwBFAC8AAXFBBQAlAC8ANQAvAAJyQQMApgAvAAFdQQMA1gAvAAFdQQMAFgAvAAFxQQMAxwAvAAFdQQMA8wA1AAFxQQMAFQA1AAFdQQMABQA1AAFyQQMAJwA1AAFyQQMAAAA2AAFyQQMA8wA2AAFxQQMA8AA3AAFxQQMAAAA3AAFyQQMARQA3AAFxQQMAJgA3AAFyQQMAXwBGAAFdQQMAXwBGAAFxAEEDAJYAAgABcUEHANYADgDmAA4A9gAOAANdQQMABgAOAAFxQQMAtwAOAAFdQQMAuQAQAAFdQQcA2QAQAOkAEAD5ABAAA11BAwAJABAAAXFBAwC5ABQAAV1BBQDZABQA6QAUAAJdQQMAQAAWAAFxQQMA4QAWAAFdQQMANgAYAAFyQQMAiwAZAAFyQQMAiQAaAAFyQQMACgAbAAFyQQMAigAbAAFyQQMAiAAcAAFyQQMADAAcAAFyQQMACAAdAAFyQQMAiQAdAAFxQQMAiQAdAAFyQQMA+gAdAAFxQQMAKwAdAAFyQQMAHwAdAAFyQQMAGAAhAAFyQQMA2QAjAAFdQQMA6gAjAAFdQQMA2QAkAAFdQQMA6gAkAAFdQQMARQAqAAFyQQMA3AAsAAFdQQMA2wAtAAFdQQMA4wAvAAFdQQMAMwAvAAFyQQMAFAAvAAFxQQMARAAvAAFxQQMAFQAvAAFdQQMABQAvAAFxQQMAFgAvAAFyQQMAyAAvAAFdQQMAiQAvAAFdQQMAKQAvAAFyQQMASgAvAAFyQQMA4gAxAAFdQQMAEgAxAAFyQQMAEwAxAAFdQQMA4wAyAAFdQQMAQwAyAAFxQQMAlAAyAAFxQQUA5AAyAPQAMgACcUEDAAYAMgABckEDANkANQABXUEDAEkANQABcUEDACoANQABckEDAAsANQABckEDAP0ANQABcUEDAPgANgABcUEDACcANwABciEjNTQnJiMiBh0BNjMyFhUUBiMiJj0BNDc2OwE2NyYjIgcGByM2NzYzMhc2NzMGBxYVBzU0JwYHFgc0JiMiBhUUFjMyNgFFJCUfKSg4DhMcJiYcHyYoJTQGLR8lLCoiJQkjBy8sOTkuFQYkBx8VJAkcICpwFA4OExMODhSjIxURKyIqBycbGycoG2QyIB4lIxkSFCIuHhwdGCAoJxsjNzkOEh4YCscOFBQODhMTAAMAEQAAAYQBkAAoADQAQAptuwAvAAYADgAEK7sAFQAFAAgABCu7ADsABgAeAAQruwAAAAUAAQAEK7sAGgAHAAYABCtBAwAOAAAAAXFBAwAMAAEAAXFBAwCYAAQAAV1BAwB3AAQAAV1BAwC2AAYAAXFBAwD3AAYAAV1BAwBYAAYAAXFBAwAKAAYAAXFBAwCrAAYAAV1BAwBYAAYAAXJBAwB4AAYAAV1BAwCGAAYAAXFBAwClAAYAAXFBAwBUAAYAAV1BAwBUAAcAAV1BAwDFAAcAAXFBAwAGAAcAAXJBAwD3AAcAAXFBAwCoAAcAAV1BAwBaAAcAAXJBAwCcAAcAAXJBAwCJAAcAAXJBAwAHAAcAAXFBAwC2AAcAAXFBBQAVAAcAJQAHAAJyQQMAVQAHAAFxQQMA0wAHAAFxQQMAMwAHAAFyQQMADgANAAFxQQUA7wAOAP8ADgACXUEHAH8ADgCPAA4AnwAOAANdQQMArgAOAAFdQQMADgAOAAFxQQMADwAPAAFxQQMADAAQAAFxuAAVELgAF9C4ABcvQQMAmAAZAAFyQQMA6gAZAAFxQQMAyQAZAAFxQQMACAAZAAFxQQUAZQAZAHUAGQACckEDAKgAGgABckEFAOkAGgD5ABoAAnFBAwAKABoAAXFBAwBrABoAAXJBAwCvABoAAV1BAwA6ABoAAXJBAwCZABoAAXJBAwB5ABoAAV1BAwBWABoAAXJBAwB1ABoAAXJBAwAKABsAAXFBAwAtAB4AAXJBAwCOAB4AAV1BAwD/AB4AAXJBAwD/AB4AAXFBAwCfAB4AAV1BAwAOAB4AAXFBAwAtAB4AAV1BAwA8AB4AAXJBAwBGAB4AAV1BAwCOADsAAV1BAwAvADsAAXJBAwCfADsAAV1BAwAPADsAAXFBAwD/ADsAAXJBAwD+ADsAAXFBAwA8ADsAAXK6ABwAHgA7ERI5QQMApgAcAAFdQQMAWAAcAAFdQQUACQAcABkAHAACcUEDAFoAHAABcUEDABoAHAABckEDAAsAHAABckEDACwAHAABckEDAMwAHAABckEDAOwAHAABcUEDAEsAHAABcUEDADsAHAABckEDANoAHAABcUEDAPoAHAABcUEDAHkAHAABcUEDAHcAHAABXUEDAGYAHAABXUEDAJUAHAABXUEDAA8AHwABcUEDAAwAIAABcUEDAAUAIgABcboANQABAAAREjm4ADUvQQUAcAA1AIAANQACcUEFAMAANQDQADUAAnFBAwBgADUAAXJBAwBBADUAAXFBAwADADUAAV1BAwByADUAAXJBAwCxADUAAXFBAwCgADUAAXFBEQCAADUAkAA1AKAANQCwADUAwAA1ANAANQDgADUA8AA1AAhdQQMAwAA1AAFyQQMAgAA1AAFyuQAkAAb0QQMAQQAkAAFdQQMAaAAkAAFyQQMAUgAkAAFdQQUAYAAkAHAAJAACXUEHABAAJAAgACQAMAAkAANdQQMABQAlAAFxQQMAhAAmAAFxQQMApAAmAAFdQQMAtQAmAAFxQQMARQAmAAFxQQMA9QAmAAFdQQMA5gAmAAFdQQUAtgAmAMYAJgACXUEDAMcAJgABcUEFAIcAJgCXACYAAl1BAwAHACYAAXFBAwB2ACYAAXFBAwDFACYAAXJBAwDVACYAAV1BBQB1ACYAhQAmAAJyQQMAdAAmAAFdQQUARAAmAFQAJgACXUEDAKQAJgABcUEDANEAJgABcbgACBC4ACnQuAApL0EFAO8ALwD/AC8AAl1BAwAPAC8AAXFBCQB/AC8AjwAvAJ8ALwCvAC8ABF1BAwAQAEEAAXG4ACQQuABC3EEDAOAAQgABcQC4AABFWLgAES8buQARABA+WbgAAEVYuAAhLxu5ACEAED5ZuAAARVi4AAAvG7kAAAAKPlm4AABFWLgABy8buQAHAAo+WbsAMgABAAsABCtBAwBcAAsAAV1BBQAPAAsAHwALAAJdQQMArwALAAFdQQMA/wALAAFdQQUAzwALAN8ACwACcUEDAE8ACwABckEDAK8ACwABcUEDAM8ACwABXUEDAI8ACwABXUEDAN8ACwABckEDABcACwABckEDAOAACwABcbgACxC4AATQuAAEL0EDAJMABAABXUEDANcABAABcUEDAKkABAABcUEFALoABADKAAQAAnFBAwB5AAQAAXFBAwAHAAQAAXFBAwBTAAQAAV1BAwCAAAQAAV1BAwA5AAYAAXFBAwD5AAYAAV1BAwAVAAYAAXFBAwCuADIAAXFBAwD/ADIAAV1BAwCvADIAAV1BAwDPADIAAV1BAwBPADIAAXJBAwCPADIAAV1BBQDPADIA3wAyAAJxQQMA3wAyAAFyQQMAWwAyAAFdQQMA4AAyAAFxugAJAAsAMhESOUEDAPgADQABXUEDAAQAFAABcUEDAAsAFQABcUEDAFoAFQABXboAFwAAABEREjlBAwAyABcAAXJBAwBcABcAAV1BAwANABcAAXFBBQDEABcA1AAXAAJxQQMA4gAXAAFxQQMAIAAXAAFyQQMAlQAZAAFyQQMAmwAZAAFdQQMArgAZAAFyQQMAWgAZAAFyQQcARQAZAFUAGQBlABkAA3FBAwDTABkAAXFBAwBSABoAAXFBAwDDABoAAXJBAwCEABoAAV1BAwDHABoAAV1BAwCHABoAAXJBAwCnABoAAXJBAwATABoAAXJBAwASABoAAXFBAwCRABoAAV1BAwBAABoAAXFBAwAGABsAAXG6ABwACwAyERI5QQMAdQAcAAFdQQMANwAcAAFdQQMARgAcAAFxQQMARQAcAAFdQQMAhAAcAAFdQQMAKAAeAAFdQQMAdwAkAAFdQQMA/AAlAAFdQQMASwAlAAFxQQMANAAmAAFxQQMAVQAmAAFdQQMAhgAmAAFdQQMA6AAmAAFdQQMAqQAmAAFdQQMA2gAmAAFdQQMAywAmAAFdQQUAqwAmALsAJgACcUEDAHwAJgABcUEDAP8AJgABXUEDAM8AJgABcUEDAN0AJgABckEDANwAJgABcUEDAAsAJgABcUEDAIoAJgABcUEDAGoAJgABckEDALgAJgABXUEFAHgAJgCIACYAAnJBAwAlACYAAXFBAwCVACYAAV1BAwBAACYAAV1BAwBwACYAAV24ABEQuQAsAAH0uAA40LgAMhC4AD7QMDEBQQMAQwAHAAFyQQkAuQAMAMkADADZAAwA6QAMAARdQQMA+gAMAAFdQQsAuQAQAMkAEADZABAA6QAQAPkAEAAFXUELALYAEgDGABIA1gASAOYAEgD2ABIABV1BAwBKABoAAXJBAwBMABsAAXJBAwBMABwAAXJBCwC5ACAAyQAgANkAIADpACAA+QAgAAVdQQsAtgAiAMYAIgDWACIA5gAiAPYAIgAFXUEDAEYAJgABcgBBCQC5AA0AyQANANkADQDpAA0ABF1BAwD6AA0AAV1BAwC2AA8AAV1BAwDnAA8AAV1BBwC2ABMAxgATANYAEwADXUEDAOcAEwABXUELALYAHwDGAB8A1gAfAOYAHwD2AB8ABV1BCQC2ACMAxgAjANYAIwDmACMABF1BAwD3ACMAAV0hIzU0IyIPASMRBiMiJjU0NjMyFh0BFAc2PwE2NyY1NDYzMhYVFAcWFSc0JiMiBhUUFjMyNjc0JiMiBhUUFjMyNgFzJBgPFYEhDREbJycbGycFDApRDhMYJxsbJyEQ/hQODhQUDg4U7xQODhQUDg4U2C4j4wETBycbGycnG9kJNRkTlRkKEyAbJycbJhMRLHYOFBQODhQUDg4UFA4OFBQAAAADABEAAAGxAa8ALgA6AEYLLLsANQAGAAoABCu7ABEABQAEAAQruwBBAAYAIgAEK7sAAAAFABwABCtBAwBPAAEAAXJBAwA6AAEAAXJBBQCfAAoArwAKAAJdQQUA7wAKAP8ACgACXUEDAA8ACgABcUEDAH8ACgABXUEDAI0ACgABXboAAgAKAAAREjlBAwCHAAIAAV1BAwCWAAMAAV1BAwBAAAMAAXJBAwD/AAgAAV1BAwAOAAgAAXFBAwD/AAwAAV1BAwAPAAwAAXFBAwD3AA4AAV1BAwADAA4AAXG4ABEQuAAT0LgAEy9BAwCMABUAAV1BAwBmABYAAXJBAwCKABYAAV1BAwDrABYAAV1BAwD9ABYAAV1BAwBLABYAAXJBAwCWABYAAXJBAwClABYAAXJBAwDFABYAAV1BAwDIABcAAV1BAwBpABcAAXJBAwCZABcAAV1BAwBHABcAAXJBAwCHABcAAV24ABwQuAAa0LgAGi9BAwCtACAAAXFBAwD+ACAAAV1BAwAMACAAAXFBAwDbACAAAV1BAwDeACIAAXFBAwBPACIAAXJBAwBfACIAAV1BAwD/ACIAAV1BAwDPACIAAXFBAwCvACIAAXFBBQB/ACIAjwAiAAJdQQMAbwAiAAFyQQMAjwAiAAFyQQMA5QAiAAFxQQMAEgAiAAFxQQMA/wAkAAFdQQMADwAkAAFxQQMA2wAkAAFdQQMASQAkAAFyQQMAGAAnAAFxQQMA+gApAAFxQQMAGwApAAFyQQMATAApAAFyQQMAywApAAFxQQMASwApAAFxQQMA2gApAAFxQQMAhgApAAFdQQMA1QAqAAFxQQMApQAqAAFdQQMAhgAqAAFdQQMASQAqAAFxQQMAyAAqAAFdQQMARgAqAAFyQQMAZQAqAAFdQQMAlAAqAAFdQQMAMwAqAAFyQQMAFgAsAAFyQQMARgAsAAFxQQMApgAsAAFduAAEELgAL9C4AC8vQQkAfwA1AI8ANQCfADUArwA1AARdQQUA7wA1AP8ANQACXUEDAA8ANQABcbgAHBC4ADvQuAA7L0EDAKAAOwABXUEDAM4AQQABcUEDAK4AQQABcUEDAG8AQQABckEDAH8AQQABXUEDAN8AQQABcUEDAI8AQQABckEDAE8AQQABckEDAP4AQQABXUEDAOcAQQABcUEDABAAQQABcUEDABAARwABcUEDAA8ASAABXUEDAH8ASAABXUEDAC8ASAABXUEDAC8ASAABcUEDAD4ASAABXUEDAOAASAABcQC4ACkvuAAARVi4AA0vG7kADQAQPlm4AABFWLgAJS8buQAlABA+WbgAAEVYuAAALxu5AAAACj5ZuAAARVi4AAMvG7kAAwAKPlm7ADgAAQAHAAQrQQMAiwApAAFdQQMA3AApAAFdQQMArAApAAFdQQMA/wApAAFdQQMAzgApAAFdQQMATAApAAFyQQMAOwApAAFdQQMAygApAAFxQQMAWAApAAFdugACAAAAKRESOUEDAE0AAgABckEDAMsAAgABcUEDAJQAAgABckEDAE0ABwABckEFAA8ABwAfAAcAAl1BAwCvAAcAAV1BAwCvAAcAAXFBBQDPAAcA3wAHAAJxQQMAzwAHAAFdQQMAjwAHAAFdQQMA/wAHAAFdQQMAXAAHAAFdQQMA4AAHAAFxQQMAzwA4AAFdQQMArwA4AAFdQQUAzwA4AN8AOAACcUEDAK8AOAABcUEDAP8AOAABXUEDAE8AOAABckEDABcAOAABckEDAOAAOAABcboABQAHADgREjm6ABMAAAApERI5QQMA5QATAAFdQQMARQATAAFyQQMAZgAXAAFyQQMAbgAYAAFyQQMAfQAYAAFdQQMARAAZAAFyugAaAAAAKRESOUEDAEYAGgABckEDAEUAHAABcroAHQAHADgREjlBAwBMAB0AAXJBAwBbAB0AAV1BAwCLAB0AAV24AAcQuAAf0EEDAFwAHwABXUEDAIkAHwABXUEDAEgAHwABckEDAEoAIQABckEDAEQAIwABckEDAEgAJwABckEDABcAJwABcUEDAMwAKgABcUEDAP0AKgABXUEDAFsAKgABXUEDAGkAKgABXUEDAEsALAABckEDAEwALAABcUEDABkALAABckEDAKQALAABXbgADRC5ADIAAfRBAwCBADIAAV24AD7QuAA4ELgARNBBAwBbAEQAAV1BAwCIAEQAAV1BAwCnAEQAAXEwMQFBAwBoAAEAAXFBAwD5AAEAAV1BAwA5AAEAAXFBCQB5AAEAiQABAJkAAQCpAAEABHFBAwC6AAEAAXFBAwArAAEAAXFBAwBLAAEAAXFBBwDLAAEA2wABAOsAAQADcUEFAAsAAQAbAAEAAnJBAwBcAAEAAXFBAwAtAAEAAXJBAwD+AAEAAXFBAwDXAAIAAXFBAwB4AAIAAXFBAwDoAAIAAXFBAwD5AAIAAXFBAwAjAAMAAXJBAwBUAAMAAXFBBQDEAAMA1AADAAJxQQMA9AADAAFxQQMANAADAAFyQQMARQADAAFxQQMAtQADAAFxQQUABQADABUAAwACckEDAIYAAwABcUEDAKYAAwABcUEDAOYAAwABcUEDAHcAAwABcUEDAJcAAwABcUEJALkACADJAAgA2QAIAOkACAAEXUEJALkADADJAAwA2QAMAOkADAAEXUEJALYADgDGAA4A1gAOAOYADgAEXUEDAHkAFAABcUEDANkAFAABcUEDAHoAFQABcUEDAOcAFgABXUEDAHkAFgABcUEFAMkAFgDZABYAAnFBAwD7ABYAAXFBAwB2ABcAAXFBAwD2ABcAAXFBAwA4ABcAAXFBAwApABcAAXFBAwCpABcAAXFBAwDXABgAAXFBBQC5ACAAyQAgAAJdQQMA6QAgAAFdQQUAuQAkAMkAJAACXUEDAOkAJAABXUEDACgAJwABckEDACoAKAABckEDAAsAKAABckEDAHIAKQABXUEDAEYAKQABcUEDAOgAKQABcUEDACkAKQABckEDAAoAKQABckEDAHQAKgABXUEDAEQAKgABcUEDALQAKgABcUEDADQAKgABckEDACYAKgABckEDADMAKwABckEFAOYALAD2ACwAAnFBAwBfAEgAAV0AQQMA5QACAAFdQQMAdwACAAFxQQMAiQACAAFxQQMA6gACAAFxQQMAKwACAAFxQQMAvAACAAFxQQMA3QACAAFxQQMAHQACAAFyQQMA/gACAAFxQQMArwACAAFxQQMADwACAAFyQQUALwACAD8AAgACckEJALkACQDJAAkA2QAJAOkACQAEXUEDAMcACwABXUEHALYADwDGAA8A1gAPAANdQQMAwgARAAFxQQMA1QATAAFxQQMAxgATAAFxQQMAwgAUAAFxQQMA1QAUAAFxQQMAdgAUAAFxQQMAdAAVAAFxQQMAxAAVAAFxQQMA1QAVAAFxQQMAEgAWAAFxQQMA4wAWAAFxQQMAEgAXAAFxQQMA4wAXAAFxQQMAwgAYAAFxQQMAdAAYAAFxQQMA1gAYAAFxQQMA+QAYAAFdQQMACQAYAAFxQQMA6QAYAAFxQQUAGgAYACoAGAACcUEDAMIAGQABcUEDANQAGQABcUEDAMIAGgABcUEDANMAGgABcUEDAHQAGgABcUEDAPoAGgABXUEDAAwAGgABcUEDANIAHAABcUEDAHMAHAABcUEDAPoAHAABXUEDAAwAHAABcUEDACwAHAABcUEDAB4AHAABcUEFALkAIQDJACEAAl1BAwDpACEAAV1BAwD7ACkAAXFBAwD7ACoAAXFBAwDrACwAAXFBAwD8ACwAAXFBAwDrAC0AAXFBAwDrAC4AAXEhIycHIxEGIyImNTQ2MzIWHQEUBzY/ATMXFhcmPQEGIyImNTQ2MzIXNjczBgcWFSE0JiMiBhUUFjMyNjc0JiMiBhUUFjMyNgGOLGRkKQ0RGycnGxsnAwYLSiJKAxACDREbJycbEA4UBS4JIwn+5xQODhQUDg4U+RQODhQUDg4Uw8MBEwcnGxsnJxvsECERGoyMByQgEbEHJxsbJwgJHiUbEg8OFBQODhQUDg4UFA4OFBQAAAIAGv/4AUsBkAALADIIsrsAHQAFABAABCu7ABcABgAAAAQruwAMAAUAIQAEK7sAKgAHACsABCtBAwCQAAAAAXFBAwBAAAAAAXJBBQDAAAAA0AAAAAJyQQMAfwAAAAFdQQUAHwAAAC8AAAACcUEDAKEAAAABcUEDAHAAAAABckEDALAAAAABcUEFAOAAAADwAAAAAl1BBwCAAAAAkAAAAKAAAAADXUEDAH8AHQABXUEDADAAHQABXbgAHRC4AAbQuAAGL0EDAEUADQABcUEDAEUADQABckEDAFMADQABcUEDAGIADQABcUEDAEwADwABckEFAEwADwBcAA8AAnFBAwBpAA8AAXFBAwB/ABAAAV1BAwAwABAAAV1BAwDKABMAAV1BAwAKABMAAXFBAwAFABUAAXFBAwDEABUAAV1BAwAgABYAAV1BAwCQABcAAV1BBwCQABcAoAAXALAAFwADcUEDAKEAFwABXUEDAIIAFwABXUEDAH8AFwABXUEFAB8AFwAvABcAAnFBAwBBABcAAXJBBQDAABcA0AAXAAJyQQUA4AAXAPAAFwACXUEJAAAAFwAQABcAIAAXADAAFwAEXUEDAHAAFwABckEDACAAGAABXUEDAAUAGQABcUEDAMQAGQABXUEDANgAGgABcUEDAEUAHgABcUEDAGcAHgABcUEDACQAHgABckEDADIAHgABckEDACwAIAABckEDAE0AIAABcUEDABsAIAABckEDADoAIAABckEDAOoAJAABcUEDAHwAJAABcUEDAIsAJAABcUEDAJoAJAABcUEDADoAJAABckEDAKsAJQABcUEDANoAJQABcUEDAPQAJwABXUEDAKUAJwABXUEDAJEAJwABcUEDAKAAJwABcUEFAJQAKACkACgAAnFBBQB1ACgAhQAoAAJxQQMA2QAoAAFxQQMAVAAoAAFyQQMAdAAoAAFyQQMAMAAoAAFyQQMAJgAqAAFdQQMAtwAqAAFxQQkAmQAqAKkAKgC5ACoAyQAqAARyQQMA3gAqAAFxQQMAfwAqAAFdQQMAngAqAAFdQQMAjAAqAAFdQQMAaQAqAAFyQQMA9gAqAAFdQQMAtQAqAAFdQQMA4wAqAAFdQQMAhgArAAFyQQMAqAArAAFdQQMAfwArAAFdQQMA3wArAAFxQQUAjQArAJ0AKwACXUEDAPYAKwABXUEDALYAKwABXUEDAOQAKwABXUEDAMkALAABcUEDAOsALAABcUEDANwALAABcUEDAPkALAABcUEDACYALAABXUEDAFIALAABckEDAKUALQABcUEDAOoALQABcUEDAM0ALQABcUEFABoALQAqAC0AAnJBAwDJAC0AAV1BAwBjAC0AAXJBAwCDAC0AAXJBAwAkAC8AAXJBAwAEAC8AAXFBAwAVAC8AAXJBAwDaAC8AAXFBAwDEAC8AAXFBAwC0AC8AAV1BBQDjAC8A8wAvAAJdQQMAwgAvAAFduAAMELgANNwAuAAARVi4AC4vG7kALgAQPlm4AABFWLgADi8buQAOAAo+WbsACQABABoABCu7ABQAAQADAAQrQQMA8AADAAFdQQMAgQADAAFdQQMAkAADAAFdQQMAcAADAAFdQQMAXgAJAAFyQQMADwAJAAFxQQUArwAJAL8ACQACcUEFAC8ACQA/AAkAAnJBAwDPAAkAAXJBAwDfAAkAAXFBAwBvAAkAAXFBAwDOAAkAAXFBAwCIAAkAAV1BBQAQAAkAIAAJAAJxQQMAjAAMAAFxQQMAfgAMAAFxQQMAbAAMAAFxQQUAmwAMAKsADAACcUEDAMkADAABcUEDAN0ADwABcUEDAFsAEAABcUEDAMsAEAABcUEDAKwAEAABcUEDAG0AEAABcUEDAH4AEAABcUEDAEwAEAABcUEDAIwAEAABcUEDAJsAEAABcUEDAJoAEAABXUEDAIkAEAABXUEDAAQAEgABcUEHAHAAFACAABQAkAAUAANdQQMAEQAUAAFdQQUAIwAUADMAFAACXUEDAPAAFAABXUEFAEAAFABQABQAAl1BAwAAABQAAV1BAwAKABgAAXFBAwDeABoAAXFBAwBvABoAAXFBBQAvABoAPwAaAAJyQQMAzwAaAAFyQQMAXwAaAAFyQQcArwAaAL8AGgDPABoAA3FBAwAPABoAAXFBAwA7ABoAAV1BBQAQABoAIAAaAAJxugAcABoACRESOUEDADoAHAABXUEDAAcAHAABcUEDACQAHQABckEDADYAHQABcUEDACcAHQABcUEDAEwAHQABcUEDABYAHQABckEDAPUAHQABXUEDAEQAHQABckEDADMAHQABcrgADhC5AB8AAfRBAwA2ACEAAXFBAwAnACEAAXFBAwAVACEAAXFBAwAUACEAAXJBAwDLACIAAXFBAwDeACIAAXFBAwC6ACIAAXFBAwDCACIAAV1BAwDLACQAAXFBAwDZACQAAXG4AC4QuQAmAAH0QQMA+AAqAAFdQQMA3gAqAAFxQQMAmAAqAAFdQQMAdwAqAAFyQQMACgArAAFdQQMA3QArAAFxQQcAGQArACkAKwA5ACsAA11BBQCYACsAqAArAAJdQQMAewAsAAFyQQMAyAAwAAFxQQMAsQAyAAFdQQMAMwAyAAFxQQMANAAyAAFdQQUABQAyABUAMgACcUEDACYAMgABcUEDAMQAMgABcUEFANMAMgDjADIAAl1BAwDhADIAAXFBAwDAADIAAV1BAwDwADIAAV0wMQFBAwC5ABMAAV1BBwDZABMA6QATAPkAEwADXUEDALYAFQABXUEFAOYAFQD2ABUAAl1BAwDXABUAAV1BAwC2ABkAAV1BBwDWABkA5gAZAPYAGQADXUEDANkALQABXQBBAwC2ABIAAV1BBQDmABIA9gASAAJdQQMA1wASAAFdQQMAtgAWAAFdQQcA1gAWAOYAFgD2ABYAA11BAwC5ABgAAV1BBwDZABgA6QAYAPkAGAADXUEDABAAMgABcTc0JiMiBhUUFjMyNhcGIyI9ATQ2MzIWFRQGIyInFRQzMj0BNCcmIyIHBgcjPgEzMhcWFaUUDg4UFA4OFKYChIQnGxsnJB4RDWJgIyAvKSIlByQKVT47KTDQDhQUDg4UFG1dXXsbJycbGycHOEREuioZFhMVIC85HCA3AAMAJf/4AV0BkQAnADIAPg02uAAaL7sACwAGADMABCu7AAAABQAVAAQruwARAAUABAAEK7sAOQAGAAUABCtBAwBBAAEAAXFBAwAzAAEAAXFBBwCUAAEApAABALQAAQADcUEDACUAAQABcUEDAGMAAQABcUEDAFIAAQABcUEFAHAAAQCAAAEAAnFBBQAwAAEAQAABAAJyQQUAKgADADoAAwACcUEDALsAAwABcUEDAKwAAwABcUEDAH4AAwABcUEDAI8AAwABcUEDAG8AAwABcUEDAD4AAwABckEDAJ0AAwABcUEDAEsAAwABckEDAIsAAwABXUEDAFoAAwABcUEDAEkAAwABcUEDAG8ABQABcUEDAAoABwABcUEDAGoABwABcUEDAGcACQABcUEDAAEACQABcUEDAAMACgABcUEDACAACwABckEDAKEACwABXUEDAAMACwABcUEDAGkACwABcUEHAEMACwBTAAsAYwALAANdQQMAMgALAAFyQQMAQAALAAFyQQUAwAALANAACwACcUEJAAAACwAQAAsAIAALADAACwAEXUEDAAAADAABcUEDAGUADQABcUEDAPMADQABXUEDADAADQABckEDAG0AOQABcbgAORC4ABDQuAAQL0EDAG8AEAABcUEDAFYAEgABXUEDAAkAFAABcUEDANMAFwABcUEDAEoAGQABcUEDAFsAGQABcUEDAAsAGQABcUEDAO0AGQABXUEDAP0AGQABcUEDAI4AGQABcUEDAN8AGQABcUEDAG4AGQABcUEDAH0AGQABcUEDANwAGQABXUEFAKsAGQC7ABkAAl1BAwC6ABkAAXFBAwAaABkAAXFBAwBEABkAAV1BAwAYABoAAV1BAwCKABoAAXFBAwB8ABoAAV1BBwDPABoA3wAaAO8AGgADcUEDAL0AGgABcUEFAGsAGgB7ABoAAnFBAwDoABoAAV1BAwA2ABoAAV1BAwBVABoAAV1BAwC5ABsAAXFBAwDaABsAAV1BAwAsABsAAXJBAwDfABsAAXFBAwDOABsAAXFBAwD6ABsAAXFBAwCaABsAAV1BAwBJABsAAV1BAwBWABsAAXFBAwBXABwAAXFBBQCLABwAmwAcAAJdQQMA3QAcAAFxQQMAKwAcAAFyQQMA5gAcAAFxQQMA9QAcAAFxQQMABQAcAAFyQQMAGQAfAAFyQQMA1QAfAAFxugAgABUAABESOUEFAHMAIACDACAAAl1BAwA0ACAAAV1BAwBkACAAAV1BAwCoACAAAV1BAwDWACAAAXFBAwDEACAAAXFBAwD0ACAAAXFBAwATACAAAV1BAwBDACAAAV24AAAQuAAi0LgAIi9BAwCTACIAAV1BAwBXACIAAV1BBQA1ACIARQAiAAJdQQMAYwAiAAFdQQUAcgAiAIIAIgACXUEDAJUAIwABXUEDAGYAIwABXUEDAKkAIwABXUEDAIcAIwABXUEDABYAIwABckEDAHQAIwABXUEDAPEAIwABcUEDAIQAJAABcUEDAKQAJAABcUEDABEAJQABckEDAEEAJQABXUEDANMAJQABcUEDAHMAJQABXUEDAJUAJQABcUEDAGUAJQABcUEFAIYAJQCWACUAAl1BAwD3ACUAAV1BAwAnACUAAV1BAwAnACUAAXFBAwBXACUAAV1BAwDGACUAAXFBAwBlACUAAV1BAwC1ACUAAXFBAwA0ACUAAV1BAwBzACUAAXFBAwCCACUAAXFBAwARACUAAV1BAwBQACUAAXFBAwDwACUAAXFBAwC0ACgAAV1BAwD1ACgAAV1BAwD2ACgAAXFBAwDXACgAAXFBAwAZACgAAXJBAwBKACgAAXJBAwCbACgAAXFBAwALACgAAXJBAwDJACgAAXFBAwAoACgAAXJBBQDWACgA5gAoAAJdQQMApQAoAAFxQQMAVQAoAAFxQQMANAAoAAFdQQMAggAoAAFxQQMACwApAAFyQQMAGgApAAFyQQMAigApAAFxQQMAHQAqAAFyQQMAqgAqAAFxQQMA+gAqAAFdQQMA5QAtAAFxQQMAlgAtAAFxQQMAFgAtAAFyQQMA9QAtAAFdQQMA8QAtAAFxQQMAAAAtAAFyQQMANwAuAAFxQQMAVAAuAAFxQQMARgAvAAFyQQMA+AAvAAFdQQMAaQAvAAFxQQMAeQAvAAFdQQMAuwAvAAFdQQMAzAAvAAFdQQMA2wAvAAFxQQMA2gAvAAFdQQMA6QAvAAFdQQMAyQAvAAFxQQMARgAvAAFxQQMA8wAvAAFxQQMAowAvAAFxQQMAygAwAAFdQQMABwAwAAFyQQMAJgAwAAFyQQMAKwAyAAFyQQUAwAAzANAAMwACcUEDAEIAMwABckEDADMAMwABckEDAGoAMwABcUEDAFUAMwABXUEDAEMAMwABXUEDAKAAMwABXUEDAAAAMwABcUEDACAAMwABckEDAEAANQABckEDAEIANwABckEDAC8AQAABcUEDAA8AQAABXUEFAC8AQAA/AEAAAl1BAwDgAEAAAXEAuAAARVi4AB4vG7kAHgAQPlm4AABFWLgAIi8buQAiABA+WbgAAEVYuAACLxu5AAIACj5ZuwA8AAEADgAEK7sAMQABABgABCu7AAgAAQA2AAQrQQMAXAAAAAFxQQMATwAAAAFyQQMAOgAAAAFyQQMASQAAAAFxQQUAWgAEAGoABAACcUEDADwABAABckEDAE8ABAABckEDACsABAABcUEDAEkABAABcUEDAFQABAABXUEDAGAACAABcUEDALEACAABcUEDAAIACAABXUEFAJMACACjAAgAAl1BAwD2AAgAAV1BAwBTAAgAAV1BAwBiAAgAAV1BAwCgAAgAAXFBAwBwAAgAAV1BCQAQAAgAIAAIADAACABAAAgABF1BAwD5AAwAAV1BAwAHAAwAAXFBAwBNAA4AAXJBAwBfAA4AAV1BAwDPAA4AAXFBAwA/AA4AAXJBAwDfAA4AAV1BAwBuAA4AAV1BAwBLAA4AAV1BAwBiAA4AAXFBBQBcADwAbAA8AAJdQQMArwA8AAFdQQMAzwA8AAFxQQMA3wA8AAFdQQMAPwA8AAFyQQMATAA8AAFyQQMAYQA8AAFxugAQAA4APBESOUEDAE8AEAABckEDAGwAEAABXUEDAFkAEAABXUEDAD0AEQABckEDAEsAEQABcUEDADgAEQABcUEJAAYAEgAWABIAJgASADYAEgAEcrgAAhC5ABMAAfRBAwAGABQAAXJBAwAlABQAAXJBAwBEABQAAXJBBQAXABUAJwAVAAJxQQMATwAVAAFyQQMAFgAVAAFyQQMANgAVAAFxQQMAXgAYAAFdQQMAjwAYAAFdQQMAzwAYAAFdQQMADQAYAAFdQQMAHAAYAAFdQQMAzwAxAAFdQQMAjwAxAAFdQQMAXAAxAAFdQQMACgAxAAFdugAWABgAMRESOUEFAM8AFgDfABYAAnFBAwD/ABYAAXFBAwCvABYAAXFBAwAfABYAAXJBAwBLABYAAXJBAwAKABYAAXJBAwAMABkAAV1BAwDbABkAAXFBAwBXABkAAXFBAwAMABoAAV1BAwAqABwAAXG6ACAAAgAeERI5QQMAOAAgAAFdQQMAaQAgAAFdQQMAjQAgAAFdQQMAGwAgAAFdQQMAeAAgAAFdQQMAxgAgAAFxQQMA1QAgAAFxQQUAXAAiAGwAIgACXUEDAJ0AIgABXUEDAC0AIgABXUEDAD8AIgABXUEDAI8AIgABXUEDAH0AIgABXUEDAE0AIgABXUEDABwAIgABXUEDABoAIgABckEDAPYAJQABXUEDACcAJQABXUEDABgAJQABXUEDAEkAJQABXUEDADoAJQABXUEDAHoAJQABXUEDAMwAJQABcUEDAJwAJQABXUEDAI4AJQABXUEDAPwAJQABcUEDAGsAJQABXUEDANoAJQABcUEDALkAJQABcUEDABgAJQABckEDAFcAJQABcUEDACcAJQABcUEDAJUAJQABcUEDAGQAJQABcUEDAEQAJwABXUEDABMAJwABXUEDAPgAKAABcUEDAAgAKAABckEDAFgAKAABcbgAHhC5ACsAAfRBAwBAADYAAV1BAwBiADYAAXFBAwCQADYAAV1BBQCgADYAsAA2AAJxMDEBQQkAuQAHAMkABwDZAAcA6QAHAARdQQkAtgAJAMYACQDWAAkA5gAJAARdQQkAtgANAMYADQDWAA0A5gANAARdQQMAygAZAAFdQQMAoAAfAAFxQQMAQAAfAAFyQQMApQAgAAFxQQMANgAgAAFyQQMAMAAlAAFyQQMAowAlAAFxQQMARwAlAAFyQQMAxQAoAAFdQQMAOQAoAAFyQQMAxgApAAFdQQMAOQApAAFyQQUAPAAqAEwAKgACckEDAMgAMAABXUEDAF8AQAABXQBBBwC2AAYAxgAGANYABgADXUEJALYACgDGAAoA1gAKAOYACgAEXUEJALkADADJAAwA2QAMAOkADAAEXUEDAD8AFgABckEDADQAIAABckEDAKUAIAABcUEDAKkAJQABcSUUIyI9ATQ2MzIWFRQGIyInFRQzMj0BBiMiNTQ3NjMyFzY3MwYHFhUnLgEjIgcGFRQzMgc0JiMiBhUUFjMyNgE8hYcnGxsnIiARDWNhK1lvMiYwTC0QASYHIQcrCzsfIx0jTUtNFA4OFBQODhRZYWFdGycnGxsnBx5ERcsdPCYUDzEbFiklDhopExsKDBQcdg4UFA4OFBQAAAIANgAAAU0BkAAWACIF07sAHQAGAAkABCu7AA8ABQAXAAQruwAAAAUAAQAEK0EDAKkABQABXUEDAMYABQABXUEDALMABQABcUEDANQABgABcUEDAKoABwABXUEDAA4ACAABcUEDAFwACQABXUEDAA4ACQABcUEDAE0ACQABXUEDAKUACQABXUEDAFMACQABcUEDAAsACwABcUEDAPoACwABXUEDABoADQABckEFADoADQBKAA0AAnJBAwD0AA0AAV1BAwA5AA4AAXJBAwBFAA8AAXJBAwD2AA8AAV1BCQAGAA8AFgAPACYADwA2AA8ABHFBCwAGAA8AFgAPACYADwA2AA8ARgAPAAVdQQMATwAPAAFxQQMAOAAPAAFyQRcAVgAPAGYADwB2AA8AhgAPAJYADwCmAA8AtgAPAMYADwDWAA8A5gAPAPYADwALcUEHAAYADwAWAA8AJgAPAANyQQcAdgAPAIYADwCWAA8AA11BAwCgAA8AAV1BBQBQAA8AYAAPAAJdQQMAOgAXAAFyQQMATwAXAAFxQQMAoAAXAAFdQQMAUAAXAAFdugARABcADxESOUEDAMcAEQABXUEDAEoAEgABckEDABwAEgABckEDALwAEgABcUEDAOsAEgABcUEDABoAEgABcUEDAAkAEgABckEDALoAEwABXUEFAMsAEwDbABMAAnFBBQCtABMAvQATAAJxQQMAfAATAAFxQQMASwATAAFyQQUAiQATAJkAEwACcUEDAFkAEwABcUEDABMAFQABcUEDAMYAFQABcUEDANAAFQABcUEDAAAAFQABcUEVAGYAHQB2AB0AhgAdAJYAHQCmAB0AtgAdAMYAHQDWAB0A5gAdAPYAHQAKcUEHAAYAHQAWAB0AJgAdAANyQQcAJgAdADYAHQBGAB0AA3FBAwAMAB0AAXFBCwAGAB0AFgAdACYAHQA2AB0ARgAdAAVdQQUANQAdAEUAHQACckEDAFMAHQABcUEFAE8AJABfACQAAl1BAwAvACQAAV1BAwB/ACQAAV0AuAAARVi4AAwvG7kADAAQPlm4AABFWLgAEy8buQATABA+WbgAAEVYuAAALxu5AAAACj5ZuwAgAAEABgAEK7gAExC5AAQAAvRBBQA5AAQASQAEAAJyQRkACAAEABgABAAoAAQAOAAEAEgABABYAAQAaAAEAHgABACIAAQAmAAEAKgABAC4AAQADF1BBQDoAAQA+AAEAAJdQSEACAAEABgABAAoAAQAOAAEAEgABABYAAQAaAAEAHgABACIAAQAmAAEAKgABAC4AAQAyAAEANgABADoAAQA+AAEABBxQQcACAAEABgABAAoAAQAA3JBAwDjAAYAAXFBAwAfAAYAAXJBAwD/AAYAAV1BAwDPAAYAAV1BAwCNAAYAAV1BAwAyAAYAAXJBAwAiAAYAAV1BAwCtAAgAAV1BAwAJAAgAAXFBAwAFAAsAAXFBAwAcACAAAXJBAwCPACAAAV1BAwD/ACAAAV1BAwDPACAAAV1BAwAxACAAAXJBAwDgACAAAXG6ABEABgAgERI5QQMAGwARAAFyQQMApQARAAFdQQMAtQASAAFdQQMAFQASAAFyQQMA5QASAAFxQQMA9AASAAFxQQMAQwASAAFyQQUAYAAWAHAAFgACcUEDADEAFgABcUEDAMMAFgABcUEDAIQAFgABcUEDAFQAFgABcUEDACMAFgABcUEDALEAFgABcUEDAEAAFgABcUEDAJAAFgABcbgAGtBBBQDmABoA9gAaAAJdQQUAxwAaANcAGgACXUEDALYAGgABXUEDABUAGgABcUEDAKAAGgABXTAxAUEJALkACwDJAAsA2QALAOkACwAEXUEJALYADQDGAA0A1gANAOYADQAEXQBBAwC4AAgAAV1BAwDYAAgAAV1BAwDJAAgAAV1BAwC2AAoAAV1BAwDmAAoAAV1BBQDHAAoA1wAKAAJdQQMAtgAOAAFdQQUA1gAOAOYADgACXUEDAMcADgABXSEjETQnBiMiJjU0NjMyFhUUBzY3MzIVJzQmIyIGFRQWMzI2AU0kHyNRLzEmGhomDjcOJDy6EQ0NEBANDREBRx8CYikhGiYmGhYRE0w+Bw0REQ0NEBAABAAfAA8BLwF+ABQAIAA1AEEId7sAGwAGAAcABCu7AA0ABgAVAAQruwAAAAUAFAAEK0EDAKkAAAABXUEDANoAAAABXUEDAPkAAAABXUEFALgAAADIAAAAAl1BAwCQAAAAAV1BAwCMAAIAAV1BAwCJAAIAAXFBAwCoAAMAAXJBAwA5AAQAAXJBAwAZAAQAAXJBAwCQAAQAAXJBAwD6AAUAAXFBAwCAAAUAAXJBAwAaAAkAAXFBAwDgAA0AAXFBAwDAAA0AAXJBAwAjAA0AAV1BAwAGAA0AAV1BAwD2AA0AAV1BAwAGAA0AAXFBAwD2AA0AAXFBAwAGAA0AAXJBBwAfAA0ALwANAD8ADQADcUEJAHYADQCGAA0AlgANAKYADQAEcUEHADYADQBGAA0AVgANAANdQQMAFAANAAFdQQMA0QANAAFxQQMAIAANAAFyQQUAsAANAMAADQACcUELAGAADQBwAA0AgAANAJAADQCgAA0ABV1BAwDgABUAAXFBBwCxABUAwQAVANEAFQADcUEHAB8AFQAvABUAPwAVAANxQQMAIAAVAAFyQQsAYAAVAHAAFQCAABUAkAAVAKAAFQAFXUEDAMAAFQABcroADwAVAA0REjlBAwA2AA8AAXJBAwBHAA8AAXJBAwDVAA8AAXFBBQC0AA8AxAAPAAJxQQMAyAARAAFxQQMAOQASAAFyQQMAigASAAFdQQMAywASAAFxQQMA6gASAAFxQQUACgASABoAEgACckEDAPkAEgABcUEDAGkAEgABcUEDAPwAEwABcUEDADsAEwABckEDAEkAEwABckEDAPoAFAABXUEDANsAFAABXUEFAKoAFAC6ABQAAl1BAwCQABQAAV1BCQAWABsAJgAbADYAGwBGABsABF24AAAQuAAh0EEDAIsAIwABXUEDAOUAJAABXUEDABkAJQABckEDAPoAJgABcUEDAIAAJgABckEDAOgAJwABcbgABxC4ACjQuAANELgALtBBAwBJAC4AAXK6ADAAFQANERI5QQMAtgAwAAFxQQMARwAwAAFyQQMA1QAwAAFxQQMAxAAwAAFxQQMAigAzAAFdQQMA6gAzAAFxQQMAigAzAAFxQQUACgAzABoAMwACckEDAPkAMwABcUEDAPwANAABcUEDADsANAABckEDAEkANAABcrgAFBC4ADXQuAAVELgANtC4ABsQuAA80EEDAMAAQwABXUEDAG8AQwABXUEFAC8AQwA/AEMAAl1BAwAPAEMAAV1BAwDwAEMAAV1BAwAwAEMAAXEAuAAAL7gACi+7AD8AAQAkAAQruwArAAEAOQAEK7sAHgABAAMABCtBAwBgAAAAAXFBAwCwAAAAAXFBAwAAAAAAAXJBAwASAAAAAV1BBQDQAAAA4AAAAAJxQQMAgAAAAAFxQQMAAAAAAAFxQQMAgAAAAAFdQQMACgABAAFxQQUAPAADAEwAAwACckEDAM8AAwABcUEFAHEAAwCBAAMAAl1BAwCgAAMAAXJBAwC6AAUAAXFBAwB2AAUAAXJBAwBlAAUAAXJBAwDtAAYAAXFBAwCdAAYAAXFBAwCsAAYAAXFBBQDLAAYA2wAGAAJxQQMAhgAIAAFyQQMAlQAIAAFyQQMA9QAJAAFdQQMAAgAJAAFxQQMAYgAJAAFxQQMAsAAKAAFxQQMAAAAKAAFyQQMAXAAKAAFyQQMAYQAKAAFxQQMA4AAKAAFxQQMAgAAKAAFxQQMA4AAKAAFdQQcAnwAeAK8AHgC/AB4AA3FBBQCfAB4ArwAeAAJdQQMAbwAeAAFdQQUAvwAeAM8AHgACckEDAM4AHgABcboADwADAB4REjm4AAMQuQARAAH0QQMAyAARAAFxQQMAdgARAAFdQQMAhQARAAFdQQMApAATAAFdQQMAlgATAAFdQQMAxgATAAFdQQMAZQATAAFdQQMAdAATAAFdQQMAhAATAAFxuAAKELgAFNC4ABQvQQMA7wAUAAFdQQMAEgAUAAFduAAKELkAGAAB9EEDAFkAGAABckEDAAcAGAABckEDAOAAKwABXUEDAB8AKwABcUEDAAIAKwABXUEDAFAAKwABXUEDALAAKwABXbgAKxC4ACHQuAAhL0EDAOsAIQABXUEDABIAIQABXUEDAAoAIgABcUEDAMwAJAABXUEDAN4AJAABXUEDAD4AJAABckEDAE0AJAABckEDAMAAJAABckEDALAAJAABcUEDAIcAJQABckEDALwAJgABcUEDAHYAJgABckEDAGUAJgABckEDAOwAJwABcUEDAJ0AJwABcUEDAK4AJwABcUEDAMwAJwABcUEDANsAJwABcUEFAGgAJwB4ACcAAl1BAwBWACkAAXJBAwCGACkAAXJBAwD0ACoAAV1BAwAEACoAAXFBAwCfAD8AAXJBAwC/AD8AAXJBBQDPAD8A3wA/AAJdQQUAnwA/AK8APwACcUELAG8APwB/AD8AjwA/AJ8APwCvAD8ABV1BAwCuAD8AAXJBAwC3AD8AAXG6ADAAJAA/ERI5uAAkELkAMgAB9EEDAGUANAABXUEDAHYANAABXUEDAJUANAABXUEDAKQANAABXUEDABQANQABXUEDAOAAOQABXUEDAB8AOQABcUEDALAAOQABXUEDAFAAOQABXTAxAUEDAJUABQABckEJALkACQDJAAkA2QAJAOkACQAEXUEJALYACwDGAAsA1gALAOYACwAEXUEFALkAKgDJACoAAl1BAwDpACoAAV1BAwDaACoAAV1BCQC2ACwAxgAsANYALADmACwABF0AQQkAtgAIAMYACADWAAgA5gAIAARdQQkAtgAMAMYADADWAAwA5gAMAARdQQMAygAnAAFdQQkAtgApAMYAKQDWACkA5gApAARdQQcAtgAtAMYALQDWAC0AA11BAwDnAC0AAV0BDgEjIicmNTQ2MzIWFRQHFjM+ATcHNCYjIgYVFBYzMjYXDgEjIicmNTQ2MzIWFRQHFjM+ATcHNCYjIgYVFBYzMjYBLwJOPjMjLCYaGiYdEAk2OAKOEg4OEREODhKyAk4+MyMsJhoaJh0QCTY4Ao4SDg4REQ4OEgF+RFcTFy4aJiYaIhMEAkM3Qw4SEg4OERGDRFcTFy4aJiYaIhMEAkM3Qw4SEg4OEREAAAL/FQHQADECawAUACAFmrsAGwAGAAYABCu7AAwABgAVAAQrQQMArgAVAAFxuAAVELgAANxBAwAmAAAAAXJBAwCcAAAAAV1BAwAtAAAAAV1BAwA/AAAAAV1BAwCPAAAAAV1BBQAPAAAAHwAAAAJdQQMATAAAAAFdQQMAqgAAAAFdQQMApAAAAAFxQQMA8QAAAAFxQQMAXAABAAFxQQUAwwACANMAAgACcUEDAOUAAgABXUEDAJYAAgABXUEDAF0AAgABcUEDAHwAAgABcUEDACUAAgABckEDAOQAAgABcUEDAAMAAgABckEDABEAAgABckEDACwABAABckEDAP4ABAABcUEDAA4ABAABckEDAM8ABAABcUEDAD8ABAABckEDAO8ABAABcUEDAK8ABAABcUEDAB0ABAABckEDANsABAABcUEDAOsABAABXUEDAAEABgABcUEDAO0ABgABXUEDAH8ABgABcUEDAP4ABgABXUEDALIABgABcUEDACEABgABcUEDABAABgABcUEDAP4ACAABXUEDAO0ACAABXUEDAOYACgABXUEDAHIADAABXUELAIYADACWAAwApgAMALYADADGAAwABV1BCwC2AAwAxgAMANYADADmAAwA9gAMAAVxQQMASAAMAAFyQQMArwAMAAFxQQMAFgAMAAFyQQUA5gAMAPYADAACXUEFAAYADAAWAAwAAnFBCwAGAAwAFgAMACYADAA2AAwARgAMAAVdQQMAUQAMAAFdQQMAYAAMAAFdugAOABUADBESOUEDAHYADgABXUEDAFYADgABXUEDAF8AEgABcUEDAL0AEgABcUEDAOoAFAABcUEDADoAFAABXUEDAIoAFAABcUEDALsAFAABcUEDANwAFAABcUEDAP0AFAABcUEDAK8AFAABcUEFAG4AFAB+ABQAAnFBBQAMABQAHAAUAAJyQQUAOwAUAEsAFAACckEDACoAFAABckEDAMoAFAABcUEDAKoAFAABXUEDAMkAFAABXUEDALgAFAABXUEDABYAGwABckELAAYAGwAWABsAJgAbADYAGwBGABsABV1BAwCWABsAAV1BBQDmABsA9gAbAAJxQQUA7wAbAP8AGwACXUEDAH8AGwABcUEDANcAGwABcUEDAKYAGwABcUEDAGYAGwABXUEDAMYAGwABcUEDALAAGwABcUEHAAAAGwAQABsAIAAbAANxALgAAC+4AAkvuwAeAAEAAwAEK0EDAHAAAAABcUEDAL8AAAABcUEDAG8AAAABXUEDAA8AAAABcUEDAFAAAAABcUEDANAAAAABXUEDANsAAQABcUEDAMwAAQABcUEDADsAAQABckEDANoAAQABXUEDAHUAAwABckEDAIYAAwABckEDAE8AAwABckEDADwAAwABckEDAFUAAwABckEDALIAAwABcUEDAMAAAwABckEDADkABAABckEDAOoABQABXUEDAJkABQABXUEDAOQABwABXUEDAKYACAABXUEDAMYACAABXUEDALMACAABXUEDAG8ACQABXUEDAA8ACQABcUEDAN8ACQABcUEDAL8ACQABcUEDAI8ACQABXUEDANAACQABXUEDAHAACQABcUEDAK4AHgABcUEDAI8AHgABXUEDAG0AHgABckEDANcAHgABcboADgADAB4REjm4AAMQuQAQAAH0QQMAZgAQAAFxQQMAhwASAAFdQQMA5gASAAFduAAJELgAFNC4ABQvQQMA/wAUAAFyQQMALwAUAAFyQQMArgAUAAFyuAAJELkAGAAC9EEDAHcAGAABcUEDAKkAGAABcUEDANgAGAABcUEHAFAAGABgABgAcAAYAANdQQMAkAAYAAFdMDEBQQMA2QAIAAFdQQMA1gAKAAFdQQMA2wAOAAFdAEEDANYABwABXUEDANYACwABXUEDANkADgABXRMOASMiJjU0NjMyFhUUBxYzNjc2Nwc0JiMiBhUUFjMyNjEBWEM6RiYaGiYeDhcxIBwClhMNDRQUDQ0TAmtEVzAnGiYlGiIUAwEmIzJCDhMTDg4SEgAAAAEAGAAAAQQBkAAPA1a7AAAABQABAAQrQQUA1QAIAOUACAACcUEDADYACAABckEDAPcACAABXUEDAMcACAABcUEDAFcACAABckEDAOgACAABXUEDAEsACAABcUEDABgACAABckEDACcACAABckEDAIcACAABcUEDAGYACAABcUEFAJYACACmAAgAAnFBAwBFAAgAAXJBAwD0AAgAAXFBAwAEAAgAAXJBAwD4AAkAAV1BAwCYAAkAAXFBBwDZAAkA6QAJAPkACQADcUEDAAkACQABckEDAEsACQABckEDACwACQABckEDAD0ACQABckEDABsACQABckEHAGkACQB5AAkAiQAJAANxQQMAqQAJAAFxQQMAOAAJAAFxQQMAhwAJAAFdQQMAVQAJAAFyQQMAHAALAAFyQQMAWAALAAFyQQcAGAALACgACwA4AAsAA11BAwBVAA0AAXJBAwAXAA0AAV1BAwAlAA0AAV1BAwBFAA0AAXFBAwA0AA0AAV1BAwCPABEAAV1BBwAPABEAHwARAC8AEQADXUEFAE8AEQBfABEAAl1BAwDwABEAAV0AuAAARVi4AAwvG7kADAAQPlm4AABFWLgAAC8buQAAAAo+WUEDAFAAAgABckEDADwAAgABcUEDACoAAgABcUEDAEAAAgABcUEDACAAAgABXbgADBC5AAUAAfRBBQA5AAUASQAFAAJyQSEACAAFABgABQAoAAUAOAAFAEgABQBYAAUAaAAFAHgABQCIAAUAmAAFAKgABQC4AAUAyAAFANgABQDoAAUA+AAFABBdQSEACAAFABgABQAoAAUAOAAFAEgABQBYAAUAaAAFAHgABQCIAAUAmAAFAKgABQC4AAUAyAAFANgABQDoAAUA+AAFABBxQQcACAAFABgABQAoAAUAA3JBAwBWAAgAAXJBAwBWAAkAAXJBAwBZAAoAAXJBAwA3AA4AAV1BAwBRAA4AAXJBAwAgAA4AAV1BAwBgAA8AAXFBAwBRAA8AAXFBAwCSAA8AAXFBAwCDAA8AAXFBAwAEAA8AAV1BAwA2AA8AAV1BAwB0AA8AAXFBAwBTAA8AAXJBAwBDAA8AAV1BAwASAA8AAV1BAwBRAA8AAV1BAwBAAA8AAXFBAwAgAA8AAV0wMUEDACUADwABXSEjETQmIyIGByM+ATMyFhUBBCQtJyMqAiUBQTM6PQErHicvGypAOC4AA/9eAAABBAJnAA8AGwAnB2i7ACIABgAWAAQruwAQAAYAHAAEK7sAAAAFAAEABCtBAwBpAAQAAXJBBQApAAQAOQAEAAJxQQMARgAGAAFxQQMAJgAGAAFxQQMAVQAGAAFyQQMAYwAGAAFyQQMA1gAIAAFxQQMApgAIAAFxQQMAlwAIAAFxQQMAFwAIAAFyQQUAGAAIACgACAACXUEDAOgACAABXUEDANkACAABXUEDACkACAABckEDADkACAABXUEFAFkACABpAAgAAnJBAwD5AAgAAV1BAwB4AAgAAXJBAwBYAAgAAV1BAwA3AAgAAXJBAwDHAAgAAXFBAwA3AAgAAXFBAwBGAAgAAXJBAwDlAAgAAXFBAwD0AAgAAXFBAwAEAAgAAXJBAwAnAAkAAV1BAwBoAAkAAXFBAwDIAAkAAXFBAwAoAAkAAXFBAwB6AAkAAXFBBwAcAAkALAAJADwACQADckEDAEsACQABckEFAOkACQD5AAkAAnFBAwAIAAkAAXJBBwCIAAkAmAAJAKgACQADcUEDAGcACQABckEDAFYACQABckEDAFUACQABXUEDAGkACgABcUEDAIkACgABcUEDAIYACwABckEDAEgACwABcUEDAGoACwABcUEDACcACwABXUEDAHQACwABckEFAFAACwBgAAsAAnJBAwBlAAwAAXJBAwBUAAwAAXJBBwAWAA0AJgANADYADQADXUEDAGoADQABckEDAFcADQABckEDAGYADQABcUEDAEUADQABcUEDAKAAEAABcUEDACAAEAABckEDADEAEAABckEDABIAEAABckEDACYAEAABcUEFAAYAEAAWABAAAl1BAwAIABAAAXJBAwD2ABAAAXFBAwBGABAAAV1BAwCxABAAAXFBAwBAABAAAXJBBwDAABAA0AAQAOAAEAADcUEDAFAAEAABcUEDADAAEAABcUEDAN8AFgABckEDAM8AFgABXUEDAL8AFgABckEDAE8AFgABcUEDADAAHAABcUEDAEIAHAABckEDAAkAHAABckEDABIAHAABckEFACEAHAAxABwAAnJBCwCgABwAsAAcAMAAHADQABwA4AAcAAVxQQMAUAAcAAFxQQMAJgAiAAFxQQUABgAiABYAIgACXUEDAE8AIgABcUEDAN8AIgABckEDAL8AIgABckEDAM8AIgABXUEHAAYAIgAWACIAJgAiAANyQQMARgAiAAFdQQUANQAiAEUAIgACckEDAI8AKQABXUEHAA8AKQAfACkALwApAANdQQUATwApAF8AKQACXUEDAPAAKQABXQC4AABFWLgADC8buQAMABA+WbgAAEVYuAAALxu5AAAACj5ZuwAZAAEAHwAEK7sAJQABABMABCtBAwAhAAIAAV1BAwAQAAIAAV1BAwBQAAIAAXK4AAwQuQAFAAH0QQUAOQAFAEkABQACckEhAAgABQAYAAUAKAAFADgABQBIAAUAWAAFAGgABQB4AAUAiAAFAJgABQCoAAUAuAAFAMgABQDYAAUA6AAFAPgABQAQXUEhAAgABQAYAAUAKAAFADgABQBIAAUAWAAFAGgABQB4AAUAiAAFAJgABQCoAAUAuAAFAMgABQDYAAUA6AAFAPgABQAQcUEHAAgABQAYAAUAKAAFAANyQQMAcAAIAAFyQQMAVQAJAAFyQQMAYwAJAAFyQQMAWgAKAAFyQQMAaAAKAAFyQQMANAAOAAFdQQMAEwAOAAFdQQMAIAAOAAFdQQMAUAAPAAFdQQMAkAAPAAFxQQMAcgAPAAFxQQMAdwAPAAFyQQMAMwAPAAFdQQMAgQAPAAFxQQcAQAAPAFAADwBgAA8AA3FBBQAQAA8AIAAPAAJdQQMAUAAPAAFyQQMALwATAAFxQQMAQAAZAAFxQQMA4AAZAAFxQQMA7wAZAAFdQQMAbwAZAAFdQQMAwAAZAAFxQQMAMAAZAAFdQQMAoAAZAAFyQQMAwAAfAAFxQQMAoAAfAAFyQQMAbwAfAAFdQQMA7wAfAAFdQQMA4AAfAAFxQQMAQAAfAAFxQQMAMAAfAAFdQQMALgAlAAFxMDEBQREAVgASAGYAEgB2ABIAhgASAJYAEgCmABIAtgASAMYAEgAIXUERAFkAFABpABQAeQAUAIkAFACZABQAqQAUALkAFADJABQACF1BEQBZABgAaQAYAHkAGACJABgAmQAYAKkAGAC5ABgAyQAYAAhdQREAVgAaAGYAGgB2ABoAhgAaAJYAGgCmABoAtgAaAMYAGgAIXQBBAwAAAA4AAV1BAwBGAA4AAV1BAwAAAA8AAV1BAwBAAA8AAV1BAwAiAA8AAV1BEQBZABEAaQARAHkAEQCJABEAmQARAKkAEQC5ABEAyQARAAhdQQMAqAAVAAFdQQsAWQAVAGkAFQB5ABUAiQAVAJkAFQAFXUEFALkAFQDJABUAAl1BCwBWABcAZgAXAHYAFwCGABcAlgAXAAVdQQUAtgAXAMYAFwACXUEDAKcAFwABXUERAFYAGwBmABsAdgAbAIYAGwCWABsApgAbALYAGwDGABsACF0hIxE0JiMiBgcjPgEzMhYVJRQGIyImNTQ2MzIWBzQmIyIGFRQWMzI2AQQkLScjKgIlAUEzOj3+8ywgIC0tICAsIRoREhoaEhEaASseJy8bKkA4LvAgLCwgIC0tIBIaGhISGRkAAAAAAv6nAcf/zgJbAAkAEQaKQQMARQAAAAFyQQMAdgAAAAFxQQMA+AAAAAFdQQMACAAAAAFyQQMACQAAAAFxQQUAKwAAADsAAAACXUEDAHgAAAABXUEDALgAAAABcUEDAGcAAAABXUEDAMYAAAABcUEDANQAAAABcUEDABMAAAABckEDAB0AAQABckEDANoAAQABcUEDALgAAQABcUEDAEUABAABXUEDAHYABAABXUEDAAcABAABcUEDACgABAABXUEDACcABAABckEDAKYABAABXUEDADMABAABXUEDAGIABAABXUEDAEgABQABcUEDAAkABgABckEDACoABgABcUEDAMoABgABcUEDAHkABgABcUEDAJcABgABcUEDAGUABgABcUEDAAkABwABXUEDACwABwABckEDAPoABwABcUEDAJcABwABcUEDAKUABwABXUEDABwACAABXUEDACUACQABckEDALYACQABcUEDAJkACQABXUEDAGkACQABXUEDAHoACQABXUEDABkACQABcUEDAMgACQABXUEDAPUACQABcUEDABQACQABckEDAAMACQABckEDAOgACgABXUEDAGgACgABXUEDAAsACgABckEFADwACgBMAAoAAnJBAwAuAAoAAXJBAwDLAAoAAXFBAwDpAAoAAXFBAwAIAAoAAXFBAwDXAAoAAXFBAwA0AAoAAV1BAwDJAAsAAXFBAwB6AAsAAXFBAwC6AAsAAXFBAwCLAAsAAXFBAwDMAAsAAV1BAwA8AAsAAXJBAwDuAAsAAXFBAwAtAAsAAXJBAwDcAAsAAXFBAwArAAsAAXFBAwAaAAsAAXFBAwCaAAsAAXFBAwAZAAsAAXJBAwCpAAsAAXFBAwCpAAsAAV1BAwBoAAwAAXFBAwCmAA0AAXFBAwDGAA0AAV1BAwClAA0AAV1BAwAxAA4AAXJBAwBjAA4AAV1BAwB1AA4AAV1BAwAFAA4AAXJBBQDWAA4A5gAOAAJdQQMAhgAOAAFxQQMARwAOAAFxQQMAKgAOAAFxQQMAFwAOAAFxQQMApgAOAAFxQQMAZgAOAAFxQQMANQAOAAFdQQMA5QAOAAFxQQMA1AAOAAFxQQMAEwAOAAFyQQMAIAAOAAFyQQMAQAAOAAFyQQMAlAARAAFxQQMAtQARAAFxQQMApwARAAFxQQMA9QARAAFxQQMAEwARAAFyQQMA0AARAAFxALgAAC+7AAgAAgAMAAQruwAQAAIAAgAEK0EDANwAAAABcUEDAF0AAAABXUEDAO0AAAABXUEDAD0AAAABXUEDAJ0AAAABXUEDAEwAAAABckEDAJwAAAABcUEDAHcAAAABXUEDADsAAQABckEDAKgAAQABcUEDANMAAQABXUEDAHMAAgABXUEDALIAAgABXUEDANIAAgABXbgAAhC4AATQuAAEL0EDAEkABAABckEDANcABAABXUEDANwABQABXUEDAHcACAABXUEDAJ0ACAABXUEDAG0ACAABXUEDAF8ACAABXUEDAE4ACAABXUEDAD0ACAABXUEDABsACAABXUEDAGAACAABcUEDAEAACAABcUEDAJ8ACQABXUEFAG0ACQB9AAkAAl26AAoAAgAEERI5QQMAaQAKAAFdQQMAWwAKAAFdQQMAPAAKAAFdQQMAvwAKAAFdQQMAfAAKAAFdQQMA6wAKAAFdQQMAmAAKAAFdQQMAtgAKAAFxQQMAngALAAFdQQMATQAMAAFdQQMAngAMAAFdQQMAPwAMAAFdQQMAXgAMAAFdQQMAbQAMAAFdQQMAYwAMAAFxQQMAQAAMAAFxQQMAGwANAAFxQQMA1AANAAFdQQMAswAQAAFdQQMAcgAQAAFdQQMA0QAQAAFdugAOAAIAEBESOUEDAHcADgABXUEDALUADgABXUEDANQADwABXUEDALUAEQABcUEDAEAAEQABcjAxAUEDADMAAAABckEDADUAAAABcUEFAEYAAABWAAAAAnFBAwA7AAEAAXJBAwBbAAUAAXFBAwCXAAYAAXFBAwBaAAYAAXFBAwBrAAYAAXFBAwBaAAcAAXFBAwBsAAcAAXFBAwCcAAcAAXFBAwBDAAoAAXJBAwBJAAsAAXJBAwBrAAsAAXFBAwBFAA0AAXJBAwBGAA4AAXJBAwBnAA4AAXFBAwAZAA4AAXFBAwBZAA4AAXFBAwAhABIAAXIAQQMARwAAAAFxQQMARwAAAAFyQQMAOAABAAFyQQMAFQAFAAFxQQMAFwAGAAFxAyYjIgc2NzYzMgcmIyIHNjMyMnNlJCsBKiY1hw0sTUYYFRpgAccpBjQgHW5RNQMAAAAAAv6nAcf/zgKHAA4AFgT1uwANAAYADwAEK7gADRC4AADQuAAAL0EDADwAAQABckEDADcABAABckEDAJcABAABcUEDADgABAABcUEDAFoABAABcUEDABoABAABXUEDAJgABAABXUEDAAcABAABcUEDAEYABAABckEDACYABAABckEDAFoABgABcUEDAHgABgABcUEDAEkABwABcUEDACoABwABckEDAAoABwABckEDABkABwABckEDAEUABwABckEFADYACQBGAAkAAl1BAwBQAAkAAV1BAwAoAA8AAXJBAwCYAA8AAXG4AA8QuAAK0EEDAGkAEAABcUEDAC0AEAABckEDAA8AEAABckEDAEkAEAABckEDABgAEAABckEDAHgAEAABcUEDACoAEgABckEDAAcAEgABckEDAEAAEgABckEDAAQAEwABckEDANUAEwABXUEDAOcAEwABXUEDABcAEwABckEDAJkAEwABXUEDADoAEwABcUEDABoAEwABXUEFAEgAEwBYABMAAnFBAwD3ABMAAXFBAwA3ABMAAXJBAwCUABMAAXFBAwAgABMAAXJBAwBAABMAAXJBAwBAABYAAXIAuAALL7gAAC+7ABUAAgACAAQruwAIAAIAEQAEK0EDAF0AAAABXUEDAD0AAAABXUEDAJkAAAABcUEDAHcAAAABXUEDABsAAQABckEDAEkAAQABckEDACgAAQABckEDAHMAAgABXUEDALIAAgABXUEDANIAAgABXbgAAhC4AATQuAAEL0EDADgABAABcUEDANgABAABXUEDALcABAABXUEDANsABQABXUEDAAMACAABXUEDAG8ACAABXUEDAJ8ACAABXUEDAAgACAABckEDAGAACAABcUEDAEAACAABcUEDACMACQABXUEFAJ8ACwCvAAsAAl1BAwAbAAsAAV26AAoAAAALERI5QQMAJQAKAAFdQQMAnwAKAAFdQQMABQAKAAFyQQMAJQAKAAFyugAPAAIABBESOUEDAJ8ADwABXUEDAL0ADwABXUEDAHgADwABXUEDAA8AEAABckEDADgAEAABckEDACUAEAABXUEDAAgAEQABckEDAG8AEQABXUEDAJ8AEQABXUEDAEAAEQABcUEDAGAAEQABcUEDAHIAFQABXUEDANIAFQABXUEDALEAFQABXboAEwACABUREjlBAwB3ABMAAV1BAwC3ABMAAV1BAwC0ABQAAV1BAwAoABYAAXJBAwD2ABYAAXEwMQFBAwA/AAEAAXJBAwDVAAQAAXFBAwDVAAYAAXFBAwCIAAYAAXFBAwDlAAcAAXFBAwB0AA8AAV1BAwCJAA8AAXFBAwBKAA8AAXJBAwCKABAAAXFBAwBKABAAAXJBAwA8ABAAAXJBAwDhABIAAXFBAwCkABIAAXFBAwDWABIAAXFBAwBGABIAAXJBAwDRABMAAXFBAwDjABMAAXFBAwAzABMAAXJBAwCkABMAAXFBAwC1ABMAAXFBAwBGABMAAXJBAwC1ABYAAXFBAwAgABcAAXIAQQMAnAAAAAFdQQMA3AAAAAFxQQMA9AAJAAFxQQMAwgAKAAFxQQMAowAKAAFxQQMA4wAKAAFxQQMAhQAKAAFxQQMA1gAKAAFxQQMAmAAPAAFdQQMAegAPAAFdQQMA2QARAAFxQQMAtQAWAAFxQQMA1QAWAAFxQQMARwAWAAFyQQMAJwAXAAFxAyYjIgc2NzYzMhc1MxUWJyYjIgc2MzIyc2UkKwEqJjVQKiEEJSxNRhgVGmABxykGNCAdNWGlDRhRNQMAA/6nAcf/6QKCABgAIAAsCJ26ABIADAADK0EDAOcADAABXUEHAAkADAAZAAwAKQAMAANdQQ0ASQAMAFkADABpAAwAeQAMAIkADACZAAwABl1BAwDJAAwAAV1BAwC5AAwAAXFBAwDYAAwAAV1BAwA2AAwAAV1BAwCyAAwAAV1BAwCyABIAAV26AAAADAASERI5QQMAOAAAAAFdQQMA6QAAAAFdQQMA+gAAAAFdQQMACgAAAAFxQQMASgAAAAFyQQMA2gAAAAFdQQMAyAAAAAFxQQMAtgAAAAFdQQMAMgAAAAFyQQMA/wABAAFxQQMAlgAEAAFxQQMAJwAEAAFdQQMA5wAEAAFdQQMAeAAEAAFxQQMACQAEAAFyQQMAugAEAAFxQQUA2wAEAOsABAACcUEDAMwABAABcUEDAFsABAABcUEDAPoABAABcUEDACoABAABcUEFADgABABIAAQAAnFBAwA3AAQAAXJBAwC3AAQAAV1BAwA2AAQAAV1BAwDUAAQAAV1BAwBRAAQAAV1BAwCGAAYAAV1BAwA4AAcAAV1BAwAvAAcAAXJBAwCZAAcAAXFBAwCmAAcAAXFBAwAFAAcAAXJBAwBRAAkAAV26AAoADAASERI5QQMAtQAKAAFdQQMAxAAOAAFdQQMAsgAOAAFdQQMAMwATAAFxQQUAFgATACYAEwACcUEFAIQAEwCUABMAAnFBAwBzABMAAXFBBQBCABMAUgATAAJxQQMAsAAUAAFdugAXAAwAEhESOUEDADYAFwABckEDAEoAFwABcUEDALsAFwABcUEDAEgAFwABckEDANQAFwABcUEDAPMAFwABcUEDAAoAGAABcUEDAAsAGAABckEFAOkAGAD5ABgAAl1BAwD4ABgAAXG6ABkADAASERI5QQMA+AAZAAFdQQMA6QAZAAFdQQMAuwAZAAFxQQMATQAZAAFxQQMADwAZAAFyQQMATwAZAAFyQQMAzQAZAAFxQQMALAAZAAFyQQMACgAZAAFxQQMA6QAZAAFxQQMAOAAZAAFyQQMAtAAZAAFdQQMATwAaAAFxQQUAPwAaAE8AGgACckEDAOoAGgABcUEDAJMAHQABcUEDAKUAHQABcUEDAEYAHQABckEDACcAHQABckEDAIcAHQABXUEDAEgAHQABcUEDADsAHQABcUEDAFoAHQABcUEDALcAHQABXUEDAOcAHQABXUEDAOYAHQABcUEDANYAHQABXUEDALQAHQABcUEDADIAHQABckEDAAEAHQABckEDAL0AIAABXUEDANIAIAABcUEDAPEAIQABXUEDAAIAIQABcUEDAFMAIQABcUEHAGQAIQB0ACEAhAAhAANxQQUAGQAhACkAIQACcUEFAJUAIQClACEAAnFBAwAzACEAAXFBAwDSACEAAV1BAwBCACEAAXFBBQCwACEAwAAhAAJdQQMA4AAhAAFdQQMA0gAnAAFdQQMABAAnAAFxQQMANgAnAAFxQQUAaAAnAHgAJwACcUEDACsAJwABcUEDABwAJwABcUEDAKsAJwABcUEFAIkAJwCZACcAAnFBBQBHACcAVwAnAAJxQQUAtQAnAMUAJwACcUEFAOMAJwDzACcAAl1BAwDBACcAAV1BAwCwACcAAV0AuAAAL7sAHwACAAIABCu6AA8AGwADK0EDADwAAAABXUEDAL0AAAABcUEDAN0AAAABcUEDAFwAAAABXUEDAPkAAAABcUEDAHYAAQABcUEDAD4AAQABckEDAJkAAQABcUEDAFUAAQABcUEDAGIAAQABcUEDAHIAAgABXUEDAJMAAgABXUEDALEAAgABXUEDANEAAgABXbgAAhC4AATQuAAEL0EDADgABAABcUEDALMAGwABXUEDAGEAGwABcUEDAEAAGwABcbgAGxC5AAgAAvRBAwC2AAgAAV1BBQAmAAgANgAIAAJdQQMAEwAIAAFdQQMAAQAIAAFdQQMAVwAJAAFdQQMAJQAJAAFdQQMAzQAPAAFdQQMArAAPAAFdugAKABsADxESOUEDALYACgABcUEDANwACgABXUEDALoACgABXUEDAFUACgABcUEDACUACgABXUEDADMADAABXUEDACQADgABcUEDAIUADgABcUEDABYADgABcUEDAKwADgABXUEDAJYADgABcUEDADYADgABcUEDAFQADgABcUEDAKMADgABcUEDAHAADgABcUEDAAMAEAABcUEDAFQAEAABcUEFAIUAEACVABAAAnFBAwA2ABAAAXFBAwDmABAAAV1BAwDHABAAAV1BAwD3ABAAAV1BAwBnABAAAXFBAwBHABAAAXFBAwCmABAAAV1BAwAWABAAAXFBAwAkABAAAXFBAwDTABAAAV1BAwChABAAAXFBAwBxABAAAXFBAwBqABMAAXFBAwCpABQAAXG4AA8QuAAV3LoAFwAPABUREjlBAwDXABcAAXFBAwC3ABcAAV26ABkAAgAEERI5QQMA3gAZAAFdQQMAvwAZAAFdQQMA+QAZAAFdQQMAQwAZAAFyQQMAsQAfAAFdQQMAcgAfAAFdQQMAkQAfAAFdQQMA0QAfAAFdugAdAAIAHxESOUEDALYAHQABXUEDAHYAIAABcUEDAFYAIAABcUEDAGUAIAABcUEDAEIAIAABckEDADIAJAABXUEDANMAJAABXUEDAAQAJAABcUEDAIUAJAABcUEDADYAJAABcUEDABcAJAABcUEDAPgAJAABXUEDACoAJAABckEDAEgAJAABcUEDAJcAJAABcUEDAGYAJAABcUEDAOYAJAABXUEDAFQAJAABcUEDACMAJAABcUEDAKMAJAABcUEDAHIAJAABcUEDACAAJAABXbgAGxC4ACrQuAAqL0EDAE8AKgABcUEDAG4AKgABcUEDALAAKgABcTAxAUEDABEAAAABckEDABoABwABckEDABUAHQABckEDAEUAHQABcgBBAwAZAAEAAXIDJiMiBzY3NjMyFyY1NDYzMhYVFAYjIicWByYjIgc2MzI3NCYjIgYVFBYzMjYyc2UkKwEqJjU2JwMdFBQdHRQFCBkdLE1GGBUaYHMPCwsPDwsLDwHHKQY0IB0aCAgUHR0UFB0CIxJRNQNFCw8PCwsPDwAC/qcBx//OAocAEwAbBU27ABAABwAMAAQrQQMALwAQAAFxQQUALwAQAD8AEAACckEDALwAEAABcbgAEBC5ABIABvS4AADQuAAAL0EDAEsAAQABckEDAOEABAABcUEDAEQABAABckEDAPUABAABcUEDAKYABAABcUEDAOcABAABXUEDAFoABAABcUEDALcABAABcUEFAAcABAAXAAQAAnFBAwBmAAQAAXFBAwCVAAQAAXFBAwDUAAQAAV1BAwDQAAQAAXFBAwAAAAQAAXJBAwAbAAYAAXFBAwBIAAYAAXFBAwDhAAYAAXFBAwAFAAcAAXJBAwDGAAcAAXFBAwBEAAcAAXJBAwDyAAcAAXFBAwBMAAoAAXJBAwALAAoAAXJBAwD6AAoAAXFBAwC/AAsAAXFBAwAvAAwAAXFBAwC/AAwAAXG6ABQADAAAERI5QQMATQAUAAFyQQMALwAUAAFyQQMAOwAUAAFyQQMA1gAUAAFdQQMA+wAVAAFxQQUACwAVABsAFQACckEDAE8AFQABckEDAC0AFQABckEDADsAFQABckEDAHgAFQABcUEDAOQAFwABcUEDAEAAFwABckEDAPAAFwABcUEDAAAAFwABckEDACIAGAABckEDAMMAGAABcUEDAKQAGAABcUEDALYAGAABcUEDAIcAGAABXUEDAEoAGAABcUEDAFkAGAABcUEDAOYAGAABXUEDANUAGAABXUEDAJMAGAABcUEDADMAGAABckEHANAAGADgABgA8AAYAANxQQMAAAAYAAFyQQMAQAAYAAFyQQMAFgAbAAFyQQMAQgAbAAFyALgAAC+7ABoAAgACAAQrugALABYAAytBAwBfAAAAAV1BAwA9AAAAAV1BAwD8AAEAAXFBAwA8AAEAAXJBAwCbAAEAAXFBAwCyAAIAAV1BAwBzAAIAAV1BAwCSAAIAAV1BAwDQAAIAAV24AAIQuAAE0LgABC9BAwAlAAYAAV1BAwAnAAcAAXJBAwAjAAcAAV1BAwBhABYAAXFBAwAVABYAAV1BAwC/ABYAAXFBAwCzABYAAV1BAwBAABYAAXFBAwBwABYAAXG4ABYQuQAIAAL0QQMAFAAIAAFdQQcAbAALAHwACwCMAAsAA11BAwCbAAsAAV1BAwBbAAsAAV1BAwCtAAwAAV1BAwBiAA0AAXFBAwB1AA0AAXFBAwC2AA0AAV1BAwBFAA0AAXFBAwDzAA0AAXFBAwCiAA0AAXFBAwDBAA0AAXFBAwBEAA8AAXFBAwD1AA8AAXFBAwAFAA8AAXJBAwC1AA8AAV1BAwB3AA8AAXFBAwCmAA8AAV1BAwBlAA8AAXFBAwDEAA8AAXFBAwCEAA8AAXFBAwCjAA8AAXG4AAsQuAAQ0EEDAK8AEAABXboAFAACAAQREjlBAwDcABQAAV1BAwAoABQAAXJBAwAPABcAAXJBAwD6ABcAAXFBAwCSABoAAV1BAwBzABoAAV1BAwCyABoAAV1BAwDRABoAAV26ABgAAgAaERI5QQMAFwAYAAFdQQMA9wAYAAFxQQMAtQAbAAFxQQMAQgAbAAFyMDEBQQMAuAAEAAFxQQMA7AAKAAFxQQMA7AALAAFxQQMATAAVAAFyQQMA4AAXAAFxQQMARAAXAAFyQQMAAgAYAAFyQQMA1AAYAAFxQQMA5gAYAAFxQQcA0AAcAOAAHADwABwAA3FBAwAAABwAAXJBAwAgABwAAXIAQQMA2wABAAFxQQMArwALAAFdQQMApwAMAAFdQQMA0gANAAFxQQMAFAANAAFyQQMA0AAOAAFxQQMAEwAOAAFyQQMA1AAPAAFxQQMAFwAPAAFyAyYjIgc2NzYzMhc1MxUWFzUzFRYnJiMiBzYzMjJzZSQrASomNRcTIRwTIQQlLE1GGBUaYAHHKQY0IB0EMDwNGGGlDRhRNQMAAv9e/xj/yP/QAA0AGQLvuAAaL7gAGy+4AA0vuAAHL7gAFC+4ABsQuAAA3EEFAA8AAAAfAAAAAl25AAEABfRBBQBZAAYAaQAGAAJxQQMAegAGAAFxQQMAiwAGAAFxQQMAGgAGAAFxQQMACQAGAAFxQQMASAAGAAFxuAAaELgAB9C4AAcvQQMAIAAHAAFxQQMAAwAHAAFdQQsAIAAHADAABwBAAAcAUAAHAGAABwAFXUEJAIAABwCQAAcAoAAHALAABwAEckEDAFAABwABckEDAAkACAABcUEDABoACAABcUEDAIsACAABcUEDAHoACAABcUEFAFkACABpAAgAAnFBAwBIAAgAAXFBBQAPAA0AHwANAAJduAANELkADgAG9EEHAF8ADgBvAA4AfwAOAANyQQMACAAOAAFduAAHELkAFAAG9EEDAEUAFAABckEDAAYAFAABXUELAIYAFACWABQApgAUALYAFADGABQABV1BAwBRABQAAXJBBQBgABQAcAAUAAJyALgAAC+4AAovuAAXL7oACgAEAAMrQQMAcAAAAAFxQQMA0AAAAAFdQQUAkAAEAKAABAACcUEDAB8ABAABXUEFAF8ABABvAAQAAnFBAwDSAAQAAV1BCQCwAAQAwAAEANAABADgAAQABHJBBQAAAAQAEAAEAAJyugACAAQAChESOUEDADwABgABcUEDACsABgABcUEFAOgABgD4AAYAAl1BBQAnAAgANwAIAAJxQQUA5QAIAPUACAACXUEDANMACAABXUEDAFAADQABcUEDAAEADQABcUEDAGEADQABcUEDAEMADQABcUEDADQADQABcUEDABMADQABcUEDAPIADQABXUEDACEADQABcUEDAOEADQABXUEDANAADQABXUEFAHAADQCAAA0AAnG4AAoQuQARAAL0QQcAXwARAG8AEQB/ABEAA3JBAwAIABEAAV1BAwAQABEAAV24AAQQuQAXAAL0QQMA1gAXAAFdQQcAUAAXAGAAFwBwABcAA3IwMQcjNQYjIiY1NDYzMhYVJzQmIyIGFRQWMzI2OCMIChYfHxYWHxsPCwsPDwsLD+hRAx8WFh8fFgELDw8LCw8PAAAAAAL+9f8L/8j/0AAXACMFmLsAHgAGAAoABCu7ABAABgAYAAQruwAAAAUAFQAEK0EFACoAAwA6AAMAAnJBBQDsAAMA/AADAAJxQQUAywADANsAAwACcUEDALgAAwABcUEDAHIAAwABXUEDAFAABAABXUEDANIACgABXUEDAKIACgABcUEDAP4ACgABcUEDAF8ACgABckEDAN8ACgABckEFAL8ACgDPAAoAAl1BAwBUAAoAAV1BAwBiAAoAAV1BAwDhAAoAAV1BAwCAAAoAAXK6AAUACgAAERI5QQMAVQAFAAFyQQMA2QAFAAFyQQMAOwAFAAFyQQMAfAAFAAFyQQMATwAFAAFyQQMAfQAFAAFxQQUAjAAFAJwABQACcUEDAMoABQABckEHAJkABQCpAAUAuQAFAANyQQMAUwAFAAFdQQMAYAAFAAFdQQMAgQAQAAFdQQMAMwAQAAFxQQMAUgAQAAFdQQUAYAAQAHAAEAACXUEDANAAEAABXUEDAF8AGAABckEDANEAGAABXUEDADAAGAABcUEDAKAAHgABcUEXAAYAHgAWAB4AJgAeADYAHgBGAB4AVgAeAGYAHgB2AB4AhgAeAJYAHgCmAB4AC11BAwD2AB4AAV1BBwAGAB4AFgAeACYAHgADcUEJALYAHgDGAB4A1gAeAOYAHgAEcUEDALoAHgABXUEDAP8AHgABcUEDAN8AHgABckEDAM4AHgABXUEDADcAHgABcUENAEYAHgBWAB4AZgAeAHYAHgCGAB4AlgAeAAZxQQcABgAeABYAHgAmAB4AA3JBAwDRAB4AAV1BAwDgAB4AAV1BAwCAAB4AAXIAuwATAAEAAgAEK7oADQAHAAMruwANAAIAGwAEK0EFAGkAAAB5AAAAAnFBBQDaAAAA6gAAAAJdQQMA+wAAAAFdQQMADQAAAAFxQQMAHwAAAAFxQQMAXAAAAAFxQQUAOgAAAEoAAAACcUEDACkAAAABcUEDAPgAAAABckEDAIAAAAABXUEDAOYAAQABckEDAHEAAgABXUEDAA0AAgABXUEDAIMAAgABXUEDAFEAAgABcUEDAGAAAgABXUEFAKYAAwC2AAMAAl1BAwDpAAMAAXJBAwBxAAMAAV1BAwBQAAMAAXJBAwCjAAQAAV1BAwDHAAQAAV1BAwBpAAQAAXFBAwD5AAQAAXJBBQB6AAQAigAEAAJxQQMA6gAEAAFdQQMAnAAEAAFxQQMADQAEAAFxQQMAHwAEAAFxQQMAXAAEAAFxQQMA+wAEAAFdQQUAOgAEAEoABAACcUEDAKkABAABcUEDACkABAABcUEDAJQABAABXUEDAIAABAABXUEDAFAABAABckEFAIEABwCRAAcAAnJBBQDTAAcA4wAHAAJdQQMAcQAHAAFxQQUAYAAHAHAABwACckEDAKAABwABcroABQAHAA0REjlBAwD6AAgAAV1BAwAKAAgAAXFBAwBqAAgAAXFBAwBOAAgAAXFBAwA8AAgAAXFBAwAqAAgAAXFBAwAZAAgAAXFBAwBYAAgAAXFBBQDmAAwA9gAMAAJdQQcABgAMABYADAAmAAwAA3FBAwA3AAwAAXFBAwBGAAwAAXFBAwBiAAwAAXFBAwBQAAwAAXFBBQA3AA4ARwAOAAJxQQMA9gAOAAFdQQMABgAOAAFxQQMA1QAOAAFdQQMA4QAQAAFdQQMAJQAQAAFxQQMAFAAQAAFxQQUAUAAQAGAAEAACcUEDANAAEAABXUEDAFIAEwABcUEDAA0AEwABXUEDAGIAEwABXUEFAHAAEwCAABMAAl24AA0QuAAW0LgAFi9BAwBfABsAAXK4AAcQuQAhAAL0QQMAaAAhAAFyQQUA1QAhAOUAIQACXUEDAFAAIQABcjAxAUEDAFYABAABXUEDAFcABQABXQBBAwB3AAMAAV1BAwCGAAQAAV0HFCMiPQEGIyImNTQ2MzIWHQEUMzI9ATMHNCYjIgYVFBYzMjY4SEQIChYfHxYWHyMiJIQPCwsPDwsLD7c+PCIDHxYWHx8WWhcXizALDw8LCw8PAAAAAf+b/6D/0P/VAAsAv7sAAAAHAAYABCtBIQAGAAAAFgAAACYAAAA2AAAARgAAAFYAAABmAAAAdgAAAIYAAACWAAAApgAAALYAAADGAAAA1gAAAOYAAAD2AAAAEF1BIQAGAAAAFgAAACYAAAA2AAAARgAAAFYAAABmAAAAdgAAAIYAAACWAAAApgAAALYAAADGAAAA1gAAAOYAAAD2AAAAEHFBBwAGAAAAFgAAACYAAAADckEFADUAAABFAAAAAnIAuwAJAAEAAwAEKzAxBxQGIyImNTQ2MzIWMA8LCxAQCwsPRQsQEAsLDw8AAAADAEv/xQFPAgsAFgAiAC0EBLsAHQAHAAgABCu7AAMABgAEAAQruwARAAUAIwAEK0EDABoAIwABcUEFADoAIwBKACMAAnJBIQAJACMAGQAjACkAIwA5ACMASQAjAFkAIwBpACMAeQAjAIkAIwCZACMAqQAjALkAIwDJACMA2QAjAOkAIwD5ACMAEF1BAwAJACMAAXFBHQApACMAOQAjAEkAIwBZACMAaQAjAHkAIwCJACMAmQAjAKkAIwC5ACMAyQAjANkAIwDpACMA+QAjAA5xQQcACQAjABkAIwApACMAA3JBAwAnABEAAXG6ABcAIwARERI5uAAXL0EFAAkAFwAZABcAAnFBGwA5ABcASQAXAFkAFwBpABcAeQAXAIkAFwCZABcAqQAXALkAFwDJABcA2QAXAOkAFwD5ABcADXFBBwAJABcAGQAXACkAFwADckEFADoAFwBKABcAAnJBHwAJABcAGQAXACkAFwA5ABcASQAXAFkAFwBpABcAeQAXAIkAFwCZABcAqQAXALkAFwDJABcA2QAXAOkAFwAPXUEDAPUAFwABXUEDACMAFwABcbkAAAAF9EEDAPUAAAABXUEDAHQAAQABcUEFAMUAAQDVAAEAAnFBAwDmAAEAAXFBAwA4AAEAAXJBAwBGAAEAAXJBAwAlAAEAAXFBAwD0AAEAAXFBAwBEAAEAAXFBAwCDAAEAAXG4AAQQuAAM0LgAAxC4AA7QQQMAJgAQAAFxQQMAlAAQAAFxugATAAgAABESOUEDAEMAEwABckEDALUAEwABcUEFAMYAEwDWABMAAnFBAwCsABMAAXFBAwAXABMAAXFBAwD2ABMAAV1BAwAkABMAAXFBAwAyABMAAXJBAwASABMAAXJBAwAVABUAAXJBAwAeABoAAXJBAwC9ABoAAXFBAwA4ABsAAXJBAwBNACEAAXJBAwCvACEAAXFBAwAvACEAAXJBAwCKACEAAXFBAwA4ACEAAXJBAwD/ACUAAV1BAwAdACYAAXK4AB0QuAAp0EEDAB8AKwABckEDAD4ALQABcgC4AAMvuAANL7oAGwAfAAMrugAnACsAAytBAwAoAAIAAXJBAwA6AAUAAXFBAwBJAAUAAXFBAwApAAUAAXJBAwCWAAwAAXFBAwCqAA8AAXG6ABMAAwANERI5QQMAqgATAAFxQQMA8wATAAFdQQMAPAAaAAFyQQMArgAaAAFxQQMASgAaAAFyQQMAaQAaAAFxQQMA/QAbAAFxQQMADgAbAAFyQQUAPAAbAEwAGwACckEDAKwAGwABcUEDAPwAHwABXUEDADEAIQABckEDAE0AJwABcrgAJxC4ACnQuAApL0EDAEsAKQABckEDAKUAKQABcUEDADUALQABckEDAEQALQABcjAxJRQHFSM1IyInETY7ATUzFRYVFAcWFxYHNCcmKwEVFjMyNzYnNCcmIyIHFTMyNgFPgSEQJS04IwchcEAfFxskJiI3OxMhNiQsEiYfLhQhRi40kmkQVFEJAZoNRUcPW0McCxkeKC0YFK8FFBj3KRQQB5QtAAIANf/6ALwBkAAOABoC27gAGy+4ABwvQQMAHwAcAAFxQQcAvwAcAM8AHADfABwAA11BEQAPABwAHwAcAC8AHAA/ABwATwAcAF8AHABvABwAfwAcAAhduAAA3EEDAGAAAAABckEFAMEAAADRAAAAAnFBBwAfAAAALwAAAD8AAAADXUEDAC8AAAABcUEFAJ8AAACvAAAAAnJBBwBPAAAAXwAAAG8AAAADcUEDAI8AAAABXUEDAAYAAAABcUEDABEAAAABckEHACAAAAAwAAAAQAAAAANyQQMA4AAAAAFxuAAbELgAB9C4AAcvuQAKAAX0uAAAELkADwAG9EEDAAkADwABcUEDAMcADwABcbgAChC4ABXQuAAVLwC4AABFWLgACC8buQAIABA+WbgAAEVYuAADLxu5AAMACj5ZuwAMAAEAEgAEK0EDAPoAAgABXUEDAPoABAABXUEDAAoABQABcUEDAAwABwABcUEDAIEAEgABckEDAB8AEgABcUEDAEAAEgABckEJALAAEgDAABIA0AASAOAAEgAEcUEDAIAADAABckEDAEEADAABckEDAB8ADAABcUEJAAAADAAQAAwAIAAMADAADAAEXUEJALAADADAAAwA0AAMAOAADAAEcUEFAJAADACgAAwAAl26AAoAEgAMERI5QQMA9QANAAFduAADELkAGAAB9DAxAUEJALYAAgDGAAIA1gACAOYAAgAEXUEFALkABADJAAQAAl1BAwDpAAQAAV1BAwDaAAQAAV1BCQC2AA0AxgANANYADQDmAA0ABF1BCwAfABsALwAbAD8AGwBPABsAXwAbAAVdQQUALwAcAD8AHAACXUEDAC8AHAABcUEDAJ8AHAABcgBBCQC5AAEAyQABANkAAQDpAAEABF1BAwDIAAUAAV1BAwC5AAUAAV1BBQDZAAUA6QAFAAJdQQkAuQAGAMkABgDZAAYA6QAGAARdQQkAtgAOAMYADgDWAA4A5gAOAARdNxQGIyInJjURMxE2MzIWBzQmIyIGFRQWMzI2vCccHxQRJA4SHCchFA4OFBQODhQ+HCgWExsBUv7pCCccDhQUDg4UFAAAAAQANf/6AWkBkAAOABoAKQA1BZ27AAoABQAHAAQruwAAAAYADwAEK7sAJQAFACIABCu7ABsABgAqAAQrQQMA8AAAAAFdQQMAAAAAAAFxQQUAAAAAABAAAAACckEDAPAAAAABckEFAGYAAAB2AAAAAl1BAwD2AAAAAXFBAwBPAAAAAXFBAwAmAAAAAXJBDQBWAAAAZgAAAHYAAACGAAAAlgAAAKYAAAAGcUEJAAYAAAAWAAAAJgAAADYAAAAEXUEHAFAAAABgAAAAcAAAAANyQQkAsAAAAMAAAADQAAAA4AAAAARxQQUAkAAAAKAAAAACXUEFAEAAAABQAAAAAl1BBwBQAA8AYAAPAHAADwADckEDAPAADwABXUEDAAAADwABcUEDAE8ADwABcUEDAPAADwABckEFAAAADwAQAA8AAnJBCQCwAA8AwAAPANAADwDgAA8ABHG4AAoQuAAV0LgAFS9BBQBgABsAcAAbAAJdQQMA8AAbAAFdQQUAoAAbALAAGwACcUEDAAAAGwABckEDAKAAGwABckEDAE8AGwABcUEDAB8AGwABcUELADAAGwBAABsAUAAbAGAAGwBwABsABXJBBQDQABsA4AAbAAJxQQMAcAAbAAFxQQUAkAAbAKAAGwACXUEDADAAGwABXUEFANAAGwDgABsAAnJBAwBwACoAAXFBBQDQACoA4AAqAAJxQQsAMAAqAEAAKgBQACoAYAAqAHAAKgAFckEDAJcAKgABXUEDAHkAKgABXUEDAB8AKgABcUEDAE8AKgABcUEFAIkAKgCZACoAAnFBBwAJACoAGQAqACkAKgADXUEDAKAAKgABckEDAAAAKgABckEFAKAAKgCwACoAAnFBAwDwACoAAV1BBQDQACoA4AAqAAJyuAAlELgAMNC4ADAvuAAbELgAN9wAuAAARVi4AAgvG7kACAAQPlm4AABFWLgAIy8buQAjABA+WbgAAEVYuAADLxu5AAMACj5ZuAAARVi4AB4vG7kAHgAKPlm7AAwAAQASAAQrQQMACgACAAFxQQMA7wAHAAFdQQMADgAHAAFxQQUAkAASAKAAEgACXUEDAB8AEgABcUEDAEAAEgABckEJALAAEgDAABIA0AASAOAAEgAEcUEJALAADADAAAwA0AAMAOAADAAEcUEDAB8ADAABcUEDAEAADAABckEFAJAADACgAAwAAl1BBwAAAAwAEAAMACAADAADXboACgASAAwREjlBAwAEAA0AAXG4AAMQuQAYAAH0QRMAJwAYADcAGABHABgAVwAYAGcAGAB3ABgAhwAYAJcAGACnABgACXFBBwDXABgA5wAYAPcAGAADcUEDABcAGAABXUEDABcAGAABckEDAAwAHQABcUEDAA8AIgABcUEDAL8AIgABXUEDAO0AIgABXboAJQASAAwREjm4AAwQuAAn0EEDAAQAKAABcbgAEhC4AC3QuAAYELgAM9AwMQFBCwC2AAIAxgACANYAAgDmAAIA9gACAAVdQQUAyQAEANkABAACXUEDAPkABAABXUEDALoABAABXUELALYADQDGAA0A1gANAOYADQD2AA0ABV1BCwC2AB0AxgAdANYAHQDmAB0A9gAdAAVdQQMAyQAfAAFdQQMA+QAfAAFdQQMAyQAgAAFdQQsAtgAoAMYAKADWACgA5gAoAPYAKAAFXQBBCwC5AAEAyQABANkAAQDpAAEA+QABAAVdQQcAuQAFAMkABQDZAAUAA11BAwD5AAUAAV1BBwC5AAYAyQAGANkABgADXUEDAPkABgABXUELALYADgDGAA4A1gAOAOYADgD2AA4ABV1BCwC5ABwAyQAcANkAHADpABwA+QAcAAVdQQMA2QAgAAFdQQMA+QAgAAFdQQUAyQAhANkAIQACXUEDAPkAIQABXUELALYAKQDGACkA1gApAOYAKQD2ACkABV03FAYjIicmNREzETYzMhYHNCYjIgYVFBYzMjY3FAYjIicmNREzETYzMhYHNCYjIgYVFBYzMja8JxwfFBEkDhIcJyEUDg4UFA4OFM4nHB8UESQOEhwnIRQODhQUDg4UPhwoFhMbAVL+6QgnHA4UFA4OFBQOHCgWExsBUv7pCCccDhQUDg4UFAAAAv/Z//gA3gKLAAsALQjQuAAuL7gALy9BAwCfAC8AAV1BAwAfAC8AAXFBAwAPAC8AAV1BBwA/AC8ATwAvAF8ALwADXUEDAL8ALwABXUEDAN8ALwABXbgADNxBAwAGAAwAAXFBBwBPAAwAXwAMAG8ADAADcUEDAO8ADAABXUEDAC8ADAABcUEHAA8ADAAfAAwALwAMAANdQQMAzQAMAAFdQQMAQAAMAAFyQQkAsAAMAMAADADQAAwA4AAMAARxuQAAAAb0QQMAyQAAAAFdQQMAeQAAAAFxQQMACQAAAAFxQQUAGQAAACkAAAACXUEDAPkAAAABcbgALhC4ABPQuAATL7kAKQAF9LgABtC4AAYvQQUAlwAXAKcAFwACXUEDAMcAFwABXUEDAAgAFwABckEFAHgAFwCIABcAAnFBBQDZABcA6QAXAAJxQQUAKgAXADoAFwACckEDAPoAFwABcUEDADkAFwABcUEDABkAFwABckEDAEgAFwABckEFAKgAFwC4ABcAAnFBAwCXABcAAXFBBQBnABcAdwAXAAJdQQMAtgAXAAFdQQMAKQAYAAFxQQMARwAYAAFxQQMABgAaAAFyQQUAdgAaAIYAGgACcUEDAHkAGgABXUEDAGoAGgABXUEDAJcAGgABcUEDAKYAGgABcUEHABUAGgAlABoANQAaAANyQQMA1QAaAAFxQQMAiQAeAAFxQQMA6QAeAAFdQQMAugAeAAFxQQMAugAeAAFdQQUADAAeABwAHgACckEDAM4AHgABXUEDAKwAHgABXUEDABoAHgABcUEDACoAHgABckEDAEkAHgABckEDAIgAHgABXUEDADgAHgABckEFAOkAHwD5AB8AAl1BAwAJAB8AAXFBBQApAB8AOQAfAAJxQQUACgAfABoAHwACckEDAIoAHwABcUEDAHoAHwABXUEDANsAHwABcUEDACsAHwABXUEDALwAHwABXUEDAHwAHwABcUEDAM0AHwABXUEDAK8AHwABXUEDAF8AHwABXUEFAA0AHwAdAB8AAl1BAwDcAB8AAV1BAwA8AB8AAV1BAwCLAB8AAV1BAwBrAB8AAV1BAwAbAB8AAXFBAwCaAB8AAV1BAwDKAB8AAXFBAwDqAB8AAXFBAwApAB8AAXJBAwBIAB8AAV1BBQA2AB8ARgAfAAJyQQMABQAgAAFxQQMApgAgAAFxQQMA9wAgAAFdQQMALQAgAAFdQQMA1wAgAAFdQQMA1gAgAAFxQQMAJQAgAAFyQQMAhQAgAAFxQQMA5QAgAAFxQQMABQAhAAFxQQMAxwAhAAFdQQMA2gAhAAFxQQMARwAhAAFxQQMAdgAhAAFxQQMARQAhAAFyQQMAFAAhAAFxQQMAyAAiAAFdQQMA2QAiAAFxQQMA2gAiAAFdQQMAuQAiAAFxQQMAqAAiAAFxQQMA5gAiAAFdQQMA9QAiAAFdQQUABQAiABUAIgACcUEDAAsAIwABckEDAE0AIwABckEDAP0AIwABcUEDAMsAIwABcUEDAOoAIwABcUEDANkAIwABcUEDANUAJQABcUEFAAMAJgATACYAAnJBAwClACYAAV1BAwAlACYAAXJBBwBmACYAdgAmAIYAJgADcUEDAPYAJgABcUEDANcAJgABcUEDAFcAJgABcUEDALkAJgABckEDAGsAJgABXUEDALcAJgABXUEDALcAJgABcUEDAJcAJgABXUEDAMYAJgABXUEDAEUAJgABcUEDAJUAJgABcUEDAOMAJgABcUEDAEIAJgABckEDAMEAJgABcQC4AABFWLgADy8buQAPAAo+WbsAGQABACQABCu7ACsAAQADAAQrQQMADQADAAFdQQUAHwADAC8AAwACcUEDAKAAAwABXUEHAMAAAwDQAAMA4AADAANxuAAPELkACQAB9EEDAIcACQABXUEDAHcACQABcUEDABcACQABXUEDAPcACQABcUEHAAcACQAXAAkAJwAJAANyQQMACwARAAFxQQUAuwARAMsAEQACXUEDAA0AEwABcUEDAOoAEwABXUEDAJMAFAABcUEDAAoAFAABckEDABwAFAABckEDAE0AFAABckEFAOsAFAD7ABQAAnFBAwC1ABQAAV1BAwDSABQAAV1BAwBQABQAAV1BAwBUABUAAV1BDwBWABcAZgAXAHYAFwCGABcAlgAXAKYAFwC2ABcAB3JBAwCYABcAAXFBAwA5ABcAAXJBAwC3ABcAAV1BAwDEABcAAV1BAwAjABcAAV24ACQQuAAc0EEFACsAHAA7ABwAAl1BAwAcABwAAV1BAwAKABwAAV1BAwBKABwAAV1BAwCqAB4AAV1BAwC4AB8AAV1BAwCZAB8AAV1BAwAaAB8AAV1BAwBLAB8AAV1BAwCrAB8AAV1BAwB6AB8AAV1BAwAJAB8AAV1BBQApAB8AOQAfAAJdQQMAiAAfAAFdQQUAWAAfAGgAHwACXUEDAFIAIQABXUEDANAAIQABXUEDAGkAJgABXUEFAMcAJgDXACYAAnFBAwDGACYAAV1BAwA0ACcAAXJBAwB2ACcAAXFBAwCBACcAAXFBAwBQACcAAV1BAwBQACgAAV1BAwAzACgAAXFBAwD5ACgAAXFBAwB0ACgAAXFBAwABACgAAXJBBQCAACgAkAAoAAJxQQMAIAAoAAFyQQMAIAArAAFdQQUAHwArAC8AKwACcUEDAKAAKwABXUEHAMAAKwDQACsA4AArAANxugApAAMAKxESOTAxAUEDALYADgABXUEHANYADgDmAA4A9gAOAANdQQUA2QAQAOkAEAACXUEDAPoAEAABXUEDANYAHgABXUEDALYALAABXUEHANYALADmACwA9gAsAANdQQMALwAvAAFdQQMA7wAvAAFdQQMALwAvAAFxAEEDALkADQABXUEHANkADQDpAA0A+QANAANdQQcA2QARAOkAEQD5ABEAA11BBwDZABIA6QASAPkAEgADXUEDANgAHgABXUEDANkAHwABXUEDALYALQABXUEHANYALQDmAC0A9gAtAANdNzQmIyIGFRQWMzI2NxQGIyInJjURNCYnNjMyFjMyNxcGIyImIyIHFhURNjMyFr0VDg0UEw4OFSEoHCATEVYnBVcQSAwSBB4OIRBLESwDdw4SHCg8DhQUDg4UFA4cKBYTGwGgHDQBXh8ZCDIhJSNM/p8IJwAAA//W//gA4wKRACgANABABuS7ADsABgAaAAQruwAUAAYANQAEK7sAJAAFAAcABCu7AAAABgApAAQrQQcAkAAAAKAAAACwAAAAA3FBEQAgAAAAMAAAAEAAAABQAAAAYAAAAHAAAACAAAAAkAAAAAhyQQMAPgAAAAFxQQUA4AAAAPAAAAACckEDAOAAAAABcUEDAPAAAAABXUEDAAAAAAABcUELAGAAAABwAAAAgAAAAJAAAACgAAAABV1BAwC3AAIAAV1BAwDGAAIAAV1BBQC5AAQAyQAEAAJdQQMAyQAFAAFduAAkELgADNC4AAwvQQMAeQAOAAFxQQMAiwAOAAFxQQMAmQAOAAFxQQMAqAAOAAFxQQMAggAaAAFxQQUAkAAaAKAAGgACcboAEQAaAAAREjlBAwB1ABEAAXFBAwA0ABEAAXJBAwBDABEAAXJBAwBmABQAAXFBAwAWABQAAV1BAwAGABQAAXFBCwA2ABQARgAUAFYAFABmABQAdgAUAAVdQQMABAAUAAFdQQUAwAAUANAAFAACcUEDAMcAFgABXUEDAKcAFgABXUEDAKwAGAABXUEDAMkAGAABXUEDAEoAHAABcbgAJBC5ACAABfRBAwC3ACcAAV1BAwDGACcAAV1BCwBgACkAcAApAIAAKQCQACkAoAApAAVdQQcAkAApAKAAKQCwACkAA3FBAwDIACkAAXFBAwA+ACkAAXFBEQAgACkAMAApAEAAKQBQACkAYAApAHAAKQCAACkAkAApAAhyQQMA8AApAAFdQQMAAAApAAFxQQMA4AApAAFxQQUA4AApAPAAKQACcrgAJBC4AC/QuAAvL0EFAMAANQDQADUAAnFBBQAGADsAFgA7AAJdQQcARgA7AFYAOwBmADsAA3FBAwA2ADsAAV1BAwAGADsAAXFBBwCAADsAkAA7AKAAOwADcUEDAB8AQgABcUEHAD8AQgBPAEIAXwBCAANdQQMAvwBCAAFdALgAAEVYuAADLxu5AAMACj5ZuwAdAAIADwAEK7sAJgABACwABCu7AD4AAgAXAAQrQQMACwACAAFxQQMAuwAFAAFdQQMAuwAGAAFdQQUA3AAHAOwABwACXUEDAAwABwABcUEDAMsABwABXUEDALkABwABXUEDACIACAABXUEDAOMACAABcUEFAFMACABjAAgAAl1BCQADAAgAEwAIACMACAAzAAgABHJBAwCDAAgAAXFBAwCSAAgAAXFBAwBCAAgAAV24AB0QuAA43EEDAHUAOAABXUEDAKAAOAABXboAEQAdADgREjlBAwASABEAAV1BAwBTABEAAV1BAwCUABEAAV1BAwAFABEAAV1BAwCFABEAAV1BAwA0ABEAAV1BAwBzABEAAV1BAwBiABEAAV1BAwBCABEAAV1BAwAgABEAAV1BAwB0ABIAAXFBAwB1ABMAAXFBAwAZABQAAXFBAwAcABUAAXFBAwC3ABUAAV1BAwCwABcAAV1BAwCQABcAAXFBAwATABcAAV1BAwBoABcAAXFBAwD5ABcAAV1BAwArABcAAXFBAwA5ABcAAXFBAwBZABcAAXFBAwBIABcAAXFBAwAQABcAAXJBAwBwABcAAXFBAwDwABcAAXFBAwBAABcAAXJBAwAaABkAAXFBBQC4ABkAyAAZAAJdQQMAGQAaAAFxQQMANwAbAAFdQQMAFQAfAAFdQQMAtwAfAAFxQQ0AJgAfADYAHwBGAB8AVgAfAGYAHwB2AB8ABl1BBQCFAB8AlQAfAAJdQQMAxAAfAAFxQQMAugAhAAFxQQMAIgAjAAFdQQMAYgAjAAFdQQMAQgAjAAFdQQMAAAAjAAFdQQUAHwAsAC8ALAACcUEHAMAALADQACwA4AAsAANxQQMAoAAsAAFdQQMAoAAmAAFdQQUAHwAmAC8AJgACcUEFABAAJgAgACYAAl1BBwDAACYA0AAmAOAAJgADcboAJAAsACYREjlBAwAEACcAAXFBAwAHACkAAXK4AAMQuQAyAAH0QQUAtwAyAMcAMgACcUEFABcAMgAnADIAAl1BAwDwAD4AAXFBAwCwAD4AAV1BAwApAD4AAXFBAwBwAD4AAXFBAwCQAD4AAXFBAwAQAD4AAXJBAwBAAD4AAXIwMQFBBwDWAAIA5gACAPYAAgADXUEHANkABADpAAQA+QAEAANdQQUA1gAWAOYAFgACXUEFANkAGADpABgAAl1BBwDWACcA5gAnAPYAJwADXUEDAC8AQgABXUEDAN8AQgABXQBBBwDZAAEA6QABAPkAAQADXUEDAPkABQABXUEDAPkABgABXUEDAOcAEwABXUEFANkAFQDpABUAAl1BBQDZABkA6QAZAAJdQQcA1gAoAOYAKAD2ACgAA103FAYjIicmNRE0NzY1NCYjIgc2FhUUBiMiJjU0NjMyFhUUBhURNjMyFgc0JiMiBhUUFjMyNgM0JiMiBhUUFjMyNuMoGyAUEQkVIhklFBskIBYWIjoxJDkfDhMbKCEVDg0UEw4OFZkPDQ0PDw0NDzwcKBYTGwGZERYzDBkgFwQgGhcgICApOC0jFUoU/qkIJxwOFBQODhQUAfkLERELCxERAAAAAv/d//gA5QKZABgAJAceuAANL7oAEwAKAAMruwAAAAYAGQAEK0EDAKAAAAABXUEDAJAAAAABcUENAFAAAABgAAAAcAAAAIAAAACQAAAAoAAAAAZyQQcAHwAAAC8AAAA/AAAAA3FBBQDgAAAA8AAAAAJyQQUA0AAAAOAAAAACcUEDAPAAAAABXUEDAAAAAAABcUEFAGAAAABwAAAAAl1BAwAQAAAAAV1BAwDGAAIAAV1BAwDVAAIAAV1BAwDaAAQAAV1BAwDIAAQAAV24ABMQuQAHAAX0QQMA8wAJAAFxQQMApgAJAAFxQQMACAAJAAFxQQMAxwAJAAFxQQMARQAJAAFyQQMAcwAJAAFxQQMAkQAJAAFxQQMAKAAKAAFxQQMAGgAKAAFyQQMADAAKAAFxQQMAiwAKAAFxQQMAmgAKAAFxQQMAAwAKAAFdQQMAEgAKAAFdQQMAcgANAAFxQQMAEgANAAFyQQUAgwANAJMADQACcUEDAOIADQABcUEFAAIADQASAA0AAl1BAwDwAA0AAXG4AA0QuQAMAAb0QQMAlQAMAAFxQQMAdwAMAAFxQQMABwAMAAFdQQMAhgAMAAFxQQMAFAAMAAFyQQMA4wAMAAFxQQMAcQAOAAFxugAPAAoAExESOUEDAJMAEAABcUEDABYAEAABckEDANcAEAABcUEDAKgAEAABcUEDAEcAEAABcUEDAFYAEAABcUEFAHUAEACFABAAAnFBAwADABAAAV1BAwAQABAAAV1BAwAnABEAAXFBAwC3ABcAAV1BAwDGABcAAV1BAwDVABcAAV1BAwDwABkAAV1BAwAAABkAAXFBAwCgABkAAV1BAwCQABkAAXFBBQBZABkAaQAZAAJxQQcAHwAZAC8AGQA/ABkAA3FBCQAJABkAGQAZACkAGQA5ABkABF1BAwCJABkAAV1BBQDQABkA4AAZAAJxQQUAYAAZAHAAGQACXUEFAOAAGQDwABkAAnJBDQBQABkAYAAZAHAAGQCAABkAkAAZAKAAGQAGcrgAExC4AB/QuAAfL0EDAJ8AJgABXUEDAL8AJgABXUEDAB8AJgABcUEHAD8AJgBPACYAXwAmAANdALgADC+4ABAvuAAARVi4AAMvG7kAAwAKPlm7ABYAAQAcAAQrQQMACwACAAFxQQMAugACAAFdQQMAvgAHAAFdQQMAzwAHAAFdQQMA7QAHAAFdQQMADQAHAAFxugAIAAMADBESOUEDACoACAABcUEDALsACAABcUEDAK0ACAABcUEDAP4ACAABcUEFAD8ACABPAAgAAnJBBQAPAAgAHwAIAAJyQQMA7wAIAAFxQQMALgAIAAFyQQMA3QAIAAFxQQMAjAAIAAFxQQMAWgAIAAFxQQMAegAIAAFxQQMASQAIAAFxQQMA9gAJAAFxQQUABgAJABYACQACckEDACQACQABcUEDAOYACgABcUEDAJYACgABcUEDAAUACgABcUEDAO4ACwABcUEDAB8ACwABckEDAJ4ACwABcUEDAPsACwABcUEDAPMADgABcUEDAIQADgABcUEDAOAADgABcUEDABAADgABcroADwADAAwREjlBAwAUAA8AAXJBAwAlAA8AAXFBAwA2AA8AAXJBAwCUAA8AAXFBAwACAA8AAXJBAwDiAA8AAXFBAwCvABAAAV1BAwDcABAAAV1BAwDEABEAAXFBAwDAABIAAXFBAwAgABIAAXFBBQBAABMAUAATAAJxQQUAIQATADEAEwACckEDAAMAEwABckEDANQAEwABcUEDABIAEwABckENAHAAEwCAABMAkAATAKAAEwCwABMAwAATAAZxQQMAIAATAAFxQQUA4AATAPAAEwACcUEFAB8AHAAvABwAAnFBBwDAABwA0AAcAOAAHAADcUEDAKAAHAABXUEDAKAAFgABXUEFAB8AFgAvABYAAnFBBQAQABYAIAAWAAJdQQcAwAAWANAAFgDgABYAA3G6ABQAHAAWERI5QQMABAAXAAFxuAADELkAIgAB9EEFACcAIgA3ACIAAl1BAwCHACIAAV1BAwAHACIAAV1BBQBXACIAZwAiAAJxQQMANwAiAAFxMDEBQQUA5gACAPYAAgACXUEDAPkABAABXUEDAOUACQABcUEDABcACQABcUEDAPoACQABcUEDAPoACgABcUEDAOsACwABcUEDAOYADQABcUEDAOsADgABcUEDACgADwABcUEFABUAEAAlABAAAnFBBQDmABcA9gAXAAJdQQMALwAmAAFdQQMA3wAmAAFdQQUAHwAmAC8AJgACcQBBBQDpAAEA+QABAAJdQQMA+QAFAAFdQQMA+QAGAAFdQQMA0gAIAAFdQQMAGgAIAAFyQQMA5wAKAAFxQQMA8AAPAAFxQQMAJwAPAAFxQQMAFgARAAFxQQMAEAASAAFxQQMAEAATAAFxQQUA5gAYAPYAGAACXTcUBiMiJyY1EQcnJiczFhc3HgEVETYzMhYHNCYjIgYVFBYzMjblKBsgFBFIIQUSHxADUg0TDhMbKCIUDg4UFA4OFDwcKBYTGwIdaAxDWVcseQEWDP4LCCccDhQUDg4UFAAAAAH/qf84AJUBkAAPAea4AAkvuwAAAAUAAQAEK0EDAE8AAAABXUEDAG8AAAABXUEDAE8AAQABXUEDAG8AAQABXUEDADgABAABcUEDAPcABgABXUEJAAcABgAXAAYAJwAGADcABgAEcUEDAA0ACQABckEDAE0ACQABckEHABwACQAsAAkAPAAJAANyuAAJELkACAAF9EEDADkACAABckEDAEkACwABckEDADkACwABXUEDADYADQABXUEHAC8AEQA/ABEATwARAANdQQUAbwARAH8AEQACXQC4AAAvuAAARVi4AAwvG7kADAAQPllBAwAjAAIAAV25AAUAAfRBBQA5AAUASQAFAAJyQRsAOAAFAEgABQBYAAUAaAAFAHgABQCIAAUAmAAFAKgABQC4AAUAyAAFANgABQDoAAUA+AAFAA1dQSEACAAFABgABQAoAAUAOAAFAEgABQBYAAUAaAAFAHgABQCIAAUAmAAFAKgABQC4AAUAyAAFANgABQDoAAUA+AAFABBxQQcACAAFABgABQAoAAUAA3JBBQAIAAUAGAAFAAJdQQMANgAOAAFdQQMAMgAPAAFdQQUAYwAPAHMADwACXUEDAEEADwABXUEDACAADwABXUEDAHcAEQABXTAxAUEDACcADQABXQBBAwAmAA4AAV0XIxE0JiMiBgcjPgEzMhYVlSQtJyMqAiUBQTM6PcgB8x4nLxsqQDguAAIAOv9WAU4BnQAZACUGDLsAIAAHABMABCu7AA0ABgAaAAQruwAAAAUAAQAEK0EDAPgABAABXUEDAEoABgABckEDAPIABgABXUEFAGYAIAB2ACAAAl1BCwAGACAAFgAgACYAIAA2ACAARgAgAAVduAAgELgACNC4AAgvQQMAJwAIAAFdQQMApgALAAFdQQMAFQALAAFxQQUAkAANAKAADQACXUEDANAADQABckEDAHAADQABckEDAAUADQABcUELAEYADQBWAA0AZgANAHYADQCGAA0ABV1BAwDWAA0AAXFBBQAvAA0APwANAAJxQQMAdgANAAFxQQcABgANABYADQAmAA0AA11BAwCgAA0AAXJBAwBAAA0AAXJBBQDgAA0A8AANAAJdQQMAMAANAAFdQQcAkAANAKAADQCwAA0AA3FBAwAVAA8AAXFBAwAKABEAAXFBAwAZABEAAXFBAwA7ABQAAXFBAwC1ABUAAXFBAwDGABUAAXFBAwC3ABUAAV1BAwAHABUAAXFBAwD3ABUAAXFBAwCGABUAAXFBAwCVABUAAXFBAwB1ABUAAXFBAwAJABcAAXFBBQC5ABcAyQAXAAJxQQcAeQAXAIkAFwCZABcAA3FBAwAJABcAAXJBAwD4ABcAAXFBBQDgABoA8AAaAAJdQQMAQAAaAAFyQQMAoAAaAAFyQQMALwAaAAFxQQMAPgAaAAFxQQMAcAAaAAFyQQcAkAAaAKAAGgCwABoAA3FBBQCQABoAoAAaAAJdQQMA0AAaAAFyQQMAfwAnAAFdQQMATwAnAAFdQQMALwAnAAFdALgAFS+4ABcvuAAAL7gAFi+7AAoAAQAdAAQruwAjAAEAEAAEK0EDAC0AAwABckEDADwAAwABcrgAFxC5AAQAAfRBAwAYAAQAAXFBAwCwABYAAV1BAwCRABYAAXFBAwARABYAAXJBAwACABYAAXJBAwDDABYAAXFBAwAqABYAAV1BAwBzABYAAXFBAwCCABYAAXFBAwCxABYAAXFBAwAAABYAAXFBAwCQABYAAV1BAwAwABYAAXK4ABYQuQAFAAH0QQMAFQAFAAFyQQMAtgAFAAFdQQMABgAFAAFyQQMAtwAFAAFxQQMAKwAFAAFdQQMAGQAFAAFxQQMABwAFAAFxQQMAxgAFAAFxQQMANgAFAAFyQQMAlQAFAAFxQQMAdAAFAAFxuAAVELkABgAB9EEDABkABgABcUEDAEgABgABckEDAPsABwABcUEDACAAHQABcUEDAMAAHQABcUEDAJAAHQABXUEDAPAAHQABXUEDAAAAHQABcUEDALAAHQABXUEDALAACgABXUEDACAACgABcUEDAAEACgABcUEDAPAACgABXUEDAMAACgABcUEDAJAACgABXUEJABAACgAgAAoAMAAKAEAACgAEXboACAAdAAoREjlBAwDxAAsAAV1BAwDGAAwAAV1BAwDzAAwAAV1BAwDhAAwAAV1BAwDLAA4AAV1BBQDoAA4A+AAOAAJdQQMAQAAQAAFxQQMA8AAQAAFxQQMA7wAQAAFyQQMA3wAQAAFxQQMArwAQAAFdQQMAIAAQAAFxQQMAsAAQAAFdQQMA8AAQAAFdQQMAAAAQAAFxQQMA6gASAAFdQQMAigASAAFdQQUAuQASAMkAEgACXUEDAGUAFAABXUEDAFoAFAABcUEDAEYAFAABckEDAOQAFAABXUEDACQAFAABcUEDADUAGAABcUEDAOcAGAABXUEDACsAGAABckEDADkAGAABckEDAEYAGAABckEDAJUAGAABcUEDACIAGAABcUEDAFIAGQABcUEDAGUAGQABXUEHACAAGQAwABkAQAAZAANxQQMA4AAZAAFdQQMAsAAjAAFdQQMA8AAjAAFdQQMA3wAjAAFxQQMArwAjAAFdQQMA7wAjAAFyQQMAAQAjAAFxQQMAIAAjAAFxQQMAQAAjAAFxQQMA8AAjAAFxMDEBQQMAtgALAAFdQQMA1gALAAFdQQMAtgAPAAFdQQMA1gAPAAFdQQMA2QARAAFdAEEDALYADAABXUEDANYADAABXUEDALkADgABXUEDANkADgABXQUjETQnBycGBzYzMhYVFAYjIiYnJjcXNxYVBzQmIyIGFRQWMzI2AU4lLi83KgYPEBokJBofJwEDXzEuVqwRDQ0QEA0NEaoB1jMcJCUSOAokGhojLi5jHSEhIVAuDRERDQ0QEAAAAv7cAcz/ygKwACIALgeouwAVAAYACQAEK7oADwAdAAMruAAPELgAANC4AAAvQQMATwAAAAFyQQMA0gAAAAFxQQMAgQAAAAFyQQMAtQABAAFxQQMAxAABAAFxQQMAJwACAAFxQQMAVQACAAFxQQMA0gACAAFxQQMAywAEAAFxQQMApAAEAAFyQQcAqgAFALoABQDKAAUAA11BAwA5AAUAAXJBBwAIAAcAGAAHACgABwADcUEDAPoABwABXUEDANkABwABXUEDAOgABwABXUEDAKcABwABckEDABAACQABXUEDAAAACQABcUEDAEoACgABckEDADsACgABckEDAPoACgABcUEDAIkACgABXUEDAI0ACwABXUEDANwACwABXUEDAIoADAABcUEDALsADQABcUEFAJgADQCoAA0AAnG4AA8QuQAOAAb0QQMAyQAOAAFxQQMAcgASAAFdQREABgAVABYAFQAmABUANgAVAEYAFQBWABUAZgAVAHYAFQAIXUEdABYAFQAmABUANgAVAEYAFQBWABUAZgAVAHYAFQCGABUAlgAVAKYAFQC2ABUAxgAVANYAFQDmABUADnFBDwCWABUApgAVALYAFQDGABUA1gAVAOYAFQD2ABUAB11BBQAWABUAJgAVAAJyQQMAAAAVAAFxuAAJELgAKdxBAwA4ACkAAV1BAwDOACkAAXFBAwD/ACkAAV1BAwA/ACkAAXJBAwCZACkAAV1BAwCwACkAAXJBAwDgACkAAXG6ABcACQApERI5QQUAFwAXACcAFwACckEDABkAFwABcUEDAAoAFwABcUEDANoAFwABXUEDAIkAFwABXUEDAOgAFwABXUEDAPcAFwABcUEFADQAFwBEABcAAnJBAwDpABgAAXFBAwCsABkAAV1BAwDMABkAAV1BAwC6ABkAAV1BAwCsAB0AAXJBBQB+AB0AjgAdAAJdQQcAnwAdAK8AHQC/AB0AA11BAwDOAB0AAV1BAwBNAB0AAXJBAwD4AB0AAV26ABsAHQAPERI5QQMA+QAbAAFdQQMASQAbAAFyQQMAzAAeAAFxQQMAqQAfAAFyQQMAxQAiAAFxQQMAcgAjAAFdQQMAhgAjAAFxQQMAlgAjAAFdQQMA9wAjAAFdQQMAmQAjAAFyQQMAOgAjAAFyQQUA7AAjAPwAIwACckEDAH0AIwABckEFAMoAIwDaACMAAnJBAwC5ACMAAXJBAwCoACMAAXJBAwCnACMAAXFBBQC2ACMAxgAjAAJxQQMAZAAjAAFxQQMA0AAjAAFxQQMAMAAjAAFdALgADi+4AAMvuAAHL7oADAAmAAMrQQMAqQABAAFxQQMAmgABAAFxQQMAewABAAFxQQMA3QABAAFxQQMAOwABAAFxQQMAWwABAAFxQQMAaQABAAFxQQMAiQABAAFxQQMASAABAAFxQQMA+gAFAAFxQQMACwAFAAFyQQMArAAFAAFdQQMAPAAFAAFyQQMAKwAFAAFyQQMAygAFAAFxQQUAugAFAMoABQACXUEDAK4ABwABckEDAN4ABwABcUEDACwACAABcUEDAHYACAABckEDAJQACAABckEDAMUACgABXUEDAEcACgABckEDAKUACgABXUEDALIACgABXUEDAJIACgABXUEDAG8ADAABXUEDAO8ADAABXUEDAD8ADAABcUEDAA8ADAABcUEDAI8ADAABXUEDAD8ADAABXUEDAAIADAABXUEFAM8ADgDfAA4AAl1BAwA/AA4AAXFBAwAPAA4AAXFBAwBvAA4AAV1BAwA/AA4AAV1BAwCFABAAAXFBAwCOABAAAV1BAwCcABAAAV1BAwCzABAAAXFBAwCzABAAAXK4AAwQuQASAAL0QQMAXwASAAFyQQMAbgASAAFyuAADELgAINxBBQDAACAA0AAgAAJxQQMAYQAgAAFyQQMAZQAgAAFxQQUAJgAgADYAIAACcUELAHYAIACGACAAlgAgAKYAIAC2ACAABXFBAwBWACAAAXFBAwBFACAAAXFBAwARACAAAXFBAwCgACAAAXJBAwCAACAAAXK6ABcAAwAgERI5QQcAFAAXACQAFwA0ABcAA3JBAwClABcAAXJBAwDFABcAAXFBAwDlABcAAXFBAwDzABcAAXFBAwBDABcAAXJBAwDnABgAAXFBAwC4ABkAAV1BAwBpABkAAV1BAwCpABkAAXJBAwALABkAAXFBAwCtABkAAV1BAwDLABkAAV1BAwDJABkAAXFBAwD4ABkAAXFBAwA4ABkAAXJBAwDXABkAAXG6ABsAAwAgERI5QQMAFQAbAAFyQQMA9wAbAAFdQQMAxQAbAAFxQQMApAAbAAFyQQMARAAbAAFyQQMA1QAfAAFxQQMAwAAfAAFxQQMA0gAhAAFxQQMApAAiAAFxQQMAgwAiAAFxQQMAEAAmAAFyQQMAEAAmAAFxQQMA0AAmAAFdQQMAIQAmAAFxQQMAoAAmAAFxQQMAcAAmAAFdQQMAwAAmAAFxQQMAUAAmAAFdQQMAQAAmAAFxQQMAtwApAAFyuAADELkALAAC9EEDAIEALAABckEDAFIALAABckEFAGAALABwACwAAnJBDwCQACwAoAAsALAALADAACwA0AAsAOAALADwACwAB3IwMQMUBiMiJwYHJjU0OwEyNzMUBisBIhUUFzY3FhcmNTQ2MzIWBzQmIyIGFRQWMzI2Nh8UKjYbGChVQjEDIiwrRTALGRoRIAEbFBQcGg0JCQ0NCQkNAf8WHCsJIxk1TkgrOi4WERwEDxUIBRQbHBMJDQ0JCQ0NAAH/pwKo/8gDFwADAFK7AAAABgABAAQrALgAAi+4AAAvQQMAfwACAAFxQQcAPwACAE8AAgBfAAIAA11BBQAPAAIAHwACAAJyQQUA3wACAO8AAgACXUEDAI8AAgABXTAxAyM1MzghIQKobwAAAAL/RgKlACoDRAAVACEJtH24ABwvGHy4ABYvGEEFADcAAABHAAAAAnJBAwA4AAAAAV1BBQDIAAAA2AAAAAJdQQkASQAAAFkAAABpAAAAeQAAAARdQQMAmQAAAAFyQQMACwAAAAFdQQMAmwAAAAFxQQMA7AAAAAFxQQMArQAAAAFxQQMA3gAAAAFxQQMAjgAAAAFyQQMArQAAAAFyQQMAGwAAAAFyQQMAKwAAAAFdQQMAGQAAAAFdQQMAeQAAAAFyQQMA+AAAAAFdQQMAqAAAAAFdQQMARwAAAAFxQQMABgAAAAFyQQMAJQAAAAFyQQMAFgABAAFyQQMA1gABAAFxQQMAMwABAAFyQQMAIgABAAFyQQUAFAACACQAAgACckEFAJcAAwCnAAMAAnFBAwD/AAMAAXJBAwBfAAMAAXJBAwCsAAMAAXJBAwDmAAMAAXFBAwAzAAMAAXJBAwBrAAYAAXJBAwB3AAYAAXFBAwB6AAgAAXFBAwCLAAgAAXFBAwCcAAgAAXFBAwBMAAgAAXJBAwDqAAgAAXFBAwDZAAgAAXFBAwBoAAgAAXFBAwCRAAsAAXJBAwDzAAsAAXJBAwAFAAsAAV1BAwClAAsAAV1BAwBlAAsAAXJBAwDWAAsAAV1BBQB2AAsAhgALAAJxQQMAtgALAAFdQQMAlwALAAFxQQMA6AALAAFxQQMAGAALAAFxQQMAOQALAAFyQQMA+gALAAFxQQUAKQALADkACwACcUEDABkACwABckEDACgACwABckEDAAcACwABckEDAMcACwABXUEFALYACwDGAAsAAnJBAwD2AAsAAV1BAwCFAAsAAXJBBQBVAAsAZQALAAJxQQMAZQALAAFdQQMAowALAAFyQQUAQgALAFIACwACckEDAHAACwABckEFANAACwDgAAsAAnJBBQDPAA0A3wANAAJdQQMArgANAAFdQQMA7AANAAFdQQMABwAPAAFxQQMA5wAPAAFdQQMApAAPAAFdQQUAwwAPANMADwACXUEDABYAEQABckEDABcAEQABcUEFABcAEQAnABEAAl1BAwBIABEAAXJBAwD5ABEAAXJBAwB6ABEAAXJBAwCKABEAAV1BAwC7ABEAAV1BAwCbABEAAXJBAwCNABEAAXFBBQDdABEA7QARAAJdQQMAnwARAAFxQQMAjwARAAFyQQUAXwARAG8AEQACckEDAM4AEQABXUEDAK0AEQABcUEDAMsAEQABckEJAEsAEQBbABEAawARAHsAEQAEcUEDAJsAEQABXUEDAKoAEQABckEDAKoAEQABXUEFANgAEQDoABEAAnJBAwAoABEAAXFBBQDXABEA5wARAAJxQQMA9gARAAFdQQMABQARAAFyQQMANAARAAFyQQMAJAATAAFyQQMAxwATAAFdQQMA7AATAAFxQQMAbgATAAFyQQMAuwATAAFyQQMApQATAAFdQQMAQwATAAFyQQMAEAATAAFyQQMAHAAUAAFyQQMA3wAUAAFxQQMATwAUAAFyQQMA7gAUAAFxQQMA+wAUAAFxQQMACwAUAAFyQQMAOgAUAAFyQQUAhgAVAJYAFQACckEDACkAFQABckEFADwAFQBMABUAAnJBAwDtABUAAXFBAwCvABUAAXFBAwAeABUAAXJBAwDcABUAAXFBAwD7ABUAAXFBAwB3ABUAAXJBAwD2ABUAAXJBAwDGABUAAXJBHQAvABYAPwAWAE8AFgBfABYAbwAWAH8AFgCPABYAnwAWAK8AFgC/ABYAzwAWAN8AFgDvABYA/wAWAA5xQQsArwAWAL8AFgDPABYA3wAWAO8AFgAFXUEHAE8AFgBfABYAbwAWAANyQQMAjgAWAAFyQQMABwAWAAFxQQUAsAAcAMAAHAACcUEDAEAAHAABckEDAPAAHAABckEDAGcAHAABckEDAAgAHAABcUEDAIsAHAABXUEDAHcAHAABcUEFANEAHADhABwAAnJBAwBwABwAAXJBBwAAABwAEAAcACAAHAADckEFAFAAHABgABwAAnFBAwDwABwAAV0AugAfAAQAAyu7AA4AAgAZAAQrQQMAfAAAAAFdQQMAjwAAAAFdQQMArQAAAAFxQQMASwAAAAFyQQMAugAAAAFxQQMA+gABAAFxQQMASQACAAFyQQMA+QACAAFxQQMAaAADAAFxQQMAowAEAAFyQQMAiQAEAAFdQQMAYwAEAAFyQQMAggAEAAFyQQMAcAAEAAFyQQMAjgAFAAFdQQMAjgAGAAFdQQcALwAfAD8AHwBPAB8AA3FBAwC7AB8AAXK4AB8QuQAIAAL0QQMA6gAIAAFdQQMA2wAIAAFdQQMAzAAIAAFdQQMAngAIAAFdQQMAjwAIAAFdQQMArwAIAAFdQQMAbwAIAAFdQQMAfgAIAAFdQQMAuwAIAAFdQQMAugAIAAFyQQMAyAAIAAFyQQUAiAAIAJgACAACcUEFAD0ACgBNAAoAAnFBAwA3AAwAAXFBAwCGAA4AAXFBAwBoAA4AAV1BAwB+AA4AAXFBAwBOAA4AAXFBAwDvAA4AAV1BAwCvAA4AAXFBAwB/AA4AAXJBBQBfAA4AbwAOAAJxQQMArwAOAAFdQQUAjgAOAJ4ADgACXUEDAJ0ADgABcUEDANcADgABXUEDALUADgABXUEDACAADgABXUEDAEcAEAABcUEDACYAEAABckEDAPoAEgABcUEDAIsAEgABcUEDAGwAEgABcUEDAFsAEgABcUEDANoAEgABcUEFALkAEgDJABIAAnG6ABMABAAfERI5QQMAaAATAAFyQQMAyAATAAFdQQMAmQATAAFyQQMA6gATAAFxQQMA6wATAAFdQQMArQATAAFyQQMA3AATAAFdQQMAiwATAAFdQQUAqgATALoAEwACXUEDAFkAEwABckEDALgAEwABckEDABYAEwABckEDAEUAEwABckEDAEgAFAABckEDAJ8AFQABcUEDAOcAFQABXUEDAH8AGQABckEJAE8AGQBfABkAbwAZAH8AGQAEcUEFAJ8AGQCvABkAAnFBAwDvABkAAV1BAwCvABkAAV1BBQBgABkAcAAZAAJdQQMAIAAZAAFdMDEBQQMA+AAAAAFxQQMAuwAAAAFxQQMAzAAAAAFxQQMAtgADAAFxQQUAaQAJAHkACQACXUEFAG4ACgB+AAoAAl1BAwDPABQAAXFBAwC8ABUAAXFBAwD8ABUAAXFBAwDNABUAAXFBAwCFABYAAV1BAwCPABwAAV0AQQMAigAIAAFdQQMAiwAJAAFdQQMAbQAJAAFdQQMAfgAJAAFdQQUAegAKAIoACgACXUEDAIsACwABXUEDAIoADAABXRMGBwYrATU2NyImNTQ2MzIWFxQHNjcHNCYjIgYVFBYzMjYqDjwwVRIhDhQeHhUUHAItdxB2DQoKDg4KCg0DOlYjHBMOGR0VFR4cFzIgCnEpCg4OCgoNDQAAAv8gAqMAKwNBAAsAMxKWuwAGAAYAJQAEK7sALQAGABEABCtBAwBAAAAAAXFBAwDBAAAAAV1BAwDyAAAAAXJBAwBTAAAAAXFBBQCkAAAAtAAAAAJdQQMARQAAAAFyQQMAZQAAAAFxQQMAtgAAAAFyQQcAxwAAANcAAADnAAAAA3JBBQC6AAAAygAAAAJxQQMADAAAAAFdQQMA3AAAAAFxQQMA+AAAAAFxQQUAdgAAAIYAAAACcUEDAOYAAAABcUEDAKUAAAABckEFACQAAAA0AAAAAnFBAwCTAAAAAV1BAwASAAAAAXFBBQCRAAAAoQAAAAJxQQUAcAAAAIAAAAACXUEDAPAAAAABXUEDAAAAAAABcUEDANAAAAABXUEFAJYABgCmAAYAAl1BAwBGAAYAAXFBAwD2AAYAAXFBBwAGAAYAFgAGACYABgADckEDAEcABgABckEDAAkABgABXUEDALsABgABXUEFACsABgA7AAYAAnFBAwD7AAYAAV1BBQAKAAYAGgAGAAJxQQMAuAAGAAFxQQMAlwAGAAFyQQMAxgAGAAFxQQcAxgAGANYABgDmAAYAA11BDwAWAAYAJgAGADYABgBGAAYAVgAGAGYABgB2AAYAB11BAwCEAAYAAV1BAwCyABEAAV1BAwBDABEAAXFBBQApABEAOQARAAJdQQMAiQARAAFdQQkAyQARANkAEQDpABEA+QARAARdQQkACQARABkAEQApABEAOQARAARxQQMACQARAAFdQQMATwARAAFyQQMAOgARAAFyQRcAWQARAGkAEQB5ABEAiQARAJkAEQCpABEAuQARAMkAEQDZABEA6QARAPkAEQALcUEHAAkAEQAZABEAKQARAANyQQMAqQARAAFdQQMAWQARAAFdQQMAdQARAAFdQQMAEgARAAFdQQMAQQARAAFdQQMAkQARAAFduAARELgADNxBAwAbAAwAAV1BAwC7AAwAAV1BBQCMAAwAnAAMAAJdQQMArQAMAAFdQQUATwAMAF8ADAACXUENAF8ADABvAAwAfwAMAI8ADACfAAwArwAMAAZyQQMAzwAMAAFdQQMADwAMAAFdQQMA7QAMAAFdQQMA2wAMAAFdQQMAOwAMAAFdQQMAKQAMAAFdQQMAQwAMAAFyQQMA2QANAAFdQQMA6gANAAFyQQUAXwANAG8ADQACckEHAI8ADQCfAA0ArwANAANyQQMA3QANAAFyQQMAeQANAAFdQQMARQANAAFyQQMAMwANAAFyQQMA+gAOAAFdQQMAmAAOAAFdQQMA2AAPAAFdQQMA6gAPAAFdQQMArAAPAAFdQQMACwAPAAFxQQMAuAAPAAFdQQMAZgAPAAFdQQMAQgAPAAFdQQUA2gATAOoAEwACckEDAKsAEwABckEDAMkAEwABckEDACkAEwABckEDAKcAFAABckEDAEgAFAABckEDAMkAFAABXUEDALkAFAABcUEDAOoAFAABckEDAHsAFAABcUEDAIoAFAABcUEDANkAFAABckEDAOkAFAABcUEDAMgAFAABckEDAGgAFAABcUEDAFcAFAABcUEDABUAFAABcUEDAEMAFQABckEDADQAFQABckEDAAYAFQABcUEDAMcAFQABXUEDANcAFQABckEDAOkAFQABcUEDAHcAFQABcUEDAKYAFQABckEDAOYAFQABckEDAEQAFQABcUEDANEAFQABXUEDAPAAFQABXUEDAMUAFwABckEDAMUAGAABckEDAFUAGQABcUEDAGYAGQABcUEDAOYAGQABcUEDAMcAGQABckEDANkAGQABckEDAHkAGQABXUEDAEYAGQABckEDAIYAGQABcUEDAOUAGQABXUEDAEQAGQABcUEDAPEAGQABXUEDAIcAHgABckEDAJAAJQABXUEDAHAAJQABXUEDAEAAJQABXUEFAAAAJQAQACUAAl1BBQDQACUA4AAlAAJduAAlELgAH9xBAwBwAB8AAV1BAwBAAB8AAXFBBQAhAB8AMQAfAAJxQQMAggAfAAFdQQMApgAfAAFdQQMAYQAfAAFdQQUAMAAfAEAAHwACckEDAPAAHwABXUEFAAAAHwAQAB8AAnFBBwDAAB8A0AAfAOAAHwADckEFAJAAHwCgAB8AAnFBAwCnACQAAXFBAwCYACcAAV1BAwBKACcAAXJBAwCsACcAAV1BAwC5ACcAAV1BAwAUACcAAV1BAwCgACcAAXJBAwDXACgAAXJBAwBqACgAAXFBAwCiACgAAXJBAwBCACgAAXK6ACkAJQAfERI5QQMAOAApAAFyQQUAmQApAKkAKQACcUEDAEoAKQABcUEFALoAKQDKACkAAnJBBQDqACkA+gApAAJdQQUAegApAIoAKQACcUEDAEwAKQABckEDAK0AKQABckEDANwAKQABckEDAGsAKQABcUEDAOoAKQABcUEDAMoAKQABXUEDAOoAKQABckEDAFkAKQABcUEDABkAKQABcUEDANgAKQABXUEDAAgAKQABcUEDACoAKgABckEDAOsAKgABckEDAEwAKgABckEFAMoAKgDaACoAAnJBAwBpACoAAXFBAwBYACoAAXFBAwDiACsAAV1BAwBEACsAAXJBAwCHACsAAXFBAwDNACsAAXJBAwDsACsAAXJBAwCmACsAAV1BAwAUACsAAXFBAwBAACsAAXFBAwCwACsAAV1BAwBAAC0AAV1BAwCQAC0AAV1BAwBzAC0AAV1BAwBPAC0AAXJBAwBiAC0AAV1BAwAQAC0AAV1BAwBAAC0AAXFBAwCwAC0AAV26AC8AEQAtERI5QQMANQAvAAFyQQMAJgAvAAFyQQMAnAAvAAFyQQUAzwAvAN8ALwACckEDAIgALwABckEDAEYALwABckEDABUALwABckEDAHUALwABckEDAJwAMQABcUEDAD0AMQABckELAL8AMQDPADEA3wAxAO8AMQD/ADEABXFBAwAPADEAAXJBAwAeADEAAXJBAwCtADEAAXFBAwAqADEAAXJBAwDZADEAAV1BAwBPADMAAXIAuAAOL7gAIi+6ACgAAwADK0EDAHAAAwABckEDAEEAAwABckEDAPEAAwABXUEFAAEAAwARAAMAAnFBAwDCAAMAAV1BAwCEAAMAAV1BAwDkAAMAAV1BAwB1AAMAAV1BAwDVAAMAAV1BAwCXAAMAAV1BAwAYAAMAAV1BAwBnAAMAAV1BAwAGAAMAAV1BAwC1AAMAAV1BAwBUAAMAAV1BAwCkAAMAAV1BBQAjAAMAMwADAAJxQQMAQgADAAFdQQUAgQADAJEAAwACckELAKAAAwCwAAMAwAADANAAAwDgAAMABXJBAwCAAAMAAXFBAwBAAAMAAXFBAwBnAAYAAXFBAwCiAAkAAXJBAwBDAAkAAXJBAwDlAAkAAXFBAwC2AAkAAXFBAwDHAAkAAXFBAwAYAAkAAV1BAwDYAAkAAV1BAwCYAAkAAXJBAwD5AAkAAV1BBQCZAAkAqQAJAAJdQQMAugAJAAFdQQUAKgAJADoACQACcUEDAMsACQABXUEDAHsACQABcUEDAIwACQABXUEDAFwACQABXUEDAB0ACQABcUEDAP0ACQABckEDAEwACQABcUEDAKsACQABcUEDAAsACQABcUEDAAoACQABXUEDAOoACQABXUEFAGoACQB6AAkAAl1BAwBpAAkAAXFBAwDIAAkAAXJBAwCYAAkAAXFBAwBIAAkAAV1BAwBXAAkAAXFBAwCHAAkAAXFBAwCFAAkAAXJBAwDkAAkAAXJBAwCzAAkAAXJBAwDSAAkAAXJBAwBxAAkAAXJBAwDcAAwAAV1BAwDNAAwAAV1BAwCtAAwAAXJBAwA0AAwAAV1BAwAgAAwAAV1BAwClAA0AAXJBAwBfAA4AAV1BAwBXAA4AAXJBAwDjAA8AAXJBAwAoABMAAXJBAwDmABMAAXJBAwDDABMAAXJBAwDkABQAAV1BAwDUABQAAXJBAwAFABQAAXFBAwD2ABQAAV1BAwAXABQAAXFBAwCXABQAAXJBAwBpABQAAXJBAwAqABQAAXJBAwCMABQAAXJBAwB7ABQAAXJBAwB5ABQAAV1BAwBYABQAAXJBAwCnABQAAXFBAwDHABQAAV1BAwCGABQAAXFBAwDlABQAAXJBAwBEABQAAXJBAwDDABQAAXJBAwCgABQAAXJBAwDmABUAAXJBAwBoABUAAXFBAwDYABUAAXJBAwDJABUAAV1BAwBpABUAAXJBAwAqABUAAXJBAwA7ABUAAXJBAwDbABUAAV1BAwB6ABUAAXFBBQCJABUAmQAVAAJyQQMAGQAVAAFyQQMAeAAVAAFdQQMAeAAVAAFyQQMA9wAVAAFdQQMARAAVAAFyQQMAwwAVAAFyQQMAUgAZAAFyQQMARAAZAAFxQQMA4AAZAAFyQQMAoAAZAAFyQQMA9AAbAAFdQQMAQAAbAAFxQQMAXAAiAAFdQQMA0AAiAAFyuAAiELgAHNxBBQBAABwAUAAcAAJyQQUAYQAcAHEAHAACckEDAKIAHAABcUEDAIMAHAABckEDAJIAHAABckEFAAIAHAASABwAAnFBBwCgABwAsAAcAMAAHAADckEHACAAHAAwABwAQAAcAANxQQMA4AAcAAFyQQMAdAAdAAFxQQMA9AAdAAFdQQMAggAeAAFxQQMAUwAeAAFxQQMAZQAeAAFxQQUAkwAeAKMAHgACcUEDAIEAHgABckEFANAAHgDgAB4AAnJBAwBqACAAAXFBAwCtACAAAXFBAwB9ACAAAXFBAwCaACAAAXFBAwCJACAAAXFBAwBYACAAAXFBAwBaACQAAXFBAwB9ACQAAXFBAwCsACQAAXFBBQCJACQAmQAkAAJxQQMAaQAkAAFxQQMA7wAmAAFyQQUAugAmAMoAJgACckEDAB8AJwABXUEDABsAKAABXUEDAN0AKAABXUEDAHwAKAABXUEDAIIAKAABcUEDAEAAKAABckEDAKIAKQABckEDAOQAKQABckEDAMUAKQABckEDAIUAKQABcUEFAJYAKQCmACkAAnFBBQDHACkA1wApAAJdQQMARwApAAFxQQMAaAApAAFxQQMAfgApAAFdQQMAHAApAAFdQQMA1wApAAFyQQMAFwApAAFxQQMANwApAAFyQQMA9gApAAFdQQMABQApAAFxQQMA5QApAAFdQQMAtAApAAFyQQUAIQApADEAKQACcUEDAEAAKQABcrgAKBC4ACrQQQMAJwAqAAFyQQMAZwAqAAFxQQMAfAArAAFdQQMAGgArAAFdQQMA2gAsAAFyQQMA5AAsAAFdQQMA4gAuAAFyugAvACIAHBESOUEFAFkALwBpAC8AAnJBAwCbAC8AAXJBAwBfAC8AAV1BBQDPAC8A3wAvAAJyQQMAigAvAAFyQQMARwAvAAFyQQMAFgAvAAFyQQMAywAzAAFyQQMAbwAzAAFdQQMAuAAzAAFyQQMA+AAzAAFdMDEBQQMATgAMAAFdQQMAegANAAFyQQMAlgAOAAFdQQMAlgAPAAFdQQMAuwASAAFyQQMAvwATAAFyQQMAeAAUAAFyQQMAiQAUAAFyQQMAnAAUAAFxQQMAvQAUAAFyQQMAowAVAAFyQQMAtAAVAAFyQQMAmQAVAAFxQQUAowAWALMAFgACckEDAMYAFgABckEDAKMAFwABckEDAMYAFwABckEDAKUAGAABckEDALoAGAABckEDAOkAGQABckEDALoAGQABckEDAOgAGgABckEDAFYAJgABckEDAFQAJwABckEDAJkAKQABXUEDALkAKgABckEDAJEAKwABXUEDAEYAKwABcUEDAFoAKwABckEDAGwAKwABckEDANsALwABckEDAEoAMwABXQBBAwB5AAwAAV1BAwB9AAwAAXJBAwDVAA8AAXJBAwDVABAAAXJBAwCBABIAAXJBBQBxABMAgQATAAJyQQMAvQATAAFyQQMAcgAUAAFyQQMAhQAUAAFyQQMAggAVAAFyQQMAcwAVAAFyQQMA1AAVAAFyQQMAvAAVAAFyQQMA1AAWAAFyQQMAuAAWAAFyQQMA0gAZAAFyQQMApAAZAAFdQQMApAAZAAFyQQMA4AAaAAFdQQMA0QAaAAFyQQMAswAaAAFdQQMApgAaAAFyQQMA4AAbAAFdQQUA0AAbAOAAGwACckEDALIAGwABXUEDAKMAGwABXUEHAJAAHACgABwAsAAcAANdQQMA4AAcAAFdQQUA0AAcAOAAHAACckEHAJAAHQCgAB0AsAAdAANdQQMA4AAdAAFdQQMA0AAdAAFyQQMA4QAdAAFyQQMApAAeAAFdQQMA1AAeAAFyQQMAXwAmAAFyQQMA2wAvAAFyQQMAeQAzAAFdQQMAfQAzAAFyAzQmIyIGFRQWMzI2NwYjNTY1NCcHJwYHBgc+ATMyFhUUBiMiJjU0NjMXNx4BFRQHNjc2NZMNCgoODgoKDb4DjSghHBwKDgsEBQkFFR0dFRocLyAYFh4jFhcTGQLVCg4OCgoNDW2VFhQsIgofHwEKCA0CAh4VFR0iHSU5Hh4BJx4kFwIbIjkAAf9zAqj//AMWAAsBNrsAAgAGAAMABCu4AAMQuAAH0LgAAhC4AAnQALgACC+4AAIvuwALAAIAAAAEK0EDAOAAAgABXUEFAJAAAgCgAAIAAnFBAwAQAAIAAXJBBQBgAAIAcAACAAJyQQMAoAACAAFyQQMAQAACAAFyQQUA0AACAOAAAgACcUEJAEAAAgBQAAIAYAACAHAAAgAEcUEFAKAAAgCwAAIAAl1BDQAwAAIAQAACAFAAAgBgAAIAcAACAIAAAgAGXbgAABC4AATQuAALELgABtBBAwDfAAgAAV1BBQCPAAgAnwAIAAJdQQMATwAIAAFxQQUAvwAIAM8ACAACcUEHAG8ACAB/AAgAjwAIAANxQQMAXwAIAAFyQQkALwAIAD8ACABPAAgAXwAIAARdQQMADwAIAAFyQQMAQAAIAAFyMDEDIxUjNSM1MzUzFTMENR81NR81As8nJxwrKwAAAAL/TgJ2//UDJwAUACAH7rgAFS+7ABsABgAPAAQrQQMAuAAAAAFdQQMACQAAAAFxQQMAWgAAAAFyQQMAugAAAAFyQQMAKwAAAAFyQQMA2wAAAAFxQQMArAAAAAFyQQMA/gAAAAFdQQMAbgAAAAFdQQcAzwAAAN8AAADvAAAAA11BEQBfAAAAbwAAAH8AAACPAAAAnwAAAK8AAAC/AAAAzwAAAAhxQQMAHwAAAAFyQQMA/wAAAAFyQQMA7wAAAAFxQQUALwAAAD8AAAACcUEHAH8AAACPAAAAnwAAAANdQQUA3gAAAO4AAAACckEDAMwAAAABckEDABwAAAABcUEDAEsAAAABckEDAPsAAAABcUEDAHoAAAABckEDAKoAAAABXUEDAIkAAAABckEDAGgAAAABckEDADcAAAABckEDADMAAQABckEDAO8AAgABcUEDADEAAgABcrgADxC4AAncQQUAxwAJANcACQACckEDAI0ACQABckEHAJ8ACQCvAAkAvwAJAANyQQcAbwAJAH8ACQCPAAkAA3FBBwBeAAkAbgAJAH4ACQADckEDAOwACQABXUEDAPcACQABXUEFADEACQBBAAkAAnK6AAYADwAJERI5QQUARgAGAFYABgACcUEDADcABgABcUEFAAcABgAXAAYAAnFBAwC5AAYAAXFBAwCbAAYAAXJBAwDOAAYAAXJBAwBrAAYAAXFBAwD7AAYAAXFBAwCZAAYAAV1BAwBHAAYAAXJBAwAmAAYAAXFBAwAmAAYAAXJBAwA1AAYAAXJBAwDqAAsAAXJBAwDmAA0AAXJBAwCeABAAAV1BAwApABAAAXJBAwBOABEAAXJBAwBPABIAAXJBAwALABQAAXJBAwBPABQAAXJBBQAvABQAPwAUAAJxQQMA7wAUAAFxQREAXwAUAG8AFAB/ABQAjwAUAJ8AFACvABQAvwAUAM8AFAAIcUEDAB8AFAABckEDAC0AFAABckEDADsAFAABckEDAEkAFAABcbkAFQAG9EEDAKIAFQABXUEFAIQAFQCUABUAAl1BAwBmABUAAV1BAwA3ABUAAV1BBQB4ABUAiAAVAAJxQQMA+AAVAAFdQQMAmgAVAAFxQQMAHQAVAAFdQQMA6QAVAAFdQQMA2AAVAAFyQQMA5wAVAAFxQQUAVwAVAGcAFQACcUEDADYAFQABcUEDAHMAFQABXUEFALEAFQDBABUAAl1BAwDQABUAAV1BAwAWABsAAXJBCQC2ABsAxgAbANYAGwDmABsABF1BAwA2ABsAAV1BAwBGABsAAXFBAwBpABsAAV1BAwCsABsAAV1BAwBIABsAAXJBBwB2ABsAhgAbAJYAGwADXUEDABYAGwABXUEDAJYAGwABcUEDAFAAGwABXUEDACAAGwABXUEDAOgAHgABcQC4AAAvuAAML7sAGAABAB4ABCtBAwD9AAAAAV1BAwC+AAAAAV1BAwCtAAAAAV1BAwCLAAAAAV1BAwDoAAAAAXFBAwD4AAEAAXFBAwCwAAwAAXJBAwCBAAwAAXJBAwDWAAwAAXJBAwAfAAwAAXJBCwAZAAwAKQAMADkADABJAAwAWQAMAAVxQQMAAgAMAAFxQQMA4AAMAAFyQQMAkAAMAAFyQQcAYAAMAHAADACAAAwAA3G6AAYADAAAERI5QQMAxQAGAAFdQQMA1gAGAAFdQQMAVgAGAAFxQQMA9gAGAAFxQQMAuAAGAAFxQQMAqQAGAAFxQQMA7AAGAAFyQQMA6gAGAAFxQQMAmAAGAAFxQQMARwAGAAFxQQMAhgAGAAFxQQkABgAGABYABgAmAAYANgAGAARxQQMAlgAGAAFdQQUANAAGAEQABgACckEDACMABgABckEDAPYACAABcUEDAPkACgABXUEDAOkADgABXUEDAPoADgABXUEFAOYADgD2AA4AAnJBAwDFAA4AAXJBAwDDABAAAXFBAwBlABAAAXFBAwBJABAAAV1BAwBaABAAAV1BAwAmABAAAXJBAwDVABAAAXFBAwCCABAAAXFBAwDwABAAAXFBAwCFABEAAXFBAwDGABEAAV1BAwAXABEAAXJBAwCqABEAAXJBAwB7ABEAAV1BAwA8ABEAAV1BAwD8ABEAAXJBAwB8ABEAAXJBBQCLABEAmwARAAJyQQMA6wARAAFyQQMAaQARAAFdQQMA1wARAAFdQQMA5gARAAFxQQMAcgARAAFxQQMA8AARAAFxQQMAQwASAAFyQQkAdAAYAIQAGACUABgApAAYAARdQQMAZQAYAAFdQQMA1wAYAAFdQQUArwAYAL8AGAACcUEDAN8AGAABcUEDAFgAGAABXUEFALUAGADFABgAAl1BBQA1ABgARQAYAAJdQQMAQQAYAAFyQQMAIAAYAAFdQQMA4AAeAAFxQQsAawAeAHsAHgCLAB4AmwAeAKsAHgAFXUEFALwAHgDMAB4AAl1BAwBfAB4AAV1BBQAPAB4AHwAeAAJdQQMA3gAeAAFdQQUAPAAeAEwAHgACXUEDAEEAHgABckEDAMAAHgABcUEJAGAAHgBwAB4AgAAeAJAAHgAEcTAxAUEDALkAAAABcUEDAOoAAAABcUEDAKsAAAABcUEDAJwAAAABcUEDAB0AAAABckEDAM8AAAABcUEDAFkAFAABcUEFAJsAFACrABQAAnFBAwDsABQAAXFBAwC+ABQAAXFBAwDPABQAAXFBAwAfABQAAXIAQQMAFgAQAAFyAwYHBgcGBx4BFRQGIyImNTQ/ATY1BzQmIyIGFRQWMzI2CwMdEB0cBxUcHhUWH0QsGDkPCgsPDwsKDwMnIA4JBgUIAh0VFh0dFkITDQgUfwoQEAoKEBAAAv9eAc7/9wJnAAsAFwL9uAAYL7gAGS+4AADcQREAXwAAAG8AAAB/AAAAjwAAAJ8AAACvAAAAvwAAAM8AAAAIckEhAA8AAAAfAAAALwAAAD8AAABPAAAAXwAAAG8AAAB/AAAAjwAAAJ8AAACvAAAAvwAAAM8AAADfAAAA7wAAAP8AAAAQXUEHAA8AAAAfAAAALwAAAANxQQUA7wAAAP8AAAACcrgAGBC4AAbQuAAGL0EDAFAABgABckEDAAAABgABXUEDAMgACQABcUEDAHgACQABcbgAABC5AAwABvRBAwAJAAwAAXJBCQAaAAwAKgAMADoADABKAAwABHJBAwApAAwAAV1BAwBIAAwAAXFBAwAoAAwAAXFBAwAHAA8AAXK4AAYQuQASAAb0QQMABgASAAFyQQMAJgASAAFdQQkAFQASACUAEgA1ABIARQASAARyQQMABwAVAAFyALsAFQABAAMABCu7AAkAAQAPAAQrQQMAIAAJAAFxQQcAYAAJAHAACQCAAAkAA3FBAwDgAAkAAXFBAwDvAAkAAV1BAwDAAAkAAXFBAwBAAAkAAXFBAwBQAAkAAV1BAwAwAAkAAV1BAwAgAA8AAXFBBwBgAA8AcAAPAIAADwADcUEDAOAADwABcUEDAO8ADwABXUEDAAkADwABckEDAMAADwABcUEDAEAADwABcUEDAFAADwABXUEDADAADwABXUEDAAUAFQABcjAxAUENAHYAAgCGAAIAlgACAKYAAgC2AAIAxgACAAZdQQ0AeQAEAIkABACZAAQAqQAEALkABADJAAQABl1BDQB5AAgAiQAIAJkACACpAAgAuQAIAMkACAAGXUENAHYACgCGAAoAlgAKAKYACgC2AAoAxgAKAAZdAEENAHkAAQCJAAEAmQABAKkAAQC5AAEAyQABAAZdQQ0AeQAFAIkABQCZAAUAqQAFALkABQDJAAUABl1BDQB2AAcAhgAHAJYABwCmAAcAtgAHAMYABwAGXUENAHYACwCGAAsAlgALAKYACwC2AAsAxgALAAZdAxQGIyImNTQ2MzIWBzQmIyIGFRQWMzI2CSwgIC0tICAsIRoREhoaEhEaAhogLCwgIC0tIBIaGhISGRkAAf86Ac//4QKfAB8Bu7gAIC+4ACEvuAAF3LgAIBC4ABfQuAAXL7kADQAG9EEhAAYADQAWAA0AJgANADYADQBGAA0AVgANAGYADQB2AA0AhgANAJYADQCmAA0AtgANAMYADQDWAA0A5gANAPYADQAQXUEhAAYADQAWAA0AJgANADYADQBGAA0AVgANAGYADQB2AA0AhgANAJYADQCmAA0AtgANAMYADQDWAA0A5gANAPYADQAQcUEHAAYADQAWAA0AJgANAANyQQUANQANAEUADQACcrgABRC4AA/QuAAPL7gABRC5ABwABvRBBQA6ABwASgAcAAJyQSEACQAcABkAHAApABwAOQAcAEkAHABZABwAaQAcAHkAHACJABwAmQAcAKkAHAC5ABwAyQAcANkAHADpABwA+QAcABBdQSEACQAcABkAHAApABwAOQAcAEkAHABZABwAaQAcAHkAHACJABwAmQAcAKkAHAC5ABwAyQAcANkAHADpABwA+QAcABBxQQcACQAcABkAHAApABwAA3K6ABoABQAcERI5ALgAFC+7AB4AAgADAAQruAAeELgACty6AAcAHgAKERI5ugAaAB4AChESOTAxAwcmIyIVFBcHJiMiBhUUMzI3FwYjIiY1NDYzJjU0MzIfCREULjIJDAwcIy0NEwETGxkkKBkUTRsCmBkFHyEGFwQZDxsIGQgdGBkiDRk6AAAEADj/+gGKAUwACwAXACMALwO0uwAeAAUAKgAEK7sABgAFABIABCu7AAwABQAAAAQruwAkAAUAGAAEK0EFADoAAABKAAAAAnJBIQAJAAAAGQAAACkAAAA5AAAASQAAAFkAAABpAAAAeQAAAIkAAACZAAAAqQAAALkAAADJAAAA2QAAAOkAAAD5AAAAEF1BIQAJAAAAGQAAACkAAAA5AAAASQAAAFkAAABpAAAAeQAAAIkAAACZAAAAqQAAALkAAADJAAAA2QAAAOkAAAD5AAAAEHFBBwAJAAAAGQAAACkAAAADckEhAAYABgAWAAYAJgAGADYABgBGAAYAVgAGAGYABgB2AAYAhgAGAJYABgCmAAYAtgAGAMYABgDWAAYA5gAGAPYABgAQXUEhAAYABgAWAAYAJgAGADYABgBGAAYAVgAGAGYABgB2AAYAhgAGAJYABgCmAAYAtgAGAMYABgDWAAYA5gAGAPYABgAQcUEHAAYABgAWAAYAJgAGAANyQQUANQAGAEUABgACckEFADoAGABKABgAAnJBIQAJABgAGQAYACkAGAA5ABgASQAYAFkAGABpABgAeQAYAIkAGACZABgAqQAYALkAGADJABgA2QAYAOkAGAD5ABgAEF1BIQAJABgAGQAYACkAGAA5ABgASQAYAFkAGABpABgAeQAYAIkAGACZABgAqQAYALkAGADJABgA2QAYAOkAGAD5ABgAEHFBBwAJABgAGQAYACkAGAADckEhAAYAHgAWAB4AJgAeADYAHgBGAB4AVgAeAGYAHgB2AB4AhgAeAJYAHgCmAB4AtgAeAMYAHgDWAB4A5gAeAPYAHgAQXUEhAAYAHgAWAB4AJgAeADYAHgBGAB4AVgAeAGYAHgB2AB4AhgAeAJYAHgCmAB4AtgAeAMYAHgDWAB4A5gAeAPYAHgAQcUEHAAYAHgAWAB4AJgAeAANyQQUANQAeAEUAHgACcrgAJBC4ADHcALgAAEVYuAAnLxu5ACcACj5ZuwAtAAEAGwAEK7sACQABAA8ABCu7ABUAAQADAAQruAAnELkAIQAB9EEhAAcAIQAXACEAJwAhADcAIQBHACEAVwAhAGcAIQB3ACEAhwAhAJcAIQCnACEAtwAhAMcAIQDXACEA5wAhAPcAIQAQXUEhAAcAIQAXACEAJwAhADcAIQBHACEAVwAhAGcAIQB3ACEAhwAhAJcAIQCnACEAtwAhAMcAIQDXACEA5wAhAPcAIQAQcUEHAAcAIQAXACEAJwAhAANyQQUANgAhAEYAIQACcjAxJTQmIyIGFRQWMzI2NxQGIyImNTQ2MzIWFzQmIyIGFRQWMzI2NxQGIyImNTQ2MzIWASElGxslJRsbJSM6KSk6OikpOiNOODhOTTk4TiNjRkdiYkdFZKMaJiYaGyUlGyk7OykpOjopOE5OODlOTzhHYmJHRmNkAAAAAAIAJv/5AZsBJwALABcCkbgAGC+4ABkvuAAA3EEDAMcAAAABXbgAGBC4AAbQuAAGL0EDAMgABgABXbgAABC5AAwAB/RBBwAJAAwAGQAMACkADAADXUEFADoADABKAAwAAnJBBwDZAAwA6QAMAPkADAADXUEhAAkADAAZAAwAKQAMADkADABJAAwAWQAMAGkADAB5AAwAiQAMAJkADACpAAwAuQAMAMkADADZAAwA6QAMAPkADAAQcUEHAAkADAAZAAwAKQAMAANyQQcAmQAMAKkADAC5AAwAA11BAwCIAAwAAV24AAYQuQASAAX0QQcABgASABYAEgAmABIAA11BAwB3ABIAAV1BCQCGABIAlgASAKYAEgC2ABIABF1BBwDWABIA5gASAPYAEgADXUEhAAYAEgAWABIAJgASADYAEgBGABIAVgASAGYAEgB2ABIAhgASAJYAEgCmABIAtgASAMYAEgDWABIA5gASAPYAEgAQcUEHAAYAEgAWABIAJgASAANyQQUANQASAEUAEgACcgC4AABFWLgAAy8buQADAAo+WbsACQABAA8ABCtBBwCIAA8AmAAPAKgADwADcUEDABkADwABcUEFABkADwApAA8AAnJBBQAoAA8AOAAPAAJxQQUAqAAPALgADwACXbgAAxC5ABUAAfRBIQAHABUAFwAVACcAFQA3ABUARwAVAFcAFQBnABUAdwAVAIcAFQCXABUApwAVALcAFQDHABUA1wAVAOcAFQD3ABUAEF1BIQAHABUAFwAVACcAFQA3ABUARwAVAFcAFQBnABUAdwAVAIcAFQCXABUApwAVALcAFQDHABUA1wAVAOcAFQD3ABUAEHFBBQAHABUAFwAVAAJyQQcAJgAVADYAFQBGABUAA3IwMSUUBiMiJjU0NjMyFgc0JiMiBhUUFjMyNgGbZlVVZWVVVWYoUUNDUVFDQ1GQQFdXQEBXV0AzRUUzM0REAAIAJP/tAZ0BJgAoADQHx7sACwAFACMABCu7AC8ABgAVAAQruwAbAAYAKQAEK7sAAAAFAAUABCtBAwCAAAAAAV1BAwCiAAIAAXFBAwBDAAIAAXFBAwDzAAIAAXFBAwDkAAIAAXFBAwCUAAIAAXFBAwDVAAIAAXFBAwCGAAIAAXFBAwB2AAIAAV1BAwAFAAIAAXJBAwBEAAIAAXJBBQC0AAIAxAACAAJxQQMAYwACAAFxQQMAcgACAAFxQQMAgAACAAFdQQMAUAACAAFxugADACMAABESOUEDAHUAAwABXUEDAIcAAwABcUEDADkAAwABcUEFAEUAAwBVAAMAAnFBBQBkAAMAdAADAAJxQQMAAwADAAFyQQ0AqQAFALkABQDJAAUA2QAFAOkABQD5AAUABl1BIQAJAAUAGQAFACkABQA5AAUASQAFAFkABQBpAAUAeQAFAIkABQCZAAUAqQAFALkABQDJAAUA2QAFAOkABQD5AAUAEHFBBwAJAAUAGQAFACkABQADckEFADoABQBKAAUAAnJBDwAJAAUAGQAFACkABQA5AAUASQAFAFkABQBpAAUAB11BAwCAAAUAAV1BAwDLAAcAAXFBAwDeAAcAAXFBAwC+AAcAAXFBAwD9AAcAAXFBAwB7AAcAAV1BAwB6AAcAAXFBAwCTAAkAAXFBAwCEAAkAAXFBAwC3AAkAAV1BAwCFAAkAAV1BAwDzAAkAAXFBBwADAAkAEwAJACMACQADckEDAHMACQABcUEDAKIACQABcUELALYACwDGAAsA1gALAOYACwD2AAsABV1BIQAGAAsAFgALACYACwA2AAsARgALAFYACwBmAAsAdgALAIYACwCWAAsApgALALYACwDGAAsA1gALAOYACwD2AAsAEHFBBwAGAAsAFgALACYACwADckETAAYACwAWAAsAJgALADYACwBGAAsAVgALAGYACwB2AAsAhgALAAldQQUANQALAEUACwACckEDANQADQABcUEDAOIADQABcUEDALAADQABcboAEAAjAAAREjlBAwAaABAAAXFBAwCTABAAAV1BAwDAABAAAV1BAwC5ABMAAV1BAwAJABUAAXFBAwD/ABUAAXFBAwAPABUAAXJBAwDxABUAAV1BAwCwABUAAXFBBwBgABsAcAAbAIAAGwADXUEDAAcAGwABcUEHAAAAGwAQABsAIAAbAANdQQMAQAAbAAFxQQMANgAeAAFdQQcA1gAeAOYAHgD2AB4AA11BBQAoACAAOAAgAAJdQQMASgAlAAFxQQUAGgAlACoAJQACcUEDAKoAJQABXUEDALkAJQABXUEDABYAJQABXUEDACYAJwABcUEDALwAJwABcUEFAAgAJwAYACcAAl1BBQCmACcAtgAnAAJdQQMA5AAnAAFxQQMAQAApAAFxQQUAWQApAGkAKQACXUEFAFkAKQBpACkAAnFBBQA6ACkASgApAAJyQQMA+QApAAFdQQUACQApABkAKQACXUELALkAKQDJACkA2QApAOkAKQD5ACkABXFBBwAJACkAGQApACkAKQADckEDACAAKQABXUEDAIAAKQABXUEFADUALwBFAC8AAnJBBQAWAC8AJgAvAAJyQQUAVgAvAGYALwACXUEDAP8ALwABcUEDAA8ALwABckEFAFYALwBmAC8AAnFBBQAGAC8AFgAvAAJdQQcAxgAvANYALwDmAC8AA3FBAwCxAC8AAXFBAwDwAC8AAV1BAwCAADUAAV1BAwDvADYAAV1BAwCfADYAAV1BAwBfADYAAV1BAwDPADYAAV1BAwCAADYAAV0AuAACL7gAAEVYuAAfLxu5AB8ACj5ZuwAmAAEACAAEK7sAMgACABIABCu7ABgAAgAsAAQrQQMAeAAIAAFdQQMALAAKAAFyuAAfELkADgAB9EEhAAcADgAXAA4AJwAOADcADgBHAA4AVwAOAGcADgB3AA4AhwAOAJcADgCnAA4AtwAOAMcADgDXAA4A5wAOAPcADgAQXUEhAAcADgAXAA4AJwAOADcADgBHAA4AVwAOAGcADgB3AA4AhwAOAJcADgCnAA4AtwAOAMcADgDXAA4A5wAOAPcADgAQcUEHAAcADgAXAA4AJwAOAANyQQUANgAOAEYADgACcroAEAASADIREjlBAwDHABAAAV1BAwC4ABQAAV1BAwC2ABYAAV1BAwAxABgAAV1BAwAfABgAAXFBAwDPABgAAXFBAwC3ABgAAV1BBQCAABgAkAAYAAJdQQcAAAAYABAAGAAgABgAA11BAwC2ABoAAV1BAwDVABoAAV1BAwD1ABoAAV1BAwDdABwAAV1BAwD9ABwAAV1BAwDsABwAAV1BCQCWACQApgAkALYAJADGACQABF1BAwDPACwAAXFBAwAfACwAAXFBAwAwACwAAV1BBQCAACwAkAAsAAJdMDEBQQMAiAAHAAFdQQMAqQATAAFdQQMAygATAAFdQQMAqQAXAAFdQQMAyQAXAAFdQQMApgAZAAFdQQMAxgAZAAFdQQMAkAA1AAFdQQMAHAA2AAFdQQMADQA2AAFdQQcALwA2AD8ANgBPADYAA11BAwB/ADYAAV0AQQMAiAAGAAFdQQMAqQAUAAFdQQMAyQAUAAFdQQMApgAWAAFdQQMAxgAWAAFdQQMApgAaAAFdQQMAxgAaAAFdJRQHIzY1NCYjIgYVFBYzMjcGIyImNTQ2MzIWFRQHBiMiJyY1NDYzMhYHNCYjIgYVFBYzMjYBnTEsOVROO1Q4LDkYEhAdJiobIiYdIkM6JCFpSWBnmhYRERUVEREWfFs0L1lAUkg6MD00CCUcHSYuITElKywoOktVYUARFhYRERUVAAIAEP/0AZ8BzAAwADwKzbsACwAFAAQABCu7ADcABgAmAAQruwAgAAYAMQAEK7sAAAAFAA8ABCtBAwC/AAAAAV1BAwB6AAEAAXFBAwC2AAEAAXFBAwDHAAMAAV1BAwC+AAMAAXFBAwBlAAMAAXFBAwB0AAMAAXFBAwCWAAcAAV1BBQA6AA8ASgAPAAJyQQMAvwAPAAFdQRcACQAPABkADwApAA8AOQAPAEkADwBZAA8AaQAPAHkADwCJAA8AmQAPAKkADwALXUEJAMkADwDZAA8A6QAPAPkADwAEXUEhAAkADwAZAA8AKQAPADkADwBJAA8AWQAPAGkADwB5AA8AiQAPAJkADwCpAA8AuQAPAMkADwDZAA8A6QAPAPkADwAQcUEHAAkADwAZAA8AKQAPAANyQQMAvAASAAFxQQMAygASAAFxQQMANgAUAAFxQQUAlgAUAKYAFAACcUEDAEUAFAABcUEDAHUAFgABcUEDACcAFgABckEDAGoAFgABXUEDAE4AFgABXUEFACkAFgA5ABYAAl1BBQDVABYA5QAWAAJxQQMAMwAWAAFyQQMAwgAWAAFxQQMAiQAXAAFxQQMAywAXAAFdQQMAWQAXAAFxQQMAwwAXAAFxQQMAjAAYAAFxQQMAmQAYAAFxQQMAqAAYAAFxQQMA4gAaAAFxQQMAgQAaAAFxugAbAAQAABESOUEDAKIAGwABcUEDACIAGwABckEDABMAGwABckEDAJQAGwABcUEDADYAGwABcUEDAKoAGwABXUEDAGwAGwABXUEDAE8AGwABXUEDAF0AGwABXUEDAJwAGwABXUEDAHoAGwABXUEDAOUAGwABcUEDAPQAGwABcUEDAEMAGwABcUEDAAIAGwABckEFALEAGwDBABsAAnFBAwAwABsAAXJBAwDVAB4AAV1BAwD2AB4AAV1BAwDkAB4AAV1BAwASAB4AAXFBBwCgACAAsAAgAMAAIAADcUEFAL8AIADPACAAAl1BAwBfACAAAXFBAwDgACAAAXFBBwAQACAAIAAgADAAIAADcUEDADAAIAABckEDAPcAIgABXUEDAAYAIgABcUEFANYAIgDmACIAAl1BAwDcACQAAV1BAwDrACQAAV1BAwD5ACQAAV1BAwAJACQAAXFBBQBPACYAXwAmAAJdQQMAnwAmAAFdQQcAvwAmAM8AJgDfACYAA11BAwCuACYAAV1BAwDcACgAAXFBAwCvACgAAV1BAwC+ACgAAV1BAwB7ACgAAV1BAwCKACgAAV1BAwDiACoAAXFBAwCFACoAAV1BAwBiACoAAXFBAwACACoAAXK6ACsABAAAERI5QQMAIwArAAFyQQMAtQArAAFdQQMA5gArAAFxQQMACAArAAFyQQMASQArAAFyQQMA2gArAAFdQQMAywArAAFdQQMATgArAAFdQQMAbAArAAFdQQMAiwArAAFxQQUAKQArADkAKwACXUEDAFkAKwABcUEDAFYAKwABXUEFADYAKwBGACsAAnFBAwDUACsAAXFBAwDDACsAAXFBAwAyACsAAXJBAwDJACwAAXFBAwBaACwAAXFBAwAMACwAAXJBAwBuACwAAXFBAwA7ACwAAXJBAwBKACwAAXJBAwDpACwAAXFBBQAZACwAKQAsAAJyQQMAVgAuAAFdQQMA5AAuAAFxQQMAugAvAAFxQQMAyQAvAAFxQQMAEAAxAAFxQQMAIQAxAAFxQQMA+QAxAAFxQQcACQAxABkAMQApADEAA3JBDQAJADEAGQAxACkAMQA5ADEASQAxAFkAMQAGXUEDAF4AMQABcUEFAL8AMQDPADEAAl1BAwBKADEAAXJBAwCZADEAAV1BAwAyADEAAXJBAwAwADEAAXFBAwDgADEAAXFBBwCgADEAsAAxAMAAMQADcUEFAOYANwD2ADcAAnFBBwAGADcAFgA3ACYANwADckEJAFYANwBmADcAdgA3AIYANwAEcUEDAE8ANwABXUEJAK8ANwC/ADcAzwA3AN8ANwAEXUEDAJgANwABXUEJAAYANwAWADcAJgA3ADYANwAEXUEDAKYANwABcUEDAEUANwABckEJAC8APgA/AD4ATwA+AF8APgAEXUEDAO8APgABXUEDAH8APgABXUEFAL8APgDPAD4AAl1BAwCfAD4AAV0AuAAIL7gAAEVYuAACLxu5AAIACj5ZuwA6AAIAIwAEK7sAKQABABkABCu7AB0AAgA0AAQrQQMA2wABAAFdQQMAygABAAFdQQMA3AAEAAFdQQMAGgAHAAFyQQMATgAHAAFyQQUAKwAHADsABwACckEDAAkABwABckEDALMABwABXUEDAKUACQABXUEDALIACQABXUEDADIACgABcUEDAPMACgABXUEFAAMACgATAAoAAnFBAwDlAAoAAV1BAwCjAAoAAV1BBwCwAAoAwAAKANAACgADXUEDACAACgABcUEDALwACwABcUEFAKQACwC0AAsAAl1BAwDDAAsAAV1BAwBmAAwAAXFBAwB1AAwAAXG4AAIQuQANAAH0QSEABwANABcADQAnAA0ANwANAEcADQBXAA0AZwANAHcADQCHAA0AlwANAKcADQC3AA0AxwANANcADQDnAA0A9wANABBdQSEABwANABcADQAnAA0ANwANAEcADQBXAA0AZwANAHcADQCHAA0AlwANAKcADQC3AA0AxwANANcADQDnAA0A9wANABBxQQcABwANABcADQAnAA0AA3JBBQA2AA0ARgANAAJyQQMAtgAPAAFdQQMArAAQAAFxuAAZELgAE9C4ABMvQQMAeAATAAFxQQMARgAWAAFxQQMAxwAXAAFxQQMAKgAXAAFyQQMARgAXAAFxQQMAIwAXAAFdQQMAAAA0AAFxQQMAkAA0AAFdQQMAgQAdAAFdQQMAIQAdAAFdQQMAdAAdAAFdQQMAxgAdAAFdQQMAVAAdAAFdQQMAAwAdAAFxQQMAYQAdAAFdQQMAEAAdAAFdQQUAMAAdAEAAHQACXboAGwA0AB0REjlBAwA0ABsAAV1BAwAUABsAAV1BAwDFAB4AAV1BBQAjAB4AMwAeAAJxQQMAYwAeAAFdQQMA5wAgAAFxQQUAHQAiAC0AIgACcUEDADwAIgABcUEDAI4AIwABXUEFAB8AIwAvACMAAnFBBQCvACMAvwAjAAJxQQMAnwAjAAFdQQMAfwAjAAFdQQMAbgAjAAFdQQMAQAAjAAFxQQMAjAAnAAFxQQMA6gAnAAFxQQMAkwAnAAFdQQMAxQAqAAFxugArAAIACBESOUEDAOMAKwABcUEDAGQAKwABcUEDANUAKwABcUEDAEUAKwABckEDAAYAKwABckEDAGYAKwABXUEDAFcAKwABcUEDACcAKwABXUEDAIgAKwABcUEDADcAKwABcUEFAMcAKwDXACsAAl1BAwA2ACsAAV1BAwAFACsAAXFBAwCFACsAAV1BAwAUACsAAV1BBQBEACsAVAArAAJdQQMAEgArAAFyQQMAIQArAAFyQQMAaAAsAAFxuAApELgALdBBAwCFAC8AAV1BAwB7ADAAAXFBAwCsADAAAXFBAwBWADAAAV1BAwBEADAAAV1BBQAfADoALwA6AAJxQQMAjwA6AAFdQQMAvwA6AAFxQQMArgA6AAFxQQMAQAA6AAFxMDEBQQUAtgAiAMYAIgACXUEFALkAJADJACQAAl0AQQMAyQAhAAFdJRQjIjURNCc1FhURFDMyNTQnJiMiBgcjJiMiBzYzMhYVFAYjIiY1NDYzMhc2MzIXFgc0JiMiBhUUFjMyNgGfs8IaPaCPDgwRFRsCFwgqMAcHEhklJhgdJjEuLRMQKiMWGMYTDg0UFA0OE5KelwEAHQEjBTz++3F4PSEbIhg7MAQlGRklLigwQTAwIyc/DhMTDg0UFAAAAAACACL//gGfASYAKAA0BVO7AC8ABwAfAAQruwAZAAYAKQAEK7sACQAFAAoABCu7AAAABQABAAQrQQUADwAAAB8AAAACXUEFAA8AAQAfAAEAAl1BAwDNAAQAAXFBAwCLAAQAAXFBAwDmAAYAAV1BAwAiAAYAAXJBAwCAAAkAAV1BAwCAAAoAAV1BAwAuAA0AAXJBBQAPAA0AHwANAAJyQQMA/QANAAFxQQMA2gANAAFdQQMABgAPAAFxQQMA1wAPAAFdQQMA9wAPAAFdQQMA9AAPAAFxQQMAIgAPAAFyQQMAkwAQAAFxQQMAhgAvAAFxQQMA5gAvAAFdQQMAxgAvAAFxQQMANQAvAAFyuAAvELgAFNC4ABQvQQMAOgAXAAFyQQMA8AAZAAFdQQUAEAAZACAAGQACckEDAIYAGQABcUEDAKYAGQABXUEDAEgAGQABckEFAAYAGQAWABkAAl1BAwBBABkAAV1BBwBQABkAYAAZAHAAGQADcUELAFAAGQBgABkAcAAZAIAAGQCQABkABV1BAwAwABkAAV1BAwAdACAAAXFBAwArACAAAXFBAwAUACIAAXFBAwA1ACIAAXJBAwDnACIAAV1BAwAlACIAAXFBAwA0ACIAAXFBAwDyACIAAV26ACMACgAJERI5QQUACQAjABkAIwACckEDAAgAIwABcUEDAHoAJAABcUEDAFwAJAABcUEDAC0AJAABcUEDAE8AJAABcUEDAB4AJAABcUEDADwAJAABcUEDADoAJAABckEFAOkAJAD5ACQAAl1BAwBpACQAAXFBAwAwACkAAV1BAwDwACkAAV1BAwA6ACkAAXJBBQCAACkAkAApAAJdQQcAUAApAGAAKQBwACkAA3FBBQAQACkAIAApAAJyQQMAgAA1AAFdQQMAfwA2AAFdQQMA7wA2AAFdQQMAnwA2AAFdQQ0ADwA2AB8ANgAvADYAPwA2AE8ANgBfADYABl1BAwDPADYAAV0AuAAARVi4AAAvG7kAAAAKPlm4AABFWLgACS8buQAJAAo+WbgAAEVYuAAcLxu5ABwACj5ZuwAlAAIABQAEK7sAFgACACwABCtBAwB9AAIAAXFBBwCPAAIAnwACAK8AAgADcUEDAGwAAgABcUEDADkAAgABcUEDAAoADAABcUEDAAoADAABckEDAPUADAABXUEDAOgADQABXbgABRC4AA7QQQMA6QAQAAFdQQMANgAQAAFxQQUAjwAsAJ8ALAACcUEDAA8ALAABcUEDADsALAABckEDAEkALAABckEDAAEAFgABXUEDAA8AFgABcUEFAI8AFgCfABYAAnFBBwAQABYAIAAWADAAFgADXUEDAJAAFgABXboAFAAsABYREjlBAwBCABQAAXJBAwDWABcAAV1BBQDkABcA9AAXAAJdQQcA2gAbAOoAGwD6ABsAA11BAwAzACAAAXG4ACUQuAAh0EEDAPUAIwABXUEDAAgAIwABcUEDACkAIwABckEDADYAIwABcUEDADQAIwABckEDAEEAIwABckEDAMoAJwABcUEDAIYAJwABXUEDAHMAKAABXUEDAGAAKAABXUEDAEcALwABcrgAHBC5ADIAAvRBBwAHADIAFwAyACcAMgADXUEDAJ8AMgABXUEDAOcAMgABXUEbADcAMgBHADIAVwAyAGcAMgB3ADIAhwAyAJcAMgCnADIAtwAyAMcAMgDXADIA5wAyAPcAMgANcUEHAAcAMgAXADIAJwAyAANyQQUANgAyAEYAMgACcjAxAUEFALYAFwDGABcAAl1BBQC2ABsAxgAbAAJdAEEFALYAGADGABgAAl1BBQC5ABoAyQAaAAJdISM1NCYjIgYdASM1NCYjIgcGFRQXNjMyFhUUBiMiJjU0MzIXNjMyFhUFNCYjIgYVFBYzMjYBnyMfGhckJTIdJRYTAw8gGyYmICYrdUQaFzcqMv77FhAQFhYQEBa8IioyHri5HjEkIDURERUoGxsmSz2gPz83MH8QFhYQEBYWAAAAAAIAHf/1AcoBngALADgI2rsAIwAHABUABCu7AAYABgAqAAQruwAwAAYAAAAEK0EDAOAAAAABXUEDAGkAAAABcUEFAAkAAAAZAAAAAl1BAwC/AAAAAXFBAwA6AAAAAXJBBwAJAAAAGQAAACkAAAADckEDACUAAAABXUEDAPAAAAABcUEFAIAAAACQAAAAAnFBBwAGAAYAFgAGACYABgADckEDACsABgABXUEDAN8ABgABXUEDAM0ABgABckEFAAYABgAWAAYAAl1BAwDmAAYAAXFBAwA1AAYAAXJBAwCYAAwAAXFBBQCuAA0AvgANAAJxQQMAHwANAAFxQQMAigANAAFxQQMA2QANAAFxQQUANAAQAEQAEAACcUEFAIYAEACWABAAAnFBAwD0ABAAAV1BAwCiABAAAXFBAwBSABAAAXFBAwALABMAAXFBAwA5ABMAAV1BAwA5ABMAAXFBAwCpABcAAV1BAwDGABcAAV1BAwBUABcAAXFBAwBqABoAAXFBAwD7ABoAAXFBBQA8ABoATAAaAAJyQQMAHAAaAAFyQQMA2wAaAAFdQQMA6gAaAAFxQQMA6gAaAAFdQQMAGQAaAAFxQQMAmQAcAAFxQQMA+QAcAAFxQQMACgAcAAFyQQMAKgAcAAFyQQMAOQAcAAFdQQMAyQAcAAFxQQMA2AAcAAFxQQMAiAAcAAFxQQMA1AAdAAFxQQMARQAdAAFyQQMAtgAdAAFdQQMAlgAdAAFxQQMA9wAdAAFxQQMAagAdAAFdQQMAOwAdAAFdQQMA1wAdAAFdQQUAtgAdAMYAHQACcUEDAGYAHQABcUEDAOUAHQABcUEFABUAHQAlAB0AAnJBAwAEAB0AAXJBAwAxAB0AAXJBAwD1AB8AAXFBFwAGACMAFgAjACYAIwA2ACMARgAjAFYAIwBmACMAdgAjAIYAIwCWACMApgAjAAtdQR0AJgAjADYAIwBGACMAVgAjAGYAIwB2ACMAhgAjAJYAIwCmACMAtgAjAMYAIwDWACMA5gAjAPYAIwAOcUEHAAYAIwAWACMAJgAjAANyQQkAxgAjANYAIwDmACMA9gAjAARdQQMABgAjAAFxQQMAtQAjAAFdQQUANQAjAEUAIwACckEDABUAJQABckEDACMAJQABckEDAPAAMAABcUEDAL8AMAABcUEFAIAAMACQADAAAnFBAwDgADAAAV26ACgAAAAwERI5QQUAGgAoACoAKAACcUEFABwAKAAsACgAAnJBAwA/ACgAAXJBAwBMACgAAXJBBQA5ACgASQAoAAJxQQMA+AAoAAFxQQMAjQApAAFxQQMADwApAAFyQQMArwApAAFxQQMAHQApAAFyQQMADQApAAFxQQMAPAApAAFyQQcAbwAqAH8AKgCPACoAA11BAwDfACoAAV1BAwAuACoAAV1BAwDOACoAAXJBAwC3ACsAAV1BAwANACwAAXFBAwABAC4AAXG6ADMAFQAwERI5QQMA4wAzAAFdQQMANQAzAAFyQQMA1QAzAAFxQQMABwAzAAFyQQMAtQAzAAFxQQMAQwAzAAFyQQMAIQAzAAFyQQMA8AAzAAFxQQMAhwA4AAFxQQMA+AA4AAFxQQMANwA4AAFdQQMA1gA4AAFxQQMApgA4AAFxQQMAgAA5AAFdQQUAoAA5ALAAOQACXUELAC8AOgA/ADoATwA6AF8AOgBvADoABV1BAwB/ADoAAXFBAwAfADoAAXFBAwDvADoAAV1BAwCfADoAAV1BAwBfADoAAXFBBQC/ADoAzwA6AAJdALgAHC+4AABFWLgADC8buQAMAAo+WbgAAEVYuAASLxu5ABIACj5ZugAtAA4AAyu7ABgAAQAhAAQrQQMAHwAtAAFxQQMA3wAtAAFdQQMAbwAtAAFxQQMAPwAtAAFyuAAtELkAAwAC9EEDAEoAAwABckEDAJAAAwABXbgAEhC4AAncQQUAlwAJAKcACQACXUEDAEcACQABXUEFAAcACQAXAAkAAl1BAwBEAAkAAXJBAwDgAAkAAXFBAwAtAA0AAXJBAwCcAA0AAXFBAwDNAA4AAXJBAwCtAA4AAXFBAwB+AA4AAXJBAwDOAA4AAV1BAwAOAA4AAXFBAwAvAA4AAXJBAwAfAA4AAXFBBQCPAA4AnwAOAAJxQQMAbwAOAAFxQQMA3wAOAAFdQQUA3wAOAO8ADgACcUEDAO4ADgABXUEDAF4ADgABcUEDAD0ADgABckEFAD0ADgBNAA4AAnFBAwD8AA4AAV1BAwC7AA4AAV1BAwBMABYAAXJBAwC6ABYAAV1BAwBuABwAAV1BAwAnABwAAXK4ABIQuQAmAAL0QSEABwAmABcAJgAnACYANwAmAEcAJgBXACYAZwAmAHcAJgCHACYAlwAmAKcAJgC3ACYAxwAmANcAJgDnACYA9wAmABBdQSEABwAmABcAJgAnACYANwAmAEcAJgBXACYAZwAmAHcAJgCHACYAlwAmAKcAJgC3ACYAxwAmANcAJgDnACYA9wAmABBxQQcABwAmABcAJgAnACYAA3JBBQA2ACYARgAmAAJyugAoABIACRESOUEDAPcAKAABcUEDAJsAKQABcUEDAH0AKQABcUEHAN8AKQDvACkA/wApAANdQQMAbgApAAFxQQMAqwApAAFdQQMAawApAAFdQQMAeQApAAFdQQMA9QArAAFdQQUA1gArAOYAKwACXUEFAKMAKwCzACsAAl1BAwDBACsAAV1BAwC2ACwAAV1BAwDyAC8AAV1BAwDkAC8AAV1BAwDWAC8AAV1BAwCjAC8AAV1BAwCxAC8AAV1BAwDAAC8AAV26ADMAEgAJERI5QQMA1gAzAAFxQQMA5gA0AAFxQQMA9QA1AAFxQQMAxgA1AAFxQQMAygA1AAFdQQMABwA1AAFyQQUAFgA1ACYANQACckEDAEQANQABckEDADMANQABckEDABUAOAABcjAxAUEDAEcAHQABcUEDAEYAHgABcUEDAEQAHwABcUEDAEQAIAABcUEDAPMAMwABcUEDAJAAOQABXQBBAwDZACkAAV0lNCYjIgYVFBYzMjYXJiMiBwYHBiY1NDYzMjc2NzMGBwYjIhUUFjMyNyY3PgEzMhYVFAYHFhceARcBBRUQEBUWDw8WmjYjFzAzJj9KZ1ZgIUANIhdOJmaUNC06NHkCAScbHSUcFRoyGkUVkhAWFw8QFheOGAoKAQJPRExTDx5JaR8PgTQ8DyBQHCMlHRUmBBILBhMLAAAAAwAd//UBygGkAAsAFwBODUy7ADkABwAhAAQruwASAAYAQAAEK7sARgAGAAwABCtBAwDgAAwAAV1BCQAJAAwAGQAMACkADAA5AAwABF1BAwDJAAwAAXFBAwBKAAwAAXJBAwDpAAwAAXFBAwB5AAwAAXFBCQAJAAwAGQAMACkADAA5AAwABHJBAwDwAAwAAXFBBQCAAAwAkAAMAAJxQQMA8ABGAAFxQQUAgABGAJAARgACcUEDAOAARgABXboAAAAMAEYREjm4AAAvQQkAyQAAANkAAADpAAAA+QAAAARxQQcACQAAABkAAAApAAAAA3JBAwDpAAAAAV1BAwBZAAAAAXFBBQA6AAAASgAAAAJyQQMAeQAAAAFxQQMACQAAAAFxQQMAuQAAAAFdQQcAYAAAAHAAAACAAAAAA11BAwAgAAAAAV1BBQAGABIAFgASAAJdQQUAdgASAIYAEgACcUEHABYAEgAmABIANgASAANyQQMAjwASAAFdQQMA3wASAAFdQQMAxgASAAFxQQMANgASAAFdQQUA5gASAPYAEgACcUEDAEUAEgABcrgAEhC5AAYABvRBAwAZAAYAAV1BAwC4AAYAAXFBAwCAAAYAAV1BAwDYABgAAV1BAwBVABsAAXFBAwDlABwAAV1BAwAWABwAAXFBAwD2ABwAAV1BAwDDABwAAV1BAwABABwAAXFBBQAKAB8AGgAfAAJxQQMA+wAfAAFdQQMAywAfAAFxQQUA6gAfAPoAHwACcUEDAEkAHwABXUEDACkAHwABXUEDAJUAIwABXUEDADQAIwABcrgAABC5ACwABvRBAwAAACwAAV1BAwARACwAAV1BAwBRACwAAV1BAwAxACwAAV1BAwAgACwAAV1BAwBAACwAAV26ACQAIQAsERI5QQMAmwAkAAFxQQMAvwAkAAFxQQMArQAkAAFxQQMA6gAkAAFdQQMAigAkAAFxuAASELgAJtC4ACYvQQMATgAmAAFyQQMAPwAmAAFyQQMALQAmAAFyQQMAgAAmAAFdQQMAXAAoAAFxQQMA3wAoAAFdQQMADQAoAAFxQQUAagAoAHoAKAACcUEDADkAKAABcUEDAP0AKQABXUEDABsAKQABcUEDABYAKgABcUEDAOcAKgABXUEDADcAKgABcUEDAFYAKgABcUEDAHYAKgABcUEDAAMAKgABcboALgAMAEYREjlBAwClAC4AAXFBAwALAC4AAXFBAwDqAC4AAV1BAwAkAC4AAV1BAwAwAC4AAXJBAwB6ADAAAXFBAwC7ADAAAXFBAwBuADAAAXFBAwDPADAAAXFBAwAcADAAAXJBAwCaADAAAXFBAwAqADAAAXJBAwDpADAAAV1BAwCJADIAAXFBAwApADIAAXJBAwCJADIAAV1BAwBpADIAAXFBAwDqADIAAV1BAwAMADIAAXJBAwBLADIAAXJBAwA6ADIAAXJBCQDJADIA2QAyAOkAMgD5ADIABHFBAwCpADIAAXFBAwAJADIAAXFBAwA4ADIAAXFBAwCYADIAAXFBAwBFADMAAXJBAwB2ADMAAXFBAwA2ADMAAXJBAwDWADMAAXFBAwBnADMAAXFBBQAHADMAFwAzAAJyQQMADQAzAAFdQQUAGQAzACkAMwACXUEDAIcAMwABXUEDAKYAMwABcUEDAPYAMwABcUEDAOYAMwABXUEDAJUAMwABcUEDACUAMwABckEDAOUAMwABcUEDAGgANAABcUEDAEgANAABXUEDAEAANAABcUEDAJYANQABcUEDAIUANQABcUEDAJAANgABcUEDAJMAOAABXUEZAAYAOQAWADkAJgA5ADYAOQBGADkAVgA5AGYAOQB2ADkAhgA5AJYAOQCmADkAtgA5AAxdQRMAdgA5AIYAOQCWADkApgA5ALYAOQDGADkA1gA5AOYAOQD2ADkACXFBBwAGADkAFgA5ACYAOQADckEHANYAOQDmADkA9gA5AANdQQ0ABgA5ABYAOQAmADkANgA5AEYAOQBWADkABnFBBQA1ADkARQA5AAJyQQMAxgA7AAFxQQMA+gA7AAFdQQMACQA7AAFxQQMA5QA7AAFxQQMA0QA7AAFxugA+AAwARhESOUEDANoAPgABXUEDALwAPgABcUEFAEoAPgBaAD4AAnFBAwA5AD4AAXFBAwBpAD4AAXFBBwBvAEAAfwBAAI8AQAADXUEDAN8AQAABXUEDAC4AQAABXboASQAhACwREjlBAwBAAEkAAXJBAwCBAEkAAXFBAwBiAEkAAXFBAwCTAEkAAXFBAwAzAEkAAXJBAwDUAEkAAV1BAwC2AEkAAV1BAwCGAEkAAV1BAwD1AEkAAV1BAwAFAEkAAXFBAwB0AEkAAXFBAwADAEkAAXJBAwCSAEkAAV1BAwARAEkAAXJBAwDgAEkAAV1BAwAgAEkAAXJBCQDAAEkA0ABJAOAASQDwAEkABHFBAwCnAEsAAXFBAwCYAE0AAV1BBQAHAE4AFwBOAAJdQQMAKABOAAFdQQMAiQBOAAFxQQMA2ABOAAFdQQMACABOAAFxQQMAxgBOAAFdQQMARgBOAAFxQQUAoABPALAATwACXUEDAIAATwABXUEDAF8AUAABcUEDAB8AUAABcUELAC8AUAA/AFAATwBQAF8AUABvAFAABV1BAwB/AFAAAXFBAwDvAFAAAV1BBQC/AFAAzwBQAAJdQQMAnwBQAAFdALgAAEVYuAAYLxu5ABgACj5ZuAAARVi4AB4vG7kAHgAKPlm6AEMAGgADK7sAKQACAAMABCu7AAkAAQA3AAQrQQMA4AADAAFdQQMAzwADAAFxQQMAOQADAAFyQQMAoAADAAFxQQMAUAADAAFxQQMAjwAJAAFdQQcAjwAJAJ8ACQCvAAkAA3FBAwB2AAkAAXFBBQAwAAkAQAAJAAJyQQMAPwBDAAFyQQMA3wBDAAFdQQMAHwBDAAFxQQMAbwBDAAFxQQMAsABDAAFxuABDELkADwAC9EEDADkADwABckEDAJAADwABXbgAHhC4ABXcQQUAJwAVADcAFQACXUEDAAcAFQABXUEFAJcAFQCnABUAAl1BAwA2ABUAAXJBAwDgABUAAXFBAwBrABkAAXFBAwD5ABkAAV1BAwBMABoAAXFBAwCdABoAAXFBAwAdABoAAXFBAwDeABoAAV1BAwA/ABoAAXFBBQDfABoA7wAaAAJxQQUALwAaAD8AGgACckEDAI8AGgABcUEDAH8AGgABckEDAK4AGgABcUEFAO0AGgD9ABoAAl1BBQBdABoAbQAaAAJxQQMAzAAaAAFdQQMADAAaAAFxQQMA3QAbAAFdQQMA+wAgAAFdQQMACgAgAAFxQQMAygAgAAFxQQMASwAiAAFyQQUABgAiABYAIgACXUEDAGYAIgABcbgANxC5ACQAAfRBAwC3ACYAAXFBAwDFACcAAV1BAwC2ACcAAV1BAwD1ACcAAV1BAwCkACcAAV1BBQDQACcA4AAnAAJdQQMAoAApAAFxQQMAzwApAAFxQQMAEQApAAFdQQMA4AApAAFdQQMAUAApAAFxQQMAogArAAFdQQMAswArAAFdQQMAVgArAAFxQQMAxQArAAFdQQMA0wArAAFdQQMAogArAAFxQQUA4AArAPAAKwACXbgALtC4AC4vQQMAxgAwAAFduAApELgAMtC4ADIvQQMASAAyAAFyQQMADQA0AAFxQQMAPwA0AAFxQQMAKwA0AAFdQQMAWgA0AAFxuAAeELkAPAAC9EEhAAcAPAAXADwAJwA8ADcAPABHADwAVwA8AGcAPAB3ADwAhwA8AJcAPACnADwAtwA8AMcAPADXADwA5wA8APcAPAAQXUEhAAcAPAAXADwAJwA8ADcAPABHADwAVwA8AGcAPAB3ADwAhwA8AJcAPACnADwAtwA8AMcAPADXADwA5wA8APcAPAAQcUEHAAcAPAAXADwAJwA8AANyQQUANgA8AEYAPAACcroAPgAeABUREjlBAwDqAD4AAV1BAwArAD8AAXJBAwCrAD8AAV1BAwBsAD8AAXFBAwCNAD8AAXFBBwDfAD8A7wA/AP8APwADXUEDAA8APwABcUEDAH8APwABcUEDAA4APwABckEDAJwAPwABcUEDABwAPwABckEDAKsAPwABcUEDALoAPwABcUEFALoAPwDKAD8AAl1BAwDyAEEAAV1BAwCkAEEAAV1BAwDmAEEAAV1BAwDVAEEAAV1BAwADAEEAAXFBAwCyAEEAAV1BAwDAAEEAAV1BAwABAEUAAXFBAwD0AEUAAV1BAwDWAEUAAV1BAwDlAEUAAV1BAwCjAEUAAV1BAwCxAEUAAV1BAwDAAEUAAV1BAwALAEcAAXG6AEkAHgAVERI5QQMAlgBJAAFxQQMAxgBJAAFxQQMAJgBJAAFyQQMARQBJAAFyQQUA1QBJAOUASQACcUEFAAUASwAVAEsAAnJBAwCnAEsAAXFBAwDKAEsAAV1BAwAmAEsAAXJBBQA0AEsARABLAAJyQQMA9ABLAAFxMDEBQQMANgAIAAFyQQMA9ABJAAFxQQMAkABPAAFdAEEDAOYAKwABXQE0JiMiBhUUFjMyNgc0JiMiBhUUFjMyNhcmIyIHBgcGJjU0NjMmNTQ2MzIWFRQHNjc2NzMGBwYjIhUUFjMyNyY3PgEzMhYVFAYHFhceARcBGBUODhQVDQ4VExUQEBUWDw8WmjYjFzAzJj9KZ1gnJhobJiY1FkANIhdOJmaUNC06NHkCAScbHSUcFRoyGkUVAWMOFRUODRUUwxAWFw8QFheOGAoKAQJPRExTESobJiYbKREECh5JaR8PgTQ8DyBQHCMlHRUmBBILBhMLAAAAAAIAEv/4AaYBngAhAC0JzroACwAXAAMruwAAAAUAEgAEK0EDABAAAAABXUEFALAAAADAAAAAAl1BEQCPAAEAnwABAK8AAQC/AAEAzwABAN8AAQDvAAEA/wABAAhyQQMAMAABAAFyQQMAhQADAAFyQQMASgADAAFxQQUAjwADAJ8AAwACcUEFAD8AAwBPAAMAAnJBBwDPAAMA3wADAO8AAwADcUEDAFsAAwABcUEDAHoAAwABcUEDAJEAAwABckENAKAAAwCwAAMAwAADANAAAwDgAAMA8AADAAZyQQMAegAXAAFxQQMAuwAXAAFyQQMAqwAXAAFxQQMAvAAXAAFxQQMAPAAXAAFyQQMAjAAXAAFxQQcAywAXANsAFwDrABcAA3FBAwArABcAAXJBAwDaABcAAV1BBQAZABcAKQAXAAJxQQMAaAAXAAFxuAAXELgABdC4AAUvQQMAoAAFAAFdQQMACwAHAAFxQQMA/QAHAAFdQQMA3wAHAAFdQQMA7AAHAAFdQQMAygAHAAFdQQMAqQAHAAFdQQMABAAJAAFxQQMApQAJAAFdQQUA4wAJAPMACQACXUEFAMAACQDQAAkAAl1BAwCWAAsAAV1BBwBWAAsAZgALAHYACwADXUEFAB8ACwAvAAsAAnFBBwAGAAsAFgALACYACwADXUEFADEACwBBAAsAAl1BAwAgAAsAAXK6AA0AFwALERI5QQMAlQANAAFxQQMARgANAAFxQQMAxwANAAFxQQUA1gANAOYADQACcUEDAHUADQABcUEFAFQADQBkAA0AAnFBAwAyABAAAXJBAwDBABIAAV1BBwDZABIA6QASAPkAEgADXUEhAAkAEgAZABIAKQASADkAEgBJABIAWQASAGkAEgB5ABIAiQASAJkAEgCpABIAuQASAMkAEgDZABIA6QASAPkAEgAQcUEHAAkAEgAZABIAKQASAANyQQMACQASAAFdQQUAOgASAEoAEgACckENACkAEgA5ABIASQASAFkAEgBpABIAeQASAAZdQQUAmQASAKkAEgACXUEDAIgAEgABXUEDABAAEgABXUEDALAAEgABXUEDALsAFAABXUEDAJ8AFAABcUEDAE8AFAABckEDAHoAFAABcUEDAMkAFAABXUEDAHUAFgABcUEDAGoAGAABcUEDAHkAGAABcUEDAPkAGAABcUEDABkAGQABckEDALkAGQABcUEDAAoAGQABckEDAIoAGQABcUEDACoAGQABckEDAEoAGQABckEHANkAGQDpABkA+QAZAANxQQMAOQAZAAFyQQMAlgAZAAFdQQMAlgAZAAFxQQMAYQAaAAFxQQUAQgAaAFIAGgACcUEDADMAGgABcUEDAKQAGgABcUEDALUAGgABcUEFAIYAGgCWABoAAnFBAwDGABoAAXFBBwDVABoA5QAaAPUAGgADcUEDAAQAGgABckEDABMAGgABcUEHABIAGgAiABoAMgAaAANyQQMAcAAaAAFxQQMAQAAaAAFyQQMAlgAbAAFxQQMAJgAbAAFxQQMANQAbAAFxugAcABcACxESOUEDACYAHAABckEDABUAHAABcUEDADQAHAABckEDADwAHQABckEDAJ8AHQABcUEDAPwAHQABcUEDAAoAHQABckEDABkAHQABckEFALsAHwDLAB8AAl1BAwB5AB8AAXFBAwBFAB8AAXG4AAsQuQAiAAb0QQMAmwAiAAFdQQMAbQAiAAFdQQMAeAAiAAFdQQMAJwAiAAFyuAAFELkAKAAG9EEDAJkAKAABXUEDAG8AKAABXUEDAHkAKAABXUEDAKgAKAABXUENAAgAKAAYACgAKAAoADgAKABIACgAWAAoAAZdQQMAEAAuAAFxQQUAsAAuAMAALgACXUEFAHAALgCAAC4AAl1BAwBfAC8AAXFBAwCfAC8AAV1BDQAvAC8APwAvAE8ALwBfAC8AbwAvAH8ALwAGXUEDAA8ALwABcUEDAO8ALwABXQC4ABkvuAAARVi4AAIvG7kAAgAKPlm7AAgAAgAlAAQruwAeAAEAFQAEK0EDALoAAQABcUEDAI4AAQABcUEDAPYAAQABcUEDAAYAAQABckEDABUAAQABckEDAG0ABAABcUEDAPMABgABXUEDAKUABgABXUEDANUABgABXUEDAOAABgABXUEDAAAABgABcUEDAGEACAABXUEDAHMACAABXUEHANAACADgAAgA8AAIAANdQQMAAAAIAAFxQQMAgAAIAAFdQQMApgAKAAFdQQMAlwAKAAFdQQMAxgAKAAFdQQMA4AAKAAFdQQMAAAAKAAFxQQMAJwALAAFyuAACELkADQAB9EEhAAcADQAXAA0AJwANADcADQBHAA0AVwANAGcADQB3AA0AhwANAJcADQCnAA0AtwANAMcADQDXAA0A5wANAPcADQAQXUEJAAcADQAXAA0AJwANADcADQAEcUEDAJgADQABcUEDAIkADQABcUEFAKcADQC3AA0AAnFBAwD3AA0AAXFBBwAHAA0AFwANACcADQADckEFADYADQBGAA0AAnK4AA/QQQMAmwAZAAFdugAXAAIAGRESOUEHACkAFwA5ABcASQAXAANdQQUAegAXAIoAFwACXUEDAJkAFwABcUEDAJkAFwABXUEDALgAFwABckEDABAAGwABckEDAPIAGwABcUEDAAIAGwABckEDAIUAGwABcUEDAOQAGwABcUEDACEAGwABckEFADAAGwBAABsAAnJBBwCwABsAwAAbANAAGwADcboAHAACABkREjlBAwACABwAAXJBBQDkABwA9AAcAAJxQQMApAAcAAFxQQMASQAcAAFdQQMALAAcAAFdQQMANgAcAAFxQQMAFAAcAAFyQQMA0wAcAAFxQQMAQQAcAAFyQQUAIAAcADAAHAACckEDALUAIQABcUEDAKYAIQABcUEFAMUAIQDVACEAAl1BAwCEACEAAXFBAwBlACUAAV1BBQA5ACUASQAlAAJyQQMAuAAlAAFdQQcA0AAlAOAAJQDwACUAA11BAwAAACUAAXFBAwCAACUAAV24AAIQuQArAAH0QQUA5wArAPcAKwACcUEFAAcAKwAXACsAAnJBAwC4ACsAAV1BAwDrACsAAXJBAwBeACsAAXJBAwCfACsAAV1BBwB/ACsAjwArAJ8AKwADckEDAM8AKwABcUENAE8AKwBfACsAbwArAH8AKwCPACsAnwArAAZxQQMAbQArAAFyQQMAqwArAAFyQQUAZwArAHcAKwACXUEDABcAKwABcUEFADYAKwBGACsAAnJBAwC4AC4AAV1BAwB3AC4AAXEwMQFBAwC5AAcAAV1BAwC2AAkAAV0AQQMAtgAKAAFdQQMAmgAKAAFdJRYjIiY1NDYzMhYVFAcWMz4BNTQmIyIHJiczFhc2MzIXFgc0JiMiBhUUFjMyNgGlAchJTiccHSYfHhtMTVBDazYGNCsmATVMWzE09BYRERUVEREWmqIzKh0mJh0mEwQBPEMyPUuYSkZcKiMmiBEWFhERFRUAAAACABj//QG0AZ4ACwBADou7ACQABQAxAAQruwArAAYAAAAEK7sAOgAFABYABCu7ABAABgA+AAQrQQcAcAAAAIAAAACQAAAAA3FBAwDQAAAAAXJBAwBEAAAAAV1BAwBSAAAAAV1BBwDQAAAA4AAAAPAAAAADcUERAAAAAAAQAAAAIAAAADAAAABAAAAAUAAAAGAAAABwAAAACHJBAwAAAAAAAXFBDwCAAAAAkAAAAKAAAACwAAAAwAAAANAAAADgAAAAB124ADEQuQAGAAf0QQMA/QAGAAFyQQMAbwAGAAFyQQMA7wAGAAFyQQMA3QAGAAFyQQMAQAAGAAFyQQUAigAMAJoADAACcUEDAKsADAABcUEDALoADAABcUEFAFoADABqAAwAAnFBAwB5AAwAAXFBAwDEAA0AAXFBBQDPABAA3wAQAAJdQQMA/wAQAAFdQQMALwAQAAFxQQUAnwAQAK8AEAACXbgAEBC4AA7QQQMAXwASAAFyQQMA9AASAAFxugAUADEAEBESOUEDAJUAFAABXUEDAIoAFAABXUEDAB0AFAABXUEDAG0AFAABXUEDAD0AFAABXUEDACsAFAABXUEDAIcAFAABckEDAKQAFAABXUEDAFAAFAABckEFADoAFgBKABYAAnJBBQAfABYALwAWAAJdQRsAOQAWAEkAFgBZABYAaQAWAHkAFgCJABYAmQAWAKkAFgC5ABYAyQAWANkAFgDpABYA+QAWAA1dQSEACQAWABkAFgApABYAOQAWAEkAFgBZABYAaQAWAHkAFgCJABYAmQAWAKkAFgC5ABYAyQAWANkAFgDpABYA+QAWABBxQQcACQAWABkAFgApABYAA3JBAwAJABYAAV1BAwCcABcAAXFBAwCqABcAAXFBAwBEABkAAXJBAwAAACsAAXFBAwDQACsAAXJBAwBRACsAAXJBAwD2ACsAAV1BCQAGACsAFgArACYAKwA2ACsABF1BDQAWACsAJgArADYAKwBGACsAVgArAGYAKwAGcUEHAKYAKwC2ACsAxgArAANxQQcAcAArAIAAKwCQACsAA3FBFwBAACsAUAArAGAAKwBwACsAgAArAJAAKwCgACsAsAArAMAAKwDQACsA4AArAAtdQQUAYAArAHAAKwACckEHANAAKwDgACsA8AArAANxQQsAAAArABAAKwAgACsAMAArAEAAKwAFcrgAKxC5ABwAB/RBBwDfABwA7wAcAP8AHAADcUENAA8AHAAfABwALwAcAD8AHABPABwAXwAcAAZyQQkAzwAcAN8AHADvABwA/wAcAARdQQMADwAcAAFxQQkAbwAcAH8AHACPABwAnwAcAARdQQsAXwAcAG8AHAB/ABwAjwAcAJ8AHAAFcUEDAN8AHAABcrgAKxC4AB3QuAAdL0ELAF8AHQBvAB0AfwAdAI8AHQCfAB0ABXFBCQDPAB0A3wAdAO8AHQD/AB0ABF1BAwAPAB0AAXFBCQBvAB0AfwAdAI8AHQCfAB0ABF1BBwDfAB0A7wAdAP8AHQADcUENAA8AHQAfAB0ALwAdAD8AHQBPAB0AXwAdAAZyQQMA3wAdAAFyQQUAOwAgAEsAIAACckEDAEoAIAABcUEDAEQAIgABcUEDAFYAIgABcUEDAGUAIgABcUEDADIAIgABckEDAEAAIgABckERAAYAJAAWACQAJgAkADYAJABGACQAVgAkAGYAJAB2ACQACF1BDwCWACQApgAkALYAJADGACQA1gAkAOYAJAD2ACQAB11BIQAGACQAFgAkACYAJAA2ACQARgAkAFYAJABmACQAdgAkAIYAJACWACQApgAkALYAJADGACQA1gAkAOYAJAD2ACQAEHFBBwAGACQAFgAkACYAJAADckEFADUAJABFACQAAnK6ACYAMQAGERI5QQMASQAmAAFyQQMABgApAAFxQQUA0AApAOAAKQACXUEFAKAAKQCwACkAAl1BAwCiAC0AAV1BBQCwAC0AwAAtAAJdQQMARwAwAAFyQQMAegAzAAFxQQMAdAA1AAFxQQMA2QA1AAFdQQMA2gA1AAFyQQMAVAA1AAFxQQMApAA1AAFxQQMAYwA1AAFxugA2ACsAHBESOUEDABkANgABcUEDAEkANgABckEHAHoANgCKADYAmgA2AANxQQMAWgA2AAFyQQMAKgA2AAFxQQMAGgA2AAFdQQMAmwA2AAFdQQMACwA2AAFyQQMAawA2AAFxQQMA/AA2AAFxQQMAXgA2AAFxQQMA/QA2AAFdQQMACwA2AAFxQQUA2wA2AOsANgACXUEDADsANgABckEFANsANgDrADYAAnFBAwBKADYAAXFBAwDKADYAAV1BBQAaADYAKgA2AAJyQQUAagA2AHoANgACXUEDAKkANgABcUEDAIkANgABXUEDACgANgABXUEFANsANwDrADcAAnFBAwB+ADcAAXFBAwCtADcAAXFBAwCbADcAAXFBAwCKADcAAXFBAwBqADgAAV1BAwBqADkAAV1BAwDsADkAAXFBAwCZADkAAXFBAwB2ADkAAV1BBQAfADoALwA6AAJdugA8ABYAOhESOUEFABQAPAAkADwAAnJBAwDlADwAAXFBAwD2ADwAAXFBAwAGADwAAXJBAwB2ADwAAXFBAwCJADwAAXJBAwCnADwAAXFBAwDWADwAAXFBAwA1ADwAAXJBBQBVADwAZQA8AAJxQQUAswA8AMMAPAACcUEDAEAAPAABckEFAAkAPgAZAD4AAnFBEwAJAD4AGQA+ACkAPgA5AD4ASQA+AFkAPgBpAD4AeQA+AIkAPgAJXUEFAM8APgDfAD4AAl1BAwAvAD4AAXFBBQCfAD4ArwA+AAJdQQMA/wA+AAFdQQUAOgA+AEoAPgACckEDAOkAPgABXUEbADkAPgBJAD4AWQA+AGkAPgB5AD4AiQA+AJkAPgCpAD4AuQA+AMkAPgDZAD4A6QA+APkAPgANcUEHAAkAPgAZAD4AKQA+AANyQQMAuQA+AAFdQQMAjQBAAAFxQQMAXQBAAAFxQQMAmwBAAAFxQQMAewBAAAFxQQMAgABBAAFdQQsAoABBALAAQQDAAEEA0ABBAOAAQQAFXbgAEBC4AELcQQcAbwBCAH8AQgCPAEIAA3EAuAAML7gAAEVYuAATLxu5ABMACj5ZuAAARVi4AC4vG7kALgAKPlm7ACgAAgADAAQruwA4AAIAGAAEK0EDAOcAAAABXUEDADoAAwABcrgALhC5AAkAAvRBCQAHAAkAFwAJACcACQA3AAkABF1BHwAXAAkAJwAJADcACQBHAAkAVwAJAGcACQB3AAkAhwAJAJcACQCnAAkAtwAJAMcACQDXAAkA5wAJAPcACQAPcUEHAAcACQAXAAkAJwAJAANyQQMAnwAJAAFdQQMA9wAJAAFdQQMARgAJAAFyQQMANQAJAAFyQQUAoQARALEAEQACcUEDANMAEQABcUEDAAQAEQABckEFABUAEQAlABEAAnJBAwD1ABEAAXFBAwCFABEAAXFBAwBlABEAAXFBAwB0ABEAAXFBAwCSABEAAXFBAwDgABEAAXFBAwDAABEAAXG6ABQALgAJERI5QQMA6QAXAAFxQQMA+wAaAAFxQQMASgAaAAFyQQMAHQAbAAFyQQMATgAbAAFyQQMADAAbAAFyQQMALAAbAAFyQQMAMAAoAAFdQQUAEQAoACEAKAACXUEDAAAAKAABXUEDAJAAKAABXbgAKBC4ABzQuAAcL0EDAC8AHAABXUEDAA8AHAABXUEDAHcAHQABcUEDAPoAHgABXUEDAAoAHgABcUEDANsAHgABXUEDAEwAHgABcUEDAG4AHgABcUEDAB4AHgABckEDAB4AHgABcUEDAF0AHgABcUEDAAwAHgABckEDACsAHgABckEFACoAHgA6AB4AAnFBAwDpAB4AAV1BBQBaAB8AagAfAAJxQQMA+gAfAAFxuAAYELgAIdC6ACYAAwAoERI5QQMARQAmAAFyQQMAxgApAAFdQQMA5QAqAAFdQQMABAAqAAFxQQMAeAArAAFxQQMAJwArAAFyQQMA7AAsAAFdQQMADAAsAAFxQQMAywAsAAFdQQMAUQAwAAFyQQMAqQAwAAFdQQMAuwAwAAFdQQMAygAwAAFdQQMAZQAwAAFyQQMAgQAwAAFyQQcAwAAwANAAMADgADAAA3JBBQBdADIAbQAyAAJxQQUA3wAyAO8AMgACckEDAI4AMgABckEDAMwAMgABckEFAEYAMgBWADIAAl24ADgQuAA00LoANgAuAAwREjlBAwAoADYAAXFBBQAIADYAGAA2AAJyQQMA2gA2AAFdQQMAbAA2AAFxQQMATwA2AAFxQQMAnQA2AAFdQQMAGgA2AAFxQQMA6QA2AAFdQQMA+AA2AAFdQQMAFgA2AAFdQQMAdgA2AAFxQQMAhgA5AAFdQQMARQA5AAFdQQMA0gA5AAFxQQMA6wA7AAFxQQMA/gA7AAFxQQMADwA7AAFyQQMAPwA7AAFyQQMATAA7AAFyQQMAeAA7AAFyQQMAoQA7AAFyugA8AC4ADBESOUEDAAEAPAABckEDALMAPAABcUEDAIMAPAABcUEDAMQAPAABcUEDAKUAPAABcUEDAHUAPAABcUEDAKcAPAABXUEDAIgAPAABckEDAGYAPAABcUEDANUAPAABcUEDAFQAPAABcUEDAPQAPAABcUEDAOMAPAABcUEFABMAPAAjADwAAnJBAwAxADwAAXJBAwBAADwAAXJBAwD0AD0AAXFBAwB1AD0AAXJBAwDUAD0AAXFBAwCiAD0AAXEwMQFBAwBLAAIAAXJBAwDJAAwAAXFBAwD5AAwAAXFBBQDaAAwA6gAMAAJxQQMA1gApAAFdQQMA1gAtAAFdQQMARAA8AAFyQQcACQBAABkAQAApAEAAA3JBAwD6AEAAAXFBBwDLAEAA2wBAAOsAQAADcUEDAJAAQQABXQBBAwDZACwAAV1BAwBHADwAAXI3NCYjIgYVFBYzMjYBBhcUFRQGKwE2NTQjIgYdASM1NCYjIgYVFBc2MzIWFRQGIyImNTQ2MzIXNjMyFRQHNjU0N5MYDw8WFw4QFwEhEgFRNwUmNBQdJiQVGyIDDx8cJygbKCw1KzcVDzdVGTwNPhIVFxAOFxYBbyx1IAOOTmVHXjIeLzAdMkI1Fg8WKBwbJkc/S1g/P3xDPw6VrSYAAAIAIP/3AaEBngAxAD0KyrgAMi+7AB0ABwAJAAQruwA4AAYALAAEK7gAMhC5AAAABvRBAwAxAAAAAV1BAwBCAAAAAV1BAwCAAAAAAV1BAwAQAAAAAV1BAwAHAAEAAXFBAwAVAAEAAXFBAwCUAAEAAV1BAwCKAAMAAXFBAwD8AAMAAXFBAwDrAAMAAXFBAwDKAAMAAXFBAwCZAAMAAXFBAwDaAAQAAXFBAwBMAAQAAXJBAwDLAAQAAXFBAwCKAAQAAXFBAwAIAAQAAXJBAwD5AAcAAXFBAwB4AAcAAXFBAwCoAAoAAXFBAwA5ABAAAXFBAwBLABAAAXFBAwDrABAAAXFBAwDdABAAAXFBAwAOABAAAXJBBQA/ABAATwAQAAJyQQMAzgAQAAFxQQMAjAAQAAFxQQMAuwAQAAFxQQMAGwAQAAFyQQMA+AAQAAFxQQMAKAAQAAFxQQMAPwASAAFyQQMALAASAAFyQQMAmgATAAFdQQMAKQAsAAFyQQkAKQAsADkALABJACwAWQAsAARdQQMAyQAsAAFdQQUAOQAsAEkALAACcUEHAJkALACpACwAuQAsAANxQQMAHQAsAAFdQQUA3wAsAO8ALAACXUEFAG8ALAB/ACwAAl1BAwBfACwAAXFBAwC/ACwAAV1BAwCPACwAAXFBAwAOACwAAV1BAwBKACwAAXJBBQBpACwAeQAsAAJxQQMA+QAsAAFdQQUACQAsABkALAACcUEHANkALADpACwA+QAsAANxQQMACQAsAAFyQQMAmQAsAAFdQQMAIgAsAAFxQQMAwAAsAAFxuAAsELgAFdxBAwArABUAAV1BAwAsABUAAXFBAwCuABUAAV1BAwCbABUAAV1BAwAkABUAAXJBAwAwABUAAXJBAwApABYAAXFBAwBXABYAAV1BAwCHABYAAV1BAwBxABsAAXFBBQC2ABsAxgAbAAJdQQMAkgAbAAFdQQMAoQAbAAFdQQMAsQAbAAFxQQkAxgAdANYAHQDmAB0A9gAdAARdQSEABgAdABYAHQAmAB0ANgAdAEYAHQBWAB0AZgAdAHYAHQCGAB0AlgAdAKYAHQC2AB0AxgAdANYAHQDmAB0A9gAdABBxQQcABgAdABYAHQAmAB0AA3JBEQAGAB0AFgAdACYAHQA2AB0ARgAdAFYAHQBmAB0AdgAdAAhdQQUAlgAdAKYAHQACXUEFADUAHQBFAB0AAnJBAwCYAB8AAV1BAwAoAB8AAXFBAwCJAB8AAXFBBQC5AB8AyQAfAAJdQQUACQAfABkAHwACcUEFABoAHwAqAB8AAnJBAwCaAB8AAXFBBQA7AB8ASwAfAAJyQQMADQAfAAFyQQMA/AAfAAFxQQMA2gAfAAFxQQMA2gAfAAFdQQcASQAfAFkAHwBpAB8AA3FBAwDpAB8AAV1BAwCpAB8AAXFBAwB4AB8AAXFBAwD4AB8AAV1BBQC4AB8AyAAfAAJxQQMA6AAfAAFxQQMA6QAhAAFdQQMABgAhAAFyQQMAOAAjAAFyugAnACwAFRESOUEDAFkAJwABcUEDAPoAJwABcUEDACsAJwABckEDAMwAJwABcUEDABwAJwABckEDACsAJwABcUEDAIoAJwABcUEDAEgAJwABcUEDAMQAJwABXUEDAO8AKgABXUEDAN8ALgABXUEDAO4ALgABXUEDACUALgABckEDAOcAMAABXUEDANUAMAABXUEDAI8AOAABcUEDAF8AOAABcUEDAL8AOAABXUEDAI8AOAABXUEFAN8AOADvADgAAl1BAwAhADgAAXFBAwDAADgAAXFBAwCAAD4AAV1BAwCgAD4AAV1BCQC/AD8AzwA/AN8APwDvAD8ABF1BBwBfAD8AbwA/AH8APwADXUEDAJ8APwABXUEFAC8APwA/AD8AAl1BAwAPAD8AAXFBAwBfAD8AAXEAuAATL7gAAEVYuAACLxu5AAIACj5ZuAAARVi4AAcvG7kABwAKPlm7ADsAAgApAAQruwALAAEAGgAEK7sALwACADUABCtBAwAaAAEAAXFBAwC7AAEAAV1BAwALAAEAAXFBBwBqAAEAegABAIoAAQADXUEDAMYAAQABcUEDAPYAAQABcUEDACkABAABcUEDADkABAABXUEDABwABAABckEDAP0ABAABcUEDAA0ABAABckEDAEoABAABcUEFAIkABACZAAQAAnFBAwDXAAQAAXFBAwA2AAQAAXJBAwAbAAYAAXJBAwCHAAoAAXFBAwB5AAoAAXFBAwC5AAoAAXFBAwDmAAoAAV1BAwCVAAoAAXFBAwCfAAsAAV24AAsQuAAO0LgADi9BAwCcABMAAV1BAwCdABUAAV1BAwA3ABUAAXJBAwCbABYAAXFBAwA9ABYAAXFBBQA/ABYATwAWAAJyQQMAXAAWAAFxQQUAagAWAHoAFgACcUEDAGkAFgABXUEDAJ8AGgABXbgAGhC4ABfQuAAXL0EDALsAHAABcUEFANIAHwDiAB8AAnFBBQCEAB8AlAAfAAJxQQMA9AAfAAFxQQMARgAfAAFxQQMAxgAfAAFdQQMAJgAfAAFxQQMAVwAfAAFxQQMA1wAfAAFdQQcAlwAfAKcAHwC3AB8AA11BBQAHAB8AFwAfAAJxQQUA5gAfAPYAHwACXUEFAGYAHwB2AB8AAnFBBQClAB8AtQAfAAJxQQMAxAAfAAFxQQMAFAAfAAFyQQMAAgAfAAFyQQcAIAAfADAAHwBAAB8AA3JBAwCDACAAAXFBAwCUACAAAXFBAwCzACAAAXFBAwAwACAAAXJBAwD5ACEAAXFBAwCHACEAAXFBAwBFACMAAXFBAwCyACMAAXFBAwAwACMAAXK4AAIQuQAlAAH0QQMARgAlAAFyQQMApgAlAAFxQQMAJwAlAAFyQQcA1wAlAOcAJQD3ACUAA11BFQAHACUAFwAlACcAJQA3ACUARwAlAFcAJQBnACUAdwAlAIcAJQCXACUACnFBGQAHACUAFwAlACcAJQA3ACUARwAlAFcAJQBnACUAdwAlAIcAJQCXACUApwAlALcAJQAMXUELALcAJQDHACUA1wAlAOcAJQD3ACUABXFBAwAHACUAAXJBAwDGACUAAV1BAwAVACUAAXJBAwA0ACUAAXJBBwAvACkAPwApAE8AKQADcUEDAAsAKQABcbgAKRC4ACfQuAAnL0EDAOsAJwABXUEDAC0AJwABckEDAEgAJwABcUEDAMYAJwABcUEDANoAKwABXUEDADcALAABckEDANUALQABXUEDADAALwABckEDAAEALwABckEHAC8ALwA/AC8ATwAvAANxQQMArwAvAAFxQQMAEAAvAAFyQQMA8AAvAAFdQQcAMAAvAEAALwBQAC8AA11BAwCVADEAAV1BAwCmADEAAV1BAwDlADEAAV1BAwDEADEAAV1BAwDwADEAAV1BBQAwADUAQAA1AAJdQQMAAQA1AAFyQQMAKgA1AAFyQQMALQA1AAFxQQMArwA1AAFxQQMAPgA1AAFxQQMATQA1AAFxQQMAUwA1AAFdQQMAMAA1AAFyQQMA8AA1AAFdQQMAEAA1AAFyQQcALwA7AD8AOwBPADsAA3FBAwAlADsAAXIwMQFBAwCpACoAAV1BBQCpAC4AuQAuAAJdQQMAtgAwAAFdQQMAkAA+AAFdAEEFAKkAKwC5ACsAAl1BBQCmAC0AtgAtAAJdQQMAtgAxAAFdJRQjIicOAQcmNTQzMhYzMjc2PQEzFRQjIiYjIgYVFBc2NxYXFjMyNwYjIiY1NDYzMhYHNCYjIgYVFBYzMjYBoWNJQw07BEa1DzAMKxQaI3cSNw9DRBgpNA4lLSAmExIEHCcnHBwnHhYPDxYWDw8Wd3xWBkQQI3SYBBMZPxEUiwQ+M0gYOBMbHycbAyccHCcnHA8WFg8PFhYAAAACABr/9QGmAZ4ANgBCCym4AAUvugA9ABsAAyu7ABUABgA3AAQruwAsAAYAJwAEK0EDAOUAAAABcUEDAKYAAAABcUEDAHYAAAABcUEDADcAAAABXUEDADcAAAABckEDAPYAAAABcUEDAAUAAAABckEDAEQAAAABckEDABIAAAABckEDAIgAAQABcUEDACgAAQABckEDAHkAAQABcUEDAEoAAQABckEDADsAAQABckEDAOoAAQABcUEDABoAAQABckEDAPkAAQABcUEDAAkAAQABckEDANgAAQABcUEDAGgAAQABcUEFAGUAAQB1AAEAAnJBAwDJAAMAAXFBAwBLAAMAAXJBAwApAAMAAXJBAwCoAAMAAXFBAwBpAAUAAXFBAwBkAAUAAXJBAwAbAAcAAXJBAwAqAAcAAXFBAwDZAAcAAV1BAwAyAAkAAXJBAwCUAAkAAXFBAwAUAAkAAXJBAwCmAAkAAV1BBQBGAAkAVgAJAAJxQQUAtwAJAMcACQACXUEFAGYACQB2AAkAAl1BAwDWAAkAAV1BAwB1AAkAAXFBAwD0AAkAAXFBAwCCAAkAAXFBAwACAAkAAXJBAwAgAAkAAXJBAwB2AAoAAXG4ABsQuQALAAX0QQMApQALAAFyQQcAVwALAGcACwB3AAsAA3JBAwD5AAsAAXJBAwAHAAsAAXFBAwC2AAsAAXJBBQDUAAsA5AALAAJyQQMAwwALAAFyQQMA1gAMAAFxQQMAhgAMAAFxQQcABgA9ABYAPQAmAD0AA11BCQBfAD0AbwA9AH8APQCPAD0ABHJBAwCPAD0AAV1BAwD/AD0AAXFBDQCvAD0AvwA9AM8APQDfAD0A7wA9AP8APQAGckEDAEYAPQABckEDAEYAPQABXUEFAGYAPQB2AD0AAl26AA0AGwA9ERI5QQMAawANAAFdQQUA5gANAPYADQACXbgAPRC5AA8ABvRBBQAvAA8APwAPAAJdQQUAbwAPAH8ADwACXUEDAA8ADwABXUEDAB4ADwABXUEDAEwADwABXUEDAAoAEQABcUEFAOsAEQD7ABEAAl1BAwDKABEAAV1BAwDZABEAAV1BAwCZABEAAV1BAwDzABMAAV1BAwDFABMAAV1BAwCVABMAAV1BAwAEABMAAXFBAwDRABMAAV1BAwDgABMAAV1BAwBQABUAAV1BAwARABUAAV1BAwAfABUAAXFBAwAAABUAAV1BAwCQABUAAV1BBQDgABUA8AAVAAJdQQMAxQAZAAFxQQMAtgAZAAFxQQMADAAZAAFyQQMAPAAZAAFyQQMA5gAZAAFxQQMA1AAZAAFxQQMAQwAZAAFyQQMArAAdAAFxQQMACwAdAAFxQQMAmgAdAAFxQQMAFgAfAAFxQQMAVgAfAAFxQQMABwAfAAFxQQMApgAfAAFxQQMAZQAfAAFxQQMA9AAfAAFxugAgABsALBESOUEDABcAIAABckEDADgAIAABckEDACQAIAABckEDAGQAIAABckEDAPoAIQABcUEDAAoAIQABckEDADwAIQABckEDALsAIQABcUEDADkAIQABcUEDAEgAIQABcUEDADYAIwABckEFAAcAIwAXACMAAnFBAwCnACMAAXFBAwDmACMAAV1BAwAmACMAAXFBAwAEACMAAXJBBQA6ACcASgAnAAJyQSEACQAnABkAJwApACcAOQAnAEkAJwBZACcAaQAnAHkAJwCJACcAmQAnAKkAJwC5ACcAyQAnANkAJwDpACcA+QAnABBdQSEACQAnABkAJwApACcAOQAnAEkAJwBZACcAaQAnAHkAJwCJACcAmQAnAKkAJwC5ACcAyQAnANkAJwDpACcA+QAnABBxQQcACQAnABkAJwApACcAA3JBAwBzAC0AAV1BAwD1AC0AAV1BAwCWAC0AAV1BAwDmAC0AAV1BAwDGAC0AAV1BAwBmAC0AAV1BAwAWAC0AAXFBAwAkAC0AAXFBAwCCAC0AAV1BAwCiAC0AAV24AAUQuQAzAAb0QQMA4wAzAAFdQQMAJwAzAAFdQQMAMgAzAAFdQQMAoQAzAAFdQQMAJQA1AAFyQQUAhgA1AJYANQACcUEDAMcANQABcUEDANYANQABcUEDAEQANQABckEDABMANQABckEHAAkANwAZADcAKQA3AANyQQsACQA3ABkANwApADcAOQA3AEkANwAFXUEFADoANwBKADcAAnJBAwAfADcAAXFBGwApADcAOQA3AEkANwBZADcAaQA3AHkANwCJADcAmQA3AKkANwC5ADcAyQA3ANkANwDpADcADXFBBQBpADcAeQA3AAJdQQMAkAA3AAFdQQUA4AA3APAANwACXUEDAHgAOgABckEDAIAAQwABXUEFAOAAQwDwAEMAAl24ACwQuABE3AC4ACkvuAAARVi4AAEvG7kAAQAKPlm4AABFWLgAGC8buQAYAAo+WbsAEgACADoABCu7AB4AAQAIAAQrQQMApwAAAAFxQQMARwAAAAFyQQMAJwAAAAFyQQUAtgAAAMYAAAACcUEDADQAAAABckEDADgAAQABckEDAKgAAwABcUEDAIQAAwABckEDAOoACgABcUEDAAsACgABckEDAEwACgABckEDAB0ACgABckEDAJ0ACgABXUEDAP8ACgABcUEDAD0ACgABckEDALwACgABcUEDAGsACgABckEFAMsACgDbAAoAAnFBAwCJAAoAAV1BAwBpAAoAAXFBAwD0AAsAAXFBAwDjAAwAAXFBBQCTAAwAowAMAAJxQQMAhQAMAAFdQQMAdQAMAAFxQQMABAAMAAFyQQMAEwAMAAFyQQMA0AAMAAFxQQMAQAAMAAFyugANAAEAKRESOUEFACEADQAxAA0AAnJBAwASAA0AAXJBBQDlAA0A9QANAAJdQQMABQANAAFxQQUAZQANAHUADQACcUEFAIMADQCTAA0AAnFBBwCiAA0AsgANAMIADQADcUEHANEADQDhAA0A8QANAANxQQMAQAANAAFyQQMAEwASAAFdQQMAHwASAAFxQQUAbwASAH8AEgACckEDAAEAEgABXUEFACAAEgAwABIAAl1BAwDFABQAAV1BAwDWABQAAV1BAwAGABQAAXFBAwDlABQAAV1BAwCVABQAAV1BAwDyABQAAV1BAwD8ABYAAV1BBQDOABYA3gAWAAJdQQMAngAWAAFdQQMA6wAWAAFdQQMACgAWAAFxQQMA5wAZAAFxQQMAHAAaAAFyQQMA3AAaAAFxQQMASgAaAAFyuAAIELgAJdC4ACUvuQAuAAH0QQMAWQAuAAFdugAgACUALhESOUEDABQAIAABckEDAGwAIAABckEDADYAIAABckEDAEAAIAABckEDACAAIAABckEDAPgAIQABcbgAHhC4ACLQuAAiL0EDALoALAABXUEDAFkALQABXUEDAAkALQABcUEDALgALQABXUEDACgAMAABXbgACBC4ADHQuAAxL0EDAJcANQABcUEFAG8AOgB/ADoAAnJBAwAfADoAAXFBAwBKADoAAXK4ABgQuQBAAAL0QR0AJwBAADcAQABHAEAAVwBAAGcAQAB3AEAAhwBAAJcAQACnAEAAtwBAAMcAQADXAEAA5wBAAPcAQAAOcUEHAAcAQAAXAEAAJwBAAANyQQUA5wBAAPcAQAACXUEDAJcAQAABXUEFADYAQABGAEAAAnIwMQFBAwCkAAUAAV1BAwCkAAYAAV1BBQCpABEAuQARAAJdQQUApgATALYAEwACXUEFAKYAFwC2ABcAAl1BAwCQAEMAAV0AQQUApgAQALYAEAACXUEFAKYAFAC2ABQAAl1BBQCpABYAuQAWAAJdJQcmJyYnLgEnIgYVFhcmNTQ2MzIWFRQGIwYmNTQ2MzIXNjMyFjMyNTQnMxYVFCMiJiMiBxYXFiM0JiMiBhUUFjMyNgGhEy01KhMHLhwjPQcsBCYbGycnG0hMTDc5JAQjCTMLIAgeCDYLPQMPBQcjLpYWDw8WFg8PFhAbI008MRIjAUg1ShwLDhsnJxsbJgFRQ0JVMjEfOTYoMyhcICUoOEQPFhYPDxYWAAAAAAIANgAAAdIBkAAjAC8CebsAKgAGABAABCu7ABYABQAkAAQruwAHAAUACAAEK7sAAAAFAAEABCtBAwBAAAcAAV1BAwBAAAgAAV1BFwBWABYAZgAWAHYAFgCGABYAlgAWAKYAFgC2ABYAxgAWANYAFgDmABYA9gAWAAtdQSEABgAWABYAFgAmABYANgAWAEYAFgBWABYAZgAWAHYAFgCGABYAlgAWAKYAFgC2ABYAxgAWANYAFgDmABYA9gAWABBxQQcABgAWABYAFgAmABYAA3JBBwAGABYAFgAWACYAFgADXUEFADUAFgBFABYAAnJBBQAwABYAQAAWAAJdugAYACQAFhESObgABxC4AB3QugAeABAAABESOUEhAAYAKgAWACoAJgAqADYAKgBGACoAVgAqAGYAKgB2ACoAhgAqAJYAKgCmACoAtgAqAMYAKgDWACoA5gAqAPYAKgAQXUEhAAYAKgAWACoAJgAqADYAKgBGACoAVgAqAGYAKgB2ACoAhgAqAJYAKgCmACoAtgAqAMYAKgDWACoA5gAqAPYAKgAQcUEHAAYAKgAWACoAJgAqAANyQQUANQAqAEUAKgACckEDAD8AMQABXQC4AABFWLgAEy8buQATABA+WbgAAEVYuAAaLxu5ABoAED5ZuAAARVi4ACAvG7kAIAAQPlm4AABFWLgAAC8buQAAAAo+WbgAAEVYuAAHLxu5AAcACj5ZuAATELgADdxBBQDZAA0A6QANAAJdQRsACAANABgADQAoAA0AOAANAEgADQBYAA0AaAANAHgADQCIAA0AmAANAKgADQC4AA0AyAANAA1dugAYABMADRESOboAHgATAA0REjm5AC0AAfQwMSEjETQnBgcRIxE0JwYjIiY1NDYzMhYVFAc2NzMyHQE2NzMyFSU0JiMiBhUUFjMyNgHSJB8WLCQfI1EvMSYaGiYONw4kPBsKJDz+wRENDRAQDQ0RAUcfAkIW/vABRx8CYikhGiYmGhYRE0w+DxozPgcNERENDRAQAAsATQAYAp0BVAAGAA8AFgAcAC4ARABQAFwAZQC5AMUEbLsAnAAFAIIABCu6AIgAjwADK7sAfQAGAKIABCu6AHEAqAADK0EbAAYAiAAWAIgAJgCIADYAiABGAIgAVgCIAGYAiAB2AIgAhgCIAJYAiACmAIgAtgCIAMYAiAANXUEFANUAiADlAIgAAl24AIgQuQCXAAb0uQDAAAf0uAAD0LgAAy+4AMAQuAAK0LgAwBC4AAzQuAAML7oAGACPAIgREjm6ABsAjwCIERI5uACPELgAHdC4AB0vuACPELgASdC4AEkvuACPELgAS9C4AEsvuACPELgATdC4AE0vugBRAI8AiBESOboAVACPAIgREjm6AFUAjwCIERI5ugBXAI8AiBESOboAYACPAIgREjlBBQDaAKgA6gCoAAJdQRsACQCoABkAqAApAKgAOQCoAEkAqABZAKgAaQCoAHkAqACJAKgAmQCoAKkAqAC5AKgAyQCoAA1dugB3AKgAcRESOUEhAAYAfQAWAH0AJgB9ADYAfQBGAH0AVgB9AGYAfQB2AH0AhgB9AJYAfQCmAH0AtgB9AMYAfQDWAH0A5gB9APYAfQAQXUEhAAYAfQAWAH0AJgB9ADYAfQBGAH0AVgB9AGYAfQB2AH0AhgB9AJYAfQCmAH0AtgB9AMYAfQDWAH0A5gB9APYAfQAQcUEHAAYAfQAWAH0AJgB9AANyQQUANQB9AEUAfQACcroAlQCPAIgREjlBIQAGAJwAFgCcACYAnAA2AJwARgCcAFYAnABmAJwAdgCcAIYAnACWAJwApgCcALYAnADGAJwA1gCcAOYAnAD2AJwAEF1BIQAGAJwAFgCcACYAnAA2AJwARgCcAFYAnABmAJwAdgCcAIYAnACWAJwApgCcALYAnADGAJwA1gCcAOYAnAD2AJwAEHFBBwAGAJwAFgCcACYAnAADckEFADUAnABFAJwAAnK4AKIQuACk0LgApC+4AHEQuQC0AAf0ugCmAIIAtBESOboAqgCCALQREjm6AKwAqABxERI5ugCwAKgAcRESOboAsgBxALQREjm4AIgQuQC6AAf0ALgAAEVYuACFLxu5AIUADj5ZuwCfAAEAfwAEK7sAwwACAIwABCu7AJIAAgC9AAQruACFELkAFwAB9LoACgCFABcREjm4AL0QuABj3LgADtC4AGMQuAAY0LgAGC+4ABcQuAAZ0LgAGS+6ABsAhQAXERI5uABjELgAHNC4ABwvuAAZELgAINC4ACAvuABjELgAJNC4ACQvuAAgELgALdC4AC0vuABD0LgAQy+4AGMQuABI0LgASC+6AEsAhQAXERI5ugBNAL0AYxESObgAYxC4AE7QuABOL7oAUQC9AGMREjm6AFQAhQAXERI5ugBVAIUAFxESOboAVwCFABcREjm6AGAAhQAXERI5ugBxAL0AkhESObgAjBC4AHPQuABzL7oAdwC9AJIREjm6AH0AvQCSERI5ugCVAL0AkhESObgAQxC4AJnQugCkAL0AYxESOboAqgC9AGMREjm6ALAAvQBjERI5MDETFCsBNTMyFzQrARUzNTMyNxQrATUzMgc1IzUjFScjFCMiNTQzMhczJiMiFRQzMjcmJzQzFhUzNCMiFRYXFCMiNSMUMzIjNSMVIzUjFTM1MxUzJzcjBzUjFTM1NxcnNCsBFTM1MzIFMwYjIicGByInJicUIyInJicGIyInJicUIyImNTQ2MzIWFRQHBiMiJjU0NjMyFzU2NTQjIgYVFBYzMjY1NCcWFzY1NCcWFzY1NCcWFzY1NCcWFxYlNCYjIgYVFBYzMjbCAwMDAwIFBQIDBRsDAwMDJwcCEAIEBAQDAQICBAYGBjYDBQMCAgQFAwUDAwIFBSkCBwICB0QFBQMFAgICAwoFBQIDBQG3BRQVIRkGFgkLDgcbBgsMCQYgBgsOB5U+SD44LTQRFSgWIB8XGhECPSksNys7PwM4EwkIKh8FBSsVCgMFJiL+fxELCxERCwsRAUMDBgMEDgYEAwYNAgwOBQQGBgQFBwcEAwMDAgEEBAMDAwQFDgYGDgcHCAYHBw4FAgcKBA4GjAsZMAchKgdcJCgLYicyCb9WSUtSNzArHSQhFhcgFAIKDkBGPTdCVk8fEAtfHRsTHQxLGQwJHAxIDRYMDwEbGQULERELCxERAAH/8v9mAA8BfwADABW7AAAABgABAAQrALgAAi+4AAAvMDEXIxEzDx0dmgIZAAAAAAH/zf9mADQBfwAOAC27AAAABgABAAQrALgABy+4AAkvuAAAL7oAAgAAAAcREjm6AA4AAAAHERI5MDEXIxEHJzcnNxc3FwcXBycPHRQRJSUSISISJSUSE5oBwBQRJScQJSUQJyURFAAAAf/y/2YAowF+AAoALLsAAAAGAAEABCsAuAAFL7gAAC+4AABFWLgAAi8buQACAA4+WbkACQAB9DAxFyMRMyc3FwcnNyMPHX4REDQ0EBFhmgH2EhA0NBESAAH/Xv9mAA8BfgAMACy7AAAABgABAAQrALgABy+4AAAvuAAARVi4AAsvG7kACwAOPlm5AAIAAfQwMRcjESMXByc3HgEXBzMPHWEREDQ0AgoEEX6aAdMSETQ0AwoDEgAAAAEAFQClAVIAxgADAA0AuwADAAEAAAAEKzAxJSE1IQFS/sMBPaUhAAABABYApQK3AMYAAwANALsAAwABAAAABCswMSUhNSECt/1fAqGlIQAAAQBJAU4AqAIDABEAsrgABi+5AAAAB/RBEQCAAAAAkAAAAKAAAACwAAAAwAAAANAAAADgAAAA8AAAAAhxQQsAAAAAABAAAAAgAAAAMAAAAEAAAAAFckEDADYACgABcUEDAHUACgABcUEDAFMACgABcUEDAEMACwABcUEDAHMACwABcUEDAFEACwABcQC4AAMvuAAKL0EDAJ8AAwABcUEDAHwACgABcUEDAEoACgABcTAxAUEFABUACwAlAAsAAnETFAYjIiY1NDc2NxcGBzYjMhaVFg8QFycWEw84BAYBDhYBdRAXFxA8LhoKESQ2ARYAAQBJAUIAqAH3ABEBCbsAAAAHAAwABCtBAwDcAAwAAXFBBQC9AAwAzQAMAAJxQQMATQAMAAFyQQMArgAMAAFxQQMAPgAMAAFyQQUA7gAMAP4ADAACcUEDAI0ADAABcUEDAA0ADAABckEFABwADAAsAAwAAnJBAwCcAAwAAXFBIQAJAAwAGQAMACkADAA5AAwASQAMAFkADABpAAwAeQAMAIkADACZAAwAqQAMALkADADJAAwA2QAMAOkADAD5AAwAEF1BEQAJAAwAGQAMACkADAA5AAwASQAMAFkADABpAAwAeQAMAAhxALgADy+4AAQvQQMARwAMAAFyQQMAvwAPAAFxQQMAowAPAAFxQQMAQQAPAAFyMDETFAcGByc2NwYzIiY1NDYzMhaoJhcTDzgEBgEOFhYPERYB0DwuGgoRJDYBFg4QFxYAAAEASf+RAKgARgARASa7AAAABwAMAAQrQQUAOgAMAEoADAACckEZAAkADAAZAAwAKQAMADkADABJAAwAWQAMAGkADAB5AAwAiQAMAJkADACpAAwAuQAMAAxdQQcA2QAMAOkADAD5AAwAA11BIQAJAAwAGQAMACkADAA5AAwASQAMAFkADABpAAwAeQAMAIkADACZAAwAqQAMALkADADJAAwA2QAMAOkADAD5AAwAEHFBBwAJAAwAGQAMACkADAADcgC4AAQvuAAARVi4AAcvG7kABwAKPlm4AABFWLgACS8buQAJAAo+WbgAD9xBGwAHAA8AFwAPACcADwA3AA8ARwAPAFcADwBnAA8AdwAPAIcADwCXAA8ApwAPALcADwDHAA8ADV1BBQDWAA8A5gAPAAJdMDE3FAcGByc2NwYjIiY1NDYzMhaoJhcTDzgEBAMRERYPERYfPC4aChEkNgEWDhAXFgAAAgBOAU4BIQIDABEAIwGfuAAYL7gAEi+4AAYvuAAAL0EDAJ8ABgABXUEDAI8ABgABcUEFAC8ABgA/AAYAAl1BAwBIAAYAAV24AAYQuQAAAAf0QQMAKAAAAAFxQQMAuAAAAAFdQQMACAAAAAFxQQUAeAAAAIgAAAACXUEDAIIAAAABcUEPAJAAAACgAAAAsAAAAMAAAADQAAAA4AAAAPAAAAAHcUELAAAAAAAQAAAAIAAAADAAAABAAAAABXJBAwBoAAcAAV1BAwCXAAsAAV1BAwCbAA0AAV24ABgQuQASAAf0QREAgAASAJAAEgCgABIAsAASAMAAEgDQABIA4AASAPAAEgAIcUELAAAAEgAQABIAIAASADAAEgBAABIABXIAuAADL7gAFS+4ABwvuAAKL0EDAJ8AAwABcUEDAEcAEgABckEDAJ8AFQABcTAxAUEDAAYACwABcUEJACYACwA2AAsARgALAFYACwAEcUEDAHYACwABcUEDALcACwABXUEDABcACwABcUEHADYAHQBGAB0AVgAdAANxQQMAdgAdAAFxQQUAFwAdACcAHQACcQEUBiMiJjU0NzY3FwYHNiMyFgcUBiMiJjU0NzY3FwYHNiMyFgEOFg8QFycWEw84BAYBDhZ0Fg8QFycWEw84BAYBDhYBdRAXFxA8LhoKESQ2ARYOEBcXEDwuGgoRJDYBFgAAAgBOAUIBIQH3ABEAIwJcuAAML7gAHi9BCQDPAAwA3wAMAO8ADAD/AAwABHFBCwAPAAwAHwAMAC8ADAA/AAwATwAMAAVyQQMArwAMAAFxQQUAjgAMAJ4ADAACcUEDAL0ADAABcbgADBC5AAAAB/RBAwCxAAAAAXFBAwCCAAAAAXFBAwCiAAAAAXFBCQDAAAAA0AAAAOAAAADwAAAABHFBCwAAAAAAEAAAACAAAAAwAAAAQAAAAAVyQQMAkAAAAAFxQQMALQAEAAFxQQMAJAAHAAFxQQMAfgAeAAFdQQMArwAeAAFxQQkAzwAeAN8AHgDvAB4A/wAeAARxQQsADwAeAB8AHgAvAB4APwAeAE8AHgAFckEDAC8AHgABXUEDAJ4AHgABcUEDAIwAHgABcUEDALgAHgABcbgAHhC5ABIAB/RBAwB5ABIAAV1BAwCCABIAAXFBDwCQABIAoAASALAAEgDAABIA0AASAOAAEgDwABIAB3FBCwAAABIAEAASACAAEgAwABIAQAASAAVyQQMAeQATAAFdQQMACgAWAAFxQQMALQAWAAFxQQMAfwAWAAFdQQMAHgAWAAFxQQ8AnAAWAKwAFgC8ABYAzAAWANwAFgDsABYA/AAWAAddQQMASgAWAAFdQQMAaAAWAAFdQQMAHQAXAAFxQQMABwAXAAFxQQMAFQAZAAFxQQMAewAZAAFdQQMAJAAZAAFxQQMAAwAZAAFxALgADy+4ACEvuAAEL7gAFi9BAwCMAAQAAV1BAwC/AA8AAXFBAwChAA8AAXFBAwCMABYAAV1BAwC/ACEAAXFBAwCgACEAAXEwMRMUBwYHJzY3BjMiJjU0NjMyFhcUBwYHJzY3BjMiJjU0NjMyFq0mFxMPOAQGAQ4WFg8RFnQmFxMPOAQGAQ4WFg8RFgHQPC4aChEkNgEWDhAXFhE8LhoKESQ2ARYOEBcWAAACAE7/kQEhAEYAEQAjAi24ACQvuAAlL7gAJBC4AAzQuAAML7kAAAAH9EEhAAYAAAAWAAAAJgAAADYAAABGAAAAVgAAAGYAAAB2AAAAhgAAAJYAAACmAAAAtgAAAMYAAADWAAAA5gAAAPYAAAAQXUEhAAYAAAAWAAAAJgAAADYAAABGAAAAVgAAAGYAAAB2AAAAhgAAAJYAAACmAAAAtgAAAMYAAADWAAAA5gAAAPYAAAAQcUEHAAYAAAAWAAAAJgAAAANyQQUANQAAAEUAAAACcrgADBC4AATQuAAEL7gAJRC4ABLcuQAeAAf0QQUAOgAeAEoAHgACckEhAAkAHgAZAB4AKQAeADkAHgBJAB4AWQAeAGkAHgB5AB4AiQAeAJkAHgCpAB4AuQAeAMkAHgDZAB4A6QAeAPkAHgAQXUEhAAkAHgAZAB4AKQAeADkAHgBJAB4AWQAeAGkAHgB5AB4AiQAeAJkAHgCpAB4AuQAeAMkAHgDZAB4A6QAeAPkAHgAQcUEHAAkAHgAZAB4AKQAeAANyuAAW0LgAFi8AuAAEL7gAFi+4AABFWLgABy8buQAHAAo+WbgAAEVYuAAJLxu5AAkACj5ZuAAARVi4ABkvG7kAGQAKPlm4AABFWLgAGy8buQAbAAo+WbgACRC4AA/cQRsABwAPABcADwAnAA8ANwAPAEcADwBXAA8AZwAPAHcADwCHAA8AlwAPAKcADwC3AA8AxwAPAA1dQQUA1gAPAOYADwACXbgAIdAwMTcUBwYHJzY3BiMiJjU0NjMyFhcUBwYHJzY3BiMiJjU0NjMyFq0mFxMPOAQEAxERFg8RFnQmFxMPOAQEAxERFg8RFh88LhoKESQ2ARYOEBcWETwuGgoRJDYBFg4QFxYAAAEAJ//eAU8B2gALAEO7AAMABQAEAAQruAAEELgACNC4AAMQuAAK0AC4AAkvuAADL7sAAAABAAEABCu4AAEQuAAF0LgABS+4AAAQuAAH0DAxARUnESMRBzUXNTMVAU+CJIKCJAFCIQT+uQFHBCEEnJwAAAAAAQAn/94BTwHaABMBDbgAFC+4AArQuAAKL7gACNxBCwCwAAgAwAAIANAACADgAAgA8AAIAAVdQQ8AMAAIAEAACABQAAgAYAAIAHAACACAAAgAkAAIAAdduAAJ3EELALAACQDAAAkA0AAJAOAACQDwAAkABV1BDwAwAAkAQAAJAFAACQBgAAkAcAAJAIAACQCQAAkAB124AAXcuAAKELgABty4AAgQuQAHAAX0uAAIELgADNC4AAoQuAAO0LgACBC4ABDQuAAGELgAEtC4AAUQuAAV3AC4AAcvuAARL7sABAABAAUABCu7AAAAAQABAAQruAAFELgACdC4AAkvuAAEELgAC9C4AAEQuAAN0LgADS+4AAAQuAAP0DAxARUnFTcVJxUjNQc1FzUHNRc1MxUBT4KCgiSCgoKCJAFCIQSYBCEElpYEIQSYBCEEnJwAAAAAAQAYAHQAwAEcAAsAXboAAAAGAAMrQQMAaAAAAAFdQQ0ABgAAABYAAAAmAAAANgAAAEYAAABWAAAABl1BAwDGAAAAAV1BAwBvAA0AAV1BAwC/AA0AAV1BAwB+AA0AAV0AugAJAAMAAyswMTcUBiMiJjU0NjMyFsAxIyMxMCQjMcgjMTEjIzEyAAMALv/6AbIAPwALABcAIwKquwAAAAcABgAEK7sADAAHABIABCu7ABgABwAeAAQrQSEABgAAABYAAAAmAAAANgAAAEYAAABWAAAAZgAAAHYAAACGAAAAlgAAAKYAAAC2AAAAxgAAANYAAADmAAAA9gAAABBdQSEABgAAABYAAAAmAAAANgAAAEYAAABWAAAAZgAAAHYAAACGAAAAlgAAAKYAAAC2AAAAxgAAANYAAADmAAAA9gAAABBxQQcABgAAABYAAAAmAAAAA3JBBQA1AAAARQAAAAJyQQUAOgASAEoAEgACckEhAAkAEgAZABIAKQASADkAEgBJABIAWQASAGkAEgB5ABIAiQASAJkAEgCpABIAuQASAMkAEgDZABIA6QASAPkAEgAQXUEhAAkAEgAZABIAKQASADkAEgBJABIAWQASAGkAEgB5ABIAiQASAJkAEgCpABIAuQASAMkAEgDZABIA6QASAPkAEgAQcUEHAAkAEgAZABIAKQASAANyQQUAOgAeAEoAHgACckEhAAkAHgAZAB4AKQAeADkAHgBJAB4AWQAeAGkAHgB5AB4AiQAeAJkAHgCpAB4AuQAeAMkAHgDZAB4A6QAeAPkAHgAQXUEhAAkAHgAZAB4AKQAeADkAHgBJAB4AWQAeAGkAHgB5AB4AiQAeAJkAHgCpAB4AuQAeAMkAHgDZAB4A6QAeAPkAHgAQcUEHAAkAHgAZAB4AKQAeAANyuAAYELgAJdwAuAAARVi4AAMvG7kAAwAKPlm4AABFWLgADy8buQAPAAo+WbgAAEVYuAAbLxu5ABsACj5ZuAADELgACdxBGwAHAAkAFwAJACcACQA3AAkARwAJAFcACQBnAAkAdwAJAIcACQCXAAkApwAJALcACQDHAAkADV1BBQDWAAkA5gAJAAJduAAV0LgAIdAwMTcUBiMiJjU0NjMyFhcUBiMiJjU0NjMyFhcUBiMiJjU0NjMyFnMVDg4UFA4OFaAVDg4UFA4OFZ8VDg4UFA4OFRwOFBQODhUVDg4UFA4OFRUODhQUDg4VFQAABwAi//cDGgHcAAMACwATABsAIwArADMFbrsAGAAFABAABCu7AAwABQAUAAQruwAwAAUAKAAEK7sAJAAFACwABCu7ACAABQAIAAQruwAEAAUAHAAEK7oAAQAQAAQREjm6AAMAEAAEERI5QQUAOgAIAEoACAACckEhAAkACAAZAAgAKQAIADkACABJAAgAWQAIAGkACAB5AAgAiQAIAJkACACpAAgAuQAIAMkACADZAAgA6QAIAPkACAAQXUEhAAkACAAZAAgAKQAIADkACABJAAgAWQAIAGkACAB5AAgAiQAIAJkACACpAAgAuQAIAMkACADZAAgA6QAIAPkACAAQcUEHAAkACAAZAAgAKQAIAANyQSEABgAMABYADAAmAAwANgAMAEYADABWAAwAZgAMAHYADACGAAwAlgAMAKYADAC2AAwAxgAMANYADADmAAwA9gAMABBdQSEABgAMABYADAAmAAwANgAMAEYADABWAAwAZgAMAHYADACGAAwAlgAMAKYADAC2AAwAxgAMANYADADmAAwA9gAMABBxQQcABgAMABYADAAmAAwAA3JBBQA1AAwARQAMAAJyQSEABgAYABYAGAAmABgANgAYAEYAGABWABgAZgAYAHYAGACGABgAlgAYAKYAGAC2ABgAxgAYANYAGADmABgA9gAYABBdQSEABgAYABYAGAAmABgANgAYAEYAGABWABgAZgAYAHYAGACGABgAlgAYAKYAGAC2ABgAxgAYANYAGADmABgA9gAYABBxQQcABgAYABYAGAAmABgAA3JBBQA1ABgARQAYAAJyQQUAOgAcAEoAHAACckEhAAkAHAAZABwAKQAcADkAHABJABwAWQAcAGkAHAB5ABwAiQAcAJkAHACpABwAuQAcAMkAHADZABwA6QAcAPkAHAAQXUEhAAkAHAAZABwAKQAcADkAHABJABwAWQAcAGkAHAB5ABwAiQAcAJkAHACpABwAuQAcAMkAHADZABwA6QAcAPkAHAAQcUEHAAkAHAAZABwAKQAcAANyQQUAOgAsAEoALAACckEhAAkALAAZACwAKQAsADkALABJACwAWQAsAGkALAB5ACwAiQAsAJkALACpACwAuQAsAMkALADZACwA6QAsAPkALAAQXUEhAAkALAAZACwAKQAsADkALABJACwAWQAsAGkALAB5ACwAiQAsAJkALACpACwAuQAsAMkALADZACwA6QAsAPkALAAQcUEHAAkALAAZACwAKQAsAANyQSEABgAwABYAMAAmADAANgAwAEYAMABWADAAZgAwAHYAMACGADAAlgAwAKYAMAC2ADAAxgAwANYAMADmADAA9gAwABBdQSEABgAwABYAMAAmADAANgAwAEYAMABWADAAZgAwAHYAMACGADAAlgAwAKYAMAC2ADAAxgAwANYAMADmADAA9gAwABBxQQcABgAwABYAMAAmADAAA3JBBQA1ADAARQAwAAJyuAAEELgANdwAuAAARVi4AAIvG7kAAgAKPlm4AABFWLgABi8buQAGAAo+WbgAAEVYuAAmLxu5ACYACj5ZuwASAAEAFgAEK7sAGgABAA4ABCu7AAoAAQAeAAQruAASELgAANC4AAYQuQAiAAH0QSEABwAiABcAIgAnACIANwAiAEcAIgBXACIAZwAiAHcAIgCHACIAlwAiAKcAIgC3ACIAxwAiANcAIgDnACIA9wAiABBdQSEABwAiABcAIgAnACIANwAiAEcAIgBXACIAZwAiAHcAIgCHACIAlwAiAKcAIgC3ACIAxwAiANcAIgDnACIA9wAiABBxQQcABwAiABcAIgAnACIAA3JBBQA2ACIARgAiAAJyuAAKELgAKtC4AB4QuAAu0LgAIhC4ADLQMDEBMwEjJRQjIjU0MzIlFCMiNTQzMgc0IyIVFDMyBTQjIhUUMzInFCMiNTQzMgc0IyIVFDMyAZ4i/t4iAp5ra2tr/d5ra2trJEdHR0cCIkdHR0fUa2trayRHR0dHAdz+G5SOjo41jo6Ojm5ublVubm5ujo6Ojm5ubgAAAQAPAXMAbAHcAAMACwC4AAIvuAAALzAxEyM3MyobJjcBc2kAAgAPAXMAxQHcAAMABwAbALoAAgAAAAMruAAAELgABNC4AAIQuAAG0DAxEyM3MxcjNzMqGyY3FxsmNwFzaWlpAAEACwAwAKQBNQAFA65BAwAGAAEAAV1BAwAqAAMAAV1BAwAcAAMAAV1BBQA4AAMASAADAAJdQQMAaAADAAFdugAEAAIAABESOQC4AAMvuAAFL0EDACUAAQABXUEDACQABAABXUEDAGMABQABXUEDACAABQABXUEDAIAABQABXTAxAUEDAMEAAAABXUEDAKYAAAABcUEDAEcAAAABcUEDAIgAAAABXUEDAGkAAAABXUEDABkAAAABcUEDABkAAAABckEDAAoAAAABcUEDAGoAAAABcUEDAMsAAAABcUEDAEwAAAABckEDAA4AAAABckEDAD4AAAABckEDAKIAAQABcUEDAJQAAQABcUEDAMUAAQABXUEFAEUAAQBVAAEAAnFBAwC1AAEAAXFBAwCIAAEAAXFBAwBJAAEAAXJBAwB6AAEAAXFBAwA6AAEAAXJBAwDDAAIAAV1BAwCIAAIAAV1BAwAoAAIAAXJBAwB5AAIAAV1BAwDJAAIAAXFBAwAZAAIAAXJBAwBqAAIAAXFBAwBrAAIAAV1BAwAbAAIAAXFBAwAMAAIAAXJBAwANAAIAAXFBAwBOAAIAAXJBAwA/AAIAAXJBAwCyAAMAAXFBAwDyAAMAAXFBAwDjAAMAAXFBAwAjAAMAAXJBAwDEAAMAAV1BAwCkAAMAAXFBAwDUAAMAAXFBAwBVAAMAAXFBAwAVAAMAAXJBAwBGAAMAAXFBAwCWAAMAAXFBAwC3AAMAAV1BAwAIAAMAAXJBAwBIAAMAAXJBAwCJAAMAAV1BAwAZAAMAAXFBAwB6AAMAAV1BAwA6AAMAAXJBAwALAAMAAXFBAwBsAAMAAV1BAwCwAAQAAXFBAwDxAAQAAXFBBwARAAQAIQAEADEABAADckEDAFIABAABcUEFAJIABACiAAQAAnFBAwDiAAQAAXFBAwBCAAQAAXJBAwDTAAQAAXFBAwADAAQAAXJBBQA0AAQARAAEAAJxQQMAxgAEAAFdQQMAZgAEAAFxQQMAwQAFAAFdQQMAsgAFAAFxQQMA8gAFAAFxQQMAowAFAAFxQQMA4wAFAAFxQQMAJAAFAAFyQQMAVQAFAAFxQQMAlQAFAAFxQQMA1QAFAAFxQQMAFQAFAAFyQQMA9gAFAAFdQQMARgAFAAFxQQMAhgAFAAFxQQMAtwAFAAFdQQMAiQAFAAFdQQUACQAFABkABQACcUEDAGsABQABXQBBAwB0AAAAAV1BAwB1AAEAAV1BAwD4AAEAAXFBAwB1AAQAAV1BAwB0AAUAAV03JzczBxd6b24qbm8wgYSEgQAAAAABABMAMACsATUABQH5QQMAmgABAAFxugACAAQAABESOUEDADkAAgABcUEHAAQAAwAUAAMAJAADAANdALgAAy+4AAAvQQMAIgAAAAFdQQMAYwAAAAFdQQUAcAAAAIAAAAACXUEDAJAAAAABcTAxAUEDAJAAAAABcUEDADYAAAABcUEHALoAAQDKAAEA2gABAANxQQMAqwABAAFxQQUA6wABAPsAAQACcUEDAAsAAQABckEJAB0AAQAtAAEAPQABAE0AAQAEckEDAGoAAgABcUEFALoAAgDKAAIAAnFBAwCrAAIAAXFBBwDbAAIA6wACAPsAAgADcUEDAC0AAgABckEDAJ4AAgABcUEDAD4AAgABckEFAA8AAgAfAAIAAnJBAwBPAAIAAXJBBwC6AAMAygADANoAAwADcUEDAKsAAwABcUEFAOsAAwD7AAMAAnFBAwALAAMAAXJBAwA7AAMAAXJBAwBMAAMAAXJBBQAdAAMALQADAAJyQQMAlAAEAAFxQQMANgAEAAFxQQMA9gAFAAFdQQMAmwAFAAFxQQMADAAFAAFyAEEDAJwAAAABcUEDAJ8AAQABcUEDADYAAgABckEDAJoAAgABcUEDADAAAwABckEDAEEAAwABckEDADAABAABckEDAEEABAABckEDAEMABQABckEDADUABQABckEDAJwABQABcTcjNyczFz0qb24qbjCBhIQAAAH/3AAAAMYB3AADABgAuAACL7gAAEVYuAAALxu5AAAACj5ZMDExIxMzJMYkAdwAAAEAAP/5AXsB4wApApG7ACAABwALAAQruAALELgACdC4AAkvuAALELgADdC4AA0vQSEABgAgABYAIAAmACAANgAgAEYAIABWACAAZgAgAHYAIACGACAAlgAgAKYAIAC2ACAAxgAgANYAIADmACAA9gAgABBdQSEABgAgABYAIAAmACAANgAgAEYAIABWACAAZgAgAHYAIACGACAAlgAgAKYAIAC2ACAAxgAgANYAIADmACAA9gAgABBxQQcABgAgABYAIAAmACAAA3JBBQA1ACAARQAgAAJyALgAAEVYuAATLxu5ABMAEj5ZuAAARVi4AAMvG7kAAwAKPlm7AAkAAQAGAAQruwAQAAEADQAEK7gAExC5ABgAAfRBBQA5ABgASQAYAAJyQSEACAAYABgAGAAoABgAOAAYAEgAGABYABgAaAAYAHgAGACIABgAmAAYAKgAGAC4ABgAyAAYANgAGADoABgA+AAYABBdQSEACAAYABgAGAAoABgAOAAYAEgAGABYABgAaAAYAHgAGACIABgAmAAYAKgAGAC4ABgAyAAYANgAGADoABgA+AAYABBxQQcACAAYABgAGAAoABgAA3K4ABAQuAAb0LgADRC4AB3QuAAJELgAItC4AAYQuAAk0LoAJQADABMREjm4AAMQuQAoAAH0QSEABwAoABcAKAAnACgANwAoAEcAKABXACgAZwAoAHcAKACHACgAlwAoAKcAKAC3ACgAxwAoANcAKADnACgA9wAoABBdQSEABwAoABcAKAAnACgANwAoAEcAKABXACgAZwAoAHcAKACHACgAlwAoAKcAKAC3ACgAxwAoANcAKADnACgA9wAoABBxQQcABwAoABcAKAAnACgAA3JBBQA2ACgARgAoAAJyMDElFwYjIiYnIzUzJjU0NyM1Mz4BMzIXByYjIgYHMxUhBhUUFyEVIx4BMzIBbww1TUtyFyUcBQMaIRV1Tk01DDY+PGEU+/79AwYBAPcWXzg+MiAZVUggHhsXFSBMXBkgF0g+IBUYHhogOUIAAgAW//0AtAHAABcAIAHMuAAhL7gAIi+4AA/cuAAA0LgAAC+4ACEQuAAF0LgABS+4AAnQuAAFELkAEwAG9LgADxC5ABgABvRBBQA6ABgASgAYAAJyQSEACQAYABkAGAApABgAOQAYAEkAGABZABgAaQAYAHkAGACJABgAmQAYAKkAGAC5ABgAyQAYANkAGADpABgA+QAYABBdQSEACQAYABkAGAApABgAOQAYAEkAGABZABgAaQAYAHkAGACJABgAmQAYAKkAGAC5ABgAyQAYANkAGADpABgA+QAYABBxQQcACQAYABkAGAApABgAA3K6ABcADwAYERI5uAATELgAHdC6AB4ABQAPERI5ALgAAEVYuAADLxu5AAMACj5ZuwAMAAEAGwAEK7gAAxC5ABUAAfRBIQAHABUAFwAVACcAFQA3ABUARwAVAFcAFQBnABUAdwAVAIcAFQCXABUApwAVALcAFQDHABUA1wAVAOcAFQD3ABUAEF1BIQAHABUAFwAVACcAFQA3ABUARwAVAFcAFQBnABUAdwAVAIcAFQCXABUApwAVALcAFQDHABUA1wAVAOcAFQD3ABUAEHFBBwAHABUAFwAVACcAFQADckEFADYAFQBGABUAAnIwMTcOASMiPQEHJzc1NDMyFhUUBgcVFDMyNwM0JiMiHQE+AbMUIworHxIxNBwdJyQUEiQfCQ4UFxQWCw5GghUcIn5UKSM3TReXIBkBMhYeNWoVNQAAAAACAA4A8gHoAewABwAUAD+7AAIABgADAAQrALgAAi+4AAgvuAALL7gADi+7AAcAAgAAAAQruAAAELgABNC4AAcQuAAQ0LgABxC4ABPQMDETIxUjNSM1MwUjJwcjJwcjNzMXNzPaVx5XzAEOHwxOFk4MHxEhUlIhAdDe3hz6xsbGxvrT0wABACMAAAGhAb8AHwHBuwAKAAcAFAAEK7sADQAFABAABCu7AB4ABQABAAQruwAaAAcABAAEK0EFADoABABKAAQAAnJBIQAJAAQAGQAEACkABAA5AAQASQAEAFkABABpAAQAeQAEAIkABACZAAQAqQAEALkABADJAAQA2QAEAOkABAD5AAQAEF1BIQAJAAQAGQAEACkABAA5AAQASQAEAFkABABpAAQAeQAEAIkABACZAAQAqQAEALkABADJAAQA2QAEAOkABAD5AAQAEHFBBwAJAAQAGQAEACkABAADckEhAAYACgAWAAoAJgAKADYACgBGAAoAVgAKAGYACgB2AAoAhgAKAJYACgCmAAoAtgAKAMYACgDWAAoA5gAKAPYACgAQXUEhAAYACgAWAAoAJgAKADYACgBGAAoAVgAKAGYACgB2AAoAhgAKAJYACgCmAAoAtgAKAMYACgDWAAoA5gAKAPYACgAQcUEHAAYACgAWAAoAJgAKAANyQQUANQAKAEUACgACcrgAGhC4ACHcALgAAEVYuAAALxu5AAAACj5ZuAAARVi4AA0vG7kADQAKPlm7ABcAAQAHAAQruAANELkADwAB9LgAHtC4AB/QMDEhIzU2NTQmIyIGFRQXFSM1MzUuATU0NjMyFhUUBgcVMwGhmGVPPT1PZZh0KEBiUVFiQCh0czBnQVJSQWcwcyE7EF88WGBgWDxfEDsAAAACAB//+QEaAYAABgAZAPC7ABMABwAMAAQruAATELgABtC4AAYvALgAAEVYuAAJLxu5AAkACj5ZuwAPAAEAAwAEK7sAAAACABIABCu4AAkQuQAWAAH0QSEABwAWABcAFgAnABYANwAWAEcAFgBXABYAZwAWAHcAFgCHABYAlwAWAKcAFgC3ABYAxwAWANcAFgDnABYA9wAWABBdQSEABwAWABcAFgAnABYANwAWAEcAFgBXABYAZwAWAHcAFgCHABYAlwAWAKcAFgC3ABYAxwAWANcAFgDnABYA9wAWABBxQQcABwAWABcAFgAnABYAA3JBBQA2ABYARgAWAAJyMDE3LgEjIgYHFwYjIiY1NDYzMhYXIx4BMzI2N/YFLCYoKgXMGF0/QUo2PD0C0wIsKh4rB98/QUE/eG5naFtdY1tYUCglAAACABz/+wEgAcUAFgAiAl64ACMvuAAkL7gAANy4ACMQuAAI0LgACC+4AAAQuQAOAAf0QQUAOgAOAEoADgACckEhAAkADgAZAA4AKQAOADkADgBJAA4AWQAOAGkADgB5AA4AiQAOAJkADgCpAA4AuQAOAMkADgDZAA4A6QAOAPkADgAQXUEhAAkADgAZAA4AKQAOADkADgBJAA4AWQAOAGkADgB5AA4AiQAOAJkADgCpAA4AuQAOAMkADgDZAA4A6QAOAPkADgAQcUEHAAkADgAZAA4AKQAOAANyuAAX0LgAFy+4AAgQuQAdAAf0QSEABgAdABYAHQAmAB0ANgAdAEYAHQBWAB0AZgAdAHYAHQCGAB0AlgAdAKYAHQC2AB0AxgAdANYAHQDmAB0A9gAdABBdQSEABgAdABYAHQAmAB0ANgAdAEYAHQBWAB0AZgAdAHYAHQCGAB0AlgAdAKYAHQC2AB0AxgAdANYAHQDmAB0A9gAdABBxQQcABgAdABYAHQAmAB0AA3JBBQA1AB0ARQAdAAJyALgAAEVYuAAELxu5AAQACj5ZuwAVAAEAEAAEK7sADAABABkABCu4AAQQuQAfAAH0QSEABwAfABcAHwAnAB8ANwAfAEcAHwBXAB8AZwAfAHcAHwCHAB8AlwAfAKcAHwC3AB8AxwAfANcAHwDnAB8A9wAfABBdQSEABwAfABcAHwAnAB8ANwAfAEcAHwBXAB8AZwAfAHcAHwCHAB8AlwAfAKcAHwC3AB8AxwAfANcAHwDnAB8A9wAfABBxQQcABwAfABcAHwAnAB8AA3JBBQA2AB8ARgAfAAJyMDEBFAcGIyInJjU0NzYzMhcmIyIHJzYzMgcmIyIHBhUUMzI3NgEgIS5gJBcaQDdQDQcCNSwXISQ/YSoHDEorJzU3JBwBGmlNaRodM1czLAGFRRNYzgEvKjpBU0AAAgAAAAAB2gHYAAIABQAeALgABS+4AABFWLgAAy8buQADAAo+WbkAAAAB9DAxJQsBBSETAZqtrQGa/ibtIwFb/qUjAdgAAAAAAQA2/8kBiAHcAAcAObgACC+4AAkvuAAA3LkAAQAH9LgACBC4AAXQuAAFL7kABAAH9AC4AAAvuAAEL7sABwABAAIABCswMQUjESERIxEhAYgn/vwnAVI3AfL+DgITAAAAAQAZ/8kBjQHcAAwAFwC7AAwAAQAAAAQruwAGAAEABwAEKzAxBSE1Nyc1IRUhFxUHIQGN/ozHxwFl/sTExAFLNy3k1ysh1RriAAAAAAEANwClAWQAxgADAA0AuwADAAEAAAAEKzAxJSE1IQFk/tMBLaUhAAABABf/9gFeAdgACAAiALgABy+4AABFWLgAAC8buQAAAAo+WbsABQACAAIABCswMRcjJyM1MxcTM7UfTDNOQpQjCvAc2wGxAAADADUAawI1AUUACgAeACkBwbgAKi+4ACsvuAAqELgAFdC4ABUvuQAFAAb0QSEABgAFABYABQAmAAUANgAFAEYABQBWAAUAZgAFAHYABQCGAAUAlgAFAKYABQC2AAUAxgAFANYABQDmAAUA9gAFABBdQSEABgAFABYABQAmAAUANgAFAEYABQBWAAUAZgAFAHYABQCGAAUAlgAFAKYABQC2AAUAxgAFANYABQDmAAUA9gAFABBxQQcABgAFABYABQAmAAUAA3JBBQA1AAUARQAFAAJyuAArELgAC9y6ABAAFQALERI5uQAfAAb0QQUAOgAfAEoAHwACckEhAAkAHwAZAB8AKQAfADkAHwBJAB8AWQAfAGkAHwB5AB8AiQAfAJkAHwCpAB8AuQAfAMkAHwDZAB8A6QAfAPkAHwAQXUEhAAkAHwAZAB8AKQAfADkAHwBJAB8AWQAfAGkAHwB5AB8AiQAfAJkAHwCpAB8AuQAfAMkAHwDZAB8A6QAfAPkAHwAQcUEHAAkAHwAZAB8AKQAfAANyALsAJwACAA4ABCu7ABwAAgAiAAQruAAiELgAAtC4AAIvuAAnELgACNC4AAgvuAAOELgAEtC4ABwQuAAY0DAxJSYjIgYVFBYzMjYlFAYjIicGIyImNTQ2MzIXNjMyFgc0JiMiBgcWMzI2AR9FMioqLCkiQgEoOTlHSzxNND85OUFQPkw0Px8sKSJCEkUyKirdTC4fJS81FSs8W1s+NSs8Wlo+MyUvNSBMLgAAAAAB/9n/mQD1AeIAFADhALgAAEVYuAAMLxu5AAwAEj5ZuAAARVi4AA4vG7kADgASPlm7AAcAAQACAAQruAAMELkAEQAB9EEFADkAEQBJABEAAnJBIQAIABEAGAARACgAEQA4ABEASAARAFgAEQBoABEAeAARAIgAEQCYABEAqAARALgAEQDIABEA2AARAOgAEQD4ABEAEF1BIQAIABEAGAARACgAEQA4ABEASAARAFgAEQBoABEAeAARAIgAEQCYABEAqAARALgAEQDIABEA2AARAOgAEQD4ABEAEHFBBwAIABEAGAARACgAEQADcjAxFwYjIic3Fjc2NxM2MzIXByYjIgYHWA9HGBEFDBcqCkANUBUOBwULHiMFC1wFIAUBAzMBmVkDHwEZIQAAAAACAC0ASwFuATIAFAApAKO4ACovuAArL7gAANy5ABQABvS4AAPQuAADL7gAKhC4AAvQuAALL7kACgAG9LgAABC4ABXQuAAUELgAGNC4ABgvuAAKELgAH9C4AAsQuAAg0LgAFBC4ACnQALsAJwABABoABCu7AA8AAQAIAAQruwAkAAEAHQAEK7sAEgABAAUABCu4AA8QuAAA0LgABRC4AArQuAAkELgAFdC4ABoQuAAf0DAxARUUBwYjIiYjIgcjNTQ2MzIWMzI3FxUUBwYjIiYjIgcjNTQ2MzIWMzI3AW4ZFSAnWSMvAh8vISZbJCsCHxkVICdZIy8CHy8hJlskKwIBMgYuGRVBQQgqMD8/hQYuGRVBQQgqMD8/AAAAAAEAN//3AWQBYgATAEwAuAANL7gAAEVYuAADLxu5AAMACj5ZuwAAAAEAAQAEK7sADAABAAkABCu4AAEQuAAF0LgAABC4AAfQuAAMELgAD9C4AAkQuAAR0DAxJRUjByM3IzUzNyM1MzczBzMVIwcBZK82JjZYaC+XpyspLF5uMIchb28hYSFZWSFhAAAAAgA5ABABYQFVAAMACgAeALgAAEVYuAAHLxu5AAcADj5ZuwADAAIAAAAEKzAxJSE1IS8BNTcVBxcBYf7YASgY+/vY2BAeCncvdyZpaQAAAAACADkAEAFhAVUAAwAKAB4AuAAARVi4AAkvG7kACQAOPlm7AAMAAgAAAAQrMDElITUhJwc1Nyc1FwFh/tgBKBj72Nj7EB6BdyVpaSZ3AAAAAAIAIQAAAWEBjgAFAAkAOQC4AABFWLgABC8buQAEABA+WbgAAEVYuAABLxu5AAEACj5ZugAHAAEABBESOboACQABAAQREjkwMSUHIyc3MxcnBxcBYYsqi4sqan9/f8bGxsjItra2AAAAEAARABYBfgGDAAsAFwAjAC8AOwBHAFMAXwBrAHcAgwCPAJsApwCzAL8F67sAnAAFAKIABCu7ALQABQC6AAQruwAAAAcABgAEK7sASAAFAE4ABCu7ADwABQBCAAQrQSEABgAAABYAAAAmAAAANgAAAEYAAABWAAAAZgAAAHYAAACGAAAAlgAAAKYAAAC2AAAAxgAAANYAAADmAAAA9gAAABBdQSEABgAAABYAAAAmAAAANgAAAEYAAABWAAAAZgAAAHYAAACGAAAAlgAAAKYAAAC2AAAAxgAAANYAAADmAAAA9gAAABBxQQcABgAAABYAAAAmAAAAA3JBBQA1AAAARQAAAAJyuAAAELgADNC4AAYQuAAS0LgAQhC4ADDQuAAwL7gAQhC5ADYABfRBIQAGADwAFgA8ACYAPAA2ADwARgA8AFYAPABmADwAdgA8AIYAPACWADwApgA8ALYAPADGADwA1gA8AOYAPAD2ADwAEF1BIQAGADwAFgA8ACYAPAA2ADwARgA8AFYAPABmADwAdgA8AIYAPACWADwApgA8ALYAPADGADwA1gA8AOYAPAD2ADwAEHFBBwAGADwAFgA8ACYAPAADckEFADUAPABFADwAAnJBIQAGAEgAFgBIACYASAA2AEgARgBIAFYASABmAEgAdgBIAIYASACWAEgApgBIALYASADGAEgA1gBIAOYASAD2AEgAEF1BIQAGAEgAFgBIACYASAA2AEgARgBIAFYASABmAEgAdgBIAIYASACWAEgApgBIALYASADGAEgA1gBIAOYASAD2AEgAEHFBBwAGAEgAFgBIACYASAADckEFADUASABFAEgAAnK4AJwQuABU0LgAVC9BBQA6AKIASgCiAAJyQSEACQCiABkAogApAKIAOQCiAEkAogBZAKIAaQCiAHkAogCJAKIAmQCiAKkAogC5AKIAyQCiANkAogDpAKIA+QCiABBdQSEACQCiABkAogApAKIAOQCiAEkAogBZAKIAaQCiAHkAogCJAKIAmQCiAKkAogC5AKIAyQCiANkAogDpAKIA+QCiABBxQQcACQCiABkAogApAKIAA3K4AKIQuABa0LgAWi+4AKIQuABg0LgAYC+4AKIQuQCuAAX0uABm0LgAZi+4ALQQuABs0LgAbC9BBQA6ALoASgC6AAJyQSEACQC6ABkAugApALoAOQC6AEkAugBZALoAaQC6AHkAugCJALoAmQC6AKkAugC5ALoAyQC6ANkAugDpALoA+QC6ABBdQSEACQC6ABkAugApALoAOQC6AEkAugBZALoAaQC6AHkAugCJALoAmQC6AKkAugC5ALoAyQC6ANkAugDpALoA+QC6ABBxQQcACQC6ABkAugApALoAA3K4ALoQuABy0LgAci+4AEIQuAB40LgAeC+4ADYQuAB+0LgAPBC4AITQuABCELgAitC4AEgQuACQ0LgAThC4AJbQuACiELgAqNC4AKgvuACcELgAwdwAuAAARVi4AEUvG7kARQAOPlm4AABFWLgASy8buQBLAA4+WbgAAEVYuABpLxu5AGkADj5ZuAAARVi4AG8vG7kAbwAOPlm7AJkAAQAPAAQruwCBAAEAewAEK7sAOQABADMABCu7ACEAAQAbAAQruABLELkACQAB9LgAGxC4ACfQuAAhELgALdC4AEUQuQA/AAH0QQUAOQA/AEkAPwACckEhAAgAPwAYAD8AKAA/ADgAPwBIAD8AWAA/AGgAPwB4AD8AiAA/AJgAPwCoAD8AuAA/AMgAPwDYAD8A6AA/APgAPwAQXUEhAAgAPwAYAD8AKAA/ADgAPwBIAD8AWAA/AGgAPwB4AD8AiAA/AJgAPwCoAD8AuAA/AMgAPwDYAD8A6AA/APgAPwAQcUEHAAgAPwAYAD8AKAA/AANyuABLELkAUQAB9LgAMxC4AFfQuAA5ELgAXdC4AD8QuABj0LgAURC4AHXQuACZELgAh9C4AIcvuQCNAAH0uACZELkAkwAB9LgAexC4AJ/QuACBELgApdC4AJkQuACr0LgAqy+4AI0QuACx0LgAkxC4ALfQuACZELgAvdAwMRMUBiMiJjU0NjMyFhEUBiMiJjU0NjMyFicUBiMiJjU0NjMyFgUUBiMiJjU0NjMyFiUUBiMiJjU0NjMyFjcUBiMiJjU0NjMyFjcUBiMiJjU0NjMyFhcUBiMiJjU0NjMyFicUBiMiJjU0NjMyFicUBiMiJjU0NjMyFgcUBiMiJjU0NjMyFhcUBiMiJjU0NjMyFhcUBiMiJjU0NjMyFjcUBiMiJjU0NjMyFgcUBiMiJjU0NjMyFgcUBiMiJjU0NjMyFtoLCAgLCwgICwsICAsLCAgLpAsICAoKCAgLAUgLCAgKCggIC/7FCwgICgoICAsjCwgICgoICAs1CwgICgoICAvVCggICwsICAojCggICwsICAo1CggICwsICArVCwgICgoICAsjCwgICgoICAs1CwgICgoICAvWCggICwsICAojCggICwsICAo1CggICwsICAoBcAgLCwgICwv+sQgLCwgICwucCAoKCAgLCwgICgoICAsLNQgKCggICwsvCAoKCAgLCxsICgoICAsLYggKCggICwsvCAoKCAgLCxsICgoICAsL3QgLCwgICgo/CAsLCAgKCisICwsICAoKUggLCwgICgo/CAsLCAgKCisICwsICAoKAAAAAgAa//cBPQGQAC8AOwKquwAAAAUAFQAEK7sAEAAGADAABCu7ADYABgAKAAQruAAwELgABNC4AAQvugAFAAoAABESOUEhAAYANgAWADYAJgA2ADYANgBGADYAVgA2AGYANgB2ADYAhgA2AJYANgCmADYAtgA2AMYANgDWADYA5gA2APYANgAQXUEhAAYANgAWADYAJgA2ADYANgBGADYAVgA2AGYANgB2ADYAhgA2AJYANgCmADYAtgA2AMYANgDWADYA5gA2APYANgAQcUEHAAYANgAWADYAJgA2AANyQQUANQA2AEUANgACcrgANhC4ACvQuAArLwC4AABFWLgAHS8buQAdABA+WbgAAEVYuAAiLxu5ACIAED5ZuAAARVi4AAIvG7kAAgAKPlm7ACAAAQAlAAQruwA5AAEABwAEK7sADQABADMABCu6AAUABwA5ERI5uAACELkAEwAB9EEhAAcAEwAXABMAJwATADcAEwBHABMAVwATAGcAEwB3ABMAhwATAJcAEwCnABMAtwATAMcAEwDXABMA5wATAPcAEwAQXUEhAAcAEwAXABMAJwATADcAEwBHABMAVwATAGcAEwB3ABMAhwATAJcAEwCnABMAtwATAMcAEwDXABMA5wATAPcAEwAQcUEHAAcAEwAXABMAJwATAANyQQUANgATAEYAEwACcrgAHRC5ACgAAfRBBQA5ACgASQAoAAJyQSEACAAoABgAKAAoACgAOAAoAEgAKABYACgAaAAoAHgAKACIACgAmAAoAKgAKAC4ACgAyAAoANgAKADoACgA+AAoABBdQSEACAAoABgAKAAoACgAOAAoAEgAKABYACgAaAAoAHgAKACIACgAmAAoAKgAKAC4ACgAyAAoANgAKADoACgA+AAoABBxQQcACAAoABgAKAAoACgAA3IwMSUUIyI9AQYjIiY1NDYzMhYdARQzMj0BNCcmJz4BMzIWMzI3FwYjIiYjIgYHFhcWFQc0JiMiBhUUFjMyNgEbUE8LDhkiIhkaIyssYTpCA0A1FUcTGAUfECoWTRQXKwJkKkWdEAsLDw8LCxBPWFgzBCEZGiMfHG40NJEYGA8JLj0WFgc0GBsSFBAZIycLEBALCw8PAAL+VQHH/3wCWwAJABEE3EEDAKUAAAABcUEDACcAAAABckEDADgAAAABXUEDAOkAAAABcUEDANcAAAABcUEFAHUAAACFAAAAAnFBAwCUAAAAAV1BAwAxAAAAAXJBAwAGAAQAAXJBAwA3AAQAAXJBAwAnAAQAAXFBAwAGAAQAAXFBAwCWAAQAAXFBAwAxAAQAAV1BAwBqAAUAAXFBAwCVAAUAAXFBAwDKAAYAAXFBAwAqAAYAAXJBAwCJAAYAAXFBAwBpAAcAAV1BAwCZAAcAAXFBAwC1AAcAAV1BAwAZAAgAAV1BAwB4AAkAAV1BAwCJAAkAAV1BAwAaAAkAAXFBAwD5AAkAAV1BAwAJAAkAAXFBAwDHAAkAAXFBAwCWAAkAAXFBAwA3AAoAAXJBAwA4AAoAAV1BAwD5AAoAAV1BAwAJAAoAAXFBAwBqAAoAAXFBAwCrAAoAAXFBAwAvAAoAAXJBAwAMAAoAAXJBAwDrAAoAAXFBAwAaAAoAAXJBAwDJAAoAAXFBAwBXAAoAAV1BAwDXAAoAAXFBAwCRAAoAAV1BAwD6AAsAAXFBAwCbAAsAAXFBAwBsAAsAAXFBAwDuAAsAAXFBAwDfAAsAAXFBAwA/AAsAAXJBAwANAAsAAXJBAwAbAAsAAXFBAwBaAAsAAXFBAwCKAAsAAXFBAwCpAAsAAXFBAwCRAA4AAXFBAwDTAA4AAXFBAwAjAA4AAXJBAwC0AA4AAV1BAwCGAA4AAXFBAwCYAA4AAV1BAwA2AA4AAV1BAwDmAA4AAV1BAwCkAA4AAXFBAwDzAA4AAXFBAwDiAA4AAXFBBQAAAA4AEAAOAAJyQQMAMAAOAAFyQQMA0gARAAFxQQMA9QARAAFxQQMAEQARAAFyQQMAMAARAAFyALgAAC+7AAgAAgAMAAQruwAQAAIAAgAEK0EDALwAAAABcUEDAO0AAAABXUEDAF8AAAABXUEDAD8AAAABXUEDAJ8AAAABXUEDAJ4AAAABcUEDAN0AAAABcUEDAIgAAAABcUEFACgAAAA4AAAAAnJBAwBpAAEAAXFBAwDRAAIAAV1BAwCxAAIAAV1BAwBxAAIAAV24AAIQuAAE0LgABC9BAwApAAQAAXFBAwA6AAUAAXJBAwDoAAUAAV1BAwAVAAUAAXFBAwDlAAYAAXFBAwAdAAgAAV1BAwCfAAgAAV1BCQA/AAgATwAIAF8ACABvAAgABF1BAwBgAAgAAXFBAwBAAAgAAXFBAwCWAAkAAXFBAwC5AAkAAV1BAwCnAAkAAXFBAwDUAAkAAV1BAwBgAAkAAXG6AAoAAgAEERI5QQMA1gAKAAFxQQMA6gAKAAFdQQMAfAAKAAFdQQMAjgAKAAFdQQMAnwAKAAFdQQMAvwAKAAFdQQMAXQAKAAFdQQMAywAKAAFdQQMANwAKAAFyQQMAFgAKAAFxQQMA8gAKAAFxQQMACAAMAAFyQQMA6QAMAAFxQQMAnwAMAAFdQQMAPwAMAAFdQQUAXwAMAG8ADAACXUEDAE0ADAABXUEFABkADAApAAwAAnJBAwBgAAwAAXFBAwBAAAwAAXFBAwByABAAAV1BAwD2ABAAAXFBAwAWABAAAXJBAwCxABAAAV1BAwDQABAAAV26AA4AAgAQERI5QQMAiAAOAAFxMDEBQQMAPQABAAFyQQMAMQARAAFyAyYjIgc2NzYzMgcmIyIHNjMyhHNlJCsBKiY1hw0sTUYYFRpgAccpBjQgHW5RNQMAAAL+VQHH/3wChwAOABYDy7sADQAGAA8ABCu4AA0QuAAA0LgAAC9BAwC6AAEAAXFBAwDnAAQAAV1BAwCaAAQAAV1BBQAqAAQAOgAEAAJyQQMAfAAEAAFxQQMACgAEAAFyQQMAGgAEAAFdQQMARwAEAAFyQQMA1AAEAAFdQQUAiQAGAJkABgACcUEDAN8ABgABcUEDAH0ABgABcUEDAEkABgABcUEDAEkABgABckEDAAIACQABckEDAEUACQABcUEDADYACQABXUEDAHoACQABcUEDAEUACQABckEFACQACQA0AAkAAnJBAwBRAAkAAV1BAwBAAAkAAV1BAwAKAA8AAXJBAwApAA8AAXJBAwCYAA8AAV24AA8QuAAK0EEDAOkAEAABcUEDALoAEAABcUEDAH8AEAABcUEFAB0AEAAtABAAAnJBAwD6ABAAAXFBAwA5ABAAAXFBAwBZABAAAXFBAwA2ABIAAXJBAwDyABIAAXFBAwBDABMAAXJBAwDUABMAAV1BBQClABMAtQATAAJxQQMAZgATAAFxQQMA5wATAAFdQQMAfQATAAFxQQMAnAATAAFdQQMANgATAAFyQQMANQATAAFxQQMAJQATAAFyQQMA8wATAAFxQQMAAwATAAFyQQMAEgATAAFyQQMA4AATAAFxQQMAsAAWAAFxALgACy+4AAAvuwAVAAIAAgAEK7sACAACABEABCtBAwB/AAAAAV1BAwC/AAAAAV1BAwDfAAAAAV1BAwCfAAAAAV1BAwBeAAAAAV1BAwA9AAAAAV1BBQA5AAEASQABAAJyuAACELgABNC4AAQvQQMASAAEAAFyQQMAnwAIAAFdQQMA3wAIAAFdQQMAvwAIAAFdQQUAbwAIAH8ACAACXUEDAAAACAABXUEDACYACQABXUEDAEUACQABXUEDAB8ACwABXUEDAH8ACwABXUEFAK8ACwC/AAsAAl1BAwDfAAsAAV26AAoAAAALERI5QQMA4AAKAAFxQQMAwQAKAAFxQQMAdAAKAAFxQQMARQAKAAFxQQMA1QAKAAFxQQMAZQAKAAFxQQMAhQAKAAFxQQMAogAKAAFxQQMAAAAKAAFyQQMAIAAKAAFyQQMAQAAKAAFyugAPAAIABBESOUEDALYADwABcUEDANYADwABcUEDAEUADwABckEDACYAEAABXUEFAG8AEQB/ABEAAl1BAwC/ABEAAV1BAwDfABEAAV1BAwCfABEAAV26ABMAAgAVERI5QQMA1gAWAAFxQQMAFgAWAAFyQQMA9AAWAAFxQQUAMwAWAEMAFgACcjAxQQMAJQAKAAFyAyYjIgc2NzYzMhc1MxUWJyYjIgc2MzKEc2UkKwEqJjVQKiEEJSxNRhgVGmABxykGNCAdNWGlDRhRNQMAAAAD/lUBx/+XAoIAGAAgACwIZLoAEgAMAAMrQQUApwAMALcADAACXUEDAOoADAABXUEVAAkADAAZAAwAKQAMADkADABJAAwAWQAMAGkADAB5AAwAiQAMAJkADAAKXUEFAMAADADQAAwAAl1BAwBwAAwAAXFBAwDvABIAAV1BAwBwABIAAXFBAwDAABIAAV26AAAADAASERI5QQMA+QAAAAFdQQMACQAAAAFxQQMAyAAAAAFdQQMAZgAEAAFyQQMARgAEAAFxQQUAuAAEAMgABAACXUEDACkABAABckEDALkABAABcUEDAPsABAABcUEDAHsABAABXUEDANkABAABXUEDADgABAABckEDANYABAABcUEDADYABAABXUEDACUABAABXUEDAFIABAABXUEFACgABQA4AAUAAnFBAwDXAAUAAV1BAwA4AAYAAXFBAwDpAAYAAXFBAwCYAAYAAXFBAwDlAAYAAV1BAwCCAAYAAV1BAwAqAAcAAXJBAwApAAcAAV1BAwCmAAcAAXFBAwAlAAkAAV1BAwBTAAkAAV26AAoADAASERI5QQMA2AAKAAFdQQMAxQAKAAFdQQMAugAOAAFxQQMAmgAOAAFxQQMAegAOAAFxQQMA2wAOAAFdQQMAiwAOAAFxQQMAbQAOAAFxQQMAWwAOAAFxQQMAqwAOAAFxQQMASgAOAAFxQQMAKgAOAAFxQQMAGQAOAAFxQQMAOQAOAAFxQQMAcgAQAAFxQQMAkwAQAAFxQQMAZAAQAAFxQQUApAAQALQAEAACcUEFADUAEABFABAAAnFBAwBWABAAAXFBAwDnABAAAV1BBQClABAAtQAQAAJdQQMA1QAQAAFdQQMAJAAQAAFxQQMA8wAQAAFdQQUAAgAQABIAEAACcUEDAIEAEAABcUEDAMAAEAABXboAFwAMABIREjlBAwD5ABgAAV1BAwAJABgAAXFBAwBIABgAAXJBAwDoABgAAV26ABkADAASERI5QQMAOgAZAAFyQQMA+wAZAAFdQQMATAAZAAFyQQMALAAZAAFyQQMA6wAZAAFxQQMACgAZAAFxQQMA2gAZAAFdQQMAaAAZAAFxQQMAHAAaAAFyQQMATwAaAAFyQQMAPQAaAAFyQQUA2wAaAOsAGgACcUEDADkAGgABcUEDADUAHAABckEDANQAHAABcUEDAOMAHQABcUEDAKQAHQABcUEDANQAHQABXUEFAAYAHQAWAB0AAnJBAwDJAB0AAV1BAwB9AB0AAV1BAwBHAB0AAXFBAwDmAB0AAV1BAwCEAB0AAV1BAwA0AB0AAXJBAwAjAB0AAXJBAwBCAB0AAXJBAwB2AB8AAV1BAwBHACAAAXJBAwC3ACAAAXFBAwAzACAAAXJBAwASACAAAXK4ABIQuQAhAAb0QQUAXwAhAG8AIQACcrgADBC5ACcABvRBAwBgACcAAV1BAwBRACcAAXJBBQChACcAsQAnAAJdQQMA5QAnAAFdQQMAAQAnAAFxQQMA8AAnAAFdQQMAYAAnAAFyQQMAwAAnAAFdALgAAC+7AB8AAgACAAQrugAPABsAAytBAwBcAAAAAV1BAwA/AAAAAV1BAwDcAAAAAXFBAwC8AAAAAXFBAwB2AAEAAXFBAwBhAAEAAXFBAwBzAAIAAV1BAwBWAAIAAXFBAwBnAAIAAXFBAwDUAAIAAV1BAwCQAAIAAV1BAwCwAAIAAV24AAIQuAAE0LgABC9BAwDZAAUAAV1BAwB1AAUAAXFBAwA3AAcAAV1BAwBEABsAAXFBAwBZABsAAXJBAwCwABsAAV1BAwBgABsAAXG4ABsQuQAIAAL0QQMARQAIAAFxQQMAAwAIAAFdQQMAEAAIAAFdQQMANgAJAAFdQQMArQAPAAFdQQMAzwAPAAFdQQMA2QAPAAFdQQMAYAAPAAFxugAKABsADxESOUEDACUACgABXUEDAFQACgABXUEDAHQACgABcUEDAHcADAABcUEDANQAEQABXUEDAFUAEQABcUEDAAUAEQABcUEDAKUAEQABcUEDALYAEQABXUEDAJcAEQABcUEDAEcAEQABcUEDAOcAEQABXUEDADYAEQABcUEDABYAEQABcUEDAMUAEQABXUEDAIUAEQABcUEDAPQAEQABXUEDACIAEQABcUEFAGIAEQByABEAAnFBAwBaABMAAXFBAwBrABMAAXFBAwBNABMAAXFBAwCeABMAAXFBAwCMABMAAXFBBwAaABMAKgATADoAEwADcUEDAHoAEwABcUEDAKoAEwABcbgADxC4ABXcQQMA4wAVAAFdQQMA0AAVAAFdugAXAA8AFRESOUEDANcAFwABXUEDAPgAGAABXboAGQACAAQREjlBAwCdABkAAV1BAwDeABkAAV1BAwBbABkAAXJBAwAWABkAAXJBAwCSAB8AAV1BAwA2AB8AAXJBAwBHAB8AAXJBAwC0AB8AAV1BAwDRAB8AAV1BAwBwAB8AAV26AB0AAgAfERI5QQMAdgAgAAFxQQMA1gAgAAFxQQMAYwAgAAFxQQMAQAAgAAFyQQMAcgAkAAFxQQMAEwAkAAFdQQMA1AAkAAFdQQMAVAAkAAFxQQMAhQAkAAFxQQMAVQAkAAFyQQMAlwAkAAFxQQMARwAkAAFxQQMAaAAkAAFyQQMAKgAkAAFyQQMA+AAkAAFdQQMAFwAkAAFxQQMAFwAkAAFyQQMA5gAkAAFdQQMAtQAkAAFxQQMANQAkAAFxQQMABAAkAAFxQQMAowAkAAFxQQMAIgAkAAFxQQMAIAAkAAFdQQMAYAAkAAFxuAAbELgAKtC4ACovQQMAFQAqAAFdQQMATwAqAAFxQQMAsAAqAAFxQQUAUAAqAGAAKgACcjAxAUEDANMABAABXUEDANYABQABXQMmIyIHNjc2MzIXJjU0NjMyFhUUBiMiJxYHJiMiBzYzMjc0JiMiBhUUFjMyNoRzZSQrASomNTYnAx0UFB0dFAUIGR0sTUYYFRpgcw8LCw8PCwsPAccpBjQgHRoICBQdHRQUHQIjElE1A0ULDw8LCw8PAAAC/lUBx/98AocABwAbA4G7ABgABwAUAAQrQQUAIAAUADAAFAACcrgAGBC5ABoABvS4AAjQuAAIL7oAAAAUAAgREjlBAwAaAAAAAXJBAwArAAAAAXJBAwCMAAAAAXFBAwA6AAAAAXJBBQBpAAAAeQAAAAJxQQMASAAAAAFyQQMAMAADAAFyQQMAwQAEAAFxQQMA0wAEAAFdQQMAhAAEAAFdQQMApQAEAAFxQQMAhQAEAAFxQQMAlwAEAAFdQQMAtgAEAAFdQQMAZQAEAAFxQQMAJQAEAAFyQQMAQwAEAAFyQQMAAgAEAAFyQQMAEQAEAAFyQQMAMAAEAAFyQQMA2AAGAAFdQQMAdQAMAAFyQQMApQAMAAFxQQMAtgAMAAFxQQMACAAMAAFyQQMAOAAMAAFyQQMASAAMAAFxQQMA2AAMAAFxQQMAlwAMAAFdQQMAVgAMAAFyQQMAZQAMAAFxQQMA1AAMAAFdQQMAggAMAAFdQQMASwAOAAFyQQUABgAPABYADwACckEFAMUADwDVAA8AAnFBAwAwAA8AAXJBAwAPABMAAXIAuAAIL7sABgACAAoABCu6ABMAAgADK0EDALAACgABXUEDAHAACgABXUEDANAACgABXUEDAJAACgABXbgAChC4AAzQuAAML0EDADcADAABcroAAAAKAAwREjlBAwB7AAAAAV1BAwBbAAAAAXJBAwBIAAAAAXJBAwCHAAAAAXFBBQBgAAIAcAACAAJxQQMAvwACAAFxQQUAOAACAEgAAgACckEDALAAAgABXUEDAEAAAgABcUEDADgAAwABckEDALAABgABXUEDABUABgABckEFADUABgBFAAYAAnJBAwCWAAYAAXFBAwDVAAYAAXFBAwC1AAYAAXFBAwBwAAYAAV1BAwDQAAYAAV1BAwCQAAYAAV26AAQACgAGERI5QQMAPwAIAAFdQQMAXwAIAAFduAACELkAEAAC9EEDACIAEAABXUEDABEAEAABXUEDAAYAEgABckENAF8AEwBvABMAfwATAI8AEwCfABMArwATAAZdQQMAQQAVAAFyQQMAwgAVAAFxQQMAEwAVAAFyQQMA9AAVAAFxQQsAdwAVAIcAFQCXABUApwAVALcAFQAFXUEDAHUAFQABcUEDANQAFQABcUEDAKMAFQABcUEDAOEAFQABcUEDACEAFQABckEDAAAAFQABcrgAExC4ABjQMDEDJiMiBzYzMhcmIyIHNjc2MzIXNTMVFhc1MxUWqyxNRhgVGmBvc2UkKwEqJjUXEyEcEyEEAe1RNQNFKQY0IB0EMDwNGGGlDQAB/zkB1v9eAmYAAwBLuwAAAAUAAQAEKwC4AAAvuAACL0EDAI8AAgABXUEDAA8AAgABcUEDAI8AAgABcUEDAO8AAgABXUEDAD8AAgABXUEDAB8AAgABXTAxAyM1M6IlJQHWkAAAAv7XAdH/1AKAABQAIAbPuAAhL7gAIi9BAwBlAAAAAXFBAwCWAAAAAXFBBQDmAAAA9gAAAAJxQQMABgAAAAFyQQMA1wAAAAFxQQMAhwAAAAFxQQUAGAAAACgAAAACcUEDABkAAAABXUEDAJkAAAABckEDAJ4AAAABXUEDAK8AAAABXUEDAHoAAAABXUEDAEkAAAABcUEDADgAAAABXUEDAGgAAAABXUEHACcAAAA3AAAARwAAAANyQQMAtwAAAAFxQQMAxgAAAAFxQQMAVgAAAAFxQQMAFQAAAAFyQQMApQAAAAFxQQMA2AABAAFdQQMA9gACAAFxQQMAQwACAAFyQQMAXwADAAFyQQMAFgADAAFyQQMARQADAAFyuAAhELgACtC4AAovQQUAUAAKAGAACgACcUEJAEAACgBQAAoAYAAKAHAACgAEckEDAFMACgABXUEDAO8ACgABcUEDAGIACgABXUEDAKAACgABcUEDAPAACgABXUEDAAAACgABcUEFAKAACgCwAAoAAnK5ABsABvRBAwCGABsAAV1BAwD3ABsAAV1BAwCmABsAAV1BBQBWABsAZgAbAAJdQQkABgAbABYAGwAmABsANgAbAARduAAE0LgABC+4AAoQuAAF0LgABS+4ACIQuAAQ3EEDADAAEAABXboACAAKABAREjlBAwBJAAgAAXJBAwApAAgAAXJBAwA4AAgAAXJBBwAaAAkAKgAJADoACQADcUEDANsADAABXUEDAD0ADAABcUEDAAwADAABcUEFABsADAArAAwAAnFBBQDpAAwA+QAMAAJdQQMAAQAOAAFxQQMAEwAOAAFxQQMA5gAOAAFdQQMAJQAOAAFxQQMAMgAOAAFxQQMA0QAOAAFdQQMA8AAOAAFdQQMAdgARAAFxQQMApwARAAFyQQMANQARAAFyQQMAVQARAAFxugASAAoAEBESOUEDAAEAEgABckEFAOIAEgDyABIAAnFBBQA1ABIARQASAAJyQQMAqQASAAFyQQMArQASAAFdQQMAbwASAAFyQQMAXgASAAFyQQMAiwASAAFyQQMAeQASAAFyQQMAEwASAAFyQQMAwQASAAFxQQMA0AASAAFxQQMAIAASAAFyQQMA7wATAAFxQQMAiAAUAAFxQQMAmQAUAAFxQQMAGgAUAAFyQQMASwAUAAFyQQUAuwAUAMsAFAACcUEDADwAFAABckEDAC0AFAABckEDAJ4AFAABXUEDAK0AFAABXUEDANwAFAABcUEDAPsAFAABcUEDAAsAFAABckEDAEoAFAABcUEDAOoAFAABcUEDAAgAFAABcUEDAKgAFAABcUEFAFgAFABoABQAAnG5ABUABvRBAwCpABUAAV1BBwAJABUAGQAVACkAFQADXUEDAIkAFQABXUEDAFkAFQABXQC6AB4ABAADK7sADQACABgABCtBAwCvAAAAAV1BAwB6AAEAAXFBAwAGAAIAAXFBAwBHAAIAAXJBAwDJAAIAAXFBAwAZAAIAAXJBAwAHAAIAAV1BAwDWAAIAAXFBAwAlAAIAAV1BAwDVAAMAAXJBAwBRAAQAAXJBBQA3AAYARwAGAAJyQQMAJgAGAAFyQQMA3wAeAAFyQQUADwAeAB8AHgACcUEDAP4AHgABXUEDAM4AHgABXboACAAEAB4REjlBBwBPAAgAXwAIAG8ACAADXUEDAGIACAABckEDAFAACAABckEDAA8ACQABcUEDAPwACQABXUEDANQACQABckEDAOYACwABXUEDAF8ADQABXUEDAA8ADQABcUEDAF8ADQABcUEDAK8ADQABXUEFAC8ADQA/AA0AAnJBAwBwAA0AAV1BAwClAA8AAXFBBQDWAA8A5gAPAAJdQQMAdwAPAAFxQQMAlwAPAAFxQQMAVwAPAAFxQQMA1QAPAAFxQQMAhQAPAAFxQQMARQAPAAFxQQMAqwARAAFxQQMALgARAAFyQQMATgARAAFxQQMADgARAAFyQQMAXwARAAFxQQMAzwARAAFxQQMAHwARAAFyQQUAPwARAE8AEQACckEFAH8AEQCPABEAAnFBAwDvABEAAXFBAwCeABEAAXFBAwDuABEAAV1BAwDcABEAAXFBAwCpABEAAXJBBQB2ABEAhgARAAJyuAAEELkAEgAC9EEFAOcAEgD3ABIAAnFBAwAHABIAAXJBAwDHABIAAXFBBwAmABIANgASAEYAEgADckEDAHcAEwABcUEDABUAEwABckEDAAQAFAABXUEFAC8AGAA/ABgAAnJBAwAPABgAAXFBAwBeABgAAXEwMQFBAwA0AAAAAV1BAwAyABQAAV0AQQMAMgAAAAFdQQMAMgAUAAFdAwYHBisBNTY3JjU0NjMyFhUUBzY3BzQmIyIGFRQWMzI2LA9DN10UJw85IBYZHS6GEIMPCwsPDwsLDwJ3XycgFRAeBzIWHSAYOCIKfy0LDw8LCw8PAAAC/q8B2//GAoAAIwAvCo+4ABAvuwAqAAYAFQAEK7oAHQAkAAMruwAAAAYAIwAEK0EDAJ8AAAABcUEDAP4AAAABcUEDAOsAAQABXUEDADwAAQABcUEDAA4AAQABcUEDAN8AAQABXUEDAJ8AAQABcUEDAPwAAQABXUEDACsAAQABcUEFAHoAAQCKAAEAAnFBAwDoAAEAAXFBAwBIAAIAAV1BAwApAAIAAV1BAwDKAAIAAV1BCQCIAAIAmAACAKgAAgC4AAIABF1BAwAYAAIAAV1BAwBzAAIAAV1BAwAJAAMAAV1BAwCfAAMAAXFBAwBaAAMAAXJBAwDZAAMAAXFBAwA5AAMAAV1BAwBxAB0AAV1BAwBFAB0AAV1BAwAGAB0AAV1BAwCfAB0AAXFBAwAvAB0AAV1BAwC2AB0AAV1BAwA2AB0AAV1BAwBjAB0AAV1BAwBRAB0AAV1BAwCAAB0AAV24AB0QuQAFAAb0QQMAPgAFAAFdQQUAdgAFAIYABQACXUEDAP8ABwABcUEDAB0ABwABckEDAAkABwABckEDAIgACAABcUEDAEkACAABckEDAPwACAABcUEDAAkACAABcUEDAFgACAABckEDAHcACAABcUEDAJkACQABcUEDAPcACQABcUEDAMEACQABXUEDAAAAFQABXUEDAH8AFQABcUEFAFAAFQBgABUAAl1BAwDAABUAAV1BAwAgABUAAXK6AAwAFQAAERI5QQMApQAMAAFxQQMAFgAMAAFyQQMAlwAMAAFxQQMA9gAMAAFxQQMAhQAMAAFxQQMABAAMAAFyQQMAcQAPAAFxQQMAUwAPAAFxQQMAYgAPAAFxQQMAgAAPAAFxQQMAQAAPAAFxQQMAAAAQAAFdQQMAEgAQAAFdQQMAnwAQAAFxQQMANgAQAAFdQRkAQAAQAFAAEABgABAAcAAQAIAAEACQABAAoAAQALAAEADAABAA0AAQAOAAEADwABAADF1BCQAAABAAEAAQACAAEAAwABAABHFBAwAAABAAAXJBAwCgABAAAXFBAwCgABEAAV1BBQBSABEAYgARAAJxQQMAcwARAAFxQQMAQAARAAFxQQMAgAARAAFxQQMAoAARAAFxQQMAjAATAAFxQQMAfwATAAFxQQMAbQATAAFxQQMAWgATAAFxQQMASQATAAFxQQMAOgAXAAFyQQMA+AAXAAFxQQMAoAAXAAFdQQMA8wAYAAFxQQMAdAAYAAFdQQMACgAYAAFxQQMAFQAYAAFyQQMAkwAYAAFxQQMAAgAYAAFyQQMAoAAYAAFduAAQELkAJAAG9EEDAKAAJAABXUEDAAAAJAABcboAGQAkAB0REjlBAwD5ABkAAXFBAwCKABkAAXFBBwC6ABkAygAZANoAGQADXUEFAOsAGQD7ABkAAl1BAwBrABkAAXFBAwCcABkAAV1BAwAPABkAAXFBAwAcABkAAXFBAwArABkAAXFBAwALABkAAXJBBwA6ABkASgAZAFoAGQADcUEDABoAGQABckEDAKkAGQABXUEDAHcAGQABcUEDAAsAGgABcUEDAP8AGgABcUEDAB4AGgABckEDAAoAGgABckEDAKgAGgABXUEDANUAGwABXUEDACYAGwABckEDALgAGwABXUEFAOcAGwD3ABsAAl1BAwAHABsAAXFBAwA2ABsAAXFBAwAkABsAAXFBAwATABsAAXG6AB8AJAAdERI5QQMAeAAfAAFdQQMAKgAfAAFdQQMAjQAfAAFdQQMASwAfAAFdQQMAWgAfAAFyQQMAtgAfAAFxQQMAxQAfAAFxQQMAyQAhAAFdQQMAOQAhAAFxQQMA3AAhAAFdQQMAnwAhAAFxQQUA6gAhAPoAIQACXUEDAAoAIQABcUEDAHkAIQABcUEDACgAIQABcUEDAIgAIQABcUEDAJ8AIwABcUEDAP8AIwABcUEDAJgAIwABXUELACYAKgA2ACoARgAqAFYAKgBmACoABV1BAwAGACoAAV1BAwB/ACoAAXFBBwCWACoApgAqALYAKgADXUEDABIAKgABXUEDACAAKgABcgC4AAIvuAASL7gAGS+6ABgAJwADK0EDABYAAAABXUEDADIAAQABcUEDAAQAAQABcUEDAHUAAQABcUEDANkAAQABcUEDAO4AAQABcUEDAM8AAQABcUEDALoAAQABcUEDAOUAAQABXUEDAIQAAQABcUEDAPMAAQABXUEDANEAAQABXUEDAJEAAQABcUEDAH8AAgABcUEDAH8AAwABcUEDAD8AGAABckEDAB8AGAABXUEDAH8AGAABXUEDADAAGAABcbgAGBC4ABrQuQAHAAL0QQMAGgAHAAFyQQMABwAHAAFyQQMAogAZAAFdQQMA8wAZAAFdQQMAFQAZAAFyQQMAVgAZAAFxQQMAJgAZAAFxQQMAJgAZAAFyQQMAxwAZAAFdQQMAdwAZAAFdQQMAeQAZAAFxQQMARwAZAAFxQQMAhwAZAAFxQQUAhgAZAJYAGQACXUEDAPYAGQABcUEDAFUAGQABckEDALQAGQABXUEDABIAGQABcUEDAAIAGQABckEDADEAGQABcbgAGRC5AAgAAvRBAwD2AAgAAV1BAwAXAAgAAXJBAwD3AAgAAXFBAwCXAAgAAV1BAwBcAAgAAXJBAwB3AAgAAV1BAwDHAAgAAV1BAwAmAAgAAV1BAwCFAAgAAV1BAwAEAAgAAXK4ABgQuQAJAAL0QQMAJgAJAAFdQQMAyAAJAAFdQQMACQAJAAFxQQMATQAJAAFyQQMAPwAJAAFyQQMALgAJAAFyQQMA+wAJAAFxQQMAmQAJAAFxQQMACAAJAAFyQQMAhQAJAAFdQQMAZAAJAAFdQQMAPwAnAAFyQQMAhQAnAAFdQQkAwAAnANAAJwDgACcA8AAnAARdQQMAAAAnAAFxuAAnELkADgAC9EEDAMAADgABXUEDAKYADgABcUEHABAADgAgAA4AMAAOAANxQQUAUAAOAGAADgACcrgADNC4AAwvQQMAAAAMAAFdQQMArQARAAFxQQMAfwASAAFxQQMAAAASAAFyQQMAqwATAAFxuAASELkALQAC9EEDAIwALQABXUEDABIALQABXUEDAFAALQABcrgAH9C4AB8vQQMApQAfAAFdQQMAlwAfAAFdQQUA5wAfAPcAHwACXUEDALcAHwABXUEDAKYAHwABcUEDAMQAHwABXUEDAIAAHwABXUEDAPUAIQABXUEDAAYAIQABcUEDAIcAIQABcUEDADYAIQABcUEDAHYAIQABcUEDANIAIQABXUEDAJIAIQABcUEDALcAIwABXUEDANgAIwABXUEDAJwAIwABcUEDAM0AIwABXUEDAC8AIwABckEDAH0AIwABcUEDAOoAIwABXUEDAIgAIwABXUEDACMAIwABXUEDAAIAIwABXTAxAUEDAP0ABwABcUEDAJQACgABcUEDAPcADAABXUEDAGAAEAABXUEDAFEAEAABXUEDAKMAEAABXUEDAFMAEQABXUEDAPoAFwABcUEDADsAFwABcUEDAA8AGQABcUEDAPkAGgABcQBBAwD5AAcAAV1BAwD8AAcAAXFBAwD5AAkAAV1BAwD5AAoAAV1BAwD5AAsAAV1BAwAwAA4AAXEDBiM1NjU0JwcnDgEHNjMWFQYjIiY1NDYzFzceARUUBzY3NjUHNCYjIgYVFBYzMjY6BZEpIh4dCRwDDgQ2BTAbHTIhGBgfJBYXFBqkDgoKDw8KCg4Cd5wXFC8kCSAhARUKAgMzMyYcJT0gIAEpHyUZAhwlO2gLDg4LCw0NAAAB/uUB1v95Al4ACwFjuwACAAYAAwAEK0EDABMABgABcUEDAAEABgABcUEDAPAABgABXbgAAxC4AAfQuAACELgACdBBAwAbAAsAAXFBAwAKAAsAAXFBAwD5AAsAAV0AuAAIL7gAAi+7AAsAAgAAAAQrQQMAcAACAAFdQQMAIAACAAFxQQMAYAACAAFxQQMAMAACAAFyQQMADgACAAFyQQMA7gACAAFxQQMArwACAAFyQQMALgACAAFyQQMAgAACAAFyQQMAgAACAAFxQQMAQAACAAFxQQMA8AACAAFdQQMAAAACAAFxQQMAUAACAAFdQQkAAAACABAAAgAgAAIAMAACAARduAAAELgABNC4AAsQuAAG0EEFAA8ACAAfAAgAAl1BAwCPAAgAAV1BAwBPAAgAAXJBCQAPAAgAHwAIAC8ACAA/AAgABHFBCQA/AAgATwAIAF8ACABvAAgABF1BAwBfAAgAAXFBAwB/AAgAAXEwMQMjFSM1IzUzNTMVM4c5Ijk5IjkCDjg4GzU1AAAC/wAB1/+vApIAFAAgCBG7ABsABgAPAAQrQQMA6gAAAAFyQQUAiwAAAJsAAAACXUEDAPsAAAABckENAH8AAACPAAAAnwAAAK8AAAC/AAAAzwAAAAZxQQUAbwAAAH8AAAACXUEDAF8AAAABckENAK8AAAC/AAAAzwAAAN8AAADvAAAA/wAAAAZdQQ0ADwAAAB8AAAAvAAAAPwAAAE8AAABfAAAABnFBAwB7AAAAAXJBAwDaAAAAAXFBAwAZAAAAAXJBAwDnAAAAAXFBAwCvAAIAAV1BAwAfAA8AAXJBAwDQAA8AAV24AA8QuAAJ3EEJAK8ACQC/AAkAzwAJAN8ACQAEXUELAF8ACQBvAAkAfwAJAI8ACQCfAAkABXJBAwB/AAkAAXFBAwD/AAkAAXJBAwBLAAkAAV1BAwAQAAkAAXK6AAYADwAJERI5QQUAFgAGACYABgACcUEFADcABgBHAAYAAnFBAwB3AAYAAXFBBQAZAAYAKQAGAAJyQQMAewAGAAFyQQMAOwAGAAFyQQMACwAGAAFyQQMA2gAGAAFyQQMA6AAGAAFxQQMA1wAGAAFxQQMAZgAGAAFxQQMA9QAGAAFdQQMAVQAGAAFdQQMApgAHAAFdQQMAYgAKAAFxQQUA4wALAPMACwACXUEDAKUACwABXUEDALYACwABXUEDADcACwABcUEDABcACwABcUEDACUACwABcUEDAGUACwABcUEDAEMACwABcUEDAAAACwABcUEDABgADQABcUEDAKoADQABXUEDAPwADQABXUEDAE4ADQABcUEDAL8ADQABXUEDAO4ADQABXUEDAAsADQABcUEDACkADQABcUEDAGgADQABcUEDADgADQABcUEDAGkADgABcUEDAKoAEAABcUEDANsAEAABcUEDAM4AEAABcUEFAA8AEAAfABAAAnJBBQB/ABAAjwAQAAJxQQMAvAAQAAFxQQMA+wAQAAFxQQMA6gAQAAFxQQMAmQAQAAFxQQMADgARAAFyQQcAfwARAI8AEQCfABEAA3FBAwDvABEAAV1BAwDtABEAAXFBAwBcABEAAXFBAwA/ABMAAXJBAwDbABQAAXFBAwBNABQAAXJBAwAuABQAAXJBAwA/ABQAAXJBAwAPABQAAXFBBQB/ABQAjwAUAAJxQQMArwAUAAFdQQcAPwAUAE8AFABfABQAA3FBAwANABQAAXJBAwAcABQAAXJBAwD7ABQAAXFBAwDnABQAAXK5ABUABvRBAwAcABUAAV1BAwANABUAAV1BBQArABUAOwAVAAJdQQMAVwAVAAFdQQMAFQAbAAFdQQMA9gAbAAFxQQMABgAbAAFyQQMAVwAbAAFdQQMAHgAbAAFyQQMABgAbAAFdQQkAZgAbAHYAGwCGABsAlgAbAARdQQcAJAAbADQAGwBEABsAA11BAwDQABsAAV0AuAAAL7gADC+7ABgAAQAeAAQrQQUAuwAAAMsAAAACXUEDAA0AAAABcUEDAF8AAAABXUEDANwAAAABXUEDAOoAAAABXUEDABcAAAABckEFABgAAgAoAAIAAnJBAwBMAAIAAXJBAwB2AAIAAXJBAwA2AAIAAXJBAwB2AAQAAXJBAwD1AAQAAXJBAwBwAAwAAXJBAwChAAwAAV1BAwCfAAwAAV1BAwCQAAwAAXJBAwBQAAwAAXJBBwBwAAwAgAAMAJAADAADcboABgAMAAAREjlBAwADAAYAAXJBAwAUAAYAAXJBAwAXAAYAAXFBAwA4AAYAAXJBBQA3AAYARwAGAAJxQQMAZgAGAAFxQQMAUwAGAAFdQQMA4wAGAAFxQQMAUQAGAAFxQQMAAQAIAAFyQQMAGQALAAFxQQMAKgALAAFxQQMAywALAAFdQQMACwALAAFxQQMAWgALAAFxQQMA2AALAAFdQQMAOAALAAFxQQMA2QANAAFdQQMAKgANAAFxQQMAWgANAAFxQQMAygANAAFdQQMAOQANAAFxQQMAGAANAAFxQQMAwgAQAAFxQQMA9QAQAAFxQQMA1QAQAAFxQQMAVgAQAAFxQQMAegAQAAFyQQMADwAQAAFxQQMAOQAQAAFdQQMAhgAQAAFxQQUApQAQALUAEAACcUEDAHMAEAABcUEDAAIAEAABckEDABEAEAABckEDAEUAEQABckEDAIcAEQABXUEFAJoAEQCqABEAAnJBAwDsABEAAV1BAwCMABEAAXJBAwDdABEAAXJBAwDPABEAAXJBAwANABEAAXFBAwDsABEAAXJBAwC8ABEAAXJBAwBbABEAAXJBAwBqABEAAXJBAwDmABEAAXFBAwB1ABEAAXFBAwAAABEAAXJBAwCIABIAAV1BAwCaABIAAV1BAwAWABIAAXJBBQAkABIANAASAAJyQQMAMQATAAFyQQMAPwAYAAFyQQUAvwAYAM8AGAACcUEDAAMAGAABXUEDANAAHgABcUEDAEAAHgABckETAB8AHgAvAB4APwAeAE8AHgBfAB4AbwAeAH8AHgCPAB4AnwAeAAldQQMACgAeAAFdQQMA8AAeAAFyQQkAcAAeAIAAHgCQAB4AoAAeAARxQQMAIAAeAAFyMDEBQQMAqQAAAAFdQQMAugAAAAFdQQMAWwAAAAFxQQMAzQAAAAFdQQMA7wAAAAFdQQUAfwAAAI8AAAACcUEDALkADQABXUEDALkAFAABXUEDAEkAFAABcUEDAFoAFAABcUEDAMsAFAABXUEDAO4AFAABXUEFAH8AFACPABQAAnEAQQMA6gAAAAFdQQMA7AAUAAFdAwYHBgcGBx4BFRQGIyImNTQ/ATY1BzQmIyIGFRQWMzI2UQMeER8dBxYdHxcXIEcvGTwQCwsQEAsLEAKSIg8JBwUIAh8WFx8fF0YTDgkVhgsQEAsLEBAAAAH/owHg/8gCcAADAKC7AAAABQABAAQrALgAAi+4AABFWLgAAC8buQAAABI+WUEDADAAAAABcUEDAMAAAAABcUEDALEAAAABXUEDAE8AAAABckEDACAAAAABckEDAKAAAAABcUEDABAAAAABcUEDAJAAAAABXUEDACAAAgABckEDAD8AAgABXUEDAB8AAgABXUEDAFAAAgABcUEDANAAAgABcUEDAKAAAgABcTAxAyM1MzglJQHgkAAC/xYB3QATAowAFAAgCHK4ACEvuAAiL0EDAJYAAAABcUEDAFYAAAABcUEJAGkAAAB5AAAAiQAAAJkAAAAEckEDACoAAAABcUEDAJwAAAABXUEDAB4AAAABcUEDAK8AAAABXUEDAE8AAAABcUEDAH0AAAABXUEDAKwAAAABcUEDALkAAAABckEDAGcAAAABcUEJALYAAADGAAAA1gAAAOYAAAAEcUEDAHYAAAABcUEDAIUAAAABcUEDABoAAgABcUEDAFgAAgABckEDAH4AAwABckEDANUAAwABcbgAIRC4AArQuAAKL0EJAFAACgBgAAoAcAAKAIAACgAEckEFANAACgDgAAoAAl1BBQAPAAoAHwAKAAJyQQcAUAAKAGAACgBwAAoAA3FBBQCwAAoAwAAKAAJyQQMAMAAKAAFyQQMAsAAKAAFxuQAbAAb0QQUABgAbABYAGwACXUEDAIYAGwABXUEDAFYAGwABXUEDADYAGwABXbgABNC4AAQvuAAKELgABdC4AAUvQQMAUQAHAAFyuAAiELgAENxBAwBPABAAAXFBBQBPABAAXwAQAAJdQQMAIQAQAAFdugAIAAoAEBESOUEDANcACAABXUEFACsADAA7AAwAAnFBAwAdAAwAAXFBAwALAAwAAXFBBwDaAAwA6gAMAPoADAADXUEDAPcADQABXUEDAPQADgABXUEHAAQADgAUAA4AJAAOAANxQQMAMQAOAAFxQQUA0AAOAOAADgACXboAEgAKABAREjlBAwDSABIAAXFBAwBHABIAAXFBAwAFABIAAXJBAwDAABIAAXFBAwDgABIAAXFBAwDuABMAAXFBAwDNABMAAXFBAwDcABMAAXFBCQBYABQAaAAUAHgAFACIABQABHFBAwC5ABQAAXFBAwCaABQAAV1BAwBOABQAAXFBAwCvABQAAXFBAwAfABQAAXFBAwArABQAAXFBAwDaABQAAXFBAwCZABQAAXFBAwDIABQAAXFBAwDmABQAAXG5ABUABvRBBQAJABUAGQAVAAJdQQMAOQAVAAFdQQMAiQAVAAFdQQMAKAAVAAFdALoAHgAEAAMruwANAAIAGAAEK0EDABMAAgABcUEDANUAAgABXUEDAKcAAgABXUEDAGcAAgABXUEDAAYAAgABXUEDAPUAAgABXUEDAFMAAgABckEDAEAAAgABcUEDAEAABAABcUEDAKAABAABcUEDACAABAABckEDALAABAABckEDAPEABAABXUEDANAABAABckEJAEAABABQAAQAYAAEAHAABAAEckEDAAAABAABckEDAGAABAABcUEFABAABAAgAAQAAnFBAwDQAAQAAV1BAwBAAB4AAXFBAwCgAB4AAXFBAwAgAB4AAXJBAwCaAB4AAV1BAwAPAB4AAXFBAwC/AB4AAV1BAwDOAB4AAV1BAwBAAB4AAXJBAwAAAB4AAXJBAwBgAB4AAXFBAwAgAB4AAXFBAwDQAB4AAV26AAgABAAeERI5QQMA1gAIAAFdQQMAqgAIAAFdQQcATwAIAF8ACABvAAgAA11BAwB7AAgAAV1BAwCZAAgAAV1BAwAgAAgAAXFBAwBQAAgAAXJBBQANAAkAHQAJAAJxQQMAOwAJAAFxQQMAKQAJAAFxQQMANAALAAFxQQMABwALAAFxQQMA9gALAAFdQQMAFAALAAFxQQMAIAALAAFxQQMA0AANAAFdQQMAoAANAAFxQQMAoAANAAFyQQMA4AANAAFyQQMADwANAAFxQQMAXwANAAFdQQMAwAANAAFyQQMAAAANAAFyQQMAIAANAAFxQQMAcAANAAFdQQMAIAANAAFdQQMA1AAOAAFdQQMAxAAPAAFxQQMAdQAPAAFxQQMAhwAPAAFxQQMA9wAPAAFdQQMA5gAPAAFdQQMAlQAPAAFxQQMA5AAPAAFxQQMAoAAPAAFxQQMAewARAAFxQQMAjwARAAFxQQcAzwARAN8AEQDvABEAA3FBAwD/ABEAAV1BAwCbABEAAXFBAwCqABEAAXG4AAQQuQASAAL0QQMACAASAAFyQQMA5wASAAFxQQMAxQASAAFxQQMAwQATAAFxQQMA0wATAAFxQQMAoAATAAFxQQMA4AATAAFxQQMANwAUAAFdQQMA6AAUAAFxQQUABQAUABUAFAACXUEDACQAFAABXUEDANAAGAABXUEDAKAAGAABcUEDAKAAGAABckEDAOAAGAABckEDAA8AGAABcUEDAJQAGAABXUEDAMAAGAABckEDAAAAGAABckEDACAAGAABcUEDAKAAGAABXUEDACAAGAABXTAxAUEDAPgAAAABcUEDABgAAAABckEDAAsAAAABckEDAE0AAAABcUEDAK8AAAABXUEDABcAAQABckEDACIABwABckEDAEIABwABckEDACMACAABckEDAEQACAABckEDABQAEQABckEDAAUAEQABckEDAPYAEQABcUEHACAAEgAwABIAQAASAANyQQMA8QASAAFxQQMAFAASAAFyQQMA6QATAAFxQQMAGwATAAFyQQMAPQATAAFyQQMADgATAAFyQQMALwATAAFyQQMATwATAAFyQQUAGwAUACsAFAACckEFAD0AFABNABQAAnJBAwD+ABQAAXFBAwAOABQAAXJBAwCvABQAAV1BAwBPABQAAXEAQQMAqwAAAAFdQQMAGwAAAAFxQQMA+QAJAAFdQQMA+wARAAFdQQMA/wARAAFxQQsADwARAB8AEQAvABEAPwARAE8AEQAFckEDAAYAEgABckEDAEgAEgABckEDAMoAEgABcUEDACoAEgABckEDACAAEwABckEDAEAAEwABckEDABEAEwABckEDADIAEwABckEDAPUAEwABcUEDAOYAEwABcUEDAKsAFAABXUEDABsAFAABcRMGBwYrATU2NyY1NDYzMhYVFAc2Nwc0JiMiBhUUFjMyNhMPQzddFCcPOSAWGR0uhhCDDwsLDw8LCw8Cg18nIBUQHgcyFh0gGDgiCn8tCw8PCwsPDwAAAAL+4QHS//gCdwAjAC8ORbsAKgAGABUABCu7ABAABgAkAAQruwAdAAYABQAEK7sAAAAGACMABCtBAwAuAAAAAV1BBQBPAAAAXwAAAAJdQQMAzwAAAAFdQQMADgAAAAFdQQMA/QAAAAFxQQMACgABAAFxQQMAKwABAAFxQQMA/AABAAFxQQMAjwABAAFyQQMA/AABAAFdQQMAPAABAAFxQQMAigABAAFxQQMA2gABAAFdQQMA6QABAAFdQQMAeAACAAFdQQMALwACAAFdQQMAzwACAAFdQQMAmQACAAFdQQMAhwACAAFdQQMARgACAAFyQQMALwADAAFdQQMAuQADAAFdQQMAZAADAAFdQQMAkgAFAAFdQQkAOQAFAEkABQBZAAUAaQAFAARdQQcA2QAFAOkABQD5AAUAA11BAwAJAAUAAXFBBwAJAAUAGQAFACkABQADckEDAM8ABQABXUEDAC8ABQABXUEDAP8ABQABcUEFADoABQBKAAUAAnJBGwApAAUAOQAFAEkABQBZAAUAaQAFAHkABQCJAAUAmQAFAKkABQC5AAUAyQAFANkABQDpAAUADXFBBQCpAAUAuQAFAAJdQQUACQAFABkABQACXUEFAHAABQCAAAUAAl1BAwAQAAUAAXFBAwAsAAcAAXJBAwA/AAcAAXJBAwAMAAcAAXJBAwAbAAcAAXJBAwAoAAcAAV1BAwB1AAgAAXFBBQBpAAgAeQAIAAJyQQUAiwAIAJsACAACckEFAEwACABcAAgAAnJBAwD/AAgAAXFBAwDbAAgAAXJBAwA5AAgAAXJBAwA3AAgAAXFBAwAhAAgAAXFBAwCgAAgAAV1BAwBNAAkAAXFBAwADAAkAAXJBAwCgAAkAAV1BAwDQABUAAV1BAwAQABUAAV1BAwBQABUAAXK6AAwAFQAAERI5QQMANAAMAAFyQQMAlQAMAAFxQQMA9gAMAAFxQQMAGQAMAAFdQQUAZgAMAHYADAACcUEDALUADAABcUEDAFQADAABcUEHAAMADAATAAwAIwAMAANyQQMAgQAPAAFxQQUASQAPAFkADwACckEDAKQADwABcUEDABAADwABXUEFAFAADwBgAA8AAnFBAwAwABAAAV1BBwDQABAA4AAQAPAAEAADXUEJAAAAEAAQABAAIAAQADAAEAAEcUEDAEEAEAABXUEDADUAEAABckEDAEYAEAABcUEDAJYAEAABcUEDACYAEAABckEDAPYAEAABcUEDAHYAEAABcUEDAMYAEAABXUEDAIIAEAABckEFAFAAEABgABAAAnFBDwBQABAAYAAQAHAAEACAABAAkAAQAKAAEACwABAAB11BBQAAABAAEAAQAAJdQQMAAAAQAAFyQQMAoAARAAFdQQMAEgARAAFyQQMAxAARAAFxQQUA1QARAOUAEQACcUEDAIYAEQABcUEDALUAEQABcUEDAGIAEQABcUEDAHAAEQABcUEDABAAEQABXUEDAAAAEQABckEDAHsAEwABcUEDAEcAFwABckEDACUAGAABckEDADYAGAABckEDAIoAGAABcUEDAIUAGAABckEDABQAGAABckEDAAIAGAABckEDABAAJAABXUEFAFAAJABgACQAAnFBAwCEACQAAXJBAwCGACQAAV1BAwBCACQAAV1BBQCgACQAsAAkAAJdQQMA8AAkAAFdQQkAAAAkABAAJAAgACQAMAAkAARxQQMAAAAkAAFyugAZACQAEBESOUEDALcAGQABXUEDANkAGQABcUEFANkAGQDpABkAAl1BAwBaABkAAXJBAwAqABkAAXFBAwCKABkAAXJBAwBLABkAAXJBAwAsABkAAXJBAwD8ABkAAV1BAwCMABkAAXFBAwA/ABkAAXJBAwBMABkAAXFBAwD8ABkAAXFBAwAMABkAAXJBAwDMABkAAV1BAwBbABkAAXFBAwAbABkAAXJBAwDKABkAAXFBAwAKABkAAXFBAwBpABkAAXFBAwCZABkAAV1BAwA5ABkAAXFBAwCmABkAAV1BAwAUABkAAXFBAwAtABoAAXJBAwA+ABoAAXJBAwD/ABoAAXFBAwCOABoAAXJBBQAMABoAHAAaAAJyQQMAmAAaAAFdQQMA9gAbAAFdQQMABgAbAAFxQQMAEQAbAAFxQQMAMAAdAAFdQQMAYwAdAAFdQQMA/wAdAAFxQQMALwAdAAFdQQMAzwAdAAFdQQMAoQAdAAFdQQMAEAAdAAFxQQcAcAAdAIAAHQCQAB0AA126AB8ABQAdERI5QQMAtQAfAAFxQQMAiwAfAAFyQQMAzQAfAAFdQQMAfQAfAAFdQQMAWwAfAAFdQQMAxwAfAAFxQQMAJAAfAAFyQQMARAAfAAFyQQMAiwAhAAFxQQMAawAhAAFxQQMALQAhAAFxQQMAPgAhAAFxQQMA7AAhAAFdQQMA+wAhAAFdQQMACwAhAAFxQQMA2QAhAAFdQQMAWQAhAAFxQQMAzwAjAAFdQQMADwAjAAFdQQUATwAjAF8AIwACXUEDAC8AIwABXUEDAP8AIwABcUEDACkAIwABckEDACEAKgABXUEDAOYAKgABXUEDAMYAKgABXUEDADYAKgABXUEDAIYAKgABXUEDAB8AKgABcUEDAKYAKgABXUEFAFYAKgBmACoAAl1BAwAGACoAAV1BAwD2ACoAAXFBAwBDACoAAV1BAwAQACoAAV1BAwBQACoAAXJBAwCIAC0AAXIAuAACL7gAEi+4ABkvugAYACcAAytBAwD/AAAAAXFBAwAlAAAAAV1BAwADAAAAAV1BAwDUAAEAAV1BAwAFAAEAAXFBAwCVAAEAAXFBAwC9AAEAAXFBBQAlAAEANQABAAJxQQMA5QABAAFdQQMApAABAAFxQQMA8wABAAFdQQMAjgACAAFxQQMAbwACAAFxQQMAfwACAAFdQQMAvwACAAFdQQMAnQACAAFdQQMAhgACAAFyQQMANgADAAFyQQMAjQADAAFxQQMAbgADAAFxQQMAFgADAAFyQQMARAADAAFyQQMABAADAAFyQQMA7wAYAAFdQQMAfwAYAAFdQQMA/wAYAAFxQQMAzwAYAAFdQQMAHwAYAAFdQQMAnwAYAAFxQQMATwAYAAFyuAAYELgAGtC5AAcAAvRBAwAFAAcAAV1BAwAoAAcAAXJBAwAcAAcAAXJBAwAJAAcAAXJBAwAnAAcAAV1BAwBVAAcAAV1BAwBDAAcAAXJBAwACABkAAXJBAwCUABkAAV1BAwDVABkAAV1BAwD2ABkAAV1BAwC3ABkAAV1BAwBKABkAAXFBAwCbABkAAXFBAwBHABkAAXJBAwD2ABkAAXFBAwAWABkAAXJBAwClABkAAV1BAwATABkAAXFBAwAyABkAAXFBAwAiABkAAXK4ABkQuQAIAAL0QQMANgAIAAFxQQMAmgAIAAFxQQMAbAAIAAFyQQMAPgAIAAFdQQMAvwAIAAFdQQMAXwAIAAFdQQcAfwAIAI8ACACfAAgAA11BBQAOAAgAHgAIAAJdQQMAjAAIAAFyQQMASgAIAAFxQQMAeAAIAAFyQQMAJQAIAAFyQQMAEwAIAAFxuAAYELkACQAC9EEDAAkACQABckEDACkACQABckEDABsACQABckEDAP4ACQABcUEDAIoACQABcUEDAJkACQABcUEDAEgACQABcUEDAAcACQABXUEDAE8AJwABckEDAP8AJwABcUEDAJ8AJwABcUEDAIMAJwABcrgAJxC5AA4AAvRBAwDwAA4AAV1BCQAAAA4AEAAOACAADgAwAA4ABHFBAwDUAA4AAXJBBQC1AA4AxQAOAAJdQQMA0AAOAAFdQQsAUAAOAGAADgBwAA4AgAAOAJAADgAFckEFALAADgDAAA4AAnK4AAzQuAAML0EDAJYADAABcUEDAJYADwABXUEDABYADwABckEDACUADwABckEDAFIADwABcUEDAF0AEQABcUEDAI8AEQABcUEDAG4AEQABcUEDAEsAEQABcUEDAKsAEQABcUEDAI8AEgABcUEDAL8AEgABXUEDAH8AEgABXUEDAJ8AEgABXUEDAG8AEgABcUEDAI4AFAABcUEDAG8AFAABcUEDAE4AFAABcUEDAFsAFAABcUEDAJwAFgABcUEDALsAFgABcUEDAEQAFwABckEDAEUAGwABckEDAMYAHAABXbgAEhC5AC0AAvRBAwCcAC0AAV1BAwB/AC0AAV1BAwASAC0AAV1BAwCCAC0AAXK4AB/QuAAfL0EFAMYAHwDWAB8AAnFBAwCMAB8AAXJBAwCGAB8AAV1BAwCQAB8AAV1BAwBwAB8AAV1BAwD1ACEAAV1BAwBXACEAAXFBAwDWACEAAV1BAwCVACEAAXFBAwCkACEAAXFBAwC4ACMAAV1BAwCpACMAAXFBAwDaACMAAV1BAwCcACMAAXFBAwD/ACMAAXFBAwDsACMAAV1BAwCbACMAAV1BAwCKACMAAXJBAwDIACMAAXFBAwAlACMAAV1BAwA1ACMAAXEwMQFBAwB1AAIAAV1BAwB1AAMAAV1BAwD6AAcAAXFBAwD1AAgAAXFBAwC3AAgAAV1BAwCzAAkAAV1BAwATAA4AAV1BAwDHAA4AAV1BAwBgAA8AAV1BAwAQAA8AAXFBAwAQABAAAV1BAwBgABAAAV1BAwAQABAAAXFBAwBgABEAAV1BAwCgABEAAV1BAwAQABEAAXFBAwCxABEAAV1BAwC0ABgAAV1BAwD2ABgAAXFBAwClABkAAV1BAwC2ABkAAV1BAwD5ABkAAXFBAwD5ABoAAXFBAwD2AB8AAXEAQQMA+AAHAAFxQQMA9QAIAAFxQQMAtgAIAAFdQQMAwwAOAAFdQQMAxAAPAAFdQQMAvAARAAFdQQMA+QAZAAFxQQMA2wAtAAFdAwYjNTY1NCcHJw4BBzYzFhUUIyImNTQ2Mxc3HgEVFAc2NzY1BzQmIyIGFRQWMzI2CAWRKSIeHQkcAw4ENjUbHTIhGBgfJBYXFBqkDgoKDw8KCg4CbpwXFC8kCSAhARUKAgMzMyYcJT0gIAEpHyUZAhwlO2gLDg4LCw0NAAH/awHcAAECZwALAZu7AAIABQADAAQrQQMA/wAAAAFdQQUADwAAAB8AAAACcUEDABcABgABcUEDAAYABgABcUEDAPQABgABXbgAAxC4AAfQuAACELgACdAAuAAIL7gAAi+7AAsAAgAAAAQrQQMAUAACAAFdQQMAkAACAAFdQQMAAAACAAFxQQMAQAACAAFxQQMAsAACAAFyQQMALwACAAFyQQMArwACAAFyQQMAbwACAAFyQQMA3wACAAFdQQMAYAACAAFxQQMAIAACAAFxQQMAsAACAAFdQQMAcAACAAFdQQMAMAACAAFdQQUAAAACABAAAgACXbgAABC4AATQuAALELgABtBBAwAQAAgAAXJBAwDfAAgAAXJBCQAfAAgALwAIAD8ACABPAAgABF1BAwD/AAgAAXJBAwA/AAgAAXFBAwCPAAgAAXFBAwCPAAgAAXJBAwA/AAgAAXJBAwBfAAgAAXFBAwD/AAgAAV1BBQAPAAgAHwAIAAJxQQMAbwAIAAFdQQMAjwAIAAFdQQMAkAAIAAFyQQMA8AAIAAFxQQMAcAAIAAFyMDETIxUjNSM1MzUzFTMBOSQ5OSQ5AhQ4OB41NQAAAv9FAdf/9AKSABQAIAgAuwAbAAYADwAEK0EDAJgAAAABXUEDAPoAAAABckEDAEsAAAABckEHAG8AAAB/AAAAjwAAAANdQQMAXwAAAAFyQQMAfwAAAAFyQQ0ArwAAAL8AAADPAAAA3wAAAO8AAAD/AAAABl1BHwAPAAAAHwAAAC8AAAA/AAAATwAAAF8AAABvAAAAfwAAAI8AAACfAAAArwAAAL8AAADPAAAA3wAAAO8AAAAPcUEDAG0AAAABckEDANoAAAABckEDALgAAAABckEDABcAAAABckEDAAQAAAABckEDADcAAgABckEDAPYAAgABcbgADxC4AAncQQkArwAJAL8ACQDPAAkA3wAJAARdQQMAfwAJAAFxQQsAXwAJAG8ACQB/AAkAjwAJAJ8ACQAFckEDAE4ACQABXUEDABAACQABcroABgAPAAkREjlBAwD3AAYAAV1BAwAHAAYAAXFBAwAIAAYAAXJBAwApAAYAAXJBAwCqAAYAAXFBAwDqAAYAAXFBAwB9AAYAAXJBBQDtAAYA/QAGAAJyQQUAXwAGAG8ABgACckEDAL8ABgABckEDAN4ABgABckEDAM0ABgABckEDAPwABgABcUEDAMoABgABcUEFADoABgBKAAYAAnJBAwDZAAYAAXFBAwAoAAYAAXFBBQBWAAYAZgAGAAJxQQMANgAGAAFxQQMAeAASAAFyQQMAWQAUAAFyQQMALAAUAAFyQQMAPQAUAAFyQQMA/wAUAAFdQR8ADwAUAB8AFAAvABQAPwAUAE8AFABfABQAbwAUAH8AFACPABQAnwAUAK8AFAC/ABQAzwAUAN8AFADvABQAD3FBAwBOABQAAXJBAwD9ABQAAXFBAwAZABQAAXJBAwAIABQAAXJBAwC0ABQAAXK5ABUABvRBAwABABUAAV1BAwAUABUAAV1BAwAlABUAAV1BAwAyABUAAV1BAwBBABUAAV1BAwCRABUAAV24AA8QuQAbAAb0QQMAJgAbAAFdQQsARgAbAFYAGwBmABsAdgAbAIYAGwAFXUEDABQAGwABXUEDAAIAGwABXQC4AAAvuAAML7sAGAABAB4ABCtBAwDsAAAAAV1BAwDdAAAAAV1BAwAPAAAAAXFBAwBfAAAAAV1BBQC8AAAAzAAAAAJdQQMAOQAAAAFxQQMAFwAAAAFyQQMASQACAAFyQQMAMgACAAFxQQMAUAAMAAFyQQMAkAAMAAFyQQMAnwAMAAFdQQMAcAAMAAFyQQcAcAAMAIAADACQAAwAA3FBAwCgAAwAAV26AAYADAAAERI5QQMAEwAGAAFyQQMAZQAGAAFxQQcAJgAGADYABgBGAAYAA3FBAwD2AAYAAXFBAwBHAAYAAV1BAwB3AAYAAXFBAwBHAAYAAXJBAwAXAAYAAXFBAwD2AAYAAV1BAwAGAAYAAXFBBQCWAAYApgAGAAJxQQMAxQAGAAFxQQMAVAAGAAFxQQMA4gAGAAFxQQMAAgAGAAFyQQMAFQAIAAFxQQMA1wAIAAFdQQMANgAIAAFxQQMAVAAIAAFxQQMAowAIAAFdQQMAuQAKAAFdQQMAGgAKAAFxQQMAqwAKAAFdQQMAzQAKAAFdQQMAbgAKAAFxQQMADwAKAAFxQQMA7gAKAAFdQQMALgAKAAFxQQMATQAKAAFxQQMA2wAKAAFdQQMA+gAKAAFdQQMAWQAKAAFxQQMAOQAKAAFxQQMA2gAOAAFdQQMAOgAOAAFxQQMAzAAOAAFdQQMA7QAOAAFdQQMADgAOAAFxQQMATgAOAAFxQQMALQAOAAFxQQMAbQAOAAFxQQMAGwAOAAFxQQMA+gAOAAFdQQUAqgAOALoADgACXUEDAFoADgABcUEFAAAAEAAQABAAAnJBAwDAABAAAXFBBQCiABAAsgAQAAJxQQMAQwAQAAFyQQMApQAQAAFdQQMA1gAQAAFdQQUAWQAQAGkAEAACckEDAJsAEAABckEDAOwAEAABckEDAKoAEAABckEDALcAEAABXUEDAFUAEAABcUEDAIMAEAABcUEDANIAEAABcUEDAPIAEAABcUEDAOAAEAABcUEDAJAAEAABcUEDAHAAEAABcUEDAOAAEQABcUEDADQAEQABckEDAKkAEQABXUEDAIsAEQABckEDADwAEQABXUEDAJoAEQABXUEDAGkAEQABXUEDACIAEQABckEDAJAAEQABcUEDAAAAEQABckEDADUAEgABcUEDAHwAEgABckEDAHwAEgABXUEDAJoAEgABXUEDAHUAEgABcUEDAGQAEgABcUEDAAQAGAABXUEFAL8AGADPABgAAnFBAwA/ABgAAXJBAwDwABgAAXJBAwAQABgAAV24AAwQuQAeAAL0QQcALwAeAD8AHgBPAB4AA11BAwCfAB4AAV1BAwALAB4AAV1BAwDwAB4AAXIwMQFBAwBJAAAAAXFBAwBpAAAAAXFBAwA6AAAAAXFBAwCKAAAAAXFBAwCqAAAAAXFBBQDaAAAA6gAAAAJxQQMAGwAAAAFxQQMAuwAAAAFxQQMAzAAAAAFxQQMAzwAAAAFdQQMASgASAAFxQQMAaAAUAAFxQQMAmQAUAAFxQQMAGgAUAAFxQQMASgAUAAFxQQMAigAUAAFxQQUAqgAUALoAFAACcUEDADsAFAABcUEDANsAFAABcUEDAOwAFAABcUEDAM0AFAABcUEDAM8AFAABXQBBAwDlABAAAXFBAwAFABAAAXJBAwCWABAAAXFBAwA2ABIAAXEDBgcGBwYHHgEVFAYjIiY1ND8BNjUHNCYjIgYVFBYzMjYMAx4RHx0HFh0fFxcgRy8ZPBALCxAQCwsQApIiDwkHBQgCHxYXHx8XRhMOCRWGCxAQCwsQEAAAAAIAHv/3Ac8BkAALADkE/rsAHAAFACcABCu7ACEABgAAAAQruwAzAAUAEAAEK7sADAAFADcABCtBAwBQAAAAAXJBBQCQAAAAoAAAAAJyQQMAoAAAAAFxQQMAkAAAAAFduAAcELgABtC4AAYvQQMA4wANAAFxQQMA8gANAAFxQQMA0AANAAFxQQMA7wAPAAFxQQMA3AAPAAFxQQMA+wAPAAFxQQMACwASAAFyQQMA2QASAAFxQQMAJgAUAAFyQQMABgAUAAFyugAWACcAHBESOUEDADUAFgABckEDAPUAFgABcUEDAAUAFgABckEDAIkAFgABckEDALkAFgABXUEDAF4AFgABckEDAHoAFgABckEDAHkAFgABXUEFABYAFgAmABYAAnJBAwDVABYAAXFBAwBEABYAAXJBAwDkABYAAXG6ABgAJwAMERI5QQMAewAYAAFdQQMAWwAYAAFyQQMAqQAYAAFdQQMAuAAYAAFdQQMAoAAhAAFxQQMAkAAhAAFdQQUAkAAhAKAAIQACckEDAFAAIQABckEDAKYAIwABXUEFALUAIwDFACMAAl1BAwDSACMAAV1BAwDbACUAAV1BBwCqACUAugAlAMoAJQADXboAKgAnAAwREjlBAwBlACoAAXJBAwCpACoAAV1BAwCaACoAAXJBAwDaACoAAXFBAwB4ACoAAV1BAwCEACoAAXJBAwCjACoAAXJBAwBqACwAAXJBAwCKACwAAXJBAwC4ACwAAV1BAwCTAC4AAXJBAwCaADAAAXK4AAwQuAA73AC4AABFWLgAOC8buQA4ABA+WbgAAEVYuAAvLxu5AC8AED5ZuAAARVi4AA4vG7kADgAKPlm4AABFWLgAJC8buQAkAAo+WbsAHgABAAMABCu4ACQQuQAJAAH0QQMAvAAMAAFdQQMA/QAMAAFxQQMAHgAMAAFyQQMA3wAMAAFxQQMA7gAMAAFxQQMAfgAMAAFdQQMAnQAMAAFdQQMAjAAMAAFdQQMAqwAMAAFdQQcA0AAOAOAADgDwAA4AA3JBAwD9ABAAAXFBAwDuABAAAXFBAwDfABAAAXFBAwAeABAAAXJBAwB9ABAAAV1BCQCMABAAnAAQAKwAEAC8ABAABF1BBQDKABAA2gAQAAJdQQMAzAASAAFdQQMA2AASAAFduAAvELkAEwAB9LoAFgAkAC8REjlBAwC7ABYAAV1BAwB4ABYAAXJBAwBFABYAAXJBBQBaABcAagAXAAJyQQMARAAXAAFyQQMA4QAXAAFxugAYACQALxESOUEDALoAGAABXUEDAHsAGAABckEDAKkAGAABXUEDAHQAGAABXUEFAC8AGwA/ABsAAnK6ABwAAwAeERI5QQMApgAgAAFdQQcAtQAgAMUAIADVACAAA11BAwCrACIAAV1BBQC6ACIAygAiAAJdQQMA2QAiAAFdQQUAqgAmALoAJgACXUEDAOMAKAABcUEDANAAKAABcboAKgAkAC8REjlBAwDnACoAAXFBAwC6ACoAAV1BAwCpACoAAV1BAwB1ACoAAV1BAwBlACoAAXK6ACwAJAAvERI5QQMAygAsAAFdQQMAvAAsAAFdQQMAqwAsAAFdQQMAlgAsAAFyQQMAdAAyAAFdQQMA4wAyAAFxuAAJELgANdC4AA4QuQA1AAH0MDEBQQMAKAAqAAFyQQMAOQAqAAFyAEEDAEUAFwABckEDADkAKgABckEDACoAKgABcjc0JiMiBhUUFjMyNiUUIyI9ATQjIgYHFhcOAR0BNjMyFhUUBiMiJj0BNDcmBz4BMzIWHQEUMzI1ETOdFA4OExMODhQBMmJhYSA3CzgYGCQNERwmHyMdJTQmKQlPNz5FPj0kOQ4UFA4OExMnWlu2ZyYfBCgFKhpBBiYbGyglH3o2GQ8EOElEP704OAE4AAAAAv6qAc//xgJqABQAIATluwAbAAYABgAEK7sADAAGABUABCtBAwCvABUAAXFBAwAMABUAAV24ABUQuAAA3EEFAB8AAAAvAAAAAl1BBQBfAAAAbwAAAAJdQQMAJwAAAAFyQQMApwAAAAFxQQMAwwACAAFxQQUAdgACAIYAAgACcUEDAPMAAgABcUEDALIAAgABcUEDANAAAgABXUEDAGoAAwABXUEDAN0ABAABcUEDAB0ABAABckEDAK8ABAABcUEDAO8ABAABcUEDAC4ABAABckEDAP0ABAABcUEFALwABADMAAQAAnFBAwBzAAQAAXJBAwCfAAYAAXFBAwDfAAYAAXJBAwAvAAYAAXJBAwCwAAYAAXFBAwAgAAYAAXFBBQCqAAgAugAIAAJdQQMAzAAIAAFdQQMA6wAIAAFdQQMA+gAIAAFdQQMA2AAIAAFdQQMA5QAKAAFdQQUApgAKALYACgACXUEDAMUACgABXUEDANQACgABXUEDAPYADAABcUEHALYADADGAAwA1gAMAANxQQMArwAMAAFxQQ0ApgAMALYADADGAAwA1gAMAOYADAD2AAwABl1BFQAGAAwAFgAMACYADAA2AAwARgAMAFYADABmAAwAdgAMAIYADACWAAwACnFBDQAWAAwAJgAMADYADABGAAwAVgAMAGYADAAGXUEFAHAADACAAAwAAl26AA4AFQAMERI5QQUAMAAOAEAADgACckEDALkAEgABXUEDAMoAEgABXUEDAN4AEgABcUEDAK8AEgABcUEDAF8AEgABcUEFAB8AEgAvABIAAnJBAwBtABIAAV1BAwBpABIAAXFBAwCpABIAAXJBAwCoABIAAV1BAwC6ABQAAXFBAwDcABQAAXFBAwBcABQAAV1BAwDvABQAAXFBBwAPABQAHwAUAC8AFAADckEDAK8AFAABcUEDAP4AFAABcUEDAEwAFAABckEDAMsAFAABcUEDADoAFAABckEDAIYAFAABXUEDAAQAGwABXUEDAMYAGwABcUEDAN8AGwABckEDAC8AGwABckEDAI8AGwABXUEDAJ8AGwABcUEJABYAGwAmABsANgAbAEYAGwAEXUEDACAAGwABcUEDALAAGwABcQC4AAAvuAAJL7sAHgABAAMABCtBAwAgAAAAAXJBAwBvAAAAAV1BAwC/AAAAAXFBAwDfAAAAAXFBAwAPAAAAAXFBAwDQAAAAAV1BAwBwAAAAAXFBAwBQAAAAAXFBAwCdAAEAAXFBAwCOAAEAAXFBAwB7AAEAAXFBAwD5AAEAAXFBBQA/AAMATwADAAJyQQMAwAADAAFyQQMAsAADAAFxQQMAxgAHAAFdQQMAtQAHAAFdQQMAbwAJAAFdQQMADwAJAAFxQQMA3wAJAAFxQQMAfwAJAAFyQQUArwAJAL8ACQACcUEDAI8ACQABXUEDANAACQABXUEDAHAACQABcUEDAG8AHgABckEDAJ8AHgABXUEDAK8AHgABcboADgADAB4REjm4AAMQuQAQAAH0QQMAVwAQAAFdQQMANAAQAAFyQQMA5wASAAFdQQMAVgASAAFdQQMA1gASAAFduAAJELgAFNC4ABQvQQMArwAUAAFyQQMA/wAUAAFyuAAJELkAGAAC9EEDAFAAGAABXUEFAHAAGACAABgAAl0wMQFBAwCjAAIAAXFBAwCpABQAAXEDDgEjIiY1NDYzMhYVFAcWMzY3NjcHNCYjIgYVFBYzMjY6AVhDOkYmGhomHg4XMSAcApYTDQ0UFA0NEwJqRFcwJxomJRoiFAMBJiMyQg4TEw4OEhIAAAAAAv7RAc7/agJnAAsAFwLeuAAYL7gAGS+4AADcQQMA/wAAAAFdQQUAnwAAAK8AAAACckEFAF8AAABvAAAAAnJBBQCPAAAAnwAAAAJdQQMAHwAAAAFdQQUApAACALQAAgACXUEDAJcAAgABXUEDAHUAAgABXUEDAIQAAgABXUEDAMMAAgABXUEDALsABAABXUEDAIwABAABXUEDAJ8ABAABXUEDAMwABAABXUEDAKoABAABXUEDAHoABAABXbgAGBC4AAbQuAAGL0EDAG8ABgABXUEFAH8ABgCPAAYAAnFBBwDfAAYA7wAGAP8ABgADcUEFAK8ABgC/AAYAAnFBAwBPAAYAAXFBAwBPAAYAAXJBBQAfAAYALwAGAAJyQQMAzAAIAAFdQQMAnwAIAAFdQQMAjAAIAAFdQQUAqgAIALoACAACXUEDAHoACAABXUEDAIUACgABXUEDAJYACgABXUEHAKQACgC0AAoAxAAKAANdQQMAdAAKAAFduAAAELkADAAG9EEHACkADAA5AAwASQAMAANdQQUAOgAMAEoADAACckEFAAkADAAZAAwAAnJBAwAoAAwAAXJBAwAIAA8AAXK4AAYQuQASAAb0QQMAFgASAAFyQQcAJgASADYAEgBGABIAA11BAwBvABIAAV1BAwAnABIAAXJBAwBGABIAAXJBAwA1ABIAAXJBAwAFABIAAXIAuwAVAAEAAwAEK7sACQABAA8ABCtBAwBAAAkAAXFBAwDAAAkAAXFBAwDvAAkAAV1BAwDgAAkAAXFBBwBgAAkAcAAJAIAACQADcUEDACAACQABcUEDAFAACQABXUEDAEAADwABcUEDAMAADwABcUEDAEgADwABckEDAO8ADwABXUEHAAkADwAZAA8AKQAPAANyQQMA4AAPAAFxQQcAYAAPAHAADwCAAA8AA3FBAwAgAA8AAXFBAwBQAA8AAV1BBQAHABUAFwAVAAJyQQMARwAVAAFyQQMAJgAVAAFyMDEDFAYjIiY1NDYzMhYHNCYjIgYVFBYzMjaWLCAgLS0gICwhGhESGhoSERoCGiAsLCAgLS0gEhoaEhIZGQAAAAAC/o0BzP97ArAAIgAuCYO7ABUABgAJAAQrugAPAB0AAyu4AA8QuAAA0LgAAC9BAwCAAAAAAXJBAwBGAAIAAXFBAwAGAAQAAXJBAwDVAAQAAV1BAwDLAAUAAV1BAwCtAAUAAV1BAwAaAAUAAXJBAwC5AAUAAV1BAwDpAAcAAV1BAwD6AAcAAV1BBQAIAAcAGAAHAAJxQQMAZAAHAAFyQQMA0QAJAAFdQQMAfwAJAAFxQQUAjwAJAJ8ACQACXUEDADAACQABcUEDAAAACQABcUEDAKwACgABXUEDAJ8ACgABXUEDAIwACgABXUEDAMoACgABXUEHAI8ACwCfAAsArwALAANdQQMAvQALAAFdQQMAzAALAAFdQQMAygAMAAFxQQMAjwAMAAFxQQMAvAAMAAFxQQMAqgAMAAFxQQMAmQAMAAFxQQMAuQANAAFxuAAPELkADgAG9EEDAHkADgABcUEDAKkAEAABckEDAJYAEQABXUEDAHUAEgABXUEDAIQAEgABXUEDANAAFQABXUELAIYAFQCWABUApgAVALYAFQDGABUABXFBEQAGABUAFgAVACYAFQA2ABUARgAVAFYAFQBmABUAdgAVAAhdQQMAxgAVAAFdQQUAFgAVACYAFQACcUEFAI8AFQCfABUAAl1BAwB/ABUAAXFBBQDmABUA9gAVAAJxQQcABgAVABYAFQAmABUAA3JBBwBGABUAVgAVAGYAFQADcUEDAKYAFQABXUEFAOYAFQD2ABUAAl1BBQA1ABUARQAVAAJyQQMAMAAVAAFxQQMAAAAVAAFxuAAJELgAKdxBAwBAACkAAXJBAwDZACkAAV1BAwB6ACkAAV1BAwDLACkAAV1BAwDOACkAAXFBAwC/ACkAAV1BAwDfACkAAXFBAwCtACkAAV1BAwD6ACkAAV1BAwAKACkAAXFBAwCaACkAAV1BAwDgACkAAXFBAwCwACkAAXJBAwAQACkAAXK6ABcACQApERI5QQMARgAXAAFyQQMAxwAXAAFxQQMAuAAXAAFyQQMACQAXAAFxQQMAiQAXAAFdQQMAFwAXAAFyQQMA9gAXAAFxQQMABQAXAAFyQQUAJQAXADUAFwACckEDAB0AGAABckEDAKkAGAABckEDAKcAGQABckEDAOsAGQABcUEDAK0AGQABXUEDAMkAGQABXUEDAAcAGQABckEDANYAGQABcUENAH8AHQCPAB0AnwAdAK8AHQC/AB0AzwAdAAZdQQMA3wAdAAFxQQMArgAdAAFyugAbAB0ADxESOUEDANwAGwABcUEDAKoAGwABckEDANsAHwABcUEDAGwAHwABcUEDACwAHwABcUEDAI8AHwABcUEDAH0AHwABcUEFAKwAHwC8AB8AAnFBAwBbAB8AAXFBBQA6AB8ASgAfAAJxQQMAmQAfAAFxQQUAcwAhAIMAIQACcUEFAKQAIQC0ACEAAnFBAwAmACEAAXFBAwDVACEAAXFBBwBEACEAVAAhAGQAIQADcUEDADIAIQABcUEDAJIAIQABcUEDAJQAIwABcUEFAKUAIwC1ACMAAnFBAwBFACMAAXFBAwBWACMAAXFBAwCnACMAAXJBAwB3ACMAAV1BAwCIACMAAXFBAwCZACMAAXJBAwC6ACMAAXJBAwB9ACMAAXJBAwDtACMAAXJBBQDLACMA2wAjAAJyQQMA6QAjAAFxQQMA+AAjAAFyQQUAZwAjAHcAIwACcUEDANcAIwABcUEDAJYAIwABXUEDAMYAIwABcUEHAKUAIwC1ACMAxQAjAANdQQMA9AAjAAFdQQMAMwAjAAFxQQMAAAAjAAFxQQMAtwAsAAFyALgADi+4AAMvuAAHL7oADAAmAAMrQQMAqgABAAFxQQMASgABAAFxQQMAWwABAAFxQQMAuwABAAFxQQMAfAABAAFxQQMA3AABAAFxQQUAiwABAJsAAQACcUEDADsAAQABcUEDAMoAAQABcUEDAGoAAQABcUEDACkAAQABcUEDACIABAABcUEDAMkABQABcUEDABkABQABckEDAMkABQABXUEDAGoABQABckEDADsABQABckEDAKsABQABXUEDANsABQABcUEDAAoABQABckEDAEkABQABckEDAPkABQABcUEDALgABQABXUEDAKcABQABckEDAN0ABwABcUEDAKwABwABckEDABYABwABckEDAHUACAABckEDAJcACgABXUEDAG8ADAABXUEDAO8ADAABXUEDAD8ADAABcUEDAA8ADAABcUEDAI8ADAABXUEDAD8ADAABXUEDAAEADAABXUEDAA8ADgABcUEDAG8ADgABXUEDAD8ADgABcUEFAM8ADgDfAA4AAl1BAwA+AA4AAV1BBQClABAAtQAQAAJxQQMAhQAQAAFxQQMAoAAQAAFyuAAMELkAEgAC9LgAAxC4ACDcQQMAEAAgAAFxQQMAYAAgAAFyQQUAwAAgANAAIAACcUEDAIAAIAABckEDAKAAIAABcroAFwADACAREjlBBQDlABcA9QAXAAJxQQUABQAXABUAFwACckEDACYAFwABckEDAMcAFwABcUEDANYAFwABcUEDAEUAFwABckEDALQAFwABckEDADMAFwABckEDADgAGQABckEDAOkAGQABcUEDAKoAGQABckEDAGsAGQABckEDANsAGQABcUEDAMwAGQABXUEDAKsAGQABXUEDAIsAGQABckEDAMkAGQABcUEDAFkAGQABckEDALgAGQABXUEDABcAGQABcroAGwADACAREjlBAwBDABsAAXJBAwCkABsAAXJBAwA1ABsAAXFBAwDWABsAAV1BAwB2ABsAAXFBAwAmABsAAXFBAwDGABsAAXFBBQClABsAtQAbAAJxQQUAVQAbAGUAGwACcUEDAEQAGwABcUEDAAMAGwABckEDANEAGwABcUEDAMUAHgABcUEDAMAAHwABcUEDAGMAIgABcUEDAJQAIgABcUEDALUAIgABcUEDACYAIgABcUEHADUAIgBFACIAVQAiAANxQQMAgwAiAAFxQQMAoQAiAAFxQQMAwQAiAAFxQQMAEAAmAAFyQQMAUAAmAAFdQQMA0AAmAAFdQQUAEAAmACAAJgACcUEDAPAAJgABXUEDAHAAJgABXUEDAMAAJgABcUEDAEAAJgABcUEDAKAAJgABcbgAAxC5ACwAAvRBAwBSACwAAXJBFQBgACwAcAAsAIAALACQACwAoAAsALAALADAACwA0AAsAOAALADwACwACnIwMUEDADkABQABcgMUBiMiJwYHJjU0OwEyNzMUBisBIhUUFzY3FhcmNTQ2MzIWBzQmIyIGFRQWMzI2hR8UKjYbGChVQjEDIiwrRTALGRoRIAEbFBQcGg0JCQ0NCQkNAf8WHCsJIxk1TkgrOi4WERwEDxUIBRQbHBMJDQ0JCQ0NAAAB/1UCqP92AxcAAwBSuwAAAAYAAQAEKwC4AAIvuAAAL0EDAH8AAgABcUEHAD8AAgBPAAIAXwACAANdQQUADwACAB8AAgACckEFAN8AAgDvAAIAAl1BAwCPAAIAAV0wMQMjNTOKISECqG8AAAAC/t0Cpf/BA0QAFQAhCr9BAwC5AAAAAXFBAwA7AAAAAV1BAwAbAAAAAV1BAwAPAAAAAV1BBQBvAAAAfwAAAAJxQQMALQAAAAFdQQMACwAAAAFxQQMA2QAAAAFdQQMA2AAAAAFyQQMAlwAAAAFxQQMAWgABAAFyQQMAigACAAFyQQMAuQACAAFxQQMAVAACAAFxQQMAngADAAFyQQMAiQADAAFyQQMAyQADAAFyQQMA+AAGAAFyQQMAwgAGAAFdQQMAxwAIAAFdQQMAOAAIAAFxQQMAmgAIAAFxQQMAOgAIAAFyQQMAagAIAAFxQQUAqAAIALgACAACcUEFANYACADmAAgAAnJBBQB0AAgAhAAIAAJyQQMAZwAKAAFxQQMAcAALAAFyQQMAkAALAAFdQQMAAgALAAFdQQMAggALAAFyQQMA4wALAAFxQQMAdAALAAFxQQMAlAALAAFyQQMARAALAAFxQQMAlQALAAFxQQMA9gALAAFdQQMA1gALAAFyQQMAJwALAAFdQQMA5wALAAFyQQMAKgALAAFyQQMACgALAAFxQQUAOAALAEgACwACckEDALcACwABXUEDABYACwABXUEDAKYACwABckEDAGUACwABckEDAKUACwABXUEDAPQACwABckEDALQACwABcUEDANMACwABXUEDAMIACwABckEDAFIACwABckEDAMEACwABXUEDALAACwABckEDAKAACwABcUEDAFAACwABcUEDAKoADQABXUEDAGsADQABcUEDAAwADQABcUEDALsADQABXUEDAPoADQABXUEFAMkADQDZAA0AAl1BAwDEAA8AAV1BAwCmAA8AAV1BAwB3AA8AAXFBAwC2AA8AAXFBAwDTAA8AAV1BAwDzAA8AAV1BAwCnABAAAV1BAwCVABEAAV1BAwBGABEAAV1BAwCoABEAAXFBBwC5ABEAyQARANkAEQADckEDAEoAEQABckEDANoAEQABXUEFAOsAEQD7ABEAAnJBAwD8ABEAAV1BAwCcABEAAXFBAwBdABEAAXJBAwBuABEAAXJBAwCsABEAAXJBAwBsABEAAXFBBQCrABEAuwARAAJdQQUAiwARAJsAEQACckEDAHoAEQABckEDAAoAEQABcUEDAHkAEQABcUEDABcAEQABcUEDAMYAEQABXUEDAPQAEQABcUEDADMAEQABckEDANIAEgABXUEDANYAEwABXUEDALcAEwABcUEDANcAEwABckEDAJkAEwABckEDAFsAEwABckEDAI4AEwABckEDAHkAEwABckEDAGgAEwABcUEDAEcAEwABckEDABcAEwABcUEDAKUAEwABcUEDAFQAEwABcUEDALwAFAABcUEDAFcAFAABcUEDANcAFQABckEDAKgAFQABcUEDALwAFQABcUEFAG8AFQB/ABUAAnFBAwBZABUAAXFBAwBXABUAAXJBBQCHABUAlwAVAAJyQQMAxgAVAAFyQQMA5QAWAAFxQQMAFQAWAAFxQQMApgAWAAFxQQMA1gAWAAFyQQMA5wAWAAFyQQUAeAAWAIgAFgACcUEDACoAFgABckEDAAsAFgABcUEDAE4AFgABckEDAG4AFgABcUEDAJoAFgABcUEDALkAFgABXUEFACcAFgA3ABYAAnFBAwCHABYAAXJBAwA2ABYAAXJBAwCGABYAAV1BAwDFABYAAXJBBQBEABYAVAAWAAJxQQMAswAWAAFyQQMAowAcAAFxQQMAtAAcAAFxQQMARgAcAAFxQQMA9gAcAAFxQQMAdgAcAAFyQQMAlwAcAAFxQQMAiAAcAAFyQQMAKAAcAAFxQQMA2QAcAAFyQQMAOgAcAAFxQQMA6wAcAAFyQQMAjQAcAAFdQQMADAAcAAFxQQMAagAcAAFyQQMA+QAcAAFdQQMAaQAcAAFxQQMAyAAcAAFyQQMAFwAcAAFxQQMAtgAcAAFyQQUANgAcAEYAHAACckEDAIYAHAABcUEDAMQAHAABXUEDAHQAHAABcUEDAOIAHAABcUEDAFAAHAABcQC6AB8ABAADK7sADgACABkABCtBAwCTAAMAAXJBAwB2AAQAAXJBAwBVAAQAAXJBAwD5AAYAAXJBBwAvAB8APwAfAE8AHwADcUEDAL8AHwABckEDADcAHwABcrgAHxC5AAgAAvRBBwC5AAgAyQAIANkACAADXUEDALkACAABckEDAJwACAABXUEDAPsACAABXUEDACkACAABcUEDADgACAABcUEDAAgACAABcUEDAKsACQABXUEDAG4ACgABcUEDAE4ACgABcUEDAGcACwABcUEDAEcADAABcUEDAPQADAABXUEDACcADgABcUEHAI8ADgCfAA4ArwAOAANdQQcAXwAOAG8ADgB/AA4AA3FBAwB/AA4AAXJBBQCfAA4ArwAOAAJxQQMA7wAOAAFdQQMATgAOAAFxQQMANgAOAAFxQQMAIAAOAAFdQQMAywASAAFxQQMAXwASAAFxQQMAfwASAAFxQQMArwASAAFdQQMA+gASAAFxQQMAugASAAFxugATAAQAHxESOUEDANgAEwABckEDALgAEwABcUEDAFkAEwABckEDAPoAEwABXUEDAHsAEwABckEDAIoAEwABckEDABgAEwABcUEDANgAEwABXUEDAKcAEwABcUEDAEcAEwABckEDAHYAFAABckEDAEkAGQABckEFAJ8AGQCvABkAAnFBAwDvABkAAV1BCQBPABkAXwAZAG8AGQB/ABkABHFBAwCvABkAAV1BAwB/ABkAAXJBBQBgABkAcAAZAAJdQQMAIAAZAAFdMDEBQQMANAAAAAFyQQMABQAAAAFyQQUAFgAAACYAAAACckEDANcAAAABcUEDAHkAAAABcUEDAEoAAAABcUEDAKoAAAABcUEDAMoAAAABcUEDAOwAAAABXUEDAMoAAQABcUEDAGMABQABXUEDAGIABgABXUEDANkACAABcUEDAPsACAABcUEDAHsACwABXUEDAI4ACwABXUEDAGIADAABXUEDAHcADAABXUEDAIwADAABXUEDAGAADQABXUEDAIAADQABXUEDAHEADQABXUEDABYADwABcUEDACYAEQABckEDAHcAEQABcUEDABIAEgABckEDAEMAEwABckEDACQAEwABckEDAHUAEwABcUEFAAUAEwAVABMAAnJBAwAWABMAAXFBAwDZABQAAXFBAwCqABQAAXFBAwBKABQAAXJBAwAbABQAAXJBAwA8ABQAAXJBAwDNABQAAXFBBQDvABQA/wAUAAJxQQMADwAUAAFyQQMALwAUAAFyQQMAOAAVAAFyQQUACQAVABkAFQACckEDAEoAFQABcUEFAHoAFQCKABUAAnFBAwAqABUAAXJBAwDrABUAAV1BAwCrABUAAXFBBwDbABUA6wAVAPsAFQADcUEDAEsAFQABckEDAM0AFQABcQBBAwAGAAEAAXJBAwCqAAEAAXFBAwAaAAEAAXJBAwAZAAIAAXJBAwA5AAoAAXFBAwAaAAoAAXJBAwBqAAsAAV1BAwClAA8AAXFBAwAFABAAAXJBAwAWABAAAXFBAwBKABIAAXJBAwDuABIAAXFBAwAuABIAAXJBAwAPABIAAXJBAwAWABMAAXJBAwB5ABMAAXFBAwAhABQAAXJBAwATABQAAXJBAwAzABQAAXJBAwBEABQAAXIDBgcGKwE1NjciJjU0NjMyFhcUBzY3BzQmIyIGFRQWMzI2Pw48MFUSIQ4UHh4VFBwCLXcQdg0KCg4OCgoNAzpWIxwTDhkdFRUeHBcyIApxKQoODgoKDQ0AAAAC/qICo/+tA0EACwAzD6O7AAYABgAlAAQruwAtAAYAEQAEK0EJAMAAAADQAAAA4AAAAPAAAAAEXUEJAAAAAAAQAAAAIAAAADAAAAAEcUEDAIEAAAABcUEDAJIAAAABcUEDAEIAAAABXUEDAIQAAAABXUEDAGQAAAABcUEDAOUAAAABcUEDAHYAAAABcUEDANYAAAABckEDALgAAAABckEDANkAAAABcUEDAIkAAAABckEDAAkAAAABckEDAMgAAAABcUEFABYAAAAmAAAAAl1BAwC2AAAAAXFBAwClAAAAAXFBAwDEAAAAAXJBAwC0AAAAAV1BAwADAAAAAV1BAwBCAAAAAXJBBQBCAAAAUgAAAAJxQQMAMAAAAAFdQQUAkAAAAKAAAAACXUEFAGAAAABwAAAAAl1BAwBWAAYAAV1BAwCmAAYAAV1BAwAHAAYAAV1BAwBJAAYAAXFBAwA6AAYAAXFBAwAsAAYAAXFBAwD7AAYAAV1BAwAJAAYAAXFBAwB4AAYAAXFBBQDWAAYA5gAGAAJdQQMAhgAGAAFdQQUAJgAGADYABgACXUEDAHUABgABXUEDAEgAEQABckENAAkAEQAZABEAKQARADkAEQBJABEAWQARAAZdQRsAOQARAEkAEQBZABEAaQARAHkAEQCJABEAmQARAKkAEQC5ABEAyQARANkAEQDpABEA+QARAA1xQQcACQARABkAEQApABEAA3JBAwA/ABEAAXJBBwB5ABEAiQARAJkAEQADXUELALkAEQDJABEA2QARAOkAEQD5ABEABV1BBQAJABEAGQARAAJxQQMAqAARAAFdQQMAIAARAAFxuAARELgADNxBAwA5AAwAAV1BAwArAAwAAV1BAwAcAAwAAV1BAwCNAAwAAV1BBQDOAAwA3gAMAAJdQQMA7wAMAAFdQQMAfwAMAAFdQQMATwAMAAFdQQUAngAMAK4ADAACXUEDAL0ADAABXUEDAFsADAABXUEDAAsADAABXUEDACgADAABckEDADIADAABckEDAAgADQABckEDAEkADQABcUEFAJkADQCpAA0AAnJBAwCLAA0AAXJBAwDMAA0AAXFBAwDuAA0AAXFBAwDNAA0AAXJBAwC7AA0AAXJBAwAaAA0AAXJBAwApAA0AAXJBAwBpAA0AAXJBAwAoAA0AAXFBAwBYAA0AAXJBAwD8AA4AAV1BAwDvAA4AAV1BAwANAA4AAXFBBQCpAA4AuQAOAAJdQQMARwAOAAFyQQMAzwATAAFyQQMAPgATAAFyQQMAZAATAAFyQQMAmAAUAAFxQQMA6QAUAAFdQQMAGQAUAAFxQQMAqQAUAAFxQQMAegAUAAFxQQMAOwAUAAFxQQMAzQAUAAFyQQMAzQAUAAFxQQMA3AAUAAFxQQMAOwAUAAFyQQMAugAUAAFxQQcASQAUAFkAFABpABQAA3FBAwDpABQAAXFBAwAoABQAAXJBAwDWABQAAXJBAwCTABQAAXJBAwBXABUAAXJBBQC5ABUAyQAVAAJxQQMAxgAVAAFyQQMAQAAVAAFyQQMA1QAXAAFyQQMAlQAZAAFxQQMA1QAZAAFdQQMAJgAZAAFyQQMAdwAZAAFxQQMAqAAZAAFxQQMAuAAZAAFyQQUAeQAZAIkAGQACXUEDALkAGQABXUEDANkAGQABckEDANgAGQABcUEDADcAGQABckEDAKcAGQABXUEDAGUAGQABcUEDAJUAGQABXUEDAFMAGQABcUEDAIIAGQABcUEDAJYAGgABXUEDADgAHAABcUEDAKMAHQABcUEDAGUAHQABcUEFAMYAHQDWAB0AAnFBAwC1AB0AAXFBAwDjAB0AAXFBAwCAAB0AAXFBAwBQAB0AAXG4ACUQuAAf3EEDAGAAHwABXUEFADAAHwBAAB8AAnFBAwARAB8AAXFBAwAjAB8AAXFBAwADAB8AAXFBAwCXAB8AAV1BAwC0AB8AAV1BAwCDAB8AAV1BAwByAB8AAV1BBQAwAB8AQAAfAAJyQQMA8AAfAAFdQQUAwAAfANAAHwACckEFAJAAHwCgAB8AAnFBAwCVACEAAXFBAwCaACMAAXFBAwC8ACcAAV1BAwDaACcAAXFBBQCYACcAqAAnAAJdQQMANgAoAAFyQQMAygAoAAFyQQMAuwAoAAFxQQMA2wAoAAFxQQMA6QAoAAFxQQMA1QAoAAFyQQMAQQAoAAFyugApACUAHxESOUEDABkAKQABcUEDADoAKQABckEDAMoAKQABcUEDAEoAKQABcUEDANsAKQABckEDANsAKQABXUEDALsAKQABcUEDAM8AKQABckEDAD8AKQABcUEDAOwAKQABcUEDAPsAKQABXUEDANsAKQABcUEDAEsAKQABckEDAOoAKQABXUEDAHoAKQABcUEHAIkAKQCZACkAqQApAANxQQUAWQApAGkAKQACcUEDAMgAKQABXUEDAM4AKgABckEDAN8AKgABcUEDAD8AKgABckEDANoAKgABckEDAEoAKgABckEDALQAKwABXUEDAEYAKwABckEDADcAKwABckEDAM8AKwABckEDAGsAKwABckEDAOYAKwABXUEDADUAKwABcUEDAKIAKwABXUEDAJEAKwABXUEDAKgALQABXUEDAD8ALQABckEDAGMALQABXUEDACAALQABcboALwARAC0REjlBAwBKAC8AAXFBAwBGAC8AAXJBBQAUAC8AJAAvAAJyQQMAKgAxAAFyQQcAuwAxAMsAMQDbADEAA3FBAwCfADEAAXFBAwD/ADEAAXFBAwDuADEAAXFBAwAbADEAAXJBAwCpADEAAXFBAwAIADEAAXJBBQA/ADMATwAzAAJyALgADi+4ACIvugAoAAMAAytBAwBnAAAAAV1BAwBAAAMAAXJBBwCwAAMAwAADANAAAwADckEFADIAAwBCAAMAAnFBAwCEAAMAAV1BBQAEAAMAFAADAAJxQQMARQADAAFdQQUA5QADAPUAAwACXUEDADYAAwABXUEDABgAAwABXUEDACcAAwABXUEDAJYAAwABXUEDAGUAAwABXUEDAAQAAwABXUEHAKQAAwC0AAMAxAADAANdQQMAcwADAAFdQQMAogADAAFyQQcAcAADAIAAAwCQAAMAA3JBAwCAAAMAAXFBAwAgAAMAAXFBAwCjAAkAAXJBAwC1AAkAAXJBAwCGAAkAAXFBAwCGAAkAAXJBAwDHAAkAAXJBBwAIAAkAGAAJACgACQADXUEDAJgACQABXUEDAJgACQABcUEDAGkACQABcUEDADoACQABXUEDAKoACQABcUEDAIsACQABXUEDADsACQABcUEDAEsACQABXUEDAM0ACQABXUEDAC0ACQABcUEDAA4ACQABcUEDAB8ACQABcUEDAE0ACQABcUEDAO0ACQABXUEDAPwACQABXUEDAHsACQABcUEDANsACQABXUEDANoACQABcUEDALoACQABXUEDAGkACQABXUEDAKkACQABXUEDAFgACQABcUEDAHgACQABXUEDAMcACQABcUEDAJcACQABckEDALYACQABcUEDAOUACQABcUEDAEQACQABckEDAHIACQABckEDANEACQABckEDAJgADAABXUEDAEkADAABckEDAMsADAABckEDAG4ADAABXUEDAF8ADAABXUEFAMwADADcAAwAAl1BAwAqAAwAAXJBAwC5AAwAAXJBAwA0AAwAAV1BAwAjAAwAAV1BAwD0AA0AAXFBAwAHAA0AAXJBAwCkAA0AAXJBAwDjAA0AAXFBAwBxAA0AAXJBAwBfAA4AAV1BAwBFAA8AAXJBAwDTAA8AAXJBAwDHABMAAXJBAwA7ABMAAXJBAwC3ABMAAV1BAwCiABMAAXJBBQCzABQAwwAUAAJyQQMANgAUAAFxQQMAxwAUAAFdQQMAGgAUAAFyQQMAuwAUAAFdQQMAKQAUAAFyQQMANwAUAAFyQQMA5QAUAAFdQQMAogAUAAFyQQMA0gAUAAFyQQMA1gAVAAFyQQMAtwAVAAFdQQUA6AAVAPgAFQACXUEDAMgAFQABckEDAEkAFQABcUEDABkAFQABckEDAJkAFQABckEDAGoAFQABckEDAEsAFQABckEDADwAFQABckEDANoAFQABXUEDACoAFQABckEDAFkAFQABckEDALkAFQABcUEDAMkAFQABXUEDAFgAFQABcUEFAJgAFQCoABUAAl1BAwCHABUAAXJBAwB1ABUAAXJBAwCjABUAAXJBAwCwABkAAXJBAwBfACIAAV1BAwDQACIAAXK4ACIQuAAc3EEDACAAHAABcUENAIAAHACQABwAoAAcALAAHADAABwA0AAcAAZyQQUAYQAcAHEAHAACckEDABEAHAABcUEDAKMAHAABcUEDADMAHAABcUEDAKIAHAABXUEDAJEAHAABXUEFAEAAHABQABwAAnJBAwBAABwAAXFBAwAAABwAAXFBAwDgABwAAV1BAwCSAB4AAXFBAwBkAB4AAXFBAwB1AB4AAXFBAwDYAB4AAXFBAwDlAB4AAXFBAwBVAB4AAXFBAwCDAB4AAXFBAwChAB4AAXFBAwDAAB4AAXJBAwDbAB8AAXFBAwCLACAAAXFBAwCtACAAAXFBAwCeACAAAXFBAwB9ACAAAXFBAwBrACAAAXFBAwBaACAAAXFBAwCrACQAAXFBAwB+ACQAAXFBAwCLACQAAXFBAwBqACQAAXFBAwBZACQAAXFBAwDcACYAAXJBAwDTACYAAXFBAwDeACgAAV1BAwB/ACgAAV1BAwAdACgAAV1BAwCBACgAAXFBAwDHACkAAV1BAwDYACkAAXFBAwC/ACkAAV1BAwBHACkAAXJBAwA2ACkAAXJBAwDlACkAAV24ACgQuAAq0LoALwAiABwREjlBAwDfAC8AAXJBBQAXAC8AJwAvAAJyQQMARgAvAAFyQQMA9QAxAAFxQQUAxwAxANcAMQACcUEDANgAMQABckEDAMkAMQABckEDAAcAMQABckEDALUAMQABcUEDAOMAMQABcUEDACMAMQABckEDABoAMwABckEDANsAMwABckEFAMwAMwDcADMAAnFBAwCqADMAAXJBAwDpADMAAXFBAwD5ADMAAV0wMQFBAwBNAAwAAV1BAwBLAA0AAXJBAwDAAB0AAXJBAwA6ACkAAXFBAwDMACkAAXJBAwA7ACoAAXFBAwBJADEAAXJBAwA4ADIAAXJBAwBKADIAAXJBAwBJADMAAXJBAwBLADMAAV0AQQMAegAMAAFdQQMAOwAMAAFyQQMAOgANAAFyQQMAlgAUAAFyQQMAxQApAAFyQQMARwAxAAFyQQMARAAyAAFyQQMAegAzAAFdQQMAOwAzAAFyATQmIyIGFRQWMzI2NwYjNTY1NCcHJwYHBgc+ATMyFhUUBiMiJjU0NjMXNx4BFRQHNjc2Nf7vDQoKDg4KCg2+A40oIRwcCg4LBAUJBRUdHRUaHC8gGBYeIxYXExkC1QoODgoKDQ1tlRYULCIKHx8BCggNAgIeFRUdIh0lOR4eASceJBcCGyI5AAAAAf8hAqj/qgMWAAsBILsAAgAGAAMABCu4AAMQuAAH0LgAAhC4AAnQALgACC+4AAIvuwALAAIAAAAEK0EDAOAAAgABXUEFAJAAAgCgAAIAAnFBAwAQAAIAAXJBAwBAAAIAAXJBBQDQAAIA4AACAAJxQQkAQAACAFAAAgBgAAIAcAACAARxQQUAoAACALAAAgACXUENADAAAgBAAAIAUAACAGAAAgBwAAIAgAACAAZduAAAELgABNC4AAsQuAAG0EEFAL8ACADPAAgAAnFBCQAvAAgAPwAIAE8ACABfAAgABF1BAwDfAAgAAV1BBwBvAAgAfwAIAI8ACAADcUEDAE8ACAABcUEDAA8ACAABckEFAI8ACACfAAgAAl1BAwA3AAgAAXJBAwBAAAgAAXIwMQMjFSM1IzUzNTMVM1Y1HzU1HzUCzycnHCsrAAL/FwJ6/8YDNQAUACAGy7sAGwAGAA8ABCtBAwBdAAAAAXFBAwBPAAAAAXFBFQBvAAAAfwAAAI8AAACfAAAArwAAAL8AAADPAAAA3wAAAO8AAAD/AAAACl1BBwAPAAAAHwAAAC8AAAADcUEPAG8AAAB/AAAAjwAAAJ8AAACvAAAAvwAAAM8AAAAHcUEDAD0AAAABcUEDAEoAAAABckEDAOkAAAABcUEDANoAAgABcrgADxC4AAncQQsAXwAJAG8ACQB/AAkAjwAJAJ8ACQAFckEFAG8ACQB/AAkAAnFBAwBQAAkAAV1BCQAQAAkAIAAJADAACQBAAAkABHK6AAYADwAJERI5QQMAqQAGAAFdQQMAOgAGAAFyQQMAmwAGAAFdQQMA2gAGAAFxQQMAyAAGAAFxQQMAyAAGAAFdQQMA9QALAAFdQQMABAALAAFxQQMA4wALAAFdQQMA+wANAAFdQQMACgANAAFxQQMA6QANAAFdQQMAmQAQAAFdQQMAPgATAAFyQQMAPAAUAAFyQQMATwAUAAFyQQUA7wAUAP8AFAACXUEDAM8AFAABcUEDAC8AFAABcUEDAA0AFAABckEFAOsAFAD7ABQAAnFBBQC3ABQAxwAUAAJyuQAVAAb0QQMAXwAVAAFdQQMAGwAVAAFdQQMAFAAbAAFdQQcAIAAbADAAGwBAABsAA10AuAAAL7gADC+7ABgAAQAeAAQrQQMAcgAAAAFxQQMAvQAAAAFdQQMAjQAAAAFdQQMAQQAAAAFxQQUAQAAAAFAAAAACXUEDAKkAAQABcUEDAEoAAQABckEDANoAAQABcUEDAIgAAQABcUEDAMcAAQABckEHAKYAAgC2AAIAxgACAANyQQMANAACAAFyQQMAQAACAAFxQQMA9wAEAAFyQQMAtwAEAAFyQQMApgAEAAFyQQMAYgAMAAFdQQMA4AAMAAFdQQkAYAAMAHAADACAAAwAkAAMAARxugAGAAwAABESOUEDADEABgABckEDAEMABgABckEDAMQABgABXUEDAEUABgABcUEDAJYABgABXUEDAJYABgABcUEDANcABgABcUEDAGgABgABcUEDAMYABgABcUEDANYABgABXUEDAKUABgABXUEDAFQABgABcUEDAIQABgABcUEDAJMABgABckEDACAABgABckEDAPAABgABcUEDAAAABgABckEDAOQACAABXUEDAPUACAABXUEDAAUACAABcUEDACUACAABcUEHADQACABEAAgAVAAIAANxQQMAEgAIAAFxQQMA6gAKAAFdQQMAWwAKAAFxQQMAPQAKAAFxQQcACgAKABoACgAqAAoAA3FBAwD5AAoAAV1BAwBIAAoAAXFBAwAKAA4AAXFBAwBbAA4AAXFBAwA9AA4AAXFBAwBMAA4AAXFBAwAqAA4AAXFBAwAZAA4AAXFBAwD5AA4AAV1BAwDAABAAAXFBAwARABAAAXJBAwCTABAAAXFBBQCkABAAtAAQAAJxQQMASAAQAAFdQQMAWgAQAAFdQQMAzQAQAAFyQQMAXgAQAAFyQQMAOwAQAAFdQQMAuQAQAAFyQQMAVAAQAAFxQQMAQwAQAAFyQQUA0gAQAOIAEAACcUEFACAAEAAwABAAAnJBBQBwABAAgAAQAAJxQQMA8AAQAAFxQQMAAAAQAAFyQQMAcQARAAFxQQMARAARAAFxQQMA6QARAAFyQQMA+gARAAFyQQMAXAARAAFyQQMAjAARAAFyQQMAewARAAFdQQMAaQARAAFdQQMARgARAAFyQQMAwwARAAFdQQMAIAARAAFyQQMA8AARAAFxQQMAAAARAAFyQQUAIAASADAAEgACckEDAKgAEgABckEDANgAEgABckEDAEIAEgABcUEDAHAAEgABcUEDAPAAEgABcUEDADEAEwABckEDAHAAFAABcUEDAKAAGAABXUEDACMAGAABXUEHAL8AGADPABgA3wAYAANxQQUAwAAYANAAGAACXUEDACAAGAABckEDAGAAGAABXUEDACoAHgABXUEDAB8AHgABXUEHAH8AHgCPAB4AnwAeAANdQQcAPwAeAE8AHgBfAB4AA11BAwC/AB4AAV1BAwAgAB4AAXJBCwBgAB4AcAAeAIAAHgCQAB4AoAAeAAVxMDEBQQMAOAAAAAFyQQMA+QAAAAFdQQMAKwAAAAFxQQMALgABAAFxQQMALAATAAFxQQUAKgAUADoAFAACckEDACsAFAABcQBBAwAiABAAAXJBAwB0ABAAAXFBBQA1ABAARQAQAAJyQQMA9gAQAAFxQQMAIwARAAFyQQMARgARAAFyQQMAJAASAAFyQQMAJAATAAFyAwYHBgcGBx4BFRQGIyImNTQ/ATY1BzQmIyIGFRQWMzI2OgMeER8dBxYdHxcXIEcvGTwQCwsQEAsLEAM1Ig8JBwUIAh8WFx8fF0YTDgkVhgsQEAsLEBAAAAAAAv9e/lv/yP8LAA0AGQDzuAAaL7gAGy+4AADcuQABAAX0uAAaELgAB9C4AAcvuQAUAAb0QSEABgAUABYAFAAmABQANgAUAEYAFABWABQAZgAUAHYAFACGABQAlgAUAKYAFAC2ABQAxgAUANYAFADmABQA9gAUABBdQSEABgAUABYAFAAmABQANgAUAEYAFABWABQAZgAUAHYAFACGABQAlgAUAKYAFAC2ABQAxgAUANYAFADmABQA9gAUABBxQQcABgAUABYAFAAmABQAA3JBBQA1ABQARQAUAAJyALgAAC+4ABEvugAKAAQAAyu6AAIABAAKERI5uAAEELkAFwAC9DAxAyM1BiMiJjU0NjMyFhUnNCYjIgYVFBYzMjY4IwgKFh8fFhYfGw8LCw8PCwsP/ltJAx8WFh8fFgELDw8LCw8PAAAAAv71/lv/yP8KABcAIwERuwAeAAYACgAEK7sAEAAGABgABCu7AAAABQAVAAQrugAFAAoAABESOUEhAAYAHgAWAB4AJgAeADYAHgBGAB4AVgAeAGYAHgB2AB4AhgAeAJYAHgCmAB4AtgAeAMYAHgDWAB4A5gAeAPYAHgAQXUEhAAYAHgAWAB4AJgAeADYAHgBGAB4AVgAeAGYAHgB2AB4AhgAeAJYAHgCmAB4AtgAeAMYAHgDWAB4A5gAeAPYAHgAQcUEHAAYAHgAWAB4AJgAeAANyQQUANQAeAEUAHgACcgC4AA0vuAAWL7gAGy+7ABMAAQACAAQruAANELgAB9y6AAUADQAHERI5uAANELgAF9C4ABcvuAAHELkAIQAC9DAxAxQjIj0BBiMiJjU0NjMyFh0BFDMyPQEzBzQmIyIGFRQWMzI2OEhECAoWHx8WFh8jIiSEDwsLDw8LCw/+mT48DAMfFhYfHxZEFxd1MAsPDwsLDw8AAf+b/tX/0P8KAAsAv7sAAAAHAAYABCtBIQAGAAAAFgAAACYAAAA2AAAARgAAAFYAAABmAAAAdgAAAIYAAACWAAAApgAAALYAAADGAAAA1gAAAOYAAAD2AAAAEF1BIQAGAAAAFgAAACYAAAA2AAAARgAAAFYAAABmAAAAdgAAAIYAAACWAAAApgAAALYAAADGAAAA1gAAAOYAAAD2AAAAEHFBBwAGAAAAFgAAACYAAAADckEFADUAAABFAAAAAnIAuwAJAAEAAwAEKzAxAxQGIyImNTQ2MzIWMA8LCxAQCwsP/vALEBALCw8PAP//ABj/JAFxAZACAgDkAAD//wARAAABsQGvAgIBAQAAAAEACgAAAScCAQAWAJu4ABcvuAAYL7gAAdy5AAIAB/S4ABcQuAAG0LgABi+5AAUAB/S4AAYQuAAK0LgABRC4ABXQALgAAEVYuAAALxu5AAAADj5ZuAAARVi4AAkvG7kACQAOPlm4AABFWLgAAS8buQABAAo+WbgAAEVYuAAFLxu5AAUACj5ZuwAOAAEAEwAEK7gAABC5AAMAAfS4AATQuAAH0LgACNAwMQERIxEjESMRIzUzNTQ2MzIXByYjIh0BAScnnScyMkdEMCURJiVdAVT+rAE1/ssBNR8RR1UbHhh7EQAAAAEACv/5AYICAQAfAJ24ACAvuAAhL7gAHNy5AAMAB/S4ACAQuAAR0LgAES+5ABAAB/S4AAvQuAARELgAFdAAuAAARVi4AAwvG7kADAAOPlm4AABFWLgAFC8buQAUAA4+WbgAAEVYuAABLxu5AAEACj5ZuAAARVi4ABAvG7kAEAAKPlm7ABkAAQAGAAQruAABELkAAAAB9LgADBC5AA4AAfS4ABLQuAAT0DAxJQcmNREmIyIOAh0BMxUjESMRIzUzNTQ2MzIXERQXFgGCBH4UHR8qGQpiYicyMlhDJykNFBsiBqwBKwoVIi4YDx/+ywE1HwpRUhT+zUkhNAAAACkAOv//A7MC3gAGAA8AGgAsADQAPABDAEwAVgBZAGEAbQB0AHsAggCIAI8AnwCjALkAxQDNANEA5gDyAPoBAQERASkBNQFBAVMBVwGFAZEBnQGkAbQBuwHLAdELzbsACwAHAAwABCu6ADUAOQADK7sARAAHAEoABCu6AQgAqAADK7sBWAAHAWoABCu6AOcA7AADK7oBVAEsAAMrQRsABgA1ABYANQAmADUANgA1AEYANQBWADUAZgA1AHYANQCGADUAlgA1AKYANQC2ADUAxgA1AA1dQQUA1QA1AOUANQACXbgANRC5AIUAB/S4AADQuAAAL7gACxC4AAPQuABKELgAB9C4AAcvugARAOwA5xESObgBWBC4AaXQuAGlL7gA5ty5ABMABvS5ABIAB/S4ABXQugAWAOwA5xESOboAGAEsAVQREjm6ABoBLAFUERI5ugAfASwBVBESObgAHy9BBQDaAB8A6gAfAAJdQRsACQAfABkAHwApAB8AOQAfAEkAHwBZAB8AaQAfAHkAHwCJAB8AmQAfAKkAHwC5AB8AyQAfAA1duAFUELgAKNC4ACgvugAtADkANRESObgALS+4AAwQuAAx3LgARBC5AXAABvS4AD3QuAA9L7gANRC5AEAABfS4AC0QuQBBAAf0uABH0LgAQBC4AEjQugBQAEoARBESOboAVQCoAQgREjm6AFcAOQA1ERI5ugBYADkANRESOboAWQA5ADUREjm6AFoAOQA1ERI5ugBfAAwAMRESObgA5hC4AGfQuABnL0EFADoBagBKAWoAAnJBIQAJAWoAGQFqACkBagA5AWoASQFqAFkBagBpAWoAeQFqAIkBagCZAWoAqQFqALkBagDJAWoA2QFqAOkBagD5AWoAEF1BIQAJAWoAGQFqACkBagA5AWoASQFqAFkBagBpAWoAeQFqAIkBagCZAWoAqQFqALkBagDJAWoA2QFqAOkBagD5AWoAEHFBBwAJAWoAGQFqACkBagADcroA0AFqAVgREjm4ANAvuQF3AAf0uAE20LgBNi+5ANIAB/S4AGjQuABoL7gA7BC4AGnQuABpL7gA5hC4AGvQuABrL7gA0hC4AGzQuABsL7oA8QDsAOcREjm4APEvuAGY3LoAbgDxAZgREjm6AHEA7ADnERI5ugBzAOwA5xESObgBVBC5AYwAB/S4AHjQuAB4L7gAHxC4AHzQuAB8L7gBmBC5APcABvS4AH/QuAB/L7gANRC4AV/QuAFfL7gAg9C4AIMvuAFwELgAjNC4AIwvuABEELgAkNC4AJAvugCSAEoARBESObgBcBC4AJrQuACaL7gAqBC4AKDQuACgL7gARBC4AKLQuACiL7oBCgCoAQgREjm4AQovuAC70LgAuy+4AQoQuADD0LgAwy+4AQgQuADJ0LgAyS+4AVgQuADO0LgAzi+4AOYQuADa0LgBdxC4AN/QuADfL7gAExC4AOLQuADiL7gA8RC4AOjQuAFUELgA89C4APMvuAGMELgA9NC4APQvuAEsELgA+NC4APgvuAFXELgA+tC4APovuAEIELgA/tC4AQoQuAEN3LgBAtC4AQIvugEPAQoBDRESObgBahC4ARHQuAERL7gBHhC4ARbQuAEWL7gAExC4ARvQuAEbL7gAExC4ASPQuAEjL7gA9xC4ASrQuAEqL7gA9xC4AS3QuAEtL7gA9xC4ATHQuAEeELgBN9C4ATcvuADWELgBONC4ATgvuAF3ELgBOtC4ATovuAEeELgBO9C4ATsvuAF3ELgBPtC4AT4vuAEeELgBP9C4AT8vuAA5ELgBQtC4AUIvuAAMELgBRtC4AUYvuAA5ELgBStC4AUovuAALELgBS9C4AAsQuAFT0LgAQRC4AWTQuAFkL7gBWBC4AXzQuACoELgBgdC4AYEvuAAfELgBhty4AVgQuAGe0LgBni+4ANAQuAGh0LgBoS+6AacBagFYERI5uAFYELgBqtC4AaovuADQELgBr9C4Aa8vuAENELgBsdC4AbEvuAASELgBtdC4AbUvuAASELgBwtC4AcIvuAASELgBxNC4AcQvugHKAOwA5xESObgBXxC4Ac3QuAHNL7gANRC4Ac/QuAHPL7gBXxC4AdDQuAHQL7gBhhC4AdPcALgAAEVYuABaLxu5AFoACj5ZuAAARVi4AF4vG7kAXgAKPlm4AABFWLgAYi8buQBiAAo+WbgAAEVYuABvLxu5AG8ACj5ZuAAARVi4AH4vG7kAfgAKPlm4AABFWLgAgy8buQCDAAo+WbgAAEVYuACULxu5AJQACj5ZuAAARVi4AJsvG7kAmwAKPlm4AABFWLgAoS8buQChAAo+WbgAAEVYuACkLxu5AKQACj5ZuAAARVi4AKYvG7kApgAKPlm4AABFWLgAui8buQC6AAo+WbgAAEVYuAC+Lxu5AL4ACj5ZuAAARVi4AMgvG7kAyAAKPlm4AABFWLgBFC8buQEUAAo+WbgAAEVYuAEqLxu5ASoACj5ZuAAARVi4ATcvG7kBNwAKPlm4AABFWLgBqS8buQGpAAo+WbgAAEVYuAGwLxu5AbAACj5ZuAAARVi4AbwvG7kBvAAKPlm4AABFWLgBwy8buQHDAAo+WbgAAEVYuAHMLxu5AcwACj5ZugFIAFkAAyu7AY8AAQAmAAQruwFRAAEAjAAEK7sA7wABADcABCu7ACEAAQF+AAQrugFXAN0AAyu7AA4AAQACAAQrugFmAVUAAyu7AAUAAQAJAAQrugARAAkABRESObgADhC4ABTQuAAOELgAF9C4AX4QuAAd0LgAHS+4AX4QuQF0AAH0uAAj0LgAIy+4AX4QuAAq0LgAKi+4AN0QuAAv0LgALy+4AVEQuAAz0LgAMy+4AUgQuAA70LgAOy+4AN0QuAA/0LgAPy+4AO8QuABB0LgAQS+4AUgQuQDqAAH0uABG0LgARi+4ADcQuABI0LgASC+4AUgQuABK0LgASi+4ADcQuABN0LgATS+4AUgQuABQ0LgAUC+4AUgQuABU0LgAVC+6AFUAWQFIERI5uABeELkAYAAB9LoAVwBeAGAREjm6AFgAXgBgERI5uABh0LgAZNC4AGXQuACMELgAZtC4AGYvuABZELgAatC4AGovuABlELgAbtC4AHHQuABy0LoAcwBeAGAREjm4AHTQuACMELgAd9C4AHcvuABZELgAedC4AHkvuAB0ELgAgNC4AIHQuACF0LgAhtC6AJIAXgBgERI5uABZELgAmdC6AJoAXgBgERI5uACGELgAndC4AJ7QuACg0LgAo9C4AKrQuACqL7gAjBC4AKzQuACsL7gAjBC4AK/QuABZELgAttC4ALYvuABZELgAuNC4ALgvuABZELgAvNC4ALwvuACqELgAwNC4AMHQuADE0LgAxdC4AIwQuADG0LgAxi+4AIwQuADK0LgAyi+4AMUQuADM0LgAzdC4ADcQuADO0LgAzi+4AUgQuADQ0LgA0C+4ADcQuADU0LgA1C+4AUgQuADY0LgA2C+4AO8QuADa0LgA2i+4AVEQuADh0LgA6hC4AOPQuADjL7gA7xC4AOXQuADlL7gANxC4AOfQuADnL7gANxC4AOvQuADrL7gBSBC4AO3QuADtL7gBSBC4APHQuADxL7gA3RC4APPQuADzL7gANxC4APXQuAD1L7gA3RC4APfQuAD3L7gBSBC4APnQuAD5L7gA3RC4AP3QuAD9L7gA7xC4AP/QuAD/L7gANxC4AQLQuAECL7gA6hC4AQbQuAEGL7gANxC4AQjQuAEIL7gBSBC4AQrQuAEKL7oBDwBZAUgREjm4AFkQuAEW0LgBFi+4AM0QuAEg0LgBIC+4AIwQuAEi0LgBIi+4ASAQuAEl0LgBJS+4ASzQuAEt0LgAjBC4AS7QuAEuL7gAWRC4ATLQuAEyL7gBLRC4ATnQuAE60LgAjBC4ATvQuAE7L7gAWRC4AT/QuAE/L7gA6hC4AULQuAFCL7gANxC4AUTQuADvELgBStC4AUovuADdELgBTdC4AWYQuQFcAAH0uAAhELgBidy4AIwQuAGg0LoBpwBeAGAREjm4AFkQuAGu0LgBOhC4AbLQuAGz0LgAjBC4AbrQuABZELgBwdC4AbMQuAHF0LgBxtC6AcoAXgBgERI5uAHO0LgBz9AwMRM0KwEVMzI3FCsBFSM1MzIFJxUjNTMVNzMHFxMGIyI1NDMyFyMmIyIVFDMyNwE0IyIVFDMyNxQjIjU0MzIXNCsBFTMyNxQrARUjNTMyFyM1JzMXNjczDwEnBxcjJyMHIzczBSM1MxUjFTMVIxUzNwcjJzMXNxc0KwEVMzI3FCsBNTMyBSM1MxUzNzQrARUzMjcUBxYXIzQnJisBFSM1MzIzFSM1FwYjIjU0MzIXIyYjIhUUMzI3NSM1MxcjNSMVIzUzFTM1MxcjFSM1IzUzNyM1MxcGIyI1NDMyFyMmIyIVFDM3NSM1MxcjNSMVIzUzFTM1MxcjFSM1IzUzBTQrARUzMhcjJyYrARUjNTMyFRQHFhUXFCMiNTMUMzI1NCY1NDMyFSM0IyIVFBYXIzUzFSMVMxUjFTMjFSM1MxUjFTMVIxUlBiMiNTQzMhcjJiMiFRQzMjclITUhJRQHBiMiJjU0NzMGFRQzMjc2NTQnJicmNTQ3NjMyFhUUByM2NTQjIgYVFB4CJRQGIyImNTQ2MzIWBzQmIyIGFRQWMzI2ATQrARUzMjcUBxYXIzQnJisBFSM1MzIXMzI1NCsBFyM0JyYrARUjNTMyFRQHFgUjNTMVM9QsJiYsO2QpOm5ZAfxSPDxSRllgPAUZHx8bAhADCg0OCwH9ahkbGxkYMzAyMUARDw8RFyYRFSkjOBckGhgDExck0AcIIg0EFAQMFA8B7CIiFxUVF1URDBIMDAxUDQgIDQsYFBQY/Z8gChZTCAYGCA0IBgQNAQMGBgsVERAJPAkKGhkTAQsBCA0OBQMJFDILFgsLFgssDgwPKTsZGWcSFzMxKAMaAhAYGxATLGQXKBgYKBdgIRcfV/6aEg8PEhkWBQEQDhctIhEPexQSCwgHGRISCwcHGp8hIRUUFBXJIiEWFRX+UwMoLzElBBoBEBcWEQEC4fzXAyn+zzouSD1FBCYBYywjLTQvMDQ0LkkyOwUkAkI8RyRzLgGBIhoZISEZGiIJHhUUHBwUFR7+gwcHBwcMCAYEDAEDBQcMFhCFBwcHBxwMAQMFBwoVDwgG/kYgChYCCBw5HElQ4eFycuFgYGR9ASwaJCQYChUYDf3eGhkZGSoqKRsKFQsbGU9PHDMiBB40XREREQkJKysrCQgICSIrKyAgFg0YCxUrKysiFQUJBggDAhMEBAkRKysrKAQWFxAHDQ4BBwgYEhIrEREJIiIJKE9MBSkpGwsYGgIODSsgIE8fHxI9PRIZCBMrFAoeTxUNBgMQWg4QBwQBCQgODgYFBAYVKwkICAkJKwkICAlkHisqHg0ZGQxaGbZPJR40LxAPBwpPFRsyJhQQEBYqRCQfKiYPEg4FPC4nGhohJ+0aICAaGiEhGxUdHRUVHBz9kQUJBggDAhMEBAkRKxEEBSMEBAkRKwsIAwITKyL//wAA/5YBkAHjAiYAIgAAAAcB6gEWAAD//wAa/5YBMAFbAiYAQgAAAAcB6gD6AAD//wAAAAABkAKXAiYAIgAAAAcB5wFzAIj//wAa//cBMAIAAiYAQgAAAA8B5wFAACY5mgAA//8AAAAAAZAClQImACIAAAAnAM0AXgCIAA8B6QGlAOU5mgAA//8AGv/3AUECDwImAEIAAAAmAM1CAAAPAekBfQBfOZr//wAAAAABkAKVAiYAIgAAACcAzQBeAIgADwHrAX4A5TmaAAD//wAa//cBMAIPAiYAQgAAACYAzUIAAA8B6wFbAF85mv//AAAAAAGQAsICJgAiAAAAJwDNAF4AiAAPAecBywDoOZoAAP//ABr/9wFEAkgCJgBCAAAAJgDNQgAADwHnAZ4Abjma//8AAAAAAZACtgImACIAAAAnAM0AXgCIAAcB6AEyAPL//wAa//cBMAItAiYAQgAAACYAzUIAAAcB6AEWAGkAAP//AAD/lgGQAl4CJgAiAAAAJwHqARYAAAAHAM0AXgCI//8AGv+WATAB1gImAEIAAAAnAeoA+gAAAAYAzUIAAAD//wAAAAABkAKnAiYAIgAAACcAzwAyAIgADwHpAT4A9zmaAAD//wAa//cBMAIiAiYAQgAAACYAzxYAAA8B6QEjAHI5mv//AAAAAAGQAqkCJgAiAAAAJwDPADIAiAAPAesBDwD5OZoAAP//ABr/9wEwAiECJgBCAAAAJgDPFgAADwHrAPMAcTma//8AAAAAAZAC2QImACIAAAAnAM8AMgCIAA8B5wFcAP85mgAA//8AGv/3ATACVAImAEIAAAAmAM8WAAAPAecBQQB6OZr//wAAAAABkAKsAiYAIgAAACcAzwAyAIgABwHoATAA6P//ABr/9wEwAiICJgBCAAAAJgDPFgAABwHoARQAXgAA//8AAP+WAZACTQImACIAAAAnAeoBFgAAAAcAzwAyAIj//wAa/5YBMAHFAiYAQgAAACcB6gD6AAAABgDPFgAAAP//ADb/lgE5AdwCJgAmAAAABwHqAP0AAP//ABv/lgFXAVsCJgBGAAAABwHqAQkAAP//ADYAAAE5ApcCJgAmAAAABwHnAVsAiP//ABv/9wFXAgACJgBGAAAADwHnAU8AJjmaAAD//wA2AAABOQJMAiYAJgAAAAcB6AEYAIj//wAb/+EBVwGuAiYARgDqAAcB6AEj/+r//wA2AAABRgKVAiYAJgAAACcAzQBFAIgADwHpAYIA5TmaAAD//wAb//cBXAIPAiYARgAAACYAzVEAAA8B6QGYAF85mv//ADYAAAE5ApUCJgAmAAAAJwDNAEUAiAAPAesBXADlOZoAAP//ABv/9wFXAhACJgBGAAAAJgDNUQAABwHrAXkALwAA//8ANgAAAVUCwgImACYAAAAnAM0ARQCIAA8B5wGvAOg5mgAA//8AG//3AV0CSAImAEYAAAAmAM1RAAAPAecBtwBuOZr//wA2AAABOQK2AiYAJgAAACcAzQBFAIgABwHoARcA8v//ABv/9wFXAi0CJgBGAAAAJgDNUQAABwHoASMAaQAA//8ANv+WATkCXgImACYAAAAnAeoA/QAAAAcAzQBFAIj//wAb/5YBVwHWAiYARgAAACcB6gEJAAAABgDNUQAAAP//ABAAAACSApcCJgAqAAAABwHnAPUAiP//AA4AAACQAg8AJwHnAPMAAAAGAMIAAP//AC3/lgBnAdwCJgAqAAAABwHqAJgAAP//ACf/lgBmAdsCJgBKAAAABwHqAJYAAP//ABb/lgHQAeQCJgAwAAAABwHqAUEAAP//ABz/lgFyAVsCJgBQAAAABwHqARUAAP//ABb/9gHQApcCJgAwAAAABwHnAZ4AiP//ABz/9gFyAg8CJgBQAAAABwHnAXIAAP//ABb/9gHQApUCJgAwAAAAJwDNAIkAiAAPAekB2wDlOZoAAP//ABz/9gFyAg8CJgBQAAAAJgDNXQAADwHpAacAXzma//8AFv/2AdAClQImADAAAAAnAM0AiQCIAA8B6wGzAOU5mgAA//8AHP/2AXICDwImAFAAAAAmAM1dAAAPAesBgQBfOZr//wAW//YB0ALCAiYAMAAAACcAzQCJAIgADwHnAfcA6DmaAAD//wAc//YBcgJIAiYAUAAAACYAzV0AAA8B5wHAAG45mv//ABb/9gHQArYCJgAwAAAAJwDNAIkAiAAHAegBWwDy//8AHP/2AXICLQImAFAAAAAmAM1dAAAHAegBLwBpAAD//wAW/5YB0AJeAiYAMAAAACcB6gFBAAAABwDNAIkAiP//ABz/lgFyAdYCJgBQAAAAJwHqARUAAAAGAM1dAAAA//8AFv/2AdACaQImAeMAAAAHAekBXQCI//8AHP/2AYIB4QImAeQAAAAHAekBMQAA//8AFv/2AdACaQImAeMAAAAHAesBXQCI//8AHP/2AYIB4QImAeQAAAAHAesBMQAA//8AFv/2AdAClwImAeMAAAAHAecBngCI//8AHP/2AYICAAImAeQAAAAPAecBWwAmOZoAAP//ABb/9gHQAkwCJgHjAAAABwHoAVsAiP//ABz/9gGCAcQCJgHkAAAABwHoAS8AAP//ABb/lgHQAgkCJgHjAAAABwHqAUEAAP//ABz/lgGCAY4CJgHkAAAABwHqARUAAP//ADb/lgGcAdwCJgA2AAAABwHqATcAAP//ADT/lgFjAVQCJgBWAAAABwHqAREAAP//ADb/9wGcApcCJgA2AAAABwHnAZQAiP//ADT/9wFjAgACJgBWAAAADwHnAVcAJjmaAAD//wA2//cB7AJpAiYB5QAAAAcB6QFqAIj//wA0//cBngHhAiYB5gAAAAcB6QE7AAD//wA2//cB7AJpAiYB5QAAAAcB6wFFAIj//wA0//cBngHhAiYB5gAAAAcB6wERAAD//wA2//cB7AKXAiYB5QAAAAcB5wGOAIj//wA0//cBngIAAiYB5gAAAA8B5wFYACY5mgAA//8ANv/3AewCTAImAeUAAAAHAegBVgCI//8ANP/3AZ4BxAImAeYAAAAHAegBMQAA//8ANv+WAewCCQImAeUAAAAHAeoBNwAA//8ANP+WAZ4BjgImAeYAAAAHAeoBCAAA//8AAAAAAW4CaQImADoAAAAHAesBDwCI//8AA/9kAU4B4QImAFoAAAAHAesA+gAA//8AAP+WAW4B3AImADoAAAAHAeoBBQAA//8AA/9kAU4BVAImAFoAAAAHAeoBOwAA//8AAAAAAW4ClwImADoAAAAHAecBYgCI//8AA/9kAU4CAAImAFoAAAAPAecBPAAmOZoAAP//AAAAAAFuAkwCJgA6AAAABwHoAR8AiP//AAP/ZAFOAcQCJgBaAAAABwHoAREAAAAB//MAAAFJAdwAEQBkuwACAAcAAwAEK7gAAxC4AAfQuAACELgAC9C4AAIQuAAP0AC4AABFWLgAAi8buQACAAo+WbsACQABAAoABCu7ABEAAQAAAAQruwANAAEADgAEK7gAABC4AATQuAARELgABtAwMTcjFSM1IzUzESEVIxUzFSMVM+mGJ0lJAQ3m19eGXl5eHwFfIbUhaAAAAAADABf/lAGNAfkAGQAlACkC6rgAKi+4ACsvuAAB3LgABNC4AAQvuAABELkAEgAH9LgABdC4AAUvuAASELgAB9C4AAcvuAAqELgADNC4AAwvuAASELgAFdC4AAEQuAAX0LgAEhC4ABrQuAAMELkAIQAH9EEhAAYAIQAWACEAJgAhADYAIQBGACEAVgAhAGYAIQB2ACEAhgAhAJYAIQCmACEAtgAhAMYAIQDWACEA5gAhAPYAIQAQXUEhAAYAIQAWACEAJgAhADYAIQBGACEAVgAhAGYAIQB2ACEAhgAhAJYAIQCmACEAtgAhAMYAIQDWACEA5gAhAPYAIQAQcUEHAAYAIQAWACEAJgAhAANyQQUANQAhAEUAIQACcrgADBC4ACfQuAAnLwC4ABYvuAAARVi4AA8vG7kADwAOPlm4AABFWLgABC8buQAEAAo+WbgAAEVYuAAJLxu5AAkACj5ZuwApAAEAJgAEK7sAGQABAAAABCu6AAcACQAWERI5ugARAAkAFhESObgAABC4ABLQuAAZELgAFNC4AA8QuQAeAAH0QQUAOQAeAEkAHgACckEhAAgAHgAYAB4AKAAeADgAHgBIAB4AWAAeAGgAHgB4AB4AiAAeAJgAHgCoAB4AuAAeAMgAHgDYAB4A6AAeAPgAHgAQXUEhAAgAHgAYAB4AKAAeADgAHgBIAB4AWAAeAGgAHgB4AB4AiAAeAJgAHgCoAB4AuAAeAMgAHgDYAB4A6AAeAPgAHgAQcUEHAAgAHgAYAB4AKAAeAANyuAAJELkAIwAB9EEhAAcAIwAXACMAJwAjADcAIwBHACMAVwAjAGcAIwB3ACMAhwAjAJcAIwCnACMAtwAjAMcAIwDXACMA5wAjAPcAIwAQXUEhAAcAIwAXACMAJwAjADcAIwBHACMAVwAjAGcAIwB3ACMAhwAjAJcAIwCnACMAtwAjAMcAIwDXACMA5wAjAPcAIwAQcUEHAAcAIwAXACMAJwAjAANyQQUANgAjAEYAIwACcjAxASMRFBcjJjUGIyImNTQ2MzIXNSM1MzUzFTMDNTQmIyIGFRQzMjYXITUhAY0wAyQCLlFJVlJHViuCgicwV0owOkB+MkRB/qABYAGq/qk5GhoiRWVSS2JIlyEuLv69OTdEUD+VQMQfAAD//wAAAAABkAJNAiYAIgAAAAcAzwAyAIj//wAa//cBMAHFAiYAQgAAAAYAzxYAAAD//wAX//kBewJpAiYAJAAAAQcB6QE5AIgAFEEDAEsAGgABckEDAEQAGwABcjAxAAD//wAb//cBOAHhAiYARAAAAAcB6QEUAAD//wAX//kBewJWAiYAJAAAAAcAzgCBAIj//wAb//cBOAHOAiYARAAAAAYAzl0AAAAAAgAG//wBkgHhAA8AHgHfuAAfL7gAIC+4AADcuQAQAAf0QQUAOgAQAEoAEAACckEhAAkAEAAZABAAKQAQADkAEABJABAAWQAQAGkAEAB5ABAAiQAQAJkAEACpABAAuQAQAMkAEADZABAA6QAQAPkAEAAQXUEhAAkAEAAZABAAKQAQADkAEABJABAAWQAQAGkAEAB5ABAAiQAQAJkAEACpABAAuQAQAMkAEADZABAA6QAQAPkAEAAQcUEHAAkAEAAZABAAKQAQAANyuAAC0LgAAi+4AB8QuAAG0LgABi+4AArQuAAGELkAGwAH9LgAFtAAuAAARVi4AA0vG7kADQASPlm4AABFWLgABC8buQAEAAo+WbsACgABAAcABCu4AA0QuQAUAAH0QQUAOQAUAEkAFAACckEhAAgAFAAYABQAKAAUADgAFABIABQAWAAUAGgAFAB4ABQAiAAUAJgAFACoABQAuAAUAMgAFADYABQA6AAUAPgAFAAQXUEhAAgAFAAYABQAKAAUADgAFABIABQAWAAUAGgAFAB4ABQAiAAUAJgAFACoABQAuAAUAMgAFADYABQA6AAUAPgAFAAQcUEHAAgAFAAYABQAKAAUAANyuAAKELgAF9C4AAcQuAAZ0LgABBC5ABsAAfS4AB3QMDElFAcGIyInNSM1MzU2MzIWBzQnJiMiBxUzFSMVFjMyAZIqMnctXDAwXEFaZScqKUguRZeXMjyg+Hg8SAncIdMMe25gNTIItSG9BgAAAAACABz/9wGNAfkAGQAlAtS4ACYvuAAnL7gAAdy4AATQuAAEL7gAARC5ABIAB/S4AAXQuAAFL7gAEhC4AAfQuAAHL7gAJhC4AAzQuAAML7gAEhC4ABXQuAABELgAF9C4ABIQuAAa0LgADBC5ACEAB/RBIQAGACEAFgAhACYAIQA2ACEARgAhAFYAIQBmACEAdgAhAIYAIQCWACEApgAhALYAIQDGACEA1gAhAOYAIQD2ACEAEF1BIQAGACEAFgAhACYAIQA2ACEARgAhAFYAIQBmACEAdgAhAIYAIQCWACEApgAhALYAIQDGACEA1gAhAOYAIQD2ACEAEHFBBwAGACEAFgAhACYAIQADckEFADUAIQBFACEAAnIAuAAWL7gAAEVYuAAPLxu5AA8ADj5ZuAAARVi4AAQvG7kABAAKPlm4AABFWLgACS8buQAJAAo+WbsAGQABAAAABCu6AAcACQAWERI5ugARAAkAFhESObgAABC4ABLQuAAZELgAFNC4AA8QuQAeAAH0QQUAOQAeAEkAHgACckEhAAgAHgAYAB4AKAAeADgAHgBIAB4AWAAeAGgAHgB4AB4AiAAeAJgAHgCoAB4AuAAeAMgAHgDYAB4A6AAeAPgAHgAQXUEhAAgAHgAYAB4AKAAeADgAHgBIAB4AWAAeAGgAHgB4AB4AiAAeAJgAHgCoAB4AuAAeAMgAHgDYAB4A6AAeAPgAHgAQcUEHAAgAHgAYAB4AKAAeAANyuAAJELkAIwAB9EEhAAcAIwAXACMAJwAjADcAIwBHACMAVwAjAGcAIwB3ACMAhwAjAJcAIwCnACMAtwAjAMcAIwDXACMA5wAjAPcAIwAQXUEhAAcAIwAXACMAJwAjADcAIwBHACMAVwAjAGcAIwB3ACMAhwAjAJcAIwCnACMAtwAjAMcAIwDXACMA5wAjAPcAIwAQcUEHAAcAIwAXACMAJwAjAANyQQUANgAjAEYAIwACcjAxASMRFBcjJjUGIyImNTQ2MzIXNSM1MzUzFTMDNTQmIyIGFRQzMjYBjTADJAIuUUlWUkdWK4KCJzBXSjA6QH4yRAGq/qk5GhoiRWVSS2JIlyEuLv69OTdEUD+VQAD//wAX//sBfwJNAiYAKAAAAAcAzwA+AIj//wAk/2MBGwHFAiYASAAAAAYAzwUAAAD////vAAAAoAJMAiYAKgAAAAcB6ACyAIj////tAAAAngHEAiYAwgAAAAcB6ACwAAD//wA1AAAAeQI/AiYAKgAAAAYA0MAAAAD//wAd/3UBQgHlACYANAIAAAYAelUAAAD//wAg/4IA+wFbACYAVAMAAA4AejwAOZr//wA7//cBoQJMACYANgUAAAcB6AFWAIj//wA0//cBYwHEACYAVgAAAAcB6AEyAAAAAgAW//YB0AIJABMAHwMZuAAgL7gAIS+4AADcuAAgELgABtC4AAYvuAAAELkAFAAH9EEFADoAFABKABQAAnJBIQAJABQAGQAUACkAFAA5ABQASQAUAFkAFABpABQAeQAUAIkAFACZABQAqQAUALkAFADJABQA2QAUAOkAFAD5ABQAEF1BIQAJABQAGQAUACkAFAA5ABQASQAUAFkAFABpABQAeQAUAIkAFACZABQAqQAUALkAFADJABQA2QAUAOkAFAD5ABQAEHFBBwAJABQAGQAUACkAFAADcrgADdC4AA0vuAAAELgADtC4AAYQuQAaAAf0QSEABgAaABYAGgAmABoANgAaAEYAGgBWABoAZgAaAHYAGgCGABoAlgAaAKYAGgC2ABoAxgAaANYAGgDmABoA9gAaABBdQSEABgAaABYAGgAmABoANgAaAEYAGgBWABoAZgAaAHYAGgCGABoAlgAaAKYAGgC2ABoAxgAaANYAGgDmABoA9gAaABBxQQcABgAaABYAGgAmABoAA3JBBQA1ABoARQAaAAJyALgADS+4AABFWLgACS8buQAJABI+WbgAAEVYuAADLxu5AAMACj5ZuAAJELkAFwAB9EEFADkAFwBJABcAAnJBIQAIABcAGAAXACgAFwA4ABcASAAXAFgAFwBoABcAeAAXAIgAFwCYABcAqAAXALgAFwDIABcA2AAXAOgAFwD4ABcAEF1BIQAIABcAGAAXACgAFwA4ABcASAAXAFgAFwBoABcAeAAXAIgAFwCYABcAqAAXALgAFwDIABcA2AAXAOgAFwD4ABcAEHFBBwAIABcAGAAXACgAFwADcrgAAxC5AB0AAfRBIQAHAB0AFwAdACcAHQA3AB0ARwAdAFcAHQBnAB0AdwAdAIcAHQCXAB0ApwAdALcAHQDHAB0A1wAdAOcAHQD3AB0AEF1BIQAHAB0AFwAdACcAHQA3AB0ARwAdAFcAHQBnAB0AdwAdAIcAHQCXAB0ApwAdALcAHQDHAB0A1wAdAOcAHQD3AB0AEHFBBwAHAB0AFwAdACcAHQADckEFADYAHQBGAB0AAnIwMSUUBiMiJjU0NjMyFzY1MxQHBgcWBzQmIyIGFRQWMzI2AdB7YmJ7e2JXPCogDhEbOidmUFBmZlBQZu1rjIxra4w5LTEWHiMYRWhYfX1YWH19AAAAAAIAHP/2AYIBjgARAB0DFrsAGAAHAAYABCu7AAAABwASAAQrQQUAOgASAEoAEgACckEhAAkAEgAZABIAKQASADkAEgBJABIAWQASAGkAEgB5ABIAiQASAJkAEgCpABIAuQASAMkAEgDZABIA6QASAPkAEgAQXUEhAAkAEgAZABIAKQASADkAEgBJABIAWQASAGkAEgB5ABIAiQASAJkAEgCpABIAuQASAMkAEgDZABIA6QASAPkAEgAQcUEHAAkAEgAZABIAKQASAANyugANABIAABESObgADS+5AA4ABvRBIQAGABgAFgAYACYAGAA2ABgARgAYAFYAGABmABgAdgAYAIYAGACWABgApgAYALYAGADGABgA1gAYAOYAGAD2ABgAEF1BIQAGABgAFgAYACYAGAA2ABgARgAYAFYAGABmABgAdgAYAIYAGACWABgApgAYALYAGADGABgA1gAYAOYAGAD2ABgAEHFBBwAGABgAFgAYACYAGAADckEFADUAGABFABgAAnK4AB/cALgAAEVYuAANLxu5AA0AED5ZuAAARVi4AAkvG7kACQAOPlm4AABFWLgAAy8buQADAAo+WbgACRC5ABUAAfRBBQA5ABUASQAVAAJyQSEACAAVABgAFQAoABUAOAAVAEgAFQBYABUAaAAVAHgAFQCIABUAmAAVAKgAFQC4ABUAyAAVANgAFQDoABUA+AAVABBdQSEACAAVABgAFQAoABUAOAAVAEgAFQBYABUAaAAVAHgAFQCIABUAmAAVAKgAFQC4ABUAyAAVANgAFQDoABUA+AAVABBxQQcACAAVABgAFQAoABUAA3K4AAMQuQAbAAH0QSEABwAbABcAGwAnABsANwAbAEcAGwBXABsAZwAbAHcAGwCHABsAlwAbAKcAGwC3ABsAxwAbANcAGwDnABsA9wAbABBdQSEABwAbABcAGwAnABsANwAbAEcAGwBXABsAZwAbAHcAGwCHABsAlwAbAKcAGwC3ABsAxwAbANcAGwDnABsA9wAbABBxQQcABwAbABcAGwAnABsAA3JBBQA2ABsARgAbAAJyMDElFAYjIiY1NDYzMhc2NzMGBxYHNCYjIgYVFBYzMjYBcl5NTV5eTUMwJAMhAjYoJks6OktLOjpLqUtoaEtLZysiPD0yMkQ+U1M+PlRUAAAAAQA2//cB7AIJABUBALgAFi+4ABcvuAAA3LgAFhC4AATQuAAEL7kABwAH9LgAABC5AA0AB/S4AAAQuAAP0AC4ABIvuAAARVi4AAIvG7kAAgAKPlm5AAoAAfRBIQAHAAoAFwAKACcACgA3AAoARwAKAFcACgBnAAoAdwAKAIcACgCXAAoApwAKALcACgDHAAoA1wAKAOcACgD3AAoAEF1BIQAHAAoAFwAKACcACgA3AAoARwAKAFcACgBnAAoAdwAKAIcACgCXAAoApwAKALcACgDHAAoA1wAKAOcACgD3AAoAEHFBBwAHAAoAFwAKACcACgADckEFADYACgBGAAoAAnK6ABAAAgASERI5MDElFCMiNREzERQWMzI2JxEzFTY3MwYHAZyzsydNP0BNASctAyAJR8nS0gET/u5eVFReARIsJzJHMAAAAAEANP/3AZ4BjgAaAU64ABsvuAAcL7gAGdy5ABAAB/S4AAPQuAADL7gAGxC4AAfQuAAHL7kACgAH9LgAGRC4ABLQALgAAEVYuAAVLxu5ABUAED5ZuAAARVi4AAgvG7kACAAOPlm4AABFWLgAES8buQARAA4+WbgAAEVYuAABLxu5AAEACj5ZuAAARVi4AAUvG7kABQAKPlm6AAMABQAVERI5uQAMAAH0QSEABwAMABcADAAnAAwANwAMAEcADABXAAwAZwAMAHcADACHAAwAlwAMAKcADAC3AAwAxwAMANcADADnAAwA9wAMABBdQSEABwAMABcADAAnAAwANwAMAEcADABXAAwAZwAMAHcADACHAAwAlwAMAKcADAC3AAwAxwAMANcADADnAAwA9wAMABBxQQcABwAMABcADAAnAAwAA3JBBQA2AAwARgAMAAJyugATAAUAFRESOTAxJQcmJwYjIj0BMxUUMzI3Nj0BMxU2NzMGBxUUAWMlDAQsVHonXCsjJicoBCAHRQEIIiBEnr+4gxwgMc4pJj1SLbwlAAAAAf8bAYD/nQIPABEAw7sAAAAGAAcABCtBBQA6AAcASgAHAAJyQSEACQAHABkABwApAAcAOQAHAEkABwBZAAcAaQAHAHkABwCJAAcAmQAHAKkABwC5AAcAyQAHANkABwDpAAcA+QAHABBdQSEACQAHABkABwApAAcAOQAHAEkABwBZAAcAaQAHAHkABwCJAAcAmQAHAKkABwC5AAcAyQAHANkABwDpAAcA+QAHABBxQQcACQAHABkABwApAAcAA3IAuAADL7sADwACAAoABCswMQMUBhUjPgE1NCYjIgcnNjMyFmM4HwE3ExAaExMWLxsiAdcfLAwaKBUODxwPKB0AAAH/PQGG/+4BxAAVAE26AAAACwADKwC4AAAvuAAOL7gAAEVYuAACLxu5AAIAED5ZuAAARVi4AAovG7kACgAQPlm4AAIQuAAL0LgACy+4AA4QuAAV0LgAFS8wMQMGIyIuAiMiBgcjPgEzMh4CMzI3EgIwChYVEwcIDgEZARsVCxUVFAoRAwHEPAoNChIRHh4KDQojAAAB/2UBhv++AeEAAwAvALgAAEVYuAACLxu5AAIAEj5ZuAAARVi4AAAvG7kAAAAQPlm6AAMAAAACERI5MDEDIzcXfB8yJwGGWwoAAAAAAf+V/5b/z//PAAsAv7sAAAAHAAYABCtBIQAGAAAAFgAAACYAAAA2AAAARgAAAFYAAABmAAAAdgAAAIYAAACWAAAApgAAALYAAADGAAAA1gAAAOYAAAD2AAAAEF1BIQAGAAAAFgAAACYAAAA2AAAARgAAAFYAAABmAAAAdgAAAIYAAACWAAAApgAAALYAAADGAAAA1gAAAOYAAAD2AAAAEHFBBwAGAAAAFgAAACYAAAADckEFADUAAABFAAAAAnIAuwAJAAEAAwAEKzAxBxQGIyImNTQ2MzIWMRANDBERDA0QTQwREQwKEhIAAAAB/28Bhv/IAeEAAwAvALgAAEVYuAADLxu5AAMAEj5ZuAAARVi4AAAvG7kAAAAQPlm6AAIAAAADERI5MDEDIyc3OB86JwGGUQoAAAAABQAe//cB/AHTAAMADwAbACcAPgKluwAOAAUABwAEK7sAIgAGADQABCu7ADoABgAcAAQrugABAAcADhESOboAAwAHADoREjlBBQA6ABwASgAcAAJyQSEACQAcABkAHAApABwAOQAcAEkAHABZABwAaQAcAHkAHACJABwAmQAcAKkAHAC5ABwAyQAcANkAHADpABwA+QAcABBdQSEACQAcABkAHAApABwAOQAcAEkAHABZABwAaQAcAHkAHACJABwAmQAcAKkAHAC5ABwAyQAcANkAHADpABwA+QAcABBxQQcACQAcABkAHAApABwAA3K6ADEABwA6ERI5QQUAOgA0AEoANAACckEhAAkANAAZADQAKQA0ADkANABJADQAWQA0AGkANAB5ADQAiQA0AJkANACpADQAuQA0AMkANADZADQA6QA0APkANAAQXUEhAAkANAAZADQAKQA0ADkANABJADQAWQA0AGkANAB5ADQAiQA0AJkANACpADQAuQA0AMkANADZADQA6QA0APkANAAQcUEHAAkANAAZADQAKQA0AANyugA9ABwAOhESObgAOhC4AEDcALgAAi+4AAsvuAAARVi4AAAvG7kAAAAKPlm4AABFWLgAKy8buQArAAo+WbsANwABAB8ABCu6AAgAAAACERI5uAArELkAGQAB9EEhAAcAGQAXABkAJwAZADcAGQBHABkAVwAZAGcAGQB3ABkAhwAZAJcAGQCnABkAtwAZAMcAGQDXABkA5wAZAPcAGQAQXUEhAAcAGQAXABkAJwAZADcAGQBHABkAVwAZAGcAGQB3ABkAhwAZAJcAGQCnABkAtwAZAMcAGQDXABkA5wAZAPcAGQAQcUEHAAcAGQAXABkAJwAZAANyQQUANgAZAEYAGQACcroAMQAAAAIREjm6AD0AAAACERI5MDEXIwEzAyM1MzUHJzcWHQEzBTQmJw4BFRQWMzI2JzQmIyIGFRQWFz4BFxQGIyImNTQ2Ny4BNTQ2MzIWFRQGBxaHIQEcIf56LCYTRxUrATYcHBwcHxkYIAkZFhYZGRYWGSovKikwGBISDywkJCwPESkJAdz+5xjJIRg/AhrjhxUjAgIiFhYbG5wPGRkPDhcGBRl3JywsJxgmDAodESEpKSERHQoXAAAABQAj//cB/AHWAAMAJQAxAD0AVANtuwAhAAYAGAAEK7sAOAAGAEoABCu7AFAABgAyAAQrugADABgAUBESOUEhAAYAIQAWACEAJgAhADYAIQBGACEAVgAhAGYAIQB2ACEAhgAhAJYAIQCmACEAtgAhAMYAIQDWACEA5gAhAPYAIQAQXUEhAAYAIQAWACEAJgAhADYAIQBGACEAVgAhAGYAIQB2ACEAhgAhAJYAIQCmACEAtgAhAMYAIQDWACEA5gAhAPYAIQAQcUEHAAYAIQAWACEAJgAhAANyQQUANQAhAEUAIQACcroADwAYACEREjm4AA8vuQAEAAb0QQUAOgAyAEoAMgACckEhAAkAMgAZADIAKQAyADkAMgBJADIAWQAyAGkAMgB5ADIAiQAyAJkAMgCpADIAuQAyAMkAMgDZADIA6QAyAPkAMgAQXUEhAAkAMgAZADIAKQAyADkAMgBJADIAWQAyAGkAMgB5ADIAiQAyAJkAMgCpADIAuQAyAMkAMgDZADIA6QAyAPkAMgAQcUEHAAkAMgAZADIAKQAyAANyugBHABgAUBESOUEFADoASgBKAEoAAnJBIQAJAEoAGQBKACkASgA5AEoASQBKAFkASgBpAEoAeQBKAIkASgCZAEoAqQBKALkASgDJAEoA2QBKAOkASgD5AEoAEF1BIQAJAEoAGQBKACkASgA5AEoASQBKAFkASgBpAEoAeQBKAIkASgCZAEoAqQBKALkASgDJAEoA2QBKAOkASgD5AEoAEHFBBwAJAEoAGQBKACkASgADcroAUwAyAFAREjm4AFAQuABW3AC4AABFWLgAAC8buQAAAAo+WbgAAEVYuABBLxu5AEEACj5ZuwAfAAEAGgAEK7sADAABAAcABCu7AE0AAQA1AAQruAAfELgAAtC4AAIvugADABoAHxESObgAHxC4ABHcugAkAB8AERESObgAQRC5AC8AAfRBIQAHAC8AFwAvACcALwA3AC8ARwAvAFcALwBnAC8AdwAvAIcALwCXAC8ApwAvALcALwDHAC8A1wAvAOcALwD3AC8AEF1BIQAHAC8AFwAvACcALwA3AC8ARwAvAFcALwBnAC8AdwAvAIcALwCXAC8ApwAvALcALwDHAC8A1wAvAOcALwD3AC8AEHFBBwAHAC8AFwAvACcALwADckEFADYALwBGAC8AAnIwMRcjATMHFAYHBic3FjMyNjU0IyIHJzY3NjU0IyIHJzYzMhUUBgcWATQmJw4BFRQWMzI2JzQmIyIGFRQWFz4BFxQGIyImNTQ2Ny4BNTQ2MzIWFRQGBxaHIQEcIcw8MSwbDxceJSoqHBAOMgYXIS0NHRs/PxwRQgEEHBwcHB8ZGCAJGRYWGRkWFhkqLyopMBgSEg8sJCQsDxEpCQHctS43AQEVIBMmHiwOGSMFExIULA8+NBImBwr+8hUjAgIiFhYbG5wPGRkPDhcGBRl3JywsJxgmDAodESEpKSERHQoXAAUAG//3AfwB0wADACAALAA4AE8DbbsABAAGABAABCu7ADMABgBFAAQruwBLAAYALQAEK7oAAwAQAEsREjlBIQAGAAQAFgAEACYABAA2AAQARgAEAFYABABmAAQAdgAEAIYABACWAAQApgAEALYABADGAAQA1gAEAOYABAD2AAQAEF1BIQAGAAQAFgAEACYABAA2AAQARgAEAFYABABmAAQAdgAEAIYABACWAAQApgAEALYABADGAAQA1gAEAOYABAD2AAQAEHFBBwAGAAQAFgAEACYABAADckEFADUABABFAAQAAnJBBQA6AC0ASgAtAAJyQSEACQAtABkALQApAC0AOQAtAEkALQBZAC0AaQAtAHkALQCJAC0AmQAtAKkALQC5AC0AyQAtANkALQDpAC0A+QAtABBdQSEACQAtABkALQApAC0AOQAtAEkALQBZAC0AaQAtAHkALQCJAC0AmQAtAKkALQC5AC0AyQAtANkALQDpAC0A+QAtABBxQQcACQAtABkALQApAC0AA3K6AEIAEABLERI5QQUAOgBFAEoARQACckEhAAkARQAZAEUAKQBFADkARQBJAEUAWQBFAGkARQB5AEUAiQBFAJkARQCpAEUAuQBFAMkARQDZAEUA6QBFAPkARQAQXUEhAAkARQAZAEUAKQBFADkARQBJAEUAWQBFAGkARQB5AEUAiQBFAJkARQCpAEUAuQBFAMkARQDZAEUA6QBFAPkARQAQcUEHAAkARQAZAEUAKQBFAANyugBOAC0ASxESObgASxC4AFHcALgAAi+4ABcvuAAARVi4AAAvG7kAAAAKPlm4AABFWLgAPC8buQA8AAo+WbsAGAABABkABCu7AB4AAQATAAQruwANAAEABwAEK7sASAABADAABCu4ABgQuAAD0LgAAy+6ABsAEwAeERI5uAA8ELkAKgAB9EEhAAcAKgAXACoAJwAqADcAKgBHACoAVwAqAGcAKgB3ACoAhwAqAJcAKgCnACoAtwAqAMcAKgDXACoA5wAqAPcAKgAQXUEhAAcAKgAXACoAJwAqADcAKgBHACoAVwAqAGcAKgB3ACoAhwAqAJcAKgCnACoAtwAqAMcAKgDXACoA5wAqAPcAKgAQcUEHAAcAKgAXACoAJwAqAANyQQUANgAqAEYAKgACcroAQgAAAAIREjm6AE4AAAACERI5MDEXIwEzBxQGIyInNx4BMzI2NTQmIyIPATczByMHNjIzMhYFNCYnDgEVFBYzMjYnNCYjIgYVFBYXPgEXFAYjIiY1NDY3LgE1NDYzMhYVFAYHFochARwhzz4zLRsOEB0RHS4mGBYPFQmJBGQFBw0IKDEBBxwcHBwfGRggCRkWFhkZFhYZKi8qKTAYEhIPLCQkLA8RKQkB3LUvOhwZCgomIRkcFAGVH0ECM/YVIwICIhYWGxucDxkZDw4XBgUZdycsLCcYJgwKHREhKSkhER0KFwAAAAAFACz/9wH8AdMAAwAOABoAJgA9ApG7AAcABQAIAAQruwAhAAYAMwAEK7sAOQAGABsABCu6AAMACAA5ERI5ugALAAgAORESOUEFADoAGwBKABsAAnJBIQAJABsAGQAbACkAGwA5ABsASQAbAFkAGwBpABsAeQAbAIkAGwCZABsAqQAbALkAGwDJABsA2QAbAOkAGwD5ABsAEF1BIQAJABsAGQAbACkAGwA5ABsASQAbAFkAGwBpABsAeQAbAIkAGwCZABsAqQAbALkAGwDJABsA2QAbAOkAGwD5ABsAEHFBBwAJABsAGQAbACkAGwADcroAMAAIADkREjlBBQA6ADMASgAzAAJyQSEACQAzABkAMwApADMAOQAzAEkAMwBZADMAaQAzAHkAMwCJADMAmQAzAKkAMwC5ADMAyQAzANkAMwDpADMA+QAzABBdQSEACQAzABkAMwApADMAOQAzAEkAMwBZADMAaQAzAHkAMwCJADMAmQAzAKkAMwC5ADMAyQAzANkAMwDpADMA+QAzABBxQQcACQAzABkAMwApADMAA3K6ADwAGwA5ERI5uAA5ELgAP9wAuAAARVi4AAAvG7kAAAAKPlm4AABFWLgAKi8buQAqAAo+WbsADgABAAsABCu7ADYAAQAeAAQruAAOELgAAtC4ACoQuQAYAAH0QSEABwAYABcAGAAnABgANwAYAEcAGABXABgAZwAYAHcAGACHABgAlwAYAKcAGAC3ABgAxwAYANcAGADnABgA9wAYABBdQSEABwAYABcAGAAnABgANwAYAEcAGABXABgAZwAYAHcAGACHABgAlwAYAKcAGAC3ABgAxwAYANcAGADnABgA9wAYABBxQQcABwAYABcAGAAnABgAA3JBBQA2ABgARgAYAAJyMDEXIwEzBw4BFSM+ATcjNzMTNCYnDgEVFBYzMjYnNCYjIgYVFBYXPgEXFAYjIiY1NDY3LgE1NDYzMhYVFAYHFochARwhviYxJQEqJ48Pr/EcHBwcHxkYIAkZFhYZGRYWGSovKikwGBISDywkJCwPESkJAdwgNHFVSHY7If54FSMCAiIWFhsbnA8ZGQ8OFwYFGXcnLCwnGCYMCh0RISkpIREdChcAAAD//wA4//oBigIiACYBIAAAAAYAA3UvAAD//wAa/zgCBwGQACIA+QAAAAMBFgFyAAD//wAY/zgCNQGQACMBFgGgAAAAAgD7AAD//wAY/yUBcQGQAgIA4wAAAAMAHv/3AgEB0wADAA8AMQKfuwAOAAUABwAEK7sALQAGACQABCu6AAEABwAOERI5QQUAOgAkAEoAJAACckEhAAkAJAAZACQAKQAkADkAJABJACQAWQAkAGkAJAB5ACQAiQAkAJkAJACpACQAuQAkAMkAJADZACQA6QAkAPkAJAAQXUEhAAkAJAAZACQAKQAkADkAJABJACQAWQAkAGkAJAB5ACQAiQAkAJkAJACpACQAuQAkAMkAJADZACQA6QAkAPkAJAAQcUEHAAkAJAAZACQAKQAkAANyugAbACQALRESObgAGy9BBQA6ABsASgAbAAJyQSEACQAbABkAGwApABsAOQAbAEkAGwBZABsAaQAbAHkAGwCJABsAmQAbAKkAGwC5ABsAyQAbANkAGwDpABsA+QAbABBdQSEACQAbABkAGwApABsAOQAbAEkAGwBZABsAaQAbAHkAGwCJABsAmQAbAKkAGwC5ABsAyQAbANkAGwDpABsA+QAbABBxQQcACQAbABkAGwApABsAA3K5ABAABvS6AAMABwAQERI5ugAwAAcAEBESObgAM9wAuAACL7gACy+4AABFWLgAAC8buQAAAAo+WbgAAEVYuAATLxu5ABMACj5ZugArAB0AAyu6AAgAAAACERI5uAATELkAGAAB9EEhAAcAGAAXABgAJwAYADcAGABHABgAVwAYAGcAGAB3ABgAhwAYAJcAGACnABgAtwAYAMcAGADXABgA5wAYAPcAGAAQXUEhAAcAGAAXABgAJwAYADcAGABHABgAVwAYAGcAGAB3ABgAhwAYAJcAGACnABgAtwAYAMcAGADXABgA5wAYAPcAGAAQcUEHAAcAGAAXABgAJwAYAANyQQUANgAYAEYAGAACcrgAKxC5ACYAAfS6ADAAHQArERI5MDEXIwEzASM1MzUHJzcWHQEzBRQGBwYnNxYzMjY1NCMiByc2NzY1NCMiByc2MzIVFAYHFpIhARwh/vd6LCYTRxUrAVw8MSwbDxceJSoqHBAOMgYXIS0NHRs/PxwRQgkB3P7nGMkhGD8CGuNtLjcBARUgEyYeLA4ZIwUTEhQsDz40EiYHCgADABD/9wIBAdcAAwAlADwDb7sANwAFACwABCu7ACEABgAYAAQrQQUAOgAYAEoAGAACckEhAAkAGAAZABgAKQAYADkAGABJABgAWQAYAGkAGAB5ABgAiQAYAJkAGACpABgAuQAYAMkAGADZABgA6QAYAPkAGAAQXUEhAAkAGAAZABgAKQAYADkAGABJABgAWQAYAGkAGAB5ABgAiQAYAJkAGACpABgAuQAYAMkAGADZABgA6QAYAPkAGAAQcUEHAAkAGAAZABgAKQAYAANyugAPABgAIRESObgADy9BBQA6AA8ASgAPAAJyQSEACQAPABkADwApAA8AOQAPAEkADwBZAA8AaQAPAHkADwCJAA8AmQAPAKkADwC5AA8AyQAPANkADwDpAA8A+QAPABBdQSEACQAPABkADwApAA8AOQAPAEkADwBZAA8AaQAPAHkADwCJAA8AmQAPAKkADwC5AA8AyQAPANkADwDpAA8A+QAPABBxQQcACQAPABkADwApAA8AA3K5AAQABvS6AAMALAAEERI5ugAkACwABBESOUEhAAYANwAWADcAJgA3ADYANwBGADcAVgA3AGYANwB2ADcAhgA3AJYANwCmADcAtgA3AMYANwDWADcA5gA3APYANwAQXUEhAAYANwAWADcAJgA3ADYANwBGADcAVgA3AGYANwB2ADcAhgA3AJYANwCmADcAtgA3AMYANwDWADcA5gA3APYANwAQcUEHAAYANwAWADcAJgA3AANyQQUANQA3AEUANwACcrgANxC4ACbQuAAmL7gABBC4AD7cALgAAEVYuAAALxu5AAAACj5ZuAAARVi4AAcvG7kABwAKPlm7ADQAAQAuAAQrugAfABEAAyu7ADwAAQAmAAQruAA0ELgAAtC4AAIvugADAC4ANBESObgABxC5AAwAAfRBIQAHAAwAFwAMACcADAA3AAwARwAMAFcADABnAAwAdwAMAIcADACXAAwApwAMALcADADHAAwA1wAMAOcADAD3AAwAEF1BIQAHAAwAFwAMACcADAA3AAwARwAMAFcADABnAAwAdwAMAIcADACXAAwApwAMALcADADHAAwA1wAMAOcADAD3AAwAEHFBBwAHAAwAFwAMACcADAADckEFADYADABGAAwAAnK4AB8QuQAaAAH0ugAkABEAHxESOboAOwARAB8REjkwMRcjATMTFAYHBic3FjMyNjU0IyIHJzY3NjU0IyIHJzYzMhUUBgcWJSM2Nz4BNTQjIgcnPgEzMhYVFAcGBzOSIQEcIVM8MSwbDxceJSoqHBAOMgYXIS0NHRs/PxwRQv7EtQJDGzMrMAUiBC4iJC02KSWHCQHc/pIuNwEBFSATJh4sDhkjBRMSFCwPPjQSJgcKGilAGTYbKzcGJionIyk4KikAAAAAAwAe//cCAQHTAAMADwAsAgG4AC0vuAAuL7gALRC4AAfQuAAHL7kADgAF9LoAAQAHAA4REjm4AC4QuAAQ3LoAAwAHABAREjm5ABwABvRBBQA6ABwASgAcAAJyQSEACQAcABkAHAApABwAOQAcAEkAHABZABwAaQAcAHkAHACJABwAmQAcAKkAHAC5ABwAyQAcANkAHADpABwA+QAcABBdQSEACQAcABkAHAApABwAOQAcAEkAHABZABwAaQAcAHkAHACJABwAmQAcAKkAHAC5ABwAyQAcANkAHADpABwA+QAcABBxQQcACQAcABkAHAApABwAA3K6ACcABwAQERI5ALgAAi+4AAsvuAAARVi4AAAvG7kAAAAKPlm4AABFWLgAEy8buQATAAo+WbsAKgABAB8ABCu7ACQAAQAlAAQruAAqELgABNC4AAQvugAIAAAAAhESObgAExC5ABkAAfRBIQAHABkAFwAZACcAGQA3ABkARwAZAFcAGQBnABkAdwAZAIcAGQCXABkApwAZALcAGQDHABkA1wAZAOcAGQD3ABkAEF1BIQAHABkAFwAZACcAGQA3ABkARwAZAFcAGQBnABkAdwAZAIcAGQCXABkApwAZALcAGQDHABkA1wAZAOcAGQD3ABkAEHFBBwAHABkAFwAZACcAGQADckEFADYAGQBGABkAAnK6ACcAHwAqERI5MDEXIwEzASM1MzUHJzcWHQEzBRQGIyInNx4BMzI2NTQmIyIPATczByMHNjIzMhaSIQEcIf73eiwmE0cVKwFcPjMtGw4QHREdLiYYFg8VCYkEZAUHDQgoMQkB3P7nGMkhGD8CGuNwLzocGQoKJiEZHBQBlR9BAjMAAwAQ//cCAQHXAAMAIAA3Ar+4ADgvuAA5L7gAOBC4ACfQuAAnL7gAORC4AATcugADACcABBESObkAEAAG9EEFADoAEABKABAAAnJBIQAJABAAGQAQACkAEAA5ABAASQAQAFkAEABpABAAeQAQAIkAEACZABAAqQAQALkAEADJABAA2QAQAOkAEAD5ABAAEF1BIQAJABAAGQAQACkAEAA5ABAASQAQAFkAEABpABAAeQAQAIkAEACZABAAqQAQALkAEADJABAA2QAQAOkAEAD5ABAAEHFBBwAJABAAGQAQACkAEAADcroAGwAnAAQREjm4ACcQuQAyAAX0QSEABgAyABYAMgAmADIANgAyAEYAMgBWADIAZgAyAHYAMgCGADIAlgAyAKYAMgC2ADIAxgAyANYAMgDmADIA9gAyABBdQSEABgAyABYAMgAmADIANgAyAEYAMgBWADIAZgAyAHYAMgCGADIAlgAyAKYAMgC2ADIAxgAyANYAMgDmADIA9gAyABBxQQcABgAyABYAMgAmADIAA3JBBQA1ADIARQAyAAJyuAAh0LgAIS8AuAAARVi4AAAvG7kAAAAKPlm4AABFWLgABy8buQAHAAo+WbsALwABACkABCu7AB4AAQATAAQruwAYAAEAGQAEK7gALxC4AALQuAACL7oAAwApAC8REjm4AAcQuQANAAH0QSEABwANABcADQAnAA0ANwANAEcADQBXAA0AZwANAHcADQCHAA0AlwANAKcADQC3AA0AxwANANcADQDnAA0A9wANABBdQSEABwANABcADQAnAA0ANwANAEcADQBXAA0AZwANAHcADQCHAA0AlwANAKcADQC3AA0AxwANANcADQDnAA0A9wANABBxQQcABwANABcADQAnAA0AA3JBBQA2AA0ARgANAAJyugAbABMAHhESObgAHhC4ACHQuAAhL7kANwAB9DAxFyMBMxMUBiMiJzceATMyNjU0JiMiDwE3MwcjBzYyMzIWJSM2Nz4BNTQjIgcnPgEzMhYVFAcGBzOSIQEcIVM+My0bDhAdER0uJhgWDxUJiQRkBQcNCCgx/sS1AkMbMyswBSIELiIkLTYpJYcJAdz+jy86HBkKCiYhGRwUAZUfQQIzNSlAGTYbKzcGJionIyk4KikAAAMAI//3AgEB1gADACAAQgLJuwA+AAYANQAEK7sABAAGABAABCu6AAMANQAEERI5QQUAOgAQAEoAEAACckEhAAkAEAAZABAAKQAQADkAEABJABAAWQAQAGkAEAB5ABAAiQAQAJkAEACpABAAuQAQAMkAEADZABAA6QAQAPkAEAAQXUEhAAkAEAAZABAAKQAQADkAEABJABAAWQAQAGkAEAB5ABAAiQAQAJkAEACpABAAuQAQAMkAEADZABAA6QAQAPkAEAAQcUEHAAkAEAAZABAAKQAQAANyugAbADUABBESOUEhAAYAPgAWAD4AJgA+ADYAPgBGAD4AVgA+AGYAPgB2AD4AhgA+AJYAPgCmAD4AtgA+AMYAPgDWAD4A5gA+APYAPgAQXUEhAAYAPgAWAD4AJgA+ADYAPgBGAD4AVgA+AGYAPgB2AD4AhgA+AJYAPgCmAD4AtgA+AMYAPgDWAD4A5gA+APYAPgAQcUEHAAYAPgAWAD4AJgA+AANyQQUANQA+AEUAPgACcroALAA1AD4REjm4ACwvuQAhAAb0uAAEELgARNwAuAAARVi4AAAvG7kAAAAKPlm4AABFWLgABy8buQAHAAo+WbsAPAABADcABCu7AB4AAQATAAQruwAYAAEAGQAEK7gAPBC4AALQuAACL7oAAwA3ADwREjm4AAcQuQANAAH0QSEABwANABcADQAnAA0ANwANAEcADQBXAA0AZwANAHcADQCHAA0AlwANAKcADQC3AA0AxwANANcADQDnAA0A9wANABBdQSEABwANABcADQAnAA0ANwANAEcADQBXAA0AZwANAHcADQCHAA0AlwANAKcADQC3AA0AxwANANcADQDnAA0A9wANABBxQQcABwANABcADQAnAA0AA3JBBQA2AA0ARgANAAJyugAbABMAHhESObgAHhC4ACTQuQApAAH0uAA8ELgALty6AEEAPAAuERI5MDEXIwEzExQGIyInNx4BMzI2NTQmIyIPATczByMHNjIzMhYlFAYHBic3FjMyNjU0IyIHJzY3NjU0IyIHJzYzMhUUBgcWkiEBHCFTPjMtGw4QHREdLiYYFg8VCYkEZAUHDQgoMf7WPDEsGw8XHiUqKhwQDjIGFyEtDR0bPz8cEUIJAdz+jy86HBkKCiYhGRwUAZUfQQIzmS43AQEVIBMmHiwOGSMFExIULA8+NBImBwoAAAAABAAg//cCAQHiAAMAIAAmADICMroAKAAsAAMruwAEAAYAEAAEK7oAAQAsACgREjm6AAMALAAEERI5QQUAOgAQAEoAEAACckEhAAkAEAAZABAAKQAQADkAEABJABAAWQAQAGkAEAB5ABAAiQAQAJkAEACpABAAuQAQAMkAEADZABAA6QAQAPkAEAAQXUEhAAkAEAAZABAAKQAQADkAEABJABAAWQAQAGkAEAB5ABAAiQAQAJkAEACpABAAuQAQAMkAEADZABAA6QAQAPkAEAAQcUEHAAkAEAAZABAAKQAQAANyugAbACwABBESObgAKBC5ACEABfS6ACIALAAoERI5uAAq0LgAKBC4ADDQuAAEELgANNwAuAAARVi4ADAvG7kAMAASPlm4AABFWLgAAC8buQAAAAo+WbgAAEVYuAAHLxu5AAcACj5ZugAXABMAAyu7ADIAAQAnAAQrugADAAAAMBESObgABxC5AA0AAfRBIQAHAA0AFwANACcADQA3AA0ARwANAFcADQBnAA0AdwANAIcADQCXAA0ApwANALcADQDHAA0A1wANAOcADQD3AA0AEF1BIQAHAA0AFwANACcADQA3AA0ARwANAFcADQBnAA0AdwANAIcADQCXAA0ApwANALcADQDHAA0A1wANAOcADQD3AA0AEHFBBwAHAA0AFwANACcADQADckEFADYADQBGAA0AAnK6ABsAEwAXERI5uAATELkAHgAB9LgAMhC4ACHQugAiAAAAMBESObgAJxC4ACvQMDEXIwEzExQGIyInNx4BMzI2NTQmIyIPATczByMHNjIzMhYlNQYHBgcXIxUjNSM2NzY3FTOSIQEcIVM+My0bDhAdER0uJhgWDxUJiQRkBQcNCCgx/o8cFxYCmCojcAElLEEsCQHc/o8vOhwZCgomIRkcFAGVH0ECM56UGDAsICE+PkNGVQK/AAAEAB7/9wH4AdMAAwAPACMALwKRuwAOAAUABwAEK7sAKgAFABcABCu7ABAABgAkAAQrugABAAcADhESOboAAwAHABAREjlBBQA6ABcASgAXAAJyQSEACQAXABkAFwApABcAOQAXAEkAFwBZABcAaQAXAHkAFwCJABcAmQAXAKkAFwC5ABcAyQAXANkAFwDpABcA+QAXABBdQSEACQAXABkAFwApABcAOQAXAEkAFwBZABcAaQAXAHkAFwCJABcAmQAXAKkAFwC5ABcAyQAXANkAFwDpABcA+QAXABBxQQcACQAXABkAFwApABcAA3K6AB8ABwAQERI5QQUAOgAkAEoAJAACckEhAAkAJAAZACQAKQAkADkAJABJACQAWQAkAGkAJAB5ACQAiQAkAJkAJACpACQAuQAkAMkAJADZACQA6QAkAPkAJAAQXUEhAAkAJAAZACQAKQAkADkAJABJACQAWQAkAGkAJAB5ACQAiQAkAJkAJACpACQAuQAkAMkAJADZACQA6QAkAPkAJAAQcUEHAAkAJAAZACQAKQAkAANyuAAQELgAMdwAuAACL7gACy+4AABFWLgAAC8buQAAAAo+WbgAAEVYuAATLxu5ABMACj5ZuwAhAAIAJwAEK7oACAAAAAIREjm6AB8AJwAhERI5uAATELkALQAB9EEhAAcALQAXAC0AJwAtADcALQBHAC0AVwAtAGcALQB3AC0AhwAtAJcALQCnAC0AtwAtAMcALQDXAC0A5wAtAPcALQAQXUEhAAcALQAXAC0AJwAtADcALQBHAC0AVwAtAGcALQB3AC0AhwAtAJcALQCnAC0AtwAtAMcALQDXAC0A5wAtAPcALQAQcUEHAAcALQAXAC0AJwAtAANyQQUANgAtAEYALQACcjAxFyMBMwMjNTM1Byc3Fh0BMwUUBiMiJyY1NDY3FwYHBgc2MzIWBzQmIyIGFRQWMzI2hyEBHCH+eiwmE0cVKwFTLSYwGRdaRQEqIh0NFSQgMCIdGRkfHxkaHAkB3P7nGMkhGD8CGuN8JzQgHStFbQsbDB8aIBIvLRskJBsaIiIAAAAEABv/9wH4AdMAAwAXACMAQANhuwAkAAYAMAAEK7sAHgAFAAsABCu7AAQABgAYAAQrugADADAABBESOUEFADoACwBKAAsAAnJBIQAJAAsAGQALACkACwA5AAsASQALAFkACwBpAAsAeQALAIkACwCZAAsAqQALALkACwDJAAsA2QALAOkACwD5AAsAEF1BIQAJAAsAGQALACkACwA5AAsASQALAFkACwBpAAsAeQALAIkACwCZAAsAqQALALkACwDJAAsA2QALAOkACwD5AAsAEHFBBwAJAAsAGQALACkACwADcroAEwAwAAQREjlBBQA6ABgASgAYAAJyQSEACQAYABkAGAApABgAOQAYAEkAGABZABgAaQAYAHkAGACJABgAmQAYAKkAGAC5ABgAyQAYANkAGADpABgA+QAYABBdQSEACQAYABkAGAApABgAOQAYAEkAGABZABgAaQAYAHkAGACJABgAmQAYAKkAGAC5ABgAyQAYANkAGADpABgA+QAYABBxQQcACQAYABkAGAApABgAA3JBIQAGACQAFgAkACYAJAA2ACQARgAkAFYAJABmACQAdgAkAIYAJACWACQApgAkALYAJADGACQA1gAkAOYAJAD2ACQAEF1BIQAGACQAFgAkACYAJAA2ACQARgAkAFYAJABmACQAdgAkAIYAJACWACQApgAkALYAJADGACQA1gAkAOYAJAD2ACQAEHFBBwAGACQAFgAkACYAJAADckEFADUAJABFACQAAnK4AAQQuABC3AC4AAIvuAA3L7gAAEVYuAAALxu5AAAACj5ZuAAARVi4AAcvG7kABwAKPlm7ADgAAQA5AAQruwA+AAEAMwAEK7sAFQACABsABCu4ADgQuAAD0LgAAy+6ABMAGwAVERI5uAAHELkAIQAB9EEhAAcAIQAXACEAJwAhADcAIQBHACEAVwAhAGcAIQB3ACEAhwAhAJcAIQCnACEAtwAhAMcAIQDXACEA5wAhAPcAIQAQXUEhAAcAIQAXACEAJwAhADcAIQBHACEAVwAhAGcAIQB3ACEAhwAhAJcAIQCnACEAtwAhAMcAIQDXACEA5wAhAPcAIQAQcUEHAAcAIQAXACEAJwAhAANyQQUANgAhAEYAIQACcrgAFRC4ACfQuAAnL7kALQAB9LoAOwAzAD4REjkwMRcjATMTFAYjIicmNTQ2NxcGBwYHNjMyFgc0JiMiBhUUFjMyNiUUBiMiJzceATMyNjU0JiMiDwE3MwcjBzYyMzIWhyEBHCFVLSYwGRdaRQEqIh0NFSQgMCIdGRkfHxkaHP7+PjMtGw4QHREdLiYYFg8VCYkEZAUHDQgoMQkB3P6DJzQgHStFbQsbDB8aIBIvLRskJBsaIiLiLzocGQoKJiEZHBQBlR9BAjMAAAABABQApQDDAMYAAwANALsAAwABAAAABCswMTcjNTPDr6+lIQACAAAAAAAA/90AHgAAAAAAAAAAAAAAAAAAAAAAAAAAAf8AAACsAAQABQAGAAcACAAJAAoACwAMAA0ADgAPABAAEQASABMAFAAVABYAFwAYABkAGgAbABwAHQAeAB8AIAAhACIAIwAkACUAJgAnACgAKQAqACsALAAtAC4ALwAwADEAMgAzADQANQA2ADcAOAA5ADoAOwA8AD0APgA/AEAAQQBCAEMARABFAEYARwBIAEkASgBLAEwATQBOAE8AUABRAFIAUwBUAFUAVgBXAFgAWQBaAFsAXABdAF4AXwBgAGEBAgAAAQMBBACjAIQAhQC9AJYA6ACGAI4AiwCdAKkApACKANoAgwCTAPIA8wCNAJcAiADDAN4A8QCeAKoA9QD0APYAogCtAMkAxwCuAGIAYwCQAGQAywBlAMgAygDPAMwAzQDOAOkAZgDTANAA0QCvAGcA8ACRANYA1ADVAGgA6wDtAIkAagBpAGsAbQBsAG4AoABvAHEAcAByAHMAdQB0AHYAdwDqAHgAegB5AHsAfQB8ALgAoQB/AH4AgACBAOwA7gC6ANcA4gDjALAAsQDkAOUAuwDmAOcApgDYAOEA2wDcAN0A4ADZAN8BBQEGAQcBCAEJAQoBCwEMAQ0BDgEPARABEQESARMBFAEVARYBFwEYARkBGgEbARwBHQEeAR8BIAEhASIBIwEkASUBJgEnASgBKQEqASsBLAEtAS4BLwEwATEBMgEzATQBNQE2ATcBOAE5AToBOwE8AT0BPgE/AUABQQFCAUMBRAFFAUYBRwFIAUkBSgFLAUwBTQFOAU8BUAFRAVIBUwFUAVUBVgFXAVgBWQFaAVsBXAFdAV4BXwFgALIAswC2ALcAxAC0ALUAxQCCAMIAhwCrAMYBYQFiAL4AvwC8AWMBZACMAWUBZgCYAKgAmgCZAO8ApQCSAJwApwCPAJQAlQC5AWcBaAFpAWoBawFsAW0BbgFvAXABcQFyAXMBdAF1AXYBdwF4AXkBegF7AXwBfQF+AX8BgAGBAYIBgwGEAMAAwQGFAYYBhwGIAYkBigGLAYwBjQGOAY8BkAGRAZIBkwGUAZUBlgGXAZgBmQGaAZsBnAGdAZ4BnwGgAaEBogGjAaQBpQGmAacBqAGpAaoBqwGsAa0BrgGvAbABsQGyAbMBtAG1AbYBtwG4AbkBugG7AbwBvQG+Ab8BwAHBAcIBwwHEAcUBxgHHAcgByQHKAcsBzAHNAc4BzwHQAdEB0gHTAdQB1QHWAdcB2AHZAdoB2wHcAd0B3gHfAPcB4AHhAeIA/QD+AP8BAAHjAQEA+AD5AeQB5QD6APsA/AHmAecB6AHpAeoB6wHsAe0B7gHvAfAB8QHyAfMB9AADAfUB9gH3AfgB+QH6AfsB/AH9Af4B/wIAAgEAAgx1bmkwRTMzLmFsdDEGQ1IuMDAxDHVuaTBFNEUuYWx0MQd1bmkwRTAwB3VuaTBFMDEHdW5pMEUwMgd1bmkwRTAzB3VuaTBFMDQHdW5pMEUwNQd1bmkwRTA2B3VuaTBFMDcHdW5pMEUwOAd1bmkwRTA5B3VuaTBFMEEHdW5pMEUwQgd1bmkwRTBDB3VuaTBFMEQHdW5pMEUwRQd1bmkwRTBGB3VuaTBFMTAHdW5pMEUxMQd1bmkwRTEyB3VuaTBFMTMHdW5pMEUxNAd1bmkwRTE1B3VuaTBFMTYHdW5pMEUxNwd1bmkwRTE4B3VuaTBFMTkHdW5pMEUxQQd1bmkwRTFCB3VuaTBFMUMHdW5pMEUxRAd1bmkwRTFFB3VuaTBFMUYHdW5pMEUyMAd1bmkwRTIxB3VuaTBFMjIHdW5pMEUyMwd1bmkwRTI0B3VuaTBFMjUHdW5pMEUyNgd1bmkwRTI3B3VuaTBFMjgHdW5pMEUyOQd1bmkwRTJBB3VuaTBFMkIHdW5pMEUyQwd1bmkwRTJEB3VuaTBFMkUHdW5pMEUyRgd1bmkwRTMwB3VuaTBFMzEHdW5pMEUzMgd1bmkwRTMzB3VuaTBFMzQHdW5pMEUzNQd1bmkwRTM2B3VuaTBFMzcHdW5pMEUzOAd1bmkwRTM5B3VuaTBFM0EHdW5pMEUzRgd1bmkwRTQwB3VuaTBFNDEHdW5pMEU0Mgd1bmkwRTQzB3VuaTBFNDQHdW5pMEU0NQd1bmkwRTQ2B3VuaTBFNDcHdW5pMEU0OAd1bmkwRTQ5B3VuaTBFNEEHdW5pMEU0Qgd1bmkwRTRDB3VuaTBFNEQHdW5pMEU0RQd1bmkwRTRGB3VuaTBFNTAHdW5pMEU1MQd1bmkwRTUyB3VuaTBFNTMHdW5pMEU1NAd1bmkwRTU1B3VuaTBFNTYHdW5pMEU1Nwd1bmkwRTU4B3VuaTBFNTkHdW5pMEU1QQd1bmkwRTVCEnplcm93aWR0aG5vbmpvaW5lcg96ZXJvd2lkdGhqb2luZXIPbGVmdHRvcmlnaHRtYXJrD3JpZ2h0dG9sZWZ0bWFyawZtaW51dGUGc2Vjb25kBEV1cm8HdW5pMjExMwNPaG0JZXN0aW1hdGVkDGRvdHRlZGNpcmNsZQx1bmkwRTEwLmFsdDEMdW5pMEUzNC5hbHQxDHVuaTBFMzUuYWx0MQx1bmkwRTM2LmFsdDEMdW5pMEUzNy5hbHQxDHVuaTBFNDguYWx0MQx1bmkwRTQ5LmFsdDEMdW5pMEU0QS5hbHQxDHVuaTBFNEIuYWx0MQx1bmkwRTRDLmFsdDEMdW5pMEU0OC5hbHQyDHVuaTBFNDkuYWx0Mgx1bmkwRTRBLmFsdDIMdW5pMEU0Qi5hbHQyDHVuaTBFNEMuYWx0Mgx1bmkwRTBELmFsdDEMdW5pMEUzMS5hbHQxDHVuaTBFNEQuYWx0MQx1bmkwRTQ3LmFsdDEMdW5pMEU0OC5hbHQzDHVuaTBFNDkuYWx0Mwx1bmkwRTRBLmFsdDMMdW5pMEU0Qi5hbHQzDHVuaTBFNEMuYWx0Mwx1bmkwRTM4LmFsdDEMdW5pMEUzOS5hbHQxDHVuaTBFM0EuYWx0MQx1bmkwRTBGLmFsdDEMdW5pMEUyQy5hbHQxA1BTSwd1bmkxRUEwB3VuaTFFQTEHdW5pMUVBMgd1bmkxRUEzB3VuaTFFQTQHdW5pMUVBNQd1bmkxRUE2B3VuaTFFQTcHdW5pMUVBOAd1bmkxRUE5B3VuaTFFQUEHdW5pMUVBQgd1bmkxRUFDB3VuaTFFQUQHdW5pMUVBRQd1bmkxRUFGB3VuaTFFQjAHdW5pMUVCMQd1bmkxRUIyB3VuaTFFQjMHdW5pMUVCNAd1bmkxRUI1B3VuaTFFQjYHdW5pMUVCNwd1bmkxRUI4B3VuaTFFQjkHdW5pMUVCQQd1bmkxRUJCB3VuaTFFQkMHdW5pMUVCRAd1bmkxRUJFB3VuaTFFQkYHdW5pMUVDMAd1bmkxRUMxB3VuaTFFQzIHdW5pMUVDMwd1bmkxRUM0B3VuaTFFQzUHdW5pMUVDNgd1bmkxRUM3B3VuaTFFQzgHdW5pMUVDOQd1bmkxRUNBB3VuaTFFQ0IHdW5pMUVDQwd1bmkxRUNEB3VuaTFFQ0UHdW5pMUVDRgd1bmkxRUQwB3VuaTFFRDEHdW5pMUVEMgd1bmkxRUQzB3VuaTFFRDQHdW5pMUVENQd1bmkxRUQ2B3VuaTFFRDcHdW5pMUVEOAd1bmkxRUQ5B3VuaTFFREEHdW5pMUVEQgd1bmkxRURDB3VuaTFFREQHdW5pMUVERQd1bmkxRURGB3VuaTFFRTAHdW5pMUVFMQd1bmkxRUUyB3VuaTFFRTMHdW5pMUVFNAd1bmkxRUU1B3VuaTFFRTYHdW5pMUVFNwd1bmkxRUU4B3VuaTFFRTkHdW5pMUVFQQd1bmkxRUVCB3VuaTFFRUMHdW5pMUVFRAd1bmkxRUVFB3VuaTFFRUYHdW5pMUVGMAd1bmkxRUYxBllncmF2ZQZ5Z3JhdmUHdW5pMUVGNAd1bmkxRUY1B3VuaTFFRjYHdW5pMUVGNwd1bmkxRUY4B3VuaTFFRjkEZG9uZwZBYnJldmUGYWJyZXZlBkRjcm9hdAZJdGlsZGUGaXRpbGRlBlV0aWxkZQZ1dGlsZGUFT2hvcm4Fb2hvcm4FVWhvcm4FdWhvcm4NaG9va2Fib3ZlY29tYgl0aWxkZWNvbWIJYWN1dGVjb21iDGRvdGJlbG93Y29tYglncmF2ZWNvbWIJb25lZWlnaHRoDHRocmVlZWlnaHRocwtmaXZlZWlnaHRocwxzZXZlbmVpZ2h0aHMMdW5pMEU0Ri5saWdhDHVuaTBFMjQubGlnYQx1bmkwRTI2LmxpZ2EMdW5pMEUwRS5hbHQxCG9uZXRoaXJkCXR3b3RoaXJkcwd1bmkyMTU1B3VuaTIxNTYHdW5pMjE1Nwd1bmkyMTU4B3VuaTIxNTkHdW5pMjE1QQd1bmkwMEFEAAAAAAEAAAYUAAEBAQYAAAgABgAiADX/2AAiADf/zgAiADj/0wAiADr/2AAiAFr/8QAiAMH/8QAiAMn/2AAnACL/2AAnAIL/2AAnAIP/2AAnAIT/2AAnAIX/2AAnAIb/2AAnAIf/2AAnAIj/zgAtADX/sAAtADf/sAAtADj/ugAtADr/ugAtAMn/ugAxACL/zgAxACv/xAAxAIL/zgAxAIP/zgAxAIT/zgAxAIX/zgAxAIb/zgAxAIf/zgA1ACL/2AA1ACv/2AA1AEL/4gA1AET/4gA1AEb/4gA1AEj/3QA1AE7/4gA1AE//4gA1AFD/4gA1AFH/4gA1AFL/4gA1AFP/4gA1AFT/4gA1AFb/4gA1AFf/4gA1AFj/4gA1AFn/4gA1AFr/4gA1AFv/4gA1AIL/2AA1AIP/2AA1AIT/2AA1AIX/2AA1AIb/2AA1AIf/2AA1AKL/4gA1AKP/4gA1AKT/4gA1AKX/4gA1AKb/4gA1AKf/4gA1AKj/4gA1AKn/4gA1AKr/4gA1AKv/4gA1AKz/4gA1AK3/4gA1ALP/4gA1ALT/4gA1ALX/4gA1ALb/4gA1ALf/4gA1ALj/4gA1ALr/4gA1ALv/4gA1ALz/4gA1AL3/4gA1AL7/4gA1AMH/4gA1AMb/4gA3ACL/zgA3ACv/2AA3AET/4gA3AEb/4gA3AEj/4gA3AFD/4gA3AFL/4gA3AFT/7AA3AIL/zgA3AIP/zgA3AIT/zgA3AIX/zgA3AIb/zgA3AIf/zgA3AKn/4gA3AKr/4gA3AKv/4gA3AKz/4gA3AK3/4gA3ALT/4gA3ALX/4gA3ALb/4gA3ALf/4gA3ALj/4gA3ALr/4gA3AMb/4gA4ACL/0wA4AET/7AA4AEb/7AA4AEj/7AA4AFD/7AA4AFL/7AA4AFT/7AA4AIL/0wA4AIP/0wA4AIT/0wA4AIX/0wA4AIb/0wA4AIf/0wA4AKn/7AA4AKr/7AA4AKv/7AA4AKz/7AA4AK3/7AA4ALT/7AA4ALX/7AA4ALb/7AA4ALf/7AA4ALj/7AA4ALr/7AA4AMb/7AA6ACL/2AA6AEL/7AA6AET/5wA6AEb/5wA6AEj/5wA6AE7/7AA6AE//7AA6AFD/5wA6AFH/7AA6AFL/5wA6AFP/7AA6AFT/5wA6AFb/7AA6AIL/2AA6AIP/2AA6AIT/2AA6AIX/2AA6AIb/2AA6AIf/2AA6AKL/7AA6AKP/7AA6AKT/7AA6AKX/7AA6AKb/7AA6AKf/7AA6AKj/7AA6AKn/5wA6AKr/5wA6AKv/5wA6AKz/5wA6AK3/5wA6ALP/7AA6ALT/5wA6ALX/5wA6ALb/5wA6ALf/5wA6ALj/5wA6ALr/5wA6ALv/7AA6ALz/7AA6AL3/7AA6AL7/7AA6AMb/5wCCADX/2ACCADf/zgCCADj/0wCCADr/2ACCAFr/8QCCAMH/8QCCAMn/2ACDADX/2ACDADf/zgCDADj/0wCDADr/2ACDAFr/8QCDAMH/8QCDAMn/2ACEADX/2ACEADf/zgCEADj/0wCEADr/2ACEAFr/8QCEAMH/8QCEAMn/2ACFADX/2ACFADf/zgCFADj/0wCFADr/2ACFAFr/8QCFAMH/8QCFAMn/2ACGADX/2ACGADf/zgCGADj/0wCGADr/2ACGAFr/8QCGAMH/8QCGAMn/2ACHADX/2ACHADf/zgCHADj/0wCHADr/2ACHAFr/8QCHAMH/8QCHAMn/2ADJACL/2ADJAEL/7ADJAET/5wDJAEb/5wDJAEj/5wDJAE7/7ADJAE//7ADJAFD/5wDJAFH/7ADJAFL/5wDJAFP/7ADJAFT/5wDJAFb/7ADJAIL/2ADJAIP/2ADJAIT/2ADJAIX/2ADJAIb/2ADJAIf/2ADJAKL/7ADJAKP/7ADJAKT/7ADJAKX/7ADJAKb/7ADJAKf/7ADJAKj/7ADJAKn/5wDJAKr/5wDJAKv/5wDJAKz/5wDJAK3/5wDJALP/7ADJALT/5wDJALX/5wDJALb/5wDJALf/5wDJALj/5wDJALr/5wDJALv/7ADJALz/7ADJAL3/7ADJAL7/7ADJAMb/5wABAAAACgAAABoAAgACAXMBdAACAfIB8wACAAwABAAYACAAKAAwAAEABAFzAXQB8gHzAAEABAABAMsAAQAEAAEAywABAAQAAQFzAAEABAABAaIAAAABAAAACgAeACwAAWxhdG4ACAAEAAAAAP//AAEAAAABa2VybgAIAAAAAQAAAAEABAACAAAAAQAIAAEWvgAEAAAAJgBWAJwA8gEcAXIDSARSBVgG/gdEB4oH0AgWCFwIogpIC+4MEAwyDFQMdgyYDN4NJA1qDbAN9g48DoIOyA8OD1QPmg/gEYYTLBTSFngAEQA1/9gAN//OADj/0wA6/9gAWv/xAJ//2AC///EAwf/xAMn/2AHI/9gByf/xAcr/2AHL//EBzP/YAc3/8QHO/9gBz//xABUAIv/YAIL/2ACD/9gAhP/YAIX/2ACG/9gAh//YAIj/zgF2/9gBeP/YAXr/2AF8/9gBfv/YAYD/2AGC/9gBhP/YAYb/2AGI/9gBiv/YAYz/2AHS/9gACgA1/7AAN/+wADj/ugA6/7oAn/+6AMn/ugHI/7oByv+6Acz/ugHO/7oAFQAi/84AK//EAIL/zgCD/84AhP/OAIX/zgCG/84Ah//OAXb/zgF4/84Bev/OAXz/zgF+/84BgP/OAYL/zgGE/84Bhv/OAYj/zgGK/84BjP/OAdL/zgB1ACL/2AAr/9gAQv/iAET/4gBG/+IASP/dAE7/4gBP/+IAUP/iAFH/4gBS/+IAU//iAFT/4gBW/+IAV//iAFj/4gBZ/+IAWv/iAFv/4gCC/9gAg//YAIT/2ACF/9gAhv/YAIf/2ACi/+IAo//iAKT/4gCl/+IApv/iAKf/4gCo/+IAqf/iAKr/4gCr/+IArP/iAK3/4gCy/+IAs//iALT/4gC1/+IAtv/iALf/4gC4/+IAuv/iALv/4gC8/+IAvf/iAL7/4gC//+IAwf/iAMb/4gDI/+IBdv/YAXf/4gF4/9gBef/iAXr/2AF7/+IBfP/YAX3/4gF+/9gBf//iAYD/2AGB/+IBgv/YAYP/4gGE/9gBhf/iAYb/2AGH/+IBiP/YAYn/4gGK/9gBi//iAYz/2AGN/+IBj//iAZH/4gGT/+IBlf/iAZf/4gGZ/+IBm//iAZ3/4gGj/+IBpf/iAaf/4gGp/+IBq//iAa3/4gGv/+IBsf/iAbP/4gG1/+IBt//iAbn/4gG7/+IBvf/iAb//4gHB/+IBw//iAcX/4gHH/+IByf/iAcv/4gHN/+IBz//iAdL/2AHT/+IB1f/iAdf/4gHb/90B4P/iAeL/4gHk/+IB5v/iAEIAIv/OACv/2ABE/+IARv/iAEj/4gBQ/+IAUv/iAFT/7ACC/84Ag//OAIT/zgCF/84Ahv/OAIf/zgCp/+IAqv/iAKv/4gCs/+IArf/iALL/4gC0/+IAtf/iALb/4gC3/+IAuP/iALr/4gDG/+IAyP/sAXb/zgF4/84Bev/OAXz/zgF+/84BgP/OAYL/zgGE/84Bhv/OAYj/zgGK/84BjP/OAY//4gGR/+IBk//iAZX/4gGX/+IBmf/iAZv/4gGd/+IBo//iAaX/4gGn/+IBqf/iAav/4gGt/+IBr//iAbH/4gGz/+IBtf/iAbf/4gG5/+IB0v/OAdX/4gHX/+IB2//iAeD/7AHk/+IAQQAi/9MARP/sAEb/7ABI/+wAUP/sAFL/7ABU/+wAgv/TAIP/0wCE/9MAhf/TAIb/0wCH/9MAqf/sAKr/7ACr/+wArP/sAK3/7ACy/+wAtP/sALX/7AC2/+wAt//sALj/7AC6/+wAxv/sAMj/7AF2/9MBeP/TAXr/0wF8/9MBfv/TAYD/0wGC/9MBhP/TAYb/0wGI/9MBiv/TAYz/0wGP/+wBkf/sAZP/7AGV/+wBl//sAZn/7AGb/+wBnf/sAaP/7AGl/+wBp//sAan/7AGr/+wBrf/sAa//7AGx/+wBs//sAbX/7AG3/+wBuf/sAdL/0wHV/+wB1//sAdv/7AHg/+wB5P/sAGkAIv/YAEL/7ABE/+cARv/nAEj/5wBO/+wAT//sAFD/5wBR/+wAUv/nAFP/7ABU/+cAVv/sAIL/2ACD/9gAhP/YAIX/2ACG/9gAh//YAKL/7ACj/+wApP/sAKX/7ACm/+wAp//sAKj/7ACp/+cAqv/nAKv/5wCs/+cArf/nALL/5wCz/+wAtP/nALX/5wC2/+cAt//nALj/5wC6/+cAu//sALz/7AC9/+wAvv/sAMb/5wDI/+cBdv/YAXf/7AF4/9gBef/sAXr/2AF7/+wBfP/YAX3/7AF+/9gBf//sAYD/2AGB/+wBgv/YAYP/7AGE/9gBhf/sAYb/2AGH/+wBiP/YAYn/7AGK/9gBi//sAYz/2AGN/+wBj//nAZH/5wGT/+cBlf/nAZf/5wGZ/+cBm//nAZ3/5wGj/+cBpf/nAaf/5wGp/+cBq//nAa3/5wGv/+cBsf/nAbP/5wG1/+cBt//nAbn/5wG7/+wBvf/sAb//7AHB/+wBw//sAcX/7AHH/+wB0v/YAdP/7AHV/+cB1//nAdv/5wHg/+cB4v/sAeT/5wHm/+wAEQA1/9gAN//OADj/0wA6/9gAWv/xAJ//2AC///EAwf/xAMn/2AHI/9gByf/xAcr/2AHL//EBzP/YAc3/8QHO/9gBz//xABEANf/YADf/zgA4/9MAOv/YAFr/8QCf/9gAv//xAMH/8QDJ/9gByP/YAcn/8QHK/9gBy//xAcz/2AHN//EBzv/YAc//8QARADX/2AA3/84AOP/TADr/2ABa//EAn//YAL//8QDB//EAyf/YAcj/2AHJ//EByv/YAcv/8QHM/9gBzf/xAc7/2AHP//EAEQA1/9gAN//OADj/0wA6/9gAWv/xAJ//2AC///EAwf/xAMn/2AHI/9gByf/xAcr/2AHL//EBzP/YAc3/8QHO/9gBz//xABEANf/YADf/zgA4/9MAOv/YAFr/8QCf/9gAv//xAMH/8QDJ/9gByP/YAcn/8QHK/9gBy//xAcz/2AHN//EBzv/YAc//8QARADX/2AA3/84AOP/TADr/2ABa//EAn//YAL//8QDB//EAyf/YAcj/2AHJ//EByv/YAcv/8QHM/9gBzf/xAc7/2AHP//EAaQAi/9gAQv/sAET/5wBG/+cASP/nAE7/7ABP/+wAUP/nAFH/7ABS/+cAU//sAFT/5wBW/+wAgv/YAIP/2ACE/9gAhf/YAIb/2ACH/9gAov/sAKP/7ACk/+wApf/sAKb/7ACn/+wAqP/sAKn/5wCq/+cAq//nAKz/5wCt/+cAsv/nALP/7AC0/+cAtf/nALb/5wC3/+cAuP/nALr/5wC7/+wAvP/sAL3/7AC+/+wAxv/nAMj/5wF2/9gBd//sAXj/2AF5/+wBev/YAXv/7AF8/9gBff/sAX7/2AF//+wBgP/YAYH/7AGC/9gBg//sAYT/2AGF/+wBhv/YAYf/7AGI/9gBif/sAYr/2AGL/+wBjP/YAY3/7AGP/+cBkf/nAZP/5wGV/+cBl//nAZn/5wGb/+cBnf/nAaP/5wGl/+cBp//nAan/5wGr/+cBrf/nAa//5wGx/+cBs//nAbX/5wG3/+cBuf/nAbv/7AG9/+wBv//sAcH/7AHD/+wBxf/sAcf/7AHS/9gB0//sAdX/5wHX/+cB2//nAeD/5wHi/+wB5P/nAeb/7ABpACL/2ABC/+wARP/nAEb/5wBI/+cATv/sAE//7ABQ/+cAUf/sAFL/5wBT/+wAVP/nAFb/7ACC/9gAg//YAIT/2ACF/9gAhv/YAIf/2ACi/+wAo//sAKT/7ACl/+wApv/sAKf/7ACo/+wAqf/nAKr/5wCr/+cArP/nAK3/5wCy/+cAs//sALT/5wC1/+cAtv/nALf/5wC4/+cAuv/nALv/7AC8/+wAvf/sAL7/7ADG/+cAyP/nAXb/2AF3/+wBeP/YAXn/7AF6/9gBe//sAXz/2AF9/+wBfv/YAX//7AGA/9gBgf/sAYL/2AGD/+wBhP/YAYX/7AGG/9gBh//sAYj/2AGJ/+wBiv/YAYv/7AGM/9gBjf/sAY//5wGR/+cBk//nAZX/5wGX/+cBmf/nAZv/5wGd/+cBo//nAaX/5wGn/+cBqf/nAav/5wGt/+cBr//nAbH/5wGz/+cBtf/nAbf/5wG5/+cBu//sAb3/7AG//+wBwf/sAcP/7AHF/+wBx//sAdL/2AHT/+wB1f/nAdf/5wHb/+cB4P/nAeL/7AHk/+cB5v/sAAgA1//iANj/4gDd/+wA3//iAOD/4gDm/+IA+P/nAPz/7AAIANf/4gDY/+IA3f/sAN//4gDg/+IA5v/sAPj/5wD8/+wACADX/+IA2P/iAN3/7ADf/+IA4P/iAOb/4gD4/+cA/P/sAAgA1//iANj/4gDd/+wA3//iAOD/4gDm/+IA+P/nAPz/7AAIANf/4gDY/+IA3f/sAN//4gDg/+IA5v/iAPj/5wD8/+wAEQA1/9gAN//OADj/0wA6/9gAWv/xAJ//2AC///EAwf/xAMn/2AHI/9gByf/xAcr/2AHL//EBzP/YAc3/8QHO/9gBz//xABEANf/YADf/zgA4/9MAOv/YAFr/8QCf/9gAv//xAMH/8QDJ/9gByP/YAcn/8QHK/9gBy//xAcz/2AHN//EBzv/YAc//8QARADX/2AA3/84AOP/TADr/2ABa//EAn//YAL//8QDB//EAyf/YAcj/2AHJ//EByv/YAcv/8QHM/9gBzf/xAc7/2AHP//EAEQA1/9gAN//OADj/0wA6/9gAWv/xAJ//2AC///EAwf/xAMn/2AHI/9gByf/xAcr/2AHL//EBzP/YAc3/8QHO/9gBz//xABEANf/YADf/zgA4/9MAOv/YAFr/8QCf/9gAv//xAMH/8QDJ/9gByP/YAcn/8QHK/9gBy//xAcz/2AHN//EBzv/YAc//8QARADX/2AA3/84AOP/TADr/2ABa//EAn//YAL//8QDB//EAyf/YAcj/2AHJ//EByv/YAcv/8QHM/9gBzf/xAc7/2AHP//EAEQA1/9gAN//OADj/0wA6/9gAWv/xAJ//2AC///EAwf/xAMn/2AHI/9gByf/xAcr/2AHL//EBzP/YAc3/8QHO/9gBz//xABEANf/YADf/zgA4/9MAOv/YAFr/8QCf/9gAv//xAMH/8QDJ/9gByP/YAcn/8QHK/9gBy//xAcz/2AHN//EBzv/YAc//8QARADX/2AA3/84AOP/TADr/2ABa//EAn//YAL//8QDB//EAyf/YAcj/2AHJ//EByv/YAcv/8QHM/9gBzf/xAc7/2AHP//EAEQA1/9gAN//OADj/0wA6/9gAWv/xAJ//2AC///EAwf/xAMn/2AHI/9gByf/xAcr/2AHL//EBzP/YAc3/8QHO/9gBz//xABEANf/YADf/zgA4/9MAOv/YAFr/8QCf/9gAv//xAMH/8QDJ/9gByP/YAcn/8QHK/9gBy//xAcz/2AHN//EBzv/YAc//8QARADX/2AA3/84AOP/TADr/2ABa//EAn//YAL//8QDB//EAyf/YAcj/2AHJ//EByv/YAcv/8QHM/9gBzf/xAc7/2AHP//EAaQAi/9gAQv/sAET/5wBG/+cASP/nAE7/7ABP/+wAUP/nAFH/7ABS/+cAU//sAFT/5wBW/+wAgv/YAIP/2ACE/9gAhf/YAIb/2ACH/9gAov/sAKP/7ACk/+wApf/sAKb/7ACn/+wAqP/sAKn/5wCq/+cAq//nAKz/5wCt/+cAsv/nALP/7AC0/+cAtf/nALb/5wC3/+cAuP/nALr/5wC7/+wAvP/sAL3/7AC+/+wAxv/nAMj/5wF2/9gBd//sAXj/2AF5/+wBev/YAXv/7AF8/9gBff/sAX7/2AF//+wBgP/YAYH/7AGC/9gBg//sAYT/2AGF/+wBhv/YAYf/7AGI/9gBif/sAYr/2AGL/+wBjP/YAY3/7AGP/+cBkf/nAZP/5wGV/+cBl//nAZn/5wGb/+cBnf/nAaP/5wGl/+cBp//nAan/5wGr/+cBrf/nAa//5wGx/+cBs//nAbX/5wG3/+cBuf/nAbv/7AG9/+wBv//sAcH/7AHD/+wBxf/sAcf/7AHS/9gB0//sAdX/5wHX/+cB2//nAeD/5wHi/+wB5P/nAeb/7ABpACL/2ABC/+wARP/nAEb/5wBI/+cATv/sAE//7ABQ/+cAUf/sAFL/5wBT/+wAVP/nAFb/7ACC/9gAg//YAIT/2ACF/9gAhv/YAIf/2ACi/+wAo//sAKT/7ACl/+wApv/sAKf/7ACo/+wAqf/nAKr/5wCr/+cArP/nAK3/5wCy/+cAs//sALT/5wC1/+cAtv/nALf/5wC4/+cAuv/nALv/7AC8/+wAvf/sAL7/7ADG/+cAyP/nAXb/2AF3/+wBeP/YAXn/7AF6/9gBe//sAXz/2AF9/+wBfv/YAX//7AGA/9gBgf/sAYL/2AGD/+wBhP/YAYX/7AGG/9gBh//sAYj/2AGJ/+wBiv/YAYv/7AGM/9gBjf/sAY//5wGR/+cBk//nAZX/5wGX/+cBmf/nAZv/5wGd/+cBo//nAaX/5wGn/+cBqf/nAav/5wGt/+cBr//nAbH/5wGz/+cBtf/nAbf/5wG5/+cBu//sAb3/7AG//+wBwf/sAcP/7AHF/+wBx//sAdL/2AHT/+wB1f/nAdf/5wHb/+cB4P/nAeL/7AHk/+cB5v/sAGkAIv/YAEL/7ABE/+cARv/nAEj/5wBO/+wAT//sAFD/5wBR/+wAUv/nAFP/7ABU/+cAVv/sAIL/2ACD/9gAhP/YAIX/2ACG/9gAh//YAKL/7ACj/+wApP/sAKX/7ACm/+wAp//sAKj/7ACp/+cAqv/nAKv/5wCs/+cArf/nALL/5wCz/+wAtP/nALX/5wC2/+cAt//nALj/5wC6/+cAu//sALz/7AC9/+wAvv/sAMb/5wDI/+cBdv/YAXf/7AF4/9gBef/sAXr/2AF7/+wBfP/YAX3/7AF+/9gBf//sAYD/2AGB/+wBgv/YAYP/7AGE/9gBhf/sAYb/2AGH/+wBiP/YAYn/7AGK/9gBi//sAYz/2AGN/+wBj//nAZH/5wGT/+cBlf/nAZf/5wGZ/+cBm//nAZ3/5wGj/+cBpf/nAaf/5wGp/+cBq//nAa3/5wGv/+cBsf/nAbP/5wG1/+cBt//nAbn/5wG7/+wBvf/sAb//7AHB/+wBw//sAcX/7AHH/+wB0v/YAdP/7AHV/+cB1//nAdv/5wHg/+cB4v/sAeT/5wHm/+wAaQAi/9gAQv/sAET/5wBG/+cASP/nAE7/7ABP/+wAUP/nAFH/7ABS/+cAU//sAFT/5wBW/+wAgv/YAIP/2ACE/9gAhf/YAIb/2ACH/9gAov/sAKP/7ACk/+wApf/sAKb/7ACn/+wAqP/sAKn/5wCq/+cAq//nAKz/5wCt/+cAsv/nALP/7AC0/+cAtf/nALb/5wC3/+cAuP/nALr/5wC7/+wAvP/sAL3/7AC+/+wAxv/nAMj/5wF2/9gBd//sAXj/2AF5/+wBev/YAXv/7AF8/9gBff/sAX7/2AF//+wBgP/YAYH/7AGC/9gBg//sAYT/2AGF/+wBhv/YAYf/7AGI/9gBif/sAYr/2AGL/+wBjP/YAY3/7AGP/+cBkf/nAZP/5wGV/+cBl//nAZn/5wGb/+cBnf/nAaP/5wGl/+cBp//nAan/5wGr/+cBrf/nAa//5wGx/+cBs//nAbX/5wG3/+cBuf/nAbv/7AG9/+wBv//sAcH/7AHD/+wBxf/sAcf/7AHS/9gB0//sAdX/5wHX/+cB2//nAeD/5wHi/+wB5P/nAeb/7AARADX/2AA3/84AOP/TADr/2ABa//EAn//YAL//8QDB//EAyf/YAcj/2AHJ//EByv/YAcv/8QHM/9gBzf/xAc7/2AHP//EAAQAmACIAJwAtADEANQA3ADgAOgCCAIMAhACFAIYAhwCfAMkBEQESARMBFAEVAXYBeAF6AXwBfgGAAYIBhAGGAYgBigGMAcgBygHMAc4B0gAAAAEAAAAKACQAygABbGF0bgAIAAQAAAAA//8ABAAAAAEAAgADAARjY21wABpmcmFjADJsaWdhADhybGlnAHIAAAAKADQANQA2ADcAOAA5ADoAOwA8AD0AAAABAAAAAAAbABkAGgAbABwAHQAeAB8AIAAhACIAIwAkACUAJgAnACgAKQAqACsALAAtAC4ALwAwADEAMgAzAAAAGAABAAIAAwAEAAUABgAHAAgACQAKAAsADAANAA4ADwAQABEAEgATABQAFQAWABcAGABBAIQAjACUAJwApACsALQAvADEAMwA1ADcAOQA7gD4AQABCAEQARgBIAEoATABOAFAAUgBUAFYAWABaAFwAXgBgAGIAZABmAGgAagBsgG8AcQBzAHUAdwB5AHsAfQB/AIEAgwCFAIcAiQCLAI0AjwCRAJMAlQCXAJkAmwCdAJ8AoQCjAAEAAAAAQIQAAQAAAABA1IABgAAAAEDhAAGAAAAAQOOAAYAAAABA5YABgAAAAEDoAAGAAAAAQOqAAYAAAABA7QABgAAAAEDvgAGAAAAAQPIAAYAAAABA9IABgAAAAED3AAGAAAAAgPmA/gABgAAAAIEAAQSAAYAAAABBBoABgAAAAEEJAAGAAAAAQQuAAYAAAABBDgABAAAAAEEQgAEAAAAAQRiAAQAAAABBWgABAAAAAEGFgAEAAAAAQZsAAQAAAABB3IABAAAAAEIIAAEAAAAAQh2AAYAAAABCKgABgAAAAEIsgAGAAAAAQi6AAYAAAABCMQABgAAAAEIzgAGAAAAAQjYAAYAAAABCOIABgAAAAEI7AAGAAAAAQj2AAYAAAABCQAABgAAAAIJCgkcAAYAAAACCSQJNgAGAAAAAQk+AAYAAAABCUgABgAAAAEJUgAGAAAAAQlcAAQAAAABCWYABAAAAAEJhgAEAAAAAQqMAAQAAAABCzoABAAAAAELkAAEAAAAAQyWAAQAAAABDUQABAAAAAENmgAEAAAAAQ3gAAQAAAABDiYABAAAAAEObAAEAAAAARCqAAQAAAABEngABAAAAAEUtgAEAAAAARaEAAQAAAABGMIABAAAAAEakAAEAAAAARzOAAQAAAABHpwABAAAAAEg2gABAAAAASKoAAEAAAABIuwAAQAAAAEi+gABIvgABgASAIwAtgD0AQoBNAAMABoAIgAqADIAOgBCAEoAUgBaAGIAagByAH8AAwAQABMB9QADABAAFAB+AAMAEAAVAfcAAwAQABYB+wADABAAFwHsAAMAEAAZAH8AAwFCABMB9QADAUIAFAB+AAMBQgAVAfcAAwFCABYB+wADAUIAFwHsAAMBQgAZAAQACgASABoAIgH2AAMAEAAUAfgAAwAQABYB9gADAUIAFAH4AAMBQgAWAAYADgAWAB4AJgAuADYAgAADABAAFQH5AAMAEAAWAe0AAwAQABkAgAADAUIAFQH5AAMBQgAWAe0AAwFCABkAAgAGAA4B+gADABAAFgH6AAMBQgAWAAQACgASABoAIgH8AAMAEAAXAe4AAwAQABkB/AADAUIAFwHuAAMBQgAZAAIABgAOAe8AAwAQABkB7wADAUIAGQABIb4AAwAMAB4AMAACAAYADAHyAAIBBwHyAAIBFgACAAYADAHzAAIBBwHzAAIBFgABAAQB8QACAAMAAwAAAAEhjgABIZYAAQAAAD4AAwAAAAEhjgAAAAEAAAA+AAMAASGIAAEhkgAAAAEAAAA+AAMAASF2AAEhigAAAAEAAAA+AAMAASGMAAEhbgAAAAEAAAA/AAMAASGKAAEhXAAAAAEAAABAAAMAASGIAAEhLAAAAAEAAAA+AAMAASEuAAEhggAAAAEAAAA+AAMAASF2AAEhcAAAAAEAAAA+AAMAAAABIWQAASFuAAEAAAA+AAMAASD4AAEg5AAAAAEAAAA/AAMAASFQAAEg8AAAAAEAAAA+AAMAAAABIT4AASEuAAEAAAA+AAMAASDCAAEhLAAAAAEAAAA+AAMAAAABISQAASEsAAEAAAA+AAMAAAABISQAASEqAAEAAAA+AAMAASEmAAEhLAAAAAEAAAA+AAMAAAABIIQAASDOAAEAAAA/AAEhDgABAAgAAQAEAXUADQA0ACwADwAlAEYAVABKAEgATwAJAEQACgABIOwABgASADwAZgCQALoA5AAFAAwAEgAYAB4AJAF4AAIB5wCFAAIB6ACDAAIB6QF2AAIB6gCCAAIB6wAFAAwAEgAYAB4AJAF5AAIB5wClAAIB6ACjAAIB6QF3AAIB6gCiAAIB6wAFAAwAEgAYAB4AJAF+AAIB5wGAAAIB6AF6AAIB6QGCAAIB6gF8AAIB6wAFAAwAEgAYAB4AJAF/AAIB5wGBAAIB6AF7AAIB6QGDAAIB6gF9AAIB6wAFAAwAEgAYAB4AJAGIAAIB5wGKAAIB6AGEAAIB6QGMAAIB6gGGAAIB6wAFAAwAEgAYAB4AJAGJAAIB5wGLAAIB6AGFAAIB6QGNAAIB6gGHAAIB6wABH+4ABAAOADgAYgCMAAUADAASABgAHgAkAZAAAgHnAZIAAgHoAIsAAgHpAY4AAgHqAIoAAgHrAAUADAASABgAHgAkAZEAAgHnAZMAAgHoAKsAAgHpAY8AAgHqAKoAAgHrAAUADAASABgAHgAkAZgAAgHnAZoAAgHoAZQAAgHpAZwAAgHqAZYAAgHrAAUADAASABgAHgAkAZkAAgHnAZsAAgHoAZUAAgHpAZ0AAgHqAZcAAgHrAAEfRAACAAoANAAFAAwAEgAYAB4AJAGeAAIB5wHcAAIB6ACPAAIB6QGgAAIB6gCOAAIB6wAFAAwAEgAYAB4AJAGfAAIB5wHdAAIB6ACvAAIB6QGhAAIB6gCuAAIB6wABHu4ABgASADwAZgCQALoA5AAFAAwAEgAYAB4AJAGkAAIB5wCXAAIB6ACVAAIB6QGiAAIB6gCUAAIB6wAFAAwAEgAYAB4AJAGlAAIB5wC3AAIB6AC1AAIB6QGjAAIB6gC0AAIB6wAFAAwAEgAYAB4AJAGqAAIB5wGsAAIB6AGmAAIB6QGuAAIB6gGoAAIB6wAFAAwAEgAYAB4AJAGrAAIB5wGtAAIB6AGnAAIB6QGvAAIB6gGpAAIB6wAFAAwAEgAYAB4AJAG0AAIB5wG2AAIB6AGwAAIB6QG4AAIB6gGyAAIB6wAFAAwAEgAYAB4AJAG1AAIB5wG3AAIB6AGxAAIB6QG5AAIB6gGzAAIB6wABHfAABAAOADgAYgCMAAUADAASABgAHgAkAbwAAgHnAeEAAgHoAJwAAgHpAboAAgHqAJsAAgHrAAUADAASABgAHgAkAb0AAgHnAeIAAgHoALwAAgHpAbsAAgHqALsAAgHrAAUADAASABgAHgAkAcIAAgHnAcQAAgHoAb4AAgHpAcYAAgHqAcAAAgHrAAUADAASABgAHgAkAcMAAgHnAcUAAgHoAb8AAgHpAccAAgHqAcEAAgHrAAEdRgACAAoANAAFAAwAEgAYAB4AJAHMAAIB5wHOAAIB6ACfAAIB6QHKAAIB6gHIAAIB6wAFAAwAEgAYAB4AJAHNAAIB5wHPAAIB6AC/AAIB6QHLAAIB6gHJAAIB6wABG9YAAwAMAB4AMAACAAYADAHyAAIBBwHyAAIBFgACAAYADAHzAAIBBwHzAAIBFgABAAQB8QACAAMAAwAAAAEbpgABG64AAQAAAD4AAwAAAAEbpgAAAAEAAAA+AAMAARugAAEbqgAAAAEAAAA+AAMAARuOAAEbogAAAAEAAAA+AAMAARukAAEbhgAAAAEAAAA/AAMAARuiAAEbdAAAAAEAAABAAAMAARugAAEbRAAAAAEAAAA+AAMAARtGAAEbmgAAAAEAAAA+AAMAARuOAAEbiAAAAAEAAAA+AAMAAAABG3wAARuGAAEAAAA+AAMAARsQAAEa/AAAAAEAAAA/AAMAARtoAAEbCAAAAAEAAAA+AAMAAAABG1YAARtGAAEAAAA+AAMAARraAAEbRAAAAAEAAAA+AAMAAAABGzwAARtEAAEAAAA+AAMAAAABGzwAARtCAAEAAAA+AAMAARs+AAEbRAAAAAEAAAA+AAMAAAABGpwAARrmAAEAAAA/AAEbJgABAAgAAQAEAXUADQA0ACwADwAlAEYAVABKAEgATwAJAEQACgABGwQABgASADwAZgCQALoA5AAFAAwAEgAYAB4AJAF4AAIB5wCFAAIB6ACDAAIB6QF2AAIB6gCCAAIB6wAFAAwAEgAYAB4AJAF5AAIB5wClAAIB6ACjAAIB6QF3AAIB6gCiAAIB6wAFAAwAEgAYAB4AJAF+AAIB5wGAAAIB6AF6AAIB6QGCAAIB6gF8AAIB6wAFAAwAEgAYAB4AJAF/AAIB5wGBAAIB6AF7AAIB6QGDAAIB6gF9AAIB6wAFAAwAEgAYAB4AJAGIAAIB5wGKAAIB6AGEAAIB6QGMAAIB6gGGAAIB6wAFAAwAEgAYAB4AJAGJAAIB5wGLAAIB6AGFAAIB6QGNAAIB6gGHAAIB6wABGgYABAAOADgAYgCMAAUADAASABgAHgAkAZAAAgHnAZIAAgHoAIsAAgHpAY4AAgHqAIoAAgHrAAUADAASABgAHgAkAZEAAgHnAZMAAgHoAKsAAgHpAY8AAgHqAKoAAgHrAAUADAASABgAHgAkAZgAAgHnAZoAAgHoAZQAAgHpAZwAAgHqAZYAAgHrAAUADAASABgAHgAkAZkAAgHnAZsAAgHoAZUAAgHpAZ0AAgHqAZcAAgHrAAEZXAACAAoANAAFAAwAEgAYAB4AJAGeAAIB5wHcAAIB6ACPAAIB6QGgAAIB6gCOAAIB6wAFAAwAEgAYAB4AJAGfAAIB5wHdAAIB6ACvAAIB6QGhAAIB6gCuAAIB6wABGQYABgASADwAZgCQALoA5AAFAAwAEgAYAB4AJAGkAAIB5wCXAAIB6ACVAAIB6QGiAAIB6gCUAAIB6wAFAAwAEgAYAB4AJAGlAAIB5wC3AAIB6AC1AAIB6QGjAAIB6gC0AAIB6wAFAAwAEgAYAB4AJAGqAAIB5wGsAAIB6AGmAAIB6QGuAAIB6gGoAAIB6wAFAAwAEgAYAB4AJAGrAAIB5wGtAAIB6AGnAAIB6QGvAAIB6gGpAAIB6wAFAAwAEgAYAB4AJAG0AAIB5wG2AAIB6AGwAAIB6QG4AAIB6gGyAAIB6wAFAAwAEgAYAB4AJAG1AAIB5wG3AAIB6AGxAAIB6QG5AAIB6gGzAAIB6wABGAgABAAOADgAYgCMAAUADAASABgAHgAkAbwAAgHnAeEAAgHoAJwAAgHpAboAAgHqAJsAAgHrAAUADAASABgAHgAkAb0AAgHnAeIAAgHoALwAAgHpAbsAAgHqALsAAgHrAAUADAASABgAHgAkAcIAAgHnAcQAAgHoAb4AAgHpAcYAAgHqAcAAAgHrAAUADAASABgAHgAkAcMAAgHnAcUAAgHoAb8AAgHpAccAAgHqAcEAAgHrAAEXXgACAAoANAAFAAwAEgAYAB4AJAHMAAIB5wHOAAIB6ACfAAIB6QHKAAIB6gHIAAIB6wAFAAwAEgAYAB4AJAHNAAIB5wHPAAIB6AC/AAIB6QHLAAIB6gHJAAIB6wABFwgABAAOACAAMgBEAAIABgAMAXMAAgBKAXQAAgBNAAIABgAMAfIAAgEHAfIAAgEWAAIABgAMAfMAAgEHAfMAAgEWAAEABAHxAAIAAwABFroABAAOACAAMgBEAAIABgAMAXMAAgBKAXQAAgBNAAIABgAMAfIAAgEHAfIAAgEWAAIABgAMAfMAAgEHAfMAAgEWAAEABAHxAAIAAwABFmwABAAOACAAMgBEAAIABgAMAXMAAgBKAXQAAgBNAAIABgAMAfIAAgEHAfIAAgEWAAIABgAMAfMAAgEHAfMAAgEWAAEABAHxAAIAAwABFioAEAAmAFAAWgCEAK4AuADiAQwBNgFgAWoBlAG+AcgB8gIcAAUADAASABgAHgAkAXgAAgHnAIUAAgHoAIMAAgHpAXYAAgHqAIIAAgHrAAEABAHUAAIB6QAFAAwAEgAYAB4AJAGQAAIB5wGSAAIB6ACLAAIB6QGOAAIB6gCKAAIB6wAFAAwAEgAYAB4AJAGeAAIB5wHcAAIB6ACPAAIB6QGgAAIB6gCOAAIB6wABAAQAkwACAegABQAMABIAGAAeACQBpAACAecAlwACAegAlQACAekBogACAeoAlAACAesABQAMABIAGAAeACQBvAACAecB4QACAegAnAACAekBugACAeoAmwACAesABQAMABIAGAAeACQBzAACAecBzgACAegAnwACAekBygACAeoByAACAesABQAMABIAGAAeACQBeQACAecApQACAegAowACAekBdwACAeoAogACAesAAQAEAdUAAgHpAAUADAASABgAHgAkAZEAAgHnAZMAAgHoAKsAAgHpAY8AAgHqAKoAAgHrAAUADAASABgAHgAkAZ8AAgHnAd0AAgHoAK8AAgHpAaEAAgHqAK4AAgHrAAEABACzAAIB6AAFAAwAEgAYAB4AJAGlAAIB5wC3AAIB6AC1AAIB6QGjAAIB6gC0AAIB6wAFAAwAEgAYAB4AJAG9AAIB5wHiAAIB6AC8AAIB6QG7AAIB6gC7AAIB6wAFAAwAEgAYAB4AJAHNAAIB5wHPAAIB6AC/AAIB6QHLAAIB6gHJAAIB6wABFAgADAAeAEAAYgCEAKYAyADqAQwBLgFYAYIBrAAEAAoAEAAWABwBfgACAecBgAACAegBegACAekBfAACAesABAAKABAAFgAcAZgAAgHnAZoAAgHoAZQAAgHpAZYAAgHrAAQACgAQABYAHAGqAAIB5wGsAAIB6AGmAAIB6QGoAAIB6wAEAAoAEAAWABwBfwACAecBgQACAegBewACAekBfQACAesABAAKABAAFgAcAZkAAgHnAZsAAgHoAZUAAgHpAZcAAgHrAAQACgAQABYAHAGrAAIB5wGtAAIB6AGnAAIB6QGpAAIB6wAEAAoAEAAWABwBiAACAecBigACAegBhAACAekBhgACAesABAAKABAAFgAcAYkAAgHnAYsAAgHoAYUAAgHpAYcAAgHrAAUADAASABgAHgAkAbQAAgHnAbYAAgHoAbAAAgHpAbgAAgHqAbIAAgHrAAUADAASABgAHgAkAbUAAgHnAbcAAgHoAbEAAgHpAbkAAgHqAbMAAgHrAAUADAASABgAHgAkAcIAAgHnAcQAAgHoAb4AAgHpAcYAAgHqAcAAAgHrAAUADAASABgAHgAkAcMAAgHnAcUAAgHoAb8AAgHpAccAAgHqAcEAAgHrAAESDgAQACYAUABaAIQArgC4AOIBDAE2AWABagGUAb4ByAHyAhwABQAMABIAGAAeACQBeAACAecAhQACAegAgwACAekBdgACAeoAggACAesAAQAEAdQAAgHpAAUADAASABgAHgAkAZAAAgHnAZIAAgHoAIsAAgHpAY4AAgHqAIoAAgHrAAUADAASABgAHgAkAZ4AAgHnAdwAAgHoAI8AAgHpAaAAAgHqAI4AAgHrAAEABACTAAIB6AAFAAwAEgAYAB4AJAGkAAIB5wCXAAIB6ACVAAIB6QGiAAIB6gCUAAIB6wAFAAwAEgAYAB4AJAG8AAIB5wHhAAIB6ACcAAIB6QG6AAIB6gCbAAIB6wAFAAwAEgAYAB4AJAHMAAIB5wHOAAIB6ACfAAIB6QHKAAIB6gHIAAIB6wAFAAwAEgAYAB4AJAF5AAIB5wClAAIB6ACjAAIB6QF3AAIB6gCiAAIB6wABAAQB1QACAekABQAMABIAGAAeACQBkQACAecBkwACAegAqwACAekBjwACAeoAqgACAesABQAMABIAGAAeACQBnwACAecB3QACAegArwACAekBoQACAeoArgACAesAAQAEALMAAgHoAAUADAASABgAHgAkAaUAAgHnALcAAgHoALUAAgHpAaMAAgHqALQAAgHrAAUADAASABgAHgAkAb0AAgHnAeIAAgHoALwAAgHpAbsAAgHqALsAAgHrAAUADAASABgAHgAkAc0AAgHnAc8AAgHoAL8AAgHpAcsAAgHqAckAAgHrAAEP7AAMAB4AQABiAIQApgDIAOoBDAEuAVgBggGsAAQACgAQABYAHAF+AAIB5wGAAAIB6AF6AAIB6QF8AAIB6wAEAAoAEAAWABwBmAACAecBmgACAegBlAACAekBlgACAesABAAKABAAFgAcAaoAAgHnAawAAgHoAaYAAgHpAagAAgHrAAQACgAQABYAHAF/AAIB5wGBAAIB6AF7AAIB6QF9AAIB6wAEAAoAEAAWABwBmQACAecBmwACAegBlQACAekBlwACAesABAAKABAAFgAcAasAAgHnAa0AAgHoAacAAgHpAakAAgHrAAQACgAQABYAHAGIAAIB5wGKAAIB6AGEAAIB6QGGAAIB6wAEAAoAEAAWABwBiQACAecBiwACAegBhQACAekBhwACAesABQAMABIAGAAeACQBtAACAecBtgACAegBsAACAekBuAACAeoBsgACAesABQAMABIAGAAeACQBtQACAecBtwACAegBsQACAekBuQACAeoBswACAesABQAMABIAGAAeACQBwgACAecBxAACAegBvgACAekBxgACAeoBwAACAesABQAMABIAGAAeACQBwwACAecBxQACAegBvwACAekBxwACAeoBwQACAesAAQ3yABAAJgBQAFoAhACuALgA4gEMATYBYAFqAZQBvgHIAfICHAAFAAwAEgAYAB4AJAF4AAIB5wCFAAIB6ACDAAIB6QF2AAIB6gCCAAIB6wABAAQB1AACAekABQAMABIAGAAeACQBkAACAecBkgACAegAiwACAekBjgACAeoAigACAesABQAMABIAGAAeACQBngACAecB3AACAegAjwACAekBoAACAeoAjgACAesAAQAEAJMAAgHoAAUADAASABgAHgAkAaQAAgHnAJcAAgHoAJUAAgHpAaIAAgHqAJQAAgHrAAUADAASABgAHgAkAbwAAgHnAeEAAgHoAJwAAgHpAboAAgHqAJsAAgHrAAUADAASABgAHgAkAcwAAgHnAc4AAgHoAJ8AAgHpAcoAAgHqAcgAAgHrAAUADAASABgAHgAkAXkAAgHnAKUAAgHoAKMAAgHpAXcAAgHqAKIAAgHrAAEABAHVAAIB6QAFAAwAEgAYAB4AJAGRAAIB5wGTAAIB6ACrAAIB6QGPAAIB6gCqAAIB6wAFAAwAEgAYAB4AJAGfAAIB5wHdAAIB6ACvAAIB6QGhAAIB6gCuAAIB6wABAAQAswACAegABQAMABIAGAAeACQBpQACAecAtwACAegAtQACAekBowACAeoAtAACAesABQAMABIAGAAeACQBvQACAecB4gACAegAvAACAekBuwACAeoAuwACAesABQAMABIAGAAeACQBzQACAecBzwACAegAvwACAekBywACAeoByQACAesAAQvQAAwAHgBAAGIAhACmAMgA6gEMAS4BWAGCAawABAAKABAAFgAcAX4AAgHnAYAAAgHoAXoAAgHpAXwAAgHrAAQACgAQABYAHAGYAAIB5wGaAAIB6AGUAAIB6QGWAAIB6wAEAAoAEAAWABwBqgACAecBrAACAegBpgACAekBqAACAesABAAKABAAFgAcAX8AAgHnAYEAAgHoAXsAAgHpAX0AAgHrAAQACgAQABYAHAGZAAIB5wGbAAIB6AGVAAIB6QGXAAIB6wAEAAoAEAAWABwBqwACAecBrQACAegBpwACAekBqQACAesABAAKABAAFgAcAYgAAgHnAYoAAgHoAYQAAgHpAYYAAgHrAAQACgAQABYAHAGJAAIB5wGLAAIB6AGFAAIB6QGHAAIB6wAFAAwAEgAYAB4AJAG0AAIB5wG2AAIB6AGwAAIB6QG4AAIB6gGyAAIB6wAFAAwAEgAYAB4AJAG1AAIB5wG3AAIB6AGxAAIB6QG5AAIB6gGzAAIB6wAFAAwAEgAYAB4AJAHCAAIB5wHEAAIB6AG+AAIB6QHGAAIB6gHAAAIB6wAFAAwAEgAYAB4AJAHDAAIB5wHFAAIB6AG/AAIB6QHHAAIB6gHBAAIB6wABCdYAEAAmAFAAWgCEAK4AuADiAQwBNgFgAWoBlAG+AcgB8gIcAAUADAASABgAHgAkAXgAAgHnAIUAAgHoAIMAAgHpAXYAAgHqAIIAAgHrAAEABAHUAAIB6QAFAAwAEgAYAB4AJAGQAAIB5wGSAAIB6ACLAAIB6QGOAAIB6gCKAAIB6wAFAAwAEgAYAB4AJAGeAAIB5wHcAAIB6ACPAAIB6QGgAAIB6gCOAAIB6wABAAQAkwACAegABQAMABIAGAAeACQBpAACAecAlwACAegAlQACAekBogACAeoAlAACAesABQAMABIAGAAeACQBvAACAecB4QACAegAnAACAekBugACAeoAmwACAesABQAMABIAGAAeACQBzAACAecBzgACAegAnwACAekBygACAeoByAACAesABQAMABIAGAAeACQBeQACAecApQACAegAowACAekBdwACAeoAogACAesAAQAEAdUAAgHpAAUADAASABgAHgAkAZEAAgHnAZMAAgHoAKsAAgHpAY8AAgHqAKoAAgHrAAUADAASABgAHgAkAZ8AAgHnAd0AAgHoAK8AAgHpAaEAAgHqAK4AAgHrAAEABACzAAIB6AAFAAwAEgAYAB4AJAGlAAIB5wC3AAIB6AC1AAIB6QGjAAIB6gC0AAIB6wAFAAwAEgAYAB4AJAG9AAIB5wHiAAIB6AC8AAIB6QG7AAIB6gC7AAIB6wAFAAwAEgAYAB4AJAHNAAIB5wHPAAIB6AC/AAIB6QHLAAIB6gHJAAIB6wABB7QADAAeAEAAYgCEAKYAyADqAQwBLgFYAYIBrAAEAAoAEAAWABwBfgACAecBgAACAegBegACAekBfAACAesABAAKABAAFgAcAZgAAgHnAZoAAgHoAZQAAgHpAZYAAgHrAAQACgAQABYAHAGqAAIB5wGsAAIB6AGmAAIB6QGoAAIB6wAEAAoAEAAWABwBfwACAecBgQACAegBewACAekBfQACAesABAAKABAAFgAcAZkAAgHnAZsAAgHoAZUAAgHpAZcAAgHrAAQACgAQABYAHAGrAAIB5wGtAAIB6AGnAAIB6QGpAAIB6wAEAAoAEAAWABwBiAACAecBigACAegBhAACAekBhgACAesABAAKABAAFgAcAYkAAgHnAYsAAgHoAYUAAgHpAYcAAgHrAAUADAASABgAHgAkAbQAAgHnAbYAAgHoAbAAAgHpAbgAAgHqAbIAAgHrAAUADAASABgAHgAkAbUAAgHnAbcAAgHoAbEAAgHpAbkAAgHqAbMAAgHrAAUADAASABgAHgAkAcIAAgHnAcQAAgHoAb4AAgHpAcYAAgHqAcAAAgHrAAUADAASABgAHgAkAcMAAgHnAcUAAgHoAb8AAgHpAccAAgHqAcEAAgHrAAEFugAQACYAUABaAIQArgC4AOIBDAE2AWABagGUAb4ByAHyAhwABQAMABIAGAAeACQBeAACAecAhQACAegAgwACAekBdgACAeoAggACAesAAQAEAdQAAgHpAAUADAASABgAHgAkAZAAAgHnAZIAAgHoAIsAAgHpAY4AAgHqAIoAAgHrAAUADAASABgAHgAkAZ4AAgHnAdwAAgHoAI8AAgHpAaAAAgHqAI4AAgHrAAEABACTAAIB6AAFAAwAEgAYAB4AJAGkAAIB5wCXAAIB6ACVAAIB6QGiAAIB6gCUAAIB6wAFAAwAEgAYAB4AJAG8AAIB5wHhAAIB6ACcAAIB6QG6AAIB6gCbAAIB6wAFAAwAEgAYAB4AJAHMAAIB5wHOAAIB6ACfAAIB6QHKAAIB6gHIAAIB6wAFAAwAEgAYAB4AJAF5AAIB5wClAAIB6ACjAAIB6QF3AAIB6gCiAAIB6wABAAQB1QACAekABQAMABIAGAAeACQBkQACAecBkwACAegAqwACAekBjwACAeoAqgACAesABQAMABIAGAAeACQBnwACAecB3QACAegArwACAekBoQACAeoArgACAesAAQAEALMAAgHoAAUADAASABgAHgAkAaUAAgHnALcAAgHoALUAAgHpAaMAAgHqALQAAgHrAAUADAASABgAHgAkAb0AAgHnAeIAAgHoALwAAgHpAbsAAgHqALsAAgHrAAUADAASABgAHgAkAc0AAgHnAc8AAgHoAL8AAgHpAcsAAgHqAckAAgHrAAEDmAAMAB4AQABiAIQApgDIAOoBDAEuAVgBggGsAAQACgAQABYAHAF+AAIB5wGAAAIB6AF6AAIB6QF8AAIB6wAEAAoAEAAWABwBmAACAecBmgACAegBlAACAekBlgACAesABAAKABAAFgAcAaoAAgHnAawAAgHoAaYAAgHpAagAAgHrAAQACgAQABYAHAF/AAIB5wGBAAIB6AF7AAIB6QF9AAIB6wAEAAoAEAAWABwBmQACAecBmwACAegBlQACAekBlwACAesABAAKABAAFgAcAasAAgHnAa0AAgHoAacAAgHpAakAAgHrAAQACgAQABYAHAGIAAIB5wGKAAIB6AGEAAIB6QGGAAIB6wAEAAoAEAAWABwBiQACAecBiwACAegBhQACAekBhwACAesABQAMABIAGAAeACQBtAACAecBtgACAegBsAACAekBuAACAeoBsgACAesABQAMABIAGAAeACQBtQACAecBtwACAegBsQACAekBuQACAeoBswACAesABQAMABIAGAAeACQBwgACAecBxAACAegBvgACAekBxgACAeoBwAACAesABQAMABIAGAAeACQBwwACAecBxQACAegBvwACAekBxwACAeoBwQACAesAAgHeACMBDQEOAQ8BZQH0AXEBVgFyAWYAYAFXAVgBWQFaAW4BbwFwAWgBYAFhAWIBYwFkAWcAYwFpAWoBawFsAW0BWwFcAV0BXgFfAAIBwAAIAEIAQwBEARkBGgEbARwBHQABAEYACQACAAIAEgAWAAAAGAAYAAUAAQADAPkA+wEgAAEAAgDiAOUAAgABAQ0BDwAAAAIAAQEZAR0AAAABAAMA8ADyAPQAAgABAWABZAAAAAEACAEGAQkBCgELAQwBGAEeAR8AAQAGAQYBCQEKAQsBDAEeAAIAAgFXAVoAAAFmAWcABAABAAQA4wDkAPkA+wABAAEBCAACAAEBWwFfAAAAAQABAGAAAgABAEIARAAAAAEAAgDjAOQAAgABAW4BcAAAAAEAAQEBAAEABQEJAQoBCwEMARgAAQABAXIAAQABARgAAQABADEAAQAGACIAQgCEAKQB0gHTAAEABAAmAEYAjACsAAEAAgAqAEoAAQAGADAAUACWALYB4wHkAAEABAA2AFYB5QHmAAEAAgA6AFoAAQAEAEcA+QD7ASAAAQAQACIAJAAmACoALwAwADYAOgBCAEQARgBKAE8AUABWAFoAAQAMAIQAjACWAKQArAC2AdIB0wHjAeQB5QHmAAIABwBCAEQAAADiAOUAAwEBAQEABwEGAQYACAEIAQ8ACQEYAR8AEQFbAWQAGQACAAIBDQEPAAABYAFkAAMAAAAAAAEAAQABAAAAAQAADMgAAAAUAAAAAAAADMAwggy8BgkqhkiG9w0BBwKgggytMIIMqQIBATELMAkGBSsOAwIaBQAwYQYKKwYBBAGCNwIBBKBTMFEwLAYKKwYBBAGCNwIBHKIegBwAPAA8ADwATwBiAHMAbwBsAGUAdABlAD4APgA+MCEwCQYFKw4DAhoFAAQUyl4LFYndQNgV1bdeKpzeTHT4vVmgggkCMIIBuDCCAWKgAwIBAgIQIontsekbpYNNCfQ7jplKvjANBgkqhkiG9w0BAQQFADAWMRQwEgYDVQQDEwtSb290IEFnZW5jeTAeFw0wODAyMDIxMjM3NTZaFw0zOTEyMzEyMzU5NTlaMBMxETAPBgNVBAMTCFN1cHBha2l0MIGfMA0GCSqGSIb3DQEBAQUAA4GNADCBiQKBgQC7An/JDN+r09vHGOfeYNLkjK7LLuEy80JBkH65Q+TjJnYwdm2eVXIqHc0yEmh3sv02R6rHnFAWfYVhqasygEmEFji+Wn5cwc2qMcl3Ks3UERtmBk5mZiXo52MRjX/AqvqTLcb0nRitG4OrdS4GOEl5oBkyS5J3Q3zvrbtIZXJtYwIDAQABo0swSTBHBgNVHQEEQDA+gBAS5AktBh0dTwCNYSHcFmRjoRgwFjEUMBIGA1UEAxMLUm9vdCBBZ2VuY3mCEAY3bACqAGSKEc+41KpcNfQwDQYJKoZIhvcNAQEEBQADQQBhrvbNRsPgD9BPKNq5F8ySSIbltUJSSa7pbt8jmVpMnt/hTS28FTSa0pdRicWROrgxIF66WFhvGeSRDszZKovqMIIDejCCAmKgAwIBAgIQOCXX+vhhr570kOcmtdZa1TANBgkqhkiG9w0BAQUFADBTMQswCQYDVQQGEwJVUzEXMBUGA1UEChMOVmVyaVNpZ24sIEluYy4xKzApBgNVBAMTIlZlcmlTaWduIFRpbWUgU3RhbXBpbmcgU2VydmljZXMgQ0EwHhcNMDcwNjE1MDAwMDAwWhcNMTIwNjE0MjM1OTU5WjBcMQswCQYDVQQGEwJVUzEXMBUGA1UEChMOVmVyaVNpZ24sIEluYy4xNDAyBgNVBAMTK1ZlcmlTaWduIFRpbWUgU3RhbXBpbmcgU2VydmljZXMgU2lnbmVyIC0gRzIwgZ8wDQYJKoZIhvcNAQEBBQADgY0AMIGJAoGBAMS18lIVvIiGYCkWSlsvS5Frh5HzNVRYNerRNl5iTVJRNHHCe2YdicjdKsRqCvY32Zh0kfaSrrC1dpbxqUpjRUcuawuSTksrjO5YSovUB+QaLPiCqljZzULzLcB13o2rx44dmmxMCJUe3tvvZ+FywknCnmA84eK+FqNjeGkUe60tAgMBAAGjgcQwgcEwNAYIKwYBBQUHAQEEKDAmMCQGCCsGAQUFBzABhhhodHRwOi8vb2NzcC52ZXJpc2lnbi5jb20wDAYDVR0TAQH/BAIwADAzBgNVHR8ELDAqMCigJqAkhiJodHRwOi8vY3JsLnZlcmlzaWduLmNvbS90c3MtY2EuY3JsMBYGA1UdJQEB/wQMMAoGCCsGAQUFBwMIMA4GA1UdDwEB/wQEAwIGwDAeBgNVHREEFzAVpBMwETEPMA0GA1UEAxMGVFNBMS0yMA0GCSqGSIb3DQEBBQUAA4IBAQBQxUvIJIDf5A0kwt4asaECoaaCLQyDFYE3CoIOLLBaF2G12AX+iNvxkZGzVhpApuuSvjg5sHU2dDqYT+Q3upmJypVCHbC5x6CNV+D61WQEQjVOAdEzohfITaonx/LhhkwCOE2DeMb8U+Dr4AaH3aSWnl4MmOKlvr+ChcNg4d+tKNjHpUtk2scbW72sOQjVOCKhM4sviprrvAchP0RBCQe1ZRwkvEjTRIDroc/JArQUz1THFqOAXPl5Pl1yfYgXnixDospTzn099io6uE+UAKVtCoNd+V5T9BizVw9ww/v1rZWgDhfexBaAYMkPK26GBPHr9Hgn0QXF7jRbXrlJMvIzMIIDxDCCAy2gAwIBAgIQR78Zld+NUkZD99ttSA0xpDANBgkqhkiG9w0BAQUFADCBizELMAkGA1UEBhMCWkExFTATBgNVBAgTDFdlc3Rlcm4gQ2FwZTEUMBIGA1UEBxMLRHVyYmFudmlsbGUxDzANBgNVBAoTBlRoYXd0ZTEdMBsGA1UECxMUVGhhd3RlIENlcnRpZmljYXRpb24xHzAdBgNVBAMTFlRoYXd0ZSBUaW1lc3RhbXBpbmcgQ0EwHhcNMDMxMjA0MDAwMDAwWhcNMTMxMjAzMjM1OTU5WjBTMQswCQYDVQQGEwJVUzEXMBUGA1UEChMOVmVyaVNpZ24sIEluYy4xKzApBgNVBAMTIlZlcmlTaWduIFRpbWUgU3RhbXBpbmcgU2VydmljZXMgQ0EwggEiMA0GCSqGSIb3DQEBAQUAA4IBDwAwggEKAoIBAQCpyrKkzM0grwp9iayHdfC0TvHfwQ+/Z2G9o2Qc2rv5yjOrhDCJWH6M22vdNp4Pv9HsePJ3pn5vPL+Trw26aPRslMq9Ui2rSD31ttVdXxsCn/ovax6k96OaphrIAuF/TFLjDmDsQBx+uQ3eP8e034e9X3pqMS4DmYETqEcgzjFzDVctzXg0M5USmRK53mgvqubjwoqMKsOLIYdmvYNYV291vzyqJoddyhAVPJ+E6lTBCm7E/sVK3bkHEZcifNs+J9EeeOyfMcnx5iIZ28SzR0OaGl+gHpDkXvXufPF9q2IBj/VNC97QIlaolc2uiHau7roN8+RN2aD7aKCuFDuzh8G7AgMBAAGjgdswgdgwNAYIKwYBBQUHAQEEKDAmMCQGCCsGAQUFBzABhhhodHRwOi8vb2NzcC52ZXJpc2lnbi5jb20wEgYDVR0TAQH/BAgwBgEB/wIBADBBBgNVHR8EOjA4MDagNKAyhjBodHRwOi8vY3JsLnZlcmlzaWduLmNvbS9UaGF3dGVUaW1lc3RhbXBpbmdDQS5jcmwwEwYDVR0lBAwwCgYIKwYBBQUHAwgwDgYDVR0PAQH/BAQDAgEGMCQGA1UdEQQdMBukGTAXMRUwEwYDVQQDEwxUU0EyMDQ4LTEtNTMwDQYJKoZIhvcNAQEFBQADgYEASmv56ljCRBwxiXmZK5a/gqwB1hxMzbCKWG7fCCmjXsjKkxPnBFIN70cnLwA4sOTJk06a1CJiFfc/NyFPcDGA8Ys4h7Po6JcA/s9Vlk4k0qknTnqut2FB8yrO58nZXt27K4U+tZ212eFX/760xX71zwye8Jf+K9M7UhsbOCf3P0oxggMsMIIDKAIBATAqMBYxFDASBgNVBAMTC1Jvb3QgQWdlbmN5AhAiie2x6Rulg00J9DuOmUq+MAkGBSsOAwIaBQCggdYwYAYKKwYBBAGCNwIBDDFSMFCgHoAcAFQASAAgAFMAYQByAGEAYgB1AG4AIABOAGUAd6EugCxodHRwOi8vd3d3LmZhY2Vib29rLmNvbS9zdXBwYWtpdC5jaGFsZXJtbGFycDAUBgkrBgEEAYI3KAExBwMFAAMAAAAwHAYKKwYBBAGCNwIBCzEOMAwGCisGAQQBgjcCARYwGQYJKoZIhvcNAQkDMQwGCisGAQQBgjcCAQQwIwYJKoZIhvcNAQkEMRYEFCbb3efV4INVW6HHh7ZOThnA/xBXMA0GCSqGSIb3DQEBAQUABIGADI/VGYqG+54q9KIeuM317wBQ/bLaca8GotkRr9wPi1DtxBE62eECe3uhMnMmMP4XqsP+sln8nXMWc7Mu6mZt5kAYju3Sb/rJ70LG/LFONAgOvnyUCHK34fnnURH/EZxvLqz+IJTIURK5biLsCeNisih2v2J5GkN0WLDthTEtc8ihggF/MIIBewYJKoZIhvcNAQkGMYIBbDCCAWgCAQEwZzBTMQswCQYDVQQGEwJVUzEXMBUGA1UEChMOVmVyaVNpZ24sIEluYy4xKzApBgNVBAMTIlZlcmlTaWduIFRpbWUgU3RhbXBpbmcgU2VydmljZXMgQ0ECEDgl1/r4Ya+e9JDnJrXWWtUwCQYFKw4DAhoFAKBdMBgGCSqGSIb3DQEJAzELBgkqhkiG9w0BBwEwHAYJKoZIhvcNAQkFMQ8XDTExMDYyNDE3NDUzNlowIwYJKoZIhvcNAQkEMRYEFHYG2MHCFeJ3t6VQVGL8lI+IInQnMA0GCSqGSIb3DQEBAQUABIGALrKtqs1WE2+BSgZ73pS5yAJZuZKCKZ4I2OSH+NLOGzNMNEDMhG2CHSCEk03tfG4XLfqUGfjVyjadE4X8TNt79SVRkp/SjvD0Ybzga2XesBtfq1caA7KK0QkL6u7v61eFoanYYo6tcyjBZS33lzEr3NsnHhMEHKpmgTDAeFzJDsEAAQAAAAIAAAAAAAAAAAABAAAAJAAAAQAAAQABAAAAKAAAAQQAAAEBAAIBBAACAAAAAAABAAAADwAAJhAAAAAJAAAACAAbAAAAAAAB/////wAbAAEAAAAA/////gABAAIAAAAC/////wABAAMAAAAA/////QAbAAIAAAAE/////wAbAAMAAAAA////+wAXAAAAAAAA////9wAXPoAAAAAI/////wAAAAEAAAAAAAAAAAAACzQgAAACAAAAAQAAABkAAAAcAAADtgAABzoAAAmIAAAKCAAACqgACAAiAcoABAABAAoAAQALAAEAAQABAAwAAQABAAEAAQANAA4AAQABAAEAAQABAA8AAQABAAEAEAABAAEAAQABAAEAAQABABEAAQASAAEAEwABAAEAAQAUAAEAAQABAAEAFQAWAAEAAQABAAEAAQAXAAEAAQABABgAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEABQAGAAcACAAJAAAAAAAAAAAAAgAAAAAAAAAAAAAAAwAEAAUABgAHAAgACQAKAAsADAANAA4ADwAQABEAAAAAAAAAAAACAAAAAAAAAAAAAAADAAQABQAGAAcACAAJAAoACwAMAA0ADgAPABAAEQABAAEAEgABAAEAEwAUABUAFgAXAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQAYAAEAAQABAAEAGQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABABoAAQABABsAHAAdAB4AHwABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAIAABAAEAIQAiACMAJAAlAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQAmAAEAAQABACcAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABACgAAQABACkAKgArACwALQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEALgABAAEALwAwADEAMgAzAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQA0AAEAAQA1ADYANwA4ADkAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABADoAAQABADsAPAA9AD4APwABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAQAABAAEAAQABAEEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQBCAAEAAQBDAEQARQBGAEcAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAEgAAQABAEkASgBLAEwATQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEATgABAAEAAQBPAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQBQAAEAAQBRAFIAUwBUAFUAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAFYAAQABAFcAWABZAFoAWwABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAXAABAAEAXQBeAF8AYABhAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAAAAAAAAABAAAAAAAKAAAAAAAOAAAAAAASAAAAAAAWAAAAAAAaAAAAAAAeAAAAAAAiAAAAAAAmAAAAAAAqAAAAAAAuAAAAAAAyAAAAAAA2AAAAAAA6AAAAAAA+AAAAAABCAAAAAABGAAAAAAAIAAAAAAACgAAAAAACgAAAAAACgAAAAAACgAAAAAACgAAAAAAMAAAAAAACgAAACAAQAAAAAAACgAAAEAACgAAAEAACgAAAEAACgAAAEAACgAAAEAAUAAAAAAACgAAAGAACgAAAGAACgAAAGAACgAAAGAACgAAAGAAYAAAAAAACgAAAIAAcAAAAAAACgAAAKAACgAAAKAACgAAAKAACgAAAKAACgAAAKAAgAAAAAAACgAAAMAACgAAAMAACgAAAMAACgAAAMAACgAAAMAAkAAAAAAACgAAAOAACgAAAOAACgAAAOAACgAAAOAACgAAAOAAoAAAAAAACgAAAQAACgAAAQAACgAAAQAACgAAAQAACgAAAQAAsAAAAAAACgAAASAAwAAAAAAACgAAAUAACgAAAUAACgAAAUAACgAAAUAACgAAAUAA0AAAAAAACgAAAWAACgAAAWAACgAAAWAACgAAAWAACgAAAWAA4AAAAAAACgAAAYAA8AAAAAAACgAAAaAACgAAAaAACgAAAaAACgAAAaAACgAAAaABAAAAAAAACgAAAcAACgAAAcAACgAAAcAAKgAAAcAACgAAAcABEAAAAAAACgAAAeAACgAAAeAACgAAAeAACgAAAeAAKgAAAeAAA///4Zv///4z///h2////jP//+Ib///+c///4nv///6T///iy////mP//+L7///+s///41v///6z///ju////tP//+Qb///+s///5Fv///6z///km////vP//+T7////E///5Uv///7j///le////zP//+Xb////M///5jv///9QAAAAEAAgADAAQAAAAAAAUAAAABAAIAAwAEAAYAAAABAAIAAwAEAAsAAAAQAAAAAQACAAMABAARAAAAAQACAAMABAAWAAAAAQACAAMABAAbAAAAAQACAAMABAAgAAAAJQAAAAEAAgADAAQAJgAAAAEAAgADAAQAKwAAADAAAAABAAIAAwAEADEAAAABAAIAAwAEADYAAAABAAIAAwAEADsBeACFAIMBdgCCAdQBkAGSAIsBjgCKAZ4B3ACPAaAAjgCTAaQAlwCVAaIAlAG8AeEAnAG6AJsBzAHOAJ8BygHIAXkApQCjAXcAogHVAZEBkwCrAY8AqgGfAd0ArwGhAK4AswGlALcAtQGjALQBvQHiALwBuwC7Ac0BzwC/AcsByQAACHggAAACAAAAAQAAABUAAAAcAAAC8gAABT4AAAcUAAAHdAAACAQACACEAWgABAABAAEAAQABAAEAAQABAAkAAQABAAEAAQABAAEAAQABAAEACgABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAsAAQABAAEAAQABAAEAAQAMAAEAAQABAAEAAQABAAEAAQABAA0AAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQAOAA8AAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAEAASABMAFAAFAAYABwARAAgAAAAAAAAAAAACAAAAAAAAAAAAAwAEAAUABgAHAAgACQAKAAAACwAMAA0AAAAAAAAAAAACAAAAAAAAAAAAAwAEAAUABgAHAAgACQAKAAAACwAMAA0AAQABAA4AAQABAA8AEAARABIAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABABMAAQABABQAFQAWABcAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABABgAAQABABkAGgAbABwAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAB0AAQABAB4AHwAgACEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABACIAAQABACMAJAAlACYAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABACcAAQABACgAKQAqACsAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABACwAAQABAC0ALgAvADAAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABADEAAQABADIAMwA0ADUAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABADYAAQABADcAOAA5ADsAAQABAAEAAQABAAEAAQABADoAAQABAAEAAQABADwAAQABAD0APgA/AEEAAQABAAEAAQABAAEAAQABAEAAAQABAAEAAQABAEIAAQABAEMARABFAEcAAQABAAEAAQABAAEAAQABAEYAAQABAAEAAQABAEgAAQABAEkASgBLAE0AAQABAAEAAQABAAEAAQABAEwAAQABAAEAAAAAAAAAAEAAAAAAAoAAAAAAA4AAAAAABIAAAAAABYAAAAAABoAAAAAAB4AAAAAACIAAAAAACYAAAAAACoAAAAAAC4AAAAAADIAAAAAADYAAAAAAAgAAAAAAAKAAAAAAAKAAAAAAAKAAAAAAAKAAAAAAAwAAAAAAAKAAAAIAAKAAAAIAAKAAAAIAAKAAAAIABAAAAAAAAKAAAAQAAKAAAAQAAKAAAAQAAKAAAAQABQAAAAAAAKAAAAYAAKAAAAYAAKAAAAYAAKAAAAYABgAAAAAAAKAAAAgAAKAAAAgAAKAAAAgAAKAAAAgABwAAAAAAAKAAAAoAAKAAAAoAAKAAAAoAAKAAAAoACAAAAAAAAKAAAAwAAKAAAAwAAKAAAAwAAKAAAAwACQAAAAAAAKAAAA4AAKAAAA4AAKAAAA4AAKAAAA4ACgAAAAAAAKAAABAAAKAAABAAAKAAABAAAKAAABAAAKAAABAACwAAAAAAAKAAABIAAKAAABIAAKAAABIAAKAAABIAAKAAABIADAAAAAAAAKAAABQAAKAAABQAAKAAABQAAKAAABQAAKAAABQADQAAAAAAAKAAABYAAKAAABYAAKAAABYAAKAAABYAAKAAABYAAD///hm///+BP//+H7///38///4lv///ez///iu///9zP//+Mb///3E///43v///bT///j2///5XP//+Q7///lw///5Jv//+Uj///k+///5XP//+Vb///lw///5bv//+YQAAAAEAAgAAAAMAAAAAAAEAAgAAAAMABAAAAAEAAgAAAAMACAAAAAEAAgAAAAMADAAAAAEAAgAAAAMAEAAAAAEAAgAAAAMAFAAAAAEAAgAAAAMAGAAAAAEAAgAAAAMAHAAAAAEAAgADAAQAIAAAAAEAAgADAAQAJQAAAAEAAgADAAQAKgAAAAEAAgADAAQALwF+AYABegF8AZgBmgGUAZYBqgGsAaYBqAF/AYEBewF9AZkBmwGVAZcBqwGtAacBqQGIAYoBhAGGAYkBiwGFAYcBtAG2AbABuAGyAbUBtwGxAbkBswHCAcQBvgHGAcABwwHFAb8BxwHBAAAD7AAAAAIAAAACAAAADQAAABwAAAJeAAAC+gAAA2AAAAOAAAAD0gAIAAMBHgAMAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEABAABAAEABQABAAEABgABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQAHAAEACgABAAEAAQABAAEAAQABAAEAAQABAAEACAABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEACQABAAEAAQABAAEAAQABAAEAAQALAAAAAAAAAAAAAgAAAAAAAwAAAAAABAAFAAAAAAAAAAAAAAACAAAAAAADAAAAAAAEAAUAAAABAAEABgABAAEABwAIAAEAAQABAAEAAQABAAEAAQAJAAEAAQABAAEAAQAKAAsAAQABAAEAAQABAAwAAQABAAEAAQABAA0ADgABAAEAAQABAAEADwABAAEAAQABAAEAAQABAAEAAQAQAAAAAAAAAABAAAAAAAKAAAAAAAOAAAAAAASAAAAAAAWAAAAAAAIAAAAAAACgAAAAAACgAAAAAAMAAAAAAACgAAACAACgAAACAAQAAAAAAACgAAAEAACgAAAEAAUAAAAAAACgAAAGP///tr///70///7+v///HD///w+///8rAAAAJL///wgAAAAAAAAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEAAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAAQAAAAGAXMBdAHyAfIB8wHzAfEAAATMAAAAAgAAAAQAAAAOAAAAHAAAAnoAAAOSAAAEKAAABFgAAASyAAgAAwEsAA0AAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQAEAAEAAQAGAAEAAQAHAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAgAAQALAAEAAQABAAEAAQABAAEAAQABAAEAAQAJAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQAKAAEAAQABAAEAAQABAAEAAQABAAwAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQAFAAAAAAAAAAAAAgAAAAAAAAADAAAAAAAEAAUAAAAAAAAAAAAAAAIAAAAAAAAAAwAAAAAABAAFAAAAAQABAAYAAQABAAEABwAIAAEAAQABAAEAAQABAAEAAQAJAAEAAQAKAAEAAQABAAEAAQABAAEAAQABAAEACwABAAEAAQABAAEAAQAMAA0AAQABAAEAAQABAA4AAQABAA8AAQABAAEAAQABAAEAAQABAAEAAQAQAAEAAQABAAEAAQABABEAEgABAAEAAQABAAEAEwABAAEAFAABAAEAAQABAAEAAQABAAEAAQABABUAAQABAAEAAQABAAEAAQABAAEAAQAWAAEAAQAXAAEAAQAYAAEAAQABAAEAAQABAAEAAQAAAAAAAAAAQAAAAAADgAAAAAAFgAAAAAAHgAAAAAAJgAAAAAACAAAAAAAAoAAAAAAAoAAAAAADAAAAAAACgAAAAAAEAAAAAAAAoAAAAwAAoAAAAwAFAAAAAAAEgAAAAAAGAAAAAAAAoAAABgAAoAAABgAHAAAAAAAGgAAAAAAIAAAAAAAAoAAACQAJAAAAAAAIgAAAAD///7Y///7Wv///vj///v8///7ov///Hj///xE///76v///LgAAACc///79v///DAAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAAAAAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAAAABAAAAAAABgFzAXQB8gHyAfMB8wHxAAAAhCAAAAAAAAAIAAAABgAAABAAAABCAAAAZgAIAQgAFgAEAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEABQAFAAUABQAFAAAAAAAAAAAAAQAAAAAAAAAAAAAAAQAAAAAAAAACAAAAAQADAAAAAAACgAAAAgAAAAAgAwAAAAAEjCAAAAEAAAAIAAAADgAAABQAAACWAAACjgAAA7AACADiAD4ACwAFAAUADAABAAEAAQABAAEAAQABAAEAAQABAAQAAQAEAAEABAABAAEAAQABAA0AAQANAAEAAQABAAEAAQAEAAEAAQABAAEABgAIAAkABgAGAAYABgAHAAcABwABAAEAAQABAAEAAQABAAEABgAKAAoACgAKAAoABgAGAAAAAQAAAAAABgAOAAAAAAABAAsAAAAVABUAGwAAAAEAAAAAAAYADgAAAAAAAQALAAAAFQAVABsAAAABAAAAAAAGAA4AAgABAAEAAgADABUAFQAbAAAAAQAAAAAABgAOAAIAAgABAAIAAgAVABUAGwAAAAEAAAAAAAYADgAEAAUAAQAEAAMAFQAVABsAAAABAAAAAAAGAA4ABwAGAAEABwAJABUAFQAbAAAAAQAAAAAABgAOAAcACAABAAcADAAVABUAGwAAAAEAAAAAAAYADgAKAA0AAQAKAAkAFQAVABsAAAABAAAAAAAGAA4AEAAPACMAEAASABUAFQAbAAAAAQAAAAAABgAOABAAEQAjABAAEAAVABUAGwAAAAEAAAAAAAYADgAUABMAIwAUABIAFQAVABsAAAABAAAAAAAGAA4AFgAXAAEAFgADABUAFQAbAAAAAQAAAAAABgAOABYAGgABABYAFgAVABUAGwAAAAEAAAAAAAYADgAZABgAAQAZAAMAFQAVABsAAAABAAAAAAAGAA4AGQAZAAEAGQAZABUAFQAbAAAAAQAAAAAABgAOAB4AHAAdAB4AIQAVABUAGwAAAAEAAAAAAAYADgAeAB8AHQAeAB4AFQAVABsAAAABAAAAAAAGAA4AIAAiAB0AIAAhABUAFQAbAAAAAP////8AAgAA/////wADAAD/////AASAAP//AAAAAwAAAAH//wAEAAD/////AAUAAP////8ABgAA//8AAgAGAAD/////AAeAAP//AAMABgAAAAQAAgACAAD/////AAYAAP//AAUABwAA/////wAIAAD/////AAgAAP//AAYACQAA/////wAJAAD//wAGAAqAAP//AAAACgAA//8ABgAJAAAAAf//AAuAAP////8ADAAA/////wANAAAAB///AA0AAP////8ADgAA/////wAOAAAAB///AA8AAP////8ADwAA//8ABgACAAD//wAIABAAAP////8AEAAA//8ABgAQAAAAAf//ABGAAP//AAAAEQAA//8ABgACAAD/////AAAAAAAkAAAANAAAAHQAAABEAAAAVAAAAGQAAACuAAAAwgAAALoACAEZAAUBYAFhAWIBYwFkAAgBYAAFARkBGgEbARwBHQAIARkABQFbAVwBXQFeAV8ACAFbAAUBaQFqAWsBbAFtAAgBGQAFAWkBagFrAWwBbQAIAQYAGgFmAAAAYAFXAVgBWQFaAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFoAWkBagFrAWwBbQFnAGMACAENAAMBbgFvAXAACAEHAAEBFgAIAOIABAFlAAAAAAFWAAABmCAAAAEAAAAIAAAABgAAABQAAAE2AAABWgAAAXwACADjAI4ABAAEAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQAFAAUABQAAAAAAAAAAAAEAAAAAAAAAAAAAAAEAAAAAAAAAAgAAAAEAAwAAAAD/////AAKAAP////8AAgAA/////wAAAAAAAP//AAAAAAAEAAgA4wACAfQBcQAAAAACiCAAAAEAAAAIAAAABgAAABQAAAIsAAACUAAAAnAACABgAQkABQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAQAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQAFAAUABQAFAAEAAQABAAEAAQABAAEAAQABAAEAAQAFAAUABQAAAAAAAAAAAAEAAAAAAAAAAAAAAAEAAAAAAAAAAgAAAAEAAwAAAAD/////AAKAAP////8AAgAA/////wAAAAAAAP//AAAABAAIAQEAAQFy';
@@ -38,10 +38,15 @@ const Dashboard = () => {
 
     useEffect(() => {
         if (user) {
-            fetchNotifications();
-            // Poll every 1 minute
-            const interval = setInterval(fetchNotifications, 60000);
-            return () => clearInterval(interval);
+            // Pushed by the server; each (re)connect resyncs the full list once
+            return NotificationService.subscribe((event, data) => {
+                if (event === 'notification') {
+                    setNotifications(prev => [data, ...prev].slice(0, 50));
+                    setUnreadCount(prev => prev + 1);
+                } else if (event === 'refresh') {
+                    fetchNotifications();
+                }
+            }, fetchNotifications);
         }
     }, [user, fetchNotifications]);
 
@@ -17,20 +17,30 @@ const DashboardHome = () => {
     const [isModalVisible, setIsModalVisible] = useState(false);
     const [selectedBookings, setSelectedBookings] = useState([]);
 
-    const fetchBookings = async () => {
+    const fetchBookings = async (month = dayjs()) => {
         setLoading(true);
         try {
-            const response = await BookingService.getBookings({ all: true });
-            const allBookings = response.data.bookings;
-            setBookings(allBookings);
+            // Totals come from server-side per-status counts; the calendar only
+            // pulls the bookings overlapping the visible month.
+            const [countsResponse, monthBookings] = await Promise.all([
+                BookingService.getBookings({ all: true, limit: 1, fields: 'id', counts: true }),
+                BookingService.getAllBookings({
+                    all: true,
+                    start_date: month.startOf('month').subtract(7, 'day').toISOString(),
+                    end_date: month.endOf('month').add(7, 'day').toISOString(),
+                    fields: 'id,status,start_time,end_time,car_license,car_model,user_name,objective,destination'
+                })
+            ]);
+            setBookings(monthBookings);
 
             // Calculate simple stats
-            const pending = allBookings.filter(b => b.status === 'pending').length;
-            const active = allBookings.filter(b => b.status === 'approved' || b.status === 'picked_up').length;
-            const completed = allBookings.filter(b => b.status === 'completed' || b.status === 'returned').length;
+            const counts = countsResponse.data.counts || {};
+            const pending = counts.pending || 0;
+            const active = (counts.approved || 0) + (counts.picked_up || 0);
+            const completed = (counts.completed || 0) + (counts.returned || 0);
 
             setStats({
-                total: allBookings.length,
+                total: Object.values(counts).reduce((sum, n) => sum + n, 0),
                 pending,
                 active,
                 completed
@@ -207,6 +217,7 @@ const DashboardHome = () => {
                     <Calendar
                         fullCellRender={fullCellRender}
                         onSelect={onSelect}
+                        onPanelChange={(value) => fetchBookings(value)}
                         headerRender={({ value, type, onChange, onTypeChange }) => {
                             const start = 0;
                             const end = 12;
@@ -8,13 +8,17 @@ const { Title, Text } = Typography;
 
 const AdminBookings = () => {
     const [bookings, setBookings] = useState([]);
+    const [nextCursor, setNextCursor] = useState(null);
     const [loading, setLoading] = useState(false);
+    const [selectedIds, setSelectedIds] = useState([]);
 
-    const fetchBookings = async () => {
+    const fetchBookings = async (cursor = null) => {
         setLoading(true);
         try {
-            const response = await BookingService.getBookings();
-            setBookings(response.data.bookings);
+            const response = await BookingService.getBookings(cursor ? { cursor } : {});
+            setBookings(cursor ? [...bookings, ...response.data.bookings] : response.data.bookings);
+            setNextCursor(response.data.next_cursor);
+            if (!cursor) setSelectedIds([]);
         } catch (error) {
             message.error("Failed to fetch bookings");
         } finally {
@@ -36,6 +40,20 @@ const AdminBookings = () => {
         }
     };
 
+    const handleBulkStatusUpdate = async (status) => {
+        try {
+            const response = await BookingService.updateBookingsStatus(selectedIds, status);
+            const conflicts = response.data.results.filter(r => r.result === 'conflict');
+            message.success(response.data.message);
+            if (conflicts.length) {
+                message.warning(`${conflicts.length} booking(s) skipped: the period is already booked`);
+            }
+            fetchBookings();
+        } catch (error) {
+            message.error("Failed to update status");
+        }
+    };
+
     const columns = [
         {
             title: 'Booker Info',
@@ -222,7 +240,31 @@ const AdminBookings = () => {
                 style={{ borderRadius: '20px', border: 'none' }}
                 bodyStyle={{ padding: 0 }}
             >
+                {selectedIds.length > 0 && (
+                    <Space style={{ padding: '16px' }}>
+                        <Text strong>{selectedIds.length} selected</Text>
+                        <Button
+                            icon={<CheckCircleOutlined style={{ color: '#10b981' }} />}
+                            onClick={() => handleBulkStatusUpdate('approved')}
+                            style={{ borderRadius: '8px' }}
+                        >
+                            Approve selected
+                        </Button>
+                        <Button
+                            icon={<CloseCircleOutlined style={{ color: '#ef4444' }} />}
+                            onClick={() => handleBulkStatusUpdate('rejected')}
+                            style={{ borderRadius: '8px' }}
+                        >
+                            Reject selected
+                        </Button>
+                    </Space>
+                )}
                 <Table
+                    rowSelection={{
+                        selectedRowKeys: selectedIds,
+                        onChange: setSelectedIds,
+                        getCheckboxProps: record => ({ disabled: record.status !== 'pending' })
+                    }}
                     columns={columns}
                     dataSource={bookings}
                     rowKey="id"
@@ -230,6 +272,13 @@ const AdminBookings = () => {
                     pagination={{ pageSize: 10, hideOnSinglePage: true }}
                     scroll={{ x: true }}
                 />
+                {nextCursor && (
+                    <div style={{ textAlign: 'center', padding: '16px' }}>
+                        <Button onClick={() => fetchBookings(nextCursor)} loading={loading}>
+                            Load more
+                        </Button>
+                    </div>
+                )}
             </Card>
         </div>
     );
@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react';
-import { Table, Button, Modal, Form, Input, Select, InputNumber, message, Popconfirm, Tag, Space, Typography, Card, Row, Col, Divider } from 'antd';
-import { PlusOutlined, EditOutlined, DeleteOutlined, ToolOutlined, CarOutlined, DashboardOutlined, BgColorsOutlined } from '@ant-design/icons';
+import { Table, Button, Upload, Modal, Form, Input, Select, InputNumber, message, Popconfirm, Tag, Space, Typography, Card, Row, Col, Divider } from 'antd';
+import { PlusOutlined, UploadOutlined, EditOutlined, DeleteOutlined, ToolOutlined, CarOutlined, DashboardOutlined, BgColorsOutlined } from '@ant-design/icons';
 import CarService from '../../services/car.service';
 
 const { Option } = Select;
@@ -29,6 +29,33 @@ const AdminCars = () => {
         fetchCars();
     }, []);
 
+    const handleImport = async ({ file }) => {
+        setLoading(true);
+        try {
+            const response = await CarService.importCars(file);
+            const { message: summary, errors, error_count } = response.data;
+            if (error_count) {
+                Modal.warning({
+                    title: summary,
+                    width: 640,
+                    content: (
+                        <div style={{ maxHeight: '320px', overflowY: 'auto' }}>
+                            {errors.map(e => (
+                                <div key={e.row}>Row {e.row}{e.license_plate ? ` (${e.license_plate})` : ''}: {e.message}</div>
+                            ))}
+                        </div>
+                    )
+                });
+            } else {
+                message.success(summary);
+            }
+            fetchCars();
+        } catch (error) {
+            message.error(error.response?.data?.message || "Failed to import cars");
+            setLoading(false);
+        }
+    };
+
     const showModal = (car) => {
         setEditingCar(car);
         if (car) {
@@ -206,23 +233,30 @@ const AdminCars = () => {
                     <Title level={2} style={{ margin: 0, fontWeight: 800, letterSpacing: '-0.5px' }}>Fleet Management</Title>
                     <Text type="secondary">Monitor and maintain the vehicle inventory</Text>
                 </div>
-                <Button
-                    type="primary"
-                    icon={<PlusOutlined />}
-                    onClick={() => showModal(null)}
-                    size="large"
-                    style={{
-                        borderRadius: '12px',
-                        height: '48px',
-                        padding: '0 24px',
-                        background: 'var(--primary-gradient)',
-                        border: 'none',
-                        fontWeight: 700,
-                        boxShadow: '0 4px 14px 0 rgba(99, 102, 241, 0.39)'
-                    }}
-                >
-                    Add Vehicle
-                </Button>
+                <Space size="middle">
+                    <Upload accept=".csv,.jsonl,.ndjson" showUploadList={false} customRequest={handleImport}>
+                        <Button icon={<UploadOutlined />} size="large" style={{ borderRadius: '12px', height: '48px', fontWeight: 600 }}>
+                            Import CSV
+                        </Button>
+                    </Upload>
+                    <Button
+                        type="primary"
+                        icon={<PlusOutlined />}
+                        onClick={() => showModal(null)}
+                        size="large"
+                        style={{
+                            borderRadius: '12px',
+                            height: '48px',
+                            padding: '0 24px',
+                            background: 'var(--primary-gradient)',
+                            border: 'none',
+                            fontWeight: 700,
+                            boxShadow: '0 4px 14px 0 rgba(99, 102, 241, 0.39)'
+                        }}
+                    >
+                        Add Vehicle
+                    </Button>
+                </Space>
             </div>
 
             <Card
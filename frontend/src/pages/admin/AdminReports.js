@@ -1,11 +1,9 @@
-import React, { useState, useEffect, useRef } from 'react';
+import React, { useState, useEffect } from 'react';
 import { Card, Row, Col, Statistic, Table, Typography, Spin, message, DatePicker, Button, Space } from 'antd';
 import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer, LineChart, Line } from 'recharts';
 import { DownloadOutlined, UserOutlined, CarOutlined, DashboardOutlined, FileExcelOutlined } from '@ant-design/icons';
 import ReportService from '../../services/report.service';
 import moment from 'moment';
-import ExportService from '../../services/export.service';
-import html2canvas from 'html2canvas';
 
 const { Title, Text } = Typography;
 const { RangePicker } = DatePicker;
@@ -13,9 +11,11 @@ const { RangePicker } = DatePicker;
 const AdminReports = () => {
     const [basicStats, setBasicStats] = useState(null);
     const [advancedStats, setAdvancedStats] = useState(null);
+    const [detailRows, setDetailRows] = useState([]);
+    const [detailCursor, setDetailCursor] = useState(null);
+    const [detailLoading, setDetailLoading] = useState(false);
     const [loading, setLoading] = useState(true);
     const [dateRange, setDateRange] = useState([null, null]);
-    const chartRef = useRef(null);
 
     const fetchBasicData = async () => {
         try {
@@ -26,17 +26,35 @@ const AdminReports = () => {
         }
     };
 
+    const rangeParams = (dates) => {
+        const params = {};
+        if (dates && dates[0] && dates[1]) {
+            // Clone to avoid mutating the state objects
+            params.start_date = dates[0].clone().startOf('day').format('YYYY-MM-DDTHH:mm:ss');
+            params.end_date = dates[1].clone().endOf('day').format('YYYY-MM-DDTHH:mm:ss');
+        }
+        return params;
+    };
+
+    const fetchDetailRows = async (dates, cursor = null) => {
+        setDetailLoading(true);
+        try {
+            const res = await ReportService.getAdvancedStatsBookings({ ...rangeParams(dates), ...(cursor ? { cursor } : {}) });
+            setDetailRows(cursor ? [...detailRows, ...res.data.bookings] : res.data.bookings);
+            setDetailCursor(res.data.next_cursor);
+        } catch (error) {
+            message.error("Failed to fetch booking history");
+        } finally {
+            setDetailLoading(false);
+        }
+    };
+
     const fetchAdvancedData = async (dates) => {
         setLoading(true);
         try {
-            const params = {};
-            if (dates && dates[0] && dates[1]) {
-                // Clone to avoid mutating the state objects
-                params.start_date = dates[0].clone().startOf('day').format('YYYY-MM-DDTHH:mm:ss');
-                params.end_date = dates[1].clone().endOf('day').format('YYYY-MM-DDTHH:mm:ss');
-            }
-            const res = await ReportService.getAdvancedStats(params);
+            const res = await ReportService.getAdvancedStats(rangeParams(dates));
             setAdvancedStats(res.data);
+            fetchDetailRows(dates);
         } catch (error) {
             message.error("Failed to fetch report data");
         } finally {
@@ -57,64 +75,29 @@ const AdminReports = () => {
     const handleExportPDF = async () => {
         if (!advancedStats) return;
 
-        let chartImage = null;
-        try {
-            if (chartRef.current) {
-                const canvas = await html2canvas(chartRef.current, {
-                    scale: 2, // Higher quality
-                    useCORS: true,
-                    logging: false
-                });
-                chartImage = canvas.toDataURL('image/png');
-            }
-        } catch (error) {
-            console.error("Failed to capture chart image", error);
-        }
-
-        const dateRangeString = dateRange[0] && dateRange[1]
-            ? `${dateRange[0].format('DD/MM/YYYY')} - ${dateRange[1].format('DD/MM/YYYY')}`
-            : 'ทั้งหมด';
-
         const filename = dateRange[0] && dateRange[1]
             ? `report_${dateRange[0].format('YYYYMMDD')}_${dateRange[1].format('YYYYMMDD')}.pdf`
             : 'vehicle_report.pdf';
 
-        const payload = {
-            summary: {
-                ...advancedStats.summary,
-                active_cars: basicStats?.active_cars,
-                total_cars: basicStats?.total_cars
-            },
-            bookings: advancedStats.bookings.map(b => ({ ...b, status: b.status.toUpperCase() })),
-            top_users: advancedStats.summary.top_users.slice(0, 5),
-            car_stats: advancedStats.summary.car_stats,
-            daily_stats: advancedStats.daily_stats,
-            chartImage,
-            dateRangeString
-        };
-
-        ExportService.exportAdvancedReport(payload, filename);
+        try {
+            await ReportService.exportAdvancedStatsPDF(rangeParams(dateRange), filename);
+        } catch (error) {
+            message.error("Failed to export PDF");
+        }
     };
 
-    const handleExportCSV = () => {
-        if (!advancedStats || !advancedStats.bookings) return;
+    const handleExportCSV = async () => {
+        if (!advancedStats || !detailRows.length) return;
 
         const filename = dateRange[0] && dateRange[1]
             ? `bookings_${dateRange[0].format('YYYYMMDD')}_${dateRange[1].format('YYYYMMDD')}.csv`
             : 'detailed_bookings.csv';
 
-        // Prepare data with localized key names for better readability
-        const csvData = advancedStats.bookings.map(b => ({
-            'วันที่ (Date)': b.start_time,
-            'ผู้ใช้งาน (User)': b.user,
-            'พาหนะ (Vehicle)': b.car,
-            'จุดหมาย (Destination)': b.destination,
-            'วัตถุประสงค์ (Purpose)': b.purpose,
-            'สถานะ (Status)': b.status.toUpperCase(),
-            'ระยะทาง (Mileage)': b.mileage > 0 ? `${b.mileage} km` : '-'
-        }));
-
-        ExportService.exportToCSV(csvData, filename);
+        try {
+            await ReportService.exportAdvancedStatsCSV(rangeParams(dateRange), filename);
+        } catch (error) {
+            message.error("Failed to export CSV");
+        }
     };
 
     const columns = [
@@ -240,7 +223,7 @@ const AdminReports = () => {
 
                     <Row gutter={[24, 24]} style={{ marginBottom: '32px' }}>
                         <Col xs={24} lg={16}>
-                            <div ref={chartRef}>
+                            <div>
                                 <Card
                                     title="สถิติการใช้งานรายวัน (Daily Usage Trends)"
                                     className="premium-card"
@@ -322,7 +305,7 @@ const AdminReports = () => {
                             <Button
                                 icon={<FileExcelOutlined />}
                                 onClick={handleExportCSV}
-                                disabled={!advancedStats?.bookings?.length}
+                                disabled={!detailRows.length}
                                 style={{ borderRadius: '8px' }}
                             >
                                 Export CSV
@@ -331,12 +314,20 @@ const AdminReports = () => {
                         style={{ borderRadius: '20px' }}
                     >
                         <Table
-                            dataSource={advancedStats?.bookings}
+                            dataSource={detailRows}
                             columns={columns}
                             rowKey="id"
+                            loading={detailLoading}
                             pagination={{ pageSize: 10 }}
                             scroll={{ x: true }}
                         />
+                        {detailCursor && (
+                            <div style={{ textAlign: 'center', paddingTop: '16px' }}>
+                                <Button onClick={() => fetchDetailRows(dateRange, detailCursor)} loading={detailLoading}>
+                                    Load more
+                                </Button>
+                            </div>
+                        )}
                     </Card>
                 </>
             )}
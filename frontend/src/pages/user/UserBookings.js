@@ -11,6 +11,7 @@ const { Title, Text } = Typography;
 
 const UserBookings = () => {
     const [bookings, setBookings] = useState([]);
+    const [nextCursor, setNextCursor] = useState(null);
     const [loading, setLoading] = useState(false);
     const [isModalVisible, setIsModalVisible] = useState(false);
     const [availableCars, setAvailableCars] = useState([]);
@@ -19,11 +20,12 @@ const UserBookings = () => {
     const [isReturnModalVisible, setIsReturnModalVisible] = useState(false);
     const [returningBooking, setReturningBooking] = useState(null);
 
-    const fetchBookings = async () => {
+    const fetchBookings = async (cursor = null) => {
         setLoading(true);
         try {
-            const response = await BookingService.getBookings();
-            setBookings(response.data.bookings);
+            const response = await BookingService.getBookings(cursor ? { cursor } : {});
+            setBookings(cursor ? [...bookings, ...response.data.bookings] : response.data.bookings);
+            setNextCursor(response.data.next_cursor);
         } catch (error) {
             message.error("Failed to fetch bookings");
         } finally {
@@ -272,6 +274,13 @@ const UserBookings = () => {
                     pagination={{ pageSize: 8, hideOnSinglePage: true }}
                     scroll={{ x: true }}
                 />
+                {nextCursor && (
+                    <div style={{ textAlign: 'center', padding: '16px' }}>
+                        <Button onClick={() => fetchBookings(nextCursor)} loading={loading}>
+                            Load more
+                        </Button>
+                    </div>
+                )}
             </Card>
 
             <Modal
@@ -4,18 +4,47 @@ const createBooking = (data) => {
     return api.post('/bookings/', data);
 };
 
+// Paginated listing: pass `cursor` (the previous page's next_cursor) to
+// fetch the following page.
 const getBookings = (params) => {
     return api.get('/bookings/', { params });
 };
 
+// Follows next_cursor until exhausted. Only use with a bounded filter
+// (e.g. a start_date/end_date window).
+const getAllBookings = async (params) => {
+    let bookings = [];
+    let cursor = null;
+    do {
+        const response = await getBookings({ ...params, limit: 500, ...(cursor ? { cursor } : {}) });
+        bookings = bookings.concat(response.data.bookings);
+        cursor = response.data.next_cursor;
+    } while (cursor);
+    return bookings;
+};
+
 const updateBookingStatus = (id, status) => {
     return api.put(`/bookings/${id}/status`, { status });
 };
 
+// Sets one status on many bookings; the response lists a result per id
+// (updated, unchanged, not_found or conflict).
+const updateBookingsStatus = (ids, status) => {
+    return api.put('/bookings/status', { ids, status });
+};
+
 const getAvailableCars = (startTime, endTime) => {
     return api.get(`/bookings/available-cars?start_time=${startTime}&end_time=${endTime}`);
 };
 
+// Free/busy matrix for every car over one window; `busy` per car is a list
+// of [start_slot, length] runs (or a base64 bitmap with encoding: 'bitmap').
+const getAvailabilityMatrix = (startTime, endTime, slotMinutes = 60, encoding = 'runs') => {
+    return api.get('/bookings/availability-matrix', {
+        params: { start_time: startTime, end_time: endTime, slot_minutes: slotMinutes, encoding }
+    });
+};
+
 const returnCar = (id, endMileage) => {
     return api.put(`/bookings/${id}/return`, { end_mileage: endMileage });
 };
@@ -23,8 +52,11 @@ const returnCar = (id, endMileage) => {
 const BookingService = {
     createBooking,
     getBookings,
+    getAllBookings,
     updateBookingStatus,
+    updateBookingsStatus,
     getAvailableCars,
+    getAvailabilityMatrix,
     returnCar
 };
 
@@ -20,12 +20,21 @@ const serviceCar = (id) => {
     return api.post(`/cars/${id}/service`);
 };
 
+// Bulk add/update from a CSV or JSON-lines file; the response carries
+// inserted/updated counts and a per-row error report.
+const importCars = (file) => {
+    const formData = new FormData();
+    formData.append('file', file);
+    return api.post('/cars/import', formData);
+};
+
 const CarService = {
     getAllCars,
     createCar,
     updateCar,
     deleteCar,
-    serviceCar
+    serviceCar,
+    importCars
 };
 
 export default CarService;
@@ -20,11 +20,80 @@ const markAllAsRead = async () => {
     return response.data;
 };
 
+// Subscribe to the server-sent notification stream. fetch() is used instead
+// of EventSource so the token can go in the Authorization header. Calls
+// onEvent(event, data) for each event and onOpen() on every (re)connect, and
+// reconnects with backoff. While the stream is unavailable (e.g. the server
+// is at its stream limit and answers 503) onOpen() is also called on every
+// retry, so the caller falls back to polling. Returns a function that closes
+// the stream.
+const subscribe = (onEvent, onOpen) => {
+    let controller = null;
+    let closed = false;
+    let retryDelay = 5000;
+
+    const connect = async () => {
+        if (closed) return;
+        controller = new AbortController();
+        try {
+            const response = await fetch(`${api.defaults.baseURL}/notifications/stream`, {
+                headers: { Authorization: `Bearer ${localStorage.getItem('token')}` },
+                signal: controller.signal
+            });
+            // An expired token is handled by the next regular API call
+            if (response.status === 401) return;
+            if (response.status === 503) {
+                // Server is at its stream limit: poll instead and retry later
+                retryDelay = Math.max(parseInt(response.headers.get('Retry-After'), 10) * 1000 || 0, 60000);
+                if (onOpen) onOpen();
+                if (!closed) setTimeout(connect, retryDelay);
+                return;
+            }
+            if (!response.ok) throw new Error(`Stream failed: ${response.status}`);
+            retryDelay = 5000;
+            if (onOpen) onOpen();
+
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffer = '';
+            while (true) {
+                const { value, done } = await reader.read();
+                if (done) break;
+                buffer += decoder.decode(value, { stream: true });
+                const frames = buffer.split('\n\n');
+                buffer = frames.pop();
+                frames.forEach(frame => {
+                    let event = 'message';
+                    let data = '';
+                    frame.split('\n').forEach(line => {
+                        if (line.startsWith('event: ')) event = line.slice(7);
+                        else if (line.startsWith('data: ')) data += line.slice(6);
+                    });
+                    if (data) onEvent(event, JSON.parse(data));
+                });
+            }
+        } catch (error) {
+            if (closed) return;
+            console.error("Notification stream error:", error);
+            retryDelay = Math.min(retryDelay * 2, 60000);
+            if (onOpen) onOpen();
+        }
+        if (!closed) setTimeout(connect, retryDelay);
+    };
+
+    connect();
+    return () => {
+        closed = true;
+        if (controller) controller.abort();
+    };
+};
+
 const NotificationService = {
     getNotifications,
     getUnreadCount,
     markAsRead,
-    markAllAsRead
+    markAllAsRead,
+    subscribe
 };
 
 export default NotificationService;
@@ -1,4 +1,5 @@
 import api from './api';
+import { saveAs } from 'file-saver';
 
 const getStats = () => {
     return api.get('/reports/stats');
@@ -8,9 +9,36 @@ const getAdvancedStats = (params) => {
     return api.get('/reports/advanced-stats', { params });
 };
 
+// Detailed rows for the advanced report, one page at a time (pass the
+// previous page's next_cursor as `cursor`).
+const getAdvancedStatsBookings = (params) => {
+    return api.get('/reports/advanced-stats/bookings', { params });
+};
+
+// Server-streamed CSV of the detailed rows (UTF-8 with BOM for Excel)
+const exportAdvancedStatsCSV = async (params, filename) => {
+    const response = await api.get('/reports/advanced-stats/export', {
+        params: { ...params, filename },
+        responseType: 'blob'
+    });
+    saveAs(response.data, filename);
+};
+
+// Report PDF rendered on the server (Thai font embedded there)
+const exportAdvancedStatsPDF = async (params, filename) => {
+    const response = await api.get('/reports/advanced-stats/pdf', {
+        params: { ...params, filename },
+        responseType: 'blob'
+    });
+    saveAs(response.data, filename);
+};
+
 const ReportService = {
     getStats,
     getAdvancedStats,
+    getAdvancedStatsBookings,
+    exportAdvancedStatsCSV,
+    exportAdvancedStatsPDF,
 };
 
 export default ReportService;